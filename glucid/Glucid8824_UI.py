@@ -373,6 +373,10 @@ class Ui_MainWindow(object):
         self.LucidWriteButton.setEnabled(False)
         self.LucidWriteButton.setGeometry(QtCore.QRect(69, 364, 70, 38))
         self.LucidWriteButton.setObjectName("LucidWriteButton")
+        self.LiveCheck = QtWidgets.QCheckBox(self.centralwidget)
+        self.LiveCheck.setEnabled(False)
+        self.LiveCheck.setGeometry(QtCore.QRect(69, 404, 70, 22))
+        self.LiveCheck.setObjectName("LiveCheck")
         self.labelIN_1 = xglucidLabel(self.centralwidget)
         self.labelIN_1.setGeometry(QtCore.QRect(285, 219, 41, 21))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
@@ -669,6 +673,7 @@ class Ui_MainWindow(object):
         self.LucidAnalogSrcCombo.raise_()
         self.SerialPortCombo.raise_()
         self.connection_label.raise_()
+        self.LiveCheck.raise_()
         self.statusbar = QtWidgets.QStatusBar(MainWindow)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -781,6 +786,12 @@ class Ui_MainWindow(object):
         self.ConINButton.clicked.connect(self.centralwidget.pro_or_consumer_clicked)
         self.ConOUTButton.clicked.connect(self.centralwidget.pro_or_consumer_clicked)
         self.ProINButton.clicked.connect(self.centralwidget.pro_or_consumer_clicked)
+        self.LucidSyncCombo.currentIndexChanged['int'].connect(self.centralwidget.on_combo_changed)
+        self.LucidMeterCombo.currentIndexChanged['int'].connect(self.centralwidget.on_combo_changed)
+        self.LucidOpticalCombo.currentIndexChanged['int'].connect(self.centralwidget.on_combo_changed)
+        self.LucidAnalogSrcCombo.currentIndexChanged['int'].connect(self.centralwidget.on_combo_changed)
+        self.LucidSpdifCombo.currentIndexChanged['int'].connect(self.centralwidget.on_combo_changed)
+        self.LiveCheck.toggled['bool'].connect(self.centralwidget.on_live_toggled)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
     def retranslateUi(self, MainWindow):
@@ -820,6 +831,7 @@ class Ui_MainWindow(object):
         self.ConOUTButton.setText(_translate("MainWindow", "-10 dBV"))
         self.LucidReadButton.setText(_translate("MainWindow", "READ"))
         self.LucidWriteButton.setText(_translate("MainWindow", "WRITE"))
+        self.LiveCheck.setText(_translate("MainWindow", "LIVE"))
         self.label_18.setText(_translate("MainWindow", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
 "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
 "p, li { white-space: pre-wrap; }\n"
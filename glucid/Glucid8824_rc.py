@@ -1,13842 +1,64 @@
 # -*- coding: utf-8 -*-
+"""
+Glucid8824_rc registers the Qt resources of xglucid (the splash,
+the panel layout and the icon) from the compiled binary resource
+file Glucid8824.rcc, which Qt memory-maps, instead of unmarshalling
+them from a Python module of embedded image bytes.
 
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.1)
-#
-# WARNING! All changes made in this file will be lost!
+It keeps the name of the module pyrcc5 used to generate, so
+Glucid8824_UI.py, as generated by pyuic5 from Glucid8824.ui, still
+imports it.  Importing it registers nothing: the resources are
+registered by the first qInitResources() call, made by xglucid
+just before it first shows an image.  Rebuild Glucid8824.rcc from
+Glucid8824.qrc with `make UI`.
 
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import os
+import sys
 from PyQt5 import QtCore
 
-qt_resource_data = b"\
-\x00\x00\x1b\x7a\
-\x42\
-\x4d\x7a\x1b\x00\x00\x00\x00\x00\x00\x7a\x00\x00\x00\x6c\x00\x00\
-\x00\x30\x00\x00\x00\x30\x00\x00\x00\x01\x00\x18\x00\x00\x00\x00\
-\x00\x00\x1b\x00\x00\x13\x0b\x00\x00\x13\x0b\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x42\x47\x52\x73\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5b\x55\x55\x5a\x55\x54\x58\
-\x54\x53\x58\x56\x52\x57\x57\x52\x5b\x55\x54\x5c\x55\x55\x5b\x56\
-\x50\x5b\x58\x56\x5a\x56\x55\x5c\x58\x57\x5a\x57\x55\x5a\x57\x55\
-\x5b\x58\x56\x58\x55\x54\x59\x56\x52\x57\x57\x52\x58\x55\x52\x5c\
-\x55\x52\x5f\x55\x51\x58\x55\x54\x58\x55\x53\x58\x55\x54\x5a\x56\
-\x55\x59\x56\x54\x5b\x55\x54\x5e\x57\x56\x5c\x58\x54\x58\x58\x53\
-\x57\x58\x53\x59\x56\x53\x5b\x56\x52\x5e\x55\x54\x59\x54\x54\x57\
-\x56\x50\x57\x58\x4e\x5b\x58\x4e\x58\x55\x53\x58\x55\x53\x58\x55\
-\x53\x58\x55\x53\x57\x54\x53\x55\x52\x50\x55\x56\x50\x56\x55\x51\
-\x5a\x54\x54\x5d\x53\x55\x5a\x54\x51\x14\x10\x11\x14\x10\x11\x16\
-\x0f\x11\x17\x10\x0f\x15\x10\x10\x11\x10\x11\x11\x10\x12\x0f\x10\
-\x10\x13\x10\x11\x12\x10\x10\x12\x10\x10\x12\x10\x10\x12\x10\x10\
-\x12\x10\x11\x0b\x0f\x12\x10\x10\x0f\x13\x0f\x0f\x13\x10\x11\x0e\
-\x11\x12\x0d\x12\x11\x13\x11\x11\x13\x11\x11\x13\x11\x11\x13\x11\
-\x11\x13\x11\x11\x11\x11\x0e\x12\x10\x0c\x12\x0e\x0f\x15\x0d\x12\
-\x15\x0e\x12\x15\x0d\x12\x14\x10\x10\x13\x10\x11\x14\x10\x11\x14\
-\x10\x0f\x14\x11\x0e\x13\x10\x10\x12\x10\x10\x12\x10\x10\x12\x10\
-\x10\x10\x0e\x0e\x13\x11\x11\x12\x10\x10\x14\x0e\x0d\x13\x0e\x0f\
-\x12\x0d\x0f\x12\x10\x12\x11\x0f\x11\x13\x11\x11\x13\x11\x11\x15\
-\x13\x12\x17\x13\x10\x17\x13\x12\x12\x14\x15\x10\x14\x15\x15\x15\
-\x14\x15\x13\x13\x15\x13\x13\x15\x13\x13\x15\x13\x13\x15\x13\x13\
-\x16\x13\x13\x1a\x13\x13\x15\x13\x14\x17\x13\x14\x18\x12\x13\x18\
-\x12\x14\x13\x13\x14\x15\x13\x13\x15\x13\x13\x15\x13\x13\x15\x13\
-\x13\x15\x13\x13\x14\x13\x11\x13\x12\x10\x16\x11\x12\x17\x11\x14\
-\x16\x13\x13\x11\x13\x12\x13\x12\x11\x13\x11\x11\x14\x11\x10\x1a\
-\x12\x12\x19\x13\x11\x11\x13\x15\x14\x12\x12\x14\x12\x12\x14\x12\
-\x12\x14\x12\x12\x16\x14\x14\x16\x14\x13\x12\x13\x12\x14\x12\x14\
-\x12\x13\x14\x0f\x14\x12\x12\x11\x12\x16\x14\x14\x16\x15\x14\x13\
-\x11\x13\x15\x0f\x11\x18\x12\x12\x15\x11\x13\x17\x14\x15\x19\x15\
-\x12\x16\x14\x14\x10\x0e\x0e\x13\x11\x11\x16\x14\x14\x14\x12\x12\
-\x13\x11\x11\x12\x14\x10\x0e\x10\x14\x11\x0f\x19\x16\x12\x16\x14\
-\x10\x10\x17\x13\x14\x14\x12\x12\x15\x13\x13\x17\x15\x15\x17\x15\
-\x15\x13\x12\x12\x1d\x16\x19\x19\x11\x15\x17\x13\x12\x14\x14\x0f\
-\x0d\x0d\x09\x11\x10\x11\x1c\x14\x16\x16\x0f\x12\x17\x12\x14\x17\
-\x15\x11\x18\x15\x10\x16\x16\x15\x16\x15\x15\x12\x10\x10\x1b\x19\
-\x19\x16\x14\x14\x16\x14\x14\x16\x14\x14\x11\x14\x15\x15\x11\x17\
-\x1a\x12\x19\x18\x14\x16\x13\x10\x0e\x14\x14\x14\x1d\x1d\x1d\x23\
-\x25\x1f\x22\x2c\x21\x26\x2d\x26\x20\x1c\x1d\x1a\x12\x19\x14\x12\
-\x17\x0f\x0d\x0d\x1d\x1b\x1b\x10\x0e\x0e\x0e\x0c\x0c\x15\x13\x13\
-\x14\x13\x13\x0d\x0e\x0f\x27\x23\x29\x2c\x2e\x2c\x25\x31\x22\x23\
-\x29\x23\x1e\x1b\x1d\x14\x12\x12\x15\x13\x13\x12\x10\x10\x0d\x0b\
-\x0b\x24\x22\x22\x15\x13\x14\x17\x17\x17\x19\x15\x14\x14\x0f\x0e\
-\x2c\x2b\x2b\x25\x2a\x29\x20\x2d\x26\x26\x2c\x2a\x16\x12\x17\x15\
-\x12\x17\x12\x14\x14\x14\x0f\x11\x0d\x0b\x0b\x24\x22\x22\x0a\x08\
-\x08\x15\x13\x13\x15\x13\x13\x16\x14\x14\x2f\x30\x30\x26\x31\x27\
-\x26\x30\x27\x2e\x2e\x2e\x11\x0d\x10\x14\x14\x14\x1b\x1c\x1c\x60\
-\x98\x6b\x53\x9a\x68\x5b\x93\x6f\x1b\x29\x1b\x16\x0f\x11\x13\x13\
-\x16\x11\x0f\x0f\x43\x41\x41\xa4\xa2\xa2\xa7\xa5\xa5\x05\x03\x03\
-\x18\x15\x15\x11\x12\x0f\x26\x3f\x2a\x5f\xa3\x71\x4c\xa0\x63\x57\
-\x84\x65\x0d\x12\x0e\x15\x13\x13\x14\x12\x12\x13\x11\x11\x65\x63\
-\x63\x8e\x8c\x8c\x99\x9c\x9c\x0b\x0e\x10\x1c\x16\x1d\x0e\x11\x0d\
-\x32\x55\x38\x5c\xa1\x6c\x59\xa7\x74\x46\x6f\x50\x14\x14\x0e\x17\
-\x13\x13\x15\x18\x16\x0e\x0a\x0a\x94\x92\x92\xa8\xa6\xa6\x50\x4e\
-\x4e\x15\x13\x13\x14\x12\x12\x14\x14\x13\x45\x6d\x52\x5a\xa4\x6d\
-\x60\xab\x6f\x33\x53\x3a\x15\x13\x14\x15\x14\x13\x15\x1c\x15\x43\
-\x76\x4c\x3d\x83\x4c\x48\x7a\x53\x16\x23\x18\x14\x13\x11\x16\x15\
-\x13\x11\x0f\x0f\x39\x37\x37\x85\x83\x83\x99\x97\x97\x0c\x0a\x0a\
-\x16\x15\x16\x14\x12\x13\x19\x28\x20\x44\x7d\x55\x3f\x86\x54\x3e\
-\x72\x4d\x09\x0f\x0b\x14\x12\x12\x15\x13\x13\x1b\x18\x18\x63\x61\
-\x61\x79\x77\x77\x82\x83\x82\x10\x0c\x0e\x0c\x0c\x0b\x17\x14\x16\
-\x29\x3f\x30\x44\x83\x52\x45\x84\x51\x44\x5f\x48\x10\x0d\x0d\x1f\
-\x1b\x1b\x0f\x0e\x0d\x18\x16\x16\x93\x91\x91\x70\x6e\x6e\x44\x43\
-\x43\x16\x14\x14\x15\x13\x13\x11\x10\x10\x2e\x4d\x38\x3d\x81\x4e\
-\x40\x84\x51\x33\x4a\x3b\x0e\x0d\x0b\x15\x14\x14\x14\x1d\x15\x44\
-\x72\x4c\x3f\x80\x4d\x4d\x7b\x5a\x18\x22\x1c\x14\x11\x15\x11\x11\
-\x14\x17\x15\x15\x1b\x19\x19\x5e\x5d\x5d\x5a\x58\x58\x14\x12\x12\
-\x15\x13\x13\x1b\x17\x1a\x1e\x2c\x1e\x46\x7e\x4e\x3e\x7f\x4a\x44\
-\x68\x4c\x16\x0c\x16\x14\x12\x12\x15\x13\x13\x0b\x09\x09\x2e\x2c\
-\x2c\x49\x47\x47\x46\x45\x45\x1d\x16\x1b\x17\x16\x16\x18\x13\x17\
-\x2d\x41\x31\x40\x7e\x4d\x3b\x7e\x4a\x3c\x5c\x44\x0e\x0f\x0e\x0c\
-\x0a\x0a\x1d\x18\x1a\x0f\x09\x0d\x50\x4e\x4e\x51\x4f\x4f\x26\x24\
-\x24\x15\x13\x13\x15\x13\x13\x11\x11\x10\x38\x56\x41\x40\x82\x4f\
-\x3e\x7c\x4c\x2c\x40\x33\x12\x0f\x0f\x16\x15\x14\x14\x1d\x14\x58\
-\x9c\x6b\x52\xa7\x69\x62\x9e\x74\x17\x27\x1b\x15\x13\x10\x17\x12\
-\x0f\x0e\x0c\x0c\x69\x67\x67\x90\x8e\x8e\xb3\xb0\xb0\x0f\x0d\x0d\
-\x19\x15\x16\x1b\x16\x17\x1a\x2f\x25\x5c\xa5\x77\x55\xad\x72\x4d\
-\x88\x5a\x0f\x15\x0c\x14\x12\x12\x15\x13\x13\x0f\x0d\x0d\x83\x81\
-\x81\x86\x84\x84\x98\x98\x97\x14\x0e\x12\x0f\x10\x0e\x17\x16\x17\
-\x35\x4d\x3a\x67\xaa\x75\x5d\xa9\x6f\x4a\x71\x55\x05\x0d\x08\x17\
-\x1b\x16\x19\x14\x16\x2b\x24\x27\x99\x96\x97\x8d\x8b\x8b\x59\x57\
-\x57\x15\x13\x13\x15\x13\x13\x11\x10\x10\x3f\x67\x49\x5d\xa8\x6d\
-\x62\xaa\x74\x38\x53\x42\x0e\x10\x0b\x14\x13\x12\x19\x21\x19\x45\
-\x62\x4c\x37\x66\x42\x3a\x59\x44\x1f\x20\x22\x19\x12\x15\x14\x12\
-\x13\x17\x15\x15\x06\x05\x05\x1e\x1c\x1c\x0c\x0c\x0c\x12\x10\x10\
-\x16\x16\x16\x1b\x10\x18\x2b\x28\x29\x3f\x5e\x44\x3b\x64\x44\x3f\
-\x55\x42\x1a\x0c\x17\x12\x10\x10\x16\x14\x14\x14\x12\x12\x00\x00\
-\x00\x19\x17\x17\x0b\x0d\x0b\x1a\x16\x19\x16\x14\x14\x19\x0f\x18\
-\x34\x39\x37\x3b\x66\x46\x31\x64\x40\x3c\x4d\x44\x14\x0c\x17\x13\
-\x0e\x12\x12\x0d\x0e\x10\x0e\x0d\x00\x00\x00\x10\x0d\x0d\x0e\x0d\
-\x0d\x17\x15\x15\x15\x13\x13\x15\x13\x14\x41\x45\x46\x39\x63\x44\
-\x38\x67\x48\x32\x3c\x38\x13\x0c\x0e\x14\x13\x12\x18\x21\x18\x6d\
-\xb6\x7f\x64\xc0\x7b\x72\xb1\x83\x16\x29\x1c\x13\x13\x13\x15\x12\
-\x13\x0d\x0a\x0a\x8c\x8a\x8a\xe6\xe4\xe4\xb5\xb3\xb3\x13\x11\x11\
-\x14\x12\x12\x17\x12\x14\x1e\x37\x25\x6a\xbb\x7e\x69\xc3\x7e\x65\
-\x9c\x6e\x0c\x0c\x07\x14\x12\x12\x15\x13\x13\x16\x14\x14\x98\x96\
-\x96\xba\xb8\xb8\x9a\x98\x98\x06\x00\x05\x13\x15\x12\x10\x12\x11\
-\x34\x53\x3a\x74\xc2\x84\x70\xc1\x7e\x54\x80\x5d\x02\x0c\x02\x11\
-\x16\x10\x19\x14\x15\x35\x2d\x32\xac\xa9\xaa\x9b\x99\x99\x5f\x5d\
-\x5d\x16\x14\x14\x15\x13\x13\x13\x13\x12\x48\x79\x50\x6c\xbe\x7a\
-\x75\xc2\x86\x40\x5c\x48\x10\x11\x0c\x14\x13\x12\x19\x21\x19\x3d\
-\x5d\x41\x32\x64\x3b\x38\x5b\x40\x1e\x21\x1f\x16\x13\x13\x13\x14\
-\x13\x15\x12\x13\x0f\x0d\x0d\x32\x30\x2f\x27\x24\x24\x19\x17\x17\
-\x0e\x0c\x0c\x1b\x13\x19\x2a\x28\x27\x3d\x5c\x40\x35\x62\x3c\x36\
-\x54\x3c\x18\x12\x16\x13\x11\x11\x16\x14\x14\x1b\x19\x19\x0e\x0c\
-\x0c\x2f\x2d\x2d\x18\x1a\x17\x16\x12\x14\x18\x17\x17\x1d\x14\x1c\
-\x2d\x37\x31\x31\x63\x3e\x32\x64\x3b\x38\x48\x3a\x18\x0d\x14\x1f\
-\x1a\x1b\x0f\x0a\x0b\x10\x0f\x0e\x19\x17\x17\x29\x27\x27\x1c\x1a\
-\x1a\x17\x15\x15\x15\x13\x13\x15\x13\x13\x3a\x43\x3c\x34\x64\x3f\
-\x2b\x5e\x37\x33\x3d\x36\x16\x0d\x0f\x16\x12\x13\x15\x1c\x15\x63\
-\xa5\x71\x5a\xb1\x6d\x69\xa5\x77\x19\x25\x1b\x17\x12\x14\x14\x15\
-\x14\x0c\x07\x07\x5e\x59\x5a\xc3\xbe\xbf\xb4\xaf\xb0\x0e\x09\x0a\
-\x1b\x16\x17\x14\x0c\x12\x23\x39\x28\x5f\xa9\x71\x64\xba\x7a\x58\
-\x8d\x66\x05\x06\x08\x15\x13\x13\x15\x13\x13\x02\x00\x00\x6b\x69\
-\x69\xaf\xad\xad\x96\x94\x94\x16\x0c\x12\x1f\x1e\x19\x0d\x0c\x08\
-\x34\x51\x39\x65\xb3\x75\x5f\xb3\x75\x4e\x78\x59\x0b\x0e\x0a\x13\
-\x10\x12\x15\x13\x12\x1f\x1a\x1c\x81\x7f\x7f\x97\x95\x95\x55\x53\
-\x53\x15\x13\x13\x17\x15\x15\x14\x14\x12\x45\x70\x4c\x65\xb5\x79\
-\x68\xb9\x7e\x36\x55\x40\x0e\x0c\x0e\x18\x13\x15\x19\x20\x19\x40\
-\x6b\x4a\x33\x71\x43\x40\x6d\x4c\x1d\x21\x1e\x17\x11\x15\x14\x15\
-\x14\x1f\x1b\x1c\x23\x21\x21\x78\x73\x74\x84\x7f\x80\x08\x03\x04\
-\x17\x12\x12\x1b\x0f\x15\x2c\x30\x2b\x3e\x6b\x49\x37\x74\x49\x37\
-\x61\x3e\x15\x13\x11\x15\x13\x13\x15\x13\x13\x1f\x1d\x1d\x4a\x48\
-\x48\x67\x65\x65\x5b\x5c\x5a\x19\x14\x15\x16\x14\x12\x15\x0f\x11\
-\x2f\x41\x32\x31\x71\x40\x35\x7b\x43\x3b\x5c\x3e\x11\x0c\x0a\x22\
-\x1c\x1e\x0f\x0e\x0c\x0f\x0e\x0f\x7f\x7d\x7d\x64\x62\x62\x30\x2e\
-\x2e\x16\x14\x14\x17\x15\x15\x14\x13\x13\x30\x47\x36\x36\x70\x44\
-\x37\x77\x47\x34\x45\x38\x12\x0c\x10\x17\x13\x14\x18\x1f\x19\x4d\
-\x81\x56\x4b\x91\x56\x51\x82\x5a\x1e\x23\x1b\x1a\x12\x13\x15\x14\
-\x11\x19\x13\x15\x23\x1f\x1f\x84\x7f\x7f\x21\x1c\x1d\x1b\x16\x17\
-\x13\x10\x11\x0e\x13\x17\x1d\x2e\x25\x4c\x81\x56\x4c\x8b\x58\x46\
-\x70\x4d\x1a\x17\x18\x15\x13\x13\x15\x13\x13\x19\x17\x17\x5e\x5c\
-\x5c\x65\x63\x63\x0d\x0d\x0c\x1b\x17\x18\x16\x12\x11\x16\x0e\x12\
-\x34\x44\x38\x4d\x87\x5a\x44\x85\x58\x45\x5d\x4d\x10\x07\x10\x16\
-\x0d\x15\x1d\x1b\x1a\x02\x02\x01\x9b\x9a\x9a\x70\x6e\x6e\x10\x0e\
-\x0e\x16\x14\x14\x17\x15\x15\x14\x13\x13\x3a\x56\x43\x4e\x89\x5a\
-\x45\x84\x53\x3a\x4a\x38\x12\x10\x10\x17\x13\x14\x18\x1e\x18\x5b\
-\x97\x69\x4c\x9e\x5d\x5c\x95\x69\x1c\x27\x1e\x16\x14\x15\x11\x14\
-\x13\x10\x0b\x0c\x61\x5c\x5d\xb0\xaa\xac\xe7\xe2\xe3\x1f\x1a\x1b\
-\x15\x11\x11\x13\x10\x0d\x22\x38\x28\x57\xa0\x6d\x4e\xa5\x68\x51\
-\x89\x5d\x0b\x0f\x07\x16\x14\x14\x16\x14\x14\x0a\x08\x08\x66\x64\
-\x64\x98\x96\x96\xa5\xa4\xa3\x13\x0d\x11\x16\x15\x11\x13\x12\x10\
-\x30\x4d\x35\x56\xa2\x66\x53\xa5\x68\x43\x6c\x4b\x0f\x11\x0e\x12\
-\x0f\x10\x17\x15\x14\x23\x1e\x20\x7c\x7a\x7a\x8e\x8c\x8c\x4f\x4d\
-\x4d\x16\x14\x14\x15\x13\x13\x14\x14\x13\x3b\x68\x43\x56\xa5\x66\
-\x58\xa3\x66\x38\x51\x39\x0f\x11\x0c\x19\x15\x17\x17\x1f\x18\x3a\
-\x62\x42\x31\x6d\x3e\x3a\x62\x43\x20\x20\x1e\x1b\x12\x16\x17\x15\
-\x14\x1b\x16\x17\x14\x0f\x10\x24\x22\x22\x1c\x17\x18\x10\x0b\x0c\
-\x20\x1e\x1e\x12\x10\x18\x27\x2c\x2c\x3a\x60\x42\x36\x6c\x42\x37\
-\x5e\x41\x12\x11\x12\x14\x12\x12\x14\x12\x12\x17\x15\x15\x29\x27\
-\x27\x0e\x0d\x0d\x1f\x21\x1e\x1b\x16\x17\x18\x16\x13\x18\x0c\x14\
-\x34\x3e\x36\x33\x64\x3e\x33\x6d\x3f\x3a\x4f\x3a\x18\x0c\x11\x17\
-\x0e\x14\x12\x10\x0f\x0f\x11\x0f\x33\x32\x32\x12\x10\x10\x14\x12\
-\x12\x16\x14\x14\x15\x13\x13\x16\x14\x14\x3f\x4c\x43\x2f\x63\x3b\
-\x30\x6b\x3f\x2e\x40\x31\x12\x0f\x0e\x15\x12\x13\x16\x1f\x18\x6c\
-\xb6\x7d\x63\xc1\x79\x70\xb1\x7f\x19\x29\x1f\x15\x14\x15\x11\x11\
-\x12\x1a\x16\x16\x75\x70\x71\xb4\xaf\xb0\xff\xff\xff\x1d\x18\x19\
-\x16\x12\x12\x10\x0e\x0e\x21\x3f\x28\x5d\xb3\x76\x60\xc0\x7d\x5e\
-\x9c\x71\x0e\x16\x13\x18\x16\x16\x16\x14\x14\x21\x1f\x1f\x8b\x89\
-\x89\x96\x93\x93\xbf\xbe\xbe\x19\x10\x14\x14\x14\x0f\x0e\x15\x0e\
-\x30\x56\x36\x69\xbe\x7a\x67\xbf\x7d\x4f\x7f\x5b\x06\x0d\x07\x17\
-\x18\x18\x12\x10\x0f\x36\x2f\x33\xa6\xa3\xa4\xa8\xa6\xa6\x60\x5e\
-\x5e\x16\x14\x14\x15\x13\x13\x15\x15\x13\x47\x7d\x4e\x6a\xc4\x7c\
-\x6d\xc5\x82\x36\x57\x3d\x11\x11\x0e\x11\x10\x12\x15\x1e\x17\x3d\
-\x5b\x44\x34\x63\x3c\x3a\x5b\x43\x1d\x20\x1e\x18\x13\x14\x1a\x19\
-\x16\x13\x0f\x10\x0f\x0a\x0b\x27\x24\x23\x30\x2b\x2c\x13\x0e\x0f\
-\x1b\x17\x18\x12\x10\x14\x27\x2d\x25\x3a\x5c\x3b\x38\x64\x43\x39\
-\x59\x44\x19\x13\x1a\x16\x14\x14\x16\x14\x14\x11\x0f\x0f\x20\x1e\
-\x1e\x13\x12\x11\x29\x28\x29\x1b\x15\x17\x16\x12\x14\x1d\x13\x18\
-\x35\x3d\x34\x33\x5e\x3c\x30\x65\x3d\x3a\x4f\x3b\x12\x0c\x0e\x19\
-\x16\x1c\x19\x18\x18\x14\x0f\x11\x27\x21\x23\x13\x0e\x0f\x19\x14\
-\x15\x19\x14\x15\x16\x11\x12\x19\x14\x15\x39\x43\x39\x2c\x59\x37\
-\x27\x5b\x38\x2f\x3a\x35\x11\x0c\x11\x13\x12\x14\x13\x1e\x15\x68\
-\xb3\x77\x64\xc0\x77\x6f\xae\x7b\x18\x29\x19\x17\x14\x13\x18\x13\
-\x12\x0f\x0c\x0d\x6a\x65\x66\xc6\xc1\xc2\xd3\xce\xcf\x1f\x1a\x1b\
-\x1a\x16\x16\x14\x12\x12\x20\x39\x24\x60\xb0\x71\x60\xbd\x73\x55\
-\x94\x65\x06\x0d\x0a\x16\x14\x14\x16\x14\x14\x07\x05\x05\x6f\x6d\
-\x6d\x86\x84\x84\xc4\xc5\xc5\x12\x11\x11\x15\x17\x13\x0c\x0f\x06\
-\x33\x59\x3c\x5b\xb3\x75\x60\xb7\x78\x54\x7d\x5a\x06\x0b\x03\x14\
-\x11\x11\x0f\x0d\x0d\x10\x0b\x0f\x91\x8c\x8e\x41\x3c\x3d\x61\x5c\
-\x5d\x19\x14\x15\x16\x11\x12\x17\x15\x14\x45\x79\x53\x68\xba\x7b\
-\x72\xc4\x84\x3c\x57\x41\x11\x11\x0b\x13\x12\x14\x10\x1a\x13\x33\
-\x63\x42\x2a\x6b\x3c\x3f\x6b\x4b\x1c\x24\x1c\x1b\x13\x13\x19\x13\
-\x12\x1c\x17\x18\x16\x11\x12\x6a\x65\x66\x8c\x87\x88\x1d\x18\x19\
-\x19\x15\x15\x1b\x15\x16\x20\x2a\x28\x33\x68\x46\x2f\x70\x40\x3c\
-\x60\x46\x16\x0f\x19\x16\x14\x14\x16\x14\x14\x1d\x1b\x1b\x23\x22\
-\x22\x44\x42\x41\x70\x6d\x70\x1a\x10\x16\x0f\x12\x13\x10\x10\x10\
-\x28\x3a\x2a\x34\x69\x3d\x29\x6b\x3a\x2f\x4d\x34\x1b\x16\x14\x10\
-\x07\x0a\x11\x0c\x0d\x22\x22\x22\x58\x54\x54\x25\x20\x21\x42\x3d\
-\x3e\x19\x14\x15\x16\x11\x12\x18\x14\x15\x36\x4c\x3a\x2d\x68\x37\
-\x27\x66\x32\x2c\x3d\x2f\x13\x0f\x15\x14\x13\x14\x16\x21\x1a\x4e\
-\x8d\x5b\x4a\x9b\x5d\x54\x8d\x62\x1a\x28\x1b\x18\x14\x13\x19\x14\
-\x13\x13\x0e\x0f\x14\x0f\x10\x8b\x87\x87\x93\x8e\x8f\x13\x0e\x0f\
-\x16\x11\x12\x1a\x17\x15\x1f\x33\x26\x4a\x92\x5e\x44\x9a\x59\x46\
-\x7e\x52\x12\x15\x14\x15\x13\x13\x17\x15\x15\x0c\x0a\x0a\x25\x23\
-\x23\x71\x6f\x6f\x88\x89\x89\x10\x0d\x0c\x16\x1a\x14\x11\x13\x0f\
-\x2d\x49\x36\x4a\x91\x60\x47\x94\x5d\x41\x66\x47\x0e\x0f\x08\x10\
-\x0a\x0b\x1f\x1d\x1d\x01\x00\x00\x45\x40\x41\x83\x7e\x7f\x49\x44\
-\x45\x18\x13\x14\x18\x13\x14\x18\x14\x14\x40\x66\x4d\x4f\x95\x5f\
-\x51\x9a\x60\x31\x4a\x35\x13\x12\x0f\x13\x11\x13\x18\x22\x1c\x48\
-\x7e\x53\x40\x89\x50\x4d\x80\x58\x19\x25\x1b\x18\x15\x13\x17\x15\
-\x13\x14\x0f\x10\x39\x35\x35\xb9\xb4\xb5\xc4\xbf\xc0\x12\x0d\x0e\
-\x1b\x16\x17\x21\x1a\x1e\x22\x2f\x23\x52\x8b\x60\x4b\x91\x5e\x48\
-\x77\x54\x11\x13\x11\x15\x13\x13\x17\x15\x15\x16\x14\x14\x56\x55\
-\x55\x88\x86\x86\x97\x97\x9b\x0f\x0b\x11\x0f\x0c\x10\x19\x15\x13\
-\x2a\x43\x2c\x4d\x95\x5c\x49\x92\x5b\x44\x67\x48\x0e\x0f\x0b\x10\
-\x0f\x10\x0f\x0c\x0d\x21\x1a\x1e\x92\x8d\x8e\x96\x90\x91\x49\x44\
-\x45\x19\x14\x15\x17\x12\x13\x17\x13\x13\x38\x5c\x3a\x43\x88\x50\
-\x46\x8b\x57\x35\x48\x3b\x0f\x0c\x10\x16\x15\x15\x15\x1e\x17\x45\
-\x71\x4f\x3a\x7b\x4a\x46\x72\x51\x1c\x23\x1f\x17\x13\x15\x15\x14\
-\x14\x19\x16\x15\x03\x00\x00\x3d\x3c\x3c\x47\x46\x46\x1e\x1b\x1b\
-\x1b\x18\x18\x19\x14\x17\x2b\x25\x28\x39\x41\x3b\x33\x40\x3a\x2f\
-\x39\x33\x15\x0b\x11\x16\x14\x14\x16\x14\x14\x14\x12\x12\x11\x10\
-\x10\x30\x2e\x2e\x39\x38\x37\x18\x11\x10\x19\x16\x15\x19\x18\x18\
-\x2f\x44\x34\x3c\x74\x49\x35\x77\x47\x3b\x5a\x40\x12\x12\x0f\x13\
-\x10\x15\x10\x0e\x0f\x10\x0c\x0d\x17\x13\x13\x43\x42\x41\x1b\x18\
-\x18\x16\x12\x13\x17\x12\x12\x15\x12\x12\x38\x50\x41\x3c\x77\x4d\
-\x37\x77\x4a\x2c\x41\x34\x0f\x0c\x0d\x17\x14\x14\x18\x23\x19\x5e\
-\xa1\x70\x5d\xb4\x71\x6c\xab\x79\x1a\x29\x1b\x17\x14\x14\x14\x14\
-\x13\x0c\x0a\x0a\x70\x6e\x6e\xc6\xc4\xc4\xae\xac\xac\x0c\x0a\x0a\
-\x11\x0f\x0f\x17\x15\x16\x23\x25\x24\x28\x2e\x28\x26\x2d\x26\x2e\
-\x32\x2d\x0d\x12\x0c\x16\x14\x14\x16\x14\x14\x10\x0e\x0e\x76\x74\
-\x74\x99\x97\x97\x87\x86\x86\x14\x0f\x14\x1b\x14\x19\x10\x14\x0f\
-\x35\x5a\x3e\x64\xad\x79\x68\xb5\x7e\x49\x77\x54\x05\x0c\x03\x18\
-\x13\x14\x19\x17\x19\x1d\x1a\x1a\x92\x90\x8f\x7f\x7d\x7c\x55\x53\
-\x52\x16\x14\x13\x17\x15\x14\x13\x14\x11\x41\x6f\x51\x65\xb5\x79\
-\x6a\xb7\x7a\x3a\x59\x3f\x0f\x11\x0e\x17\x13\x13\x15\x1f\x16\x3d\
-\x5c\x40\x32\x65\x39\x3b\x5d\x3d\x23\x22\x21\x1a\x11\x18\x12\x12\
-\x15\x15\x14\x14\x12\x10\x10\x03\x01\x01\x39\x37\x37\x12\x10\x10\
-\x15\x13\x13\x16\x13\x14\x25\x27\x26\x41\x48\x42\x42\x49\x42\x3c\
-\x3f\x3a\x0f\x12\x0e\x16\x14\x14\x16\x14\x14\x0f\x0d\x0d\x0b\x09\
-\x09\x15\x13\x13\x2f\x31\x31\x1d\x1c\x1d\x1a\x14\x18\x15\x10\x13\
-\x31\x39\x33\x32\x47\x39\x2d\x47\x38\x31\x3b\x36\x15\x0f\x12\x16\
-\x12\x13\x17\x1a\x18\x13\x15\x13\x0d\x0b\x0a\x1c\x1a\x19\x24\x22\
-\x21\x16\x14\x13\x17\x15\x14\x15\x14\x12\x3a\x4a\x3c\x2c\x60\x39\
-\x28\x5d\x35\x30\x39\x2e\x17\x0d\x16\x17\x14\x14\x17\x22\x18\x67\
-\xb4\x7f\x62\xc4\x7b\x6f\xb4\x7f\x1a\x2a\x18\x19\x15\x11\x19\x14\
-\x10\x0d\x0b\x0b\x68\x66\x66\xd2\xd0\xd0\xc8\xc6\xc6\x16\x14\x14\
-\x19\x17\x17\x19\x17\x18\x22\x23\x23\x26\x2c\x27\x27\x2e\x27\x29\
-\x2d\x28\x0c\x0f\x0b\x16\x14\x14\x16\x14\x14\x0d\x0b\x0b\x67\x65\
-\x65\xbb\xb9\xb9\x81\x7f\x7e\x14\x15\x13\x13\x11\x0f\x17\x13\x12\
-\x34\x32\x31\x2b\x2b\x27\x24\x26\x26\x3a\x37\x3a\x13\x0e\x12\x13\
-\x12\x11\x0d\x10\x0e\x12\x0f\x10\x77\x75\x74\xb6\xb4\xb3\x3e\x3c\
-\x3b\x16\x14\x13\x17\x15\x14\x14\x14\x11\x4d\x7a\x4f\x66\xbd\x7f\
-\x6e\xc7\x8d\x34\x5c\x40\x0c\x13\x0b\x17\x14\x14\x12\x1d\x14\x3c\
-\x5b\x3f\x2e\x60\x35\x38\x5b\x3b\x20\x1e\x1e\x19\x10\x18\x15\x15\
-\x18\x17\x15\x14\x0d\x0b\x0b\x4f\x4d\x4d\x61\x5f\x5f\x16\x14\x14\
-\x16\x14\x14\x17\x14\x15\x23\x24\x23\x3b\x42\x3c\x42\x49\x42\x3e\
-\x42\x3d\x0e\x12\x0d\x17\x15\x15\x17\x15\x15\x1d\x1a\x1a\x25\x24\
-\x24\x3d\x3b\x3b\x43\x3f\x42\x19\x14\x18\x1b\x18\x1a\x12\x12\x12\
-\x30\x33\x31\x3f\x42\x3d\x40\x46\x3f\x38\x3d\x39\x0b\x0d\x0d\x11\
-\x11\x0f\x18\x14\x14\x1a\x14\x19\x47\x45\x45\x40\x3e\x3d\x27\x25\
-\x24\x15\x13\x12\x14\x12\x11\x15\x14\x12\x31\x40\x36\x37\x59\x45\
-\x34\x53\x3f\x34\x36\x32\x19\x11\x14\x16\x13\x13\x13\x1d\x15\x67\
-\xa5\x78\x60\xb2\x72\x67\xa1\x70\x1d\x29\x1b\x19\x14\x13\x12\x13\
-\x10\x24\x22\x22\x09\x07\x07\x5a\x58\x58\x13\x11\x11\x0c\x0a\x0a\
-\x14\x12\x12\x18\x15\x17\x23\x24\x23\x29\x2f\x29\x27\x2e\x28\x2b\
-\x2f\x2a\x12\x16\x11\x17\x15\x15\x17\x15\x15\x22\x20\x20\x14\x12\
-\x12\x83\x81\x81\x00\x00\x00\x16\x13\x15\x1c\x19\x1e\x15\x11\x16\
-\x2a\x2c\x2b\x28\x2e\x28\x23\x2c\x22\x29\x30\x2b\x0d\x0e\x0e\x18\
-\x13\x15\x1d\x17\x18\x18\x17\x19\x10\x0e\x0d\x90\x8e\x8c\x06\x05\
-\x04\x15\x13\x12\x15\x13\x12\x15\x13\x12\x31\x33\x32\x26\x30\x26\
-\x28\x2f\x26\x33\x32\x2d\x0a\x0d\x08\x13\x12\x13\x15\x1e\x1c\x3b\
-\x6e\x47\x3e\x7a\x4e\x46\x6e\x51\x21\x25\x1a\x15\x13\x13\x1c\x12\
-\x17\x15\x13\x14\x0c\x0b\x0b\x93\x90\x90\x14\x12\x12\x11\x0f\x0f\
-\x1a\x18\x18\x19\x15\x16\x1f\x20\x21\x31\x37\x35\x32\x39\x37\x36\
-\x38\x37\x0b\x0c\x0b\x16\x14\x14\x16\x14\x14\x10\x0e\x0e\x11\x0f\
-\x0f\xaf\xad\xad\x01\x00\x00\x19\x15\x13\x17\x12\x14\x15\x11\x13\
-\x2b\x2c\x2d\x32\x37\x36\x34\x39\x36\x33\x37\x37\x0c\x09\x0c\x17\
-\x13\x15\x17\x12\x13\x13\x11\x11\x0f\x0b\x0c\xaa\xa5\xa6\x08\x05\
-\x05\x17\x12\x13\x17\x13\x13\x16\x11\x12\x36\x33\x33\x34\x37\x36\
-\x2d\x31\x31\x30\x30\x32\x0e\x0d\x0e\x17\x14\x17\x12\x1d\x20\x4d\
-\x8a\x98\x3e\x8e\x9e\x47\x84\x8f\x1f\x24\x28\x17\x15\x13\x17\x17\
-\x15\x14\x11\x12\x10\x0e\x0e\x43\x42\x42\x0b\x09\x09\x12\x10\x10\
-\x1b\x19\x19\x16\x13\x15\x25\x26\x27\x3a\x3e\x40\x38\x3d\x3e\x3a\
-\x3b\x3c\x12\x10\x12\x16\x14\x14\x16\x14\x14\x19\x17\x17\x00\x00\
-\x00\x5e\x5c\x5c\x02\x00\x01\x19\x14\x15\x18\x15\x15\x11\x10\x12\
-\x2f\x33\x34\x3a\x41\x44\x35\x3b\x3f\x39\x3b\x3f\x0d\x0d\x0f\x17\
-\x14\x16\x18\x13\x14\x15\x13\x13\x00\x00\x00\x5b\x57\x58\x0d\x08\
-\x09\x17\x12\x13\x18\x13\x14\x15\x11\x12\x35\x3b\x3b\x2f\x39\x3b\
-\x31\x3a\x3d\x31\x36\x39\x08\x0d\x0c\x12\x10\x13\x19\x23\x27\x52\
-\xad\xb7\x3f\xb5\xbe\x51\xab\xb1\x16\x27\x29\x16\x15\x11\x16\x17\
-\x12\x16\x14\x14\x1e\x1c\x1c\xb4\xb2\xb2\x1e\x1c\x1c\x0e\x0c\x0c\
-\x14\x12\x12\x16\x13\x15\x26\x29\x2a\x30\x38\x38\x30\x38\x38\x35\
-\x39\x3a\x10\x11\x13\x16\x14\x14\x16\x14\x14\x15\x13\x13\x2d\x2b\
-\x2b\xc8\xc6\xc6\x05\x03\x03\x17\x15\x15\x16\x15\x15\x12\x13\x14\
-\x2c\x31\x32\x30\x37\x3b\x2d\x34\x37\x35\x38\x3b\x0d\x0e\x0f\x17\
-\x14\x16\x18\x13\x14\x15\x13\x13\x4f\x4a\x4b\xa6\xa1\xa2\x0d\x09\
-\x09\x17\x12\x13\x18\x13\x14\x16\x11\x12\x32\x3a\x3a\x27\x33\x34\
-\x29\x32\x35\x34\x36\x39\x0d\x0c\x0b\x14\x13\x15\x14\x1e\x21\x32\
-\x59\x69\x26\x5b\x6c\x36\x5d\x69\x24\x21\x24\x16\x15\x10\x17\x15\
-\x10\x15\x12\x13\x14\x12\x12\x15\x13\x13\x02\x01\x01\x1b\x19\x19\
-\x18\x16\x16\x16\x14\x16\x1f\x24\x25\x38\x42\x42\x3c\x46\x46\x38\
-\x3c\x3e\x0c\x0e\x0f\x16\x14\x14\x16\x14\x14\x13\x11\x11\x08\x06\
-\x06\x1f\x1e\x1e\x0a\x09\x09\x16\x14\x14\x15\x15\x15\x0e\x0f\x10\
-\x2f\x35\x35\x39\x43\x46\x3d\x44\x47\x3a\x3d\x40\x0c\x0c\x0d\x19\
-\x16\x18\x17\x12\x13\x15\x13\x13\x05\x01\x02\x20\x1b\x1c\x17\x12\
-\x13\x17\x12\x13\x18\x13\x14\x16\x12\x12\x38\x3d\x3e\x39\x42\x45\
-\x3f\x44\x47\x35\x33\x36\x12\x0d\x0d\x13\x11\x14\x15\x20\x23\x64\
-\xd4\xdd\x59\xe2\xeb\x6d\xd5\xde\x12\x27\x2d\x19\x13\x15\x19\x14\
-\x15\x16\x13\x13\x31\x2f\x2f\x83\x81\x81\x10\x0e\x0e\x13\x11\x11\
-\x0c\x0a\x0a\x17\x14\x16\x22\x24\x25\x35\x3c\x3c\x2e\x34\x34\x30\
-\x33\x34\x0f\x10\x11\x16\x14\x14\x17\x15\x15\x18\x16\x16\x56\x53\
-\x53\x94\x92\x92\x01\x00\x00\x15\x13\x13\x17\x15\x15\x0e\x0f\x10\
-\x30\x35\x36\x2b\x33\x36\x2b\x31\x34\x3a\x3d\x40\x0e\x0e\x0f\x16\
-\x13\x15\x19\x15\x15\x14\x12\x12\x6b\x66\x67\xb0\xab\xac\x0b\x06\
-\x07\x17\x12\x13\x18\x13\x14\x17\x12\x13\x36\x3d\x3d\x28\x35\x36\
-\x26\x32\x34\x32\x36\x38\x0e\x0e\x0e\x16\x15\x17\x14\x1f\x22\x19\
-\x47\x51\x11\x52\x5c\x21\x51\x5c\x21\x21\x26\x16\x14\x13\x17\x13\
-\x17\x12\x10\x10\x0c\x0a\x0a\x27\x25\x25\x02\x00\x00\x14\x12\x12\
-\x1c\x1a\x1a\x19\x14\x16\x24\x25\x26\x3b\x3f\x40\x41\x46\x47\x3e\
-\x40\x41\x0c\x0a\x0d\x16\x14\x14\x17\x15\x15\x1e\x1c\x1c\x04\x03\
-\x03\x4a\x47\x47\x07\x05\x05\x17\x12\x13\x19\x14\x15\x11\x0e\x10\
-\x36\x38\x39\x39\x3e\x41\x3b\x41\x43\x39\x3c\x3f\x0e\x0f\x10\x15\
-\x12\x14\x18\x13\x14\x16\x14\x14\x08\x03\x04\x2b\x26\x27\x19\x14\
-\x15\x17\x12\x13\x18\x13\x14\x16\x12\x13\x36\x39\x3a\x3b\x43\x45\
-\x3b\x43\x46\x31\x35\x38\x0b\x0f\x0e\x17\x12\x12\x10\x1f\x1e\x5e\
-\xc7\xcc\x57\xd5\xe3\x61\xbc\xca\x0f\x26\x29\x1e\x11\x15\x21\x13\
-\x1c\x19\x15\x16\x19\x14\x15\x24\x1f\x20\x0e\x08\x09\x1c\x16\x17\
-\x1e\x1c\x1c\x11\x10\x14\x24\x29\x2c\x2c\x37\x39\x2d\x39\x3b\x2f\
-\x36\x38\x12\x13\x15\x0f\x0d\x0d\x18\x16\x16\x25\x23\x23\x2e\x2c\
-\x2c\x4f\x4d\x4d\x00\x00\x00\x12\x10\x10\x13\x11\x11\x13\x13\x13\
-\x2e\x32\x32\x31\x39\x39\x28\x31\x31\x33\x3a\x39\x08\x0a\x0a\x1a\
-\x1a\x1a\x1e\x1c\x1c\x1c\x1b\x1b\x56\x54\x54\x78\x76\x76\x07\x05\
-\x05\x13\x11\x11\x18\x16\x16\x14\x13\x13\x35\x3a\x3d\x29\x30\x31\
-\x2c\x32\x33\x33\x36\x37\x12\x12\x12\x1a\x16\x16\x12\x1e\x21\x23\
-\x5d\x70\x17\x5e\x74\x25\x57\x65\x13\x23\x23\x16\x15\x11\x1a\x18\
-\x0d\x15\x11\x12\x1f\x1a\x1b\x31\x2c\x2d\x03\x00\x00\x17\x12\x13\
-\x19\x13\x14\x15\x13\x17\x23\x26\x2a\x35\x3d\x41\x33\x3c\x3f\x38\
-\x3d\x40\x06\x08\x09\x14\x12\x12\x12\x10\x10\x19\x17\x17\x0b\x0a\
-\x0a\x63\x60\x60\x05\x03\x03\x1d\x1b\x1b\x11\x0f\x0f\x11\x10\x10\
-\x30\x33\x32\x3a\x41\x40\x39\x40\x3f\x3a\x40\x3f\x06\x08\x08\x16\
-\x15\x15\x0e\x0c\x0c\x12\x10\x10\x04\x03\x03\x7a\x78\x78\x06\x05\
-\x05\x19\x17\x17\x14\x12\x12\x14\x12\x13\x34\x39\x3c\x37\x3c\x3d\
-\x3a\x3f\x40\x35\x36\x37\x0d\x0c\x0c\x17\x10\x15\x17\x1c\x26\x3c\
-\x37\x86\x29\x30\x98\x32\x39\x86\x20\x1d\x32\x18\x15\x0e\x10\x15\
-\x13\x30\x2c\x2c\x79\x74\x75\x8d\x88\x89\x7f\x7a\x7b\x10\x0b\x0c\
-\x17\x12\x13\x18\x14\x16\x25\x26\x28\x32\x36\x36\x2a\x2f\x30\x2b\
-\x2e\x2f\x0f\x0f\x11\x20\x1e\x1e\x1c\x1a\x1a\x53\x51\x51\x57\x55\
-\x55\x66\x64\x64\x7a\x78\x78\x11\x0f\x0f\x17\x15\x15\x11\x10\x10\
-\x2e\x2f\x30\x31\x37\x36\x2d\x32\x31\x2e\x30\x30\x12\x10\x10\x14\
-\x0f\x10\x16\x10\x11\x6d\x68\x69\x52\x4f\x4f\x68\x66\x66\x5c\x5a\
-\x5a\x0f\x0d\x0d\x1b\x19\x19\x16\x14\x14\x33\x33\x37\x2f\x2f\x31\
-\x2c\x2c\x2e\x32\x31\x32\x11\x0c\x0e\x16\x10\x16\x1a\x19\x26\x32\
-\x3d\x98\x29\x3f\xb8\x30\x3f\x9a\x1e\x1e\x34\x17\x14\x08\x17\x16\
-\x13\x47\x42\x43\x92\x8c\x8d\x99\x94\x95\xb8\xb3\xb4\x1d\x18\x19\
-\x15\x10\x11\x15\x10\x12\x29\x26\x29\x31\x30\x33\x2b\x2b\x2d\x29\
-\x28\x2a\x11\x10\x12\x16\x14\x14\x13\x11\x11\x7d\x7b\x7b\x8a\x88\
-\x88\x93\x91\x91\xbc\xbb\xbb\x00\x00\x00\x14\x12\x12\x12\x10\x10\
-\x2b\x2c\x2c\x2e\x31\x31\x30\x32\x32\x38\x36\x36\x14\x0f\x10\x18\
-\x12\x13\x11\x0b\x0c\xab\xa5\xa6\x70\x6e\x6e\xbf\xbd\xbd\xa7\xa5\
-\xa5\x03\x01\x01\x15\x13\x13\x12\x10\x10\x2f\x2c\x31\x32\x31\x34\
-\x32\x31\x33\x30\x2f\x30\x13\x0f\x0f\x17\x14\x15\x20\x1b\x23\x2c\
-\x27\x31\x2a\x24\x30\x2f\x25\x2d\x18\x16\x16\x12\x13\x14\x19\x12\
-\x11\x12\x0d\x0e\x11\x0c\x0d\x09\x04\x05\x1b\x16\x17\x1a\x15\x16\
-\x1a\x15\x16\x17\x14\x14\x25\x22\x23\x25\x23\x23\x28\x27\x27\x24\
-\x23\x23\x17\x17\x17\x1a\x18\x18\x1b\x19\x19\x0e\x0c\x0c\x0f\x0e\
-\x0e\x10\x0e\x0e\x13\x12\x12\x10\x10\x10\x18\x16\x16\x15\x10\x11\
-\x2f\x2d\x2e\x29\x28\x28\x28\x27\x27\x24\x22\x22\x1c\x17\x18\x1a\
-\x14\x15\x1b\x18\x19\x09\x08\x08\x03\x02\x02\x10\x0e\x0e\x0a\x08\
-\x08\x18\x16\x16\x14\x12\x12\x16\x14\x14\x34\x2c\x32\x28\x25\x28\
-\x27\x27\x28\x24\x23\x24\x12\x11\x11\x17\x15\x14\x18\x14\x16\x71\
-\x71\x6f\x75\x79\x78\x6d\x6b\x68\x1f\x19\x1a\x14\x11\x15\x1c\x16\
-\x15\x1a\x15\x16\x1a\x15\x16\x1e\x19\x1a\x19\x14\x15\x15\x10\x11\
-\x18\x13\x14\x21\x1f\x1f\x32\x31\x31\x81\x7f\x7f\x7f\x7e\x7e\x71\
-\x74\x73\x01\x03\x04\x14\x12\x12\x13\x11\x11\x17\x15\x15\x13\x11\
-\x11\x15\x13\x13\x11\x0f\x0f\x17\x17\x17\x15\x13\x13\x1b\x16\x17\
-\x53\x4f\x50\x78\x78\x78\x7d\x7d\x7d\x5f\x5d\x5d\x07\x02\x03\x1b\
-\x16\x17\x14\x12\x12\x11\x12\x12\x16\x15\x15\x10\x0e\x0e\x1e\x1d\
-\x1d\x17\x15\x15\x14\x13\x13\x0f\x0d\x0d\x5c\x57\x5b\x6e\x6d\x6f\
-\x79\x79\x7b\x4a\x4c\x4c\x11\x11\x11\x1a\x15\x16\x3f\x3b\x3c\xee\
-\xea\xea\x92\x8f\x8f\xf6\xf4\xf4\x50\x4c\x4c\x12\x0d\x0e\x1b\x16\
-\x17\x16\x11\x12\x18\x13\x14\x17\x12\x13\x19\x14\x15\x18\x13\x14\
-\x17\x12\x13\x09\x08\x08\xa3\xa3\xa3\x6b\x6b\x6b\x01\x00\x00\xaa\
-\xaa\xaa\x00\x00\x00\x17\x12\x13\x1a\x15\x16\x18\x12\x13\x18\x13\
-\x14\x18\x13\x14\x18\x13\x14\x17\x14\x14\x18\x13\x14\x08\x03\x04\
-\xe6\xe4\xe5\x59\x54\x55\x1c\x17\x18\xff\xff\xff\x02\x00\x00\x19\
-\x14\x15\x1a\x15\x16\x18\x15\x15\x18\x13\x14\x19\x13\x14\x18\x12\
-\x14\x19\x14\x15\x18\x13\x14\x19\x14\x15\xff\xff\xff\xc6\xc6\xc6\
-\x41\x41\x41\xee\xee\xee\x05\x04\x04\x1b\x16\x17\x3d\x39\x3a\xeb\
-\xe6\xe7\x54\x4f\x50\xf6\xf5\xf6\x47\x42\x43\x15\x10\x11\x19\x14\
-\x15\x17\x12\x13\x17\x12\x13\x17\x12\x13\x19\x14\x15\x18\x13\x14\
-\x17\x12\x13\x0d\x0b\x0b\x9d\x9c\x9c\xee\xec\xec\x6c\x6a\x6a\xee\
-\xec\xec\x04\x02\x02\x1b\x16\x17\x1a\x15\x16\x17\x12\x13\x18\x13\
-\x14\x18\x13\x14\x18\x13\x14\x19\x14\x15\x19\x14\x15\x19\x14\x15\
-\xd2\xcf\xd0\xfb\xf7\xf8\x11\x0c\x0d\xff\xfd\xfe\x00\x00\x00\x18\
-\x13\x14\x18\x13\x14\x18\x13\x14\x19\x14\x15\x19\x14\x15\x19\x14\
-\x15\x19\x14\x15\x18\x13\x14\x18\x13\x14\xfe\xfe\xfe\x3e\x3c\x3c\
-\x63\x61\x61\xec\xeb\xeb\x07\x05\x05\x19\x15\x14\x3c\x38\x38\xe2\
-\xdf\xde\xa6\xa2\xa1\xf7\xf5\xf4\x47\x43\x42\x15\x11\x10\x15\x11\
-\x10\x17\x13\x12\x17\x13\x12\x17\x13\x12\x19\x15\x14\x18\x14\x13\
-\x18\x13\x12\x0f\x0d\x0c\x94\x93\x92\xcd\xcc\xcb\x38\x36\x35\xff\
-\xff\xff\x14\x12\x11\x18\x14\x14\x1a\x16\x15\x18\x14\x13\x18\x14\
-\x13\x18\x14\x13\x18\x13\x13\x17\x12\x13\x17\x12\x13\x05\x01\x01\
-\xdf\xdc\xdd\xa0\x9c\x9d\x66\x60\x60\xfb\xfa\xfa\x05\x01\x00\x16\
-\x12\x11\x17\x13\x12\x17\x13\x12\x17\x12\x13\x17\x12\x13\x17\x12\
-\x13\x19\x14\x15\x18\x13\x14\x18\x13\x14\xff\xfe\xfc\xfb\xf9\xf8\
-\x66\x63\x62\xe5\xe4\xe4\x06\x04\x03\x13\x0f\x0e\x13\x0f\x0e\x22\
-\x1d\x1c\x21\x1d\x1c\x21\x1d\x1c\x12\x0e\x0d\x13\x0f\x0e\x13\x0f\
-\x0e\x12\x0e\x0d\x12\x0e\x0d\x12\x0e\x0d\x15\x11\x10\x15\x11\x10\
-\x15\x11\x10\x15\x11\x10\x10\x0c\x0b\x2b\x27\x26\x1f\x1b\x1a\x24\
-\x20\x1f\x0a\x06\x05\x12\x0e\x0d\x12\x0e\x0d\x15\x11\x10\x15\x11\
-\x10\x15\x11\x10\x15\x11\x10\x15\x10\x11\x15\x10\x11\x1d\x18\x19\
-\x15\x10\x11\x22\x1d\x1d\x1f\x1b\x1b\x1a\x16\x16\x0e\x0a\x09\x14\
-\x10\x0f\x13\x0f\x0e\x12\x0e\x0d\x15\x0f\x11\x14\x0f\x10\x15\x10\
-\x11\x13\x0e\x0f\x14\x0f\x10\x13\x0e\x0f\x17\x13\x12\x1a\x17\x17\
-\x21\x1d\x1c\x18\x15\x14\x13\x0f\x0e\x11\x0e\x0b\x11\x0e\x0c\x11\
-\x0d\x0b\x11\x0d\x0b\x11\x0d\x0b\x0f\x0c\x08\x10\x0d\x0b\x10\x0d\
-\x09\x11\x0d\x0b\x11\x0d\x0b\x11\x0d\x0b\x11\x0d\x0a\x11\x0d\x0a\
-\x11\x0d\x0a\x0f\x0c\x09\x10\x0c\x0a\x0e\x0b\x08\x12\x0f\x0c\x15\
-\x12\x0f\x15\x12\x0f\x10\x0d\x0a\x10\x0c\x0a\x11\x0d\x0b\x11\x0d\
-\x0a\x11\x0d\x0a\x11\x0c\x0d\x12\x0d\x0e\x12\x0d\x0e\x0e\x09\x0a\
-\x0f\x0a\x0b\x18\x13\x14\x12\x0e\x0d\x11\x0e\x0b\x14\x10\x0d\x0e\
-\x0b\x09\x10\x0d\x0a\x12\x0e\x0c\x15\x10\x11\x15\x10\x11\x15\x10\
-\x11\x11\x0c\x0d\x11\x0c\x0d\x11\x0c\x0d\x12\x0f\x0c\x10\x0d\x0a\
-\x0e\x0a\x07\x0f\x0b\x09\x13\x10\x0d\x08\x05\x02\x08\x05\x01\x07\
-\x04\x01\x07\x04\x01\x07\x04\x01\x06\x03\x00\x09\x06\x02\x09\x06\
-\x02\x07\x04\x01\x07\x04\x01\x07\x04\x01\x07\x05\x00\x06\x04\x00\
-\x06\x04\x00\x07\x03\x01\x06\x02\x00\x09\x04\x02\x09\x05\x01\x08\
-\x04\x02\x05\x00\x00\x06\x03\x00\x06\x03\x00\x07\x04\x00\x08\x05\
-\x01\x07\x05\x01\x07\x04\x01\x07\x02\x03\x07\x02\x03\x09\x04\x05\
-\x07\x03\x03\x04\x00\x01\x08\x05\x03\x06\x03\x00\x07\x04\x01\x08\
-\x05\x01\x07\x04\x01\x05\x02\x00\x06\x02\x01\x06\x02\x01\x06\x01\
-\x01\x07\x03\x03\x07\x03\x03\x07\x03\x03\x09\x05\x02\x0a\x05\x04\
-\x0b\x07\x04\x09\x04\x02\x09\x04\x01\x6e\x6a\x65\x6d\x69\x64\x6e\
-\x6a\x65\x6e\x6a\x64\x6e\x69\x64\x6f\x6b\x65\x6f\x6b\x65\x6f\x6b\
-\x66\x6d\x68\x65\x6d\x68\x65\x6d\x68\x65\x6d\x67\x64\x6e\x69\x66\
-\x6f\x6a\x66\x70\x6a\x63\x6f\x69\x61\x6e\x68\x61\x6f\x69\x61\x70\
-\x6a\x63\x6f\x6a\x64\x70\x6c\x67\x6f\x6b\x66\x6e\x6a\x65\x6e\x6a\
-\x64\x6f\x6b\x66\x6f\x6b\x66\x6d\x6a\x65\x6d\x6a\x65\x6e\x6b\x66\
-\x6e\x6b\x66\x6e\x6b\x66\x6f\x6c\x66\x6c\x69\x64\x6e\x6a\x65\x6b\
-\x68\x63\x6c\x69\x64\x6d\x6a\x65\x6e\x6a\x66\x6e\x6a\x66\x6e\x6a\
-\x66\x6e\x69\x65\x6e\x69\x65\x6e\x6a\x65\x6f\x6c\x64\x6f\x6c\x64\
-\x6f\x6c\x63\x6f\x6c\x65\x6f\x6c\x64\
-\x00\x00\xff\x21\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x03\x34\x00\x00\x00\xea\x08\x06\x00\x00\x00\x74\xae\x00\xb5\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x0b\x10\x11\x1d\x21\x1e\x70\xc3\xa2\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\xda\xec\xbd\x5b\xab\x2d\x49\x92\x26\x66\xe6\x11\xfb\
-\x9c\xaa\xac\xcb\xd0\xdd\xd3\x4c\xb7\x98\x87\x81\x81\x81\x79\x11\
-\x08\xf4\x22\x10\xe8\xdf\xe8\x4d\x3d\x99\x95\xb7\xdf\x50\x99\x27\
-\xb3\x8a\xd1\x9b\x7e\x87\xc4\xc0\x08\xc1\x68\xd0\xa0\x97\x41\x42\
-\x7a\x19\x24\x24\x18\x90\x98\xaa\xa6\x2e\xa9\xce\xca\x73\xd9\x6b\
-\x85\x9b\xe9\xc1\x6f\x66\x1e\x1e\x11\x1e\xb7\xb5\xd6\xc9\x74\x4b\
-\x56\xee\x7d\xd6\x5e\x2b\xc2\xdd\xc3\x2f\xf6\xd9\xe5\x33\x64\x66\
-\x86\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x79\x0f\
-\xc5\xb4\x21\x68\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\
-\x03\x34\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\
-\x00\x4d\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\
-\x40\xd3\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x06\x68\
-\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x01\x9a\
-\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\x80\xa6\
-\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x1a\xa0\x69\
-\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x03\x34\x4d\x9a\
-\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\x00\x4d\x93\x26\
-\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x40\xd3\xa4\x49\
-\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x06\x68\x9a\x34\x69\xd2\
-\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x01\x9a\x26\x4d\x9a\x34\
-\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\x80\xa6\x49\x93\x26\x4d\
-\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x1a\xa0\x69\xd2\xa4\x49\x93\
-\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x03\x34\x4d\x9a\x34\x69\xd2\xa4\
-\x49\x93\x26\x4d\x9a\x34\x69\xd2\x00\x4d\x93\x26\x4d\x9a\x34\x69\
-\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x40\xd3\xa4\x49\x93\x26\x4d\x9a\
-\x34\x69\xd2\xa4\x49\x93\x06\x68\x9a\x34\x69\xd2\xa4\x49\x93\x26\
-\x4d\x9a\x34\x69\xd2\xa4\x01\x9a\x26\x4d\x9a\x34\x69\xd2\xa4\x49\
-\x93\x26\x4d\x9a\x34\x69\x80\xa6\x49\x93\x26\x4d\x9a\x34\x69\xd2\
-\xa4\x49\x93\x26\x4d\x1a\xa0\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\
-\x69\xd2\xa4\x49\x03\x34\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\
-\x9a\x34\x69\xd2\x00\x4d\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\
-\x26\x4d\x9a\x34\x40\xd3\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\
-\x49\x93\x06\x68\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\
-\xd2\xa4\x01\x9a\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\
-\x34\x69\x80\xa6\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\
-\x4d\x1a\xa0\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\
-\x03\x34\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x34\x69\xd2\
-\x00\x4d\x93\x26\x4d\x9a\x34\x69\xd2\xa4\x49\x93\x26\x4d\x9a\x6c\
-\x97\xbe\x0d\xc1\x7a\x61\x00\x20\x22\x60\x66\x20\x66\x00\x62\x20\
-\x60\xf7\x37\x0e\x1f\xe2\x36\x50\x4d\x9a\x34\x69\xd2\xa4\x49\x93\
-\x26\x3f\x24\x05\x31\x08\xce\x7c\x0e\xd1\xfd\x19\x01\x10\x10\x10\
-\x11\x0c\x22\xa0\x41\x40\x63\x9a\xb7\xa1\x01\x9a\x73\x84\x88\xc1\
-\x12\x01\x91\x05\xb2\x04\x96\x08\x98\x18\x88\x09\x88\xc9\x61\x17\
-\x66\x60\x66\xe0\x30\x9b\x1b\x9e\x69\xd2\xa4\x49\x93\x26\x4d\x9a\
-\x34\xf9\xe1\x81\x99\x45\x40\x13\x7e\x38\x30\x83\x06\xc1\xa0\x71\
-\xc0\xc6\x18\xf7\xea\x0c\x74\xc6\x40\x67\x3a\x30\x06\xdb\xf8\x36\
-\x40\xb3\x01\xc0\xb0\xf3\xc0\x58\x6b\xdd\x2b\x00\x19\x6b\xfd\xfb\
-\x0e\xc8\x90\x07\x36\x0c\x04\x4c\xe0\xc1\x4c\xe6\xa9\xa9\x10\xbc\
-\xe1\xfa\xba\x57\x3b\x1e\x75\x4f\xd9\x32\x4e\x4d\x1e\xf0\x21\x3f\
-\xda\x24\xe7\x1f\xd0\x82\x6b\xd2\xe4\x4e\x82\x6d\x4f\x7f\xd8\xf1\
-\xbf\xf5\xd6\xfe\x5e\x9c\x49\x98\xfd\x8a\xee\x0d\x83\x08\x80\x08\
-\xc6\x20\x18\x74\xe0\xc5\x98\x0e\xba\xce\x83\x99\xce\xb8\xdf\xbb\
-\xce\xff\xbb\x83\x86\x6f\x1a\xa0\x99\x06\x31\xc4\x60\xc9\xc2\x60\
-\x09\x28\x00\x99\xfc\xe5\xbd\x34\xd6\x0a\x30\xc3\x04\xc4\x00\x00\
-\xce\x53\xc3\xd1\x41\xf3\xfd\xd9\x4e\xb1\x1d\x16\x4d\x1e\xf6\xc0\
-\xe0\x0d\x93\x19\x6f\xd4\x4e\xae\x5b\x4d\xed\x60\x6a\xd2\xa4\x49\
-\x93\xf7\xfc\x7c\xe2\xf9\x83\x07\xf3\x77\xdc\x1b\x0e\xcb\x78\x2f\
-\x0d\x1a\x0f\x66\x9c\x67\xc6\x79\x69\x3a\xe8\x03\x90\xe9\x3b\xe8\
-\x23\xc8\xe9\xa1\xeb\x0d\xf4\xcd\x7b\xd3\x00\x4d\x00\x31\x83\x75\
-\x00\xc5\xda\x01\x2c\x59\xb0\x43\xf0\xcc\x0c\xfe\x27\xb9\xf7\x6d\
-\x08\x37\x73\x5e\x1a\x22\x8e\x79\x34\xe1\x05\xc0\x09\xd0\x2c\xe9\
-\x59\x0f\x38\xff\xee\xdd\x24\x16\x6d\xe0\xbd\x17\x5a\xdb\x31\xfe\
-\xbe\xc3\x35\xdc\x39\x88\x3f\xf4\xf1\x78\xc4\xf1\xc2\x1b\xb4\xfb\
-\x7d\x3b\x28\xf9\x7b\x32\x9f\xf6\xf6\x05\xef\xd7\x55\x7e\x1f\x9f\
-\xdf\xae\x03\xe3\xbe\xcf\xe4\x3d\xd7\x65\xf1\xc8\x99\x70\xca\xf4\
-\x39\x69\x4e\x62\x06\x68\xc0\x79\x68\x1c\xa8\x71\xaf\xce\x87\x9c\
-\x99\xae\x8b\xde\x99\xae\x77\xbf\xf7\xe2\xf7\xf4\x72\x9f\x6f\x80\
-\xe6\x87\x02\x62\x18\x46\x9e\x97\xc1\x5a\xa0\xc1\xc2\x40\x1e\xc8\
-\x0c\x09\xc4\x04\x50\xa3\xc1\x8c\x27\x04\x90\x80\xc6\xa3\x98\xc4\
-\x09\xc0\xcb\x0b\x18\x1f\x77\xc7\xc2\xa3\xb7\x03\xbc\xe1\xa6\xc3\
-\x0f\xb3\x65\x35\x69\xd2\xa4\x49\x93\x26\x37\x3b\xac\x71\xf2\x04\
-\xe7\xf3\x6f\xbe\xf3\x2a\xdb\x5a\xc8\x6b\xfe\xf9\x78\x8f\x2e\x78\
-\x67\x00\x1c\x21\x00\xfa\xb0\xb3\x0e\xbd\x97\xc6\x87\x9c\x85\x10\
-\x34\x0f\x5e\xfa\xae\x4b\xde\x9b\xfc\xd5\x77\x3f\x48\xcf\x0d\x32\
-\xff\x30\xe8\xb8\x2c\xb1\x03\x27\x83\x85\x81\x3c\x68\x11\x5e\x98\
-\xc1\x0e\x3e\xd4\x8c\x62\xde\x8c\x0b\x2d\x4b\x21\x66\xf2\xc5\xc0\
-\x40\xe4\xbd\x32\x14\x00\x4d\x58\x40\xeb\xad\x9e\xf8\x90\x2b\xed\
-\x46\xc2\x47\x5f\x6a\xff\x05\xbf\x9f\xcb\x02\xef\xf3\x50\x9a\x9c\
-\x79\x1a\x6e\x7f\x7c\xb8\xf0\x61\x3e\x6a\x8e\xf1\x9d\xa6\x34\x1e\
-\x62\xec\x38\x41\xdb\x3c\x67\x7c\x78\xe3\x52\x5f\xd3\x04\xdc\x39\
-\x0e\x37\x19\x7f\x3e\xee\xb9\x4d\x4e\xe7\x83\xee\x81\x47\xce\x32\
-\xbc\xe7\xcc\xbe\xab\xf0\x09\x73\x80\x81\x4f\x9f\xaf\x18\xbc\x34\
-\x7e\x2e\x84\xd0\x33\x63\x0c\x98\x90\x53\x63\x3a\xe1\xb1\x49\xa0\
-\xc6\xe5\xd8\xb8\x10\x34\x05\x6c\xfa\x0e\x7a\xd3\x83\xe9\x0d\xf4\
-\x5d\x1f\xbf\xf3\x43\x80\x36\xdf\x7b\x40\x33\x10\x03\x59\x0b\xc3\
-\x60\xc1\x7a\x20\x13\xc0\xcb\xe0\x43\xcd\x48\x85\x96\x51\x24\x01\
-\x20\x72\x8c\x66\xe4\x49\x00\x58\x7a\x66\xbc\xd2\xcb\xec\x26\x3d\
-\x4b\x55\x7a\x43\x14\x07\x3e\xc0\xb6\x82\x37\xdb\x6c\xce\xbb\x12\
-\xaf\xbe\xcc\x94\x39\x87\xbf\x87\x2a\x7d\x03\x34\xb5\x23\xc1\x9b\
-\xc7\x8f\x2b\xef\x5d\xdf\x02\xde\x79\xa5\xfa\xd6\xf2\x8a\xf1\xba\
-\x6d\x08\xe3\xe2\xb7\xb1\xf2\xd9\xf0\x6d\x56\xcf\x9a\x8d\x9e\xb7\
-\xf4\x78\xd5\x19\xb3\x9c\x3a\x8f\x5c\xd7\x17\x2e\x5e\xae\x66\xce\
-\xe3\x1d\xb7\x95\x33\xc3\xc3\x0e\xb8\x36\xee\xb0\x45\xa8\x7f\xdc\
-\x4e\x65\xc5\x03\xb5\x86\x23\x42\xce\x66\x4f\x6b\xde\x71\x65\x3e\
-\x57\x0f\x40\x05\x6c\x43\x1e\x0d\x78\xb6\x33\x00\x63\x8c\xa3\x70\
-\x96\xcc\x67\x01\xd8\xc4\x50\xb4\x44\x16\xd0\x75\x06\xba\xbe\x8f\
-\xa1\x69\x25\xef\xcd\xf7\xd9\x69\xd3\xdf\x6a\x3b\x89\x8a\xbe\xa4\
-\x36\x0e\xdb\x9c\x7f\x88\x47\x8e\xb3\x25\x48\x61\x63\x0a\xcc\x78\
-\xd6\xb2\x61\xf0\xe0\x25\xb1\x97\x39\x00\x63\x81\x2c\xab\xd0\x32\
-\x75\x68\x32\x03\x1a\x03\xcc\x9c\x58\x2a\x04\x8a\xc1\xb9\xf5\x82\
-\xc5\x2d\xfe\x66\x88\xe3\x5e\xf3\x98\x6f\x78\x81\xea\xed\x27\x3e\
-\xb3\xec\xa0\x45\xf5\xeb\x4d\xd4\x7e\x5c\x35\x08\x38\x7b\xff\xb5\
-\x90\xa5\xa5\x12\xce\x3f\x13\x7e\x80\xb5\x85\x3b\x9f\xf3\xd9\xed\
-\xbe\xc5\x3a\xc1\xa3\xd6\x1b\xde\x67\x8c\x56\x61\x9c\x23\x19\xf2\
-\x0e\xd6\xcb\xa5\x53\x90\x6b\x6e\xbb\x73\xe2\x1e\x07\xd6\xef\x0f\
-\x63\xe6\xee\x25\x81\x22\xae\xba\xc6\x94\xe2\x84\x9b\x91\x02\x9e\
-\xf8\x80\x8e\x5a\x4b\x55\x36\xc9\xd2\x3b\x95\xc4\x32\x52\x3d\xc0\
-\x4d\xed\xe3\x75\xcf\x50\xac\x2d\xf4\xca\x30\x23\xaa\x54\x06\x57\
-\xf7\x90\x00\x28\x62\x2d\x30\xe1\x7d\x62\xa0\x8e\x81\xc8\x38\x82\
-\xab\x8e\xa0\x23\x02\xea\xac\x23\x12\xb0\x3d\x74\x9d\x4d\x60\xa7\
-\x33\xbb\x81\x0d\x03\xb8\xf2\x25\xc0\xbe\x4d\x3c\x32\x32\x25\xbd\
-\x3e\x81\xb5\xbb\x03\x1a\x06\xf0\xb5\x57\x28\x85\x57\x01\x27\x95\
-\x3c\x6f\xa5\x07\x2d\x8e\xf5\xcb\x31\x81\xa5\xdf\x79\xa4\x9f\x45\
-\x37\x1b\x3a\xde\xed\x88\x42\x37\x8c\x38\x01\x00\x59\xf2\xde\x17\
-\x0b\x44\x2e\x47\xc6\x0e\xd6\x87\x8f\xd9\x08\x64\x62\x08\x19\x13\
-\x50\x6c\x9b\x57\x1f\xd0\x15\x37\x42\x22\x40\x83\x11\x95\x91\x31\
-\x00\xcc\x60\x38\x0b\x6e\xba\x81\xe6\x83\x27\x7f\x03\xe7\xcd\x3f\
-\x9b\xb6\x71\xae\xfc\xc0\x61\x2e\xe3\x35\x2e\x1a\xf5\x83\x27\x37\
-\x4b\x3e\x72\xb8\x6f\x68\xa1\x2c\x45\x24\xf1\xc6\xf6\xe1\xce\x86\
-\xf0\xe9\x73\xfd\xbe\x60\x1c\x6f\xdc\x0e\x3c\xa4\x15\xbc\x7f\x7e\
-\xdd\x50\x01\xbc\xf1\xf2\xb9\xeb\x5c\xe4\x3b\xde\xbf\x76\xc7\xe7\
-\x1d\x63\xb6\x74\x8f\x5b\x51\x76\xe0\x9d\xe6\x23\xee\xbd\x0e\x66\
-\xde\x59\xc4\xbb\xcc\x17\xdc\xf1\xe9\x63\x76\xab\x15\x41\xe6\x3c\
-\x0d\x72\x78\x37\x2c\xa9\xc5\x50\x3c\x0d\x69\x04\x78\x72\xa1\x68\
-\x28\x18\xd0\x8c\xd7\x95\x8d\x78\xd6\x1c\x23\x86\xf2\x3b\x74\x10\
-\x48\xaa\x3a\xe8\x18\x80\x3b\x00\x62\x03\xc4\x0c\x64\x08\x88\x3c\
-\xa8\xe9\xea\x0b\x78\x12\x83\x8b\x66\x0a\x51\x4b\x51\x77\x26\x37\
-\x86\xc2\xf8\x1f\x40\x99\x01\x4f\x47\x8d\xfa\x27\x4e\x20\x1b\x96\
-\x21\x4e\x88\x60\xbc\x97\xaa\xb6\x0e\x4f\xbf\xf4\x4c\xae\xd7\x01\
-\xec\x30\xc4\x84\x78\xce\xa0\x2b\x42\x40\x5d\x28\x1a\xe5\x01\x0d\
-\xb1\x03\x0a\x14\x00\x03\x25\x44\x27\x9e\xab\xf1\xe0\x41\xc7\x09\
-\x8a\x97\xe9\xc0\x98\x65\xc7\xb9\x4b\xf8\x0f\x61\x62\xa1\x7e\x8c\
-\x0c\x1f\x63\x20\x82\x18\x26\x16\x56\x95\x41\x03\x80\x04\x64\x4c\
-\x04\x2a\x08\x06\x98\x08\x3a\xd3\x01\x01\x43\x27\xc0\x18\xcb\x81\
-\xe7\x6d\x1b\xd1\xea\xe5\x7f\x18\x10\xba\xfd\xf1\xcc\x87\x6d\x42\
-\x35\x9f\xe7\x55\x17\xe5\xe2\x57\x79\xd9\x0c\x54\xd5\x3c\xe9\x85\
-\xbb\x85\x2a\x86\x07\x7d\xe6\xc6\x6a\x23\x3e\x48\x73\x70\xfe\xcd\
-\xb3\xbc\x24\x47\xc1\x99\xc3\xfa\xcc\xf7\xdb\x19\xce\x56\xad\xa6\
-\x76\x1e\x3c\xf1\x9e\x37\x29\x34\x76\x6b\xcd\x1c\x1f\xe8\xd1\x1f\
-\x3c\x60\x77\xdb\x21\x71\xc7\xd7\x4a\x80\x06\xf1\xd4\xc6\xe3\xde\
-\x36\xef\x34\x8b\x4c\x39\x5b\x78\xee\xfb\xbc\x0c\x5b\x78\xd3\x3c\
-\xae\x61\x22\xa8\x74\xbd\xaa\x82\x9b\x09\x20\x04\x26\x34\x34\xe2\
-\xa7\xd7\x9d\xc3\x07\x83\x6a\xcb\x0c\x3e\xc7\x9b\x92\x47\xd5\x97\
-\x15\xe1\xce\xe9\xe7\xc4\x1d\x74\xcc\x2e\xac\x2d\x84\xba\x89\x96\
-\x3a\x0f\x0c\xc4\xc8\x25\x4d\x98\x35\x88\x22\xf3\x81\x1c\x4b\x4c\
-\x3b\x04\x30\x60\x5c\xb1\x50\x13\x8a\x85\x26\x5a\x6a\x04\x33\xb2\
-\x6a\x78\xd4\xa0\x1e\x93\xf1\x05\x47\x7b\xd3\x41\xf7\xd4\xc3\x53\
-\xdf\xcf\xb2\xb8\x4d\x02\x1a\x4b\x04\x97\xcb\x15\xae\xd7\x2b\x0c\
-\x83\x4b\x9e\x77\xde\x19\xd6\x03\x2c\xd0\x96\x8f\xc8\x52\x60\x86\
-\x7c\xed\x96\x94\x50\x1f\xfe\x46\xf1\x01\xca\xf8\xc0\x98\xd4\xd4\
-\xf5\xd0\xf5\x3d\xf4\x7d\x07\x5d\xd7\x3b\x34\xe9\x51\x5a\xc1\x21\
-\xe4\x1f\x20\x29\xf4\xe8\xee\xa3\x75\x5c\x44\x70\xe0\x29\x7e\x19\
-\x81\xd1\x85\x91\x19\x0a\x9e\x25\xcd\x5c\x96\x06\xbb\x66\xd1\x1c\
-\x86\x67\x4e\x05\x2c\x78\x62\xa3\x78\xcd\x06\x54\xfc\xc3\xaa\x18\
-\xb3\x85\x4f\x2f\xbb\x9b\xeb\x41\x4d\xe9\x9b\x58\x65\x82\xc4\x53\
-\x8e\xc6\xa3\xe3\x4e\xce\x3e\xfd\x0e\xd2\xb0\x4f\x71\x9b\xbc\x47\
-\xc1\x77\x7b\x35\xae\x83\x1d\x39\xb8\x30\xf7\xf9\xf4\x39\xf3\x60\
-\xf8\xab\xc5\x71\xde\x7f\x78\x66\xb6\x0c\x3c\xb8\x81\x7c\xb7\xea\
-\xd5\xb9\x2e\xb4\x1c\xd2\x83\x77\x7b\xbe\xb8\xa0\x13\xd5\x6f\x6a\
-\x5c\x71\x8e\x57\x3f\x27\xe6\x2a\xfd\x65\x9f\xf1\x75\x23\x29\x49\
-\xc8\xab\x51\x38\x27\x85\x6e\xa1\xb3\xc6\x83\x01\xa7\xd3\xa2\xf7\
-\x80\x8c\xbc\x1f\x22\x52\x8a\xc8\x0d\x38\x03\x39\xcf\x0d\x33\xa0\
-\xf1\xa0\xc6\xeb\xf5\x01\x54\xc4\x34\x0c\xef\x1c\x18\xae\x16\xac\
-\xbd\xba\x7c\x74\x3b\x38\x76\xe0\xa0\x6b\xfb\x28\x2c\x8c\x80\x46\
-\xe8\xf4\xb1\x9e\x8e\xd7\xe1\x31\x80\x32\x23\x42\x89\x93\xde\x4d\
-\xcc\x00\x5e\x17\x0f\x04\x09\x5d\xd7\x41\x3f\xf4\x60\x9f\x9e\xe0\
-\xc5\x8b\x17\xf0\xd4\x77\xf5\x80\x86\x88\xe0\xf2\xfc\x0c\xcf\x97\
-\x0b\x5c\xae\x57\x18\xae\xce\x43\x03\x09\x83\x08\xd4\xe5\x12\x96\
-\x62\x40\x1e\x43\x6c\x54\x70\x4f\x69\x9a\xe4\x34\x00\xc9\xd1\x63\
-\x00\x3d\x7f\x76\xdf\x77\xd0\xf7\xbd\x7b\xd9\x27\xb0\xb6\x87\xbe\
-\x27\xef\xad\xa1\x38\x48\xe8\x5d\x57\x6e\x4e\x26\xd7\x1b\x51\xc4\
-\x79\x69\xee\x08\x10\x43\x88\x60\x98\x81\x11\x01\x4d\x07\x86\x05\
-\xba\xe4\xf4\x5d\xed\x42\x3b\x8a\x3b\x6b\x53\xe6\xcc\xc6\x9d\xe4\
-\xb8\x84\x9b\x43\x2d\x56\x35\x21\x66\xbc\xfb\x2e\x0b\x87\x0c\x8f\
-\xbc\x2f\xcc\xab\x6d\x41\xdb\x74\x47\xbe\xd1\x71\xd2\x94\xaa\xf7\
-\x5a\x69\xe3\x4d\x37\xc1\x45\xe2\x32\x61\xc7\x59\xbe\x1b\xdf\x57\
-\x57\xe7\x33\x41\xdd\xda\x0e\xad\x1c\x0b\x2e\xa2\x3c\x7e\xec\xf9\
-\x5a\x41\x34\x70\xb4\xee\xbe\x3b\x50\x8a\x37\x92\x2a\xd4\xb4\x69\
-\x32\x2c\x86\x6f\xb0\x41\xa0\x1a\x73\x9c\x41\x03\xb8\x78\x95\x7b\
-\xc7\x68\x40\xbd\xd1\x74\xe1\xf8\x5a\x77\xae\x2f\x43\x1e\xae\xd0\
-\x37\xe6\xed\xad\xeb\x8c\x6d\xbc\xfa\x2f\xe3\x27\x88\x29\xd9\x26\
-\xe5\xa8\x04\x30\x23\x3d\x37\x68\x9c\x5e\x8e\xe9\x25\xc9\xac\x5c\
-\xf4\x14\x47\x1d\x18\xa5\x3e\x4d\x1c\x1d\x11\x83\x1d\xc0\x0e\x36\
-\x3a\x37\xae\xd7\x41\x01\x1b\xf2\x11\x58\xe1\xe1\xa8\xe2\xa0\x8a\
-\x56\xba\x57\x3a\x3c\x20\xb9\xbe\x04\x87\x84\x27\xde\xa2\x58\xb0\
-\xde\x5d\xcf\x20\x3a\x16\xb7\xa7\x1e\x88\xac\x6f\xeb\x4b\xe8\xbb\
-\xae\x0e\xd0\x5c\xae\x03\x5c\x2e\x57\xb8\x3c\x5f\xe0\xf9\x7a\x71\
-\x49\xf5\x96\x04\x62\x42\x30\xdc\x25\xd7\x4f\x67\x00\xd9\x2d\x2c\
-\x66\x17\x52\x26\xd1\xdd\x30\x0c\x30\xd8\xc1\x23\xbc\x41\x80\x1a\
-\x3f\x00\xbe\xf3\x7d\xd7\xc3\x30\x74\xd0\x3f\x59\x78\xb2\x3e\x44\
-\xcc\xc7\xe8\xf5\xfc\x04\xc4\xec\x58\x1a\xfc\xe0\x23\x1a\xb5\xc9\
-\x84\x30\xb0\xe8\x54\x0e\xa1\x6c\x7e\x21\x78\x47\x97\x43\x93\xc6\
-\xc4\xbc\x1e\x90\x20\x46\x2d\x0a\x5e\x65\x61\xc4\xb3\xab\x90\xe3\
-\xde\xe3\x03\x4e\x4b\xe2\x5b\x1d\x19\x36\xf9\xa5\x32\xeb\x0e\xaf\
-\x34\x89\x71\x6d\x2b\x78\x0a\xd4\xf0\xb6\x3e\x6d\x19\xea\xd3\x23\
-\x6f\x1e\xc0\x43\x73\xc8\xac\xe3\xca\x6f\xe3\x09\x3d\xad\x5f\x09\
-\xa7\x24\xbe\x56\x3e\x5f\x9c\xd3\x3e\x71\xe1\xa0\x5e\xc5\x72\x36\
-\xad\x30\x15\xed\x9b\x3b\x33\xb4\x1f\xbb\xdc\xe2\xf2\x13\x67\x3c\
-\x60\xb3\xe0\x15\xa6\x13\x5c\xd9\x0f\x2e\x7f\x86\x57\x81\xb6\x65\
-\x80\xd4\xec\x2c\x15\xeb\x7c\xc5\x39\x3f\x47\x70\x86\x02\x1d\x9c\
-\x6e\x58\xdb\x62\x4c\xc5\xed\xf3\xa2\x3a\x77\x79\xca\x03\xc3\xeb\
-\xc3\xcc\x36\x1b\x61\xd7\x02\xa6\x15\x06\x00\x14\xee\x9b\x18\xa2\
-\x26\xeb\xda\x78\xb6\x34\x34\xc6\xff\xdd\xc4\xef\x06\x7d\x99\x00\
-\x00\x45\x52\xbf\xf3\xe4\x38\x40\x63\x07\xa7\xbf\x5f\x87\x2b\x0c\
-\x57\x17\xb1\x75\x1d\x06\xff\xfb\x00\x96\x06\xcf\x02\xcc\x41\xc9\
-\x06\x83\xe8\xd2\x44\xba\x0e\x9e\xfa\x0e\xb8\x7f\xf2\xf7\x4a\xed\
-\x03\x66\x30\x80\xc2\x79\xe0\xc0\x8c\x25\xcd\x32\xec\xae\xe9\xf0\
-\x01\x91\x75\x79\x25\xbe\x00\xa9\xf9\xd1\x8f\x47\xc4\x06\x23\x40\
-\x33\x78\x24\x76\xf1\xaf\xeb\x75\x80\x61\x18\x80\x9d\xaf\xca\xc7\
-\xbf\x75\x00\x86\x7d\x21\x20\xe3\x29\xe6\xdc\x20\xb2\xef\x18\x23\
-\xfb\x33\x35\x79\x4f\x2c\xb9\x6b\x39\x0a\x65\x8a\xc9\x4c\x88\xae\
-\x80\x90\xed\x2c\xf4\x4f\xbe\xf3\x6a\x1e\x20\xe8\x1c\x1d\x88\xa1\
-\x67\x28\x18\x57\x58\x2e\x63\x34\x00\xc0\x60\xd0\x0d\x00\x01\x03\
-\xfb\x84\x7e\x00\x13\x43\xe3\xc2\x88\xf2\x8e\x52\x05\xb8\x7b\x03\
-\x38\x5e\xaf\x3c\x1d\x5c\x6d\x68\xee\xa2\x03\xf7\x94\xcc\xe1\x05\
-\x9b\x08\xf3\x24\x84\x59\x6b\x88\xbb\x69\x8e\xc5\xfd\x12\x3a\xce\
-\x9f\xeb\x1b\xc7\x00\xf1\xf8\x39\xbb\xa6\x03\xb8\xeb\x81\x6d\xb5\
-\x33\x63\x35\xc0\x58\xb6\x57\x96\xef\x88\x3b\x21\xe3\xba\x63\x7b\
-\x6d\x70\xe6\x1a\xff\xe8\x01\x56\xfb\x03\x2c\x42\x7c\xe4\xdc\x3f\
-\xd2\x8e\xc5\x15\x04\xcf\x1b\xcf\xad\x63\x72\x94\xbe\xbf\x54\xf2\
-\xbc\x04\x62\xb0\x6e\x5e\xe2\x0a\xc0\x70\xec\xb6\xbc\x27\xc9\xf7\
-\x00\x83\xdb\x22\x6b\x33\x6f\x8a\x5c\xe6\xba\x8b\x57\x83\x98\x9a\
-\xbd\xb0\xb6\xcc\x11\x4e\x14\x54\x8d\xa0\x46\xb1\x08\x87\xf7\x4d\
-\x0a\x57\x93\x06\xa3\x90\x1f\x2e\xa2\x9d\xac\x75\xc5\xe6\x07\x5f\
-\xf6\xe4\x3a\x0c\x70\x1d\x06\xb8\x5c\x2e\xce\x5b\x73\xbd\x3a\xc2\
-\x2d\x6b\x53\xc8\x99\xd7\xe5\xbb\x8e\xa0\x67\xf6\x1e\x23\x0b\x1d\
-\x1b\x77\xe2\x78\xc0\x63\x22\x6e\x08\xde\x19\x00\xf4\x9f\x07\xf6\
-\xec\x69\xb1\xe6\x23\x40\x17\xb0\x05\x38\x07\x48\xd7\x75\xd0\xf7\
-\x03\xbc\x78\xea\x17\x00\x4d\xf0\xa8\xc4\xd7\x15\x68\x20\x20\x60\
-\x30\x88\xc0\x2e\x62\xcf\x33\x92\x79\xde\x6b\x5f\xc9\x34\x38\xd5\
-\xc9\x92\x6f\x28\x43\x67\x08\xac\xa7\x36\x26\x91\x60\x34\x0c\x83\
-\x77\x2d\xb9\xf8\x3d\x32\x26\xba\x98\x42\xa3\x25\x51\x80\x43\x9a\
-\x94\x32\x8e\xc0\x80\x31\xe4\xdb\x03\x92\x1e\x42\xb9\x8c\xd1\x0f\
-\x22\x4a\x4f\x8c\x98\x35\xcc\xf5\xd3\x6d\xb7\x7b\x1c\xf1\x00\x5b\
-\x79\x05\xf2\xc2\xf5\x4a\xc7\xd9\xfa\xf6\x2a\x65\x84\x8f\xb8\xe3\
-\x1a\x8b\x4e\x69\xb3\x3b\xa3\x54\xd7\x0d\xce\x65\x3c\xfa\xc0\xe1\
-\x1b\xe6\xff\x2e\x85\x46\xd4\xc7\x10\x1d\xc9\xc0\xc5\x93\x6a\xfd\
-\xd4\xdd\xf9\x9c\x29\x82\xb3\x1c\x39\xe3\xf7\x27\x30\x14\x6f\x1c\
-\x09\x9c\x54\xa4\x71\xb5\x95\x74\xad\xa2\x53\xda\x99\x8f\x4c\x13\
-\x5a\xbf\xc4\xd6\x91\xad\x9f\xeb\xb6\x5b\xd7\xf1\xa3\x6a\x7b\xce\
-\x7a\x68\x5a\x5d\xde\x1b\xe3\x02\x9c\x00\x30\x7a\x77\xc0\xf7\xaa\
-\x8f\x3b\x01\x2d\x2f\xbd\xc5\x93\x78\x68\x77\x92\xc1\xa6\x84\x9e\
-\x3a\x93\xd3\xfc\x88\xe1\x68\xff\x44\x49\x32\x10\xe6\x49\x00\x35\
-\x05\x32\xaf\x10\x15\x45\xc4\x82\x10\xc0\xa6\x68\x2b\x0f\x6e\x06\
-\x0f\x70\xc8\x97\x3d\x01\x70\x60\x85\x4c\xe7\xa2\xb9\x8c\x81\x3e\
-\xe4\xa9\x84\x5c\x18\x5f\x1f\xa7\xf3\xc5\x42\x83\x13\x84\x08\xc1\
-\x7a\x70\x63\xc8\x80\x05\x0b\xe0\xe9\xa8\x99\x09\xd8\x7b\x73\xd0\
-\x7b\x7f\x86\xde\xdd\x7f\x16\xd0\x30\x43\x6a\xb8\x1d\x7c\x01\x4a\
-\xe7\x06\x02\x00\x80\xce\x05\x6d\x85\x04\x9f\xae\xef\xe0\xa9\x7f\
-\xf2\x55\x4b\x45\xe3\x0c\x01\x92\x89\x83\x64\x0c\x45\xd7\x17\x03\
-\xf8\x81\xe2\x98\x97\x43\xec\x58\xc4\x10\x10\xac\x21\x30\xde\xf5\
-\xd4\x11\xc5\xcf\x06\x5a\x65\xf9\x22\x46\x30\x9e\x62\x59\x67\xfd\
-\x79\x44\xca\x82\x48\x7c\xa6\x40\x12\xdf\x72\xdf\x59\x73\x11\x5e\
-\xbf\x6e\x96\xbd\xd5\x78\xf2\x20\x2c\x28\x1d\x67\x1f\x74\x1b\xd8\
-\x45\x78\xe4\x7e\x3e\x96\x9e\x1a\x6f\xd9\xff\x05\x40\x53\xaf\x0f\
-\xdd\xad\xa1\x87\x8c\xf6\xf1\x94\xc2\x6b\xbc\x34\x07\x03\x9a\xb5\
-\x59\xcc\x5c\x3a\xdc\x6a\xe7\xf7\x5a\x3f\x55\x1a\x6f\xde\x65\x72\
-\x9c\x0e\x99\x3a\xc7\xb4\xb0\x60\xbe\xe6\xfd\x33\x97\x8f\x9a\xee\
-\x67\x83\x19\x35\x67\x4e\x00\x66\x7c\xdc\x10\x7c\x1f\xa4\x3e\x37\
-\x6c\x0b\xc1\x4f\x85\xa2\xbb\xeb\x59\x9c\x44\x28\xbe\x29\xa2\xa4\
-\x3e\x94\x75\x36\xf5\x9f\x6f\xf9\xe0\x17\x4c\xbb\x07\x02\x9d\xa9\
-\x93\x50\x93\x06\x94\x83\x4b\x63\xfa\x46\x88\xb8\x0a\xb5\x6e\x42\
-\x6e\x8d\xc7\x09\xae\x40\xbd\xf5\x11\x5c\x00\x64\x10\x7a\x00\x20\
-\x32\x2a\xa7\xa6\x33\x8e\xe8\xab\x7f\xea\xe1\xa9\x7f\x82\xbe\xef\
-\x7d\x1e\x8d\xbb\x35\x59\x82\xab\x1d\xfc\xbd\x09\xac\x35\x60\x09\
-\x23\xa8\x01\x60\x00\x8b\x60\x8c\x4d\x00\x8b\x5c\xa4\x97\x64\x3d\
-\x53\x80\xc6\xa1\xb2\xec\x15\x12\x86\x8c\xe7\x95\x36\x08\x5d\xe7\
-\xf2\x5d\x9e\xfa\x27\x78\x7a\xea\x63\xb1\x9e\xe0\x3e\xb2\x44\x60\
-\x86\xc1\x7b\x65\xd8\x31\x22\x0c\xde\xc5\x04\x29\xf1\x08\x08\x80\
-\x80\x01\x09\x80\x90\x45\x3d\x18\x00\x88\x0c\x65\x61\x50\x3d\x93\
-\x02\x19\x20\xe3\xf0\x1a\xfa\xb0\x31\xe5\x3e\xc3\xe9\x07\x77\x5c\
-\x31\x3a\xbc\xf3\x06\xb8\x3e\xea\xf2\x48\x66\xdc\x2d\xd7\x3a\x02\
-\x2f\xf1\xda\xab\xf1\xfe\xcd\x71\x36\x01\x74\x29\x49\x96\xf7\xf5\
-\x77\x5a\x55\x3e\xab\xaa\x42\xbd\xfe\xbc\x37\xb7\x8a\x6b\xcf\xb4\
-\x23\xe2\xf0\x11\xab\x5b\xc8\x4b\xda\x1b\x9e\x35\xea\xc7\x4c\xe7\
-\x35\xc6\xcf\x1a\x63\x03\x9e\xdd\x91\x95\x44\x7d\x47\x71\x02\xae\
-\x0e\x80\x3b\x60\xf0\xf7\x16\xc1\xbd\x95\xb9\xe0\xe6\x13\x19\x77\
-\xe1\xa4\xc5\x79\x75\xcb\x62\x99\xb7\x15\xac\xd8\x8f\xf0\xfd\x00\
-\x92\x78\xd0\x5c\xaa\xb9\xe6\x8c\xd1\x93\x4f\x9d\x20\xbc\xdd\xde\
-\x33\x75\x9d\x25\x12\x84\xda\x30\x3b\x4e\x86\xff\x74\x3e\x24\x9d\
-\x83\xe3\x15\x39\xd1\x42\xb3\x28\xcb\x12\x3c\x34\x60\x80\x4d\x3a\
-\x77\x1d\x31\x80\x73\x7e\xf4\xde\x01\xf2\xe2\xc9\x03\x9a\xce\xe1\
-\x01\x06\x06\x6b\x2d\xe0\xe0\xf3\xf0\x2d\x03\x75\xce\x33\x84\xb2\
-\xe6\x0e\x59\x20\x32\x59\x1d\x49\x86\x4e\xb0\x38\x6b\x0f\x4d\x64\
-\x17\xf0\x05\x34\x09\x54\xdd\x19\x0c\x85\x2f\x63\x03\x7b\xe8\x7d\
-\xe3\x3a\x93\x42\xce\x3a\x22\x18\x7c\xfe\x0c\x91\x85\x61\xe8\xa1\
-\xeb\xae\xce\x8b\x93\xe5\xbe\x84\xa4\x9f\x7c\xd0\x79\x4e\xdf\xe4\
-\x34\x0b\xd8\xa3\xa8\x08\x6a\x58\xeb\x30\x53\xc5\x3f\xef\x9c\x62\
-\x52\xb9\xfa\x78\x02\x43\xe3\x21\x7b\x45\xbd\x5e\x51\x6b\xf5\xe6\
-\x49\xc5\xe1\x90\x8a\xe4\x6b\xcd\x84\xab\x0d\x3e\x5b\x83\x71\xf8\
-\x60\x2f\x1f\x6e\xdc\x1a\x6f\x73\xb6\x1c\x92\xfe\x85\xe3\x60\xb6\
-\xea\x10\x33\xae\x6c\xcf\x86\x45\x7e\x37\x06\xd6\x2d\x00\x64\x71\
-\x9d\xcc\x37\x9a\xf7\x8c\xed\x1d\xb6\x45\x86\xb5\x55\xd4\x1f\x4b\
-\x87\xc7\x03\xda\xc7\xef\x51\x9f\xdf\x47\xd0\x75\x04\x70\xe4\x5b\
-\x8e\xd8\x46\x40\x53\xb4\x1b\xf1\x7a\x0b\x1c\x1e\x7d\x56\x2d\x80\
-\x5b\x3e\x22\x77\x14\xa7\xcf\x70\x3c\x73\xb2\xac\xfc\xd2\x7a\x70\
-\x35\x5d\x30\x3c\xb0\xf8\x06\xe2\xae\xd1\x25\x94\x8b\x5d\x06\xa3\
-\xe9\x5c\x9c\x71\x34\x40\x62\x14\xce\x99\xd8\x0c\x4a\xef\x8c\x63\
-\x29\x73\xaf\x27\x78\xea\x7b\x30\x9d\x77\x82\x50\xa0\x8d\x76\x11\
-\x5e\x96\x2c\x18\x6b\xc0\x58\xcf\xd8\x66\x03\xd9\x18\x8a\x52\x30\
-\x9a\x58\xac\x0c\x68\x7c\x4e\x49\x2c\x88\x09\x14\xeb\xb1\x60\x6c\
-\xa4\xe3\x92\x0e\x79\x33\xbd\xe9\xa0\x17\x2e\x1f\x04\x80\xce\x18\
-\xe0\xbe\x87\xce\x92\x28\x8c\xd9\xc5\x82\x3a\x88\x26\x56\x12\x45\
-\x39\x78\x3e\x54\xcc\x00\x08\xae\xed\x71\xe1\xa8\x48\xf3\x86\x0c\
-\xc6\xd7\x91\x01\x1f\x5e\x16\x3e\xab\x70\x52\x21\x96\x70\x9b\x31\
-\x64\x07\x7b\xd2\x26\xcd\x5e\x43\x03\xdc\xba\x88\x6a\x7c\xd2\x7c\
-\xc4\x65\xea\x6c\xa0\xe3\x3d\x09\xeb\x16\x2e\xee\xdb\x40\x16\x3d\
-\x4b\x0b\xac\x3d\x73\xc1\x38\x78\xe8\xa6\x37\x33\xb4\xbc\x73\x1a\
-\xad\xdd\x49\x71\xe7\xf0\xef\x02\xc8\x58\xad\x65\xe3\x8a\xfb\x6c\
-\x4d\x23\xbf\x45\xd5\x9f\x39\x00\x58\x3d\xba\x15\x40\xce\xed\x96\
-\x3c\xab\x75\xd7\x25\x12\xe3\xa2\xc5\xe4\xa8\x3a\x34\xb8\xc2\x70\
-\x80\xf5\x17\x3d\xdd\x62\xb0\xa4\x28\xad\xc1\xdd\x78\xa0\x9b\xee\
-\x98\xf3\x64\xdd\x84\x7e\x74\xc0\x75\x76\xa4\xc2\x11\xb8\x85\x4f\
-\x78\x44\x23\x1d\x6b\x67\x93\x4f\x0a\x4c\x3b\xa5\x8e\xdf\x66\xad\
-\x70\x13\x75\x3c\xae\xbe\x3e\x4f\x0e\xaa\xf6\xd4\x44\x03\xa1\xdc\
-\x24\xd8\x87\x4d\xa1\x8b\x65\x0a\x7a\xf2\x9c\xeb\x06\xc3\x68\xc8\
-\x5a\x93\x59\x9d\x9b\x40\x0d\x1d\x75\xeb\xac\x69\x81\x85\x38\xd0\
-\x37\x1b\x8f\x03\xfa\xce\xd7\x96\xec\xbb\x14\x54\x65\x10\x00\x7b\
-\x60\x76\xce\x90\x90\x5f\x63\xb0\x03\x84\x01\x42\xb3\x31\x28\xfe\
-\x9e\x56\x9a\x3d\x3b\xda\x34\xa0\x21\x19\xe2\xc5\xa2\x16\x0b\x8f\
-\x26\x95\xab\x2a\x2a\xea\xcf\x64\x62\x02\x65\x32\x1a\x88\x4c\x71\
-\x88\x80\xbe\xa8\x29\xfa\x02\x41\xc0\x10\xb9\xb2\x0d\xfa\x52\x3b\
-\x61\xf0\xfc\xef\x02\x99\x88\xd1\x4f\x14\x73\x08\x18\x3d\x35\xec\
-\x9f\x27\x06\x0b\x30\xba\xd0\xb4\x34\xf0\x01\xdc\xdc\x6e\x6b\xad\
-\x3a\xb0\x70\x09\x78\x4f\x11\xb4\x73\x01\x2c\x55\x70\x76\xf2\xf6\
-\xb2\x35\xb5\x91\xbd\x5c\xd8\x80\xaa\x0e\xf7\xcd\x00\x70\x8f\xf2\
-\xac\xb7\xb4\x52\xa8\xd9\x26\xdd\x67\x97\x06\x32\x7f\xb2\x1d\x6b\
-\x09\xe4\xc9\xe9\x53\x35\x76\x05\x2f\xeb\x02\x2c\xd9\x0c\xec\x67\
-\x31\x0e\x2e\x1f\x50\x08\x15\x34\xba\x95\x7d\xc7\xc3\x37\x8a\x69\
-\xab\xef\x11\xcc\xbf\xf9\xaa\xe0\xa9\xfb\x2f\x61\xc8\x15\x45\x46\
-\x70\x0d\x6b\x33\xd6\xad\x50\x5e\xf9\xd5\xd5\xca\x27\x6e\x9e\x99\
-\x8b\xb0\x1c\x0f\x98\x23\x87\x7d\xf5\x7e\x95\x16\x1f\x52\xf0\x3d\
-\xe8\xf6\x96\xe8\x12\x3c\x05\x79\x95\x81\xc6\x1a\x4f\x47\xed\x1e\
-\xb6\x3a\x35\xb6\xb2\xc0\xe8\xa1\x8c\x83\x27\x4d\x02\xac\xd9\x84\
-\x85\x5d\x89\x03\x88\x01\x76\xe7\x1c\xe7\x6d\x65\x11\x79\x25\xdf\
-\xd6\x15\xe8\x23\x70\x31\x09\x98\x28\x56\x63\x93\x7e\xc6\xf0\x36\
-\x14\x13\x14\x43\xe9\x94\x54\xd0\x1e\xbd\xd7\x06\x47\x78\x21\xe0\
-\x0a\x0d\x94\xf4\x83\x0a\xb9\xf3\x21\x9c\x6e\x6c\xe0\xea\xf3\x27\
-\x13\xff\x0b\x15\x3b\x83\x4b\x29\x14\xdb\xf1\xe1\x68\xe4\xeb\xcd\
-\x00\x31\x80\x19\x3f\x84\xf0\x5d\xf2\x74\x6e\xa2\xd0\x8b\x52\x82\
-\xd8\x40\x42\x7e\x3e\x24\x2d\xfc\x0e\x31\x3c\x0d\x47\x0c\x61\x0c\
-\x0c\xe8\xbd\x33\xcc\xee\xf7\x78\x4d\x4c\x0a\x3b\x57\x54\xcf\x3d\
-\x65\x87\xda\x68\xea\xc1\xa5\xc3\xb5\xf4\xc7\x2d\x27\xf9\x8a\x6a\
-\xde\x5b\x0f\x42\xdc\x63\xad\xc1\x63\x36\xdc\xad\xb9\x86\x6b\x00\
-\xef\x62\xc9\xbc\xda\x2a\x89\xb8\x6e\x6a\xe1\xa1\x1b\x69\x01\xf8\
-\x55\x58\xec\x6f\xaf\x3c\x55\xda\xde\xd7\x56\xcc\x7e\x70\xa5\xeb\
-\x68\xef\xd0\x92\x72\x8d\x07\x6b\x76\x47\xe7\xc4\xe3\x11\x53\xbf\
-\x76\x6e\xf3\xf6\xb1\x5f\x6a\xf3\xd6\xfd\xe9\x50\x4d\xfa\xc4\x04\
-\x9d\x5b\x11\xa2\x1c\x65\xff\xe2\x93\xd6\x19\x1c\x3d\x27\x71\xc3\
-\x34\xe0\xf9\x7d\xb9\x36\xe2\x0c\x57\xee\xad\xbc\xd2\x78\x33\xf9\
-\xf1\x3c\x75\x64\xe5\x81\x54\x4d\x5d\xbd\x63\x3d\xd4\xd6\xc7\xd9\
-\x52\x52\xb0\x56\xc7\x88\xc6\x7c\x01\x5a\x02\x60\x21\x48\x49\xfe\
-\x3c\xb5\x72\x42\x1a\x47\xa0\x7e\x8e\xde\x16\x97\x6e\x82\x9d\xf1\
-\x11\x57\xd6\xbd\x47\xe4\x9d\x07\x50\x8c\xa4\x8a\xaf\xe8\x55\x19\
-\x87\xf7\x11\xa4\xe2\x9a\xe4\x73\x5d\x28\x16\xbd\x77\xed\x46\x46\
-\x30\xb1\xa6\x4b\x22\x07\x9b\x04\x34\x21\xe4\x0c\x38\xab\x26\xea\
-\xbf\x64\x89\xc0\x5a\x57\x39\xb4\x1f\x7a\xb0\xdd\x00\x57\xcf\x54\
-\x60\xba\xce\x15\xad\x04\x4f\xcd\xec\x8b\x69\x06\xd6\x34\xc7\x8c\
-\xc0\x91\xaf\x5a\x82\x9a\x84\xf6\x0c\xa0\xe9\x22\xa8\x71\x48\xd0\
-\xa4\xf0\xb3\x7c\xb0\x22\x2a\x44\x90\x69\x4b\xc8\xda\x15\xc6\x18\
-\xac\x84\xde\x63\x13\xbc\x07\x5b\x76\x3b\x3c\x72\xf7\xd2\xd7\xbd\
-\x4b\x52\x22\xef\xdb\x74\x0f\x51\xf8\x4f\xba\xc0\x66\xa5\x0c\x77\
-\x7e\x45\x39\x11\x0e\xd2\xe6\x4a\x9e\xb5\xda\x44\xe9\x85\x39\xbb\
-\x5a\xa9\xc5\x63\x86\x95\x8f\x18\x0f\xf8\x01\xb0\x27\xe1\x86\xc7\
-\xb0\xb0\x57\xe1\xce\x87\x70\x8f\x0a\x21\x78\xe0\x7c\xe1\xa3\x6f\
-\xbc\xc5\xc3\x77\x8b\xfd\xa9\x26\xc9\x03\x97\xf7\x82\x5d\x85\x4c\
-\x78\x9b\x12\x3b\x7b\xc9\x95\xb9\x5e\xb8\x32\xaa\xf9\x28\xda\x95\
-\x2d\x9e\x80\xda\x67\xb0\x7a\x1a\x2c\x18\x09\x15\x59\x2c\x6f\x38\
-\x4f\xf1\xb8\x31\x38\x7f\x30\xeb\xbf\x33\xeb\x35\x9a\x2a\x48\x7b\
-\x64\x5b\x71\xbc\x67\x73\xad\x8e\xc4\xc2\x97\x20\x9c\x0c\x01\x6c\
-\x24\x15\x85\x0b\x71\x63\x10\xf3\xde\x4d\x56\x46\x25\xd6\x91\x11\
-\x5e\x1a\x20\x8a\xc0\x93\x23\xf5\xb3\xc3\x0c\x8e\x95\x6c\x80\xc1\
-\x76\x60\x06\xe7\xa1\x31\x5d\xe7\xf4\x5e\xcf\x78\x3c\x0c\x03\xd8\
-\xc1\x17\xf3\xf4\x54\xd0\x8e\x00\x80\x81\x2d\x03\x18\x06\x66\x93\
-\x80\x51\x61\x20\xfa\xd2\x4e\xc1\x8a\xa6\x2d\xa1\x24\x44\x70\x6c\
-\x65\x9d\x01\x63\x2e\xce\x1b\xe2\x01\x4c\xd7\x75\x3e\x20\xc0\x7d\
-\x67\x18\x6c\x2c\xcc\x79\x8d\xc5\x34\x53\x41\x4d\xb9\xc7\x05\x0f\
-\x4d\x7c\x79\x50\x13\xde\x77\xde\x19\x1f\xb7\x86\x05\xb6\x27\xe1\
-\x7a\x42\xcf\xd6\xe0\xca\x67\x8a\xd9\xe5\x81\x8c\xda\x11\xb7\x68\
-\xbc\xbc\xf2\xa3\x93\xb3\x1e\xcf\x31\x31\xad\x5c\xcc\xbc\xc5\xe4\
-\xc5\x70\x7b\x2d\x12\x61\x96\xdc\x03\x27\x2c\x58\x77\x51\x76\x0b\
-\xa1\xac\x5b\xaf\x51\xe3\xad\xdb\xe5\x0d\xc1\x7a\x80\x73\xf4\x60\
-\x1e\x91\x14\xfd\x48\x60\x66\x8f\x92\x3f\xa9\x6b\x9c\xad\xf4\x6e\
-\x38\x78\xb1\xc2\xfa\xc9\x5b\x07\xe2\xac\xb5\x38\xd7\x07\xac\xd8\
-\x07\x8f\x00\x0e\x95\x8a\xcb\x21\xe7\x0f\xae\x7b\xe6\x93\x0a\xef\
-\x4e\xa3\x46\x8d\x22\xbd\xe9\xb1\x56\x78\x15\x10\xb7\x2f\x01\xdc\
-\xb1\xdc\xf8\xe0\x25\x8b\x78\x82\xf1\x60\x21\x3d\x91\xd7\x1e\xfb\
-\x37\xdc\x88\x79\xe7\xf7\x8e\xf2\x76\xc7\xd0\xe5\x39\x26\xb1\xa9\
-\xb5\xb6\x67\x2f\xc0\x4c\x1d\xe2\x25\x4b\x8d\x8b\xa4\xe2\x00\x66\
-\x08\x80\x80\x0a\x0d\x45\x41\x16\xec\x52\x3e\xd8\x83\x1a\xe9\x91\
-\x09\xf9\xf3\xa6\x33\x2e\x79\xdf\x18\xe7\x4d\x09\x78\x00\x20\x26\
-\xef\x3b\x86\xe3\x01\xae\xd7\x2b\xf4\x5d\x07\x06\x9d\x56\x4e\x44\
-\x89\xe5\x8c\xbd\xa3\x64\x18\xe0\x72\xbd\x78\xdc\x70\x85\xeb\x70\
-\x05\x6b\x07\x20\xeb\x6a\x56\x1a\x30\xb1\x56\x0e\x4b\xa4\x36\x05\
-\x68\xa2\x77\x26\x86\x9d\x79\x84\xe5\x91\xd7\xa8\x5e\x07\x03\x58\
-\xb2\xd0\x77\x8e\x82\xcd\xa0\x89\x5e\x9d\x61\x18\x60\xb8\x5e\x5d\
-\xe3\x2e\xcf\xbe\xb2\xe8\xe0\xbd\x35\x09\xd4\x20\x80\x0a\x37\x53\
-\xde\x19\x15\x82\x06\x25\x82\x85\xd1\x6a\xf3\xa9\x4f\xd1\x5b\x04\
-\xa1\x1e\x4d\xcc\xb1\x11\x5e\x1a\xe6\x5d\xc9\xfe\xcb\x16\x24\x9e\
-\x47\x3a\x5b\x83\x61\x2b\xac\x81\x8c\x3b\x36\x85\x6c\x5c\xb9\x10\
-\xce\x88\x2b\xd1\xc2\x6e\x2f\xcd\x42\x82\xf1\xdd\xc0\xcb\x91\xa7\
-\x1c\xae\x1c\xb7\x0d\x1d\xfe\x51\x97\xbe\xf4\xce\x72\xf9\xf0\xe4\
-\xf5\xf7\x9a\x52\x68\x5f\x8a\xfb\x3d\xdb\xba\x19\x30\xf7\x1d\x3c\
-\xe3\xd9\xac\x38\x41\xf1\xa0\xc7\x8f\x0b\x87\xd5\xd6\x83\xfc\xa5\
-\xc8\x69\x7c\x26\xde\xbc\x40\x4b\xcf\x60\x73\x98\xde\x1a\x2f\xc1\
-\x91\xda\x0d\xd6\x7b\x48\xaa\x01\xe5\x5a\x94\x7a\x74\x0c\xd3\xd6\
-\x24\xa2\x39\xa0\x71\x74\x42\xd2\x9a\xf6\x2f\x78\x8f\x9f\xc4\x7c\
-\xbe\xae\x98\xcf\x5b\xbc\x09\xb8\x00\xc4\x5f\x88\xb6\x5c\x88\xcb\
-\x80\x4d\x18\xb2\xf6\x02\x0f\x3c\xc8\xe3\xb1\x96\xb0\xe6\x91\xe9\
-\xab\xf9\xa0\x6b\x1c\x99\x85\xc0\x47\xeb\x3a\x78\x40\x23\xa2\xf2\
-\x06\xd1\x9b\xc1\x3e\x2f\x9e\x80\xc0\xe5\xd2\x4b\x17\x8d\x2f\x83\
-\x12\x52\x3b\x10\x80\x0d\x02\xb2\x2b\x68\x8f\x06\x35\x98\xc9\x8a\
-\xde\x1b\x34\x60\x91\x7c\xc2\x3e\x01\x59\xe7\xd4\xb8\x76\x03\x98\
-\xeb\xc5\x79\x78\xd0\xb1\x94\x0d\xd6\x42\xdf\x3b\xa2\x30\x54\x1e\
-\x1a\x0b\xd7\xeb\x15\x2e\x97\x0b\x3c\x5f\x2e\x70\xbd\x38\x60\x63\
-\x2d\x41\xc8\x9b\x27\xea\x52\x8e\x7f\x61\x42\xf4\xe3\x21\xe0\x58\
-\x3f\x86\xd9\xf3\x3d\x5b\xeb\x3d\x36\xa2\xd0\x25\x91\x73\x0d\x5d\
-\x7b\xe8\xfa\x2e\x76\x0c\x3c\xa0\x09\x55\x45\xaf\xd7\xab\x43\x5d\
-\x17\x87\xb8\x86\xc1\x85\x9f\x45\x70\xe4\x93\xfe\x11\xd0\x33\xa8\
-\x05\x6a\x67\xe3\x80\x4c\x60\x5b\x08\x6c\x68\x58\x44\x0e\x49\xc9\
-\x86\x44\xec\xe0\x9e\x93\xf7\xde\xf0\x44\x2e\x0d\x27\x0a\xee\xc3\
-\x16\x1c\x9f\xb3\x58\xab\x59\x69\xf0\xb8\x0d\x03\x27\x36\x82\x2d\
-\xa0\xe6\xf0\x9d\x63\x6e\xa3\x7a\x34\x84\xb3\xd4\xfe\x3a\x1e\x87\
-\xdb\xe0\xaf\x03\x08\x22\xf0\x56\x9b\xf9\x5a\x3d\x1a\xe7\x41\x80\
-\x94\x67\xe2\x7a\x9b\x03\x9f\xdf\x2d\xc4\x03\x43\xa5\xf8\x78\xab\
-\xc3\x8b\x35\x60\x0a\x97\x9f\xc1\xd2\x35\xf2\xef\xe4\x9f\xc7\x89\
-\xb6\x45\xa5\x74\xc2\xbc\x8f\x00\xf0\x62\x42\x9b\x7c\xe6\x7a\x6d\
-\x75\x6a\x5e\xad\x06\x9b\x15\xe3\xb7\x77\x7e\xe5\xe3\x73\x29\xb4\
-\x6f\xf4\x19\xe6\xed\xf3\x1d\x37\xcc\xdf\xc2\xfc\x44\x1c\xa9\x02\
-\x9b\x43\xa3\x56\xed\xc9\x2b\x01\x1f\xf2\xe9\xb9\xe3\xa7\x9c\xa9\
-\xd5\xba\x12\x9f\xdf\x11\xbe\xf1\xd0\xac\xda\x97\x79\x7d\x3f\x70\
-\x27\xe2\x5a\x7a\x7c\x9c\xfd\x3f\x80\x9a\x58\x34\x33\x04\xc5\xc7\
-\x74\x0c\x1f\xd5\xe4\x5d\x4f\x08\xec\xa3\xa4\x4c\x7c\x8d\xc2\xce\
-\xbc\xbe\x0e\x94\x16\x21\x81\x73\x74\xe0\xe0\x43\xd5\x44\xed\x49\
-\x6b\x2d\x5c\x87\xab\x73\x82\xf8\xe8\x2b\x87\x2d\x2c\x0c\x03\xc1\
-\x30\x5c\xa3\x87\x66\xb8\x5e\xe1\x3a\x38\x07\x08\x02\x40\xdf\x83\
-\xaf\x8d\x29\x73\x71\x66\x73\x68\x7c\xed\x18\x8f\x80\x2c\x71\x44\
-\x5a\x8e\x1e\x0d\xc1\x74\x04\xe4\x2b\x75\x0e\xc3\x00\x17\x5f\x54\
-\x33\x20\x30\xd7\xf0\xe0\x42\xf2\xa0\x66\x70\xa1\x67\x83\x75\x31\
-\x72\x2e\x8c\xcd\xd1\xb5\x05\x47\x57\xf2\xce\x18\xe5\xad\x71\xac\
-\x0a\x29\x31\x49\x86\x9d\x15\xa0\x98\x1b\xbc\xc9\x09\x91\xfe\x10\
-\x0b\x72\xfa\x87\xc0\x88\xbb\xd7\xe3\xea\x82\x92\x25\x54\xc0\x3b\
-\xef\xbf\x03\xdd\x73\x65\x13\x1f\x19\x17\x7c\x9f\x05\x4f\xda\xec\
-\xf1\x91\x3b\x76\x64\xb8\x0a\x6a\x70\x38\xa7\x70\xee\xea\xc3\x59\
-\x13\x94\x27\x18\xda\xee\xb1\x90\xf0\x98\xcb\xcf\x3d\x83\xf0\xb7\
-\x5c\xf9\x9f\xfa\x8e\xfc\xfc\x12\x98\x99\x55\xee\x67\xb4\xd5\x97\
-\x88\x0e\xd4\xec\xb4\x32\x8c\xfa\xc6\xc7\x83\x94\x47\x5b\xca\x37\
-\xb9\x3f\xde\x66\xde\xde\xe4\xac\x9a\x89\x81\xe3\x73\xb6\x97\xea\
-\xcf\x55\x7b\x7d\xf0\x98\xf6\xf2\xc1\x0f\xe9\x70\x95\x66\x43\x9b\
-\x26\x81\x0d\x1e\xf7\xbc\xa6\x0c\xec\x25\x02\x7c\x69\xbc\x73\xeb\
-\xc8\x00\x1a\x72\x5e\x9a\x40\xbf\x6c\x0c\x74\xc1\x53\x93\xe5\xd3\
-\x90\x0b\x64\x73\xce\x8a\xc1\x8a\x8c\x10\x17\xea\x46\x01\xcc\x5c\
-\x9e\xa0\xeb\x42\x7e\x3c\x44\x67\x89\xc3\x14\x16\x86\xe1\x0a\xd7\
-\x90\x4f\x43\x36\xd5\xa9\x41\x84\xbe\xf7\x35\x32\x81\x8b\x7d\xe8\
-\xcb\x23\x94\x2a\x80\x5a\x0f\x5e\x2c\x59\xd7\x51\x3b\x80\x1d\x0c\
-\x74\x7d\xef\x6a\xcc\x74\x9d\x2b\xaa\xe9\x1b\x07\x90\xe2\xe7\xc8\
-\x13\x08\xd8\xc1\xc2\x40\x81\x1c\x40\xd4\x8c\x61\x0f\x67\x64\x88\
-\x19\x26\x4f\x4d\xa0\x87\x8b\x9c\x6e\x06\x44\xfd\x9a\x70\x99\x7a\
-\x78\x3c\x3f\x89\x8b\x95\x19\xaa\xe7\x17\xdf\x60\x65\x2d\x7e\x14\
-\xeb\xce\xd9\x7b\x01\x82\xa3\x3c\x0d\x73\x7b\x47\xee\xa5\x39\xd2\
-\xfb\xf6\xc8\x5a\xc0\x96\x39\x7a\x8b\x71\xb9\x58\x9e\x3e\x94\xee\
-\x28\x4b\xd6\xfd\x97\x06\xf7\x79\x99\xf8\xdc\xe9\x32\x75\xf9\x67\
-\xe6\xf3\xdb\x79\xc2\xb3\x93\x1e\x81\x35\x00\x24\x3c\x37\xf9\x3c\
-\x71\xe6\xfa\x4b\xd7\xce\xc1\xcc\xc5\x7b\xf8\x5f\xee\x8c\xff\x79\
-\xa6\x64\xa2\x97\xe1\x7c\x2f\x0d\xce\x82\x9a\x7b\xed\x3f\x2f\x0c\
-\xae\x7e\x26\x78\xab\xb6\xf2\x7d\x6e\x11\x3c\x52\xb8\xf1\xa2\x8b\
-\xf4\xe5\x13\xcc\xa3\x78\x1a\x55\xff\xcc\x75\x17\xc6\x99\x6f\xf9\
-\xcc\x4b\xcd\x79\x20\x50\xc3\x59\x9b\xf8\x46\xf3\x16\x0b\xf7\xae\
-\x9d\xd0\xe8\xab\x7a\xa5\x7a\x33\x89\x74\x2b\x16\xa9\x0f\xcc\x62\
-\x3e\xaf\xdd\x74\xe4\x73\x66\x42\xd8\x59\x17\x75\xf5\x50\x74\x93\
-\x01\x5c\xc8\x99\xbf\x65\x02\x2b\x2e\xa2\xab\xbb\x76\xd0\x75\x97\
-\x88\x19\x00\x03\x83\x32\x79\xd2\x31\x1b\x81\x0d\x59\x47\x2c\x10\
-\x08\x04\x8c\x31\x3e\x72\x8c\x8b\x65\x35\xc6\x80\x46\xc6\xdc\xf9\
-\xd0\x31\x12\x0c\x04\xec\x81\x88\x31\x08\x66\x18\x1c\x5a\xeb\xba\
-\x58\x40\x27\xc1\x71\x4a\x61\x69\x1e\xd8\x10\xd9\xc8\x98\x16\x98\
-\xcd\x22\xa5\x72\xac\x43\x23\x58\x13\x02\x19\x80\x71\xc9\x49\x29\
-\xfc\x0c\x44\xe5\xd2\xe8\x34\x4b\x09\xd8\x39\x23\x9a\x68\x16\x56\
-\x55\x23\xc0\x35\x86\x92\x05\xe0\x50\x39\x8b\x8f\x58\x59\x78\xee\
-\x86\x77\x4b\x2b\x10\x56\x6c\xb2\xb7\x2a\x72\x78\x3a\xa2\x2b\x85\
-\x40\x4d\xe4\x90\xcc\xe5\x96\xa8\xbf\x15\x94\xbc\xdc\x6a\x5d\x7b\
-\xcf\xa5\xbf\xbd\xe8\x70\x16\xc4\xbc\xe8\xe6\xc3\x90\x36\xe7\x7c\
-\xec\x90\x17\x0b\x60\x26\x57\xb0\x97\x94\xba\xfc\xb3\x2a\xd6\xde\
-\x8f\xc5\x8b\x89\x9c\x14\xf9\xfe\xc5\xce\xdf\xf3\x42\xac\xc3\xba\
-\xfc\xa6\x1e\x94\xed\x67\x66\xa5\x78\x97\x42\x82\xa4\xc2\x5e\x9c\
-\x27\x33\x79\x4e\xaa\xad\x0b\xca\xee\x9a\xf0\x33\x35\x7e\xe8\xda\
-\x2d\xdb\x29\x77\xd1\xa9\xf9\xf2\x4c\x1c\xff\x96\x2b\xe3\x17\xe2\
-\x4d\xfb\xee\x94\x02\xfb\x12\x71\x3c\xb6\x2b\xc2\x4e\x64\x5b\x47\
-\xa0\x66\x06\x3c\xe5\xf7\x7c\x51\x78\xd6\x2f\x16\x9e\xff\xd9\x5b\
-\xdb\x53\xa1\xed\xd7\x99\x76\xac\xfd\x3c\xc0\x74\x5e\x4d\xb8\xd4\
-\xd3\xc4\x3a\xcd\xaf\x2b\xef\x1d\xfe\xf6\x34\x33\x7e\x2f\x0a\x9f\
-\x5f\xea\xcb\xe6\x67\xf0\x40\xa1\xdc\x9b\x74\x15\xbc\x7f\x53\xef\
-\x32\xc4\xd2\xd8\xbe\xd4\x01\x3c\xf7\x79\x06\x7d\x99\xe3\x3e\x66\
-\x00\x90\x04\x94\x49\x05\xe7\x03\xb8\x88\x45\xef\xfd\xc3\x36\xc6\
-\x51\x32\x1b\xd2\xd4\xcd\xa5\x1c\x9a\x14\xa1\xe5\x70\x03\x12\x01\
-\x21\x46\xa7\xc8\x30\x5c\xa1\xeb\x3a\xf1\x3d\x8c\xcd\x75\x79\x34\
-\xe4\x1d\x21\x3e\xcf\xde\x33\x22\x1b\x63\xa0\x03\x00\xea\x3a\x20\
-\x22\x5f\x30\xb3\x0c\x1e\xfb\xa9\x49\x1b\x78\xa3\x5d\x78\x99\x43\
-\x58\x2e\x91\x9f\x23\x37\xb5\x43\x6e\x3e\x3c\x4c\x86\x82\x09\xba\
-\x67\x8e\x31\x6f\x82\x89\xcc\x18\xe8\x30\x06\x9b\x39\xc0\x92\x79\
-\x67\x30\x5c\x1b\x1c\xc8\x09\x85\x7e\x0c\xa0\x18\x70\x97\xf0\xcf\
-\xa8\x19\xcb\x24\xf0\x09\xf7\x38\xaa\xae\x02\xaf\xfe\xdc\xb1\xcb\
-\x50\xed\x27\x78\xd2\xc6\x50\xbb\xf0\x70\xff\xbd\xd7\x84\x22\xf3\
-\x0a\x8b\x68\x54\x32\xe0\xc1\xc9\x02\x4a\x0a\x8f\xe5\x08\x22\x5e\
-\x76\xa8\xfe\xbd\x04\x38\x4a\x0a\xd2\xda\xb9\x5c\x3b\x66\x2f\x3b\
-\x9c\x54\x7c\x4b\xca\x79\xfe\xe0\x73\x2f\x49\x6d\xbb\xd7\xae\xd5\
-\x39\x8a\xe2\xda\xfb\xcd\x59\xa8\x73\x05\x3a\x6f\xc3\xe8\xf9\xf8\
-\x7f\x3f\x5b\x56\xcf\x56\x8d\x1b\x96\x93\x90\xf3\x8b\xab\x31\x5c\
-\xe8\x4a\xee\x7d\x58\x33\xde\x79\x1f\xe6\xfa\xbc\x46\x46\xd7\xe0\
-\x95\x7b\xd6\x14\x56\xe1\xca\x50\x8e\x6c\x4e\x4a\x50\xf8\x22\x84\
-\x97\x1d\xa1\xa4\x66\x44\x2b\xf9\x9a\xae\x79\x86\xe1\xf9\x4d\x8d\
-\x7b\xfe\x7c\x5f\x94\x80\xd7\x4a\xe0\x7f\xb1\x5c\x34\x5a\xe4\x1b\
-\x05\xc3\x74\xa8\x5e\x50\xf4\xe7\x00\x45\xfe\xfe\x14\xa8\xc9\xbf\
-\xf3\x64\xd3\xbd\x49\xb6\x00\x00\x20\x00\x49\x44\x41\x54\x10\xae\
-\xc4\x55\x60\x72\xaa\x1d\x53\xd7\x5e\x33\x7e\x53\x7d\x51\xd7\x98\
-\x39\x78\xe7\xf6\xdc\x5b\x84\x13\x6f\xd5\x52\x8a\xed\x3e\x31\x3c\
-\x6e\x55\x3b\x6f\x74\xf0\x17\x89\x01\xb0\x12\xd4\x9c\x60\x23\x4d\
-\xf7\xf1\x95\x18\xbd\xae\x4e\x06\x00\x08\x1d\x5b\x98\xd4\x50\x7d\
-\xd4\x93\x41\xa3\xeb\x3d\x3a\x6f\x83\x2f\x8a\x49\x82\x89\x38\x84\
-\x9d\x05\x50\x83\xb1\xb4\x4a\xd8\x7b\x5d\xfe\xbd\x33\xa2\xa2\x45\
-\xb0\xa1\x66\x8d\x20\xfa\x0a\xf7\x72\x64\x64\xde\x81\xc2\x04\x6c\
-\x39\xd6\xa2\x81\x88\x03\x5c\xd9\x18\x97\x12\x53\x0e\x99\x2b\x02\
-\x1a\x66\x55\x5e\xd3\x81\x1b\x72\x1e\x96\xc1\xba\x78\xb6\x38\x90\
-\xc6\x0d\x0e\x18\x50\xa0\x81\x23\xe7\x35\xc4\x42\x3e\x61\x80\xb4\
-\xa7\x05\x62\x48\x19\x4a\x70\x14\xbc\x35\xe0\xab\x8c\xc6\xe2\x3e\
-\x18\x07\x3f\x38\xcd\x1c\x8b\x19\x26\x14\x8a\xc2\x8b\x13\xc2\x46\
-\x70\x81\x44\xbf\x26\xf3\xb7\x40\xff\xc9\xd5\x2e\xbe\x93\x33\x9d\
-\xf7\x2e\x42\x55\x88\xf4\xfc\xcd\xe0\x08\x26\x5a\x7e\x9c\xfd\xec\
-\xae\x80\x68\xca\x62\xbd\x37\x3f\x64\x69\x7c\x73\x65\x2c\xf7\x24\
-\x2d\x7e\x7f\x4d\xbb\x0f\x08\x2d\x58\x6b\x71\x94\x60\x68\x0a\x58\
-\xc8\xf7\x83\xf2\x57\x1a\xa7\x29\x2f\xdb\x9a\x46\x73\xa1\x9d\x8b\
-\x80\x84\xcb\x80\x6c\xed\x3c\x91\x7d\x90\xed\x7f\x61\x30\x82\xb2\
-\xfc\x6f\xb5\x40\xa9\xc6\xb8\x31\x49\xb4\xc2\x75\xd7\x9e\x02\xb4\
-\x3c\xf1\x05\xe9\x41\xc9\xbd\x25\xcf\x95\xca\xf3\x1e\xcd\x70\xc9\
-\x93\x39\xa9\x38\x17\xc2\xea\x4a\x4a\xb9\x1a\x73\x9e\x37\xa8\xf0\
-\xc4\xfb\xf9\xc5\x6a\xd6\x08\xcf\x80\x2f\x09\x32\x66\x81\x8e\xbf\
-\xb6\xf4\xc2\x3c\x65\x6b\x2f\xfc\x2e\x2f\xf3\xb4\x30\x7e\x12\x44\
-\xc9\xfb\xbf\x98\x01\x57\x53\xed\xad\xe9\x4b\x71\x4b\x3f\xc1\xfa\
-\x56\x45\x26\xb7\xc4\x6c\xb9\x70\x91\xbb\x85\x12\x2f\x85\x59\xdd\
-\x5b\x37\xa8\x64\x0c\xe5\x15\x6a\x68\xed\xfd\x22\x53\x59\x28\xa6\
-\x62\x10\x90\xc0\x91\x70\x11\xc7\x85\x1f\xf4\xe3\xe0\x2d\x09\x91\
-\x51\x52\xc1\x35\x88\xc0\xd2\x3b\x23\xc3\xce\x3a\xed\xa9\x09\xbb\
-\x06\x45\x67\x86\xbb\x09\x5a\x9b\xf4\x7f\x71\x3f\x19\xa6\x27\x6b\
-\x5f\xc6\x7b\x1b\x47\xf3\x6c\xd9\xd7\xb0\xa4\x79\x52\x96\x7e\x6e\
-\x25\xc4\x64\x1e\x26\x20\xcb\x3e\x74\x8c\x52\xfc\x9a\x1c\x84\xc2\
-\xfc\xcf\x0f\x2b\x34\x06\xc0\x74\xa9\x88\x8f\x1f\x3c\x03\xc1\x5d\
-\x25\x3a\x1b\x48\x01\xc0\x64\x60\x46\x0c\x86\xa0\x5e\x96\x61\x65\
-\xee\x52\x26\xb6\x0d\x83\xb7\x46\xa0\xc8\x2a\x2f\x07\xee\x58\x50\
-\x47\x6b\xf8\x78\xfb\xfd\x62\xf6\x7e\x77\x46\x0b\xb8\x40\x66\x80\
-\xef\x39\x9a\xc9\xbd\x34\x6b\x15\xc5\x3c\xac\x65\x2a\xb6\xb7\xf8\
-\xde\x0c\x55\x5f\xe9\x6c\x7f\x1e\xf4\xc5\x6b\xe9\x99\x4b\xd7\x7c\
-\x67\x59\x51\x4b\x33\xcf\x9f\xd4\x3f\xea\xb1\xdc\x9e\x35\xf3\x95\
-\xeb\xff\xc4\x3c\xad\xe0\x55\x53\xa1\xe7\x0a\xf4\xc0\xf0\xb2\x4f\
-\x5e\x9a\x7c\xfc\xe2\xbf\x57\x2a\xf5\x4b\x63\x37\xa5\xa4\x4e\xcd\
-\x09\xc4\x19\xcf\xc2\x01\x20\x74\x92\xea\x9b\x61\xd7\xfd\xd6\xd6\
-\x98\x99\xeb\xdf\x4b\x83\xab\xe7\x77\xf5\x70\x70\x1d\xe8\xe5\x19\
-\xaf\x14\xe0\x78\xed\xf3\x96\x39\xb2\x72\xdd\x2a\x70\x65\xa6\xbd\
-\x15\x53\xe1\x9d\xf2\x5a\xe1\xdf\x38\x73\xcf\xdc\x73\xc4\x95\xcf\
-\xaf\x46\xae\xcc\xd5\x40\xa4\xf4\x5d\xd5\xb7\x52\x05\xd0\x9d\x94\
-\xdb\xa7\x18\x0f\xe7\xbc\x47\x35\xba\x07\x9e\xd3\xde\x45\x9c\x75\
-\xd2\xb8\x1d\x86\x2d\x6b\x23\x4a\x70\xff\x6d\x46\xf9\x34\xe8\xea\
-\x32\x32\x32\x20\x87\x70\x33\x04\xf6\x61\x64\x4a\x37\x47\xa9\x1f\
-\x8b\x07\x4e\x20\x74\xf2\x32\xd3\x59\x27\x43\xc8\xbc\x23\x82\xc1\
-\xe1\x26\x17\x22\xe6\xe3\xc3\x30\x8b\x96\x12\xa1\x6d\xa0\x4a\xc6\
-\x24\x5d\x9e\x7d\xdb\x98\x38\x46\x9a\x05\xff\x4c\xb8\xec\x34\xa0\
-\x51\x74\x6e\x32\x9f\x06\x52\xd5\x4f\x12\x28\xa9\x0a\x59\x26\x30\
-\x62\x80\x95\x49\x28\x0e\x40\xa0\x69\xf6\x3f\x5d\x3c\x9f\x7b\x49\
-\x52\x00\x05\x6c\xc4\x35\x9c\xa5\x49\x73\x36\x8e\xd0\x26\xe2\xcc\
-\xec\xc1\xea\x09\xb6\x94\x3c\xc7\x67\xec\x38\x78\xc2\x42\xdb\x09\
-\xce\x1e\x02\x2f\x4c\x15\xb0\xfc\x9e\xb8\x66\x46\xa1\x66\x3b\x42\
-\x7c\x4a\xdf\xa4\x09\x0a\x5a\xc7\x68\x58\x16\x2a\xfc\x8d\xb2\x43\
-\x7b\xaa\xa0\x28\x51\xf9\xd9\xcc\x2b\x5c\x53\xca\x3c\xaf\x6a\x23\
-\x4e\x50\x83\x31\xf1\xaa\x93\x7a\xae\xad\xa5\xc7\xf3\xf6\xca\xae\
-\xdf\x85\x36\xd3\xc4\xc5\x98\x18\x7e\xf4\x64\xc4\xbf\xcb\xe3\xf6\
-\x6e\xe0\x4d\xca\x2a\xcf\x14\xdb\xa0\x42\x27\xde\x5e\x1d\xcb\x25\
-\x17\x34\x08\xe2\xb2\xf9\x96\x36\xd2\x58\x4b\x80\xba\xd4\x3f\x9a\
-\xb9\x09\xd7\x84\x5c\x16\xf6\xed\x1f\x8b\xfb\xbf\x15\xc0\x58\xbe\
-\xff\xb2\x43\x78\x37\xf0\x3a\xec\x4a\xf3\x6d\x09\x73\xe4\xc7\x4f\
-\xb8\xaa\xdd\x35\xa0\x77\x2d\x68\x91\x09\xb7\x0a\xb0\x13\xef\x06\
-\x43\xbc\xa2\x7d\x5c\xe8\xe3\x12\x48\x7f\xd9\x6f\x03\xdb\xd7\x83\
-\xdd\x6e\x93\xb6\x87\x6d\xe9\x5c\xe7\x01\x19\xb8\x43\xdd\x94\x15\
-\x97\x59\x2a\x95\xc4\xb7\x6d\xe2\x43\x4b\x5e\xe8\x33\x79\x40\x0c\
-\x80\x61\x40\x32\x2e\x3d\x83\xcd\xa8\xb8\x67\xca\x4b\x47\x8d\x64\
-\x91\x7c\xf4\x14\x02\x86\x3c\x9a\x00\x6a\xd0\x79\x6a\xd0\xe8\xbc\
-\x18\xe9\xe1\x61\x9f\x4f\xaf\xd1\x07\xce\x5b\x2b\xfc\x67\x8c\x37\
-\x8c\x10\x1a\x77\xfe\x78\x40\xc2\xf1\x5a\x4b\x2c\x67\x13\x4b\x2d\
-\xb8\x82\x5c\x4e\x0c\xc7\x5c\x9a\xf9\x49\x13\x3c\x25\x2e\x24\xcc\
-\x74\x26\xc3\x5e\x1e\xd1\x19\x18\x83\x1a\x83\x60\x22\x8e\x09\x35\
-\x6a\x84\x07\x47\x84\xac\xb1\x34\x1f\x4a\x90\xa3\xbc\x31\xa8\x30\
-\x0d\xce\x21\x31\xdc\x3a\x93\x36\xac\xb6\x95\x60\x06\x6f\xb4\x28\
-\x6a\x3e\xc4\x3f\x90\x4d\xe2\x0c\xcb\x4f\xed\x38\x6f\xcd\x8d\x29\
-\x82\x14\x28\x15\xc6\xf5\x1b\xc4\x48\xb9\xa2\x19\x45\xb1\x00\x68\
-\xc4\x7b\x73\xd3\x9e\x88\x8a\x1d\x9f\xbb\x5f\xfc\xdb\x04\xa0\x79\
-\xfd\x7c\x5d\x68\x0f\x0a\x9b\x4e\x41\x81\x7e\x32\xf0\xe6\x32\x54\
-\x1f\xa5\x55\x6d\x15\xf2\xe3\x27\x84\xd7\xcf\x76\xf6\xf3\x08\x00\
-\x6f\x9e\x07\xf8\xe0\x65\x5f\xbc\xce\x96\x71\x9b\xfb\xfb\xda\x3e\
-\x68\xe0\x30\x35\x1e\x58\x7d\x8f\xd2\x1c\xf9\xe0\x45\xa7\xfe\xfd\
-\xe6\x62\x17\xfb\xc7\x2b\xfb\x91\x8f\x61\xed\xf8\xa1\x6f\x8f\x6c\
-\xe3\xd2\x77\x97\xda\xf3\x93\x97\xdd\xe8\xef\xf9\x23\x7e\x73\xb1\
-\xc5\xf1\x29\xdd\xdb\xae\x1d\x8b\x85\xb6\xbe\xb9\x0c\xf0\xc1\x8b\
-\xa4\x1e\xbc\x79\x1e\xca\xf3\xb2\x20\xb1\xdd\x95\x73\x36\x6f\x3b\
-\xce\xb4\x6b\x0a\x77\x94\xfa\xff\xee\x4a\x51\x0f\x91\x40\x87\x6f\
-\x70\x78\xad\x05\x09\xf7\x3c\x4b\x79\x6b\xa3\xdf\x13\x25\xff\x16\
-\xdf\x9b\xe3\xfb\x59\xcc\xfd\xc5\x13\x0a\x7d\x86\x34\x02\x4c\xe0\
-\x84\x8d\x33\x36\x62\x5e\xd0\x4c\xd9\xfc\xc7\x95\x07\x5d\xb9\x14\
-\x06\x83\xe4\x08\xc1\x0c\x46\x30\x13\xeb\xd3\xc4\x5a\x35\x28\x03\
-\xa6\x42\x32\xbe\x0a\x23\x63\x1e\x17\xf6\x55\xcd\x09\xd1\x5b\x64\
-\x00\x31\xd5\xce\x61\xe6\xc5\xe9\xd9\x17\xa7\x36\x8b\x42\x3c\x90\
-\x2e\x94\x7e\x67\x6f\xad\xe1\x89\x18\xe8\x94\x8c\x84\xc8\x00\xa6\
-\x53\x1b\x51\xcc\x6f\x09\xb9\x32\x91\xe1\xcc\x27\x21\x01\x7a\x0f\
-\x0d\xaa\x90\x31\x13\x5d\x56\xa8\x43\xb0\x32\xf7\xb0\x02\x32\x88\
-\xe3\xf7\x8e\x04\x33\x73\x56\x99\x4a\x56\xab\x7b\xed\x72\x93\xa9\
-\x3e\xfc\xa0\x3b\xef\x99\x6d\xda\x53\x11\xfc\x04\xc9\x3d\x33\x31\
-\xa6\xbf\x02\xd4\x30\x83\x0a\xdb\x0a\xca\xdf\x08\xb8\x58\x5b\x0c\
-\x2f\xfb\xe9\xcb\x27\xf8\xbb\x37\xef\x00\x00\xe0\xef\x7d\xf0\x23\
-\xad\x38\xd8\xb1\xe2\xf0\x93\x97\x3d\x7c\xfb\xe6\x39\xfe\xfb\xe7\
-\x1f\xbc\x54\xff\x4e\xdf\x1d\xca\xca\xc8\x30\xa8\xef\xea\xbf\xd9\
-\x8a\x85\xc7\xab\x4e\x86\x3f\xbd\x79\x86\x9f\x89\xfb\x7c\xf0\xa2\
-\x87\x3f\x65\xed\xfd\xd9\x07\x2f\x47\xef\xe5\x6d\xfd\x59\x65\x5b\
-\x27\xfb\x6d\xcb\x9f\x0f\xc0\x26\xb4\x75\x7a\xdc\xe6\xc7\x66\xea\
-\xfa\xb3\x7d\x28\x7c\x67\xea\x3a\xb3\xf7\x98\x68\xf3\xd8\xec\x05\
-\xf0\xb3\x1f\xbf\xd0\xcf\xe7\xed\x45\x5f\x57\xcc\x51\xf9\xec\x3e\
-\x10\xf3\x4e\xce\x9b\x6f\xdf\x3c\xc3\x60\xed\xe2\x54\xb0\xd6\xce\
-\x2e\x73\xd9\x86\x9f\x67\x6d\x9c\x1c\x13\x9e\xbb\x16\x17\xe7\xf8\
-\xb7\x13\xcf\xd8\x3d\x27\xac\x1a\x73\x12\x73\x21\x77\x46\x16\xdb\
-\x3a\xd3\xf1\xd2\xbc\x2a\xce\x8b\xc1\x16\xd7\xdb\x07\x2f\x3a\xf8\
-\xd3\xdb\x8b\x5e\x4f\x3f\x7e\x01\xdf\xbe\xbd\x14\x9f\xc9\x07\x4f\
-\xee\xf3\xe1\x6f\x3f\xfd\xf1\x0b\xf8\x2e\xfb\xfe\xa8\x5d\x3c\xde\
-\xcb\x8a\xa0\x1a\xb1\xbc\xb5\x9f\xb4\xbf\x87\x5c\x9c\x70\x79\x95\
-\xc3\xf4\x80\x60\x61\x0d\x5d\xf3\x08\x07\xde\xa9\xdc\xc0\x99\x6a\
-\xc1\xd1\x75\x08\x6b\x6f\x70\x24\xc6\x46\x51\x58\x3e\x82\x9a\x10\
-\x7e\x26\x13\xa6\x47\xcd\xca\xea\x7e\x44\xa0\xc3\x60\x0c\x02\x91\
-\xcf\x93\x29\x14\xd7\x4c\xf9\xef\x9e\xa9\x18\x0c\x00\xd8\xe4\x47\
-\x61\x97\xcc\x1f\x3c\x35\x0c\x90\x8a\x71\x66\x0d\x61\x76\x3a\x3f\
-\x9b\xcc\x1b\xe3\xbf\x3f\xe7\x4c\xed\x17\x95\x04\x4e\xff\x96\x5e\
-\x9a\x50\x75\x54\x85\x5b\xa1\x04\x33\x61\x50\x30\x85\x83\x81\xa8\
-\x27\x03\x02\xcc\x18\xc9\x9a\x16\x10\x20\x44\x2f\x0e\xc4\x17\xc4\
-\x9f\x38\x13\xe3\x8a\x19\xb2\xc1\x62\xc2\xcc\xc1\x55\xcc\x76\x24\
-\xa8\x4d\x7d\xe7\x6e\xd8\xa1\x00\x6c\xf0\x7b\x50\xf4\xad\xfa\xb9\
-\x9c\x70\xf0\xf0\x8a\x0d\xec\x65\x05\xd5\x71\x78\x3f\x07\x3b\xd1\
-\x4a\x3a\x30\x7c\x20\xac\x92\x2a\xf7\x4d\x28\x4c\xc1\x48\xf1\x87\
-\x6f\xbf\x83\xbf\xf8\xf9\x4f\xe3\xdf\x02\x90\xf9\xc3\xdf\x7d\x07\
-\x7f\xf1\xf7\xd2\xfb\xd7\xeb\xb5\xf8\x7e\xae\xa4\x0d\xc3\xd8\x73\
-\x72\x15\xef\xc9\xfb\xc9\xef\xe6\xed\xb8\x16\xae\x53\xfb\x7c\xe6\
-\x42\x61\xff\xf8\xed\x77\xf0\xe7\xe2\x3e\xb9\x62\xef\xee\x3d\xf8\
-\xcf\xbe\x86\x3f\xff\xf9\x4f\x26\x3f\x17\x3e\x53\x6a\xeb\x1f\xbe\
-\x7d\x3d\x1a\x9b\x52\xdf\xa6\xe6\x42\xfa\xcc\xf8\x13\xa5\x31\x56\
-\x7f\xbf\xa6\xbf\x7f\xf3\xed\x6b\xf8\xb3\x42\x1f\xf2\x71\xb8\x2e\
-\x3c\xb7\xd1\xdf\xae\xd7\x62\xdb\x7e\xfe\xe3\x97\xb1\xff\x73\xcb\
-\x2e\x8c\x6b\xae\xfc\x4a\xf9\xc6\x5f\x83\x0b\x0f\xbf\x34\xb6\xf9\
-\xb8\xc8\xfe\x4d\xdd\xe7\x8f\xfe\x1e\xf2\x59\xe7\x20\x46\x3d\x6b\
-\x3f\xb6\xb5\x5b\xc8\xcf\x3f\x98\xbe\xd6\x30\x94\xc1\xdf\xd4\x5c\
-\x93\xcf\x35\x9f\xab\xe5\x67\x34\xcc\x2f\x1e\x2e\x3f\xef\x3f\x7e\
-\xfb\x5d\xf6\x1e\x4e\x8e\xb3\x9c\x5f\xa5\x67\x98\x7f\xfe\x8f\x7f\
-\x7a\x0d\x7f\xfe\xb3\xe9\xcf\x17\xe7\xe1\x75\x7a\x1e\x0e\xc3\x30\
-\x7a\x18\xd2\x30\xa0\x8d\x3b\x3c\xd2\x1f\xf6\x28\x94\x79\xce\xcd\
-\xd3\x5c\xcd\xa2\x93\xf3\x67\xd6\x5c\x8a\x2b\x74\x19\x3e\xd9\xb0\
-\xd9\x22\x3d\xce\x03\x35\xa1\x0e\x1f\x08\x8f\x08\x7a\xc0\x50\x7c\
-\x8c\x39\x59\x01\x63\x70\xe9\x00\x80\xc8\x6b\xc7\x54\xf8\xde\x08\
-\xa6\x33\x49\xea\x85\x06\x62\xce\x4c\x84\x13\x91\xed\x78\x3e\xe1\
-\x31\x38\x29\x64\xf9\x4c\xae\x3c\xf8\xfb\xe5\x49\xce\x19\xc8\xf1\
-\x08\x4b\x24\xf1\x94\x6a\x83\x70\x9e\xfc\x83\x29\x77\xdf\x80\xf7\
-\xc6\x20\x8e\xf2\x67\x02\x55\x1c\xa0\xc9\x06\x25\x84\x9c\x09\xa0\
-\xb2\xa4\xf5\xa3\xf6\x1a\x4d\x12\x01\x3c\xd2\x8a\x7a\xa4\x42\x90\
-\xdf\xd7\x9d\x06\x6f\xbf\x51\xed\xdd\xc0\x46\x49\xfe\x33\x7f\x7b\
-\x73\xa5\x51\x1e\x8c\xb5\x34\x0a\xd1\xb9\x0c\x83\x7b\xcf\xaf\xe3\
-\xdf\xfc\xfe\x8f\xf0\xd7\x7f\xff\xcf\xe3\xdf\x7f\xf3\xbb\x3f\xc0\
-\xe5\xa2\xbd\x14\xe1\xdf\x08\x00\xbf\xfd\xdd\x1f\xe1\xaf\xfe\xf2\
-\xcf\x47\xed\xf9\xed\xef\xfe\x08\x97\xe7\xb1\x85\x35\x7f\xef\x37\
-\xbf\xfb\x23\xfc\xb5\xf8\xfe\x6f\x7e\xff\x47\xb8\x5c\x2e\xb3\xdf\
-\xa9\xd9\xd4\x70\xe1\x61\x87\x0d\xf3\x6f\x7f\xff\x0d\x00\x00\xfc\
-\x83\xbf\xff\x67\xc5\xeb\x5c\x9e\x9f\x55\x9f\x4a\x7d\x75\x7f\xfb\
-\x26\xb6\x93\x0b\x7d\xfe\xcd\xef\xbe\x81\xbf\xfe\xcb\x3f\x13\xfd\
-\xfe\x06\x00\x18\xae\x59\xdf\xf2\x7b\xc8\x71\xc4\x42\x5f\xf2\xb1\
-\x1a\xb5\x3f\xfb\xfb\xdf\xfe\xfe\x1b\xd5\xd7\xd2\x73\xba\x16\x9e\
-\xdb\x75\xe6\x3e\xd7\xeb\x35\xf6\xf9\x37\x7f\xf8\x06\xfe\xfa\x2f\
-\xfe\x6c\xb6\x0d\x5b\x96\x5e\xbc\x86\x37\xad\xff\xed\xef\xfe\x08\
-\x0c\x30\x7a\x1e\xbf\xfd\xdd\x1f\x47\x73\xa6\xf6\x7e\x97\x6b\xfa\
-\xce\x6f\xff\xf0\x0d\xfc\xd5\x5f\x94\xe7\xc4\x6f\x7f\xff\x8d\xea\
-\xd3\xd6\xad\xe4\xb7\x7e\x0e\xc8\x39\x36\x35\xcf\xfe\xf6\x77\xdf\
-\xc0\x3f\x10\xf3\xa7\xf4\xdc\xe7\xe6\xc2\xf5\x72\x01\x9e\x5a\x3f\
-\x0c\x8b\xeb\x14\x37\xce\xaf\xd1\xb8\xe5\xf3\xfd\xf7\xdf\xc0\x5f\
-\x15\x3e\xff\xb7\x85\xcf\x2e\xf5\xf1\x72\xb9\x00\x22\xc2\xef\xbe\
-\xf9\x16\xfe\xf2\xcf\x7e\xae\xfe\xf6\xed\xeb\x77\xf0\xf3\x9f\x24\
-\x4f\x33\x71\xa1\x26\x17\x47\xfb\xeb\x21\xa0\x26\xb6\x2b\x0f\x93\
-\x39\xd1\x42\x7f\xb6\x7d\xee\x7d\x51\x07\xf0\x3d\xee\xcf\xa1\x00\
-\x2f\x14\x73\xcd\x80\x34\x56\xa6\x3a\xa0\x07\x35\x91\x5c\x2b\x94\
-\x6b\x31\xa9\xbc\x4a\xd9\x53\x63\x62\x3d\x9b\xb1\xe1\x40\x3a\x41\
-\xb8\x48\xf1\xe6\x48\x0c\x38\xb9\x9a\x79\x85\x11\x93\x85\xd9\xf6\
-\xed\xdb\x77\xf0\xa7\xd7\xaf\xe1\xbb\xef\xbe\x83\xef\xbe\xfb\x0e\
-\x5e\xbf\x7e\x03\x6f\xde\xbe\x81\x77\xef\x9e\xe1\x72\xb9\xc0\xf5\
-\x7a\x85\xc1\x17\xbd\x89\xf1\xf7\x25\x42\xa1\xc0\x5e\x86\xe0\xdd\
-\x53\x1d\x74\x9d\x81\xbe\xeb\xa1\x7f\x7a\x82\xa7\xa7\x1e\x9e\x9e\
-\x5e\xc0\x8b\x17\x2f\xe0\xc5\xd3\x0b\x78\x7a\xe9\x7f\x3e\x3d\xc1\
-\xd3\x8b\x27\xe8\xfb\x27\xe8\xfb\x0e\xfa\xee\x09\xba\xce\xc4\x62\
-\x3c\xee\x5a\xc1\x73\x33\x3f\x4b\x47\xf9\x3c\x53\x66\xdb\x23\xeb\
-\xd3\x1c\x44\x18\x8f\x37\x5e\x40\x6b\x17\xfe\x7b\x8f\x73\x6e\xe4\
-\x99\xd9\x95\xb0\xb8\x62\x90\xa3\xa3\x94\x53\x48\xe8\x4f\x9e\x74\
-\x8c\xfe\x1f\xbe\x7d\x9d\x8a\x55\x85\x02\x56\x9e\xe0\x83\x03\x25\
-\x22\x73\xb6\xcf\x70\x15\x40\xd8\x33\xfe\x55\x4e\x4d\xae\x5d\x74\
-\x38\x9f\x59\x5a\xd1\x03\x3e\xa0\x53\xff\xe8\x1f\xfe\x75\xfc\xfd\
-\xdf\xff\xbf\xbf\x59\x75\xa7\x7f\xf4\x0f\xff\x23\xf1\xdd\xff\xb0\
-\x0a\xa8\x2d\xcf\x47\x9e\xbd\x1f\x00\xc0\xbf\xff\x7f\xfe\xc3\xc2\
-\x60\x1d\xb9\x78\x70\x65\x6f\x32\x3b\xdd\x8a\xcd\x6b\xee\x4e\xbc\
-\x63\x15\x6f\x7f\x26\x13\x36\xc7\x85\x24\xbb\xd9\x11\xab\x21\xb2\
-\xe1\x95\xcf\x6b\x71\x79\x61\x4d\xaf\x0e\x56\x48\x73\x52\xa0\x54\
-\x4c\x3b\x18\x48\x3b\x6f\x45\x0e\x7a\x43\x17\x58\x98\x24\x23\x93\
-\x67\x51\x35\x26\xeb\xdf\x0e\x46\xd1\x45\x62\x41\x5e\xbf\x27\xdd\
-\xed\x48\xbb\x01\xd9\xce\x99\x21\x67\xb7\x04\x33\x7c\x40\x1f\x4e\
-\xd3\xab\x78\x5a\x47\x5d\x2a\xcd\xe5\x48\xca\x3c\x21\x98\x25\x18\
-\xac\x85\xe1\x3a\xc0\x75\xb8\xc2\xf5\xe2\x70\xc1\xf3\xf3\xb3\x7a\
-\x5d\x9e\x9f\xe1\x39\xe0\x85\x61\x00\x3b\x0c\xce\xa0\xea\x19\x93\
-\x83\x9e\x52\x1c\x03\x51\x13\xc7\x18\xa7\xfb\x3f\x3d\x3d\xc1\x8b\
-\x17\x2f\xe0\xc7\x3f\x7a\x09\x1f\x7c\xf0\x01\xfc\xe4\x27\x3f\x81\
-\x9f\xfd\xec\xa7\xf0\xb3\x9f\xfe\x14\x7e\xfa\xd3\x9f\xc2\x4f\x3e\
-\xf8\x71\xfc\x7e\xbf\x6b\x9c\xb8\xee\x11\x85\xf2\x96\x10\xf3\x61\
-\x8c\xa6\x67\xc6\xe4\xaa\x4a\x85\x30\x4d\x0c\x2d\x4b\x79\x34\xf3\
-\x9a\x3f\x2e\x1d\x33\x78\xe2\xb4\x39\x00\xcc\xdc\x03\x28\xe0\x9d\
-\x37\x82\x26\xfb\xe6\x1c\x83\xcb\x97\x79\x33\xb8\xe4\xbb\x50\xd4\
-\x4a\xca\xef\xff\xee\x4f\x30\x0c\x03\x90\xb5\x60\xc9\x02\x59\x8a\
-\x3f\x23\xb0\xf1\xa0\x26\x2c\x6c\x9e\x39\x81\xf1\xe8\x25\x72\xf0\
-\xa9\xa6\xdd\xe8\xb8\x88\x77\xaa\x74\xbd\x8d\xe1\xa4\x6f\xdf\xbe\
-\xdd\x6c\xf9\x78\xfb\xe6\xed\xac\xf5\xac\x46\x9d\x91\x7d\xfa\xa7\
-\xff\xe4\x1f\xc3\xbf\xfb\x3f\xff\xef\xc9\x3e\xfd\xbb\xff\xe3\xff\
-\x4a\xf7\x9c\x8c\xce\x5d\x4e\x36\xdb\x92\x82\x87\x95\x47\x2c\xf3\
-\x9a\x43\x08\x47\xfd\x98\x1a\x37\x5e\x6a\x7d\xad\x85\x70\x11\x00\
-\xf2\x8a\xf3\x73\x03\x48\xc3\xa9\xe1\x59\xc9\x6b\x7d\x70\xf8\x74\
-\x01\x1b\xed\x3a\x3f\xf3\x3c\x59\xe3\xc1\x0a\xaa\x82\x7f\x06\x4c\
-\xd7\x41\x67\x0c\x50\xf8\xdd\x87\xbd\x84\x3a\x77\x06\xc1\xe5\x06\
-\x98\x64\xcd\x46\x6f\x26\x3f\x25\x1c\x0a\x8f\x19\xd2\x5b\x28\xfd\
-\xb7\x38\xec\x6f\x95\x56\x84\x0f\xdc\xb6\xb9\xfb\x1d\x46\x1d\xcd\
-\xf5\xea\x2f\x4a\xc7\x89\xaf\x65\xa3\xf2\xd9\x0d\xf8\x7a\x32\x5d\
-\xca\x99\x89\x5e\x99\x44\x10\x90\x6a\xcd\xe0\x74\xa1\x51\xd0\xeb\
-\x8c\x61\x5f\x3a\x73\x5f\x3d\xc4\x3c\xed\xaa\x9e\x33\x2a\xc5\x70\
-\xb1\x58\x54\x27\x54\x0a\x15\xcc\x66\xa2\x10\xa6\x09\xf1\x77\x80\
-\x9a\x02\x4e\x9a\x4f\x70\x0c\x98\x16\x27\xf2\x81\x60\x86\x8f\x9c\
-\xf9\x77\x04\x33\x3f\x64\x20\xf0\x48\xb7\xd8\x7a\x70\xca\x7b\x7c\
-\x30\x41\x57\xfa\xbb\xff\xef\x5b\xb0\x83\x85\xc1\x0e\xee\xe7\x30\
-\x80\xb5\xfe\x27\x59\x20\xef\x71\x8d\xde\x1a\x10\x60\x66\x85\xc6\
-\x75\x88\x85\xf0\x60\x33\x23\x4e\xe4\xd0\x95\xf2\xef\x72\x57\x38\
-\x2f\x58\xb6\x8a\x7a\x64\x61\x8f\x79\xf3\xfa\x4d\xb1\x33\x9c\x05\
-\xa9\xff\xa7\xff\xc9\x7f\xac\x3e\xf5\x6f\xff\xd7\xff\x0d\x5e\xbf\
-\x7e\x3d\xbe\x5d\x45\x5f\x52\x9b\xc7\x15\xc1\xfe\xe9\x3f\xf9\xc7\
-\xc5\xcf\xff\xdb\xff\xe5\x7f\x87\xd7\xaf\xdf\xe8\x3e\x29\x73\xf5\
-\xcc\x46\x15\xc2\x6a\xe6\x58\x68\xb8\xbc\xdf\x61\xf6\x26\x4e\x54\
-\x39\xe5\xbc\xba\x19\xcb\xe7\x32\x4d\x1d\x84\xe5\x83\x20\x55\xa9\
-\x16\x07\xbe\xbc\x30\x57\x84\x66\x4d\xe3\x3d\xd4\xa1\xce\x98\xcf\
-\x23\xd6\x9e\x8c\x95\xb4\xff\x38\xd1\x97\xbc\x31\x3c\xd3\xa7\x29\
-\x9c\x83\x07\x03\x9a\xc5\x5a\x21\xbc\xfe\xd2\x72\xad\xc5\x92\x10\
-\x5e\xa1\xea\x7c\xb1\xbf\xde\x74\x60\xba\x1e\xfa\xde\x00\x75\x7d\
-\x02\x33\x9d\x01\xc3\x1d\x80\x61\x30\x60\x80\x3a\x00\x03\xe0\x18\
-\x95\x0c\xc4\xbc\x83\xca\x9a\x92\x55\xcf\xed\x7b\x46\x1c\xf6\xde\
-\xc9\x21\x79\x45\x07\xb5\x81\xef\x3d\x08\x33\x1e\x9a\x79\xb6\x3b\
-\x59\x27\xd2\xa5\x86\x38\x46\x62\x13\x99\xce\x42\x2e\x4d\xca\xaf\
-\xf1\x46\x06\xb2\x29\x0f\x9e\xcb\x26\x37\x0e\xbb\xa6\x67\x33\xe0\
-\xb8\x67\xad\x93\x45\x0f\x0d\x1f\x40\x50\x1e\x71\x09\x6a\xd7\x70\
-\xc8\xa5\x49\x39\x34\x69\xc0\x12\x65\xb3\x18\x4c\x91\x4d\x03\x88\
-\xd5\x1b\x0d\xe2\x8c\xea\x98\xbd\xb5\xba\xbb\x3f\x20\x30\xd3\x40\
-\xd7\xe3\x00\x32\xa9\xde\xbd\xb9\x12\x7c\x20\xea\x96\x24\x30\xf3\
-\x27\x20\x6b\xe1\x3a\x5c\xc1\x0e\x03\x5c\x87\x01\x86\xeb\x15\x86\
-\xeb\x00\xc3\x70\x85\xeb\x60\xc1\xda\x41\x80\x9a\x44\xfc\xb1\x69\
-\x37\x79\x24\x0b\x15\x26\x85\x5f\x92\x84\x20\x62\xd1\x53\xc3\x32\
-\x1f\x50\x28\xe6\x2c\x41\x01\x8f\x15\xe6\x5c\x79\xce\x15\xf2\xd7\
-\x6f\x5e\x97\x90\x86\x52\x30\xf3\x3d\xf6\x5f\xfd\xeb\x7f\x03\xdf\
-\xfd\xe9\x3b\x85\x60\x30\x53\x5c\x51\xf4\xaf\x64\xd2\x8a\x34\xdd\
-\x9c\x0e\x8c\xff\xf1\x7f\xfa\x9f\xe1\xbf\xf8\xcf\xff\xb3\xd1\x50\
-\xfd\xab\x7f\xfd\x6f\xe0\xbb\xef\xfe\xa4\xf7\x54\x59\xc9\xb9\x10\
-\x0b\x3d\x02\x4e\xa1\x28\x5a\xae\x29\xfb\xf7\xb1\xb0\xe9\x61\xde\
-\x37\xcc\x59\x28\xc5\x65\xa2\xd7\x50\x5f\xb7\x08\x3e\x40\xe7\x57\
-\x62\x89\xd2\x1f\x0a\xfb\x7e\x61\x0e\x70\x69\xc1\x15\x94\x6b\x75\
-\x3f\xc8\xc6\xac\xa0\x35\x70\xa4\x30\x95\x1e\x1b\x39\x1f\x78\x34\
-\x9f\x31\x07\x4c\x28\x0d\x7f\x65\xe5\x84\x53\x2c\x2a\x68\x0e\x1f\
-\x1e\xa3\x9a\x15\x34\x4d\x93\x56\x54\x3c\x71\x43\xc8\xc7\x17\x84\
-\x2e\x61\x0c\x74\xa6\x03\xd3\x75\xd0\xf7\x1d\x74\xfd\x13\x3c\x75\
-\x03\x90\xed\xa1\x7b\x22\xe8\xa9\x77\x1e\x68\xee\x81\xbb\x74\x71\
-\x03\x08\xd4\x39\x4a\x5a\x66\xa3\x0a\x36\x1f\x51\xff\xad\x81\x99\
-\xc7\xd4\x59\x6e\xf5\x5c\xf8\xa0\xef\x1f\x99\x57\x03\x3c\x1d\x99\
-\x3d\x11\x08\x06\xe8\x89\xbe\x5c\x74\x95\x4d\x44\x5e\x8a\x18\x20\
-\x63\x3c\xf3\xa9\x21\xb2\x98\x26\x06\xb0\x52\xd5\x77\x5e\x3d\x9e\
-\xfd\x59\x8f\x3a\x52\xc5\xc5\x03\x24\x85\x92\xc9\x70\x33\xe3\x7f\
-\x82\x0c\x43\x93\x87\x50\xa8\x27\x83\xe5\xa7\xca\x4a\x89\xe0\x85\
-\x49\x55\x70\xd2\xe3\xc6\x1e\xbf\xa7\x3b\xd5\x56\xc3\x1b\xbe\x07\
-\x7d\x38\xba\xad\x6b\xd9\xb6\x6f\x31\x25\xf2\x62\x80\x01\x7c\x7c\
-\x77\x19\x62\x8d\x28\x22\x07\x50\x82\x37\x86\xbc\x47\xe6\x7a\xb9\
-\xc0\xf5\x72\x85\xcb\xd5\xc5\xb7\xca\x18\xd7\x18\x7e\xa6\x0a\x57\
-\xdd\x61\x9e\xe3\x8e\x49\x90\x99\xca\x51\x1a\x45\xbc\x91\x64\xec\
-\xf9\x0d\xca\x2b\x2b\x6a\xc9\xa8\x9c\x2f\xb1\xb2\x80\xa8\x8b\xe5\
-\xf7\xb9\x7f\xf1\xdf\xff\x0f\x71\xbf\x7b\xfb\xe6\x4d\x3a\x2a\xa2\
-\xd2\x1f\x7e\xa7\x78\x8f\xff\xf6\x5f\xfc\xcb\xd8\xa9\xef\x5e\x7f\
-\x57\x54\x21\x51\x54\x72\x96\x74\xf6\x52\xd9\x65\x09\x00\xe2\xbd\
-\x92\x32\xfb\xdf\xfd\x8b\x7f\x39\xca\x73\x08\xf7\x43\xe1\xf5\xc9\
-\xef\xe3\x8a\x1c\xeb\x41\x96\x85\xce\x98\xe5\x3d\xa5\xc2\x3c\xa5\
-\x95\xa2\x20\xad\x1c\xf7\x4d\xcf\xf9\x44\x44\x53\xfc\xbd\x70\xfa\
-\xa3\x02\x36\x85\xfe\xe4\x09\x13\x90\x81\x32\xd1\x17\x66\x9e\x9c\
-\x74\x09\x94\xa5\x73\x2a\xe6\x78\xe6\x95\xb1\x41\x3f\x1b\xe0\x50\
-\x98\x74\x3c\xd7\x78\x62\xa6\x81\x9a\xd3\xa8\x7e\x0f\x73\x9e\xd3\
-\xe6\x90\x2a\x6f\x47\x86\x21\x10\xec\xa4\xbc\x7e\x03\x7b\x80\x83\
-\x40\xcf\xd3\xa4\x50\x75\x7d\x0f\x7d\xd7\xc1\xd3\x53\x0f\x7d\x3f\
-\x00\x3d\x3d\x81\x25\x82\x27\x66\xe0\x3e\xf5\xaf\x57\x48\x14\xc1\
-\x90\xa3\xb3\x25\xc3\xae\x68\x84\x18\x43\xc4\x65\xe5\x92\xef\x78\
-\x1e\x34\xa9\x30\x68\xb7\xe7\xb1\x7d\x00\x24\xb1\x40\xd4\xe9\x1d\
-\x2d\x33\x8a\x5c\xb4\xc8\x4e\x2c\x3c\x36\x8a\xc6\xd9\xd7\xd9\xe2\
-\x49\xe4\x34\x8e\xc4\xc2\x0d\x0c\x1d\xfd\x29\x1b\x98\xb4\x4c\x61\
-\x9e\xb0\x27\xf3\x62\x04\xd8\x31\xd9\xfb\xea\x30\x2d\x74\x5a\xfc\
-\xe4\x6c\xa3\xab\x69\x3b\x6f\xed\xdb\x9d\xf4\xb7\x33\xe7\x32\x3e\
-\x40\xfb\x8e\x5c\x8b\x35\x56\x0d\xde\x79\x7f\x3c\xfb\xe0\x5a\x08\
-\x26\x15\x94\xee\x5a\x61\xf1\xca\x65\x08\x21\x23\xb2\x30\xf8\x50\
-\xb3\xeb\x75\x80\xcb\xf5\x12\x13\xf7\x2e\x1e\xd4\xd8\xc1\x3a\x50\
-\xe3\x73\x69\x64\x11\xac\xc7\x7b\xd6\xbc\xa0\xe6\xa4\x3d\xc8\x88\
-\x04\x43\xf4\x04\x25\xb1\x06\x56\xb1\x10\x24\x47\x2f\x95\x4c\x5e\
-\xe4\x85\x3c\x8d\xb8\xaf\x81\x49\x85\x82\x63\x01\xe0\x5c\x61\x4e\
-\x79\x4e\x92\xfe\x3e\xa7\xc0\x1f\x6f\xa9\x69\x3f\x34\x3e\xbf\xd0\
-\x48\x26\x19\x55\x9d\x59\x5f\x97\xfc\x7d\x80\x60\x96\x36\x53\x29\
-\xc9\x71\xfc\x7c\xc5\x66\x14\x45\x8d\x21\xd5\x29\x03\x62\x20\x60\
-\x57\xe7\x28\xf4\x8b\xb5\x77\xa8\x74\x3e\x38\x8c\x84\x02\xcc\x84\
-\xca\xd0\xa8\xbc\x6a\xd2\xd3\x44\xf1\x27\x65\x34\xa0\xd3\x7b\x97\
-\x2c\xb2\x2c\xc7\x4d\x1f\x9a\x09\x84\x39\x40\x2b\x80\xfd\xc2\x1c\
-\x18\xe5\x87\xa2\xa8\xaf\x66\x44\x2d\xb4\xfc\xf9\x88\x57\x75\x7f\
-\x72\x03\xa1\x8c\x6a\x00\x5d\x4c\x3a\x8e\x99\x9b\xdc\x40\xe1\xd9\
-\x80\xa3\x2d\x2e\x3e\x1b\x9e\xda\x78\x8e\x39\x08\x8e\xcc\x31\x57\
-\xb5\xec\x7c\xf2\x70\xd7\x77\xf0\xd4\x3f\xc1\x30\x3c\xc1\x8b\x17\
-\xfe\x19\x06\x62\x93\x10\xca\x6e\x11\x10\x09\xc0\xba\x08\x11\x36\
-\x04\xcc\xe8\x7a\xcd\xc6\xe7\x0b\x88\x3c\x9a\x42\xee\x01\x9f\x70\
-\x5e\xb5\xe8\x87\x86\x1f\x6e\xd9\x18\xae\xd4\x63\x10\x42\x08\x26\
-\x2a\xd6\xb2\xa0\xaf\x1b\xec\x62\x61\xcd\xf8\x0a\x2c\x68\x32\xf7\
-\x1d\xd3\xfe\xc5\xcc\xe9\xa7\xf7\xd8\x14\xa2\x68\x8b\x7b\xc4\xd2\
-\x3a\xe9\x97\x37\x8e\xb5\x58\x06\x0b\x98\x2b\x23\x04\x30\xc9\x53\
-\x13\x91\x5c\x2c\xa8\x19\xe8\x9c\x05\x55\x9c\xa2\x80\xde\xd2\xce\
-\xc3\x1d\x77\x0f\x8b\x64\xb8\x6d\x0c\x37\x19\x0b\x3e\xe1\x7a\x58\
-\xb9\x09\x65\xb0\x46\xb0\x9c\x05\x8b\xb9\x53\x90\x88\x5d\x18\x19\
-\x91\x03\x2c\x76\xb8\x3a\x2f\x4d\x60\x22\x79\xbe\xc0\xe5\x7a\x71\
-\x21\x68\x36\x79\x69\xa4\xc5\x78\xcf\xb4\xe6\x53\xc6\x72\xde\xc7\
-\x98\x2c\xf1\x09\x58\x18\xc1\x6c\x14\xe2\x7c\x73\xd3\x6b\x04\x73\
-\x9e\x09\x8e\x2c\x09\xf6\x37\x10\x4a\x6f\xae\xfc\xeb\xfb\xc8\x78\
-\xfe\xa8\x80\x42\x50\x9a\x13\xa3\x9c\xa5\x00\x02\x78\x34\xe6\x9c\
-\xdf\x43\x00\xb4\xc0\xd4\xa4\x58\x9b\x50\x03\x27\x16\xa0\x2c\x02\
-\x5b\xf6\xf7\x03\x2e\xb2\xcc\x28\xeb\x7f\x7e\x1f\x11\x16\x2c\xc7\
-\x8d\x83\x47\xcf\xff\x4c\xf7\xa2\x14\xb2\x55\xb8\x4f\x78\x46\x31\
-\xcc\xd8\xf7\xc1\xc4\xa2\x6c\xe9\x1c\x89\x5e\x05\x71\xed\x44\x62\
-\x21\xbd\x5d\x95\xfd\x09\xc9\xe3\x32\xf4\x4c\x00\x27\xe6\x10\x7a\
-\x29\x43\x30\x69\x62\xcc\x92\x45\x31\xe6\x87\x22\x82\xe9\x52\x5f\
-\x0c\xa2\x0a\x3f\x4b\xb5\xdc\x84\x47\x34\x7a\x46\x49\x97\x43\xc8\
-\xcf\xd5\x98\x6b\x2a\x2c\xa3\x41\x71\xf0\x54\x5d\x7a\xdc\xc2\x7d\
-\x38\xce\x33\x39\xa7\x79\xd2\x8b\x36\x69\x26\xd8\xbe\x57\x56\x9a\
-\xc9\x6b\x18\xce\x92\x27\xcc\xcf\x9d\xce\x40\x6f\x7a\xe8\x9f\x7a\
-\xb0\x4f\x16\x88\xac\xeb\x9b\x7f\x2e\xc6\x74\x60\x87\x01\x8c\x31\
-\x40\xc6\x02\x91\xb3\x20\x93\x21\x40\x72\xc5\xbf\x99\x00\xd8\x80\
-\x02\x33\x4d\x1e\x5b\x0f\x58\x6b\x88\xc5\x1b\xe9\x47\x6b\x99\x0b\
-\xf7\x9f\x7a\xdb\x0f\x57\xae\x18\xab\xf4\xbb\xd3\xc5\x53\x91\xcd\
-\x90\x2f\x23\x8b\x6d\x8a\x7a\x34\x26\xd5\x9a\x4c\x21\x56\xeb\x02\
-\xcb\x79\xa5\xae\xd0\x1f\xa5\x69\x63\xc9\x82\x02\xd9\x61\xec\xc1\
-\x8c\x51\x96\x4c\x48\x1e\x1a\x93\xc2\x28\x50\x79\x61\x10\x4a\x2e\
-\xa9\xd9\x39\x83\xa5\xc7\x53\x48\x98\xc1\x93\x27\xf3\xd4\xa8\xf2\
-\x71\x3c\x05\xbc\xf3\x83\xa5\x61\x40\x7c\xbc\x0d\xac\x6d\xe6\x99\
-\x21\x95\x75\x0e\x83\xfa\x64\x50\xf4\xa2\xa7\x86\x94\xa7\xe6\xf9\
-\xf9\x02\xcf\x17\x07\x6c\xa2\x97\xc6\x5a\x6f\x2d\xe6\x65\x9e\xd1\
-\xcd\x0f\x8f\x0f\x79\xe6\x53\x87\x1b\xa2\x54\x64\x7d\x28\x8a\x57\
-\x7a\x8c\xe9\x04\xb8\x09\xf1\xbc\x6e\xac\xac\x07\x31\x21\x5c\xcf\
-\xda\x8c\xfd\x2d\x53\x68\x73\x05\xd3\x04\xa5\xbc\xeb\x44\x72\xa4\
-\x89\x3b\x59\x50\x98\x49\x50\x66\x3b\x00\x40\x93\x60\x43\xe7\x96\
-\x98\xac\x90\x99\xcb\x19\x70\xa0\x43\x7b\x00\x08\x58\x31\xd8\x51\
-\xa6\x3c\x17\x43\x8e\xa6\xee\xa3\xc6\x4d\x87\x01\xe4\xd7\xb7\x44\
-\x63\x50\x23\x94\x73\x9d\xfb\xe0\x15\xf1\x2e\x63\xa5\x8a\x06\xae\
-\xe0\x09\x62\x11\x4a\x99\x8f\x1d\x3b\x8f\x17\x85\x4f\x6a\xa0\x11\
-\xc1\x66\x29\xce\x1b\x11\xc0\x18\x39\x6c\xfe\x59\xc8\x7b\x70\x7c\
-\x46\xd1\xc3\x95\x53\x99\x4b\x4f\x56\x48\x4a\xcf\xe3\xc9\x3d\xa0\
-\x71\x43\x9e\xae\xab\xc7\xcc\xff\x04\x8e\xfd\x51\xb3\x5b\x81\x33\
-\xe3\x40\x53\xbc\x47\xe7\xfb\x23\x00\x5a\x04\xe9\xd3\xfd\x91\x61\
-\x7b\xe5\xb3\x6a\x2e\x4f\xb5\x22\x7b\x75\xa5\x57\x03\x6b\xe2\xbf\
-\x85\x1a\x10\x0b\x73\xfb\xbc\x99\xde\x3e\x39\xe3\x00\xb3\x23\x08\
-\xf0\x6b\xa4\xeb\x7b\xb0\x5d\x07\x5d\x98\x33\x44\x40\x1d\x81\x61\
-\xa3\x3c\x99\xce\x52\x9c\xec\xc5\xa7\xb2\x9d\x55\x2a\x96\x4d\xa6\
-\xe7\xcf\x9c\x32\x3e\x37\x7d\xf8\x5e\x8d\xde\xc7\x6c\xbf\xfa\xbc\
-\x44\xde\x3e\xb6\x93\x23\x17\xf5\x73\x50\x9e\xfc\xce\x88\xfa\x34\
-\x91\xe5\xcc\x24\x07\x05\xe2\x24\x31\x00\x96\x1e\xea\xc6\x87\xd4\
-\x6f\x1e\x58\x71\xd3\xd9\x09\x84\xa9\x18\x66\x70\xc1\xe7\xa0\x26\
-\x5a\xea\x20\xaf\x32\x0a\xab\x13\xe7\xa7\xd5\x2f\xac\x30\x7b\xcf\
-\x31\xf9\x9c\xa0\x78\xe3\x11\x13\xed\x24\x14\x70\xe7\x1d\x96\x97\
-\xfa\xf4\x03\xdf\xfd\x57\x95\x93\x08\x61\x47\x44\x9e\xe1\xec\xea\
-\x48\x01\x2e\x17\xb8\x5e\x2e\x70\xb9\x5c\x1d\x0b\x9a\xb5\x51\xc1\
-\xde\x33\x8f\x70\xd3\xb4\x9c\x5f\x60\x53\xe9\x81\x9c\xa9\x5d\x9a\
-\xc7\xde\x59\x67\xa9\xeb\xc0\x50\x07\x7d\x47\x00\x5d\x07\xc0\x1d\
-\x18\x83\x5e\x71\xe1\xe8\x5d\x20\x6b\x61\xb0\x36\xe6\x1d\xd9\x98\
-\x57\x34\x0d\x68\x82\x85\x3c\x28\xfe\x1d\x11\x74\x5d\xe7\xd9\x94\
-\x38\x7a\x24\x82\xf2\x48\xfe\x19\xd8\x40\xa1\x4d\xc9\x1b\x14\xee\
-\xa3\x5d\x41\x29\x5c\x2a\x78\x4c\xba\xae\x83\xae\xeb\x00\x3a\x72\
-\x8c\x4d\x9c\x3c\x0e\x0a\x34\x85\xfe\x08\x8a\x6e\xfd\x7c\xf5\x7d\
-\x24\x0b\xa5\x4b\xb0\x36\xd0\x7b\x46\x28\xe8\x8c\xbf\x8f\xf1\xa1\
-\x38\x1c\xbd\x7f\x14\xfa\x63\xad\x53\xd0\x6d\xee\x71\x60\xa1\x97\
-\x6b\xaf\x4c\xd7\x19\x20\xd3\xf9\x3e\x19\x60\x63\x00\xd9\x80\x11\
-\x80\x26\x2a\xff\x96\xd2\xb3\x09\x8a\x39\x13\x10\x09\x84\x2f\x8c\
-\x60\x8e\x5e\x54\x52\xf9\xba\xfb\x98\x00\x3a\x88\x00\x42\x41\x5a\
-\x0a\xf3\xc0\xa6\xfb\xf8\x31\x8c\x7d\x89\xc0\x89\x27\xf3\x38\x88\
-\xd2\x7d\xba\xae\x73\x14\xc1\x1e\xd4\xa4\x10\x40\x52\xf7\xb1\x92\
-\x69\x90\x29\xe6\x71\xe5\x16\x26\x45\x4d\x6c\x3d\x0d\x71\x67\xc0\
-\x18\xf2\xfd\x31\x11\xd8\x86\x90\x46\x75\x1f\x3f\x0f\x62\x98\x1b\
-\x89\x1c\xa4\x91\xf7\x71\xca\x43\x83\x0f\xb1\x07\x07\xb0\x1a\x8c\
-\x08\x64\x7b\xd7\x1f\x04\x30\x06\xa1\x1b\x7a\x18\x86\x1e\xfa\x27\
-\xeb\x8b\x07\x8b\x50\xcc\xb0\xa7\xa8\x75\xc0\x87\x9d\x87\xfc\xbd\
-\x3a\x60\xee\x7f\xd6\xf2\x51\x6e\x9b\x47\x3b\x97\x4f\x9e\x4c\x47\
-\xab\x70\x8a\xdc\xcb\xe7\xbf\x1b\x61\x64\x49\x14\xce\x22\x1c\x54\
-\xbc\x68\x0d\x31\xc0\x59\x21\x67\x5c\x81\x36\xf3\x81\x43\xc9\x8c\
-\x83\x92\x9d\x2c\xc5\xaf\xa3\x2a\x90\x29\xe3\xcd\x85\x77\x46\xe5\
-\xe2\xac\x7c\x98\x3c\xb5\xf7\xce\xc1\x3f\x61\x92\x39\x78\xbe\xbd\
-\x97\x16\x98\x3b\x6c\x16\x5b\x12\x2c\xbf\x2f\xd8\x66\x7d\xe8\xd5\
-\x64\xea\xf0\x28\xdb\x2c\x86\xa2\x79\xab\x70\xa0\x6e\xbe\x0e\x83\
-\x07\x38\x43\x54\xac\x74\x38\xca\x78\xb0\x4b\x76\xdb\xf5\xb9\xfc\
-\x3c\x03\x5a\xb8\x0a\xd8\x94\xce\xdc\xa8\xe8\x04\xab\x7c\xc7\xd1\
-\xb2\xc4\x88\xc0\x86\xe3\xe6\x10\x77\x02\xf6\x0a\x2d\x79\xcf\xc6\
-\x20\x80\x0d\xe9\x10\x27\x39\xca\x71\x53\x37\x8e\x0a\xb6\xeb\x41\
-\xe4\x51\xf8\x35\x6f\xba\x38\x9e\xc4\xc1\x03\xe0\x94\x4b\x6b\x2d\
-\xd0\x10\x80\x8d\xcf\x11\x21\x1a\x85\x9c\x19\x11\xfe\x05\x5d\x27\
-\x80\x8e\x0f\x97\x91\x9b\x9e\x08\x3b\xb4\x41\x71\x1e\x6c\xac\x41\
-\x24\x43\x90\x4a\x0a\x73\x50\xcc\xa1\x63\x00\xe8\x80\x44\xbe\x86\
-\x1b\x36\x76\x96\x3f\xf6\x75\x8f\xe4\x7c\xb2\x09\xdc\xc4\xfe\xc4\
-\x90\x3d\x61\xe0\x12\x95\xa6\x99\x3b\xe8\x3b\x4e\x31\xd6\x80\x80\
-\x40\xc0\x3e\x84\xca\x59\xd4\xbd\x55\xdd\x6a\xf0\x24\x3d\x0f\x32\
-\x24\x50\x87\xb4\x39\x2f\x13\x77\x1d\xf4\x90\xee\xc3\x08\xc0\x68\
-\x00\x7d\xe9\x25\xf2\xcf\xc7\xfa\xfb\x58\x31\x6e\xca\xbb\x25\x9d\
-\x0f\xbe\xbd\x21\xc4\xcc\x74\x9d\xeb\x4f\xef\x42\x9d\xd8\x84\x1b\
-\xb1\x5e\xb3\x11\x0c\x0a\x70\xeb\x01\x74\x08\x75\x1b\x79\x9c\x30\
-\xf5\xa7\xeb\x0c\x80\xe9\x9c\x27\x02\xfa\xb8\x1e\xd9\x50\xf2\x6c\
-\x71\xea\x8f\xbe\x47\xa9\x3f\x3c\x3a\xa4\x30\xa7\xbd\x56\xc5\x2c\
-\x27\x56\x3c\xae\x5a\xf1\xd2\x0c\x51\x65\xd5\x52\xab\xcf\xaf\x33\
-\x63\x10\x4c\xf0\xa0\x01\x80\x31\x06\x6c\xd7\x03\xd9\x1c\xc8\x94\
-\x55\x09\xed\x8c\x0e\xeb\x02\xcb\x11\x0a\xcd\x8d\xf2\x50\x82\x0f\
-\xa6\x68\x1d\x0e\x66\xce\x18\x9f\x8d\x17\x4a\xb5\x69\x24\xa9\x0a\
-\x46\x70\x93\xc2\xcf\x64\x6e\x9b\xf6\xcc\xc8\x68\x85\xf1\xca\x96\
-\xd9\x99\x28\x42\x89\xd7\xc9\x3c\xcb\x19\x4e\x85\x70\xd5\x0f\x5c\
-\x4e\x02\x20\x2b\xf4\xaa\x04\x5a\x93\xd0\x9e\x62\xf1\x29\x26\xcf\
-\x1c\x53\x25\x7b\x6e\x5a\xe2\xad\xb4\xf7\x87\xad\xaa\xb5\xe1\x3e\
-\x78\xce\x3d\x6b\xab\xf0\xfe\x10\xce\x1a\xae\x78\x37\x29\xdb\x61\
-\x01\xa6\xc1\x21\x66\xe0\x10\x5a\x65\x5d\x6e\xcd\x60\xad\xf0\xd0\
-\x08\x66\xac\x92\xc2\x81\x38\xa9\x90\xd4\x85\x29\x16\x58\xa9\x26\
-\xde\x2b\xf5\xb0\x54\x23\x47\x5a\xcc\x9d\x62\xee\x15\xe2\xce\xb5\
-\x8d\xd0\x40\x47\x0c\xd0\xb1\x72\x95\xa3\xd7\x6c\x0d\x52\xb4\x1e\
-\x85\xe4\xf3\xe4\x79\x20\x1f\x86\x97\xf2\x1b\xe2\x5e\x4e\xc6\x29\
-\xad\xe1\xbe\x16\x81\x8d\xd1\x89\xc8\xc2\x86\x82\x52\x83\x8a\xca\
-\x78\xf2\x6a\x8c\xbc\x27\x7e\x0f\x24\x34\x60\x88\x01\x3a\x01\xd8\
-\x7c\x7f\xa2\x92\xe6\xef\x45\x99\x55\x87\x45\xfe\x84\x2b\xa8\x4a\
-\x31\xec\x2c\xe4\x06\x45\x00\x86\x26\xbe\xef\x22\xb2\x0c\x10\x13\
-\x74\x60\xe2\x7d\x0c\xe2\x78\x3f\x95\x79\x21\xd2\x4b\x23\xc2\xe8\
-\x22\x1f\x65\x1c\x37\xf6\xf7\x06\xb0\x06\x63\xff\x22\x58\x0b\xc7\
-\x1b\xb2\xc0\x6a\xda\xbb\x41\x11\x80\xfb\x71\x13\x62\x10\x81\xc9\
-\x80\xf1\xf7\x31\x08\x40\x88\x60\x8c\xa7\xe7\xcd\x3d\x11\x0c\x11\
-\xa8\x31\x84\x35\x22\xee\x35\x09\x6a\x01\x98\x3b\x47\x05\x8c\xe9\
-\xbe\x1c\x9e\x0d\x42\x3a\xf0\x01\x80\x6c\xb8\x67\xf0\x60\x85\x7b\
-\x04\xf0\xc4\xc9\x4b\x03\x2c\xe6\x34\xc4\xfe\x24\xe3\xa0\xf7\x32\
-\x75\x66\x64\xca\xc0\x30\xee\xea\xf9\xdb\xd8\x9f\x34\xd7\x48\x7b\
-\x68\x30\x2b\x87\x8d\xa5\x1a\x4b\x38\xbf\xd6\x71\xc7\x7e\x36\x91\
-\x70\x33\xa2\x03\xf7\xeb\x97\x08\xa1\xeb\x20\x7a\xc9\xa2\xd7\x93\
-\x28\x86\xcf\xb2\x58\x23\xc5\x42\x48\x5c\x0c\x48\xdf\x7c\x54\x6f\
-\x89\x98\x39\x92\x45\x73\xcb\xb5\x70\xee\x8f\x8f\x7c\xc0\xe2\x83\
-\xb5\xf7\x81\xdc\x73\xc7\x7b\x68\x9c\x01\x2d\x44\x1d\x18\x91\x4a\
-\x62\x8c\xf4\xc6\xf8\x90\x33\x30\x82\x20\x47\xab\x10\x5c\x30\x58\
-\xa8\x0a\xbc\xb8\x46\x67\x9f\x05\x34\xb8\x6f\x72\xc9\x62\x76\x29\
-\x7b\x4f\xb1\xe7\xc4\x4d\x3e\xf0\x54\x63\xa6\x14\x95\xde\x13\x7f\
-\x5b\xf7\xa8\x78\xe3\x64\xe0\x59\x58\xc3\x07\x4c\x30\xde\xb3\x09\
-\x4e\x84\xfb\xf1\xbd\x57\xd0\xd1\x20\xc7\x4f\x1f\xae\xd8\xa4\x7e\
-\x30\x06\xb4\x82\x73\x06\x85\x22\x47\x22\x7c\xd3\x20\x66\x1b\x0a\
-\xa7\xbc\x84\xa0\xa8\xc7\xd8\xf2\x94\x38\x5c\x1c\x53\x04\xc0\xec\
-\x41\xa8\x8a\xc2\x13\x45\xf2\x78\xca\x62\xcb\x33\xf0\x8c\xc5\x3a\
-\x2c\x14\xbc\xcc\x13\x9a\x93\xf5\xc8\xf5\x3f\x6c\xc0\xc6\x18\x35\
-\x79\x82\xf7\xa6\xf3\x1b\x2d\x03\x3b\x45\x17\x0d\x18\xb4\xca\x6c\
-\x9b\x92\xc4\x27\x00\x0d\x82\x0b\xc3\x62\x02\xc3\x08\x41\x23\x47\
-\x69\xc8\x31\x7a\x1f\xc3\xcc\x3c\x1c\x2d\xe5\xde\x4b\x23\x69\x9d\
-\x51\x80\x51\x36\x00\xc0\x08\xcc\x06\xa4\xfa\x95\xe2\x98\xbd\x57\
-\x02\xbc\xe7\x01\x6c\xba\x8d\x4a\xda\x97\xca\xb9\x06\x34\x26\x54\
-\x85\xf6\x4a\xbf\x63\xa1\x11\xaa\xb2\x49\x39\x91\x1d\xb8\xd2\xea\
-\xa4\xd8\xaf\x1d\xab\x56\xe8\x8f\x64\x71\x93\x8a\x70\x78\x24\xcc\
-\x28\xd8\xd0\x12\x00\x30\x82\xad\xcb\x00\x3a\x96\x1d\x4c\x13\x9f\
-\x23\x13\x99\x57\x5a\x89\x32\x2b\x3c\x02\x21\xc7\x42\x89\x86\xd1\
-\x27\x7d\x27\xa0\x19\x06\xd6\xb8\x07\x04\xc4\x36\xd1\x60\x47\xd0\
-\xac\xf3\x5d\x8a\x80\xc6\x35\x12\x80\x5c\xa8\x93\xcc\x7f\x72\x91\
-\xd3\x46\x18\xea\xdc\x9b\x4c\xb9\xe7\x34\xb1\xb8\xa5\x35\x29\xfa\
-\xe3\xc3\x35\x5c\x35\x7b\xf4\x6c\x65\x66\xbc\xe0\x02\xa0\x4a\x78\
-\x58\x03\x4e\x08\x73\x40\xd4\x9d\xca\x2c\x46\xb1\x32\xb8\x9f\x17\
-\x7e\x86\xf8\xff\x52\x5e\x8c\x63\xff\xc2\xe5\x43\x68\x53\x45\xca\
-\xac\xd6\x50\xe1\x7d\x37\x0f\xdc\x64\xe2\x00\xd2\x45\x18\xa2\x7e\
-\x4e\x52\x0d\x41\xcd\xae\x57\x79\x46\x1d\x58\x97\xfb\xfd\x3e\x77\
-\x0e\x0a\x93\xc7\x5b\xb5\x37\xbb\x19\x9f\x81\x34\x1f\x10\xcc\x1c\
-\x8e\x19\x51\x1b\x1b\xa4\xe7\xc5\x18\xd4\x2c\x67\xca\x5b\x03\x69\
-\xff\x0b\xb9\x84\x5c\xd6\x76\x19\xf6\x15\xb0\x2d\x02\x9a\xbd\x54\
-\x8a\xfa\xa7\x28\x89\x29\xc1\x8c\xb7\xf8\x25\x06\x18\xcd\x08\x84\
-\x38\xb6\x37\x3d\x1a\x5c\x3e\x8c\xdb\x9c\xf5\x86\x5b\x7d\x4d\x2c\
-\x27\x7d\x6d\x6d\xd7\x14\xd8\xc2\x23\x36\x15\x3c\x68\x8c\x14\x7a\
-\x5f\x7e\xe2\xf8\x1e\x6c\x14\xc7\xcc\x5c\x54\x1a\x4c\x30\x18\x18\
-\xb1\xae\x50\x15\xa2\x65\x51\x43\x04\xa2\xa5\x98\x99\x40\xb3\x0d\
-\xe0\x7c\x52\x2c\xa6\x55\x8a\xd5\x1e\x5c\xc9\x99\x92\xe0\x48\xae\
-\x9b\x31\xe6\xa7\x4f\x16\xfb\xae\xc0\x0d\x24\xab\x34\xb0\x57\x25\
-\x75\x3d\x1d\xe7\x5d\x80\x14\xd7\x6b\xd2\xe6\xca\xc0\x60\x48\x5a\
-\xa1\xb4\x92\x1e\xc6\x29\x51\x50\x21\x04\xc2\xc9\xf8\xb7\xdc\xae\
-\x23\xeb\x6e\x79\xcf\x89\xa4\x3d\x96\xc0\x29\xf5\x81\x63\x5e\x43\
-\x3a\x7c\x83\x09\x99\x55\x78\x90\xac\xd7\x65\xc4\x1e\x4a\xa4\x99\
-\xde\xf2\x93\x9c\x23\x28\x18\xdf\x27\x64\x18\xe4\x85\x1d\x51\x8d\
-\x9b\x89\xd7\x91\x7b\xfa\x88\x8c\x02\x52\x42\x7f\x32\x0f\x31\x30\
-\x18\xa7\xac\x23\x17\x59\xc3\xe2\x19\xe0\xd0\x95\xf7\x16\x65\xd9\
-\xe5\xcc\x59\x0d\x1c\xad\x98\x33\xb2\x43\x80\xf2\xd9\x01\x67\x64\
-\x01\x18\xc9\x21\xc0\x03\x8f\xe0\x31\x9a\xb2\x20\xc8\x1a\x38\xe8\
-\xef\x83\x6c\x54\xd1\x4d\x04\xa9\x38\x1b\x30\x06\x52\xe8\x05\x23\
-\x00\x12\x50\x2c\x3c\x97\x21\x78\x59\xd3\x67\x04\xfc\x0d\xa0\x0c\
-\x9f\xca\x3c\x2a\x81\x31\x34\xd5\x8d\xc8\x95\xf5\x04\x94\xc9\xd7\
-\xbf\x51\x4c\x71\x10\x28\x55\x21\x8b\x8c\x00\xe5\xcd\xd2\x75\x8f\
-\x70\xdf\x26\xb7\x64\xc9\x0b\xc4\x1d\x2a\xfc\x24\x3b\x0c\x14\x45\
-\xb9\x9c\xea\x82\x97\x49\x46\x86\xe4\x65\x23\xa6\x9a\x29\x93\x93\
-\x8f\xe2\x43\xd9\x32\x44\x79\x39\x30\x5c\x7f\xff\x1a\x9d\x80\x73\
-\xe0\x76\xb2\x72\xbe\xd6\xe3\x35\x79\xb6\x73\xc5\x58\xf2\x0e\xc3\
-\xf1\xfa\x53\xf8\x78\xc5\x60\xcf\x84\xe2\x63\x3a\xa3\xfe\x29\xc2\
-\xc7\x0c\x6a\xda\x7d\x5d\x8b\x06\x63\xce\x25\x88\x5c\xfa\xa4\xae\
-\x60\x0c\xf1\x04\x55\x7c\x79\xfa\x59\xae\xce\xa1\x99\x4c\xc6\xe6\
-\xb5\xe3\x21\x0b\x63\xca\x7c\x1a\x03\x60\x64\x4d\x00\x54\x56\x39\
-\xb5\xd1\x48\x0f\xcf\x03\x81\x99\xed\x77\xe0\x6c\x21\xa3\xb6\x48\
-\xe3\xca\x39\x8b\xf7\x59\xb8\x37\x1f\x4f\x3c\xfe\xf9\xdc\x13\xec\
-\xe0\x09\xd7\x62\x94\xce\x4b\x67\x32\xb0\xbe\xf6\x8a\xc1\xb1\xa2\
-\xae\x15\xa9\xdc\x72\x85\xb3\xb1\xf4\x98\x29\x34\xaa\xd0\x5f\x05\
-\x52\x4b\x4a\x75\xf2\x3d\x23\xea\x22\x86\x5a\x61\x72\x9f\x45\x60\
-\x50\xc6\x9d\xcc\x53\x13\x83\x71\xa4\xb2\xcc\x3a\x6e\xde\xf8\x4d\
-\xd8\x00\x46\x0f\x0d\x7b\xc0\x61\xa4\xf2\x56\x60\x7e\xe2\x89\xa7\
-\x87\x85\x75\x99\x6f\x5d\x38\xb9\x8d\x2d\xa9\x19\x73\x48\x11\xf5\
-\xfd\xa4\x11\x69\xe2\x41\x20\x2f\x38\x52\xd5\xb8\x71\x76\xbd\x72\
-\xaf\x77\x6d\xcf\x05\x93\x69\x5e\xbb\xe0\xcc\x75\x93\x92\xfb\x59\
-\x47\x02\xc0\x5c\x31\xcd\x72\x87\x50\x4c\x36\x84\x14\xa2\x67\x04\
-\xb8\x64\xf4\x73\x10\x46\xd1\xa0\x11\x94\x4f\xd6\x3d\xe2\xf2\x3e\
-\x3f\xea\x4f\xc8\x73\x92\x73\x59\xd4\xb9\x01\x26\x05\x06\x25\x70\
-\x92\xde\xdc\xc4\x40\x8a\x31\xc4\x2d\x81\xfe\xa9\xb5\x8e\x05\x50\
-\x52\x9e\xeb\x8b\x39\x07\x79\x8d\x2d\x5f\x18\x46\x79\xe3\xc5\xe7\
-\xc4\xc0\x00\x00\x20\x00\x49\x44\x41\x54\x30\x8b\xa3\xe0\x34\x0e\
-\x92\x25\x50\x25\x2f\xc7\xe2\xba\xf5\xea\xc5\x5d\xbc\xff\x3c\x43\
-\x01\xbc\xe2\x80\xe1\xad\x6b\xf3\xe4\xaf\xad\x1d\x53\x3c\x15\x45\
-\xdc\xcf\xca\x8d\x35\xcf\x7d\xe3\xc5\x18\xeb\xd9\xce\xaa\xb4\xfa\
-\xb0\x4f\xca\xdc\x19\xc1\x2a\x3a\xf2\xd0\xa0\x30\xac\x2a\x67\x05\
-\x2a\xc6\x48\x5e\xad\xfc\x96\xfb\x3b\x4f\x0a\xb0\x93\xbb\x17\x33\
-\x54\x86\xd2\x4a\x89\xd9\xdf\x47\x15\x9d\x27\xf7\xc7\x9b\x2b\xd9\
-\x78\x1a\x22\xcf\xfc\x20\x7b\x77\xcd\x9d\xc8\x9e\x2b\x2f\x81\x0f\
-\xb4\x77\x6c\xdd\x7f\xef\xe5\xc9\x39\x32\x56\x7a\x6a\xc3\xe1\x50\
-\x01\x3b\xd6\xf4\x10\x9e\x1a\xe9\xf9\x94\x4c\xe8\xa8\x15\xa2\x52\
-\xa1\x4a\xb5\x21\x29\xe3\x03\x66\x80\x09\x47\x45\xd8\x13\x9c\x4f\
-\xca\x53\x50\xa6\xd2\xef\x2c\xac\x36\x90\x42\x9e\x22\x73\x93\xf7\
-\xc2\xc4\xe2\x5c\x19\xa8\x41\x61\xce\x54\xec\x45\x1c\x15\x4e\x94\
-\xbf\xf3\x18\xf0\xa0\xd8\x64\x65\xbe\x4d\x4a\x56\x4c\xa1\x63\x58\
-\x58\x2d\xb2\x18\x63\x48\xce\x97\x0c\x57\xba\x4d\xe3\xbd\x24\x85\
-\xf9\xc8\xd0\xb5\x5c\x73\x65\x65\x9d\x0e\x4a\x1e\x42\x02\x68\xfa\
-\x7e\xe3\x1b\xa1\xa4\xcf\xc4\x8c\x16\xd8\x7f\x8e\xf3\xa1\x54\xed\
-\x4e\xe6\x70\xd6\x1f\x52\xe3\x07\xc1\xea\x9f\x03\x3d\x9c\xb2\xb2\
-\xe6\xd6\x76\xe1\x49\x2a\xac\x90\x38\x3f\x38\xe5\xdb\x60\x9c\x9f\
-\x25\x24\x59\x4e\x49\x2d\x75\xad\x74\x1c\x72\x21\x71\x1e\xd4\x5c\
-\x48\xf3\x2c\x78\xf0\xdc\x5c\xc3\xdc\x84\x25\x42\x39\x45\xbe\x4d\
-\x58\x47\xac\xc3\x9e\x31\x0f\xe7\x56\x5e\x23\x18\x79\xdc\xd2\xfb\
-\x33\x68\x68\x54\xeb\x46\xb0\xf7\x19\x54\xd4\xe7\xa9\x30\xa9\x5c\
-\xeb\x99\x21\xe3\xa0\xcd\x54\xd7\x7d\xd2\xf4\xd2\xa1\xa6\x12\x8e\
-\xda\x0d\x05\x70\x8f\x3a\xf2\x03\xb2\x22\xb4\x7a\xa6\x8e\x2b\x3d\
-\x00\xac\x66\x59\xdd\xa2\x17\x1c\x02\x96\x2a\x81\x3f\x9f\xd1\x81\
-\x07\x33\x8a\xde\x5d\x3f\x59\x31\x7e\x67\xe9\x96\x78\x74\x3f\xb0\
-\x64\x48\x09\x0b\xcf\x88\x54\x92\x8c\x5e\x5e\x84\x9a\xc9\x28\x91\
-\xb3\xfa\x56\x1f\x72\xb6\x6a\x45\x8f\x19\xce\x4c\x2c\x08\xa6\xdd\
-\x54\x72\xa3\x41\xb5\x79\x67\xd5\x42\x47\x4c\x67\xef\x53\x70\x51\
-\x8d\x25\x56\x68\x11\x0b\x5d\xc2\xfa\xc7\x50\x67\x09\x5b\xb9\x21\
-\x9c\x41\x7e\x76\xd4\x04\xe7\x1b\xed\x57\x67\x6e\xb0\x6b\x17\xbc\
-\x54\x26\x18\xd0\x25\x38\x67\xde\x93\xf8\x33\x83\x2a\xb2\xca\x93\
-\x41\xf4\xca\x02\x2a\xa3\x44\xfa\x29\x72\x29\x64\xb5\x72\xd0\x71\
-\xe9\x73\xee\x43\x49\x38\x90\xaa\xca\xfb\x6a\xdd\x39\x23\x16\x88\
-\x3a\x3b\x98\x42\x62\x14\x13\xca\xac\x99\x8b\x23\x1b\x97\xfa\x3d\
-\xc6\x65\xa1\xf8\x3b\xe9\xef\x80\x56\x8a\x82\x0b\x0c\x05\xd8\x4b\
-\xf1\xc1\x42\x13\xcb\x12\xf1\x01\x4c\xf4\x18\x05\xaa\xe3\x3c\xc6\
-\x5f\x8f\xb5\x06\x93\x98\xe5\x1e\xa6\x30\xc1\x10\x6a\x43\x60\xc9\
-\x40\x87\x04\x0c\x18\x73\x24\x98\x55\xa1\xa2\x0c\xf4\xfa\xa4\x0f\
-\xcc\x9e\x73\x5e\xf2\x8b\x41\x55\xb3\x47\x32\x02\xc8\xa4\x5c\x85\
-\xdc\x1b\xa6\xef\x93\x85\x71\x89\xba\x2d\x1a\xd1\x84\x7c\x25\x03\
-\x88\xee\x27\xf8\x39\x12\xc6\x0c\x24\xed\x2e\xa4\xd0\x4a\x26\xef\
-\x59\x60\xed\x59\x44\x59\xa9\x5a\x7c\x2f\xf5\x07\x80\x4c\xc8\xa1\
-\x21\x5f\xd3\x26\xdd\x4b\xcf\x01\xb1\x0e\xc4\xa2\x36\xa8\x0d\x04\
-\xa8\x30\x6b\x98\x5b\x62\x50\x99\x5c\x1e\x1a\x07\xb0\x03\xea\xcc\
-\x03\x9f\x78\x0b\x59\x78\xa2\x02\x69\x4a\xf1\x07\x45\x07\x1d\x72\
-\x68\x52\x21\x4d\x5d\x84\x94\x79\xbe\x88\x66\xac\xdd\x03\x89\x8e\
-\xba\xcb\x0a\x79\x82\x00\x37\xf2\x9c\xc1\xcc\xdd\x81\x55\x89\x27\
-\x19\xf0\x8a\x7b\x43\xfa\x77\xa0\x33\x27\x26\x1f\xe6\x97\x0c\x07\
-\x10\x0d\x2c\xa8\x3d\x5e\x2a\x7d\x57\xe4\xed\xa2\x36\x48\x3c\x9a\
-\x71\xee\xec\x83\xac\xfa\x6c\x59\xf0\x36\x3c\x2a\xde\xc1\x83\x2f\
-\xb6\x16\x1c\xaa\x54\x13\xbe\x51\x3b\x0b\x17\xcc\x73\x5f\xb7\x3c\
-\xb8\xbc\x0b\xc9\x83\x8d\x2a\x8f\xd4\xc8\xba\x6f\x60\x62\x7d\x28\
-\xcc\xc1\x0c\xae\x5b\x71\x5b\x18\x6f\xfb\xa3\x27\x2a\x62\x19\xdc\
-\xc8\x82\x77\x90\xfd\x1b\x0d\xe8\x58\x89\x4a\x76\xb5\xc9\x56\x3f\
-\x1c\xbe\xb9\x2f\xb9\x73\xed\x22\x3b\xa5\x15\x78\xbf\x0d\xed\x11\
-\x28\xb5\x71\xef\x33\xdb\xf0\x61\xb5\x94\x44\x01\xc8\x3c\x94\x4c\
-\x5a\x59\x74\xfe\x1a\xc7\xcf\x62\xc6\x6c\x94\x33\x16\xa6\xc2\x81\
-\xba\xf0\x62\xae\xdc\x00\x4b\x85\xd2\xd7\x0e\x61\xf4\x49\xf1\x9e\
-\xd6\x38\x64\x57\x03\x46\x4b\xb8\x8c\xe9\x0e\x21\x31\x12\xd0\xc8\
-\xca\xe8\xc9\xe2\x8e\x1a\x60\x08\x8a\x61\x26\x02\xb0\xd6\xb5\xc5\
-\x53\x11\xc7\xf7\x89\x62\x0e\x08\x0a\x4f\x8c\x61\x5f\x55\x1c\x40\
-\xc4\xf6\xa1\xc8\x27\xd0\xd5\xd9\x89\x2d\x10\xe1\xc8\x32\x2e\x6b\
-\x8d\xb8\xf6\x92\xb6\x8c\x43\x96\x2f\xa2\x80\x8e\xb4\xed\x07\x46\
-\x31\xf2\x04\x08\x36\x3e\x75\xce\x0a\x35\xc6\xda\x36\x90\x12\xee\
-\x09\xd8\x83\x0d\x2d\x46\x1e\x38\x02\x30\xb9\x76\x23\x20\x58\xe7\
-\x71\x02\x54\x05\x1b\x43\x22\x76\xf4\x50\x60\x02\x67\x2e\xac\x0f\
-\x47\x1e\x95\x9c\xa6\x22\x24\xdf\x23\x92\xff\xbe\xef\xa9\x2c\xaa\
-\x29\xc0\x26\x0a\x97\x49\x20\x7e\xe0\x51\x98\x64\x9a\xf3\x6a\xdc\
-\xbc\xe2\x4f\x62\x54\x99\x34\xd8\x64\x09\x38\x84\xf2\xcb\xa0\xe7\
-\xe5\x18\x38\x81\x7b\xae\x6c\x5d\x1e\x0f\x05\xad\xda\x83\x41\x4b\
-\xc0\x6c\x13\x88\xf6\xcf\x27\x18\xfd\x00\xd9\xe5\xd8\x48\x2d\x3f\
-\x33\x2a\x48\x8f\x4c\x18\x1b\x19\xa6\xcd\xcc\x65\x12\x08\x62\x05\
-\x52\x73\x32\x00\x10\x61\x21\xe8\x6b\x38\xc5\x42\xa1\xa1\xe0\xa9\
-\xac\x1b\x97\xe5\xa1\xe4\x20\x06\xa7\x0e\xf1\xe2\xe6\xc6\x99\x67\
-\x26\xb5\xd3\xb0\x01\x22\xf6\x84\x08\x3c\x22\x68\x30\x66\x62\xcd\
-\x88\x87\x32\x9b\x2f\x33\x77\x28\xdc\xda\xe4\x7f\x40\x02\xce\x54\
-\x93\x79\xcb\xed\x0f\x4b\x16\xbe\xbb\x6a\x70\x78\xdb\x70\xc6\xc0\
-\x3b\xa7\x6f\xdd\x55\xb7\xc2\x79\x75\x99\x2b\x15\x11\x1d\x3d\x90\
-\x08\x00\x20\x10\x01\xe4\x75\x6a\x54\x08\x68\x0a\xf7\xc6\x64\xaf\
-\x3c\x44\xfa\xf3\x66\x84\xa4\x7c\xf4\x6e\x6c\x40\xe5\xb2\x4e\x96\
-\x2f\xed\x56\x97\x56\x64\xdc\xf2\xec\x0e\xf4\xe1\xee\xc9\x69\xdc\
-\xd6\xbc\x98\xd9\x7a\xce\xc4\xbe\x07\xa8\x39\xc9\x33\x73\x0f\xcb\
-\xd1\xc3\x6d\xc2\x91\x12\x18\x23\x7d\x31\x23\x2b\x30\xa2\x94\x65\
-\x69\xe6\x55\xc6\x83\x5c\x39\xc1\xcc\xaa\x2f\x42\x62\x00\x44\x31\
-\xc1\x14\x96\x92\x2a\xa6\x63\x39\x5c\xd5\x2b\x5a\x29\xcf\x05\x1c\
-\x7d\x31\x38\xa6\x22\xcc\xca\x04\x33\xcb\xfb\x0b\x10\x13\xfa\x1a\
-\x42\xcf\x64\x4b\xd9\x2b\xc3\x9c\xc2\xb2\x20\x02\x16\x0b\x60\x1d\
-\x6b\x16\xfb\xe4\xfe\xf0\x77\x08\x7f\x67\xf2\x40\x83\x23\x91\x00\
-\x19\x74\x05\x2c\x25\x83\x47\x6e\xc1\xf3\x80\x8d\x2c\x03\xa2\xab\
-\xfd\x11\x42\x82\x50\x78\x05\x48\x01\x0e\xad\x80\xe1\xc8\x24\x56\
-\x52\x0e\x3d\x00\x33\x08\x96\x2c\x60\x00\x83\x64\xfc\xc8\xf9\xfa\
-\x26\x64\x85\xe2\x97\xfa\xc3\x21\x79\xbc\xe8\x09\x46\xe5\xd5\x75\
-\x6c\x5b\xc6\xd1\xfd\xfa\x93\xc7\xb0\x89\xca\x66\xa8\x71\x42\x9c\
-\x6a\xdb\x30\x83\x48\x00\x35\x79\xc1\x78\x0d\x52\x05\x98\x60\x4c\
-\xa0\xc9\xd1\x2c\xa3\xf7\x9c\x70\xa1\x28\x68\x6a\xbc\x89\xf5\x71\
-\xb0\x90\xcb\xa4\xdf\x63\x22\x20\x83\x80\x44\x60\xfd\x6c\x33\x1e\
-\x88\xa5\xfb\x24\xb6\xb9\x14\x8f\x18\xd8\xe3\x44\x3c\x3a\x26\xe0\
-\x64\x40\x7a\x07\x08\x80\x8c\x9f\x73\x36\xd2\x8f\x22\x7a\x0a\x6b\
-\x62\x3f\x0f\x6d\xf4\x0a\xa2\xa2\xf9\x36\x60\x42\xa2\x53\x60\x2c\
-\x93\xfd\x11\xf9\x3d\x61\x1e\x10\xd9\x08\x80\x38\xe4\x85\x11\x47\
-\x9a\xe6\x08\x3a\x41\x82\x69\x56\x3b\x7d\x22\x32\x00\x51\x8f\x28\
-\xd5\x0b\x92\xaf\xc8\x1e\x28\x8d\x1c\x05\x6b\x66\x0a\x01\xc3\x59\
-\x35\x70\x14\x1e\x17\xd8\xff\xa2\xf7\xd6\x8f\x1f\xa3\xf7\x7a\x42\
-\x46\x66\x00\x0a\x64\x81\xca\x27\x1b\x83\x69\xb5\xde\xf0\x88\x33\
-\xfb\xc1\x0f\xad\x07\x3c\xf8\xf0\xc4\xa1\x3c\x84\x6c\x07\x4f\xe8\
-\x28\x6f\x3a\xda\x57\xb7\x0f\x57\x5c\x18\x2b\xef\x39\xa2\xf2\x41\
-\x51\x5d\x32\xea\xec\x89\x08\xc0\x31\x18\x63\xe1\x75\x84\x06\x5d\
-\x0d\x68\x66\x1c\x42\x0b\x0a\xb6\x8c\x4d\xcd\x5d\xd0\x28\xd9\x51\
-\x14\x9b\x19\x66\x1b\x4d\x6e\x35\xd6\x88\x06\x6f\xaa\x6a\x3f\x9e\
-\xd5\x7e\x6e\x95\xea\xb0\xa3\x85\xc5\x51\xb9\xc8\x6a\x43\xcb\xbe\
-\x0f\x74\xc9\x35\x7d\x78\xa4\x3e\xe2\x94\x65\x48\x99\x91\xc7\x39\
-\x69\x98\x29\x96\x28\xfe\x91\xa8\x97\xb1\xa8\xe4\x2a\x63\x45\xb2\
-\xeb\x0b\x65\x07\x53\x52\x20\x96\xf3\x4b\xd0\x2b\x29\xce\xba\x1c\
-\x40\x92\x1d\xd1\x3e\x4f\x8e\x7f\x08\xab\x93\xa0\x67\x94\xab\x03\
-\x90\x58\xa3\x5c\xc8\x8f\xa3\x11\x76\x75\x2b\x9c\x51\xdc\x44\x8b\
-\xaf\xa3\xac\xb6\x00\x64\x63\xb8\x11\x8a\xbe\x9a\xb8\xfd\xe1\x64\
-\xc3\x38\x28\x98\x81\x69\xcc\x37\x0e\x91\x7c\x64\x9b\xbb\x8f\xf5\
-\x15\xef\x49\xe4\xd3\x44\xab\x76\xc8\x18\x2f\x62\x1a\x41\x90\x00\
-\xee\x3a\x80\x16\xec\xe0\xe8\x88\x8d\xa1\x38\x1e\xc4\xa4\x8b\x82\
-\xaa\xe7\xc6\x30\x22\x7d\x10\xa7\x9b\xcc\x05\x09\xd6\x70\x44\x74\
-\xfa\x77\x08\xff\x81\xe0\x6c\x08\xf5\x8c\x48\xd1\x7d\xab\x36\x63\
-\x79\xc6\x86\xb9\x17\xa9\xb1\x19\x63\x91\x4b\x06\xf2\xde\x3a\xff\
-\x7b\x54\xce\x35\x25\x6f\xa0\xcd\x9e\xf3\xe8\xa3\x9a\x0b\xa1\x3f\
-\xd6\xb7\x86\x52\x56\x95\xa0\x68\x66\x0e\xf5\x98\xd2\x18\x31\xe6\
-\x9e\x1f\x65\x13\xc8\x18\xe5\x9c\xf2\x0d\x76\xf0\x4f\xcb\x78\xa0\
-\xe1\x3c\x4e\x0e\x38\x5b\x15\xea\x18\xae\x61\x02\x15\x43\xce\x2e\
-\x98\x6d\x50\x21\x3c\xd3\x81\x40\x8c\xef\x85\x85\x14\x3c\x34\xa1\
-\x86\x0e\x65\x54\xd0\xd2\x41\x83\xaa\x03\xc9\xe8\x68\x42\x98\x99\
-\x0f\x3b\x33\x5d\xf0\xd4\x18\x91\x9f\x27\xce\x7d\xf1\xbf\x52\x3e\
-\xdd\xd8\x6b\x9b\xf2\xdf\x24\xdb\x21\x33\x83\x09\x40\x97\x11\x2c\
-\xb1\x67\xf0\x4b\xf3\x87\x84\x35\xc0\xed\x35\x66\x14\xe6\x3e\xb9\
-\x69\xab\x04\xdd\x85\xe4\x13\x7c\xc0\xcd\xff\xd6\x18\xe9\x7d\x8b\
-\xee\xbf\xb1\x7e\x86\x73\x5e\x9a\xa3\x74\x08\x3c\xa1\x93\xac\xb7\
-\x15\xae\xed\xa8\x48\xec\x4c\x0c\x82\x46\xe7\xcf\x98\xf0\x9e\x0e\
-\x3f\x53\x9b\x26\xef\x1d\x8a\xb1\xb2\xdb\x4f\x7e\x03\xb7\x65\xc5\
-\x8d\x3d\x2b\xda\x22\x12\xfe\x6d\xf2\x44\xd4\x22\x82\x9b\x62\x52\
-\xb9\x85\x0a\xad\xca\xf5\x1d\xee\xa5\x39\x73\x01\x2e\xa3\xec\x95\
-\x0b\x85\xbf\x3f\xc0\xe5\xfb\x21\x5c\x35\x27\xb0\x66\x43\x10\x91\
-\x68\x2a\x29\x9d\x17\xa6\x87\xa8\x7f\x22\x59\x4e\x94\xa5\x34\xd3\
-\x5e\x82\x05\x9f\x08\xbc\x02\x8e\x91\x96\x37\xba\xa1\x05\x95\xf1\
-\xa8\xd5\x23\x8a\xae\xe4\xe9\x51\x73\x5b\x30\x22\xb9\xf0\x1f\xe3\
-\x14\x48\x42\xe7\x7c\x21\xf6\x8a\xac\x49\xd4\xc2\x21\x6c\x8a\xac\
-\x52\x32\x4d\xa8\x01\xb2\xf4\x28\xbc\x75\x9c\xd8\x2b\xac\x5e\x59\
-\x47\x83\xca\xea\x1c\x0a\x68\x72\x56\xef\x47\x25\xb1\xcf\x50\x73\
-\x04\x60\xe4\x33\x66\x84\xd2\x8f\x31\xdc\x28\x85\x69\xd9\x71\x4d\
-\x8e\xa2\x35\xbd\xec\x4d\x73\xf7\x49\xa1\x64\xc4\x04\x86\x92\x87\
-\x86\x78\xe9\x3e\xe3\xfd\x5c\x55\xa6\x07\x5d\x30\x33\x2a\xb9\x64\
-\x00\x03\x8f\x36\x41\xac\x78\x2f\x0b\x25\x46\x5e\x1c\x65\x30\xd3\
-\x27\xb5\x4a\x7f\x0f\xde\x41\x4a\xe3\x66\x38\xd5\x2c\x02\x5f\x97\
-\xc9\xca\x10\x2d\x51\x1b\x47\x81\x99\x2c\x97\x53\x11\x4a\x08\xc0\
-\x17\x5f\x44\xc0\x61\x5d\x91\x2b\xda\x19\x73\xb9\x98\xf5\x91\x8b\
-\x25\xdf\x02\xeb\x9a\x2c\xb1\x66\xa6\x5f\x4c\x61\x7d\x61\xac\x16\
-\xe3\x73\xab\x28\x7a\x68\x72\x6f\x5d\x3e\xaf\x54\x6e\x49\xcc\x39\
-\x31\x4a\x41\x31\xe8\x40\x8d\x24\x0a\x90\xeb\x5c\x81\x18\xe5\x5d\
-\xc4\x8c\x41\x2e\xf3\xc2\x46\x12\x36\x56\xfb\x04\xa3\x03\x61\x80\
-\xec\x0b\x92\x5a\x15\xb8\xaf\x3d\x9c\xb9\x01\xa0\x8c\x5f\xc6\xac\
-\x72\x0b\x6a\x05\xc3\x6a\xa2\x55\x86\xb3\x3e\x7c\x27\x6b\xe2\x7b\
-\xe2\x9d\xa9\x19\x92\x05\x96\xf0\xcd\xe3\x5a\x03\x6a\x0e\x8a\x10\
-\x3b\x6c\x6c\xa7\x68\x92\x79\x09\xcf\x00\x64\x7b\x6f\x2a\xf8\xac\
-\x6a\xdf\xa9\xfd\x04\x47\x4c\x67\x67\x4c\xa6\x7e\xc2\x1c\xb8\xf3\
-\x1e\x39\x65\xb3\x49\x2e\xaa\x9c\x30\x00\x75\xa2\x5e\xb4\xb8\xfc\
-\xe0\x35\x67\xbe\xf1\x36\x50\xb7\xaa\xe6\xe2\x73\x71\x67\x0f\xbf\
-\x4f\x56\x9b\x87\xb6\xc0\xa1\x36\x38\xe4\x6c\x5e\xac\x8a\xf2\x41\
-\x16\x4f\x9e\x29\x43\x32\xee\x3e\x2a\x33\x38\x32\x46\x30\xa7\xa4\
-\x76\xe9\x8d\x41\xd4\x1e\x81\x74\x4b\x2e\xce\xac\x18\x66\x86\x38\
-\x9b\xe0\x1c\x88\x98\x9d\x62\x6a\xbd\x91\xde\xff\xa4\xd0\x70\x12\
-\x5a\x75\xca\x69\x40\xe1\x39\x61\x0e\x4e\x13\x1d\x46\x17\xe9\x64\
-\x31\xb5\x19\x99\x9c\x17\x08\x02\xeb\x16\xfa\x82\x9b\x50\x24\x05\
-\x90\x79\x1a\x80\xb2\x32\x3b\x8a\x71\x0b\x75\x6f\x82\x26\x8b\xc0\
-\xe8\x93\xa4\x89\x7d\x18\x91\x49\xe3\xc8\x10\xf3\x4d\x62\xc1\xd4\
-\xd1\x7d\x72\x60\x23\x72\x2b\x04\xd0\x00\x20\x48\x3a\xb3\xcf\x65\
-\x40\x8a\x53\x81\x8b\x45\x27\x59\x3f\x57\x95\x2f\x13\x0b\xcb\xa8\
-\xe7\xcb\x2c\x2d\xee\x0c\x06\x13\x2b\x58\x0a\xd5\x4b\xfd\x89\xb3\
-\x63\x54\x17\x45\x03\x27\x54\xbc\x68\xec\x9f\x0f\x00\x85\x7a\x3b\
-\xc2\x93\x18\x0a\xcd\xba\x57\x1a\x33\x99\x7f\xa4\x9f\x51\xb8\x70\
-\x20\x1d\xe5\x78\x67\x0c\x79\x4b\x0e\x75\x88\xd2\xd8\x61\x78\xc6\
-\x73\x2d\x80\x75\x49\x40\x10\xd9\xdb\xe4\x2a\x90\xc5\x64\x19\x12\
-\xe8\x64\x56\x46\x01\x19\xe2\x18\xc6\x8d\x24\xa1\xc4\x04\x29\x05\
-\x2a\x7a\x63\x88\xb5\x25\xdc\x19\x6e\x84\xd1\x42\xb0\x27\x16\x5c\
-\x64\x39\x1b\xe2\x6c\x5e\x0d\x06\xba\x6a\x10\x45\xf7\xfc\xfa\x45\
-\x37\x46\x8e\x8b\x20\xfd\x07\x56\x18\x33\xb0\x50\xb4\xf6\x68\x15\
-\xe2\x0c\xe0\xc0\x07\xec\xf1\x58\x77\x56\x7d\x2f\x6b\x3e\x56\x44\
-\x97\xe0\xd6\xb3\xfd\x1c\x7d\xfb\xd4\x8b\x9c\xa1\xa3\xe8\xa8\x8f\
-\xcc\xc9\x22\xbd\x34\x80\x91\x1c\x00\x22\x65\xb3\xd1\x4c\x67\x90\
-\xd7\x7e\xc2\xac\x70\xee\x7e\xe9\x17\x20\xc9\x66\xf8\xa8\x29\x99\
-\x35\x05\xaa\x8c\xc3\x1f\xf1\xc7\xea\x8c\xcb\xed\x4b\x94\xf1\xbc\
-\xa7\x7c\x97\xbd\x71\x7a\x89\xde\x23\x6f\xb1\xea\x89\xe0\xed\xc7\
-\x75\xf5\x6e\xf6\xde\x6e\xe2\x3c\xd1\xe9\x3a\x20\x53\xbd\xae\x71\
-\x5c\x90\x3c\x29\xbc\xa2\x08\xa0\x4f\xca\xc6\x95\xcf\x5f\x16\x2b\
-\x1c\x9b\xb6\xcb\x7d\x53\x80\x08\x4a\xd5\x2d\x04\xaf\x95\xac\x44\
-\xef\xc3\xcf\x30\x68\xc3\x9c\x29\xda\xb2\xb0\x68\xc8\x2d\x08\xba\
-\x68\x21\x3f\x80\x33\xba\x61\x0a\xe0\x87\xc0\x91\x08\x04\x05\x4d\
-\x90\x1a\x70\xcc\x0f\xa0\xd1\x5a\x92\x85\x25\x55\x5f\x65\xd1\x48\
-\x60\xaf\xeb\x11\x10\x20\x20\x15\xf6\x03\x12\x0a\xad\x28\x44\xa9\
-\x0a\x1e\x8f\x78\xbb\xb3\x2a\xec\x7e\x0f\x25\xf6\x54\x0d\x84\x82\
-\x6e\x21\xe5\x69\x24\xc5\x19\x20\x2f\x90\x0a\x92\x06\x5a\x4c\x88\
-\x94\x57\x04\xca\xeb\xc6\xe4\xfa\x14\x68\xc3\xd3\xb8\xa6\x7b\xb1\
-\x07\x59\xda\x54\x08\x85\x5c\x0d\x4e\xca\xb1\x77\xe1\xb9\xe7\xe3\
-\x18\xd4\x0c\x58\xa0\x50\xf4\x0d\x1c\xf0\xa0\xd0\xa7\x08\xd0\xd4\
-\x83\xc9\x14\xf4\x34\x2f\x13\x09\x07\xcb\x87\x20\xe6\x56\x9a\x47\
-\xc8\xe0\x01\x4f\x00\x41\xa4\xea\xbe\xb0\xf2\x34\xa1\x0a\xb5\x66\
-\xf1\x6c\x30\xb0\x81\x01\x01\x10\xba\xdc\x20\x4e\x01\x84\xe9\xf9\
-\x13\x10\x5b\xf7\x39\x9f\x1b\x56\xb6\x03\x8c\x63\xab\xd2\x5c\x2c\
-\x80\x91\xc9\x02\x41\x2c\x00\x65\x85\xf2\x8d\xa0\xc7\x99\x73\xc3\
-\x85\x2c\xae\x2a\x78\x1a\xe3\xbf\x59\x3f\x77\x9c\xd0\x5e\xe6\x42\
-\xc7\x70\xfb\x99\xb7\x19\x38\xf0\x81\xe7\x01\x2e\xb7\xf5\x11\x98\
-\x98\xf1\x4e\xc7\x25\x6e\x69\xc7\x19\x4a\xd5\x9a\x87\x80\x37\x78\
-\x76\x9b\x2e\xac\xb3\x69\x30\x67\x2c\xf6\x75\xb7\x8c\x2c\xe5\xa0\
-\x72\xe9\x51\x13\xac\x1c\x2c\xfd\xa1\x83\x51\xae\xc0\x26\xea\x01\
-\x08\x4b\x9a\x88\xef\x07\x45\x0c\x80\x19\x33\x3c\x02\xc2\xfd\x74\
-\xd3\x2d\x34\xc6\xe7\xda\x46\xca\xa1\x70\x0c\x05\x9a\xe6\x13\x5b\
-\x52\xb5\xde\x5b\x8c\xda\x76\xb3\xd1\x61\x96\x3e\x9c\x3e\xd1\x71\
-\xac\xb8\x20\xa6\xc0\xda\xe4\x45\x49\xc9\xde\xcc\x42\xd1\x8f\x4a\
-\xba\x57\x16\x59\x52\xef\xea\x87\xcf\x3c\xae\x2b\x11\x43\x4b\x0a\
-\xaf\x9a\x0d\x07\x11\x46\x55\xd3\x65\x95\x5a\x0c\x96\xef\xa0\x38\
-\xa2\xf7\xca\x48\x42\x92\x58\xdb\xc6\xe5\xbb\xa0\x02\x55\x99\x82\
-\x27\x94\x79\x75\x3f\xe1\x99\x20\x97\x9d\xe3\xd9\xad\x50\x81\x91\
-\x98\xec\x4c\xa9\x56\x0c\x14\xab\xba\x43\x21\xa7\x48\xd7\x63\x61\
-\xf2\xec\x5e\x3e\x17\x49\x37\x87\x13\xab\x95\xa8\xb3\xc2\xa8\xbd\
-\x41\xfa\x3e\x38\x02\x91\x0e\x3c\x21\x90\x21\x97\xdb\x41\x59\x92\
-\xbd\xe8\x0f\x28\x00\xb0\x5c\x57\x2b\xf6\x84\x40\x79\xb9\x80\xd8\
-\x03\x0d\x11\x5e\x15\xf2\x45\x22\xcd\x37\x8f\xcc\x6e\xa8\x42\xa4\
-\x25\xb0\x48\xfd\x47\xaf\xd6\x1b\x1f\xa2\x87\x1e\x74\x82\x1c\xb3\
-\x42\xe5\xf9\xc9\xda\x4c\x93\x4a\x41\xc8\x8b\xa2\xe8\x41\xd2\xb8\
-\x28\xd0\xe8\x09\xd0\xa3\x26\x33\x4e\x86\x7f\x88\x5a\xb8\xbe\x3f\
-\x0c\x06\x4c\xf4\x04\x71\xc8\x0e\x52\x1e\x3a\x89\xeb\xcb\x85\x4c\
-\x47\x06\xcd\xc2\xa1\x9b\x8c\x0f\x8e\xf8\x00\x4d\xb6\x5e\xa3\x0d\
-\x31\xbd\x21\x43\x4a\xcb\x2a\x25\x47\x47\x58\xa2\x74\xf7\xcc\x87\
-\x4c\x62\x7f\x99\xae\xe1\x54\x04\x59\x5b\xf6\xd9\xa5\x44\xeb\x23\
-\xce\xb3\x23\x0f\x61\xac\x3f\x7a\x1f\x29\x24\xfe\xfc\x33\x6f\xfd\
-\x47\xf1\x16\xfa\xcb\xc6\xe2\x44\x67\xb0\xb5\x1e\x15\xfe\x26\xed\
-\x0c\xa1\x98\x26\xf8\x97\xf1\x04\x34\x31\xef\x0e\xf1\xd0\x7a\x4b\
-\x1b\x00\x0d\xd6\x3d\x9c\xcc\x19\x92\x27\xe7\xe5\x3c\xfe\xd2\x12\
-\x39\x5d\x89\x7a\x89\xba\x79\x05\x5d\xd7\xce\x55\x75\x8a\xb7\x59\
-\xe6\x28\xe0\x31\xbb\x06\x1f\xb4\x96\x6a\xbf\xfc\x48\x8e\x90\x87\
-\x77\xa9\xf3\xbd\x80\x1e\x2b\xc2\xdf\xe5\xc5\x35\xe2\x33\x29\x2a\
-\xbb\x51\xb1\x01\x14\x09\xca\x49\x19\xc2\xcc\x62\xce\x2a\xdc\x45\
-\xc7\xf4\xcb\x82\x93\xbc\x08\xce\x78\xf5\x6e\x85\xb9\x02\xe9\xc3\
-\x65\xc0\x57\x3d\x76\x18\xc7\x67\xf2\x23\xe9\x82\x87\x42\xd9\xe7\
-\x3c\xf6\x92\x75\xd8\x94\xfc\xa4\xbc\x44\x2c\x77\x23\x8a\x61\x2a\
-\xc5\x9c\xd3\x93\x8a\x74\xc5\x05\x12\x16\xe9\xc5\x72\x16\xec\x40\
-\x3c\x4c\x31\x34\x20\x29\xaf\x9c\xbc\x28\xf1\xf1\xa3\xc8\x95\x4a\
-\x85\x42\x13\x72\x88\x08\x22\x45\x19\x22\x43\x20\xee\x32\x3e\x4f\
-\x28\x7c\x9e\x7c\xc8\x93\xee\x4f\xa4\xdd\xcb\x68\xae\xb3\x65\x20\
-\x00\x6e\x20\x35\x89\x60\x10\x48\x8f\x9b\xa4\x19\x8e\x1a\xb4\x08\
-\x2b\x43\x54\x94\xde\x49\xc9\x16\xc0\x31\x9f\x41\x08\x1e\x04\x80\
-\xca\xe1\x08\x79\x36\x32\xfc\xce\x3d\x23\x07\x6a\x46\xc6\x24\x85\
-\xa8\x39\x81\x93\xf0\x21\x03\xbe\xba\x76\xca\xd5\x71\x73\x32\xcc\
-\x37\x0f\xa6\xb9\xbe\x5a\xb6\x04\xc9\x18\x61\x9a\x24\x8d\x00\x51\
-\xaf\x88\xd4\xf8\xe5\x39\x4c\xa5\x15\x84\x58\x02\xd2\x1c\x81\x92\
-\xaf\xdc\x23\xa8\xc9\xc7\x49\xbe\x32\x04\x55\x31\x9e\x4e\xf8\xf6\
-\x93\x5d\x80\x05\x48\x17\x21\x9a\x34\x5f\x47\x07\x57\xc7\x0d\xe1\
-\xa1\x2a\x37\x1f\x7c\x48\xad\xbe\x1e\xd6\x6b\x72\xb7\x3a\x2b\xdf\
-\x27\x56\xb8\x49\x5d\xa6\xe2\xac\xe6\xb3\xda\xbc\x41\x4f\x38\x42\
-\xb5\x58\xca\x33\x62\xb1\xe6\x75\xe8\xba\xd0\xf7\x41\x25\xd7\x8c\
-\x6a\x91\x49\xea\xe6\xad\xd4\x73\xa5\x35\xdf\xef\x9a\x90\xbc\x6e\
-\x14\x15\xdb\x89\xda\xf9\x64\x15\xac\xda\x06\xf0\xba\x29\xba\xf3\
-\x49\xf3\x89\x6b\xf3\x16\x49\x72\xfb\xbf\xcc\xb3\x2a\xf3\x59\xc5\
-\x35\x71\x4f\x13\x57\x20\x2e\xdc\xb3\x0e\x4e\x78\x00\x3c\xf9\x66\
-\x79\x03\xa8\x89\x3c\xcb\x83\xa6\x0a\xe4\x65\xd1\xa2\xca\xa3\x4c\
-\xfb\xa4\x54\x23\x3a\x45\xc3\x18\xcc\xd8\x86\xa4\xc2\x2d\x8c\x1b\
-\x00\xaa\xa2\x39\xc7\x64\x72\x8e\x2f\x9d\x83\xc1\x0b\xca\x47\xa9\
-\x48\x04\x2b\xdd\x2a\x85\x8c\xa5\xcf\x22\xfa\x58\x7c\x03\xce\x3a\
-\x8f\x32\x37\x45\x28\xb8\x18\x34\x6c\x8c\xd5\xda\x55\x4d\x10\x99\
-\x6f\x22\x80\x5a\x52\x96\xd1\x85\x04\x45\xad\x3c\x53\xe2\x39\x07\
-\x00\x20\xf2\x08\x32\x6a\x5e\x95\xcf\xc1\xc2\x47\x93\xd4\x59\x59\
-\x77\x5e\x55\x8e\x17\xe0\x29\xe2\x33\xbf\xff\x86\x70\x9e\x08\xc1\
-\xf2\xfe\x40\xf2\x82\xb0\x57\xb8\xc9\xf7\x2b\x4d\x45\xe9\xcd\x60\
-\x95\xe7\x03\x71\x1e\x11\x28\x0a\xbd\x11\xa0\x13\x39\x48\x72\xde\
-\x85\x3c\x24\x91\x51\xc5\x19\x29\x80\xcb\x2d\x0a\x85\x4b\x33\xb0\
-\x09\x33\xc5\x24\xd1\x87\x6c\x61\x0a\x3b\x94\xe3\xac\xcb\x77\x06\
-\x30\x8a\xea\x3e\xaa\x8a\x4e\xa0\x0a\x8f\x1e\x41\x7f\x1b\x93\x6a\
-\xff\xa0\xf1\x9f\x33\xec\x0b\x6b\x82\x07\xd8\x3c\x5e\xb6\xac\x49\
-\x45\x99\x73\xaf\x66\x16\x6e\x1a\xe6\x9b\x58\x1e\xd1\x9b\x22\x0d\
-\x10\xea\x5e\x0b\xc5\x03\xb8\xb4\x66\x19\x0c\x10\x58\x2c\xd5\xde\
-\xc9\x07\x58\x18\x37\x84\x29\xb7\x40\x7e\xa8\x40\x56\x9c\xaf\x12\
-\x90\xfb\x7b\xbb\x9c\x2e\x2e\xd6\xd1\xa9\xde\xa7\x79\xe6\x10\x56\
-\x89\x4a\x78\xec\xf6\x7e\x36\x8a\xe0\x69\x03\xe7\xda\xe4\xef\xd3\
-\x01\xc9\x99\xe7\xe8\x4e\x6a\xb1\xe2\xd7\xf3\x33\xf0\xe4\x64\x61\
-\xde\x69\x35\xae\xf9\x0a\x17\xfa\xb5\x06\xed\x48\x77\x84\x4a\xfa\
-\x47\x23\x6a\xd0\x18\x55\xcc\x3b\x16\xe4\x9e\x52\x3c\x0e\x18\xc8\
-\xbe\xd4\xde\xc3\x28\xb8\x31\xef\x6c\x56\xff\x42\x55\x2f\x07\x39\
-\x44\x07\x2e\xa6\x09\xdf\xdd\x19\x81\x94\x7c\xb0\x39\xe6\x00\x6a\
-\x15\xae\x88\x97\xe3\xca\x36\xe3\xac\xcd\x70\xdf\x33\xe3\x8d\x4f\
-\x80\x97\x4c\x0b\x3b\x27\xd2\xe9\x56\x26\xdc\x7b\xe6\xd5\x07\xe5\
-\xf2\xec\x5a\xd5\xa1\x47\x79\x0c\x7b\x50\x6c\xdc\xfb\x21\x0c\x2d\
-\x54\x74\x0f\xb5\x22\x18\x88\x10\x8c\x99\xda\x52\x65\x98\x19\x89\
-\x04\x79\x52\xe1\x67\xdb\x34\x92\x0c\xd4\xa8\xfc\x0a\xcf\x36\x86\
-\x5e\xa1\x44\x76\x89\x8b\x28\x62\x81\x5d\xcc\x9c\xd3\x31\x51\x6b\
-\x96\x9c\xd5\xc7\x01\xa5\xfc\xb3\x66\xc4\x0a\xe9\x3a\x88\x1e\x40\
-\x28\xbf\x8e\x52\xd8\xb4\x45\x7d\x5a\xb1\x54\x6a\x7d\x76\x12\xb1\
-\x04\x35\x0a\xf0\x72\xca\x21\x52\x78\xd8\x79\x40\x5c\xb6\x4f\xee\
-\x61\xd2\x40\x83\xc5\x3e\x5e\xae\x7e\x96\x6a\xfd\xe4\xc9\x9d\xcc\
-\xce\x73\x80\x68\x12\x20\x03\x0d\x34\xf2\x30\x3a\xe4\x34\x11\x59\
-\x85\x9c\x09\x05\x57\xad\x1d\xef\x31\xe0\xf1\xfc\x65\x1e\x83\x26\
-\xbd\xe7\x85\x90\xc4\x7c\xfe\x94\x00\x03\x47\x72\x86\x18\x7e\x09\
-\x92\x0c\x20\x03\x41\xe8\x92\xa9\x5c\xf8\x85\xf8\x1d\xdc\xfc\x72\
-\xce\x42\x51\xe7\x46\x3d\x83\x82\x5d\x86\x39\x03\xc1\x85\xfe\x04\
-\x4a\x6e\xce\xbe\xb7\xe1\x7c\x93\x75\x61\x82\xc7\x0a\x90\xc4\xb4\
-\x2b\x58\x5d\xa1\xe4\xf4\x95\xe7\xfc\x9c\x7f\x26\x9b\xeb\x9c\x58\
-\xdd\x5c\x77\x53\x2e\x18\xa9\x50\x4a\xce\x67\xe2\xc2\x0e\x5e\xd6\
-\x6e\x96\x3f\xf1\xe0\x60\x66\xe1\x9e\x53\x67\x28\xbe\x4f\x68\x86\
-\x77\xfc\x7d\x67\x28\x09\xd7\xea\x5a\x67\xf7\xff\x48\x6f\x0d\xef\
-\x29\xc0\x8a\xda\x70\x23\x88\x01\x54\x42\x60\xa0\x73\xce\x29\x9b\
-\xb5\xf5\xf3\xd0\x7c\x9a\xfe\xd8\x95\x2b\x2c\x46\xaa\x63\x62\x13\
-\x54\xf4\x97\x98\x85\xf6\xe3\x49\x0b\x6b\x42\x7b\xac\xaa\x40\x74\
-\xd0\x6c\x9f\x99\x6e\x93\x38\x6b\x12\xe8\x70\xd6\x23\x5c\xb0\xd8\
-\xf3\x21\x8b\x6f\x1e\x0f\xca\x94\xe1\x63\xa7\xd4\xd9\x87\x06\x6e\
-\x7f\xfa\xfb\x67\xe5\x46\x7a\xc8\x29\x4a\x48\xae\xe8\xe7\xf8\xd0\
-\x5e\x61\x8d\xe4\xc4\x2c\xe4\x0a\xb4\x53\xbc\xa2\x03\x32\x89\x4e\
-\x35\xaf\x45\x23\x15\x25\x8e\xf9\x10\x24\xd8\xbf\xb8\xca\x6e\x98\
-\x94\xca\xa9\x2d\x31\xe3\x5a\xd5\x25\x36\x1c\x70\x31\xc9\x65\x8e\
-\xec\xf4\x7b\x07\x66\xb4\x92\xad\xa7\x97\x42\x77\x19\x98\x61\xa9\
-\xff\xaa\xfd\x6c\xbc\x16\x59\xbf\x27\x94\xe4\xdc\xe3\xa2\x73\x8e\
-\x34\x60\x41\x59\x17\x40\x07\xc4\x69\xe0\xa5\xee\xe3\xc0\x0c\x8e\
-\x42\xe8\xc6\xe0\x2c\xc2\xe0\x08\xd0\x38\xf3\x1c\x80\x02\x33\x2a\
-\x24\xce\xd7\x92\x31\x40\x71\xdf\xd7\xb9\x29\xd9\xb3\x16\xd7\x2e\
-\x67\x08\x66\xc4\x08\x1e\x9c\x39\x10\xed\xc2\xb6\xa3\x97\x4b\xcc\
-\x31\xf5\x3d\xef\x99\xd1\xcf\x66\xc4\xef\x2c\xc6\x23\xb5\x87\x51\
-\x33\x9e\x8d\xc6\x08\x34\x73\x46\xc8\x95\x71\xa0\xc6\xcf\xb9\xf0\
-\x59\x82\x08\x74\xc0\xfa\x09\x43\x28\x80\x6b\x66\xb1\xcc\xc1\x4c\
-\xb1\x3f\xf9\x3a\x9e\xf0\x76\x72\xad\xe6\x23\xc0\x2a\x12\x90\x75\
-\x54\xda\x4c\x19\xab\x59\xf1\xc8\xd6\xc5\x2d\xf3\xb3\x3d\x23\xa4\
-\x1e\xcf\x03\xe9\xb5\x11\xc0\x66\xe4\x75\xe4\x91\x6e\x74\x1b\xc5\
-\x1a\x77\x1f\x39\x7a\xe7\x7d\xc4\x3a\x2f\x5b\xad\xf7\x37\x6c\x0b\
-\x97\xc6\xaf\x52\x0d\xe4\xbd\x7d\xbd\x85\xe0\xc2\x38\x1c\x48\x66\
-\x51\xa3\x73\x8c\xf4\x08\xcc\x18\x89\x23\x93\x99\x11\xa9\x25\xe0\
-\x8d\x87\x92\x0d\x55\xb3\x38\xae\x6b\x09\xce\x9a\x1d\xfa\x5b\xa9\
-\x70\xb2\x50\x1d\x8c\x94\x71\xe9\x8e\xce\x1a\x7c\xc0\x13\xc1\xcd\
-\x6b\x88\x77\x2e\xf8\xf5\x66\x85\xb2\x31\x01\x17\x36\xd5\xdb\xd2\
-\x12\x28\x1d\x40\x85\x1d\xb0\x56\xfe\x1e\x61\xd3\xad\x8c\x81\xbd\
-\xf5\x39\x72\xf3\x3d\x14\x8f\x6d\x35\x7b\xda\x60\x44\xf4\xb1\xf4\
-\x28\xd8\x88\xe6\x6e\xc8\x50\x26\x06\xa0\x49\x2a\xd9\x2a\x23\xc2\
-\x42\x25\x33\x57\x57\x03\xbc\x72\xe9\x5f\xe1\x3b\x46\x80\x10\x84\
-\x51\x60\x8e\x66\x60\x43\x05\xec\x72\x2f\x48\x38\x61\xcb\xc4\x1d\
-\xe3\xf8\x3d\x16\x8a\x39\x33\x67\x9e\x83\x3c\xcc\x88\xcb\x13\x77\
-\x52\x21\x95\x4a\xa2\x24\x01\x48\x59\x17\x98\x01\x55\x99\xe3\xe2\
-\xf4\x6a\x2c\x2b\x8c\xd2\x50\x92\x51\x09\x4b\xef\x45\x02\x4d\xc2\
-\xbb\x92\x31\xdb\x45\x06\xb0\xd9\x95\x98\x80\x86\x4c\x8a\x0f\x78\
-\x8e\x18\x44\xb9\x55\xad\xfc\xc7\xf0\x3a\x46\x91\xd2\xc3\x93\x1a\
-\x03\x67\x9e\xa3\x12\x7d\xa3\xca\x58\x11\x44\x1a\xea\xe5\xe7\x18\
-\x9a\xcc\x9a\x60\x3c\xa8\x11\xc6\xa9\xc0\x43\xc7\xac\x79\xd2\x53\
-\x5a\x93\xec\x8f\xc8\x81\x3a\x74\xef\xd2\x73\x2c\x00\x50\x37\x59\
-\xc8\x11\x38\xe4\x60\x26\xe7\x18\x89\x03\x23\x88\x2e\xb8\xce\x7b\
-\x9f\xba\xc8\x0a\xd0\x40\x4e\x27\x9e\x31\x81\x70\x9d\x6b\x77\xd5\
-\x66\x38\x1b\xf9\x7e\x00\xe5\x59\x4d\x11\x67\x7e\xa4\xad\x7f\x25\
-\xd8\x5b\xdb\x8e\x35\x64\x9d\x20\x0d\x47\x5b\x1e\x03\xdf\xa4\xbb\
-\xfb\x6f\x55\x0a\xa9\xc4\x6a\x0b\xf3\xc9\xca\x0a\x8e\x35\xf8\x10\
-\x5e\x2b\x8b\x6b\x06\xc6\x33\xe9\xc5\x01\x59\x37\x6a\x99\xba\x79\
-\xa1\xa6\xf5\x1c\xa0\x39\x00\x3c\x60\xc9\x4a\xa3\x13\x03\x15\x49\
-\x40\xcd\x42\xdc\xb8\x6b\xe3\xce\x4d\x80\x37\xcd\x50\x3e\x61\x0e\
-\xe5\x10\x01\x17\x63\x45\xf9\x56\x26\x08\x2e\x27\x89\x25\xaa\xac\
-\x03\x17\xdd\x4a\x57\xef\xde\xe7\x7f\xd6\x66\x70\x4b\x30\x83\x3b\
-\x1b\xae\x42\x90\x84\x87\x25\xd5\x80\x90\x8c\x59\x5a\xf9\x9d\xf2\
-\xd0\x94\xae\xcb\x05\xce\x6d\xc4\x12\xc4\xe7\x75\xf5\x19\x32\xe5\
-\x32\x3a\x86\x8d\xe0\xd8\x07\x80\x94\x57\xcd\x31\x87\x46\x65\x21\
-\x44\x4d\x38\x29\x95\x3c\x93\xcf\x84\x0b\x34\xeb\x90\x85\x89\xc5\
-\x1c\x8d\xb8\xbe\x79\x42\x81\x93\x37\xa9\x0c\x1a\x48\x34\x67\x02\
-\xfc\x69\xa2\x03\xa5\xc2\x33\xaf\x38\x35\x65\x68\x98\x7c\xbe\x9e\
-\x6d\x81\x0d\xe4\x6c\x77\x23\x9a\x6e\x49\xd1\x58\x78\xde\xb9\xd9\
-\x46\x96\xd6\xc4\x44\x61\x36\xde\xf3\x58\x39\x5c\x46\xcc\x7b\xfa\
-\xa2\xac\xd4\x79\x09\xee\x5c\x0d\x1b\x14\x9e\x34\x69\xcc\xe1\x0c\
-\x7e\x64\x5e\x39\x39\xf7\x40\xce\x35\x16\x3a\x81\xbe\x28\x67\xa6\
-\x64\x16\xe1\x83\x32\x34\x30\x10\x22\x9c\xb1\xa9\xa7\xfa\x47\x59\
-\x58\x62\xc9\x45\x2c\x59\x4b\x39\x83\x7d\x95\xd3\x67\xb4\x2f\xf0\
-\xf8\x19\x96\xbe\x83\xba\xd8\xd5\xe6\xfd\x71\xb5\x97\x9e\x4f\x3a\
-\x1f\x6a\x74\x1d\x5c\xd7\x96\x1b\x73\xd0\x14\xf5\xc1\xa5\xcf\xae\
-\x06\x70\x7c\xc8\x47\x60\xc4\x89\x52\x0c\x4f\xad\xbf\xea\x31\xe4\
-\x0b\x99\x2e\x85\xa8\xb7\xfc\xd2\xf8\xce\x84\xd5\x2d\x99\x89\xd6\
-\xb4\x39\xaf\x6d\xad\x22\xb1\xa4\xce\xaf\x2a\x6f\xa2\x0a\x3b\xc3\
-\xad\x7b\x56\xc5\xd7\xfa\xea\x6f\x6f\x6d\x43\x5e\x98\x42\x15\x5a\
-\xd3\x9c\xf2\x78\x90\x4a\x86\x6b\x16\x05\xae\x58\x08\x0b\x7f\xe0\
-\xb3\xda\x39\xb6\x8f\x9f\xb6\xc9\xf2\xe6\xf6\xb2\x06\x37\xca\x84\
-\x82\x80\x0b\x8b\x6e\xb2\x0d\x5c\x0a\xa7\xe2\xca\xbe\x60\xde\x8c\
-\xaa\x7e\x3d\x12\x98\xc1\x42\x9f\xb4\x12\x85\x0b\x27\xc3\x5a\x53\
-\xa2\x04\x32\x25\xd0\xa1\xc3\x8b\x64\x62\xfb\x1c\x98\x29\x01\x1b\
-\xa9\xd4\xe6\xde\x19\x44\x50\x5e\x85\x69\xc6\x07\x80\x69\xa2\x80\
-\x69\x70\xc3\x00\x2a\x8d\x84\x83\x77\x66\xce\x1b\xc1\x73\x21\x3d\
-\x5b\xb2\x37\x65\xea\x7d\x18\x87\xdc\xd0\xc3\xaa\x42\xfc\xd4\x2d\
-\xe6\xf3\xdb\xd2\x0e\xf5\xd9\x67\x9f\xc5\xbf\xbc\x7a\xf5\x35\x8c\
-\xbc\x2c\xbc\x5e\x01\xe2\x11\xcc\x4c\x83\xfa\xe9\x67\x1f\xc7\x77\
-\xbf\xfc\xf2\xab\x6c\x8e\x71\x51\xe1\xf9\xf0\xa3\xf4\x9d\x5f\xff\
-\xea\x2b\xd5\x7e\x1e\x51\x4b\xeb\xf1\x13\x59\xf1\x0a\x38\x62\xae\
-\x35\xaf\x3c\x54\x59\xd4\x93\x09\x53\x21\x84\xe0\x49\x9c\xc4\x28\
-\x58\xce\xc2\x5c\x43\x5d\xad\x3e\xb1\xff\x64\x54\xdc\x00\x8a\x90\
-\x21\x37\x4e\xad\x3e\x65\x16\xb5\xc4\x79\x52\x00\xcc\x3d\x23\xb2\
-\xb8\xae\xf0\x48\x61\xa9\xf2\x5e\xc9\xf4\x50\x11\xb0\xc0\xd2\x23\
-\x43\x59\x22\x88\x02\x48\x58\x34\x1f\x4c\xf7\x73\xa6\x2e\xdd\xa8\
-\xee\x1d\x1c\xc3\x6c\x75\xd6\x05\x76\x90\xcc\xdc\x02\xd8\xe0\x46\
-\x34\x85\x37\x18\x1a\xce\xc0\x0b\x17\x8c\x45\xf9\x7b\xcc\x87\x3d\
-\xf5\x95\x80\x06\x23\x81\x49\x6c\x41\x0e\x0a\x72\x70\x3f\xf1\xa0\
-\xd5\x63\x38\x34\xd6\x5f\xb2\x9b\x29\xad\x5e\x17\xbb\x55\xe4\x20\
-\xfb\x1f\x2e\xae\x07\x34\x2b\x3b\x37\x0a\x25\x03\xe1\x5e\xc2\x71\
-\x9d\x4c\x1c\xd5\x45\x1b\x6f\x3e\xa7\x98\x0f\xea\xdc\xcd\x6b\x82\
-\xb8\xb8\xac\xdb\xcf\x0e\xdc\x7c\x84\xcc\x46\xbf\xed\x61\xfb\x1f\
-\x2b\x3d\x07\xb3\xc5\xb4\xdc\x34\xd6\x87\x10\xc8\xd8\x7b\x5c\xed\
-\xe5\xe2\xad\x9d\x42\x1e\x59\x61\xf2\x0a\xf6\x87\x5b\xb0\x56\x60\
-\xcd\x3c\x92\x09\x6b\x27\xe6\x5c\x41\xdb\x8d\xdb\x2e\xb3\x06\x29\
-\x53\x60\x46\x7b\x53\x74\x4f\x70\x21\x9e\x3e\x07\x2d\x3c\x4b\xe7\
-\xc2\x02\xd4\x68\x46\xae\xd1\xe9\x54\x11\xdb\xc1\x90\xf0\x08\x83\
-\xcf\x6b\xf0\xc9\x8d\xec\x73\x19\x24\xa8\x51\x6a\x73\xe9\xb6\x85\
-\x43\x32\x85\x4e\xed\x98\x37\x28\xbc\x0f\x55\xaa\xc9\x62\xb1\x97\
-\xe9\xcf\x2d\xcc\xa5\xe5\xce\xf0\x86\x1d\xa6\x48\x9b\x37\x7b\x33\
-\xac\xbe\xee\xd4\x83\xe2\x09\xfb\x29\x6e\x5a\x30\x5a\xb7\xe7\x51\
-\x35\xd9\x54\xb7\x55\x28\xda\x9e\xa2\x94\x31\x7c\x86\x67\x76\x3a\
-\x9c\x9c\xe3\xac\x4d\x35\x1b\x2d\x73\xe3\xdd\x1a\xd5\x3e\xc0\x19\
-\x7d\x38\xab\x1a\x4f\x23\x3c\x88\x72\x03\x63\x85\x11\x6a\xf6\x7b\
-\x2e\x00\x20\x66\x9e\x5c\xde\x28\x4d\x3b\x12\x64\xde\x4d\x63\x58\
-\x77\xc1\x35\xb5\x42\xb8\x66\x11\x3c\x48\x0e\x08\xee\x1c\xc4\xbd\
-\x45\x49\x79\xe1\x7c\x4b\xf3\x2a\x9b\x67\xac\x8d\x2c\x3c\xb6\x22\
-\x2c\x6a\x24\x55\xa1\x67\x8b\xa8\x12\xf5\xda\x89\xf5\xc9\xd2\x4f\
-\x08\xf4\xf4\xc1\x28\x28\x6b\x3c\x71\x01\xd8\x54\x3c\x86\xb5\x21\
-\x79\x8a\xfa\x1e\x40\xd3\x33\x03\x66\x65\x5b\x74\xde\x0c\xc6\x7e\
-\x6d\x28\xae\x89\xcb\x83\xdd\x9f\x3f\xc9\xb1\xa0\xa8\xcb\xd8\x0f\
-\x89\x4a\x51\x0f\xd0\xa4\x39\xe5\x0e\x2b\x78\x29\xb9\xbe\xe4\xb2\
-\x9c\x41\xf6\xcb\x80\x09\x47\x06\xa4\xa2\x3e\x70\x28\xb0\xe1\xf9\
-\x7b\xcc\x58\x36\xb1\x00\x78\x30\xb3\xd6\x4a\x85\xad\x3c\x33\x79\
-\x79\x47\xda\x04\x2e\x50\xb3\x09\xa9\x83\x05\x4f\x37\x5b\x95\x36\
-\xc3\xd2\x96\x38\x15\xd5\x8f\x2b\xa1\xcb\x0e\xc3\xec\x24\x98\x09\
-\x49\xfc\x25\x6f\x8a\x9a\x1e\x90\xd7\x1d\xe1\x49\x34\xc7\x13\x7f\
-\x08\x4c\x6a\xc0\xe0\x8b\xf7\xe9\xc9\xcf\x5c\x58\x92\x0c\x59\xc6\
-\xc6\x04\xb0\xf1\x7b\x4e\x22\xd4\x42\x65\xf7\xe7\x25\xb4\x08\x50\
-\x4d\x0d\x3a\x7a\x76\x4b\x0f\x06\xa5\x7d\x6b\xe3\x03\xcc\x95\xc0\
-\x1a\x8d\x08\xcb\x6b\x3e\x37\x02\xe2\x09\x5a\x14\x63\x0e\xdf\x78\
-\xb6\x3b\x75\xa7\xdd\x0a\x13\x24\xef\x4c\xb0\x43\x4c\x24\x2d\x99\
-\x03\x81\xfd\x7c\x0b\xc0\x26\x72\xa2\x49\x43\x0b\x2a\xbb\xcf\xba\
-\xc5\x5c\x62\x90\x09\x2c\x71\x73\x79\x65\x73\x63\x21\xea\x13\xb9\
-\xed\x9e\x34\x25\xf6\x44\x42\x3c\xa2\x20\x85\x41\x14\x7d\xe2\xe5\
-\xb4\x28\xbd\x5b\xa8\x3d\x83\x59\x9f\xbf\xc9\x2b\xed\xda\x8a\x79\
-\xe5\xa7\xad\xa9\x34\x13\x3c\x07\x78\xc2\x41\x30\xbb\x7d\xe0\xd1\
-\x2b\x6c\x43\x5f\x8e\xe4\x73\x5e\xca\x29\xb8\x01\x9d\x35\x67\x40\
-\x46\x52\x9f\xc7\xba\x53\xe0\x49\x44\x98\xb5\xa7\x94\x8f\x88\x86\
-\xa9\x30\x6f\xe7\x0e\xc2\x90\x87\x02\x00\x10\x92\xec\x63\x68\x67\
-\x06\x74\x82\x5e\xe6\xff\xcd\x07\x47\xa2\x56\xd0\xf4\xa4\xad\x10\
-\x85\x5e\x8f\x79\xde\x0c\x1e\x32\x87\xb1\xa8\x18\x9f\x0d\x68\xb0\
-\x40\x86\x88\x13\x1c\x05\x78\xdc\x6a\xc3\x53\x56\xf8\x7c\x2b\x78\
-\x22\x41\x76\xa9\xb5\x25\x17\x20\x4f\xf9\x05\x79\xdf\xa4\x3b\x62\
-\x22\xe3\x0c\xb0\xe0\xe2\x5e\x85\xe3\xea\xd1\x12\xda\x63\x4d\xa7\
-\x78\x57\x3f\x51\xa3\x4d\x35\x37\x63\xb0\x82\x4a\x16\xde\x69\x95\
-\xdb\x9a\x7c\xc5\xa1\xd2\x77\x45\xdc\xf6\x29\x73\x21\xd7\x82\x65\
-\xae\x43\xc9\x43\x33\x35\x0f\x78\x05\x51\x7f\xf9\x68\x8f\xa1\x48\
-\xc1\x38\x8c\x79\xa1\x49\x91\xcf\x33\xa3\x7f\xf2\xe4\xcb\x8d\x33\
-\x65\xfb\x95\x06\x36\x30\xce\x13\xc8\xc1\x3b\xf3\x6a\xfd\x79\xf2\
-\x9f\x93\xc5\x22\x72\x95\x0d\x77\xac\x64\x5c\xad\x53\x4c\xce\x47\
-\xd4\x79\x26\x53\xf2\xe5\x97\xaf\x20\xe4\x43\x31\x17\xcf\xf1\x03\
-\xd5\xc6\xac\xbe\x99\x28\xda\x79\x86\x62\x88\x13\xfc\x3f\x8c\x7a\
-\x6e\x95\x57\x56\x9a\x8b\x59\x32\xca\x2c\x92\xce\xab\xe0\x08\x33\
-\x00\xec\x25\x42\x8d\x94\x14\x31\x47\x4e\xec\xd3\x32\x56\x07\xa5\
-\x17\x26\xec\x59\xaa\x40\xc5\x82\xcd\x4a\x00\x9e\x8c\xbd\x4e\xd3\
-\x9b\xeb\x3c\x32\x17\x6c\x1b\xfe\x2f\x6a\x03\x65\xfd\xe5\xea\x83\
-\xfb\x26\xf6\xac\x9d\x2b\x14\x0e\x63\x10\xa8\x3a\xd7\x78\x7b\x63\
-\x57\x9f\x9b\xb7\x00\x33\x8a\xee\xdd\x17\xce\x65\x00\x0a\xa5\x02\
-\x88\x81\x80\x81\x49\xd7\x38\x1a\x45\x25\x6c\x35\xaa\xae\xdc\x59\
-\x02\x28\x08\xc0\x40\x27\xd9\x1b\x30\xe2\xfd\xf0\x93\x05\xb0\x89\
-\x1e\x1b\x2e\x27\xd3\x57\x3b\xdd\xd7\xda\x03\x24\xd3\x19\x6a\x9f\
-\x84\xec\xcf\xaa\x92\x2c\x88\xd3\x84\x00\x13\x17\xe9\x8f\xd3\xf4\
-\x4b\xb1\xeb\x38\xb2\x7e\x94\x76\x90\xd3\x2c\x22\x13\xfd\x9a\x62\
-\x10\x9b\x4a\xcd\x9c\x7c\xe6\xa3\xc4\x60\x9e\xd5\x65\xb9\x84\xd6\
-\x79\x6c\x68\x1b\x87\x44\xcd\x78\x32\xb6\xd2\x6c\x4c\x15\x38\x9b\
-\xf9\xaa\xda\xc7\x0a\x21\x86\x69\xc1\x63\xb4\xbc\xc6\x83\x08\x33\
-\x80\x01\xb8\xe0\x03\xe5\x09\xf0\xb8\xd2\x04\x87\xf3\xa0\x2c\x56\
-\x67\xe7\xb3\x4f\x36\x84\xf9\x28\x78\xac\x0a\x74\x0e\xf9\xdc\x38\
-\x7a\x5e\xb2\x86\x2f\x6e\x3e\x2b\x38\x4b\xa4\x4e\xe0\x61\xbc\xc9\
-\x67\x58\xec\x90\x93\x2a\x46\xa9\xb0\x8e\xaf\x43\x9c\xd4\x8e\xd6\
-\xc0\xda\xf8\x22\xcf\xbe\x12\x80\x0d\xe5\x60\xa6\x62\xfc\x55\xb5\
-\xfa\x1a\xcd\x68\x29\xdd\x09\x04\xd5\x25\x64\x11\x3b\x8c\xb3\x06\
-\x80\x7f\xf6\xe1\x2f\xe2\xef\xbf\xfe\xda\xe5\xaa\x7c\xfc\xe9\xa7\
-\xf1\xbd\x5f\xfe\xf2\x8b\x09\x9b\x93\xbb\xe7\xc7\x9f\x7e\x14\xdf\
-\xff\xe2\x8b\x2f\xd5\xe7\x3e\xfe\xf8\x93\x74\xed\x5f\x7f\x9d\xfd\
-\xed\xd3\xd1\x75\x7f\xf9\xcb\x5f\xc6\xdf\x3f\xfd\x34\x7d\xf7\xd5\
-\xab\xaf\x33\x6a\x67\x80\xcf\x3e\xfb\x3c\xfe\xfd\xab\xaf\xbe\xdc\
-\x70\xbe\xba\xf6\xcb\xfb\x48\xf9\xe2\x97\x5f\xa8\x91\xfe\x44\x8c\
-\xc9\xaf\x7f\xe5\xc6\xe9\xc3\x8f\xdc\xd8\x7d\xfd\xf5\xab\x78\xbf\
-\xcf\x3e\xff\x7c\xd4\x9f\xcf\x3e\xfb\x54\xf4\xe5\xab\xd1\xc1\xa5\
-\x3d\x49\xe8\xe7\x95\xf6\x3d\x51\xa0\xaf\x9e\x0a\x3b\x13\xf1\x1c\
-\x51\x69\x9f\xca\x99\x4b\x35\x4c\xb3\xf4\x16\xde\xbe\x0c\x15\x83\
-\xa6\xdc\xa7\x45\xd8\x5b\xa8\x4f\xe5\xdf\x4e\xa1\x96\x38\x77\x0a\
-\x16\x26\x7d\xa9\x8e\x4c\x52\x40\xf3\x7e\x70\x6e\x2e\x63\x5f\xf4\
-\x35\x9a\xe1\x8f\x86\xac\xf7\x05\x36\x37\x65\x3a\xe3\x9d\x8d\xdd\
-\x02\x6a\x0e\xec\x20\xcf\x81\x19\xf9\x3b\x85\x5a\x46\x16\x48\x14\
-\x78\x66\x22\xb0\xe4\x6a\xa2\xb9\xbf\x93\xa2\x0a\x1f\xcd\xea\x0d\
-\xf1\x71\xbc\x04\x64\x22\x20\x30\xbe\x2c\x82\x11\x85\x2a\x0d\x98\
-\xce\x00\x79\x6f\x0d\x1b\xf7\x39\xf0\x6c\x62\x81\xe9\x26\xee\x2a\
-\x28\xf2\x87\x77\x00\xcf\x2a\x67\xdd\x88\x6e\x1f\x75\x66\x0d\xe6\
-\xd1\x58\xb0\xce\x85\xc4\x73\x16\x3f\x2d\x66\xcb\x3a\x5e\xa5\x46\
-\xcc\x54\xdf\x92\xc5\x36\xf1\xfe\x7b\xc9\xae\x45\xa4\xac\x4b\xac\
-\x93\xaa\x25\x4b\x8d\x28\x92\xe0\x92\x1e\x47\x56\x81\x54\x3c\x8c\
-\x29\x7c\x87\xb2\x17\xeb\x6b\xcc\xbd\xb8\x7c\x8f\x70\xfd\xf8\x2a\
-\x7c\x66\xea\x7a\xba\x5a\x33\x17\x2a\x1e\xc8\x01\x10\xd6\xb6\x52\
-\x6e\x11\x17\x34\xea\x3c\x51\x16\x40\x57\x87\xd6\x03\x3c\xf3\xa2\
-\x72\xdf\xb2\xb6\x8e\x99\x97\x8e\x99\x1b\x0c\xcb\x20\x71\xf4\x97\
-\x39\x2e\x0e\x9c\x03\xb5\xf2\xdf\xbc\xca\xe3\xc9\x85\x56\xea\xea\
-\xe4\x30\xa2\x57\x8e\xd3\x2f\x56\xf2\x2e\x4f\xcf\xf5\x2f\xce\xea\
-\x6d\xc8\x42\x94\xeb\xb4\x16\x56\x8a\x64\xa8\x8e\x02\xc5\x97\x9a\
-\x6b\x79\xe8\x24\x0a\x06\x37\x59\xb4\x13\x57\xee\x9b\xa3\x8a\xd3\
-\x08\x13\x28\x43\x17\x23\x9b\x4d\xf9\x4f\x0a\x79\x90\x0f\x7f\xf1\
-\xf1\x8c\xea\x3f\x3e\x48\xc7\x73\x0e\x55\xad\x81\xa9\xdd\xfd\x17\
-\xbf\x28\x83\x88\xcf\x3f\xff\x5c\x45\x10\x2b\xfb\x82\x60\xc1\x91\
-\x04\x05\x53\xe0\x68\x7e\xdd\x78\x30\xf3\xd9\xf4\xf7\x3e\xfb\xfc\
-\xb3\x55\x63\xe7\x40\xd8\x67\xe3\xfe\xe4\x66\x30\x9c\xae\x89\x10\
-\xe6\x19\x8b\xb9\x45\xde\xaf\x90\x7e\x97\xb0\x4e\x5f\x43\x87\x97\
-\xc0\x38\x52\xbb\xea\xe4\xc5\x1d\x67\x9a\xd8\xdb\x4b\xe7\x82\xdc\
-\x82\xc3\x7f\xec\x2d\xdd\x3c\x61\x19\x93\x47\x99\xa2\x6b\x07\xf1\
-\x3d\xca\xce\x16\xad\x94\xca\xb3\x4c\x59\xe1\x76\x33\x36\xcf\x16\
-\xd5\xb9\xb9\x52\xb1\xa9\xd0\xe7\x11\xc5\x46\x2a\xce\xb2\x55\xbb\
-\xf0\xd6\x9a\xe4\x85\xfe\xe3\x1a\x1d\xb1\x04\x66\x98\x81\x2c\x39\
-\x00\x63\x2d\x58\x22\xb0\x83\x85\x61\x18\xe0\x7a\xbd\xc2\xe5\x7a\
-\x81\xcb\xe5\x19\x9e\x9f\x9f\xe1\xf9\xdd\x3b\x78\xf7\xfc\x0c\xef\
-\xde\xbd\x85\x77\xef\xde\xc2\xdb\x77\x6f\xe1\xed\xdb\xb9\xd7\x9b\
-\xf1\xeb\x4d\x78\xbd\x85\xb7\x6f\xde\xc2\x1b\xff\x73\xf4\x1a\x5d\
-\xeb\x1d\xbc\x7b\xfb\xd6\xb5\xe3\xf9\x19\x55\xa3\xf1\x42\x00\x00\
-\x20\x00\x49\x44\x41\x54\x2e\x97\x67\xb8\x5c\xae\x70\x1d\xae\x70\
-\xbd\x5e\x61\x18\x06\xb0\xd6\x82\xb5\x04\x96\x2c\x10\x59\xa0\x00\
-\xd2\x42\x58\x38\x4f\x47\x30\xac\x79\x2c\xeb\xc2\xd6\x53\xc8\x9b\
-\xce\xa3\xc9\x9e\xa5\xc8\xf9\xd1\xe1\x69\x33\x60\x09\xa7\x9f\xfd\
-\x32\x6d\x73\x66\x2f\x59\x83\xd5\x70\x69\xf9\x4d\xd6\xe3\x9a\x3f\
-\xb8\xef\x83\x71\x16\xcc\x07\x59\x91\x3b\xad\xb0\xcc\xc4\x62\xe4\
-\x95\xbb\xb3\xcf\xea\x3c\x4a\x2c\x24\x44\xf2\xbe\x89\x38\x63\xbd\
-\xd6\x4a\xee\x84\x21\x86\x51\x7d\x83\x65\xa2\x1a\x14\x03\x30\x52\
-\x98\x01\x06\xab\x5a\xc1\x53\x33\xa5\x8c\x72\x36\xc6\xa3\xe1\x9c\
-\xaf\x5d\x32\xaa\x9e\x1d\x0e\x0d\x0c\xde\x19\xe9\x65\x38\xd7\x53\
-\xb3\xd3\x60\x5a\x58\x11\xbc\xec\x01\xaa\x71\x7f\x2a\x32\x00\x2e\
-\x42\x82\x9c\xe1\x8c\x0b\x5c\xaa\x87\x90\xc1\xc4\x62\x5b\xac\x92\
-\x20\x97\xac\x4a\xbc\x78\x18\x27\x30\x63\x47\x5e\x1b\x74\x07\x82\
-\xaa\xfb\x2e\xd3\x9b\xc7\x83\x98\x42\x72\x78\xd2\x4a\x29\x53\xb7\
-\x79\x12\xe8\xe2\x14\xa6\x49\xbf\x47\x6f\x10\xcf\x82\x8a\xe0\x3d\
-\x61\x62\xf8\x68\x02\xd4\x8c\xb5\x05\x2c\x9e\x4d\x93\xcd\xf3\x26\
-\xb0\x0f\xff\x46\x03\x81\x2f\xbe\xfc\x65\xc4\x9c\x9f\x7f\xfe\x79\
-\x31\xb0\x40\x7a\x18\x3e\x15\x9e\x92\x2f\xbe\xfc\xc2\x35\xc5\x20\
-\xfc\xe2\x17\x9f\x16\x66\x15\xcf\x00\x96\xf4\xf9\xaf\x5e\x7d\x1d\
-\x07\xfb\xe3\x4f\x7e\xa1\x40\xcd\x17\x5f\x8c\x3d\x54\x1f\x7d\xf4\
-\x31\xfc\xfa\x57\x5f\xa7\xb9\x0f\x0c\x9f\x7c\xf2\x69\xc1\xd3\x84\
-\xf0\xf9\xe7\x9f\x2e\x1a\xec\xe4\xbc\xe1\x0c\xc0\x04\x7f\x4b\x02\
-\xd1\x18\xbd\x35\x00\xa5\xda\x5d\xba\x10\x25\x17\x8d\x18\x85\xa3\
-\x05\x55\x26\xca\x88\x78\x83\xe7\xcc\xeb\xf3\x1a\xe2\xe8\x99\x20\
-\x20\x30\xf9\x6b\x18\x06\x24\xf6\xf9\x42\x0c\xcb\xe1\x0d\x25\x05\
-\x54\xb0\x9c\x49\xfa\x66\xc6\xd8\x39\xe5\x13\xad\x64\xad\x5c\xa5\
-\x70\x9f\xc9\x49\x74\x20\xde\xe0\x15\x2a\xcb\x12\x25\x35\x4f\x7c\
-\xbf\x86\x31\x0c\xf7\x82\x99\xbd\x6d\x2e\xcd\x25\x80\x6c\x2e\x39\
-\x4f\x0c\xb3\xf3\xc6\x10\x59\xb0\xd6\xc2\x60\xdd\x4f\x3b\x84\x7f\
-\x3b\xb0\x40\xd6\x7b\x6b\x88\x52\x68\x1a\x8f\xcf\xc1\x43\x0e\x7c\
-\xa1\xa9\x1b\xe3\x94\xfd\xe0\x8d\x31\xc6\x40\xd7\xf5\xd0\xf7\x1d\
-\x74\xa6\x83\xae\xef\xa0\xeb\x08\x8c\xe9\xa0\xeb\x0c\x18\x36\x00\
-\xc6\xf8\xb2\x6a\x1d\x90\x01\x5f\xc8\xd8\x80\x52\x65\x78\xbd\x17\
-\x6d\x4b\x68\x7f\xdc\x0f\xb3\x50\xb3\x98\xf3\x53\x00\x00\xa8\xf6\
-\x3e\x5e\x73\xa7\x0a\x0f\x4d\x69\xa4\x57\x5a\x21\x11\xc6\xc9\x3f\
-\x11\x99\x95\xae\x0b\xb0\x82\xd4\x0b\x0f\xdf\x18\xb6\x7e\x56\xd7\
-\x90\x80\x9c\x77\x73\x16\xcc\x28\xaf\x03\x05\x64\x1d\xdc\x9d\x6e\
-\x21\x39\xef\x0c\xa9\xbf\x69\x0b\x16\x4d\xbe\xa0\xce\x0e\x0d\x30\
-\x52\xdf\xd2\xbf\x93\x27\x87\x00\xfc\x2b\xde\x57\x7a\x33\x98\x33\
-\xe0\x31\x03\x8b\x39\xa7\x4d\x5c\xb0\xac\x67\xee\x5e\xe9\xa9\x89\
-\x6d\x2b\x98\xf9\x65\x3c\x2c\x49\x6b\xe0\xc8\x03\x51\xb0\xf6\x9d\
-\x71\xfa\xd4\xce\xbe\x8a\x0a\xd4\x5c\xe1\x79\xc5\xa9\x32\x22\xb3\
-\x86\xcd\xcc\xdf\x98\x85\x9d\x25\xc0\x23\x8a\xfc\xcd\xbe\x36\x82\
-\xbe\xaa\xfc\xa3\xe5\x38\x4a\x69\x01\xcf\x95\x4c\x62\x14\x4a\x25\
-\x8c\x7e\x57\x36\x41\x9c\xb6\x17\x26\x0f\x33\x2e\x1f\x0e\x3c\x0f\
-\xe2\x62\xf8\x17\x96\xef\x33\x8a\x43\xc5\x79\x9d\xf1\xeb\xaf\x5e\
-\x55\x60\x47\xac\xd9\xcc\x17\xaf\xf3\xe5\x57\x5f\xa8\xef\xfc\xf2\
-\x8b\x2f\x8a\x01\xdc\xd1\x20\x37\x73\xcd\xaf\xbe\xfe\x72\xd7\xba\
-\x0b\xb7\xfd\xea\xd5\xd7\x65\x6b\xdf\x82\xf5\x79\x4a\xf2\x30\x3c\
-\x44\x2c\x24\x70\x63\x02\x32\x9c\x76\x5d\xeb\xe7\x9b\xf5\x20\x86\
-\x84\x07\x87\x95\x97\x06\x44\xdd\x86\x34\x5e\xc9\xb3\x85\x0a\x44\
-\x71\xa1\xb8\x72\xb1\x64\xd1\x1e\xd7\x33\xb3\xf2\xb0\xa4\xe8\x01\
-\x48\x7b\xab\x0f\xdb\xb1\x96\x9d\xc7\xd6\x8e\x5f\x14\x5e\x94\xbd\
-\x2c\x83\xf5\xbf\x33\x31\xb0\x25\x11\x9d\x10\x16\xa7\xf4\x16\x29\
-\x3f\xd2\x3c\x7b\xe4\x89\x9e\x0d\x3c\xf1\x4b\xfb\xd5\xba\xf3\x1d\
-\x3a\x87\x5e\x3c\x33\xd4\xef\x6e\x1b\x67\x01\x8c\x22\x64\x9a\x88\
-\xc0\x5a\x72\x60\x66\x18\x60\xb8\x0e\x70\xbd\x5e\xe0\xd9\x7b\x67\
-\xde\x05\x4f\xc9\x9b\x37\xf0\x26\xbc\x5e\xbf\x81\x37\x6f\x5e\xeb\
-\x9f\xaf\xdf\xc0\xeb\xd7\xaf\xdd\xeb\xbb\x89\xd7\xeb\x8a\x97\xff\
-\xdc\x9b\x37\xe1\xe7\x1b\x78\xf3\xd6\x79\x76\xde\xbd\x7b\x07\xcf\
-\xef\xde\x39\x4f\xcd\xf5\xe2\x3c\x34\xd7\x01\xac\x00\x5e\x2e\x64\
-\x8e\x80\xc8\x7a\x5d\x72\x5c\x37\xee\x3c\x8b\x6b\xb6\x41\x95\x72\
-\x5e\x84\x4b\x1e\x97\xdd\xfe\xfb\xf4\x27\x58\x95\x43\xb3\x8e\x4a\
-\x18\xa7\x0e\xc3\x8a\x0a\x56\x38\xfb\xf9\x83\x02\x2f\x0b\x0a\xc2\
-\x38\xbc\x17\xcb\x6a\x1f\x4f\x38\x6a\x16\x3d\x3a\xc9\x7a\x95\x18\
-\x34\x64\x48\x4d\xf2\x1c\x84\x24\x89\xe9\xc2\xb0\x33\x4a\xdd\x9c\
-\xf9\xa2\x54\xf6\x18\x51\x27\x66\x72\xe1\x30\xcc\xd8\x3b\x31\x26\
-\x13\x2c\x3f\x5b\x45\x44\x1b\x12\xd7\x16\x2c\x05\xb2\x30\x3a\xcb\
-\x76\x8c\x6a\x98\x2c\xfb\x9c\x92\x27\x2c\x2f\xf6\x2a\xab\x95\xe3\
-\xa8\xaa\xc5\x2e\x4f\xcc\x66\x4e\xc2\xfd\x7b\x0f\x6f\xb8\x42\x0d\
-\xe5\xe5\xea\xbe\xe0\x96\xc6\x65\x69\xfd\xfe\x99\x05\x45\x46\x32\
-\xa0\xd5\xf4\x49\xda\x19\x82\x6e\x84\x90\x72\x90\x9c\xe7\x86\x23\
-\xa8\x61\xff\x7b\xc9\x43\x23\x15\x71\x47\x17\x9b\x79\x69\xb2\x25\
-\x28\xfd\x4a\x3c\x45\x2d\x2b\x8d\x56\x52\x71\xc5\x74\x1f\xf9\x19\
-\x65\x21\x9c\x61\xea\x65\xdc\x31\xc5\x70\xfa\xf9\xa1\xc1\x32\x30\
-\x42\x0d\x84\x71\x62\xef\x56\xc9\xe6\xd9\xdf\xe6\x52\xea\xb8\x94\
-\x47\x81\x58\x04\x68\x19\xef\xd5\xa4\x7c\xfd\xab\xaf\x2a\xaa\xca\
-\x4d\xa9\x59\x19\x85\x48\x98\x54\x02\x40\x93\x07\xcf\xf9\x7c\x24\
-\x96\x00\x7b\xec\x83\xc2\xcc\x8a\x18\x3c\xc7\x0c\x90\x25\xcf\xc9\
-\x6b\x23\xe0\x9c\x31\x69\xe7\x8e\xa6\xcd\x4a\x7e\x3f\xf6\xc5\x68\
-\x59\x91\x77\x70\xb1\xa2\xf9\x12\x35\x2c\x8b\x07\x1d\x6a\xd0\x70\
-\xc8\x25\x62\xbd\x26\x22\xa3\x21\xe2\x36\x3d\x6c\xa3\xd2\xbd\x5f\
-\x01\xdc\x70\x8f\x0a\xdd\x6f\xca\x23\x8f\x7b\x70\x2c\xdc\x41\x56\
-\x9c\x99\x45\x92\x91\xc2\xc1\x15\x43\xce\xc8\xe7\xcb\xb0\x53\xfe\
-\xc9\x12\x58\x6b\xe1\x7a\xbd\xc2\xd5\x83\x85\xcb\xf5\x0a\x83\x0f\
-\xeb\x1a\x06\xeb\x43\xba\x48\x90\x09\xf0\x8c\x81\x8a\x27\x48\x5f\
-\xe6\x73\x68\x82\x81\xc2\x88\xc4\xff\xae\xeb\xa0\xef\x7a\xe8\xfb\
-\x1e\x9e\x9e\x7a\xb0\xf4\xe4\x3d\x4c\x2c\xc8\x0c\x25\x90\x60\xb7\
-\x2d\x78\x83\x33\xb2\x51\x3a\x56\x69\x1a\xf1\x84\x6a\x5d\x7b\xd6\
-\x4f\x3e\xaa\x42\x98\x74\x0a\x33\xc3\x45\x03\x53\x4d\x98\xb5\xd8\
-\x19\xe7\x01\x0d\xce\x0e\x7d\x9e\x92\xc7\x0b\xa3\x53\xd1\x0c\xd4\
-\xef\x45\xc2\xd2\x9c\xfd\xa6\x10\x8c\xbd\x7e\x2b\xab\x53\x53\x71\
-\xa4\x90\x4e\x91\x7a\xf3\x82\x05\xb6\x10\xec\xc7\x2c\xe9\xfc\xa3\
-\x02\xc0\xd2\xa2\xe0\x2b\x40\xbb\x33\x0c\xc7\x0f\x5f\x2c\xaa\x72\
-\xa8\x48\x59\x29\x1f\x87\x03\x8d\xb4\x24\x0d\xd4\xf2\x38\x4c\x16\
-\x1c\xe2\x1e\x94\xc8\x66\x61\x75\x01\xc7\xb9\xe4\x77\x5d\x3d\x3d\
-\x85\x4d\xf0\x08\xc8\x2c\x2a\x2c\x8c\xc5\x79\x2d\xea\x40\x26\x8a\
-\x61\x1e\xaf\xd2\x43\x22\xcf\x8a\xca\xd2\x4a\x1f\xfb\x4a\x80\xb2\
-\x39\xec\x8b\xc7\x53\xbb\x1c\x78\xb8\xe2\x40\xc6\x85\x50\x89\xa9\
-\x3a\x29\x1b\x09\xbd\x64\x02\x35\x64\x79\x0a\x14\xad\xe6\xc9\x53\
-\x1c\x49\x01\x98\x45\xb2\x36\x8c\x93\x10\x45\xe1\x3d\x79\x4c\x04\
-\x50\x13\x68\x6e\x35\xa3\x07\x6a\xb3\x03\x2f\x1d\x09\xc9\xda\xa5\
-\xbd\x18\xac\xc8\xd4\x10\x27\x06\x76\xe1\xb4\x29\x79\x45\xa6\x0a\
-\x9d\xa1\xaf\xa1\x82\xc0\x23\x00\x83\xa6\x04\x72\xfc\xed\x28\x23\
-\xe9\xc7\x02\x49\x4c\x08\xed\x84\xfa\x93\x67\x62\x63\x9e\x09\xc5\
-\x2c\xdc\x63\x26\x5f\x89\x97\xce\x2b\x9c\x30\x2a\xe2\x98\x17\x91\
-\xc5\x7c\x33\x1e\xd4\x84\x39\xe8\x14\xac\x00\x9a\xb1\xc0\x72\xa6\
-\x77\xd4\x5c\x3b\x45\xc8\xc9\x32\xe4\xdd\x19\xca\x1e\xca\x03\x15\
-\xd4\xbc\x96\x87\x28\x44\x8b\xe8\x6b\xec\x20\xae\x08\x67\x61\xad\
-\x0b\x66\x74\x70\xa1\xce\x8f\x0a\x49\x41\x14\xc6\xb1\xad\x86\x96\
-\xca\xa2\xe1\x0b\xba\x15\xe2\x86\xfd\xf6\x04\xd7\x08\xae\xd4\x3a\
-\x71\xee\x63\x39\xb1\x5d\xe5\xb3\xc4\x25\x65\x79\xd7\x99\xb9\x1e\
-\x00\xa5\x02\xb5\xac\x0c\xb5\xc1\x9b\x48\x64\x3d\x70\x71\xb9\x29\
-\xcf\xcf\x2e\x87\xe6\xe2\xbd\x20\xc3\x70\x05\x4b\x14\xbd\x20\x5a\
-\x57\x9b\xd1\x40\x16\x80\x0e\x4f\x18\xfe\xd1\x87\x9c\xb9\x70\xb2\
-\x0e\xfa\xbe\x83\xa7\xa7\x27\x20\x7a\x01\xe4\x0b\xcc\x1a\x1f\x8e\
-\x86\xc6\x80\xb1\xe4\x48\x01\x62\x5e\x19\x39\xa3\x47\x30\x7c\x44\
-\xc3\x02\x16\x1f\xca\x91\xbc\x92\x45\xed\x1c\x71\x6c\x18\x9b\x39\
-\xbb\x6a\xea\x81\x63\x05\xe0\xef\x97\x54\x7f\x3c\x65\xb5\x61\xb9\
-\x2e\x4d\xcd\x26\xb2\xa1\x01\xb8\x34\x32\x38\x7d\x76\xba\x85\x1d\
-\x7e\x29\x68\xbf\x8b\x4f\x21\x5b\xe5\xac\x95\x6b\x99\xc8\x25\xf3\
-\x52\x7c\x91\xe9\xb8\x24\x53\x9e\x37\x8f\x94\x57\x54\x66\xe1\x09\
-\xa6\x99\x09\x0b\x13\x43\x6e\x41\x94\x21\x5a\x13\x8b\xd1\x83\x1a\
-\xc8\x00\xd7\x9a\xbd\x68\x71\x93\x14\xfc\xf1\x20\x8a\x39\xf2\xa8\
-\x40\x41\x09\xcb\xcc\xd5\x68\x41\x55\x03\x05\x7d\x6e\x4f\x3d\x28\
-\xdb\xbe\x0e\xe6\x54\xb1\xd5\x73\xbc\x9a\xaa\xf3\x06\x66\x3a\x49\
-\xd9\x38\xb6\x58\x8c\x97\xde\xe8\x59\x16\x00\x04\x6e\x6f\x32\x42\
-\x09\x9c\xa5\xb0\x32\xcc\xe6\x3c\x09\x2f\x4d\xaa\x1d\xc2\x99\x12\
-\x8e\x9a\xc5\x05\x73\x75\x92\x17\xe9\xd1\x98\xcb\xf3\x51\x85\x13\
-\x81\xb6\x66\xe5\xe7\x11\xb3\x34\xbd\x4e\x6c\x5c\x08\xf0\xf1\x47\
-\x9f\x2c\x1f\x08\xb2\x28\x9b\x90\x4f\x3e\xfe\x18\x5e\x7d\xfd\x15\
-\xa0\x41\xf8\xf8\xc3\x2c\x17\xa7\xe0\xa1\xf9\xf8\xc3\x4f\xe1\xcb\
-\x5f\x7d\x19\x29\x74\x3f\xfb\xe4\x53\xf8\xf2\xd5\xab\x71\xe8\x31\
-\xce\x14\x0c\xf5\x6f\x7e\x32\xca\xa1\x49\xf9\x23\x32\x59\x3f\x85\
-\xb5\xe9\xeb\x87\x21\xf8\xa8\x90\xec\x3f\x3b\xc5\x71\x2e\x2b\x75\
-\xcc\xa2\x86\xa2\x18\x68\x60\x74\x64\x01\x77\x43\xb4\x54\xb8\xaa\
-\xe1\xe4\x91\x91\x9e\xc0\xd1\xfa\x61\x5d\x25\x3c\x5f\x1b\x92\x61\
-\x4c\x36\x34\x84\xad\x95\x15\xd1\x8a\x8a\xbc\x33\xab\x49\xe5\x23\
-\x00\x08\x62\x00\xd6\x36\x08\x0c\xf5\x68\xea\xf7\xf8\xb1\x8d\x50\
-\xef\x09\x21\x73\x06\x65\xfb\xf3\x0a\xb6\xbc\x75\xe3\xaa\xd8\x75\
-\x6b\x3d\x24\x07\x04\x8e\xe0\x19\xc0\x07\xb7\x0d\x09\xd7\x7e\x0f\
-\x27\xf6\xdd\xb3\x74\xc7\x52\xbe\x31\x2f\x54\x4b\x10\x64\x42\x41\
-\xe7\x72\x1e\x1a\x17\x7a\x76\xbd\x5e\xe1\x7a\xb9\xc0\xe5\xf9\x02\
-\x97\xcb\x05\x2e\xd7\x8b\x03\x35\xde\x93\xc3\x44\x40\xc0\xda\x83\
-\x38\x15\xe1\xc0\x4b\x86\xef\xb1\x0b\x3b\xd1\x32\x23\x74\xc6\x81\
-\x99\xbe\x7f\xf2\xac\x6b\xde\xf8\x66\x8c\xcb\xa3\xe9\x2c\x30\x75\
-\x82\xe0\x48\xe7\xb6\xe1\xd4\xe0\xd7\xa6\x8c\xd4\x78\x69\x42\x6e\
-\x6b\x9c\xfb\xe5\xdc\x18\x05\xa8\x70\x51\x29\x3a\x64\x92\xf4\x30\
-\x63\xe5\xdf\x6f\x22\xd8\x3a\xa9\x77\x66\x94\xcd\x81\x99\x03\xd6\
-\x58\xd5\xfe\x99\x3d\x47\xc6\xb4\x4b\xf0\x28\x27\x21\x15\x2d\x94\
-\x13\x92\xfc\xa4\x41\x41\x09\x1a\xed\x7d\x42\xa7\x51\x4e\x17\xe9\
-\x82\x58\xc8\x02\x8a\x21\x0c\xf1\xd0\xd2\xac\x64\x79\x5a\x8c\x89\
-\x56\xe2\xdc\xd3\x86\xb3\x01\x19\xa5\x4d\x8e\xa1\x4c\x29\x38\x37\
-\xa8\x9c\x91\x30\x4c\x77\x6d\x3e\x9c\x2a\x28\x90\x1c\xc3\xfc\x44\
-\xc8\xdd\x4e\x70\x73\x13\x57\x7d\xc5\x26\x30\x2e\xf2\xca\xc7\xdd\
-\xa7\xa8\x18\x4b\xeb\x0c\x4c\x7b\x67\x78\xbc\x31\xf2\x89\x83\x37\
-\x99\xe5\xc3\x00\x84\x29\x14\x2d\x9d\x7b\x28\xc2\x2c\x93\x91\x00\
-\xb3\x79\xae\x6b\x75\x70\xa4\x26\xc7\x35\xe3\x99\x25\xff\xe3\x28\
-\x97\x46\x87\xb6\xc5\xea\xed\x98\xe8\x9d\xbf\xfe\xf5\xd7\xf0\x0b\
-\x4f\xd9\xfc\xe1\x3f\x4b\x4a\xfc\x57\xbf\x7a\xa5\x41\x4d\xd1\xe2\
-\x95\x1a\xfc\xeb\x5f\xff\x73\xf8\xf0\xc3\xbf\x49\xa0\xc6\x93\x0a\
-\x7c\xfd\x5f\x7f\x0d\xbf\xf8\xaf\xd2\x75\xb1\x73\x3f\xff\xf9\x7f\
-\xf3\x6b\xf8\x9b\xff\xf2\xc3\xf8\xfe\xa7\x1f\x69\x20\x82\x06\x27\
-\x2c\x77\xae\x2f\x5f\x7d\xf5\x35\x7c\xfc\xb1\xbb\xee\x67\x82\x20\
-\xe0\xd5\xd7\xaf\xe0\x93\x09\xf6\xb4\x11\x10\x04\x84\x57\xaf\xbe\
-\x82\x4f\x3e\x71\x6d\xfd\xe8\xa3\x0f\x8b\x9f\x7d\xf5\xea\x55\x2a\
-\x34\x99\x9f\xa7\xa8\x97\xc7\x97\x5f\xbf\x82\x4f\xfd\xfd\x3f\x17\
-\x2c\x6c\x5f\xbe\xfa\x1a\x3e\x15\x44\x03\x28\x0c\x47\xa9\x98\x2c\
-\x47\x1a\x65\x49\x0a\x10\x3c\x36\x92\x14\x80\x63\x9c\x03\x66\x61\
-\x74\xe9\x67\xb8\x2e\xb3\xa4\x2f\xc7\xd9\xb0\x43\x79\xce\x24\x03\
-\x19\xe8\x1a\x01\xbb\x52\x6a\x7c\x1d\x0f\x60\x28\x86\xd9\xe0\xf6\
-\x0d\x73\xb4\x4f\x7b\x4d\x35\x78\x5e\x47\x40\xe6\xc8\x9d\x17\xf7\
-\x7f\x95\x77\x58\xf4\xf0\x06\x67\x06\x2e\x80\x03\x5e\x0b\xd4\xee\
-\x41\x9e\x50\x75\xf6\xf1\xc4\xbb\x21\xc7\x96\x53\xe8\xd9\x30\x28\
-\xa6\xb3\xe7\xcb\x33\x5c\x2e\x2e\x04\xcd\x5a\xff\x19\x49\xe1\x5c\
-\x3e\x5d\x4b\x85\x09\x47\x6d\x19\x9f\x7f\x22\x2a\xc9\x20\x74\x68\
-\xc0\x74\xff\x3f\x7b\xef\xfa\x2c\xd9\x75\xdd\x87\xad\xb5\xcf\xe9\
-\xbe\xaf\x01\x40\x11\x05\xea\x11\x52\xb1\x6c\x2b\xaa\x92\xab\xf4\
-\x21\x2a\xd9\xd2\x97\x54\x52\xfe\x1f\x92\xa8\x4a\x89\x64\x97\x2d\
-\x0a\xc0\xcc\x60\x00\x0a\x02\x41\x90\x74\x59\x24\x08\x82\x03\x0c\
-\x06\x33\x03\x80\x94\x92\x48\xb1\x5d\x25\x39\xff\x43\x2a\x89\x2b\
-\x65\xd9\x56\x49\x1f\x94\xb2\x53\x8a\xe2\x52\x4a\x52\x24\x91\x08\
-\x24\x12\x9c\xd7\xed\xee\xb3\x57\x3e\xec\xd7\xda\xcf\xb3\xf7\x39\
-\xa7\x7b\x2e\x94\x34\xea\xe2\xde\xe9\x3e\x7d\xce\x7e\xae\xbd\x7e\
-\xeb\xf1\x5b\x1d\x0c\x43\x67\x43\xdd\x04\x22\x74\x9d\x80\xbe\xef\
-\x40\xca\x5e\xb5\x85\xe5\x05\xcd\x5e\xe7\xad\x85\xda\x11\x92\x35\
-\xfd\x62\x05\x8b\xb3\x9c\x61\xe2\x72\x5c\x68\x3f\xf8\x2d\x16\x8b\
-\x28\x6d\x33\x0d\x22\x18\x4d\x70\x4b\xc7\xf2\x54\x25\xf8\xa8\x36\
-\x21\x32\x72\x04\x56\x50\x28\xa9\x68\x19\xef\x83\x94\x8c\x46\x59\
-\x3a\x56\x0e\x43\x14\x60\x48\x01\x3c\xf6\x0d\xe9\xc2\xb1\x54\x96\
-\x66\x44\x15\x4d\x61\x92\x7f\x40\x8b\x09\x12\xbc\x24\x4c\x9b\xf4\
-\x69\x08\x00\xf4\xf3\x40\xf3\xb3\x03\xa3\x6b\x8e\x41\x63\xc8\x69\
-\x8b\xa3\xa4\x0e\x94\x52\x78\x83\x82\x6a\xbe\xb7\xc8\xaf\xf6\x1b\
-\x52\x48\x8f\xe7\xa9\x27\xe8\x99\x33\x55\xeb\x29\x5e\x52\xa3\x99\
-\x8b\x38\x61\xb5\x2e\xba\x3c\x93\x7d\x5b\x08\x7d\x85\xdc\x99\xda\
-\xaa\x64\x94\x71\x21\x10\x50\x80\xfe\x51\x42\x9a\xff\x18\x2b\x14\
-\x9a\xeb\x30\xf0\x12\xe0\xb2\x15\x8e\xc3\x6e\x72\xcb\xb9\x9f\x98\
-\x8d\xfe\x32\x09\x02\x7c\x8d\x0b\x1d\x3d\xe6\x16\xe7\x4d\x09\x69\
-\x9d\x6b\x27\xd9\xcb\x95\x40\x6e\xad\x73\xcf\x51\x0e\x11\xe1\x3f\
-\x0f\xd8\xd8\x09\x80\x9b\xb7\xfc\x04\xf8\xb7\x6e\xdd\x48\x12\xb3\
-\xa4\x3c\xd3\xae\xe8\x19\xc0\xcd\xb7\xdf\xf6\x3e\xbe\x71\xeb\x46\
-\xfc\x95\x4e\x00\x76\x6a\xae\x6f\xfd\xca\xcd\x34\x80\xb8\xf1\x86\
-\x0b\x3b\x08\x00\x14\x82\x4b\x78\x7f\xe3\x4d\xbf\xdd\xd7\xdf\xbc\
-\xde\x7e\x7e\x20\xc2\x8d\x1b\x6f\x65\x2f\xbb\x71\xe3\x86\xab\x58\
-\x9d\xa1\xe3\xf6\x59\x79\x00\xae\x07\xc4\x04\xd7\xaf\xbf\x91\x59\
-\x97\xa8\x03\x17\x1d\xc4\x72\x1e\x13\xbe\xd6\x80\xe5\x68\xc5\x40\
-\x3b\x94\x2f\xce\x1b\x88\xd1\x1a\xe3\x5e\x71\xac\x3d\x0a\x27\x01\
-\x17\xe6\x31\xe1\x96\x69\x4e\xec\xa2\x69\xda\xc3\x24\xff\x5c\xf2\
-\x7f\xf2\x87\x5d\x13\x97\x12\x50\xf7\xe7\xd5\xdb\x21\x74\xe2\x4c\
-\x96\x04\xcb\x0b\xe1\x88\x5a\x78\xaa\x2c\x5b\x50\x06\x16\x45\x52\
-\x8b\xbc\xaa\x3c\xff\x0e\xa5\x5f\x4d\xbf\xc0\x81\x1a\xd2\x04\x01\
-\x86\xbe\x79\xb7\xdd\xc1\x76\xb3\xb5\x3f\x1b\x03\x6e\x36\x1b\x0b\
-\x72\xb6\x9b\x8d\xfd\x7c\xa7\x7f\xd4\xbf\x37\xf6\x67\xb3\x55\x3f\
-\xe7\xdb\x0d\x6c\x36\x5b\xf5\x73\xbe\x81\xed\xb9\xbb\xd7\x66\xa3\
-\xfe\xbd\x39\xdf\xc0\xb9\xfe\xfb\x7c\xb3\x61\xcf\x54\x54\xcd\xbb\
-\xdd\x0e\x86\xdd\x00\x72\x70\xc0\xca\xd9\x32\x70\x92\xe1\x35\xe7\
-\x09\xa4\xa6\x39\x1c\x67\x34\xf6\x11\x4c\x62\xe1\xe0\xbc\xcd\x96\
-\xac\x2a\x49\x8c\x0a\xe1\xe1\xf9\x06\xee\xde\xbb\x0b\x77\xbf\x7b\
-\x17\xbe\x6b\xd8\x17\x1e\xdc\x87\x07\x0f\x1e\xc2\x66\x73\x0e\xdb\
-\xed\x4e\xb1\x43\x58\xd6\x2b\x7e\x30\xaa\x2a\xa6\x42\x27\x35\x75\
-\xda\x6d\xb6\x5a\xf5\xb0\xea\x57\xb0\x5e\x1f\xc1\x7a\xbd\x82\xd5\
-\x7a\x0d\xeb\xf5\x5a\xfd\xbd\x5a\xc3\x6a\xb5\x82\xbe\x5f\x41\xdf\
-\x6b\x7a\xba\xae\x07\x21\x14\x65\x1d\xaf\x88\x1a\x8f\x35\x4d\x5b\
-\xd2\xa9\x41\xc4\x11\x5d\x2f\x50\xa8\xb9\xb0\x27\xa2\x4c\x05\xec\
-\xf0\x00\x35\x8c\x30\xba\x4a\xad\x46\xfe\x92\xd5\x4a\xd1\x1c\x98\
-\x6e\xfa\x91\x1f\x93\x9c\x47\x87\x37\x3b\x64\x98\x60\x40\x62\xa4\
-\x5f\xc4\xa4\x2f\xa7\xcd\x34\xc0\x45\x92\x6f\x4e\xb0\xb4\x82\x7a\
-\x7e\x4c\xe1\x27\x1b\x67\xcf\x13\xd1\x92\xc5\x46\xc3\x18\xfb\xc0\
-\xea\x0d\xae\xf6\x00\x00\x81\x24\xd0\xcc\x6e\x9c\x44\xa1\x8e\xb5\
-\xa7\x1c\x5f\xef\x5b\xc2\x55\x81\x2a\x00\xa1\x7f\x3b\x1e\xf5\x91\
-\x30\x00\x3a\x8c\x87\x26\x65\x94\xf2\x18\xda\x58\x3d\x20\x4b\x53\
-\xa9\x29\x29\xb7\x9b\x0d\x3c\x3c\x7f\x08\x0f\xee\xdf\x87\xbb\x77\
-\xef\xc1\xbd\xbb\xdf\x85\xef\xde\xbd\x0b\xf7\xee\xde\x85\xfb\xf7\
-\x1f\xc0\xf9\xf9\x43\xd8\x6c\x36\xb0\xdb\xed\x5c\x91\x31\xeb\x31\
-\x94\xaa\xbe\x8c\x61\xd7\x0b\x69\x2b\x8d\x15\x59\xe8\xa1\x11\x4e\
-\x61\x2d\x51\x44\xdb\xf9\x94\xe0\xd7\x27\x22\x47\xf1\x8d\x4c\xb1\
-\x53\xeb\xcb\x29\xc2\xae\x4c\x4d\x5c\x5f\xc8\x14\xe1\x34\xa0\xa9\
-\xeb\x05\x88\x95\x80\x7e\x25\xa0\x5b\x77\xd0\xe9\xbf\x51\x08\x95\
-\x0f\x42\x9a\xc4\x6f\x27\x61\xd8\x11\xc8\xad\x04\xb9\x23\x90\x3b\
-\xa3\x91\x1a\x19\x24\xb4\xea\x8a\xfe\x7e\xd6\x54\xa0\xd6\x6a\xc6\
-\x8d\xec\x88\xb1\x8d\x50\x32\x99\xc1\x12\x3c\x6d\x11\x35\x5d\x48\
-\x2d\xf5\x1c\xfe\x0c\x63\x8e\x12\x01\x28\x34\xc0\xfe\xda\x15\x3f\
-\xe4\xea\xfa\x1b\xd7\x95\xf2\xad\x0b\xb2\x09\xbd\x6f\x79\x31\x44\
-\xd2\x5a\xaa\x62\xe2\x25\x05\x3a\x3b\x35\x96\xa2\x73\x40\xd4\x4e\
-\x95\xd4\x63\x25\x09\x68\xa7\xc6\x41\xb9\xbd\x4c\x92\xab\x60\xb4\
-\x9d\xe8\xad\x5b\xa9\xc3\x38\xac\x21\x42\x57\x68\x8c\x99\xe3\xf4\
-\x98\xd9\xf5\xc2\xc5\xb8\x2b\x3a\x87\x1e\x68\x71\xb2\x43\xb2\xba\
-\x46\x64\xeb\xcf\xa1\x0f\x66\x6c\x7f\x5c\xe1\x3d\x63\x1c\x32\xc0\
-\xe2\xc5\x5f\xf4\x43\xef\xde\x7e\xfb\x36\xf3\x9e\x98\xf6\x93\x9a\
-\x93\x1e\x40\xf4\x08\xdd\x0a\x41\xf4\x08\xa2\x13\xee\x39\x92\x40\
-\xee\x08\x86\x9d\x84\x61\x2b\x41\xee\x00\xe4\xce\xb8\x09\xd5\xb3\
-\x04\xf8\x46\x30\xb7\x17\x1d\x73\xa3\x1b\x33\x70\x15\xb8\x59\xcc\
-\x1d\x5f\x9b\xa6\x70\xa0\x2b\x2a\xc8\xa1\x14\x3a\x63\x84\x9e\x33\
-\xf7\x37\x26\x8d\x47\xbc\xe6\x05\xcd\xa1\x1f\xb0\xb2\x24\x4d\x11\
-\xc3\xd7\x8e\x05\xf8\x42\x04\x95\xd3\xd5\x39\xa4\x72\x0e\xd6\x70\
-\x74\x74\x04\x27\x27\xc7\x70\x72\x7a\x0a\x67\x67\x97\xe0\xf4\xec\
-\x0c\x4e\x4f\x4f\xe1\xe4\xe4\x04\xd6\x47\x47\xb0\x5a\xaf\xa1\xef\
-\x7b\x10\x5d\xa7\xc3\x78\x04\x08\xd1\xd9\x2a\xec\x28\xf4\x33\x16\
-\x30\xb0\xb4\x30\xfc\xc2\x9e\xaa\x05\x34\x3b\xcc\x68\xfa\x79\x86\
-\x39\x43\xf5\xbe\x5e\x41\xf4\xb9\x19\x6f\xc9\x99\x60\x0d\x19\x80\
-\x94\x30\x0c\xda\x1b\xb3\xd9\xc2\xf9\xe6\x1c\x1e\x3e\x7c\x08\x0f\
-\x1e\x3c\x80\xfb\xa6\x66\xcc\x83\x07\xf0\xe0\xe1\x39\x9c\x6f\xce\
-\x95\x87\x46\x13\x03\x18\xf9\x53\x47\xc0\xe9\xeb\x28\x94\x1b\xd8\
-\xc0\xb2\x22\xf4\x1e\x34\x34\xcd\xab\xb5\x5e\xcb\x47\xc7\x70\x72\
-\x7a\x02\x27\x27\xa7\x70\x72\x7a\x0a\x27\xc7\xc7\x70\x74\x7c\x0c\
-\xeb\xb5\xd2\x9d\xbb\x4e\xe5\xdc\xa0\x5d\xcb\x42\x19\x9d\x0c\xd1\
-\x80\x5e\xcb\x1c\x57\x60\x8d\x97\x74\x84\x75\x48\x12\x67\x8d\x53\
-\x94\xd7\xbb\x1d\x0b\xdf\xdb\x6c\x14\x6b\x1c\xab\xeb\xb3\x39\x37\
-\xde\xaf\x0d\x6c\xb7\x9a\xa9\xcd\x12\x2f\x98\x10\x56\x25\x9b\xcd\
-\xbe\xee\xfa\x0e\xd6\x2b\x85\x1f\x4e\x4e\x8e\xe1\xf4\xf4\x14\x2e\
-\x9d\x9d\xc1\x63\x8f\x5d\x82\xc7\x2e\x5d\x82\x4b\x97\x2e\xc1\xc9\
-\xf1\xd1\x98\x87\x06\x27\x2d\xac\x69\x17\xe5\xfd\x31\x13\xc3\x00\
-\x0b\x60\x06\x21\x4d\x4c\xb0\xb4\x77\x06\x33\xe6\x33\xcc\x28\x78\
-\xe4\x68\x91\xcd\xe1\x63\x0f\x23\x47\xcd\xe7\x12\xda\xf4\x06\xd5\
-\x07\x14\xa7\x7a\x36\x34\xd0\x12\xcc\x67\x61\x5d\x4c\xbf\x70\xa6\
-\x63\xff\x70\x7f\x03\x7b\x1e\xf7\xd0\xa8\x8d\x9d\x49\x1b\x62\x56\
-\x45\xdf\x3a\x8b\x2e\x81\xb3\x82\x63\x33\xb6\xa1\x21\x2c\x2a\x22\
-\xb1\xce\x55\x4d\x35\xdf\xc3\x2a\x6c\x7c\x90\x17\x8d\x09\xa8\x96\
-\x21\x0a\x36\x07\xcf\xf1\xb0\xec\x85\x56\xa9\x70\x4a\xa2\x10\xa8\
-\x14\xe0\x0e\x95\x15\xbf\x13\xde\x0f\x76\x08\xd0\xa9\xef\x08\xeb\
-\xdd\x61\x80\x28\x59\x51\x38\xeb\xde\xa8\x1a\x0b\xca\xbc\xe7\x59\
-\xc8\xbd\x8b\xfc\xfb\x23\x37\x10\x30\x50\xc5\x29\x96\x9d\xd7\x84\
-\x17\xa4\xc4\xb4\x61\x2a\x08\xc7\x43\xf0\xc7\xd6\x07\xda\x41\x91\
-\x45\xbe\xaf\x8c\x87\x4b\x20\x5c\xbb\xfc\xbc\x03\x1f\x1d\x46\x79\
-\x2e\xd7\x6f\x5c\x57\x17\x0b\xc6\xc4\x8c\x41\xe1\x32\x1e\x56\x17\
-\x3e\x57\x7b\xdc\xb0\x03\x9d\xb8\x8a\x20\xcc\x7b\x02\x3d\x4f\x9b\
-\xc6\x7e\x9e\x97\x1a\x23\x1a\x6c\x5e\x84\x0d\x20\x3a\x71\x21\x0e\
-\x69\x85\x8c\x1d\x0a\x43\x4f\x13\x24\xe6\x86\x15\xa9\x54\x55\xb5\
-\xf5\xef\x8e\x7b\x0c\x5d\x3f\x5f\x7c\xfe\x17\xbd\xa2\x96\x21\x30\
-\xbd\x75\xeb\x8e\xa7\x68\x7b\xd5\x42\x59\xc8\x18\xf7\xfc\x01\x14\
-\x28\xa2\x53\xfc\x13\x21\x75\x33\x37\xb2\x20\xf8\x13\x09\x18\xc7\
-\xb1\xe3\x34\x19\x38\x7e\x66\x93\xef\x2a\xe1\xf4\x81\x15\x3f\x71\
-\x31\xe7\x80\x0e\x3e\xa0\x89\x0e\xf9\x6a\x96\x65\x6f\xdb\xaf\x29\
-\xaa\x85\x54\x10\x17\x7a\x5e\x8d\x13\xe5\x91\x38\x4d\x1e\xe5\x2b\
-\xa3\xec\x59\xf6\x33\xa3\x98\x6b\xe5\x5c\x0e\x03\xc8\x9d\xab\x4b\
-\x63\x0a\x59\xca\xd4\x0f\xd3\xcf\x8c\x17\x65\x30\xbf\xa5\xbe\x17\
-\x7b\x3f\xfa\xd1\xd7\xd8\x62\x99\xc3\x4e\x3f\x4b\x3f\x93\x9c\x21\
-\xc3\x24\x0b\x71\x63\x0c\xda\xda\x35\xe1\xd9\xd9\xa0\x9c\xa4\xca\
-\x45\xe0\x8c\x15\x80\x19\x2f\x8d\x27\xb0\xdb\x3c\x34\xb5\xcd\xe9\
-\xf7\xae\x68\x51\x42\x61\xf4\xc2\x6f\x69\xc4\x65\xd5\x62\xb7\x4e\
-\x5b\xe6\x11\xc7\x14\xb7\x44\xfc\x6e\x52\xb1\x1e\x4f\xac\x44\x4f\
-\x45\x49\xb7\xd8\xf3\x62\x18\x6f\x08\xf8\x96\x33\x24\x57\x4a\xcf\
-\x0f\x64\x08\xa2\x7e\x0c\xaa\x35\x5f\x02\xa1\x13\x4b\x29\xd1\x6f\
-\xca\xd6\x81\xb1\xe1\x6f\xd6\x22\xaa\x3d\x35\x36\x2d\x13\x40\x20\
-\xe9\x1c\x9d\x0a\xeb\x4c\x8a\x2f\x21\x01\x5e\xb0\xd6\x2a\x90\xa3\
-\x23\x2b\x2e\x7e\x4c\x83\xcd\x92\x5b\x2e\x91\x6f\x9a\x4d\xb4\x6b\
-\x5a\x99\xf3\x64\x71\xed\x3d\xab\xc9\x98\x43\xef\x2f\x66\x7a\x60\
-\xe9\xb9\x1d\x29\x86\x27\xa7\x38\xb0\x11\x81\xd2\xc5\x6f\x6c\x0a\
-\xe3\xe9\xdb\x90\x74\x0c\x46\x28\xfd\x47\x54\xe5\x56\x4d\x29\x55\
-\x4d\x61\x2e\x5a\x40\x9b\x8b\x61\x91\x2f\x0c\x3c\xae\x21\xfb\x98\
-\x5f\xb9\xcc\xb0\xff\x21\xf3\xa0\xf8\xeb\x88\x79\x51\x30\x94\xf7\
-\xe8\x59\x85\xd1\x23\xf7\x40\x96\x71\xe1\x34\x20\x1b\xda\x07\x00\
-\x57\x9f\x4e\xe7\x8f\xbc\x79\xf3\x0d\xe6\xd5\x40\x66\xcd\x0f\x3c\
-\x3b\x2e\x53\x41\xe7\x2b\x28\xb0\x24\x8c\xf2\xaf\x41\xa8\x02\x4b\
-\xa4\x1d\x12\x08\x28\x94\x42\x8b\x02\x95\x07\x05\xd5\xfb\xde\x22\
-\xe0\x39\x76\xa4\x0b\xec\xda\xbf\xdd\xe4\x70\x25\xde\xb1\x2d\x21\
-\x1b\x6b\xb2\x44\x2d\xfc\xc2\x24\x59\x03\x63\x51\x30\x8c\x6d\xa0\
-\xc1\x8c\xd0\x21\x90\x42\x04\xeb\x93\x51\xb7\xbf\x98\xc9\xe3\x79\
-\xfb\xed\xdb\xbe\x3c\x21\x3e\x33\x3e\xdb\x99\x2f\xb5\x2b\xec\x7a\
-\x04\x09\xf4\xcb\xd9\xb4\x5c\x61\x62\x2b\x64\xb9\x1d\x20\x3c\xcf\
-\xec\x5e\x34\x0c\x64\x5c\x2e\x63\xfb\xfe\x09\x64\x75\x48\xad\xbf\
-\x1c\xac\xf0\x59\xcc\xd4\x7a\x89\x19\xe5\x96\xc9\x3c\xf7\xe7\x09\
-\x17\xbe\x2d\xd6\x1c\x6b\x17\x49\xf7\x47\xdf\xc8\x33\x9e\xa5\x5c\
-\xd6\x69\x0f\x06\x58\x8a\xfb\x8a\x17\xb9\x09\xeb\x47\x29\x63\xb2\
-\x01\x35\xa6\x4e\x8d\xf1\x1c\x48\x53\x13\x30\xa4\x60\xc2\x18\x1c\
-\x85\x3a\x6e\xf8\x1e\x51\x7e\xe5\x09\x10\x20\xa5\x54\x39\x72\xc6\
-\xc0\xcc\xc2\xfc\x7d\x0d\xd3\xe8\x63\xc2\x1a\x54\xb8\x67\xbb\x94\
-\xb6\x81\x23\x1e\x42\xa2\x29\x8a\x4c\x6d\x62\xc8\xfe\x61\xb6\x98\
-\xd2\x3e\x5c\x62\x53\x62\xc5\x7d\x70\xae\x45\x05\x9b\x94\xd0\xd2\
-\x63\xb0\xe9\xb9\xe3\x42\x9b\x11\x6f\x58\x4b\x81\x0d\xaf\x90\x3e\
-\xf2\x1f\xb8\x47\x46\x92\xf3\xcc\xd8\x8d\xa8\x93\xdc\x74\x18\x88\
-\x09\x11\x92\x26\xbe\x99\xcc\xf5\xe0\x15\x44\x33\xde\x1d\x65\x05\
-\x90\x36\xe4\x48\xda\xca\xba\xe4\x55\xdb\xf5\x8a\x57\x8e\x58\x88\
-\x92\x9a\x64\x50\x17\xbb\xaa\xca\x66\x01\x32\x56\xcd\xa8\x67\x1c\
-\xc6\x8c\xf2\x5e\x09\x12\x66\x57\x71\x6b\xb7\xb4\x25\x5b\x4a\x75\
-\x26\x4b\x9a\x8a\x03\x1a\x36\x8c\xb3\xc8\x33\x6f\x8b\xd0\xae\x6e\
-\x21\x98\xf5\x5b\x87\xb2\xb0\x1f\x6b\xfd\x16\xe8\x1b\xe1\x71\xfc\
-\xc1\x63\xc9\xc7\xc9\xa9\xc2\xcc\x35\xa3\xd6\xec\xd0\xa2\x84\xfe\
-\x41\x02\xbe\xa1\x9c\x83\x19\x44\xee\xc5\x60\xde\x1b\xef\x80\x0d\
-\xbc\x99\xe1\xf1\x85\x69\x2f\x88\xf1\x2a\xdc\xfe\xd5\xb7\x93\x4d\
-\x7f\xeb\xce\x0d\xcf\x83\xe2\x93\x49\x22\x44\xd9\x6e\xe8\x5f\x8b\
-\xcc\x13\x84\x42\xff\x2d\x9c\x17\x88\x7b\xe7\x10\x99\xd7\x08\x38\
-\xfd\x7e\x10\xde\x65\xc7\x0c\xbd\x61\x45\x4c\xb4\x93\xef\x5d\xc1\
-\x41\x34\x1b\xeb\x28\xf7\x28\x50\x5c\x58\x3e\x17\x72\x30\xd3\x19\
-\xaf\x93\xbf\x26\x85\x00\xb8\x71\xe7\x46\x72\x3c\x6f\xde\xbc\xe5\
-\x7b\xce\x00\x7c\x8f\x49\xb0\x96\xc2\xad\x49\x34\x7e\x56\xf9\xde\
-\xb3\x44\xce\x0c\x06\xe1\xc8\x3c\xa7\x8b\xcf\x5d\xe0\xcd\xc1\x42\
-\xad\xd8\xc9\x61\x55\x9c\xad\x30\x70\x3f\xd1\xc4\x9f\x62\xb5\xd8\
-\x3a\x4b\x67\xb3\x98\xa6\xd8\xf2\x5a\xf5\xbd\x2a\x8f\x08\xce\xaa\
-\x13\xf8\x88\x7d\x4c\x0d\x3a\xd3\x05\x74\xd1\x20\x84\x0a\x3e\x16\
-\xea\x5c\x39\x1d\x87\xc0\x85\x9d\x82\x74\xa1\xd6\x04\x3e\xa1\x53\
-\xcd\x44\x44\x60\x26\x5a\xf4\x1c\x10\xf9\x85\xcd\x81\x85\x56\x7b\
-\x7b\x95\x45\x37\x60\xc0\x8a\x59\xc5\x07\x35\x79\x92\xdb\xf5\xf4\
-\x5c\x31\xcd\xe6\xbd\x12\x18\x78\x72\x5f\xe8\xa7\x6f\xb0\x32\x7c\
-\xe3\xc5\x22\x29\x52\x0a\x69\x81\xc2\xec\xf5\xb6\x83\x51\x62\x94\
-\x2a\x4a\x7b\x9a\xb9\x22\xf2\x02\xd3\xfc\x53\x4a\xdf\x9d\xcf\x03\
-\xa0\x30\xa5\xd4\x5a\x65\x81\x54\xd5\x03\x52\xdc\xe4\xd6\x93\x83\
-\x61\xe7\xfc\x3c\x0b\xf0\xf4\x62\x3f\x1f\x48\x32\x17\xa7\x25\xce\
-\x0c\x18\xa9\xa8\xe4\x0d\xc9\x79\xb5\x92\x93\x41\x10\x11\x98\x05\
-\x87\x5b\xc8\x95\x9f\xe3\xc9\xc7\xe4\x42\x4f\x84\x02\x95\xd6\x04\
-\x92\xa5\xb4\x46\x5c\x68\x19\xcc\xb6\x71\x4c\x68\x04\x2d\x0f\xc4\
-\xbc\x7a\x28\x3c\x84\xd3\x84\x19\x85\x0a\x16\xfb\x22\x91\xb6\x94\
-\x13\x57\xbe\xc8\xcb\xc5\xab\x2b\xbc\x39\x5e\x27\xa1\x89\x08\x89\
-\x6a\xee\x83\x71\xc1\x43\x4b\xdb\xeb\x3c\x4f\x00\xe4\x40\x00\xb3\
-\x06\xa2\x4d\xfe\x41\x7d\x48\x06\x24\xde\x9e\xb7\x0c\x59\x3e\x1a\
-\x2f\xa6\xe6\x2c\xef\x9c\x7c\x01\x3b\x84\x77\x7e\xfd\x96\x3b\x2f\
-\xa5\x04\x32\xb9\x2d\x1a\xc9\x85\xc0\xc5\x43\x07\xc8\xbc\x65\xa6\
-\x67\x48\x51\x78\x58\x58\xed\x99\x74\xce\x08\x0e\x81\xd5\x3f\x73\
-\xe0\xf0\x72\xba\xa4\xdd\x70\x88\x8c\xc1\x4b\x70\xef\x1e\x2b\x88\
-\x21\x39\x88\x1d\xa3\xdd\xd3\xb5\x88\xac\xc5\x11\xad\xc7\xc9\x00\
-\x6e\x1e\x2e\xe7\xb8\xf1\x99\x27\x88\x08\x6e\xdc\x7a\x53\xa7\x34\
-\xa2\xb3\x89\x7a\x80\xd6\x2d\x58\xc5\x40\xc7\x3d\x68\x73\xab\xb8\
-\xfb\x84\x2a\x7e\xd9\x00\x26\x44\x91\xfc\x10\x3f\x1e\xb6\x27\xf5\
-\x78\x5a\x7a\x55\x8c\xad\x73\x53\x64\x00\x8d\x29\x70\x0b\x1c\x97\
-\x25\x0e\x60\x72\x7d\xdf\xa7\x16\x3d\x76\xf7\x05\x55\xa5\x0b\xff\
-\xc2\x3d\x5f\xbf\x17\x87\x4d\xb2\x16\x57\xa2\x75\xe4\xe7\xe6\x5a\
-\x22\x24\x46\xac\xe4\x9d\xa3\x08\x49\x0f\x8d\x62\x1f\xa4\xb6\xf9\
-\x46\x2c\x9e\xd9\x61\x04\x13\x86\x61\xdf\x10\x86\x24\x07\xfe\x19\
-\xdc\xcf\x84\xd0\xbe\x56\x02\x8d\xd7\xff\x1b\x4b\x15\xe9\x47\xcd\
-\x0f\x4b\x2d\xd3\x40\x51\xb7\xce\xb8\x2a\x7f\x7c\xaa\x74\x58\x7a\
-\xe5\x10\xb4\x53\xee\x12\x2d\x37\x8b\x14\xae\xd3\xe2\xe1\x11\x57\
-\x12\x73\xd6\xa2\x80\xd5\x0b\x52\x8c\x79\xe6\x30\x15\x00\x28\x55\
-\x52\x3b\x48\x20\x53\x32\x30\x1a\x30\x56\x5f\x06\x12\xc5\x33\x79\
-\xf1\x28\xf6\x75\xb5\xc8\x62\xf8\x32\xee\xca\x1c\x67\x95\x89\x42\
-\xf0\x92\x00\x98\x85\x50\xf0\x03\x2d\xa0\x27\xcd\xe5\x2e\x39\x25\
-\x03\xab\xb7\x5c\x18\x6a\xb6\xaf\xe3\x13\x67\x8b\x95\x20\xee\x83\
-\x1a\xd0\xcb\x62\xf4\x67\x61\x41\x5c\xdf\x13\x40\x51\xf8\x1a\x30\
-\xb0\x7c\x01\x4e\x66\x4c\xf7\x27\x59\xed\xc5\x00\x0d\x62\xeb\x11\
-\xd9\xd5\x89\x70\xb0\xb0\x98\x2e\x00\x02\x4a\xb3\xb0\xb8\xab\x2b\
-\xcc\x1f\x61\x81\x71\xc8\x40\x94\xcd\x9f\xd1\xf9\x4a\xec\x59\x66\
-\x7f\x90\x00\xad\xcc\xe6\xd0\x7f\xc8\x4e\x68\x40\x8d\xa3\xa1\xc6\
-\x90\x79\x4b\xb0\x8d\x2f\x43\x05\x81\xb2\xc6\x05\xff\x90\x65\xc4\
-\x0f\x3c\xd0\x8d\x81\x19\x05\x6c\xd0\x37\x80\x49\xb4\x75\x6e\x78\
-\xeb\x7d\xcf\x57\x00\x6a\x80\x33\x6f\x23\x80\x20\x0b\x62\xec\xb8\
-\x21\xda\xca\xf4\x26\x24\x52\x10\x81\x34\xf3\x22\x03\xfd\xc3\x03\
-\x5c\x04\x49\x1c\x07\x71\xbd\x1d\x1e\xd2\x58\xc5\x82\x1b\x26\xf1\
-\xf2\x50\x3d\xde\x4f\x03\x66\x84\x4f\x0a\x00\x40\x20\x24\xc2\x20\
-\xf4\x9e\x23\x8a\x0d\x4c\xd8\x72\x56\x8e\x6b\x69\x34\x4d\x74\x44\
-\x67\x31\xa2\xab\xb7\x73\x51\xb3\x33\x68\xc4\x84\xd7\x22\xe8\xe9\
-\x82\xf5\x12\xdb\x83\x26\x1e\x39\x90\xc9\x06\x2c\x04\x1e\x02\x0c\
-\xc1\x08\x82\x57\xaa\x84\x92\xda\x19\x39\x19\x09\x89\xdc\x3e\xfe\
-\x28\xa3\x5f\xa1\x5f\xf3\xce\xa9\x2e\x09\xa6\x45\xee\x65\x89\x18\
-\x3f\x19\x97\x19\x23\x89\x12\x00\x1e\x71\x11\x2e\x15\xcd\x95\x5a\
-\xc0\x4d\xa1\x67\xbe\xbf\x72\x82\x0d\xb1\xf2\xf8\xc6\x64\x38\x47\
-\x5f\xaf\x5c\x51\xd9\x2c\xc3\x5d\xed\x19\x84\x40\x55\x0a\x14\x15\
-\xb7\x39\x55\xc8\x09\x0a\x3d\x19\x05\x85\x74\x69\xc3\x09\x4e\xbc\
-\xda\x6e\x1c\x4a\x70\x8c\x13\x65\xfa\x8e\xac\x54\x9b\x00\xa9\x7f\
-\x23\x2b\xf8\xe6\x0a\x60\x92\xc7\xd6\xe6\x2c\x10\xe0\x17\x4c\x23\
-\x7f\x13\xb3\xfa\x99\x0b\x09\x31\x67\xd1\xf4\x2d\x11\x8d\x96\x74\
-\xaa\x29\x54\x99\x07\x33\xb9\x2a\xe9\x5e\x7f\x03\x8b\x01\x35\xcc\
-\x73\x8d\x0c\xc0\x3d\x0a\xf5\x7d\xad\xf3\xec\xd4\x90\x8e\xef\xf7\
-\xf5\x7c\x3f\xc8\x90\x31\x03\x56\x1b\x12\x96\x34\x77\x8e\xac\xab\
-\x1a\xee\x3c\xaf\xf6\x92\xc9\xcf\x20\xe3\x11\x40\xcb\x74\xc5\x19\
-\xc1\xac\x41\x99\x02\xa5\x2d\x65\x1c\x08\xac\x04\xbc\x9e\xaf\xb5\
-\x3c\xa2\x53\x62\x6d\x18\x98\x70\xca\x88\x04\x04\xec\x08\x50\x22\
-\x90\x20\xf0\x34\xfb\xf0\xf0\xcb\x15\x94\xc4\x8c\x45\x0c\xd3\xed\
-\xcc\x79\x44\x93\x40\x11\x81\x95\xcb\x04\x3f\xaf\xbd\xc3\x80\x7d\
-\x8c\x7b\x3f\x8c\x77\x0b\x5c\xd1\xf8\x2a\x0b\x28\xf9\xe1\x6e\x9d\
-\x9f\x50\x6b\xc0\x8f\x04\x95\x13\x44\xd2\xcf\x15\xcb\x0d\x53\xb4\
-\x16\x71\x64\x6d\x4e\xa0\x49\xf7\xac\xcd\x56\x8e\xa3\x05\xb6\xb6\
-\x1f\x7c\xbd\xe9\xb6\x98\x31\x43\xc9\x3c\x39\x14\x1b\x8f\x70\xc2\
-\xe6\x21\xd8\xa3\x90\xa9\x9a\xd6\xc3\xa9\xcf\xad\x75\x0a\x67\xe9\
-\x84\x17\x02\xd1\x54\x82\x1a\xbc\x80\x70\x33\x95\x6a\xcb\xe4\x67\
-\x32\xcf\x61\x94\xb0\x28\x14\xca\x98\xac\xbd\x67\xea\x83\x45\xb9\
-\x5f\xc4\x90\x62\x52\x87\x03\x3f\x4c\x94\x81\x18\x4c\xf1\xa9\x30\
-\x2f\x71\x64\x34\xca\x39\x67\xb0\x61\x87\xb7\x2c\xe0\x0b\xb6\x00\
-\x7a\xc8\xda\xd5\xf6\xd3\x72\xca\xfe\x41\x05\x29\x89\x45\x80\x83\
-\x15\x6d\xc4\x45\x1a\x5d\xa5\xae\xdb\x6a\xcf\x59\xad\x2d\xeb\xf9\
-\xc2\x08\x28\xe6\x8a\x49\x9a\x63\xd8\x84\xbb\xf0\x71\x22\x04\x10\
-\x84\xce\xb2\x1b\x79\xc7\x28\xe9\xa5\xe1\x60\x26\xed\x13\xc3\x20\
-\xe4\xad\x72\x6c\xa9\xde\x2e\xe5\xb9\x79\x3d\xd0\x05\x10\xf2\x34\
-\xce\xc9\x57\x53\x91\x65\x4e\x21\x35\x61\x30\xc6\x1a\xca\x41\x70\
-\x0a\xd4\xd1\x02\x72\x77\xf9\xb5\x48\x0b\xb6\xae\xa6\x72\x27\xd9\
-\x24\x70\x07\x68\xc8\x5a\xef\x29\xa4\x2d\x07\xb0\xf5\x8e\x6c\xbc\
-\x72\xe0\x8c\xa4\xda\xf1\x29\x36\x11\x5b\x85\x50\xf2\x5b\x98\x8b\
-\x8c\x47\xcf\xd1\x60\x4e\x2f\x47\x3d\xcc\xc3\xc1\xf4\x2d\x48\x57\
-\xf2\xb4\x05\x65\x8d\x37\x0d\x47\x94\xe6\x08\xcc\xe8\x30\x2d\xc1\
-\x92\xc1\x59\x4e\x92\xa9\xdb\x61\x3d\x12\x52\xcf\x43\x52\x84\x06\
-\x1e\xa4\x38\x38\x29\xab\xca\x59\xd9\xc2\x49\x11\x72\xd4\xa6\x01\
-\xdd\xb5\xaf\x10\xb1\x3a\x30\x1d\x07\x82\xec\x39\xd2\xed\xd1\x54\
-\x3d\x49\xc4\x60\xf0\x30\x4d\x4a\x82\x81\xb7\xc9\x84\xa0\x79\xdc\
-\xcd\x16\x24\x30\xa7\x46\x41\x74\x23\xb9\xc2\x8f\x55\x45\xe9\x66\
-\xd4\x26\x41\x72\x4b\x8d\x83\x5a\xce\xd0\xe6\x7f\x45\x93\x37\x08\
-\xd4\x61\x7b\x94\x61\xa6\xa9\xcb\xe6\x26\x3a\x3c\x78\x89\xc1\x0c\
-\x8e\x80\xcc\x36\x19\xea\x9d\x03\xf6\xd4\x0b\x15\xd1\x05\x24\xe8\
-\x01\x8a\x53\x2e\x76\xab\xca\xb9\xc5\x0b\xe0\x5a\xa2\x29\x63\x83\
-\x8c\x99\xd2\x2c\x24\xc4\xa4\x5c\x41\x4a\x18\x9e\x3c\x42\x17\x47\
-\xf4\x82\x0c\xd4\x10\x99\x62\xcb\xcc\x57\x4b\x99\xf5\x8c\x3c\x87\
-\x11\x83\x42\xd5\x9c\xc1\x11\xbd\xda\x86\x29\x81\x82\x55\x56\xfe\
-\xf2\x18\x8d\x16\x54\x6d\x55\xb4\x12\x7b\x2e\x04\x91\xb4\xd0\x7a\
-\xef\xeb\x17\x0a\x55\x3d\x3c\x12\xeb\x11\xfb\x03\xfb\x37\xe5\xfa\
-\x9c\x0b\x31\x4b\x77\xab\xe6\xba\xd4\x35\xe3\xe1\xfa\x99\x42\x23\
-\x5e\xc1\xb1\xfa\x85\x53\x4e\xa4\x77\x71\xe5\x1e\xa2\x27\xff\x04\
-\xe2\x7f\x21\xa1\xb5\x04\x70\x2b\xac\xfa\xda\x78\xf0\x5d\x78\x40\
-\x51\x42\x6d\x41\x4c\x24\x0c\x67\xdc\x7d\x15\x24\x70\xe3\xb3\x44\
-\x05\x30\x43\xa5\xb5\x39\xbd\x82\x1c\xb7\xac\x38\x6b\x38\xb9\xbc\
-\x0f\x84\xbc\xa7\xea\x51\x1c\x3c\xa3\x8a\x45\x85\x39\x62\x66\x48\
-\xa9\x1d\x0f\x09\x40\x42\x7b\x06\x58\xdc\xbe\x52\xba\x28\xb9\x77\
-\x5c\x3d\x16\x9f\xaa\x35\xc2\x19\x58\x58\xb4\xb4\xc4\xe8\xce\xb5\
-\x9b\xb2\x50\x33\xa1\x57\x61\x07\x1e\xcd\x31\x70\xab\x1d\xaa\x60\
-\x50\x45\xca\xa1\xdf\x97\x95\xad\x0b\xd2\x5e\xdc\xc1\x0c\xbe\x97\
-\x5f\x68\x8f\x91\x4c\x40\x0c\x2c\x56\x67\xb2\x21\xac\x2e\x60\x8a\
-\xbc\x02\x66\x53\xbc\xcf\x98\x3a\x2d\x19\xa3\x17\x9a\x5c\x1d\xe6\
-\xd5\x42\x21\x7c\x72\x3c\xc3\xee\x65\xc2\x90\xa8\x5e\x9b\xf5\xaa\
-\xb8\x07\x21\x74\x9c\xc4\x80\x33\x1f\x23\x8b\x04\xf4\xda\x0a\x09\
-\x8d\x66\xe9\x0d\x8e\xa1\xf1\xc8\x85\xe6\xf1\x30\x31\x57\x53\xc7\
-\x11\x35\xa8\xba\x42\xa6\xb9\xe4\x6a\x38\x49\x5d\x53\x48\xc6\xe0\
-\x0b\xc3\xfa\x5c\xd9\x0e\x94\xcd\xf6\x34\x4b\x90\x61\x5a\xb6\x3c\
-\x6a\xc5\x7e\x8f\xce\x83\xf0\xe8\xba\x50\x61\x67\xdc\xa3\x01\x6d\
-\x91\x09\x17\xa9\xfd\x34\xb6\x2a\xd0\xcf\x55\x43\x56\x8e\xc0\x17\
-\xba\x09\xab\x08\x07\xd7\x1e\x8b\xa3\x61\xba\x44\xa7\xcb\x18\x0f\
-\x73\x66\x51\x23\xa7\xfe\xf7\x88\x3e\x84\xcb\x8d\x41\xbf\xa8\x72\
-\xf8\x53\x9c\x9b\x86\xc5\x45\xad\x9b\x2c\x63\x1c\x4c\xb3\xe8\x42\
-\x43\x38\x4e\xe9\xb9\x79\x17\x46\x9f\x6b\x67\xf3\xc2\xe5\x61\x17\
-\xe6\xdf\x14\x56\x3e\xa2\x98\x51\x24\xe6\x82\x99\xa4\xa2\x52\xe6\
-\xdc\x9c\xd0\x91\x51\x21\x14\x29\x1a\x13\xa4\x39\x32\x26\x1b\xe4\
-\xcc\x49\xa4\xe2\xc9\x6d\xbd\x36\x16\x37\x0e\x14\x5b\x1a\xa2\x0a\
-\x60\x58\x23\x52\xcd\x86\x34\x0a\x8c\x3e\x00\x03\x4a\x4f\xaf\x7e\
-\x03\xcb\x3e\x45\xdc\x87\x93\x80\x3c\xa6\x1b\xaf\x46\x48\x90\xe7\
-\x93\xd3\xec\x95\xce\x88\x5e\xbc\x61\x14\xb2\x92\x5a\x33\x26\x21\
-\x1a\x11\x66\x99\xe5\x1a\x56\x18\x4e\xfd\x22\x4c\x59\x8c\x4b\x98\
-\x18\x13\x4d\x91\xa0\x43\x74\x78\x44\x4c\x40\x5d\x1c\x86\x16\x1a\
-\xf0\x62\xeb\x2f\xa5\xab\x80\x8f\x29\x37\xb4\xd8\x4c\xb4\xdc\x13\
-\x8b\x6f\x7b\xdb\x31\xf0\xd0\x00\xa1\x57\x48\x14\x25\xcf\x0b\x4b\
-\x6c\xdf\x31\x76\x19\xce\x06\xc6\xc3\x8d\x28\xb2\x94\x2c\xa7\xec\
-\xe5\x38\xc4\x2b\xc0\x31\x4f\x70\xb7\xc6\x02\x67\x82\xf4\xbd\x4d\
-\x1d\x8f\x16\x43\x6b\xdb\x41\x72\x80\xcb\x02\x41\xac\x68\x63\xc0\
-\xa6\x06\x5c\x19\x10\xac\x5d\x92\xac\x59\x96\x87\x7a\x15\xcf\x11\
-\xee\x01\x9f\x2d\x32\x2a\x2a\x6f\x1b\xc0\x69\x99\xe7\x74\x5d\x27\
-\xc1\x00\x9a\x01\x60\xc4\xd6\x60\x30\x4f\x08\x15\x0a\x5f\x8b\x48\
-\xa0\x29\xc2\x6b\xdc\x82\x41\x94\x57\x04\x3f\x1a\x30\xe6\x70\x3a\
-\xfc\x5f\xed\x07\x2e\x21\xe9\x79\xd1\x71\xf4\xd8\x26\xa3\x22\xae\
-\x42\x00\x6a\x1a\x65\xb3\xbf\xbd\x6d\x84\x41\xe2\x5e\xc0\x46\x48\
-\x01\xb0\x31\xa4\x4a\x69\x11\x82\x8c\x0d\x93\x15\x91\x45\xb0\xc5\
-\x31\x01\x58\x11\x65\xaf\x2d\x71\x7c\x30\x1e\x74\x4c\x73\xef\x3b\
-\xa3\x09\x51\xa8\xeb\xd3\xde\x16\x5e\xbf\xef\xb5\x6a\xeb\x3c\x50\
-\xa8\xeb\xa6\x3b\x46\x7b\x9e\x00\x2c\x09\xe8\x66\x17\x5b\xc9\x62\
-\x45\x59\x9b\xa6\x0d\xec\x30\x95\xcf\x4d\xc5\x6e\x89\x8a\x82\x47\
-\xc7\x3c\x93\xa7\xd0\xa5\x34\x3b\xf4\x36\x44\x22\xd8\x32\xb0\xcc\
-\xea\xf8\x6b\x03\x92\x34\x60\xd2\xc1\x09\x10\xc6\x8d\x3b\x0b\xb0\
-\xf0\x63\x3a\x8b\x26\xfb\xd9\xc8\x06\xbc\x42\x45\x09\xb6\x0f\x2a\
-\xd6\x1f\x4a\x50\x65\x8c\x14\x93\x61\xc4\x66\xbe\x22\xe3\x97\xa8\
-\x58\xd4\x4b\xb3\xc8\xbd\x32\xb2\x61\x2f\xf1\xda\x89\xc8\x50\xd2\
-\x1e\x1a\x40\xb2\xb5\x64\x4c\xe8\x06\x85\x4e\x3c\x2f\xac\x8c\x02\
-\x60\xe3\x53\xbf\x62\xc9\x02\x8e\x9c\xb9\x69\xff\xc2\x1a\x73\x5a\
-\x33\x7a\x6c\x15\xd6\xcb\xc0\x0b\x5e\x7a\xc4\x00\xa4\x32\xdd\x90\
-\x54\x6e\x0b\x08\xad\x9c\xcb\xdc\x42\xc6\xe2\x84\x62\x68\xd3\xf0\
-\xc0\x05\x4b\xc0\x47\x4c\xc6\x6e\xd7\x9d\x50\x0d\xe6\x2d\x4a\x7d\
-\xab\xcc\xe7\x69\x3d\xcd\x3c\x44\x4f\x17\xee\xf4\x42\x76\xc9\xe4\
-\x81\xb0\x70\x20\xbd\x51\x31\x63\xb9\x63\x58\x31\x2e\x38\x59\xe0\
-\x45\x37\x1e\x69\x1a\x89\xa9\x1d\xab\x8a\x35\x69\x6b\x63\x06\x1f\
-\x86\x6d\x0c\xe4\xb3\xad\x13\x64\x88\x15\xc8\x6c\x4b\x3e\xb6\x00\
-\x30\xf0\x06\x1f\x32\xab\x6b\xad\xe1\xee\x00\x00\x20\x00\x49\x44\
-\x41\x54\xe3\x23\x4c\xf1\x35\x53\xf5\xaa\x22\x4a\x98\xe9\x9e\xc1\
-\x3d\x4f\x17\xee\xa1\xcd\x0b\x1f\x49\xcd\xdd\x42\x0f\x4c\x08\x05\
-\x1c\x18\xa8\x10\x88\x20\x85\x60\xe1\xfc\xe0\x79\x4b\x1c\xcb\x58\
-\x2c\xd7\xd4\xd9\x8e\xb6\x66\x1f\x41\xa8\x87\xc5\xe3\xab\x9e\x29\
-\x6c\xe1\x62\x55\xf2\xa0\xd3\xde\x6a\x04\xa1\x7f\x73\x06\xcc\x48\
-\xcd\xab\x38\x4a\x9a\x8c\x16\x29\xc3\x15\x55\x8c\x7d\xe8\xc8\xc8\
-\x98\xa3\x93\x6f\x04\x8a\x51\x92\xb5\xb6\xa0\x1e\xf4\xf9\x1d\x82\
-\xd9\x7f\x8f\x89\xc2\x88\x78\x38\x34\xbf\x52\x09\xe4\xd4\xc2\x82\
-\x71\xd9\x60\xe3\xd5\x59\xf3\x69\x82\xc0\x4d\x95\xd4\x8c\xf2\x34\
-\xc3\xfb\xd5\xf0\xcf\xa1\x2b\x74\x27\x00\x41\xb2\x2a\xe0\x86\x6e\
-\x14\x91\x27\x50\x53\x34\xab\xfe\xe1\x66\x42\xc4\x84\x3a\xc4\x00\
-\x13\x75\x2e\x48\x3f\x42\x59\x10\x48\x03\x9c\x28\xda\x8d\x9d\xf0\
-\xc6\x4a\x60\x36\x17\x06\x14\xb6\x91\x77\x6c\xc2\xf9\x45\x01\xa3\
-\x1b\x51\xfa\x34\xa0\x0a\xa6\x1d\xf4\xc6\x5f\xaf\x21\x02\xbf\x68\
-\x60\xe4\xad\xa1\x58\x79\x25\x9a\xea\xe6\xab\x3b\xd7\x5b\x0e\x05\
-\x6a\x14\x46\x73\xef\x37\x9a\x42\x43\x2c\x22\x92\xd9\xdf\x0d\x53\
-\x16\xe6\x85\x9d\xdd\xf3\x52\xdf\xa9\xe1\x64\xa2\x52\xfe\x54\x2b\
-\xf3\x47\x15\x5d\x73\x15\xbe\xf0\xa3\x12\x18\x6d\xb3\xcb\xa1\xd1\
-\x60\x06\x19\xf3\x16\xe4\xf3\x4e\x47\xdb\x59\xf2\xe0\x60\xa6\xbd\
-\x09\xe6\xde\xaa\x05\x94\x03\x59\xd9\x01\x88\x04\x5d\xf6\x19\x9c\
-\x06\x1a\x59\x6d\x1b\x10\x4e\x60\x13\x11\x40\x07\xda\x23\x38\x96\
-\x96\x38\x9e\xd1\x8a\x21\xb8\x09\x48\x1a\xb2\x77\x0a\xc6\xd7\xb1\
-\xdd\x4d\xd5\x2e\x5d\x78\x1f\x15\xcf\xe0\x20\xb7\xc9\xab\x37\xe3\
-\x87\x9e\x71\xc0\x8f\x12\x7c\x0a\x24\x0e\x6e\x9b\xf1\x0c\x4d\x24\
-\xf1\xb8\x58\x36\xfa\x49\x7b\x7f\x22\x80\xa0\x09\x2d\xfc\x2b\xe5\
-\x67\x5a\x04\xe5\x2f\x87\x91\x53\xf4\xf8\xce\x3b\x22\x40\x84\x3f\
-\x92\xb4\x2e\xc6\xca\x31\x7b\xf9\x2d\xe9\x22\x4e\xc8\x12\x6f\xb9\
-\x06\x9b\x2d\xac\xa9\x8d\x28\x22\xd5\x06\xf3\x83\x42\x95\xe4\xb0\
-\xa0\x46\xf8\x85\x8b\x93\xc5\xb0\x70\xfe\xf0\x57\x50\xbc\x53\xc1\
-\xc2\x4a\x19\x2e\xb1\xec\x91\xdf\x6a\xe5\x2d\xd6\xa1\xa9\xaa\xa2\
-\xd3\xae\xa8\x72\x26\x2d\xf7\x1b\x20\xe7\xe1\xa0\x84\xba\x39\xbb\
-\x86\x6f\xa9\x18\x0d\x4d\x9c\xe0\xd1\xb0\x1c\xb6\x98\xf9\x64\xdb\
-\xa2\xd7\x1a\x18\x08\xe5\x21\x11\x24\x6c\x92\xbe\x0b\xd7\x43\xe6\
-\x41\x88\x89\x01\xbc\x22\x6c\xac\x88\x1d\x06\x9b\xcf\xb3\x20\x80\
-\x03\x31\x96\x1c\x00\x63\x9b\x2a\x4f\x54\x13\xe8\x6a\x2f\x78\x9b\
-\x87\x21\x6a\xee\x52\xa5\x82\xd5\xb7\xc8\x52\x53\xa0\xcf\xa1\x74\
-\xa2\xcf\x88\x19\x73\x3e\xfb\xf8\x22\x74\xee\x35\x4a\xf5\xc2\xa7\
-\x19\x26\x74\xca\xa4\xde\x39\x1a\x42\xe8\xc6\x9f\x87\x8c\x52\x68\
-\x35\xa0\xa0\xd2\x7c\xc1\x78\x93\x04\x32\x3c\xe9\x39\x2b\x8d\x0a\
-\xe9\xd7\x38\x0e\x46\xa6\x2a\x2a\x58\x5a\x05\xe1\x59\x82\x3e\x9d\
-\xae\x7a\x5f\xaf\x5d\x69\xc2\x1c\x28\x5b\xd3\xa0\x0d\xa9\x62\x3e\
-\x94\x28\xe5\x8e\xc6\x76\xed\x9b\x3c\xaa\x20\x6c\x1b\xc0\x0a\x26\
-\x32\x0c\xc7\x02\x59\x08\x9d\xa6\x6b\x36\x34\xd2\xb6\x3e\x0e\xa5\
-\xd7\xb1\x02\x26\x58\x65\x55\xc1\x60\x6c\x30\x83\xc1\xd2\x3e\xa7\
-\x4a\x44\x80\xd3\x45\x43\xb4\x04\x12\x64\x4b\x36\xe4\x50\x17\xa8\
-\x75\x9e\x2b\x43\x85\x8d\x10\x32\xc2\x4e\xb3\x80\x94\x0d\x0c\x0b\
-\x4a\xab\x60\x79\xe0\x62\xa2\x76\x6f\xca\x75\xee\x11\x54\x49\x16\
-\x85\xd3\x41\xcd\x23\x05\x40\xa5\xc6\xd2\x1e\x9f\x39\xe9\x2b\x14\
-\xe8\x20\xce\x23\x63\x41\x43\x27\xa0\xeb\x3a\xe8\xba\x5e\x17\x16\
-\x57\x7b\x46\x7a\x86\x55\x96\x57\x5c\xb1\x3e\x7d\x9d\x88\xb2\x67\
-\x8b\xf1\xc2\x08\xfd\xfc\xbe\xeb\xa0\x33\xed\xd1\x6d\x13\x9d\x60\
-\x9e\x1a\x9e\xf3\xe6\x33\xa0\x21\xa6\x0c\xde\x87\x03\xb0\xae\x60\
-\x7c\x6a\xd2\x28\x62\x3b\xf5\x14\x83\xc0\x43\x33\xca\xa6\x48\x45\
-\x40\x33\x7f\xa7\x10\xa5\x26\x8f\xb3\x68\x31\x76\x6f\xf2\x95\xa6\
-\xbd\x5b\x80\x52\x05\xbb\x9a\x6c\x69\xf9\x53\x80\xbf\x4b\x26\x94\
-\x8b\x7c\xe5\x8b\x82\x8d\x61\x0a\xa3\x01\x28\x77\x23\x69\x7a\x28\
-\x94\x04\x84\x8e\xed\xcb\x2f\xdb\xc1\xcb\xdf\x81\x07\x68\xb8\x57\
-\x05\x3d\x65\xc9\xcf\x2b\x41\x96\xa3\x82\x9c\xdd\x83\x62\xd3\xa9\
-\x75\xb1\x0a\xb4\x16\x82\xe8\xc0\x27\xf0\xd9\x3c\x12\x03\x8c\x23\
-\xd0\x00\xc3\x52\x09\x63\xca\x6c\x06\xb0\xe0\x58\xc2\xae\x47\xa1\
-\x78\xc0\xe3\x20\xb4\x4c\xb7\x1c\x10\x4d\x71\x91\xf5\x5a\x4a\x7d\
-\x11\xbc\x04\xfb\x55\xe0\xaa\xa4\xd0\x1d\x1a\x51\xb9\x07\x0f\xa2\
-\x94\x09\x07\xe3\x7b\x67\xba\xb7\x0c\x35\x2a\xfa\x4c\x4f\x29\xd6\
-\xa7\xb1\x24\x94\x94\x2b\xdc\xec\x3d\xc1\x62\xb4\xa5\x66\xbc\x49\
-\x91\xd4\x50\x68\x9c\x62\x09\xe8\x2d\xf1\x14\x23\xb4\xc1\x3c\xcd\
-\x3c\xcb\x0a\x86\x23\x47\x01\x95\x0d\x09\xe8\xb9\x11\x3c\x47\xb4\
-\x57\xe4\x33\xe0\x06\x50\x57\x0b\xe6\x6d\x30\x4b\x41\x27\xb3\x5b\
-\xaf\x17\x5f\x1e\x4c\x53\xe7\x11\xec\x8e\xdd\x11\xdc\xba\x2d\x95\
-\x72\x2f\x8e\x59\x6c\xe7\xc4\x19\x2b\x2e\x97\xbd\x42\x19\x63\x4c\
-\x18\x02\x10\x0c\x6f\xe4\xa9\x81\xa0\x16\x4f\x2a\xc5\x72\xc9\x68\
-\x33\xaf\xa0\xe0\x3e\x8e\xec\xea\x1c\x9a\xb1\x1b\xe1\x88\x69\xf8\
-\x11\xa1\x05\x6c\xc3\x09\x17\x06\xcc\x2c\x0c\x3a\x26\x19\x94\x1b\
-\x77\x21\x79\x06\x20\xb4\x61\x5e\x0a\xc4\x74\xd0\x77\x3d\xf4\x7d\
-\x0f\xc3\xa0\x0a\x6b\x02\x22\x48\x29\x34\x81\x0d\xf9\x20\x3b\x11\
-\x72\x86\x5e\xe0\x3b\x15\x8c\x79\xb1\xee\xc3\xdb\xd2\xf7\xbd\xfd\
-\xe9\xba\x0e\xba\xbe\xf7\xc1\x8c\x8d\x94\xe1\x67\x45\x3a\x97\x67\
-\x89\x25\x59\xcc\x9b\x4b\xb1\x95\x25\xab\xb0\xd0\xa4\x4d\x87\x8d\
-\x0b\xbf\x9f\xb2\x61\xa8\x76\xf3\x51\x68\xe5\x73\x6c\x46\xc4\xab\
-\xb3\x5a\x30\x43\x15\x4c\x47\x6d\x8a\x28\xa5\x0e\xe4\x19\xbb\x2e\
-\xf4\x13\xd9\x9c\x81\x64\x32\x73\x99\x19\x4e\x1d\x2e\x02\x10\xa4\
-\xae\x58\x2d\x54\xc8\x8e\x60\xaa\x7b\x58\x34\x20\x69\x5e\x0c\x92\
-\x8a\x79\x05\xf0\x84\xb9\x9a\x58\x81\x26\xcf\x02\x4f\x98\xb4\x8e\
-\xa9\x0d\x27\x58\x35\x6a\x8c\xc9\x17\x2c\xb3\xda\xc8\xf0\xe2\xb8\
-\xa4\xc2\x40\xd7\xe4\x40\x06\xb1\x54\xc8\x2f\xa3\x6d\x62\x0a\x54\
-\x3d\x82\xc3\x21\xc8\x27\x99\x46\x0c\xd0\xa0\x8d\x54\xd2\x34\x36\
-\xb9\xa0\x42\xab\x23\xc5\x20\x86\x8a\x85\x5d\x68\x44\x42\x3e\xc2\
-\x63\x1a\x33\x40\x09\x63\x5d\x33\x52\x0c\xc3\xc8\xaa\x30\x4f\x83\
-\x85\x09\x39\x30\x4d\x49\xa0\x9b\x88\x36\x9a\x6e\x29\x2d\x29\xea\
-\xbc\x7e\x65\xd5\xb2\xc2\x34\x6f\x71\xae\xa1\x18\xa6\xaf\x1a\x32\
-\x00\xb4\x9e\x3d\x8c\x34\x6e\xf4\xf2\x80\x0c\xa5\xae\x35\x42\xb0\
-\x1c\xad\xd4\xe3\xda\x69\x31\x46\xac\x0c\x86\xb4\x01\xfc\x0a\x9e\
-\xd5\x61\x7c\xf9\x2c\xfc\x04\x70\x0a\x3c\x41\x98\x93\x67\xcc\xd3\
-\x1f\x82\x68\xf4\x6b\xfb\xb4\xc4\x4f\x11\x67\xb7\x5b\x74\x1f\x4e\
-\x47\x50\x55\x60\xa6\x86\xf8\x02\xcb\xc4\x0d\x25\x03\xd3\xe4\x88\
-\xc2\x49\x0a\xca\x47\x1c\xcc\xe4\xa6\x1b\xf7\xfc\x98\xa2\x21\x94\
-\x15\xba\xb5\xe0\x21\x00\x33\xfd\x0a\x56\xfd\x16\x86\xd5\xca\xb2\
-\x29\x8a\x1d\x82\x94\x12\x24\x51\x6c\xec\xc2\x84\x79\xa3\xb0\x56\
-\x4b\xa0\xdf\x00\x24\x21\x04\x74\x9d\x80\xbe\xef\x61\xb5\x5a\xc1\
-\x6a\xb5\x82\x7e\xb5\x82\xbe\xeb\xa0\x17\xda\x53\x23\x04\x63\x45\
-\x0b\x88\x0d\x82\x3a\x69\x87\x45\xb0\xc4\x2c\x9b\x10\xb0\x01\x27\
-\x74\xd9\x19\x87\x59\x49\x8f\xeb\xe3\x43\xce\xb7\xfe\xb7\x88\x27\
-\x57\xc3\x31\x70\x25\x79\x09\xc5\x89\xba\x2a\x4d\x25\x86\xa7\x70\
-\x9f\x4d\x51\x3c\x31\x02\x40\x91\x75\x8c\xfc\xd3\x2c\x74\x31\x13\
-\x41\x3e\x06\x11\x79\x61\x4c\x0c\xa8\x9b\xc9\x4f\x78\xa5\x0a\x74\
-\x10\xe6\xd3\xa4\x34\x30\xfe\x27\x2b\xfe\x64\x99\x84\x32\x15\xd3\
-\x81\x85\xb1\xf1\x62\x4e\x91\x42\xbb\x98\xbe\x6f\x84\x0f\xd9\xf0\
-\x11\x8c\x06\x12\xcb\xda\x39\x66\x2b\xe8\x64\xa6\x1b\x01\x03\xab\
-\x72\x5c\xb9\x7d\x3f\x86\xac\xa2\x05\x9c\x16\x5a\xd3\x4b\x1a\xde\
-\x72\xae\xe4\xc6\xe6\x15\xa3\xed\x1a\x2b\x97\x4e\x56\xc3\xaa\x2a\
-\xe4\xf9\xea\x26\x8f\xff\x19\x0b\x21\xe1\x4a\x66\x58\xcf\x92\x22\
-\xa0\x1d\x5b\xd9\x2c\x61\x07\x42\xf9\xc4\xc6\x31\x1c\x82\x79\x50\
-\xc2\x16\x5e\xb9\x9e\x4a\xb9\x66\x09\x9f\x83\x74\xc4\x56\x8a\x11\
-\x2c\xa4\x87\x0e\xf6\x2a\xa6\xd7\x06\x92\x93\x99\x10\xd0\xc9\xa3\
-\x09\x39\x4b\x44\x9e\xcd\x67\x79\xc3\x48\x51\x6a\x08\x1a\x8b\xff\
-\x8d\xe1\x3f\x7d\x84\x82\x96\x3a\xde\x37\x9a\xc5\xc5\x58\x31\xf6\
-\xc2\x60\x10\xde\x9b\xb2\xec\xf9\x16\xa9\x04\x23\x76\xdd\x86\xc6\
-\xd1\x28\x3f\xdc\x9f\x0c\xa3\x0a\x81\x95\xf1\xcc\xe0\x48\x6b\x67\
-\x81\x19\x6c\xf7\x24\xff\xff\x7c\x6e\xf3\x54\xba\xba\xe8\x5c\x4d\
-\x04\x60\x42\xba\xfa\x1e\x56\xab\x1e\x86\x61\xad\xc0\x0b\x28\x2f\
-\x88\x09\x3d\x93\x24\x7d\x07\x03\x86\xe2\x00\xb3\x51\x22\xd9\x22\
-\xf3\x2c\x1d\x21\x02\x34\x5d\x0f\xab\xf5\x0a\x56\xeb\x35\xac\x35\
-\xa8\xe9\xfa\x15\x88\xae\xd3\xe1\x71\x3c\xc4\xd4\xa7\x73\xe6\xc0\
-\x66\x29\x20\x8e\x35\x6a\x48\x2a\x8f\x3c\x28\xaa\xed\x71\x05\x50\
-\x02\x1f\x4c\x69\x58\x39\x87\xa6\x19\x8f\x25\x27\xc8\xb6\x93\xe5\
-\x83\x58\x9a\x56\xfd\xa1\xf1\xd2\xd8\xff\x02\xd7\x54\x96\x0e\x20\
-\xcc\x5e\x5f\x12\xc8\x30\x4b\x73\x2c\xa0\x0b\xbc\x36\xa6\x5a\x38\
-\x8c\x30\xa7\x25\xc2\x6b\x4c\x7c\x38\x81\xcb\x63\x0f\x0b\x73\x12\
-\x96\xdc\x70\x98\x06\x2c\x98\x10\xc7\x98\x45\x56\x50\xf2\x78\xa0\
-\xe7\xed\xc1\x04\xb5\x92\x3b\x10\x0b\x26\x32\xff\xa0\x0e\x74\x29\
-\xf2\x10\x15\x03\x74\xe8\x6a\x12\x15\x45\x16\xa6\x11\xfc\x68\x58\
-\x3f\xfa\xd6\x50\x3f\xb9\xce\x27\x8d\x4a\x29\x57\x93\x8b\xdd\xa7\
-\x74\x8a\x54\x83\x6b\x2d\xe7\x0d\x76\x69\xdc\xd3\x61\xb2\x08\x90\
-\xa9\x6d\x63\x91\x5d\x70\x59\x80\xed\xeb\xdf\xda\x86\x8d\x99\x2a\
-\xa0\x51\x08\x68\x7a\xab\x52\x04\xa6\xdd\x62\x43\x58\x5a\x69\x09\
-\x47\xa4\x9c\xa8\x0f\x99\x22\xb2\x04\x99\xe4\x7b\x64\xca\x39\x62\
-\xe4\xb5\x0a\xdf\xb6\xc6\x1f\x26\x77\x30\xa3\x45\x7a\xe1\x62\x39\
-\x66\x32\x48\x18\x64\x10\xa3\xc2\xa5\x6d\x1a\x50\x5c\x55\x0f\x63\
-\x31\x96\x8c\xa2\xc4\xda\x05\x8b\x31\x40\xe6\x0f\x71\xf2\x96\xea\
-\x22\x4d\xf9\xf5\x7b\x35\xb7\x4f\x05\x35\xed\xf7\x5c\x46\x4c\xe1\
-\x8c\x9d\x7f\xb1\x40\xc4\xc1\x22\x09\x68\xf2\x60\x5f\x88\x31\xf2\
-\xcd\x33\x3a\x0f\x8f\x13\x00\xb0\x7c\x99\x55\xbf\x02\xb9\x1a\x54\
-\xde\x0c\x80\xf5\xdc\x0c\xbd\x7e\xcf\xe8\xb0\x19\xa9\xda\x9c\x96\
-\x48\x09\xc3\x36\xa2\x66\x38\xeb\xa0\xef\x3b\xe8\x57\x2b\x58\xaf\
-\xd6\xb0\x5e\xaf\x95\xa7\xa6\xef\x75\xe8\x59\x07\x42\x74\x2a\xfc\
-\x3f\x32\x86\x25\x68\x12\x0f\x94\x3b\xe3\x47\x90\x73\x5a\x30\xf2\
-\x52\x4d\x28\x51\x20\x7d\xcc\x6e\xd6\xf2\xea\x27\x4b\x8c\xa8\xda\
-\x2e\xd8\x64\x0f\x5b\x05\x9c\x75\xcb\x67\x36\xe3\xd5\xc2\x1d\x84\
-\xe3\x40\x09\xb9\x92\x8c\xfb\xdf\x40\x98\x63\xab\x80\xb4\x95\xcf\
-\x85\xac\xf3\x70\xa8\x20\x47\x3a\x1c\xb4\x40\x07\xf0\xea\xa6\xd8\
-\x73\x48\xfd\xe1\x1c\x1f\x58\xa9\xf4\xe5\xbc\x35\x05\xad\x0a\x12\
-\x15\xc1\x29\x67\x94\x64\x14\xd1\x19\xca\x86\x62\x95\xb0\x08\xcc\
-\xa0\x07\x52\x79\x6d\x50\xb4\xeb\x00\xed\xba\xc2\x40\x0a\x34\x59\
-\xb8\x30\x03\x72\x30\x3d\x66\x51\xda\xd1\x47\xfa\x74\xca\xcb\x53\
-\xdf\xd1\x42\xf9\x22\x59\x49\xc1\x43\xcd\xcf\x4b\x81\xdf\x54\x8d\
-\xc4\xb1\xf3\xa1\x94\x07\x30\x0e\x63\xeb\xe0\x42\x32\x41\x3c\x11\
-\x7e\x42\xad\xd5\xcc\xaa\x5d\x51\x25\x7a\x19\xac\x96\x06\x96\x1c\
-\x39\x51\x53\x25\x20\x40\x4c\x38\xca\x09\xf2\x4c\x0b\x54\xd6\x6c\
-\x21\xf6\x3c\xa5\xe7\xcd\x2f\x18\x0c\x38\xde\x7d\x44\x4c\x8c\x7b\
-\xce\x63\x86\x55\xeb\x75\x2c\x4a\x06\x27\xec\xb1\xa9\x95\x5d\x30\
-\xd9\x27\x9e\xc5\x59\xd2\x38\xb9\x07\x8c\x98\x11\xb0\xb1\xa5\x9c\
-\x30\x86\x0e\x2b\xfc\x70\x26\xfe\x38\x68\x22\xf4\x44\x7c\x80\x8b\
-\x8d\xd6\x05\x00\x35\x17\xae\x5d\xce\xe8\x64\xf4\x2b\x22\xa7\xbf\
-\x08\x96\x80\xdf\xf7\x1d\x48\xb9\xb2\x67\x9c\x10\x02\xb6\x5d\x0f\
-\xfd\x6e\x07\xc3\xc0\x01\x4d\xda\x14\x57\x06\x33\x75\x83\x68\x0a\
-\xe0\x2a\xda\x66\x01\x5d\xdf\xd9\xb0\xb3\xf5\x4a\x79\x6a\x56\x2b\
-\x4d\x14\x20\x3a\x7d\x2d\x32\xd6\xb3\xd0\x3b\x83\x59\xd9\x35\x95\
-\xc3\x21\xcb\xe0\x9c\x4a\x89\x08\x8a\xa2\x13\xd0\x72\x39\x7b\x7b\
-\x01\x34\x08\xe5\xb2\xb7\x9e\xbd\x94\xe5\xcc\x44\xde\x1a\xf2\x03\
-\x1c\xc8\x2b\x4c\x11\xe8\xc6\xfc\x70\x6d\x0f\x6f\x19\x3d\x80\x0a\
-\x04\x3e\xce\xf2\xc4\x30\x7f\x60\x00\x24\x46\x97\x09\x49\x60\xc3\
-\x42\x2b\xc8\x25\xe4\x13\xf2\x90\x2a\xce\xa4\x31\x3f\x04\x0f\x93\
-\xf4\xdb\xbe\x0e\x8b\x05\xd0\xe5\x57\xc7\xf6\x5d\xa9\x49\xeb\x44\
-\x0e\x05\x84\xa1\x5b\x88\x81\x95\x53\xe7\xf5\x30\xca\xdf\xb8\x32\
-\x8e\x1f\x0c\x53\xe5\x9a\xcf\x24\xec\x25\x70\x1d\x84\x71\xeb\x18\
-\x86\x19\x41\x31\x47\x7d\x11\x90\x81\x35\xd2\xa4\xde\x0c\x7a\x61\
-\x00\x54\x31\x44\x6d\x2f\x65\xb2\x53\x37\xa4\xd9\x43\x36\x37\x1d\
-\xbc\xfa\x49\x98\x15\x40\xf3\x8c\x59\x61\xa8\xc4\x82\xa4\x96\x25\
-\x47\x07\x67\x38\xc8\x85\xe8\xe1\x44\x57\x1d\x26\xd5\x83\x20\x17\
-\xb3\x06\xd3\x24\x2d\x9a\xb1\x5b\x88\x7b\xad\x59\xc9\xe3\x24\xad\
-\x7f\xf3\x0c\x61\x4a\x1e\x81\x2b\x26\x6a\x22\x01\x02\x80\x8d\xa5\
-\x99\xc0\x3d\xc8\xa3\x0b\xff\x9a\xb6\xb0\xb3\xf5\x3c\x1e\xe1\x60\
-\x3c\xb2\x39\xa0\x0b\xd8\x89\x42\xcd\xb5\xe8\x88\x04\xf0\xe8\xd8\
-\x55\x84\x96\xca\x03\x26\x41\x20\xa8\x83\xbe\x93\x40\x7d\xef\x91\
-\x8c\x88\xae\x87\xae\xdf\x81\x1c\x06\x05\x68\x88\x14\x29\x40\xa8\
-\xb4\xe3\xb8\x39\xc9\x37\x88\xe7\x8b\x6a\x02\x98\x02\xb8\x02\x3a\
-\x81\x0a\x68\x99\xbc\x9e\x55\x0f\xab\xd5\x5a\x87\x9d\x29\x92\x00\
-\x21\x84\xad\x97\xe3\x15\x66\x07\x57\xba\xa3\xd5\x28\x33\x09\xe8\
-\xf0\xd8\xb1\x04\x9b\xb1\x73\x5a\x30\x5d\x9f\xeb\xf8\x7b\x78\xf5\
-\x8b\xae\x40\x9d\x18\x4e\xe0\x80\x8b\xed\x18\xb8\x10\x33\x60\x2e\
-\x3c\x3f\x24\x2d\x25\x52\x33\xc1\x67\x54\x2f\x8c\xeb\xe4\x51\x9d\
-\x57\xc4\x3f\x7d\x34\x54\x21\x63\x05\x75\x8c\x34\x61\x14\x81\x4f\
-\x70\xa6\x83\xcc\xec\x75\x41\xd5\xd9\x54\x8b\x29\x65\x8b\x9c\x3e\
-\x6d\x58\xb2\x16\x8f\x32\xb3\x62\x74\xf8\xe6\xcf\x10\x8c\xac\x66\
-\x51\x48\x1c\xab\x83\x63\x72\x16\xec\xd8\x21\x67\xf8\x19\xa1\xf3\
-\xc3\xf1\xa1\xc0\x1c\xc4\xc1\x38\xf7\x26\xb4\x66\xef\xdb\x98\x45\
-\x95\x82\x27\xc5\x91\x94\x12\xec\x87\x3c\x10\xcb\x44\x6c\x13\x2c\
-\xc4\xf5\x4b\xf2\x30\xea\x04\xe2\x72\xf3\x8f\x90\xac\xf5\x85\x45\
-\xcd\x7e\x5f\xfd\x9b\xb0\x7a\x13\x5f\xa1\x40\x6e\x62\x71\xde\x46\
-\xc2\xa2\x2a\xf4\x51\x0c\x93\x73\x31\xa3\x54\x80\x63\x57\xcb\xd6\
-\x08\x18\x47\xb2\x91\x0c\x1b\xdb\x03\xf5\x3a\xb0\xde\xbf\x15\x66\
-\xfc\xf4\xde\x2f\x5d\x84\x87\x53\x5a\x01\x1e\x5d\x9d\x1a\xaa\xbc\
-\x28\x55\x13\x23\x69\xc8\x5c\x16\xc1\x5c\xf4\xf2\x3d\x25\x71\x8d\
-\x4b\x3d\x00\xe7\xe5\x0d\x55\xed\x24\x2f\x45\xcf\xe9\x64\x4a\xb7\
-\x10\x40\x28\x2d\x3d\x72\x07\x04\x40\xbd\x0d\x4d\x53\x60\xa6\x83\
-\x7e\xb7\x85\xdd\xb0\x52\x80\x86\x85\x9b\xa5\x3c\x0d\x25\x83\x71\
-\x6b\xbb\x93\x5e\x1a\x93\xdf\xd3\xf7\xd0\xf7\x2b\xe8\xbb\x5e\x51\
-\x39\x0b\xe1\x79\x67\x6c\x81\x5d\x98\x11\xc2\x5d\x92\x4e\x89\xf2\
-\x0a\x71\x4a\x9a\x4f\x08\xc0\x9d\x16\xe1\xba\xaa\x8a\xa0\x9f\xd8\
-\xf2\x45\x42\xce\xca\x42\xce\x21\x32\x2f\xd4\x0c\x02\xa6\x33\x8b\
-\xe2\xc0\xab\x73\x81\x13\x24\x04\xce\x9d\xcc\x90\x72\x36\xf8\x2b\
-\x49\x3b\x4a\x0e\x7c\x59\xa0\xc3\x6f\xc7\x62\x6b\x88\x1f\xea\x94\
-\x8b\xd8\xa5\xb2\xb2\x4e\x0d\x5a\xdf\x02\x95\xc0\xb0\xf9\x59\xe8\
-\x43\x19\xf4\x8b\x75\xe6\x4c\x93\x66\x84\x90\xd0\x1f\xa7\xa4\xd2\
-\x5f\x19\xdb\x9d\x6a\x43\xd6\x3a\x8a\x69\x7d\xa6\x80\x36\xf6\x7e\
-\x60\xd1\xb8\xd2\x50\xcf\x46\x8a\xcb\x37\x8d\x0e\x3a\x1a\x2d\x5b\
-\xb7\xdc\xef\x9a\xec\x5c\x6a\x53\x64\x0f\x65\xc1\xf4\xd2\x43\x08\
-\x12\x89\x58\x14\xfa\x7c\xc7\x54\xe1\xb8\x57\x0b\x2d\x15\x1c\x55\
-\xfd\xc3\x0b\x19\xbd\x54\x82\x87\xa0\x26\x7c\x67\x42\xdd\xc8\x11\
-\xf0\x96\xb6\x75\xd2\x02\xf3\x1f\x1a\x86\x30\xc0\xcf\x98\x63\x14\
-\x4f\x1a\xbe\xa8\xa0\xc4\x7f\xa4\x2b\x63\xce\xdc\x3f\x58\xa7\x18\
-\x24\xe4\x7c\xaa\x40\xf7\xe8\xda\xc1\x36\xac\xb5\x47\x11\xdd\xb6\
-\xe4\xa9\xdd\xc8\x36\x53\x30\x8f\x1b\xe0\x6a\x89\x00\x28\x2c\xb7\
-\x85\x9c\xa9\x0a\x84\x40\x90\x20\x40\x98\x9b\xf6\x06\x0c\x08\xc0\
-\x9d\x80\xae\x1b\x60\xe8\x7b\x58\x0d\x03\x48\x49\x20\x69\x00\x92\
-\x60\x0d\xf4\x35\xc0\x64\xda\xf2\x75\x6c\x65\x06\xd0\x28\x82\x80\
-\xce\xfd\xf4\xfa\xb7\xd0\xc4\x00\xa6\x10\x31\xba\xba\x38\x18\x58\
-\x75\x26\xdb\xc6\x5a\x16\x2d\xd3\xdb\xdd\xff\xfd\xdf\xae\x52\xba\
-\x4f\x67\x4d\x0b\xec\x73\x2c\x02\x1a\x5c\x78\xb3\x90\x5f\x90\xcf\
-\x12\x05\x80\x1f\x82\x06\x41\xc7\xa9\xb8\xdb\xb0\x79\xef\xb4\xdb\
-\x5b\xa8\x3e\xb9\x11\xc9\x57\x9c\x29\x4c\x62\xa7\x02\x63\x1c\x96\
-\x6b\x3a\x4c\x10\x0e\xb3\xe6\xb2\x26\x57\x09\xeb\x15\x46\x8c\xaa\
-\xde\x55\x34\x8c\x25\xb6\x22\x2d\xb1\x30\xb1\xaa\xd0\x79\x3c\xe2\
-\xb8\x97\x3c\x9a\xd9\xde\x93\x31\xfa\xd7\xd1\x88\xb4\x7d\x31\x0c\
-\xd1\x8c\x5b\x50\xc4\xe1\x8f\x7b\x1d\xf9\x47\xab\x65\xcd\x53\x82\
-\x5b\x54\x75\x8c\x80\x49\x13\xad\xa7\xa7\x45\x93\xa7\xa5\xd1\x0c\
-\xd1\x34\xf9\x7b\xb8\x3f\xa0\x4e\x33\xe7\x74\xfe\x5a\x49\x6b\xdb\
-\x63\xf5\xcf\xaa\x46\xae\x10\xf2\xc2\x43\x73\x66\x8d\xdf\x81\xb6\
-\x57\xb2\x2e\x0d\xcd\x98\xf4\xb1\x70\xc4\xa9\xb5\xeb\xa8\xae\x96\
-\xf2\xac\xd5\x35\xf1\x46\x34\x63\x7f\xec\x55\x47\x86\x65\x7d\x63\
-\xe8\xa5\x28\x08\x00\x90\x20\x04\xb2\x40\x19\x01\x88\x03\x08\x44\
-\xe8\x84\x80\x41\x4a\xc5\x6a\x26\x25\x10\xcb\x9d\xa9\x05\x34\xa3\
-\x25\xf0\x28\x0d\x36\x5c\xf8\x3e\x23\x2d\x10\x86\x56\x5a\x80\x10\
-\x9d\x22\x31\x10\x8c\xe5\xcc\x16\xd8\xc4\x08\xcc\xa4\xec\x42\xfb\
-\x39\xfe\x78\x8e\x9d\xff\x37\xb1\x4d\x60\x49\xbf\x92\x45\x46\x1b\
-\x53\x2b\x46\x74\xc8\x7e\x99\x4e\xa1\x2f\x1b\x3c\x2a\x6a\x96\x33\
-\x93\x0b\x39\x63\x9d\xa4\xc8\x2a\x12\x4a\xdb\x5a\x9e\xea\xfd\xab\
-\x2b\xa1\x97\x46\x35\x35\x6e\x6b\x9e\x3a\x94\xea\x26\x31\x52\x46\
-\x46\xcc\x42\x53\x07\x83\xe6\xde\x2a\xe3\xbd\xc1\x5a\xca\x0d\x1c\
-\xdd\x89\x38\x73\xa6\x53\x09\xb7\x73\x16\x11\xcd\xf8\xdc\xcb\x63\
-\x9a\x51\x2d\x7a\x32\xc0\xbb\xa0\x60\x01\xc7\x42\x8e\x32\x21\x4f\
-\x94\x8c\x29\xc1\x03\x49\x82\x43\x40\xa1\x25\xc7\x3a\x53\x00\x63\
-\x12\xe2\x26\x66\xbc\xc1\x43\x0c\xc2\xc8\x97\x26\x86\xd1\x2d\x31\
-\xdc\xd4\x78\x41\x75\xba\x07\x5d\x80\x9d\x79\x41\x5f\xd8\xb8\x34\
-\x6a\xbe\x47\xf1\x71\x34\x77\xdc\xe9\x50\x93\xb6\xc7\x98\xe3\xd6\
-\xa1\xc8\x39\x08\xa9\x60\x5c\x4c\xe7\xf7\x4e\x90\xc8\x96\xc2\xdd\
-\x81\x1a\x04\x02\x29\x04\x74\x88\x20\x35\x38\x96\xa8\x6a\xcd\x08\
-\x29\x6d\x11\x4d\x22\x5e\x7f\x06\x46\xfd\x0a\x38\x3a\x0e\x54\x3e\
-\x85\x03\x4f\x8b\x03\x36\xc2\x92\x18\xa0\xe7\x99\x11\x59\xcf\x4c\
-\xd8\xa8\x39\x46\xa6\xe4\x3f\x58\x04\x95\x7f\x00\x07\x1e\x99\x20\
-\xf4\xcc\x4b\x43\xa9\x5e\xea\x69\xe0\x83\xfb\x03\x34\xbe\xf5\x04\
-\x08\x59\x2d\x1a\xde\x39\x0d\x57\x24\xa9\x44\x2b\x50\xc9\x56\x40\
-\xc0\x16\x91\x01\x3b\x0e\xde\xa0\xe7\x36\xac\x1b\x06\xda\x8b\xd2\
-\x56\x52\x10\x29\x8a\x4a\x30\x8c\x65\x29\x5e\x7f\xca\x2a\xd5\x38\
-\x1e\x92\xd9\xe2\xb5\x78\x94\x59\x9d\x95\x55\x1b\x71\x54\x49\xc4\
-\xa2\x60\x98\xa2\xc6\x8f\x5b\x82\xeb\xbc\x63\x54\x2b\x0c\x46\x96\
-\xed\x68\x48\x43\xc3\x61\xb7\x3f\x4b\x29\x4d\x6b\xd0\x42\xa7\xa6\
-\x27\x02\xa8\xf9\xeb\x11\xf4\x89\x8b\x94\x4c\xf0\x9b\x8c\xa4\x65\
-\x84\x39\x4d\xbc\xd6\x98\xe7\xfd\xa0\x7a\x40\x5b\xef\xa3\x5e\x40\
-\x1b\xa7\xb2\x1e\x1e\x4a\xb2\x39\x6b\x6f\x99\x34\x06\x9a\x0e\x30\
-\x29\xaf\x14\xc1\xcc\x5a\x36\x69\x47\x00\xc1\x22\x8b\x2d\x7c\x4a\
-\xa9\x6e\x40\x92\xde\xf0\xff\xc3\x55\x4d\x1a\xba\xdf\x32\x52\x53\
-\xc1\xcc\xbe\x66\xe3\x60\x40\xaa\xe5\x31\xb4\x4c\xbf\x53\x95\x35\
-\xc2\xf7\x38\xa8\x21\x44\x10\x5a\xd1\x16\xa4\x93\xea\x85\x50\x60\
-\xa6\x13\x3a\xc4\x4c\x32\xf5\x75\x84\xe9\x2f\xa4\x9e\x2f\xf4\xb3\
-\x64\xb8\x43\x5e\xb4\x17\x15\xf4\x02\x81\xfa\xb7\x06\x32\xc8\x88\
-\x00\x72\x61\x66\x23\xe3\x84\x53\x96\x01\x15\x8e\x51\x60\x6c\xc5\
-\x00\x7e\xce\x11\x85\xe1\x67\x53\x16\x5e\x1b\xff\x74\xbf\x4f\xc9\
-\x90\xaf\x45\xa3\x80\x8d\x25\x0f\xd0\xe0\xc6\xab\x53\x43\x04\xa8\
-\xb5\x98\x76\xb7\xf8\xa1\xd3\xa2\x31\x3a\xe0\x73\xce\x0a\xaa\x60\
-\xce\xda\x0f\x48\xa9\x60\x7d\xc2\x25\x1f\x8d\x33\xe5\x23\x66\x90\
-\x79\xce\xbf\x45\x23\x30\x26\xf4\x84\xcc\xa8\x56\x42\x89\xb0\xfa\
-\x6a\x81\x40\x65\x10\x4e\x63\x42\x9e\x8a\xff\x2e\x85\x9c\x85\x8c\
-\x5d\xb8\xcc\xc2\x5a\xfc\xb8\xf3\xca\xa8\x52\xc6\x20\x40\x8d\xe2\
-\x69\xd2\x21\x3e\x87\x7c\xb7\xee\x8a\xa0\xae\xe1\x42\x8c\x4a\x98\
-\x56\x64\x47\xe7\x7b\xba\xb7\xc9\x07\x71\x53\x82\x7c\x2b\x98\xa1\
-\x69\x9e\x44\x6a\x11\x6e\xe3\xd0\x01\x97\x5a\xee\xcd\xf2\x16\xab\
-\xee\x47\x6d\xcf\x35\x55\xa0\x39\x7f\x7e\x4d\xf3\xf7\x1c\x6b\x96\
-\x0a\x31\x53\x32\x81\x22\x99\x39\x75\xbc\xc3\xa0\xca\xdc\x5a\x74\
-\x56\xff\x47\x6e\xf2\xa9\xef\xe2\xc8\x56\xa4\x8a\xc6\x87\x39\xda\
-\x73\xb4\xab\xb1\x31\xc2\x89\x4a\x78\x51\x8a\x99\xc2\xe0\x84\x6a\
-\xbd\xa2\x2a\x60\x6e\xbc\x05\x08\x04\x24\x84\xd2\x3b\x05\x01\x41\
-\xe7\xe7\x7a\xef\xd1\xd8\xe7\x19\x5a\x19\x39\x94\x2d\x72\xcf\xc0\
-\x4b\x04\x64\x26\x0c\x4e\x53\x2a\x18\xd5\xca\x0d\x1e\x96\x47\x3e\
-\x90\xb1\x5e\x19\x96\x86\x62\x01\xd0\xf2\x6c\xc5\x7d\xeb\x01\x31\
-\xca\xd4\xcc\x00\x49\xa4\x86\xb0\x30\x33\xc9\x42\xcf\xfc\xa4\xe7\
-\x04\x9a\x23\xaa\xcb\xbf\x58\xd8\xfa\xd1\xba\xa1\xd0\xa6\xaa\xd3\
-\x0c\x50\x90\xe0\x37\x9f\x22\x1d\x5b\x4b\xaf\xd3\xd4\x4d\x9b\xbf\
-\x3f\x4e\x16\x7b\xb9\xfb\x96\x2a\x4c\x8c\x14\x43\xc3\xba\x56\xd5\
-\x04\xf2\x55\x19\x38\x69\xea\xc4\xed\x43\x41\xfa\x28\x59\x61\x67\
-\xfa\xc9\x97\x96\x07\x55\x5c\xda\x53\xf7\x59\x7b\x5c\x27\x56\xf5\
-\xe8\x40\xa4\xff\x79\xe9\x35\x61\xfe\xc8\x31\x91\x55\xd7\x1e\x23\
-\x48\xc7\x10\xed\x97\xf3\x0f\x93\x32\x28\x33\xf6\x81\x57\x64\x9c\
-\x87\x22\x55\xe3\x9b\x2a\x66\x36\x44\x64\x69\xd5\x9c\x16\x36\x94\
-\x21\xe2\x5e\x41\x4d\x08\x66\x1c\x2d\x2d\x4e\xab\x37\xd3\xb8\xe5\
-\x52\x3c\x0c\xfb\x24\x91\x2b\xa5\xec\x4c\x26\xa2\xcf\x10\x1d\xd4\
-\xea\xe3\xde\xd7\x1b\xbd\xc9\xfb\x3c\x01\xa9\x20\x96\xb3\xf4\xf0\
-\xec\x7c\x41\x34\xdb\xc4\x45\x15\xd1\x52\x40\xbd\xc5\xea\x86\x18\
-\xfd\xc9\x19\x2f\xd1\x2b\x1e\x9c\x06\x32\xad\xc4\x60\xd4\xf8\x01\
-\x65\xba\x46\x0c\xcc\x10\xcb\x3d\xe7\x40\xc6\xaf\x4d\x49\x7e\x80\
-\x02\xcc\xcd\x27\x2d\x02\x9a\x89\xe5\x61\xc3\x04\x1a\x46\xc0\x1d\
-\x11\x02\xf0\xce\x49\x83\xe2\x64\x40\x12\x00\x0e\xc5\x4d\x54\x6c\
-\xdc\x26\xf4\xd3\xf3\x5b\x63\x1d\x4b\x0a\xf3\x14\x25\x3c\x79\x1d\
-\x8e\x83\x80\xb4\xf0\xa6\x0c\x43\x0a\x16\xf5\xc4\xe4\x1b\x99\xda\
-\x3e\xad\xa0\xa4\x35\xa7\xa4\x0d\xb8\xa5\xc7\x15\x2b\x00\x68\x95\
-\xab\x35\x57\xeb\x03\x71\x7a\x87\x1b\x0b\x50\x2e\x6d\x9c\xaf\x92\
-\x03\x13\x0b\x82\xb5\x28\x22\xa5\x03\x22\x55\xd4\x76\xec\x94\xa4\
-\xdc\x9b\x85\x0a\xee\x8b\x59\x50\x11\x1a\xbd\x1e\x0d\xea\x0b\x97\
-\x9f\x85\xc3\x19\x71\xfe\x5e\xe4\xf2\x02\x89\x78\x59\xa8\x36\x21\
-\xbb\x40\xf8\x08\xee\x8b\x62\x78\x6a\x5f\x26\x44\xed\x4d\x84\xb8\
-\x23\xe0\xa6\x76\x37\x52\x83\x89\x26\xf1\x35\x82\x59\x46\xc3\x39\
-\xe5\xb1\x1e\xf5\x6b\xb2\xdc\xa5\x99\x4b\x15\x17\x9d\xc9\x8a\xf3\
-\x2d\x73\x60\x56\x76\xe2\x10\x01\x8a\xb3\x2a\x88\x51\xc5\x7e\x44\
-\x76\xe6\x90\x5f\xb5\x8a\x4c\x39\x0d\x63\x42\x58\xac\x16\x03\x8d\
-\x02\x99\x24\xa0\x09\xcf\xc6\xf9\x0c\xd1\xb3\x17\x15\x31\x18\xe3\
-\x7b\x5b\xc0\x85\x99\xf1\x1f\x90\x60\x50\x00\x71\xa6\x33\x0a\x0f\
-\xf2\xb1\x55\x5f\x17\xc8\xd9\xef\x67\x51\xa6\x6a\xd1\x98\xf7\x54\
-\x7c\xa2\x2a\x56\x04\x20\xa5\x09\x45\x53\x49\x58\x1d\xf9\xca\x8f\
-\x17\x80\x32\x7b\x47\xb9\x52\x68\x58\x01\x64\xf6\xa9\x53\x96\xf3\
-\x65\x32\xd6\x27\xca\xdf\x23\x29\xa3\x6a\x0b\x95\x53\x08\xae\xa6\
-\x43\xe7\x74\xdf\x43\xe6\xb7\x05\x31\x61\x8d\xe2\x50\xe9\x9d\x31\
-\xc2\xc3\x53\xbe\x67\x25\x83\xd2\x38\xf6\xcc\x99\xbe\x16\x59\x85\
-\xb0\xf0\xfd\xa8\x0e\x8c\xd4\x82\x96\x36\xe3\x55\x95\x05\xce\xaf\
-\x94\x3e\x27\x32\x7b\x2c\x58\xb4\x86\x81\x6a\xe6\x33\x4b\xdb\x90\
-\xa6\xdd\x3f\x59\xa8\xb8\x45\x8a\xa5\x12\x83\xd8\x67\xe5\xa5\x9c\
-\x2c\x83\xd7\x0c\xfa\xf7\xaa\x4d\x4d\xda\x11\xfc\x2f\x56\x60\x79\
-\x9f\xaf\xa5\x0a\xa0\x62\x6a\xa3\x3d\x7a\x8f\x2e\xee\xab\x1e\x13\
-\xb5\xec\xf9\x3d\x2f\xa1\xa5\x9d\x87\x4b\xe4\x61\xd6\x44\x2a\x06\
-\x61\xc0\x4b\x9f\x5c\x55\xe1\xa7\x4b\x19\xa6\xd8\x5a\xf3\xf2\x9e\
-\xa7\xce\x49\x18\x99\x84\x6d\x46\x9c\x1c\x80\xa9\x6a\x0e\x2e\x39\
-\x38\x89\xaf\x7a\xf4\xcb\x71\x4e\xa8\xf3\xd2\x50\x54\x5f\x92\x38\
-\xdb\x59\x62\xac\x68\x54\x15\xaa\x33\x16\x36\x87\x9c\x95\x7c\x95\
-\xe9\x85\x48\x41\x47\x15\x78\x51\x63\x23\x13\x94\x78\xac\x10\xa7\
-\xae\x47\x32\x1e\xe0\x3a\x05\x63\x2e\x1c\x9e\xd1\xb4\x76\xda\xc1\
-\x0c\x56\x5a\x56\x26\x31\x5a\x26\x4f\x39\x5a\x94\xc0\x89\x52\xd2\
-\x16\x1b\xe9\x5a\x69\xf4\xcd\xaa\x7d\x3e\xca\xb5\x86\x38\xcb\x20\
-\x4c\x99\xb0\x93\x52\x7c\xb6\x5a\x12\xfb\xb4\x81\x4d\xbf\xef\xa1\
-\xad\xaf\x4b\x28\x33\x04\x30\x2d\x24\x25\xbc\xc3\x92\x53\x32\xd1\
-\x40\x50\x5a\xe9\x38\x65\x3c\x9a\xf4\xb8\x79\x45\x8d\x67\x58\x7c\
-\x16\x12\xcf\x21\x75\x35\xce\xcb\x1e\xaa\xd2\x74\x0a\xa6\xf7\xe8\
-\x40\xaf\x2a\x3d\x1e\x2c\x02\x9c\xbc\x12\xa8\x04\x50\xb1\x7e\xba\
-\x52\x32\x61\xae\x9c\xc0\x8c\x12\xc3\xc3\xcc\xf6\xb2\xf7\x22\x8c\
-\xad\xcd\xa8\x87\xe4\x4c\xc8\xd4\xbe\x9b\x94\x36\x5c\xae\xcb\xbd\
-\xc8\x5e\x9b\x5f\x1a\x63\xa2\xbc\x9a\xd1\xec\x51\xaf\xd7\x12\x45\
-\x9c\x11\xeb\x8a\xa0\x57\x34\x70\x5e\x48\x74\xe1\xba\xb9\xd1\x74\
-\x06\xc5\x90\x4b\xf8\x77\xd4\xcc\xec\x01\x04\x5e\x44\x96\x0b\x3f\
-\x03\x2f\xbc\xaf\x6e\xd6\xeb\x1a\xdd\xb7\xed\xfa\xc2\x35\x41\xf6\
-\x2e\x31\x50\x12\x51\x37\x1b\x50\xc3\xc2\xcc\xbc\xcf\x80\x0d\x00\
-\x72\x9b\x22\x31\xc6\x0a\x78\xf4\xaf\x2a\x44\x8c\x95\x8b\x16\xeb\
-\x95\x6f\x9c\xd6\xc4\x29\xeb\xf8\x78\x25\xec\xdf\x0f\xb7\xb2\xe9\
-\xfa\x07\xfa\xfa\x2c\xec\xdd\x83\xce\x98\xec\x3b\x4d\x15\x56\xad\
-\xc7\x4a\x60\xaf\xa5\xf4\x67\xc9\xd9\x21\x98\xe1\xa9\xa9\xc8\x2c\
-\xce\x06\xd9\x22\x5c\xb9\x7c\xd9\xfe\xeb\xfa\xf5\x37\xe3\x19\xa3\
-\xb9\x5a\x69\xfc\xfa\xe2\x17\xbf\x60\xff\xfe\xe5\x5f\xfe\x52\xf4\
-\xde\x97\xbf\xfc\x6a\x59\xd9\xa9\x78\x3c\xa5\xe6\xa1\xf0\x9d\xcb\
-\x3f\xf7\x9c\xfd\xfb\xe6\x9d\xb7\xec\xb5\x7c\x7c\xde\x7b\xef\x1b\
-\x75\xe3\xcf\xcd\x5a\x84\xe5\xc6\x11\x46\x69\x23\xf5\x0a\x7a\xdb\
-\xda\x78\xee\xca\x55\xd6\x97\xf7\xe2\x81\x64\xf7\xbd\xfa\xf3\x6e\
-\x3c\xde\xfb\x67\xb7\x8b\x0a\x1e\xc6\x67\x19\x93\xd5\x21\x1d\x45\
-\x4d\xb2\x2d\xc1\xa7\xff\x73\x37\xee\x77\xfe\xfb\x5b\xed\x2a\x4f\
-\x83\x01\x8c\xb7\xe5\xea\x3f\xb8\xe6\xd6\xc1\xed\x9b\x75\x73\x41\
-\x53\xf6\xc3\x8c\x3d\x94\x8a\x1f\x22\x9c\x96\x41\xad\x7f\x7f\xee\
-\x95\x97\xed\xdb\xaf\xbf\x7e\x3d\xee\xa6\x06\x15\x14\x6c\x2a\x9e\
-\x47\xb3\x84\x63\x85\x1b\x34\xbe\xf0\x85\x57\xec\xdf\xaf\xbd\xf6\
-\xfa\x3c\x8d\xb6\x82\x10\xa0\x70\x4c\x01\x00\xc0\xba\x73\x57\x6d\
-\x06\x77\x43\xfe\xfe\x39\x7b\xff\x28\xf3\x7e\xee\x75\x24\xd8\xf5\
-\x92\xea\x9c\x38\x13\xcb\x13\x5d\xe4\x17\x1f\x87\xd4\x78\xd7\x4c\
-\x7d\x38\xf6\x34\xa2\x5f\x2d\x66\xb3\x6b\xb9\x69\x6b\x1a\xe5\x8c\
-\x88\x91\xd9\xd4\xcd\xa9\xcf\x28\x41\x08\x60\x81\x8c\x64\xa1\x67\
-\x14\xe4\xd2\xcc\xee\x5a\x0d\xa0\xc1\x3a\xc9\x57\x94\xb3\x21\x75\
-\x33\x78\xbc\xd4\x9c\x0c\x20\xe6\xa8\xe6\x94\x6f\x1a\xc2\x90\xb1\
-\x94\x04\x02\x7b\x76\x75\xdd\x96\x1d\x3f\xa1\x28\xcb\x04\xf3\xc5\
-\xbe\xe5\xcf\x71\xd7\xf6\x84\x1a\x00\x33\xb6\xf0\x69\x11\xa0\x90\
-\x3b\xff\xa9\x79\x86\x6b\x67\x3d\x67\x59\xa1\x9a\x5e\x4e\xb4\xc4\
-\x2f\x7d\x08\x25\xf3\x07\xb1\x46\xc3\xc7\xa4\xc2\x12\xfe\x9e\x55\
-\xa8\x61\xe6\xea\xcf\x99\x57\xbe\xf0\x79\x07\x8a\x5e\x7d\xfd\xd5\
-\x65\x24\x77\xcb\xc2\xac\x60\xe2\xf2\xdc\xf5\xfa\xf7\xf3\x57\x1c\
-\x78\x78\xf7\xbd\xf7\xc6\x1b\xba\xc8\xe9\x8b\xe9\xf6\x37\xc6\xf6\
-\xcf\x79\x5d\x7d\xda\x01\xac\x77\x38\x68\x21\x6c\x9a\x3a\x1c\x05\
-\x09\x7e\x11\x64\x77\x7f\x4c\xa8\xb6\x0b\x62\x92\x22\x1b\x78\xc1\
-\xac\x4e\x23\x1a\x2c\x4e\x5b\xd0\xaf\xbc\xf4\x39\x67\x48\xf8\xd2\
-\x97\x66\x75\x54\xc9\x01\xf5\xac\x1a\x72\x80\x7f\xf4\x8f\xbe\x68\
-\xff\xfe\xc7\xff\xf8\x97\x67\xaf\x9d\xcf\x7c\xe6\x05\x07\x78\xef\
-\xbc\x3b\x32\x04\xb4\xa0\xf4\x59\x50\x74\x34\xdc\xe8\x42\x61\x94\
-\x16\xee\x8e\xc6\x31\x4a\x81\x99\xbd\x8e\x7b\x42\x12\x2c\x02\x56\
-\x1a\x17\xd6\x18\x90\x69\x8d\x29\xca\x56\x65\xab\x14\x73\x54\x38\
-\x76\xbc\x14\x18\xf2\x89\x01\x24\x49\x90\x3a\xfa\x0a\x98\xa3\x42\
-\x46\xb1\x2b\xb4\x18\x7d\x77\x06\xd0\x2c\xb9\xe0\x1d\x7f\xb7\x07\
-\x56\x4c\x1d\x1a\xeb\xa5\x31\x75\x68\x5c\x9c\x9d\xf5\xed\xb4\x50\
-\x35\xcf\x2a\x08\xb7\x30\x98\xa9\xbc\x1e\x4b\x7f\xff\x95\x28\x0f\
-\x50\x3f\x29\xd3\x16\x73\x7e\x67\xe2\x7c\xf9\xd2\xb0\x5a\xa6\x86\
-\x2f\x66\x62\x03\x30\x4d\x7e\x4b\x45\x7e\x24\xf2\x4d\x8d\xc5\xa8\
-\x94\xf1\x78\x79\x64\xe5\x9f\x4a\xbf\x97\x81\xe2\xb9\x58\x62\x4c\
-\x00\xb4\x05\xe2\x20\x93\xf5\x38\x26\xde\x64\xb4\x00\x0b\x73\x43\
-\x1e\x72\xbb\x1d\x42\x03\xa0\xe4\xb9\x14\xac\xe3\x36\xfd\x7f\xde\
-\x9c\x8c\x7c\x8f\x46\xf0\xc4\x12\x80\xd6\xde\xae\x92\xd8\x39\x18\
-\x43\xac\xad\x87\x44\x85\xf6\x7b\x05\x74\x46\x0c\x91\x54\x5e\xc3\
-\x59\x78\x98\x00\x30\xc9\x1c\xc4\x51\xa3\x4b\x5e\x50\xed\x2d\x8f\
-\xa6\x42\x14\x71\xf1\x73\x91\x8e\xe2\xf9\xec\x8c\xd3\x76\xd0\x12\
-\x12\x7e\xca\x16\xdb\x0c\xd4\xba\xcb\x67\xeb\x66\x35\x98\x25\xa9\
-\xa3\xd1\x1e\xda\xb7\xaf\xf5\x83\x6d\xa2\xd2\xa9\xf4\x3c\xa1\xdf\
-\x0f\x27\x33\xfa\xbd\xcd\xa9\xb1\xba\x3e\x01\x49\xc9\x42\xcd\x18\
-\xd3\xd9\x94\xfa\x6f\xcb\x02\x9a\x86\x04\xce\x80\xaa\x4d\x7a\xa1\
-\x65\x06\xcc\xb0\x3c\x1a\x5e\x5d\x34\xf1\xac\xbf\xba\x25\xc0\xf0\
-\x20\x9d\x34\x6e\x57\xf3\xe2\x1e\x9b\x87\x3b\x4a\x43\xf1\xaa\xd5\
-\xe0\x2e\x7e\xb0\x1d\x32\xcb\x74\xdc\x5f\x32\x66\x94\xac\x15\x95\
-\x98\xd2\xce\x17\x96\x7d\xd9\xe3\x9f\xa8\xd0\x2a\x6a\x3e\xa8\x66\
-\x94\x0a\xac\x7e\xdd\xbe\x7d\x07\x86\x61\x80\x61\x18\x40\xca\x32\
-\x2b\x1f\xa2\x31\x54\xe0\x52\xc3\x6a\x15\x97\x2f\x7d\xe9\xd5\x68\
-\xba\x7c\x60\xc3\x28\xcd\x69\xc2\xd8\x8c\xc4\x99\xdf\xfe\xb5\x9b\
-\x40\x3b\x02\xb9\x03\xa0\x01\xda\x14\xd2\x14\x78\x21\x18\xdf\x53\
-\x4b\x87\x8b\x50\xeb\x80\xe4\x1f\x74\xeb\x1b\x6f\x03\xf6\x00\xa2\
-\xc3\x71\x50\x48\xed\x53\xd0\xd4\xac\x90\x4d\x07\x42\xaf\xe6\x08\
-\x37\x2d\xcd\xd0\x36\xc6\x42\xbb\x1b\x2c\xeb\x34\x0a\xe2\xe6\xc7\
-\xe0\xd2\x84\x79\x29\x6c\x4e\x27\xd3\xb4\x47\x06\x91\x1b\x1b\x31\
-\xc0\x42\x54\x05\x44\x4a\x40\xc6\x7c\x8e\x08\xf0\xea\xab\x5f\x01\
-\x00\x04\x21\x26\xe4\xd1\x84\xae\x69\xac\x54\x4c\x27\x28\xd8\xcb\
-\x9b\xf8\x66\x80\x9a\xa9\x37\xce\xa4\xce\xe2\xe4\x86\x2c\x74\xe8\
-\xd2\x42\xf7\x59\xa0\xc9\x07\xcf\x70\x4d\x80\xea\x89\x24\x75\xcd\
-\xa0\xa6\x78\x57\xa2\x20\xa5\x44\xfd\x4b\x92\xf3\xd0\x48\x1e\x79\
-\x65\x65\x38\x23\x0a\x2b\x88\xcf\x1a\x9b\x08\xce\x05\x34\x54\x3a\
-\x30\x82\xd6\x10\x42\x9a\xe9\x4c\x77\xd8\x81\x19\xb0\x45\x35\xc3\
-\xb0\x33\xaf\x77\x2d\xda\x13\x3b\xdb\xa6\x2f\xe0\x31\xb7\x4a\xfe\
-\x84\x9b\xc2\x9c\x7b\x51\x10\x5b\xcd\x26\x39\xf1\xf2\x64\x06\xef\
-\x9a\x93\x55\x67\xff\xbe\x1f\x7c\x76\xca\xbe\xc7\x5f\xf7\x77\xe3\
-\xab\xf7\x64\x85\xec\x99\x94\x78\xcf\x0f\x8f\xf3\x72\x7f\xf4\xfd\
-\x8f\x7b\x75\xfd\x39\x7b\xde\x51\x9f\x1e\xf4\xf3\x4c\x9b\xf8\xf5\
-\xe1\x7d\x01\x5c\x98\x5e\x2a\x97\xc8\x8c\x8d\x19\x33\x3e\x56\xfc\
-\xf5\x70\x27\x3d\xd1\x7b\x14\xdc\x9f\xc2\x71\x3e\xdf\x01\x00\xc0\
-\xd9\xd1\xca\xbb\xcf\xb7\x3f\xbc\x5b\xb5\xc0\xae\x5c\x09\x73\x68\
-\xdc\xf5\x9f\xfd\xec\x2f\x25\xbf\x13\xe6\xb8\x94\x5e\x9f\xff\xfc\
-\x2b\xc5\xef\x99\xad\xcd\xaf\x7b\xf5\xd5\xd7\x5c\xbd\x09\x04\xf8\
-\xec\x67\x5f\x4a\xde\xfb\x2b\x5f\x79\x2d\xfa\xae\x79\xbd\xf2\x92\
-\x7b\xef\xcd\x77\xaf\xc3\xb5\x7f\xe8\x42\x54\xbe\xfe\x9b\xb7\x01\
-\x00\xe1\xd3\xff\x85\xea\xfb\x3b\xff\xe4\x16\x5c\xf9\x7b\x2e\x77\
-\xe2\xad\x3b\x37\x94\xb2\x96\x71\xdc\x3f\xfd\xf4\x2f\x38\x20\xf4\
-\xee\x6d\xef\xf3\xcb\x7f\xcf\x85\x8f\x7d\xe3\x37\xef\x78\xc3\xfe\
-\xec\x7f\xed\x42\xac\xde\x7a\xe7\x06\x3c\x7f\xe5\x85\xa8\xdd\xcf\
-\x3c\xf3\xb4\xfd\xfb\xdd\xf7\xde\xb3\xd2\xfd\xea\x33\x57\xa3\x6b\
-\xdf\xfb\xa7\xb7\x93\xbb\x97\x08\xe0\xea\xdf\x67\xfd\xb9\xfd\x56\
-\xe6\x60\xa3\x4c\x6c\x02\xc1\xd5\x4f\xfb\x39\x34\xe6\x43\x33\x66\
-\x00\x00\x77\x7e\x5d\x85\x89\x5d\xfb\x05\x96\x77\x72\xeb\x26\x70\
-\x2e\x35\x0a\xfc\x15\x44\x00\x97\x9f\xb9\x1c\xb5\xe7\xd9\x9f\x75\
-\xfd\xfb\xc6\x3f\xbf\x93\x9c\xef\x6b\x9f\x7e\xde\x3d\xe7\xf6\xcd\
-\xa4\x7c\xe7\x73\x63\xc1\xd9\x7b\x6f\x87\xdd\x4b\x44\x79\xe5\xd3\
-\x54\xaf\x5e\xb9\xe2\xc6\xe2\xbd\xaf\x27\xcd\x1b\xa9\xf9\x01\x00\
-\xf8\xfa\x6f\xf8\x6b\xe0\x99\x9f\x71\xd7\xdd\x7c\xef\x86\xea\xd7\
-\x15\xd7\xaf\x3b\x77\xee\x78\x9c\x74\x06\xa0\xa4\xc6\xec\xce\x7f\
-\xf7\xb6\xe7\x64\xc1\x8c\xd5\xe5\xc5\xab\xf1\x3e\xfe\xe2\x17\xbe\
-\x30\xba\x9f\x5f\x7c\xf1\x17\xed\xdf\xaf\xbf\xfe\xb5\x00\xd8\x00\
-\x7c\xfe\xf3\x9f\x4b\x7e\xef\x97\x7f\xf9\xcb\xee\x39\x5f\xfc\x7c\
-\xfc\x6c\x2f\x87\xee\xcb\x11\xc8\x31\x7f\xbe\xf2\x8a\xbb\xff\x57\
-\xbf\xaa\x72\x68\x7e\xe9\x97\x5e\x8c\xee\x77\xf9\xf2\x33\xf6\xef\
-\xdf\xfc\xe7\xff\x43\xfa\xf4\x22\x80\xff\xe0\xfb\x9e\xb2\xef\x7c\
-\xf0\x1d\x25\x1f\x9f\x38\x3b\x76\xb2\x74\xe3\xce\xac\xa3\x44\xbe\
-\x4c\x94\x43\x83\xf5\xac\xf7\x53\xf5\xf2\x30\xaf\x26\x82\xef\x08\
-\xb0\x4e\xe5\x9c\x48\xaa\xc6\x05\xde\x33\x06\x9f\xa5\xef\xa8\x22\
-\x3f\x28\xf7\x5c\xf3\x4a\xb5\xef\x3c\xb8\x2e\x15\x6a\x66\xbe\xb7\
-\x91\xe4\xdd\x23\xcc\x47\x6a\xcd\x55\xda\x0b\x9e\x62\x17\x2f\x9d\
-\x9b\x33\x99\x21\x36\xf8\x72\x96\x3c\x8c\xea\xfa\xcd\xc3\xa5\xc9\
-\x73\x40\x38\x50\x63\x93\xff\x65\x90\x1f\x0f\x0c\xd8\x8c\x76\x8a\
-\x26\xa9\xe7\x62\x51\x3c\x4a\xe9\xe3\x1f\x0c\x88\x09\x99\xce\x34\
-\xa8\xb1\x79\x35\xc0\x8a\x6a\x52\x1c\x5f\x47\x7b\x5d\x05\xe9\xde\
-\xdb\x1f\x74\x05\x8e\xd0\x48\xb1\xd4\x4f\x05\xaf\x45\x96\xd5\xec\
-\x40\x06\x8f\xe9\x53\x4d\x1e\x98\x29\x29\xe5\xe1\xeb\xb4\x70\xdd\
-\x69\xdf\xde\x6b\x0e\x66\x0c\xc8\x3a\x59\x89\x6c\xa4\xd5\x71\xe2\
-\x19\x47\x85\xe7\x1e\x55\x5c\x7f\xdc\xe3\x58\x39\x4f\xaf\x7d\xb5\
-\xaf\xe3\x5e\xc0\x71\x2f\x0a\x7d\xf7\x3f\x3b\x3d\xea\x23\x30\x03\
-\x00\xf0\xb1\xc7\x2f\xc1\x1c\x0e\xcf\x97\x5e\x7a\xb1\x08\x52\x94\
-\x15\xb5\xfc\x13\x02\x0d\xf3\xbd\x31\x8b\x2d\xa2\x7b\x2f\x07\x66\
-\x00\x00\x3e\xf7\xb9\x97\xa7\x1d\x10\x04\x9e\x62\x9e\xbe\x86\x92\
-\xc3\xf3\xf4\x2f\x7c\xda\x07\x84\xcf\x5c\x51\xb9\x20\x85\x13\x80\
-\x5b\xa5\xa6\x88\xb1\x94\x32\x0b\x00\xf0\xf4\x7f\x75\x05\x7e\xe1\
-\xa7\x2f\x03\x17\x9b\x40\x00\x97\x7f\xd6\x57\xae\x9f\x67\x0a\x73\
-\xd2\xe0\x16\x8b\xdc\xfc\x49\x16\xbc\x78\x12\x3d\x00\xc0\xb5\xab\
-\xd7\xbc\xb6\xb4\xe4\x32\x94\x2e\x8b\x9e\x73\xe5\x9a\x37\x9f\x94\
-\x01\x33\x00\x00\x57\x9f\x7e\x0e\xae\xfe\xfc\x73\x6c\x4e\x7d\xab\
-\x61\xfe\x90\x21\xb8\x76\xf5\xb9\x24\x60\xe2\xa7\xdd\xd5\x67\xf3\
-\x6b\xc9\xcc\x4f\x6e\x0d\x5c\xbb\xfc\x42\xa0\x9c\x5f\x86\x67\x9f\
-\x79\xda\xf3\x7e\x3f\xfb\xcc\x33\xc9\x7b\x5f\xfe\xfb\xcf\x29\x90\
-\x4c\xe1\x3c\xd1\xec\x68\x8e\x10\x38\xbc\xf4\xd2\x2f\x01\xf2\x90\
-\xac\x82\x6c\xf9\xe2\x17\x3f\x0f\x5f\xfc\xe2\xe7\xab\xbd\x35\xc6\
-\x23\xe3\x7e\x30\x59\x54\x73\xfa\xf9\x8f\xd3\xbf\x3a\xe5\xcc\x4c\
-\x84\xfd\x62\xfe\xa3\x2a\xa0\x61\xfe\x1d\xbe\xb7\xce\xe4\x9c\xac\
-\x05\x7a\x9f\x2d\x99\x14\x7e\x54\xc8\xc7\x5d\x57\xb6\x2f\xd5\x97\
-\x8b\xf8\xe2\xfa\x5f\x5a\xe7\xab\x9b\xf7\xe5\x94\xb5\xfa\x35\xc7\
-\xdf\xc7\x99\xf3\x4e\xfc\x7f\x81\xcc\x34\xe1\x65\x52\x12\x48\x29\
-\x75\x39\x16\xe3\xc0\x60\x4e\x0c\x9b\x8a\x32\x96\xd3\x86\x93\xda\
-\xd8\xd7\x7f\x85\x9a\xaa\x9f\xfa\xe7\x44\x88\xe4\xa4\x46\x6f\x1a\
-\xcc\x98\x58\x3b\x49\x00\x92\xf1\x59\x1b\x90\x84\x78\x60\xe7\x05\
-\x26\x12\xa9\xb3\xfc\x54\x09\xc6\x63\x03\x6a\xda\x28\x85\x97\x72\
-\x85\x16\x53\x1b\x46\xd9\x98\xf3\x9f\x9e\xac\xba\xa4\x77\xe1\x64\
-\xd5\x45\xde\x98\xd2\x4b\x5d\xeb\x7c\xa9\xa7\xbd\x68\xea\xeb\xc9\
-\x0a\xad\x97\x26\x06\x37\x69\x20\x12\x7a\x5c\x38\x38\xc9\x79\x6c\
-\xf8\xf7\x6a\xae\x0f\xe7\x9f\x03\x90\x07\x09\x82\x85\xf0\x3d\x04\
-\xdf\xb3\x93\x04\x3b\xf6\x5e\x14\x81\xc9\x7b\xe7\x5b\x00\x02\x38\
-\x3b\x5e\x2d\xbe\x23\x14\xc3\x90\xa3\x58\x57\x40\xa2\xbc\x62\x5f\
-\x61\xac\x49\xaf\xbe\xfa\x5a\xf2\x7d\xa5\xa8\x88\x0c\xc0\x89\xc3\
-\xda\x94\x95\x98\x40\x4a\x00\x00\x09\x2f\xbf\xac\xee\xf5\xa5\x2f\
-\xbf\x0a\x44\x04\x5f\xfc\x82\xb3\x06\xbf\xfa\xfa\xab\x20\x3a\x01\
-\xa2\x17\xd1\x92\x7e\xfa\xa7\xaf\xc0\xd7\x7f\xe3\x8e\x92\x32\x03\
-\xc1\x30\xe4\x88\x1d\x28\x52\x66\x4d\xd2\xbe\x24\x09\x97\x9f\x79\
-\xd6\xfb\x12\x51\xfa\x10\xa0\x94\xb1\x87\x00\x6e\xdc\x52\x9e\xa0\
-\x17\xae\x3b\x37\x14\x85\x00\x00\x20\x00\x49\x44\x41\x54\x32\x0b\
-\xfd\x3b\xef\x82\x50\xd6\x13\x20\x22\xef\x19\xb7\xde\xbd\xa9\xcc\
-\x50\x1d\xc0\xd5\x7f\xe8\x2b\xf4\x26\x65\xe5\xe9\x9f\x71\xde\x84\
-\x9b\x5f\x7f\x0b\x68\x47\x40\xd2\x01\x0d\xbf\x67\xc1\xff\xcd\x81\
-\x83\x19\x70\x17\x7c\x70\xf9\xe7\xae\xc2\xad\x5f\xbd\x09\x72\x47\
-\x70\xed\x69\xd7\x87\xe7\xae\x5e\x85\x5b\xb7\xef\x00\x4f\xb0\x21\
-\x74\x4a\xfd\xad\x77\x6e\x03\x00\xc1\xd5\x67\x1d\xf0\xba\xf3\xeb\
-\x6f\x83\xe8\x10\xb0\xc3\x68\x1c\x2f\xff\xdc\x73\xfa\x39\x12\xae\
-\x3d\xed\x00\xc0\x73\x57\xae\xc2\xad\x3b\xb7\x01\x81\xe0\x99\xa7\
-\x9d\xd2\xff\xce\xbb\xef\xda\xf3\xe5\xea\xb3\x57\x92\xc7\x98\x17\
-\x85\x26\xfd\x33\x8b\x03\xc1\x9b\xb7\x6e\x02\x82\x80\xe7\xae\x5e\
-\x65\xeb\xe0\xd3\xf0\xee\xbb\xef\x29\x6f\xd3\xb3\x6e\x7e\xde\x7e\
-\x4f\xcd\x0f\x76\x3e\x00\xfb\xf4\x7f\x79\x19\xde\xfb\x8d\xdb\xd1\
-\x3a\xbc\xf6\xf4\x0b\xca\x1b\x28\x01\x10\x84\x3f\x47\x3a\xf1\xfa\
-\x99\xa7\x9d\xc7\xee\xd6\x9d\x5b\x40\x28\x01\x04\xc0\x73\x4f\x5f\
-\xe3\x2b\xcf\xce\x4d\xc8\x30\x0a\x04\xf0\xb5\xb7\x5f\x87\x61\x2b\
-\xe1\xe5\x5f\x74\x7b\xcf\xb0\x0b\xa6\x4e\xd7\x97\x5e\x7a\x11\xbe\
-\xf6\xb5\xeb\x11\xb0\xf9\xec\x67\x5f\x82\xd7\x5e\x7b\x5d\xef\x4b\
-\xd2\xfb\x9a\xbc\x75\xc2\x8d\x18\x88\xce\xfb\x93\xf2\xd4\xe6\x41\
-\x4a\x3e\xa4\xf5\xfa\xf5\x37\x00\x00\xe1\xc5\x17\x3f\x63\xdf\xbb\
-\x7d\xe7\x1d\x58\xaf\x56\x70\x74\x74\x94\x3f\x5c\x2b\x0e\xd8\xd3\
-\x75\x17\xc9\xe5\x25\x2d\xfe\x2d\xaf\x23\x81\x9e\x17\xa3\xe4\xc1\
-\x00\xf0\x3d\x23\x39\x10\xd1\xea\x3a\xa8\xd1\x49\xce\xa5\xef\xd1\
-\xe1\xcf\x0e\xdb\x47\x85\xbe\x98\xfb\xe4\xfa\x54\xa9\xa6\x5c\x58\
-\x50\xd4\x64\x63\xc7\xe5\x9e\x87\x35\x63\x36\xd2\x40\x4a\xd8\xb6\
-\x94\x84\xd1\x04\x00\xc6\x5b\x03\x0e\xb0\xb8\xdc\x19\x2d\x90\x24\
-\x79\xa0\xa6\x05\x4f\xe4\xf4\xd8\x46\x40\x53\x27\x60\xa2\x5c\x08\
-\xcd\x84\x04\x1e\x4d\xb3\xee\x9c\x24\x8f\x28\x00\x58\xe2\x90\x17\
-\x73\xc7\x94\x00\x2f\x3c\x60\x42\x0c\x59\xeb\x57\x5a\x0b\x18\x61\
-\x16\x48\x20\x33\x9b\x56\xdc\x60\x21\x20\x7f\x88\xbd\xfe\x60\x3b\
-\x54\x7b\x67\x46\x01\xce\x4e\xce\xef\xf4\x42\x63\x79\xbe\xa3\xa2\
-\xe7\xa6\xea\xfa\xca\xaf\xb7\x78\x6d\x96\x13\xa9\xe3\xe7\x59\xca\
-\x78\xa2\xb6\xb3\x93\x01\x26\xd4\xab\xfa\xe9\xec\xf1\x5f\xf9\xca\
-\x6b\x9e\x67\x05\xb1\x20\x6f\x30\xdf\x3e\x02\x15\x63\x4f\x39\xf7\
-\x01\xa3\x46\x4e\xf5\xc9\x63\x54\xa4\xd4\x33\xd2\xa9\xdd\x94\xd2\
-\x88\x03\x50\xe1\x14\x65\x2d\x79\xa5\x02\x15\x55\x03\xce\xc0\x4f\
-\x68\xc9\xba\xfa\xcc\xb5\xe4\x2d\x7e\xe1\xa7\x2f\xc3\x7b\xbf\x71\
-\x47\x25\x65\x66\xee\x75\xe3\xed\xb7\xe0\x85\xe7\x9e\xf7\xfb\xcf\
-\x28\xf1\x23\xda\xfc\x44\xdf\x52\x96\x35\x13\x6a\x70\xe3\xf6\x0d\
-\x78\x81\x87\xd0\x11\x00\x21\x81\x24\x46\xd5\xcc\xad\x74\x61\x96\
-\x9d\x24\x20\x81\x80\x92\x80\x44\x7a\xbe\x08\x00\x6e\xdc\xb9\x01\
-\x2f\x5c\x7e\x21\x65\x3a\xb4\xaf\x9c\x47\xe3\xca\x3f\x78\x0e\xee\
-\xfc\xda\x2d\x75\x46\x49\x00\x12\x4e\x46\x53\xe6\x80\x35\xc3\x74\
-\xeb\xf6\x1d\xb8\xca\xc2\x33\x53\x1e\x17\xbb\x06\x08\xe0\xce\xaf\
-\xbd\xed\x85\x1f\xba\x67\xa4\xa7\x1f\x93\xe3\xea\xbf\xae\x5e\x4e\
-\x87\xb5\x3d\xf3\x33\x57\xe1\xbd\x7f\x76\xdb\xb2\x47\x1b\x80\x66\
-\x93\x75\xc7\x6a\x07\x65\xda\x85\x08\xf0\xb5\xaf\x5d\xf7\x40\x0d\
-\x97\x05\x9f\xfb\xdc\x67\x47\xf6\x7d\x7a\x13\xa7\x8c\x18\x65\x79\
-\xe0\xc4\x18\xa5\xf6\x25\x51\xd9\x19\xa8\xff\xfe\xbf\xff\xfc\x7d\
-\x2f\xec\x2c\x37\x2c\xc7\x3d\x1e\x48\x0a\x2f\x77\x76\x95\x3c\x35\
-\x9b\x54\x6e\xe7\xd8\x19\x3a\x51\x89\xc8\x81\x90\x92\xa7\x26\x04\
-\x45\x87\x3b\x05\xf7\xf4\xa5\x46\x25\x6c\x56\x6e\x0f\x36\x7c\xb4\
-\x44\xf9\x45\x1e\x44\xc5\x40\x8c\xd4\x8e\x0a\x29\xa5\xa3\x6c\xe6\
-\xe0\x26\x80\x42\xd4\x5a\xce\xbe\xc2\xe3\xdc\x37\x8d\x14\xb5\xcf\
-\x6e\x18\x3f\x47\xe0\x50\x9b\x24\xc6\x82\x40\xda\x3b\xc3\xac\x4a\
-\x76\xd0\x26\xd0\xeb\x27\xc9\xa3\x6a\x40\xdb\xd8\xcd\x70\x99\x35\
-\x8c\xf5\xb7\x9d\xd4\xf7\x29\xa0\x66\xec\x7a\x9e\x2f\xd3\x7a\xef\
-\xfb\xdb\xc1\x86\x9d\x85\xe1\x67\xad\x80\xe6\xc1\xae\x4d\xf8\x9d\
-\xef\x16\x86\x77\x8d\x56\xae\x94\x77\x66\x2a\x98\x79\xb8\x93\x49\
-\xa5\xe8\xde\xf9\x76\xa1\xce\x39\x86\xc1\xd7\x5f\xbf\x6e\xc3\xce\
-\xc2\xb0\x2f\xe3\xb1\xa9\x07\x34\xd8\xf4\x99\xa3\x9c\x46\x78\xfd\
-\xf5\xaf\xc1\x4b\x2f\xa9\x1c\x00\xf3\xdb\xbc\x5e\x7d\xf5\x2b\xe3\
-\xd4\xb8\x14\x57\xfc\x7b\xe7\x9f\xde\x52\x60\xc3\xc8\x18\x49\xc9\
-\xef\x85\xef\xde\xb9\xf3\x4e\x96\x4b\x3f\xa7\xec\x23\xf9\x8a\x7c\
-\xa8\xe0\x62\xe0\xf5\x20\xa0\x4c\x11\x9d\x91\xd7\x20\x53\xd8\xc8\
-\x09\xd1\x02\x70\x72\x7f\x6b\xf9\x2b\x13\x60\x42\xc6\xb2\xe8\xd6\
-\x7f\xab\xbc\x26\x24\x53\x78\x52\x02\x48\x01\x28\x14\xfd\xbe\xea\
-\x96\x74\x87\x1c\xc6\x60\x80\x24\x81\x44\x04\x11\xcc\x87\x79\x4e\
-\x12\xb7\x12\x81\x6c\x90\x08\xf6\x19\xa8\x40\x0d\x00\x28\x32\x0c\
-\x8a\x41\xe7\x8d\xb7\x6f\x30\xc4\x2b\x13\x00\x2b\xf8\x82\x74\x25\
-\x69\x42\x82\x0d\x92\xf1\x3a\xbb\x71\xe7\x4d\xcd\x0c\x84\x20\x23\
-\x70\x44\x4d\xd3\x2f\x49\x29\xfa\x2e\x6f\x95\x2b\x1d\xd0\xc4\x6a\
-\xa4\xf2\x55\xa8\x48\xfe\xf1\xf2\xcb\x9f\x9d\xbc\xef\x4b\xa0\xa5\
-\x18\x5a\xc6\x8a\x5f\x46\x6f\x97\x88\x1f\x12\xb7\x7c\xf2\x89\x4b\
-\xf6\xef\xef\xde\xdf\xc0\x63\xa7\xeb\xb2\xb8\x3f\x70\x46\xf8\xb9\
-\xa4\xbd\x3d\x6e\xee\x9d\xcf\x25\x59\x2f\x4b\xe8\x6d\xd9\xc8\x03\
-\xb9\x4e\x1e\xb1\x97\xa6\xe4\xf9\xa0\x83\x37\x62\xb9\xfb\x51\x45\
-\x22\xb5\x73\x4a\x18\x59\x27\xbd\x42\x9a\xce\x81\xe1\x74\x7d\x1b\
-\x79\x45\x13\xd1\x5c\x85\x97\x75\x02\x29\x40\x25\xba\x4c\x10\x03\
-\x90\x24\xeb\xa1\x71\x74\x6e\xee\xb7\x04\xe9\xc2\xce\x04\x4b\x32\
-\x02\x6e\x49\x9c\xc7\x0e\x92\x5e\x03\x38\x1f\x75\x14\xf7\x18\x1e\
-\x14\xcc\xd4\x34\x10\x1f\x81\x7c\x88\x49\x02\x34\xc0\xe9\x45\x15\
-\x31\x80\x05\x03\x3d\x32\x56\xb6\xe5\xc6\x64\xf2\x77\x67\x4a\xde\
-\x07\x5b\xa7\x29\x9e\xf4\xf3\xbc\x36\x54\xdd\x46\x4c\x5e\x1f\x86\
-\xdd\xa8\x02\x7b\xce\x8d\x6c\x80\xcd\xcb\x2f\xbf\x94\x2f\x74\xd7\
-\x8c\x02\x71\x54\xb1\x31\x09\xc9\x06\x6c\x99\x76\xbc\xf2\xca\xe7\
-\xf2\x04\x05\x9c\x15\x8b\x12\xde\x80\xc0\x8b\x9c\x56\x26\x7d\x85\
-\xf5\xf2\xe5\x67\xe1\xf6\x9d\x3b\x56\x39\x0f\xef\x19\x19\x52\x06\
-\xb2\x58\x22\x54\x66\x29\x67\xb1\x37\xf7\x49\x2c\x9b\x9b\xb7\xdf\
-\x02\x10\x04\x20\x00\x44\xaf\xc2\xb3\x50\xa8\x1f\x29\x13\xfd\xf4\
-\x58\x65\x30\xa1\x00\xb3\x90\x33\x92\x56\xa9\x8e\xc0\x86\x54\xbd\
-\x8d\x4c\x3e\x5e\x98\x30\x44\x0a\x3c\x0a\x65\xb1\xb3\x94\xbe\x50\
-\x38\xd8\x24\xd9\x88\x36\x19\x28\x49\xf6\x5c\x90\xe9\xb9\xc2\x60\
-\x2e\x6e\xdd\xbe\x6d\x01\x87\xb2\xc3\x49\x40\x01\x00\x1d\xda\xf1\
-\x95\x80\x80\x82\x5c\xff\xf4\xf9\x14\x01\x42\x8d\x0c\x42\xd0\x64\
-\xf2\x40\xa3\x75\x23\x95\x6b\x23\x54\xcc\xa5\xa4\xc8\x83\xf6\xc2\
-\xe5\xcf\xc0\x9b\x6f\xbf\x91\x94\xc9\x32\xb1\x38\xde\xba\x75\x53\
-\xad\x3b\x54\x61\x6d\xd8\x01\x08\x21\x00\x3b\xb7\xd6\xc0\xe4\xa8\
-\x0e\xee\xbc\x05\x39\x22\x35\x72\x1e\x4a\xed\x8d\x19\x03\x24\xaf\
-\xbd\xf6\xd5\x2c\xd0\xa9\xc9\x99\x6b\x11\xae\x49\x4f\x1a\xa5\x95\
-\x1f\x1d\xb8\xea\x32\x5b\x0b\x5e\x89\xbb\xe7\x5b\xb8\x74\xb4\x6a\
-\x97\xf3\xb5\x21\x12\x29\xeb\x78\xe1\xbe\x61\xc8\xd9\xd8\x2b\x02\
-\x12\xfb\x28\x0d\x86\x3e\xa8\x49\x85\x9a\xad\x05\x26\x41\x4d\xa9\
-\x2f\x58\x1a\xcb\x43\x2a\xf4\x53\x87\x26\x55\x9f\x18\x63\x43\x42\
-\xd5\x12\x98\xbe\x35\x16\x39\x8e\x31\x03\x6a\x78\x7a\x1e\x30\x76\
-\x33\x69\x18\xce\xa4\x74\x0c\x67\xa1\xb3\x82\x45\x5e\xa5\x79\xfe\
-\x1b\x54\xf2\xc2\xe7\xcb\xc4\xbc\x30\xb7\x53\x68\xb9\x24\x66\x3d\
-\xd1\x90\xc5\xb9\xa6\x8c\x5b\xca\x82\x19\x13\x95\x17\x3b\xa3\xaa\
-\x8d\x55\x15\x28\x2e\x47\xf2\x3b\x96\x37\xd3\xb2\x56\x30\x31\xf8\
-\xd8\x00\x66\xf0\x51\xec\xd5\x8a\x84\x9e\xa9\x79\xa6\xa7\x2d\xe1\
-\x69\x63\x89\x77\xfb\xea\x3b\x42\x53\xb8\x19\x40\x39\x39\xb2\x5a\
-\x02\xe1\xd4\x49\xaa\xbc\x09\x65\x56\x26\x65\x10\x8d\x7e\x29\xef\
-\x4c\x9e\x91\x04\x47\x7e\x72\xeb\xb9\xc6\xb2\xcb\x5f\xc6\x2b\x63\
-\x94\xe0\x48\x69\x2f\x19\x5b\x64\xda\xd2\x2d\x07\x02\x1a\x94\xd2\
-\x27\x07\x00\x1a\x12\xd6\xf7\x4c\x98\x18\x49\x27\xb4\x23\x19\x15\
-\x5c\xff\xec\xcf\x3e\xa7\x9f\x45\x1e\x8b\x9a\x03\x1b\x94\x01\x3a\
-\xc6\xba\xe5\xdf\xf0\xda\x95\xe7\x15\x70\x91\x60\xef\x7b\xf9\xe7\
-\x9e\xd3\x7d\x51\xfd\x89\x80\x9b\x6e\xeb\x67\xae\xbd\x10\x2b\xe4\
-\x46\x89\x97\xba\x3f\xec\x20\x8a\x80\x99\xa4\x68\x9c\x24\xcb\x7f\
-\x8c\xfb\xe1\x27\x87\xf2\x98\x6a\x63\xc8\x0a\xef\x65\x8d\x5e\x32\
-\x06\x8b\xb2\x30\x5e\xa1\xae\x74\xf5\xca\x15\x2f\x57\x93\x08\xe0\
-\xda\xb3\x2f\xa8\x6b\xd9\x33\x48\x8f\x21\x49\x95\x4b\x95\xea\x83\
-\x5b\x43\x32\xf1\x5c\x99\x04\x90\x44\xe4\xe5\x38\x99\x31\x4c\xd1\
-\xa2\x97\xc6\x2f\x9c\xff\xe7\xaf\x5e\xf3\x59\x84\xa4\xca\xa5\x22\
-\x69\xc6\x4f\x2a\xc5\x62\x70\x06\x44\x46\x3c\x94\x95\x1d\x29\x7e\
-\x37\x5e\xf8\x7a\xaa\x5c\xaa\x4f\xe4\xaf\x15\xfa\x54\x69\x01\xc7\
-\xe8\x2c\xc7\xca\x48\x0f\xee\x3d\x0f\x4b\x1d\x54\x1f\xd2\x58\xd9\
-\xd5\x05\x5f\xa9\x90\xae\xf5\x04\x6e\x7d\xee\x71\x39\x2a\x84\x89\
-\xcd\xb9\x2f\x7f\x0f\x27\x8c\x47\x4d\x1b\x4b\x53\x62\x08\x13\xd6\
-\x02\xab\xce\xaf\x2a\xbd\xac\x44\x0b\xde\x72\x3c\xcf\xd4\x6f\x17\
-\x01\xae\x59\xb5\xc0\x45\x70\xf0\x64\x44\xc9\xce\x59\xe7\xb8\x08\
-\x3c\x33\x7e\x4d\x96\x11\x4b\xec\x48\x91\xb0\xcc\xa6\x9c\x5c\x58\
-\x33\x5d\x48\x2d\xb4\x70\xa2\x8e\x27\x66\x61\x64\xd2\x58\xbb\xa4\
-\xce\x9f\xd1\x49\x45\xd2\x1d\x80\xb6\xb2\x28\x01\x08\x93\x47\xb3\
-\x30\x62\x1d\xbf\x27\x16\x11\x21\xcd\x58\x2b\x8b\x7a\x64\x0a\x5f\
-\xc6\x92\xc5\xbe\x66\x8d\x4c\xec\xf3\x34\x50\xc3\x88\x4a\xa9\x3c\
-\x18\x0f\x07\xf2\x6a\xe8\x4c\x19\xc4\xf3\x81\x2c\x18\xc9\x81\x12\
-\x9e\x0c\x9a\xbb\x9e\xbf\x9f\x1d\xdb\x91\xac\xbc\x16\xaf\x8c\x73\
-\x3a\xb4\xd5\x63\x70\x6c\x7d\xce\x5a\x99\x62\x12\xa2\xe0\xaf\x30\
-\xc4\xab\x65\x9c\xbf\xfa\xd5\xd7\xad\x27\xe5\xb3\x2f\xbf\xc4\xac\
-\xb9\xaf\xc3\xcb\xec\xdf\xa9\x33\x37\x6c\x57\xa9\x1d\x98\x19\x93\
-\x57\x5e\x56\x49\xc8\x5f\x7d\xe3\xb5\xd8\x92\x3e\x98\xea\xa0\x2e\
-\x9c\x2a\x04\x42\x29\xa8\x74\xf3\xe6\xdb\x70\xf5\xea\xd5\x0c\x78\
-\x52\x37\x79\xeb\xdd\x37\xe1\xf9\x67\x5c\xc2\xb2\x01\x32\x37\x7f\
-\xe5\x06\x5c\xfb\xf9\x17\xfc\x43\x82\xe2\x5c\x92\xe7\x9e\x53\xf7\
-\xbf\xf9\xf6\x2d\x00\x22\x78\xeb\xe6\x4d\x78\xfe\x9a\x53\x8e\x5f\
-\x48\x50\x3d\xcb\xc1\xdd\xf4\xe6\x37\x6e\xc0\xb5\x4f\xab\x6b\x3e\
-\x73\xc5\xd1\xee\x5e\xbf\xf1\x06\xbc\xf8\xc2\x2f\xfa\x60\x07\x81\
-\x19\xa2\x58\x60\x70\x02\x6c\x60\x62\xae\x48\x82\x4e\xf6\xa4\x74\
-\xb8\x1b\xc4\xac\x36\x52\xb9\x74\xa2\x7e\x9b\x36\xbf\xfd\xab\x6f\
-\xa5\x73\x91\x24\x65\x3c\x41\x04\x20\x24\xdc\xbc\xf9\x36\x5c\xbb\
-\xe6\x72\x56\xae\x3d\x17\xe7\x1b\x19\xc0\x27\x41\x85\xfa\xb9\xba\
-\x4a\x90\x04\xb0\x9c\x8a\x34\xc4\x22\x52\xaa\x3e\xdc\xb8\x79\x13\
-\x5e\xd0\xf3\xf3\xc2\xd5\x17\x92\x6b\xe3\xd6\x7f\xa3\xc9\x19\x82\
-\x41\xba\x7e\xf3\x3a\xbc\x78\xed\xc5\xc2\x7a\xc2\x78\xfe\x9f\x4b\
-\xcd\xbf\xd4\xa1\x8b\x68\x4b\x21\x48\xc9\x3c\x83\x09\x5c\x62\xa8\
-\x93\x15\x6d\x32\x46\xfd\x36\xf4\xcc\x35\x92\x9f\xef\xe7\x1a\x21\
-\x61\x8c\x1a\x45\x2f\x6f\x29\x67\x37\xf0\x1a\x5d\xbd\xaa\x72\x9b\
-\x7e\xfd\xd7\xff\x89\xf2\xc8\x68\x5a\x2a\x47\x2e\xe2\x38\xc6\xbe\
-\xf5\xc1\xb7\xe1\x13\x4f\x7e\x6c\x82\x59\x78\x79\x45\xb1\x78\x46\
-\x11\xc1\xd1\x08\x20\xe1\xa1\x5f\x39\x50\x33\xe5\x59\xe6\x9e\xe1\
-\xfd\x5b\x40\x0d\x25\xbe\x3f\x87\xd5\x2c\xa4\x6e\xce\xb6\x71\xa9\
-\xfa\x68\x73\xbe\x44\x0d\x9f\x5d\x04\xa2\x37\x0c\x6c\x97\x98\xb2\
-\x65\x92\xef\xa1\x21\x1e\x7a\xa6\x43\xcb\x8c\xc1\xca\xfb\x91\x7e\
-\x4e\x1f\x24\x72\x28\x17\x1a\x03\xb1\xe4\x2e\xa4\x0c\xb4\xb3\x5e\
-\x18\x4e\xe1\xc6\x2c\x7b\x52\x77\xda\x1c\x10\x52\xba\x70\x33\x4e\
-\x6d\x1d\x3f\x67\xae\x19\x3f\x03\xa9\x11\xab\x2e\x9b\xe2\x01\xd8\
-\xcb\xe2\xc5\x65\x64\x31\xfa\xff\x5b\x54\x42\x97\x58\xd0\xee\xdb\
-\x1c\x93\x7a\xc8\xf4\x30\xb0\x44\x3f\x1c\x48\xbd\xd7\xd0\xc4\x12\
-\x7b\x4d\xea\xb3\xf0\xbd\x69\xec\x37\x6a\xb2\x1e\x24\x42\xe6\xa2\
-\xf7\x1a\xd7\x0b\x55\xad\x73\xcb\x3f\x3e\x6a\x3d\xfd\xea\x57\xbf\
-\x36\xf2\xd9\xf8\xfe\x33\xb5\x23\xf8\xbf\x5b\x8d\x86\x2e\xdc\x2c\
-\x7e\xa9\xc2\x7b\x60\x95\x97\x2f\x7d\xf9\xcb\x89\x81\xc1\x04\x60\
-\x21\x90\xda\x62\x6e\xbc\x34\x49\xbd\x29\xe1\x0d\x78\xeb\xad\x9b\
-\xde\x7b\x6f\xdc\x78\x13\xde\x78\xeb\x0d\x2f\xb4\xf6\xad\x77\xdf\
-\xf4\x81\xd0\x37\x6e\x00\x84\xcf\x30\x42\x5e\x02\x5c\x7f\xe3\x8d\
-\x84\xe8\x94\xd6\xc2\xf5\xe6\x8d\x1b\xd9\x31\xb8\xf9\xf5\x1b\x20\
-\x07\xe9\xfa\x23\x01\x6e\xbc\xe3\x3f\xff\x6b\x6f\x5e\x8f\x4c\xf4\
-\xd2\x1e\x44\xd2\xf3\x16\x51\xca\x43\x23\xb5\x87\x61\x48\x79\x6e\
-\x72\xc4\x0a\x14\x78\x44\xd4\x81\x07\x2c\xcc\xf8\x8d\xb7\xde\x4c\
-\x28\xf2\x04\x72\x17\x3e\x87\x01\x8e\x70\x2e\xc1\x9d\x23\xe1\xdc\
-\x78\xf3\x74\xf3\x0d\xdb\x0f\xe3\xa1\x91\xba\x4f\x34\xc8\x64\x8e\
-\x8b\xb5\x38\x52\x2a\x6a\x40\xda\xfb\xbc\x31\x3a\x3f\x66\xad\xc5\
-\x6b\xec\x6b\x37\xfc\xf5\xfd\xe6\x9b\x37\xe0\xc6\x8d\xb7\x40\x0d\
-\x95\x6a\xeb\x8d\xc2\xfd\x6f\xdc\x79\xd3\xcd\x8f\xf6\xa2\x99\x75\
-\x6d\x49\x78\xf4\x98\xbd\xfa\xda\x57\x52\xd6\x83\xcc\x9e\xa4\x51\
-\x83\x45\xf8\x2a\x01\x94\xaa\x10\x55\x26\x4e\x52\x24\x09\xbc\x45\
-\x86\x85\x2d\x6d\xc0\x41\xcd\x14\x88\x5e\x3e\x5e\xaa\xa3\x1f\xde\
-\x3f\x5f\xac\xf8\xf2\xd2\xaf\xf3\x60\x1f\x9e\x13\xa9\xf7\xd0\x57\
-\xf4\xb3\x20\xa0\x81\x2a\x3e\x7a\x96\xa4\xec\xf4\x94\x9e\x79\x2e\
-\xfd\x79\x3a\x5f\xa8\x7d\x94\xb8\x57\x6d\x48\xde\xa3\x8c\x76\x49\
-\x85\x94\x61\x26\x58\x62\x92\x37\x70\xc1\x36\xd7\x95\x86\x71\xf2\
-\x50\xa6\xce\x0e\x4b\xdd\x2c\x5d\x79\x16\xf2\x8d\x58\x73\xea\x1c\
-\x17\x35\x54\x62\x27\xd7\x66\xbb\x83\xbb\x77\xef\xc2\x77\xef\xde\
-\x85\xbb\x77\xef\xc2\xdd\x7b\xf7\xe0\xde\xbd\xfb\xf0\xe0\xe1\x03\
-\xd8\x9c\x6f\x60\xb3\xd9\xc2\x6e\x18\x40\xca\xc1\x7a\x52\x42\x06\
-\x21\x6b\x19\x31\xd6\x60\x81\x20\x84\x80\x4e\x74\xd0\xf5\x3d\xac\
-\xfa\x1e\xfa\xd5\x0a\x56\xab\x15\xac\x56\x6b\x58\xaf\x57\xb0\x5e\
-\x1f\xc1\x7a\xbd\xb6\x3f\x2b\xfd\x79\xdf\xf7\xd0\xf5\x3d\x74\xa2\
-\x03\x21\x04\x08\xe1\x04\x14\x8e\xc6\x6d\xd5\x38\xa5\x31\xb2\x62\
-\xf3\x1b\xd6\x46\x9d\xd1\x02\x1b\x6a\x9f\x5c\xe5\xa5\xea\xd4\x94\
-\x5e\xaf\xe0\xb9\xf6\x69\x4a\x8f\x1b\x3b\x81\x99\x99\x31\xb9\x25\
-\xcc\x0b\xf2\x70\xa0\x0b\x23\xbc\x42\xef\x8e\x69\x1b\xd1\x1e\xe6\
-\xd3\x13\x28\x60\x91\x3e\x85\xbf\xb5\x20\xd9\x0d\x03\xec\x36\x1b\
-\x38\x3f\x3f\x87\x07\x0f\x1e\xc0\xfd\x7b\xf7\xd4\xbe\xbe\x7b\x17\
-\xee\xdd\xbb\x07\xf7\xd9\xde\xde\xee\xb6\x30\xec\x06\x6d\x6c\x90\
-\x7b\x1c\x31\x9a\xf1\x4d\xc6\x4a\x06\xbc\x02\x71\xe2\xbe\x42\xc7\
-\xce\x0b\x00\x14\x42\xd1\x01\x0b\x5d\x71\x5c\x08\xf5\x3e\xba\x34\
-\x19\x5b\x13\x4b\xe7\x6a\xb8\xd3\x05\xad\xc5\x37\xf6\x66\xf9\x89\
-\xf4\x88\x3a\x77\x42\x80\xca\x6b\xd1\x7f\x5b\xc5\x58\x7b\x82\x94\
-\xa0\x87\xf8\x39\xa6\x1e\x87\x77\x7a\x91\xb3\x8c\xd9\xe7\xe8\x2d\
-\x23\x4c\xfe\x8c\xdb\x42\x56\x79\x65\x40\xc2\x8c\x99\xb1\xe0\xa3\
-\x27\x43\xd3\xcf\x01\x50\x79\x3a\xb6\x1e\x90\xed\x93\xb5\x53\xc5\
-\xcf\xb1\xfd\x41\x00\x10\xfa\xbb\x22\xf6\xea\x98\xb9\xd3\x74\x60\
-\xa8\x2e\x77\xf2\x5d\x38\xfd\x92\x34\x98\x09\xfb\xe3\xc6\x4d\x24\
-\xfa\x93\x62\xd2\x61\xfd\xe1\x73\x83\x1c\xb8\xf8\xe1\x12\x8e\x07\
-\x40\xdd\x57\x30\x8b\x7f\xb8\x0a\xf8\xb8\xa9\xfb\x22\x08\xfd\x9b\
-\x3f\x87\x24\xc0\x0b\xcf\x3a\x0f\xcb\xf5\x1b\xd7\x2d\x18\x44\x32\
-\xe0\x42\xd8\xf3\x93\x5b\x32\x2d\xa8\x42\xde\x1f\xf4\xc6\xcd\xee\
-\x04\x1d\x02\x22\x03\x70\xc3\x23\x20\xb8\xa5\x90\x7b\x30\x5c\x0d\
-\x28\x34\x78\x07\x72\x2c\xa7\x34\x7a\x36\xe0\x22\x07\x5f\xaa\x68\
-\x82\xd5\x2d\xba\x0e\x56\x7d\x0f\xab\xf5\x1a\x4e\x8e\x4f\xe0\xe4\
-\xe4\x14\x4e\xcf\x4e\xe1\xec\xec\x0c\xce\xce\xce\xe0\xe4\xf4\x0c\
-\x8e\x8f\x8f\x61\x7d\x74\x64\xf5\x0a\xd1\x29\x9d\x02\x85\x00\x81\
-\xea\x3e\x46\x5f\x31\x6b\x16\x73\xc7\xd3\x48\xbb\x69\x8e\xd8\x6b\
-\x2c\x16\xd2\x5a\x57\x8e\x2a\xc5\x33\x1e\x42\xaa\x63\xdb\xb3\x68\
-\xc6\xc3\xc2\x67\x18\x4f\xcf\x56\x2e\x98\x8b\x3b\x32\x28\x34\x75\
-\xcc\xf0\x70\x3a\x0d\x25\x14\x42\xe7\x89\x51\x20\x65\x90\x12\x86\
-\xdd\x00\xbb\x61\x07\xbb\xed\x16\x36\x9b\x2d\x6c\xb7\x1b\x38\xdf\
-\x9c\xc3\xf9\xf9\x39\x6c\x1e\x9e\xc3\xc3\xf3\x73\xd8\x9c\x9f\xc3\
-\xf9\x66\x03\x9b\xcd\x39\x6c\xb7\x3b\xd8\xed\x76\x30\x68\xfc\x40\
-\xd2\x27\xff\x02\x66\x74\x30\x32\x4d\x88\x0e\xfa\xbe\x83\xd5\x6a\
-\x05\xc7\x47\x47\x70\x72\x72\x02\x67\x67\xa7\x70\x76\x76\x09\x1e\
-\xbf\x74\x09\x2e\x3d\x76\x09\x2e\x5d\xba\x04\x47\x6b\x97\xf7\xd6\
-\xef\x45\x1d\x0c\x6a\xc7\x38\x96\x15\xee\xa1\xe1\x96\x41\xce\x84\
-\xe0\xb3\x22\xf0\xea\x6c\x64\x54\x5d\x4d\x07\x8a\xa3\xc1\x5b\x15\
-\x99\xde\x18\x41\x98\x69\x9b\x6c\x5f\xca\x75\xa5\x27\x95\x66\x82\
-\x99\xe2\xf8\x45\x43\xd9\x46\x1f\x30\x7e\xc4\x85\x54\x76\x8c\x98\
-\x33\x11\x1b\x48\x8f\xc8\xea\x72\xd4\xa1\xe7\x95\x09\xfb\xc5\x81\
-\x56\x33\xc1\x42\x73\x1e\x0d\xf9\x1e\x08\xa0\xa4\x60\xa2\xd0\xd0\
-\x60\x0e\x71\xfb\xbb\x53\xb5\x5a\xa4\x00\x12\x86\x90\x03\x21\x41\
-\x82\x5a\x6e\x62\x35\xcb\x4b\x63\x68\x00\x07\x2b\x64\x3c\x4b\x7a\
-\x7d\x18\xc5\x0c\x13\x4f\x34\xc5\xf9\x8c\x52\x69\xff\xd3\x5a\x9f\
-\xc4\x40\x97\x27\x40\x12\x20\x8c\x82\x8a\x0e\x58\x23\x60\x22\xf6\
-\xd4\xac\x50\x4e\x22\xcb\x20\x82\xcd\x6e\xf7\x3d\x45\x4a\x09\x11\
-\x9e\xa2\xea\xda\x17\x80\x0c\xaf\xa6\x11\x79\x9f\x21\xef\x76\xd8\
-\x17\x30\xe1\xbe\xe8\xc0\x96\xd5\x4c\x73\xe5\xfd\xfc\xe7\x28\xf9\
-\xcd\xf6\xa5\x51\xee\xcd\xb8\xd8\x02\x69\x3a\xac\x18\x90\x45\x01\
-\x61\x10\xde\x98\x30\x25\x05\xda\xa2\xb7\xd7\x65\x78\x82\xb3\xf0\
-\x65\x40\x7b\x12\x18\x4b\x3c\x46\x81\xea\xe8\x49\x09\xce\xf6\x8f\
-\xa0\xef\x83\x99\x35\xc0\xee\x41\x9e\x32\x81\x45\xed\x11\xbd\x27\
-\x04\x9b\x40\x72\xda\x49\xca\x9b\xd5\x10\x47\xf6\x3b\xb2\x9e\xa9\
-\x7e\xf8\x6b\x0d\x7d\x01\x60\x80\x25\x48\x8d\xe4\x08\x84\x20\x8f\
-\x7c\xc1\x6e\x20\xf4\xcf\xc0\x10\xd4\x84\x67\x25\x65\x9b\xbc\x5f\
-\xa9\x8c\x7c\xbf\x20\x82\x40\x23\xcb\x3a\x25\xcb\x84\x50\xf2\xcc\
-\xc8\x38\xe4\x40\xc5\x85\xa2\x31\x47\xb5\xfb\xa3\xe0\xa5\x89\xea\
-\x79\x2c\x6e\xae\x99\x36\x74\x54\xb2\xe7\xe2\x41\x9a\x50\x57\xbf\
-\x74\x29\x1b\xe8\x02\xf7\x99\x14\x96\xf7\xa8\x1c\x78\x98\xef\xf6\
-\x21\x9b\xc4\x6d\x48\xae\x9e\xa4\x09\xc3\x0d\xbc\xf0\xc4\x53\x49\
-\x24\x23\xa5\xa1\x7a\x35\x9d\xa6\xcd\x7d\xbf\xf4\xfa\xb2\x35\x68\
-\x80\xe5\xd1\xa0\x03\x33\x1d\xb9\x58\x68\x57\x59\xd4\x81\x1c\xf3\
-\x37\x58\x97\x16\xe9\x3c\x1a\x52\x07\x34\xd6\x0b\x97\x09\x62\x60\
-\xc9\x35\xb8\x0f\x83\xcc\xfc\xbd\x4f\x23\xd6\x82\x2a\x57\x20\xcd\
-\x6a\x2f\x95\x40\x0d\x38\x4d\xcd\xe4\x44\x20\x3d\x8a\x59\xac\xf3\
-\xc8\xa4\xc0\x8c\xd5\x31\x68\xe1\x05\x50\x81\x6f\x3c\x8b\x34\x81\
-\x57\xe2\xd8\x1c\xf2\xc6\xe3\xd9\xf7\x1d\xf4\x5d\x07\x43\xd7\xa9\
-\x50\x20\x00\x40\x89\x4a\x08\xb5\xae\x3a\xda\xaf\x38\xa5\xc0\x62\
-\xc4\xb3\x89\x28\x41\x25\x63\x41\x08\x1a\x8b\x8f\x0f\x1c\x42\xbe\
-\x2e\x04\xa7\xe4\xa1\x20\xb6\xb8\x02\x2b\x35\x53\xfb\xb9\x92\xe9\
-\x4c\xa6\x98\x80\x0a\x68\x57\xb3\xf1\x0a\x91\xb6\xb0\x87\x45\x21\
-\x78\x8e\x93\xf9\xa5\xbe\xeb\xe7\x12\x1a\x6b\x3c\x06\x82\x10\x79\
-\x5f\x04\x28\x5a\x62\xd4\xf4\xd0\xdc\x60\x83\xe1\x28\x18\x60\x46\
-\x5e\xd7\x9d\xd2\x97\x86\x73\x88\x00\x24\xb4\xb7\x06\xc1\x8f\x9b\
-\x40\x36\xda\xc8\x19\x77\xf5\xb3\xd8\xc6\x46\xf4\xfb\x12\xce\x0d\
-\xd8\xe7\x50\xb2\x98\x86\xeb\x8f\x53\xf8\xa3\xac\x2a\x0c\xfa\x14\
-\xda\xfd\xf5\x38\xa9\x71\xe3\xcf\xc1\x40\x99\x76\xef\xb9\xb9\xf1\
-\xbd\xca\xfe\xb8\x21\xb3\x0d\xf9\x1b\xa5\x13\x82\x9d\xf5\xc8\x80\
-\x67\xec\x95\x40\x4c\x98\xd0\x05\x06\xba\xb8\xb9\x87\x22\x4a\xe8\
-\x50\xd5\xf6\x91\xfa\x3d\x55\xeb\x87\x3c\x06\xc0\xd0\x42\x0a\x5e\
-\x04\x04\xee\xd7\x42\x3c\x45\xb7\x34\xfb\xd8\x46\x7f\xf4\xd0\x77\
-\xca\x9a\xdb\xf5\x1d\x74\x9d\xf2\xda\x88\xce\x80\x1b\x74\xc0\x26\
-\xf0\xe6\xa1\x17\x92\x96\x68\xd0\xc5\x2f\x64\x9f\x65\xcc\xa2\x19\
-\xf7\xc2\x29\x22\x1f\xf7\x77\xce\xd1\x64\x4b\x61\xfe\xd5\xe4\x9d\
-\x99\xa2\x6c\x60\xad\xf1\x78\xda\x73\x97\x30\xec\xd2\x98\xad\x94\
-\x9f\xb4\xc4\xcb\x00\x58\x97\xb6\x4f\xfc\x22\x7d\x70\xc3\x1d\x16\
-\xee\xbb\xb1\xe1\x15\x27\x37\x78\x61\x40\x53\xac\xce\xe7\xd1\xa2\
-\x12\xf3\xd0\x30\x66\x1c\x1d\xc3\x1d\xb2\xe1\x98\x58\x70\xe8\x18\
-\xed\x33\x02\xb3\x84\xb1\x82\x60\x58\x69\xc9\x4e\x99\x9a\x26\xee\
-\x38\x5a\x68\xed\x67\xaf\xc5\x3d\x4b\xbe\x51\x30\x4c\xd3\x56\x54\
-\xe5\x55\xe9\xcd\x48\x09\x91\x8c\x17\xa6\x20\x70\x44\x00\x90\x01\
-\x33\x7b\x45\xca\xa1\x39\x0c\xd3\x09\x66\x14\xd8\xa8\x51\x87\x5a\
-\x99\x10\x8d\x6e\xb5\x82\x6e\xbb\x83\x7e\xb5\xb3\x4c\x4d\x28\x04\
-\xc8\xc1\x79\x4e\x9b\xe6\x7c\x4f\x21\x15\xde\x5a\xa4\xcc\x1a\x0d\
-\xd1\x38\xfa\x0a\xa8\xf5\xd6\x18\x80\x23\x62\x55\xde\x2b\xb0\x49\
-\x61\x76\x64\x4d\xbb\x59\xfc\x07\x3a\xe6\x9e\x48\xc1\x20\x46\x38\
-\x40\xb1\x62\xee\x29\x96\x90\xe1\x74\x42\x5f\x71\x86\x94\x83\xc6\
-\xdc\x5b\x70\x96\xb7\x54\x28\x6d\x21\x8b\x15\x69\xb4\x3f\xb6\xfe\
-\x8c\x01\x03\x59\x5f\x77\xf8\x1c\xf2\x40\x46\xae\x3f\xd1\x73\x04\
-\x79\xc6\x3e\xac\xf0\xf8\x99\x31\xb4\x9e\x1c\x01\x69\x25\x9d\x98\
-\x21\x82\x3d\x07\xa3\x35\x30\xa2\x36\x26\xfa\x93\xbb\xbc\xeb\x56\
-\x76\xaf\x71\x10\x81\x63\x32\xd9\x44\x28\x20\x78\x1e\x07\x7e\xfc\
-\x0a\x74\x79\x4c\x9d\x80\x6a\xda\x54\xee\x91\xc4\x0b\xa7\xe0\x3b\
-\x40\x82\x26\x2c\xa5\xeb\x74\x28\x99\xfb\xe9\xfa\x1e\xba\xae\xb7\
-\x46\x1c\xa1\xc3\x58\x10\x7d\x70\x63\xe5\x23\xe0\x28\x1b\x9a\xe7\
-\x0c\xc6\x36\x03\xe2\x5e\x94\xe6\xb1\xfa\x27\x13\xd1\xc9\xe4\x29\
-\x9e\xa8\x61\x37\x75\x7b\x7a\x61\x79\xfb\x8c\x83\xd5\xc9\x59\xd2\
-\x2b\x85\x8b\x0f\x7b\x63\xf3\xdc\x99\xa8\x1c\x0d\x9a\xb1\x5f\x02\
-\xd3\xe1\xb5\x57\x86\xc2\x3a\x93\xbc\x70\x73\x10\xf5\x31\x46\x71\
-\x9e\x30\x48\x95\x2e\xeb\xab\xba\x19\xee\x92\x91\x91\xb0\x0c\x29\
-\x76\xcf\x11\xab\x47\xc3\x13\x88\xa4\x4b\x1e\x92\x6c\x40\xa4\x21\
-\x6f\x96\x40\x52\xa8\xaa\xd1\x61\x49\x9a\x71\x34\x33\x7f\x45\xe1\
-\xde\xd6\xe0\x23\x35\xe3\xd0\xec\x41\xa1\x79\xbb\x66\x2c\x76\x29\
-\xf0\xd4\x00\x20\xdc\xe7\xc5\x34\x1f\x55\xcc\x19\x8c\xd0\x78\xce\
-\x1c\xaa\x65\xe6\x81\x79\x0e\x8c\x25\x52\x5b\x28\x3b\x21\xa0\xeb\
-\x7a\x9b\xcb\x36\xac\x56\x36\x9f\x03\x11\x41\x0c\x03\x03\x34\x5c\
-\x33\xbe\x58\x56\x48\x88\x6a\x98\x50\x56\xf1\xb1\xbf\xd1\x59\x77\
-\x01\x63\x45\xcd\x81\x9a\xcc\x46\x49\x84\x4f\x65\xbd\x58\x18\x5a\
-\xf3\x43\xb0\x91\xdb\x8c\xb9\xb6\xe5\x15\x67\xe4\xbf\x01\x3d\x90\
-\xe7\x79\xae\x28\xf5\xc5\xba\xd1\x76\x20\x03\x93\xb2\x1e\xc2\xc2\
-\x8d\x76\xff\x62\x41\xfd\xa7\x68\x8f\xc7\x60\x06\x81\x7b\xe7\x8a\
-\xe3\x96\xc5\x67\x94\xe4\x10\xcf\x11\x62\x50\xc8\x6f\x9c\x00\x9c\
-\xbe\x4f\x2e\x07\xfc\x59\x58\x5d\x30\x00\xef\xfd\xca\xaf\x78\xa0\
-\x99\xc2\xe1\xc8\xc9\x36\xca\x60\x44\xb6\xae\xc3\xb5\x66\xcb\x28\
-\x48\x96\x21\x45\xe5\x83\x20\xf2\xfa\x25\x1a\x85\x13\xc4\xfe\x52\
-\x52\xcf\x80\x38\x13\x6e\x66\xe4\xd9\xfa\x68\x0d\x2b\x93\x83\xdb\
-\xf7\x36\x07\xd7\x84\xa2\x21\xaa\x30\x5b\xb4\x06\x0e\x74\xe3\x66\
-\xd9\xd0\xe0\xa3\xf3\xa2\x09\xd7\x61\x9d\xba\x77\xa8\x61\xf8\xc8\
-\x0c\xf7\x54\xce\x29\x9a\x91\x3b\x73\x18\x3c\xd9\xb0\x7c\x38\x03\
-\x26\xd9\x3a\x5f\x52\x17\x11\x76\x3f\xd2\xb2\x9d\x59\x7a\xf9\x40\
-\x7e\xd3\x9e\x06\xa3\xdf\xb7\x54\x32\x61\x67\x64\xb9\xf0\x4d\x5d\
-\x04\xd7\x69\x2f\x77\xc6\x78\x6d\x24\x77\x8f\x27\xf2\x68\x26\x2b\
-\x7d\x78\xf1\xb7\xd5\xfe\x56\x64\x8b\x1d\x2c\x6b\x19\x6f\x7b\x6e\
-\x4a\x62\xf2\x70\x9a\x42\x97\x3d\xa5\x04\xe3\x6b\x59\x54\xd5\x85\
-\x16\x84\xfb\x08\x80\xf5\xc2\x61\x28\xfb\x20\x15\x67\x8e\xd0\x09\
-\x01\xa2\xeb\xa0\xef\x7b\x58\xad\x56\x30\x0c\x47\x6a\xff\x01\x81\
-\x40\x84\xed\xae\x87\x7e\xb7\xf3\x69\x17\xa7\x4c\x7c\x49\x52\x61\
-\x83\xdf\x92\xea\xdf\x2f\xee\x70\xc4\x28\x9c\x26\xc9\xa0\x04\x30\
-\xb9\xc8\x12\x05\xbc\x8b\x01\xca\x88\xd3\x27\x28\xe5\x01\x2d\x2b\
-\x8b\x54\x52\xee\x32\x8a\x0a\xcd\xd9\xbb\x40\xc1\xb4\x05\xa1\x47\
-\xc1\xfd\x29\x8f\xed\xaa\xe8\xdf\x79\x1a\x0c\x66\x96\x13\x15\xc1\
-\x75\xe5\xa8\x71\x60\x9b\x5d\x62\x94\xe5\xbb\x6f\x49\x11\xc8\x3e\
-\x82\xe6\x58\x98\x28\x39\xb0\x88\x51\x4c\xa0\xcd\x5b\x4d\x82\xcf\
-\x86\x91\x44\x68\x01\xc3\xfb\x52\xd5\x3c\xf4\x06\x42\x13\x4e\x28\
-\x40\xd3\xc1\xaa\x5f\xc1\x6a\xbd\x86\x23\x03\x6a\xd6\x6b\xe8\x7b\
-\x15\x8a\xd6\xf5\x9d\xcd\xab\xe1\x1e\x1a\x33\x6e\x58\x02\x32\x61\
-\x39\x0a\x28\x7b\x69\x66\xeb\x4f\x74\x80\xa1\xdc\xf7\x6d\x2a\x35\
-\x6b\x5c\xea\xa1\x13\x69\x90\x9b\x3d\x43\x38\xbf\xb9\xb4\xe4\x80\
-\x63\x03\x70\xad\x55\x4d\x52\xe1\x66\x04\x9e\x4e\x60\x29\xee\x19\
-\xcb\xa3\x63\xcb\x94\x5e\x2d\x31\x49\x92\x15\x53\x76\x84\x30\xa1\
-\x99\x0e\x27\x0e\x14\x35\x01\x9a\x09\x87\x3a\x42\xe0\xf7\xf6\xe8\
-\x6a\xc8\x2b\x3c\x46\x9c\xc2\x59\x4a\xcd\x7e\x20\x1d\xa8\xe1\x83\
-\x41\x52\x27\x02\x63\xe0\x99\x09\x13\xca\x4b\xa3\x91\x0f\x35\xa3\
-\x8c\x25\x11\x5b\x16\xc3\xc4\xcd\x9a\x52\xd4\x17\x51\x7a\x5b\x22\
-\x85\x72\x05\x6b\x68\x86\x8f\x77\x4c\x02\xb1\x5a\x02\xfe\x14\x26\
-\x06\xa0\x24\x50\x2e\x9c\x3b\xac\x52\x08\xcf\x68\x33\x26\x46\x89\
-\x58\x08\x1a\xb2\x84\x01\x17\x6a\xd6\x43\xbf\xea\x61\x3d\xac\x2d\
-\x70\x41\xd4\xef\x5b\x06\x12\xe9\x55\xf6\xad\x59\x44\x74\xd0\x71\
-\x6c\x61\xa5\xc1\xb2\x72\x9d\x8a\xb6\xa2\xfa\x33\x92\xea\x1f\x5d\
-\xb7\x2d\xa6\xae\x05\xdc\xff\x73\xb0\x42\x93\xa7\x82\x71\x24\x05\
-\xfe\x8a\xcf\x48\xc4\x72\xcf\xeb\x0f\xc5\xf2\x3f\x04\x4f\xb4\xa7\
-\x05\x8d\x95\xf2\xa0\xa8\xac\xe4\x62\x82\x30\x3b\x47\x94\x29\x9a\
-\x4b\xa3\xfb\x09\x0b\x0c\x9f\x95\x21\x68\x4b\x85\xa0\x66\xce\x42\
-\xa1\x81\x89\xd0\xf9\x32\xc6\x50\xb3\x5e\xaf\xe1\xe8\xe8\x88\x81\
-\x9a\x95\xca\xa7\x11\x9d\x26\x44\x61\x6c\x82\x42\x78\x39\x86\x98\
-\x02\xac\x38\x57\x5e\x7d\x34\x5f\x54\xa1\x33\x2f\x8b\x56\x46\x6e\
-\x47\x0b\x84\xf4\x2d\x8c\xab\x2f\xc4\x24\x61\xc2\xce\x51\xd1\xd6\
-\x51\x72\xc2\x40\x16\xf2\xb4\x19\x60\xd1\x56\x26\xc4\xcc\xa6\x92\
-\xb0\xb0\x33\x69\xea\xbb\x15\x8c\xa3\x58\x59\x21\xc4\xd7\x44\xf2\
-\x93\xbe\x18\xa0\x49\x71\xc6\xdb\xb0\x33\xc5\x19\xca\x14\x25\xe9\
-\x06\x63\x20\xa0\x5e\xba\x8a\xd3\x7c\x80\x98\x97\x86\x17\xe5\x41\
-\x02\xc5\xc2\x13\x31\x1c\xb5\xb3\x6f\xe1\x05\x92\x4b\xb9\x62\xa5\
-\x38\xa1\x71\x53\x58\xcf\x16\xeb\x7c\xd6\x33\x53\x40\x6e\xa3\x93\
-\xe1\x42\xd1\x28\xa5\x9c\x3e\xc2\x30\xb4\xe2\xb0\x61\xe5\xf8\x4e\
-\xae\xe2\x45\x9e\x50\x53\xc4\x58\x3c\x6f\x04\x41\x60\x07\xa2\xef\
-\xa1\x97\x12\xa4\x5c\xeb\x7a\x4f\x8a\xf6\xb4\xeb\x3a\xe8\x57\x2b\
-\x18\x76\x3b\x90\x72\x80\x81\xd7\x09\xd9\xfb\x6e\x98\xaa\x25\x53\
-\x66\x13\x97\x8a\x31\xcd\xe1\x2d\xc4\x03\x4b\x07\x5c\xa0\x6d\xb5\
-\xfa\x32\x2d\xbc\xf0\xa7\xf0\xf0\xd6\x87\x0e\xa7\xf4\xf0\xbc\x17\
-\xa8\xc4\xb5\x87\x0b\xcf\x0f\x35\x8f\xd5\x5c\x53\x01\x16\x35\x82\
-\xc4\xdd\x88\xda\x1e\x81\x69\xba\xe4\x47\x25\x4b\x3d\xe2\x03\x04\
-\x67\xa8\x11\x42\x79\x63\xfa\x5e\x95\x7d\x30\xe5\x1f\xfa\x15\xf4\
-\x2b\x95\x4b\xd3\x69\x9a\x66\x61\xbc\x33\x88\x2c\xf4\x8c\x75\xaf\
-\xa5\x0c\x02\x2d\xb3\x14\x0e\xf5\x9a\x02\x4e\x68\xcf\x73\x3b\x33\
-\x65\x68\xf6\xf3\x9a\x31\x4a\xc5\x99\x9d\xb3\x15\xd0\x1e\x37\x08\
-\x4e\x6c\x2b\x8c\xa8\x6a\x14\x58\xf9\x4c\x9d\x48\xab\x9f\x1b\x62\
-\xaf\x41\xaa\x1f\x8f\xe1\x8c\x40\x82\xfa\x1b\x24\x44\x84\x00\xb3\
-\x30\x22\xa6\x1b\xdf\x8f\xc2\x62\x80\x98\x16\x35\xb9\xb2\xc6\xaa\
-\xc6\xf2\x3c\x1a\x5d\x2b\xc3\x0e\x88\xf6\xc6\x0c\x2e\xa7\xc6\x85\
-\xbe\x48\xe6\xea\x22\x16\x2a\x40\x73\xec\x07\x7b\x7f\x85\xd5\xe4\
-\xe7\x2c\xd8\x56\xbd\xb7\x29\xb4\x96\xa6\x1e\xb6\xf9\x07\x8f\xa6\
-\x37\x64\x3a\x44\x14\x1e\x5c\x69\x92\x80\xa2\xa0\x4a\x39\xec\xf6\
-\x71\x2a\x5c\x98\xa5\x86\x11\xfa\x45\x9d\x5f\x66\xac\x90\xa2\x23\
-\xe8\x48\x80\xec\x7b\xe8\xf5\xfe\x33\x0c\x41\x7d\xbf\x82\x15\xf7\
-\xce\xa4\x42\xce\xe8\x00\xcd\x6f\x59\xc4\xd4\xa0\xd8\xb7\x46\x98\
-\xee\xa9\xaf\x7b\x27\xbc\x9b\x4a\x25\x4b\xcb\xb4\xe9\xef\xfe\x67\
-\xff\x89\xfd\xfb\x7f\xfc\x9f\xfe\x45\x75\xb3\xbd\xef\xfd\xcf\xff\
-\x62\x06\x00\xa0\xe6\x31\xc2\xa5\x66\x60\x66\x4a\xe1\xb8\xc0\x4c\
-\x74\x25\x05\xe2\x2b\xf7\x12\x55\x0a\xf9\xb1\x50\xb3\xa9\x73\x3e\
-\x4b\x11\x45\x80\xbf\xfb\x9f\xba\xe7\xfe\x2f\xff\xeb\xbf\x54\x72\
-\xac\xd3\x75\xee\x6c\x8d\x3b\x55\xe7\x4e\x11\x04\x74\xba\xee\x0c\
-\x32\x23\x0f\xcf\x99\x41\x2f\x07\xa9\x55\xc1\xe5\x55\xea\x79\xa1\
-\xc7\xdc\xfb\x8b\xea\x19\x33\x9e\xb1\x97\x14\x4f\xdc\xc3\xa5\x54\
-\x38\x7e\x53\xa1\x0a\x87\x44\xdb\x58\xaf\xea\xb4\xce\x67\xed\xbc\
-\x62\xe3\x18\xd6\xd6\x22\x62\x3c\xa2\x4e\x83\xd7\xec\x2c\x36\x75\
-\x44\x86\xc5\x35\x59\xc8\x19\x18\xe3\x28\x80\xcb\xbd\xa9\x68\x3b\
-\x4e\x5f\x70\x75\x39\x34\x33\x57\xbd\x97\x47\x43\x86\x15\x41\x68\
-\x2f\xcd\x00\x52\x76\xda\x55\xe5\x92\x8a\x2c\x69\x80\x1e\x38\x90\
-\x02\x40\x28\x6e\x50\xa2\x44\xcc\x6b\x15\xd4\xd3\x17\x8d\xb0\x94\
-\x60\xd3\x3d\x1f\xdd\x1e\x5a\x33\xd0\xb4\x19\xea\xec\x7d\xc7\xec\
-\x3b\x61\x65\xfa\x93\xde\x7d\x76\x7f\xeb\x7f\x76\xba\x12\xec\xb3\
-\x81\xbd\xdf\xb9\xf7\x37\x03\x9c\xae\xbb\xa6\xfe\xdc\x3b\xdf\x01\
-\x00\xc1\xd9\x91\x5b\x8a\xf7\x36\x03\x3b\x3f\xc9\x7b\x86\x69\x1b\
-\x81\x4f\xe7\x7c\xbc\x4a\x4f\x54\x0e\x4c\x96\x00\x67\xea\xb3\x1c\
-\x5d\x73\xee\xf5\x60\xa0\x2a\x10\xc4\xc7\x3c\xf9\x5d\x7e\x6d\x30\
-\x77\x68\x23\x02\xd5\x7e\x38\x5b\xbb\x39\xfa\xf0\xc1\x16\x3e\x76\
-\xe9\xc8\xfb\xfe\x9f\x7e\xeb\x03\xad\x0c\x39\xba\xd3\x1f\xfd\x91\
-\xbf\x61\x3f\xff\xed\xdf\xfd\x3d\x47\x08\xe0\x85\x9b\x11\xfc\x9d\
-\x9f\xf8\x71\x7b\xdd\xbf\xfe\xed\xdf\xf1\xba\xf3\x93\xec\xb3\x7f\
-\xf5\xdb\xbf\xe3\x75\xf3\xa7\xd8\x67\xbf\xa5\xbf\x87\x89\xef\xf1\
-\xef\xa7\x36\xe5\x4f\xfe\xed\x1f\xcf\x8e\xf5\xbf\xfa\x37\xbf\x93\
-\x7c\xbf\xf4\x9d\x7f\xfd\xdb\xbf\x1b\x4d\x0a\x6f\x77\x55\xdb\x12\
-\xd7\xfe\x56\xe2\x9a\x70\x0c\x7e\xea\x27\x7e\x7c\x96\x0c\xf8\xad\
-\x7f\xf3\x3b\x91\x7e\xe9\xcf\xc1\xef\x56\x1c\x5e\xf5\x94\x87\x39\
-\x32\xc8\xdc\x8e\x38\x3b\x3b\xf3\xbe\xf0\x93\x7f\xfb\x3f\x1e\x1d\
-\xc3\xf8\x7b\x13\x74\x7e\xac\x95\x9c\xe5\xaf\x85\xeb\x79\x31\x7c\
-\xb3\x64\x08\x60\xe3\x9c\x4c\xad\x8d\xcc\xf7\x50\x6e\x9f\x01\x00\
-\x5c\xba\x74\x76\x10\xd0\x1f\xbe\x4e\x4f\x4f\x1d\x73\xa3\x0e\x3d\
-\xeb\x75\x68\x6d\xaf\x3d\x34\x7d\xd7\xfb\xb5\x69\x74\xa8\x19\x22\
-\x96\x4c\x43\x45\xe3\xdb\xe2\x9d\xfb\x28\x91\x11\x1c\x52\xd9\x69\
-\xf9\xbc\x42\x5f\x33\x97\xf0\x5a\x34\x1b\x49\x17\x62\xf8\x8f\x04\
-\x4e\x1e\x26\xdc\xc7\xb0\xdb\x34\x11\x96\x43\xa3\x09\x00\x1c\x70\
-\x31\x84\x5e\x83\xfe\xf1\x3d\x38\x92\xd2\xec\x66\xfb\x5a\x24\x7d\
-\xd5\x26\xc3\x3c\xba\xc7\x4c\x9a\x05\x66\xca\x0a\xdb\xa4\x22\x8e\
-\xe6\xac\x97\x66\x60\x16\x62\xc9\x80\x8d\xe2\x3c\x33\xfc\x00\x88\
-\xac\x4e\x04\x61\x46\x12\xd5\x08\x0f\x3c\xc8\x02\x39\xd4\x3e\xa7\
-\x19\xb2\x21\xa5\x58\x3f\x52\x37\x44\x43\xc2\xff\xc9\x2a\x7f\x91\
-\x01\x22\xe7\x03\x5d\xcc\x49\x9b\xf8\x3a\xe9\x31\x00\xa4\x61\x4d\
-\x0d\x80\x0f\xef\x6f\xe0\xf1\xd3\xb5\xdb\xec\xfd\x4a\x57\x30\x57\
-\x05\x35\xff\xa3\xbf\xf1\x1f\xda\xcf\xfe\xf7\xff\xe3\xdf\x5b\x2a\
-\xf5\x9c\x35\xc5\x2a\x11\x67\x97\x6c\x97\x7e\xec\x47\x7f\x24\xfe\
-\x2c\xf3\xd5\xb3\xd3\x4b\xa3\x1b\xcb\xdc\xbb\x65\xbc\x8c\xd2\xf5\
-\x7b\xff\xf6\xf7\xab\x75\x83\xbf\xf3\x13\x4a\xc9\xfe\xdf\xfe\xdd\
-\xef\x57\x5b\xaf\x6c\xdb\x0a\xf3\xfa\x53\x3f\xf1\xe3\xb6\x1d\xd9\
-\x31\x68\x7c\xfd\xde\xbf\xfd\x7d\xf8\xb1\xbf\xf5\x23\x4c\xf1\xf7\
-\xef\xc1\x3f\xfb\xbd\x7f\xf7\xfb\x7b\x58\x93\x69\x89\x98\x07\x34\
-\x97\xaa\xfa\x4f\x58\x31\xbe\x8b\x20\x04\x82\xa9\xc9\x11\xa7\x67\
-\x97\x1e\xd1\x3e\x6f\xf3\xe9\xb5\x44\x55\x52\xf5\x78\x62\xf5\xbc\
-\x9e\x56\xec\xed\x7d\x0c\xdf\xd9\xd9\x99\x26\x07\x40\x10\x06\xd4\
-\x88\x0e\x84\xae\xb1\xd5\xf5\xbd\x7a\x5f\xcb\x3c\x95\x43\xc3\x43\
-\xcd\x30\x62\x88\xc3\x43\x69\x8e\xf5\x43\xbf\x2c\x00\x4e\xe8\x71\
-\x5e\x1b\x0e\xa4\xfc\x34\xd7\x20\x69\x51\x82\x0e\xa5\xc0\xd1\xf2\
-\x11\xfb\x00\x6d\xde\xb6\x45\x6b\x19\x26\xca\x3e\x00\xab\x3f\x43\
-\xcc\x1b\x63\x42\xcb\xbc\xfc\x19\x39\x00\x51\x90\x8b\xcb\x7c\x3c\
-\xe5\x7e\xc4\x05\x97\x5b\xfb\xd1\xb7\x6c\x09\xc4\x84\x39\x48\x7b\
-\x4b\x1c\x97\x7e\x46\x0b\x65\x75\x69\x48\x12\x48\xc1\x8b\x6b\x2a\
-\xe0\x32\x98\x70\xb3\x41\x06\x5e\x1a\x09\x9d\x65\x3c\x53\xde\x1d\
-\x5b\xbc\xd3\x2f\x69\xd6\xbc\xa0\xc7\xc2\x60\xf1\xa2\xa3\x9b\x3d\
-\x41\x8f\xd3\x15\x6a\x2f\x4d\x4b\xa2\x0e\xc1\xfd\xf3\x9d\xf7\x36\
-\xf7\xbc\xdc\x3d\xdf\x36\x9f\x12\x44\xe5\x59\x0b\xc1\xcc\x43\xa6\
-\xe4\x1f\x33\x90\x76\xd4\xe1\x34\x50\x83\x69\x01\xc3\xad\x29\xa9\
-\x3a\x34\x74\xa0\xc9\xcc\x1b\x14\x94\x47\xf3\xc3\xfb\x5b\x78\xfc\
-\x74\x05\x00\x00\x9f\xf8\xf8\xe3\xf0\xfe\x5f\x7e\x17\xa4\x10\xf0\
-\xc9\xef\x7b\xca\xbb\xfe\xf8\xf8\x44\x09\x1e\x19\x44\xcf\xa6\xbc\
-\x4a\x27\x27\xd9\xf6\xfc\xd8\x8f\xfe\x08\xfc\xc1\x1f\xfe\x51\x1a\
-\x84\x9d\x9e\x8c\xee\xcd\xd3\xd3\xd3\xd1\x0c\xf0\x3f\xf8\xc3\x3f\
-\xb2\x1f\xff\xf0\x5f\xff\x41\xf6\xdd\x7c\xbb\xfe\x4f\xd6\xa6\xbf\
-\xf9\x43\x3f\x58\xd5\x97\x96\x7e\x27\xfb\x99\xf9\x2c\x1c\x9f\x1f\
-\x66\xed\xc9\x8d\xdd\x1f\xfc\xe1\x1f\xd9\xeb\x7e\xec\x6f\xb9\x31\
-\xe6\xdf\x55\x6d\x3c\x1d\x3f\xf1\x66\x66\xd8\x63\x71\x7c\x71\x64\
-\x6c\x4e\xb3\x37\xf2\x3e\x2b\x6b\xde\xd3\x36\xd3\x04\x50\x53\x9a\
-\xcb\x83\x08\xe2\xa6\x79\x18\x2f\x82\x49\x33\xc6\xb6\x34\x16\xa7\
-\xa7\xa7\x93\x2b\xdd\xb7\x5e\xf5\xef\xff\xaf\x3f\x02\x4b\x78\x82\
-\x86\x20\x40\xd5\xa4\x71\x9e\x18\x55\x60\xd3\xd6\xa1\xb1\x60\x06\
-\x3d\x30\x53\x15\xa9\x31\x05\xd4\x90\x7f\x2e\x34\x13\x08\x3d\x02\
-\xc5\x7c\x91\x67\x4f\x24\xc6\xc4\xa5\x9f\xd1\x78\xd3\x25\xd5\xbc\
-\x43\x9b\x4e\x1b\x96\x64\x15\x90\xf1\xc0\x9a\x4d\x5e\xf7\x19\xce\
-\x78\xf1\xcc\x28\x7f\x26\x57\x50\x93\x3d\x00\x17\x97\x7d\xcd\x80\
-\xc6\x29\x50\xca\xa2\x41\x40\xc4\x58\x95\x42\x10\x83\xa9\x5c\x07\
-\xf7\x1f\x30\x86\x04\x4b\xef\x26\xa5\x43\x7d\x92\x51\x3b\x4b\x02\
-\x29\x24\x08\x12\xae\x7e\xbc\x4e\x5a\x46\x44\x95\x5b\x93\xe2\xfb\
-\x6c\xa5\x62\xdc\xb3\x5c\x69\x0d\x73\xca\x7d\x96\x0a\x7f\x9a\x95\
-\xb3\xc3\x2e\xbf\xbf\x25\x38\x0d\x40\x42\x14\x6e\x46\x35\xd6\x8a\
-\x96\xa3\x6a\x4a\xa6\x18\xc1\x09\x6b\x17\x00\xc0\xc3\x20\x4c\xee\
-\x7c\x47\x70\xd4\x3f\x1a\x34\x5a\x8c\xf5\x35\x0a\x42\xef\x87\x90\
-\x99\x7f\xc7\xde\x97\x8c\x82\x51\xb8\x4e\x6d\x3f\xa1\xaa\xde\xb3\
-\xd7\x53\xdf\xf3\x18\x7c\xf0\x9d\x7b\xde\x7b\x7f\xf6\xfe\x5f\xaa\
-\xb0\x4e\x02\x2b\xb4\x4a\xa6\xa7\xe3\xe3\x58\xb1\xf9\x93\x3f\x7b\
-\x1f\x3e\xf9\xfd\x4f\x79\x9f\x7f\xea\xfb\x1d\x68\xfa\xe3\x3f\x7b\
-\xdf\xbb\x9e\x7f\xc6\xbf\xfb\x37\xff\xda\xa7\xe0\x4f\x82\x6b\xa3\
-\x7e\x1f\x1d\xa7\xdb\x75\x74\x92\x95\x78\xa9\x36\xe7\xde\xff\x64\
-\xa6\x6d\x3f\xfc\x43\x3f\x18\xf5\x23\xf5\xfa\xe1\x1f\xfa\x41\xf8\
-\xe3\x3f\xfd\x56\x72\xf8\x8e\x32\x6d\x1f\x6b\x67\xf2\x19\x41\x5b\
-\xf8\xbf\x4b\x63\x9f\x7a\x79\xd7\xff\xa9\xba\xfe\x53\x3f\xc0\xdf\
-\xfb\x16\x98\x54\xfa\x4f\xb2\xf7\xff\xe4\x4f\xdf\x07\xc0\x78\xcc\
-\xc2\x71\x74\x60\xf2\x53\xd1\x75\xe1\xbc\x7e\xb2\xa2\xed\x9f\x4a\
-\xdc\x5b\x5d\xff\x2d\x4f\x46\x7c\xea\xfb\xbf\xd7\xfe\xeb\x8f\xfe\
-\xec\x9b\x9e\x73\xfe\x53\xdf\xe7\x3e\xfb\xe3\x3f\xff\x16\x7c\xea\
-\xfb\x3e\x11\x8f\xf3\x5f\x73\x80\xf1\x4f\xfe\xfc\xfd\x51\x0b\x6d\
-\xaa\x5d\x7f\xfc\x67\xef\x7b\x17\xf9\xe3\x1a\xdf\x33\xf7\x39\x7f\
-\x3f\x37\x86\xa9\xf5\x9b\x7b\xaf\xf4\x4a\xcf\xdd\x0f\x66\xef\x71\
-\x74\x7c\x9c\x7f\x4e\xb0\x17\x43\x63\x4a\x72\x6c\x0b\x61\x85\xfc\
-\xfb\x7f\xfa\xcd\xff\xc7\x02\x9b\xef\x7f\xea\x49\xfb\xfe\x07\x1f\
-\xde\x05\x81\x08\xdf\xf3\xd8\x99\x67\x50\x43\x44\x38\x5b\xfb\x6a\
-\xcf\x83\x1d\x79\x67\x0e\x0f\xcb\x36\xa0\xe4\xb8\xe5\x7c\xa5\x38\
-\xbc\x3b\x65\xf4\x3a\x4e\x9c\xe3\xd1\xbd\x29\x73\xc6\xcb\xf6\xb2\
-\x88\x47\x41\x98\x15\x80\x1f\x7a\xc5\x9f\x9d\x7b\x56\x2e\x2c\xaa\
-\x64\xf0\x33\x9f\x99\xf7\xce\x25\x25\x3f\x37\x6d\x49\xb5\x8d\xbf\
-\x36\x8d\x21\xe2\x63\xed\xcf\x3d\x67\x9b\x18\xe3\x15\xbb\x76\x2b\
-\xc7\x0b\x1b\xd4\x8c\x57\xea\x1a\x3e\x56\x8b\x80\x9e\x06\xbb\x34\
-\xb1\xff\xd9\x52\x2b\xc0\x4a\xaa\x80\xf4\x4a\xaf\xd8\xda\x33\x83\
-\x26\xf9\xb2\x2c\xc5\xae\xa0\xa6\x6f\x73\x29\x24\xb6\xa2\xef\x6d\
-\xe6\x74\xfe\x35\xaf\xbe\x46\x2d\xcb\x45\x1e\x5b\x78\x31\xc6\x37\
-\x8e\xe8\xd3\x37\x03\x2b\x64\xc7\x42\xce\xd4\xc0\x0c\x5e\xa4\x3f\
-\x48\x96\x00\x00\x20\x00\x49\x44\x41\x54\xa1\x4d\xf3\xb9\x75\x77\
-\x49\x01\x84\x0c\xcc\x68\x80\x43\x29\xf4\x41\x29\x8b\x15\xcf\xa3\
-\xa9\xc4\xb6\xd4\x58\x34\x7c\x04\xcc\xf0\x7f\x1f\x22\x14\x8a\x02\
-\xe1\xed\x29\xce\x5b\x9a\x54\x06\x61\xd2\x45\x95\x6e\x75\x33\x97\
-\x2d\x61\x14\x0f\xb6\x32\x9a\x52\x7a\xc4\x46\xaf\x0c\x8e\x59\xf4\
-\x65\x40\x4d\x28\xb0\x9c\x07\x13\xe0\xee\xf9\x00\x97\x8e\x5c\x1e\
-\xd2\x93\x4f\xb8\x43\xfe\x83\xef\xdc\xb3\xde\x55\x67\x8d\x89\x07\
-\xed\xfd\x0f\x3e\x84\xa7\x9e\x7c\xdc\x2a\x2d\xdf\xfa\x8b\x0f\xfd\
-\x43\xe1\xc8\xe5\xeb\xac\xd7\x47\xf1\xa1\xc1\xdf\x0b\x26\x80\x7f\
-\x37\xf7\xfd\xd2\xf5\xee\xfd\x75\x7e\xff\x65\xee\x69\xde\xcf\xcd\
-\x51\xd8\x16\xf7\xef\xf2\xac\x7e\xea\x07\x3e\x01\xdf\xfc\xe0\x3b\
-\x09\x40\x33\xd2\xb7\x75\xbe\x0f\xdf\xfc\xe0\x3b\xf0\xbd\x4f\x3e\
-\x91\x54\x9e\xbf\xf9\xc1\x87\x85\x7b\x1e\x35\xed\xd5\xd4\x38\xb6\
-\x8c\xf9\xd8\xfc\x65\xc7\xf6\xe8\x08\x3e\xf1\xf1\xc7\x23\xe0\x12\
-\x8e\x23\x1f\x83\x18\xe8\x7c\x02\xbe\xf9\xc1\xb7\xd3\x73\x5d\x18\
-\xfb\xd2\xb8\xe7\xae\x21\xbe\x98\x09\xe0\x7b\x9f\x7c\xbc\x08\xbe\
-\x4c\x3f\xf8\x3c\x7e\xea\x07\xfc\xfe\xf1\xbe\xe5\xde\x4f\x01\x8f\
-\xf7\x3f\xf8\x30\x29\xd8\x8e\x8e\x8e\xe0\xa9\x60\x4c\x3f\xf9\xfd\
-\x4f\xc1\xfb\x7c\xff\x4e\xf0\xd8\x1d\x05\x63\x71\xb4\x3e\xb2\xf2\
-\x21\xfb\x1c\x80\xa8\x2d\x21\xc8\x09\xe5\xca\x98\xa1\x6b\xb5\x5e\
-\xbb\x02\xc2\x5c\xb1\x11\x1d\x3c\x71\xc9\x37\x0e\x5c\x3a\x5a\xe5\
-\x65\xe8\x40\x59\x3b\xda\x71\xc3\xd9\x5d\xeb\xf8\x3a\xce\xe4\x64\
-\xe6\xee\x1d\xe9\x0f\x02\x0f\x17\x46\x5d\x71\x70\x8e\x29\xe0\x63\
-\xf9\x21\xeb\x86\xfc\x91\xf5\x88\xee\x94\x1c\xab\x4a\x60\xb0\x91\
-\x64\xdb\xb2\x12\xe8\x81\x9a\x55\x00\x08\xc7\x48\x00\x4a\x7d\x6e\
-\x69\xd3\x64\x05\xa6\x31\x1c\x2e\xae\xf9\x45\x2e\x87\xc6\x84\xa2\
-\xdb\x1c\x19\x09\x72\xf0\xcb\xad\x70\x87\x84\x25\x06\x20\x67\x61\
-\x35\x25\x57\x12\x05\x5e\x3c\x8d\xc9\xec\x67\xcb\x46\xe8\x8a\x50\
-\xcc\x05\x34\x86\xa2\x1d\xed\x8f\x40\x54\xb4\xb0\x02\x2c\x30\xc8\
-\x51\xe8\x86\x94\x8b\xb6\x0b\x9a\x9f\x5a\x0a\xe5\xa6\x1a\xa4\x84\
-\x8e\x81\x18\xcb\x72\x26\x7d\x6f\x8d\x90\x1d\x90\xd0\xc8\x0f\x3b\
-\x00\xed\x99\x51\x60\x83\x15\x82\x33\xe8\x43\x7b\x8f\x08\xf1\x91\
-\x46\x8d\x85\xe1\x4e\xad\x09\xe6\x39\x2b\x4e\x8d\x57\x66\xac\x7c\
-\xc7\x6c\xe6\xa0\xc9\x57\xe7\x37\x28\x57\xbe\x5b\x6f\xa8\x6a\x15\
-\xa5\x57\xff\x71\x87\xf0\x70\xa0\xe5\xc9\x87\x6b\xcb\xf5\x64\xd0\
-\x8d\xf1\xb2\xb4\x78\x69\xf8\xb5\x76\x9f\xa6\x04\x83\x0e\x07\x0d\
-\x41\x8d\x15\x00\x7d\xcf\xf2\x65\xfc\x6a\x89\x25\x3d\x67\xb5\xf2\
-\x45\x47\xcf\xfe\x1d\x7e\x16\xbd\xc7\xda\xfa\x17\xdf\xbd\x6f\x7f\
-\x7f\xfc\x31\x15\x72\xf4\x89\x27\x1f\x87\xbf\xfc\xf0\x7e\xb6\xef\
-\xab\xd5\xaa\xe9\xfd\xb0\x7d\x35\xef\x03\x00\xfc\x85\x6e\xc3\x5f\
-\x7c\x78\x1f\x3e\xfe\xf8\xa9\x56\x2c\x1f\xb7\xef\xa7\x5e\x1f\x7c\
-\x78\x1f\x9e\xd4\xd7\xf6\x89\xf6\xf4\x85\x36\xd6\x7c\xce\xdb\x52\
-\x9a\x8f\x9a\xcf\xa8\xa1\x0d\xdf\xfb\xe4\x13\x51\xbf\x73\x73\x64\
-\x9e\x67\x3e\xff\x1e\xd6\xde\xd2\xbc\x7e\xe2\xe3\x6e\x6c\x79\x1f\
-\xbf\xf7\xc9\x27\xe0\x03\xfd\xfe\x93\xec\xfd\x0f\xd8\xbd\x9e\xf4\
-\xae\xff\x18\x7c\xf0\xe1\xbd\xe4\x5a\xcf\x6c\x16\x58\xad\x56\xf0\
-\x17\xdf\x55\xdf\xf9\x38\xb3\xea\x9b\xf5\x39\xf6\x32\x6b\xd7\xcc\
-\x11\x25\xda\x95\x9b\xdb\xb1\xf7\xf9\x3d\xf8\x1c\x7c\xdc\xbb\x77\
-\x9f\xd4\x75\x9e\xfa\xf8\xe3\xf0\x6d\xdd\x87\x8f\xb1\x36\x3e\xf5\
-\xf1\xf2\x1e\x6b\x9d\xbb\xa7\x9e\x7c\x1c\xbe\xad\x3f\xff\xd8\xe3\
-\xa7\xa3\xcf\xff\x36\x1b\x57\xfe\x7e\xb4\x56\x47\xe4\xea\xaa\xef\
-\x93\x96\xaf\x27\x2e\x9d\xc0\xdd\x87\x5b\x00\x8c\x81\x8c\x22\xb5\
-\x41\x2f\xf2\x20\x47\xe8\x68\xce\x8c\x14\x10\x99\x7a\x8e\xe4\x3c\
-\x37\xb9\x7b\xe7\xbc\x43\x91\x1e\xd1\x1a\x37\x45\x65\x3d\x25\xd2\
-\x2b\x28\x0d\x58\xc6\xc0\xca\x98\xf2\x9e\xfb\x7c\x23\xe3\xe4\xc6\
-\xf5\x88\xee\xc4\xfb\xc0\xc7\xc7\x3c\x23\xf4\x16\x01\xd4\x11\x2a\
-\xb5\x0e\x67\x0d\xf3\x5d\xa9\x4d\xf6\x3b\x34\x11\xd8\x50\xe1\xab\
-\x34\x96\x6f\xcd\xc3\xcd\x5d\xb8\x99\x2d\xad\x22\x1d\xbb\x99\xab\
-\x39\xe3\xa2\xac\x48\x4a\x90\x3c\x0b\x07\x51\x95\x6e\x11\x42\xeb\
-\xec\x50\x4c\x8e\x46\x30\x05\x6f\x7d\xec\x91\xca\x7d\xc7\x6a\x96\
-\x33\xe4\x9c\x00\xea\x6b\x0a\xcc\x08\x10\x48\x0a\xd4\x8c\x18\xdb\
-\x29\xac\x56\x8c\x7e\xa9\x69\x4b\xdf\xac\x41\xcb\x20\x25\xf4\xb6\
-\xc8\xa6\x0f\x6c\x6c\xd8\x99\xd4\xf7\x60\x75\x32\x42\x3f\x12\xa1\
-\x9b\x35\xd4\x5a\xe4\x22\xa0\x26\xae\x07\x39\x3a\x06\x73\x37\xc6\
-\x3e\x0c\x2d\xe1\xcb\x84\x98\xa5\x98\xcd\xee\x6f\x65\xe3\x0d\xa9\
-\xbd\x1f\x93\x90\x10\x96\x41\xcd\x81\x41\x6b\xb5\x27\x46\x5f\x78\
-\xb2\x60\x28\x5c\x19\xfc\x98\x98\xf1\xf8\xf3\xbb\x0f\x77\x5e\x55\
-\x74\x6a\xb0\xd4\x76\x5d\x6f\x09\x07\x3e\xbc\xbf\xf1\x95\xbb\xc7\
-\x4f\xa3\xf7\xac\x32\x09\xe0\x13\x15\x74\x69\x11\xd4\xf5\x79\xd1\
-\xf4\x3d\x09\x85\xfe\xc3\xfb\xe7\xc5\xf6\xd6\x7e\xe7\xf1\xd3\xa3\
-\x64\x9b\xfd\xb6\xe5\x01\x77\xdf\x75\x9e\x92\xfd\xed\x7b\xe7\xc1\
-\xb8\x95\xc1\x7a\xdf\x75\xcd\x82\xe4\x3b\x89\x7e\x7c\x67\x64\x3c\
-\xc2\xbd\xf7\x9d\x7b\xe7\xf0\xc4\xd9\x51\xd4\x87\xb0\x6d\x8f\x9f\
-\x1d\x8d\xf6\xa5\x34\x3e\xa5\x79\x75\x63\x4e\xf0\xe1\xfd\xf3\x60\
-\x2e\x52\x60\xbc\xf3\xfa\xfb\xc4\xc8\xdc\x99\x67\xa7\xa4\x43\x97\
-\x59\x87\x7d\xd7\x6e\x5c\x49\x01\x4e\xb3\x1e\xbe\xa3\xd7\x03\x1f\
-\x6f\xfe\xbe\xed\xcf\xbd\xf3\xa6\x7b\x7f\x4f\x62\xcf\x99\x97\xd0\
-\x7d\x0b\x49\x42\xdc\x5c\x54\xee\xf9\xbe\x3c\x16\xa2\x4f\x3f\x47\
-\x24\xc6\x96\x83\x18\xaf\x1f\x8f\x85\xfd\x28\xb7\x4d\x74\x5d\x36\
-\x8e\x04\xb3\x2e\x7e\x6c\x3b\x51\x26\xe4\x63\x24\xef\x31\x02\x6e\
-\x4a\x40\x2a\xa5\xcb\x26\xc3\xcf\xa9\x6c\x08\xb5\xd7\x53\x19\x14\
-\x94\xc0\xc7\xa1\x5e\x6b\x31\xdf\xf0\x3b\xc5\x78\x5c\xf2\xd2\x44\
-\x40\xab\xb5\x4d\x41\xb8\xdd\x5e\x14\xc1\x04\x60\x71\xd4\xc9\xa5\
-\xe4\x7c\xf4\x20\x0d\x71\x86\x33\x69\xf2\xd7\x39\x70\x19\x22\x27\
-\x84\x24\x5e\x33\x92\xd5\xad\x15\x42\xbb\x1e\x30\x4e\x0f\x09\xda\
-\x69\x60\x02\x0a\x01\x02\x11\x04\x70\xc2\x00\x2c\x12\x45\xf5\x63\
-\x8a\xb9\x49\xa0\x43\x81\xea\x87\x10\x3a\xec\xfc\x9a\x21\x18\xd7\
-\xd8\x75\x0c\x07\xee\xef\x54\xeb\x4d\x22\x32\x59\xe4\xe7\xc0\x4d\
-\x08\x6c\x84\x26\x13\x40\x1d\xef\x2f\x40\x58\x1c\x88\xbc\x41\xa6\
-\x24\x87\x0e\x49\x03\x52\x7e\x1c\x07\x6a\x58\xd8\x59\x4a\x94\xd5\
-\x54\xdb\xc4\xb6\x8d\xf5\x28\x08\xc3\x68\xee\xc6\x80\x20\x7f\x66\
-\x33\x14\x85\x73\x04\x66\x26\x3e\xf7\xee\xf9\xce\xc3\xdf\x67\xa1\
-\x67\x21\xe4\x6c\x4e\x81\x9a\x44\x31\x9a\x87\xbb\xfd\x4e\x42\xae\
-\x20\xf8\x58\xe9\x9a\xa9\xe0\x26\xf4\xd2\xc4\x87\x39\x9f\x2b\x8c\
-\xf2\xa3\xcc\x7e\xf6\x8c\x0c\x95\x0b\x5b\x74\x22\xf9\x77\x0a\xb4\
-\xb8\xf9\x84\xe2\x75\xb9\xfb\xd7\xac\x23\x21\x44\xf3\xf8\xf9\xdf\
-\xc1\xfa\xb6\x89\x2e\xdb\x28\xd1\x09\xf8\xee\xc3\x2d\x3c\x76\xbc\
-\x4a\xb6\x6b\xac\x9d\xa9\xb1\x0c\x5f\xfc\xfe\x00\x00\x9d\x10\x8b\
-\x92\x50\x3c\xc1\x40\xcb\x77\x1f\x6c\xe1\xb1\x93\xb6\xbe\x94\xfa\
-\x28\x44\x3e\x78\xe0\xee\xc3\x5d\x76\xc2\x53\xf7\x2c\x3f\x27\x7f\
-\x7d\xca\x42\x98\x1b\x77\xfe\xfe\x84\x72\x31\xd5\x6d\x16\x42\xd8\
-\x71\x5e\x66\x3d\x87\x63\x5a\xba\x9e\x66\xb5\x5d\x3d\x67\xbb\xd8\
-\xde\x14\x9d\xc8\x9f\xcd\xa9\x7b\x27\xf4\xa3\xfb\xe7\xbb\xa4\x15\
-\x98\x97\x1c\x48\x2a\x81\x18\xcb\xd8\xdc\x10\x2d\x51\x77\x64\xce\
-\x96\x9d\xa3\xee\xaf\x2b\xf2\x72\x5b\x80\xce\x98\x12\xdf\xf2\x39\
-\xcd\x00\x4e\xfb\x08\xc3\xa3\x0a\x70\xb5\x97\x79\x6f\x88\x57\xe7\
-\x35\xe6\x53\x60\x26\xac\x2b\x17\x81\x1a\x64\x0f\x23\x56\x7b\xc6\
-\xd6\xa4\x93\x96\x92\x99\xac\x77\x86\x3c\x3d\xdd\xea\xf1\x8c\x20\
-\x4c\x00\x2a\xcf\x0c\x5b\xaf\x3c\x94\xcc\xc2\xa7\xa0\x56\x8d\x4a\
-\x01\x16\x80\x02\x01\x44\x82\xc4\x03\x6b\x01\x0d\x9a\x03\x87\xc5\
-\xaf\x21\x82\x40\xa1\x0f\x72\x97\x84\x8f\xac\x1a\x39\xa6\x10\x9e\
-\x71\x51\xe9\xce\x43\x2a\xee\x50\x0f\xb6\x4b\x30\x92\x36\x8f\xc6\
-\xfd\xdd\x59\x06\x05\x21\x55\xc8\x1b\x81\xf2\xd8\x20\xa1\x06\x2e\
-\xc1\x02\x60\xa0\xc6\x10\x18\x34\x15\x0c\x5f\xf0\x75\xd4\x21\x9c\
-\xef\xf2\x31\x5f\x34\xc1\xfa\x83\x95\xd7\xa5\xfe\xcd\x15\xe1\xd3\
-\x55\x4a\xe8\x4b\xdf\x1d\x9f\x05\x29\x85\x30\x37\xaa\x69\xd5\x78\
-\x2f\x68\xb4\x1c\xaf\x06\x05\xda\x9b\x84\x53\x07\xf6\x00\xc2\xc7\
-\x5c\x52\x0b\x60\x6a\xc9\x01\x4a\xa0\x88\xd7\xa1\x8d\x46\xdf\x98\
-\x42\x98\xf2\x50\x6a\x19\xaf\x33\x74\x89\xb1\xd7\x99\x7c\x9d\x7b\
-\x9b\x01\xce\x12\x75\x88\x38\x61\xc8\x59\x65\x9d\xa2\x4b\x47\xbd\
-\x05\xd0\x51\x3b\xce\xd5\xfb\xa7\x0c\xe8\x5e\x3a\x5e\xd9\xf7\x5b\
-\xbe\x73\x8f\x7d\xe7\xac\x32\xd4\xf1\xb1\xe3\x1e\xee\x66\x9e\x85\
-\xe8\xef\x9b\xc7\x4f\x56\x09\x85\xbe\xb0\x46\x50\x4c\x58\x7b\x62\
-\x66\x51\x4e\x2a\xdc\x1a\xe1\xee\xf9\x0e\x2e\x1d\xf5\xea\x70\x09\
-\x3e\x4b\xf7\x01\xb3\x7b\xbc\xd4\x3f\x97\xf7\x85\x55\xe3\x82\xa5\
-\xb0\x85\xc4\x47\x62\x24\xcc\x21\xf9\x25\xf6\x1e\x12\x56\x89\x2e\
-\x7f\x6d\x54\x16\xca\x0c\x94\x7e\xcc\x80\x80\xd0\xd8\x33\x7a\xdf\
-\xe2\x18\x61\xa5\x1c\xf6\xe7\x20\x75\xb5\x18\x99\x57\xcc\xec\x47\
-\x2a\x4f\xc8\xa8\xda\x68\xfa\x80\xb9\x79\x1b\x2d\xa1\x1e\xa8\x84\
-\x09\xe2\x96\xfb\x5b\x2a\x53\xa1\x26\xde\xa3\xca\x33\xf1\xfe\x8e\
-\x26\x7b\x86\x96\x54\xa2\x5b\xbd\x19\x4b\x86\xd0\x8f\xbd\x78\x48\
-\xd8\xba\x3b\x0c\x37\x38\xf7\xd2\x2c\x70\xbb\xf6\x2f\x37\xd6\x2d\
-\x4a\x82\x19\x02\x2f\xa9\x1f\x2c\x38\xc9\x2d\x36\x5f\x87\x97\xb6\
-\xfe\x8c\x04\x29\x21\x28\xa7\x12\x46\x51\x71\x30\x43\xd6\xc3\xa2\
-\x40\x0d\xd8\xba\x4f\x0a\x33\x88\x20\xef\x4d\xb5\xc9\xd5\xac\xd1\
-\xa7\x80\x29\x31\x81\xea\x07\x99\xb7\x26\xb7\xb5\xfb\xdc\x61\x60\
-\x53\x67\x84\xae\x36\x2e\x04\xf4\x44\x20\x8d\x00\x31\x55\xc8\xf5\
-\x43\x31\x30\x0b\x2b\xfc\xe2\x28\x98\x1d\x9d\x9b\xf4\x2c\xfc\xae\
-\xc2\xa8\xfa\x1d\x86\x9d\x91\x2d\xd2\x33\x80\x94\x02\x48\x08\xdb\
-\x71\x5d\x67\x33\xa8\x68\x8e\x2e\xef\xc7\xba\xbd\xb4\x87\xc6\x3b\
-\x08\x28\x00\x60\xd8\x56\x4c\x2b\x21\x6c\x6a\xd8\xd2\x6a\x94\x7f\
-\xee\x6e\xce\xb9\xa4\x69\x5f\x1b\xac\xa5\xb6\x43\x13\x98\x49\x7c\
-\x8e\x39\x78\x46\x55\x28\xe1\xfe\x76\xf0\x8a\x6e\x9e\xae\x04\x3c\
-\x60\x21\x72\x21\xa5\x73\x8d\x55\x6b\x29\xe1\x8c\x95\x10\xee\xc1\
-\x10\xc7\x09\xb7\x78\x6c\x4a\x5e\x9a\xf0\xc1\xd9\x4a\x22\x33\xb9\
-\xc9\x11\x71\xd2\xe7\xa9\x70\x46\x0f\x48\xe7\x94\x12\x8c\x01\xd6\
-\xa8\x5e\x96\xf9\x4e\xae\xe9\xa1\x25\x97\x00\xe0\x8c\xad\x35\x14\
-\xe5\x09\xbe\xbb\x19\xe0\x52\x12\xbc\x8d\x78\x83\xb1\x7d\x26\x52\
-\x7d\xe0\xc0\xf1\xde\x66\x18\xd9\x90\x25\x45\x9f\x81\x51\x06\x62\
-\x4b\xe0\xb1\xa4\x6a\x97\x96\x0a\x9f\x6e\xaa\xfa\x1e\x32\x00\xdc\
-\x8d\x1a\x4b\x2e\x1d\xad\xe0\xee\x46\x01\x82\x4b\x01\xd3\x15\xb0\
-\x73\xad\x65\x6d\xa7\xc1\x78\xc7\x80\x32\x5a\xb0\x1c\x82\x60\x9e\
-\xd7\xc6\xdb\x7f\xb7\x30\xb6\x97\x8e\x7a\x7b\x6f\xd3\xb2\xd3\xa3\
-\x2e\x3b\x1f\xc5\xf1\x9e\x28\xd3\x60\x81\xf5\x79\x7a\xd4\xc1\xfd\
-\xcd\xe0\xdd\xf3\x74\xdd\x65\x8d\x18\xb6\x05\x94\x58\x6b\x8b\xe9\
-\xd3\xd4\xf4\x11\x65\x4c\x70\x2d\xb7\x3e\x35\x80\x89\x0d\xf0\x29\
-\x37\x64\x51\xfe\x64\x0c\x75\x83\x25\xa8\x87\x67\xb1\xa5\xee\x79\
-\x0a\x16\x35\x3e\x26\x44\x60\x6e\xec\xd6\x09\x76\xb8\xa9\x4d\x5d\
-\x2c\x64\x8f\xea\xb0\xb5\x2b\x88\xc9\xd9\x85\x29\xb6\x8c\x1b\x8f\
-\x09\xb2\x75\xa7\x6b\xc9\x38\xa7\x44\x90\xd7\x3e\x48\xa0\xc1\xcf\
-\xa7\x01\x20\xeb\x04\xe9\x84\x50\x5e\x16\x0d\x62\x84\xad\x81\x27\
-\x9c\xb3\xc1\x02\x2f\xb2\xb5\x6b\x6c\x0e\x0e\x29\x23\x54\xd7\x29\
-\x4f\x8d\x08\x73\x69\x12\x82\xa5\x8f\x0e\x53\xeb\x9c\x41\x40\x10\
-\xba\x68\x95\x50\x37\x45\xc5\x6c\x26\x50\x3d\xc0\x14\xab\x32\x0d\
-\xe5\x2f\x1b\x3a\x36\x28\x2f\xcb\x30\x48\xd8\x0d\xae\x9a\x28\x99\
-\x60\x39\x0d\x80\x6c\x3d\x1a\x72\x9e\x99\x41\x4a\x18\xe4\x00\x1d\
-\xcb\xa5\x19\xa4\x54\x1e\x19\x04\x90\xa0\xe3\xf2\x08\xe3\x7c\x21\
-\x22\x6b\xb9\x24\xa9\xad\x89\x86\xcd\x09\xd3\xa0\xa6\x39\xf4\xac\
-\x0e\xe7\xc0\xc3\x1d\x79\x35\x51\x52\xaf\xf0\x1a\x23\xac\x1e\x0e\
-\x94\x05\x35\x29\x41\x14\xc6\xdd\xb6\xb9\xc5\x17\x00\x33\xa5\x6f\
-\x65\x69\xc7\xa6\xd0\x36\xab\xeb\x42\x50\x73\xb2\x12\x59\xc5\x9f\
-\x3f\x92\x8f\x6b\x0e\xc4\x34\xb3\x90\x24\x34\xb1\x26\x96\xb3\x44\
-\x33\x5a\xbc\x34\xd3\xe5\xba\x0f\xbf\x1e\x71\x09\xd2\x2c\x40\x1d\
-\x53\x32\x4f\xd7\x5d\xf2\xfa\xd2\x5e\x3e\x5d\x77\x99\x30\x94\x72\
-\x8e\xe0\xd9\xaa\x83\xfb\x5b\x09\x14\xac\xdd\xb1\x65\x3b\xa6\x1f\
-\xe3\x04\x25\x12\x27\xee\xe2\x70\xea\xef\x9d\x0f\xd5\x5e\xaa\xa9\
-\x9a\xaf\x01\x93\x65\xc5\x35\x7f\x0b\xee\x05\xcc\x91\x87\x18\xd0\
-\x62\xfe\xe6\xe0\xc5\xfc\x1d\xbe\x9f\x03\x62\x06\xc4\xde\xdb\x96\
-\xdb\x1b\x7a\x27\x53\xe3\x38\x55\x95\x09\x09\x3d\xb2\x73\x84\xfb\
-\x80\x23\x3e\x08\xc9\xce\x5d\xc5\xed\x43\x63\xc2\xe9\xba\x9b\xbf\
-\xb6\x1a\x43\x15\xf2\x86\xc5\x74\xe6\x65\xaa\x8c\x41\xfe\x40\x83\
-\x91\x22\xb0\x98\xbc\x67\xea\xfe\xdc\x3b\x73\x7f\x47\x70\x6a\xc8\
-\x62\xd8\x59\xf5\x60\x20\xef\xdf\x21\xe0\x49\x9e\x69\x13\xf3\x4a\
-\xf6\x65\xf8\xab\x79\xad\xbb\xfd\x80\x80\xb0\x2f\xe6\xbc\xc7\x69\
-\xb7\x89\x74\x07\x03\x5e\xb2\xd4\xcd\xfb\x04\x8c\x2c\xcc\xcc\x03\
-\x35\xec\x3d\x73\x1d\x22\xc6\xd4\xb2\x36\x5d\x44\x3a\x87\x83\x0d\
-\x39\x63\x29\x21\x26\x9f\xc6\xa4\x95\xe8\xc4\x19\x13\x5a\x8c\xa0\
-\x41\x4c\x27\xa0\xb3\x05\x6e\x85\xf2\xde\x18\x8f\x3c\xb9\x94\x13\
-\x2f\x84\x8d\xa4\xfb\xbe\xbe\xde\x7a\x79\x32\x94\xc3\x7d\x4e\x36\
-\xa0\x6e\x94\xd0\xc0\x05\xba\x5e\x85\x78\x69\xf0\xa2\x1a\xd7\x43\
-\xd7\x19\xb0\x23\x6c\x08\x82\xe1\xa1\x1e\x06\x09\xc3\x30\xc0\x76\
-\xb7\x83\x61\xb7\x03\xb1\x13\xb0\xdb\x21\x48\xd4\xa0\xc6\x2a\x50\
-\xae\x2e\x8d\x1c\x24\xc8\x8e\xb9\xb3\x06\x69\xbd\x33\x52\x4a\x10\
-\x24\x41\x4a\xed\x85\x11\xa0\xa9\x99\x79\x68\x12\xd9\x30\x34\x00\
-\xa9\x40\x0d\x99\x64\x23\x1c\x2b\xe3\x08\xd0\x52\xa4\x73\xac\x2a\
-\x67\x01\xb0\xa4\xf2\x39\xa2\x6b\x46\x16\xfc\x18\xd8\x69\x01\x33\
-\xbe\xb5\x9c\x92\x87\x51\x55\xd2\xf8\x94\x40\xf3\x6c\x04\x40\x7a\
-\x80\xc3\x77\x43\x50\xe3\xb5\x7b\x27\xe3\xc2\xab\x7a\xff\x96\xc6\
-\x6f\x12\xff\x3b\x8d\xea\x8c\x11\xc3\x0d\x65\xc0\xd7\x5c\x2f\x0d\
-\xb6\xcd\xc0\x64\x10\x56\x24\x8d\x08\x3e\xf7\xeb\x19\xc9\xec\xf5\
-\xa7\xab\xfa\xb0\xab\x07\x5b\x99\x05\xb1\xf9\x36\xc5\xeb\x85\xff\
-\xbb\xa5\x6d\x58\x30\x82\xdc\xdb\x0e\x9e\x57\x67\x41\x5c\xb0\xe8\
-\xf7\x72\xa1\xb8\x25\x2f\x4c\xcb\x56\xc8\x85\x22\x4e\x7d\x95\xee\
-\xc7\xc1\x4c\x0e\xd4\xa4\xae\xb1\x4a\x2d\x01\xdc\xdb\xec\xa2\x5a\
-\x25\x35\x1b\xa2\xd4\xae\x7b\xe7\x43\xf2\x76\x21\x58\xc9\x79\x67\
-\x72\x2c\x85\xde\x3c\x51\x8b\x35\xa9\x72\xaf\x9c\x0f\x5e\x98\xe6\
-\x04\x2b\x59\x11\xd4\x84\x9f\xb5\x9f\x13\xe5\x98\x1d\xaa\x6d\x67\
-\x26\x59\x9a\x88\xe0\xde\x56\xc2\x59\x56\x76\x51\xc3\x40\x50\x95\
-\x9c\xb3\x05\xad\x0b\xf5\xe1\x6c\xed\x9c\x91\x27\x8d\xc9\x82\x16\
-\xa5\x3a\x05\x86\xa2\xf7\x16\xd2\xd1\x53\xcf\xda\x0c\xb4\x18\xb8\
-\xc9\x12\x2a\x30\x27\x60\xaa\x5e\x4e\x4b\xf7\x4a\x04\x00\xfb\xf6\
-\x7e\x91\x5b\xd4\x1e\xa8\x91\x52\x79\x51\xbc\x08\x33\xed\x5c\x20\
-\x43\xad\x0c\x3e\x45\x33\x51\x58\x77\x86\xb1\x99\x49\x47\xd3\x6c\
-\xee\xa7\xb0\x4c\x07\xa0\xbd\x2b\x7d\xd7\x41\xd7\x75\xd0\xf7\xbd\
-\xc2\x0d\x5d\x67\x01\x0a\x07\x34\xc3\x30\xc0\x30\x0c\xca\xf1\x31\
-\x0c\xd6\x63\x63\xbc\x3d\x42\x74\xcc\xd1\x92\x0e\x97\x45\x72\x9c\
-\xad\xb0\xdd\xed\xe0\xde\xbd\x7b\x70\xf7\xee\x3d\xb8\x77\xff\x3e\
-\xdc\xbf\x7f\x1f\xce\xcf\xcf\x61\xb3\xdd\xc2\x30\x28\x61\x23\x50\
-\x40\xd7\x77\xd0\x77\x3d\xf4\x7d\x0f\x7d\xdf\x41\xd7\xf5\x20\x3a\
-\x61\xd9\xd0\x24\xa8\xea\xa1\xc3\xb0\x83\xdd\x6e\x80\xed\x76\xeb\
-\xfd\xec\x76\xaa\xe1\x26\x74\x0c\x04\x42\x27\x54\x47\x57\x7d\x0f\
-\xfd\x7a\x0d\xeb\xf5\x0a\xd6\xab\x35\xac\xd7\x6b\x58\xad\xd7\xb0\
-\x5e\xad\x60\xb5\x5a\xa9\x41\xe9\x3b\xe8\x4c\xe7\x4c\x92\x29\x3a\
-\xb6\x33\x93\x1b\xa0\x42\xe1\xd0\xa2\x41\x8b\x1a\x31\x64\x4a\xc0\
-\x8c\xc5\x7a\xba\xa6\x30\x7b\xdb\xe1\x12\x0b\xda\xff\x07\x35\x1e\
-\x06\xb9\x40\xe0\x9c\x0f\x88\x12\xa7\x07\x51\xac\x34\xa4\x3a\x8b\
-\xcc\x84\x9d\x98\x9a\x48\x71\xf4\xac\xf4\xa5\x70\x94\xd4\xf7\x33\
-\x5f\xc5\xb9\x63\x4f\xf3\x2f\xa1\x09\xf7\xd4\xc3\xd6\xfc\x30\x2a\
-\x80\xcf\x47\xe9\xa5\xc1\x05\x45\xfa\xbc\xfe\x54\xd5\x5c\x5f\x76\
-\xac\x68\x99\xb1\x30\x4a\xe3\xbd\x4d\x1d\x28\x41\x5a\xb4\xd9\x55\
-\x1d\xc0\x09\xf7\x23\xda\xc3\xa8\xe3\xc2\xab\xb2\xb9\x8d\x6d\x75\
-\xbe\xd3\x4e\x0a\x9c\x8a\x31\x16\xde\x7b\x25\xa5\x0f\xc7\x0d\x84\
-\x55\xed\x69\x8f\x31\xa0\xb1\x73\x82\xbd\x2e\x45\xe1\x9a\x01\xdd\
-\x0b\x2e\xb7\xd0\xe6\xdd\x2a\x31\xf3\x58\xcb\xeb\x76\x81\x04\x3a\
-\x2d\x27\x1f\x96\x6e\x6f\x8e\x7e\x79\x1f\xba\xc1\x92\x67\x08\x11\
-\x81\x64\x84\x5b\x16\x88\x98\xf7\xb8\x3c\xe1\x79\xf0\x2c\x0c\xcc\
-\x50\x34\x2b\x90\xb1\x83\xdd\x76\x07\xdb\xed\x16\x36\x9b\x0d\x6c\
-\xce\x37\xb0\xd9\x6c\xe0\x7c\x73\x0e\xdb\xcd\x06\xb6\xdb\x2d\x0c\
-\xbb\x1d\x0c\x1a\x30\x01\x18\x30\xd3\xc3\x6a\xd5\x43\xbf\x5a\x29\
-\xdd\x7e\xd5\x43\x2f\x3a\xc5\x4e\xa8\xf5\x74\xd2\xf5\x27\x77\x83\
-\x84\x61\xb7\x85\xdd\x6e\x07\xbb\xdd\x4e\x61\x04\xa9\x8c\x07\x5d\
-\xd7\xc1\x6a\xb5\x82\xe3\xe3\x63\x38\x3d\x3d\x81\xb3\xd3\x33\xb8\
-\x74\xe9\x12\x9c\x9d\x9d\xc1\x9a\x51\xbd\xf7\x49\xe5\x52\x2b\xfc\
-\xca\x43\xa3\xbc\x31\xa6\xd3\x06\x69\xad\x34\xc0\x58\xf5\x3d\xf4\
-\x5d\x6f\xbd\x34\xea\xd0\x51\xae\xa3\xdd\x6e\x07\xdb\xed\x4e\xa3\
-\x32\xe1\x29\xa1\x04\x04\x30\x48\x90\xcc\x12\x42\x2c\xf4\x2c\xf2\
-\xd4\xb0\x1f\x94\x02\x10\xa5\x62\x39\x93\x00\xa8\x13\x88\x08\x1d\
-\xe2\x44\x10\x40\x92\x74\xac\xbb\xe3\xd5\xb6\xde\x35\x4f\xc5\x55\
-\x13\xe0\x2c\xff\x85\x38\x58\xac\xb3\x84\xd0\xa8\xb2\xe0\x6b\xd5\
-\xd5\x8a\x2c\x96\xdf\xca\xe9\xa8\x34\xea\x7b\xaf\xf1\xbc\x50\x83\
-\x52\x47\xc1\xf3\xcb\xc7\x8d\x75\xf8\x53\x9a\x62\x3b\x0c\x09\x18\
-\x27\x67\xf6\x27\xab\x86\xcc\x99\x0e\x20\xf8\xf7\x55\x68\x93\xc2\
-\x7a\x50\x4d\xc8\xe9\xa2\x04\x99\xed\xe7\xb4\xa0\x3d\xdd\xf7\x10\
-\xdd\x98\xb2\x26\xa7\x84\xf2\xd0\x44\x95\x98\xaa\x2f\x88\x95\xd9\
-\x1a\xb6\xc4\x69\x33\x41\xf3\xc6\x3d\x65\x1d\x20\xda\xc3\xfa\xc4\
-\xd9\xbd\xc3\xa2\x6c\x45\xa8\x2d\x8f\x35\x0e\x46\x96\xe8\x31\x35\
-\x83\x76\x9a\x39\xdf\x65\x31\x97\xcc\xd6\x4a\x4c\x3b\x2d\x24\xc0\
-\x69\x3c\x3c\xb4\xd6\x00\x40\x6c\xe6\xb9\x2a\x41\x38\xca\xb0\x59\
-\x2d\x4f\x70\xa1\xb9\xa7\x69\xb7\x3c\xc4\x79\x5c\xec\xc0\x45\xaf\
-\xc3\x51\x78\x9c\xab\x37\xa3\x3c\x2c\x86\x4b\xd9\x80\x19\xf2\x5d\
-\x34\x3a\x43\x03\x1d\x5b\xb0\xd6\xe3\x0d\x9b\x99\xaf\x83\x0f\xfe\
-\x6f\x46\x36\x80\x3a\x67\xc5\x78\x66\x56\xab\x15\xac\xd7\xca\x31\
-\xb1\x5e\xad\x61\xb5\xea\xa1\xd3\x9e\x1a\x43\x90\x23\xa5\xf6\xce\
-\xec\x76\xb0\xdd\xad\x9c\xf3\x63\xb7\x05\x39\x0c\x40\x44\x96\x94\
-\x4c\x30\xa2\xb2\x14\x78\x0f\x42\xce\x90\xe5\xd0\xb0\xfc\x19\x21\
-\x14\xb8\x41\x01\x5d\xdf\xc3\x9a\x35\xd2\x78\x4d\xfa\xae\x63\x21\
-\x67\x00\x83\x1c\x60\xb7\xdd\xc1\xa6\xdf\x40\xd7\xa9\x84\x20\xb2\
-\x8c\x66\xc6\x95\x05\x80\x72\xb0\xdc\xd8\x5e\xc2\x91\xc9\xa1\x19\
-\x06\xe8\xe4\x00\x83\x14\xd0\xc9\x4e\x03\x1a\x69\x43\xce\x10\x84\
-\x72\x97\x91\x0a\x17\x40\x04\x20\xc1\xc5\x3c\xba\x02\x9c\x66\x00\
-\xc8\x7d\x86\x18\xab\xdc\x58\x41\x2d\x42\xb8\xe0\xe6\x6b\xf9\x72\
-\x42\xfe\x52\xad\x14\x6f\x50\x20\xe2\x6a\xf1\x94\x85\x30\x94\xa0\
-\xd6\xa0\xd4\x21\x59\xda\xd8\xe8\x83\x1a\xbb\x5a\x89\xf7\x93\x81\
-\x12\x46\x62\x56\x0c\xba\x63\xb4\xc4\xf6\xfb\x63\xe3\x3d\x75\x32\
-\x2b\x0f\x3b\x1c\x51\x71\x68\x8e\xdc\xa4\xf9\x72\xb8\xce\xf7\x80\
-\x8f\xf0\x3c\xa1\x8b\x76\x86\xec\xf5\xb0\x9b\xba\x1c\xc7\xc9\x00\
-\x96\xf7\xca\x8d\xaa\x96\xd4\xb6\x7a\xe8\x51\xcc\x32\xd1\x81\xe6\
-\x99\x2a\x00\x08\xd5\x29\xfc\x38\x1d\x28\x51\xa5\xf2\xbd\xaf\x59\
-\x68\x24\x74\x9a\xfd\xfc\x9c\x7c\xc3\x1a\xe9\x3b\xc9\x85\x5e\x51\
-\x8c\x33\x98\xb2\xa4\xc3\x1d\x33\xf3\xc3\xdc\x4f\xc4\x0e\x00\x84\
-\x52\xf9\x00\x1c\x1f\xdf\x06\xf1\xdf\x92\x7d\x8b\x0b\xae\x8d\x7d\
-\xbd\xa2\xd0\x3a\x49\x17\xab\x81\x25\xd1\xc5\x08\x00\xec\x2f\x72\
-\x35\x68\x38\xb5\xb2\x5d\xf9\xa8\x8a\xdd\x43\x94\xd7\xa2\xbc\x27\
-\x24\xd3\xa0\xc6\x84\x9e\x59\x76\x33\xd4\x51\x5c\xa2\x83\x5e\xe3\
-\x84\xa3\xa3\x23\xf5\xa3\x23\xaf\xfa\x7e\x05\x5d\x2f\x2c\x33\xa2\
-\xc9\xb5\xdf\xed\xb6\xb0\xd9\x6c\x15\x5e\x10\x08\x42\x00\xec\x76\
-\x2a\xd5\x44\x85\x9d\xe9\xd2\x31\xda\xe0\x9d\x0a\x95\xee\xe3\x45\
-\x8a\x1e\x25\xb3\xf1\xd0\x10\x00\x74\xa2\x83\xd5\xaa\xb7\x8d\x5c\
-\xaf\xd7\x70\xa4\x41\x4d\xe7\x01\x1a\x85\xb8\xb6\xfd\xd6\xc6\xca\
-\x11\x11\x0c\x24\x6d\x8c\xdc\xd0\x0d\x80\x72\x00\x16\xb1\x07\x12\
-\x08\x50\x17\xec\x51\x39\x33\x8a\xb2\x79\x18\x24\x74\x1d\xaf\x47\
-\x23\x2d\x75\x33\x08\xa9\x48\x01\x74\x0c\x20\x68\x60\x63\xd0\x22\
-\x71\x30\x43\x64\x41\x8c\xf2\xd6\x30\x3a\x67\x36\x38\xd4\x1c\x3b\
-\x84\x45\x2b\x48\x5a\x41\x4b\xe4\xeb\xe0\x72\xa7\x01\x8d\x82\x19\
-\x6a\x7e\x08\x35\xaa\xbc\x19\xbd\xa9\x78\x21\xe9\x84\x2f\xd2\xb9\
-\x50\xb1\xe0\x24\x8f\xee\x4f\xd1\x88\x43\x81\xa5\x24\x03\x6a\x32\
-\xc3\x3e\x1b\x98\x2e\xfd\x9a\x80\x70\x8a\x80\x80\xca\x33\x58\x4f\
-\x0b\x40\x8d\x9d\x98\x8b\xf3\xa9\x7d\x1a\xf6\x88\xc7\xe8\x60\x6b\
-\x83\xe2\x39\x25\x5f\x5e\x87\xb7\x4f\x03\x19\x5a\x78\x8d\x4e\x01\
-\x43\x58\xb2\xcb\xc0\x5c\x52\x0a\x5a\x70\xcb\x1d\x6a\x71\x50\x05\
-\x90\xca\xfa\x10\x6a\x5c\xf3\xc5\x5e\x1d\x06\x2e\xe6\xbc\x10\xd8\
-\x74\x96\xed\x7f\x3a\x68\x72\x72\xd0\x98\xa0\xa9\x28\x57\x40\x85\
-\x96\xa0\x0f\x5c\x30\x00\x38\x98\x39\xeb\xd3\x9e\x3c\x8c\x00\x11\
-\x4d\xd9\x20\x33\xaa\x8b\x2f\xed\x00\x99\x3b\xef\x55\x79\x46\x54\
-\x77\x16\xd3\x1e\xe4\x49\xf5\x6e\x26\x5f\xe7\xa2\x48\xa6\x52\x41\
-\x56\x38\x4f\x8d\x8b\x68\xe2\xa0\x86\x01\x99\xc1\xaf\x15\x49\x3a\
-\x94\xcd\xa2\x07\x81\xd0\xf5\x2a\x7d\x64\xbd\x5a\xc1\xfa\x68\x0d\
-\xc7\x47\x47\x70\x74\xbc\x86\xf5\xea\x48\xe1\x85\x08\xd0\x0c\xb0\
-\xdd\xea\xdc\x1a\xc1\x35\x34\xe5\xa5\x01\x00\x4b\xe1\xcc\xeb\xd8\
-\x14\x3d\x34\x36\x17\x05\x1d\x3b\x81\xf2\xd2\x28\xd7\x47\xcf\xc2\
-\xcd\xd6\xab\x95\x46\x5c\xc6\x4b\xd3\x59\xde\x69\xe3\x42\x52\xcc\
-\x67\xa8\x09\x02\x06\x15\x1b\xd7\xf7\xd0\xed\xb6\x36\x9c\x4d\x4a\
-\xa9\x5c\x3a\xa4\xc9\x04\x90\x6c\x01\x1f\x2f\xec\x2c\x08\x41\x33\
-\x9d\x12\x12\x34\x39\x80\xd9\x67\xa8\x99\x1b\xd8\x04\x6b\x56\x00\
-\x47\xde\xac\x11\x69\x22\x82\x2a\x5b\x8f\xa0\xd1\x94\x41\xc9\x33\
-\xa7\x18\x98\x36\x2a\xf7\xf2\x0b\x7b\x04\x82\xb5\x56\xb9\xa4\x78\
-\x97\x64\xc1\xcc\x88\x77\xa6\xe6\x90\xc2\xe8\x16\x64\x8b\xa2\x72\
-\x8f\x8c\x0f\x38\x51\x73\x06\x38\x97\x59\xde\x63\x93\x00\x35\xde\
-\xbf\x17\x00\x35\x0b\x87\xf4\xd3\xde\x05\x3a\x55\x1d\xe7\x87\x3d\
-\x5a\x0e\x08\x1c\x08\xd2\x4a\xc3\x1e\xba\x3b\x85\x55\x10\x6b\xee\
-\x95\xda\xd7\xd8\x66\xc3\x98\x9a\x79\x41\x0b\xcf\x26\xcd\xbd\x13\
-\x2d\xd1\x5a\x4c\x7b\xbc\x67\x0c\x06\xb2\x85\x46\x8d\x20\x2f\x77\
-\x25\x2f\x53\x80\x19\x53\xd9\x94\x31\xc0\x99\xf3\x39\x5a\x52\x03\
-\xfd\x73\x36\xc5\x29\x35\xda\x06\x9a\xee\x9d\xcd\x7b\x47\xfc\xa7\
-\x7e\xf8\x70\xcb\xc8\x52\x2b\x5d\xee\xd5\xed\x45\x08\xdd\xe8\x58\
-\x2d\x40\xd0\xcd\x3e\xf2\x71\xc4\x70\x09\x17\xee\x48\xf3\x67\x9f\
-\xf4\xba\xc6\x84\x39\x62\xe4\xf0\xc4\x1a\xa0\x7e\xe0\x93\x86\x72\
-\x20\x66\xec\xcc\x98\x03\x48\x68\x5e\xdb\xf3\xfc\x18\x64\x0b\x55\
-\x92\x07\x50\xc8\x44\x9d\x65\x97\x28\x32\x6b\x99\x2d\x99\xc2\xa9\
-\x94\x33\x05\xef\x4d\x8d\x49\x33\x89\xca\x43\xa3\x73\xed\x57\x3d\
-\xac\xfb\x15\xac\xd6\x2b\x38\x5a\x1f\x69\xbc\xb0\xf6\x01\x0d\x49\
-\x18\xb6\x3b\xe7\x10\xd1\x65\x5a\x06\xdd\x86\x9d\x6e\x24\x06\x4c\
-\x67\x29\x17\x4d\x4c\xdb\x6c\x0a\x6a\xea\x1f\x21\x0c\xb3\xb4\x70\
-\xec\x66\x5d\xa7\x12\xf3\x7b\x45\x0c\xb0\xd2\x89\xfa\xe6\xd6\x9d\
-\x50\xf1\x78\xa4\x07\x66\xd7\xf7\x9a\x38\xa0\xd3\x14\x6c\x5d\x54\
-\x88\x8b\xb4\x72\xca\xe3\xf5\x42\xda\x66\x03\x92\xa4\x94\x0a\xc5\
-\x49\x04\x29\x84\x0f\x6a\x8c\xf7\x85\x1c\xcb\x99\xca\x2f\x90\x40\
-\x20\x9c\x48\x20\x17\x83\x47\xa1\xa3\x84\x28\xaf\x21\xa4\x33\xd6\
-\x2b\xf3\x1c\x29\x9b\x16\x48\x29\x08\x54\x11\x22\x46\x4b\x6e\xed\
-\x31\x70\x52\xc2\x47\x14\x58\x02\xa8\x9e\x0c\x27\x25\x03\x89\x01\
-\x50\xe4\xe1\x67\x18\x28\xe0\xe4\x6a\xa9\xa0\x96\xf4\xe9\xfa\x77\
-\xe4\x11\xce\x9b\x35\x80\x39\x50\x43\x50\x57\x88\xf5\x50\xd1\x29\
-\x7b\xbe\xf1\x47\x2a\x8b\x66\x1f\x09\xec\x53\x82\xcc\x47\xc7\x93\
-\x26\x37\x6a\xb2\x15\x93\xda\x80\xec\x58\xb7\xa9\xa5\xdf\xb8\xff\
-\x79\x2d\x73\x48\x2d\x60\xcb\x9f\x79\x0b\x0c\x1a\x99\x03\x5e\x53\
-\x28\x25\x28\x6b\xf8\x28\xe5\x1c\xed\x23\x70\x6c\x42\x8e\x93\x6d\
-\x2c\x66\xfb\x5f\x65\xc8\xa1\x99\xe1\xa6\x95\x8b\x9c\x60\x66\xb5\
-\x6b\x2a\x00\xdc\x6a\xa0\x55\xf8\x2e\xf1\x76\x52\x61\x00\x71\xbc\
-\xdb\xd8\xbe\x62\xbc\xb3\x37\x9b\x63\x14\x33\x40\x96\xe4\xcd\x1c\
-\xcf\x0d\x4d\xf9\x9c\x20\x0b\x04\x17\x89\x51\x18\xb3\xba\x8c\x1a\
-\xbe\xea\xf7\x2e\xd7\xbb\xd4\x2f\xe9\xa8\x9b\xa9\xf2\x1e\xe4\x00\
-\x05\x90\x5f\x48\x73\x60\xac\xc3\x83\x1c\x6c\xc2\xbe\xad\x31\xa9\
-\x1f\x62\x4b\xc5\x18\x50\xa3\xb1\x42\x6f\xb1\xc2\x4a\xe5\xd1\x74\
-\xae\x18\xb4\xd4\x7a\xb9\x21\x13\xdb\xed\x06\xe8\xbb\x1e\x76\xdd\
-\x0e\xa4\x10\x20\x49\xa8\xba\x93\x88\x3a\x15\xc6\xf8\x66\x46\xea\
-\xd0\x20\x6b\x90\x05\x35\x20\x54\x75\x4e\xe1\xd8\x10\x04\xa2\x4e\
-\xd2\xd1\x0c\x62\x22\xae\x54\x2d\x84\x5f\x48\x47\xe8\xc2\x38\x2a\
-\x06\xce\xdc\x3f\x10\x52\x52\xfd\x4f\x6a\xd0\x42\x86\xc6\x79\x18\
-\x60\xe8\x5c\x0e\x8d\xca\xa3\xd1\x5e\x24\x00\xa0\x4e\x78\x2e\x41\
-\x15\x6a\xa6\xc0\x8c\xb9\xb7\xc2\x3c\x52\xa9\xc7\x64\x42\xd0\x20\
-\x60\x7b\x70\x62\xa3\x8e\xf1\x8a\x82\x73\x30\x2d\x3c\xb0\x68\xfd\
-\x9b\x4a\x6b\xb4\x5c\x9a\xac\x2f\xcf\x28\xed\x79\x81\x42\x28\x0f\
-\xc5\x9f\xd3\x18\x0c\xa3\x44\xf9\xcc\x80\x0c\xc0\x01\x4f\x0a\xf8\
-\xd2\x13\x26\x6c\xeb\xa1\xd1\xd7\x06\xe3\xed\x03\x1b\x9b\x4c\x65\
-\xe9\xbc\x93\xa0\x06\x60\x91\x9c\x94\x59\x16\x44\x5a\x5a\xba\xb7\
-\x7b\x66\xa6\xea\x78\x8b\x87\x14\x34\x9d\x32\x23\x3b\xad\x3d\x31\
-\xa1\xa2\x29\x34\x7f\xd0\x2a\x54\x47\x5c\x68\x7e\xc6\xec\x19\x73\
-\x1b\x3b\xd7\x02\x5b\x0c\x8b\x24\xd8\xd3\xaa\x9d\xb7\x8a\x69\x01\
-\x50\xb4\xec\x09\x50\x5f\xd4\x8b\x0e\xd2\x58\xda\xfb\x8c\x95\x95\
-\xf0\xf1\x27\x63\xd3\xb8\x4d\x04\xe4\x8d\xda\xbb\xe7\x89\xc1\x31\
-\x90\x53\x37\xff\xb9\x2c\x1a\xaa\xde\x16\xad\x6e\x06\x1c\x05\xaf\
-\xb3\x73\x48\xa7\x7e\x81\xf2\x51\x74\xd5\xfb\x64\x2a\xc9\x09\xcd\
-\xef\x11\x51\x0c\x6c\x1c\x45\xb3\xcb\x9f\x61\x94\x01\x09\x30\x43\
-\xde\x77\x15\x88\xd1\x45\xed\x29\x2c\xa5\xa2\xc3\xcf\xb4\xf7\x86\
-\xc8\xd0\x7b\x75\x9e\x2e\xad\x0a\x6a\xea\x50\x31\x21\x00\x3b\x85\
-\x1d\xf8\x50\x0b\x00\xe5\x98\xb0\xc5\x37\x0d\xce\x10\x00\x02\x41\
-\x48\x04\x95\xde\x83\x16\x87\x00\x0a\x8b\x23\x0a\x80\x86\xc5\xa6\
-\x99\x02\x36\x9e\x6b\xc7\x6d\x75\x22\x52\x28\xc1\x26\x18\x05\xab\
-\xc1\x63\x53\x20\x18\x8b\x04\x74\x15\x69\x08\x40\xf3\x5e\xd3\x20\
-\x81\x3a\x72\x15\x4a\xf5\x20\x0b\x29\x41\x48\x01\x84\x2e\xc6\x8f\
-\x04\x80\x20\x50\xbf\x35\x7c\x01\x29\x41\xbb\x98\x00\x04\xc0\xa0\
-\x39\xad\x11\xd1\xe6\xd9\x70\x10\x42\x36\x87\x88\x19\x93\x46\x63\
-\x45\x91\x4d\x60\x42\x4a\xa1\xef\xb5\xc8\x3b\xd8\x5d\x91\xd1\x65\
-\x35\x41\x9a\x20\xe8\x69\xe4\x1c\x4a\x30\x98\x51\xde\x26\x4d\xa9\
-\xb0\x0b\x0a\x9f\x81\x81\x95\xc8\x07\x1d\x11\x43\x00\x84\x1e\x14\
-\xca\xea\x93\x08\x18\xc7\x1b\x13\x3f\x12\x28\x73\x5d\xd2\x90\xb3\
-\xe8\x4c\x54\xe5\x7b\xd0\xec\xd9\x6d\xd3\x3c\x67\xab\x38\xb8\x5f\
-\x20\x44\xd3\x95\x22\x2a\x21\xee\x45\xa1\xc2\x45\x0c\xe0\x9b\x70\
-\x83\x0a\xe0\x40\x95\x93\xf8\xff\xb6\x77\xed\xfd\x51\xdb\x4a\x7b\
-\x64\x6f\x42\xa1\x21\x09\x50\xa0\xa5\x94\xd2\x2b\x05\x02\xa7\xe7\
-\xfb\x7f\x86\xf7\x34\x09\x0b\x94\x52\x38\x21\xa4\xe1\x12\x2e\x21\
-\x50\x38\x64\x6d\xcd\xfb\x87\x2d\x79\x24\x4b\xb2\xec\xf5\x6e\x76\
-\xcb\x3c\xfd\xed\x8f\xd4\x96\x65\x59\x97\xd1\x3c\xd2\x68\xa6\xcb\
-\x31\x3e\x0c\x2c\x22\xcd\x12\x6d\xe8\x9a\xf5\xd8\x63\x44\xc4\x70\
-\x69\x3c\xf2\x3a\xc0\x16\x0a\xb5\x99\xa6\x59\xf8\x79\x67\x1e\x61\
-\xcf\x2f\x71\x35\x6b\x78\x3b\x15\xf1\xdf\x24\xc6\xac\x18\xef\x99\
-\x22\x61\xba\x2c\xaa\x4f\x48\x4d\xee\xa0\xd1\xb9\x71\xa3\xbf\x13\
-\xdb\xb1\x2b\x53\xd5\x09\xb9\x5d\xc5\x88\xf5\x1e\x5f\x60\x50\x9c\
-\xfe\x28\xed\xb8\xa2\x18\x45\x4e\xb0\xdd\x04\x8f\x75\x05\x32\x4a\
-\x19\xa0\x1e\xcc\xec\x80\x9a\xc4\x4f\x80\xa3\x0f\x55\x9e\x80\xd1\
-\x32\x33\xab\x91\x18\x1a\x50\x53\x91\x1a\xbd\xa1\x80\x86\xb6\x8f\
-\x9a\x46\x61\xc9\x15\x00\x24\xc8\x72\x9b\x84\x7c\x91\x24\x41\x3f\
-\x1d\x26\xb5\x82\x1c\x85\xa1\xc1\x35\x45\xd0\x29\x40\x22\x20\x29\
-\x0f\xf5\x24\xe5\xee\x8c\xbd\x93\x62\xda\xd3\xe5\xda\x0c\xac\x20\
-\x4d\xa5\x49\x17\x22\x64\xe5\xbd\x9c\x32\xbd\x92\x7c\x18\x5a\x9c\
-\x62\x59\x44\x21\x56\xe1\x69\x24\x00\x21\x33\x84\xd8\x94\x6c\xb1\
-\xfc\xaa\x22\x1b\x99\x80\x14\x85\x8f\x00\x29\x00\x84\x90\x25\x71\
-\x51\xff\x0a\x6d\x52\xa7\xdd\x47\xd7\x4c\x93\x3c\xf1\x50\x84\x67\
-\xc4\x0a\x97\xc2\x2c\x9c\x53\xbc\x3d\xef\x14\x65\x20\x82\x44\xa0\
-\x63\x51\x45\x4c\x72\xf8\xb6\x1b\xa5\x2e\x53\x09\x6c\x1a\xc3\xe8\
-\x24\x3d\xee\x15\x44\xb7\x99\x5a\x15\x11\x16\xad\x18\x14\xc2\x5d\
-\x57\x82\x08\x44\xeb\x90\x9c\x9d\xce\x24\x37\x94\xd8\xd4\x05\xae\
-\x70\xc9\x96\x88\x69\x00\xa3\x23\x55\x77\x6d\xd6\x56\xc1\x66\xc2\
-\x8a\x29\x7a\x94\xff\xd6\x6a\x16\x4e\x86\x23\x34\x64\x82\x13\xca\
-\xb7\x53\x4e\x3d\x65\xd5\x9b\x47\x20\xec\x23\x50\x2c\xb6\x4b\x3a\
-\xc1\x40\x12\xd3\xf1\x73\x27\xfa\x6d\x70\xf4\x8d\xaa\xf6\xad\x8c\
-\x10\x32\x6f\x13\x33\x31\x06\xe2\xdf\xd4\x65\x81\xa2\x2d\x1b\x8e\
-\x3f\xa1\x64\x90\xa0\x16\xbb\xdd\x8d\xc4\x49\xc4\x17\xb7\xee\x82\
-\x5f\x38\x15\x7d\x5f\xb0\x6b\xac\x4d\x89\x76\x00\x42\x9a\xae\xa5\
-\x57\x3c\xd1\xd0\xef\xd1\x75\xa6\x47\x34\x2e\xae\x89\xae\xbd\x50\
-\xb4\x58\xef\x18\xeb\x7c\x63\xb8\x54\x4b\xc7\x16\xf4\xdf\x6f\xff\
-\x37\x8a\x93\x11\xd8\xdf\x12\x84\xde\xa5\x41\x42\x27\x64\xe1\x6c\
-\x4b\x9b\x90\x91\xbf\x6b\x75\x46\x88\x90\xb6\x90\x2a\x75\x6f\xa4\
-\x0e\x00\xb0\x3a\xe7\x8e\xa8\x88\x8a\xac\x74\x28\x72\x4d\x3b\x14\
-\xc8\x4b\x1e\x90\xe7\x20\x93\x04\x72\x00\x1d\xe6\x45\x4a\x59\xf0\
-\x05\x65\xca\xa6\xc8\x13\x48\x5d\x26\x01\x24\x5e\x8e\xa0\xd6\x5e\
-\x81\x1d\x9a\xc2\xb4\xac\xdc\x12\x12\xa5\xb7\x01\x91\x40\x69\x0b\
-\xa6\x5d\x2b\xe7\xb9\x84\x2c\xcf\x21\xcd\x33\x48\xb2\xd2\xfe\x0d\
-\x11\xd2\x24\xd1\x15\x92\x29\x27\x00\x59\x06\x79\x56\xd9\xdc\x21\
-\x29\xa4\xf2\xa8\x06\xa2\xf0\x7f\x5d\xb3\x8c\x53\x8c\x0e\xc1\xdc\
-\xf2\x92\x12\xa4\x28\xce\xd1\x94\x71\x77\xca\xe8\xa4\x02\x64\xe1\
-\x37\x0e\x04\xd2\x5d\x26\xa1\xfd\x63\x57\xe3\x57\xe8\x7f\x3d\x3c\
-\xc5\x22\x38\xc6\xe8\xac\xab\xbb\x64\xe0\x9e\x3a\x79\xc2\x48\xb3\
-\xff\xee\x7d\x2d\xbf\x95\xa5\xe3\x46\x9a\x83\xbf\x3f\x1a\x79\x2f\
-\x9f\x38\x16\xec\xbc\x07\xef\x3f\x1a\x85\x58\x3e\xee\x4f\x7f\xf0\
-\xe1\xb0\x51\xae\x9e\x3c\xbe\xe8\x7c\xf6\x6d\xf9\x1e\xb4\xca\x64\
-\xbc\xdf\x51\xde\x37\xef\x3e\xd4\x26\xac\xd5\xa5\x13\xb5\xfc\x5f\
-\xbd\x7d\x6f\xec\x4a\xa9\xb2\xad\x9e\x3c\x4e\xea\xef\x83\x71\xde\
-\x05\x84\x80\x15\x52\xde\x83\xf7\x1f\x61\xf9\xc4\x62\xab\xc1\xff\
-\xee\x63\xa6\xe5\xee\xd2\x62\x3d\x1c\xd3\xfb\x51\x5e\x9f\xe0\x10\
-\x6a\x11\xe6\x6d\x7c\x70\x44\x99\x3f\xee\x89\x32\x7d\xc2\xb8\x9e\
-\x07\xe5\x2a\x8d\x2d\x12\x8a\xb6\x1d\x8b\xbf\x3f\x66\x35\xe5\x8a\
-\x0a\xe4\x77\x1f\x47\xad\x05\xac\x80\x0e\x27\x1d\x1b\x1e\x59\xfa\
-\x6c\x21\xdc\x8e\xff\x1b\x19\x0b\x24\x4b\xa4\x5f\xbc\xfb\x70\x68\
-\xfc\x7f\x0c\xde\xfe\xaf\x18\x2b\x27\x3f\x5b\xf4\x4e\x4e\x88\x00\
-\xcb\xc7\x17\xc8\xf8\x1a\xe9\x52\x2f\x37\xbc\xef\xe0\xfd\x61\xed\
-\x5a\xa8\xef\xda\xe9\xc3\x69\x3f\x46\x7d\x63\x2b\xd9\x12\xf1\x9c\
-\x2d\xbb\x54\x73\xac\x04\x64\xd2\x9b\xf7\x1f\xa1\xcb\x6e\xcb\xca\
-\xe7\x9f\xd5\xae\xed\xbf\xfb\xd0\xaa\x8d\x57\x2d\xd9\xeb\xcf\x0f\
-\xbd\xe9\x7d\xef\x0c\xe5\x5d\xcd\x03\x6e\x59\x18\xc2\xeb\xb7\xc5\
-\xb3\x74\x6e\xa1\xf9\xd1\xb5\x99\x53\x27\x8f\x07\xf3\xb0\xf3\xa1\
-\xd7\x01\x01\x4e\x2d\x93\x7b\x07\xe6\x3b\x42\xf7\x7c\x93\x8c\x3d\
-\x1f\x6a\xb9\xef\xc0\xe9\x93\xfe\x7a\x31\xdf\xd7\xdc\x69\x4e\x2d\
-\x7f\x1e\xbc\xff\xea\xed\xdf\xde\x77\x17\xe5\xc3\xc0\xbd\xb8\x32\
-\xab\xb4\x36\xf9\x3c\x75\xf2\x44\x43\x1f\x7c\xef\xb4\x91\x5d\xf1\
-\xf4\xaf\x37\x7f\xff\xcf\x29\x48\x05\x00\x9c\x74\x8c\x19\x63\xac\
-\x13\xe5\xb6\x49\x36\x28\x7d\x20\xbc\x33\xe3\x68\x26\xd1\xbc\x14\
-\xf8\xf9\xb1\x41\x60\xbe\x1e\x75\xe7\xe0\xd8\x21\x92\x85\x2b\xe6\
-\x1e\x86\x75\x20\x0a\x15\x10\xb2\x46\x58\xb0\xe9\xad\xd8\xea\xdb\
-\xd0\xb3\x88\x6c\x58\xc5\x60\x7d\xd7\xc6\x4d\x88\x90\xc4\x83\xac\
-\x88\x8c\xb1\x63\x83\x50\xc5\xb5\xc1\xca\x9c\x4d\x7b\xa9\x45\x20\
-\x81\x3c\xcb\xf8\x32\x79\x56\x04\xe6\xcc\x46\x45\xf8\x16\x00\x48\
-\x65\x11\x53\x06\xa0\x48\x9b\xe5\x45\x98\x97\x2c\x53\x1b\x21\x79\
-\x19\x14\x54\x75\x37\xa1\xbd\x2e\x2b\x87\x62\xa2\x34\x51\xf3\x12\
-\x1a\x00\x28\x0e\xec\x27\x49\xe9\x0b\xba\x78\x18\xa5\x28\x0e\xfd\
-\xe8\x18\x32\x39\xc8\xb2\x00\x6a\x47\x22\x95\x12\x72\x45\x68\xca\
-\xc3\x3d\xa3\x32\xea\x67\x9e\x67\x90\x6b\xbf\xd5\xe4\x5d\x25\xcb\
-\x4a\x50\x00\x26\x49\xe9\xf2\x2d\x01\x91\x9a\xde\x0c\x6c\x02\x8e\
-\x9a\xfd\x25\x7a\x8b\x4a\x26\x12\x44\x79\xb8\x48\xe4\x85\x77\x00\
-\x14\xee\x5d\x19\xe1\x58\x79\x77\x92\x17\xd7\xd0\x13\xf4\x39\xdf\
-\x4e\x8f\x89\x3c\x97\x10\xc8\xba\x4c\x93\x37\x06\x52\x76\x0e\x98\
-\x18\x05\xa6\x54\xb2\x94\xd0\xa3\xab\x37\x2b\x27\x3e\x0b\xbf\xc7\
-\xd7\xf9\xa5\x0c\x8e\x37\xb4\x76\x5c\xb0\x21\x1f\x5f\x7c\x1f\xa5\
-\x24\xbc\x7e\xfb\x5e\x07\x46\xb5\x5f\xda\xa6\x2e\xaa\xc1\x2b\x83\
-\x46\xb3\x52\x5a\xeb\x6d\x91\x8b\x9e\xc7\x17\x12\x78\x1f\x88\xff\
-\x81\xd2\x6d\x7e\x29\x5b\x44\x21\x96\x1d\x56\xdb\xdf\x7d\x18\xc1\
-\x12\x51\xc2\xed\xf6\xa3\x84\xf6\xe0\xc3\x47\x4b\x20\x47\xd6\xe9\
-\xb4\x02\x57\x44\xb6\x7d\x97\x7a\x42\x47\x3b\x9c\xfc\x6c\x21\x38\
-\x79\x21\xca\x16\x6d\x67\xa6\x5d\xfd\xfc\xb3\x86\x7e\x8a\x44\x99\
-\x3f\xd6\x9c\xb6\x87\x63\x3c\xae\x3a\x0d\x29\xea\xcb\x65\xb9\xda\
-\x10\x8b\x95\x13\xc7\xdc\x4a\x79\x87\x2e\x83\x3d\xc7\x8d\x51\xf2\
-\x26\x7a\x0c\x62\x6c\xbe\x85\x12\xfb\xea\xe0\x5d\xfb\x36\x41\x9f\
-\xcc\xa8\x16\x25\xce\x2c\x2f\x75\x1a\x2b\xe1\x31\xd4\xed\x5e\xa3\
-\x22\xd6\x41\x66\x2b\x32\xf5\xf2\xcd\xbb\x71\xb6\xb4\x09\x11\xf9\
-\xbc\xc8\xcb\x51\xe0\x50\xf9\xda\x94\x5d\x91\x9d\x97\x2d\xdb\x7c\
-\x75\xe9\x04\xbc\x3c\xf8\x9b\xcc\x3f\x08\xa7\x4f\x7e\xde\x48\xf4\
-\xf7\xad\x7e\xbb\xd2\x40\x9c\xda\xce\x9d\xba\x1f\xa2\xb9\x0b\x2f\
-\x8c\xdd\xac\x18\xef\x77\xe6\x44\xde\xb4\x20\x29\x73\xd9\xb9\x9d\
-\xed\x62\x85\xcf\xb9\xb9\x83\x87\x23\x78\x74\x36\xdf\xbd\x2c\xeb\
-\x4e\x56\xb0\xf5\x97\xd5\x6a\x9c\x0e\x8f\x1a\x89\x41\xf4\xb8\x76\
-\x2e\xcf\xcf\xa0\x04\xcc\x15\x81\xc1\x4a\xdf\xa6\xcf\xaa\x76\x2f\
-\x75\x74\x4c\x44\xcd\x3e\x03\x51\xea\x58\x92\x59\x96\xc1\x68\x54\
-\x78\x3d\x96\x88\x65\x6c\x4a\xd3\x6d\xb3\xda\x00\xc9\xf2\xac\xdc\
-\xa5\xa9\x62\xdb\x14\xe7\x67\x92\xca\xa9\x58\xf9\xb7\x8d\x1a\xa1\
-\x49\xd3\xc2\x33\x41\xa2\xbc\x99\xa5\x69\x69\x26\x96\x17\x6b\xb0\
-\x25\xa9\xc9\xf3\x5c\x7b\x1c\xd0\x84\x82\xec\xd0\xc8\x5c\x42\x26\
-\x0b\x56\x96\x65\xc5\x96\x13\x12\xff\x70\xaa\x40\x03\x18\x80\x14\
-\x64\x6b\x49\xc7\xbe\x49\x20\x49\x2b\xbf\xd3\x09\x25\x1c\x48\x88\
-\x0d\x14\xe5\x29\x3c\x9d\x95\x4a\x6a\xc9\x02\x0b\x57\xcd\x50\x92\
-\x1b\xa2\x95\x7a\x89\x83\x23\xa4\xa6\x08\xef\xe0\xd8\xe4\xc6\xa5\
-\xd3\x9d\x59\x59\x82\xe7\x2f\xf7\xf5\xfd\xb3\x67\x56\x6b\x69\xb2\
-\x3c\xab\x91\x2d\x85\x17\xfb\xef\x6a\x0b\x22\x6a\x30\xb9\x40\x85\
-\x27\x9d\xe4\xe8\x33\x42\x00\x9c\xb2\x04\x24\x9d\xc4\x05\x00\xac\
-\x9e\x3c\x41\x14\x5b\x6c\x25\x08\x8b\xdd\xb8\xe6\xc1\xe9\xcc\x47\
-\x34\xa4\x13\xf5\x7b\xaf\x0e\xfe\x36\xd8\xc7\xe9\xda\x4a\xa6\x30\
-\xda\x53\xe6\xb2\xe6\x84\xc0\xcc\x33\xb7\x5b\xb8\xbe\x5a\xf5\xe1\
-\x50\xdf\xa7\x64\x21\x24\x7c\x55\xbe\x8d\xf5\x80\x61\xe1\x1e\x5a\
-\xb9\x37\x94\x6f\xac\xf2\x3f\xf8\xfb\xa3\x56\x3e\x97\x8e\x2f\xc2\
-\x41\x49\x70\x97\x2d\xa5\x1a\x73\xd9\x1f\xe7\xe8\xcb\x07\xb5\x63\
-\xe5\x3c\x54\x9f\xea\x9e\xad\x30\xd3\x95\x71\x97\x32\xed\x6f\x9f\
-\xbc\xb9\x4d\xd1\xbf\x22\xee\x52\x86\xbc\xab\xe4\xe4\xbe\xca\xdb\
-\x58\x99\x27\x69\xd1\x48\x6b\x2d\x0e\x44\xcc\x96\xaf\x0f\xfe\x6e\
-\xec\x8b\xa7\xad\x95\xee\x57\xe4\x19\x7a\x4f\x51\x37\xec\x00\x00\
-\x1e\x5a\x49\x44\x41\x54\x6f\x75\xe9\xb8\x71\xcf\xf5\x4c\xa1\x78\
-\x57\xcf\xe4\x6d\x14\x2a\x8c\x90\x21\x2d\x3d\xb0\x55\x0a\x6d\x21\
-\xa7\x69\xdd\xd3\x7b\xb5\xa2\x44\x8c\x91\x17\xfb\x6f\xf5\xdf\x5f\
-\xac\x9e\x34\xca\xfb\x62\xff\xc0\x78\xfe\xec\xea\xb2\xfe\x7b\x6f\
-\xff\x20\xaa\xff\xa9\x43\xbf\x45\xfe\xcb\xc6\xbd\xbd\xfd\x03\xa3\
-\x2e\xce\x9e\x5a\xee\x46\x68\xa4\x8c\xab\xf7\x1e\x17\x22\xf4\x37\
-\xbc\x3e\xd0\x6d\x7a\xf6\xf4\x32\x91\x7f\x79\xeb\xf7\xed\xbd\x7a\
-\x53\xd5\xc5\xe9\x15\xa3\xcd\xf5\x7b\x5a\xd4\x09\x36\x95\xb9\xac\
-\xf3\x98\x39\x81\xb6\x37\xed\x07\x67\x96\x3f\x87\x17\xfb\x07\x00\
-\x20\x8c\xfe\x13\xea\xb7\xab\xa4\xdf\xd2\xeb\xb5\xbe\x2c\x0a\xdd\
-\xc0\xec\x57\xc2\x3b\xce\xeb\x75\xef\x5f\x7d\x6d\xf6\x0e\x2a\xbc\
-\x8b\x25\x2e\x99\xbc\xba\x54\xc8\x41\xec\x12\x8f\x0d\x03\xd1\xf3\
-\x02\x2e\x8c\xeb\x64\xa6\x9e\x38\x73\x90\x16\x43\xd7\x42\x0f\x99\
-\x89\x3a\x38\xdb\x91\xb4\xb9\x57\x7c\xea\x64\xc4\x15\xf0\x5c\x79\
-\x47\x93\x60\x9e\x65\x21\xad\x56\x39\x05\xab\x74\x78\x65\x76\x26\
-\xa0\x72\x06\xa6\x89\x94\x0e\x9a\x99\x43\x92\x64\x05\x87\x90\x08\
-\x79\x9a\x54\x1e\x66\x25\x16\xe6\x66\x59\x5e\x6e\x80\x14\x4e\x08\
-\xd4\xd9\x7c\x21\x40\x73\x02\xed\x65\x39\x1d\x40\x9a\xa6\x31\x84\
-\x26\xd5\xae\x98\xf3\xc1\xa0\x22\x22\xb2\x0c\x5a\x29\x92\x92\xc5\
-\x55\x5b\x45\x08\x00\x32\x41\x48\xb4\x1f\xe9\x8a\x75\xe5\xb9\x04\
-\x89\xb9\xb6\x2a\x12\x89\x80\x34\x4d\x00\x65\x51\x98\x44\x9b\xa2\
-\x81\x41\x68\x8a\x0f\x18\xc0\x60\x90\x96\x04\xab\xf0\x92\xa0\x6d\
-\xe7\x3c\xad\x8a\x42\xb3\x9d\x92\x6c\xd1\xc5\x9c\xee\x8e\xf1\x84\
-\x88\x1b\xb9\xbe\x10\x36\xa1\xce\xaf\xee\xfb\x0e\x49\xe6\x59\xd6\
-\xca\x2c\x5a\xed\x9c\x41\x80\x04\x51\x61\x5b\x4c\xbe\x07\x90\xe7\
-\x59\xe3\xb5\x4a\x11\x09\x4f\x2a\x74\x57\x0a\x10\x8d\x49\xe4\xd9\
-\xcb\x7d\x38\x5f\x92\xba\xb3\xa7\x96\xe1\xd9\x8b\xfd\xc6\x06\x39\
-\xb3\xb2\x44\x26\x25\x51\xff\xae\xc0\x2e\x99\x2e\x8b\xa8\x13\x57\
-\xaa\x90\xed\xbf\x7d\x0f\xab\xa5\xe2\xb8\x7c\xfc\x58\xe3\xea\xb1\
-\xaa\xcf\xfa\xfb\xb2\xc6\x67\xfc\x13\x45\x8c\x32\x90\xfb\x24\xb0\
-\x53\x98\xfa\x57\xd6\x3f\xab\x29\xb4\xaf\x0e\xde\xe9\xb6\x6d\xca\
-\xc2\xb7\x22\x4c\x09\xb5\x00\x80\xd3\x24\x9d\xba\xa7\x9e\xf5\x2a\
-\x8d\x22\xbe\xee\x7c\x52\x3d\xcf\x64\x30\xcf\xbc\xc5\xaa\xdf\xea\
-\x92\x5f\xc1\x95\x99\x0c\xae\xe0\xc5\xc0\x95\xf6\xc5\xfe\x5b\x67\
-\xbf\x30\xcb\x8d\x3a\x6d\x3d\x8f\xe6\x4e\xd0\x34\x8e\x6b\x8a\xf2\
-\xeb\x03\xe3\x3d\x7b\xaf\x0f\x0c\x59\xe2\xfb\x66\x7f\xbf\x8f\x6f\
-\x03\xfa\x9e\xbd\x57\x6f\xb4\x4c\x29\x16\x8c\xde\x74\x92\xed\xa1\
-\x71\x27\xf3\xdc\x90\x5b\xcf\x5f\xbd\x81\x73\xea\x9d\xab\xee\x77\
-\xda\xcf\x63\x93\x6c\x1c\xa3\x4e\x54\x9d\x9e\xb7\x16\xc8\x9e\xbd\
-\xdc\x2f\xf2\x20\x2f\x7f\xf6\x62\xdf\x9b\x6f\x71\xdd\xdd\x57\xf2\
-\xcc\x5f\x3f\xc6\x3d\x8f\x7e\x7b\xfe\x8b\x53\xa4\x0c\xaf\xf5\xff\
-\x9f\x3d\xb5\x0c\x4f\x5f\xbc\x0e\x76\xd7\x2c\xf3\xc9\xd7\xf6\x84\
-\x26\xf4\x4c\xee\x1c\x63\x91\xdf\x1d\x79\x2f\x94\x9f\xcc\x72\xf0\
-\xc5\x7e\xc8\x73\x59\x6b\xdf\xe7\x2f\xf7\xc9\x0e\x80\x80\xe7\x2f\
-\xdf\xc0\xb9\x33\x2b\x56\x7e\xae\x77\x98\x73\xe0\xde\xab\x83\xba\
-\x8c\x8c\xad\x67\xd1\xec\x3b\xcd\x77\x2f\x74\x62\x27\xcb\xea\x7d\
-\xf1\xc5\xfe\x5b\xc8\xb2\xbc\x46\x2c\xce\x5a\xb2\xc9\x45\xe4\xe9\
-\xd9\xec\x73\x64\x2c\xd3\xb1\xe2\xe6\x39\xd4\x83\x2d\xc2\x57\x67\
-\x4f\x07\xe5\xd1\xee\xde\x4b\xe3\xde\x68\x54\x98\xc8\x5d\x38\x77\
-\xa6\x4a\xf3\xfc\xa5\xb3\xaf\x5f\x38\x7f\xa6\x96\xf7\xee\xb3\x97\
-\xcd\x04\x51\xf8\x97\x5c\x5b\x7b\x88\x34\x0e\xf3\x9b\x9e\x7f\x45\
-\xe9\x2e\x39\xa1\x3b\x24\xa9\x84\x94\x6c\x42\xa8\x85\xba\x24\x49\
-\x74\x78\x16\x75\x46\xa6\x38\x8b\x93\x43\x9e\x27\x3a\xd8\x7d\x22\
-\x93\xca\xbb\x6c\xc9\x25\xd4\x99\x7b\x75\xce\x5e\x24\x85\x8f\x65\
-\x21\x0a\xce\x30\x20\x61\x62\x06\x83\x14\x06\x31\x84\x26\x11\x02\
-\x16\x06\x03\xc8\x16\x16\x20\x2f\xc9\x8c\x10\x02\xb2\x3c\xd3\xbb\
-\x28\x85\xdb\xb5\xca\x2b\x17\x4a\x59\x3a\x3c\xab\x0e\x6a\x4b\xe5\
-\xa9\x0c\xab\xe8\xa1\x49\x92\x42\x9a\xa2\xce\x33\xc9\x13\x90\x72\
-\x50\x46\x1a\xad\x76\x3a\x12\x51\xee\xce\xe8\xb8\x37\x83\x92\x9d\
-\x15\xac\x8c\x6e\x3b\x29\x3b\x3a\x41\xcc\xcb\x1a\x68\xb7\x39\xd0\
-\xa3\x5c\xcd\x8c\x1f\xff\xf5\xc2\xf9\x2f\x60\x7b\xe7\x29\x5c\xba\
-\xf8\xa5\x87\x84\x8c\x2a\x65\xdb\xca\x7a\x94\x8d\xc2\x22\xc2\x56\
-\xd4\x3c\xe4\x69\x94\x8d\x9c\xa5\x7e\xba\xf7\xaa\x20\x41\x22\xfe\
-\x9b\x72\x25\x84\x43\x8a\x02\xba\x7d\x20\xd9\x82\x32\x44\x00\x0c\
-\x01\x72\x7a\x05\x9e\xec\xbd\x74\x13\x3e\x22\x65\x85\x87\x4c\x0a\
-\xa3\x7e\xeb\x09\x33\xab\x1c\x19\xc9\xd7\x69\x4a\xe8\xa9\xe7\x2c\
-\x38\xe1\x65\xad\xae\x77\x25\xc7\xbe\x6e\xbc\xf7\xea\xc0\x58\xed\
-\xa4\x76\xe6\x7b\xaf\xde\x18\x13\x32\x06\x56\xb2\xce\x39\x76\x19\
-\x29\xd1\xa1\x2b\xa2\x76\xbf\xa1\x13\x8b\xfb\xbb\xc5\xd8\x75\x14\
-\xd3\xaf\xda\xe6\x77\x66\x65\xc9\x9c\x00\x3d\xfd\x26\x46\xf1\xa9\
-\x13\x87\x93\x26\xb1\x0f\x54\xc5\x99\xd5\x25\xe7\x44\xdc\x86\xc8\
-\x74\x29\xe3\xb3\xbd\xd7\x20\xb3\x3c\x98\xbb\x57\xa1\xf3\x5e\x6f\
-\xd7\x06\xbe\x3a\x8f\x91\x21\xa2\x65\x1f\xb1\xef\xd9\x65\xcd\x1a\
-\xde\x99\xe5\xdd\xbe\xd9\x7f\x5f\x34\x2e\x5c\xec\x3e\x7b\x51\x7b\
-\x1e\xa3\xea\x12\x5b\x8f\x21\x7d\x4f\xc4\xcd\x8b\x99\x43\xee\x87\
-\xce\xed\xfb\xde\xed\xac\xd7\x06\x47\x5d\x59\x90\xd0\x64\xad\xbe\
-\x3b\xeb\x70\x4f\xb7\x89\x68\x97\x9f\xdd\x96\xbb\xcf\x5f\xea\x6f\
-\x11\x2d\xca\x70\xf6\xcc\x0a\x3c\xa1\x0a\xb5\xd5\x66\xa2\xd3\xd8\
-\x14\x71\xbb\x31\x2d\x4e\xfb\x7f\xb1\xba\xe4\x25\xba\x54\x97\x70\
-\x11\x0c\x4a\x72\x76\xf7\x5e\x1a\x3b\x0f\x2e\xd2\x40\x17\x03\x76\
-\x9e\xee\xd5\x76\x4e\xb0\x85\x59\x63\x36\xaa\xeb\x0e\x97\x2e\x9c\
-\x37\x75\xc0\x73\x67\x60\x7b\xf7\x99\x51\xfd\xdf\x58\x69\x6c\x92\
-\xb3\xb3\xfb\xbc\xb6\x5a\x5e\x9d\x25\xae\x5a\x0e\x5d\x8a\x8f\x63\
-\x91\x57\x3b\x37\xaa\x79\x5f\xaa\xce\xb1\x4b\x51\x9c\xa7\x2f\x7c\
-\x24\x03\x60\x82\xc5\x6e\x08\x4a\x40\x4c\x75\x9d\x24\x89\x80\x2c\
-\x13\x85\x15\x17\x39\xbc\xaf\xac\xbb\xd4\x26\x84\x76\xbf\x54\x12\
-\x17\x4d\x6a\x28\xa1\xc1\xca\x99\x80\x32\x2f\x4b\x05\x00\xa4\x65\
-\xa0\xce\x34\x85\x85\x85\x05\x1d\x98\x73\xb0\x30\xd0\x1b\x28\x41\
-\x42\x03\x00\x30\x58\x5c\x80\x45\xa9\xc8\x4c\xe1\xbd\x2c\xcd\x93\
-\xc2\x3c\x00\x15\xe9\xa8\x9c\x07\x80\x0e\x74\x43\x6a\x0d\x05\x00\
-\x24\x85\xd7\x64\x4c\x60\x90\xa6\x7a\xcb\x2a\x4d\x92\xd2\xe3\x81\
-\x22\x3d\xd6\xd6\x96\x22\x2a\x49\x11\x9c\x27\x49\x0b\xd6\x97\x26\
-\x69\x49\x74\xd2\x32\xae\x4d\xe9\xb8\x40\x9d\x91\x89\x55\xc8\xc9\
-\x01\xa9\xa0\xf2\x86\xe8\xb6\x4d\xf4\xb2\xdc\xfa\xa5\x87\x5b\x3b\
-\xf0\xfd\xe5\x8b\x35\x45\x93\x5e\xd7\x84\xc6\x23\x1d\x2e\x7e\x79\
-\xb6\x76\x6d\xeb\xf1\xae\xf7\xf3\xd4\xea\x40\x4d\xb1\x3f\xcc\xdc\
-\x0a\xff\x28\x73\x4e\x4a\xa1\xea\xa4\x2b\x6f\x3e\xa5\xda\xb5\x33\
-\xf6\x78\xf7\x19\xe4\x59\x06\xdb\xbb\xcf\xf4\x80\xbf\x70\xfe\x0b\
-\xd8\xfe\xeb\xa9\x77\x52\x7c\xbc\xfb\x4c\x0f\xfc\x7c\x94\xb9\x85\
-\x49\x60\x52\xcd\x46\x23\xcb\x01\x44\x9d\xf8\x3c\xdd\x7b\x09\xd9\
-\x68\x04\x4f\xf7\x5e\xc1\x97\xa5\xb0\xfc\x62\x75\x19\x9e\xee\xbd\
-\xf2\x2b\xb8\x96\x19\x80\x5a\x85\xcc\x28\x01\xc5\xb0\xe0\x6b\xba\
-\xee\x9c\xe4\x48\x5a\x27\x61\xcc\xb2\x20\x19\x79\xf2\xfc\x25\x7c\
-\x75\xee\x8c\x83\xf0\x66\xd6\x33\xe8\x25\xe7\x54\x81\x72\x5d\x3f\
-\x7b\x7a\xc5\x58\x65\xd2\x44\xe8\xf4\x8a\xf1\x4c\xd6\x42\xa1\x75\
-\x91\x28\x9a\x57\x6f\xc4\xcf\xf1\x0e\xf5\x6d\xae\x49\x3e\xcb\x46\
-\xce\xaa\x3a\xff\x45\xbd\xbc\x7f\x3d\xdd\x33\xfe\xfe\x9a\x8c\x6d\
-\x3b\x7d\x30\xed\x19\x7f\xda\x36\x94\xc6\x35\x8e\x77\xac\xbc\xcc\
-\xfe\x11\xce\xf9\xcb\xb3\xa7\x60\xe7\xc9\x5e\x74\x5d\x1b\xd7\x23\
-\x0b\xbd\xb3\xfb\x0c\xf2\x51\x06\x3b\xbb\xcf\xe0\x62\x29\x17\xbe\
-\x3a\x77\x06\x1e\x5b\xca\x42\x17\x45\xc4\x77\x6f\xa7\x94\x5b\xf4\
-\x9d\x17\xc8\x3b\xdb\x10\x93\xf6\xfd\xd2\xbd\xfd\x91\x67\x59\xad\
-\xca\x8a\xc5\x94\x76\xce\x39\x4c\x99\x8a\xd1\x4a\x6d\xee\x2b\xa7\
-\x03\xdb\x3b\x4f\x21\x1f\x65\xc6\xa2\xde\xd7\xe7\xcf\xc2\xa3\x9d\
-\x27\xad\xc7\x67\x1e\x58\xe0\xeb\xb2\x78\x91\xf9\xe6\x94\x0e\x79\
-\x75\x69\xf3\xa2\xfe\x45\xd4\x73\x31\x0b\x00\x6a\x2c\xd0\x79\x53\
-\x5d\xb7\xc7\x51\xa8\xfd\xbe\x74\x90\x86\x9d\x27\xcf\x03\xdc\xa5\
-\x5b\xdc\x9e\x9d\x27\x7b\x70\xf1\xab\x4a\xb6\x7d\x69\xc9\xa4\xc7\
-\x4f\x9e\x1b\x1a\x38\xfd\x26\x3a\xfe\xe8\xf5\xec\x70\xa4\x75\xb8\
-\x4b\x17\xbf\xaa\xf4\xa6\x9d\x5d\xfd\xde\xcb\xdf\x5c\xa8\x64\xdb\
-\xe1\x61\x50\xcf\x7b\xf0\x68\x07\x00\x00\x7e\xf8\xb6\xd2\xd9\x1e\
-\x6c\xed\x90\xe7\xcd\x3e\x79\xe9\xc2\x79\x78\x58\x3e\xf3\x3d\x79\
-\xe6\xd2\x85\xf3\xf0\xdf\xed\x1d\x00\x10\xf0\xdd\xa5\xaf\xab\x72\
-\x6d\xef\xea\x26\xa0\xe5\x2a\xac\x31\x2a\x73\x79\x1d\x38\x5e\xc5\
-\xd9\x53\x7a\x8c\xc0\xd2\x93\x6f\x3d\xd8\xbb\x70\x9d\x07\x77\x1c\
-\x4e\x47\xa1\x48\x49\xe1\x1d\x4d\x24\x02\x92\xbc\x3c\xc7\x9e\x08\
-\xcd\x05\xd4\x4e\x4d\x9e\x17\xd6\x5c\xca\xfb\x19\x00\x39\xbc\x9f\
-\xa6\x30\x48\x2b\x2b\x2b\xb5\xf9\x40\x17\xcd\xd1\xea\x3a\x58\x5a\
-\x67\x41\x49\x68\x14\xb9\x49\x92\x04\xd2\x41\x0a\x8b\x0b\x8b\xb0\
-\x78\x6c\x11\x16\x17\x17\x60\x61\xc1\x7d\xe6\xca\x49\x68\x12\x00\
-\x38\xb6\xb8\x58\x92\x0b\x01\x49\x9a\x40\x96\x95\xe6\x67\x20\x75\
-\xb5\x68\x42\x21\xea\x1e\xc3\x92\x04\x41\xa2\x00\x99\x17\x8e\x05\
-\xd2\x34\x85\x5c\x4a\x18\x0c\x72\xed\x01\x41\x2a\xef\x09\x48\xb7\
-\xb8\x84\x0e\xea\xa9\xec\xf4\x68\x25\xea\x00\x3d\xca\x56\x8f\xf8\
-\xa4\x76\x8d\x18\xe3\xf0\x93\x1d\x2b\x45\xf5\x8e\xd2\x56\x0f\x2d\
-\x3f\xbf\x48\x9f\x37\x14\x73\x72\xe0\xdd\x72\x79\x57\x9b\x10\xc8\
-\x6a\x09\x15\x4e\xb6\xa0\x1a\x19\x26\x67\xcd\xd0\x03\xc8\xf1\xd0\
-\xb7\x64\x00\x57\x83\xef\x31\x8c\x46\x87\x4e\x53\xb4\xac\x36\x41\
-\xc4\x39\x3b\x08\x4f\xca\x95\x92\xf7\x2d\x19\xa0\x86\xb2\x1d\x29\
-\xf0\x69\xf9\x2e\x5e\x38\x0f\x5b\xdb\x7f\x79\xee\x7b\x26\x85\x92\
-\x2c\x0a\x2b\xee\x0f\xdd\x2d\x1b\x1d\xba\xcd\xfa\xaa\x9d\xb3\x78\
-\x05\x71\x27\xa0\xe4\x8c\x46\x87\xad\xae\x77\x49\x3b\x1a\x8d\x5a\
-\xc7\x3c\xdb\xfe\xeb\x69\x35\x09\xb4\x50\x8d\x69\xfd\x6c\xef\x3c\
-\x31\x26\x0f\x5f\xdd\x15\xca\x42\x3f\xf6\xc3\xa1\xf6\x69\x6a\xbb\
-\xd8\xb6\xa5\xe9\x8a\x9d\xd6\x27\xee\xfb\xd8\xbe\xbc\x8f\x1e\xef\
-\x1a\xe3\x83\x42\x11\x98\x47\x3b\xbb\xfa\xdf\x6f\x2f\x36\xa4\x7d\
-\xbc\x3b\x76\xcd\x7a\xdb\xad\x46\xdc\x30\xfa\x79\xaa\xb0\xd0\x49\
-\x3c\xb6\x2f\x5c\x26\x93\x7f\x7b\x45\xd7\x2f\xbd\x2e\x7a\x56\x48\
-\xb7\xb6\xff\x32\xee\xf9\x09\x99\xbf\x0f\xb9\x56\x5f\x1f\x3e\xda\
-\x69\x4d\x68\x44\x84\x5c\xf4\x5e\x8b\x69\xaf\xc0\x37\x8c\x02\x65\
-\x1d\x79\x76\x57\x55\x79\x8d\x05\xbb\x32\x2d\xb6\x90\xfb\x97\x9d\
-\xf3\xd8\x76\xab\x45\x90\xd0\x9c\xa8\xe6\xc5\xcc\xb9\x48\x11\x37\
-\x1f\xc5\xce\xbd\xa1\xfc\x2e\x79\xca\xe6\xea\x2b\xf6\xd8\x12\x5e\
-\x92\x54\xa4\xdb\x7a\xb4\x03\x97\x89\x42\xed\xea\xfb\xf6\x7c\x1a\
-\x2f\x1b\x44\xec\x30\x6b\x9c\x56\xb6\xb6\x77\xe1\xf2\x25\xb7\x6c\
-\xfb\xe6\xab\x73\x45\x7d\x6c\xef\x44\x8d\x31\x00\x80\x4b\x5f\x7f\
-\x09\x0f\xb6\xb6\x1d\x7d\xca\xfd\x8e\xef\x2e\x7d\x0d\x7f\x3c\xd8\
-\xaa\xef\x06\x05\xc6\x4f\xa6\xe7\x61\xe1\x9f\xe7\x04\xc0\xfd\x07\
-\x5b\xf0\xd3\x0f\x97\xc9\xf5\xbc\x66\x0d\xe3\xfb\xf6\x4b\x17\xbf\
-\x82\xad\xed\x5d\xad\xe3\xa2\x22\x2d\x8a\xc0\x94\x0a\xbb\xf6\x16\
-\x4c\x1c\x5c\x69\x5d\xda\x26\x32\xb4\xc1\x84\x7b\xb1\x1f\x92\xd2\
-\x19\x40\x52\xc4\x7c\x4c\x65\x11\xf0\x3e\xcf\x25\x0c\xd2\x14\xf2\
-\xc1\x40\x7b\x2e\xd6\x7a\x3c\xa0\xde\x5c\xd0\x16\x56\xda\x44\x4d\
-\xfd\x9d\x94\x81\x33\x29\xb9\x29\xde\x95\x24\x08\x80\x69\xe9\x78\
-\xa2\xd0\xc9\x93\xd2\xb2\x6b\x30\x48\x61\x71\xa1\x20\x32\x8b\xc7\
-\x16\x21\xf1\xf4\x35\xaf\x9f\xbc\x24\x11\x70\xec\xd8\x31\x48\x93\
-\x04\x06\xe9\xa0\xf0\x3c\x50\xda\xb7\xd1\xc3\x3a\x66\x25\x0a\xa0\
-\x54\x00\x25\x00\x0e\xa4\x7e\x4e\x52\xbf\xd6\xa5\x39\x1a\x94\xde\
-\x13\x88\xbf\x00\xed\x62\x59\x7b\x3a\x4b\x12\xcd\xd4\x2a\xef\x67\
-\x55\x85\x18\x0d\x45\x76\x55\x34\x89\x41\x42\x4f\xb4\x0f\xee\xca\
-\xc5\x9c\xde\x2e\x53\x81\x7d\x44\x11\x36\x56\xd8\xd1\x57\x81\x04\
-\x27\x42\xe2\xad\x4a\xfb\xf8\x76\xad\x70\x55\x5b\xdd\x3f\xff\x78\
-\x99\x10\x9d\x51\xf4\xaa\xd3\xdd\x7b\xf7\x6b\x93\x46\xd6\x72\x95\
-\x8a\x0a\x22\x7b\x30\x8d\x9c\x0a\x8c\x6d\xfa\x66\x3e\xf3\xe0\xbf\
-\xa6\xb0\xf8\xe1\xbb\x4b\xf5\xc1\x8c\x61\xc5\xc4\x5d\x3e\xe1\xdc\
-\x41\xa2\x42\xc1\x2e\xef\x88\xac\xa6\x89\xd0\x0a\x9c\xf0\x0b\xdf\
-\x6f\xbe\x3e\xef\x27\x07\x1e\xfc\xf7\x51\x25\x60\xbf\x23\x93\xc6\
-\xc5\x0b\xe7\x8d\x7b\x31\xf9\x8d\x5a\x10\xa7\xa6\xb4\xd9\xe1\xa8\
-\x31\xc6\xc3\xc3\xad\xc7\xf0\xfd\xe5\x6f\x1a\xf2\x6c\xf6\xe4\x34\
-\x0a\x2a\x43\x87\x4e\x85\xc4\x75\x3d\x06\x7a\x82\xc2\xb8\xba\x68\
-\xaa\xa7\xda\x7d\x8f\x71\xf7\x68\x34\x82\x07\xff\xdd\xd6\x7d\xdc\
-\x7e\xce\xd7\xd7\xff\x7c\xb8\xed\x78\x67\x16\x4c\xf7\xe3\xf7\x97\
-\x82\xab\xc5\x74\xdc\xd9\x63\xae\x6d\x3f\x02\x00\x78\xf0\xf0\x51\
-\xad\xc5\xfd\x44\x74\x64\xcd\x7b\xf5\x8f\xbe\xff\xe0\x91\xd7\xb4\
-\xd5\x95\x5f\x17\xf2\xe5\x93\x21\xa3\xc0\xaa\x7a\x1b\x5d\xeb\xcf\
-\x07\x8f\x6a\x75\xe0\x97\x5b\x2d\xcd\x20\xb3\xac\xd1\x2b\x9b\xad\
-\x34\xfa\xcc\x7a\x5c\xef\xce\x8d\x5d\xd6\xb8\xd0\xb8\xcd\xbb\x07\
-\xd8\x7a\xa7\xc2\x06\x25\x37\xee\x6f\xe8\x66\xda\x33\x0e\xee\xdd\
-\x7f\xd8\x69\xd1\xa5\x6d\x19\x82\x24\xc0\x83\x3f\xfe\xdc\x72\xef\
-\x1c\x45\xd4\xf9\xfd\x3f\xb7\x8c\xb1\x70\xff\xc1\x96\xfe\x9b\x2a\
-\xd6\x4d\x32\x83\x3e\xe7\x4e\x6b\x9d\xdf\x68\xfa\x34\xe7\x74\x82\
-\xd1\xe5\xcc\x46\xa3\x56\x8e\x01\x46\x87\xed\x75\x24\x97\x5c\xf3\
-\x39\x05\x08\x2d\x42\xdf\xfd\xfd\x3e\x59\xcc\x36\x53\x49\xd9\xf6\
-\x0c\x98\x19\xd4\x4b\x2f\xe0\x0b\x01\x85\x1f\xae\xa4\xb4\x0e\x53\
-\x7a\x71\x79\x3f\x21\xc4\x46\x13\x9c\xf2\x2c\xbb\xb1\x5a\xed\x38\
-\x81\x53\xd6\x83\x44\x84\x41\xe9\xe4\x4b\x05\xd6\xcc\xf3\x85\x2a\
-\xc0\xa6\xac\x8e\x96\x28\x2f\xb4\xc5\x4f\xb9\x57\xae\xce\xdf\x54\
-\x21\x61\x44\xb9\x19\xe1\x7a\x2d\xea\xcf\x15\xa5\x15\x98\x72\x04\
-\xb0\xb0\x30\x80\x85\x85\x85\x9a\xab\xe6\x28\x42\x03\x50\xc4\x76\
-\x59\x5c\x5c\x80\xc1\x60\x00\x99\x76\xbb\x8c\x5a\x79\x37\xb6\xb4\
-\xec\x38\x04\x48\x48\x0d\x14\xee\x9a\x11\x2b\x3f\xd6\x68\x10\x0b\
-\x74\x08\x70\x01\x55\x84\xd0\x84\xb8\x88\xab\x62\xd7\xd0\xd7\x1a\
-\x5b\x84\x84\xc0\x60\xc9\x96\x2a\x7f\xd9\x25\x81\x92\x58\xc6\xc4\
-\xa9\x47\x54\xd5\xe5\xd2\x7d\xa9\xdc\xc1\x29\x2f\x08\xa0\xf7\xd1\
-\x0a\x58\x04\x56\xe7\x95\x70\xe7\xee\x1f\x70\xed\xea\xcf\xfa\xda\
-\xf0\xce\xbd\xda\x61\xbc\x6c\x94\x07\x06\x5a\x1e\xbd\x62\x0e\x00\
-\x30\xbc\xfd\x3b\x00\x08\x58\xbb\x7e\x45\x5f\xbb\xf2\xd3\xf7\x70\
-\xfb\xee\x1f\x4e\xb9\xf3\xd3\x0f\x97\xe1\xee\xef\xf7\x6b\x1d\x5b\
-\x84\xec\xa1\x23\x57\xbf\xaf\xfc\xfc\x43\xd4\x90\xfd\xf9\xc7\xef\
-\x8a\x32\xf8\xf2\x12\xe0\x15\x76\x8a\xdc\x89\x50\x59\xac\x9b\xb1\
-\xe5\xfa\xee\xdb\x8b\xf0\xc7\xfd\x87\x1e\x81\x79\xa8\xf3\xfd\xe3\
-\xcf\x87\xf0\xf3\x8f\xdf\x47\xec\x4e\x8c\x3a\xd5\x67\x9b\xb4\xd5\
-\xa4\x13\xef\x65\xdf\x9f\x67\x38\x56\x48\xdb\x1d\x92\xb6\x3b\x5e\
-\xce\x67\xb1\x9f\x7a\x8a\x5d\x14\xb0\xf3\xa9\x93\xf7\x51\xab\xfc\
-\x43\xf3\xfe\xbd\x3f\x1e\xd4\xfa\xa7\x2f\x7f\x67\x5a\x4b\xa1\x1d\
-\x47\x99\xb5\xf1\xe3\xf7\xdf\xc2\xef\xf7\xfe\x6c\x50\xd8\xdd\x65\
-\x55\xcf\xfd\x72\xe5\xc7\x2a\xbf\x1f\x9a\xf3\xb3\x9f\x09\xe1\xa7\
-\x1f\x2e\xc3\x5d\x92\x5f\x8c\xea\xe8\x7a\x7f\x96\x8d\x5a\xbe\xf3\
-\x7e\x70\x21\xea\xea\x95\x9f\xea\xb2\xb6\x81\xf4\xc4\x74\x1a\x57\
-\xff\xd2\xe5\x69\xa1\xf8\x05\x4d\xa8\xca\x85\x37\x74\x14\x80\xf6\
-\x1d\xfb\xee\xd5\x5f\x7e\x8a\x7a\xf7\x95\x9f\xbe\x83\x3b\x77\xef\
-\x3b\x95\x46\x35\x5f\x5d\x27\x73\x27\x9d\xc7\xda\x90\xd7\x3b\x77\
-\xef\x3b\xbe\x3b\xf6\xac\x63\xbc\x19\xde\x9d\xb2\x6c\xd7\xac\x32\
-\xdf\xd1\x65\x16\xfe\xb2\x11\xc3\x08\xdf\x38\x8a\xe9\x3f\x5e\xb9\
-\x26\xdc\x7d\xd2\x67\xe1\x10\x23\x1b\xda\x5a\x6e\xc4\x86\x44\x76\
-\x96\xd3\x41\xf0\xea\x7d\xa1\xd2\xdb\x5c\xe5\xbf\x35\xbc\xeb\x2d\
-\x87\x2d\x67\x9b\xc8\x93\xcc\x32\xf0\x9a\x83\x12\x47\x44\xf6\x02\
-\xb2\x94\xb2\xa6\x5b\xdd\xff\x73\xcb\x0c\x31\x52\x1e\xa5\x48\x2c\
-\x53\x79\x7d\xc4\x42\x59\x46\xa9\x83\xf3\x89\x30\x02\x4f\x9a\x3f\
-\xba\x83\x23\x4c\xaf\xbc\x22\x70\xbc\xc0\xd0\x8d\x25\x89\x2f\x23\
-\x49\xe0\x4d\xb2\x39\x41\x09\x97\x5d\x06\x4d\x66\xc8\x37\x8a\x40\
-\x9f\xd2\x56\x5a\x8a\xd0\x24\x3a\xce\x65\x08\x83\x98\x4e\x98\x24\
-\x02\x16\x93\x01\x58\x9c\xa1\xb1\xe7\xa2\x66\x5c\xe8\xfc\x9b\xc6\
-\x4d\x30\xe6\x5f\x61\x7e\x58\xe5\x12\x59\x54\x31\x63\x44\xbd\xe3\
-\xd1\xa0\x42\x28\x09\x79\x41\x04\x28\xc9\x94\x8a\xa5\x53\xc4\xb1\
-\x49\x4b\x92\x85\xd6\x75\xd0\x0d\x88\x84\xb0\x20\xf9\x76\xa1\xdf\
-\x57\x45\xb9\x77\x29\x11\x76\x63\xab\x0e\xed\x8e\xa5\xd2\xfe\x60\
-\x66\x28\xfd\xc6\xe6\x6d\xf8\xd7\xcd\xeb\x0e\x41\x2c\x60\x73\x78\
-\x17\x6e\xae\x5d\x35\x26\xa0\xe1\xf0\x77\x5a\xf1\xb0\x76\xfd\x0a\
-\x0c\x6f\xdf\x73\x0e\xd8\xcc\x38\xe4\xe8\x98\xec\x1c\x65\x1e\xde\
-\xb9\x07\x66\x94\x2b\x84\xb5\xeb\x57\x1b\x27\x0a\x35\xf1\x0c\x87\
-\xbf\xc3\xda\xda\x2f\xad\x26\x26\x67\x59\x84\x7b\x12\xa2\xa0\x13\
-\x52\x8c\xfd\x3f\x4d\x1f\x9a\x54\x5a\x11\x9a\x8e\x1e\xf3\xd4\x64\
-\xd8\x66\xf5\xbb\xeb\xe1\xec\xdc\xa8\x83\x2b\x8d\xed\xd2\x74\x60\
-\x59\x04\xfe\x2f\xcf\xf2\xc8\x35\x67\x7f\x1f\x34\xeb\x31\x8f\xfe\
-\x46\x04\x80\xdb\x77\xee\xc1\xf5\x6b\x57\xa2\xdb\x23\xa4\xf0\x01\
-\x80\xce\xeb\xf6\x9d\x7b\x8d\xa4\x43\xa7\xbd\xdb\x9c\xb6\x15\x49\
-\x6c\x48\x6f\x7f\xf3\x2f\x57\x7e\xac\xc6\x31\x00\xac\x5d\xfb\xc5\
-\x51\xe7\x2e\x79\x90\x6b\x19\xb0\x46\xf2\xcb\xb2\x76\xab\x95\x5a\
-\x1e\x11\xd0\x85\x9b\x7c\x14\xef\x64\x22\x46\x76\xb8\xdf\x89\xb0\
-\x76\xfd\x97\xc6\x3c\x7c\x72\x2b\xf7\x98\x5f\xd9\x6d\x52\x1b\x0b\
-\xc2\x93\xff\xed\xdf\x8d\xf2\x5c\xbd\xf2\x13\x0c\x6f\xdf\x35\x5e\
-\xb0\xb6\x76\x55\x2b\x73\xa1\x3e\x70\x83\xcc\x09\x4d\xed\xe3\x93\
-\x19\x76\x6d\x0f\xc9\x7b\xd1\xf1\x9e\x9a\x73\x00\x7d\xbd\x78\xb7\
-\x3d\x57\x75\xf3\x72\xd6\xdd\xa1\x88\x5d\x27\x31\x1e\xd3\x6e\x0d\
-\xef\x5a\xdf\x98\xb7\x2c\x5b\xa5\xf2\xda\xfd\xc7\x98\xab\x01\x6a\
-\x73\xa2\x6a\x97\xb5\xf2\xfd\x43\xbb\xdd\x45\xdc\x18\x88\x99\x13\
-\x68\xbf\x2b\x16\x52\xdb\x43\xe5\x31\xbc\x7d\x37\x48\x24\x5c\xb2\
-\xea\xfa\xd5\x9f\x61\x73\x78\xc7\xe8\xeb\x37\x6f\x5c\x83\xcd\xcd\
-\xdb\xce\x3e\x75\x63\xed\x2a\xac\x6f\x0c\x8d\x9d\x88\x5f\x7f\xbd\
-\x01\xbf\xad\xdf\xf2\x12\x2d\xf4\xc8\x90\x3c\xcf\x9d\x26\xfc\x85\
-\x3e\x97\x97\x07\xed\x1d\xcf\x4a\xd4\xe7\x55\x34\x51\xfd\xf1\x72\
-\xb5\x43\x55\x66\xf9\xfd\xe5\x8b\xb0\xb5\xfd\x97\xb1\xe3\x51\xec\
-\xca\x88\xca\x19\x96\xb6\x5e\xaa\xae\x01\xd9\x09\x11\x42\x18\xe7\
-\xcc\x4d\x72\x63\xee\xae\xb9\x7c\x25\x21\x82\x19\x26\x05\x49\x7c\
-\x1a\xbd\x29\x60\x39\xd6\x12\x55\xf0\x7a\xfb\x58\x88\xe1\xbc\xcb\
-\x3e\x06\x40\xf4\x7e\x65\x2e\x97\xb4\xec\x4b\x83\x2e\x1d\x50\xc4\
-\x30\x73\x41\x95\x5d\x01\x93\x82\x4d\xae\x94\xf9\x9a\x3e\x1a\xe3\
-\x20\x2a\xd5\xff\x23\x20\x26\x85\x47\x36\x89\x90\x20\x82\x94\x09\
-\xa0\x90\x20\x51\x00\x94\x66\x72\x55\x43\x22\xa0\x90\x80\x52\x00\
-\x82\x84\x44\xaf\x07\x54\xa6\x76\xc2\x33\x18\x87\xc3\xdf\x8d\x33\
-\x39\xf6\xa8\xd5\xc1\xf9\x1c\xcf\xff\xfa\xaf\xb5\xda\xb5\xff\xfc\
-\xb6\xe9\x5f\x39\xf0\xf8\xd0\xbf\x79\xe3\x1a\xac\xaf\x0f\x75\x73\
-\xac\x6f\x0c\x8d\xbc\x5d\x64\x41\xbb\x35\xb5\x57\x19\x3a\xb8\x1e\
-\xd5\x79\x79\x24\xd6\xda\xda\x55\xd8\xdc\xbc\xed\x16\x0e\x01\xc5\
-\xa4\xc9\xe5\x71\x9e\x35\xb9\x75\x0e\x3f\x7f\xed\xea\xcf\x4e\x65\
-\xc0\x26\x31\x74\x02\x6f\xeb\xbe\xf3\xaa\x23\xaf\xa1\x47\x01\x69\
-\xf4\x92\xe4\x79\x07\x76\x78\xc6\xf5\xd0\xad\x5b\x77\xe1\xc6\x8d\
-\xab\x4e\x12\x43\x57\xc2\xf2\x46\x97\xc3\x6d\x95\x92\x76\x8a\x4c\
-\x53\xbf\x90\x91\xdf\xdc\x54\xe6\xea\xbe\xf9\xe0\x9a\x83\xfc\x6c\
-\xde\xba\xeb\x25\x36\x2e\x6c\xde\xba\x63\x94\xf3\xfa\xd5\xf8\xb4\
-\x31\x94\x31\xa6\x4e\x37\x6f\xdd\x81\x9b\x37\xae\x05\xbf\xab\x48\
-\x77\xdb\x5b\xa7\xbe\xeb\x6b\xd7\xaf\xc0\xe6\xe6\x9d\xde\xda\x74\
-\x6d\xed\x97\x56\xf9\xc5\x7c\x7f\xe3\x3b\xaf\xab\x77\x62\xdc\x37\
-\x7b\xe4\x9c\x6e\xb1\x86\xa0\xc5\xae\xfc\x37\x37\x6f\xc3\x4d\xb2\
-\x78\x45\x17\x8a\xaa\x7c\x69\xfa\x21\xdc\xbc\xb9\xe6\x54\xd8\x69\
-\x1a\x0c\x98\xc7\xb8\x9e\xdb\xdc\x1c\xd6\xca\x4d\xe7\x23\xd7\x82\
-\xc4\x8d\xb5\xab\xb0\xb1\x39\x0c\xc8\x7d\x6b\x1e\xf3\xa4\x0f\xd6\
-\x55\x84\x99\xcf\xc6\xe6\x10\xfe\xd5\x50\x27\x1b\x9b\xc3\xb8\x98\
-\x54\x91\xdf\x58\x3d\x53\x5f\xca\x41\xa3\x5e\xad\xf6\x75\xcc\xd5\
-\x2a\x9d\x5d\x86\x35\xcf\xb7\xe8\xf4\xde\xb1\xf9\x8b\x73\x8c\x7b\
-\xe3\x12\x75\x20\x9a\xe6\xfb\xfc\xe5\x5c\x27\xf5\xbe\xbe\x39\x84\
-\x5f\x6f\xae\x91\xfe\x70\xcd\xa9\x03\x29\x3a\xf2\xdb\xfa\x26\xfc\
-\xfb\xd7\x9b\x41\x7d\x4a\xa2\x6c\x0a\xe6\x52\xbb\xf2\xef\x5f\x6f\
-\x00\x00\xc0\x6f\xeb\xb7\xea\x9a\x89\x52\xf2\xcb\xf3\x2e\x2e\xdc\
-\xbb\xf7\x27\x5c\x21\x3b\xc1\x2e\x33\x3b\x7a\xde\x44\x7b\xf5\x4d\
-\xcc\x63\x18\x8a\xd8\x54\x04\x47\x9d\x53\x11\x46\x98\x93\xd2\xd0\
-\xa9\x9d\x46\x6e\x24\x56\xff\x93\x78\xf5\x6f\x3a\xc3\x4c\x4e\xeb\
-\xf7\x23\x81\x39\x87\xaa\x5e\xf5\x4b\x01\x60\x20\x00\x16\x12\x80\
-\xc5\x14\x60\x30\x10\xb0\x30\x48\x60\x61\x30\x28\x6d\xf0\x0a\x3f\
-\xd6\x0b\x69\x61\x4a\x97\xa6\x03\x18\x90\x78\x37\xfa\xdf\x24\xad\
-\x02\xf9\x94\x2e\xa2\xe9\xa1\x26\xea\xa4\x40\x79\x7c\xd3\xee\xa3\
-\x69\x05\x8b\x72\xdb\xb0\x34\x95\x4b\xc0\xbd\xa9\x21\xa2\x55\x4f\
-\xbb\x2b\xd5\xbb\x54\x65\x5e\x07\xf0\x5b\x8d\xf8\x48\x28\x99\x1d\
-\x00\x22\xac\xaf\xdf\x2a\x48\x8e\xef\x2d\xda\xfd\x76\xee\xb9\x2e\
-\x9d\x91\xd2\x51\x4a\x63\x52\xd8\xdc\x1c\x96\x6e\xff\x24\x31\x07\
-\x44\xd8\xd8\x18\x3a\xca\x8e\xce\x6b\x88\xb2\x96\xde\x55\x16\xbb\
-\x3c\x05\x79\x55\xdf\x2d\xe1\x06\x51\xce\xd4\xa4\x6d\xff\x36\xad\
-\xc9\x47\x5d\x6f\x54\xfe\x4a\xc1\x4b\x7f\xf6\xe4\xe5\xba\xee\x23\
-\xa6\xea\x67\x0b\x5f\xfb\xe7\xbc\x2f\xcd\x1f\x5a\x3f\xf3\xfb\xb0\
-\x76\x1f\xa5\x74\xd6\x2d\xa2\x0c\x2a\x64\x45\x9d\xfa\xde\xa3\xae\
-\xe7\x81\x5f\xd3\xb3\xbe\x5f\xde\x98\x3e\x2a\x3f\x57\xff\x09\x7d\
-\x37\xe6\xe5\x2f\x82\xac\x61\xd5\x0f\x43\x75\x68\x8f\x99\xcd\x06\
-\x05\x4e\xa5\xa5\xbf\xda\x2e\x73\x39\x86\x7c\xe5\x09\xfd\x42\xef\
-\xdf\xd8\x1c\xc2\xc6\xe6\xd0\x61\xb6\xeb\xfb\xee\x61\x54\x19\x10\
-\x25\xdc\xbc\x59\x8d\xd5\x8d\x8d\xa1\xb3\x2f\xd6\x65\x88\x43\x1e\
-\xd0\x5f\xc3\xbb\xe9\x3b\x37\x5b\xbd\xd3\x27\xb7\xea\x72\x4e\x96\
-\x0b\x6d\xea\x17\xba\xe7\xab\x53\xb4\xfe\x53\xed\xe0\x97\xe5\x60\
-\x98\x58\x6f\x6c\xdc\xf2\xb7\xe9\xc6\x2d\x8f\x29\x76\x43\xf7\x46\
-\xd0\x44\xa9\x6a\x33\x9a\x47\x91\x66\xbd\x56\x7f\x8e\x75\x2e\x5d\
-\x60\x7f\x7a\xe3\x17\x6a\x66\x8c\xfb\xad\x6f\xf8\xeb\x6f\x7d\x7d\
-\x48\xf2\x47\x72\x9e\xd8\xdd\xe6\xa1\x32\xd7\xaf\x9b\xf5\x2c\x1d\
-\x75\xbf\x11\x28\xdb\xc6\xc6\x90\xd4\x75\x91\x67\x28\xbd\xd1\x36\
-\xe4\xbf\xe6\xf6\xf5\xa7\xb7\xfb\xa3\xab\xff\x60\xcb\xef\x2a\x16\
-\x5e\x6f\x95\xc1\x0d\x11\x40\x4a\x00\x29\x61\x7d\xdd\xbf\xa0\xfb\
-\xdb\xfa\xa6\xb6\x06\x52\xff\x84\x16\x80\xff\xef\x3f\xeb\xd5\x56\
-\x84\x3e\xb3\x80\x75\x15\x0b\x01\xfe\xef\x3f\x1b\x4e\x1d\xd4\xb9\
-\xc3\xe6\x70\x96\xa5\xd6\x86\xd5\xce\xc5\x7d\x8f\x39\x3b\x00\xc0\
-\xe3\x9d\x27\x3a\x3c\x89\x8a\xed\x92\x96\x5e\x7e\xd3\xa4\xd2\x4d\
-\xd3\xb4\x88\xc9\x92\x96\xfa\xec\xc2\xa0\xd0\x63\x07\x83\x04\x06\
-\x03\x01\x83\x04\x60\x90\x14\xba\x71\xd2\x33\xd1\xb0\xf5\xef\x64\
-\xe2\x5b\x18\x0d\xe5\x41\x44\x84\x4f\x04\x6a\x63\xa4\x18\x17\x68\
-\x38\x2a\xa8\xb6\xd2\x94\x5d\x20\x92\x33\x43\x64\x8b\x0d\x2b\x07\
-\x07\x80\x08\xb2\xb0\x63\x33\x6c\x09\x2b\x45\xa2\x3a\x3f\xa4\xce\
-\x0a\x55\x26\x70\x48\x88\x3c\x75\x99\x86\x80\xa6\x33\x35\x00\xc0\
-\x16\x44\xa7\xa9\xfb\xd9\x83\x2e\x22\x65\xb3\xb3\xf9\x56\x2b\x1b\
-\xa1\x14\xa2\xbf\x6c\x3b\x64\x3a\x2f\x2c\x5e\xf4\x5b\x3f\xbd\x8d\
-\xae\xbe\x97\x2a\x26\xf5\x7e\x71\x04\xdf\x2b\x8e\xb0\x2e\xe7\x6d\
-\x89\xaa\x43\x9d\xe0\x98\xef\x13\x93\x6d\x13\x1c\x33\x3b\x21\x26\
-\xd3\x5b\x9b\x6a\x5b\x4c\x4a\x4a\x7c\xca\x5d\x7c\xdc\x51\x31\x27\
-\xf3\x19\xf6\x94\x43\xa3\x86\x8a\xf1\x6f\xc5\x31\x0a\x2d\x6a\x83\
-\xb1\x3a\x7f\x62\x9e\xfb\x26\x8e\xb2\x94\xb9\x15\x39\x4f\x02\x7a\
-\x91\xbb\xf2\xd4\xeb\x35\x19\x2b\x17\xce\x69\xc0\x79\xe3\x6f\x72\
-\x2d\x55\x07\xef\x13\x7b\x1f\xe5\x13\x1a\x27\x9f\x12\xa1\xf1\x13\
-\x9b\x82\xb0\x98\x04\x46\x1a\xa4\x07\x64\x65\xaa\xa6\x08\x8f\x26\
-\x38\xf6\xaa\x83\x74\xad\x50\x10\x52\x63\x91\x97\xea\x9e\x39\xa2\
-\x7c\xd7\xfb\x99\x0d\x44\x0b\xd2\xe2\x70\x0f\x20\xc6\x13\x6f\xd8\
-\xd7\x67\x8c\xa3\x4a\xce\x35\xd1\x11\x33\x38\xaa\x3e\x01\x42\x83\
-\x6d\x6f\x06\x6c\x1d\x31\xa6\x98\xff\x70\xf1\x8c\xf3\x3b\x08\xf1\
-\x08\xda\xa6\x1b\xb1\xc1\x30\xa1\xc1\x96\x84\x46\x74\x1f\x47\xd8\
-\x69\x0c\xcd\xb2\xfc\xc3\x09\x96\xcd\x7d\x52\x5b\x74\xa9\x37\x11\
-\x4e\x21\x7a\x2c\xb7\x5e\x84\xc5\x31\x9b\x11\x23\xbe\x70\x9a\x8a\
-\x04\xf5\x34\x06\xa6\xe7\x30\x75\x4d\x9f\x11\x31\x9c\x5a\xa9\x83\
-\xfc\x00\x00\x49\x45\x72\x48\xe8\x11\x6d\x1a\x46\x89\x8c\x93\xd0\
-\x10\xaf\x61\x22\x81\x24\x15\x24\x9c\x49\xe1\xc8\xeb\x53\x24\x32\
-\x9f\x34\xa1\xa9\x11\x1b\x09\xfa\x1c\x8d\x54\xe7\x66\xca\x5d\x1b\
-\x7a\x1d\x14\x99\x81\xca\xdb\x9b\x3a\xe0\x4f\xcf\xda\x80\x36\x23\
-\x28\x09\x8b\xc4\xba\x73\x04\xea\x81\x8d\x08\x80\x2a\x6e\x8e\xb5\
-\x2b\x83\x10\x70\xc5\x8b\x81\x49\x48\xc4\x52\x9a\xf9\xd1\x9d\xe7\
-\x75\xee\x63\x30\x18\x0c\x06\x83\xd1\x69\xa2\x6f\xb1\x19\xd3\x41\
-\x59\x10\x0d\x24\xc6\xbe\x6c\x3a\xab\xa2\xe1\x4b\x04\x39\x66\x40\
-\x0f\xc2\x9b\xde\xc8\xa0\x22\x30\xca\xab\x97\x0a\x4d\xe2\x71\x77\
-\x4c\x63\x32\x52\x92\x93\x24\x47\x6b\xea\xc5\x84\x66\x86\x50\x3a\
-\x44\x2b\x77\x63\xec\x5d\x18\xdb\x89\x00\x6a\x8f\x64\x3a\x8d\xf3\
-\x57\x1e\xec\x24\xb6\xc7\xe6\xdf\x15\x99\x31\x9a\x00\xd1\x11\x04\
-\xd4\xd3\x44\x88\x1d\x87\xaa\xe0\x9e\xcf\x60\x30\x18\x0c\x06\x63\
-\xee\x89\x4e\x8f\x2a\x71\xf4\x7d\xdf\x2e\x8d\x0e\x31\x02\x94\xd4\
-\x40\xe5\x36\x59\x93\x9b\xa4\x3c\xac\x9f\x18\xe4\x26\x49\x12\x87\
-\x37\x33\x01\x22\x49\xf5\xdf\x74\x57\x46\x7c\xe2\xbb\x32\x4c\x68\
-\x7c\xc4\x46\x1f\x2e\x24\x9e\xd1\x10\xf5\xff\x03\x75\xf1\x6c\x9c\
-\x9d\x51\xbb\x32\x16\x89\xa1\x87\xfd\xca\x01\x68\x1f\xae\xa4\x64\
-\xc7\x1e\xab\x68\xec\xce\xe0\x98\x83\x9c\x19\xcc\x3f\x76\x10\x0b\
-\x2f\xd7\x9d\xb8\xa8\x6f\xec\x6d\x1e\x33\x2b\x16\x3a\x8c\x7e\x15\
-\x8d\x69\x28\x3b\x73\x22\x07\x90\xc7\x17\x83\xd1\xb7\xec\xb1\xf7\
-\x6a\xcc\xa3\x34\xd5\x6e\x8d\x20\x1e\x7e\xab\xb8\x89\x95\x49\x5a\
-\x61\x7a\x56\x05\x97\xa4\xbb\x34\xda\x35\x73\x61\x93\x56\x77\xcd\
-\x9c\x54\xce\xa7\x44\xc2\x44\x86\x09\x4d\xe4\x54\x88\x12\x8c\xf8\
-\x34\x8a\xc4\xd4\x76\x60\xa4\x34\x7c\x74\x9b\xd7\x5a\x90\x18\x83\
-\xc0\xa0\x71\x78\xb2\xc9\xd4\xec\xe8\x94\x86\xa6\xe7\x71\x06\x5b\
-\x76\xdc\x6f\x9b\xe4\x37\x4d\x83\x74\x8a\x09\xd6\x11\x83\x31\x2b\
-\x63\x62\x9e\xfa\xf1\x3f\xd9\xc3\x09\x72\x9f\x8c\xaa\x0b\x5e\x70\
-\x9c\x4e\xdf\x12\x63\xa5\x71\x93\x1a\x51\x23\x37\xd5\xee\x0c\x98\
-\x01\x33\x49\xfa\x2a\x46\x0b\x75\x16\x60\xfd\x9b\x50\x93\xb4\xa4\
-\x70\x26\xc0\x44\x86\x09\xcd\xb8\xe4\x06\x81\xc4\x07\x40\xd7\x81\
-\x7f\x69\x1d\xfe\x07\xe3\x7c\x8c\x79\xc0\xbf\x62\x2a\xe8\x3a\x23\
-\xe3\xdc\x91\xc1\xe6\x01\x3d\x76\x4b\x8a\xf9\x92\xb3\xad\xf4\x80\
-\x7f\x42\x37\xe7\x49\x8f\xf5\xcf\x4f\xb5\xce\x45\xcb\x3a\x67\x42\
-\xc3\x84\x66\x56\x64\x31\x0b\x8c\xf9\x27\x34\x22\x9c\x52\x54\x27\
-\x92\x75\xe8\x0e\x87\xb3\x00\x75\x9f\x9e\xbb\x29\xd2\x27\x35\x6f\
-\x68\xc6\x2f\xe1\x9e\xc1\x84\x66\x52\xc3\x08\xc1\xe9\xb5\xac\xfa\
-\xbb\xfa\x7f\x95\xde\x75\xd0\x5f\x57\xbd\xd3\x44\xc0\xb3\x7b\xc3\
-\x60\x30\x18\x9f\xde\x54\xc5\x8a\x34\x83\xc1\x98\x9a\x9c\x09\x3a\
-\x57\xf2\x86\xbb\xa8\xcc\xcb\xa8\xdd\xb5\xb9\x53\x03\xda\x5e\x4d\
-\xd4\x3c\xa2\x15\x7b\x2f\x4c\x60\x98\xd0\xcc\x14\xe1\xa9\xfe\x45\
-\x42\x70\xc0\x22\x30\x8e\x5d\x18\xdf\x19\x03\xec\x3a\x75\xf7\xb3\
-\x3a\x34\xb1\x78\x04\x1d\x4b\x75\x94\x9d\xf6\xd8\xb1\x05\xfd\xf7\
-\xc7\x8f\xa3\xa3\x11\xb7\xa4\x52\x16\x17\xab\xf2\x1c\x1e\x8e\x1a\
-\x2b\x7d\x91\x94\xff\x90\x94\xdf\x77\xbd\x77\x5d\x33\x00\xe3\x5b\
-\xda\xd6\xad\xe8\xb9\xe3\xf5\xf4\xb8\x38\xa2\x71\x33\x56\x39\xc5\
-\x18\xed\xe6\xea\x83\x9f\xea\x2c\xe3\xb0\x54\x0d\x2d\x5e\x35\x56\
-\x7b\xa9\x08\x45\x8f\xf9\x49\x8c\xcb\xc8\xf7\x99\xcf\x1c\x76\xeb\
-\x0f\x33\xa2\xd5\x2d\x2e\x2e\xd6\xae\xc5\xd7\x3b\xb6\x48\x26\xa6\
-\x30\xb8\xe7\x07\x71\xfd\xae\xc5\xa1\xb1\xb6\x7e\xcf\xd1\xac\xc0\
-\xc5\x63\x03\x52\x9e\x4c\x9f\x9c\x59\x58\x4c\xf5\xf5\xd1\x28\xb7\
-\xe6\x6a\x41\xe2\xd4\x54\x47\x6e\x04\x33\x16\x26\x34\x73\x5f\xe1\
-\x9e\x5e\xec\x6a\x06\x9a\xb6\xcd\xfd\xd0\x73\x4d\x79\xf6\x59\xfe\
-\x4f\xa1\x0d\x63\xbf\x5b\x34\x48\xaf\x71\xea\xaf\x6d\x79\xba\xf4\
-\x9b\x69\xd5\xd9\x24\xcb\xf0\x4f\xed\x67\xb3\x50\x67\xb3\xda\x6e\
-\xae\x71\xf7\x4f\xe8\x57\xd3\xae\xef\x71\x65\xde\x3c\xd7\x39\xcf\
-\x79\xf3\xdf\xcf\x27\x9d\x0f\xcf\x5b\xb3\x01\x3e\x5b\x34\xc5\x81\
-\x19\x52\x6a\x9b\x14\x5e\x71\xc4\x74\x7e\xdc\xf2\x33\x60\xa6\xdb\
-\x97\x31\x7b\xf0\x4d\x98\xdc\x6f\xc6\x1b\x53\x4d\xb2\x8c\xc1\x08\
-\x8d\x49\xdb\xc9\x0f\x83\xc1\x98\x0d\x0c\xb8\x0a\xa6\x3f\xb1\x36\
-\xed\xb6\x70\xf9\x3f\x4d\x45\x55\x08\x71\xa4\x13\xe5\x2c\x4c\xd2\
-\xac\x28\xcc\x67\xdd\xcd\x6a\xbb\x85\x76\xa8\x19\x3c\x2e\x19\x0c\
-\x1e\x07\x4c\x68\x18\x3d\x92\x81\xd8\x81\x72\x14\x0a\xef\xb8\xe5\
-\x8f\x35\xf9\x70\x6d\xd9\xc6\x6c\xe3\xf6\x91\xbf\xeb\x7d\x47\x29\
-\xc4\xfa\x30\x19\x9c\x84\x89\xc8\x34\xcc\x77\xfa\x2a\xc3\x24\xfb\
-\x5d\x57\xb3\xd1\x71\xeb\xac\xcd\xf8\x9f\xf6\xb8\xe8\xab\xce\xba\
-\xca\x81\x49\x8f\xdb\x3e\xca\xdf\xd5\x1c\xb4\xcd\xf7\x77\x95\x1d\
-\x4d\xfd\xa5\xab\xf9\xf3\x51\xd7\xf3\x38\xf5\xe9\x2a\x4b\xd3\x3b\
-\x26\xd1\x37\x62\xbf\x21\x76\xae\x9e\x64\x1d\x8f\xd3\x07\xc6\x31\
-\x9d\x6e\xd3\xaf\x63\xea\x6e\xdc\xf9\xb7\xeb\x7c\xc1\x18\x0f\x6c\
-\x72\x36\x67\xec\xfe\x28\x57\x18\xdb\x96\x7f\x1c\x93\x0f\xfb\x7e\
-\x93\x60\x1a\x37\xff\xa6\xb4\xf3\xb4\xb2\xeb\xaa\xbb\x71\xcb\x3f\
-\x0b\x26\x4f\xb1\x65\x98\x64\xbf\x6b\x63\x76\xd9\x87\xc9\x53\x17\
-\xd2\x3a\xe9\x71\xd7\xb6\xed\xfb\x34\xb5\x3d\x8a\x71\x38\x2d\x53\
-\xe1\xa3\xfa\xd6\x71\xc7\x76\x5f\xe5\xee\xbb\x9e\xa7\x51\x9f\x47\
-\x61\x46\x1e\x2b\xdf\xdb\xcc\x99\x7d\xd5\x71\xd7\x39\xa7\x6d\x5b\
-\x4d\xcb\x9c\x74\xdc\xfc\xd8\x4c\x7f\xba\xe0\x1d\x9a\x19\x52\x3c\
-\x43\x0a\x0c\x22\xce\xdc\x00\x08\x95\xbf\xad\xb2\x65\xe7\xeb\xca\
-\xc7\x77\x7d\x9c\xfc\x9b\xea\x7e\xde\x84\x8e\xfd\x6d\x7d\x94\x3f\
-\xb4\xf2\x77\x54\x4a\x57\xc8\x6c\x6f\x92\xfd\x2e\xd4\x5f\xfa\x2a\
-\x47\x5f\xf5\xd4\xd7\xb8\x88\xf9\xde\x71\xca\xe3\x7b\x6f\xdb\xf6\
-\x68\xa3\x34\x8c\xbb\x6b\xd9\xb6\xfc\x93\x6c\xb7\xa3\x1c\xdb\x7d\
-\x95\xbb\xef\x7a\xee\xa3\x5c\x6d\xe6\x9a\x49\xf6\x8d\x98\x31\xe1\
-\x2b\xef\xac\xd7\x71\xd7\x85\x99\xd8\xf4\xb1\xbb\x72\xd3\x98\xfb\
-\xd9\xfc\x95\x09\x0d\xa3\x83\xe2\x31\x0f\xc4\x2d\xf6\x3b\x62\x88\
-\xdc\x38\xf9\x1f\x85\x80\x99\xe7\x2d\x68\xbb\x8c\x47\x51\xe6\xd8\
-\x32\x4c\xba\xdf\xc5\xb6\xdf\xb8\xfd\x93\x96\x45\x3d\xd3\x56\xd9\
-\x9c\x84\xfc\x18\x27\x8f\xb6\xf5\xdb\xf7\x82\xce\xb8\x75\x30\xad\
-\x05\xa6\x69\x2e\x64\xf5\x39\xb6\xfb\x2a\x77\xdf\xdf\x3f\x8d\xfa\
-\x9c\xc5\xc5\xc7\x49\x97\x77\x12\xb2\xe6\x9f\x38\xf7\xcf\xdb\x7c\
-\xcf\x84\x86\xd1\xba\x43\xb7\x31\x3f\x99\x25\x41\xd9\xb6\xfc\xb3\
-\x32\xd0\x67\x71\x27\xa6\xaf\x6f\x66\x21\x39\xd9\xba\xb3\xc9\xc5\
-\x2c\xd4\xfd\x24\xfb\xce\x51\x7e\xef\x24\x48\xd7\x34\xc7\x39\x8f\
-\x45\xae\xe7\xbe\xcb\x3c\xce\x19\x5c\xee\xcb\xd3\x27\x33\xb3\x38\
-\x5f\x30\xa1\x61\xf4\x36\x70\xfa\xea\xc4\x47\x65\x4b\xde\xa5\xfc\
-\xf3\x26\x6c\x27\x6d\xf2\x31\xc9\xfa\x98\xb7\xdd\xbb\x79\x9c\x84\
-\x7d\x4a\x72\x1b\x53\xc6\x79\x26\x3a\x4d\xdf\xcb\x60\x30\x58\xd6\
-\xce\xe3\x7b\x27\x31\xf7\xb3\xfc\x9c\x1e\xd8\x29\xc0\x94\x07\xdc\
-\xb8\x83\x64\x12\x1e\x64\x26\x5d\xfe\xb6\x87\x13\x67\x2d\xff\xa3\
-\x26\xc1\xb3\xf4\x4d\xb3\x78\x48\xbb\xcd\xa1\xe6\x49\x99\x56\x4c\
-\xba\x7f\x76\x09\xe2\xd6\xc7\x7b\x27\xd5\xbe\xd3\x3e\x1b\x32\x6f\
-\xf9\xf7\xf1\x9e\xb6\xb2\xa3\xcf\xb1\xdd\x74\x18\x3a\xf6\xb0\x75\
-\xdf\xf5\x3c\x8d\x76\x9b\xc7\x73\x97\xb3\x38\x07\x77\xed\x1f\xb3\
-\x54\xff\x5d\x9c\x0f\xf1\xd9\x9a\xee\xe0\x1d\x9a\x29\x91\x9a\x69\
-\x2a\xa6\xa1\x6d\xce\x2e\xc4\xa8\x4b\xf9\x27\xfd\xcd\x93\xcc\x7f\
-\x16\xcc\xcf\x5c\xdf\x16\x63\x72\x38\x09\xb3\xc4\xbe\xeb\xba\x8b\
-\x9b\xcf\xd8\x32\x4c\x63\xac\xcd\x42\xff\x9f\xe6\x7b\xc7\xc9\xa3\
-\x6f\x59\x34\xed\x71\x3c\xad\xf2\xfb\xde\x33\xee\x59\xa3\x26\xd9\
-\x31\x6e\x7f\x99\x44\xb9\xfb\x9e\xb3\xc6\x29\xd7\xac\xf6\xed\x79\
-\xd5\x0b\xfa\x68\xab\x71\xdf\x1b\x72\x95\x7d\x54\xf3\x05\xa3\x1f\
-\xf0\x0e\xcd\x14\x85\x49\x93\x07\xa1\x58\x61\x12\x6b\xeb\x3f\xce\
-\xf3\x7d\x94\xbf\xef\x32\x4c\xf2\x1b\x67\xc9\x54\xc8\xf5\xee\x71\
-\xe2\x6f\xf4\x11\xd9\xfa\xa8\x6c\xb7\xbb\x94\x61\x92\xfd\xae\x4d\
-\xde\x93\xee\xff\x47\x35\x2e\xda\xe6\x75\x14\xf5\xd0\x97\xac\x9d\
-\x66\xf9\xfb\x3a\x94\xdf\x36\x9f\x71\xc7\xf6\xa4\xca\xdd\xc7\x9c\
-\x35\xe9\xbe\x76\x54\x63\x7c\x56\xca\xdb\x57\x7e\x7d\xf5\xd9\x2e\
-\x73\xf9\x24\xe7\xfe\x79\xeb\x1f\xf3\x0e\x81\x5c\xab\x0c\x06\x83\
-\xc1\x60\xcc\xde\x04\xcd\x07\x89\xb9\x3e\x19\x0c\x46\x14\x78\x87\
-\x86\xc1\x60\x30\x18\x8c\x19\x53\xb6\x6d\xb0\xf2\xcd\xf5\xc9\x60\
-\x30\xfc\xe0\x33\x34\x0c\x06\x83\xc1\x60\xcc\xb0\x12\xce\xca\x37\
-\xd7\x27\x83\xc1\x08\x83\x77\x68\x18\x0c\x06\x83\xc1\x38\x62\xcc\
-\xc2\x39\x35\xae\x4f\x06\x83\x31\xaf\xe0\x33\x34\x0c\x06\x83\xc1\
-\x60\x30\x18\x0c\x06\x63\x6e\xc1\x3b\x34\x0c\x06\x83\xc1\x60\x30\
-\x18\x0c\x06\x83\x09\x0d\x83\xc1\x60\x30\x18\x0c\x06\x83\xc1\x60\
-\x30\xa1\x61\x30\x18\x0c\x06\x83\xc1\x60\x30\x18\x0c\x26\x34\x0c\
-\x06\x83\xc1\x60\x30\x18\x0c\x06\x83\x09\x0d\x83\xc1\x60\x30\x18\
-\x0c\x06\x83\xc1\x60\x30\xa1\x61\x30\x18\x0c\x06\x83\xc1\x60\x30\
-\x18\x0c\x26\x34\x0c\x06\x83\xc1\x60\x30\x18\x0c\x06\x83\xc1\x84\
-\x86\xc1\x60\x30\x18\x0c\x06\x83\xc1\x60\x30\xa1\x61\x30\x18\x0c\
-\x06\x83\xc1\x60\x30\x18\x0c\x26\x34\x0c\x06\x83\xc1\x60\x30\x18\
-\x0c\x06\x83\xc1\x84\x86\xc1\x60\x30\x18\x0c\x06\x83\xc1\x60\x30\
-\xa1\x61\x30\x18\x0c\x06\x83\xc1\x60\x30\x18\x0c\x26\x34\x0c\x06\
-\x83\xc1\x60\x30\x18\x0c\x06\x83\x31\x01\xfc\x3f\x29\x20\xf7\x9c\
-\x7a\x90\xa7\xcd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x02\x41\xa1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x03\x81\x00\x00\x01\xdb\x08\x06\x00\x00\x00\x75\x20\x9f\x74\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x07\x1e\x0c\x09\x32\x85\xb1\xff\x38\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x20\x00\x49\x44\x41\x54\x78\xda\xec\xdd\x77\
-\x74\x15\xc5\xdb\xc0\xf1\xef\xde\x9a\x9b\x5e\x08\x84\x84\x10\x7a\
-\x2f\xd2\x05\x45\x8a\x0d\x04\x41\x41\x14\x51\x01\x01\x41\x50\x01\
-\x51\x14\x15\x7b\x41\xe5\x87\x20\x62\x41\x10\x11\x14\x1b\x22\x28\
-\xa2\x34\x45\x01\xe9\xbd\x87\x22\x29\x40\x28\xe9\xc9\xcd\xad\xbb\
-\xef\x1f\xc9\xbd\x24\x14\x4d\xf3\xe5\x06\x9f\xcf\x39\x39\x87\x84\
-\xdc\xcd\xce\xcc\xee\xec\x3c\x33\xb3\x33\x8a\xa6\x69\x1a\x42\x08\
-\x21\x84\x10\x42\x08\x21\xfe\x13\x74\x92\x05\x42\x08\x21\x84\x10\
-\x42\x08\x21\x41\xa0\x10\x42\x08\x21\x84\x10\x42\x08\x09\x02\x85\
-\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\x84\x10\x42\x08\x21\x84\
-\x10\x42\x82\x40\x21\x84\x10\x42\x08\x21\x84\x10\x12\x04\x0a\x21\
-\x84\x10\x42\x08\x21\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\
-\x84\x04\x81\x42\x08\x21\x84\x10\x42\x08\x21\x24\x08\x14\x42\x08\
-\x21\x84\x10\x42\x08\x21\x41\xa0\x10\x42\x08\x21\x84\x10\x42\x08\
-\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\x84\x10\x42\
-\x08\x21\x84\x10\x12\x04\x0a\x21\x84\x10\x42\x08\x21\x84\x90\x20\
-\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\x21\x84\x10\
-\x42\x08\x21\x24\x08\x14\x42\x08\x21\x84\x10\x42\x08\x21\x41\xa0\
-\x10\x42\x08\x21\x84\x10\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\
-\x10\x42\x48\x10\x28\x84\x10\x42\x08\x21\x84\x10\x42\x82\x40\x21\
-\x84\x10\x42\x08\x21\x84\x10\x12\x04\x0a\x21\x84\x10\x42\x08\x21\
-\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\
-\x21\x84\x10\x42\x08\x21\x41\xa0\x10\x42\x08\x21\x84\x10\x42\x08\
-\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\x84\x10\x42\
-\x08\x21\x84\x10\x42\x82\x40\x21\x84\x10\x42\x08\x21\x84\x10\x12\
-\x04\x0a\x21\x84\x10\x42\x08\x21\x84\x90\x20\x50\x08\x21\x84\x10\
-\x42\x08\x21\x84\x04\x81\x42\x08\x21\x84\x10\x42\x08\x21\x24\x08\
-\x14\x42\x08\x21\x84\x10\x42\x08\x21\x41\xa0\x10\x42\x08\x21\x84\
-\x10\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\
-\x84\x10\x42\x08\x21\x84\x10\x12\x04\x0a\x21\x84\x10\x42\x08\x21\
-\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\
-\x21\x84\x10\x42\x08\x21\x24\x08\x14\x42\x08\x21\x84\x10\x42\x08\
-\x21\x41\xa0\x10\x42\x08\x21\x84\x10\x42\x08\x09\x02\x85\x10\x42\
-\x08\x21\x84\x10\x42\x48\x10\x28\x84\x10\x42\x08\x21\x84\x10\x42\
-\x82\x40\x21\x84\x10\x42\x08\x21\x84\x10\x12\x04\x0a\x21\x84\x10\
-\x42\x08\x21\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\
-\x81\x42\x08\x21\x84\x10\x42\x08\x21\x41\xa0\x10\x42\x08\x21\x84\
-\x10\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\
-\x84\x10\x42\x08\x21\x84\x10\x42\x82\x40\x21\x84\x10\x42\x08\x21\
-\x84\x10\x12\x04\x0a\x21\x84\x10\x42\x08\x21\x84\x90\x20\x50\x08\
-\x21\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\x21\x84\x10\x42\x08\
-\x21\x24\x08\x14\x42\x08\x21\x84\x10\x42\x08\x21\x41\xa0\x10\x42\
-\x08\x21\x84\x10\x42\x88\x12\x32\x48\x16\x5c\x79\xc9\xc9\xc9\xa4\
-\xa6\xa6\xa2\xd3\xe5\xc7\xe4\xaa\xaa\x52\xa9\x52\x25\xa2\xa3\xa3\
-\x51\x14\x45\x32\xa8\x02\x49\x48\x48\x20\x2b\x2b\xcb\xfb\xbd\xaa\
-\xaa\x44\x44\x44\x50\xad\x5a\x35\xc9\x9c\xcb\xd0\x34\x8d\x84\x84\
-\x04\xb2\xb3\xb3\x4b\xf4\x39\xa7\xd3\x49\xe3\xc6\x8d\x31\x9b\xcd\
-\x3e\x9d\xbe\x03\x07\x0e\xe0\x74\x3a\x4b\x74\x2f\x2b\x8a\x42\x8d\
-\x1a\x35\x08\x0c\x0c\xf4\xd9\x74\xd9\x6c\x36\x12\x13\x13\xb1\xd9\
-\x6c\xc5\x4e\x9b\xa6\x69\x18\x0c\x06\xea\xd4\xa9\x83\xc9\x64\xf2\
-\xd9\xb4\xb9\xdd\x6e\x76\xef\xde\x8d\xc1\x50\xb2\x47\xa4\xc9\x64\
-\xa2\x5e\xbd\x7a\x3e\x5d\x6f\x67\x65\x65\x71\xfc\xf8\x71\xef\x75\
-\x56\xdc\x72\x0b\x0b\x0b\x23\x3a\x3a\x1a\xbd\x5e\xef\xb3\x69\x4b\
-\x4b\x4b\x23\x29\x29\xc9\xfb\x2c\x2d\x0e\x55\x55\xa9\x52\xa5\x0a\
-\x51\x51\x51\x3e\x5d\x8f\xa4\xa5\xa5\x91\x90\x90\x50\xa2\x6b\x52\
-\xa7\xd3\x11\x15\x15\x45\x44\x44\x44\x85\x7a\x6e\x16\x87\xcb\xe5\
-\xa2\x71\xe3\xc6\x3e\x5d\x8f\xf8\x1a\xa7\xd3\x49\x7c\x7c\x3c\x6e\
-\xb7\xdb\x7b\xef\x2b\x8a\x42\x4c\x4c\x0c\x61\x61\x61\x92\x41\xff\
-\x41\x8a\xa6\x69\x9a\x64\xc3\x95\x35\x63\xc6\x0c\xa6\x4c\x99\xe2\
-\x6d\xcc\x5a\xad\x56\xc6\x8f\x1f\xcf\xa8\x51\xa3\x7c\xfa\x81\x2b\
-\x2e\xf6\xdc\x73\xcf\xf1\xfd\xf7\xdf\xa3\xaa\x2a\x9a\xa6\xa1\xaa\
-\x2a\x43\x87\x0e\x65\xc2\x84\x09\x92\x39\x97\x71\xe6\xcc\x19\x46\
-\x8d\x1a\xc5\x9e\x3d\x7b\x2e\x6a\x94\x6a\xaa\x83\xac\xcc\x1c\x9c\
-\x6e\x08\x0c\x0f\xc7\xaf\x50\xdb\x2e\x3b\x3b\x9b\x0f\x3f\xfc\x90\
-\x5e\xbd\x7a\xf9\x6c\xda\x72\x73\x73\x69\xdf\xbe\x3d\x36\x9b\xed\
-\x7c\xc3\x54\x53\xb1\xe7\x59\xc9\x73\x38\x51\xdd\x1a\x8a\xde\x80\
-\x9f\xc5\x82\x9f\xc9\x88\x27\xf9\x26\x93\x89\x71\xe3\xc6\x31\x78\
-\xf0\x60\x9f\x4d\xdb\x9a\x35\x6b\x98\x30\x61\x02\x69\x69\x69\xde\
-\xb4\x69\xaa\x3b\x3f\x6d\x76\x27\x1a\xa0\x37\x98\xb0\x04\xf8\x63\
-\xd2\x9f\xef\xe0\xd2\xe9\x74\x2c\x5e\xbc\x98\x06\x0d\x1a\xf8\x6c\
-\xda\xd6\xae\x5d\xcb\xa0\x41\x83\x2e\xd9\xc0\xd4\x5c\x76\xb2\x72\
-\xac\xa8\x28\x98\xcc\x16\xfc\x2d\x66\x94\x82\x40\x29\x24\x24\x84\
-\x6f\xbf\xfd\x96\xb8\xb8\x38\x9f\x4d\xdb\xd2\xa5\x4b\x79\xf8\xe1\
-\x87\x09\x08\x08\x28\xb8\xdf\xdc\xe4\x66\x66\xe3\xd0\xe0\xfc\xdd\
-\xa7\xa1\x61\x24\x38\x34\x10\x7d\x41\xe3\xf1\x86\x1b\x6e\xe0\xcd\
-\x37\xdf\xa4\x4a\x95\x2a\x3e\x9b\xb6\x89\x13\x27\xf2\xed\xb7\xdf\
-\x16\xad\x47\x0a\xee\x37\xab\xcd\x81\xaa\x81\xde\x68\xc4\x62\xf1\
-\xc7\x6c\xd4\x7b\x83\x89\x6e\xdd\xba\x31\x63\xc6\x0c\x9f\x4d\x97\
-\xc3\xe1\x60\xfa\xf4\xe9\xbc\xfb\xee\xbb\x04\x04\x04\xe0\x76\xd8\
-\xc8\xb1\xda\xd0\x2e\x19\xb0\x83\xc5\x3f\x10\x3f\xb3\x01\x4d\xd3\
-\x78\xe8\xa1\x87\x78\xf2\xc9\x27\x7d\xfa\x19\xd0\xab\x57\x2f\x0e\
-\x1d\x3a\xe4\x2d\x37\x4d\x53\x71\xd8\xf2\xc8\xb3\xd9\x51\x35\x05\
-\x83\xc9\x4c\x80\xbf\x05\xbd\xee\x7c\xb9\xe6\xe4\xe4\xf0\xd5\x57\
-\x5f\x71\xfd\xf5\xd7\xcb\x43\xb4\x98\xec\x76\x3b\x3d\x7a\xf4\x20\
-\x29\x29\x09\x45\x51\x50\x55\x95\xca\x95\x2b\xf3\xd6\x5b\x6f\x71\
-\xdd\x75\xd7\x49\x06\xfd\x07\xc9\x48\xa0\x0f\x88\x8b\x8b\xf3\xf6\
-\xcc\x7a\xc4\xc6\xc6\x96\xa8\x37\x53\xf8\x86\xfa\xf5\xeb\x93\x90\
-\x90\x80\xd5\x6a\x05\x20\x20\x20\x40\x7a\xd8\xfe\x81\xd5\x6a\xe5\
-\xd8\xb1\x63\xc4\xc7\xc7\x5f\xfc\x9f\xc1\x9d\xf8\xf6\x87\x69\x5c\
-\x5b\x4f\xc7\xf8\x66\xcd\xf9\xea\x5c\xd1\xff\xfe\xeb\xaf\xbf\x7c\
-\x3e\x6d\x87\x0e\x1d\xc2\xe1\x70\x14\xfa\xa9\x99\x6e\x23\x9e\x65\
-\x64\x9f\xce\xd4\x8e\xad\xc4\xd9\xf8\x4d\xcc\x9c\xfa\x16\x5f\xfd\
-\x7e\xc8\xfb\x1b\x46\xa3\xf1\xa2\x3a\xc1\xd7\x9c\x3d\x7b\x96\xbd\
-\x7b\xf7\x92\x9b\x9b\x7b\xfe\x87\xfa\x30\xee\x7c\x6c\x22\x63\x1f\
-\xb8\x89\x08\xbd\x93\xc3\xdb\x7e\xe1\xd5\x67\x5e\x62\xfb\x19\x57\
-\x91\xcf\x66\x66\x66\xfa\x74\xda\x12\x13\x13\x2f\x7b\x6d\x29\xb1\
-\x9d\x59\xf0\xe9\xf3\x54\x33\xe6\xb0\xfc\xcb\x8f\x78\x73\xce\xcf\
-\x78\x52\x17\x1a\x1a\xea\xf3\x69\x3b\x77\xee\x1c\x27\x4e\x9c\x28\
-\xf4\x93\x2a\x3c\xf5\xc5\x6c\x7a\x56\x31\x93\xe7\xce\x0f\x2b\x34\
-\xc5\x8f\x40\xf7\x9f\xdc\xd7\xfd\x19\x8e\x14\xfc\x56\x74\x74\x34\
-\x76\xbb\xdd\xa7\xd3\xb6\x7f\xff\xfe\x4b\xd4\x23\x06\xba\x8d\x78\
-\x91\xa7\x86\xdc\x49\x6c\xb0\x93\x83\x9b\x57\xf1\xee\xdb\x6f\xb1\
-\x6a\xdf\xf9\xca\xe4\xf0\xe1\xc3\x3e\x9d\x2e\x97\xcb\xc5\xd1\xa3\
-\x47\x49\x4e\x4e\x06\xa0\xc6\xf5\x0f\x30\xfd\xe9\xfb\x08\x31\x5d\
-\x38\x92\xab\x60\x36\xb8\xf9\x78\xca\x93\x2c\x58\xb6\x0f\xc0\xfb\
-\x19\x5f\xa5\x69\x1a\xf1\xf1\xf1\x45\xcb\x4d\x09\xe0\x96\x81\x63\
-\x78\x74\x48\x5f\xe2\x2c\xb9\x6c\x59\x3e\x9f\x67\x5f\x9c\xc5\x19\
-\xb5\xe8\x67\x4f\x9d\x3a\x25\x0f\xd0\x12\x30\x9b\xcd\x98\xcd\xe6\
-\x22\x79\x1d\x19\x19\x49\xcd\x9a\x35\x25\x73\x24\x08\x14\x57\xca\
-\x75\xd7\x5d\x87\xd9\x6c\xf6\x3e\x60\x2d\x16\x0b\x0d\x1b\x36\x94\
-\xa9\xa0\x15\x50\xaf\x5e\xbd\x78\xea\xa9\xa7\xbc\x41\x60\x78\x78\
-\xb8\x4f\x8f\x78\xf8\x8a\x4b\x76\x78\x18\xc2\x18\xf4\xc2\x53\xdc\
-\xd8\xfe\x1a\xc2\x4c\x69\x04\x54\xc0\xda\x4a\xd3\xb4\x0b\xd2\x16\
-\xcc\xf8\xf9\x2b\x78\xfd\xde\xb6\x18\xf5\x05\xf7\x77\xc3\x46\x74\
-\xee\x7d\x27\xd7\x0e\xef\xcb\x33\x73\x7e\x25\xcf\x4d\x85\xb9\xf7\
-\x0b\xa7\xcd\x1c\x52\x9d\xc9\x8b\x37\xf3\x58\xe7\xf3\x23\x45\x8d\
-\x9b\xb7\xa2\xf7\xc0\xfe\x0c\x6e\xde\x8c\x79\xfb\xad\x15\xff\x42\
-\x35\xd5\xe2\x93\x85\xdf\xd0\xbf\x6d\x24\x90\x4d\xe2\x8e\x65\x18\
-\xc1\x1b\x04\x56\x84\x8e\xbb\x8b\xae\xad\x88\x26\x0c\xec\xd3\x93\
-\xc6\x7e\x17\x5d\xbd\x84\x01\x09\x97\xfb\x9c\xaf\xa7\x4d\x31\x40\
-\x68\x2b\x26\x7e\xf4\x3e\xcf\xdd\xdd\x0a\x4f\xf2\xea\x34\xb8\x86\
-\xee\x3d\x7b\xf1\xf2\xc8\xfb\x79\xf3\x9b\x2d\x38\xa1\xc2\x3d\x6b\
-\x43\x62\x1b\xd3\xe3\x96\x9b\xf0\x37\x5d\x7a\xa6\xd0\x9a\x45\x6f\
-\x5e\xbe\xbc\x7d\xbc\x1e\xf1\xab\x54\x87\x17\xe7\x2c\x65\xc2\xed\
-\xf5\xbd\x3f\x6b\xd6\xe6\x7a\xfa\x0e\xea\xcb\xdd\xed\xba\xb1\xf2\
-\x54\xd1\xfa\x55\x94\x4c\x9b\x36\x6d\x58\xb1\x62\x05\x2e\x57\x7e\
-\xad\x55\xb3\x66\x4d\xa2\xa3\xa3\x25\x63\xfe\xab\x6d\x2f\xc9\x82\
-\x2b\x2f\x3c\x3c\x9c\x7a\xf5\xea\x79\xbf\xef\xd0\xa1\x83\x8c\x1e\
-\x55\x50\xa1\xa1\xa1\x44\x46\x46\x7a\xbf\x8f\x8a\x8a\xa2\x56\xad\
-\x5a\x92\x31\x25\xa1\xf7\xa7\xd3\x03\xef\x70\xe8\x74\x02\x9f\x8e\
-\xbb\x8d\x30\x53\x7e\x83\xf4\x6a\x10\x78\xdd\x30\x1e\xbe\xf5\x1a\
-\x8c\x7a\x85\x03\x3f\xbc\x46\xdf\x01\x8f\xb1\xe6\xb8\x0d\x08\x65\
-\xcc\x23\x77\x10\x1e\x62\xa9\xb0\x69\xab\xda\xfc\x21\x86\x76\xae\
-\x82\x23\xfd\x2f\xe6\xbe\x36\x8a\x01\xcf\xce\x25\xcd\xea\x44\x31\
-\xd4\xe6\x85\xc7\x6e\xba\x0a\x4a\x2f\x8c\x89\xdf\xaf\xe4\xc1\x56\
-\xa1\x38\x3d\x97\xa3\xaa\x55\xf8\x2b\xd3\xbf\x5e\x1d\xaa\x9b\xc0\
-\x91\x7d\x9a\xd5\x8b\x17\x30\x6b\xd6\x2c\x66\x7f\xfa\x39\x0b\x66\
-\xfd\xc0\xd9\x0a\x9c\x2e\x4b\x44\x0d\x46\x4e\x7f\x9f\xd1\x77\xb7\
-\xc2\x8f\x1c\x66\x0c\xe9\x44\x74\x9d\xd6\x4c\x5b\xb4\x99\x63\xa7\
-\x73\x89\xae\xdf\x94\xf0\xa0\x8a\xd9\x04\x4a\x3d\xbc\x89\xd9\x73\
-\xe7\x32\x67\xce\x1c\xe6\xcc\x99\xc3\xac\xd9\x73\xf8\x65\xfd\x6e\
-\xac\x2e\x40\xcb\xe2\x5c\xe2\x89\x8a\x5a\xf9\x53\xad\x71\x77\x86\
-\xdf\x5e\x1f\x38\xc7\xe4\x11\x37\xd3\xa6\xcf\x9b\xa4\x6a\x0a\xa1\
-\xd1\x1d\x79\x6c\xfc\x9d\xf2\x7c\x2c\xa3\x96\x2d\x5b\x7a\xdf\x2b\
-\xf5\xf7\xf7\xa7\x75\xeb\xd6\x92\x29\xff\x61\x32\x12\xe8\x23\xee\
-\xbd\xf7\x5e\xf6\xec\xd9\x03\x40\x97\x2e\x5d\x08\x0f\x0f\x97\x4c\
-\xa9\xa0\xfa\xf7\xef\xcf\xc4\x89\x13\x01\x88\x89\x89\x21\x36\x36\
-\x56\x32\xa5\x04\x14\x9d\x9e\xd0\x88\x6a\x44\x05\xe8\xc8\xb5\x39\
-\x08\xb0\x98\xb8\x5a\xc6\xc4\x6b\xd5\xae\xcc\xd9\xb3\x67\x31\x39\
-\x4f\xf2\x44\xdf\xe7\xf9\x59\x1f\x4b\x6c\xcf\x47\xe9\x5c\xa3\x3e\
-\x04\x87\xa0\x54\xe0\x29\xe0\x19\x29\x6b\x78\x6c\x44\x02\xd9\x49\
-\xf1\x6c\xdb\xb6\x85\xcc\xba\x16\x32\xec\x2e\xc2\x0c\x79\xec\x3b\
-\x9a\x52\xc1\x2f\xca\x20\x06\xbe\xf7\x1d\xaf\xde\x16\xcb\xc2\x19\
-\xb3\x88\xbb\x6f\x18\x6d\xc2\x14\xb8\x0a\xae\xcc\xba\x75\xea\xe1\
-\xaf\x83\xd4\x93\xc7\x58\xfc\xf5\xe7\x1c\xc9\xd0\xb0\x65\x9f\xe3\
-\xe8\xa1\x83\x9c\xa8\xc0\xe9\x0a\xab\x5a\x8b\xbe\xed\x1a\x11\x09\
-\x70\xf8\x0f\x16\x27\x1a\xb8\xa6\x5e\x25\x16\xbe\xfd\x30\xd3\x8e\
-\x1f\x23\xe1\x74\x66\x85\x4d\x5b\xf2\xd6\xef\x19\xb3\xf5\xfb\xf3\
-\x3f\xa8\xd4\x8a\x8f\xbe\x59\x80\xbf\xc1\xc1\xb7\xcf\xf7\x63\xc6\
-\x8f\x47\x2a\x68\xca\x34\xec\xd6\x54\x4e\xa4\xbb\x09\x37\x67\x93\
-\xe6\x50\x50\xd3\x92\x49\x73\x43\x70\xce\x19\xfe\x3a\x2a\xd3\x3f\
-\xcb\xaa\x45\x8b\x16\x84\x84\x84\x60\xb3\xd9\x08\x0f\x0f\xe7\xc6\
-\x1b\x6f\x94\x4c\xf9\x0f\x93\x91\x40\x1f\xd1\xb3\x67\x4f\xef\xbf\
-\x9b\x34\x69\x52\xe2\x55\xe9\x84\xef\xe8\xd3\xa7\x0f\x90\xff\x5e\
-\x57\xa3\x46\x8d\x24\x43\x4a\xda\x0c\x70\xe5\xb1\xf9\xa7\xff\xd1\
-\xef\x8e\x61\xcc\x5f\xbb\x17\xfb\x55\x94\xb6\xbf\x56\x7e\xcc\xc8\
-\x41\xfd\xe8\xdb\xeb\x6e\x7e\x76\x57\xe5\x81\x27\x9f\xe3\x89\xbe\
-\xf5\x01\x17\x3f\xcc\x5b\x46\x66\x76\x5e\xc5\x0d\x02\xe3\x57\x33\
-\xe7\xe3\xd9\x7c\xfb\xf3\x1f\x34\xbe\xf7\x35\xf6\xae\x99\x42\xad\
-\x30\x0b\x6a\xee\x31\xe6\x7d\xb3\xa5\xe2\x16\x9a\x3e\x88\x6e\x8f\
-\xbc\xca\xb4\x87\xdb\xb1\xe6\xfd\xc7\x18\x3c\x76\x2a\x56\xc5\x08\
-\x68\xe4\xe5\x64\x61\xab\xd8\xd1\x2d\x2d\xdb\x75\x44\x0f\x54\xae\
-\xdf\x9e\xff\x7d\xf2\x1d\x3f\xff\xfc\x33\xbf\xad\xdb\xc2\xda\x5f\
-\xbe\x66\x40\xd3\xa0\x0a\x9b\x2e\xff\x90\x20\xc2\x42\xf3\x47\xd6\
-\xf3\x22\xda\xf0\xcd\xcf\x2b\x59\xb6\xec\x17\xd6\x6d\xdc\xce\x8e\
-\xf5\xcb\x78\xbc\x6f\x7b\x2c\x15\x7d\xdd\x35\x45\x21\xb0\x4e\x77\
-\x9e\x98\x3a\x8b\x11\x5d\xea\x71\xe0\xab\x89\x0c\x7f\x63\x45\x05\
-\xee\x9c\x50\x39\x75\xe0\x57\xe6\xfe\xb4\x1d\xfc\x6b\xf2\xc6\x07\
-\xdf\xb0\x76\xcd\x0c\xea\x1a\x20\x2d\x61\x2b\xdf\x2d\xd8\x28\x0f\
-\xc8\x32\x8a\x8d\x8d\xf5\xae\x16\x5b\xb9\x72\x65\x1a\x37\x6e\x2c\
-\x99\x22\x41\xa0\xb8\xd2\xa2\xa2\xa2\xf0\xf7\xf7\xa7\x7e\xfd\xfa\
-\xf2\x92\x6e\x05\x57\xb3\x66\x4d\x22\x22\x22\xf0\xf7\xf7\xa7\x7b\
-\xf7\xee\x92\x21\x25\x8f\x02\x39\x75\x78\x33\x2b\x7e\x59\xc8\xce\
-\xe3\xa7\x71\x5d\x45\x49\xcb\x3e\x75\x8c\x1d\x5b\x37\xb2\x25\xad\
-\x21\x1f\x2d\x5d\xc8\x87\xaf\x8d\x20\xd6\x98\xce\x57\x93\x1e\xe1\
-\x91\xa9\x4b\xc8\xb6\xab\x57\x45\x3a\x8f\x6e\xff\x8d\xf9\x4b\x36\
-\x61\x73\xa8\xe8\x43\xea\xf1\xe8\x73\x0f\x54\xd8\x87\x4d\x48\xfd\
-\xf6\x0c\x1d\xf1\x30\x61\x7a\x15\x57\x68\x73\xde\x9a\xfe\x3a\xf5\
-\xfd\x15\xc0\x4c\xe7\x7b\xc6\xf0\xe2\xfd\xd7\x13\xe6\x57\x71\xcb\
-\x6a\xeb\x77\xef\x30\x66\xcc\x58\x1e\x1f\x3d\x8a\x7b\xee\xb8\x95\
-\x1e\x8f\xbd\x4f\x72\xba\x83\xb8\x56\xb7\x31\xf1\xc5\xfe\x15\xb6\
-\xdc\x34\x2d\xff\x0b\xc0\x12\xae\xe3\xeb\x89\x43\xe9\x75\xe7\x20\
-\x7e\xde\x97\x41\x58\xed\x0e\x8c\x7a\x78\x30\x75\xab\x04\x55\xe8\
-\xfb\x4c\x67\x0a\xe6\x81\x27\x9f\xe7\xd9\xfb\x5b\x80\x35\x9e\x29\
-\x9f\x2c\x23\x4b\x85\x0a\x3b\x7d\x5e\xd1\x11\xd3\xf2\x66\xee\xb9\
-\xa1\x11\x60\x63\xf9\xbc\xa9\xbc\x3c\xf5\x27\xac\x40\x78\xad\x76\
-\xf4\x1f\x76\x3b\x7e\x88\xb2\x6a\xd7\xae\x1d\x00\xcd\x9b\x37\x97\
-\x05\x08\x25\x08\x14\xbe\xc0\x6c\x36\xd3\xb1\x63\x47\x1a\x34\x68\
-\x40\xed\xda\xb5\x25\x43\x2a\x78\x59\x36\x6d\xda\x14\x3f\x3f\x3f\
-\x59\xbe\xba\x4c\xfc\x30\xea\xf5\x5c\x6d\xcb\x23\xd5\xbe\x69\x24\
-\x7f\x2e\x9f\xcb\x88\xdb\xda\x73\x6a\xe3\x22\x1e\xea\x79\x33\xc3\
-\x5f\x9e\xcb\x99\x5c\x27\x15\x79\x2d\xa8\x7b\xdf\xdf\xc8\xfe\x1d\
-\x1b\x59\xf8\xfe\x04\x5c\x9b\x96\xf2\x54\xff\x97\xd8\x93\x96\x03\
-\x3a\x7f\x9a\xdd\x7e\x1b\x35\x2a\x68\xba\xfc\xc3\x22\xa9\x5c\xd5\
-\x0c\x04\x72\xd3\x7d\x23\x79\x64\xd4\xdd\x44\x99\x40\xc3\x44\xed\
-\x26\xed\x18\xde\xbb\x15\x21\x15\xb5\x65\xaa\xf7\x23\xe7\xd4\x5e\
-\xd6\xfe\xb9\x81\x35\xab\x57\xb0\x64\xe5\x5a\x96\x2d\x5e\x4b\x4a\
-\x56\xfe\x88\x74\x70\xad\x7a\x04\x56\xc8\x84\x69\x58\x33\x32\x38\
-\x9b\x9a\x93\xff\x6d\xc6\x01\xa6\x4f\x9f\xcb\x8f\x8b\xe7\xb1\x6c\
-\xc3\x51\x00\x22\x22\xa3\x08\x0b\xf2\xaf\xd0\x75\x49\x70\xa5\x06\
-\xdc\xdf\xbf\x3d\xe1\x40\xf2\xce\x2d\xec\x3e\x72\x92\x8a\xdc\x8d\
-\xa4\xe8\x0d\xb4\xec\xd4\x93\xb6\xd5\x03\xe0\xf4\x2e\xde\x9d\x36\
-\x83\xb7\xc7\x8d\xe0\xcf\xb3\x60\x0c\x8a\xa5\xe3\xad\xfd\xa8\x5e\
-\xb1\x8b\xcc\x27\x78\xb6\x55\x6a\xd1\xa2\x85\x64\xc6\x7f\x9c\xcc\
-\x39\xf4\xb1\xc0\x21\x39\x39\x19\x7f\x7f\xa9\xe5\x2a\x32\x45\x51\
-\xa8\x5d\xbb\x36\xfb\xf7\xef\x97\xcc\x10\x45\x18\xeb\xf5\xe3\xd3\
-\x0f\x5f\xe6\xda\x3a\x91\x68\xaa\x8b\xe0\x98\xa6\x3c\x36\xe9\x13\
-\x1e\x33\x87\x10\x79\xe2\x1b\x5a\xf6\x7b\x89\x94\xf4\x8a\x39\x25\
-\x34\xf9\xb4\x89\x86\xd7\xb4\xa0\x5e\xbd\xda\x44\x44\x37\xe6\x94\
-\x5f\x7d\x1a\x47\x04\x00\xe0\xde\xf1\x07\xc7\x2a\x68\x99\xa5\xc7\
-\xaf\x67\xd2\xa3\x0f\xf1\x79\xa0\x86\xaa\xba\xb1\x9b\xeb\xf1\xca\
-\x3b\x13\xa8\xe9\x67\x67\xf3\xca\xef\x99\x32\xfd\x67\xce\xe6\x56\
-\xd4\xca\xca\xc2\xf8\x59\xbf\x32\xa4\x4d\x00\x79\x99\x67\x59\xfb\
-\xeb\xef\x28\xd5\xdb\xd1\x38\x26\x18\x80\x53\xbf\x2e\x21\xab\x82\
-\x26\x2d\xed\xd4\x51\xbe\xf8\x73\x1f\x4d\x1b\xb4\x23\x26\xb4\x1d\
-\x9f\x7f\xf9\x3e\x8b\xf7\xc2\x7d\x7d\xae\x01\xe0\xec\x99\x14\xd2\
-\xb2\x73\x2b\x74\x7d\x12\xde\xf4\x5e\xda\x87\xe4\xff\xfb\xd8\xe1\
-\x43\x9c\xce\xc8\xaa\xd0\xe9\xd1\x34\x8d\xb3\xa9\x69\xf9\xdf\x54\
-\x69\xc6\xc4\x97\x5e\xa4\x63\x66\x1d\xda\x56\x02\x70\x91\x97\x77\
-\x86\xac\xab\x60\x91\xe1\x2b\xed\xda\x6b\xaf\x05\x20\x24\x24\x44\
-\x32\x43\x82\xc0\xff\x26\x4d\xd3\x7c\x6a\x79\x61\x4d\xd3\xbc\xef\
-\x01\x7a\xce\xcb\x57\xce\x4f\x51\x14\x9f\x5e\x66\xda\x97\xca\xd2\
-\x93\x57\x7a\xbd\xde\x9b\x67\xaa\xea\x3b\x7d\xb3\xbe\x5e\x96\x17\
-\x97\xad\x8a\x3b\x3f\x8c\xb8\x2a\xd6\x07\xed\x31\xb8\x1f\x0d\xaa\
-\x47\xe2\x76\xbb\xd0\x50\x88\x88\xae\x45\xa5\x68\xd0\xf4\x7a\xf4\
-\xfe\x55\xd1\x1b\x2a\xee\xe4\x8c\xed\x1f\x0d\x66\xc9\x7d\x9b\xe9\
-\x5d\x37\x9c\x4e\x77\xdc\x8f\xa2\x69\xb8\x55\x15\x5b\xca\x7a\x06\
-\x0e\xfd\xb0\xc2\xa6\xcb\x76\xf6\x38\xbf\x7c\x35\xfb\xfc\x0f\xfc\
-\xdb\x31\xea\x8d\xf1\xd4\x34\xdb\x39\xb4\x65\x15\x8b\xd7\xc6\xe3\
-\xa8\xa8\x89\x73\xa5\x31\xe9\x95\xb7\xe8\xfd\xdd\x24\xa2\x2a\xc5\
-\x72\x7b\xff\x81\xf9\xf7\x9c\xa6\x90\xb3\x7f\x16\x77\x3d\xb9\xae\
-\xc2\x96\x9b\x3d\x2d\x91\xcf\x87\x0d\xa6\x2a\x1f\xf1\xc2\xa0\x8e\
-\xb4\xe8\x3d\x8a\x56\x77\xe4\xd7\xc7\xf6\x8c\xe3\x7c\xf9\xc5\xd7\
-\xc4\x9f\xcc\xa9\xd0\xf5\x49\xdc\x2d\xb7\x16\xcc\x94\x70\x72\xea\
-\xd4\x49\xac\x56\x77\xc5\xae\x20\xdd\x4e\x76\x7d\xff\x11\x33\x07\
-\xf6\x62\x44\xdb\x28\xda\xdf\x33\x9a\xeb\xd0\x70\x3b\x1d\xa4\x9e\
-\x3d\xc8\x27\x2f\x3d\x43\x45\x5c\x62\xca\x97\xda\x00\x3a\x9d\xce\
-\xdb\xd6\xf4\x4c\x05\xf5\xb5\xf3\x13\x12\x04\xfe\xab\x01\x43\x42\
-\x42\x02\x87\x0e\x1d\x22\x23\x23\xc3\x67\x82\x07\xcf\x79\x9d\x39\
-\x73\x86\x6f\xbf\xfd\xd6\x67\x82\x40\x45\x51\x08\x0c\x0c\xa4\x59\
-\xb3\x66\x44\x45\x45\x61\x34\x1a\x7d\xaa\x2c\x93\x92\x92\x88\x8f\
-\x8f\x27\x35\x35\xd5\x67\xca\x52\xaf\xd7\x73\xee\xdc\x39\x82\x83\
-\x83\x59\xb1\x62\x05\x69\x69\x69\x3e\x13\x00\xfa\xfb\xfb\xd3\xbc\
-\x79\x73\xaa\x56\xad\xea\x33\x65\xa9\xd7\x5f\x6e\x75\x06\x07\x9b\
-\x16\x2f\xe0\xcd\xc4\xcd\x58\x8c\x99\x6c\xbf\x44\x7b\xcd\x62\xf1\
-\xed\x2d\x15\x0c\x06\x43\xa1\x07\xac\x89\xe4\xf5\x3f\x32\xd5\xb6\
-\x17\xbd\xfb\x82\xa0\xd6\xe0\x47\x50\xfa\x76\xb2\x73\xcf\x87\x13\
-\xbe\x74\xaf\x5d\x2e\x6d\x85\x1f\xd8\xb9\x67\x76\xd3\xb7\x6d\x43\
-\x06\x3e\x34\x98\x56\xb5\xaa\xa0\xb8\x6c\xa4\x1c\xdb\xce\xe7\xb3\
-\xe7\xf1\x57\x4e\x71\xcb\xdc\x37\xfc\xed\x75\xe5\x3a\xc1\xac\x37\
-\x5e\xe2\x37\x3f\x27\xdb\xd7\xed\x28\x32\xfd\xae\x70\x67\x9e\xaf\
-\xba\xb0\x91\x95\xb4\x72\x0a\x4d\xda\xef\x60\x58\xff\x9e\xd4\xae\
-\x1c\x80\xcb\x9a\xc5\xe1\xed\xab\x99\x35\xff\x17\xac\x17\x7c\xce\
-\xd7\x3b\x90\xcc\x66\x73\xe1\xa6\x37\x0a\x07\x99\x3c\xac\x27\x9b\
-\x96\xf6\xa3\x73\x9b\x26\x44\x47\x06\x92\x73\xfa\x18\xab\x16\x7d\
-\xc9\x2f\x3b\x12\x2b\xcc\xf5\xa8\x28\x0a\x26\x93\xe9\xa2\x9f\x67\
-\x6c\x9c\xcb\xa4\x57\x4d\xe4\x39\x5c\xec\xfa\x7d\x0b\x39\xce\x8a\
-\xd9\xa8\x2e\x7c\x8e\xd9\xa7\x76\x31\xb2\x73\x53\x96\xdc\x7d\x3f\
-\x5d\x5a\x36\x24\x40\x97\xc7\xc9\xa3\xbb\x58\xf8\xd9\x67\x1c\xca\
-\x00\x45\x39\xff\xae\xa7\x9f\x9f\x6f\xcf\xc3\xce\xca\xca\x22\x31\
-\x31\x91\x83\x07\x0f\x7a\xf7\xe5\xf3\x85\xe7\x6d\x4e\x4e\x0e\xa1\
-\xa1\xa1\xec\xdb\xb7\x8f\x45\x8b\x16\xe1\x70\x38\x7c\xe6\x3a\xa8\
-\x5d\xbb\x36\x35\x6a\xd4\xf0\x2e\x5e\x23\xfe\xfd\x86\xf4\x7f\xca\
-\xa7\x9f\x7e\xaa\xd5\xab\x57\x4f\x23\xff\xcd\x69\xf9\x2a\xe6\x57\
-\xad\x5a\xb5\xb4\x8f\x3e\xfa\x48\x73\x38\x1c\x3e\x53\x96\x73\xe7\
-\xce\xd5\xea\xd7\xaf\xef\xb3\x79\xa6\x28\x8a\x4f\x9e\x57\x6c\x6c\
-\xac\x36\x79\xf2\x64\x2d\x2f\x2f\xcf\x27\xca\xd1\xed\x76\x6b\x83\
-\x06\x0d\x2a\x71\x3a\x02\x02\x02\xb4\xc3\x87\x0f\xfb\x7c\x9d\x73\
-\xeb\xad\xb7\x96\x38\x6d\xd1\xd1\xd1\xda\x9e\x3d\x7b\x7c\x3a\x5d\
-\x09\x09\x09\xda\xf5\xd7\x5f\x5f\xe2\xb4\xb5\x6a\xd5\x4a\x3b\x79\
-\xf2\xa4\x4f\xa7\x2d\x33\x33\x53\xab\x5a\xb5\x6a\x89\xd3\xd6\xa1\
-\x43\x07\xcd\xe9\x74\xfa\x74\xda\xd6\xad\x5b\xa7\x45\x46\x46\x96\
-\x38\x6d\x63\xc6\x8c\xd1\x72\x73\x73\x7d\x3a\x6d\x3f\xfe\xf8\xa3\
-\x66\x30\x18\x4a\x9c\xb6\xa9\x53\xa7\xfa\x74\xba\xdc\x6e\xb7\xf6\
-\xd5\x57\x5f\x95\x38\x5d\xc1\xc1\xc1\xda\xfc\xf9\xf3\x7d\xbe\x8e\
-\x1c\x31\x62\x44\x89\xd3\xe6\xef\xef\xaf\x1d\x3b\x76\xcc\x67\xd3\
-\x74\xe8\xd0\x21\xed\x81\x07\x1e\xd0\xfc\xfc\xfc\x7c\xb2\x1d\xa0\
-\xd3\xe9\x7c\xf6\xbc\x7a\xf6\xec\xa9\x6d\xdd\xba\x55\x13\xff\x3e\
-\x45\xf3\xa5\x39\x91\xff\xb2\x69\xd3\xa6\x31\x6e\xdc\x38\x22\x22\
-\x22\xe8\xdd\xbb\x37\x31\x31\x31\x15\x6a\x6a\xdc\x95\x92\x92\x92\
-\xc2\x8f\x3f\xfe\xc8\xe9\xd3\xa7\x79\xe3\x8d\x37\x18\x33\x66\xcc\
-\x05\x3d\xae\xff\xff\xa6\x4f\x9f\xce\x98\x31\x63\x08\x0b\x0b\xe3\
-\xf6\xdb\x6f\x97\x15\x55\x8b\xd9\x9b\x7c\xe6\xcc\x19\x7e\xf8\xe1\
-\x07\x92\x93\x93\x19\x3f\x7e\x3c\xaf\xbe\xfa\xea\x15\x2f\x4b\x80\
-\x63\xc7\x8e\x31\x6b\xd6\x2c\x0e\x1d\x3a\xf4\x8f\xf7\xa4\xa6\x69\
-\xf8\xf9\xf9\xd1\xaf\x5f\x3f\x7a\xf5\xea\xe5\xf3\xbd\xf8\x27\x4f\
-\x9e\x64\xd2\xa4\x49\x9c\x38\x71\xa2\x58\x69\x0b\x0c\x0c\xa4\x6f\
-\xdf\xbe\xf4\xee\xdd\xbb\x5c\x46\xcb\x2f\xbc\x06\xca\xd3\xa6\x4d\
-\x9b\x98\x33\x67\x0e\xe7\xce\x9d\xbb\xf0\x0f\xa3\x29\x4a\x91\x45\
-\x7d\x34\x4d\x23\x22\x22\x82\x51\xa3\x46\x55\x88\x05\x09\xd6\xac\
-\x59\xc3\x9c\x39\x73\xc8\xc9\xc9\xf9\xc7\x7c\x53\x55\x95\x98\x98\
-\x18\x46\x8c\x18\x41\xd3\xa6\x4d\x7d\x3a\x5d\xaa\xaa\xb2\x64\xc9\
-\x12\x16\x2e\x5c\x88\xcd\x66\xbb\xe8\x7a\xb9\x30\xad\x8a\xa2\x50\
-\xb7\x6e\x5d\x46\x8c\x18\x41\x8d\x1a\x35\x7c\xbe\xdc\x3e\xfc\xf0\
-\x43\x7e\xfd\xf5\x57\xdc\x6e\xf7\x45\x69\xb9\x30\x7d\x9a\xa6\xd1\
-\xba\x75\x6b\xc6\x8c\x19\x43\x40\x40\x80\x4f\xa7\x2b\x23\x23\x83\
-\x39\x73\xe6\xb0\x61\xc3\x86\x62\x4d\xdf\x33\x18\x0c\x74\xea\xd4\
-\x89\x81\x03\x07\x12\x18\xe8\xdb\xcb\xfb\x24\x27\x27\xf3\xfe\xfb\
-\xef\x5f\xa2\xfe\xd7\xd0\xb8\xb8\x1e\x31\x9b\xcd\xf4\xeb\xd7\x8f\
-\xde\xbd\x7b\xfb\x64\xfd\x9f\x90\x90\x40\xbf\x7e\xfd\xd8\xb2\x65\
-\x0b\x1d\x3a\x74\xa0\x63\xc7\x8e\x58\x2c\x16\xfe\x43\xcd\xed\x52\
-\x71\xb9\x5c\x6c\xdd\xba\x95\xe5\xcb\x97\xd3\xa8\x51\x23\x3e\xfb\
-\xec\x33\xd9\xcc\xfe\xdf\x6e\x17\xfe\x57\x82\xc0\xf8\xf8\x78\xef\
-\x34\xb8\xf7\xdf\x7f\x9f\xce\x9d\x3b\xfb\xfc\x54\x32\x5f\x91\x97\
-\x97\xc7\x86\x0d\x1b\x18\x3b\x76\x2c\x47\x8e\x1c\x61\xed\xda\xb5\
-\xb4\x6a\xd5\xea\x8a\x9d\xcf\xfe\xfd\xfb\xb9\xe1\x86\x1b\x30\x9b\
-\xcd\x7c\xf1\xc5\x17\xb4\x6e\xdd\xda\xe7\x1f\x72\xbe\xc2\x66\xb3\
-\x11\x1f\x1f\xcf\x9d\x77\xde\x49\x7a\x7a\x3a\x5f\x7e\xf9\x25\xb7\
-\xde\x7a\xeb\x15\x3d\x27\x4f\xc3\xcc\xe5\x72\x91\x9e\x9e\x5e\xac\
-\xcf\x98\xcd\x66\x82\x83\x83\x2b\x4c\xbe\xbb\xdd\xee\x62\x4f\x0b\
-\xf6\xa4\xed\x52\x0d\xf2\x92\x06\x7f\x97\x0b\x02\xcb\x33\x18\xb4\
-\x5a\xad\xe4\xe6\x16\x6f\x81\x8d\xa0\xa0\x20\x9f\x9f\xc2\x55\x58\
-\x4e\x4e\x0e\x56\xab\xb5\x58\xc1\x7b\x58\x58\x18\x46\xa3\xb1\x4c\
-\xe5\xf6\xff\x29\x33\x33\xb3\x58\xd3\xc0\x14\x45\x21\x24\x24\xc4\
-\xe7\xa7\x27\x17\x96\x9a\x9a\x5a\xec\xf7\x9c\x22\x23\x23\x2b\x4c\
-\xba\x54\x55\x25\x3d\x3d\xbd\x58\x69\xd3\xe9\x74\x15\x6a\x4a\x9d\
-\xd3\xe9\x24\x23\x23\xa3\x58\xbf\x6b\x34\x1a\x09\x0d\x0d\xf5\xd9\
-\xb4\x8c\x1b\x37\x8e\xa9\x53\xa7\x32\x78\xf0\x60\x26\x4d\x9a\x44\
-\xe5\xca\x95\xe5\x5d\xb7\x62\x4a\x49\x49\xe1\x9b\x6f\xbe\x61\xcc\
-\x98\x31\xf4\xef\xdf\x9f\xcf\x3f\xff\xdc\xe7\x3b\x7a\x2b\xb2\xff\
-\xcc\x3b\x81\x5f\x7d\xf5\x15\x36\x9b\x8d\x9b\x6f\xbe\x59\xf6\x6e\
-\x2b\x21\x8b\xc5\x42\xd7\xae\x5d\x19\x38\x70\x20\xe3\xc7\x8f\xe7\
-\xc7\x1f\x7f\xa4\x79\xf3\xe6\x57\xec\xdd\x97\xe9\xd3\xa7\x93\x9a\
-\x9a\xca\x0b\x2f\xbc\x40\xe7\xce\x9d\xa5\x80\x4a\xc0\xcf\xcf\x8f\
-\x66\xcd\x9a\x31\x73\xe6\x4c\x6e\xbe\xf9\x66\x56\xae\x5c\x79\xc5\
-\x83\x40\x4f\x83\xd9\x60\x30\x54\xa8\x06\x59\x49\xe8\xf5\xfa\x12\
-\xa7\xad\x34\x81\x44\xe1\xe0\xef\x52\x0b\x26\x5d\xb8\x30\x50\x79\
-\x04\x2b\xfe\xfe\xfe\x57\xed\x8a\xc6\x81\x81\x81\x25\xee\x60\xaa\
-\x28\xb3\x4b\xae\xe6\x95\x01\xaf\xd6\xf7\x89\x2a\x5a\x60\x57\x12\
-\x46\xa3\xf1\xaa\xa8\xff\x73\x73\x73\x59\xbe\x7c\x39\x00\x1f\x7f\
-\xfc\x71\x85\xea\x3c\xf1\x05\x51\x51\x51\x0c\x1e\x3c\x98\x45\x8b\
-\x16\xb1\x7c\xf9\x72\x56\xaf\x5e\xcd\x2d\xb7\xdc\x22\x19\x23\x41\
-\x60\xd9\x24\x25\x25\x61\x32\x99\x24\x68\x28\x83\x1a\x35\x6a\x60\
-\x30\x18\x38\x71\xe2\xc4\x15\x9d\xd6\xe0\x99\x7a\xd6\xbe\x7d\x7b\
-\x29\x94\x52\x6a\xd4\xa8\x11\x40\xb1\x7b\x5e\xcb\x9b\xdb\xfd\xef\
-\xac\x62\xe7\x0b\x8b\x57\xa8\xaa\xfa\xaf\xdc\x1f\xff\x94\xb6\xc2\
-\x81\xdf\x85\x5f\x85\x03\xc0\xc2\x5f\x25\x0d\x5a\xfe\xad\x72\x53\
-\x14\xe5\x8a\xf7\x94\xff\x5b\xe5\x76\xa5\x7b\xb1\x35\x4d\xfb\xd7\
-\x56\xff\xbb\xd2\xf7\xdb\xbf\x95\xb6\xab\xf9\x7a\xf4\x85\x6b\xf2\
-\xdf\x4a\x9b\x2f\x94\xdb\xa9\x53\xa7\xc8\xc8\xc8\xa0\x6b\xd7\xae\
-\x12\x00\x96\x92\xc5\x62\xa1\x65\xcb\x96\xfc\xfe\xfb\xef\xa4\xa4\
-\xa4\x48\x86\x48\x10\x58\x3e\x8d\x4e\xcf\xd2\xfd\xa2\x94\x17\x4b\
-\xc1\x6a\x80\xff\x56\x43\xb0\x24\x0f\xfe\x92\x36\x5e\xc5\xc5\x0f\
-\xcb\xc2\x79\xf9\xff\x29\x33\x33\x93\xb8\xb8\x38\xc2\xc2\xc2\xca\
-\xf5\xef\xdb\x6c\x36\x3a\x77\xee\xcc\xbb\xef\xbe\x4b\x95\x2a\x55\
-\xae\x48\xbe\xae\x5e\xbd\x9a\x71\xe3\xc6\x91\x96\x96\x56\x6e\x75\
-\x8d\xa2\x28\xe4\xe6\xe6\xd2\xb3\x67\x4f\x3e\xf8\xe0\x83\xbf\x9d\
-\x4e\xe9\x09\xfa\x54\x55\xf5\x7e\x15\xbe\x5f\x74\x3a\x9d\xf7\xab\
-\xa4\xf7\xd0\xd2\xa5\x4b\x19\x3a\x74\x28\xfe\xfe\xfe\xe5\x5a\x6e\
-\x4e\xa7\x93\x9e\x3d\x7b\x32\x73\xe6\xcc\x2b\xf6\x6c\xf8\xe2\x8b\
-\x2f\x18\x3f\x7e\x7c\xb9\xbe\x22\xa0\x28\x0a\x69\x69\x69\xbc\xf7\
-\xde\x7b\x0c\x18\x30\xe0\x8a\xcc\x9c\x70\x3a\x9d\x8c\x1f\x3f\x9e\
-\x25\x4b\x96\x94\xfb\xbd\x6e\x30\x18\x18\x37\x6e\x1c\xa3\x46\x8d\
-\xba\x22\xe5\x96\x9b\x9b\xcb\x98\x31\x63\x58\xba\x74\x69\xb9\x4e\
-\x31\xd6\x34\x0d\x9d\x4e\xc7\xc2\x85\x0b\x69\xd9\xb2\xe5\x15\x79\
-\xce\xc4\xc7\xc7\x33\x7a\xf4\x68\x0e\x1e\x3c\x58\xee\xc7\x0e\x0f\
-\x0f\x67\xde\xbc\x79\x34\x69\xd2\xe4\x8a\x94\xdb\x91\x23\x47\xb8\
-\xed\xb6\xdb\xb0\xdb\xed\xe5\x9a\xb7\x4e\xa7\x93\x0e\x1d\x3a\xf0\
-\xce\x3b\xef\x10\x1b\x1b\x7b\xc5\x9e\xad\x2e\x97\xab\x42\xac\x12\
-\xec\xeb\x3c\xcf\xa8\x2b\xdd\xde\x94\x20\x50\x5c\xd5\x54\xb7\x1b\
-\x14\x1d\x3a\xdd\x3f\x57\xc6\xf2\x52\xb3\x28\x0f\xb5\x6a\xd5\xc2\
-\xe9\x74\xd2\xb2\x65\xcb\x72\xed\xc5\xcf\xcb\xcb\xe3\x9b\x6f\xbe\
-\xa1\x51\xa3\x46\x4c\x9c\x38\xf1\xff\xbd\x47\x38\x39\x39\x99\xd1\
-\xa3\x47\x93\x99\x99\x49\xeb\xd6\xad\xcb\xad\x81\xa3\xd3\xe9\xc8\
-\xce\xce\xe6\xd3\x4f\x3f\xa5\x5a\xb5\x6a\xbc\xf2\xca\x2b\x97\x0d\
-\xfe\x3c\x01\xa0\xdb\xed\xc6\xed\x76\x5f\x32\x08\xf4\x04\xa7\x3a\
-\x9d\xae\xd8\x1d\x2a\x49\x49\x49\xf4\xe9\xd3\x87\x46\x8d\x1a\x51\
-\xab\x56\xad\x72\xad\x0b\xd2\xd2\xd2\xf8\xf8\xe3\x8f\x69\xdc\xb8\
-\x31\xa3\x47\x8f\xfe\x7f\xbf\x1e\x4f\x9e\x3c\xc9\xa0\x41\x83\x68\
-\xd5\xaa\x15\xd5\xab\x57\x2f\xb7\xb4\xe9\x74\x3a\x0e\x1d\x3a\xe4\
-\x3d\x76\xe3\xc6\x8d\xff\xdf\xd3\xf6\xd9\x67\x9f\xf1\xf1\xc7\x1f\
-\xd3\xb1\x63\xc7\x72\x9d\xb2\xeb\xd9\xd2\xe8\xb5\xd7\x5e\xe3\xba\
-\xeb\xae\xa3\x79\xf3\xe6\xff\xef\x69\xfb\xfd\xf7\xdf\xf9\xe4\x93\
-\x4f\xe8\xdd\xbb\x77\xb9\x06\x13\x7a\xbd\x9e\x5f\x7f\xfd\x95\xd1\
-\xa3\x47\xb3\x62\xc5\x8a\x2b\xb2\x60\xcc\xb4\x69\xd3\xd8\xb2\x65\
-\x0b\xed\xda\xb5\x2b\xb7\x85\xbb\x14\x45\xc1\xed\x76\xb3\x71\xe3\
-\x46\xc6\x8e\x1d\xcb\xaa\x55\xab\xae\x48\xfd\x3f\x7c\xf8\x70\x92\
-\x92\x92\xb8\xed\xb6\xdb\xca\xb5\xfe\x77\x38\x1c\x2c\x5a\xb4\x88\
-\x6e\xdd\xba\x31\x64\xc8\x90\x2b\xd6\x49\x5c\x9a\xbf\xab\xba\x1c\
-\xd8\x1d\xae\x82\x6d\x83\x14\x0c\x46\x33\x26\xa3\x0e\xd0\x70\x39\
-\x1c\x38\x5c\x6e\x8c\x26\x3f\x8c\x05\xfb\xc8\x3a\xac\x59\xe4\xda\
-\xdd\xe8\x4d\xfe\x04\x07\x98\x01\x0d\xa7\xdd\x8e\x53\x55\xd0\x29\
-\x1a\x9a\xa6\x52\xa4\x1a\x53\x74\x18\x8d\xa6\x82\xcf\xab\xd8\xf2\
-\xec\x68\x8a\x1e\x3f\x3f\x13\x0a\xe0\x76\x3a\xb0\x3b\xdd\x98\x2d\
-\x7e\xe8\xff\xe1\xfc\x73\xb3\xd2\xb1\xbb\x75\x04\x86\x04\x63\x2a\
-\x68\x37\x3a\xed\x79\x38\x55\x3d\x16\x8b\x09\x05\x15\x87\xdd\x81\
-\xce\x60\x02\xb7\x03\x87\xeb\xe2\x32\x36\x98\x2c\x98\x0c\xd2\x89\
-\x2f\x41\xa0\x0f\x71\xdb\xb2\xd9\xf3\xe7\x4a\xf6\x9d\xca\xc3\x10\
-\x5a\x93\x98\x86\x2d\xb8\xbe\x96\x05\xd0\x48\x3f\x75\x8c\x3f\xd7\
-\xfd\x49\xa6\xdb\x4c\xbd\x16\x9d\x68\x5d\x3f\x88\x0d\xdf\x7f\xcf\
-\x5f\x0e\x13\x46\x45\x3b\xbf\xdf\x97\xa6\x62\x88\x6c\x40\xd7\x98\
-\x1c\xfe\xd8\x96\x44\x9e\x41\x8f\xce\x73\x43\x69\xf9\xbf\xa7\x18\
-\xfd\x69\xdc\xaa\x1d\xee\xc4\xcd\xec\x4f\xce\x41\xa7\x53\x0a\x7d\
-\xde\x0d\x81\xd1\x74\xec\x78\x3d\xc1\xb9\x87\x59\xbd\x61\x2f\x76\
-\x77\xa1\xf7\x7a\x14\x1d\xc1\x51\xf5\xe8\xda\xb1\x19\x26\xe0\xd0\
-\xef\x4b\xd8\x96\x6a\xa4\x55\xbb\x0e\xd4\x8f\x09\x61\xd7\x1f\xcb\
-\x88\x4f\xc9\xc1\x10\x10\x49\x97\x6e\x5d\x09\xd5\x03\x9a\x95\x1d\
-\xeb\xff\xe4\x70\x4a\x36\xad\xbb\xdc\x4e\xad\x08\x03\xa0\x72\x64\
-\xfb\x1a\xfe\xd8\xb2\x9f\xd4\xf4\x1c\x34\x83\x1f\x51\x35\xea\x72\
-\xed\x0d\x37\x52\xaf\xb2\x5f\xfe\x79\x5e\xe5\xe5\xad\xb9\x1d\xa4\
-\x24\x1f\xe7\x64\xaa\x9d\x9a\x0d\xeb\x13\x6e\x31\x01\x6e\x6c\x19\
-\x49\x1c\xfc\x2b\x87\xaa\x35\x6b\x52\x25\x34\x00\xcd\x9d\xc5\x81\
-\x9d\xc7\x08\x6f\xd8\x8c\x28\x7f\x1d\xb8\x72\xf8\xeb\xf0\x31\x72\
-\x4d\x95\x68\x50\xb3\x2a\x06\x1d\xd8\xb2\xcf\x71\x2c\xc5\x4a\x5c\
-\xad\x38\x02\xf4\x17\x36\x96\x54\xf6\x6d\xfb\x93\xa3\x29\x56\x9a\
-\xb6\xef\x4c\xad\x88\x0b\xf6\x7a\x52\xad\xec\xdb\xba\x99\xa3\x29\
-\x56\x22\x6b\x34\xa6\x7d\xb3\xb8\xfc\x4d\x90\x0a\xae\x9b\x9c\x73\
-\x09\x1c\x3e\x9e\x4b\xcd\x96\x8d\x70\x26\x1e\xe0\x94\xdd\x42\xf5\
-\x7a\x35\x08\x55\xb8\xf8\xdc\x2a\x88\xc8\xc8\x48\x8c\x46\x23\x0b\
-\x17\x2e\x64\xd1\xa2\x45\xde\x11\xab\xb2\x34\xda\x4c\x26\x13\xb5\
-\x6a\xd5\xe2\xc9\x27\x9f\x2c\xdb\x08\x9c\xd3\x01\x46\x13\x94\xe2\
-\x2e\xd0\xeb\xf5\x04\x04\x04\x70\xcf\x3d\xf7\xd0\xb3\x67\x4f\x12\
-\x13\x13\xb1\xdb\xed\x65\x0e\x24\x3c\x7b\x3b\x36\x6e\xdc\xf8\x6f\
-\x1b\xa4\x97\x0a\x02\xdd\x6e\x77\x91\x40\xcf\x93\x37\x9e\xe9\xa0\
-\xc5\x5d\xc4\x44\xaf\xd7\x63\x36\x9b\x79\xe1\x85\x17\xa8\x5d\xbb\
-\xb6\x77\x15\xbf\xb2\x94\x9b\xd1\x68\x24\x30\x30\x90\xea\xd5\xab\
-\xd3\xb4\x69\xd3\x52\x05\x29\x9e\x52\x72\xba\xc0\x58\xca\xa7\x99\
-\xa2\x28\x04\x04\x04\xf0\xd2\x4b\x2f\x51\xb9\x72\x65\x8e\x1f\x3f\
-\x5e\xa6\x40\xd0\x13\x6c\x37\x6b\xd6\x8c\x55\xab\x56\xf1\xf4\xd3\
-\x4f\x97\x6d\x54\x40\x55\xa1\x94\x1d\x1a\x66\xb3\x99\x88\x88\x08\
-\x96\x2f\x5f\xce\x82\x05\x0b\x30\x9b\xcd\x65\xde\xaf\x4c\xa7\xd3\
-\xd1\xb8\x71\x63\x12\x12\x12\x18\x32\x64\x48\xa9\xa6\xbc\x95\xc7\
-\x33\xc6\x68\x34\x52\xb3\x66\x4d\x16\x2f\x5e\xcc\x8a\x15\x2b\x8a\
-\xbd\xa8\xd4\x3f\xe5\x57\xd7\xae\x5d\x79\xf4\xd1\x47\x39\x75\xea\
-\x54\xe9\xde\xcb\xbd\x20\x6d\xa5\x49\xab\xa6\x69\xf4\xec\xd9\x93\
-\xe9\xd3\xa7\xf3\xcb\x2f\xbf\x78\xef\xd5\xb2\x94\x59\x5e\x5e\x1e\
-\x03\x07\x0e\xe4\x81\x07\x1e\xe0\xec\xd9\xb3\x57\xac\xfe\x0f\x0c\
-\x0c\xa4\x55\xab\x56\x7c\xf7\xdd\x77\x2c\x5c\xb8\xb0\xcc\x53\x7a\
-\x3d\xf7\x6f\xcb\x96\x2d\x79\xf8\xe1\x87\x2b\xe4\x0c\xa1\x53\x9b\
-\xbe\x67\xce\xe2\xf5\x9c\xca\xb6\xe3\xd2\x74\x84\x54\xa9\xc9\x8d\
-\x77\xdc\x4d\xb7\x96\x71\xac\xfb\xf6\x13\x96\x6c\x3e\x4a\xf7\xfb\
-\x1f\xe7\x96\x36\x31\x6c\xfb\x7e\x06\x5f\x2d\xdf\xcc\x91\x93\x59\
-\x98\x2b\xd5\xa0\x7b\xff\x91\x0c\xba\xa5\x16\xab\xbf\x98\xce\x2f\
-\x87\x43\xa8\x16\x74\x8e\x93\x49\xc7\xb0\x19\x82\x30\xeb\xdc\xf9\
-\xc1\xa1\x5f\x04\x3d\xee\x19\x4a\xaf\xf6\x75\xe0\xcc\x7e\xa6\x4c\
-\x9f\x4b\x8e\x31\x86\x91\x4f\x3f\x4e\x75\x3f\x8d\x03\x6b\xbe\x66\
-\xce\x92\xe3\x0c\x7c\x7d\x1c\xd7\x84\x5c\xee\x19\x93\xcd\xca\xf9\
-\xb3\xf9\x66\xd9\x1f\xa4\xd8\xcc\x34\xea\xd0\x83\x47\x1e\xba\x8b\
-\xea\xa1\x66\xd6\x7c\xf1\x36\xcb\x4f\x34\xe0\xc5\xe7\xef\x21\x88\
-\x73\xfc\x38\x77\x2e\x11\x9d\x07\x63\x5e\xf7\x21\x33\x37\x9e\xc4\
-\xdf\x6c\xc2\x64\x50\x70\xd8\xed\x58\xb3\x72\xe8\x38\x7a\x06\x43\
-\xdb\x85\x49\xe0\x21\x41\xa0\xef\x70\x66\xa6\xf0\xf5\xa4\x87\x79\
-\x73\xd5\x59\x4c\xa1\x1d\x69\x34\xe4\x05\x76\x4c\xb9\x09\x34\x07\
-\x7b\xd6\xce\x61\xc8\x3d\x6f\x70\x46\xef\xc7\x23\xff\x5b\x46\xeb\
-\xfa\x75\x78\x7f\xe4\x03\x2c\x48\x37\xa1\x73\xd8\x29\x3c\x58\xed\
-\x7f\xdd\x18\xd6\xdf\x79\x94\x87\x9e\x5c\xca\x19\x40\x6f\x34\x63\
-\x36\xe9\x71\xd9\xf2\x70\xb8\x35\x94\xb0\x5a\xbc\x34\x63\x0e\xea\
-\x8f\x13\x78\x63\xe1\x21\x54\xb7\x13\x77\xe1\xba\xbd\xc6\xad\xfc\
-\xb8\x74\x11\x4d\x12\x7f\xe2\xb1\xe1\xaf\x70\x26\x37\x0f\x9b\xad\
-\x60\x07\x58\xc5\x40\x58\x54\x1c\xb7\x0c\x7e\x8d\xf9\x6f\xf4\x67\
-\xf9\xe4\x47\x78\x7c\x6b\x28\x53\x3e\x5e\x40\xfd\x98\xc6\x7c\x3d\
-\xe5\x19\x66\xac\x3a\x8c\x3e\xa8\x1a\xaf\x2c\x58\xc3\x63\x5d\x63\
-\x40\x4b\x63\xfe\xb4\x97\xf8\x60\xc5\x11\x3e\x5a\x79\x0b\xb5\x22\
-\xf4\x6c\xfa\xfa\x15\x86\x8f\x9f\xc1\xee\xa4\xd4\xf3\x7f\xd7\x14\
-\xc8\xb5\x3d\xee\xe3\xcd\x77\xde\xa3\x53\x8d\xab\x7f\x1e\x7b\xee\
-\xb9\xa3\xbc\xff\xd2\x18\x3e\x5b\x73\x92\x67\x66\x7e\xcf\x88\x9b\
-\xeb\xa2\xc7\xca\xa9\xad\x33\x18\xf0\xf0\xcf\xdc\x36\xfa\x75\x5e\
-\x7c\xec\x0e\xfc\x73\x77\x30\xf6\xbe\x47\xe8\xb5\x70\x33\x8f\x36\
-\xf1\x27\xe7\xc0\x3a\x5e\x19\x33\x8e\x75\x7e\xb7\xb0\x66\xc1\x5b\
-\xc4\x84\x1a\x49\xda\xbd\x8c\xc7\x3f\xd8\xcb\xdb\x1f\x4d\xa6\x79\
-\x50\xe1\xc6\x9b\x9b\x2d\x8b\xdf\xe2\xbe\x87\x27\xf3\x57\xa6\x83\
-\xfa\xd7\x74\x63\xd2\xe7\x9f\xd2\xab\x6e\xc1\xaa\x96\xee\x74\x16\
-\x4e\x7f\x89\x89\x6f\xcf\xe3\x58\xaa\x8d\xf0\xb8\x26\xdc\xf3\xd8\
-\x5b\xbc\x3b\xba\xab\xb7\xe5\xb0\x7f\xf9\x47\x3c\xf8\xf2\x16\xa6\
-\xec\x58\x49\xda\xcc\x09\x3c\xbf\xca\xc4\x80\x67\xa6\xf2\x54\xaf\
-\x6a\xf8\x5b\x8b\x9e\x5b\x45\xe2\x72\xb9\x58\xb6\x6c\x19\x77\xdd\
-\x75\x17\xa1\xa1\xa1\x04\x07\x07\x97\xaa\x21\xe0\x99\x72\x07\xf0\
-\xec\xb3\xcf\x5e\xb4\xf0\x49\x49\xa4\x6d\x5f\xcc\x63\x6f\xcd\x85\
-\xd0\x76\x4c\x9b\xf9\x0c\xa5\x5d\xa2\xc0\x66\xb3\xf1\xc6\x1b\x6f\
-\xf0\xc3\x0f\x3f\x50\xb5\x6a\xd5\x52\x37\x70\x14\x45\x21\x3b\x3b\
-\x1b\xbb\xdd\xce\x77\xdf\x7d\x77\xd9\xe3\x5c\xf8\xfe\x9f\x27\xa8\
-\xf6\x8c\x04\xaa\x6e\x17\x09\x9b\x16\x32\x71\xca\xf7\xb4\xea\x33\
-\x8c\x87\xef\xef\x41\x25\x9d\xea\x1d\x09\x2c\xc9\xf4\x6a\xab\xd5\
-\xca\x73\xcf\x3d\xc7\x4f\x3f\xfd\x44\x44\x44\x44\xa9\xa7\x86\x1a\
-\x0c\x06\x92\x92\x92\xa8\x5a\xb5\x2a\x33\x67\xce\x44\xaf\xd7\x97\
-\xea\x38\x0a\x79\x7c\x3d\xe5\x65\xbe\xf8\x7d\x2f\xdd\x1e\x9e\xca\
-\xa8\xdb\xea\x96\xfa\x9a\x4c\x4a\x4a\xe2\x9d\x77\xde\x61\xfd\xfa\
-\xf5\x44\x46\x46\x96\xfa\x3a\x72\xb9\x5c\xa4\xa4\xa4\x30\x70\xe0\
-\x40\xe2\xe2\xe2\xca\xd0\x78\x77\xb2\xe8\xa9\x81\xbc\xbd\xdb\x40\
-\xf7\x3e\x83\x79\x62\xf8\x8d\x94\x66\x0d\x64\x55\x55\x71\x38\x1c\
-\xdc\x77\xdf\x7d\x98\xcd\xe6\x32\x2d\xbe\x61\x30\x18\x38\x7e\xfc\
-\x38\x0f\x3e\xf8\x20\x37\xdd\x74\x53\xa9\x47\xdb\x15\x4e\x33\xe7\
-\x95\x89\x6c\x56\xeb\x32\xf9\x99\x27\x08\x32\x97\xae\xe3\x46\xd3\
-\x34\x36\x6e\xdc\xc8\x90\x21\x43\xc8\xca\xca\x2a\xd3\x62\x37\xaa\
-\xaa\x72\xf2\xe4\x49\x3e\xfc\xf0\xc3\xd2\x97\x99\x06\x8a\x62\xe5\
-\xc3\xc1\x7d\xf9\xc1\xd1\x98\x89\x53\x27\x73\x5d\x15\xa5\x54\xf7\
-\xbe\xc3\xe1\x60\xdb\xb6\x6d\xf4\xef\xdf\x9f\xe8\xe8\xe8\xd2\xe7\
-\xb5\xa2\x60\xb3\xd9\x38\x7b\xf6\x2c\xed\xda\xb5\xc3\x66\xb3\x95\
-\xf2\xda\x56\x21\x6f\x1f\x9f\xbc\x35\x95\x79\x5b\x22\xf9\x78\xe1\
-\x4b\xd4\x2f\xc5\xf4\x69\xcf\x4a\xd0\x1b\x37\x6e\xa4\x5f\xbf\x7e\
-\x84\x86\x86\x12\x14\x14\x54\xea\x3c\x77\x38\x1c\xb8\x5c\x2e\xde\
-\x7b\xef\xbd\x0a\x3b\x75\xf0\xf4\x8e\x5f\x78\xff\x9d\xb9\x04\x34\
-\x6b\x4d\x55\x3f\x8d\xf8\x5d\xb3\x99\xff\xf3\x2e\x96\x2c\x9e\xcc\
-\xee\x55\x8b\x98\x36\x77\x35\x61\x6d\x87\xd1\xd6\x3a\x99\x5e\xf7\
-\x3c\xcd\x49\xbf\x38\xfa\xf6\xed\x4a\xc2\xba\xcf\x19\xb2\x78\x25\
-\xb6\x5f\xd6\x90\xb3\x62\x1e\xef\x2e\xad\xc6\xed\x9d\x03\x70\xe6\
-\x24\x73\x60\xe7\x56\x12\x6c\xa1\x54\xa9\x59\x83\x9a\x51\x55\x69\
-\x71\x53\x0e\x00\x47\x36\xfd\xc8\xd4\x49\x53\x48\xf5\xaf\x4e\xc3\
-\x1e\x0f\x31\xb0\x75\x20\x87\x37\xfe\xcc\xbb\xef\xff\x49\xfb\x09\
-\xa3\x2e\x1b\x04\x6e\x9f\xf9\x04\xf7\x3d\x36\x0b\x73\x83\x1b\xe9\
-\x58\x2b\x8d\x8f\x26\x0e\x61\x57\x5e\x20\x4b\x9f\xef\xc1\xa6\x25\
-\x33\x99\xb1\xbd\x1b\x4f\x3c\x7f\x0f\x41\xa4\xb1\x7a\xe1\x3c\xe2\
-\x62\x6e\xa7\xf1\xb1\x7d\x6c\xde\x7c\x04\xc7\xfa\xea\x88\x9a\x00\
-\x00\x20\x00\x49\x44\x41\x54\xb9\xe3\x1c\x3d\xe3\xa0\x4e\x83\x06\
-\x98\x6d\x19\x54\x4b\x75\x4a\xd0\x21\x41\xa0\x8f\xd1\x34\x9c\x79\
-\x56\x50\x8c\xa8\x59\xdb\x39\xf4\xd3\x22\x4e\x4d\xb9\x89\xaa\x76\
-\x2b\xc7\xb7\xad\xe1\x0c\x0a\xb8\x6d\xd8\x9d\x6e\x40\xc3\x96\xab\
-\x61\x08\x8a\x63\xe4\xb3\x63\x69\xe6\xaf\xe0\xd0\x34\x34\xb7\x0b\
-\x63\xb5\x96\x54\xaf\x99\xc5\x5b\xd3\x6e\xc5\x15\x6a\x64\xd3\x17\
-\x1f\x30\x77\xe5\x6e\x5a\x8f\x78\x91\x87\x5a\x54\xc1\x61\x0a\xa3\
-\x75\x43\x3f\xe6\x7f\x99\x8d\xd3\x65\x62\xc0\xeb\x6f\xd3\x29\xcc\
-\x8c\x1b\xd0\x54\x17\x5a\x48\x4d\x9a\x57\xf7\xc7\x76\xd4\x4e\x6e\
-\x4e\x36\x7e\x91\x37\x33\xe5\xdd\x11\x04\xe7\x64\x71\xee\xf0\x26\
-\xde\xff\xe8\x53\xbe\x7e\x7b\x0c\x77\x3d\xd0\x1f\xc5\x65\x45\xb5\
-\x9a\x0a\x86\xdb\x35\xec\x36\x3b\xb9\x56\x1b\xaa\xf5\x08\x1f\x4f\
-\x79\x97\x7b\xba\xbe\x4d\x65\x45\xc5\x61\xcb\xc3\x9e\x93\x8b\x13\
-\x33\xb6\x43\xf3\x19\x34\xe0\x65\xe2\x83\xea\x32\x76\xca\xbb\xf4\
-\xef\xdc\x04\x3f\xc7\x69\x16\xfc\xef\x29\xde\xfe\x6e\x26\x4f\xfa\
-\x55\xe6\xab\x79\xaf\x50\xfb\x2a\xbf\x32\x52\x93\x8e\xb1\x66\xd5\
-\x4a\x92\x93\x61\xd9\xaf\x9b\x18\xd4\xb5\x36\x01\x7a\x37\xf6\xec\
-\x93\x1c\x38\xba\x9f\xf4\xaf\xbf\x65\x40\x9f\x6e\x34\x0f\xcc\x26\
-\xfe\xd0\x7e\xce\xe4\xe5\xef\x65\xba\x63\xe7\x46\x56\xae\x3b\xc0\
-\x09\xa7\x95\x3f\xcf\x3c\x4b\xbf\xd0\x08\x6c\x39\xa9\x1c\x3e\x9e\
-\x4c\xde\x05\xcf\x9f\xcc\xd3\x6b\x78\x6e\xd4\x5b\x34\xbf\xeb\x51\
-\x5e\x69\x19\xc8\x3b\x13\x9f\x67\x60\xdf\x17\x39\xbc\x7b\x2a\x91\
-\xb8\xd8\xf7\xeb\x17\x4c\x78\xe6\x23\xa2\xfa\x8e\xe5\xb5\xbb\x5b\
-\xf3\xfb\xcc\xe7\x99\xfe\xe4\x60\xa2\x1a\xee\xe4\x99\x9b\xc3\x01\
-\xc8\x49\x3b\xc1\xfe\xc3\x87\xc9\x54\x21\xfd\xd4\x5f\x1c\xdb\xba\
-\x87\xd9\xef\x56\xa1\x4f\x9b\xb7\x69\x16\xe4\x39\x37\xb5\x42\xe5\
-\xbd\x27\xf8\x70\x38\x1c\x54\xab\x56\x8d\x99\x33\x67\xd2\xb0\x61\
-\xc3\x52\x8d\x50\xe8\x74\x3a\x8e\x1d\x3b\xc6\x1d\x77\xdc\xe1\x6d\
-\x00\x98\xcd\xe6\x52\x34\x98\x9c\xcc\xfd\x72\x35\x77\x3e\xf9\x3c\
-\x86\x65\x13\x99\xfb\xc3\xfd\x8c\xef\x55\xb2\xf7\x4a\x02\x03\x03\
-\xbd\x7f\xd7\xe9\x74\x12\x1e\x1e\xce\xea\xd5\xab\x4b\xdd\xb8\x31\
-\x9b\xcd\xcc\x9b\x37\x8f\x57\x5f\x7d\xd5\xdb\x78\xfa\xa7\x77\x9f\
-\x2e\x15\x10\x3a\x6c\xe9\xac\x58\xb9\x9d\x5b\x1e\x1e\x8e\xf5\xc0\
-\x5e\x0e\x1f\x6b\x49\x44\xa3\x6a\x25\x3a\xaf\xa0\xa0\x20\x6f\x80\
-\xed\x76\xbb\xb9\xf6\xda\x6b\x99\x3f\x7f\xbe\xf7\x6f\x96\x94\xc5\
-\x62\x61\xf2\xe4\xc9\xcc\x9b\x37\xaf\xc8\xcf\x4a\x2a\x6b\xc7\x4a\
-\x7e\x4a\xaf\xc3\x53\xcf\xdf\xc0\x47\x1f\xce\xe2\x81\x6e\x6f\x13\
-\x54\xc2\xa2\xf7\x34\x40\x35\x4d\x23\x37\x37\x97\x51\xa3\x46\x31\
-\x62\xc4\x88\x52\x8f\x28\xab\xaa\xca\x8c\x19\x33\x48\x4e\x4e\xf6\
-\x8e\xb4\x96\x6a\x0b\x9b\xfd\x5f\xf2\xfa\xbe\xc6\xcc\x7d\x22\x96\
-\xf9\x0b\xe7\xb2\xf6\xe0\xb5\x74\x6f\x10\x50\xe2\x7c\x2e\x1c\xe0\
-\x8f\x1f\x3f\x9e\x11\x23\x46\x90\x97\x97\x57\xaa\xb4\x85\x86\x86\
-\xd2\xae\x5d\x3b\x9c\x4e\xa7\xf7\xfe\x2b\x4d\xda\x12\x97\x7e\xcf\
-\x76\x77\x5d\x0c\xfe\xf5\xd9\x93\x92\x45\x87\xb8\x92\x8f\x0a\x04\
-\x04\x04\xa0\x69\x1a\x6e\xb7\x1b\x7f\x7f\x7f\xa6\x4c\x99\x42\xeb\
-\xd6\xad\x4b\xdd\xe9\x92\x93\x93\xc3\xd8\xb1\x63\xc9\xcc\xcc\xf4\
-\x06\xbc\x25\x1e\x9d\x56\x40\x5b\x3e\x86\x77\x33\xef\xe2\xed\x21\
-\x99\xcc\x79\x7f\x29\xd7\xbd\x72\x7b\x89\xcf\xc5\x64\x32\x15\x19\
-\x69\x5f\xb3\x66\x4d\xa9\x47\x03\x75\x3a\x1d\x36\x9b\x8d\x1b\x6e\
-\xb8\x01\x55\x55\x51\x14\xa5\x54\x23\xd3\x5a\xf6\x49\x76\xbc\xfb\
-\x18\x67\x43\x7b\x32\xac\xee\x2a\x5e\x58\x90\xcc\xd7\x43\x4b\xde\
-\xe9\x62\x30\x18\xd0\x34\x0d\xab\xd5\x4a\xbd\x7a\xf5\x98\x35\x6b\
-\x16\x31\x31\x31\xa5\x2e\xb7\xcc\xcc\x4c\x7a\xf6\xec\xe9\xad\xff\
-\x2d\x16\x4b\x85\x1b\x0d\x54\x14\x0d\xbb\x1a\xc6\x84\x0f\x3f\xe7\
-\xbe\x1a\x01\x1c\xd8\xb2\x80\x7e\x77\xbe\xca\x92\x65\xbd\x08\xd2\
-\xcc\x28\x18\xb0\x18\x4f\x30\xfd\xf9\xc9\x9c\xac\x7e\x2b\x93\x67\
-\xce\x61\x54\xc7\x4a\xb8\x0e\xdc\x4e\xef\x41\x8f\xf3\xd3\x57\xbf\
-\xd0\x3d\x38\x00\xf4\x16\x6e\x1d\xf4\x34\x0f\xf6\xba\x86\x4f\xfb\
-\xc6\x30\x36\xb1\x1b\xf7\xbe\x33\x8d\x17\x9b\xbb\xd0\x07\xe6\xb7\
-\x29\x36\xfe\xba\x92\xdc\x06\xed\xb9\x26\x69\x3b\xab\xd7\x6f\x66\
-\x60\xeb\xae\x28\x8a\x01\x13\x7a\x2e\x9b\x6d\xb6\x1d\x3c\xff\xf6\
-\x02\x9c\x75\xee\x62\xe5\xda\xb9\x34\x34\xe6\xf2\xd9\x2b\xc3\x78\
-\xf4\xed\x77\xd8\xfe\xd8\x8d\x18\xf5\x06\xcc\x7a\x9d\x77\x3a\xab\
-\x4e\xaf\x23\x2f\xcb\x49\xa7\x71\x33\x58\x31\x22\x8f\xf5\x9f\x3c\
-\xc5\xd0\xcf\x52\x98\x30\x63\x01\xb7\xd7\xd3\x30\x86\x5c\x9d\x2b\
-\xdc\x4a\x10\x58\xc1\xa9\x2a\x44\x55\x8b\xc3\xa8\xa6\x91\x9c\xb4\
-\x9c\x9d\xc9\x10\x19\x60\x63\xcf\x96\x9d\x54\xaf\xd3\x88\x8c\x23\
-\xfb\x0b\xdd\xb4\x10\x58\x29\x8e\x3e\x63\x47\xd2\x49\x77\x61\x43\
-\x4c\xe5\x81\x26\xa0\xd7\x2b\xf8\xef\xfe\x99\x2f\x56\xee\xa6\xfe\
-\xcd\x03\x18\xd2\xa7\x0e\x2a\x3a\xb4\x33\x5b\x98\xed\x56\x81\x20\
-\x6e\x7b\x70\x10\xf7\x55\xbd\xf8\x01\x18\xaf\x69\x28\x40\x40\x78\
-\x03\xee\xe9\xd3\x87\x08\x0d\x50\xbb\x70\x70\xe7\x16\x8e\x2c\xdd\
-\x49\x42\x52\x2a\x16\xbd\x1e\x0a\x6d\xc8\xac\x14\xfc\xdb\x12\xd7\
-\x84\x13\xbf\x7d\xc1\x9b\x73\x07\xf3\xce\xe0\xf0\xfc\x93\x55\x14\
-\x4c\x16\x3b\xdf\xbd\xfc\x3c\x87\xd4\x70\x1e\x9e\xf8\x16\x93\xc6\
-\xdd\x89\xa7\x49\x59\x7f\x76\x3d\xaa\x35\x98\xcc\x89\xc0\x58\xec\
-\xe9\x40\xe4\xd5\x5c\xd2\x0e\x8e\x1d\xde\x42\x4e\x70\x6d\xfa\x5d\
-\x6b\x67\xf3\x86\xf5\x64\x58\xfb\x13\x10\x04\x0a\x0a\x16\x3f\x13\
-\x29\xbb\xb7\xb1\x66\xc7\x21\x1a\x5f\xaf\xa0\x47\x8f\x4e\x01\xd4\
-\x34\x76\x6f\xde\x8c\xf3\x9a\xee\x34\xde\xff\x3b\x9f\xae\x38\x45\
-\xbf\x7a\x95\x50\x14\x1d\x7a\x9d\xee\xa2\x29\x3f\x89\xdf\x4e\x65\
-\x33\x71\x2c\x1e\x36\x8a\x2e\x2d\x63\xa8\xce\x49\x6e\x7c\x68\x1a\
-\xef\x6e\x9c\xca\x6b\xcd\xff\x60\xc3\xb7\x1f\x91\xd1\xe4\x0e\x16\
-\xbc\xfa\x14\x6d\x6b\x45\xd0\xbb\x6d\x6d\xa2\x3e\x58\x44\x6d\xed\
-\x2c\x10\x5e\x50\xa6\x7a\x74\xe8\xd0\x01\x28\x16\x4c\x4a\x20\xd6\
-\x6d\xdf\xb0\x7a\xd7\x08\x1a\x5d\x57\xe8\xdc\x7c\x8c\xdb\xed\x66\
-\xc4\x88\x11\xc4\xc7\xc7\x17\x69\x4c\x1b\x8d\x46\x8e\x1f\x3f\x4e\
-\x5c\x5c\x9c\xf7\xfb\xd8\xd8\x58\x6a\xd6\xac\x59\xea\xbf\xe5\xd9\
-\xc7\xcd\x33\x2d\x68\xda\xb4\x69\x2c\x5d\xba\xb4\x58\xa3\x08\x66\
-\xb3\x99\xe1\x23\x1e\xa6\xef\x1d\x5d\x39\xad\xfa\xd3\xb7\xde\x35\
-\xe8\x74\x5d\xf9\xf3\x97\x9d\xd0\x2b\x96\x49\x93\x26\xf1\xc3\x0f\
-\x3f\x14\x6b\xe1\x09\x97\xcb\xc5\xde\xbd\x7b\xbd\x5b\xd0\xe8\xf5\
-\x7a\xea\xd4\xa9\x53\xa6\x7c\xac\x52\xa5\x8a\xb7\x41\x63\x36\x9b\
-\x99\x3e\x7d\x3a\x4b\x97\x2e\x2d\x12\x30\x5f\xb8\x27\x60\xe1\x80\
-\x66\xce\x9c\x39\x84\xfb\xab\xa4\x38\x2d\x3c\x72\x5d\x07\x56\x25\
-\x1d\x23\x2f\x27\x0b\x97\xaa\xf1\xe8\xc3\x0f\x73\xe4\xc8\x91\x22\
-\x53\x44\xff\xae\x11\x99\x9d\x9d\xed\xfd\x3d\x8b\xc5\xe2\x5d\x2d\
-\xb8\xb4\xc2\xc2\xc2\xbc\xc7\x53\x55\x95\xd7\x5f\x7f\x9d\xb9\x73\
-\xe7\xfe\x63\x6f\xbe\xa6\x69\x04\x07\x07\xf3\xee\x7b\xd3\xc9\x4d\
-\xc8\xa4\x7e\x9b\x3a\x5c\xdb\xb2\x25\xdf\x28\x8b\xc8\xb3\x42\x56\
-\x46\x12\x2f\xbc\xf8\x12\xf1\xf1\xf1\xc5\x3a\x3f\xa7\xd3\x89\xbf\
-\xbf\xbf\xb7\x73\x22\x38\x38\x98\xba\x75\xeb\x96\x3a\x08\x74\xbb\
-\xdd\x84\x87\x87\x93\x98\x98\x88\x4e\xa7\xc3\xe5\x72\xd1\xa7\x4f\
-\x1f\x02\x03\x03\xff\xb1\xa1\xeb\x74\x3a\xa9\x56\xad\x1a\xb3\xe6\
-\x7c\xc6\xd9\x1d\x3b\xa9\xda\x63\x14\x4d\x6f\xce\x23\x62\xd3\x66\
-\x32\x4f\x9e\x63\xb7\x3d\x9e\x09\xcf\x3c\x57\xac\x20\x4e\xaf\xd7\
-\x93\x9c\x9c\x5c\x64\x2f\xc0\x88\x88\x08\xaa\x55\xab\x56\xa6\x6b\
-\xd2\xf3\x8e\x9a\x4e\xa7\x23\x39\x39\x99\x7e\xfd\xfa\x15\x2b\x6d\
-\x9e\xc0\x6d\xe9\xd2\xa5\xec\x39\x90\x45\x8d\xa6\x2d\x89\x49\xca\
-\x60\x4b\x7a\x2e\x1d\xe2\xc2\x58\xbf\x7e\x7d\xb1\x47\xf3\x3d\x33\
-\x00\x3c\xd3\xa3\xf5\x7a\x3d\x11\x11\x11\xd4\xae\x5d\xbb\xd4\xe9\
-\xca\xca\xca\xc2\xdf\xdf\x1f\x55\x55\x31\x99\x4c\xac\x5f\xbf\x9e\
-\x4e\x9d\x3a\x15\xab\x43\xc9\x6a\xb5\x72\xc7\x1d\x77\xf0\xc4\x33\
-\xcf\xb0\xe5\xfb\x15\x34\x19\x3c\x8b\x0e\x75\x7e\xe6\xe7\x2f\x37\
-\x91\xc1\xed\xcc\x9c\x34\x89\xe5\x2b\x57\x16\x2b\x88\x53\x14\x85\
-\x5d\xbb\x76\xd1\xbd\x7b\x77\x6f\x3e\x44\x47\x47\x97\xe9\xdd\xc4\
-\xac\xac\x2c\xef\xbd\xa0\x69\x1a\xab\x56\xad\xe2\xc6\x1b\x6f\x2c\
-\x56\x99\xa9\xaa\x9b\xeb\xaf\xbf\x81\xd7\xc6\x0f\xe3\xb7\x5f\xfe\
-\xc2\xf2\x60\x3b\x1e\x18\x6a\xe5\xb5\x37\xb7\xc2\xd0\xba\x4c\x9d\
-\x3a\x95\xaf\xbe\xfa\xaa\x58\x01\xb3\xa2\x28\xec\xdc\xb9\x93\xc6\
-\x8d\x1b\xa3\x69\x1a\x7e\x7e\x7e\xd4\xa8\x51\x83\xea\xd5\xab\x97\
-\x3a\x6d\x89\x89\x89\x45\x3a\xe2\x9e\x7f\xfe\x79\x3e\xfe\xf8\xe3\
-\x8b\xca\xe7\xce\x3b\xef\x64\xf4\xe8\xd1\x3e\xbc\x9d\x8d\x0e\xff\
-\xc0\x20\x22\xa3\xa2\x31\x5f\x73\x1b\x37\xd6\x7a\x9e\xa3\x47\x8e\
-\x50\xd7\xea\x02\x8c\xe8\x13\x76\xb0\x64\x7f\x2e\x9d\xee\xb8\x83\
-\x61\x37\x46\xe3\x0f\xd0\xfc\x4e\x7e\xdb\xd1\x1b\x87\x3d\x9d\x37\
-\x06\xbc\x0d\x8a\x82\x7f\x70\x18\xfe\x66\x13\x81\x66\x1d\x8a\xde\
-\x88\x7f\x48\x04\xa1\xde\xf6\xdc\x49\x56\xfe\xb2\x87\xa6\xf7\xff\
-\xc8\xb0\x75\x37\x30\x69\xd5\x3a\x18\xd3\xf5\x1f\xdb\x10\xae\xf8\
-\x5f\xd9\x9f\x92\x4b\xa3\xb1\xe3\x68\x1e\x12\x00\x04\xd0\xe9\xa6\
-\x5b\x88\x9a\xf1\x02\xab\xe2\xf3\xf0\xd3\x83\x76\x89\x7a\xda\x12\
-\x5e\x99\xc0\x50\x27\x81\x7e\x46\xd0\x19\x08\x8b\xa8\x42\xe5\xaa\
-\x12\x76\x48\x10\xe8\xc3\x51\xa0\x29\xba\x1a\x4d\x34\x13\x27\x4f\
-\x1e\x63\xfb\xce\x93\x74\x6c\xbd\x8b\xad\x07\xcc\x34\x6a\x17\xc7\
-\xa6\x23\xfb\x8a\xfc\x7a\x7a\xe2\x76\x26\x74\xef\x41\xa4\x01\xdc\
-\x68\x38\x9d\x70\xf3\xc8\x37\x18\x7f\xe7\x35\x5c\xd8\x7e\xd0\xd0\
-\xf2\x17\x60\x01\x34\x05\xd0\xf4\x40\x0a\x6f\xdf\xdf\x9f\xaf\xfc\
-\x0c\xa8\x68\x38\x9c\x06\x5a\xf6\xbc\x9f\xe7\x46\xdf\x8d\x27\xb4\
-\x53\x55\x1b\xe9\x68\xf8\xe5\xe4\x70\x6e\xf7\x06\xf6\xc7\x1f\x47\
-\x17\x5c\x8b\xa6\xcd\x23\x38\xe8\xba\xf8\x81\xa2\x01\xb1\xad\x86\
-\xd2\xc3\xf9\x36\x9f\x7f\xf0\x0a\xf7\x77\x7f\x0f\xa3\x41\x01\x0c\
-\x98\x1c\xfb\x59\xfc\xeb\x29\xfc\x62\x1a\xd3\xb6\x5d\xf3\xfc\x00\
-\x50\x73\x91\x97\x67\xc3\x65\xa8\xc4\xb0\xe7\xdf\x41\xaf\x28\x18\
-\x0c\x57\xf7\x5b\x81\x6a\x5e\x0e\xf1\x6b\x97\x11\xd0\xe1\x6e\x1e\
-\xef\x9c\xc2\xed\x63\x36\x70\x34\x2d\x8b\x98\x20\x1d\x9a\xea\xc2\
-\x14\xd1\x94\xae\x0d\x43\x99\xf7\xd5\x2a\x06\xb4\xaa\x83\x52\x10\
-\xf4\x6b\xa9\xa7\xd8\xb4\x7d\x3f\x6d\x6f\x9b\x4c\xcb\xea\x7f\xf1\
-\xca\x9c\x6f\xe0\xd1\xcb\x2f\x88\xb0\x7f\xfb\x5e\xcc\x95\x9a\x13\
-\x5c\x35\x06\x80\x66\xd7\xb4\xa5\x92\x11\x76\x6c\x39\x06\x41\x07\
-\xd9\xb3\xed\x00\xf5\x1a\xdd\x47\xb5\xc8\x08\x34\x47\x0e\x39\x96\
-\x5a\x8c\x9d\xf0\x2c\x46\xc3\xa5\xa6\xe3\x6a\xb8\x5c\x3a\x9a\x74\
-\xea\xc6\x7d\xad\x0f\x31\x6b\xde\x2a\x1e\x68\x59\xcb\x67\x4b\x49\
-\xd3\x34\x0e\x1d\x3a\xc4\xae\x5d\xbb\x8a\x34\xa6\x75\x3a\x5d\x99\
-\xdf\x93\xfb\xa7\x5e\xef\x93\x27\x4f\x92\x93\x93\x53\xac\xdf\xb7\
-\x58\xfc\x38\x77\x2e\xd5\x73\x87\x82\x06\x9a\x4e\x8f\xa2\xe5\x07\
-\x22\xc9\x49\x49\xec\xd8\xb1\xa3\x58\xa3\x54\x9e\xde\xed\x7f\x63\
-\x41\x1a\xcf\x8a\x85\x9e\xe5\xc7\x0b\x37\xde\x2e\xd7\xb0\xcc\xce\
-\xce\xc6\xe1\x70\xa2\x0b\x30\x00\x0a\x06\x9d\x1e\x74\xe7\x6f\xed\
-\xf8\xf8\x78\x76\xef\xde\xfd\x8f\x41\x60\x59\xdf\x47\xfa\xbb\x34\
-\x15\xfe\x1b\x09\x09\x09\x9c\x3e\x7d\xfa\x1f\xff\x96\xa6\x69\x54\
-\xaa\x54\x09\x9b\x2d\x0f\x0d\xc5\xdb\x80\x51\x14\x05\xb4\xfc\xe9\
-\xb8\x07\x0f\x1e\x64\xd7\xae\x5d\xc5\x7a\x5f\x4d\x55\xd5\x7f\xa5\
-\x61\xe8\xc9\x4f\xcf\x02\x31\xc5\x19\x9d\xb0\xdb\xed\x64\x67\x67\
-\xe3\x72\xb9\x70\xbb\xb5\x82\xb2\x51\x40\xd1\x15\x94\x69\x0e\x7b\
-\xf6\xec\x29\xd6\xf5\xad\x28\x0a\x56\xab\xb5\x48\xf0\xf0\x6f\x94\
-\xe3\xc1\x83\x07\x8b\x7d\xcd\x7b\xf6\xb8\x73\x6b\x1a\x3a\x14\x0c\
-\x9a\x8a\x5b\x53\xbd\x81\xca\x8e\x1d\x3b\x8a\xbd\xed\x84\xdb\xed\
-\xf6\x76\x26\xfd\x1b\x65\x97\x9d\x9d\xcd\xee\xdd\xbb\x8b\xf5\xfb\
-\x39\x39\x39\xb4\x6a\xd5\x0a\x55\x05\x87\x4b\xcd\x7f\xad\x18\x05\
-\x85\xfc\xb4\x25\x25\x26\xb2\x73\xe7\xce\x62\x07\x81\xe9\xe9\xe9\
-\x45\xf2\xb4\xbc\xcb\xcd\x66\xb3\xb1\x63\xc7\x8e\x62\x1d\xd7\xe5\
-\x72\x51\xad\x5a\x75\x14\x45\x87\xd3\x05\x06\x74\x60\x34\xa0\xba\
-\xf3\x3b\xa2\x92\x93\x93\xd9\xbe\x7d\x7b\xb1\xa6\x74\x2a\x8a\x42\
-\x56\x56\xd6\xbf\x36\x52\xa7\xd7\xeb\x49\x4c\x4c\x24\x35\x35\xf5\
-\xa2\xba\x30\xbf\x7c\x7c\x7b\xd6\x8c\x27\xff\x8c\x06\x03\xa1\x21\
-\x7a\x4e\xe6\xd9\xbc\x2b\xdb\xbb\x33\xd2\x39\xe7\x86\xea\x95\xaa\
-\x11\x0a\xe4\xfc\x3e\x8d\x2e\x23\xde\x21\x39\x33\x97\xfa\x8d\x07\
-\x33\xa0\x41\xb8\x77\xed\x09\x4f\x5b\xf0\xfc\x31\x0b\x16\x70\x39\
-\xf0\x33\xbf\x9d\x82\x91\x3d\x1b\xd0\x35\xfc\x16\xc6\xbe\xb6\x9a\
-\x8d\x79\x2f\x60\xfe\x87\x28\x30\x3b\xe3\x24\x36\x3b\x44\xd5\x38\
-\x7f\xbf\x05\x04\x85\x13\xe0\x97\x4b\xca\x29\x27\x35\x2f\x77\xfb\
-\x17\x3c\x54\x3d\x97\x85\x2c\x2e\x28\x41\xa0\x6f\xd3\x54\xec\x01\
-\xd1\xb4\xab\x61\x26\x79\xfb\x7e\x36\xef\xde\x47\x8e\xdf\x2f\x1c\
-\x32\x55\xe3\xbe\x5a\xb1\x6c\xe1\x82\xde\x0e\x47\x0e\x47\xf6\xed\
-\xe6\x44\x7e\xdb\x03\x97\xdd\x49\xdd\x33\xd9\x45\x2b\xbd\xcb\x57\
-\x87\x80\x93\xc4\x03\xfb\x48\xd7\xe7\x2f\x0e\xe3\x74\x18\xa8\xd4\
-\x2c\x05\xcf\x6c\x69\x45\xa7\xe7\xd4\xde\x8f\xa9\xab\x14\xed\xd5\
-\xba\xfb\x7f\x4b\xb9\xa5\x0a\xec\x56\x2f\x7d\x43\x19\x43\xab\xf2\
-\xc8\x03\x4f\x31\xbb\xcb\x44\xbe\xf9\xf4\x3a\x72\xdd\x86\xfc\x69\
-\x2a\xb9\xb9\xa4\x39\x54\x4c\xfe\x7e\x04\x5a\x0a\x1a\x3d\xb6\x15\
-\x3c\x78\xcb\x53\xfc\x71\x3c\x03\x03\x1a\xa6\xea\xed\x79\xfb\xbd\
-\xd9\xf4\x69\x15\x7a\xd5\x16\x73\x5e\xee\x39\x56\xff\xb2\x93\xea\
-\x83\xc7\xd3\xa4\x8d\x8b\x70\xf5\x2b\x3e\xdd\x76\x86\x1b\x6a\x54\
-\xcd\x6f\x14\xea\x4c\xdc\x72\xf7\xdd\x7c\x31\xe9\x23\x3e\xdc\x34\
-\x92\xfc\xf5\xb3\x34\x52\x4f\x1e\x65\xf7\x31\xe8\x57\xbf\x1a\xcd\
-\x02\x5b\xa1\xfb\x6e\x1e\x9f\xa7\xbf\x4e\xbb\xcb\xdc\x45\x79\x79\
-\x36\x74\x46\x23\x9e\xc1\x08\x93\xd1\x84\x5e\x0f\x36\xab\x15\x5c\
-\x4e\x1c\x0e\x15\x83\xc9\x84\x31\x00\x92\x67\x0f\xa4\xc6\xc8\xef\
-\x51\x55\xe8\x3f\x64\x26\x5f\x7e\x32\xfc\x52\x8f\x63\x94\xa8\xe6\
-\xdc\x36\xf6\x21\xe6\xb5\x79\x92\x0f\x36\x3d\x56\x70\x6e\x3e\x58\
-\xb1\x18\x0c\xac\x5d\xbb\xf6\x92\xff\xd7\xa4\x49\x13\xef\x48\x96\
-\xdb\xed\xe6\xcc\x99\x33\xa4\xa4\xa4\x94\x7a\x3a\x68\x7a\x7a\xba\
-\xf7\xe1\x92\x95\x95\xc5\x07\x1f\x7c\xc0\x88\x11\x23\x4a\xda\x2c\
-\x22\x5c\xc9\xe3\x60\xd2\x51\x94\xb5\x1b\x09\xa9\xdd\x13\x80\xf7\
-\x3f\xf8\x80\xf7\x3f\xf8\xa0\x78\xd7\x55\x5e\x1e\xb7\xde\x7a\xab\
-\x77\x94\x46\x55\xd5\x32\xed\xa9\x69\x36\x9b\xbd\x8b\x5d\x78\x1a\
-\xf4\xd3\xa6\x4d\x63\xf8\xf0\xe1\x97\x6c\x3c\x14\x7e\x17\x30\x3f\
-\x88\xc8\x5f\x18\xc6\x61\x3d\x4b\x25\x93\x83\xf5\x7b\xf7\x90\x6b\
-\x75\x60\x09\x08\xc2\x6c\x34\xb0\x66\xcd\x1a\xef\x76\x11\xc5\x69\
-\x94\x85\x86\x9e\xaf\x13\x1c\x0e\x07\x29\x29\x29\xa5\x0e\x10\x2d\
-\x16\x0b\xb9\xb9\xb9\x45\x02\xdc\xd9\xb3\x67\x33\x60\xc0\x80\x12\
-\x1d\xe7\x6c\xea\x3e\x8e\xfd\x91\xcc\xbe\x3a\x7a\x32\xd4\x40\xcc\
-\x16\xa8\x5c\xa7\x2e\xeb\xd7\xaf\x2f\xf6\x31\xb2\xb3\xb3\xbd\xef\
-\x6e\x7a\xf2\x39\x39\x39\xb9\x4c\xd3\x41\x73\x72\x72\xbc\x23\x9c\
-\x9e\x11\xb3\x92\x4e\x9b\x0c\x68\x54\x97\x93\x53\x56\x90\xdc\x2a\
-\x8c\xcc\x94\x2c\xfc\x23\x42\xb9\xae\x79\x1c\x49\x49\x49\xc5\x3e\
-\xc6\x8f\x3f\xfe\x58\x64\x0b\x87\xec\xec\x6c\x52\x53\x53\xcb\x34\
-\x1d\xd4\x33\x15\x54\x55\x55\x6a\xd4\xa8\xc1\xa6\x4d\x9b\xa8\x5c\
-\xb9\x72\x89\x8e\x53\xbf\x86\x3f\x6b\x8e\x1d\x20\x45\xab\xc6\x2d\
-\xc1\xf9\x41\x6a\xf7\xee\xdd\xc9\xca\xca\x2a\xf6\x31\xf6\xee\xdd\
-\x4b\x8f\x1e\x3d\xbc\xe7\x92\x99\x99\x59\xa6\xfb\x2d\x27\x27\x07\
-\xbb\xdd\xee\x1d\xf9\xee\xd5\xab\x17\x4b\x96\x2c\x29\xf1\x71\xda\
-\xdc\xd4\x8e\x31\xdf\x2d\x65\xef\xbd\x89\xd8\xa3\x1b\x13\x0a\xcc\
-\xf8\xf0\x43\x66\x7c\xf8\x61\xb1\x8f\xf1\xec\xb3\xcf\x72\xfc\xf8\
-\x71\xef\xf7\xe7\xce\x9d\x23\x33\x33\xb3\xd4\xd3\x41\xad\x56\x6b\
-\x91\x11\xf6\xbe\x7d\xfb\xb2\x70\xe1\xc2\x12\x1d\xc7\x9d\x91\x40\
-\xfb\xeb\xab\xb0\xd1\xb6\x9b\xe5\xdf\x6d\xa5\x5e\xbb\xfc\x3a\x72\
-\xca\x94\x29\x4c\x99\x32\xa5\xd8\xc7\xb9\xf7\xde\x7b\x39\x76\xec\
-\x18\x8a\xa2\xe0\x74\x3a\x49\x49\x49\xc1\x60\x30\x94\x3a\x40\x2b\
-\xbc\x20\x50\x46\x46\x06\x8b\x16\x2d\xa2\x67\xcf\x9e\x15\xb2\x6d\
-\xa2\x14\x04\xfe\x0e\x47\x2e\xc9\xa7\x5d\x84\x86\x85\x60\x3c\x9b\
-\x3f\x7d\x56\x17\x12\x4c\xa8\x0e\xb2\x32\xce\x90\x07\x18\xc3\xe2\
-\xb8\xa1\x53\x1b\x16\xce\x5f\xc4\x89\x53\xe9\xe8\x1b\xff\x73\x7d\
-\xb5\xf9\xa7\xdf\xc8\xb2\x19\x38\xb7\x78\x36\x0b\xf2\x8c\x90\x7e\
-\x84\x5f\x7e\x3b\xc1\x0d\x96\xfc\x8e\x42\x9d\x72\xe9\x68\x2e\x28\
-\xb8\x0a\x26\x33\x9c\x49\x4a\x06\xa2\x0b\xda\x51\x99\x58\xf3\x2c\
-\x54\xa9\x62\x40\x55\xf3\xdb\xcf\xb2\xde\xa7\x04\x81\x15\x9b\xa2\
-\x62\xb3\x59\x68\x75\x6d\x13\xd4\x1d\xab\x98\xb5\x7d\x0b\x6b\x8e\
-\xff\x86\xa5\x7a\x3d\x6a\x55\x8b\xbe\x68\xb8\x3b\xa8\x7a\x1b\x66\
-\xae\xf9\x91\x6e\x21\x60\x73\xab\x68\x28\x58\x02\x82\x8a\x5b\xa5\
-\x02\x95\x78\x61\xc5\x3a\x86\xc6\x04\x93\x3f\xa8\xa7\x60\xf4\xf3\
-\x27\x08\x48\x25\x7f\x99\xdf\xd0\x98\x2e\x3c\xf3\xca\x00\x02\x73\
-\x73\x39\xba\xfd\x57\xe6\x7f\xfd\x13\xeb\xbe\x9c\xcb\xa9\xc7\xaf\
-\x45\x7f\xb9\x3b\x4e\xd3\x53\xfb\x86\x07\x78\xa2\xf7\x07\xcc\xfb\
-\x64\x16\x41\xba\xcc\x82\x13\x8e\xa4\x7a\xb0\x8e\xdf\xac\xb9\xa4\
-\x67\x16\xf4\x24\x1b\xa2\x68\xdb\xf1\x26\x02\x1a\x66\xb2\x6d\xd9\
-\x17\xec\x4a\x38\x4d\x76\x9e\xeb\xaa\x2e\xe6\x9c\xbf\xbe\x65\xe9\
-\x5f\x4e\x2c\xb3\x9f\xa3\xd3\xf7\x7a\x4e\xa6\xe7\xf1\xcd\xac\x5f\
-\xf9\xb4\xef\x83\x05\x3d\x9f\x6e\xa2\xae\xb9\x95\x61\x37\x7e\xce\
-\xd3\xcf\xcf\xc6\xac\x98\x50\x34\x95\x94\xe3\xbb\x38\x9a\x92\xc0\
-\xcc\x97\x86\x13\xe8\x38\x83\xca\x19\x3e\x9f\x7d\x90\x4e\x9d\xcd\
-\xf9\x4b\x30\x5f\xb0\xf0\x67\xed\x3a\xd5\xc9\xdd\x98\x82\x3d\x33\
-\x17\x22\x03\x38\x91\x74\x8c\x4c\x1b\xd4\x6e\x58\x03\x2a\x47\x11\
-\x5b\xbd\x12\x2b\x4e\x9c\x20\x27\x07\x62\x7b\xbc\xc8\x4f\x5f\x76\
-\xe0\x89\x21\xcf\xa1\x29\x97\xef\x56\x73\x3a\xdc\xc4\xc6\xdc\xc2\
-\xf0\x9b\x82\x98\xe8\x39\xb7\x0a\x96\xff\x4e\xa7\xd3\x1b\x78\x24\
-\x26\x26\x72\xdf\x7d\xf7\x15\x7b\x3a\xd9\xe5\x7a\x96\xad\x56\x2b\
-\xaa\xaa\xa2\xd7\xeb\x39\x77\xee\x9c\xb7\xf1\x5d\x7c\x7e\x0c\xe8\
-\xdd\x8e\x17\xdf\x79\x15\xf4\x75\x79\x61\x66\xbd\x12\x9f\x4b\x46\
-\x46\x86\x77\xd1\x05\xb7\xdb\x4d\x4a\x4a\x0a\x5d\xba\x74\x29\xf5\
-\x6a\x8c\x8a\xa2\x90\x9a\x9a\x8a\xdd\x6e\xf7\xbe\x5b\xe6\x59\x04\
-\xe7\x72\xbf\x7f\xe1\x36\x10\x8a\xa2\xa0\x0f\x88\xa4\x5b\xe7\xc6\
-\xbc\xf2\xee\x7b\x5c\x73\xcb\x3d\xd4\xab\x1d\xe7\xcd\xff\xe2\xf6\
-\xc8\x9f\x3c\x79\xd2\xdb\x88\x74\x38\x1c\xac\x5f\xbf\x9e\x0e\x1d\
-\x3a\x60\x34\x1a\x4b\xbd\x30\x4c\x62\x62\xa2\x77\x61\x19\xcf\xf4\
-\xd5\x92\x8a\xec\xd0\x95\x0e\xbf\x4d\xe6\xcd\x57\x17\xd3\xea\xce\
-\x67\x09\x29\xc5\x13\xcd\xf3\x0e\x98\xa7\xc1\x3c\x7d\xfa\x74\x16\
-\x2e\x5c\x58\xea\xd1\x0a\x55\x55\x49\x48\x48\xe0\xae\xbb\xee\xf2\
-\x06\xb9\xc9\xc9\xc9\x34\x68\xd0\xa0\x44\xc7\x31\xb5\xbe\x9f\x87\
-\x2a\x0d\x63\xf0\xeb\x01\xb4\xed\x74\x07\xd7\x35\x29\xf9\xa2\x27\
-\xe9\xe9\xe9\x45\xee\xab\x49\x93\x26\xf1\xd9\x67\x9f\x95\x3a\x50\
-\x32\x99\x4c\x1c\x3d\x7a\x94\xb6\x6d\xdb\x7a\xaf\x85\xb3\x67\xcf\
-\x96\x3c\x08\xbc\xa3\x07\x75\x5e\x98\xc4\x56\xa3\x9d\x56\xd1\xb7\
-\x97\xea\x5c\x4e\x9e\x3c\xe9\xbd\x8e\xcf\x9e\x3d\xcb\xd0\xa1\x43\
-\x09\x0f\x0f\x2f\x75\xbd\xe4\x29\xb7\x5e\xbd\x7a\x79\x3b\x03\xac\
-\x56\x6b\x89\x47\x89\x03\xfb\x4f\xe7\x9e\xc5\x83\x99\x3e\xaf\x09\
-\xc3\x5f\x78\xb0\x4c\x81\x8d\xa7\xec\x3a\x75\xea\xe4\x7d\x97\xae\
-\x34\xf5\x48\x5e\x5e\x1e\xa9\xa9\xa9\xde\x7a\xc4\x33\xb5\xbb\x24\
-\xf4\xa1\xd1\xdc\xf0\xf4\xdb\x1c\x7c\x6f\x3e\xaf\x6f\x8e\xe1\x7f\
-\x5f\x94\x6e\xaa\xbb\x67\xfa\xbe\xc1\x60\xe0\xc0\x81\x03\xf4\xee\
-\xdd\xbb\x4c\x7b\x8f\xda\xed\x76\x32\x32\x32\xbc\xf7\xaf\x67\x36\
-\x41\x85\x7a\x2f\x50\x51\x50\xd0\x70\x58\xad\x58\x33\xcf\xb2\x71\
-\xcd\xd7\xfc\x7e\x22\x98\xa7\x1b\x36\xc2\x98\xfc\x5b\x7e\x7b\xb1\
-\x7a\x73\x6e\x8d\x33\x31\x7d\xed\x77\x7c\xba\xe9\x36\x46\xb5\xbb\
-\x93\xff\x3d\xad\x67\xf5\xe2\xa5\x38\x8a\xb5\x34\xf2\x01\x7e\xfa\
-\xf3\x20\xf8\xb9\x59\xf2\xf9\x47\x28\x28\x98\x8d\x76\xb6\xac\x5a\
-\x41\xd3\xda\xfe\xe8\x71\x93\x75\xf6\x0c\xa7\x75\x76\x34\xc0\x6c\
-\x09\x26\x34\xc4\x1f\x05\x30\x34\xb8\x89\x86\x55\xfc\xd8\xfc\xdd\
-\x34\xf6\x8f\x5f\x40\xa3\xa0\x3c\xfe\x58\xf9\x0b\x49\x34\xa5\x6b\
-\xfd\x40\xb6\x5a\x02\xb1\x65\x1d\x64\xbf\x0d\xaa\x5a\xcf\x92\x78\
-\x36\x8d\xd8\x90\x82\x77\x0c\xb5\xfc\x21\x0f\xcf\x8c\x2a\x21\x41\
-\xa0\x4f\x73\xd9\xec\x54\x6e\x79\x2d\x3d\xef\xb8\x86\x97\x3f\xfe\
-\x86\x59\xfa\xe3\xd4\xb8\x69\x00\xb1\x55\x40\xbd\xa8\x87\x4d\x8f\
-\xc5\x3f\x00\xff\x00\x30\x14\x8c\xca\xa9\xaa\x1b\x0d\x43\x31\x1b\
-\xe6\x0a\x66\x7f\x0b\xfe\x01\x81\xb8\x01\x05\x8d\xf3\xcf\x6b\x05\
-\x34\x8d\xc0\xc8\x16\x3c\x36\x64\x18\x16\x80\x13\x6d\x39\xb0\x63\
-\x0b\x3f\xef\x5c\xc6\xbe\x6c\x2e\x1b\x04\x6a\x68\xa0\x8b\x60\xf0\
-\x53\x13\x58\xda\xf7\x61\xb6\xa6\x38\x41\x17\x8c\x43\x57\x87\xfe\
-\xf7\x34\x65\xce\xdb\x7b\x59\xfe\xe3\x32\x7a\xb4\x7b\x94\x98\xc0\
-\x96\x8c\x9b\xd4\x92\xf4\xf8\x15\xf4\xf9\x79\x1e\xe8\xf4\xff\xb8\
-\x4f\x4c\x45\xb7\x6d\xee\x97\xe4\x05\xc5\x72\x6b\xc7\x2e\x54\x0e\
-\x54\xa9\xea\xe7\x60\xd9\xea\x8f\xf9\xc3\x3e\x8a\x18\xbd\x86\x0e\
-\x95\x5c\x67\x04\x0f\x8d\x1f\xca\x94\x16\x0f\x72\x48\x0b\x45\x51\
-\xcf\x11\xff\xc7\x0f\xf8\xc7\x34\xe7\x86\xeb\xdb\x10\x66\xce\xc5\
-\xbd\x60\x21\xbb\x17\x7d\x4c\x6a\xe7\xd6\x38\xd2\x93\xf8\x63\xd9\
-\x1a\xce\x06\xe4\xe2\xc2\xc4\x35\xd7\xdd\x4c\x93\x3e\x83\x88\x9e\
-\x3e\x8e\xe5\x2b\x7f\xa1\xb2\xab\x2a\x93\xdf\x9d\x43\x66\x58\x67\
-\x86\xde\x1c\x08\x96\x8e\xb4\xbb\xad\x27\x93\x9f\x5e\xc0\xc7\x9f\
-\x77\x64\x68\xcf\x56\xb8\x8e\xef\xe7\xa8\x55\xa3\x95\x5e\x57\xf8\
-\x12\xe1\xfc\x1c\xbe\xfc\xe9\x45\xd9\xc0\xc3\x13\x86\x31\xbd\xcd\
-\x30\x0e\x69\xc1\x97\xef\x0c\xf0\xd9\xe7\x5d\xfe\x09\xb7\x6a\xd5\
-\x8a\xe7\x9e\x7b\xae\xc8\x0a\x95\xa5\xa1\xd3\xe9\x30\x9b\xcd\xb4\
-\x6a\xd5\xca\xbb\x80\x42\x89\x69\x50\xbd\xe3\x7d\x7c\xd2\xe2\x76\
-\xb4\xc0\x60\xf4\x65\x58\xc4\xde\xe1\x70\x30\x60\xc0\x00\x5a\xb7\
-\x6e\x5d\xe6\x0d\x91\x15\x45\xc1\xdf\xdf\x9f\x4a\x95\x2a\xfd\x6d\
-\xc3\xc6\xf3\x73\x4f\x10\xe8\xf9\xb7\xaa\xaa\x68\x7a\x3d\x4d\x6e\
-\x1d\xc6\xb7\x37\x0d\x04\x93\x05\x43\xa1\xd1\xbf\x92\xae\xa6\xea\
-\x70\x38\x18\x36\x6c\x18\x6d\xda\xb4\x29\xb2\xcf\x60\x89\xb3\xbb\
-\x60\x33\xe5\x90\x90\x10\xc2\xc2\xc2\x4a\xbd\xaa\x9f\x46\x38\x0f\
-\x3e\xf7\x06\xfd\x72\xdd\x04\x06\x94\xfe\x71\xa6\xaa\x2a\x01\x01\
-\x01\xde\xf7\x58\xcb\xc3\xf5\xd7\x5f\xef\x9d\x4e\x58\xba\x6b\x20\
-\x98\xe1\xef\x7d\xc3\xe0\x3c\x3b\x26\x8b\xb9\x4c\xf7\x5a\x4e\x4e\
-\x0e\x4f\x3f\xfd\x34\x46\xa3\xb1\x4c\x2b\x28\x7a\xae\xc1\x6b\xaf\
-\xbd\xb6\xc8\x3b\xa2\x25\x8f\x26\x6b\x31\xea\xcd\x8f\xc1\xa5\x82\
-\x41\x5f\xea\xb4\xb9\xdd\x6e\x62\x62\x62\x78\xf6\xd9\x67\x49\x4d\
-\x4d\x2d\x73\xc3\xdf\x60\x30\xd0\xa5\x4b\x17\x36\x6d\xda\x54\x86\
-\xa3\x44\xf3\xdc\x57\x2b\x70\x3a\x35\x8c\x46\xa5\x54\x35\x89\x67\
-\x05\xcd\x1a\x35\x6a\xf0\xec\xb3\xcf\x96\x79\x1a\x9d\x67\x85\xd0\
-\xe8\xe8\xe8\x32\x04\x48\x46\x94\xc8\xce\x8c\x78\xb9\x33\x23\xca\
-\xf8\xcc\xd1\x34\x8d\x86\x0d\x1b\x32\x61\xc2\x84\x72\x09\xd6\x82\
-\x83\x83\x69\xd0\xa0\x01\x0e\x87\xa3\x42\x6e\x11\xe1\xcc\xcb\xc5\
-\x49\x1a\xef\x3f\xfe\x10\x3f\x07\x68\xec\x5c\xf7\x07\x95\xba\x8c\
-\xe4\x8e\x1e\xed\xf8\xf1\xbb\x97\xd0\x70\x90\x66\x8b\x65\xd4\x1b\
-\x8f\xf1\x69\xf7\xd7\x18\x73\x7b\x37\x36\xdd\x79\x2d\xc7\xb7\x6f\
-\xc5\xae\x39\x48\x3d\x97\x85\xdd\x9a\x01\x59\x3a\xec\x8e\xfc\xfb\
-\xdb\x96\x9d\x8b\x33\x23\x07\xab\x4b\x01\x32\x49\x5b\xf2\x3e\xbf\
-\xac\xde\x46\xab\x81\x1f\x30\x6d\xd4\x8d\x18\xd5\x1c\xe6\x4c\xb8\
-\x87\xf7\x57\x2c\xa6\xd6\x75\xa1\xe8\x39\xce\xeb\x0f\x3d\xc8\x27\
-\x26\x1d\x6e\xcd\x40\x93\x8e\x03\x79\xe7\xcd\x21\xf9\x2b\x12\xfb\
-\xb5\xe4\xf5\xa7\x06\xd1\x6d\xf4\x4c\xee\xe8\xe1\xa2\x4b\xf5\x5c\
-\xbe\xff\xe1\x77\xba\x8c\xf9\x84\x16\xa1\x81\x98\x6f\xed\x85\xff\
-\xe7\x6f\x31\xf2\xd6\xfb\x69\x17\x78\x98\xdf\xe2\xf3\x18\x5b\xcb\
-\x92\x3f\x55\x5f\x03\x87\x2d\x87\x9c\xec\x3c\xec\x2e\x99\x0e\x2a\
-\x41\xa0\xcf\x47\x81\x79\xb8\x2a\xb5\xa6\x69\xef\x3b\x08\x79\xe9\
-\x05\xd6\xfa\x85\x32\xa8\x55\x27\xc2\xf5\xcb\xf3\x83\xc0\x42\xd7\
-\x70\xe6\xa9\x7d\xbc\x36\xf8\x6e\x66\x1b\x35\xdc\x1a\x28\x9a\x9b\
-\x5c\x53\x3d\x96\x7c\x3e\x19\x8b\x59\xc7\x05\xbf\x7e\x61\xd3\x15\
-\x48\x67\xd6\xc8\x61\xac\xb2\xe8\x0b\x8e\xed\x22\x4b\xad\xca\x4b\
-\xaf\xbe\x42\x4c\x41\x20\xa0\xaa\x4e\xac\x80\x05\x50\xdd\xa0\x37\
-\xe8\x41\xef\xc0\xe5\x3e\x7f\x74\xed\xe2\x1a\x16\x80\xb8\xb6\x77\
-\x32\xf4\xfe\x25\xec\xff\xdf\x0f\x58\x35\x0d\xa7\x1d\x3a\x3d\xfa\
-\x0e\xbd\x7f\xb8\x85\x45\xef\xbe\xc4\xd9\xc3\xeb\x69\x54\xab\x2a\
-\x46\x67\x26\x9b\x57\x2c\x66\xf3\x09\x15\xbf\x1a\x0a\x57\xf5\x6d\
-\x9a\xbd\x85\x67\x3f\xd8\x47\xd5\x6b\x87\xf3\xce\x67\x33\x89\xd3\
-\xc3\xc1\x6f\x26\xb0\xac\xff\x5b\x4c\x9c\xb6\x81\xf9\x8d\x73\xc8\
-\x3d\x95\x4e\x46\x66\x26\x74\x18\xc4\x8b\xfd\xdf\x60\xc0\x9c\x78\
-\x92\x37\x7f\xc0\xda\xe9\xdb\x68\xf9\xc8\xc7\x7c\x38\x79\x28\x41\
-\x46\x98\x1e\xbf\x94\x31\xab\x3f\x62\xf9\x1f\x13\x49\xdc\xfb\x3b\
-\x8f\xdf\xdb\x0d\x93\xe2\xc6\xe1\x54\x98\xb5\x25\x8f\x61\x2d\x06\
-\xf0\xdc\xb8\x3f\x79\x72\xe2\x50\x3e\xc0\x4e\x8a\x5a\x9b\xd7\x66\
-\x4d\xa3\x9d\x25\xbf\xa1\xd0\xe1\xee\x27\x19\xbe\x7c\x33\x53\x1e\
-\x1f\xc0\xe7\x6f\x84\x90\x61\x69\xcc\x5d\xd7\xe8\x38\x9a\x70\x7e\
-\xb4\x27\x2f\xe3\x2c\x2a\x09\xe4\xa8\x1a\x39\xa9\xc9\xa4\xbb\xd3\
-\xb0\x03\xba\x46\x0f\xf2\x62\xff\x37\x19\x30\x27\x9e\x54\x5b\xc5\
-\x2c\xb1\xd8\xd8\x58\x5e\x7b\xed\xb5\x72\x3b\xde\xe9\xd3\xa7\x4b\
-\x3d\xcd\xcd\xd3\x4a\xd3\x05\x06\x17\xfd\x41\x29\x1a\x37\x4e\xa7\
-\x93\x7b\xef\xbd\xb7\x5c\x1b\x23\xc7\x8e\x1d\x2b\x51\xa3\xdf\x13\
-\xe4\x15\xd9\x10\xde\x68\x2c\x12\xf8\x95\xf4\xfc\x14\x45\xc1\x6e\
-\xb7\xf3\xe0\x83\x0f\xd2\xbf\x7f\xff\x72\x4b\xdb\xfe\xfd\xfb\xbd\
-\xef\xbd\x94\xae\xd8\x94\x32\x05\x80\x9e\x20\x30\x30\x30\x90\xbe\
-\x7d\xfb\x96\xeb\x35\x7e\xf8\xf0\xe1\x32\x37\xe0\x4b\x1b\x00\x16\
-\x2e\xb7\x9c\x9c\x1c\xde\x7c\xf3\xcd\x72\x4d\xdb\xfc\xf9\xf3\xcb\
-\x98\x36\xa5\xd4\x01\xa0\x87\xdb\xed\xa6\x5a\xb5\x6a\x3c\xf9\xe4\
-\x93\xe5\xdb\x28\x77\x96\x7d\x09\x7b\xa3\x51\x29\x43\x4d\x92\xff\
-\x2e\x5e\x4c\x4c\x0c\xaf\xbf\xfe\x7a\xb9\xa6\xad\xcc\xef\x65\x95\
-\x53\xb5\x16\x19\x19\xc9\xa4\x49\x93\xca\x2d\x5d\x59\x59\x59\xe5\
-\x52\x6e\x57\x42\xf5\x4e\x03\x79\x73\x72\x73\xd2\xac\x6e\x54\x4d\
-\xa1\x4b\xcf\xfb\xe9\x70\xcb\xed\x34\x0a\x0a\x23\xeb\x81\xd1\x4c\
-\xba\x26\x91\xeb\x5a\x46\x52\xa3\xd9\xd3\xfc\xb0\x38\x8e\x55\xeb\
-\xb6\xb2\x23\xfe\x34\x2d\xfa\x3d\xc1\x7d\x8d\xb2\xd8\x98\x14\xcd\
-\x75\xb5\xd3\x79\xb9\x81\x85\x0e\x8d\xf2\x47\xe5\xdb\x0f\x7f\x83\
-\x49\x19\x35\x69\x57\x13\x70\x19\xc8\x0d\xeb\xc8\x43\xcf\x44\xd1\
-\xa8\x77\x3f\x9a\x36\xac\x04\xc0\xb0\xa7\xdf\x24\x7c\x67\x0e\x8d\
-\xaa\x86\xd0\xa8\x5e\x3d\xce\xe5\xba\xc9\x5f\x07\x5d\x4f\x6c\x83\
-\x3a\x45\x02\x84\x56\x0f\xbd\xc1\x77\x91\xad\xf8\xee\xa7\x55\x1c\
-\x4d\x0f\x65\xf4\x5b\x9f\xf2\xc0\x3d\x3d\xf0\xd3\xc1\x35\x77\x8e\
-\xe3\x8b\x39\x95\xf9\x71\xf5\x06\x4e\x3b\x1b\xf3\xf2\xf4\x89\xb4\
-\xad\x51\x2d\xff\x45\x1a\x9d\x9e\x26\xb7\x0e\xe6\xad\x28\x2b\x2d\
-\xa2\xf5\x08\x09\x02\x7d\x92\xa6\x69\xd8\xf3\x9c\xe4\x5a\x6d\xb8\
-\xdd\x21\x04\xd4\xbd\x9d\x06\xfe\xcf\xb3\xc9\x0e\xcd\x3b\xb7\xc7\
-\xbd\x79\x21\xb9\x80\xc3\x9d\xbf\x1d\x83\xd3\x0e\x38\xce\xf1\xe7\
-\x4f\x8b\x2f\xa8\x20\x9b\xe1\xfc\x4c\xc5\x42\x41\x10\xe8\xb6\x92\
-\x07\x38\x8b\x6c\x06\x58\xb0\x1d\x05\x2e\x76\xae\x58\xca\xce\x22\
-\x07\x88\x62\xc8\xc3\xe3\xa8\xa6\xa9\xd8\xed\x1a\x9a\xc3\xed\x0d\
-\xca\x74\xc1\x41\x58\xcc\x26\x70\x24\x73\x78\x63\x32\x9a\xea\x82\
-\x5c\x3b\xaa\x9a\xdf\xd7\xe8\x72\xe4\xa0\x02\x76\x67\xc1\x27\x0c\
-\x61\xdc\x35\x60\x30\xf3\xbe\xfb\x95\x0d\x7f\xd9\x70\xbb\x9d\x98\
-\x62\x3b\xf1\xc1\x37\xcb\xf0\x1f\x39\x94\x2f\x97\x7d\x83\xe7\xad\
-\xad\xda\x37\x3e\xca\x97\xe3\x2c\x0c\x7a\xe5\x17\x5c\xea\x55\x5c\
-\xd0\x01\x4d\xf8\xe9\xaf\xbf\xd0\x05\x84\x11\x95\xff\xaa\x24\x0d\
-\xee\x78\x8e\x84\x84\x91\x18\x02\x2b\x53\xd9\x7f\x1e\x7f\x25\x38\
-\x89\x28\x98\xde\x74\xd7\xb4\xb5\x74\x78\x21\x8f\xa0\xd0\x00\xec\
-\xb7\x8f\xc1\x14\x56\x89\x20\x63\x7e\xd9\x3e\xf4\xf5\x01\x7a\xe7\
-\xb8\x09\x0d\x0d\xa1\x7f\xdf\x7b\xd1\x0a\x9e\x8e\x9a\xaa\x51\x29\
-\x46\x07\xfa\x30\xee\x7d\x6a\x06\x75\xda\xdf\x45\x7c\xba\x9e\xb6\
-\xed\xdb\x52\xa7\x7a\x15\xef\xa9\x58\x22\x1b\xf1\xd2\x82\xf5\x0c\
-\xdc\xb1\x8e\x8d\x7f\xd9\xb9\xb6\x6b\x17\xe2\xfc\xf2\xc8\x51\xcf\
-\x4f\x29\xee\xf2\xd8\xa7\x1c\xbf\xdf\x46\xa5\x20\x1d\xee\xcf\xb6\
-\x32\x04\x7f\xef\xc2\xad\x9e\x73\x0b\x8e\x0a\xa8\xb0\xc5\xb1\x61\
-\xc3\x86\x72\x09\x96\xf4\x7a\x3d\x7e\x7e\x7e\x65\xdb\x94\xbb\x1c\
-\x78\x02\xaf\x03\x07\x0e\x90\x9d\x9d\x5d\xe6\x06\x97\x67\x05\xd3\
-\xe2\xac\x4e\x5a\x78\x34\xb0\xf0\x36\x11\x17\xfe\x4e\xe1\x00\xb0\
-\xa4\x79\xaf\xd7\xeb\xf9\xeb\xaf\xbf\x38\x79\xf2\x64\xa9\xdf\x99\
-\x2b\xcc\x6c\x36\x7b\xdf\x09\xbc\xd2\xe5\xe6\x70\x38\x38\x74\xe8\
-\x10\x69\x69\x69\x65\xbe\x26\x55\x55\xa5\x4e\x9d\x3a\x3e\xb3\x6f\
-\x99\x67\xb5\xcb\xf2\x28\x33\x55\x55\x89\x89\x89\x29\xd3\x9e\x9c\
-\xe5\x45\xa7\xd3\x91\x93\x93\xc3\xb1\x63\xc7\xca\xb0\xff\x5d\x51\
-\x4d\x9b\x36\x2d\x97\x7c\x2a\x8f\xb4\x59\xad\x56\xb6\x6f\xdf\x5e\
-\x2e\xf5\x9a\xdd\x6e\xa7\x53\xa7\x4e\x3e\x55\xff\xff\xf9\xe7\x9f\
-\xe5\x72\xef\x1b\x0c\x06\x22\x23\x23\xaf\x78\x3d\x52\x5a\x55\x5a\
-\x76\x67\x44\xf3\x5b\xbd\x6d\x3d\x45\xa7\xc7\x50\x30\x10\xd0\xb6\
-\x47\x7f\x5a\x75\xd7\xd0\xeb\xf3\xdf\xdb\x6b\xdf\x6b\x08\xad\xbb\
-\xdd\x87\xcd\xe1\xc2\xe8\x17\x80\x9f\x5e\xe3\x1a\x15\xf4\x8a\x46\
-\xa3\x2e\x0a\x7a\x43\xfe\xe7\x9a\xde\x39\x92\x46\x9a\x0e\x9d\x1e\
-\x50\xfc\x89\xb9\xae\x2f\xc3\xda\x6b\xe8\x0b\x5d\x4b\x75\x3b\xdc\
-\xc1\x13\xed\x54\x74\x8a\x82\xa6\xf5\x28\x32\x00\xa0\xe8\xf4\x45\
-\x03\x04\x7d\x38\x37\xf4\x19\x42\xdb\xee\xf7\xe2\x70\x2b\x58\xfc\
-\x2d\x18\x0b\xce\x51\xe7\x5f\x99\xdb\x1e\x18\x4d\xd7\x7e\xc3\x71\
-\x69\x3a\xfc\x2c\x16\x8c\x05\x53\x94\x14\x9d\x9e\x3a\xed\x6f\xe7\
-\xf1\x76\x9a\x4f\xdc\x57\x42\x82\xc0\x4b\xb2\x44\xd5\x63\xc6\x4e\
-\x37\xef\xa1\xa0\x53\x14\x20\x8c\x0d\xd9\xf9\x01\x98\xa2\x03\xad\
-\xd1\xff\x70\x0c\x9a\x8c\xa2\xe8\xd0\x34\xf8\x3e\xcf\x7d\x99\x11\
-\x33\x05\x5d\xa1\x95\x96\x06\x4c\x5d\xce\xbd\xef\x68\xf9\x9f\x2b\
-\xe8\x44\x53\x2a\xb7\x61\xf6\x6f\xa7\x98\xa5\x5d\xae\x41\xa2\x43\
-\xa1\x01\x19\xee\x09\xa0\x28\x78\x3f\x19\xda\x84\xaf\xd7\x1d\xe1\
-\x2b\x2d\xff\x78\x74\xcf\xe0\x31\x2d\xff\xf7\x01\xa6\xae\x4e\xe4\
-\x1d\xcd\xb3\x4a\x9e\x06\x8a\x42\xa5\x16\x77\xb2\xfe\x68\x66\xfe\
-\xb7\x05\x15\x64\x74\xd3\x1b\x59\xb0\xee\x38\x33\xcf\x26\x71\x24\
-\x29\x95\xc0\xa8\x3a\xd4\x8d\x0e\x00\x0d\xee\x1e\xf5\x56\x85\x9c\
-\x4e\x51\xfc\x27\xab\x85\x98\x1a\x35\x8a\xfe\xc8\x1c\x44\xf5\xea\
-\x9e\xc0\xcb\x42\x8d\x42\xab\x55\x1b\x83\x2a\x13\xe7\xf9\xaf\x0b\
-\x5e\xc9\xb1\x44\xc4\x10\x57\xb0\xdd\xcd\xe5\x36\x29\x36\x06\x84\
-\xd1\xa1\xdb\x9d\x74\xb8\xcc\xb5\x62\x09\x0c\xa5\x71\xc7\x9e\x34\
-\xee\x78\xfe\xa7\x85\x97\x8f\xb0\x04\x47\x12\xe7\x19\x9c\x8a\x8c\
-\x21\x98\xcb\x9c\x5b\x05\xec\x74\x59\xb4\x68\x51\xb9\x8d\xbc\x04\
-\x04\x04\xf0\xc4\x13\x4f\x10\x14\x54\xf6\x0c\x51\x55\x95\x1d\x7f\
-\xfe\x41\xf5\xb6\x9d\x88\x34\x95\xfc\x5e\xb0\x58\x2c\x3c\xf1\xc4\
-\x13\x2c\x5f\xbe\xbc\xdc\x56\x43\x5b\xba\x74\x69\xb1\x1a\x38\x85\
-\xef\xdd\x4b\x2d\xda\x62\x3f\x71\x98\x8d\x99\x66\xda\x37\x88\xc3\
-\xcf\xa0\x94\xb8\xcc\x02\x02\x02\x18\x3a\x74\x28\xbf\xfd\xf6\x5b\
-\xb9\x04\x5e\x81\x81\x81\x2c\x58\xb0\xa0\xd4\xef\x3b\x15\x71\x76\
-\x07\x9f\xed\x8e\x60\xd0\x8d\x25\x5f\x6e\xde\x60\x30\x90\x96\x96\
-\xc6\xc8\x91\x23\xcb\x25\x6d\x00\xfd\xfb\xf7\xa7\x76\xed\xda\xe5\
-\x52\x9f\xa6\xee\xd9\xce\x3e\xb7\x85\x96\xcd\x1b\x12\xa8\x94\xfc\
-\x5e\x8b\x88\x88\x20\x2a\x2a\xaa\xdc\x56\x7a\xbd\xe7\x9e\x7b\xe8\
-\xdd\xbb\x77\xb9\xd5\x07\x6b\x3f\xfb\x94\x5a\x83\x1e\x24\xa6\x14\
-\xe5\xb6\x77\xef\x5e\xfa\xf5\xeb\xc7\xa9\x53\xa7\xca\xe5\x5c\xa6\
-\x4c\x99\x82\xc9\x64\x2a\x87\x23\xd9\x89\x3f\xb8\x9d\x4c\x6b\x35\
-\xda\xb4\x8c\x2d\xf1\xa7\x4d\x26\x13\xdb\xb6\x6d\xa3\x7b\xf7\xee\
-\xe5\x56\x8f\xec\xdb\xb7\xaf\xdc\x02\xa5\x4d\x5f\xcc\x23\xe2\xae\
-\x81\xd4\x31\x97\xee\xde\xff\xe3\x8f\x3f\xca\x2d\x28\xad\x54\xa9\
-\x12\x93\x27\x4f\xf6\xe1\xed\x1f\xfe\x21\x3f\x74\xfa\xfc\xd5\x9b\
-\x2f\xd5\x64\xd1\x1b\x28\xf2\x5f\x8a\x0e\xa3\xd9\x82\xb1\x50\xbe\
-\x17\xf4\x4b\x17\xf9\x3d\x9d\xde\x88\xae\x70\xbb\xf4\xc2\xe3\x14\
-\xfc\x5d\xa3\xae\x04\x81\x99\xa2\xc7\xcf\x3f\x10\xbf\x4b\xfe\x97\
-\x01\x4b\x40\xe0\x65\xd3\x67\xac\x98\xf1\xb9\x04\x81\xff\x19\x8a\
-\x82\x82\x52\x64\xa6\x83\x52\x68\xef\x37\xa5\x60\xaf\xbd\xc2\x37\
-\xa2\x52\xac\xc3\x5e\xaa\xb7\xd4\xd3\x1b\xff\xb7\x9f\x2c\x08\x46\
-\xff\xee\x78\xba\xa2\xa7\xa4\xe8\x2e\x79\xcc\xcb\xfd\x3c\x28\x32\
-\x96\x16\x91\xb1\x85\xff\xa4\x4f\xee\x39\x27\xae\xc6\xdb\x2d\x7f\
-\xc4\x2c\x3a\x3a\x9a\xd9\xb3\x67\xd3\xa8\x51\xa3\x12\xbf\xcf\xe1\
-\x79\xaf\x6c\xf7\xee\xdd\x0c\x18\x30\xa0\xc8\x76\x00\x65\x69\xe8\
-\x7c\xf9\x78\x67\x9e\xdf\x54\x9d\x55\xeb\x3a\x97\x68\xbb\xcc\xc2\
-\xe7\x6e\x36\x9b\xa9\x54\xa9\x12\xbb\x77\xef\x26\x3b\x3b\xbb\x54\
-\x81\x80\xc5\x62\x61\xfe\xfc\xf9\xbc\xf8\xe2\x8b\xde\x69\x9d\xc5\
-\x3d\xce\xa5\x7e\x4f\x3b\xbb\x97\x17\x1e\x7a\x80\x9d\xd7\x4e\xe0\
-\xdb\x67\xe3\xf0\x2b\xc1\xb9\x78\xf2\xd3\xb3\xb7\x57\xeb\xd6\xad\
-\xf9\xec\xb3\xcf\xbc\x23\x79\x25\x0d\x4a\x42\x43\x43\x79\xf1\xc5\
-\x17\xf9\xfa\xeb\xaf\x8b\xbc\xc3\x58\x5a\xee\x8c\x3f\xe8\xdf\xe1\
-\x76\x8e\xf7\x5f\x51\xe2\x20\xd0\x93\xb7\x9e\x91\x97\x91\x23\x47\
-\x32\x76\xec\xd8\x52\x8f\x74\xa9\xaa\xca\xff\xfe\xf7\x3f\xce\x9d\
-\x3b\x57\x0e\x69\xd3\x48\xd8\xf1\x13\x0f\xf7\x19\x42\xe8\xa3\x33\
-\xf9\xe0\x9a\x86\x25\xbe\xcf\x3c\x79\x0e\xf9\x9b\xc5\x3f\xfa\xe8\
-\xa3\xa5\xda\xa6\x45\xd3\x34\xa2\xa2\xa2\x68\xd6\xac\x19\x26\x93\
-\xe9\xfc\x34\xe3\xb2\x04\xb9\x99\xbf\xf2\xcc\x63\x2f\xf2\xe5\xfa\
-\x70\x56\x0d\x7a\xb0\x54\x69\xf3\x74\x02\xcd\x99\x33\x87\x8e\x1d\
-\x3b\x96\xfa\x54\x6c\x36\x1b\xc3\x87\x0f\x2f\x32\x7a\x5b\xea\xb4\
-\x69\x6e\xb6\x7d\x37\x85\x41\xcf\x7f\xcb\xd0\xd7\xbe\xa0\x4d\x4b\
-\x4a\x95\x36\x4f\xe7\xc8\xce\x9d\x3b\x09\x0c\x0c\x2c\xf5\xea\xa0\
-\xe9\xe9\xe9\xdc\x74\xd3\x4d\xe5\xd3\xc1\xeb\x4e\xe5\x93\xd7\xc6\
-\xf0\xfc\xf4\x23\x7c\xdb\x67\x20\xa5\xdd\x09\xd5\xed\x76\x53\xbb\
-\x76\x6d\x3e\xf9\xe4\x13\x62\x63\x63\x4b\xbd\x3a\xe8\x89\x13\x27\
-\xb8\xeb\xae\xbb\xd0\xeb\xf5\xde\x3a\x52\x91\x15\x48\x84\x90\x20\
-\x50\x08\x71\x65\x68\x9a\xc6\xae\x5d\xbb\xbc\x4b\xe5\x7b\x84\x86\
-\x86\x92\x97\x97\xe7\x5d\x0d\xce\x6c\x36\x53\xbd\x7a\xf5\x32\xed\
-\xf7\xe5\x59\x6d\x0e\xce\x4f\x57\xdc\xb0\x61\xc3\x3f\x36\x2a\x14\
-\x45\xa1\x66\xcd\x9a\x54\xad\x5a\x15\x97\x35\x8b\xd4\x1c\x07\xa1\
-\x11\x11\xf4\x7a\xf6\x13\x92\x3f\xf8\x12\x97\x23\xbf\x86\x3c\x78\
-\xf0\xe0\x45\xfb\x4e\x5d\x4a\x46\x46\x06\xd9\xd9\xd9\xde\xa0\xc2\
-\x68\x34\x12\x15\x15\x45\x54\x54\x54\xa9\xd3\x56\xa9\x52\xa5\x22\
-\x69\x3b\x7e\xfc\x38\x3b\x77\xee\xbc\x28\x5f\x2f\xcc\x7b\x45\x51\
-\x68\xd1\xa2\x05\xfe\xfe\xfe\xb8\x5d\x56\xd2\x52\x73\x08\x08\x6f\
-\xc4\x88\xb1\x4f\x32\x2f\x3d\x0a\xa5\x60\xef\xa8\x3d\x7b\xf6\x90\
-\x91\x91\xf1\xb7\x41\xb3\xd1\x68\xe4\xf4\xe9\xd3\x45\x56\x39\x0d\
-\x0e\x0e\xa6\x61\xc3\x86\x65\x6a\x6c\x55\xa9\x52\xc5\xbb\x2d\x83\
-\xa6\x69\x1c\x3b\x76\x8c\xad\x5b\xb7\xfe\x63\x80\x62\x32\x99\x68\
-\xda\xb4\x29\x7e\x7e\x66\x72\x33\xd3\xb0\xaa\x7e\x44\x84\x75\xe4\
-\xbd\x77\x9f\x61\xe8\xce\xfc\x46\xb2\xdd\x6e\xe7\xe0\xc1\x83\xc5\
-\x0a\xc0\xd3\xd2\xd2\xbc\xd3\x94\x54\x55\xa5\x72\xe5\xca\xd4\xab\
-\x57\xaf\x4c\xd7\x7f\x4c\x4c\x0c\xa7\x4f\x9f\xf6\x96\xc7\xb6\x6d\
-\xdb\x48\x4b\x4b\xfb\xdb\xe9\xa1\xaa\xaa\x12\x1e\x1e\x4e\xdd\xba\
-\x75\x31\x99\x8c\x64\xa6\x9e\xc1\xae\x0b\x24\xae\x45\x77\x5e\x98\
-\xf8\x34\xab\x0c\x06\xdc\x2a\x42\x34\x27\x12\x00\x00\x20\x00\x49\
-\x44\x41\x54\xa0\x83\x35\x6b\xd6\xfc\xe3\x1e\x88\x16\x8b\x85\xf8\
-\xf8\xf8\x22\xf7\x41\x74\x74\x34\xb1\xb1\xb1\x65\x4a\x9b\x9f\x9f\
-\x9f\xf7\x1a\xcb\xcb\xcb\x63\xc7\x8e\x1d\x64\x65\x65\xfd\xed\x2a\
-\xb8\x9e\x7c\xad\x5f\xbf\x3e\xaa\xdb\x4d\x7a\x56\x2e\x16\x7f\x0b\
-\xfe\x41\x1d\x79\xf9\xd3\x79\xb8\x6f\x7e\x94\x3c\xc0\x9a\x9d\xc5\
-\xde\x03\x07\xff\xb1\x43\x48\xaf\xd7\xb3\x77\xef\x5e\x6f\xb9\x19\
-\x8d\x46\xe2\xe2\xe2\xa8\x53\xa7\x4e\xa9\xd3\x95\x9b\x9b\x4b\x68\
-\x68\x28\x2e\x97\xcb\x1b\x38\x6d\xd8\xb0\x01\xb3\xf9\x9f\x87\xba\
-\x62\x63\x63\xa9\x5e\xbd\x3a\xaa\xcb\x86\x35\x33\x8b\x5c\x55\x4f\
-\x93\xdb\x86\xf0\x72\x9a\x93\xb3\x79\x76\x6f\xfd\x50\x78\x5f\xce\
-\xbf\x0b\xda\x4e\x9c\x38\x51\x64\x7f\xc7\x7a\xf5\xea\x15\x6b\xaf\
-\xd2\xbf\x4b\x5b\xe1\x74\xa4\xa6\xa6\xb2\x69\xd3\xa6\x7f\x5c\xb9\
-\xd8\xe1\x70\xd0\xb2\x65\x4b\x42\x42\x42\x70\x3b\xac\xa4\xa5\x67\
-\x63\xb2\x04\x33\xf4\xc5\x77\x49\xde\x34\xd8\xfb\xea\xc8\xb9\x73\
-\xe7\xd8\xbf\x7f\x7f\xb1\xd2\xe6\x59\xc0\xc7\xf3\x1e\x6e\x9d\x3a\
-\x75\x88\x89\x89\x29\xd3\xf5\xe8\xf9\xbb\x7a\xbd\x9e\xf8\xf8\x78\
-\xd6\xad\x5b\x57\xe4\xfa\x71\xbb\xdd\x54\xad\x5a\x95\x5a\xb5\x6a\
-\xc9\x94\x44\x21\x24\x08\x14\x42\xfc\xdb\x41\xe0\xb2\x65\xcb\x48\
-\x4c\x4c\x2c\x12\x60\x58\x2c\x16\xb2\xb2\xb2\x8a\x4c\xdb\x29\xeb\
-\x7b\x53\x85\x3f\x6f\x30\x18\xd8\xb1\x63\x07\x9f\x7f\xfe\xb9\xf7\
-\x3c\x2e\x5b\xf9\x19\x0c\xf4\xe9\xd3\x87\xaa\x55\xab\x72\x66\xd7\
-\x72\xa6\x2f\xfd\x8b\x81\x8f\x3f\x42\xfd\xb0\x4a\xf8\x1b\xbd\xeb\
-\x2b\xb1\x6e\xdd\xba\x7f\xdc\x58\xd9\xf3\x4e\xd9\xb9\x73\xe7\xca\
-\xb5\x91\x51\xb8\x01\xaf\xd7\xeb\xd9\xb9\x73\x27\xf3\xe7\xcf\xff\
-\xdb\x05\x70\x3c\xa3\x5a\xb5\x6a\xd5\xc2\xdf\xdf\x9f\x9c\x73\x3b\
-\x99\x39\x75\x19\x6d\x86\x3c\x47\xcb\x90\x10\x0c\x59\xe7\x1b\x47\
-\x2b\x56\xac\xe0\xd0\xa1\x43\x7f\xfb\xce\x91\x5e\xaf\xff\x3f\xf6\
-\xce\x33\xb0\x8a\x6a\x6b\xc3\xcf\x9c\x9e\x93\xe4\xa4\x43\x0a\x84\
-\x16\x92\x40\xa8\xa1\x28\x1d\x04\xa4\xa3\x82\x82\x80\x20\x45\x05\
-\x15\x91\x22\x22\x02\x62\x05\xe1\x02\x0a\xa8\x48\xb1\x71\x15\x1b\
-\x28\x82\x20\x45\x7a\x11\x11\x94\x48\xaf\x21\x84\x92\x02\x49\x48\
-\x3f\x75\xbe\x1f\x61\xc6\xe4\x2a\xc9\xc9\x99\x73\x3f\xf5\x3a\xef\
-\x9f\x2b\xb9\x99\x9d\xbd\xf6\xde\xb3\x67\xbd\x7b\xad\xbd\x5e\xf2\
-\xf2\xf2\x28\x2e\x2e\x2e\xd3\x2f\x87\xc3\xe1\x96\x18\xbb\x3b\xb6\
-\x89\xa2\xc8\x4f\x3f\xfd\x44\x61\x61\x21\x36\x9b\xad\xdc\xe7\x2c\
-\x16\x0b\xb5\x6a\xd5\xc6\x64\x72\x70\x60\xe3\x4a\xf6\xe6\x25\x30\
-\x69\xe4\xdd\x04\x06\xf8\xc9\x55\xb2\x8a\x8a\x8a\xd8\xb4\x69\x13\
-\x17\x2e\x5c\xa8\x70\x3e\xec\x76\x3b\x3a\x9d\x4e\x76\x1a\x25\xdb\
-\x3c\xbd\x87\x25\x69\x34\x96\x6e\x6f\xfd\xfa\xf5\x04\x07\x07\x97\
-\x7b\x30\xe1\x74\x3a\x69\xd8\xb0\x21\xd5\xaa\x57\xc7\xa0\x73\xb1\
-\xe9\xa3\xf9\x9c\xf4\xed\xc9\x8b\xa3\x3b\x62\x36\xf9\xa3\x2d\xf5\
-\x9a\xbc\xff\xfe\xfb\x15\x8a\x73\x1b\x0c\x06\x8e\x1d\x3b\x56\xe6\
-\xfd\xf0\xb6\x58\x76\x6e\x6e\x2e\xdf\x7e\xfb\x2d\x21\x21\x21\xe5\
-\xbe\xc7\x4e\xa7\x93\x96\x2d\x5b\x12\x17\x17\x47\x5e\xde\x4d\x3e\
-\xfe\x72\x07\x4d\x5b\xdf\x41\xfb\x06\xd5\x30\x10\x80\xee\xd6\xc4\
-\x65\x66\x64\xb0\x7a\xf5\x6a\x72\x73\x73\xcb\x3d\x98\xd0\x6a\xb5\
-\xa4\xa4\xa4\xc8\xeb\x4f\x14\x45\xc5\xfb\x88\xc3\xe1\x90\xc7\x53\
-\xab\xd5\x72\xe5\xca\x15\x3e\xff\xfc\xf3\x0a\xd7\x8f\x20\x08\x74\
-\xeb\xd6\x8d\xe8\xe8\x68\xac\x19\x67\xf9\xe1\xcb\x2f\xd9\x59\x10\
-\xcc\x63\x4f\x3d\x8a\xaf\x9f\x81\x8c\x5b\xf5\x00\xd2\xd3\xd2\x58\
-\xb9\x72\x65\xb9\xd1\x73\x29\x8a\x75\xe2\xc4\x09\x5a\xb4\x68\xe1\
-\xb5\x3d\xb2\xb4\x6d\xa2\x28\x92\x92\x92\xc2\xc7\x1f\x7f\x5c\x52\
-\x3d\xb8\x9c\xbe\xe4\xe4\xe4\xf0\xe2\x8b\x2f\x12\x10\x60\x21\xe7\
-\x72\x12\x4b\x96\xaf\xa5\x56\xbb\x01\x0c\xed\xd9\x14\x43\xa9\xb4\
-\xa1\x94\x94\x14\x56\xae\x5c\x59\x6e\x1a\xad\x64\x5b\x6a\x6a\xaa\
-\x7c\x10\x21\x8a\xa2\xc7\x12\x3a\x7f\x34\x36\xd2\xdd\xd7\xd2\xb2\
-\x2f\x52\x65\xd4\x8e\x1d\x3b\x52\xbd\x7a\x75\x95\x04\xaa\x50\xf1\
-\x4f\x26\x81\xea\x06\xa0\x60\xb1\x94\x72\x94\xfe\x2a\xfd\x51\xf1\
-\xd7\x1c\x3b\x8d\x46\xc3\xc4\x89\x13\x7f\xe7\x74\x9a\xcd\x66\xd6\
-\xaf\x5f\x5f\xe6\xf7\x2c\x16\x8b\xa2\xbf\x55\x5a\x84\xdb\x6a\xb5\
-\xd2\xbb\x77\x6f\x9e\x7d\xf6\xd9\x0a\x9f\x13\x04\x41\x76\x22\x03\
-\x6a\x36\xa1\x4f\xaf\xda\x54\xf5\x33\xe0\x72\x14\x60\x73\x38\xe4\
-\x3b\xbf\xc3\x86\x0d\xab\x50\xc4\x5c\x10\x04\x32\x32\x32\xf8\xe5\
-\x97\x5f\xe4\x0a\x75\xde\x78\x57\x4a\x47\x03\x6c\x36\x1b\x3d\x7b\
-\xf6\x64\xfa\xf4\xe9\x14\x16\x16\x56\xf8\xac\x54\x4c\xc6\xc7\x52\
-\x8b\xbb\xfb\xf4\x22\x22\xc2\x84\xf5\x9a\x15\x87\xd3\x25\xdb\xf6\
-\xe4\x93\x4f\x56\x48\x0c\xf4\x7a\x3d\xa9\xa9\xa9\x65\xc4\xa5\x75\
-\x3a\x9d\x22\x02\x08\xc8\x91\x09\x29\xaa\x74\xff\xfd\xf7\xf3\xd8\
-\x63\x8f\x55\x58\xe1\x55\x10\x84\x5b\xb6\xd9\x89\x4d\xec\x88\x9f\
-\x3d\x18\xa3\xae\x64\x7c\xec\xce\x12\x5b\x02\x02\x02\x78\xfa\xe9\
-\xa7\xdd\x22\x3d\x19\x19\x19\x7c\xfa\xe9\xa7\xb2\x33\xac\xb4\xc0\
-\x90\x4e\xa7\x2b\xe3\xe8\x6b\xb5\x5a\xa6\x4c\x99\x42\x7c\x7c\x7c\
-\x85\xce\xbc\x56\xab\xc5\x60\x30\x02\x0e\x9a\x76\xec\x4b\x0d\x7d\
-\xcd\x5b\x4e\xbc\x1d\x87\xeb\xb7\x79\x7b\xf7\xdd\x77\x2b\xec\x87\
-\xd9\x6c\xe6\xfd\xf7\xdf\xe7\xe4\xc9\x93\xbf\x5b\x13\x4a\xdf\x6d\
-\x09\x61\x61\x61\x3c\xf3\xcc\x33\x34\x6c\xd8\xb0\xc2\xca\x8c\xd2\
-\x98\x9a\x7c\xcc\x74\x68\xdd\x98\xb0\x88\x40\x89\xa2\x60\xb7\x3b\
-\x70\x02\x35\x6a\xd7\xe6\xa5\x97\x5e\xaa\x30\xed\x51\xab\xd5\xb2\
-\x75\xeb\x56\x9e\x7a\xea\x29\x79\x4d\x94\x7e\x57\x3c\x41\x40\x40\
-\x80\xec\x1f\xd8\xed\x76\xea\xd5\xab\xc7\xac\x59\xb3\xdc\x8a\xc0\
-\x49\xef\x82\x3e\x20\x82\xb8\x0e\x3d\xf1\xb5\x9b\x08\xd5\xdb\xb0\
-\xdb\xec\xb8\x84\x12\x5b\xea\xc6\xc6\xb2\x68\xd1\xa2\x0a\xd7\xb6\
-\x46\xa3\x61\xec\xd8\xb1\x65\x74\x33\x4b\xef\x71\x9e\xc0\x62\xb1\
-\x94\x49\x4d\x6e\xdc\xb8\x31\xf3\xe7\xcf\xc7\xe9\x74\x96\x3b\xd6\
-\xa2\x28\xca\xf6\xfb\x86\xd6\xa4\x5b\xef\x3e\x04\x44\x45\x03\x36\
-\xec\x76\xbb\x2c\x9b\xd5\xa4\x49\x13\xb7\x6c\x13\x04\x81\x8b\x17\
-\x2f\x72\xfd\xfa\x75\x79\x2d\xdd\xee\x3e\xbd\xbb\x28\x7d\x0f\xbc\
-\xa8\xa8\x88\xc1\x83\x07\x33\x74\xe8\xd0\xdf\xed\xbf\x3a\x9d\xce\
-\x4b\x77\x3d\x2b\xff\x9e\xa8\xa8\x1c\xf4\x7a\xbd\xea\xab\xab\x24\
-\xd0\xfb\x70\xb9\x5c\x5c\xbc\x78\x91\x73\xe7\xce\x79\x24\x4c\xfc\
-\x4f\x86\xc9\x64\x22\x25\x25\x45\xf1\xa9\x9d\x37\x20\x6d\xee\x67\
-\xce\x9c\x21\x3c\x3c\xfc\x2f\xd1\xa7\xbf\x1b\x14\x69\x7c\x55\x62\
-\xcd\xdc\xee\xe3\x28\x9d\xdc\x9f\x3f\x7f\x9e\x2e\x5d\xba\xe0\xeb\
-\xeb\xeb\xb1\x10\x72\x6e\x6e\x2e\x45\x45\x45\x72\x0a\x99\xc1\x60\
-\xc0\xc7\xc7\xa7\x52\xb6\xf9\x46\xd4\xa5\x4d\xc4\x2d\x97\xd4\xaa\
-\xa7\x7a\x8d\x5a\x98\x6f\x7d\x83\x0c\x06\x83\x5b\xce\x83\xc1\x60\
-\x90\xa5\x19\x8a\x8a\x8a\xb8\x72\xe5\x0a\x4d\x9a\x34\xf1\x38\xfa\
-\x22\x08\x02\x69\x69\x69\x58\xad\x56\xb9\x0d\xc9\xd9\xac\x4c\x01\
-\x04\x83\x39\x82\x96\x6d\x4b\x8c\x4b\x0f\x08\xa5\xa6\x2b\x80\x5b\
-\x05\xe4\xdc\x26\x05\xa5\xc7\xb3\xa0\xa0\x80\xdd\xbb\x77\x93\x90\
-\x90\xe0\xf1\x87\x5a\xa7\xd3\x71\xe1\xc2\x05\x6c\x36\x9b\x4c\x02\
-\xb5\x5a\xad\xac\x8b\xe8\xa6\x65\x54\x8f\x6b\x8a\x94\xdc\xe8\x0c\
-\xaa\x46\xe3\x1a\x01\xff\x41\x14\xdd\x73\x38\xa4\x94\x54\xad\x56\
-\xcb\xec\xd9\xb3\xf9\xf4\xd3\x4f\x15\xbd\x1b\xe7\xce\x9d\xa3\x5b\
-\xb7\x6e\xf2\xbc\xf9\xf8\xf8\xb8\x95\x56\x58\xfa\xd3\x1c\x9b\xd8\
-\xf6\x37\x47\x37\x3c\x8a\x1a\x62\x28\x52\x9d\x22\x77\xc7\x48\x5a\
-\x2f\x92\x2d\x33\x66\xcc\x60\xc9\x92\x25\x8a\x9c\xb3\x13\x27\x4e\
-\x50\xbf\x7e\x7d\xf9\x5d\xf6\xf1\xf1\x41\xaf\xd7\xbb\x7d\x28\x60\
-\x34\x9a\x68\xd2\x20\xa6\xcc\x3c\xd6\x69\xda\xb8\xa4\x20\x96\xa0\
-\x71\x3b\xed\x51\x9a\x5f\x51\x14\xc9\xcc\xcc\xe4\x81\x07\x1e\x20\
-\x24\x24\x44\x91\x7f\x70\xfa\xf4\x69\xda\xb7\x6f\x2f\x13\x4d\xb3\
-\xd9\x5c\xa9\x34\x4c\x9d\x6f\x28\xd1\x4d\x42\x89\x06\x10\x73\x08\
-\xae\x5a\x03\xa7\xc6\x5f\x1e\xab\xca\xcc\x9b\xa4\x15\x08\x50\xbf\
-\x7e\x7d\x8f\x0f\x26\x24\x69\x97\xb4\xb4\x34\x79\x3d\x96\x1c\x36\
-\x54\x8e\x10\x99\x2c\x11\xdc\x21\x6d\x92\x58\xa9\xd1\xa8\x11\x41\
-\x5a\xca\x8c\x95\x3b\x90\xf6\x0c\x8d\x46\xc3\x91\x23\x47\xb8\xe3\
-\x8e\x3b\xe4\x14\x63\x4f\x50\x54\x54\x44\x41\x41\x81\x3c\x56\x46\
-\xa3\x51\xf1\x81\x80\x37\x7c\x94\x9c\x9c\x1c\xce\x9e\x3d\xeb\xd6\
-\x81\x9d\x8a\xb2\x70\x3a\x9d\x5e\x2b\xf4\xa4\x42\x25\x81\x32\xec\
-\x76\x3b\xcf\x3f\xff\x3c\x33\x67\xce\xf4\x5a\xb5\xad\x7f\x0a\xa4\
-\x0f\x92\xd3\xe9\xfc\xcb\x9c\x70\x4d\x98\x30\xc1\x3b\x55\x05\xff\
-\xe1\xf3\xfa\x67\xfd\xdd\x96\x2d\x5b\x32\x71\xe2\x44\xaf\xac\x27\
-\xa3\xd1\x48\x8b\x16\x2d\xd8\xbb\x77\xaf\xec\x18\x7a\x6a\x9b\xce\
-\x18\x48\xbf\x87\x1e\x42\xeb\x61\xa0\x4b\x12\x8b\x4f\x4c\x4c\xf4\
-\x8a\x44\x80\x54\x64\xc6\x1b\xeb\xbc\x4a\xe3\x76\x0c\x15\x05\xb9\
-\xfc\xb8\xbb\x90\xfe\xb6\xdd\x6e\x67\xd4\xa8\x51\x34\x6b\xd6\x4c\
-\xf1\x49\x6d\x97\x2e\x5d\x08\x08\x08\x28\xb9\x6f\x54\x41\x44\xc2\
-\x2d\x27\xb5\x51\x3f\x5e\x4d\xa8\xfc\x5a\x92\x0e\x24\xcc\x66\x33\
-\x23\x46\x8c\xe0\xf4\xe9\xd3\x8a\xd7\x64\xd7\xae\x5d\x69\xdf\xbe\
-\xbd\x1c\x85\x53\x6a\x5b\x4c\x97\xde\xd4\x46\x40\xeb\xe1\xeb\x9a\
-\x9f\x9f\xcf\x53\x4f\x3d\xa5\xc8\xd9\x96\xd0\xb1\x63\x47\x5a\xb7\
-\x6e\x2d\xa7\x07\x2b\x5f\x97\x01\x8c\xfa\xd7\xab\x68\x3d\x9c\xb7\
-\x6a\xd5\xaa\x31\x7e\xfc\x78\xb2\xb2\xb2\x14\xcf\x5b\xef\xde\xbd\
-\xe9\xd2\xa5\x0b\x47\x8e\x1c\x51\x6e\x9b\x10\xc0\x9d\x77\x0f\x41\
-\xc4\xb3\x3e\xd9\xed\x76\x6a\xd5\xaa\xc5\xf8\xf1\xe3\xbd\x92\xb9\
-\xd1\xb1\x63\x47\xaa\x55\xab\xe6\xa5\x94\x60\x23\x83\x5f\x7d\x05\
-\xad\x02\x09\xcb\x46\x8d\x1a\x79\xcd\x36\xb3\xd9\x4c\xfd\xfa\xf5\
-\xf9\xfc\xf3\xcf\x65\x69\x9c\x3f\x33\x6b\x49\xa7\xd3\x71\xf0\xe0\
-\x41\x9a\x36\x6d\xaa\xfa\x27\x1e\xc2\x6a\xb5\xca\x07\x83\x2a\x54\
-\x12\xe8\x15\x98\x4c\x26\x42\x43\x43\xbd\x7e\x2f\xe2\x9f\x02\x8d\
-\x46\xc3\xf5\xeb\xd7\xbd\xe2\xb0\x29\x81\xcb\xe5\x22\x28\x28\x48\
-\x2e\x2e\xa2\xc2\x33\x48\xd5\xd4\xfe\xac\x0f\x66\x74\x74\x34\xf3\
-\xe7\xcf\xf7\x5a\x7b\xd7\xae\x5d\xf3\x5c\x2c\xbe\xac\xf7\x86\xce\
-\xc3\x54\x47\x51\x14\xb1\xd9\x6c\x0c\x1d\x3a\xd4\xab\xe9\x2c\xe7\
-\xcf\x9f\xf7\x0e\xf9\xd6\x68\xf1\x34\x89\x53\x8a\x28\x8c\x1e\x3d\
-\x9a\x61\xc3\x86\x79\xcd\xb6\xe3\xc7\x8f\x7b\x2c\x16\x5f\x76\x83\
-\xd2\x61\xd4\x78\xbe\xa7\xf8\xf9\xf9\x71\xff\xfd\xf7\x7b\x75\x8d\
-\x27\x27\x27\x7b\x65\x8f\xd2\x68\x75\x68\x14\xcc\x5b\x5e\x5e\x5e\
-\x85\xe9\x7a\x95\x85\x72\xb1\xf8\xdf\xde\x37\xbd\xd1\x33\x36\x21\
-\x91\xc0\x69\xd3\xa6\x79\xd5\x36\xef\x88\x8e\x0b\xb7\xb4\xdd\x3c\
-\x83\xc3\xe1\x20\x32\x32\x92\x37\xde\x78\xe3\x2f\xf9\xfd\xd0\x1b\
-\x3d\x4f\xad\x94\x64\x4b\xbc\x69\xdb\xcd\x9b\x37\x2b\xbc\x4f\xfc\
-\xff\x05\x41\x10\xa8\x5a\xb5\xaa\x4a\x60\x14\x40\x14\x45\x72\x73\
-\x73\xbd\xf4\x2e\xaa\xf8\xc7\x93\xc0\x90\x90\x10\x96\x2d\x5b\xc6\
-\xd0\xa1\x43\xd5\x59\x57\x80\x4d\x9b\x36\xb1\x69\xd3\xa6\x3f\xb5\
-\x0f\x05\x05\x05\xbc\xf7\xde\x7b\xdc\x77\xdf\x7d\xea\x84\x28\x40\
-\x52\x52\x12\xab\x56\xad\xc2\xe9\x74\xfe\x69\xf7\x2b\x4f\x9c\x38\
-\xe1\x35\xb1\x78\x97\xcb\xe5\x25\xe2\x75\xab\x04\xa3\x02\x07\x20\
-\x35\x35\x95\xe2\xe2\x62\xaf\x38\xc9\x06\x83\xe1\x2f\xe3\xdc\x68\
-\x34\x1a\x32\x32\x32\xb8\x7e\xfd\xba\x57\xe6\x4d\xaf\xd7\x57\x5a\
-\x1a\xe4\xf6\x5e\x03\x20\x78\x3e\x67\x4e\xa7\x93\xab\x57\xaf\x92\
-\x93\x93\xa3\xb8\x3f\xa2\x28\x12\x15\x15\xf5\x97\x39\xa4\xd2\xeb\
-\xf5\x1c\x3f\x7e\x5c\x3e\xf8\x51\x6a\x5b\x58\x58\x98\xd7\x1c\x5c\
-\x97\x4b\x2c\xa3\xad\x5b\xd9\x79\x2b\x2a\x2a\x22\x23\x23\x03\xab\
-\xd5\xaa\xb8\x4f\x82\x20\x10\x13\x13\xe3\x35\xdb\x14\x2c\x49\xf9\
-\xd0\x25\x25\x25\xc5\x2b\xd9\x12\x76\xbb\x9d\x86\x0d\x1b\x7a\xc9\
-\x41\x07\x6f\x0c\x91\xb7\xf6\x7f\x9d\x4e\x87\xd9\x6c\xfe\x4b\x64\
-\x29\x55\xaf\x5e\x9d\x26\x4d\x9a\xb0\x76\xed\x5a\xd5\xc9\x50\x88\
-\x89\x13\x27\xaa\x57\xb7\x54\x12\xe8\x1d\xb8\x5c\x2e\xb2\xb2\xb2\
-\xd4\x19\x57\x88\xec\xec\xec\x3f\x3d\x92\x2a\x45\x24\x55\x28\x43\
-\x7a\x7a\xba\x57\xd2\x15\x3d\x71\x22\x05\x41\xe0\xfb\xef\xbf\xe7\
-\xbe\xfb\xee\x53\x9c\xf2\xe1\x72\xb9\xf0\xf7\xf7\x67\xfc\xf8\xf1\
-\x8a\xc5\xe2\x73\x8e\x6d\xe5\xb3\x5d\x67\x08\xad\xdf\x96\x7b\x3b\
-\x35\xae\xf4\x06\x29\x08\x02\x3e\x3e\x3e\xcc\x9c\x39\x93\x8d\x1b\
-\x37\x2a\xbe\xaf\x2a\x09\xb4\x7f\xf0\xc1\x07\x0a\x9d\x25\x17\x99\
-\x97\x8e\xf0\xed\x37\x7b\x09\x48\xec\x4e\xaf\x3b\xeb\x62\xd4\x56\
-\x5e\x2c\xde\xc7\xc7\x87\x71\xe3\xc6\xb1\x6e\xdd\x3a\x0c\x06\x83\
-\xa2\x3e\x49\x44\x69\xc1\x82\x05\xe8\xf5\x7a\x45\xe4\xe4\xf2\xc1\
-\xf5\x7c\xb3\xff\x22\x35\xda\xdc\x47\xef\x16\xd5\x3c\x3a\x44\xc8\
-\xc9\xc9\x61\xcc\x98\x31\xec\xd8\xb1\x43\xd1\xa1\x88\x28\x8a\x58\
-\xad\x56\x46\x8e\x1c\xa9\x98\x2c\x89\x4e\x2b\xa7\x7f\xfc\x8e\x9f\
-\xae\x07\xd2\xbd\x4b\x7b\xc2\xcc\x9e\xa5\xbb\x06\x05\x05\x51\xbd\
-\x7a\x75\x7c\x7d\x7d\x15\x3b\xdd\x0e\x87\x83\xe1\xc3\x87\xd3\xaa\
-\x55\x2b\x65\x6d\x39\xb2\xd8\xb7\xf1\x3b\x8e\x5d\xca\x24\x24\xae\
-\x2b\xfd\xba\x26\x54\xfa\xe8\x45\xa7\xd3\x71\xea\xd4\x29\x46\x8c\
-\x18\x41\x4a\x4a\x8a\x57\x0e\xb3\x16\x2c\x58\x50\xc9\xfb\x9b\x7f\
-\x40\xb8\x0a\xaf\xb3\x65\xed\x17\x5c\x76\xd5\xa0\x47\xcf\x6e\x44\
-\x07\x57\xbe\x5f\x06\x83\x81\xe3\xc7\x8f\xd3\xab\x57\x2f\xc5\x76\
-\x39\x9d\x4e\xf2\xf2\xf2\x38\x7b\xf6\xac\xe2\xf9\xcf\xbc\x78\x8c\
-\x2d\xdf\xef\xc0\x11\xdc\x9c\x01\xfd\xee\xc4\xc7\x03\x9a\x2b\x08\
-\x02\x87\x0f\x1f\xa6\x4d\x9b\x36\x18\x8d\x46\x45\xe4\x4d\x14\x45\
-\x82\x83\x83\x99\x33\x67\x8e\x57\x0a\x1f\x29\x85\xc3\xe1\xc0\x6a\
-\xb5\x72\xfd\xfa\x75\x42\x43\x43\x55\x47\xc3\x43\xe4\xe6\xe6\x56\
-\x58\x25\x58\x85\x4a\x02\x55\xfc\x3f\x43\x4d\x6f\x50\xe7\xd2\x1b\
-\x24\x1e\x4a\xee\x29\x69\x34\x1a\xc6\x8c\x19\xe3\xf1\x5d\x15\x41\
-\x10\x48\x4f\x4f\x67\xfe\xfc\xf9\x14\x15\x15\xc9\x85\x61\x3c\xfb\
-\x70\xe4\xf0\xc6\xf4\xc5\x14\xb5\xe9\xc9\x99\x55\xcb\x08\x6b\xbc\
-\x98\x0e\xc1\xee\xb7\x63\x30\x18\x64\x42\x9b\x9d\x9d\x8d\xcd\x66\
-\xe3\x95\x57\x5e\xf1\x78\x9c\xb4\x5a\x2d\x3b\x77\xee\x64\xed\xda\
-\xb5\x72\x0a\xb6\xc7\xd5\xed\x8a\xd2\xd9\xbd\xe6\x23\xf6\x5e\x10\
-\x39\xb2\xef\x4b\x9a\xc7\x8d\x27\x3a\xd4\xfd\xe2\x09\x66\xb3\x59\
-\xae\xee\x97\x93\x93\x43\x78\x78\x38\xe3\xc7\x8f\xf7\xd8\x36\x83\
-\xc1\xc0\xda\xb5\x6b\xf9\xf1\xc7\x1f\xe5\x83\x08\xcf\xab\x8d\x9e\
-\x65\xee\xcc\x0f\xa8\xd6\xa5\x3d\x8b\x9e\x7c\x81\xba\x07\xdf\x27\
-\xae\x92\x7d\x91\x1c\xe5\xcc\xcc\x4c\xda\xb5\x6b\xc7\xdd\x77\xdf\
-\xed\xb1\xf3\xe1\x72\xb9\xd8\xb0\x61\x03\x69\x69\x69\x04\x07\x07\
-\xcb\xe3\xe7\xd1\xb4\xdd\xbc\xc6\x86\xb7\x66\xf1\x8d\xe6\x2e\x8c\
-\x01\xd1\x0c\xe8\x50\xbb\xd2\xe3\x2c\xbd\x73\x0e\x87\x83\x8e\x1d\
-\x3b\xd2\xad\x5b\x37\x8f\x53\xac\xcc\x66\x33\x53\xa6\x4c\x21\x3b\
-\x3b\x5b\x6e\xd7\x53\xc7\x3b\xe7\xd0\x67\xbc\xf0\xef\x8b\xf4\xeb\
-\x1a\xcd\xa6\x59\x8f\x12\xd6\x7c\x3f\x1d\x82\xdc\x7f\x5e\x2a\xd8\
-\x62\xb3\xd9\x28\x28\x28\x60\xe4\xc8\x91\xc4\xc4\xc4\x78\x7c\x98\
-\x50\x5c\x5c\xcc\x7b\xef\xbd\x27\x6b\x82\xea\x74\x3a\x8f\xb5\xf9\
-\xd2\x4f\xae\xe1\xcb\x4d\x67\x08\xf3\x3b\xce\x97\x36\x1f\x9e\x1e\
-\x79\x57\xa5\x9c\x2d\xe9\x80\xc5\x66\xb3\x91\x9f\x9f\xcf\xa2\x45\
-\x8b\x3c\xb6\x4b\x8a\x96\x4e\x9b\x36\x4d\x9e\x77\x8f\x49\xa5\x58\
-\xc8\x8e\xcd\x9b\xb8\x96\x6b\xe5\xf4\xca\xb1\xf8\x35\x39\x4c\xff\
-\xca\x2d\x49\xf9\x1e\x7f\x5e\x5e\x1e\x7e\x7e\x7e\x8c\x1d\x3b\x96\
-\x90\x90\x10\x8f\xed\x2b\x2c\x2c\x64\xfe\xfc\xf9\xf2\x1d\x55\x93\
-\xc9\xf4\xa7\xfa\x29\xaa\x8f\xa4\x42\x25\x81\x2a\x54\xa8\xf8\x47\
-\x43\x14\x45\xf6\xec\xd9\xc3\xcd\x9b\x37\xcb\x7c\x14\xfd\xfd\xfd\
-\xc9\xcb\xcb\x93\x35\xce\xc2\xc2\xc2\x18\x35\x6a\x14\x75\xeb\xd6\
-\xf5\xf8\x6f\x5d\xb8\x70\x81\x37\xdf\x7c\x13\x41\x10\xd0\xe9\x74\
-\x24\x25\x25\xf1\xed\xb7\xdf\xba\x45\x46\xeb\xd5\xab\x47\xad\x5a\
-\xb5\xa4\xde\x71\xd7\xe4\x45\x84\xdf\xfc\x8a\xd9\x67\x03\x89\xf0\
-\x2d\x21\x01\x87\x0f\x1f\x76\xab\x52\x59\x6e\x6e\x2e\x37\x6e\xdc\
-\x90\x2b\x84\x5a\x2c\x16\xc6\x8d\x1b\xa7\x68\x1c\x7d\x7d\x7d\x65\
-\x49\x0d\x9d\x4e\xc7\xd1\xa3\x47\xd9\xbe\x7d\x7b\xb9\x15\xe7\xa4\
-\x48\x6b\x87\x0e\x1d\xf0\xf3\xf7\x2f\x39\xa7\xf7\x09\xa3\x65\x8f\
-\x21\x70\xf0\x07\xd2\x7f\x36\x60\x32\x94\x6c\xfd\xfb\xf6\xed\x93\
-\xfb\x5c\x9e\xd3\x76\xfd\xfa\x75\x59\xc4\x5d\xa3\xd1\x10\x13\x13\
-\xa3\xd8\xb6\xac\xac\x2c\x0e\x1c\x38\x20\x57\xe6\x4c\x4a\x4a\x62\
-\xeb\xd6\xad\x15\x8a\xc5\x1b\x8d\x46\xda\xb4\x6e\x8d\x59\xae\x00\
-\xe8\x47\xff\x69\x73\x70\x9c\x7a\x8f\xed\xd5\xeb\x13\x09\xd8\x8a\
-\x8b\xf9\xf1\xa7\x9f\xc8\xce\xce\xae\x90\xcc\xe5\xe6\xe6\xca\xe4\
-\xdd\xe9\x74\xd2\xb6\x6d\x5b\x45\x04\x57\x72\x4c\x7f\xfc\xf1\x47\
-\xd9\xb6\x4d\x9b\x36\x11\x15\x15\x55\xee\x41\x87\xcb\xe5\xa2\x6a\
-\xd5\xaa\x34\x6e\xdc\x08\x93\xa9\x84\x7c\x98\x2d\xc1\xb4\xbe\xff\
-\x69\xae\x9c\xcc\xc4\x3f\xe0\x37\xd2\xbe\x66\xcd\x9a\x0a\xa3\x55\
-\x26\x93\x89\x83\x07\x0f\x96\xf9\x9b\x77\xdf\x7d\x37\x8f\x3f\xfe\
-\xb8\x22\xdb\xde\x78\xe3\x0d\xf9\x40\x20\x37\x37\x97\x2d\x5b\xb6\
-\x50\xb3\x66\xcd\x0a\xc5\xe2\xab\x55\xab\x46\x62\x62\xa2\xfc\xb3\
-\xc0\xf8\xbb\x58\xb4\xd8\x40\xf2\xb7\x9f\xb1\x37\x20\x8e\xa8\x20\
-\xc8\xcd\xce\xe2\xc0\x4f\x87\x2a\x4c\xed\xd4\x68\x34\xfc\xf2\xcb\
-\x2f\xf2\xc1\x81\x8f\x8f\x0f\x03\x06\x0c\xa0\x4d\x9b\x36\x1e\xdb\
-\x65\xb5\x5a\xd9\xb3\x67\x0f\x76\xbb\x1d\x8d\x46\xc3\xb5\x6b\xd7\
-\xf8\xfa\xeb\xaf\xdd\x3a\x78\xa9\x5b\x37\x86\xb8\xb8\x78\xf9\xdf\
-\xd5\xe2\xee\x64\xc4\x83\xe1\x7c\xb5\x76\x23\x21\x55\x22\xd0\x51\
-\x22\xa8\xbe\x6f\xdf\xbe\x0a\x53\xd6\xb5\x5a\x2d\xa7\x4e\x9d\x22\
-\x38\x38\x58\x1e\x03\x49\x0a\xc3\x53\x38\x9d\xce\x32\xf7\xef\x52\
-\x53\x53\xd9\xb4\x69\x53\x85\x99\x0a\xc5\xc5\xc5\x74\xea\xd4\xe9\
-\xb7\xaa\xab\x82\x99\x8e\x3d\x7a\x73\xe2\x87\x6d\xfc\xec\x5b\x9b\
-\x6a\xb7\x7e\x7c\xf5\xea\x55\x7e\xfa\xe9\xa7\x0a\x6d\xd3\xe9\x74\
-\x5c\xbe\x7c\x19\xad\x56\x8b\xd3\xe9\x24\x3a\x3a\x9a\x27\x9e\x78\
-\x82\x2a\x55\xaa\x78\x6c\xdb\x8d\x1b\x37\x58\xb8\x70\xa1\x7c\x90\
-\xf4\xe3\x8f\x3f\xe2\xef\xef\x5f\x66\xfd\x38\x1c\x0e\x6a\xd5\xaa\
-\x45\x42\x42\x82\x2a\x2d\xa5\x42\x85\x4a\x02\x55\xa8\x50\xf1\xdf\
-\x26\x81\xcb\x96\x2d\xe3\xd4\xa9\x53\x65\x1c\x03\x89\x50\x48\x69\
-\x9b\x4e\xa7\x53\x71\x31\x17\x49\xee\x02\x4a\x4e\xd0\x37\x6f\xde\
-\xcc\xd9\xb3\x67\x2b\x3c\x59\xd6\xe9\x74\x3c\x3d\x61\x12\xb5\xaa\
-\x5b\x79\xe2\xbe\x07\xd8\xe7\x37\x90\x7d\x9f\x4e\xe7\xfa\xde\x50\
-\x0a\x2e\xef\xe1\xe8\x15\x3b\xb1\xb5\xf5\xac\x5e\xbd\x9a\x1d\x3b\
-\x76\x54\xd8\x9e\xd3\xe9\xe4\xf2\xe5\xcb\xb2\x63\xea\x8d\xb4\xe9\
-\xd2\x77\x01\xf5\x7a\x3d\x5b\xb7\x6e\xe5\xcc\x99\x33\xe5\x46\x72\
-\x24\xb1\xf8\x84\x84\xc6\xf8\xfb\x5f\xa6\x7f\x95\xb6\xa4\x3f\xf0\
-\x1a\x7b\xdf\x1e\x03\x99\x87\x79\xf5\x9d\x43\x5c\x2a\x1a\x42\x15\
-\x8b\x91\x0f\x3f\xfc\x90\x43\x87\x0e\x95\xeb\xe8\x6a\x34\x1a\x8a\
-\x8b\x8b\xcb\xf4\xc5\x6e\xb7\x63\xb7\xdb\x15\x69\x05\x96\x76\xf4\
-\x45\x51\x64\xdd\xba\x75\x65\x22\x83\xb7\x43\x50\x50\x10\x0d\x1a\
-\x36\x26\xef\xe4\x56\x1e\x7a\xe0\x49\xba\xcc\xff\x9a\x29\xfd\x5a\
-\xf2\xcb\xcd\x20\xb2\x8f\x6e\x21\xc9\xf9\x0c\x0d\xf2\x73\x59\xb1\
-\x62\x05\xc7\x8e\x1d\xab\xd0\xe9\x73\x3a\x9d\x65\x52\x5b\x8b\x8b\
-\x8b\x15\x8b\xc5\x17\x17\x17\xcb\x44\xc9\xe9\x74\xb2\x78\xf1\xe2\
-\x0a\x0b\x59\xd9\xed\x76\xda\xb6\x6d\x4b\xdd\x7a\x8d\x29\xde\x31\
-\x89\xba\xc3\x3e\x63\xea\xf6\xf3\x4c\xec\xd9\x86\x8f\xd7\xbf\xce\
-\x99\x94\x6b\x74\x6f\x52\x15\x01\x98\x3a\x75\x2a\xc1\xc1\xc1\xe5\
-\xb6\xa7\xd5\x6a\xb9\x7a\xf5\x6a\x99\xb5\x52\x11\xc1\x76\x07\xd2\
-\xba\x96\x48\xe0\x3b\xef\xbc\xe3\x96\x6d\xdd\xbb\x77\x27\x31\x31\
-\x91\xd4\x3d\x9f\x31\x71\xd0\x20\x2e\xdd\xfb\x11\x9b\x16\xf4\xc7\
-\x56\x3d\x92\xa2\xcb\x9f\x72\xe6\x32\xd8\x73\x52\x99\x37\x6f\x1e\
-\x59\x59\x59\xe5\x12\x0a\x29\xda\x5e\x5a\x6b\x52\xe9\xdd\xa1\xe2\
-\xe2\x62\xec\x76\xbb\x7c\x98\x74\xe6\xcc\x19\x66\xcf\x9e\xed\x56\
-\x44\x78\xc4\x88\x91\xc4\xc5\xc5\xf3\xcd\xac\x87\x18\x3d\x7f\x1d\
-\xfd\xdf\xcb\xe0\xed\x4e\x2e\x36\x7c\x9e\xc6\xb9\xf3\xa7\x71\x52\
-\x8f\x8b\xc9\xc9\x4c\x9f\x3e\xbd\x42\x39\x1c\x49\x2c\xbe\x6f\xdf\
-\xbe\x65\xf6\x38\x25\xa9\xee\x79\x79\x79\x65\xf6\xa3\x13\x27\x4e\
-\xf0\xe2\x8b\x2f\xca\x63\x77\xbb\x7e\x64\x64\x64\xb0\x7a\xf5\x6a\
-\x82\x03\x4d\x2c\x99\xd4\x8f\xed\x39\xd1\xac\xfe\x70\x39\xc5\x59\
-\x17\x11\x6f\x2c\xe2\xe8\xb9\x02\xee\x68\xe6\xcb\x89\x13\x27\x98\
-\x31\x63\x86\x5b\x91\xd3\x53\xa7\x4e\xd1\xa8\x51\x23\xf9\x5d\xf1\
-\xc6\xfe\x5f\x5a\xe3\x73\xcd\x9a\x35\x1c\x38\x70\xa0\xcc\xef\x14\
-\x14\x14\xf0\xc0\x03\x0f\x10\x13\x13\xa3\x92\x40\x15\x2a\x54\x12\
-\xa8\x42\x85\x8a\xff\x26\x34\x1a\xcd\x1f\x56\x0f\x94\xa2\x6f\xa5\
-\x1d\x55\xa5\x1f\xe5\xd2\xa9\x76\x05\x05\x05\x3c\xf7\xdc\x73\x4c\
-\x98\x30\xc1\xad\xf4\x22\x41\xa3\x01\x57\x01\x93\xfe\xf5\x39\x53\
-\x0b\x4e\x32\xfa\xd9\xd5\x7c\x32\x77\x08\xe3\xfa\x9d\x63\xf3\xc9\
-\x1c\xfa\xd7\x0e\x63\xd6\xac\x59\x15\xb6\x25\x08\x02\xd7\xae\x5d\
-\xe3\xfe\xfb\xef\x97\x1d\x6d\x6f\xa4\x05\x95\x76\x40\x8b\x8a\x8a\
-\x78\xfe\xf9\xe7\x19\x3f\x7e\xbc\x5b\x04\xb3\xe4\xd9\x62\x66\x6f\
-\xd8\x40\x81\xce\xc0\x17\x4b\x16\x10\xfb\xc8\x44\x1e\x0c\x1e\xc1\
-\x71\x47\x31\xcd\xf1\x67\xd9\xb2\x65\x15\xda\xa6\xd1\x68\xc8\xce\
-\xce\xa6\x46\x8d\x1a\x65\x08\xb4\x52\xb1\x78\x83\xc1\x20\x57\xa7\
-\xd5\x68\x34\x3c\xf7\xdc\x73\x3c\xfa\xe8\xa3\x6e\xdb\x66\xf7\x6b\
-\xc7\x82\xf5\xdb\xa9\x65\xdf\xcd\xa3\xaf\x15\xb0\x7c\xda\x14\xa6\
-\x7c\xf1\x21\x1b\x7f\x86\xb6\x2d\xaa\xf0\xe1\x87\x1f\xba\xb5\x06\
-\xae\x5c\xb9\x42\xfd\xfa\xf5\xe5\xdf\xf5\x3c\x9d\xf8\xb7\x35\x2d\
-\x89\xc5\x8b\xa2\x88\x5e\xaf\x67\xe3\xc6\x8d\x6e\xa5\x3c\xcb\xc4\
-\xb1\xd5\x53\xac\x5f\x37\x94\xaa\xa1\x07\x78\x6f\xfe\x25\x7a\xdd\
-\xd1\x82\xa4\xbc\x2b\xe4\xd3\x04\x3f\x51\xe4\xd4\xa9\x53\x6e\x8d\
-\xd1\xaa\x55\xab\x78\xf6\xd9\x67\xcb\xcc\x9b\x52\x48\xeb\x5a\x8a\
-\xee\xad\x5e\xbd\x9a\xd8\xd8\x58\xb7\x6c\x03\xa8\xda\xb8\x2b\x73\
-\xb7\xfc\xc2\xcf\x9b\x3e\x67\xc5\xe1\xeb\x4c\xec\x36\x9c\xd7\xcf\
-\x7e\xc9\x37\x07\xaf\xd2\xb3\x5f\x63\xb7\x0a\x8f\x69\x34\x1a\xf6\
-\xef\xdf\xcf\xe0\xc1\x83\xe5\xc8\xb7\xa7\xa9\x9b\xa5\xdb\x94\xee\
-\xa6\xda\x6c\x36\x3a\x76\xec\xc8\x57\x5f\x7d\xe5\x56\x24\x50\xb2\
-\xad\xdd\xc3\x33\xf9\xb6\xdb\x73\xe4\x9e\x9e\xcd\xd7\x17\xa6\xf3\
-\xd4\xc3\x03\xf8\xe2\xa7\xb3\xa4\x59\xa1\x79\x8b\x16\x24\x25\x25\
-\xb9\x35\xff\xe3\xc7\x8f\x27\x23\x23\x43\xfe\xb9\xd2\xbb\x6e\x26\
-\x93\xa9\xcc\x9a\xee\xde\xbd\x3b\xeb\xd6\xad\x73\xfb\x5d\x13\x45\
-\x27\xfd\xc7\x2f\xa4\x63\x7e\x26\xdf\x6e\xfa\x96\xc6\xcd\xba\xf3\
-\xe6\xb8\x26\x2c\xf8\xe5\x22\x34\x4b\xa0\x73\xe7\xce\xb2\xac\x46\
-\x45\x6d\xf5\xeb\xd7\x8f\xab\x57\xaf\xca\xeb\xd1\x1b\xfb\xbf\x34\
-\xfe\x79\x79\x79\xcc\x9b\x37\x8f\x81\x03\x07\xfe\xee\xdd\x97\xc6\
-\x56\x85\x0a\x15\x2a\x09\x54\xa1\x42\xc5\x7f\x19\xb7\xfb\xe8\xba\
-\x5c\x2e\x34\x1a\x0d\x5a\xad\x96\xf3\xe7\xcf\x33\x69\xd2\x24\xaa\
-\x57\xaf\xee\x51\x11\x15\x8d\x46\xc3\xf9\xf3\xe7\xe5\x28\x95\x74\
-\xff\x45\x22\x16\xee\x35\xe2\x4b\x9d\xf8\xfa\x40\x1c\x1d\x16\xdd\
-\x4d\xf3\x9e\x9f\x13\x15\x5c\x8d\xd9\xcb\xc2\x2a\xe5\x3c\x94\x16\
-\x77\x16\x04\x81\xeb\xd7\xaf\xf3\xf8\xe3\x8f\x7b\x1c\x7d\xd1\xe9\
-\x74\x1c\x3f\x7e\xbc\x4c\xe4\xa5\x74\x4a\xa6\x9b\xee\x1f\xb1\x2d\
-\xee\x04\x47\x36\xd7\x76\x2f\x67\x4c\x93\x06\x88\x2d\x86\xb3\xde\
-\x3f\x00\x10\x10\x04\xf7\xc8\xaa\x34\xa6\xd2\xfc\xed\xdb\xb7\x8f\
-\x01\x03\x06\x60\xb1\x58\x3c\x8a\x78\xfa\xf8\xf8\xb0\x71\xe3\xc6\
-\x3f\x4c\x69\x74\xd7\x36\xbd\x5f\x08\x0d\x1b\x84\x00\x21\x44\xbd\
-\xd0\x97\xae\xbd\xcc\x14\xf9\x0e\x67\x7d\x0b\x2a\x3d\x6f\x92\x6d\
-\x46\xa3\x91\x7f\xff\xfb\xdf\x9c\x3f\x7f\xde\x23\x87\x51\xba\xc7\
-\xb5\x71\xe3\x46\xba\x76\xed\x2a\x13\xc1\xfc\xfc\xfc\x4a\xd9\xa6\
-\x0d\xac\xc9\x9d\xad\xc0\x7a\x33\x8d\x6b\x3f\x3d\xca\x9c\xdc\xce\
-\xbc\xb3\xf0\x65\xfc\x4b\xfe\x88\xdb\x7d\xfb\x4f\x39\x9f\xa5\x4b\
-\x97\xf2\xeb\xaf\xbf\xe2\x72\xb9\x3c\xba\x83\xe5\xe7\xe7\xc7\xd9\
-\xb3\x67\x69\xde\xbc\xb9\xbc\x16\xa4\x35\xef\xae\x6d\x06\x4b\x08\
-\xb5\xea\x87\x10\x29\x9e\xa4\xef\xa3\x23\xd8\x1f\xa1\x27\x3b\xaf\
-\x16\xef\x7d\x17\x59\xa9\x76\x0a\x0a\x0a\x10\x04\x01\xad\x56\xcb\
-\x8d\x1b\x37\x98\x36\x6d\x1a\x31\x31\x31\x1e\xef\x57\x76\xbb\x9d\
-\xad\x5b\xb7\xd2\xb5\x6b\x57\xf9\xdf\xd2\x5e\xe5\x2e\x82\xa3\xea\
-\x12\x1c\x05\xd7\x8d\x47\x18\x3c\xac\x39\x62\x44\x2c\x03\x9f\x7e\
-\x85\x28\x63\xe5\xd6\xb6\xb4\x9f\x49\x73\x34\x62\xc4\x08\xf9\x60\
-\xc1\x93\x3d\xf2\xe6\xcd\x9b\xa4\xa5\xa5\x95\x59\xa3\x95\xe9\x8f\
-\x20\x68\xa9\x5a\x33\x9e\xaa\xc4\x70\x66\xcf\x6b\x3c\xb3\x64\x2e\
-\x17\xd2\xaa\xf2\xd6\xc6\x84\x4a\x13\x2c\x29\xd2\x6f\x30\x18\xf8\
-\xe5\x97\x5f\x18\x3d\x7a\x34\x11\x11\x11\x1e\x15\x29\x93\xee\x28\
-\xe7\xe7\xe7\xcb\x7d\x90\x52\xe5\xd5\x82\x22\x2a\x54\xa8\x24\x50\
-\x85\x0a\x15\x7f\x41\x72\x08\x50\xa5\x4a\x15\x1a\x35\x6a\xc4\xe5\
-\xcb\x97\xb9\x74\xe9\x92\x47\x4e\xb7\x28\x8a\x68\xb5\x5a\x5a\xb6\
-\x6c\x49\x58\x58\x98\x22\xbd\x39\x51\xd4\xf2\xd8\x47\xdb\x78\x2c\
-\x3f\x03\xbb\x5f\x15\x8f\xf5\xf4\x5c\x2e\x17\x75\xeb\xd6\xe5\xca\
-\x95\x2b\xec\xde\xbd\x5b\x41\x7f\x4a\x88\x6c\xf3\xe6\xcd\x95\x8b\
-\x7c\xeb\x82\xe8\xf9\xf4\x12\xba\x8f\x75\xa2\x51\x20\xa3\xe1\x72\
-\xb9\x88\x8f\x8f\xe7\xf2\xe5\xcb\x9c\x3c\x79\x12\x97\xcb\xe5\xf1\
-\xbc\x05\x06\x06\x12\x17\x17\xe7\xb1\x73\xfb\x5b\x5b\xa1\xbc\xb8\
-\x7e\x3f\xf9\xb9\x79\xf8\x59\xfc\x3d\xaa\x5f\x2f\x8a\x22\x3a\x9d\
-\x8e\x06\x0d\x1a\xb0\x77\xef\x5e\x7e\xfa\xe9\x27\x45\x6b\x3c\x22\
-\x22\x82\xfa\xf5\xeb\xff\x6e\xcd\x57\x16\xc6\x80\x70\xa6\xaf\x3d\
-\xcb\x74\x85\xef\x9c\xdd\x6e\xa7\x7e\xfd\xfa\xe8\x74\x3a\xf6\xef\
-\xdf\xaf\x68\x4d\xc6\xc7\xc7\x53\xa7\x4e\x1d\x85\x3d\x12\x31\x26\
-\x0c\x62\xf3\xfe\x41\xdc\x48\xcf\x25\xa4\xaa\x05\x4f\x04\x15\xa4\
-\xea\xb9\xcd\x9b\x37\x27\x25\x25\x85\x83\x07\x0f\x2a\xea\x55\x83\
-\x06\x0d\xa8\x56\xad\x1a\x3f\xfe\xf8\xa3\xa2\x76\x42\x1b\x3c\xc4\
-\x96\x9f\x1f\x24\xdf\xae\xc3\x4f\xef\xf9\xbb\xe6\xef\xef\x4f\xd3\
-\xa6\x4d\x39\x72\xe4\x88\xc7\x7a\xae\xd2\x3e\x12\x13\x13\x83\x9f\
-\x9f\x9f\x42\x5d\x58\x1d\xf7\x3e\x3e\x93\xce\x83\x9e\xc1\x3f\xd0\
-\x57\xd1\x18\x85\x84\x84\x90\x90\x90\x40\x4a\x4a\x0a\xc9\xc9\xc9\
-\x8a\xa2\x74\x77\xdc\x71\x07\x41\x41\x41\xaa\x06\xb4\x0a\x15\x2a\
-\x09\x54\xa1\x42\xc5\xdf\x01\x77\xde\x79\x27\x7b\xf7\xee\xf5\x4a\
-\x5b\x1a\x8d\x86\xac\xac\x2c\x3e\xfa\xe8\x23\x05\xe4\xf4\xd6\x7f\
-\x28\x20\x80\xa2\x28\x52\x5c\x5c\xcc\x4b\x2f\xbd\xc4\xcc\x99\x33\
-\xbd\xa2\x13\xa7\xd7\xeb\x49\x4d\x4d\xf5\xce\x38\x29\x20\x80\xd2\
-\x29\xfb\x82\x05\x0b\xe4\x28\x8c\x52\xfb\x34\x1a\x0d\x17\x2e\x5c\
-\xc0\xe1\x70\x78\xec\x04\x4a\x8f\xf9\x59\xfc\xff\x63\x22\xdd\x87\
-\xd3\xe9\x24\x30\x30\x90\xc5\x8b\x17\x2b\xbe\xa3\x24\xc1\xdf\xdf\
-\x9f\x85\x0b\x17\xfe\xe9\x5a\x81\xd2\xfd\xb9\xd2\x45\x78\x94\xc2\
-\x64\x32\xf1\xd9\x67\x9f\x29\x68\xeb\xb7\x39\x2a\x21\x80\xe0\x89\
-\xa2\x9e\xc3\xe1\x20\x2e\x2e\x8e\xd5\xab\x57\x2b\x96\x63\x91\xc6\
-\xca\xcf\xcf\x8f\x4f\x3f\xfd\xd4\x2b\xee\x95\x9f\x82\x8c\x69\x9b\
-\xcd\x46\x42\x42\x02\x3b\x77\xee\xbc\x95\x92\x29\x2a\xb2\xcb\xe9\
-\x74\x12\x10\x10\xe0\x15\xa2\xa4\x94\x00\x8a\xa2\x48\xfd\xfa\xf5\
-\xf9\xe1\x87\x1f\xbc\xb6\xff\x17\x17\x17\x33\x7f\xfe\x7c\xf5\xc3\
-\xaa\x42\x85\x4a\x02\x55\xa8\x50\xf1\x77\x80\xd2\x7b\x3c\xa5\x9d\
-\x1c\x6f\x08\x61\x7b\x03\xa2\x28\x62\x34\x1a\xbd\x24\x5c\x5f\x92\
-\x16\xfa\x57\x49\x6d\x92\xa2\x0a\xde\x2a\xc3\xae\xd1\x68\xfe\x32\
-\xb6\x49\x05\x41\xbc\x61\x9b\xb4\x0e\xff\x2a\x77\x90\x24\x8d\x47\
-\x6f\xb5\xa5\xf4\x3e\xa8\x37\x21\xdd\xe5\xd3\xe9\x74\xff\x73\x77\
-\xbe\x34\x1a\x8d\xe2\x3b\xaa\x12\xfe\x8a\x51\x32\x6f\xee\xff\x9e\
-\xca\x9e\xfc\x9d\x51\xf9\xd8\xb9\xe7\x4f\xfd\x51\x3b\xa2\x28\xa0\
-\x5e\xb3\x54\x49\xa0\x0a\x15\x2a\x54\x54\x1a\x3b\x76\xec\xe0\xe1\
-\x87\x1f\x46\xab\xd5\x2a\x72\x50\x34\x1a\x0d\xa1\xa1\xa1\x0c\x1e\
-\x3c\x98\x80\x80\x00\x85\xdf\xb5\x74\xd6\x2c\xfd\x14\x21\xa1\x3b\
-\xfd\xda\xc5\x7b\xe4\x8c\xf8\xf8\xf8\x30\x76\xec\x58\xf6\xed\xdb\
-\x27\xdf\x55\x51\xe2\x6c\x1b\x0c\x06\x16\x2d\x5a\xa4\xd8\xc1\x75\
-\xe6\xa7\xf3\xdd\xda\xf5\xe8\xeb\x77\xa1\x4b\x93\x9a\x68\x35\x95\
-\xef\x8f\x9f\x9f\x1f\x23\x46\x8c\x90\x4b\xe9\x2b\x21\x12\x26\x93\
-\x09\x8b\xc5\xc2\xac\x59\xb3\x64\xed\x30\x8f\x91\x7b\x86\x0f\xde\
-\xdf\x48\x54\x8f\x11\xdc\x1d\x57\xf9\x35\xa0\xd3\xe9\xb8\x71\xe3\
-\x06\x23\x47\x8e\x64\xe7\xce\x9d\x1e\xdd\x4f\xfa\x4f\x0c\x1a\x34\
-\xc8\x0b\x84\xd2\x45\x46\xca\x09\x0e\x9d\xbd\x49\x9b\x0e\x6d\x08\
-\xd0\x7b\x36\xd6\xa1\xa1\xa1\x72\x41\xa6\xd2\x55\x5e\x3d\x9d\xb7\
-\x3e\x7d\xfa\xd0\xac\x59\x33\xc5\x6b\xb2\xe0\xf4\x56\xbe\xd8\x7a\
-\x94\xc0\x16\x83\xb9\xef\x8e\x70\x8f\xe6\xed\xd7\x5f\x7f\x65\xe2\
-\xc4\x89\xa4\xa4\xa4\x28\x3e\x04\x32\x1a\x8d\x4c\x9f\x3e\x5d\xb1\
-\x58\x3c\x2e\x27\x47\xb6\x7f\xc9\xa1\xcc\x20\xfa\xde\xd7\x8d\x2a\
-\x26\xcf\xfa\x72\xf8\xf0\x61\x1e\x7f\xfc\x71\xf2\xf3\xf3\xbd\x12\
-\x09\xdc\xb5\x6b\x97\x72\x42\x59\x90\xc6\x37\x5f\x7d\x4d\x6e\xd5\
-\x4e\x3c\x74\x77\xbc\x47\x74\x42\x10\x04\x7e\xf9\xe5\x17\xfa\xf4\
-\xe9\xa3\xf8\xdd\x17\x04\x81\x6a\xd5\xaa\x31\x61\xc2\x04\x8f\xf5\
-\x38\xff\x1e\x28\xe6\xf3\xe7\xc7\xf0\x55\x56\x04\x63\x27\x4e\xa2\
-\x5d\x6c\x28\x82\xf3\x12\xaf\x4d\x7c\x85\x23\xd7\xb2\xb1\xdb\x1c\
-\xe0\x72\xe0\x0a\xa9\xc7\xb4\xa9\x53\xb8\xa3\x46\x31\xf3\x9f\x79\
-\x8a\x65\x5b\x4f\x62\x0e\xaa\xc6\xd0\x49\xaf\xf0\xc4\xfd\xad\x30\
-\x21\xc0\xde\x17\x69\xf2\xd4\x4e\x06\x0c\xef\xc7\xb1\xdd\xdb\x28\
-\x72\x09\x20\x82\xcd\xa5\xe5\x81\xc9\x6f\x71\xbf\x65\x33\x43\xa7\
-\xac\x01\x1f\x2d\x2e\x97\x86\x2a\x71\x77\x32\x76\xe2\x53\x34\x0e\
-\x13\x59\xbf\xf4\x55\x36\x5d\x89\x64\xe2\x8c\xb1\xd4\x31\x89\xac\
-\x9e\xf1\x30\xdf\x6a\xbb\xb2\xf4\xc5\xa1\x18\x51\xa1\x92\x40\x15\
-\x2a\x54\xa8\x70\x03\x37\x6f\xde\xa4\xa0\xa0\x80\x99\x33\x67\x52\
-\xa3\x46\x0d\x8f\x48\x85\x56\xab\x25\xf9\x56\xe9\x75\x49\x7c\x5e\
-\x09\xbe\x18\xf6\x00\xeb\x5a\x4d\xa3\xc1\xda\xb7\xf9\xa6\xc6\x7c\
-\xee\x89\xae\xbc\x38\xbb\x46\xa3\x21\x3d\x3d\x9d\x6b\xd7\xae\xb1\
-\x6a\xd5\x2a\x8f\x4b\xd7\x9b\x4c\x26\x36\x6d\xda\xc4\xb2\x65\xcb\
-\xbc\x90\xea\x76\x93\xad\x6b\xde\xe5\x87\xa3\xd9\xfc\xb8\x36\x95\
-\x1a\xef\x3c\x43\x7c\x95\xca\x97\x9c\x17\x04\x81\xb4\xb4\x34\xf4\
-\x7a\xbd\x4c\xde\x3c\x21\xf0\x16\x8b\x85\x15\x2b\x56\xf0\xfd\xf7\
-\xdf\x2b\x4a\x05\xbd\x45\x6f\x79\x73\xd8\x68\x6c\xc3\xc7\xb1\x7d\
-\xc4\x30\xcc\xfb\xbf\xa1\xad\x27\xad\x38\x9d\x9c\x3a\x75\x8a\xc4\
-\xc4\x44\x1e\x7c\xf0\x41\x8f\x1d\x52\x80\x4f\x3e\xf9\x84\xb3\x67\
-\xcf\x96\xb9\x17\xe8\x09\x6c\x79\x59\xec\x7c\xe7\x49\xde\x3d\xd5\
-\x82\x1c\x57\x20\x83\xef\x4e\xf0\xa8\x1d\xad\x56\xcb\xb9\x73\xe7\
-\x78\xf8\xe1\x87\xe9\xdf\xbf\x3f\x36\x9b\xcd\x23\xc7\x3b\x34\x34\
-\x94\x41\x83\x06\x91\x91\x91\xa1\x3c\xea\x76\x79\x1d\x3d\x1f\x5d\
-\xc7\xa8\x67\x07\xf1\xeb\xeb\xf7\xa0\x79\xf3\x47\xee\xa9\x51\xf9\
-\xf1\x2e\x2e\x2e\xe6\xf2\xe5\xcb\x0c\x1d\x3a\x94\x26\x4d\x9a\x78\
-\x4c\x28\xec\x76\x3b\x73\xe6\xcc\x21\x3d\x3d\x5d\xb1\x6d\xd7\x2f\
-\x6f\x67\xf9\xe7\x7b\x89\x8b\x09\x64\xe5\x47\x05\x3c\x39\xba\x1f\
-\x3e\x1e\xac\x25\xab\xd5\xca\xf1\xe3\xc7\xf9\xf7\xbf\xff\x8d\xd9\
-\x6c\xf6\xe8\x5d\xd3\x6a\xb5\xe4\xe7\xe7\x33\x7a\xf4\xe8\x0a\xf5\
-\x17\xdd\x39\x94\x58\xf7\xf9\x97\x5c\xd3\x87\x72\x7d\xd9\xc3\xbc\
-\x1f\xb6\x8f\x51\x4d\x3d\x73\x23\x73\x72\x72\x10\x45\x91\xe7\x9f\
-\x7f\x5e\xbe\xcf\xed\xc9\xfb\x96\x99\x99\xc9\xf4\xe9\xd3\x29\x2c\
-\x2c\xfc\xdf\xae\xfe\x99\x75\x90\xd7\xdf\xfa\x88\x23\x54\x27\xf6\
-\xce\x1e\xb4\x8b\x6d\x0f\xce\x1c\xb6\xad\xff\x92\x3d\x37\x2c\x34\
-\xaa\x17\x8e\xab\xa8\x08\x57\x51\x10\x1a\xb3\x89\xf5\x53\x7b\xf0\
-\xdc\x92\x4b\xf4\x1d\x39\x08\xcd\x99\xef\x99\x34\xe6\x19\xc2\x23\
-\x3e\x61\x70\x9b\x9a\x6c\xfe\xf4\x0b\xce\x59\x5b\xe3\xca\xdc\xc1\
-\x97\xdf\x6e\xa7\x6e\x42\x3d\xcc\xd8\x29\x72\x6a\xc9\x29\x16\x29\
-\xca\xff\x89\xb5\x9b\xbf\x23\xae\x49\x4b\x42\x74\x37\xf9\x7e\xc3\
-\xd7\xac\x3a\x50\xcc\x8d\xdd\x53\x38\x73\x70\x33\xdf\x9c\xaf\xc7\
-\x70\xfb\x58\xea\x98\x5c\x1c\xdd\xbc\x91\x35\xc6\x50\x96\xcc\x1c\
-\xea\x9d\x00\xa3\x0a\x95\x04\xaa\x50\xa1\xe2\xef\x0f\xab\xd5\xfa\
-\xbb\xc2\x21\x52\x81\x13\xe9\x6e\x52\x40\x40\x00\x77\xdd\x75\x17\
-\x0d\x1a\x34\xf0\xf8\xef\x1c\x3d\x7a\x94\x17\x5e\x78\x41\xfe\x3b\
-\x76\xbb\xdd\x2d\x67\xa7\x24\xd2\x66\x40\xa7\xd3\xe2\x12\x41\xe3\
-\xfc\x81\x79\xc9\x1d\x59\xf3\x46\x35\x0a\x0b\x5e\x21\xee\x16\x01\
-\xb4\xdb\xed\x15\x3a\x28\x52\xc5\xbd\xd2\x95\x3c\xcd\x66\x33\x3d\
-\x7a\xf4\x50\x34\x86\xd7\xae\x5d\x93\x89\x6d\xe9\xea\xa3\xc5\xc5\
-\xc5\x15\x3e\x6b\x34\x1a\x11\x04\x01\x97\xd3\x89\x23\xe3\x0a\x17\
-\x4f\xa7\xe0\xdf\x7e\x3a\xab\x5f\x08\x25\xe0\xd6\xfd\x39\x9b\xcd\
-\x56\x61\x31\x1d\x9d\x4e\x57\x86\x34\x08\x82\x40\x44\x44\x04\xfd\
-\xfb\xf7\x57\x94\xf2\xba\x7f\xff\x7e\xb6\x6e\xdd\x2a\xcf\x85\xbb\
-\xb6\x09\x82\x50\xa2\xeb\x07\x38\x05\x01\x6d\xd6\xc7\x7c\x51\xd4\
-\x9d\x77\xe3\xea\x30\x6c\xdb\xd7\x84\xdf\x6a\xcf\x5d\xa2\x53\xba\
-\xb2\xac\xc3\xe1\x20\x21\x21\x81\x7e\xfd\xfa\x79\x7c\xa0\xe0\x72\
-\xb9\xf8\xf5\xd7\x5f\x39\x72\xe4\x88\x3c\xae\x56\xab\xd5\xad\x75\
-\x24\xa5\x36\x0a\x88\x38\x5d\x22\xf9\xf9\xa7\xd8\x79\xb4\x0e\xb3\
-\x57\xcf\xe3\x8e\x52\x41\x8e\xa2\xa2\xa2\x0a\xd7\xb7\xc9\x64\xfa\
-\xdd\xe1\x41\x93\x26\x4d\xe8\xd3\xa7\x8f\xa2\x35\x19\x18\x18\x58\
-\xe6\x1d\x92\xd6\x50\x45\xda\x95\xb2\xac\xc8\xad\xc2\x3d\xc7\x36\
-\x7c\x47\xf8\xa8\x11\x54\xf3\xb1\xd3\x6a\xe5\x8f\xd4\xf5\x2f\x19\
-\x3b\x77\x22\x95\x5a\xad\xb6\xcc\xef\x19\x0c\x06\x3a\x74\xe8\x40\
-\x97\x2e\x5d\x3c\xb6\x2b\x2f\x2f\x8f\x95\x2b\x57\xca\x63\xe6\x74\
-\x3a\xb1\x5a\xad\x15\xae\x03\x29\x62\xaf\xd3\xe9\x10\x5d\x2e\x44\
-\x8d\x86\xcc\x9f\x56\xe3\x57\xb7\x2f\x5d\xfa\x35\x26\x36\xa6\x1a\
-\xba\x5b\xed\xd9\x6c\xb6\x72\xe7\x4d\xaa\x70\x59\xba\xca\x30\xc0\
-\x7d\xf7\xdd\x87\xaf\xaf\xaf\x22\xdb\x9e\x79\xe6\x99\x32\x07\x1e\
-\x0e\x87\xe3\x77\xd5\x63\xff\xc8\x36\xa3\xd1\x28\xdf\x49\x74\x15\
-\x5f\x23\xdb\xe5\x24\x50\xd0\xd2\x6e\xc9\x6e\x12\xc2\x74\x72\x7b\
-\x15\x1d\xe2\x95\xd6\xcd\x94\xde\x93\xd0\xd0\x50\x7a\xf4\xe8\x41\
-\xf5\xea\xd5\x3d\xb6\x2d\x35\x35\x55\xd6\x3c\x94\xde\x67\x49\xa7\
-\xb3\xb4\x1d\x5a\xad\xb6\xe4\xdd\xfa\x9b\x12\xc5\x8b\x7b\x77\x71\
-\xa6\x40\x20\xb2\x76\x00\xc7\x7f\x3e\x4c\xee\xf0\xf6\x58\x10\xc0\
-\x69\xa5\x5a\xab\x49\x1c\xde\xf4\x74\xa9\xdf\xce\xe0\xd1\xaf\x4e\
-\xd3\x60\xd4\x3c\xd6\x2c\x7d\x8c\xec\xe4\xfd\x58\xfb\x3c\xcc\xee\
-\xd3\xe7\x18\xdc\xc6\x97\xcf\x36\xa6\x50\x6f\xf0\x62\xea\x38\x67\
-\x11\xd5\xea\x7e\x3e\xdf\xf2\x01\x0d\x4b\x9d\x77\x5e\xfe\xc6\x89\
-\x4f\x58\x02\xb3\x3f\xfc\x96\xfb\x1a\x07\xf3\xdd\x9c\xfe\xf4\x7a\
-\x6e\x03\x87\x98\x8e\x49\x28\x89\x1a\xca\xa3\xa8\x11\x51\x73\x42\
-\x55\x12\xa8\x42\x85\x0a\x15\x65\x9c\x8c\xc9\x93\x27\x73\xee\xdc\
-\xb9\x32\x44\xc1\x60\x30\x70\xe5\xca\x95\x32\x1f\x7d\xa5\x77\x55\
-\x4a\x3b\x31\x3e\x3e\x3e\xac\x5c\xb9\x92\x43\x87\x0e\x55\xbc\xf9\
-\xe9\x74\x8c\x1c\xf5\x08\x7d\x7a\xb7\x63\xfb\xda\x8d\x88\x85\xc9\
-\xa4\xa5\x6f\x60\xfa\x8c\x7c\x0a\xd3\xd3\x19\xf1\xe6\x47\xf4\x8c\
-\xd6\x31\x7f\xfe\x7c\xf6\xed\xdb\x57\x61\x7b\x0e\x87\x83\x33\x67\
-\xce\x28\x76\xb2\x6f\x67\x9b\xc1\x60\xe0\xe3\x8f\x3f\xe6\xe7\x9f\
-\x7f\x2e\xd7\x51\x96\xee\xed\xbd\xf5\xd6\x12\xa2\xa3\x7d\xf8\x76\
-\xd9\xbf\xb9\x19\x1a\xcd\x85\x23\xfb\x39\x7c\xea\x39\xfe\x3d\xaf\
-\x2a\x9f\xae\x99\x45\xa3\x30\x7f\xa6\x4f\x9f\x4e\x52\x52\x52\x85\
-\x62\xf1\x45\x45\x45\x65\x22\x9a\xa2\x28\xe2\x72\xb9\x14\x91\xc0\
-\xd2\xa4\x52\x14\x45\x96\x2f\x5f\xce\x96\x2d\x5b\x2a\x8c\x7a\x06\
-\x06\x06\x32\x6f\xde\x7c\x2c\xe4\xf1\xf5\x96\xc3\xb4\x0e\x3e\xcd\
-\xb9\xb3\xbb\xf9\x60\xc9\x59\x7e\xd8\x9f\xc3\x3b\x87\x56\x13\x93\
-\x7d\x83\x99\xaf\xbc\xc6\xa9\x53\xa7\x2a\xd4\x21\x73\x38\x1c\x65\
-\xd2\x36\x25\xdb\x94\x90\xc0\xd2\x15\x18\x9d\x4e\x27\x4f\x3f\xfd\
-\x34\xfe\xfe\xfe\x15\x0a\xaa\xb7\x6c\xd9\x92\x09\x93\x26\x63\xce\
-\x3e\xcc\xbb\x6b\x2e\xd0\xb4\xbb\xc0\xb1\x1d\x1b\x78\xf2\xbe\x87\
-\x79\xf2\x99\xca\xb1\xe5\xd8\x00\x00\x20\x00\x49\x44\x41\x54\xe7\
-\x18\xd1\xb5\x24\xa5\xb3\x5b\xb7\x6e\x04\x06\x06\x96\xdb\x9e\x4e\
-\xa7\xe3\xc2\x85\x0b\x65\xd6\x8a\x37\xef\xcc\x4a\xda\x98\x13\x26\
-\x4c\xa8\x50\x2a\xc4\xe1\x70\xd0\xb1\x63\x47\xa6\x4c\x99\x42\xde\
-\x95\xd3\xec\xdf\xb5\x8b\x9d\x3b\x0f\x71\xf0\xe2\x65\xaa\x76\xaa\
-\xc3\xc5\xe7\x67\x30\x61\xdd\x1e\xaa\x67\x9f\x62\xe6\x2b\xaf\x91\
-\x9d\x9d\x5d\xee\xda\x92\xa2\xed\xa5\xef\x94\x29\xb5\xad\xf4\xbc\
-\xe9\xf5\x7a\x7e\xf9\xe5\x17\x86\x0c\x19\x52\xe1\x1a\x17\x04\x81\
-\x07\x1e\x78\x80\xa1\x43\x87\x72\xfe\xa7\x4d\x6c\xfd\x39\x9d\xfc\
-\x33\x27\xf9\xf6\x50\x0e\xe9\x87\x6c\xd4\xe9\x36\x86\x69\xa3\xba\
-\x71\xec\xd8\x31\x26\x4d\x9a\x54\xe1\x3d\x38\x41\x10\x38\x78\xf0\
-\x20\x9d\x3b\x77\xf6\xaa\x6d\xa5\xdb\xfa\xe1\x87\x1f\xe8\xdf\xbf\
-\x7f\xb9\x73\x26\x08\x02\x37\x6e\xdc\x60\xe9\xd2\xa5\x34\x48\x88\
-\x27\x69\xe7\x7a\x2e\xe5\x5c\xe3\xe2\xf1\x43\x9c\xcb\xd1\xf3\xef\
-\x05\xaf\x33\xe4\xa3\x1f\x18\xdc\xd0\xc8\xfe\xfd\xfb\x79\xf9\xe5\
-\x97\x2b\xd4\x33\x94\x6c\x8b\x8d\x8d\xf5\xda\xfe\x5f\xfa\x79\xb3\
-\xd9\xcc\xe2\xc5\x8b\xd9\xb0\x61\x43\x99\xdf\x29\x2a\x2a\xa2\x77\
-\xef\xde\x8c\x1e\x3d\xda\x6b\xf7\x10\xff\xbf\xb1\x6b\xc7\x26\x5c\
-\x61\x5d\x18\x37\x2d\x91\x8f\x56\x1c\xe0\x78\x26\xb4\x0a\x04\x41\
-\xa3\x27\x37\x75\x3f\xcb\xbf\x08\x43\xc8\xce\xc7\x52\xad\x01\xf7\
-\xf4\x6a\x4c\x4c\xdd\x30\x56\x7c\xb3\x9c\x97\x1b\x1a\x68\x93\xd8\
-\x84\x95\x47\xce\x12\xa8\x03\x52\x36\xf0\xfd\x55\x1d\x4f\x3e\xd8\
-\x11\xe7\x8a\x99\xdc\xbc\x74\x8a\xaf\xdf\xff\x94\xc3\x86\x3c\x1c\
-\x82\x85\x6e\x83\x1f\x44\x2b\x80\x35\x37\x83\x6d\xeb\x3f\xc3\x76\
-\xcc\xc4\xfa\x75\x3f\x11\xd4\x7e\x14\x8d\x70\x70\x10\x15\x2a\x09\
-\x54\xa1\x42\x85\x8a\x72\xa0\xd5\x6a\x99\x32\x65\xca\xef\xc8\x4a\
-\x60\x60\xa0\xac\x31\x26\x39\x05\xde\x10\x42\x96\x60\xb5\x5a\xb9\
-\xf7\xde\x7b\x19\x3b\x76\xac\x5b\x4e\x6c\x70\x48\x28\x38\x8a\x11\
-\x5d\x4e\x9c\x16\x33\x26\x31\x91\xb7\x97\x2c\xe0\xc8\x3b\xcf\xf1\
-\xfd\xe9\x9b\xf4\x8c\x0e\x61\xe4\xc8\x91\x0c\x1c\x38\xb0\xc2\xb6\
-\xb2\xb2\xb2\x18\x3e\x7c\xb8\x7c\x22\xee\x8d\x13\xe7\xd2\xe4\xcc\
-\x66\xb3\x71\xcf\x3d\xf7\x30\x69\xd2\x24\x59\x77\xae\x3c\x44\x44\
-\x54\x05\x72\x41\x14\xd1\xe2\x24\x32\xa1\x2d\xed\xc6\x2f\x23\xe9\
-\x89\x31\x9c\xb2\x16\xd3\x08\x7f\x26\x4c\x98\x50\x61\x54\x49\xaf\
-\xd7\x73\xf5\xea\xd5\x32\x95\x5c\xa5\x53\x75\x25\x28\xfd\xbc\x20\
-\x08\x0c\x19\x32\x84\x21\x43\x86\x54\x58\x9d\x53\xab\xd5\x12\x1a\
-\x1a\x4a\x71\x46\x0e\x38\xec\x38\xc2\x02\x09\xaf\xd2\x99\x37\x16\
-\xbd\xc4\x27\xf7\xc6\xf0\xed\x09\x78\xa1\x7e\x20\x93\x27\x4f\x76\
-\x4b\xa3\x31\x2b\x2b\x8b\x8e\x1d\x3b\xca\x8e\xb6\x14\xd5\xf1\xf8\
-\xa3\x7a\x2b\xe2\x25\xb5\xa7\xd1\x68\x98\x3e\x7d\x3a\x75\xeb\xd6\
-\x2d\x37\x12\x28\x8a\x22\x66\xb3\x99\x80\x00\x7f\xec\xd9\x22\xe0\
-\x44\x14\x6a\xd3\xf9\xde\xee\x44\x74\xec\xca\xf5\xb4\x14\x0a\xa9\
-\x87\x19\x78\xff\xfd\xf7\x2b\x24\x27\x66\xb3\x99\x55\xab\x56\xf1\
-\xaf\x7f\xfd\xeb\x0f\xc7\x5c\x09\xf9\x93\xfa\x1b\x16\x16\xc6\xb4\
-\x69\xd3\x88\x8f\x8f\xaf\x30\x12\xe8\xe7\xe7\xf7\x9b\xe3\xee\x70\
-\x11\x14\xe8\x47\x95\xfb\x67\xf1\xe6\xa4\x86\x1c\x9b\xdb\x96\xef\
-\x7e\xca\xa2\x53\xaf\xba\xcc\x9e\x3d\xbb\xc2\x88\xa9\x56\xab\x65\
-\xd7\xae\x5d\x72\x04\x48\x10\x04\xc5\xf7\xf8\x7c\x7c\x7c\xe4\xe2\
-\x52\x0e\x87\x83\xfa\xf5\xeb\x33\x7f\xfe\x7c\xb7\xf6\xa7\x32\xd1\
-\x51\xa7\x0d\x73\xcd\x7a\x0c\x6f\x3d\x95\x51\x35\x0e\xb3\x62\x6b\
-\x12\x19\xce\x6e\xc4\xc5\xc6\xb2\x6c\xd9\x32\xb7\x22\x81\x53\xa7\
-\x4e\x2d\x43\xfc\x94\xee\x91\x3e\x3e\x3e\xf2\xdf\x15\x04\x81\xa6\
-\x4d\x9b\xf2\xd6\x5b\x6f\x55\x18\x09\x74\x38\x1c\x54\xaf\x5e\x1d\
-\x51\x74\x81\xe8\x42\x14\x8d\x84\xc6\xb7\x66\xe0\x7d\x8f\xe3\xbf\
-\xae\x0f\x0b\x7f\x4e\x65\x70\xc3\x18\x12\x13\x13\x59\xba\x74\xa9\
-\x5b\xb6\x3d\xf2\xc8\x23\xe4\xe5\xe5\xc9\xef\x86\x52\x52\x56\x7a\
-\x6c\x8a\x8b\x8b\x19\x36\x6c\x18\x0f\x3c\xf0\xc0\xef\x22\x81\xfe\
-\xfe\xfe\xca\xef\x7a\xfe\x59\x70\x65\xb1\x7d\xf3\x41\x6a\xf6\x59\
-\xc3\xc8\x56\xb0\x7c\xda\x26\x8e\x1d\x4b\xa5\x55\x07\x01\x34\x3a\
-\xb2\xcf\x7d\xc7\xf4\xf1\xbb\x71\x16\xdb\xa8\xd3\x69\x28\x09\x2d\
-\xee\xe0\xa9\x77\xe6\x73\x78\xcc\x2c\xde\x7c\x66\x04\x33\xad\x06\
-\xe2\x3b\x0e\xe1\xad\x15\x8b\xa8\x71\xfc\x00\x69\x96\x2e\x3c\xd8\
-\x50\x60\x8b\x5d\x43\x4e\xf2\x01\x16\xbd\x38\x09\x9d\xcb\x8e\xcb\
-\x54\x9d\x1a\xbd\x1e\xa4\x91\x46\xc0\x65\x4d\xe3\xf3\x77\x5e\x67\
-\xbd\xd6\xc6\x95\xcb\xe9\x24\x8e\xae\x89\xc8\xef\x0f\xe8\xd4\x18\
-\xa0\x4a\x02\x55\xa8\x50\xa1\xe2\x77\x88\x8a\x8a\x2a\xd7\xf9\x77\
-\xb9\x5c\xa4\xa4\xa4\xf0\xe6\x9b\x6f\x52\xab\x56\x2d\x8f\xee\xbd\
-\xe9\x74\x3a\x4e\x9d\x3a\x85\xd5\x6a\xc5\xe1\x70\xe0\x72\xb9\x08\
-\x0b\x0b\xa3\x56\xad\x5a\x6e\xb7\x21\xe2\x47\xd7\xfe\x43\x00\x58\
-\x70\xe0\x11\xc6\xbf\xbc\x80\xf0\x62\x0b\xfd\x07\x05\x03\x25\x7a\
-\x86\xee\xc0\x6c\x36\xe3\xe3\xe3\x83\x28\x8a\xd8\xed\x76\x32\x32\
-\x32\x98\x3b\x77\xae\xc7\x45\x46\xf4\x7a\x3d\xbb\x77\xef\xc6\x6a\
-\xb5\xca\xa2\xe3\x21\x21\x21\x84\x85\x85\x11\x16\x16\xe6\x66\x2b\
-\xc1\xf4\x7d\x62\x3c\x50\xc8\x3e\xe7\x45\x3e\x7f\xf9\x31\x32\x63\
-\x9a\x33\xd4\xdf\xff\x16\x51\x8c\x70\x9b\x8c\x4a\xa4\xc3\x6a\xb5\
-\x72\xec\xd8\x31\x5e\x78\xe1\x05\x7c\x7d\x7d\x3d\x16\x8b\x5f\xbf\
-\x7e\xbd\x3c\x67\x82\x20\x10\x18\x18\x48\x78\xb8\xfb\xc5\x41\x7c\
-\x23\x62\x19\x3c\x22\x16\xc8\xe7\xe9\x96\x4f\x32\x6d\xf6\x6b\xa4\
-\x87\x8d\x64\x46\xfd\x92\x4f\x5b\x64\x64\xa4\xdb\x4e\xa4\x34\xbe\
-\x1a\x8d\x86\x8d\x1b\x37\x7a\x4c\x02\xa5\x54\xbe\x35\x6b\xd6\x50\
-\xb3\x66\x4d\xd9\xb6\x1a\x35\x6a\x10\x1d\x1d\xed\x76\x3b\xc6\x9a\
-\x9d\x78\x7a\x52\x27\x5c\x85\x39\x5c\xad\xf3\x36\x5f\x1e\x4a\x66\
-\xf4\xd8\xbb\x90\x32\x42\xdd\x15\x45\xaf\x52\xa5\x4a\x19\x67\xf8\
-\xab\xaf\xbe\xc2\x6a\xb5\x7a\x5c\x1c\xc6\xcf\xcf\x8f\xd4\xd4\x54\
-\x1a\x35\x6a\x24\xaf\xd1\xea\xd5\xab\x53\xad\x5a\x35\xb7\xdb\xf0\
-\xaf\x16\x4f\x8f\x87\xe3\xe9\xd1\x35\x96\xf3\x53\x97\xf3\xfa\x1b\
-\xd1\x64\x9d\x4d\xe4\xe1\xc7\x82\x41\xc0\xed\x71\x8a\x8a\x8a\x92\
-\xa3\x77\x37\x6f\xde\x64\xf9\xf2\xe5\x6e\x45\xec\x6f\x07\x9b\xcd\
-\xc6\x91\x23\x47\xe8\xd0\xa1\x83\xac\x3f\x58\xa7\x4e\x9d\x72\xa3\
-\xe4\xff\x89\x98\x3b\x7a\x12\x73\x07\x14\x5c\xde\xc6\x0b\x2f\xcd\
-\x62\x7e\x95\x2a\xc4\xb7\xb9\x9f\x50\x2d\xe8\x7c\x7c\xa8\x5d\xbb\
-\xb6\x7b\x6f\x6d\x70\x30\x59\x59\x59\xf2\xde\xf1\xea\xab\xaf\x7a\
-\xac\x15\xaa\xd5\x6a\xc9\xcd\xcd\x25\x3d\x3d\x5d\x7e\xde\xcf\xcf\
-\xaf\xd2\x29\x98\x4d\xee\xea\x4f\x13\x60\xe7\x9a\xf7\x58\xfb\xc1\
-\x4b\x5c\x3b\x1e\x4e\xff\x57\x4b\x2e\x71\xfa\xfa\xfa\xba\x6d\x9b\
-\xaf\xaf\x2f\x79\x79\x79\x08\x82\xc0\x89\x13\x27\x98\x3b\x77\x2e\
-\x61\x61\x61\x1e\xed\x23\x52\xb4\xb2\xb8\xb8\x18\x97\xcb\x85\xcb\
-\xe5\x22\x3c\x3c\xdc\xed\xbe\xfc\x5d\x60\x4f\xdd\xc4\xf6\x93\x0e\
-\x74\x35\xb7\x30\x77\x41\x06\x39\xd7\x8e\xb1\xf7\xf8\x19\x1e\x6d\
-\x17\x05\x4e\x2b\x11\xcd\x9e\x64\xe3\x87\x0f\x63\xbf\x59\x84\x29\
-\xa0\x0a\x75\x02\x8b\x29\xd0\x76\xe4\xbd\xd5\x77\xf0\xf3\x9e\xed\
-\xec\xda\xb3\x8d\xf7\xde\xfe\x84\xf9\x2b\x7b\xd3\x2f\xf7\x07\xc2\
-\x7b\x3c\x42\x4d\xac\x14\x39\x9d\x44\x24\x76\xe7\x8d\x77\xe6\x13\
-\xa7\xcf\xc3\x89\x91\xba\xc1\x90\xe7\x12\x31\x04\xd4\x65\xc6\x5b\
-\x1f\xd1\xab\x61\x00\x3b\x3f\x9c\xce\x23\xb3\x9e\xe2\xe3\xc9\xc3\
-\xf0\x33\x94\xe4\x82\x96\xac\x24\x2d\x82\x4b\x40\x44\x44\x85\x4a\
-\x02\x55\xa8\x50\xa1\xc2\x6d\x54\xaf\x5e\x9d\x46\x8d\x1a\x71\xf8\
-\xf0\x61\x92\x92\x92\x3c\x4e\x79\xb2\xd9\x6c\xb4\x69\xd3\x86\xa8\
-\xa8\x28\x99\x54\x54\x26\x9d\xaf\xf4\x49\x66\xef\x69\x2f\x10\xf0\
-\xc3\x59\x2c\x35\xeb\xd3\x38\xa8\x72\x67\x9c\xd2\xa9\xba\xcb\xe5\
-\xa2\x61\xc3\x86\x64\x67\x67\xb3\x76\xed\x5a\x45\x63\xe4\x72\xb9\
-\x68\xd7\xae\x9d\x5c\xf5\xce\xf3\xd4\x29\x33\x2d\x7a\x0d\xc7\x18\
-\x71\x14\x63\xed\xc6\x54\xb7\x54\x2e\xb2\x50\xfa\x9e\x54\x93\x26\
-\x4d\xc8\xca\xca\x62\xd3\xa6\x4d\x8a\xc8\x92\xcb\xe5\xa2\x43\x87\
-\x0e\x98\x4c\x26\x79\xce\x3c\x83\x1f\xc3\x5e\x9c\xc6\xfe\x9f\x53\
-\x09\x7e\xb8\x35\x95\xac\x2d\x22\xcf\x9b\xc1\x60\xa0\x59\xb3\x66\
-\xfc\xf8\xe3\x8f\xac\x5f\xbf\xde\xe3\x39\x93\xd6\x40\x8b\x16\x2d\
-\x64\x27\xde\xd3\x83\x00\x8d\xd9\x42\x8f\x27\xe7\x10\x77\x1d\xe2\
-\x13\x22\x3d\x5a\x3f\xd2\x3b\xd2\xb0\x61\x43\x0a\x0a\x0a\x58\xb3\
-\x66\x8d\xc7\xb6\x09\x82\x40\x5c\x5c\x1c\x0d\x1a\x34\x90\xdb\xf6\
-\xb8\x92\x6a\x64\x27\x5e\x9b\x1a\xc0\x89\xab\x37\xf1\xeb\x35\x92\
-\x86\x81\x9e\xcd\x5b\x40\x40\x00\x89\x89\x89\x9c\x3e\x7d\x9a\xf3\
-\xe7\xcf\x2b\x7a\xdf\xaa\x55\xab\x46\x5c\x5c\x1c\xbf\xfe\xfa\xab\
-\x1c\x11\xac\x0c\x09\x94\xdf\xb6\xc8\x0e\x8c\x7e\xc2\x44\xba\x23\
-\x88\x46\x8d\xeb\x57\xda\xd1\x92\xde\x87\xa0\xa0\x20\x12\x13\x13\
-\xd9\xb2\x65\x8b\xe2\x7d\x24\x36\x36\x16\x8b\xc5\x22\x1f\x78\x78\
-\x8a\xd6\x77\xf7\xc5\x2f\xfc\x38\xf6\x1e\x75\x69\x15\xad\xf7\xe8\
-\xfd\x90\x48\x7c\x7c\x7c\x3c\x7b\xf7\xee\x55\x24\xef\x23\x8a\x22\
-\x2d\x5b\xb6\x94\x8b\xcb\x48\xeb\xe2\x7f\xa9\x48\xcc\xd1\xcf\x97\
-\x72\x59\x08\xa4\xf9\x8d\x9f\xd8\x9d\x61\xc3\xe4\x07\xdf\x6f\x3d\
-\x4c\xd6\x43\x55\x00\x11\xa3\x25\x82\x86\xb1\x09\xe0\x70\xe0\x40\
-\x87\x41\x77\x9e\xc9\xf7\x0e\xe5\x62\xeb\xc7\x59\x3f\x67\x28\x1d\
-\x7a\x74\xe6\xea\x81\x0d\x1c\x4c\x4b\x65\xfb\x4f\x69\xf4\x79\xb9\
-\x19\x38\xed\x20\x82\xc1\x3f\x8c\x7a\x8d\xe2\x68\x64\x72\xe2\x74\
-\x88\x88\x3a\xc8\x73\x81\xd6\x60\x26\xba\x6e\x7d\xea\xd4\x0d\xe0\
-\x7c\x58\x20\x3a\xf2\x48\xcb\x13\x68\xe8\x6b\x26\x33\xe5\x32\xd9\
-\x99\x80\xff\xaf\x1c\xbc\x52\x48\x60\xf3\x00\xb4\x6a\x48\x50\x25\
-\x81\x2a\x54\xa8\x50\xe1\x2e\x5a\xb6\x6c\x29\x17\x06\x51\xe2\x70\
-\x0b\x82\x80\x46\xa3\x21\x27\x27\x87\x0f\x3f\xfc\x50\x59\xa7\xcc\
-\xd1\xb4\xeb\x1c\xad\xa8\x3f\xc5\xc5\xc5\xcc\x98\x31\x83\x29\x53\
-\xa6\xfc\xae\x30\x8e\x27\xd0\xeb\xf5\xa4\xa5\xa5\x29\xbe\x17\x64\
-\xf0\x0f\xa5\x79\x87\x4e\x8a\x08\x40\x71\x71\x31\xaf\xbd\xf6\x9a\
-\xc7\x15\x4f\xff\x73\xde\xb4\x5a\x2d\x97\x2e\x5d\xaa\xb0\x38\x4d\
-\x85\x63\x14\x1c\x4b\x87\x2e\xb1\x1e\x3f\xef\x74\x3a\xb1\x58\x2c\
-\xcc\x9b\x37\x8f\xc2\xc2\x42\xaf\x38\x91\x41\x41\x41\x5e\x10\x8b\
-\xd7\x10\x18\x51\x97\xc4\x08\x14\xcd\x5b\x4e\x4e\x0e\xdb\xb7\x6f\
-\xf7\x8a\xfe\xa1\x94\xc2\xfd\xd5\x57\x5f\x29\xb6\x2d\x34\xbe\x39\
-\xed\xe3\x3d\x6f\xc1\xe1\x70\x10\x13\x13\xc3\xc7\x1f\x7f\x8c\xdd\
-\x6e\x57\x64\x9f\x14\x09\x0e\x0e\x0e\xe6\xe3\x8f\x3f\x56\x34\x4e\
-\x82\x46\x47\x6c\xd3\x36\xc4\x2a\x68\xc3\x6e\xb7\x53\xb7\x6e\x5d\
-\x36\x6f\xde\xec\x15\x42\x23\x65\x49\x28\xdf\x47\xc2\x68\xde\xa6\
-\xa3\xe2\x75\x14\x17\x17\xc7\xf6\xed\xdb\xbd\xf2\x2d\xd1\x6a\xb5\
-\x72\x41\xb0\xff\x3d\x64\xb2\x62\xd9\xcf\x04\xb4\x7b\x94\xf5\x6b\
-\x5f\xc6\xdf\x75\x9d\x95\x73\x27\xf0\xc4\xe2\xaf\x38\x7b\xed\x4e\
-\x9c\xe8\x49\xde\x3a\x9d\x88\xc8\xb9\x08\x0e\x3b\xb9\xda\x9a\xac\
-\xf9\x76\x35\x5d\x1a\xe6\x71\xef\xdc\xc7\x88\x5e\x3b\x8f\x00\x57\
-\x3a\xc7\xce\xf9\xf2\xfc\x43\x85\xac\xdf\x1d\xc4\x1b\xf5\x02\x4b\
-\xea\x33\x69\x20\x65\xd7\x87\x74\xaa\xb9\x09\xbd\xe0\xc2\x61\x75\
-\xd2\x73\xe6\x6a\x16\xc4\xeb\x28\xca\x4c\xe2\xe1\x8e\xb1\xf8\x1a\
-\x05\x72\xd3\xd3\x71\xd4\x1b\xc7\xb3\x4d\xe0\xd2\xb9\x4e\x88\x6f\
-\xbc\xc2\x83\xad\xa3\x09\xd4\x15\x90\x7c\xb5\x88\x91\xdd\xee\xc6\
-\x80\x0a\x95\x04\xaa\x50\xa1\x42\x45\x25\x10\x12\x12\xe2\xb5\xb6\
-\xa4\x94\xa0\x3f\x1b\xd2\xfd\x13\x6f\x0a\x6a\x67\x66\x66\xfe\x25\
-\xe6\xcb\xe5\x72\x61\x32\x99\x14\xdf\x51\x2a\x8d\x2b\x57\xae\x78\
-\xb5\x60\x89\xc7\x94\xe4\xd6\xfd\x24\x6f\x16\x8e\xf8\xab\x44\x23\
-\xa4\x4a\x8c\xff\x6b\x90\xaa\x8e\xfe\x5d\x8b\x7d\xb8\x63\x5b\xe9\
-\xfb\x86\xea\xfe\x7f\x7b\x48\x92\x13\xff\x73\xc8\x39\x89\xad\x61\
-\x17\x9e\xbe\xef\x3e\xc2\x83\xfc\x00\x33\x1d\xbb\x0d\x60\xc8\x99\
-\xaf\xc9\xb9\xa1\xa7\x4d\xd7\xde\xf8\xa6\xe5\xa2\x15\x04\x70\x39\
-\xb9\xa9\x0d\xc7\x28\x8a\xf4\x78\x67\x0f\xef\xf8\x8c\xe1\x83\x1d\
-\x27\xb1\x6b\xe3\x99\xba\x62\x06\x4f\xd6\xbb\xc8\xaf\x2d\xda\x10\
-\x1b\x1c\x08\x82\x9d\x3a\x4d\xda\xd1\xfd\x6e\x0b\x3a\x63\x49\x45\
-\x62\x87\xcd\x45\x6c\xa4\x3f\x86\xaa\x8d\xb9\xbb\x7d\x67\xf4\x16\
-\x1f\xb4\x7a\x1f\xc2\x6a\xb7\xe4\xd9\x19\xe3\xf0\x07\xea\xf7\x9e\
-\xc0\xb7\x4b\x8a\x78\xed\xbd\x6d\xe4\x3a\x23\x78\x6c\xec\xb3\x2c\
-\x78\xbc\x95\xea\xcc\xa8\x24\x50\xc5\x3f\x05\x82\x5a\x0e\x58\x85\
-\x17\x70\xe0\xc0\x01\xc6\x8c\x19\xa3\xa8\xc2\xa4\xb4\x1e\x8d\x46\
-\x23\xc3\x86\x0d\xc3\x62\xb1\x28\x6a\xcb\x51\x90\xc5\xa5\xb3\xe7\
-\xd0\xd5\x68\x40\x74\x90\xd9\xa3\xbe\xf8\xf8\xf8\x30\x75\xea\x54\
-\x76\xef\xde\xed\x15\xd1\x71\x93\xc9\xc4\xab\xaf\xbe\xaa\xb8\x1d\
-\xbb\xf5\x26\xc9\x17\xd3\xf0\x0b\x8d\x22\x3c\xc4\x8f\xca\xd6\xbe\
-\x94\xee\x49\x8d\x1f\x3f\x9e\x6d\xdb\xb6\x79\x94\x26\xf7\x9f\x63\
-\x15\x16\x16\xc6\xa4\x49\x93\x14\x0b\x46\xdb\xf2\xae\x73\xea\xec\
-\x35\xaa\xc5\xc5\x13\xec\x5b\x79\xf2\xad\xd5\x6a\xc9\xc9\xc9\xe1\
-\xb1\xc7\x1e\xe3\xe0\xc1\x83\x8a\xd7\xa4\xc3\xe1\xa0\x7f\xff\xfe\
-\xca\xf7\x4b\xd1\x45\xfe\xcd\x4c\x6e\xda\x75\x54\x09\x09\x41\xef\
-\x41\xc1\x52\xe9\x2e\x69\x6c\x6c\x2c\x01\x01\x01\x8a\x0f\x4a\x24\
-\xdb\x62\x62\x62\x14\xda\xe6\x20\x37\x2b\x95\x33\x67\x73\xa9\x19\
-\x1f\x4b\x68\x60\xe5\x89\x9c\x5e\xaf\xe7\xe4\xc9\x93\x4c\x99\x32\
-\x85\x6b\xd7\xae\x29\x9e\x37\x8d\x46\xc3\xf3\xcf\x3f\xaf\xf8\x90\
-\x43\x74\xda\x48\xbb\x9c\x4c\xa6\x3d\x88\xf8\x5a\x55\x30\x78\xd0\
-\x2d\x83\xc1\xc0\xc9\x93\x27\x19\x31\x62\x84\xc7\xf7\x01\x4b\xbf\
-\x6b\x99\x99\x99\xec\xdd\xbb\x57\xf1\xf7\xdb\x61\xcd\xe3\xd4\x89\
-\x14\x82\x22\xaa\x13\x19\x6e\x41\xf0\xa0\x34\x88\x20\x08\x9c\x3c\
-\x79\x92\x07\x1e\x78\xc0\x2b\xc5\x5a\xfc\xfd\xfd\x99\x3c\x79\xf2\
-\xff\xe6\x61\x40\x60\x7b\x56\x7c\xdd\xbe\xf4\x2a\xa5\xde\x5d\x83\
-\xf8\xf8\xae\x41\x00\x74\x6b\x7b\x7b\x02\xf6\xf8\xfc\xcf\x78\xdc\
-\x65\xc3\x81\x01\x9d\x06\x5c\x76\x2b\xab\x5b\x68\x31\xea\x75\x80\
-\x9e\x5e\x63\x5e\xa7\xd7\x98\x3f\x7a\xb2\x19\x9b\x77\x3d\xfa\xc7\
-\x73\x67\x0a\xe2\xee\x31\xff\xe2\xee\x31\xaa\x0f\xa3\x92\xc0\xbf\
-\x11\x2c\x16\x0b\x57\xaf\x5e\x55\x67\x5c\x21\x6e\xdc\xb8\x21\xeb\
-\x8f\xa9\x50\xa1\x04\x69\x69\x69\x24\x25\x25\xd1\xb8\x71\xe3\x0a\
-\xcb\xe7\x97\x87\x82\x82\x02\x0e\x1f\x3e\x4c\xb7\x6e\xdd\xd0\x6a\
-\xb5\x72\x7a\x68\xe5\xe1\xe2\xdf\x4f\xf6\x61\xee\xd9\x60\xea\xd4\
-\x88\xe5\xed\x8f\xe6\x53\xa3\x12\x7c\x42\x7a\x27\x34\x1a\x0d\x67\
-\xce\x9c\xe1\xd0\xa1\x43\xb4\x6e\xdd\x5a\x91\xe3\x76\xf9\xf2\x65\
-\x52\x52\x52\x64\xdd\x2b\x8f\xdf\x3b\x47\x36\xdf\x2d\x7d\x9e\xa9\
-\xf3\x37\x61\xea\x3e\x99\x8d\xf3\x1e\xa1\xaa\xbf\xfb\x24\x4e\x1a\
-\x4f\x8d\x46\xc3\xc9\x93\x27\x39\x7b\xf6\x2c\xcd\x9a\x35\xf3\xb8\
-\x3f\x1a\x8d\x86\x73\xe7\xce\x91\x9c\x9c\x8c\xcd\x66\x43\xa3\xd1\
-\x28\xd8\x53\x72\x98\x33\xf8\x6e\xbe\x4b\x37\x61\x8f\x19\xcc\x0f\
-\xab\xc6\x56\xea\xc3\x26\x8d\xab\xcd\x66\xe3\xc4\x89\x13\xa4\xa7\
-\xa7\x53\xbb\x76\x6d\x8f\xfb\x23\x8a\x22\xe7\xce\x9d\xe3\xe8\xd1\
-\xa3\xc4\xc7\xc7\x97\x19\xbf\xca\xc2\x9a\x7b\x99\x37\x47\x74\x64\
-\x79\xfe\xdd\xbc\xb7\xe8\x75\xba\xd4\x0b\xac\xf4\x1a\x92\xc8\xd2\
-\xd9\xb3\x67\xe5\x02\x35\x9e\x12\x41\x9d\x4e\xc7\xae\x5d\xbb\x68\
-\xd8\xb0\xa1\x5c\x9c\xc6\xd3\x71\x2a\x3c\xbd\x9a\x7b\x07\x2d\xc2\
-\x3f\xd2\x49\x5a\xe1\x9d\x7c\xb5\x63\x21\x51\x95\x5c\x43\x82\x20\
-\x90\x9f\x9f\xcf\xd1\xa3\x47\xb1\x58\x2c\x04\x07\x07\x2b\x22\xb7\
-\x27\x4f\x9e\xe4\xe2\xc5\x8b\xb2\x5d\x9e\xce\x5b\xfa\xf1\x35\x0c\
-\x19\x3c\x13\x5b\x95\xfa\x0c\x9f\xb6\x90\x47\x3a\xd7\xa8\xf4\xbc\
-\x49\x29\xee\xc7\x8f\x1f\xa7\x55\xab\x56\x1e\xf7\x05\x4a\xd2\x9d\
-\x2f\x5d\xba\x44\x7e\x7e\xbe\xc2\x6f\xb7\x8d\xf5\xef\xcd\x67\xd5\
-\x37\x5f\x73\x3c\xa3\x3e\x9f\xed\xfa\x94\x46\x1e\x9e\xbb\x65\x66\
-\x66\x72\xfc\xf8\x71\x9a\x35\x6b\xa6\x88\x74\xdb\x6c\x36\x92\x92\
-\x92\xc8\xca\xca\x42\xa3\xd1\x28\xdc\x4b\xfe\x7a\x50\x6c\x89\xc6\
-\x20\xef\x87\x1a\xbd\x11\x23\x2a\x54\xfc\x03\x49\x60\x97\x2e\x5d\
-\x18\x3a\x74\x28\xaf\xbf\xfe\xba\x4a\x60\x14\x60\xd3\xa6\x4d\x0c\
-\x18\x30\x40\xf1\x89\xab\x8a\xff\x7d\x14\x15\x15\xfd\xce\xd9\x94\
-\xaa\x49\x4a\x85\x00\xea\xd4\xa9\xc3\xda\xb5\x6b\xa9\x59\xb3\xa6\
-\xc7\x7f\x27\x35\x35\x95\x7a\xf5\xea\xc9\x4e\x92\xd5\x6a\x75\xfb\
-\xce\x9a\xc1\x60\x28\x95\xb6\x79\x90\x19\x3f\x74\xe4\xf2\xe9\xd7\
-\xf8\x76\xf6\x58\xd6\xfc\x92\xcb\xc4\x96\x16\xb9\xf2\x68\x45\x4e\
-\x9b\xd5\x6a\x2d\x23\x16\x5f\xb5\x6a\xd5\x32\xb2\x0a\x9e\xe0\x93\
-\x4f\x3e\x61\xd4\xa8\x51\xf2\xbf\xa5\x32\xfc\xee\xd8\xe7\xe3\xe3\
-\x83\xa0\xd1\x94\x38\x11\x37\xaf\x71\x2e\xd9\xce\xe2\x73\xc9\x7c\
-\x32\xf0\x29\x4e\xde\xcc\xa3\xaa\x7f\x08\xc5\xc5\xc5\x15\x46\x2b\
-\xf5\x7a\x3d\x45\x45\x45\x32\x49\xd7\x6a\xb5\x74\xe8\xd0\x81\xcd\
-\x9b\x37\x2b\xb2\x6d\xd6\xac\x59\xcc\x9d\x3b\x57\x26\x4e\x52\x51\
-\x9f\x8a\x24\x22\xa4\x3b\x69\xb2\x53\x9c\xf3\x31\x1f\x66\x3f\xc6\
-\xf9\x83\x63\x98\x9e\x50\x97\x0f\x72\xc6\xf2\x68\xa0\x48\x71\xb1\
-\xd5\xad\x48\x6c\x69\xb1\x78\x9b\xcd\xc6\xd3\x4f\x3f\xcd\x73\xcf\
-\x3d\xa7\xc8\xb6\x39\x73\xe6\xb0\x7f\xff\x7e\xf9\x5b\x53\x58\x58\
-\xe8\xd6\x58\x6b\xb5\x5a\x8c\x46\x03\x82\x50\x62\x9b\xad\xf0\x02\
-\xf9\x62\x5b\x26\x0f\x69\x4b\xd2\xa1\x5f\xe8\x58\xaf\x13\x3a\x70\
-\xcb\x99\x37\x9b\xcd\xbf\xab\x02\x3a\x6d\xda\x34\x1e\x7d\xf4\x51\
-\x45\xb6\xc5\xc5\xc5\xc9\xc4\x59\x14\x45\x8a\x8a\x8a\xb0\xd9\x6c\
-\x15\x8a\x85\xeb\x74\xba\x32\x51\x9f\x8c\x1d\x1b\x31\x4e\x5d\xcb\
-\x37\x03\xaa\xb0\x71\x58\x15\xbe\xd8\xbf\x90\x09\xad\x45\x0a\x0b\
-\x8b\x2a\x3c\x10\x92\xb4\x2b\xa5\xb5\xe3\xef\xef\xcf\xca\x95\x2b\
-\xcb\xc8\xcf\x78\x82\x3e\x7d\xfa\xc8\x07\x2e\x0e\x87\x83\xc2\xc2\
-\x42\xb7\xd6\x50\xd9\x7d\x04\xec\x67\xd6\xd1\x63\x5e\x12\x03\x8d\
-\x9f\xb1\x62\xdb\x57\x64\x75\x9e\x40\xa0\xd3\x49\x51\x71\xb1\x5b\
-\xe4\x4f\x9a\x37\x69\x8d\xef\xdf\xbf\x5f\xf1\x7e\x5c\xba\x5a\xae\
-\x24\xee\x6e\xb7\xdb\x2b\x14\x8b\x97\xa4\x33\xa4\x03\x97\x54\x47\
-\x30\x4b\xd6\x25\x71\x71\x6a\x1c\x9f\xef\xcc\xa2\x51\xdf\x60\x1c\
-\x0e\x47\x85\xf7\xf1\xa4\x3b\xc0\xd2\x5e\x6a\xb3\xd9\x48\x4c\x4c\
-\x64\xdb\xb6\x6d\x04\x04\x04\x78\x6c\x57\x41\x41\x41\x99\x6a\xa0\
-\xc5\xc5\xc5\x7f\xb8\x3f\xea\x74\x3a\x0c\x06\x83\xea\xff\xa9\x50\
-\xf1\x4f\x24\x81\x6d\xda\xb4\xa1\x61\xc3\x86\x3c\xfa\xe8\xa3\xac\
-\x58\xb1\x42\x9d\x79\x0f\x30\x7f\xfe\x7c\xf2\xf3\xf3\xe9\xd2\xa5\
-\x8b\xa2\x53\x49\x15\xff\xfb\x70\x3a\x9d\x2c\x5a\xb4\x88\xd4\xd4\
-\xd4\x32\x6b\xc5\xc7\xc7\x87\xcc\xcc\x4c\x59\x0a\xc0\xe9\x74\x92\
-\x9b\x9b\xab\xe8\x6f\x65\x67\x67\xcb\xff\x6d\x34\x1a\xd9\xb0\x61\
-\x03\xd9\xd9\xd9\x15\x3a\x92\x5a\xad\x96\x7b\xfb\xf5\xa7\x43\xeb\
-\x1a\x2c\x7a\xf1\x35\x2e\x85\x37\x65\x58\xfd\x1f\xe8\x7d\xff\x28\
-\x9c\x69\xc7\x69\xdb\x5a\x2b\x13\xb1\x23\x47\x8e\xb8\x45\x02\x53\
-\x52\x52\x64\x67\xd0\x1b\xef\x48\x69\x67\xc6\x60\x30\xb0\x71\xe3\
-\x46\x72\x73\x73\xcb\x25\x4a\x52\x81\x8b\xa9\x53\xa7\x13\x1e\x5e\
-\xc4\xcb\x03\x26\x70\xf3\x8e\x3e\xb4\xaf\x6e\xe4\xd5\x7e\xbd\x39\
-\xb5\x23\x93\xce\x62\x09\x59\x5d\xb2\x64\x09\x67\xcf\x9e\x2d\xb7\
-\xca\xa7\x4e\xa7\x23\x37\x37\xb7\x4c\x5f\x24\xa7\x5f\xc9\xbd\x47\
-\xab\xd5\x5a\x26\xba\xb9\x76\xed\x5a\xce\x9d\x3b\x57\xa1\x7c\x81\
-\xbf\xbf\x3f\x93\x9e\x99\x8c\x90\x79\x9c\xd7\x5f\x5d\x4a\xa7\xa7\
-\x06\xd3\xc7\x6f\x16\xfd\x06\xfc\x4c\x46\x51\x3e\x0f\xde\x00\x9b\
-\xfe\x26\x6f\x2d\x59\x41\x72\x72\x72\x85\x07\x56\x76\xbb\xbd\x8c\
-\x73\x58\x58\x58\x88\xc3\xe1\xf0\xb8\xf2\xa9\xc3\xe1\xa0\xa0\xa0\
-\xa0\x8c\x58\xfc\xbf\xfe\xf5\x2f\x42\x43\x43\xcb\x8d\xc0\x39\x9d\
-\x4e\x12\x12\x12\x18\x3a\xfc\x11\x84\xe3\xef\x33\x7c\xce\x2e\xee\
-\x9d\xf1\x22\x61\x86\x24\xe6\xcc\x48\xe6\xa1\xd7\x66\x62\xbf\xf5\
-\xd1\x1e\x37\x6e\x5c\x85\xd1\x73\x83\xc1\xc0\xaf\xbf\xfe\x5a\x86\
-\x9c\xb9\xa3\x2f\x59\x11\x4a\xaf\xeb\x8c\x8c\x0c\x16\x2c\x58\x20\
-\x57\x66\x2c\xcf\xb6\xe6\xcd\x9b\x33\x62\xc4\x08\x32\x8f\xed\x64\
-\xf9\xdc\x39\x9c\xd6\x07\x70\xe3\xcc\x68\x46\x6e\xf0\x25\xf5\x54\
-\x10\x0f\xba\xf2\xb8\x9a\x7a\x83\xc5\xef\x2c\x25\x2f\x2f\xaf\xdc\
-\xf7\x47\xa3\xd1\x90\x9c\x9c\x5c\x26\x82\x54\x7a\x1f\xf0\x04\x37\
-\x6f\xde\x94\x8b\xcb\x48\xd2\x33\xd3\xa7\x4f\xaf\x70\x1d\x08\x82\
-\x40\xd7\xbb\xef\xa6\x77\xaf\x5e\xfc\xf0\xe9\x1c\xde\x58\xf3\x23\
-\xb1\xed\x3a\x71\x76\xe3\x7d\xec\x28\xca\xa7\x56\xd7\x87\xd0\x02\
-\xe7\xcf\x9f\x67\xde\x2d\xdd\xc1\xf2\xe6\x4d\x10\x04\x76\xed\xda\
-\x45\x8b\x16\x2d\xe4\x9f\xe5\xe5\xe5\xe1\x7f\x4b\xd6\xc5\x53\xdb\
-\xa4\xf9\x11\x45\x91\x5f\x7f\xfd\x95\xc9\x93\x27\x97\x5b\x29\x54\
-\x2a\x28\x34\x63\xc6\x0b\xd4\xa9\x1d\xc5\xb7\xcb\x5e\xe6\x68\x81\
-\x3f\xf5\x42\x8d\x4c\x19\xde\x9f\x8b\x27\x0b\x68\x7b\x67\x0e\x10\
-\xcc\xd1\xa3\x47\x59\xba\x74\x69\xb9\x29\xe2\xd2\xfb\x70\xfc\xf8\
-\x71\xa2\xa2\xa2\x10\x04\x01\xbb\xdd\x4e\x4e\x4e\x8e\x22\x12\x78\
-\xfd\xfa\x75\xb9\x6d\x93\xc9\xc4\x67\x9f\x7d\xc6\x89\x13\x27\x7e\
-\xb7\xd7\xb4\x6f\xdf\x9e\xfe\xfd\xfb\x7b\xf5\x3e\xb3\x0a\x15\x2a\
-\x09\xfc\x9b\x40\x14\x45\x16\x2f\x5e\xcc\xa4\x49\x93\xe8\xd3\xa7\
-\x0f\x63\xc7\x8e\xad\x94\x6e\xd3\x3f\x19\x39\x39\x39\x2c\x5b\xb6\
-\x8c\xd4\xd4\x54\xe6\xce\x9d\xeb\xb6\xb6\x98\x8a\x7f\x2e\x34\x1a\
-\x0d\x03\x06\x0c\xa0\xf8\x3f\x4e\xbe\xfd\xfd\xfd\x59\xbd\x7a\x75\
-\x19\x82\xa1\xf4\x1e\x47\x69\xe7\xc8\x66\xb3\x71\xd7\x5d\x77\x31\
-\x62\xc4\x88\x0a\x49\xa0\x20\x08\x54\xa9\x1a\x0e\x38\x49\x68\xd6\
-\x96\x48\x53\x14\x91\x8d\x5f\xe7\x7e\x43\x11\x5b\xbe\xf8\x86\x5a\
-\x35\x4a\x9c\xd0\x6e\xdd\xba\xd1\xaa\x55\xab\x0a\xdb\xca\xcc\xcc\
-\xe4\xc0\x81\x03\xf2\x49\xb7\x37\x48\x60\x99\xe8\x82\xdd\x4e\xfb\
-\xf6\xed\x79\xec\xb1\xc7\x7e\x37\xae\x7f\x84\xa0\xa0\x40\x40\x4b\
-\xe2\x5d\x77\x51\x18\xd3\x80\x66\xd5\x9b\xb2\xb0\xfd\x45\xa6\x88\
-\xfb\x68\x62\x30\x80\x28\xd2\xaf\x5f\xbf\x32\x84\xe5\x76\x64\x39\
-\x27\x27\x87\x4f\x3f\xfd\xb4\x0c\xc1\x50\x5a\xf8\x46\xd2\x54\x94\
-\xc6\xaf\x6d\xdb\xb6\x0c\x1e\x3c\xb8\xc2\x88\x82\x4e\xa7\xc3\xdf\
-\xdf\x1f\xbb\xb5\x0a\xcd\x3b\x76\x24\x22\x38\x9a\x41\xd3\xe6\xe2\
-\x17\x62\x67\xd1\xc3\xe7\x89\xa9\x03\x06\xa7\x1f\xf7\xdf\x7f\x7f\
-\x85\x51\x45\x80\xf4\xf4\x74\x56\xad\x5a\x25\xf7\xc5\x64\x32\x29\
-\x16\x8b\x2f\x6d\x9b\x56\xab\xe5\x91\x47\x1e\x21\x22\x22\xa2\x5c\
-\x12\x28\x45\xb4\xcc\x3e\x06\x1c\x55\xea\x73\x57\x47\x2d\xf1\x55\
-\xab\xd2\x6e\xe2\xcb\x64\x7d\x73\x98\x98\x80\x10\xa4\x37\x65\xe2\
-\xc4\x89\x15\xde\xa3\x34\x99\x4c\xac\x59\xb3\x86\x63\xc7\x8e\x95\
-\x39\x24\xf1\x26\x09\x0c\x09\x09\x61\xe8\xd0\xa1\xd4\xae\x5d\xbb\
-\xdc\x68\xb9\x24\xe5\x00\x60\x0a\x8a\xa0\x49\xc7\x6e\x44\xf8\x44\
-\x33\xfc\x91\xea\xf8\x05\x07\xf3\xf3\x2b\xfd\x31\x55\xf1\x27\xbc\
-\xaa\x8e\x91\x23\x47\x56\x18\x79\xd7\x68\x34\xfc\xfc\xf3\xcf\x4c\
-\x9b\x36\x4d\x3e\xf4\xf0\xf5\xf5\x55\x64\x97\xc9\x64\xc2\x68\x34\
-\xca\x51\xe9\x3a\x75\xea\x30\x66\xcc\x98\x0a\xd7\xb9\x20\x08\x72\
-\x81\x93\x2a\x31\x8d\xb8\xeb\x2e\x0b\x51\x89\x6d\x18\xd0\xa6\x39\
-\x47\xf7\x6f\xe7\x9a\xe0\x87\x8e\x12\x49\x84\x71\xe3\xc6\x95\x2b\
-\x87\x20\x08\x02\x06\x83\xa1\x8c\x46\x20\x94\xe8\xfa\x29\x81\xaf\
-\xaf\x6f\x99\x79\x8b\x8f\x8f\x67\xd2\xa4\x49\x14\x14\x14\x94\xdb\
-\x17\xbb\xdd\x4e\x64\x64\x04\xa0\x25\x3a\xbe\x05\x14\xfb\xd0\xac\
-\x41\x0c\x35\xee\xb8\x87\xa3\x73\x07\x90\x53\xbd\x44\x1f\xb2\x4e\
-\x9d\x3a\x8c\x1b\x37\xae\xc2\x28\x9b\x8f\x8f\x0f\x27\x4e\x9c\x20\
-\x2f\x2f\x4f\x96\x65\x51\xba\xff\xfb\xf9\xf9\xa1\xd1\x68\x10\x45\
-\x11\xab\xd5\x4a\x9f\x3e\x7d\xe8\xd5\xab\x57\x19\xbb\x5c\x2e\x17\
-\xc1\xc1\xc1\x8a\xef\x31\xab\x50\xa1\x92\xc0\xbf\x29\x04\x41\x20\
-\x3a\x3a\x9a\xe5\xcb\x97\xb3\x65\xcb\x16\x3e\xfc\xf0\x43\xd2\xd3\
-\xd3\xd5\x15\xe0\xc6\x07\xdf\xc7\xc7\x87\x7b\xee\xb9\x87\x9e\x3d\
-\x7b\xba\x2d\xc0\xac\xe2\x9f\x0d\x41\x10\x6e\x2b\xd8\x2e\x39\x55\
-\x5a\xad\x96\xd4\xd4\x54\x3e\xf8\xe0\x03\x1a\x37\x6e\xec\x91\x80\
-\xb5\x4e\xa7\xe3\xc0\x81\x03\x72\xb4\x43\x14\x45\x02\x03\x03\xe5\
-\x94\x35\x37\x8f\x88\xe8\xd4\xf7\x21\x34\x9a\x62\xe6\xf6\xee\xc0\
-\x57\xbe\x09\xc4\x84\xd4\x66\x74\xcd\x12\xe7\x24\x2a\x2a\xea\xb6\
-\xc2\xf7\xa5\x11\x10\x10\x80\xc1\x60\x90\xcb\xe8\xe7\xe6\xe6\xb2\
-\x7a\xf5\x6a\xb7\x88\xc8\x1f\xc1\x60\x30\xb0\x6f\xdf\x3e\xd9\x99\
-\x11\x45\x91\xa0\xa0\xa0\xdb\x8e\xeb\x1f\x23\x98\x9e\x8f\x3d\x8e\
-\xc6\x7e\x9d\xb5\x0b\x27\xf3\xc2\xb2\x24\x62\x86\x3f\x4f\x84\xc5\
-\x0f\x6e\x89\x98\xbb\x83\xb4\xb4\x34\xd9\x89\x14\x45\x91\x63\xc7\
-\x8e\xb1\x78\xf1\x62\x42\x42\x42\x3c\x2a\x7e\x63\xb1\x58\xf8\xe6\
-\x9b\x6f\xe4\xf1\x02\x2a\x2d\xf2\xac\xaf\x1a\x43\xff\xe1\x75\xd1\
-\x68\xae\x32\x61\xe4\x43\x9c\xf6\x0f\xc2\xd5\x71\x3c\xdd\x01\xb4\
-\x3a\xb7\x53\x8c\x2d\x16\x8b\x6c\x83\xc1\x60\x60\xe7\xce\x9d\x44\
-\x45\x45\x79\x44\xe2\x25\xc7\x79\xfd\xfa\xf5\x65\x04\xd4\x23\x23\
-\x23\x89\x8d\x75\x5f\x30\x40\x1b\xdd\x8e\xd1\x8f\xb7\xc5\x9a\x9b\
-\xc6\x2b\x53\x9e\x60\x63\x95\xd1\x2c\x1f\xfb\x9b\x96\x42\x83\x06\
-\x0d\xdc\x6a\x27\x3c\x3c\xbc\xcc\x7b\xb0\x6d\xdb\x36\x42\x42\x42\
-\x3c\x16\x8b\x0f\x0e\x0e\xe6\xca\x95\x2b\x34\x6f\xde\x5c\xae\x5e\
-\x19\x1d\x1d\x4d\xdd\xba\x75\xdd\x3f\xb4\x89\x8c\xa5\xe7\xc8\x38\
-\xf2\x0e\x2f\xa5\xf3\xe8\xe5\xc4\xc7\x14\x70\xd1\xf1\x10\x9b\x63\
-\x41\x83\x8f\xdb\x6d\xa5\xa6\xa6\x22\x8a\x22\x5a\xad\x96\x1b\x37\
-\x6e\xb0\x6a\xd5\x2a\x45\x3a\x81\xc5\xc5\xc5\xec\xde\xbd\x9b\x4e\
-\x9d\x3a\x21\x8a\x22\x26\x93\x89\xba\x75\xeb\x56\x8a\xa4\xd4\x6e\
-\xde\x8d\xc7\x9a\x6b\x48\x3b\xb2\x82\xc1\x0f\xbf\x85\x25\xb6\x31\
-\xc3\x9e\x1b\x8b\x6f\x09\x13\x23\x21\x21\xc1\xed\x35\x59\x3a\xb2\
-\xb9\x7c\xf9\x72\x39\x95\xbe\xb2\xd0\x6a\xb5\x64\x67\x67\x93\x9d\
-\x9d\x2d\x47\xde\x7d\x7c\x7c\x2a\x2d\x16\xdf\xa8\xc3\xbd\x34\xa6\
-\x98\xcf\x17\xcd\x66\xe3\xce\x8d\xfc\x9a\xd7\x99\x0d\x2d\x0d\x72\
-\x7f\xeb\xd7\xaf\xef\x36\x21\xcd\xcb\xcb\xc3\x60\x30\x70\xe2\xc4\
-\x09\x96\x2f\x5f\x4e\xad\x5a\xb5\x3c\xda\x47\x04\x41\x20\x2d\x2d\
-\x4d\x8e\x1c\x8b\xa2\x48\x70\x70\xb0\x7c\x17\x57\x85\x0a\x15\x2a\
-\x09\x2c\x83\xc0\xc0\x40\x06\x0c\x18\xc0\x80\x01\x03\xd4\xd9\x57\
-\xa1\xe2\xcf\xdc\x7c\x74\x3a\xac\x56\x2b\x73\xe6\xcc\x51\x4c\x38\
-\x2d\x16\x8b\x1c\xbd\x91\x52\x9c\xdc\x27\x81\x02\x25\xfe\xbe\x89\
-\x67\xbf\xfd\x91\x61\xa7\x8f\xe1\x53\xa7\x01\x01\x0a\xfa\x64\x30\
-\x18\xb0\x5a\xad\x0c\x1c\x38\x50\xf1\x38\x99\xcd\x66\xd9\x16\x4f\
-\x8a\xe7\x68\x34\x1a\x30\x56\xe1\xde\x67\x96\xd3\x66\x58\x16\x7e\
-\x81\xa1\xf8\x98\x2a\x77\xa7\xb7\xb4\xf3\x69\x30\x18\xb8\x7a\xf5\
-\x2a\xe3\xc7\x8f\x57\x7c\xc0\x14\x19\x19\xe9\xb9\x6d\x82\x80\x46\
-\x00\x88\xe4\x8d\x5d\xfb\x39\x7f\x21\x83\x3a\xb5\x2b\x9f\xdd\x51\
-\xfa\xef\xfa\xfa\xfa\xb2\x75\xeb\x56\xb6\x6d\xdb\xa6\xc8\x36\x97\
-\xcb\xc5\xf0\xe1\xc3\xff\xf0\x6f\xb8\x6b\x9b\x56\x2b\x60\x0e\x8a\
-\xe4\xd5\xed\xc9\xcc\xb4\xdb\x30\x99\x7c\x3c\xb6\x4d\xfa\xdf\x75\
-\xeb\xd6\xb1\x76\xed\x5a\x8f\xed\x92\xde\xad\xd2\xd1\x31\x4f\x6c\
-\x03\xf0\x6f\x36\x9a\x83\xfb\xfa\x70\xfc\x02\x24\xd4\x8b\xf4\xd8\
-\x36\x29\x0a\xf8\xce\x3b\xef\xb0\x64\xc9\x12\x45\xf3\xa6\xd7\xeb\
-\xcb\xa4\x0b\x56\xd6\x36\x41\x28\xb9\x83\x1b\xd9\xf4\x11\xd6\x6d\
-\xeb\x4e\x9e\xa1\x0a\x51\x01\x06\x8f\x6d\x93\x22\x83\x8f\x3f\xfe\
-\xb8\xe2\x7d\x44\xa9\x66\x69\xc9\xb3\x3e\x0c\x1c\x37\x95\xe6\xbd\
-\x1f\xa7\x5a\xed\x08\x8c\x02\x1e\xdb\x26\xdd\x35\x7e\xe1\x85\x17\
-\x14\xdb\x16\x1e\x1e\x2e\x47\x58\x2b\xbf\xff\xab\x50\xa1\x92\x40\
-\x15\x2a\x54\xa8\xf8\x7f\x45\xcf\x9e\x3d\xe5\xe2\x19\x4a\x3f\xd8\
-\x1a\x8d\x46\xbe\x0f\xa8\xd8\xa1\x88\x6b\xa0\xe8\xf9\xa2\xa2\x22\
-\x5e\x7c\xf1\x45\x26\x4d\x9a\xa4\xb8\x2f\x52\xca\x94\xd2\x12\xf1\
-\x25\x83\x64\x20\xec\xd6\x5d\x4c\x4f\x9d\xc0\xa2\xa2\x22\xde\x78\
-\xe3\x0d\xa6\x4c\x99\xa2\xb8\x38\x94\x28\x8a\x65\xd2\xef\x94\xad\
-\x01\x93\x47\x04\x50\x82\xd3\xe9\x24\x30\x30\x90\x45\x8b\x16\xc9\
-\x55\x06\x95\x3a\xdc\x75\xea\xd4\xe1\xe3\x8f\x3f\x56\x3c\x6f\x5a\
-\xad\x01\xad\xd6\xa0\x68\xde\xb2\xb3\xb3\xd9\xbb\x77\xaf\xa2\x34\
-\xd7\xd2\xb6\x45\x46\x46\xb2\x67\xcf\x1e\xe5\x9b\x80\x31\x92\x84\
-\x7a\x9e\x3f\xee\x70\x38\x88\x8b\x8b\x63\xf5\xea\xd5\x14\x17\x17\
-\x7b\x25\x05\xbb\x41\x83\x06\xec\xd8\xb1\x43\x71\x3b\x96\xb0\x6a\
-\x28\x11\xac\xb1\xd9\x6c\x34\x6a\xd4\x88\xed\xdb\xb7\x7b\x65\xde\
-\x8a\x8b\x8b\x89\x8b\x8b\x53\xae\xa5\x2a\xf8\x50\xa7\x8e\x8f\xe2\
-\x77\xbf\x55\xab\x56\x5e\xd9\xff\xa5\x88\x74\x58\x58\x18\xef\xbd\
-\xf7\x9e\xfa\x61\x55\xa1\x42\x25\x81\x2a\x54\xa8\xf8\x3b\xa0\xa2\
-\xbb\x76\x95\xc1\xf5\xeb\xd7\x2b\xac\x50\xf8\xdf\x86\x28\x8a\x38\
-\x9d\x4e\xb7\x53\xa3\xdc\x45\x72\x72\xf2\x5f\x62\xbe\xec\x76\x3b\
-\xb5\x6b\xd7\xae\x54\xda\x66\x45\x38\x79\xf2\xa4\x72\xc7\xd4\x0b\
-\xc4\xc6\x60\x30\x10\x17\x17\xe7\xd5\x76\xff\x2a\x55\x94\xad\x56\
-\x2b\x6d\xda\xb4\xf1\x6a\x9b\xbb\x77\xef\xfe\xd3\xc5\xb9\x5d\x2e\
-\x17\x16\x8b\x85\xa6\x4d\x9b\x7a\xb5\x5d\x6f\xe8\x7b\x7a\xc3\x36\
-\x5f\x5f\x5f\xaf\xcf\xdb\xff\xea\xfe\x5f\x50\x50\x80\xd3\xe9\x54\
-\x23\x80\x2a\x54\xa8\x24\x50\x85\x0a\x15\x7f\x75\x9c\x3b\x77\x8e\
-\xb7\xdf\x7e\x1b\x8d\x46\xe3\xf1\xc7\x5b\xba\x13\xe4\xef\xef\x4f\
-\xe3\xc6\x8d\x15\x17\x87\x50\x0a\x49\xb8\x7e\xf9\xf2\xe5\x24\x27\
-\x27\x53\x58\x58\xa8\x48\x6f\x4e\xa7\xd3\xa1\xd7\xeb\xe9\xdb\xb7\
-\xaf\x57\x9c\x1b\x11\xcf\x75\xa7\xa4\x72\xf1\xef\xbd\xf7\x1e\xa7\
-\x4e\x9d\xc2\xe1\x70\x78\x9c\x76\x55\xba\x28\x44\x97\x2e\x5d\xca\
-\x2d\x96\xf1\xff\x01\xad\x56\x4b\x6e\x6e\x2e\x1f\x7c\xf0\x01\xc7\
-\x8f\x1f\x57\x4c\x02\x04\x41\xa0\x4d\x9b\x36\x5e\xd0\x65\xf3\xce\
-\xc1\x84\xc5\x62\xe1\xd9\x67\x9f\x45\x14\x45\xb9\x02\xa6\xa7\xc4\
-\xc4\x64\x32\xd1\xa8\x51\xa3\xbf\x84\x1e\x9b\x56\xab\xe5\xe2\xc5\
-\x8b\x7c\xfe\xf9\xe7\x64\x66\x66\x2a\x5e\x43\x06\x83\x81\x7e\xfd\
-\xfa\x29\x2e\x7a\xe4\x0d\xe8\xf5\x7a\xce\x9f\x3f\xcf\xaa\x55\xab\
-\x64\x89\x16\x4f\xdf\x35\xe9\xb9\x69\xd3\xa6\xfd\x57\xe6\x4c\x14\
-\xe5\x2c\x5f\xb7\x71\xed\xda\x35\xe6\xcc\x99\x83\x46\xa3\x51\x94\
-\xaa\x2a\x15\xe6\xe9\xd8\xb1\xa3\x9c\x59\xa0\x42\x85\x0a\x95\x04\
-\xaa\x50\xa1\xe2\x2f\x8c\xa4\xa4\x24\xde\x7c\xf3\x4d\xba\x77\xef\
-\x4e\x78\x78\x78\x85\x15\x01\xff\x08\x1a\x8d\x86\x6b\xd7\xae\xb1\
-\x75\xeb\x56\x5e\x78\xe1\x05\x0f\xcb\x7f\x97\x50\x23\xd7\xf9\xc3\
-\x6c\x76\xd6\xa2\x47\x6c\x00\x47\xb7\xac\xe4\xdd\xf5\x27\xe8\x3a\
-\x70\x24\xbd\xdb\xd6\xab\xd4\x46\x69\x30\x18\x58\xbd\x7a\x35\x5b\
-\xb6\x6c\xe1\x91\x47\x1e\x71\xab\x92\xe7\xed\x9c\xc0\xe3\xc7\x8f\
-\x73\xf0\xe0\x41\xda\xb6\x6d\xab\x68\xac\x8b\xad\xe9\x6c\xff\xfe\
-\x32\x3d\x7b\x25\xb2\xeb\xd3\x77\xf9\xfa\xc0\x29\xda\x3c\x38\x99\
-\x07\x5a\x55\xab\xb4\x93\xbc\x74\xe9\x52\x0e\x1d\x3a\x44\xdf\xbe\
-\x7d\xd1\xeb\xf5\x1e\x39\x5d\x66\xb3\x99\xaf\xbf\xfe\x9a\xcc\xcc\
-\x4c\x5a\xb6\x6c\xa9\x28\x62\x76\x75\xcb\x37\x9c\x4e\xe8\x4c\xa7\
-\x28\x5f\xf6\x2c\x99\xc1\x27\x29\x66\x1e\x1a\x3a\x82\xb6\x09\x11\
-\x95\x5a\x47\x85\x85\x85\xac\x5c\xb9\x92\xf4\xf4\x74\xda\xb5\x6b\
-\xa7\x68\xbc\xf7\xed\xdb\xc7\xf9\xf3\xe7\x69\xd8\xb0\xa1\xa2\x76\
-\x5c\x49\x9f\xb0\x86\x41\x3c\x10\x73\x81\x0f\xde\x5a\xc1\xa1\xa2\
-\x5a\xbc\x34\x65\x24\xa1\x3e\x95\x23\x29\x7e\x7e\x7e\xfc\xeb\x5f\
-\xff\xa2\x51\xa3\x46\x24\x26\x26\x7a\xf4\xae\x41\x49\x25\xde\x45\
-\x8b\x16\x31\x60\xc0\x00\xee\xbd\xf7\x5e\x45\xb6\x9d\xdf\xbe\x85\
-\xc2\xd8\xa6\x34\xac\x16\xc4\xda\x57\x9f\x66\x4b\x41\x0c\xa3\x9f\
-\x99\x40\xe3\x90\xca\x91\xc0\x2b\x57\xae\x30\x6f\xde\x3c\xea\xd7\
-\xaf\xaf\x48\x6f\xd4\xe9\x74\xb2\x7e\xfd\x7a\x82\x83\x83\x3d\x4e\
-\xbf\x14\x01\xe1\xd4\x27\x2c\xcd\xec\xcb\xe8\x76\xfe\x64\x9e\xdf\
-\xcf\xdb\xf3\xde\x27\xb4\xf7\x53\xdc\xd7\xb3\x31\x51\x95\xe0\x39\
-\x3a\x9d\x8e\x2b\x57\xae\x30\x7b\xf6\x6c\x06\x0c\x18\xe0\x31\xc1\
-\x91\xe4\x6b\xbe\xf8\xe2\x0b\x1e\x79\xe4\x11\xc5\x24\xf0\xfc\xc9\
-\x24\xcc\x11\x09\x68\x8e\xbd\xcf\xcb\x1f\xfd\x4c\xdc\x03\x53\x19\
-\x77\x77\x8d\x4a\xf7\xe9\xe4\xc9\x93\x2c\x5c\xb8\x90\x7b\xef\xbd\
-\x17\x8b\xc5\xe2\x71\x36\xc0\xcd\x9b\x37\x59\xbc\x78\x31\xcb\x97\
-\x2f\x57\xab\x7f\xaa\x50\xa1\x92\x40\x15\x2a\x54\xfc\x95\x21\x39\
-\x21\x1a\x8d\x86\xe8\xe8\x68\x5e\x7c\xf1\x45\x9a\x34\x69\xe2\x91\
-\x63\xaa\xd5\x6a\x39\x72\xe4\x08\xfb\xf7\xef\x97\x09\x89\x56\xab\
-\xad\xe4\xdd\x20\x01\xeb\xcf\x2b\x69\xd5\x77\x02\xcd\xdf\x3e\x40\
-\xb7\xf0\x3c\xbe\xda\x95\xcc\xa8\xe1\x3d\x39\x78\x60\x3b\xe7\x6b\
-\x47\x13\x17\x59\x71\x84\x51\xaf\xd7\xcb\x02\xda\x26\x93\x89\xf0\
-\xf0\x70\x16\x2e\x5c\xe8\xf1\xc9\xb4\xd1\x68\xe4\xdd\x77\xdf\x25\
-\x29\x29\x49\xae\x7c\xe7\x09\x59\xca\xbd\x76\x94\x41\x9d\x3b\xe1\
-\xd3\x77\x05\xad\x6a\x67\xf3\xed\x8d\x2a\x8c\x1b\xdb\x82\xc5\xef\
-\xae\xa0\x7b\x8b\x17\xf1\xd7\xb9\xd7\x17\xc9\x36\x5f\x5f\x5f\x9a\
-\x35\x6b\xc6\x92\x25\x4b\x30\x1a\x8d\x1e\x39\x6f\x66\xb3\x99\xa9\
-\x53\xa7\xb2\x6c\xd9\x32\x79\x3d\x78\xe2\x78\xff\xfa\xcd\x1b\xdc\
-\x3f\x6c\x0e\x0f\xef\x3e\x41\xa7\x8c\x2f\x78\xe5\x44\x1c\x6f\x8c\
-\xa8\xce\xee\x03\xdb\x49\x88\x1b\x42\x90\x1b\x4d\xfe\xa7\xae\xe3\
-\xc0\x81\x03\x99\x36\x6d\x9a\xc7\xc4\xd4\xe9\x74\x32\x6b\xd6\x2c\
-\x4e\x9d\x3a\x25\xb7\xe9\x49\x64\x69\xf7\xb2\x27\x19\x3c\x6d\x1d\
-\x4f\xad\xbb\x8f\xef\xd7\x6e\x26\xbf\x46\x17\xba\xa7\xef\x67\xd9\
-\x4f\x57\x78\xbe\xbd\x7b\x64\xa7\x74\xb1\x24\x80\xc1\x83\x07\x33\
-\x79\xf2\x64\x8f\x2b\xd6\x4a\x85\x73\x24\x42\x22\x08\x42\xe5\x6d\
-\x73\xe5\xb1\xf1\xdd\x69\x8c\x9a\xb1\x83\x05\x3f\xee\xa0\xf6\x97\
-\x8f\xf2\x46\xde\x43\xbc\xd9\xe7\x0a\x1f\x2d\xf9\x86\x05\xd3\xef\
-\x71\xfb\x90\x44\x92\x87\x08\x0b\x0b\x63\xf2\xe4\xc9\x74\xee\xdc\
-\xd9\xe3\x7d\x29\x2f\x2f\x8f\x8c\x8c\x8c\x32\x05\x67\x2a\x4b\x2a\
-\x04\xeb\x69\x5a\x77\x7f\x9c\x5a\xaf\xf6\x62\x74\xf3\x4b\x7c\xff\
-\xe5\x1a\x22\x7a\x0c\xe0\xc2\xae\xad\x4c\xbc\x64\xe6\xf3\xc7\xeb\
-\xba\xbd\xaf\x49\x99\x00\x00\x8b\x16\x2d\xf2\x98\x28\x49\xd5\x41\
-\xb7\x6f\xdf\x2e\xaf\xc7\xca\xdf\x9d\x14\xb9\x7e\x69\x1f\x53\xee\
-\x1d\xc8\xfe\x80\x6e\xac\x59\xd6\x9b\x57\x5f\x3d\xc3\x0b\xef\x4d\
-\xe2\xa3\xd1\x53\xd9\xd9\x65\x15\x1d\xdd\x6c\xb2\x74\x95\xe1\x84\
-\x84\x04\x66\xcf\x9e\x4d\x8d\x1a\x35\x3c\xb2\x4d\x10\x04\x52\x52\
-\x52\x38\x70\xe0\x00\x5a\xad\x16\x97\xcb\x85\x4e\xa7\x53\x53\x42\
-\x55\xa8\x50\x49\xa0\x0a\x15\x2a\xfe\x2c\xb8\x5c\x2e\xbe\xf8\xe2\
-\x0b\x32\x33\x33\xcb\x38\x1c\x66\xb3\x99\xac\xac\x2c\x82\x83\x83\
-\x65\x07\xc5\xc7\xc7\x07\xa3\xd1\xe8\xb1\x86\x99\xd9\x6c\x2e\xe3\
-\x18\xee\xde\xbd\xbb\x42\x5d\x2d\xbb\xdd\xce\x13\x4f\x3c\x21\x3b\
-\x79\xc6\xc4\x21\xbc\x35\xed\x02\xeb\x4c\x5a\x34\x06\x3f\xba\xf6\
-\xe9\x47\xbd\x28\x3b\xfb\x6d\xc5\x68\xd0\x90\x94\x74\x84\x9d\x3b\
-\x77\x95\x4b\x54\x0a\x0b\x0b\xb9\x7a\xf5\xaa\xfc\x3b\x1a\x8d\xa6\
-\x4c\xdf\x3c\x41\x69\x27\x54\xaf\xd7\xb3\x67\xcf\x1e\x82\x83\x83\
-\x6f\x9b\x66\xea\x70\x38\x08\x0f\x0f\xa7\x7b\xf7\x1e\x04\x04\x94\
-\x94\xa5\xb0\x44\xd4\x63\xde\x3b\xf3\x59\xba\xc5\x8a\x2d\xa0\x31\
-\x43\xee\xb3\x50\x3b\x28\x07\x5b\x61\x01\x0e\x17\x1c\x3f\x76\x94\
-\x0d\x1b\xbf\xbb\x6d\x2a\xad\x54\x82\xbf\xb0\xb0\xb0\xcc\xcf\x7c\
-\x7d\x7d\x15\xa5\xcd\x95\x26\x12\xa2\x28\xb2\x73\xe7\x4e\x9c\x4e\
-\xe7\x6d\x75\x02\x9d\x4e\x27\xc1\xc1\xc1\x3c\xf4\xd0\x43\xf2\xcf\
-\x1a\xdd\x33\x8e\x97\x07\x1f\x22\x55\x10\xb1\x9a\x63\x18\xf7\x64\
-\x0b\x02\x85\x5f\xb0\x15\x17\xe3\x04\x36\x7c\xbb\x9e\xe4\x8b\x29\
-\xe5\x3a\x85\x85\x85\x85\x65\x08\xbc\xd1\x68\xc4\x6c\x36\x2b\x12\
-\x8b\x2f\x3d\x6f\x2e\x97\x8b\x0f\x3f\xfc\x90\xf0\xf0\xf0\xdb\x1e\
-\x08\x38\x9d\x4e\x6a\xd5\xae\x4d\x9f\xde\xbd\xe5\x9f\xb5\x1a\xb5\
-\x90\x55\x19\x17\x59\x9b\x51\x4c\xb5\xe6\xed\xa8\x19\x58\x8f\xac\
-\x6f\xf6\xb0\x27\xcf\x0e\xa2\x83\xaf\xd7\xae\xe7\xd2\xa5\x4b\xb7\
-\xed\xa7\xd1\x68\x64\xf7\xee\xdd\x65\x0e\x57\x0c\x06\x83\x62\x4d\
-\x3d\x49\x9f\x50\x10\x04\xb2\xb2\xb2\x58\xb9\x72\x25\x51\x51\x51\
-\xb7\x4d\xa1\xb5\x5a\xad\xb4\x6a\xd5\xea\xb7\xfb\x5f\x1a\x7f\x7a\
-\x3e\xf1\x2a\xaf\x9e\x7f\x1e\xb3\xa3\x90\x9c\xa0\x36\x3c\xff\x54\
-\x67\x82\xae\xfd\x1b\x7b\x6e\x01\x69\x85\x79\x6c\xfb\xea\x1b\xb2\
-\x73\x72\x6e\x3b\x6f\x1a\x8d\x86\xe3\xc7\x8f\xcb\x7b\x86\x24\x7b\
-\xa0\xc4\x2e\x87\xc3\x21\x8f\xa5\x56\xab\x25\x39\x39\x99\xc5\x9b\
-\xe7\xf0\xc1\x00\x00\x20\x00\x49\x44\x41\x54\x8b\x17\x57\x48\x04\
-\x1b\x34\x68\x40\x87\x0e\x1d\x6e\x0d\x7a\x1c\x9f\x4c\x68\xcd\x53\
-\xf9\x76\xd0\xfa\x12\xd7\xba\x3b\x51\x2d\x62\x79\x6b\xd3\x0f\x5c\
-\xcf\x29\xa4\xf0\xe6\x0d\x3e\xf8\xf8\x73\x44\xf1\xf6\xe9\x8f\x82\
-\x20\x70\xf0\xe0\x41\xea\xd4\xa9\x53\x86\x7c\x2b\xd1\xd3\x33\x9b\
-\xcd\x65\xc8\xd7\x99\x33\x67\x58\xb2\x64\xc9\x6d\x89\x97\xb4\x4e\
-\xef\xe9\xdb\x97\xea\xd1\xd1\x80\x40\x48\xb5\x56\xcc\xdf\xb8\x83\
-\xcf\xd7\xef\xc1\x95\x21\x72\xf7\xd3\x8f\x13\x1f\x15\x8c\xe0\xb8\
-\x4e\x81\x0d\xce\x25\x1f\x67\xd3\xb6\x1d\xe5\xbe\x6b\x82\x20\x70\
-\xf6\xec\x59\x59\x33\x52\xda\xff\xbd\x65\x9b\xd1\x68\xe4\xbb\xef\
-\xbe\x23\x37\x37\xb7\x4c\x3f\x6c\x36\x1b\x0d\x1b\x36\xa4\x7d\xfb\
-\xf6\x6a\xb4\x50\x85\x0a\x95\x04\xaa\x50\xa1\xe2\xbf\x09\x41\x10\
-\x88\x8f\x8f\xff\x9d\x16\x55\x40\x40\xc0\xef\x52\x36\x95\x56\xf4\
-\x2b\xfd\xbc\x54\xb9\xb0\x69\xd3\xa6\xe5\x46\xe0\x5c\x2e\x17\x1a\
-\x8d\xc0\xba\x0d\xdb\xd9\x70\xe8\x3c\x8b\x67\x3e\x4a\x80\xbf\x2f\
-\x02\x22\x98\x42\xa8\x17\x91\xca\x2b\xd3\x17\x12\xd1\xe7\x19\x6a\
-\x47\xfa\x90\x4e\x18\x89\x89\x89\xb7\xed\xab\xa4\x0b\xe8\xa9\x96\
-\x57\x79\xe3\x58\xba\xcf\x51\x51\x51\x34\x6f\xde\x9c\xbc\xbc\xbc\
-\xdb\xda\xe5\x6f\x09\xc0\xec\xa3\x61\xf7\xec\x11\xbc\xfe\xed\x31\
-\xda\xbe\xb2\x93\x61\xd5\x83\x10\x9c\x79\x54\x89\xac\x45\xd5\x6b\
-\x7b\x79\x6a\xd8\x5c\xe2\x1f\x9b\x47\x90\x01\xac\x21\xa1\xb4\x6c\
-\xd9\xf2\xb6\x84\x4e\xaf\xd7\x93\x9e\x9e\x5e\x86\x6c\x08\x82\xa0\
-\x78\xde\xfe\xd3\x59\xac\x51\xa3\x06\x89\x89\x89\xb7\x8d\x52\x49\
-\x77\x12\x45\x97\x93\xaf\x17\xbd\xce\x7b\x87\x6e\xf0\xda\x3b\x0b\
-\xf0\x37\xfa\x80\xd3\x81\x31\xae\x3d\x77\x24\x6f\x67\xd6\x4b\x1f\
-\xd2\xea\xb1\x57\x08\xd5\x41\xad\xda\x75\x08\x0c\x0a\x2e\xb7\x1f\
-\x79\x79\x79\xb8\x5c\xae\x32\x65\xf9\x95\xd8\x26\xdd\x95\x2b\xdd\
-\x5e\xbd\x7a\xf5\xca\xd5\x42\x13\x45\x91\xb0\xaa\x55\xc8\x3a\xbd\
-\x93\x67\x27\xcf\xc0\xf7\x81\x15\x2c\x1c\x1a\x47\x80\x49\x87\x5d\
-\x34\x13\x1f\xd7\x88\x5f\xbf\x7e\x83\x45\x87\x04\x5e\x1e\x50\x1d\
-\x51\x14\x88\x89\x89\x21\x34\x34\xf4\xb6\x7d\xf5\xf1\xf1\x21\x35\
-\x35\xb5\xcc\xff\xef\xed\x08\x89\xc9\x64\xa2\x5e\xbd\x7a\xd4\xa9\
-\x53\xe7\xb6\x91\x7c\x87\xc3\x41\x44\x64\x75\xc8\x3a\xc4\xfc\x27\
-\x9e\xe3\x60\x95\xbb\x58\xb8\xf0\x79\xfc\x0c\x7a\x1c\x85\x56\x22\
-\xbb\x3c\x82\xe9\x97\xcf\x98\xb8\xf0\x00\xa3\x5e\x7f\x93\x50\x8d\
-\x9d\xf8\x7a\xf5\xca\x4d\xa3\xd6\x6a\xb5\x58\xad\x56\x36\x6d\xda\
-\xe4\x35\xdb\x4a\xcf\x9b\x74\x8f\xb2\x71\xe3\xc6\xe5\x1e\x4e\x09\
-\x82\x40\x54\xb5\x08\xce\xed\x5e\xcd\x73\xaf\x2c\xa1\xd7\x6b\x5f\
-\xd2\xdb\xa8\xc7\x25\x8a\x60\x08\x21\xf1\xce\x06\x7c\x30\x67\x2e\
-\xda\x16\x3d\x79\xfb\xfe\xc6\x20\xe4\xd3\xb4\x69\x93\x72\x05\xda\
-\x05\x41\x28\x63\x97\x37\x6c\xfb\xcf\xe7\x03\x03\x03\x69\xda\xb4\
-\x69\x99\x75\xff\x47\x6b\x32\x38\x2a\x9a\xe4\x55\x93\x18\xbc\xe2\
-\x02\x93\xe6\x2e\xe3\xfe\xe6\x61\xf8\xea\x5c\x14\x86\xb6\x66\x78\
-\x6b\x17\x2f\x8d\x18\x89\x76\xd8\x3c\x7a\x99\x20\x3d\x28\xb4\xdc\
-\x02\x3d\x92\x6d\x81\x81\x81\x65\xf6\x48\x6f\xee\x23\x4e\xa7\x93\
-\x1a\x35\x6a\xd0\xa4\x49\x93\xdf\xfd\x3c\x22\x22\xe2\x2f\x53\xa8\
-\x49\x85\x0a\x95\x04\xaa\x50\xa1\xe2\x7f\x9a\x04\x36\x69\xd2\xe4\
-\xb6\xce\x69\x69\x07\xfc\xd8\xb1\x63\x68\x34\x1a\x8f\xd3\x41\x93\
-\x92\x92\x64\x67\xc6\xe9\x74\x52\xa7\x4e\x1d\x5a\xb7\x6e\xed\xd6\
-\xf3\xcd\x9a\x26\x10\x51\xb3\x26\x06\x4a\xa2\x83\x0e\x51\x84\xa2\
-\x34\xde\x78\xf1\x45\x82\xfa\xbf\xce\x93\xbd\x62\x10\x5d\x22\x91\
-\x91\x51\x44\x46\x96\x2f\x18\x9f\x99\x99\x49\x40\x40\x00\x2e\x97\
-\x0b\x97\xcb\x45\x71\x71\x31\xc7\x8e\x1d\xf3\x98\x14\x1a\x8d\x46\
-\x52\x53\x53\x65\xe2\xe0\x72\xb9\xa8\x5d\xbb\x36\x8d\x1a\x35\x72\
-\xeb\xf9\x7a\xf7\x8c\x61\x4a\x8b\x5c\xaa\x34\xd0\x63\xbd\x66\xc3\
-\x21\x6a\x10\xf3\x8e\x30\xe8\xb1\xb7\xe8\x3a\xed\x6d\x06\x35\x0a\
-\x45\x04\xc2\x23\x22\x08\x8f\x88\xa8\xd0\x36\xe9\x04\xdd\xe5\x72\
-\x91\x9d\x9d\xcd\xcf\x3f\xff\x8c\x8f\x8f\x8f\xc7\xe9\xa0\xc9\xc9\
-\xc9\x65\x34\xbd\x6a\xd6\xac\x49\x62\x62\x62\x85\xcf\x8a\xa2\x8b\
-\x96\x3d\xee\x25\xf4\x4e\x3b\x75\x2d\x70\xc1\x6a\xc5\x29\x68\xb1\
-\x5f\xdf\xc3\xc8\xfe\x2f\x71\xef\xf2\xb5\x0c\x68\xea\x87\x0b\xdc\
-\xaa\xd2\x9a\x96\x96\x86\xd3\xe9\x94\xfb\x71\xf9\xf2\x65\x92\x92\
-\x92\x3c\x76\x18\x1d\x0e\x07\x29\x29\x29\x32\xa1\x10\x04\x81\x96\
-\x2d\x5b\x96\x89\xec\xdc\x0e\xd6\xdc\x00\x46\x3f\xf3\x22\xba\x1a\
-\x25\xf3\xe1\xb4\xdb\x10\x05\x48\xde\xf0\x06\x33\xbe\xbc\xca\xf4\
-\xd9\xcf\x52\xd5\x6c\x40\xd0\x68\xdc\xba\x6f\x58\x3a\x25\x15\x4a\
-\x04\xd6\xcf\x9c\x39\xe3\xf1\x3d\xd5\xc0\xc0\x40\x0a\x0a\x0a\x64\
-\xe2\x60\x36\x9b\x69\xde\xbc\x39\xb1\xb1\xb1\x15\x3f\x6c\xf3\xa1\
-\xf7\xb8\x69\xdc\x69\x0a\x27\x4c\x00\x9b\xdd\x8e\xce\x60\xa0\xf8\
-\xec\x32\x7a\x0d\x59\xcb\xeb\x5b\xbf\xa6\x75\x98\x88\xce\x60\xa6\
-\x59\xb3\x66\x15\x36\x57\x54\x54\x24\xbf\x1b\x36\x9b\x8d\xb3\x67\
-\xcf\x52\xb5\x6a\x55\x8f\xd3\xaf\x0b\x0a\x0a\xe4\xcc\x05\x97\xcb\
-\x45\x70\x70\x30\xed\xda\xb5\x73\x2b\xda\x9d\x6b\xd4\x30\xe1\xf9\
-\x10\xaa\x35\x08\xc6\x75\xd0\x4a\x49\x8d\xe2\x6c\xbe\x58\xf8\x22\
-\x3f\x16\x35\x67\xc6\x7d\xed\x08\xd0\xd9\x31\xfb\xf8\xb9\xb5\x37\
-\x45\x47\x47\x93\x95\x95\x25\xdb\x72\xf4\xe8\x51\xfc\xfc\xfc\x3c\
-\x4e\x07\xcd\xc9\xc9\x91\xe7\x5c\x10\x04\xc2\xc2\xc2\xb8\xf3\xce\
-\x3b\xdd\x7a\xbe\x6a\x9b\x87\x78\x39\xbc\x80\xf8\x98\x00\x70\xdc\
-\xc4\xe1\xd2\x60\xd1\xa4\x31\xad\xc7\x28\x84\x51\x2b\x99\xd9\xb7\
-\x36\x36\x17\x54\x0d\xaf\x4a\xd5\xf0\xaa\x15\xb6\x17\x16\x16\xc6\
-\xb5\x6b\xd7\x64\xe9\x92\xa3\x47\x8f\x92\x9b\x9b\xeb\xb1\x58\xfc\
-\x95\x2b\x57\xe4\xf7\xd7\xe9\x74\x52\xaf\x5e\x3d\xc5\x77\xa8\x55\
-\xa8\x50\x49\xa0\x0a\x15\x2a\x54\xfc\x17\xe1\xeb\xeb\x4b\x6e\x6e\
-\x2e\xcf\x3c\xf3\xcc\xef\x4e\x87\xdd\x85\x46\xa3\x21\x3d\x3d\x9d\
-\xa0\xa0\x20\x59\x4b\x4f\x22\x61\xee\x9c\x30\x47\x45\x56\x25\xea\
-\x96\x4e\xb5\x25\xaa\x36\x71\xc1\xbe\x38\x0b\xf3\xd0\x84\xd6\xa2\
-\x5a\xc1\xaf\xac\xdf\x96\x43\xfb\x36\xcd\x09\xf2\xa9\x78\xab\x94\
-\xaa\x65\x8a\xa2\x48\x40\x40\x00\xa2\x28\x32\x68\xd0\x20\x8f\x2b\
-\x4d\x0a\x82\x40\x5e\x5e\x1e\xc1\xc1\xc1\x32\x21\xa9\x4c\x5b\x61\
-\xf5\xef\xa0\x43\x7d\x00\x17\x97\x6f\x56\xa1\x41\x3d\x48\xbd\x90\
-\x45\x93\xee\x77\xe1\x7f\x7e\x07\x6b\x32\x6a\x33\xa8\x4f\x5b\x74\
-\x6e\x04\x19\xec\x76\xbb\x6c\x9b\xbf\xbf\x3f\x7b\xf7\xee\x65\xe0\
-\xc0\x81\x25\x91\x39\x0f\x9c\x6e\xbd\x5e\xcf\xb9\x73\xe7\x88\x8e\
-\x8e\x96\xef\x3b\xba\x6b\x9b\x20\x68\xa8\x16\x97\x80\x54\xd2\xa6\
-\x4a\xbd\x86\x38\x82\x7c\xc8\x3f\x71\x8a\xc0\x5e\x43\x88\x48\xd9\
-\xc2\x26\x6b\x7d\x3a\xb4\x6e\x88\x3b\x49\x66\xd2\xe1\x83\x56\xab\
-\xa5\x4a\x95\x2a\xac\x5d\xbb\x96\x1f\x7e\xf8\xc1\xe3\x39\x73\x3a\
-\x9d\x5c\xb9\x72\x85\x21\x43\x86\xc8\x6b\xd0\xdd\x03\x0e\xa3\xa5\
-\x2a\x2d\xda\xff\xe6\x48\x5b\x6a\x37\xa3\x41\x68\x3e\x67\xae\xfa\
-\xd3\xea\x8e\x58\x4e\xef\xdc\x48\x6e\xab\x7b\xe8\x1c\x1b\xe8\x56\
-\x7b\xa5\x0f\x10\x8c\x46\x23\x9f\x7e\xfa\xa9\x1c\x65\xf2\x74\xde\
-\x6e\xde\xbc\x89\xc5\x62\x91\xd7\x83\xdb\x87\x37\x86\x10\xe2\x5a\
-\x77\xa2\x44\x84\xc3\x49\x44\x6c\x3d\xfc\xab\x04\x90\xfc\xe5\x3e\
-\x6a\x0f\x7d\x84\xbc\xfd\x5f\xb1\xad\x5a\x33\x3a\xb7\x8a\x75\xcb\
-\x31\x91\xde\x37\x83\xc1\x80\x5e\xaf\xe7\xb5\xd7\x5e\xc3\x62\xf1\
-\x5c\x99\x4f\x14\x45\x52\x53\x53\x09\x0b\x0b\x93\xff\x6d\xb7\xdb\
-\xdd\x22\x81\x96\xaa\x35\x68\x53\xb5\xa4\x38\x4a\x4e\x74\x33\x9a\
-\x63\x80\x9b\x37\x29\x28\xd4\x53\xad\x66\x00\x7b\x36\xef\xc0\x5c\
-\xab\x09\x7d\x5b\xba\x57\xac\x48\x3a\xd4\xd2\xeb\xf5\x58\x2c\x16\
-\x86\x0f\x1f\xee\x71\x05\x5d\x41\x10\xb0\xdb\xed\xe4\xe7\xe7\xcb\
-\xf7\x28\x2b\xd3\x8e\xb9\x46\x53\xba\x4a\x75\x5f\x1c\x7a\xa2\x6a\
-\xc4\x10\x78\xe3\x27\x2e\x44\xf6\xe3\x01\xe3\x49\xbe\x58\x73\x9e\
-\x76\xfd\xef\x21\xda\xcd\x6c\x7e\x69\x9f\xb7\x58\x2c\x5c\xb9\x72\
-\x85\x27\x9e\x78\xc2\x63\x82\x2b\x15\xbd\xf1\xf3\xf3\x93\xf7\xff\
-\xd2\x07\x3a\x2a\x54\xa8\x50\x49\xe0\x5f\x1e\xab\x56\xad\x62\xf3\
-\xe6\xcd\xf2\xc7\xc6\x6a\xb5\xd2\xa3\x47\x0f\x06\x0e\x1c\xa8\xa6\
-\x2f\xa8\xf8\x9f\x45\xfb\xf6\xed\x59\xb7\x6e\x9d\x4c\xda\x3c\x85\
-\x56\xab\x45\xaf\xd7\x13\x10\x10\xc0\xfa\xf5\xeb\x3d\x6e\x27\xba\
-\x7d\x5f\x06\x69\x8c\x68\xb4\x21\x3c\x31\x7e\x3c\x79\xc5\x0e\x0c\
-\xbe\x01\xf8\x1a\xdc\x4f\x57\x12\x45\x11\xab\xd5\xca\x84\x09\x13\
-\x78\xf8\xe1\x87\xb1\xd9\x6c\x8a\xc6\x48\x10\x04\xcc\x66\x33\x21\
-\x21\x21\x0a\x4a\x9f\x6b\x88\xa8\x75\x07\x0f\x45\x82\xc9\x20\x32\
-\x2a\xac\x2e\x79\xc5\x36\x30\xf8\xa3\xad\x64\x5f\x8a\x8b\x8b\x79\
-\xe1\x85\x17\x18\x39\x72\x64\xa5\x9d\xc9\xff\x1c\x27\xbd\x5e\x8f\
-\xc9\x64\xc2\xd7\xd7\x57\x91\xbe\x57\x8b\x91\x8f\xe3\xf4\x31\x63\
-\xa8\x3a\x88\xb9\xb5\x32\xc9\xb7\x8a\xfc\x1f\x7b\xe7\x1d\x1e\x55\
-\xd5\xbd\xed\xfb\x9c\x29\x99\x4c\x32\xe9\x95\x00\x81\x40\x12\x7a\
-\x47\x40\xe9\x08\x4a\x97\x22\x0a\x88\x20\x1d\x45\x40\x51\x41\x44\
-\xc0\x86\x34\x45\xc5\x86\x28\x16\x04\x05\x94\x8e\x28\x2f\x48\x47\
-\x40\x7a\xef\x90\xde\xfb\x64\xfa\xcc\xf9\xfe\x08\x33\x26\x6a\x42\
-\x66\x26\xbf\xef\xc5\xd7\x79\xbc\xbc\x20\x13\xce\x9e\xbd\x76\x3b\
-\xeb\xd9\x7b\xed\xf5\xf8\xf8\x07\xe1\xcc\xcd\x1f\xab\xd5\x8a\x46\
-\xa3\xe1\xb5\xd7\x5e\x23\x23\x23\xc3\xed\x90\x5e\x51\x14\x89\x8d\
-\x8d\x65\xe3\xc6\x8d\x6e\xa5\xac\xaf\xd5\xf7\x45\x46\xc8\x34\xc8\
-\x2d\x83\x69\x90\x9d\x87\xd1\x64\xc5\x37\x5c\xed\xf4\x18\x2a\x28\
-\x28\xe0\xc7\x1f\x7f\x44\x26\x93\xb9\x25\x7f\x61\x4f\x56\x52\xb3\
-\x66\x4d\x4e\x9e\x3c\xe9\x46\x0b\xc9\x68\x3f\x7c\x24\xa2\xb7\x1a\
-\xdb\x88\xa5\x2c\xce\x2f\x40\x6f\x06\x1f\xff\x60\xa7\xc6\xa4\xd5\
-\x6a\x25\x26\x26\x86\xcf\x3e\xfb\x0c\xad\x56\x5b\x25\x12\x11\x2d\
-\x5b\xb6\x64\xe7\xce\x9d\x2e\x97\xe1\xd7\x7d\x26\x33\xd1\x80\x97\
-\x86\x81\x4f\xcf\x22\x4f\xab\xc3\x8a\x37\x5e\x7e\x01\x4e\x95\x63\
-\x36\x9b\x89\x8d\x8d\xe5\xbb\xef\xbe\x73\x99\xb4\xff\x99\x08\xd6\
-\xac\x59\xd3\xbd\x36\x92\xfb\xd1\xa1\x43\x5b\x14\x52\x4b\xde\x9f\
-\x9f\x8f\xb6\xd8\x88\x20\xf3\x22\x58\xee\xfc\x38\x6a\xde\xbc\x39\
-\xdb\xb7\x6f\xaf\x30\x24\xb5\xb2\xb6\x79\x7b\x7b\x53\xa3\x46\x0d\
-\x56\xac\x58\xe1\x79\xb1\x7a\xe0\x81\x87\x04\xfe\xb3\x90\x95\x95\
-\xc5\x37\xdf\x7c\x53\xe6\xb3\xca\x84\x45\x79\xe0\xc1\x3f\x19\x2a\
-\x95\x8a\x87\x1e\x7a\xa8\xca\xca\xcb\xce\xce\x76\x8b\x74\xc9\x55\
-\xea\x3b\x0b\xa2\x8c\xb0\xa8\x68\xc2\x5c\x2c\xc7\x62\xb1\x54\x2a\
-\x9c\xcd\x19\xb8\x2b\x16\x2f\x93\x7b\xe1\x73\x67\xb5\x0f\xad\x56\
-\x83\x50\x17\xcb\x31\x9b\xcd\x34\x6e\xdc\xd8\x6d\xe9\x83\xd2\xb8\
-\x7c\xf9\xb2\x5b\xa4\xcb\xcb\x57\x73\xc7\x48\x5f\x22\x6b\xf8\xba\
-\x54\x86\x5d\xff\xae\xaa\xd7\x5d\x77\x93\x50\xc8\xd5\xfe\x25\x63\
-\xd2\x2b\x80\x1a\x3e\x01\x2e\x97\x63\x30\x18\xe8\xdd\xbb\x77\x95\
-\xda\x76\xe2\xc4\x09\xb7\x9c\x77\x95\xcf\x9d\xbe\xf2\x0b\x22\xca\
-\x2f\xc8\xe5\x7e\x0b\x0c\x0c\xa4\x63\xc7\x8e\x55\x6a\x9b\xab\x12\
-\x1a\x00\xa2\xb7\x3f\xfe\x77\xfe\xee\x1f\x5a\x0d\x7f\x17\x27\x9b\
-\xcd\x66\x23\x20\x20\x80\x5e\xbd\x7a\xdd\x43\xab\xb6\x88\xca\xcb\
-\x0b\xf0\x22\x2c\xc2\xd7\xe5\x35\x12\x4a\x36\xef\x1e\x7e\xf8\xe1\
-\x2a\xab\x99\x56\xab\x75\xab\xdf\x3c\xf0\xc0\x43\x02\x3d\xf8\xaf\
-\xe0\x81\x07\x1e\xf8\xcb\x0e\xed\xfd\xf7\xdf\xef\x39\x05\xf4\xe0\
-\x7f\x1a\x37\x6f\xde\x64\xc9\x92\x25\xc8\x64\x32\xb7\x43\x77\xe4\
-\x72\x39\x1d\x3b\x76\xbc\x67\xc4\xe2\x3f\xfb\xec\x33\x2e\x5c\xb8\
-\xe0\xf6\xc9\x84\x3d\x5b\xe5\xe0\xc1\x83\xff\xeb\xfd\x65\x97\xbe\
-\x58\xb1\x62\x05\x27\x4e\x9c\xa8\x92\x2c\x7b\x7e\x7e\x7e\x3c\xf4\
-\xd0\x43\xff\xf5\xb5\xce\x2e\x16\xff\xc1\x07\x1f\x70\xe5\xca\x15\
-\xb7\xeb\x63\xb1\x58\xe8\xdc\xb9\x73\xb9\x59\x5c\xff\x7f\xf7\x9b\
-\xbf\xbf\x3f\x63\xc6\x8c\x41\xad\x56\xbb\x5d\x1f\xb3\xd9\x4c\xc7\
-\x8e\x1d\xef\x09\xb1\x78\xb9\x5c\xce\xed\xdb\xb7\x59\xb9\x72\x25\
-\x79\x79\x79\x6e\xf5\x9b\x3d\x84\xf0\x89\x27\x9e\x70\x39\x53\x71\
-\x55\x42\xa1\x50\x90\x90\x90\xc0\xd2\xa5\x4b\x5d\xd4\x3f\x2d\x8b\
-\xdc\xdc\x5c\x3e\xf8\xe0\x83\x7b\x62\xed\x17\x04\x81\x8c\x8c\x0c\
-\xe6\xce\x9d\xeb\xc8\xcc\xeb\xee\xba\x34\x60\xc0\x80\x7b\xa2\xdf\
-\x3c\xf0\xc0\x43\x02\x3d\x70\x0a\xad\x5a\xb5\x42\xad\x56\x3b\x32\
-\xfe\xd5\xa8\x51\x83\xb0\xb0\x30\x4f\xc3\x78\xf0\x3f\x8d\xf3\xe7\
-\xcf\xf3\xc9\x27\x9f\xb8\xa0\xeb\x57\x16\x36\x9b\x0d\xa5\x52\x49\
-\x50\x50\x90\x5b\x4e\x80\x3e\x3d\x91\x44\x79\x28\xf1\x21\x5e\xe4\
-\x67\xa5\x93\x5d\xa0\xc7\xc7\x3f\x84\xb0\x60\x7f\x64\x4e\x54\x4f\
-\xa1\x50\xb0\x63\xc7\x0e\x36\x6d\xda\x84\x52\xa9\x74\x99\x08\xda\
-\x43\xb8\x64\x32\x19\xdd\xba\x75\x73\xc3\x51\x92\xd0\x15\xe5\x92\
-\x9a\x66\xa4\x6e\x5c\x04\xd9\xe9\xa9\x14\x16\x1b\x50\xfa\x85\x12\
-\x15\xea\x8f\x33\xa5\x2a\x95\x4a\xd6\xad\x5b\xc7\xcf\x3f\xff\xec\
-\x96\x3c\x84\x20\x08\x98\x4c\x26\xc2\xc2\xc2\x1c\x1b\x5e\xae\xb6\
-\x53\xfe\xb5\xf3\xe4\x84\xc7\x51\xc7\x4f\x46\x66\x62\x02\x05\x16\
-\x91\x80\xa0\x50\x42\x03\x2a\xbf\x21\x60\x17\x8b\xdf\xb8\x71\x23\
-\x7b\xf7\xee\x75\xcb\x36\x3b\x51\x2a\x28\x28\x20\x26\x26\xc6\x2d\
-\xe7\xd6\x90\x7e\x81\x5b\x52\x7d\x1a\x84\xe8\x49\x4d\xcb\x44\x6b\
-\x92\x11\x59\x2b\x0a\x8d\xc2\xb9\x57\xb7\x5a\xad\x66\xe5\xca\x95\
-\x88\xa2\xe8\x16\x51\xb2\xf7\x5b\x71\x71\xb1\xdb\xa7\x38\xd9\x37\
-\xae\x60\x0d\xaf\x49\xb8\x42\xcf\x8d\xa4\x5c\x04\x85\x17\x21\x91\
-\x35\xf0\x73\x62\x6f\xc1\x7e\x27\xf8\xab\xaf\xbe\x22\x25\x25\xc5\
-\xed\x7e\xb3\x58\x2c\xc4\xc6\xc6\xba\xb5\x1e\x49\x59\xe7\x38\xa1\
-\x8d\xa3\x55\x6d\x2f\xf4\xda\x5c\xd2\x53\xb3\x40\x1d\x82\x26\x38\
-\x88\x10\xef\xca\xcf\x36\x99\x4c\x46\x4a\x4a\x0a\x2b\x56\xac\x70\
-\xdb\x2e\xfb\x98\x7c\xe5\x95\x57\xdc\xb3\xcd\x6a\x26\x23\x33\x1b\
-\x9f\xc0\x20\x84\xc2\x0c\xd2\x8b\xcc\x28\x94\xfe\xd4\xa8\x11\x82\
-\xb3\xa5\x5e\xbb\x76\x8d\xe5\xcb\x97\xbb\xad\xeb\x57\x3a\x93\x6b\
-\x55\xb4\x93\x07\x1e\xfc\x9b\x20\x7a\x9a\xe0\xde\x40\x69\x91\xdb\
-\x6e\xdd\xba\x11\x1c\x1c\xec\x69\x14\x0f\xfe\xa7\x61\xb3\xd9\x88\
-\x8c\x8c\xe4\xc8\x91\x23\x98\x4c\x26\x0c\x06\x83\xd3\xff\x9b\x4c\
-\x26\x0e\x1e\x3c\xf8\x17\x47\xd5\x69\x47\xa7\xe8\x36\x1f\xbe\x38\
-\x89\x45\xfb\x13\xc0\x9c\xc3\x7b\x2f\x8e\x60\xdc\xc4\xa9\x7c\xb6\
-\x61\x0f\x05\xc6\xca\x3b\x6d\xa5\x6d\x0b\x0e\x0e\xc6\x68\x34\xa2\
-\xd7\xeb\x5d\xb2\xcd\x68\x34\xf2\xf9\xe7\x9f\x97\xb1\xc5\x15\x07\
-\xce\xa2\xcb\x65\xc3\x07\x33\x79\xe1\xbd\x5d\x60\xbc\xc8\xd4\x69\
-\x2f\xf0\xcc\xe4\xa9\x2c\xfe\x76\x2f\x95\xbd\x1d\x56\xda\x36\x41\
-\x10\x68\xdf\xbe\x3d\x79\x79\x79\x2e\xf5\x9b\x5e\xaf\xc7\x68\x34\
-\x32\x71\xe2\xc4\x32\xe1\x5b\xae\x90\x13\x7d\xde\x45\x5e\x1d\x3e\
-\x92\x2f\x2f\xe5\x81\xf5\x04\x8f\xde\x3f\x80\xe7\x5e\x99\xc7\xfa\
-\x5d\xa7\xa8\x2c\xa5\xb4\x4b\x5f\x08\x82\x80\x5e\xaf\x67\xea\xd4\
-\xa9\x14\x17\x17\xbb\xd4\x67\x06\x83\x01\x9d\x4e\xc7\x4b\x2f\xbd\
-\x44\x71\x71\xb1\xc3\xb9\x75\xa5\xdf\xb2\x6e\x9d\xe4\xed\xd1\xfd\
-\xf8\xe8\x94\x8c\xd4\x9d\xab\x19\x3f\xe6\x31\xc6\x4c\x79\x8d\x03\
-\xa9\x05\x4e\x91\xa4\xd2\x58\xb0\x60\x81\xcb\x73\xcd\xde\x6f\x51\
-\x51\x51\x65\x9c\x76\xa7\x6d\x93\x2c\x64\x27\x1c\x60\xc6\x98\xc9\
-\xec\x4c\xca\xc3\xbc\x7e\x0c\xf1\x7d\xa7\x33\xef\xf5\x25\x1c\x4a\
-\xb2\x38\x6d\x9b\x7d\x13\x68\xdb\xb6\x6d\x2e\xf7\x99\xc1\x60\x20\
-\x27\x27\x87\x76\xed\xda\xfd\x45\x0f\xd3\x59\x7c\xf9\x6c\x2f\xa6\
-\x6f\x2d\x04\x0a\xd9\xf9\xfd\x6c\x06\x74\x7f\x8c\x97\x3f\xdc\xc0\
-\x86\x8b\xc6\x4a\x97\x61\x6f\x5f\xfb\x9f\x59\x59\x59\x6e\xad\x91\
-\xe9\xe9\xe9\x8e\x84\x37\xa5\xcb\x75\x06\xc6\xe2\x0c\x0e\xfc\xf8\
-\x29\x73\xde\x7c\x97\x1b\x39\x5a\x96\x0d\xe9\xc8\xf0\xe7\x5f\x60\
-\xce\xa2\x1f\x28\x74\x72\x23\x01\x4a\x32\xba\xd6\xab\x57\x8f\x2b\
-\x57\xae\xb8\x6c\x9b\xc1\x60\xe0\xe2\xc5\x8b\x65\xb4\x45\xef\x85\
-\x13\x6a\x0f\x3c\xf8\xa7\xc0\x73\x12\x78\x8f\xe0\x89\x27\x9e\x60\
-\xd3\xa6\x4d\x40\x49\x28\xa8\x3b\x59\xce\x3c\xf0\xe0\x5e\x20\x78\
-\x3f\xff\xfc\x33\xb9\xb9\xb9\x65\x44\x8a\xfd\xfc\xfc\x28\x2c\x2c\
-\x74\x64\xcf\x2c\x2d\x14\xec\xea\x0e\xb5\x46\xa3\x71\x3c\xab\x50\
-\x28\x38\x7e\xfc\x38\x6b\xd6\xac\xa9\x98\x18\x59\x2c\x0c\x1d\x3a\
-\xb4\xcc\xce\xb1\x4f\x60\x30\xfe\xde\x0a\x24\xb3\x09\x21\xa0\x0e\
-\x4f\xf5\xea\x4b\xb3\xfb\xda\x10\xe4\x0d\x97\x2e\x5d\xe2\xf8\xf1\
-\xe3\x15\x3a\x85\x7a\xbd\x9e\xac\xac\x2c\xc7\xbf\xb1\x87\x70\xb9\
-\x73\xf2\x52\x3a\x61\x8a\x5c\x2e\xe7\xc4\x89\x13\x6c\xd9\xb2\x85\
-\xa2\xa2\xa2\xbf\x75\x74\xac\x56\x2b\x21\x21\x21\xb4\xef\xd0\x01\
-\x8d\x6f\xc9\x9d\x2b\xb9\x42\x40\xee\xeb\x4f\x68\x80\x1a\x43\x6a\
-\x1e\x21\x8d\xda\xd1\xab\x4e\x35\x1a\xb5\xed\x80\x1c\xb8\x7a\xf5\
-\x2a\x07\x0e\x1c\xf8\x5b\xc1\x66\x7b\xf6\xc5\xac\xac\xac\x32\x8e\
-\x96\x52\xa9\x74\xbb\xdf\xaa\x55\xab\x86\xcd\x66\x73\x48\x29\xfc\
-\xfe\xfb\xef\xf8\xfb\xfb\x57\x28\x16\xef\xef\xef\x4f\xbf\x7e\xfd\
-\x4a\x55\x50\x4e\x40\x48\x30\xbe\x2a\x05\xa4\xdc\xc6\xdc\x7a\x20\
-\x2f\x4e\xec\x48\x74\x7c\x13\x04\x60\xcf\x9e\x3d\xa4\xa5\xa5\x55\
-\x58\x0f\x9d\x4e\xe7\x38\x8d\xb0\xdf\x31\x73\xf7\x74\xba\x74\xd6\
-\x54\x49\x92\xd8\xb4\x69\x13\x35\x6a\xd4\x28\xf7\xee\xa3\xd5\x6a\
-\xa5\x46\x8d\x1a\x74\xee\xdc\xf9\x8f\x39\x64\x95\x08\x0c\x8f\xc0\
-\xe2\xa5\x27\x21\x43\xa0\xd1\xfd\x03\x68\xd5\xed\x41\x3a\x55\x0b\
-\xc0\x62\xb1\xb0\x77\xef\x5e\xd2\xd2\xd2\xfe\x76\x7c\xd9\xe7\xd6\
-\xa1\x43\x87\xca\x5c\x33\xb0\x87\xf0\xba\x63\x9b\x5d\x06\xc5\xae\
-\x8d\xb9\x75\xeb\x56\xce\x9c\x39\x53\x6e\xc2\x19\x93\xc9\x44\xd3\
-\xa6\x4d\xff\xd0\x90\x13\xe4\x48\x82\x02\xff\xe0\x60\x02\x7c\x14\
-\xfc\x7e\x32\x9b\x3e\x93\x5e\x65\x6c\xab\x30\x5a\xd5\x91\x93\x97\
-\x97\xcb\x81\x03\x07\xcb\x1d\xe3\xf6\xfa\x9f\x3e\x7d\xda\x91\xed\
-\x52\xa5\x52\xe1\xed\xed\xed\xb6\xe6\x9c\xdd\x36\xfb\x29\xdc\x9a\
-\x35\x6b\xee\x1a\x5d\x10\x1b\x1b\x4b\xeb\xd6\xad\xed\xbd\x86\x26\
-\x2c\x92\x40\xb5\x08\x36\x2d\xb6\x22\x81\xb6\x4f\x4c\x67\xcc\xa8\
-\x07\x89\x8b\x55\x91\x97\x9b\xcb\xcf\xbf\xfc\xe2\x68\xbf\xf2\x48\
-\xd2\xc5\x8b\x17\xa9\x56\xad\x9a\xe3\x33\xfb\x3a\xe5\xaa\x7d\x0a\
-\x85\xa2\xcc\xb3\x09\x09\x09\x7c\xff\xfd\xf7\x77\x15\x8b\xef\xda\
-\xb5\x2b\x91\x77\xe4\x63\xe4\xa2\x88\xa0\x50\xe3\x1f\x18\x8a\xaf\
-\xfc\x3c\x37\x6d\xf7\x31\x76\xcc\x13\x34\x88\x6d\x4f\x00\x70\xfd\
-\xfa\x75\x8e\x1e\x3d\x5a\x21\xc9\x14\x04\x81\x84\x84\x04\xc7\xfc\
-\xf0\xf2\xf2\x72\xdb\x36\x6f\x6f\x6f\x47\xb6\x5a\x85\x42\xc1\xc1\
-\x83\x07\xff\x12\x62\x6a\x36\x9b\x89\x8b\x8b\xa3\x55\xab\x56\x9e\
-\xd3\x42\x0f\x3c\xf0\x90\xc0\x7b\x0f\xed\xda\xb5\x03\xc0\xd7\xd7\
-\x97\xda\xb5\x6b\x7b\x1a\xc4\x83\x7f\x3c\x32\x32\x32\xc8\xc8\xc8\
-\x28\xf3\x72\xcf\xc9\xc9\x29\x73\xfa\x23\x08\x82\xdb\xf7\xaf\xfe\
-\xfc\x52\x37\x18\x0c\x24\x27\x27\x57\xf8\x8c\xd9\x6c\xc6\x66\xb3\
-\x71\xf4\xf7\xb3\xfc\x7e\x2d\x95\x49\xc3\x1e\xa6\x4b\xbb\xa6\x24\
-\xc9\x40\x90\xa9\xa9\x5b\xbb\x06\x29\x57\x0f\xf2\xdd\xa5\xab\x68\
-\xa6\x3c\x47\x71\xb1\x96\xa4\xa4\xa4\x32\x82\xe9\x7f\x86\x5d\x74\
-\xbc\x2a\x77\xa1\xff\x2c\xf4\xad\xd3\xe9\xb8\x7e\xfd\x7a\x85\xc2\
-\xdc\x36\x9b\x84\xcd\x62\xe4\xfc\xfa\xcf\x59\x7f\x2c\x81\x86\x23\
-\xde\xa6\x63\xaf\xce\xfc\xfe\xa5\x16\x82\xa3\xa8\x1f\x7c\x9e\xa2\
-\xfc\xab\xbc\x3e\xff\x02\xdf\x2c\x9f\x47\x71\xb1\x96\xc4\xc4\xc4\
-\x72\xef\x53\xda\x43\x25\x4b\x87\x6b\x56\x85\x58\xfc\x9f\x6d\xcb\
-\xca\xca\x22\x21\x21\xa1\x5c\xdb\xac\x56\x6b\x89\x90\xbc\x45\xcb\
-\xc1\xaf\xdf\x61\x57\x41\x34\xa3\xa7\x8c\xe2\xfe\x7a\xd1\x9c\xc7\
-\x06\xaa\x5a\x74\xaa\x7f\x83\xbd\xfb\x7f\x43\x38\x9d\xcc\x94\x29\
-\x23\xc8\xc9\xc9\xbe\xeb\x58\x28\x28\x28\x70\xc8\x54\xd8\xeb\xe5\
-\xae\x58\xfc\x9f\xc7\x74\x61\x61\x21\x49\x49\x49\xe5\x86\xbc\x5a\
-\xad\x56\x7c\x7c\x7d\xd1\xa6\x9e\x67\xe5\xe7\xdf\xa0\x6a\x3f\x95\
-\xf1\x5d\x5b\xd1\xa3\x69\x18\x9f\xe9\x6d\x44\xc5\xd7\x20\x22\xa5\
-\x98\x43\x9f\xbd\xc3\x35\xcb\x42\x66\x74\x8a\x22\x33\x33\xb3\xc2\
-\x31\xa9\x50\x28\xc8\xcb\xcb\x2b\xb7\xcd\xab\x02\x56\xab\x95\xec\
-\xec\x6c\x07\x81\xfe\x3b\x18\x8d\x46\x6a\xd7\xae\x03\x05\x57\xd9\
-\xf8\xe9\x57\x5c\xf1\x6f\xc6\xe4\x89\x43\x68\x57\xaf\x3a\x82\xc9\
-\x84\x5f\xab\x1e\xc4\x25\x5e\x62\xe7\xda\x1f\x38\xa2\x9d\xc3\xa4\
-\xfb\x54\x64\x64\x64\x90\x9b\x9b\x5b\x21\x99\xd0\x6a\xb5\x65\x4e\
-\xcc\x2a\x9a\x9b\x95\x81\x4c\x26\x2b\xd3\x6f\x16\x8b\x85\xb4\xb4\
-\xb4\x0a\xcb\x15\x04\x81\xf0\x88\x10\xb2\x2e\x1f\xe6\xf3\x55\xdb\
-\x68\x35\x6a\x0e\x0f\x36\x8e\xe0\x4b\xb3\x0d\x44\x1f\xaa\xd7\x88\
-\x27\xac\xf0\x3c\x6f\xcf\xbb\x86\x6f\x8f\xe1\xbc\xf3\x90\x3f\xc9\
-\xc9\xc9\x15\x86\x3e\x2b\x14\x0a\x8c\x46\x63\x19\xdb\xdd\xb5\xad\
-\xf4\xf3\x92\x24\x61\x32\x99\xc8\xca\xca\x2a\x99\x4f\xe5\x40\x92\
-\x24\x4c\x56\x48\xdf\xbb\x82\xc5\xbf\xa4\x33\x70\xcc\x34\x3a\x0c\
-\x18\x42\x52\xd1\x46\xac\x7a\x05\x2d\xba\x34\x44\x77\xe3\x32\x4b\
-\x96\xad\x47\xbd\x63\x15\x2a\x7d\x31\x29\x29\x29\x15\xd6\x43\xa9\
-\x54\x62\x36\x9b\x51\xab\xd5\x55\xd6\x6f\xf6\xe7\xed\x77\x3a\x8b\
-\x8b\x8b\x49\x4d\x4d\x2d\xd3\xc6\x26\x93\x89\xd0\xd0\x50\xb7\xef\
-\x68\x7b\xe0\x81\x87\x04\x7a\xf0\x7f\x02\x2f\x2f\x2f\x62\x62\x62\
-\x88\x8c\x8c\x24\x3e\x3e\xde\xd3\x20\x1e\xfc\xa3\x21\x8a\x22\x4f\
-\x3d\xf5\xd4\xdf\xfe\xee\x93\x4f\x3e\x71\xfc\x9b\x9c\x9c\x1c\x4e\
-\x9d\x3a\x85\x4a\xa5\x2a\xf7\x04\xe8\x6e\x0e\xc0\x91\x23\x47\x1c\
-\xc4\xc1\x64\x32\xf1\xe0\x83\x0f\x32\x7d\xfa\xf4\x4a\x3d\xef\xef\
-\xef\x4b\xad\xa8\x30\x44\xc0\x6c\xb1\x02\x02\x98\xcd\x84\xb7\x7c\
-\x84\xe1\xed\xfd\x59\xf1\xc1\xb7\x64\x65\xe4\x70\x5f\xab\xd6\xb4\
-\x6a\xd5\xba\xc2\xb2\x72\x73\x73\xd9\xb5\x6b\x17\x16\x8b\xc5\x21\
-\xa7\x90\x98\x98\xe8\x72\x72\x10\x95\xaa\xc4\x19\xb6\x3b\x2e\x26\
-\x93\x89\xae\x5d\xbb\x32\x6d\xda\xb4\x4a\x3c\x2d\x91\x1f\x51\x8b\
-\xb8\x7a\x3e\x54\xf3\x13\x30\x6a\xcd\x20\x40\x46\xa6\x8e\x56\x83\
-\xc6\xd0\x2a\x4c\xc9\xc5\x51\x23\x29\x36\x40\xf3\xe6\x2d\x68\xde\
-\xbc\xc5\x5d\x89\xd2\x92\x25\x4b\x1c\x3f\x67\x67\x67\x73\xea\xd4\
-\x29\x97\xf4\xbd\x24\x49\x22\x28\x28\x88\x93\x27\x4f\x96\xb9\x0b\
-\xd8\xb7\x6f\x5f\x46\x8e\x1c\x79\xf7\xe7\x4d\xc5\x04\xd5\x8c\x25\
-\x4e\x1b\x86\x5a\x06\x26\x8b\x15\x41\x26\x50\x94\x9c\x49\xf3\x31\
-\x2f\x33\xd8\x2f\x91\x65\xdf\x6d\xa2\xc0\x28\x31\x78\xf0\xa3\x77\
-\x2d\x2f\x2b\x2b\x8b\xf7\xdf\x7f\xdf\x41\x04\x6e\xdd\xba\xc5\xa5\
-\x4b\x97\x5c\x26\x4c\x56\xab\x95\xeb\xd7\xaf\x3b\x08\x85\x20\x08\
-\x4c\x98\x30\x81\xea\xd5\xab\xdf\xf5\x59\x5d\xf6\x2d\x6a\xd5\xad\
-\x87\x32\xa4\xe4\xf4\xc9\x6c\xb1\x21\xb3\xe8\xc8\x14\x42\x18\x3c\
-\xe9\x39\xfc\x7f\x7d\x9b\x09\xa9\x5a\x44\xb9\x82\x61\xc3\x86\xdd\
-\xb5\xbc\x75\xeb\xd6\x71\xe0\xc0\x01\xc7\xcf\x89\x89\x89\x24\x24\
-\x24\xb8\x24\x16\x2f\x49\x12\xe1\xe1\xe1\xe4\xe5\xe5\x39\x4e\x6f\
-\x83\x83\x83\x99\x38\x71\x62\xe5\x36\x2e\x75\x29\x44\xd4\xa9\x87\
-\xc5\x27\x12\x39\x60\xb6\xda\xf0\xa3\x88\x73\x09\x35\x78\xf5\xe5\
-\x51\xe8\x76\xbd\xc7\xf3\xa7\x92\xd1\xf4\x68\xcb\xb8\x71\xe3\xee\
-\x5a\xdc\xa1\x43\x87\xd8\xb6\x6d\x1b\xa2\x28\x3a\x44\xc7\xc3\xc3\
-\xc3\x5d\x5e\xb3\x74\x3a\x1d\x97\x2f\x5f\xa6\x73\xe7\xce\x58\xad\
-\x56\xea\xd4\xa9\xc3\xcb\x2f\xbf\x5c\xa9\xb9\x9b\x7d\xeb\x2c\x75\
-\xe2\xe3\x09\x0f\x50\x60\xb6\xd8\x4a\xee\xd9\xea\xf4\x18\x7c\x62\
-\x98\x31\x77\x0a\x4b\x46\xbf\xc0\x97\x07\x93\x09\x1d\x19\xcf\x8b\
-\x2f\xbe\x78\xd7\xf2\x12\x13\x13\xc9\xc8\xc8\x70\xfc\x7c\xe1\xc2\
-\x05\xb7\xc4\xe2\xf3\xf2\xf2\xca\xac\xaf\xf5\xea\xd5\xe3\xd9\x67\
-\x9f\xad\xd4\xf3\xf9\x79\x35\xa9\x5f\x4f\x43\xa0\x5a\x06\x56\x1d\
-\x56\x41\x86\xf5\xc6\x25\x0c\xcd\xc6\xf2\xdc\x80\x28\xd8\x50\x8f\
-\x83\x39\xf0\x6c\xe3\xa6\xd4\x6f\xdc\xf4\xae\xe5\x1d\x38\x70\x80\
-\xe4\xe4\x64\x44\x51\x24\x3b\x3b\x9b\x73\xe7\xce\x51\x5c\x5c\xec\
-\xb2\x58\x7c\x52\x52\x12\x5a\xad\x16\x51\x14\x31\x1a\x8d\x0c\x1e\
-\x3c\x98\xa1\x43\x87\x7a\x5e\xc2\x1e\x78\xe0\x21\x81\xff\x1c\x78\
-\x7b\x7b\xd3\xa9\x53\x27\x74\x3a\x5d\x99\x30\x10\x0f\x3c\xf8\x5f\
-\x83\x7d\xc7\x56\x92\x24\xf2\xf3\xf3\x19\x3d\x7a\xb4\x43\xe8\xd7\
-\x15\x27\x40\xaf\xd7\x63\x36\x9b\xb1\x5a\xad\x0e\x47\xa0\xb2\x62\
-\xf1\xf5\xe2\x62\xa8\x17\x77\xc7\x79\x37\xea\xd1\x9b\xad\xa0\x90\
-\xd8\xf3\xc1\x53\x4c\x9c\x00\xfd\x47\x3e\xcf\xe0\xba\x95\xcb\xf1\
-\x6e\x34\x1a\x1d\x8e\x8c\xd9\x6c\x26\x27\x27\x87\x66\xcd\x9a\xb9\
-\x2c\x7f\x60\xdf\xd5\xb6\x0b\xb5\xdb\x85\x91\x2b\xf9\x34\xd1\x1d\
-\x1e\x21\xba\x3d\x20\x58\xb9\x7c\xdc\x88\x56\x67\x21\x3a\x12\x5e\
-\x7d\xac\x2f\x57\xb2\x92\x89\xed\x3d\x9f\xb0\x4a\x4a\xce\x15\x17\
-\x17\x3b\xfa\xc7\x68\x34\x72\xe6\xcc\x19\x3a\x75\xea\xe4\x32\x51\
-\xb2\x3b\xee\x01\x01\x01\x65\x48\x6e\xa5\x2c\x53\xfa\xd0\xa0\xfb\
-\x30\x1a\xd8\xdb\x5d\x5b\x8c\xde\x64\xc3\xa7\xb6\x1f\x9f\xb6\x8c\
-\x66\x5e\xad\x66\x3c\xf5\xd4\x54\x6a\xaa\x84\x4a\xf7\x9b\x7d\x5c\
-\x8a\xa2\xc8\x97\x5f\x7e\xc9\x86\x0d\x1b\xdc\x1a\xdf\x85\x85\x85\
-\x0c\x1a\x34\xc8\x61\x5b\x71\x71\x71\xa5\x9e\x55\x87\xd4\xa6\xdf\
-\xb0\x3f\x08\x95\xc5\x50\x84\x16\x3f\xc2\xb2\x7f\x67\xf8\x98\x51\
-\xdc\xa6\x36\x5f\x6c\x9c\x58\xe9\xba\x18\x8d\xc6\x32\xf3\x6a\xe9\
-\xd2\xa5\x7c\xfe\xf9\xe7\x2e\x9f\x88\xc8\x64\x32\x72\x73\x73\x31\
-\x9b\xcd\x8e\xd3\xbf\x8a\x4e\x93\xca\x1a\x17\x45\xbb\xc1\x4f\xda\
-\x2d\xc3\x50\x5c\x4c\xb1\xcd\x87\x56\xc1\x3b\xa9\x1e\xb1\x84\x26\
-\x2d\x5b\xf2\xc6\x67\x93\x9d\x22\x6d\xf6\x75\xc4\x64\x32\x31\x75\
-\xea\x54\x7c\x7d\x7d\xdd\xee\x37\xfb\x98\xb6\x58\x2c\xe8\xf5\x7a\
-\xc7\xa9\x55\x45\x08\xa9\xdd\x84\x21\xb5\x9b\x00\x90\x61\x2c\xa2\
-\x08\x09\xd4\x2a\x72\xce\xaf\x23\xfe\xf1\xd1\xd4\x1f\xf3\x26\x6f\
-\x4f\x6c\xe7\x54\xbf\xc1\x1f\xc2\xea\xee\xcc\x35\xfb\xc6\x84\x5d\
-\x47\x51\x10\x04\xa7\xa4\x14\x02\x1a\x3f\xc4\x58\xbb\x22\x8c\xa9\
-\x08\xa3\x4e\x8b\x58\xe7\x3e\x72\xc6\x3d\x48\xbd\x97\x45\x42\xbb\
-\xcc\x62\xbf\x13\xdc\xdb\xbe\x49\x26\x93\xc9\x48\x4e\x4e\x66\xc0\
-\x80\x01\x6e\x85\x68\x96\x1e\x8b\xf6\xf7\x81\x47\x2c\xde\x03\x0f\
-\x3c\x24\xf0\x9f\xd5\x11\x72\x39\x91\x91\x91\xdc\xbc\x79\xb3\xca\
-\x43\x76\x3c\xf0\xe0\x5e\xc4\x03\x0f\x3c\xc0\x82\x05\x0b\xaa\x44\
-\x1e\x40\x2e\x97\xd3\xa8\x51\x23\xf6\xee\xdd\xeb\x72\x19\xcd\xc6\
-\xcc\xa1\x29\x02\x92\x00\x73\x57\x1d\xe6\x85\x42\x1d\x81\xa1\xce\
-\x6b\xb3\x99\x4c\x26\xc6\x8e\x1d\x4b\xd7\xae\x5d\xab\x4c\x22\x22\
-\x2c\x2c\xcc\xb5\xb2\x04\x00\x19\xf1\x2d\x1f\xe3\x93\x16\x80\x28\
-\xf0\xcd\xc6\xef\x48\x2b\xd6\x10\xee\xef\xdc\xf2\x6f\x27\xa1\x53\
-\xa7\x4e\xa5\x7b\xf7\xee\x6e\x87\x71\x41\x49\xf8\x7b\x50\x50\x90\
-\xcb\x02\xe6\x12\xf0\xe8\xe7\xdf\x81\x20\x80\xd0\x81\x5f\x2e\x5f\
-\xa6\x20\xdf\x42\x48\x98\xc6\xa9\x72\x6c\x36\x1b\x1a\x8d\x86\x69\
-\xd3\xa6\xd1\xbf\x7f\x7f\xb7\xd7\x60\xab\xd5\x4a\x9b\x36\x6d\x38\
-\x76\xec\x98\x3b\x9d\x4f\xcb\xd9\xbb\xf9\x14\x11\x51\x78\x9a\x9f\
-\x5b\x0f\x41\xe6\xa3\x41\xe1\x42\x06\x5c\xad\x56\xcb\x9b\x6f\xbe\
-\x59\x25\x29\xf4\xad\x56\x2b\xcd\x9b\x37\x27\x2b\x2b\xcb\x2d\xd7\
-\xe3\xa9\xf7\x3f\x01\x51\x40\x88\x5d\x4d\xee\xd0\x0c\x8c\x3e\x11\
-\xa8\x45\xe7\xeb\x12\x1d\x1d\xcd\x5b\x6f\xbd\xe5\x08\xeb\x75\x07\
-\x82\x20\xd0\xab\x57\x2f\xd7\xfb\x4d\x92\x08\x9f\xba\x87\xbd\x94\
-\x84\x17\x3f\xf2\xc2\xe7\x3c\x38\xd9\x8a\x42\xa1\x42\x29\x77\x8e\
-\x94\x98\xcd\x66\xea\xd6\xad\xcb\xfc\xf9\xf3\xdd\xbe\xc7\x26\x08\
-\x02\x45\x45\x45\x44\x47\x47\xbb\xa5\xc9\x89\x32\x9c\x31\xe3\xc7\
-\x23\x08\x02\x6f\xec\xbc\xc0\x73\x79\x3a\x82\x02\x7d\x11\x24\xfb\
-\x5a\x53\x79\x34\x6f\xde\x9c\xb7\xdf\x7e\xbb\x4a\xd6\x11\x2f\x2f\
-\x2f\x9a\x34\x69\xc2\xea\xd5\xab\x3d\x2f\x56\x0f\x3c\xf0\x90\xc0\
-\xbb\x43\xaf\xd7\xbb\xec\x78\xfc\x5f\xc0\xbe\x9b\x25\x97\xcb\x31\
-\x18\x0c\xf7\x54\xdd\x44\x51\xac\xd4\x6e\xa8\x07\x1e\x38\x83\xd0\
-\xd0\x50\x66\xcc\x98\x51\x65\xe5\x65\x64\x64\xb8\x14\xe6\x56\xda\
-\x51\xb2\xfb\x31\x4a\x2f\x25\xca\x50\xe7\x75\xf0\x24\x49\xc2\x6c\
-\x36\xf3\xc8\x23\x8f\x54\xe9\x4e\xf4\xcd\x9b\x37\xdd\x76\x02\x1d\
-\xd5\x51\x04\x11\xe9\xa2\xee\xb8\xc9\x64\xa2\x5f\xbf\x7e\x65\x93\
-\xb3\xb8\x89\x8b\x17\x2f\x96\x49\x80\xe3\x34\xc7\x2d\xe5\xf8\x2b\
-\x94\xde\x84\xb8\xa0\xae\x63\xb3\xd9\x50\xab\xd5\x0c\x1a\x34\xa8\
-\x4a\xc7\xf8\xe9\xd3\xa7\x5d\xdf\x08\x10\x04\x4a\xfe\x2b\x81\x77\
-\x50\x88\xcb\x7d\xaf\xd5\x6a\x79\xe5\x95\x57\xaa\xd4\xb6\x55\xab\
-\x56\xb9\xb5\xc9\x21\xd8\xfb\x4d\x00\x99\x26\x02\x57\xde\x30\x56\
-\xab\x95\x88\x88\x08\x26\x4c\x98\x50\xe5\xef\x63\x57\xfb\x0c\x84\
-\x3b\x69\xd7\x05\x40\x89\xaf\xb7\xeb\x64\x3b\x2c\x2c\x8c\x97\x5f\
-\x7e\xf9\x9e\x5a\xb7\xff\xb8\x87\x29\x12\x1c\xe4\xda\xc9\xab\x24\
-\x49\x68\x34\x1a\x66\xce\x9c\x59\x65\xf5\x2a\x2c\x2c\x74\xbd\xdf\
-\x3c\xf0\xc0\x43\x02\xff\x1d\xc8\xcd\xcd\xe5\xb7\xdf\x7e\x63\xd3\
-\xa6\x4d\x24\x24\x24\xdc\x53\x17\x85\x8b\x8a\x8a\xb0\x58\x2c\x55\
-\xea\x60\x55\xc5\x82\x1f\x11\x11\xc1\xb0\x61\xc3\x68\xd9\xb2\x65\
-\x99\x34\xd3\x1e\x78\xe0\xae\xa3\x75\xf4\xe8\x51\x6c\x36\x9b\x5b\
-\xbb\xd3\xa2\x28\xa2\x54\x2a\x51\xa9\x54\x55\xb2\xab\xec\x2e\x64\
-\x32\x19\x17\x2e\x5c\xa0\xb0\xb0\xb0\xd2\x21\x8e\x15\xd9\xa6\x52\
-\xa9\xee\x99\x4d\x18\xb9\x5c\xce\xb5\x6b\xd7\x48\x4b\x4b\x43\x92\
-\x24\xb7\xd6\x4f\xb9\x5c\x8e\x4a\xa5\x72\x3b\x11\x4b\x55\xad\x73\
-\x26\x93\x89\x4b\x97\x2e\x91\x95\x95\xe5\xde\x69\xc9\x9d\x7e\xab\
-\x5d\xbb\xb6\x53\x61\x77\xff\x97\x50\x2a\x95\xec\xdb\xb7\x0f\x51\
-\x14\xdd\xde\x60\x94\xc9\x64\x44\x44\x44\xdc\x13\xe1\x76\xa2\x28\
-\x52\x54\x54\xc4\xcd\x9b\x37\x1d\xe1\x8e\xee\x40\xa1\x50\xd0\xa4\
-\x49\x93\x2a\x89\x4e\xa8\x0a\xdb\x0a\x0b\x0b\x39\x71\xe2\x84\xdb\
-\x73\xcd\x1e\x2e\xd9\xbe\x7d\xfb\x7b\xea\x1d\xb0\x7f\xff\xfe\x2a\
-\xb1\xcd\xdb\xdb\x9b\xd0\xd0\x50\x4f\x14\x95\x07\x1e\x78\x48\x60\
-\xf9\xb8\x7a\xf5\x2a\x33\x67\xce\x64\xe3\xc6\x8d\x68\x34\x1a\xaa\
-\x55\xab\x76\x4f\xc5\x8d\xdb\x17\xb0\xca\xde\x1f\xf9\xff\x85\x93\
-\x27\x4f\xb2\x6a\xd5\x2a\xfa\xf4\xe9\xc3\xc2\x85\x0b\x69\xd0\xa0\
-\x81\x67\xe6\x78\xe0\x36\xb6\x6d\xdb\xc6\xc0\x81\x03\x09\x08\x08\
-\xc0\xcf\xcf\xcf\x25\xc7\xdb\x1e\xe6\x94\x9f\x9f\xcf\xbc\x79\xf3\
-\xd0\x68\x34\x2e\xd4\xe4\x4e\x2c\x53\x4e\x12\xe7\x2d\x41\x34\x0a\
-\xf7\x26\xf5\xe2\x11\xf6\x9c\x49\xa5\x71\xdb\x8e\x34\xae\x1d\x56\
-\xe9\x48\x27\xbb\x43\x32\x63\xc6\x0c\x7e\xfa\xe9\x27\x6a\xd5\xaa\
-\xe5\x32\x11\xb0\xdf\xbf\x2a\x2a\x2a\x62\xfb\xf6\xed\x6e\xad\x55\
-\x56\xab\x96\x4b\x17\x73\x68\xd4\x38\x9a\xeb\x27\xf6\x72\xec\x4a\
-\x3a\x0d\xdb\xf7\xa6\x69\xcd\xca\xb7\x97\x5d\x76\x60\xc2\x84\x09\
-\xec\xd9\xb3\x87\xc8\xc8\x48\xe4\x72\xb9\x4b\x0e\x9c\x52\xa9\xe4\
-\xe6\xcd\x9b\xf8\xfb\xfb\xb3\x7a\xf5\x6a\x97\xcb\x01\x28\xba\x74\
-\x86\x94\x88\x7a\xd4\x0b\x54\x72\x63\xff\x56\x8e\x64\xc9\x68\xd7\
-\xbe\x23\x31\xe1\x1a\xa7\xda\x3a\x2f\x2f\x8f\x27\x9f\x7c\x92\xe3\
-\xc7\x8f\x57\x2a\x89\x4b\x45\x48\x4e\x4e\x66\xd0\xa0\x41\xd4\xaf\
-\x5f\xdf\xbd\x77\x4c\xea\x31\x8e\x5b\x5b\xd1\x2a\x22\x97\xdf\x76\
-\xef\x23\xc1\x16\x41\xbf\x07\xdb\xa2\x56\xca\x9c\xea\xb7\xe0\xe0\
-\x60\x3a\x77\xee\x8c\x5a\xad\x26\x24\x24\xc4\x65\x92\x6b\xef\xb7\
-\xc7\x1f\x7f\x9c\x7e\xfd\xfa\xb9\x65\x5b\xce\xd5\x8b\xe8\xc3\xa3\
-\xa9\xae\xd1\xb2\x63\xfd\x4e\x0c\x21\x0d\xe9\xd9\xad\x05\x2a\x27\
-\x37\x12\x2e\x5e\xbc\x48\xcf\x9e\x3d\x1d\xf2\x1e\xae\x42\x92\x24\
-\x52\x52\x52\x78\xf7\xdd\x77\x1d\x52\x1a\x2e\xad\x24\x99\xc7\xd8\
-\x97\xdf\x84\x4e\x71\x2a\xb4\x59\x37\xd9\xf3\x9f\xc3\x04\x36\xeb\
-\x4a\xb3\x06\xd5\xf0\x75\xb2\xad\xcf\x9f\x3f\x4f\x8f\x1e\x3d\x88\
-\x8a\x8a\x2a\x93\xc1\xd6\xd9\x35\xd2\x6a\xb5\x92\x9a\x9a\xca\x85\
-\x0b\x17\xdc\xf6\x79\xb2\xd3\x53\x50\xf8\x45\x20\x66\xfc\xc6\xd6\
-\x7d\xb7\xa9\xd1\xa1\x1f\x1d\xea\xf8\x39\x5d\xa7\xfd\xfb\xf7\xd3\
-\xa9\x53\x27\xc2\xc2\xc2\xf0\xf2\xf2\x72\x79\xfe\x1b\x8d\x46\x72\
-\x73\x73\x59\xb9\x72\xe5\xdf\xca\xdc\x78\xe0\x81\x07\x1e\x12\x88\
-\xd5\x6a\x65\xec\xd8\xb1\x1c\x38\x70\x80\x27\x9e\x78\x82\xf1\xe3\
-\xc7\x13\x18\x18\xe8\xb9\x3c\x5c\x09\xe4\xe6\xe6\xb2\x6e\xdd\x3a\
-\x3e\xfc\xf0\x43\x0a\x0a\x0a\xd8\xb0\x61\x03\x21\x21\x21\x9e\x86\
-\xf1\xc0\x6d\x84\x84\x84\xf0\xfe\xfb\xef\xd3\xb4\x69\x53\x97\x42\
-\x79\xe4\x72\x39\x67\xce\x9c\x61\xec\xd8\xb1\x8e\x4d\x14\xe7\x35\
-\xde\x04\xcc\x37\x76\x33\x71\xd2\xab\xf8\x3d\xb7\x8a\xa5\x9d\xfd\
-\xd8\xbc\xe5\x67\x7c\xc2\xab\x71\x60\xd7\xcf\x04\x3d\x3a\x8c\xea\
-\x01\x77\x5f\x2a\xed\xda\x54\x92\x24\x21\x97\xcb\x09\x0a\x0a\x62\
-\xeb\xd6\xad\x2e\x93\x40\x2f\x2f\x2f\xbe\xfb\xee\x3b\x16\x2c\x58\
-\xe0\x28\xd7\x95\x13\x0a\x5d\xde\x4d\xe6\x3c\x33\x81\xdc\x3a\xcf\
-\xb0\x3c\x32\x9f\x35\xfb\x6e\xd0\xac\xa6\x8c\xd5\xdf\x7c\x47\xfc\
-\xec\xf1\x95\x72\xba\x95\x4a\xa5\x63\xad\xf4\xf2\xf2\xa2\x59\xb3\
-\x66\x2c\x5f\xbe\x1c\x95\x4a\xe5\x12\xa1\xf0\xf5\xf5\x65\xce\x9c\
-\x39\xfc\xf2\xcb\x2f\x65\x74\x10\x9d\xc5\xad\xa3\x9b\x79\x7e\xfc\
-\x1b\xdc\xbf\xea\x17\xea\xe9\xcf\xf2\xda\x9a\x73\xf4\xec\x52\x83\
-\x3d\x7b\xf6\x13\xf5\x78\x6f\x2a\x73\x03\xae\xf4\x7d\x2b\xb9\x5c\
-\xce\x88\x11\x23\x98\x36\x6d\x9a\xcb\xa7\x0a\x36\x9b\x8d\x65\xcb\
-\x96\x91\x9f\x9f\xff\xb7\xdf\x51\x59\x9c\xdd\xbe\x8c\xd7\x16\x7c\
-\x45\xab\xb7\x7f\xc3\xf7\xc2\x7f\x38\x70\xbd\x08\x4b\xca\x49\xb6\
-\xd6\xa9\xcb\x63\xf1\xe1\x95\x9e\x1f\x76\x82\x03\x30\x61\xc2\x04\
-\xc6\x8f\x1f\xef\x72\xd8\x74\x50\x50\x10\xf7\xdf\x7f\xbf\x83\xb4\
-\x0b\x82\xe0\xbc\x6d\x92\x8e\xe3\x3f\x7d\xcd\xcc\xb9\x9b\x78\x76\
-\xfd\x6a\xf2\x56\xbd\xcc\x06\xf3\x60\xda\x25\x6d\x61\x5d\x40\x2c\
-\x4f\xb6\xac\x1c\x79\x2f\xfd\xbd\xc1\xc1\xc1\x4c\x9f\x3e\xdd\xad\
-\x93\x2e\x9d\x4e\xc7\xe4\xc9\x93\x1d\xf3\xd5\x1e\x61\xe0\x14\xb9\
-\xb1\xa4\x32\x65\xc4\x08\xf2\x9f\x3c\x42\xa7\xb8\x62\x8e\xec\xf8\
-\x9e\xd3\xc9\x32\x32\xaf\xfe\xcc\xee\x0e\x83\x99\xdb\xad\x72\x64\
-\xa9\x74\x66\x59\x80\xb5\x6b\xd7\xa2\xd1\x68\x5c\xce\x0e\x9a\x9f\
-\x9f\x4f\xdf\xbe\x7d\xef\x84\x85\xbb\x22\xef\x22\x51\x90\x79\x81\
-\x95\xf3\x5e\x63\x5f\x71\x6d\xde\x5e\xf0\x18\x1b\xe7\xad\xa3\xd6\
-\xe0\xb6\x7c\x37\x67\x29\x35\x57\xcf\x25\xba\x92\x25\x95\x4e\xbc\
-\x13\x1d\x1d\xcd\xc7\x1f\x7f\x4c\x8d\x1a\x35\x5c\xce\x0e\x9a\x9c\
-\x9c\xcc\xc8\x91\x23\xcb\xac\xbd\x1e\xbf\xce\x03\x0f\x3c\x24\xb0\
-\x0c\x76\xec\xd8\xc1\x81\x03\x07\xe8\xdc\xb9\x33\x1f\x7d\xf4\x91\
-\x47\x8c\xdd\x49\x34\x6a\xd4\x88\xdc\xdc\x5c\xd6\xac\x59\xc3\xbe\
-\x7d\xfb\x18\x30\x60\x80\x27\xf4\xc2\x83\xf2\x5d\x86\x3b\xe2\xdf\
-\xa5\xb3\xed\x41\x89\xb0\xbb\x4e\xa7\x73\x68\xd2\x69\x34\x1a\x9a\
-\x36\x6d\x4a\xc3\x86\x0d\x5d\xfe\x2e\x7b\xa6\x39\xfb\x9f\x97\x2f\
-\x5f\xe6\xd7\x5f\x7f\xbd\xeb\xa6\x50\x97\x2e\x5d\x1c\x4e\xb2\x22\
-\xb2\x1e\xed\x9b\x35\xe0\x9c\x24\x21\x49\x16\x0a\xb4\x26\x22\xe3\
-\x7d\xc8\x4b\x2a\xc2\x86\x9c\xa4\xa4\x24\x2e\x5f\xbe\x5c\x21\x09\
-\x2b\x2c\x2c\x24\x2f\x2f\xcf\x61\xaf\x4a\xa5\xa2\x51\xa3\x46\x6e\
-\xb5\x63\xcd\x9a\x35\xcb\x90\xdb\x2b\x57\xae\x70\xf4\xe8\xd1\x32\
-\x1a\x69\x7f\x26\x20\x7e\x7e\x7e\x34\x6e\xdc\xd8\xb1\x2b\xae\xf6\
-\x0f\xa1\x73\xc7\x36\x6c\xbd\x6d\xc6\x6a\xd0\x92\xab\x97\x11\x1a\
-\xaa\x41\x7b\xe4\x06\x12\x90\x9a\x92\xcc\xd9\x73\xe7\xcb\x75\x78\
-\xe5\x72\x39\x19\x19\x19\x8e\xd0\x56\x41\x10\x08\x0c\x0c\xa4\x55\
-\xab\x56\x6e\xad\x01\xf1\xf1\xf1\xec\xd8\xb1\xc3\xe1\xbc\x5d\xbe\
-\x7c\x99\xc3\x87\x0f\x97\x4b\x50\xec\xf7\xf6\xee\xbf\xff\xfe\x3f\
-\xda\xa7\x71\x33\x5a\xc7\x84\x60\x95\x00\x6b\x11\xe9\x85\x10\x10\
-\xe8\x47\x5e\x72\x31\x02\x70\xe6\xcc\x19\x87\x8e\x5d\x79\x28\x28\
-\x28\x70\x8c\x1f\xab\xd5\x4a\x4c\x4c\x0c\xcd\x9b\x37\x77\xd9\x91\
-\x94\x24\x89\xe8\xe8\x68\x87\xce\x9d\x24\x49\xec\xdf\xbf\xbf\xc2\
-\xeb\x07\x36\x9b\x8d\x90\x90\x10\x9a\x35\x6b\xe6\xf8\xac\x5a\xd3\
-\x1e\x3c\x58\x7f\x1d\xb7\x75\x56\x74\x05\x5a\x2c\x72\x35\x4a\x9b\
-\x19\xbd\xcd\x06\x36\x2b\x27\x4e\x9d\x2e\x33\xde\xfe\x0c\x95\x4a\
-\xc5\xd9\xb3\x67\xcb\x10\x87\xe8\xe8\x68\xea\xd5\xab\xe7\xd6\x98\
-\xb4\x9f\xb6\xdb\xef\x1a\x1e\x3c\x78\x90\xd4\xd4\xd4\x72\x9d\x78\
-\xb3\xd9\x4c\x9d\x3a\x75\xa8\x5b\xb7\xee\x9d\x09\xab\x26\xee\xbe\
-\x76\xb4\x89\x3d\x80\x20\xd8\x28\xce\x4e\x46\x1f\x16\x82\xaf\xc1\
-\x40\x8e\x19\x2c\x86\x62\x7e\x3f\x75\xb6\x42\x69\x15\x51\x14\x39\
-\x76\xec\x98\x63\x3e\x7a\x7b\x7b\x53\xbf\x7e\xfd\x32\xed\xe7\x2c\
-\xb4\x5a\x2d\x11\x11\x11\x58\x2c\x16\x44\x51\x08\x12\x16\xca\x00\
-\x00\x20\x00\x49\x44\x41\x54\x24\x2b\x2b\x8b\x9d\x3b\x77\xa2\x52\
-\x55\xbc\x4d\x12\x15\x15\xf5\x87\xac\x93\xbc\x1a\x3d\x1a\x05\xf0\
-\x59\xb1\x15\x6c\x56\x74\x45\x5a\x94\xca\x30\xf4\x45\x46\xf2\xcd\
-\x22\x46\x5d\x11\x07\x8f\xfc\x5e\x61\x64\x81\x20\x08\x8e\x53\x72\
-\xbb\xfd\xcd\x9b\x37\x77\x2b\x24\x5c\xab\xd5\x3a\x92\x02\x49\x92\
-\x44\x7a\x7a\x3a\xfb\xf6\xed\x2b\xb7\xcf\xec\xe3\xb4\x59\xb3\x66\
-\x04\x07\x07\x03\x02\x7e\x01\xd5\x69\xdf\x7f\x30\xd9\xbf\x25\x21\
-\x93\xb4\x64\xa6\x6b\x69\x51\x3d\x80\xc2\xf4\x7c\x24\x20\x33\x35\
-\x95\xf3\x97\x2f\xdf\x75\xad\xb6\x6b\xc7\x4a\x92\x84\xbf\xbf\x3f\
-\x4d\x9a\x34\x71\xeb\xe4\x3d\x38\x38\xf8\x8f\x75\x5c\xa1\xe0\xcc\
-\x99\x33\xec\xde\xbd\xbb\xcc\xd8\xb1\x58\x2c\x54\xaf\x5e\x9d\xf8\
-\xf8\xf8\x7b\x22\xd4\xd7\x03\x0f\x3c\x24\xf0\xff\x33\x76\xed\xda\
-\x85\x28\x8a\xf4\xea\xd5\xcb\x43\x00\x5d\x40\x60\x60\x20\x3d\x7a\
-\xf4\x60\xcd\x9a\x35\x1c\x38\x70\x80\x7e\xfd\xfa\x79\x48\xa0\x07\
-\x15\x3a\xc2\x99\x99\x99\x7f\x11\x7c\xd6\x68\x34\x7f\x39\xf1\x73\
-\xf7\x8e\x52\xe9\xe7\xed\xf7\x68\x52\x53\x53\xcb\x38\x33\x7f\x76\
-\x44\x4a\x64\x17\x6c\xfc\xbc\xeb\x20\xbb\xcf\x24\x30\x7f\xfa\x70\
-\x5a\x37\x8e\xe3\xaa\x5c\x40\x90\xc9\xb1\xe6\x5c\xe6\x9b\xef\xae\
-\x53\x3d\xb6\x03\x5e\x5e\x90\x9b\x56\x44\x4a\x4a\x4a\xb9\x61\x8b\
-\x76\x21\x77\x7b\x82\xa7\xaa\x42\x69\x07\xde\x7e\xff\x29\x25\x25\
-\xa5\xdc\x90\x71\x9b\xcd\x86\xc9\x64\x46\x92\x4c\x1c\x59\x36\x8b\
-\x65\x3b\x2f\xd1\x66\xc6\x8f\x0c\xec\xda\x9a\x5f\xbf\x32\xa0\x0a\
-\xd4\xa0\xbb\x7a\x94\x35\xb7\xd2\x49\x50\x76\x41\x0e\x68\x8b\x8b\
-\x49\x4a\x4a\xc2\xdb\xdb\xfb\x6f\x6d\x53\x28\x14\x64\x67\x67\x97\
-\x69\x67\x49\x92\x1c\x92\x1c\x55\x61\x9b\x9d\x44\xa7\xa4\xa4\x54\
-\x48\x02\xfd\xfd\xfd\xc1\x5a\xc4\xd6\x37\x27\xb1\x36\xbb\x3e\x2f\
-\xbf\xfd\x0a\x4d\xa2\xa3\xb8\x84\x04\x9a\x50\xbc\xae\xfd\xcc\xca\
-\x0d\xc9\x34\x6c\xd0\x15\x01\xc8\xcd\xc9\x71\xdc\x5f\x2c\x0f\x7a\
-\xbd\xde\x71\x42\x62\xff\x1e\xab\xd5\xea\xf2\xfd\x52\xab\xd5\xea\
-\x48\x57\x6f\x47\x56\x56\x16\x4a\xa5\xb2\xdc\xb1\x6e\xb3\xd9\x50\
-\x28\x95\xe4\xdf\x3c\xcc\x1b\xaf\x2d\x44\xdd\xf7\x5d\xde\x18\x1c\
-\xcf\xfd\x71\x41\x5c\x31\xcb\x08\x09\x84\x73\x9b\xb6\x93\x98\x90\
-\xc7\xf8\x61\x02\x48\x12\xd9\xd9\xd9\xa4\xa5\xa5\x95\xeb\xd4\x7a\
-\x7b\x7b\x93\x9f\x9f\x5f\xc6\x76\x77\xef\x3a\xfe\x19\x16\x8b\x85\
-\xcc\xcc\x4c\x54\x2a\x55\xb9\x27\xde\x66\xb3\x99\xd0\xf0\x48\x28\
-\x38\xcb\xa7\x33\xde\xe0\x54\x70\x7b\xde\x7c\x6b\x2a\x8d\x6b\x45\
-\x20\x58\x6c\x84\xd5\x0e\xe7\xf8\x8a\x4f\xb0\x55\x2b\xe6\xe1\x6e\
-\x22\x26\xb3\x99\xcc\xcc\x4c\x0a\x0b\x0b\xcb\xfd\x5e\x99\x4c\x46\
-\x4e\x4e\x8e\x63\xfc\x49\x92\xe4\xb6\x6d\xa5\xfb\xcd\xae\xf3\x99\
-\x96\x96\x56\xe1\x69\xa0\x20\x88\xf8\x05\xf8\x91\x78\x74\x07\x6f\
-\xbc\xf3\x05\xdd\x66\x7d\x41\xb7\xd8\x30\x3e\xb6\x4a\x20\xaa\x50\
-\xa0\x63\xcf\x0f\xdf\xa1\x6b\x30\x90\x2e\xde\x16\xac\x66\x1b\x69\
-\x7f\x12\x32\xff\xf3\x3a\x62\x0f\x71\xf7\xf7\xf7\xaf\xb2\x7e\xfb\
-\xf3\xb8\xd3\xeb\xf5\x0e\xe2\x5e\x5e\x5d\x24\x49\xa2\x69\xeb\xfb\
-\x49\xdc\x38\x8f\x49\xab\x13\x98\x34\x7b\x09\x7d\x1e\xea\xce\x95\
-\xb4\x2d\x60\x0b\x22\x4c\x75\x8d\xaf\x3e\xfc\x9a\x1b\x62\x5d\x34\
-\x40\xa1\xae\x62\xb1\x78\xbb\x6d\x7a\xbd\xbe\x4c\xd8\x66\x55\xae\
-\xff\x82\x20\x90\x9f\x9f\xef\x58\xff\x4b\x8f\x41\xbb\xce\xa2\x87\
-\x04\x7a\xe0\xc1\xbf\x90\x04\x16\x15\x15\xa1\x50\x28\x88\x8e\x8e\
-\xf6\xf4\xba\x8b\xf0\xf3\xf3\x43\xa9\x54\x52\x54\x54\xe4\x69\x0c\
-\x0f\x2a\x84\x28\x8a\xf4\xe9\xd3\xe7\x6f\x7f\x57\x3a\x23\x9c\x24\
-\x49\x58\x2c\x16\xc7\x9f\xce\x42\x26\x93\x95\x71\x02\xcc\x66\x33\
-\x6d\xdb\xb6\xe5\x89\x27\x9e\xa8\x0c\x55\xa5\x76\x74\x14\x9d\x94\
-\x3e\xc8\x01\x9b\x04\x20\x62\xce\xcb\x44\x17\xde\x81\xef\xde\x7f\
-\x8c\x55\x5f\x6e\x20\x39\x31\x9d\x96\xf5\x1b\x50\xbf\x7e\xc5\x77\
-\x61\xd3\xd3\xd3\xf9\xfc\xf3\xcf\x1d\xf5\x29\x6d\x9b\x2b\x50\x28\
-\x14\x65\x9c\x3f\x8b\xc5\x42\x8b\x16\x2d\x18\x38\x70\x60\x65\x28\
-\x16\xd5\x9a\x77\xa2\x97\x4f\x43\x6a\xd5\x90\x61\x2e\xb2\x21\x93\
-\x09\x9c\xfa\xed\x3a\x0d\x86\x3e\xc1\xb3\xdd\x1b\xf3\xf2\xb4\xd9\
-\xe4\x6b\x21\x2e\x2e\x9e\xb8\xb8\xf8\xbb\xda\x56\x3a\x4b\xa1\xdd\
-\x36\x51\x14\x5d\x72\x50\x4b\xdb\x66\x0f\x2b\x6c\xd5\xaa\x15\x8f\
-\x3e\x7a\x77\x71\x77\xc9\xac\xa3\xce\x03\xbd\xe9\xad\x0d\x23\xdc\
-\x17\xae\xdb\x24\x44\x85\x82\xe4\x5f\xb6\x11\xf0\xcc\xb7\x2c\xef\
-\x9a\xcf\xe7\x3f\x1d\xe3\xb6\xde\x46\x97\xae\x5d\xef\x5a\x5e\x6a\
-\x6a\x2a\xcf\x3f\xff\x7c\x19\xfd\x4a\x77\xfa\xcd\x4e\x26\x4a\x3b\
-\xa6\x8f\x3c\xf2\x08\xb1\xb1\xb1\x77\x7d\x56\x97\x7d\x9b\xce\x0f\
-\x0f\x40\x19\xef\xef\x68\x1b\xb9\x21\x9d\x5d\xe9\x26\x06\x3f\xbd\
-\x98\x2e\xba\xef\x19\x7f\x30\x9b\x91\x4d\x23\x78\xe8\xa1\x87\xee\
-\x5a\x9e\xc1\x60\x60\xcb\x96\x2d\x7f\x21\x13\xae\x66\x51\x54\x28\
-\x14\x65\xda\xc5\xdf\xdf\x9f\xfe\xfd\xfb\x57\xee\x74\x51\x97\x42\
-\xd3\xee\x7d\x09\xf1\xa9\x83\x06\xb0\xda\x04\xfc\x7c\x32\x78\x67\
-\x91\x8e\x65\x17\x7e\x24\xfa\x3f\x9f\xb2\xf0\xa7\x23\x3c\xf9\x72\
-\x37\xfa\xf7\xef\x7f\xd7\xe2\xc2\xc3\xc3\x59\xb7\x6e\x5d\x19\xdb\
-\xdc\xe9\xb7\xd2\xcf\x5a\xad\x56\xaa\x57\xaf\xce\xf0\xe1\xc3\xef\
-\x7a\x12\x08\x90\x73\xeb\x1c\x3d\xfa\xf6\x27\xbe\x86\x06\xe9\xc8\
-\x9d\xbe\xcf\x4c\xe1\xf2\x6d\x3d\x2f\xed\x3c\xca\x8d\xe9\xcf\xf3\
-\xee\x8a\x9d\xbc\xf6\xed\x90\x4a\xad\x4d\x87\x0f\x1f\x26\x2f\x2f\
-\xaf\x4c\xdd\xfe\x3c\xae\x5c\x5d\x23\x05\x41\x20\x3a\x3a\xba\xd2\
-\x82\xea\x05\xb1\xf7\x33\xa8\x5f\x03\x62\xc2\xd5\x60\x2d\x46\x52\
-\xfa\xa0\x38\xf2\x05\x3f\x06\x3f\xc3\x89\x2f\x1e\xe7\xfb\xa7\x9a\
-\xb3\xe2\xdc\x5b\xcc\x6c\x1c\x4b\xed\xba\x77\x1f\xe3\xeb\xd7\xaf\
-\x27\x3d\x3d\xbd\xcc\x3a\xe2\xaa\x6d\xf6\x84\x37\xa5\xd7\xff\x0e\
-\x1d\x3a\x30\x62\xc4\x08\xcf\x4b\xd8\x03\x0f\x3c\x24\xb0\xec\xae\
-\x96\x07\x9e\xb6\xf4\xe0\x1e\x5a\x7c\xe4\x72\x6e\xdf\xbe\xcd\xa8\
-\x51\xa3\xa8\x5b\xb7\xae\x4b\x24\x50\x14\x45\x6e\xdc\xb8\x51\xe6\
-\xe4\xc5\x7e\x2a\x70\xf7\x53\x2a\x81\xf8\xd8\xda\xc4\xdf\xf1\x5b\
-\x64\x5e\x2a\xd4\x0a\x11\xb9\x8f\x1f\x6a\x7d\x12\x6b\xd7\xee\xa0\
-\xd8\xe6\x4b\x50\x50\x80\xd3\xf3\xc2\x1e\x4e\xf6\xd8\x63\x8f\xb9\
-\xec\x70\xcb\x64\x32\x6e\xde\xbc\xe9\x28\xd7\x4e\x50\x2a\xd9\x32\
-\xd4\x6c\xff\x08\xc3\xdb\x97\x10\xc2\x1b\x67\xe5\x78\xab\x44\xa2\
-\x63\x42\xc8\x5c\x7b\x8a\xed\x45\x37\x31\x05\xd4\xc6\xa7\x92\x79\
-\x14\x4a\x3b\x5a\x92\x24\x71\xe4\xc8\x11\xfa\xf4\xe9\x83\xaf\xaf\
-\xaf\xd3\xeb\x81\x24\x49\xf8\xfa\xfa\xb2\x76\xed\xda\x32\x59\x26\
-\x2b\xeb\x04\x0a\x0a\x35\x0d\x1e\x1c\xea\x10\x8b\x97\xab\x7d\xf0\
-\x12\x24\xaa\x35\x6e\x86\xfe\xbd\x6f\xd9\xe2\x15\x85\xdc\x3b\x94\
-\x70\x2f\xd1\x69\xdb\xd4\x6a\x35\xcb\x97\x2f\xe7\xf4\xe9\xd3\x2e\
-\x9f\xe8\x5a\xad\x56\x7e\xff\xfd\x77\x1e\x7c\xf0\xc1\xbf\xfd\x8e\
-\x8a\xa0\x0e\xa9\x45\xdf\xa1\xa3\xfe\x18\x03\xde\x7e\xa8\xfc\x02\
-\x68\x20\xf7\xe2\xe7\xdf\xb7\x93\x98\x97\x45\xe7\x5e\x01\x4e\xb5\
-\x75\x69\x2c\x5f\xbe\x9c\x03\x07\x0e\xb8\xe4\x70\x4b\x92\x84\x8f\
-\x8f\x0f\x37\x6e\xdc\xa0\x6d\xdb\xb6\x8e\xb2\x2b\x5d\x96\x3a\x8a\
-\x76\x83\xfe\x10\x8b\x57\xaa\x55\x58\xad\x91\xf4\xea\x2d\x67\xc3\
-\x47\xdb\x69\x67\x48\xa7\x79\x9b\xbe\x95\xae\x8f\xfd\x7b\x45\x51\
-\x24\x2f\x2f\x8f\x17\x5f\x7c\x91\xe8\xe8\x68\x97\xfb\xcd\x6c\x36\
-\xb3\x73\xe7\x4e\x47\x76\x6e\x67\x4e\x17\x83\x6b\x37\xe6\xd1\xda\
-\x25\x8a\xea\xd9\x5e\x1a\xfc\x10\x20\x20\x80\x6a\x11\x3e\x1c\xf9\
-\xe2\x03\x72\x02\x6a\xd2\xad\x4b\x6b\x97\xfb\x6d\xe8\xd0\xa1\x28\
-\x95\x4a\x97\x13\xc3\xe8\x74\x3a\x32\x33\x33\x5d\x6a\x1b\xff\x46\
-\x3d\x18\x6d\x8f\x6a\x37\x17\xa3\x14\x81\xfa\x5d\xb8\x6f\xdd\x7f\
-\x58\xbb\xcb\x8b\xdf\x4d\xed\x19\xd6\x10\xa7\x6d\xf3\xf2\xf2\xe2\
-\xdc\xb9\x73\x8c\x1a\x35\x8a\xa0\xa0\x20\x97\xfd\x8a\x82\x82\x02\
-\x8c\x46\xa3\x63\xbd\xb7\xd9\x6c\x1e\xb1\x78\x0f\x3c\xf0\x90\x40\
-\x0f\x3c\xf0\xe0\x5e\x46\xfd\xfa\xf5\x79\xfa\xe9\xa7\x31\x9b\xcd\
-\x6e\xa5\xd2\x0f\x0f\x0f\xa7\x47\x8f\x1e\x34\x6c\xd8\x90\xdd\xbb\
-\x77\xbb\x5c\x4e\x9d\x1e\x43\x19\xa7\xf0\x47\xf0\x55\x30\x71\xc2\
-\x48\xf6\x9d\x4e\xa1\x6d\xb7\x8e\xd4\x0e\x55\x39\x55\x8e\xd9\x6c\
-\xa6\x57\xaf\x5e\xd4\xac\x59\x93\xc2\xc2\x42\xb7\x9c\x91\x36\x6d\
-\xda\xd0\xa3\x47\x0f\x02\x02\x02\xdc\x08\x09\x13\xa9\x1e\xdb\x89\
-\x89\x63\x6c\x04\x45\x04\xf0\x6c\x7f\x19\x87\x2e\x65\xf2\xcc\x94\
-\x21\xa8\x9d\x8c\x8c\x32\x9b\xcd\x0c\x1a\x34\x88\x9a\x35\x6b\xba\
-\xbc\x7b\x6f\x77\xd4\x9e\x7e\xfa\x69\x02\x03\x03\x1d\x61\x5a\xae\
-\xa2\xc3\x94\x19\xb4\x09\xf4\x45\xf4\x7e\x94\xf7\x9f\xfe\x95\x23\
-\x49\x36\xfa\xb5\xef\x80\x9f\xe8\x5c\x7d\xd4\x6a\x35\x03\x06\x0c\
-\x20\x2e\x2e\xce\x2d\xbd\x31\xfb\xc9\x5f\xb7\x6e\xdd\xb8\x71\xe3\
-\x86\x5b\x73\x24\xf6\xf1\x37\x79\xda\xcb\x8f\x6a\xea\xc7\xf0\x3a\
-\xb0\x9f\x44\xdb\x7d\xf4\x6c\x13\xe5\x74\x39\x3a\x9d\x8e\xd1\xa3\
-\x47\xa3\x54\x2a\x31\x1a\x8d\x2e\xd7\xc7\x66\xb3\x31\x76\xec\x58\
-\x3a\x76\xec\xe8\x66\x88\xa2\x9c\xee\x13\x26\x23\x04\x04\xe2\xbf\
-\xe8\x33\xfc\xb7\xfe\x42\x51\xd0\xa3\x0c\x7f\x20\xca\xe9\xfa\x84\
-\x87\x87\x33\x7e\xfc\x78\x52\x52\x52\xdc\xde\xa0\x9c\x32\x65\x0a\
-\xad\x5b\xb7\xe6\xd0\xa1\x43\x2e\x97\x11\xd8\x7f\x01\x0b\x08\x04\
-\xa5\x8c\xfe\x63\x9f\xe7\xe0\xde\x63\x04\xf4\x6f\x4f\xe3\x18\xe7\
-\x04\x2c\x2d\x16\x0b\x91\x91\x91\x8c\x1f\x3f\xde\xad\xb9\x06\x25\
-\x9a\xac\xc3\x87\x0f\x27\x34\x34\xd4\xbd\x7e\x93\x07\xd0\xa3\x47\
-\x37\xbc\xfd\x83\x58\xfa\x5e\x34\xdb\x0f\xdc\x60\xf8\xa2\xc5\xb4\
-\x70\x32\x2a\x5c\x92\x24\xea\xd4\xa9\x53\x25\xb6\x85\x85\x85\xd1\
-\xb6\x6d\x5b\x62\x62\x62\x3c\x3a\x81\x1e\x78\xe0\x21\x81\xff\x25\
-\xdc\xc9\x32\x6f\x2a\x48\xe7\xfc\xf9\x4b\xa4\xe7\x1b\xd0\x84\x56\
-\xa7\x7e\xc3\xfa\x84\xf8\xc8\x01\x33\xe9\xb7\x12\xd0\xcb\xbd\x09\
-\x0c\x8e\x24\x40\x6d\x5f\x35\x8d\xa4\x26\xa4\x61\x46\xc4\x3f\x22\
-\x0a\x0a\x32\x28\x30\x48\x84\x46\x56\x43\xad\x28\x71\x1e\x2d\x86\
-\x22\xd2\xb3\xf2\xf0\xd2\x04\x11\xec\xef\x8b\x78\xc7\xa7\x34\x14\
-\xa4\x73\xe9\xdc\x05\x52\x0b\xcd\x04\x57\xaf\x43\xa3\xfa\xb1\xf8\
-\x2a\x3c\x5d\xe1\xc1\x3f\x03\x75\xeb\xd6\xe5\xa3\x8f\x3e\xaa\xb2\
-\xf2\x72\x73\x73\x59\xb0\x60\x81\xcb\xcf\xab\x02\x43\x89\xb8\xf3\
-\xf7\xe0\x98\xe6\x0c\x8c\x69\xee\xfc\x32\x20\x49\x18\x8d\x46\xc6\
-\x8d\x1b\x57\xa5\x6d\x75\xfb\xf6\x6d\xb7\x9e\xf7\xf2\xf6\xa3\xda\
-\x9d\x53\xbf\xc8\x06\x6d\x19\xec\x82\xca\x8b\xfd\x3e\xcf\xa4\x49\
-\x93\x18\x3b\x76\x6c\x95\xd9\x76\xe9\xd2\x25\x2c\x16\x8b\xcb\x64\
-\xd9\xaf\xda\x1f\x49\x25\xa2\x9a\x75\x65\x90\x0b\xb9\x41\xac\x56\
-\x2b\xbe\xbe\xbe\x8c\x1c\x39\xb2\x4a\xfb\xed\xfd\xf7\xdf\x77\x8b\
-\x98\xa8\x42\x6a\x51\x0d\x00\x0d\xcd\x3b\xf7\xa6\x39\xae\xf5\x5b\
-\x41\x41\x01\x5f\x7c\xf1\x45\x95\xda\xe6\xae\x58\x7c\x40\x44\xe4\
-\x9d\xbf\xf9\xd3\xbe\xef\x10\x97\xca\xb0\x58\x2c\xd4\xae\x5d\x9b\
-\xd7\x5f\x7f\xbd\x4a\x6d\x73\x47\xdf\x53\x16\x54\x8b\x5a\xf6\xfe\
-\xf3\xaf\xce\x83\xfd\xab\xbb\x6c\x5b\x4c\x4c\x0c\xcb\x97\x2f\xbf\
-\x77\x16\x6d\x41\x4e\x60\x50\x50\xc9\xdf\xab\x35\x63\xd0\x63\xae\
-\x27\xe2\x89\x8c\x8c\xac\x52\xdb\x74\x3a\x1d\x46\xa3\xd1\x73\x02\
-\xe8\x81\x07\x1e\x12\xf8\xdf\x58\x1c\x21\xe3\xe0\x72\x26\xcc\xfa\
-\x8c\xe3\x97\x6e\x90\x5d\x68\xc0\x27\x28\x9c\xf8\x56\x5d\x99\x33\
-\x7f\x01\x0f\x37\x0e\xe7\xf0\x27\xa3\x79\x6e\x8b\x89\x3e\x4f\x3c\
-\xc7\xe2\xd9\x8f\xa1\x06\x92\x37\xcf\xe2\x91\x79\xbb\x50\x46\xf5\
-\xe5\x9b\x6f\x26\xf2\xed\xcb\x63\x58\xbd\x2f\x99\x21\xb3\x3f\xe5\
-\xb5\x27\x3b\x20\x17\xac\xa4\x9c\xda\xc8\xe0\x51\x6f\xd0\x76\xd4\
-\x3c\xe6\x3d\x37\x9c\x60\x15\x5c\xfc\x79\x19\x2f\xbf\xbd\x92\xd3\
-\x57\x12\xc8\x2c\x34\x11\x10\x56\x8d\x7a\xad\x7b\xb1\xe8\x93\x25\
-\xb4\x0e\xf1\x74\xab\x07\xf7\x3e\x74\x3a\x1d\x3b\x76\xec\xa8\x92\
-\x04\x43\x32\x99\x8c\xb0\xb0\x30\x97\xf5\xbd\xaa\x6c\x19\xb8\x93\
-\x32\xff\xd0\xa1\x43\x64\x65\x65\x55\x49\xe8\xb4\x52\xa9\x74\x5b\
-\xb7\xae\xaa\xa0\x50\x28\x38\x7e\xfc\x38\xb7\x6f\xdf\xae\x92\x04\
-\x0b\xde\xde\xde\x04\x07\x07\xff\xd7\x93\x4c\x89\xa2\x88\xd1\x68\
-\xe4\xf0\xe1\xc3\xa4\xa5\xa5\xb9\x5d\x1f\x9b\xcd\x46\x83\x06\x0d\
-\xee\x89\x93\x09\xbb\xbe\xe3\xda\xb5\x6b\xab\x64\x7e\xd8\x6c\x36\
-\xea\xd4\xa9\x53\x26\x99\xce\x7f\xb3\xdf\xb2\xb3\xb3\x39\x71\xe2\
-\x44\x85\xd9\x44\x9d\x99\xbf\xed\xda\xb5\x73\x39\x29\x50\x55\xdb\
-\x96\x93\x93\xc3\xe1\xc3\x87\xdd\xae\x8f\x20\x08\x14\x17\x17\x57\
-\xea\xce\xed\xff\xaf\x75\xd2\x6a\xb5\xb2\x71\xe3\xc6\x2a\x59\x47\
-\x14\x0a\x05\x71\x71\x71\x6e\xe9\x8d\x7a\xe0\x81\x87\x04\x7a\xe0\
-\x06\xce\x32\x6d\xfc\x6b\x6c\xbe\x64\xe4\xa9\x37\xdf\x61\x5c\xb7\
-\xba\xec\xf8\x64\x1e\xf3\xbf\xf9\x8a\xe7\x55\xb5\x68\xb9\x6a\x0e\
-\x6d\x1e\x9f\x8c\x72\xc9\x63\x7c\xf9\xed\x37\x3c\xd4\xaf\x3f\xfd\
-\x9a\x64\x32\x6f\xd6\x6a\x4e\x5c\xcc\xe5\xd9\xd7\xb6\x50\xdd\x9c\
-\xc3\xcd\xab\x97\xb8\x7e\x23\x89\xf9\x6f\xbd\xcb\xe8\xfe\xad\xa8\
-\x13\xa0\xc4\xa4\xcd\xe1\xdc\xd5\xeb\x84\xa5\xe6\x62\x13\x41\x4a\
-\xdb\xc4\x88\x61\x33\x39\x99\xa7\xa3\x59\xff\x17\x59\x38\xbc\x1e\
-\x5b\xde\x79\x8d\xb5\x3f\xbc\x4f\xd7\xd4\x40\xb2\x0e\xcd\x45\xe5\
-\xe9\x10\x0f\xee\x71\x1c\x3c\x78\x90\x11\x23\x46\x38\x12\x03\xb8\
-\xe2\xc0\xd9\x75\xa1\x42\x42\x42\x98\x36\x6d\x9a\x43\x7a\xc2\x35\
-\x58\xb9\x7a\xe1\x16\xb5\x1b\xd6\x45\x01\x60\x33\x52\x5c\x6c\x44\
-\xa9\xf6\x43\xe1\x84\x9f\xa2\x54\x2a\xf9\xf4\xd3\x4f\xd9\xb6\x6d\
-\x9b\x5b\xe1\xa0\x76\xdb\x02\x02\x02\x58\xb5\x6a\x95\x7b\x0e\xae\
-\x64\x22\x39\x31\x93\xa0\xe8\xea\x94\x24\x9a\x37\x90\x9b\x6b\x21\
-\x28\xc8\xd7\xa9\xfa\xa8\x54\x2a\x16\x2d\x5a\xc4\xe6\xcd\x9b\xdd\
-\xca\xea\x67\xb3\xd9\xf0\xf1\xf1\x21\x2a\x2a\x8a\xf7\xde\x7b\x0f\
-\x99\x4c\xe6\xba\xf3\x56\x90\xc4\xe5\x82\x20\xea\xd5\x2c\xe9\x7b\
-\xab\xd9\x8c\xde\x68\xc2\xd7\xb7\xf2\x63\x41\x26\x93\x51\x58\x58\
-\xc8\x82\x05\x0b\xf8\xe5\x97\x5f\xdc\xce\x58\x28\x08\x02\x63\xc7\
-\x8e\x25\x2c\x2c\xcc\xbd\x7e\x33\xa4\x71\x2d\x43\x49\x6c\x74\x30\
-\x00\x45\x85\xf9\x78\xab\xfd\x90\xcb\x9d\x23\xa9\x7e\x7e\x7e\x3c\
-\xf9\xe4\x93\x88\xa2\x88\xc9\x64\x72\xb9\x4e\x36\x9b\x0d\x2f\x2f\
-\x2f\x9e\x7a\xea\x29\xb7\x34\xf9\x00\xcc\x79\x29\xa4\x5a\xc3\x88\
-\x0e\x29\x09\x5f\x31\x6b\x0b\x28\x56\x68\x08\xf0\x12\x9d\xea\xb7\
-\xdb\xb7\x6f\x33\x7d\xfa\x74\xae\x5e\xbd\xea\x36\x01\xf0\xf5\xf5\
-\xe5\x9d\x77\xde\x71\x99\x74\x49\x12\x08\x82\x8d\x84\x0b\x57\xa9\
-\xd6\xb0\x1e\x77\x2c\x23\x33\xd7\x48\xb0\xbf\x0f\x32\x59\xe5\xdb\
-\x5d\xa1\x50\x70\xfd\xfa\x75\xc6\x8e\x1d\x5b\x6e\x36\x60\x67\xc6\
-\xa3\xc5\x62\xe1\xbe\xfb\xee\x73\x6b\x83\xa3\xb8\xb0\x18\x9d\xc1\
-\x44\x68\x58\xa0\xe3\xb3\xac\xe4\x2c\x82\xaa\x87\xe2\x2c\x95\x3b\
-\x79\xf2\x24\xc3\x86\x0d\x43\x92\x24\xb7\xfa\xcd\x9e\xe8\x66\xfe\
-\xfc\xf9\x0e\x19\x8c\x7f\x2b\xdc\xb9\x0b\xe9\xb9\x47\xe9\x21\x81\
-\x1e\xb8\x83\x2b\x47\x38\x90\x96\x85\x6f\xdb\x71\x7c\xf8\xca\x18\
-\xd4\x40\xbb\xe8\xb7\xd0\x19\x66\xb0\xbd\x20\x0b\x43\xb1\x91\xa8\
-\xc6\x0f\x33\x6d\xfc\x03\x4c\x5e\xbe\x8b\x9d\x87\xf6\x11\x77\x71\
-\x0f\x5b\x6e\x66\x10\xdc\x71\x1a\x6f\xf7\x8b\xc6\x94\x94\x8d\x20\
-\x8a\x20\x78\xc1\xf5\x4d\x8c\xf9\xf4\x18\x7b\x5f\xee\x08\x82\x80\
-\x0c\x10\x65\x22\x5e\x4a\xd8\x38\xfb\x45\x4e\xe6\xe9\x68\xf0\xc4\
-\x37\x9c\x5a\x55\x92\x05\xeb\xf1\xfe\xf7\xa1\xea\x3e\x80\x75\x87\
-\x3f\x66\xc5\xd5\xb9\x3c\x1b\xe7\xe9\x12\x0f\xee\x6d\xe8\xf5\x7a\
-\x44\x51\xe4\x83\x0f\x3e\xa0\x6d\xdb\xb6\x2e\xdd\x55\x52\x28\x14\
-\x1c\x3e\x7c\x98\x17\x5e\x78\xc1\xcd\x50\x20\x23\x9f\xcc\x9c\xc4\
-\xc1\xe4\x4c\x92\x53\xa3\x58\xf9\x9f\xe5\xa4\xac\x5a\xc2\x7f\x92\
-\x7c\x18\x37\x6d\x1a\x35\x35\x95\x2f\xc9\x9e\xe2\xdd\x66\xb3\x71\
-\xee\xdc\x39\x97\x89\xa0\xb7\xb7\x37\xeb\xd7\xaf\x67\xd1\xa2\x45\
-\x6e\x91\x12\x8b\x3e\x9b\x65\x33\x27\xb0\xe5\x82\x96\x96\xdd\x86\
-\x32\x6d\x74\x3f\x4e\xac\x9e\xcc\x7f\x84\x89\x7c\xf8\x5c\x47\xa7\
-\x1d\x2e\xad\x56\x4b\xdd\xba\x75\x59\xb6\x6c\x99\x4b\x02\xd6\x92\
-\x24\x11\x1a\x1a\xca\x88\x11\x23\xb8\x7e\xfd\xfa\x5f\xe4\x14\x9c\
-\x41\xfe\xf9\x9d\x4c\x7b\xe7\x3b\x0a\x93\xcf\x11\xfb\xc4\x72\xe6\
-\xf7\xd5\xf0\xe9\x17\xdf\x20\x46\x3f\xc4\xa4\x21\x1d\x9c\xae\x57\
-\x4e\x4e\x0e\x3d\x7b\xf6\x64\xe6\xcc\x99\x6e\x11\xa5\xa5\x4b\x97\
-\x92\x99\x99\x49\x68\x68\xa8\xeb\x0e\xf7\xe9\x35\x74\x9f\xf0\x15\
-\x8d\x9b\x56\x63\xcc\xf8\xe9\xc4\x06\x16\x33\xf5\xf5\x55\xcc\x5e\
-\xb4\x98\xb8\x70\xe7\x34\xe3\xec\xe4\xef\x99\x67\x9e\x61\xec\xd8\
-\xb1\x2e\xcd\x35\x49\x92\x88\x8c\x8c\xa4\x45\x8b\x16\x6e\x93\x92\
-\x5b\xbb\xbf\x66\xd6\x47\x3f\x90\x7c\xed\x36\xf7\xbd\xb9\x81\x45\
-\x2d\xf3\x98\xf3\xda\x72\xea\xbd\xf0\x21\x23\xe3\xbd\x9d\x1a\x8f\
-\x66\xb3\x99\xdc\xdc\x5c\xde\x78\xe3\x0d\xba\x74\xe9\xe2\x3a\xdf\
-\x36\x18\x18\x39\x72\x24\x05\x05\x05\x2e\xf7\xbd\x20\xc0\x73\xfd\
-\x07\x71\xd5\xc7\x9b\xa0\x88\x36\x7c\xf1\xee\x54\xb2\x76\x7f\xc6\
-\x88\xf5\x32\xd6\x2c\x78\x8a\x88\x00\x2f\xa7\x6c\xb3\x58\x2c\x14\
-\x16\x16\xb2\x7b\xf7\x6e\x97\x92\x30\xd9\x89\x72\x5e\x5e\x1e\x83\
-\x06\x0d\x72\xeb\xee\xb5\xad\x20\x85\xad\xef\x4f\xe3\xed\x83\xde\
-\xbc\xf5\xfa\x6c\x7a\xb7\x8d\xe5\xc6\xae\x45\x3c\xfa\x7a\x31\x47\
-\xf7\xbf\xee\x34\x09\x2c\x2e\x2e\x26\x38\x38\x98\x65\xcb\x96\x51\
-\xab\x56\x2d\x97\xd7\xb8\xc4\xc4\x44\x9e\x7c\xf2\xc9\x2a\x97\xe7\
-\xf9\x27\xc0\x62\xb1\x10\x11\x11\x81\x56\xab\xe5\xb5\xd7\x5e\x63\
-\xc6\x8c\x19\x00\xec\xdd\xbb\x97\xc1\x83\x07\x3b\x74\x44\x9b\x35\
-\x6b\xc6\x73\xcf\x3d\xc7\xa3\x8f\x3e\x8a\x42\x51\xb2\x35\x51\x58\
-\x58\x48\xf7\xee\xdd\x39\x76\xec\x18\xef\xbf\xff\x3e\x53\xa6\x4c\
-\x61\xfa\xf4\xe9\xbc\xf7\xde\x7b\x8e\xf1\x67\x4f\x8e\xd4\xbd\x7b\
-\x77\xb6\x6c\xd9\x52\xa9\x4c\xb9\x1e\x78\x48\xe0\xbf\x13\x31\xf5\
-\xa8\x13\xa0\x61\xff\xef\xdf\xd2\xa5\x57\x21\xfd\x7a\xf6\xa0\x47\
-\xd7\x8e\xbc\xf9\xed\x3e\x96\x28\xec\x3b\x6f\x5e\x0c\x7a\x7a\x2a\
-\xcb\x57\x0d\x61\xf7\xd7\xf3\x39\xad\x4d\x26\xcb\xa0\x66\xfe\x8c\
-\xe7\xf0\x01\xf2\x91\x90\x2c\x26\xbc\xea\xf5\x63\x58\xed\xf3\x7c\
-\x39\x6b\x38\x5f\x0d\xb9\x4d\x37\x2f\x99\xe3\x79\x25\x09\xac\xfb\
-\x25\x17\x08\x65\xd2\xdc\x61\x7f\x7c\xbf\xb2\x11\xef\xfd\xb8\x8f\
-\x39\x85\x7a\x7c\xc2\x3c\xdd\xe1\xc1\x7f\x1f\xd9\xd9\xd9\x7f\x71\
-\x3a\xfc\xfc\xfc\x1c\x5a\x4d\x36\x9b\x8d\x88\x88\x08\x3a\x75\xea\
-\x44\xfd\xfa\xf5\x5d\xfe\x1e\x1f\x1f\x9f\x32\x3b\xf7\x56\xab\xb5\
-\x52\xa1\x98\xe1\xe1\xe1\x7f\x64\x14\x2d\xbe\x8d\xac\xde\x23\xac\
-\x5e\xd0\x8f\x43\xaf\x76\x60\xc7\xbe\xdb\x04\xde\x4a\xc4\xa0\x68\
-\x8a\x5c\x04\x9d\xae\x98\xc2\xc2\x8a\xa5\x51\xb2\xb2\xb2\xca\x38\
-\xcc\x1a\x8d\x86\x06\x0d\x1a\xb8\xd5\x86\xc7\x8e\x1d\xfb\x8b\xe8\
-\x71\x5e\x5e\x5e\xb9\x4e\xbc\x24\x49\x28\x95\x4a\x02\x02\x02\x1c\
-\x61\x56\x16\x9d\x0e\xbf\x16\x43\xd9\xb3\xb4\x19\xdf\x7e\xbd\x9b\
-\xdb\xa7\x8f\x70\x21\xb1\x10\xaf\xb8\x92\xdf\xeb\x74\xba\x0a\x1d\
-\x5f\x51\x14\xff\xe2\xf4\x47\x46\x46\xd2\xb5\x12\xf2\x0b\x15\xa1\
-\x4f\x9f\x3e\x2c\x5a\xb4\xc8\xf1\xbd\x85\x85\x85\x15\xda\x66\x77\
-\x68\x4b\x13\xab\x8b\x69\x26\x26\xcd\x5a\x48\x9b\xe8\x2c\xa6\xcc\
-\xdc\x4e\x6e\x9b\x96\x5c\x49\xc8\xa5\x51\x5c\x49\xd8\xe3\xdd\xca\
-\xb3\xf7\x9b\xbd\x0e\x66\xb3\x99\x56\xad\x5a\xd1\xa6\x4d\x1b\xb7\
-\x1c\xca\x5d\xbb\x76\x71\xfc\xf8\xf1\x3f\xb6\x18\x8c\x46\x32\x32\
-\x32\x2a\xd4\x64\xf3\xf6\xf6\x26\x20\xe0\x8f\xcc\x9f\x27\x4f\x64\
-\xf1\xe2\x96\x5f\x78\x44\x71\x81\x8c\xdc\x44\x12\xaf\xe7\x92\x53\
-\x6c\x43\x10\x00\x49\x22\xf7\x8e\x6d\xe5\xd5\x53\xa5\x52\xfd\xa5\
-\xdf\xe2\xe3\xe3\xdd\x12\x54\x07\x88\x88\x88\x70\x10\x77\x49\x92\
-\x28\x2c\x2c\x24\x2b\x2b\xab\x42\xe1\x71\x5f\x5f\x5f\x7c\x7d\x7d\
-\xef\xd4\xb5\x90\xd3\xb9\xbe\x3c\x3d\xe7\x2b\x3a\x04\xae\xa7\xf5\
-\xd2\x6b\x58\x6b\x17\x92\x98\xa3\xa7\x89\x5c\x06\x92\x95\xac\xec\
-\xdc\x0a\x49\x81\x9d\xfc\xd9\x49\x77\x60\x60\x20\xed\xda\xb5\xa3\
-\x4d\x9b\x36\x2e\xdb\xa5\xd5\x6a\x69\xdc\xb8\xb1\x63\xbc\x48\x77\
-\xb4\x18\xef\x16\x42\xab\x56\xab\x4b\x69\x0f\x67\x23\x9b\xf0\x15\
-\xdb\x7b\xf9\xf2\xe1\xbc\xb9\x5c\x2d\xd2\x62\x4c\x4b\x45\x6f\x8c\
-\x74\xd4\x39\x27\x27\xa7\xc2\xf2\x54\x2a\xd5\x5f\x6c\x7f\xe0\x81\
-\x07\xdc\x3a\xe5\xd2\xe9\x74\x0e\xb1\x79\xbb\x63\xaf\xd7\xeb\x29\
-\x28\x28\xa8\xf0\xb9\xc0\xc0\x40\xc7\xf7\xe6\xe4\xe5\x11\x18\xdc\
-\x9b\x6f\x5e\x0c\xe2\x6c\x71\x2e\x16\x8b\x81\xab\x97\x6f\x20\x29\
-\x6b\x22\x02\x06\x9d\x8e\xfc\x0a\xb4\x1d\xed\x1b\x5b\x76\xdb\xac\
-\x56\x2b\x11\x11\x11\xb4\x6b\xd7\x8e\xa8\xa8\x28\x97\x6d\xab\x59\
-\xb3\x26\x81\x81\x81\x8e\x72\xed\xda\x95\xa5\xe7\x9a\x24\x49\xa8\
-\xd5\x6a\x34\x1a\xcd\xff\x94\xbe\xf1\x81\x03\x07\xd0\x6a\xb5\xb4\
-\x69\xd3\x86\x3d\x7b\xf6\x38\x48\xa0\x42\xa1\xc0\x68\x34\x32\x70\
-\xe0\x40\x1e\x79\xe4\x11\xbe\xf9\xe6\x1b\x86\x0f\x1f\x4e\x7e\x7e\
-\x3e\x93\x26\x4d\x42\x10\x04\xb2\xb3\xb3\xb9\x70\xe1\x02\x71\x71\
-\x71\x9c\x3c\x79\xd2\x91\x3c\xaa\x79\xf3\xe6\x18\x8d\x46\xc6\x8e\
-\x1d\xcb\xd0\xa1\x43\xe9\xdd\xbb\x37\x35\x6b\xd6\xfc\xaf\x5f\xb5\
-\xf0\xc0\x43\x02\xef\x61\x48\xa0\xe8\xc8\xca\xc5\x13\x18\xfa\xfa\
-\x7a\xae\xec\x5d\xcb\xec\x1d\xab\x99\x0d\x04\xc4\x76\xe2\xcd\x77\
-\xdf\x61\xcc\xc3\x2d\x50\xc9\x05\x22\xea\x3d\xc8\x9c\xe7\x7b\xf2\
-\xe8\x9b\x3b\x00\x88\xea\x32\x8f\xf1\xbd\x6a\x96\x2a\xca\x86\x59\
-\x0c\x60\xdc\x0b\x2f\x73\xf4\xf0\x28\x66\x8c\x78\x99\x5d\x8b\xeb\
-\x97\xec\xb2\xc9\x64\xc8\x4c\x69\xa4\xd9\xcc\x20\x44\x51\x37\xb4\
-\xac\x43\xe1\x17\x52\x0d\xbf\x10\x4f\x6f\x78\xf0\xdf\x87\xd5\x6a\
-\x65\xe2\xc4\x89\x5c\xbc\x78\xb1\xcc\x9d\x0f\x99\x4c\x46\x42\x42\
-\x02\x31\x31\x31\x0e\x07\xce\xdd\xd0\xbb\xd2\xf7\xae\xd4\x6a\x35\
-\xef\xbf\xff\x7e\x19\xfd\xb0\xbf\x83\xcd\x66\xe3\xd8\xb1\x63\x28\
-\x05\x33\xe7\x4f\x9f\x43\x55\xab\x09\xe3\x47\xd5\xe2\xd2\xa1\x2f\
-\x59\x7e\xbe\x21\xb3\x5f\xaf\x45\x54\xf8\x40\x0c\xfb\x6f\x21\x53\
-\xc0\x0f\xdf\xfd\xc0\xc2\x45\x8b\x2a\x74\x20\x2c\x16\x0b\xb7\x6f\
-\xdf\x76\xe8\x23\x56\xc5\xdd\x94\xd2\x65\xa8\x54\x2a\x3e\xfa\xe8\
-\x23\xd6\xae\x5d\x5b\x6e\xd9\x16\x8b\x85\xe6\xcd\x9b\xb3\x70\xd1\
-\x62\x6a\x04\x7b\x73\xf4\xc4\x59\x64\x61\x8d\x18\x33\xb2\x27\x3f\
-\xad\xfc\x98\x84\xdc\x20\x1e\x1a\xd1\x8b\xe6\x61\xe7\x78\x6b\x7f\
-\x49\xbb\x6f\xdb\xb6\x8d\x97\x5e\x7a\x09\x8d\x46\x53\xae\xc3\x6d\
-\xb5\x5a\xd1\x6a\xb5\x65\xda\xcf\x6a\xb5\xba\x75\x9f\xa7\xf4\xce\
-\xbd\x24\x49\xbc\xfb\xee\xbb\x7c\xfd\xf5\xd7\x15\xda\x56\xab\x56\
-\x2d\x76\xec\xd8\x41\x7e\xca\x35\xce\xdc\xca\xa3\xe1\x03\x3d\xd1\
-\x98\x32\x59\xb7\xe4\x5d\x02\x9a\x8c\x25\xb4\x5e\x3b\xc6\x0c\x2f\
-\xe4\x5c\x9a\x1e\x80\x59\xb3\x66\x71\xf0\xe0\xc1\x0a\xeb\x61\x32\
-\x99\xf0\xf1\xf1\x71\xd4\xc5\x62\xb1\xb8\x25\x2a\x6d\xd7\xab\x2b\
-\xdd\x87\x8f\x3f\xfe\x78\x85\xe5\x59\x2c\x16\x1e\x7e\xf8\x61\x96\
-\x2e\x5d\xc2\x8d\x0b\xa7\x49\xc9\x97\xd1\x76\xcc\x54\x8c\xb7\x4f\
-\xb1\xe1\xc7\x4d\x44\xb7\x1c\x4c\xab\x87\x7a\xd1\xed\x78\x02\x22\
-\x25\x29\xff\x9f\x7f\xfe\x79\x7e\xfb\xed\xb7\x72\x9d\x33\xfb\x7d\
-\xb9\xd2\x24\xd8\xdd\xb9\x66\xb7\xcf\x3e\x2e\xd2\xd2\xd2\x18\x39\
-\x72\x24\x5e\x5e\x5e\xe5\xf6\x9b\x4e\xa7\xe3\xd9\x67\x9f\x65\xda\
-\xb4\x69\xe4\x5e\x3b\xc6\xcd\x4c\x1b\x2d\xbb\x74\x27\x84\x4c\x96\
-\xcd\xfe\x99\x1e\x3d\x17\xa1\x6c\x52\x97\xc7\xbb\xde\x40\x87\xc4\
-\xcd\x6b\xd7\x98\xf2\xfc\x0b\xdc\xbe\x7d\xbb\x42\x22\xae\xd3\xe9\
-\xfe\xd2\x6f\xee\xce\x35\x7b\xfb\x28\x95\x4a\x0e\x1d\x3a\x44\xaf\
-\x5e\xbd\x2a\xac\x83\x28\x8a\x3c\x3a\x64\x08\xb3\x5f\x99\xc5\xe5\
-\x53\x47\x28\x50\xd4\x60\x49\x57\xf8\xed\xa7\x2f\xb9\x66\x0e\x67\
-\x8c\xc6\x17\xef\x07\x7b\xd1\xe8\x56\x2a\x32\x51\xe4\xea\xd5\x2b\
-\x0c\x1f\x3e\xbc\xc2\x44\x48\xa2\x28\x72\xeb\xd6\xad\x32\x5a\x89\
-\x16\x8b\xc5\x2d\x12\xf8\x67\x51\xf8\xfd\xfb\xf7\xd3\xae\x5d\xbb\
-\x0a\x89\x3b\xc0\x67\x9f\xad\xe0\xfe\xfb\x1b\x73\x76\xff\xef\x58\
-\xab\x35\xa4\xeb\x53\x0f\xb1\x78\xd1\xa7\xb4\xea\x35\x0c\x99\xdc\
-\x9b\x5e\x13\x47\xf3\xd9\xcf\xbb\x11\x80\x9f\x76\xec\x60\xee\xbc\
-\x79\x15\xd6\x43\x14\x45\x6e\xdf\xbe\x4d\x93\x26\x4d\x1c\x63\xc9\
-\xbd\x2c\xb3\x7f\xe8\x3b\x0a\x82\x80\xaf\xaf\x2f\xf3\xe6\xcd\x63\
-\xd9\xb2\x65\x65\xfe\x8d\xc1\x60\xe0\xf1\xc7\x1f\x67\xe6\xcc\x99\
-\x6e\x5e\x19\xb8\xb7\xb0\x77\xef\x5e\x44\x51\x64\xc9\x92\x25\x3c\
-\xf4\xd0\x43\x64\x65\x65\x39\x36\xc9\xac\x56\x2b\x71\x71\x71\x0c\
-\x1f\x3e\x9c\x1e\x3d\x7a\x30\x70\xe0\x40\x16\x2d\x5a\x44\xef\xde\
-\xbd\x89\x8e\x8e\xe6\xc0\x81\x03\x84\x85\x85\xf1\xcc\x33\xcf\xf0\
-\xc9\x27\x9f\x90\x9a\x9a\x4a\xc3\x86\x0d\x69\xd8\xb0\x21\x99\x99\
-\x99\x00\xb4\x6e\xdd\x9a\xe1\xc3\x87\x7b\x1c\x1a\x0f\x09\xf4\xa0\
-\x62\x08\xd8\xcc\x46\xa2\x07\xbf\xcd\xbe\xf6\x4f\xf2\xcb\xee\x03\
-\x5c\xba\x76\x93\x6b\x17\x4f\xb2\xf3\xa7\xff\x30\x79\xd0\x38\x7a\
-\xdc\xf8\x95\xd8\xea\x01\xa0\x0c\xa4\xeb\x63\x93\xe9\xbb\xee\x3f\
-\x6c\xbd\x1a\xc2\xac\xc5\x53\x08\xfe\xf3\x4b\xd6\x64\x24\xb2\xe5\
-\x40\xde\x7e\xe6\x5b\xfa\xbf\xb5\x8c\x85\x5f\x3e\x81\x4c\x06\x82\
-\x64\xc3\xa6\x0c\x24\x40\x94\x81\x94\x4f\x86\x56\x0e\xfe\x7f\x3c\
-\x97\x76\xe3\x02\xc9\xd9\x85\x84\xc5\xb7\x23\x3a\xc0\xd3\x2b\x1e\
-\xfc\xf7\x20\x93\xc9\xf8\xe1\x87\x1f\xfe\xf6\x77\x8d\x1a\x35\x72\
-\x38\x41\x46\xa3\xd1\x11\x3a\xe9\x4a\x46\x3e\xb9\x5c\x4e\x61\x61\
-\xa1\xc3\x91\x28\x2e\x2e\xe6\x8d\x37\xde\x60\xd2\xa4\x49\x95\x7a\
-\x3e\x2f\xe1\x0c\x1b\xbf\xfe\x92\xd0\xfe\x13\x48\x3f\x7e\x89\xdf\
-\x2e\xeb\x78\x65\xc3\xa7\xc4\x09\x90\x69\x30\x61\xb5\x81\x5e\x0f\
-\x4f\x8e\x1c\xc9\x93\x77\xc9\x1c\xa9\xd7\xeb\xe9\xd1\xa3\x07\x06\
-\x83\xc1\xf1\x12\x76\xd5\x2e\x3b\xe9\x2b\xed\xbc\xe9\xf5\x7a\x96\
-\x2c\x59\xc2\x84\x09\x13\x2a\xe7\x1c\x25\x1e\x63\xcd\xca\x8f\x91\
-\x35\x1e\x8b\xf6\x6a\x02\x57\x6d\xf1\x8c\x7e\xa6\x1f\xa1\x72\xc8\
-\x36\x5a\x90\x28\x29\x77\xc8\x90\x21\x0c\x19\x32\xe4\xae\x8e\x7f\
-\x90\x3d\x2b\xe0\x1d\x02\xa7\xd5\x6a\xf1\xf6\xf6\x76\xc9\x89\x53\
-\xa9\x54\x64\x66\x66\x22\x8a\xa2\xc3\x81\x5b\xb2\x64\x49\xa5\x04\
-\xac\x25\x9b\x85\xd4\xf3\xfb\x59\xb1\xfe\x22\x03\x75\x26\x2c\xc9\
-\xc7\x48\x8b\x1e\xc7\xeb\xc3\xdb\x82\xd5\x88\xd1\x68\xc6\xee\xef\
-\x7e\xf2\xc9\x27\x77\x2d\x4f\xab\xd5\x96\x39\xdd\xd2\x6a\xb5\x18\
-\x0c\x06\x97\x49\xa0\xd5\x6a\x45\xaf\xd7\x3b\x4e\xca\x04\x41\xe0\
-\xc8\x91\x23\xa5\x4e\x8b\x2a\x42\x2e\x87\x76\xac\x67\xd7\x35\x0d\
-\x01\xa1\x02\xfb\xb7\xef\x22\x24\xb6\x0f\x4d\xda\x34\x06\xb4\x58\
-\x2c\x36\x40\x42\xed\xe3\xc3\x57\x5f\x7d\x75\xd7\xd2\xb6\x6c\xd9\
-\xc2\xd3\x4f\x3f\xed\xf8\xd9\x4e\x08\xed\x63\xd4\x95\x7e\xb3\x9f\
-\x3e\xda\x6c\x36\xa2\xa3\xa3\xd9\xbf\x7f\x3f\xe1\xe1\xe1\x95\x7a\
-\x3e\xf1\xc0\xf7\x6c\x3a\xaa\xc5\xa7\x41\x4b\xc2\x04\x2d\xf2\xfe\
-\x8b\x79\xab\x67\x2c\x56\x93\x0e\x93\xc5\x86\xd9\x62\x21\x26\xbe\
-\x1e\xdb\xb6\x6d\xbb\x6b\x59\x67\xcf\x9e\xa5\x6f\xdf\xbe\x0e\xbb\
-\xec\xd9\x21\x5d\xdd\x7c\xb1\xaf\x45\xf6\x24\x41\xf6\x10\xb8\x4a\
-\x41\x7f\x93\x5f\x37\x7c\x4b\x72\x64\x77\x2e\x1c\xcd\xa7\xc8\x28\
-\x30\xe3\xf5\x67\xf1\x06\x30\x99\xb1\xda\x24\xac\x36\x2b\x0d\x1b\
-\x36\xe4\xf4\xe9\xd3\x77\x2d\x6e\xe6\xcc\x99\x24\x26\x26\x96\x21\
-\x31\x0a\x85\xc2\x65\xb1\x78\xbd\x5e\x5f\xa6\x5d\x7a\xf6\xec\xc9\
-\x86\x0d\x1b\x2a\x59\x42\x12\xdb\x3f\xfb\x90\xbc\xd6\x8f\xd2\x3b\
-\xb2\x80\xf8\x6e\x8f\xf2\xe0\x7d\xf1\x88\x25\x8d\x86\x4d\x02\x13\
-\x30\x70\xd0\x20\x06\x0e\x1a\x74\xd7\xd2\x1e\x7f\xfc\x71\x6e\xdd\
-\xba\x85\x20\x08\x98\x4c\x26\x74\x3a\x1d\x66\xb3\xd9\xa5\x0d\x0a\
-\x7b\xc6\x62\xfb\xb8\x2e\x2c\x2c\xe4\xd3\x4f\x3f\x75\x68\x3d\xfe\
-\xaf\x63\xe7\xce\x9d\xf4\xee\xdd\x9b\xba\x75\xeb\xa2\xd7\xeb\xf9\
-\xe1\x87\x1f\x98\x34\x69\x92\x63\xdd\xb1\xb7\xa9\x9f\x9f\x1f\xf7\
-\xdd\x77\x1f\x07\x0f\x1e\xa4\xa8\xa8\x24\xa2\x65\xd1\xa2\x45\xb4\
-\x6e\xdd\x9a\x66\xcd\x9a\x91\x94\x94\xc4\xed\xdb\xb7\xa9\x5b\xb7\
-\xae\x63\x63\xac\x2a\x36\x56\x3c\xf0\x90\xc0\x7f\x0d\x4c\xa7\xd7\
-\x32\x7a\xe1\x0f\x78\x35\x7f\x92\x2f\x5f\x19\xcf\x23\x00\xa4\xb3\
-\x70\xf8\xa3\xcc\x5c\x73\x1c\x53\x51\x11\x50\xc2\xcc\x82\xc2\xc3\
-\xa8\x1e\x13\x0e\x09\x8d\xe9\x1c\xfd\x77\x8e\x86\x0d\x6d\xa1\x40\
-\xbf\x57\x3f\x62\xdc\xe6\x58\x56\xac\x5e\x0b\x56\x01\x41\x32\x61\
-\x22\x9e\x9e\xcd\xd5\x6c\x49\x49\x61\xe5\x87\x3f\x31\xf2\xed\x5e\
-\x77\x3c\xbe\x8b\xbc\x35\x7d\x3c\xdb\x7e\xb3\xb2\xf4\xf2\x11\xa2\
-\x3d\x5d\xe2\xc1\x3d\x0a\xb3\xd9\xec\x70\xfe\x53\x53\x53\x99\x36\
-\x6d\x1a\xe1\xe1\xe1\x4e\xcb\x04\x48\x92\x84\x4c\x26\x23\x3d\x3d\
-\x1d\xa3\xd1\x88\xd5\x6a\x45\x14\x45\x72\x73\x73\x2b\x29\x16\x0f\
-\x81\xd1\x4d\x79\x7d\xf9\x4a\x28\x3a\xc8\xc3\x9d\xdf\x41\x16\xd7\
-\x84\xab\xe3\x2e\x33\xf9\xb5\x65\xc4\x48\x66\x0c\x7a\x3d\xb6\x4a\
-\xfa\x94\xf9\xf9\xf9\x0e\x07\xd9\x62\xb1\x90\x91\x91\xc1\xa0\x41\
-\x83\x5c\xba\xab\x68\x4f\x0a\x73\xe3\xc6\x0d\x4c\x26\x93\xe3\xa5\
-\x9e\x97\x97\x57\xf9\xc5\xbd\xe6\x7d\xbc\xbf\x72\x1d\xf9\x49\xc7\
-\xe9\xd7\x71\x38\xca\x66\x0f\x93\x9c\x9d\xc1\xd4\xc9\xe3\x50\x59\
-\x8a\xd1\xea\x2b\x9f\xb9\x32\x3d\x3d\xdd\xe1\x50\x98\x4c\x26\x8e\
-\x1e\x3d\xea\xb8\x5f\xe2\x6c\x42\x01\x7b\x68\xd6\xae\x5d\xbb\x1c\
-\x44\xc9\x4e\xc6\x2a\xe5\xf8\x89\x72\x1a\x3c\x34\x86\x6f\x1f\x82\
-\x5f\x3f\x7f\x95\x19\x5f\xec\xa1\x76\x8d\x23\x24\xe5\x3c\xc9\xc2\
-\x29\x3d\xb1\x9a\x0d\x18\x8c\x95\xb7\x2d\x3f\x3f\xbf\x8c\xc3\xbc\
-\x6a\xd5\x2a\x2e\x5e\xbc\xe8\x70\x32\x9d\x85\x24\x49\x9c\x38\x71\
-\x82\x07\x1e\x78\xc0\xf1\x59\x6a\x6a\x6a\x25\x49\x60\x10\x4f\xbe\
-\xb0\x80\x27\x81\xcd\xb3\xfb\x31\x6f\x7d\x3e\x43\x7b\xa7\x10\x1d\
-\xe3\x47\xbb\x06\xd1\xe8\x8a\x8b\xb1\x3a\xc1\x71\x0a\x0a\x0a\xca\
-\x38\xff\x2b\x56\xac\xe0\xd0\xa1\x43\x2e\x39\xdc\x76\xb1\xf8\x5b\
-\xb7\x6e\xd1\xb6\x6d\xdb\x32\xe1\x8d\x95\x25\x81\xcd\x46\xbf\x4b\
-\xb3\xa7\x0a\xf8\x72\xee\x34\xde\xde\x7c\x83\xe6\xb1\x07\x39\x78\
-\xe6\x69\x56\xbf\xd4\x11\xa3\xbe\x18\xa3\x13\xc6\xa5\xa7\xa7\x3b\
-\xe6\x78\x61\x61\x21\xb3\x67\xcf\xe6\xd3\x4f\x3f\x75\x79\x5d\xb2\
-\x5a\xad\x1c\x3d\x7a\x94\x01\x03\x06\x38\xc8\x45\xe9\x30\xca\x0a\
-\xe1\x1d\xc3\xd3\x6f\x7c\x04\x14\x50\xb7\xc5\x00\x9a\x34\xaa\xc1\
-\xe5\x9b\xf9\xcc\x58\x32\x9d\x5a\x92\x99\xc2\x62\x03\xce\xf0\xb7\
-\xc2\x3b\x61\x95\x76\xd2\x37\x74\xe8\x50\xc7\x5d\x2e\x67\xfb\x4c\
-\x14\x45\x0c\x06\x83\x23\x44\xde\x2e\x1e\x5f\x79\xd4\xe0\xe5\x6f\
-\x7f\x24\xfd\xea\xcf\x4c\xe9\xff\x3c\x85\x8d\xfa\xa0\x95\x26\x33\
-\xb4\x63\x13\x94\x92\x99\xfc\x7c\xe7\xee\x87\xda\x37\x48\x44\x51\
-\xe4\xf2\xe5\xcb\x8c\x1b\x37\xce\x71\x4d\xc0\x95\xf9\x56\x54\x54\
-\xe4\x20\xb9\xf6\xd3\xef\x7f\x43\x92\x93\x6b\xd7\xae\x71\xe9\xd2\
-\x25\x16\x2e\x5c\x48\x60\x60\x20\x8d\x1a\x35\x62\xd7\xae\x5d\x8e\
-\x70\xcf\x3f\x93\x65\xfb\xf8\x11\x45\x91\xd4\xd4\x54\x2e\x5e\xbc\
-\xc8\xf3\xcf\x3f\x4f\xdb\xb6\x6d\x89\x8d\x8d\xe5\xd4\xa9\x53\x74\
-\xee\xdc\xf9\x9e\xc8\x8c\xeb\x81\x87\x04\xfe\xe3\xa0\xaa\x13\xcc\
-\xe5\x9f\xb7\x72\x6a\xdb\x61\xb0\x16\x30\xa6\x47\x63\x8a\x6f\xee\
-\xe3\xa7\xdf\x4e\x81\xaa\x3e\x72\x5f\xdf\x52\x0b\x33\x48\x36\x40\
-\x06\x65\xdf\xc5\x02\x08\x94\xdc\x2e\x97\x2c\xe0\x55\x97\xd9\x1f\
-\x2d\x66\x53\xa7\x17\xc9\x42\x40\x14\x6c\x18\x2d\x30\x7c\xde\x0c\
-\xde\xdc\x36\x95\xfd\xcb\x26\xf1\xa8\xf1\x59\x86\xb6\x0b\x63\xef\
-\x9a\x4f\x59\xbe\xf9\x37\x02\x7b\xbf\xcb\xc3\x81\x9e\xfe\xf0\xe0\
-\xde\x85\xfd\x05\x55\xa7\x4e\x1d\x7a\xf4\xe8\xe1\x38\x11\x74\xe5\
-\xa5\x6d\xb5\x5a\x09\x09\x09\xe1\x91\x47\x1e\x21\x26\x26\x86\x83\
-\x07\x0f\xba\xf6\xf2\x57\x37\xe2\xdd\x2f\xbe\x24\x5f\x67\x44\x94\
-\x7b\x13\x13\x08\xfe\x81\x5d\x78\xbc\x86\x19\x7f\x8d\xf3\x75\x6a\
-\xd7\xae\x1d\xa2\x28\xba\x95\xb6\xde\x68\x34\x52\xa3\x46\x0d\xe2\
-\xe3\xe3\x1d\x49\x21\x5c\x29\xcb\x37\x2c\x9e\x0f\xbf\xdf\x48\xa1\
-\x59\x40\x1d\x14\x41\xb0\x97\x84\xb2\xd9\x64\x5e\xaa\xab\x71\xa9\
-\xbd\x3b\x76\xec\xe8\x70\xe2\x5c\x0d\x2f\x2c\x2a\x2a\xe2\xfe\xfb\
-\xef\x27\x24\x24\x04\xb5\x5a\xed\x72\x48\x58\xcb\x7e\xe3\x58\xde\
-\xa4\x17\x7a\x93\x15\x9f\xb0\x18\x44\x64\x34\x69\xdb\x87\x58\xb3\
-\x73\xaf\x36\x49\x92\xf0\xf2\xf2\xa2\x53\xa7\x4e\x2e\x25\xbb\xf9\
-\x33\x9a\x34\x69\x42\x97\x2e\x5d\x1c\xce\xbc\x2b\xfd\xf6\xc0\xf8\
-\x85\x6c\xed\x99\x8b\xe8\xe5\x45\x9d\xea\x91\x80\x17\x13\xa6\x3e\
-\x4b\x50\x90\xca\xa5\xb1\xd4\xa5\x4b\x97\x32\x27\x79\xae\xa0\xb0\
-\xb0\x90\x1e\x3d\x7a\xd0\xb6\x6d\x5b\xd7\xc3\x9d\x05\x1f\x7a\x8f\
-\x7b\x85\xfa\x3d\x33\xb1\x5a\x2c\x88\x21\x71\x20\x28\x79\xf8\xa9\
-\x67\xb1\x05\xa8\x9d\x5a\x47\xec\x27\xd4\xbd\x7a\xf5\x22\x2d\x2d\
-\xcd\xed\x70\xd7\x1e\x3d\x7a\xd0\xa8\x51\x23\x4e\x9c\x38\xe1\x62\
-\x09\x3e\xfc\xf8\xe5\x12\x8a\xb5\x06\x14\xea\x20\x42\x25\x20\xb2\
-\x2d\x8b\xa6\x9a\x09\xd6\x38\x77\xa7\xca\x66\xb3\x11\x1a\x1a\x4a\
-\xf7\xee\xdd\xdd\x9a\x6b\x36\x9b\x0d\xb9\x5c\x4e\xbb\x76\xed\x08\
-\x0a\x0a\x72\x79\x1d\x09\xaa\xd1\x86\xd9\x5f\xfe\x40\x9e\x49\xa4\
-\x66\xfd\x9a\xc8\x01\x49\xdd\x86\xcf\x57\xd6\xc7\x95\x40\xd5\xe8\
-\xe8\x68\xba\x75\xeb\x86\x5c\x2e\x77\xeb\xc4\x49\xad\x56\xd3\xbf\
-\x7f\x7f\xaa\x55\xab\xf6\xaf\x3a\xb9\xda\xb0\x61\x03\x85\x85\x85\
-\x8c\x1a\x35\x0a\x95\x4a\xc5\xb5\x6b\xd7\x30\x18\x0c\x5c\xbf\x7e\
-\xdd\x11\xc5\x60\x9f\xa3\x26\x93\x89\xe4\xe4\x64\xd4\x6a\x35\xfe\
-\xfe\xfe\x8e\x70\xd9\x59\xb3\x66\xb1\x78\xf1\x62\xae\x5f\xbf\xce\
-\x86\x0d\x1b\x18\x37\x6e\x5c\x99\x7b\xc9\x1e\x78\x48\xa0\x07\x95\
-\x5e\x21\x7b\xb3\x7e\xe3\x07\x0c\x19\x3a\x85\xaf\xe6\x8e\xe5\xdb\
-\x37\x14\x58\x2d\x66\x24\xef\xea\xbc\xf0\xc1\x62\x6a\x46\xfe\x11\
-\xb7\x29\x59\x0d\x14\xeb\x0b\x40\x97\x87\xd5\xfa\x87\xb3\x61\xb3\
-\x98\x28\x2a\xca\x83\xdc\x62\xcc\x96\x92\xcf\xab\xdd\x37\x9a\xc9\
-\x83\x3e\x63\xee\x8f\xd7\x28\xcc\x2f\xc2\x6c\x82\x90\x96\x53\xf8\
-\x61\x75\x0e\x4f\x8c\x7d\x9d\x1f\x96\xbe\xc8\x86\xf7\xc1\x66\x83\
-\x66\xfd\x5e\xe0\xab\x15\x13\xf0\xf6\xf4\x86\x07\xff\x00\x34\x69\
-\xd2\x84\x4d\x9b\x36\x55\x19\xb1\xcc\xcc\xcc\xe4\xe3\x8f\x3f\x76\
-\xad\x00\x59\x00\x0d\x9a\xb5\xfa\xd3\x87\x81\x84\x39\x97\x84\x11\
-\x49\x92\x30\x18\x0c\xcc\x9e\x3d\xbb\x4a\xf4\xaf\xa0\x24\xe4\xd5\
-\x1d\xb1\x78\xb9\x97\x86\x26\x6d\xfe\x94\xce\x5f\x51\x8d\x1a\xbe\
-\xce\xb7\xb1\x5e\xaf\xe7\xd5\x57\x5f\x75\x39\x9c\xf0\xef\xca\xbc\
-\x71\xe3\x86\xcb\x12\x21\xfe\x61\x35\x69\x11\x56\xb3\xac\x1b\xae\
-\x09\xc2\xd9\x5b\x3f\x56\xab\x15\x7f\x7f\x7f\xe6\xcf\x9f\x5f\x65\
-\xb6\x79\x7b\x7b\xb3\x74\xe9\x52\x97\xc9\x52\x48\xcd\xfa\x84\x94\
-\x35\x8d\x48\x17\x12\x68\x08\x82\x40\x7e\x7e\x3e\xdb\xb7\x6f\xaf\
-\xb2\xb9\x2b\x93\xc9\x2a\xbc\x9b\x7a\x37\xb7\x23\xac\x46\x5d\xc2\
-\x6a\xd4\x2d\xfb\x0a\x8d\x70\xde\x36\xab\xd5\x4a\x4c\x4c\x0c\x2b\
-\x56\xac\xa8\x92\xfb\x8e\xf6\x7e\x5b\xb1\x62\x85\xcb\x2e\x55\xd3\
-\xa6\x2d\xca\x7e\xa4\xd4\x10\xe3\x42\xde\x13\xb3\xd9\x4c\x4c\x4c\
-\x0c\x9b\x36\x6d\xaa\x92\x53\x2d\xfb\x09\xbc\xab\xe3\x51\xe9\x1d\
-\x48\x93\xb6\xf7\x97\xfd\x50\xd4\x10\x17\xaf\x71\xa9\x2e\xb5\x6b\
-\xd7\x66\xeb\xd6\xad\x55\xd2\x67\xa2\x28\xa2\xd5\x6a\x5d\xca\x7a\
-\xfb\x4f\xc5\x6f\xbf\xfd\x46\xad\x5a\xb5\x98\x3a\x75\x2a\x5e\x5e\
-\x5e\xfc\xfe\xfb\xef\x7c\xf5\xd5\x57\x9c\x38\x71\x82\x3a\x75\xea\
-\x20\x49\x92\x23\xfa\x60\xfd\xfa\xf5\x7c\xff\xfd\xf7\x8c\x18\x31\
-\x82\xa8\xa8\x28\x36\x6f\xde\x4c\x40\x40\x00\xaf\xbf\xfe\x3a\xa2\
-\x28\xb2\x6b\xd7\x2e\xd6\xad\x5b\x47\x51\x51\x91\x87\x04\x7a\x48\
-\xa0\x07\xae\xa2\x4e\xf7\x67\x39\x91\x3d\x91\xeb\xc7\xf6\x72\xf8\
-\x42\x0a\x9a\x9a\x0d\xe9\xfa\x40\x2b\xfc\x55\x65\x17\x70\x31\xb2\
-\x3d\x5f\xef\x2d\xe0\x2b\x04\x04\xf1\x8f\xdf\x05\xd5\x6e\xc7\x86\
-\xd3\x06\x24\x01\xc4\x3b\x8b\xbe\x5c\x15\xc4\x9c\x1f\xae\x32\xdb\
-\x66\x43\x10\x44\xec\xef\x82\xb6\xc3\x5e\xe3\xda\x63\x33\x38\xb3\
-\xf7\x67\xce\xe7\x28\x69\xd5\xbe\x3d\xf1\xd5\x02\xf0\xa8\xbc\x78\
-\xf0\x4f\x42\xe9\x1d\x4b\x57\x43\xef\xec\xa2\xd5\xa2\x28\xde\x33\
-\x21\x40\xa2\x28\x3a\xb4\xef\xdc\xd5\x6d\x92\xc9\x64\xf7\x8c\x5d\
-\xf6\x3a\xd9\xdb\xba\x2a\xfa\xed\x5e\x12\x77\xb6\xb7\xb7\xbb\xfd\
-\xf6\xbf\x38\xd7\xfe\xdc\xff\xf7\x52\x9f\x95\xbe\x5b\xea\xee\xd8\
-\xbe\x57\x60\x1f\x47\xee\xce\x7f\xbb\x5d\xf7\xe2\xb8\x74\x77\x1d\
-\x29\x3d\x06\xfe\x4d\xf2\x10\xbf\xff\xfe\x3b\x27\x4f\x9e\xa4\x6f\
-\xdf\xbe\x4c\x9e\x3c\x19\x99\x4c\x46\xa7\x4e\x9d\x58\xb9\x72\x25\
-\x17\x2e\x5c\x20\x22\x22\x02\x99\xbd\xb9\x90\x00\x00\x20\x00\x49\
-\x44\x41\x54\x6f\x6f\x6f\xe6\xce\x9d\xcb\xdc\xb9\x73\xb1\x5a\xad\
-\xb4\x6e\xdd\x9a\x39\x73\xe6\x70\xfe\xfc\x79\xd2\xd2\xd2\x68\xd1\
-\xa2\x85\xe3\x7e\x79\x74\x74\x34\xbf\xfc\xf2\x0b\x5f\x7f\xfd\x35\
-\xb3\x67\xcf\xf6\x38\x26\x1e\x12\xe8\x81\xeb\x50\x50\xf7\xbe\xee\
-\xd4\xbd\xef\x2e\x8b\x96\x28\xfe\x2d\x61\x13\x44\xe1\x6f\x3f\xff\
-\xbb\x97\xae\x20\x53\xd3\xac\xdb\x40\x9a\x79\x1a\xdd\x83\x7f\x20\
-\x76\xef\xde\xcd\xa0\x41\x83\xf0\xf6\xf6\x76\xe9\xbe\x8b\xdd\xc1\
-\xb1\x67\xa9\x7c\xee\xb9\xe7\x2a\x79\xef\xea\x6f\x60\x33\x92\x96\
-\x98\x84\x5e\x11\x44\xad\xa8\x20\x44\x24\xf4\xda\x02\xf4\x16\x19\
-\x01\x01\x1a\x2a\xeb\xf2\x0a\x82\x80\x5a\xad\xe6\xe9\xa7\x9f\x66\
-\xc7\x8e\x1d\x6e\x8b\x17\x9b\xcd\x66\x64\x32\x19\x2b\x57\xae\x74\
-\xc3\x71\xb7\x92\x9d\x9a\x40\xa1\xd5\x87\xa8\xa8\x70\x54\x32\xb0\
-\xea\x32\xc8\x35\xf9\x13\x1a\xa0\x72\xaa\xad\x7d\x7d\x7d\x19\x36\
-\x6c\x18\xdb\xb7\x6f\x77\x2b\xdd\xba\x20\x08\x14\x17\x17\x13\x11\
-\x11\xc1\x3b\xef\xbc\xe3\xb8\x5b\xe8\x2c\xac\xc6\x62\x92\x53\x52\
-\x11\xd5\x61\x54\x8f\xf0\x47\x40\xc2\xa8\x2b\x44\x6f\x55\x12\xa0\
-\xa9\x7c\x4c\x84\x5c\x2e\x27\x27\x27\x87\x7e\xfd\xfa\x71\xe8\xd0\
-\x21\xd4\x6a\xb5\x5b\x44\xa9\xb8\xb8\x98\x61\xc3\x86\x11\x12\x12\
-\xe2\x72\x39\x16\x5d\x3e\x89\x29\x99\x78\x05\x45\x12\x11\xac\x41\
-\x86\x44\x4e\x56\x0e\x7e\x41\xc1\x28\x64\xce\xdd\xc1\x0c\x0d\x0d\
-\x45\xa3\xd1\x10\x1c\x1c\xec\xf6\x9d\x9f\xa2\xa2\x22\x46\x8c\x18\
-\xe1\xb8\x17\xe8\x0a\x8c\xba\x3c\x52\x52\xb3\xf1\x09\xae\x46\x58\
-\xa0\x0f\x48\x36\xf2\x72\x72\xf0\x0b\x0e\x45\xee\x44\x91\x72\xb9\
-\x9c\xb3\x67\xcf\xf2\xd4\x53\x4f\x91\x91\x91\xe1\x96\x8e\x99\xcd\
-\x66\xc3\x68\x34\xb2\x78\xf1\x62\x37\xca\x91\x48\xba\x79\x03\x8b\
-\x77\x20\xd1\x91\xc1\x88\x80\xb9\xb8\x88\x22\x49\x8e\xc6\xc7\x1b\
-\x85\x13\xb6\x79\x79\x79\x71\xe6\xcc\x19\x7a\xf5\xea\x45\x40\x40\
-\x80\xdb\x44\x30\x39\x39\x99\xeb\xd7\xaf\xbb\x3e\xae\x6d\x16\x8a\
-\x32\x53\xc8\xd6\x49\x04\x86\x57\x23\xd0\x47\x89\x45\x97\x4b\x86\
-\xd1\x97\xa8\x40\xa5\xd3\xf3\xff\xe4\xc9\x93\x74\xee\xdc\x19\x8d\
-\x46\xe3\x56\xd4\x84\xd5\x6a\x45\xa5\x52\xb1\x70\xe1\xc2\xca\xdd\
-\xdf\xfc\x1f\x80\xc1\x60\xa0\x73\xe7\xce\x0c\x19\x32\xc4\xd1\x9f\
-\x61\x61\x61\xbc\xf0\xc2\x0b\x04\x07\x07\xe3\xe7\xe7\xc7\xa0\x41\
-\x83\x30\x18\x0c\x68\x34\x1a\xda\xb4\x69\x43\xff\xfe\xfd\xf1\xf7\
-\xf7\xe7\xd0\xa1\x43\xf4\xec\xd9\x93\x31\x63\xc6\x38\xca\x6b\xdc\
-\xb8\x31\x13\x26\x4c\x40\xaf\x2f\xc9\xaa\xec\xed\xed\xcd\xc0\x81\
-\x03\x69\xd8\xb0\xa1\xc7\x51\xf1\x90\x40\x0f\x3c\xf0\xc0\x83\xaa\
-\x47\x51\x51\x11\x05\x05\x05\x0c\x1b\x36\x8c\x46\x8d\x1a\x95\x91\
-\x7a\x70\xc6\x09\x3c\x7f\xfe\x3c\x2b\x57\xae\x44\xab\xd5\x3a\x76\
-\x96\x9d\x25\x27\x09\x7b\xd7\xf0\xd9\xae\x0b\x64\xdd\x2e\xa2\xef\
-\xe2\x4f\xe9\x1b\x91\xcf\xa6\x8f\x5e\x27\x29\xbc\x27\x53\x47\xf5\
-\xa8\xd4\x9d\x17\xfb\x77\x0b\x82\x40\x4e\x4e\x0e\x05\x05\x05\x2c\
-\x5d\xba\xd4\xe5\xec\xa0\x4a\xa5\x92\xbd\x7b\xf7\xb2\x7e\xfd\x7a\
-\xc7\x5d\x17\x57\x1c\xb8\xbc\x84\x03\x2c\x59\xf0\x2d\x16\xff\x48\
-\x3a\xf4\x1f\xc3\x23\xf7\xd7\x64\xc3\x9b\x93\xb8\xdc\xe4\x4d\x5e\
-\x7d\xbc\x72\x3a\x86\x76\x27\x4d\x10\x04\xb2\xb2\xb2\xf0\xf1\xf1\
-\x61\xf2\xe4\xc9\xf8\xf8\xf8\xb8\x74\x7f\x4e\xa3\xd1\xb0\x64\xc9\
-\x12\x52\x53\x53\x1d\x61\x7c\xce\x13\x4a\x0b\xc7\x76\x6e\xe0\x3f\
-\xc7\x4e\x91\x96\xe9\xc5\xa4\xf9\xf3\x69\xe2\x57\xc8\xe6\x8f\xe7\
-\xa0\x6d\x32\x8e\xd1\x3d\x1a\x55\xaa\x14\xfb\xf7\x5a\xad\x56\xb2\
-\xb3\xb3\x89\x8b\x8b\xe3\xb1\xc7\x1e\x73\xa9\xad\xed\x19\xf9\xd6\
-\xad\x5b\x47\x6a\x6a\x2a\x81\x81\x81\x2e\xdb\xf6\xf3\x37\xef\xb2\
-\x27\x41\x42\xa6\xd0\xd0\x65\xf4\x4b\xf4\xf4\xfd\x8d\x57\x5e\xdb\
-\xc1\xac\xd7\x5f\xa5\x66\x90\xb2\xd2\xf5\xb1\x7f\xbf\xc9\x64\xa2\
-\x79\xf3\xe6\xf4\xee\xdd\xdb\xa5\xb9\x06\xe0\xef\xef\xcf\xd4\xa9\
-\x53\xc9\xcd\xcd\x2d\x53\xb6\x53\x64\x42\x97\xc2\xcf\x6b\xbf\x65\
-\xff\xb9\x34\xc4\x88\xe6\xcc\x9a\x32\x12\xaf\xbc\x63\xcc\x9e\xb7\
-\x91\x79\x1f\x2f\x24\xac\x92\x7c\xc0\x3e\xdf\x8c\x46\x23\x39\x39\
-\x39\xf4\xe9\xd3\x87\xa6\x4d\x9b\xba\xbc\x1e\x19\x8d\x46\x16\x2c\
-\x58\xe0\xd0\xf1\xb3\x9f\x0a\x3b\x83\xe2\x84\xc3\xac\x59\xff\x2b\
-\x79\xe9\xb9\xf4\x79\x6e\x21\xed\x6b\x2a\xf9\x6d\xfd\x4a\xf6\xfb\
-\x34\x64\xf4\x80\x6e\x54\xab\x24\xc3\xb5\xaf\x23\x06\x83\x01\xad\
-\x56\xcb\xec\xd9\xb3\x5d\xbe\x3b\x2b\x8a\x22\x45\x45\x45\xcc\x99\
-\x33\x07\x93\xc9\xe4\x1a\x09\x94\x6c\x64\x5e\x3a\xc0\x82\xf7\x7f\
-\xc4\x80\x44\x64\xe7\xc7\x98\x31\xac\x23\x87\x97\x4f\xe7\x4b\x9f\
-\xd9\x7c\x33\xbe\x8e\x53\x73\x04\x4a\x92\x16\x59\x2c\x16\x46\x8d\
-\x1a\x45\x64\x64\xa4\xcb\xd9\x41\x33\x32\x32\xf8\xe8\xa3\x8f\x1c\
-\xf7\xaf\xef\xa5\x88\x90\xff\x0b\x48\x92\x44\x87\x0e\x1d\xe8\xd0\
-\xa1\x43\x99\xcf\x83\x83\x83\x59\xbc\x78\xb1\xe3\xe7\xcf\x3e\xfb\
-\xec\x6f\x9f\x7d\xe0\x81\x07\xca\x24\xad\x82\x12\xdd\xd7\x85\x0b\
-\x17\x3a\xfe\x4d\x70\x70\x30\x3f\xfe\xf8\xa3\xc7\x49\xf1\x90\xc0\
-\xff\xcd\x09\xe4\x81\x07\x1e\xfc\xdf\x23\x23\x23\xe3\x2f\x04\x28\
-\x20\x20\x00\xb3\xd9\x8c\x52\xa9\x44\x92\x24\xea\xd4\xa9\xc3\x73\
-\xcf\x3d\x47\x6c\x6c\xac\xcb\xdf\x73\xf5\xea\x55\x56\xad\x5a\xe5\
-\x78\xf9\xe7\xe5\xe5\x91\x94\x94\x74\xd7\x75\xa0\x46\x8d\x1a\x0e\
-\x67\xe1\xd4\xc9\x2c\x06\x4c\x5f\x42\x8d\xaf\x3a\x30\x78\x5d\x3a\
-\xdd\x7b\x9f\x63\xf3\xde\x44\xee\x1b\x6a\x40\x02\xb4\x45\x45\xe4\
-\xe6\xe5\x95\xeb\x5c\xd8\x89\x9f\xc1\x60\x70\x38\x22\x21\x21\x21\
-\x95\x96\xaa\x28\x0f\xde\xde\xde\x6c\xde\xbc\xd9\xe1\x14\xe6\xe7\
-\xe7\x93\x97\x97\x57\x6e\x26\x4d\x7b\x82\x93\xd2\x27\x3e\xb6\xb4\
-\xe3\x34\x1d\xfa\x26\xad\x6d\xdb\xf9\xe9\xcc\x61\x2e\xda\x0e\xb3\
-\x29\xc9\x40\x5c\x9d\x92\x5d\x5f\xad\x56\x4b\x4e\x4e\x4e\xb9\xce\
-\xbc\x42\xa1\x20\x25\x25\xc5\xe1\x80\x2a\x14\x0a\x1a\x34\x68\xc0\
-\xcc\x99\x33\xdd\xb2\x2d\x2d\x2d\x8d\x25\x4b\x96\x38\xc2\xc1\x0a\
-\x0a\x0a\xc8\xce\xce\x76\xec\x46\x97\x47\xfa\x23\x23\x23\xef\xfc\
-\x64\x20\xd7\xa6\x66\xdc\xec\x77\xb9\x36\xb7\x03\x3b\x2f\x59\x08\
-\x37\x7f\xcd\x37\x07\x8a\x19\xda\xbc\x64\xdc\x65\x65\x65\xdd\xf5\
-\x8e\x5f\x4e\x4e\x8e\xa3\x7d\x2d\x16\x0b\x7d\xfb\xf6\x65\xda\xb4\
-\x69\x6e\xd9\xa6\xd5\x6a\x39\x7e\xfc\xb8\x63\xbc\xa4\xa6\xa6\xe2\
-\xe3\xe3\x53\xa1\x2e\x9b\xb7\xb7\xb7\x43\xe3\x0b\x8a\xb9\x5a\x14\
-\xc2\xfc\xb7\xa7\xf0\xc3\x3b\x53\xd8\xfa\xc3\x7e\x04\xaf\x1d\x5c\
-\xcd\xd0\x52\xa2\x12\x21\x91\x79\xc7\xb6\xf2\xc6\xa4\x5a\xad\x26\
-\x27\x27\xe7\x2f\xd2\x00\xa5\x25\x23\x5c\xc1\xa2\x45\x8b\x1c\xdf\
-\x69\x36\x9b\x49\x4b\x4b\xc3\xdf\xdf\xbf\xdc\xa4\x1c\xf6\xbb\x49\
-\xf6\xbb\x46\xd6\x82\x1c\x0c\xf2\x50\x66\x2f\x79\x9e\x0f\x5f\x9e\
-\x8b\xd1\x92\xc7\xae\x0f\x97\x70\x45\xd7\x00\x41\x02\xab\xc5\x4c\
-\x56\x76\x4e\x85\x44\x55\x26\x93\x91\x91\x91\xe1\xa8\x47\x40\x40\
-\x00\xa3\x46\x8d\xa2\x63\xc7\x8e\x2e\xdb\x65\x36\x9b\xd9\xbf\x7f\
-\xbf\x83\x28\xe9\xf5\x7a\x12\x13\x13\xef\x7a\x2a\xe8\xeb\xeb\xeb\
-\x20\xfb\xd7\x4e\x5c\x66\xca\x73\xaf\x92\xb1\x63\x12\x2b\x77\x5e\
-\xa1\xfd\x70\x0d\x07\x76\xed\x26\xa9\x53\x1c\x56\xc0\x6c\x32\x91\
-\xf1\x27\x21\xf3\xbf\x23\x7f\x76\x11\x77\xfb\x9c\x9c\x3e\x7d\xba\
-\x5b\x27\xb8\x26\x93\x89\x0f\x3e\xf8\xc0\xf1\xb3\x4e\xa7\x73\x24\
-\xd2\xa9\xc8\x27\x0a\x09\x09\xc3\xdb\xdb\x0b\x04\x91\xa2\xb4\x24\
-\x14\x03\xde\x60\x6e\xc3\x0b\x3c\xf3\x79\x26\x05\x37\xf7\xb0\xed\
-\x3f\xa7\xc8\xed\xf9\x87\x3c\x4f\x6e\x6e\xee\x5d\x89\xad\x3d\x33\
-\xa9\xcd\x66\x23\x3e\x3e\x9e\xa9\x53\xa7\x12\x16\x16\xe6\xd6\x7b\
-\xe6\x8b\x2f\xbe\x70\x94\x9f\x9d\x9d\x4d\x62\x62\x62\x99\x79\x61\
-\x8f\x62\x08\x0c\x0c\xfc\xc7\x13\x44\x77\xc3\x66\xff\x2f\xcb\xf7\
-\xc0\x43\x02\xef\xf9\xc9\xe3\xb9\xf4\xea\x3a\xdc\x09\xff\xf2\xe0\
-\xdf\x05\x9b\xcd\xc6\xde\xbd\x7b\xc9\xca\xca\x72\xbc\x54\x04\x41\
-\xc0\xc7\xc7\x07\xad\x56\xeb\xd0\x9c\xb3\x6b\xaa\xb9\x83\xd2\x4e\
-\xbe\x5c\x2e\xe7\xc2\x85\x0b\x6c\xdd\xba\xb5\x42\xe7\xc6\x62\xb1\
-\x30\x69\xd2\x44\xce\x5e\xb8\xce\xa9\x1b\xc9\x0c\x7c\xfa\x25\x0c\
-\x67\x7e\xe0\xf5\x33\xb1\x4c\x9a\xee\xc5\x91\x8b\x19\x3c\xf1\xf4\
-\x18\x24\xbd\x05\x05\x70\xe5\xc6\x0d\xf6\xed\xdf\x5f\xee\xc9\x80\
-\xdd\x69\xcc\xcb\xcb\x73\xcc\x91\xaa\xd8\x70\x2a\x4d\xa2\x65\x32\
-\x19\x17\x2f\x5e\x64\xcb\x96\x2d\x14\x15\x15\xfd\xed\xcb\xda\x6a\
-\xb5\x12\x19\x19\x49\xcf\x9e\xdd\x49\xde\xfd\x1d\x1b\x8f\x27\x12\
-\xdf\xff\x39\x1e\x0e\xbf\xc2\xdb\x4b\x2f\xd2\xaa\x73\x47\xf6\xa5\
-\x45\x31\x7f\xc6\xc3\x6c\xbd\x50\x12\x3a\x7b\xeb\xd6\x2d\x7e\xf9\
-\xe5\x17\xbc\xbd\xbd\xcb\x25\x5e\xb9\xb9\xb9\x7f\x11\x1d\x37\x9b\
-\xcd\x2e\x87\xf1\xfe\xd9\x36\x49\x92\x38\x77\xee\x1c\x9b\x37\x6f\
-\x2e\x97\xb4\xd9\x6c\x36\x02\x03\x83\x78\xe2\x89\xc1\x1c\x59\xb5\
-\x94\xbd\x05\x51\x0c\x7c\x72\x28\xa9\x3b\x3e\x61\x75\xfe\x03\x4c\
-\x08\x3a\xc7\xb7\x3b\x82\x78\x69\xfe\x44\x6c\xd9\x25\x6d\x73\xe4\
-\xe8\x51\x12\x13\x12\x2a\xac\x87\xd1\x68\x44\x2e\x97\x97\x21\x36\
-\x16\x8b\xc5\x65\xa7\xdb\x62\xb1\x60\x36\x9b\x1d\xe5\xd9\x6c\x36\
-\x7e\xfd\xf5\x57\x2e\x5e\xbc\x58\xee\x49\x8e\xd5\x6a\xa5\x6e\x6c\
-\x2c\x9d\x9b\x47\xb3\xea\x9b\xef\xf1\x6a\x33\x81\x71\x93\x27\x72\
-\x66\xf5\x9b\xec\x49\x0f\xa7\x41\x6c\x26\xda\xea\xfd\x78\x44\x7e\
-\x89\xc8\x00\x39\x26\xb3\x99\x43\x87\x0e\x91\x94\x94\x54\xee\x98\
-\x54\xa9\x54\x9c\x3a\x75\xaa\x0c\xf1\x74\xf5\x04\xb0\xbc\x8d\x54\
-\xad\x56\xcb\x9e\x3d\x7b\xb8\x72\xe5\x4a\xb9\x04\xd7\x64\x32\xd1\
-\xb6\xdd\x03\xb4\x6b\x1c\xca\xb6\x15\xdf\x72\xc5\x27\x9e\x51\xc3\
-\x06\x71\x6e\xcd\x3b\xe4\x87\xc6\x93\xf8\xe3\x27\x24\xb5\x9a\xcd\
-\x98\xfa\x67\xf1\x93\x43\x7e\x76\x3e\xbb\x77\xef\x2e\x23\xdd\xf1\
-\x77\x24\xf0\xc2\x85\x0b\x8e\x3e\x92\x24\xc9\xed\xa4\x20\x3a\x9d\
-\xce\x21\x53\x23\x8a\x22\x19\x19\x19\x6c\xdf\xbe\xbd\xc2\x31\x2e\
-\x08\x02\x8d\x9b\x34\xa6\x7e\x98\x9a\x6f\xd6\xfd\x44\xe3\x01\xe3\
-\xf1\xd9\xf5\x29\x8b\x7e\xf2\x62\xd4\xf4\x70\xce\x1d\xfe\x95\xd0\
-\x26\x7d\x88\x6c\x1d\x4f\x94\x5c\x20\x27\x33\x9f\xad\x5b\xb7\x56\
-\x78\xa2\x27\x8a\x22\xd7\xaf\x5f\x27\x26\x26\xa6\xcc\x1a\xe7\xeb\
-\xeb\xeb\xb2\x6d\xa5\x75\x02\xed\xd2\x3c\x9b\x37\x6f\xc6\x66\xb3\
-\x95\xb3\x4e\x49\x48\x92\xc8\x63\xc3\x7a\x71\x62\xfd\x66\x7e\xcd\
-\x90\x31\x64\xe4\x38\x16\x86\xe5\xb0\xed\x93\x3d\xd4\x8f\xae\xc1\
-\x86\xf5\x69\x3c\xf9\xec\x04\x96\xe5\x97\x6c\x5c\xdc\x4e\x48\x60\
-\xef\x9e\x3d\x15\xd6\xc3\x2e\x4f\x60\x0f\xdb\xb7\xd9\x6c\x55\xba\
-\xfe\x2b\x14\x0a\x4e\x9e\x3c\xf9\x97\xb5\xcc\x6c\x36\xd3\xb8\x71\
-\x63\x3a\x74\xe8\x80\x52\xa9\xc4\x03\x0f\x3c\xf8\x17\x92\x40\x83\
-\xc1\xc0\xac\x59\xb3\xf8\xf8\xe3\x8f\xab\x2c\x93\xd8\xbf\x05\xa2\
-\x28\x92\x96\x96\x56\xe1\xce\xb3\x07\x1e\x94\x1e\x2f\xbd\x7b\xf7\
-\xfe\x8b\xf6\x9f\xbf\xbf\x3f\x6f\xbe\xf9\x66\x19\x67\xce\x9d\x7b\
-\x3c\x40\x99\x17\xbe\xc5\x62\xa1\x45\x8b\x16\x0c\x1d\x3a\xb4\xc2\
-\x0d\x0b\x49\x92\x50\x28\x14\x88\x82\x80\xd2\x27\x04\xf1\xd6\xf7\
-\xcc\xfb\xf6\x12\xcf\xbc\xbe\x94\x28\xdb\x61\xba\x8e\x78\x92\x6c\
-\x9f\x70\x42\x9a\xf4\xa1\x7a\xfb\xce\x34\x6c\xd0\x80\xe8\x5a\xb5\
-\x2a\x1c\xfb\x19\x19\x19\xac\x5e\xbd\xda\x8d\xf0\xc6\xbf\xa2\xb4\
-\x03\x6a\xb5\x5a\x69\xde\xbc\x39\x43\x87\x0e\x2d\xd7\x71\x2a\xd1\
-\x17\x54\xe0\xe3\xe3\x85\x20\xca\x51\x2a\xd5\x98\x0c\xe9\xbc\xbb\
-\xf0\x6b\xfa\xcd\x7a\x17\xff\xb3\x5f\x31\x7a\xe6\x4b\xbc\x53\x98\
-\x4e\x9a\xe6\x08\xa3\x07\xac\xa1\x5e\xbd\x78\xaa\x57\xaf\x5e\x6e\
-\x7d\x65\x32\x19\x29\x29\x29\xbc\xf5\xd6\x5b\x65\x3e\x73\x87\x00\
-\xda\x49\x8a\x24\x49\x0e\x7d\xaf\x16\x2d\x5a\x30\x7c\xf8\xf0\x72\
-\x9d\x79\xbb\x2e\xa4\x64\x32\x23\x2a\x94\xa8\xd5\x6a\x4e\x6d\x58\
-\xc9\xc9\x6c\x05\xb3\xe6\xbf\x46\xce\xa6\xe9\xcc\x9a\xb7\x8e\xb0\
-\x77\x94\xd4\x79\x78\x1c\x5f\xb6\x6b\xce\x83\x5d\xbb\x60\x32\x57\
-\x9c\x36\x3e\x35\x35\x95\xb9\x73\xe7\x3a\x9c\x61\x2f\x2f\x2f\xb7\
-\x4e\x5d\xe4\x72\xb9\xe3\xa4\xdb\x3e\x0e\xfa\xf6\xed\x4b\x7c\x7c\
-\x7c\xb9\xce\xbf\x24\x49\x78\xa9\xbc\xb0\xe6\xdd\x46\x26\xf7\xc2\
-\xdb\x57\xc1\xc5\x55\xaf\xf0\x5e\xda\x7d\x7c\x31\xe7\x01\x56\xbe\
-\x3e\x9d\xa7\xe7\xec\xc7\x94\x97\xce\xd6\xfc\x86\xfc\xe7\xe5\x36\
-\x74\xef\xde\xbd\x42\x6d\x4d\x95\x4a\x85\xc5\x62\x61\xe7\xce\x9d\
-\x7f\x3b\x9e\xdc\x99\xdb\x76\xf8\xf9\xf9\xd1\xbb\x77\x6f\x1a\x35\
-\x6a\x54\xe1\x49\xa0\xca\x5b\x0d\x96\x14\x64\x0a\x05\xfe\x3e\x26\
-\xb6\x7c\xbe\x8c\xb3\x86\xba\xcc\x79\xf1\x3e\x9e\x8d\x6b\xc7\x76\
-\xdb\x57\xc8\x8a\x8d\xfc\x96\x5b\x9b\x65\x53\x3a\xd0\xaf\x5f\xbf\
-\x0a\x89\x92\x20\x08\xfc\xfa\xeb\xaf\x6c\xdf\xbe\xdd\x91\x54\xc4\
-\xdd\x75\xc4\xde\xef\x92\x24\x61\xb3\xd9\xa8\x56\xad\x1a\x8f\x3d\
-\xf6\xd8\x5d\xef\x99\xa9\xbc\x95\xe4\xdf\x38\x83\x42\xe5\x43\xa8\
-\xf6\x38\x6f\x9f\xf3\xe7\xb5\x85\x6f\xe1\x5f\x74\x8b\x67\x9f\x1f\
-\xc7\xda\x44\x15\x9a\xf7\xbe\x64\x79\x9f\xa9\x1c\xfe\xe4\x51\x86\
-\x0d\x1b\x76\xd7\xf6\x3d\x7e\xfc\x78\x99\x39\xee\xae\x6d\x2a\x95\
-\xaa\xcc\x66\x5c\x74\x74\x34\x23\x46\x8c\xa8\x50\x52\x41\x92\x20\
-\x20\x40\xc5\x0d\xb9\x02\xa5\x52\xf1\xff\xd8\x3b\xef\xf0\xa8\xaa\
-\xad\x8d\xff\xce\xf4\xf4\x9e\x10\x02\xa4\x40\x68\x12\x08\x1d\xe9\
-\x55\x44\x90\x2e\x4d\x7a\x53\x14\x14\x41\x8a\x52\x44\x10\x45\x8a\
-\x48\x13\xf5\x22\x22\x88\x14\x95\xde\x41\x40\x5a\x24\x40\x28\x01\
-\x02\x84\x40\xa8\x49\x48\xef\x99\xfe\xfd\xc1\x9d\xb9\x09\x92\x32\
-\x67\xe2\xfd\xf4\xfb\xce\xfb\x3c\x3c\xc0\xc0\xec\xec\xb5\xf7\x3e\
-\xfb\xac\x77\xaf\xb5\xd7\x8b\x29\x33\x86\x77\xfa\xbf\x83\xc7\xa0\
-\xd9\x4c\xaa\x76\x96\x1a\xef\xad\xc0\xc5\xc3\x4c\x2a\xdf\xd1\xae\
-\xc1\x79\x5e\xaf\x55\x8d\x4a\xa5\x54\xaf\x95\xc9\x64\xec\xde\xbd\
-\xdb\x1a\x31\x94\xc9\x64\x76\xdf\x9b\x76\x70\x70\x28\x72\x80\xd3\
-\xae\x5d\x3b\x5e\x7f\xfd\xf5\x3f\x45\x02\x55\x2a\x55\xb9\xac\x7f\
-\x09\x12\x24\x12\xf8\x0f\x84\xe5\x85\x1c\x15\x15\x45\x54\x54\x94\
-\x34\xf3\x12\x24\xfc\xc5\x28\xee\xe4\xda\x12\xb9\x90\xcb\xe5\xdc\
-\xbd\x7b\x97\x25\x4b\x96\xf0\xc2\x0b\x2f\x88\xba\x3b\x67\x89\x8e\
-\x59\x22\x1c\x96\xb4\x3a\x37\x37\xb7\x32\x91\xb0\xfa\xf5\x6a\xd3\
-\x20\x3c\x8b\x15\x63\xbe\x20\xa4\xf9\x6b\x64\xde\x8b\x42\x1e\xda\
-\x81\xe8\x6c\x03\x91\xdb\xb7\x73\x2d\xc5\x40\x8d\x8a\xae\xa8\xa0\
-\xd4\x13\xe4\xbc\xbc\x3c\x2b\x79\xb0\x88\x16\xaf\x5a\xb5\x4a\xf4\
-\x49\xb7\x4a\xa5\xe2\xf4\xe9\xd3\x56\x67\xd8\x6c\x36\xa3\xd1\x68\
-\x50\xa9\x54\x65\x3a\xcd\xae\xd1\x6d\x34\x35\x5e\x15\x88\x59\x3f\
-\x88\x7d\x9e\xaf\xa0\x4e\x8a\xc1\xa5\xe1\x00\xce\x5e\x7b\x87\xfc\
-\x0b\x9f\xf0\xe5\xc5\x57\x71\x54\x01\xa8\xf0\x28\xa5\xb0\x83\x8b\
-\x8b\x8b\xd5\xa9\x32\x9b\xcd\x5c\xbb\x76\x8d\x79\xf3\xe6\x89\xbe\
-\x13\xe8\xe6\xe6\xc6\xbf\xfe\xf5\xaf\x22\x0e\xa0\x46\xa3\xb1\xfe\
-\x2a\x0d\x4d\x06\x4c\xa2\x89\xf6\x3e\xab\x96\x7e\x4b\xa8\x7f\x3d\
-\xee\x5e\x3b\x4f\xcd\xfe\xcb\x29\x18\xba\x88\x1b\x17\x8f\x70\x2d\
-\xc9\x9b\x60\x15\xa0\x72\x2a\x55\x32\x27\x3b\x3b\xdb\xfa\x7e\xd0\
-\x68\x34\x6c\xdd\xba\x15\x95\x4a\x65\xd7\x9d\xc0\x3d\x7b\xf6\x50\
-\xb9\x72\x65\x6b\xbb\x2e\x2e\x2e\xb8\xb8\x94\xa1\x94\xbe\x7f\x2d\
-\x46\x4d\x9a\x81\xa0\x4b\x60\xd4\xc2\x3b\x0c\x1b\xdf\x97\xf3\xd1\
-\x49\x74\x99\xb4\x96\xf1\x8b\x14\x2c\x5d\xbc\x82\x81\x6f\x84\x97\
-\xf8\x7c\x15\xc6\xb3\x05\x6e\xf6\xed\xdb\x67\x8d\xe2\x8a\x81\x87\
-\x87\x07\xf7\xee\xdd\xa3\x51\xa3\x46\x56\x52\xee\xe2\xe2\x82\x93\
-\x53\x19\x44\x39\xd4\xc1\x74\x79\x7b\x1a\xa9\xd1\x87\x59\xf9\xf5\
-\x61\x1a\x74\x6d\x49\xf4\xb9\x3c\xbe\x8f\x79\x88\xc1\xa0\x67\xed\
-\xaa\x55\xf4\x7f\xab\x95\x75\xbc\x4a\x83\x93\x93\x93\xb5\x0f\xa9\
-\xa9\xa9\x7c\xf3\xcd\x37\x9c\x3d\x7b\x56\xf4\x7e\xa5\xd3\xe9\x88\
-\x88\x88\xa0\x63\xc7\x8e\xd6\x43\x22\x37\x37\xb7\x32\x15\x1b\xf1\
-\xab\xd5\x94\x09\xb5\x9a\xf1\xdb\xaa\x19\xf4\x0b\xad\x4f\xfc\xd5\
-\x2b\x54\xae\x51\x97\x1f\x2e\x67\x33\xef\xc8\x4e\x76\xca\x02\x78\
-\xbd\x65\x03\xe4\x32\x19\x6e\x6e\x6e\x65\x22\xa4\x85\xf7\x8d\x05\
-\x0b\x16\x88\xbe\x13\x28\x97\xcb\xc9\xce\xce\xb6\xa6\x3d\x5b\x0e\
-\x03\xca\x34\x67\x40\xd3\x81\xe3\x68\x62\xd0\x71\x76\xc3\x5c\x2e\
-\x34\x79\x8b\x77\xab\xaa\xb8\xee\x39\x8c\xbb\x69\x33\x50\x47\x7e\
-\x49\xbf\x4b\xbd\x78\xbd\xc6\xd3\x7d\xc4\xcd\xad\xf4\x7d\xc9\x42\
-\xc4\x14\x0a\x05\xb1\xb1\xb1\x2c\x5d\xba\x94\x0a\x15\x2a\xd8\x75\
-\x27\x30\x27\x27\xc7\x9a\x56\x6e\xd1\xc2\x93\x0e\xab\x25\x48\x90\
-\x48\x60\x11\x87\x74\xf4\xe8\xd1\x0c\x1a\x34\xc8\x2e\x01\xe7\xff\
-\xcf\xd0\x68\x34\x1c\x38\x70\x80\x9c\x9c\x1c\xe9\x6e\xa5\x84\x72\
-\x79\x26\x7d\x7d\x7d\xf9\xf5\xd7\x5f\xd9\xb2\x65\x8b\x68\xa9\x01\
-\x85\x42\x41\x60\x60\x20\xae\xae\xae\x36\x3b\x49\x4f\x7f\xa4\x92\
-\x8e\xa3\x47\x12\x75\xfd\x1e\xb1\x37\x13\xa9\xe2\xd9\x80\xb0\x8a\
-\x6e\x54\x7f\xb1\x29\xbe\x5a\x19\xb6\x26\x0f\x59\x44\x9e\xfd\xfc\
-\xfc\xf8\xf0\xc3\x0f\x45\x47\x04\x2d\x8e\x68\x50\x50\x90\xb8\x13\
-\xec\x7f\x8f\xa7\x4f\xbd\x61\xb4\x35\x3c\xe2\x4a\xf4\x4d\x6a\x39\
-\xf8\x52\xb9\x22\x28\x83\x5f\xe3\x35\x2f\x5f\x51\x7d\xaa\x50\xa1\
-\x02\x7a\xbd\x9e\xa5\x4b\x97\x62\x32\x99\x44\xcd\x9b\xc9\x64\xc2\
-\xd9\xd9\x99\x2a\x55\xaa\x58\xa3\x2f\x36\x43\xe9\x41\xeb\xd6\x2d\
-\x88\x8a\x79\x4c\x6c\x6c\x3e\xbe\x55\x1b\x50\xa1\xa2\x9a\x0a\xc1\
-\x0d\x70\xad\x6c\xbb\x5a\xaa\x5c\x2e\xc7\xcf\xcf\x8f\x98\x98\x18\
-\x3e\xfd\xf4\x53\xbb\xd6\xb6\x4c\x26\xa3\x79\xf3\xe6\xa2\xaa\x1e\
-\x0a\x00\x0a\x37\x86\x0f\xee\xc5\xad\x5b\xd7\x30\xa9\x3c\x51\xb8\
-\x55\xa6\xaa\xbf\x07\xdd\x7b\xbc\x8a\x8b\xca\xf6\xb5\x60\x34\x1a\
-\x71\x75\x75\x25\x2a\x2a\x8a\x33\x67\xce\x88\x7e\xff\x19\x8d\x46\
-\x9c\x9d\x9d\x0b\xdd\x5d\xb4\xdd\x3a\xe7\x80\x30\x3a\x75\x7e\x99\
-\x5b\x8f\x6f\x11\x93\x91\x47\xbd\xb0\x1a\xb8\xaa\x65\xbc\xdc\xa3\
-\x27\x4e\x82\xed\xeb\x51\xad\x56\x13\x18\x18\xc8\xde\xbd\x7b\xed\
-\xd6\x42\x74\x71\x71\xc1\xdb\xdb\x5b\xc4\x7a\x7c\xda\xf1\xfa\xdd\
-\xfa\xb1\xff\xf8\x45\x1e\x67\xdd\xc1\xa9\x52\x4d\x82\x7c\x9c\xf0\
-\xae\xd7\x84\x57\x4c\x2a\x1c\x94\x02\xb6\x68\x38\x59\x0e\x7d\x7c\
-\x7c\x7c\xf8\xe2\x8b\x2f\x44\x3f\x6b\x16\xa2\x2c\x97\xcb\x8b\x44\
-\xa8\x6d\x21\x5a\x28\x94\x54\x79\xb1\x3b\x13\x95\x57\xc9\x8b\xbb\
-\xc6\xb5\x2c\x15\xe1\x35\x02\x30\x55\xef\xc6\xf4\x0a\x9e\xa2\xc6\
-\xda\xd5\xd5\xd5\xaa\xc9\x68\x8f\x6d\x32\x99\x8c\xc0\xc0\x40\xd1\
-\x07\x52\x12\x24\x48\x24\xf0\xff\x01\xd4\x6a\x35\x35\x6b\xd6\xa4\
-\x5d\xbb\x76\xd2\xac\xdb\x81\xb4\xb4\x34\x4e\x9e\x3c\x29\x0d\x84\
-\x04\xbb\xd1\xbe\x7d\x7b\x12\x12\x12\xca\xad\xbd\xd4\xd4\x54\x7e\
-\xfa\xe9\x27\x11\xdf\x74\xa0\x56\xd3\x0e\xd4\x6a\x5a\xf4\x53\xf7\
-\x0a\x95\xb1\xf5\x06\xb1\xd9\x6c\x26\x2f\x2f\xef\xb9\x95\xd9\xec\
-\xc1\xdd\xbb\x77\xc5\x8b\x8e\xd7\xeb\xcc\xc8\x67\x8a\x26\x2a\x3c\
-\x6b\x50\xc3\x46\xdf\x4d\x10\x04\x72\x72\x72\xf8\xfe\xfb\xef\xcb\
-\xd5\x36\x4b\x24\xd7\x66\x27\x50\xe6\x42\x58\xf3\x2e\x84\x3d\xa3\
-\x5f\xed\xe1\x1d\x80\x87\x8d\x7d\x30\x18\x0c\x78\x79\x79\xf1\xf3\
-\xcf\x3f\x97\xab\x6d\xcb\x97\x2f\x17\x37\x6f\x32\x47\x5a\xbd\x3a\
-\x98\x56\xcf\x7c\x5c\x55\x44\x01\x25\x4b\x45\x57\x4b\xb1\x91\xf2\
-\xc2\x86\x0d\x1b\x44\xd9\xa6\xf6\xf4\xa7\x79\xf7\x81\x14\x9d\x36\
-\xa5\x28\xdb\xf4\x7a\x3d\xe1\xe1\xe1\x44\x46\x46\x96\xab\x6d\x3b\
-\x76\xec\x10\xf5\x3d\xcf\xc0\x7a\xbc\x3e\xac\xe8\xc3\xe6\xe8\xe3\
-\x4f\x55\x11\x6d\x69\xb5\x5a\x1a\x36\x6c\xc8\x93\x27\x4f\xca\xd5\
-\x36\x31\x73\x26\x08\x32\x02\x6a\x35\xa5\xdf\xb3\x9b\xa4\x77\x35\
-\x1a\x7b\x8b\xeb\x43\xfd\xfa\xf5\x49\x4e\x4e\x2e\x37\xbb\x72\x73\
-\x73\x59\xbe\x7c\xb9\x74\xc0\x2f\x41\x82\x44\x02\x9f\xbf\xe9\x94\
-\x94\xff\x2e\xa1\xec\xce\x92\x14\x05\x94\x50\x9e\xe4\xa6\x3c\x5e\
-\xda\x32\x99\x0c\xad\x56\x6b\x97\xde\x54\x79\x41\x2e\x97\xf3\xf8\
-\xf1\x63\xf4\x7a\x7d\xb9\x3c\x2b\x4a\xa5\xd2\xee\xa2\x17\xe5\x05\
-\x99\x4c\x46\x7a\x7a\x3a\x19\x19\x19\xe5\x32\x6f\x0a\x85\x42\x1c\
-\x01\xfc\x0b\x60\x91\x88\x28\xae\xf2\xaa\xad\xef\x1b\xb1\x29\x6e\
-\x7f\xc9\x8b\x5e\xa1\xe0\xce\x9d\x3b\xe5\x72\x4f\xd5\x52\xed\xf3\
-\xef\x30\x67\x96\x82\x4c\x19\x19\x19\xe5\x52\xf4\x06\x20\x28\x28\
-\xe8\x6f\x51\x00\xcd\x52\x49\xf3\xf1\xe3\xc7\x4f\xef\xc2\xda\xb1\
-\x97\x08\x82\x80\x5e\xaf\xa7\x5a\xb5\x6a\xff\x27\xf7\x7f\xb9\x5c\
-\x8e\x42\xa1\x40\x26\x93\x49\xfe\x89\x04\x09\x12\x09\x94\x20\x41\
-\xc2\xdf\x1d\xe7\xce\x9d\xe3\xed\xb7\xdf\xfe\x53\x35\x45\x5b\x1d\
-\x52\xa5\x52\x89\x87\x87\x07\x03\x07\x0e\x2c\xf3\x3d\x97\x67\x1a\
-\x01\x41\xc0\x90\x93\x81\xd9\xd9\x1d\xe5\xbf\x3f\xc2\xb6\xec\x2d\
-\xab\xb3\xa5\x52\xa9\x58\xb1\x62\x05\x27\x4f\x9e\x24\x33\x33\xd3\
-\x2e\xd1\x71\xa5\x52\x89\xbb\xbb\x3b\xb3\x67\xcf\xb6\x93\xe1\x68\
-\xc9\xd2\xaa\x71\x75\x04\x33\x66\x04\xb3\xed\xc6\x59\xd2\xd3\x3e\
-\xfb\xec\x33\x0e\x1f\x3e\x8c\xc9\x64\xb2\x3b\x1d\xd4\xcf\xcf\x8f\
-\x77\xde\x79\x47\x7c\x4a\x28\x90\x91\x9a\x81\x9b\x97\x3b\xc2\x7f\
-\xa6\x52\x94\x13\x99\x95\x95\xc5\xc7\x1f\x7f\xcc\xe9\xd3\xa7\xed\
-\x3e\x30\x94\xcb\xe5\xf4\xeb\xd7\xaf\xc4\xc2\x2d\x65\x41\xee\x93\
-\x24\x14\xbe\x7e\xa8\x31\xff\xdb\x36\x71\xcf\x88\x9b\x9b\x1b\x5d\
-\xbb\x76\x45\x2e\x97\xdb\x55\xdc\xcb\x64\x32\xa1\xd1\x68\xe8\xdd\
-\xbb\x37\x41\xa5\x14\x4a\x2a\x0d\xd9\x19\x99\xb8\xb8\xbb\x59\xfb\
-\x28\xa6\x2d\x85\x42\xc1\xdd\xbb\x77\x99\x35\x6b\x16\x77\xee\xdc\
-\xb1\x9b\x00\xb8\xba\xba\x32\x75\xea\x54\xbb\x0a\x88\xe4\x3e\x49\
-\xc2\xec\xeb\x87\x33\x80\x19\xcc\x88\x5b\x93\x4a\xa5\x92\xb8\xb8\
-\x38\x26\x4c\x98\x60\x95\x55\x10\xbb\x8f\xc8\x64\x32\xf4\x7a\x3d\
-\x87\x0f\x1f\xb6\x93\x74\x19\xd1\x6a\xf5\xa8\xd5\x1a\xbb\xe6\x4d\
-\x10\x04\x6e\xde\xbc\xc9\xc0\x81\x03\x31\x1a\x8d\xa2\xf7\x11\x4b\
-\x5b\x01\x01\x01\x4c\x98\x30\xc1\xee\x22\x33\x12\x24\x48\x24\x50\
-\x82\x04\x09\x12\xfe\x42\x58\x1c\x87\xc7\x8f\x1f\x73\xee\xdc\x39\
-\x5e\x7b\xed\x35\xea\xd6\xad\x2b\xba\x30\xcc\xa5\x4b\x97\xd8\xb5\
-\x6b\x17\x6d\xdb\xb6\x15\x47\x26\x04\x81\xe4\xb3\x1b\xf9\x68\xf5\
-\x4e\x6e\xde\x77\xe6\xfd\xef\xe6\x73\x62\x5a\x1f\xce\x26\x2b\x71\
-\x0c\x6c\xc2\x27\x73\x67\x10\x5e\xc5\xdd\xa6\x3e\x45\x47\x47\x73\
-\xee\xdc\x39\xe6\xcc\x99\x23\xfa\x0e\xb2\x52\xa9\x24\x32\x32\x92\
-\xfd\xfb\xf7\x93\x9f\x9f\x6f\x2d\x7c\x60\x2b\xb2\x1e\x45\xf2\xe1\
-\xbb\x33\x49\x73\xaf\x45\xfb\x36\xcd\xb8\xfe\xfb\x0e\x6e\x3c\x4c\
-\x23\x5e\x5b\x99\x3f\x0e\xac\xc5\x55\x6d\xdb\x78\x5f\xbe\x7c\x99\
-\xf8\xf8\x78\x46\x8c\x18\x21\xea\x1e\xa6\x85\x94\x7c\xf9\xe5\x97\
-\xdc\xb9\x73\x87\x37\xde\x78\x43\xa4\x03\x68\x26\x72\xf7\x3a\x36\
-\xec\xdc\x45\x7c\xee\x0b\x4c\x7b\xb3\x3e\x4b\x16\x7c\x45\x6a\x96\
-\x89\x8a\x2f\x76\x63\xc1\xfc\xc9\x04\xa9\xcb\xba\x04\x04\x74\x3a\
-\x1d\x51\x51\x51\x18\x0c\x06\x7a\xf4\xe8\x61\xd7\xbd\xb9\xed\xdb\
-\xb7\x13\x15\x15\x45\xcd\x9a\x35\xad\x36\xdb\x8a\xc3\x5f\x7f\xc0\
-\x37\x27\x1f\xe3\xeb\x5d\x09\x9f\x90\x0a\x5c\x3c\xb4\x97\xf4\x07\
-\x71\x78\x8c\xdc\xc4\xae\x89\x8d\xca\x3c\xd6\x96\xb5\x74\xf1\xe2\
-\x45\x5a\xb7\x6e\xcd\xab\xaf\xbe\x2a\x8a\xe4\x9a\xcd\x66\x3c\x3c\
-\x3c\x98\x3e\x7d\x3a\xb5\x6a\xd5\x22\x28\x28\x48\xdc\x06\xa0\x4f\
-\x61\xdf\xfa\xaf\x59\xbf\xe7\x02\x95\x3b\xbc\x44\xa5\x6b\xa7\xd9\
-\x75\x27\x05\x43\x5e\x01\x0d\xfa\xcf\x67\xe9\xf8\x16\x36\xed\x23\
-\xd9\xd9\xd9\x1c\x3f\x7e\x9c\x96\x2d\x5b\x52\xbf\x7e\x7d\xd1\xfb\
-\x92\x4e\xa7\x63\xf1\xe2\xc5\xdc\xbd\x7b\x57\x7c\x24\x30\xf9\x02\
-\x33\x3e\x5f\x43\xca\x23\x3d\x13\x3e\x5f\xc2\xf5\x55\x23\xf8\xf1\
-\x62\x2a\xe9\x8f\x9d\x90\xb7\x1e\xcd\xb9\xd5\xbd\x6d\x22\x6e\x99\
-\x99\x99\x9c\x3d\x7b\x96\x29\x53\xa6\xe0\xe0\xe0\x20\x6a\x1d\xc9\
-\x64\x32\xb2\xb2\xb2\x58\xba\x74\x29\x59\x59\x59\x22\xf7\x11\x33\
-\xa9\xf1\xa7\xf9\xf8\xbd\x05\xc4\xea\xdc\xe9\xd2\xa5\x1a\xa7\x8f\
-\x5c\x20\xc7\x68\x24\xed\x49\x26\xe3\x36\x9e\x66\xa8\x8d\x41\xc6\
-\xa4\xa4\x24\x2e\x5f\xbe\xcc\xe8\xd1\xa3\xf1\xf7\xf7\x17\x7d\x9f\
-\x2f\x39\x39\x99\x75\xeb\xd6\x31\x68\xd0\x20\xbb\x23\xa6\x12\x24\
-\x48\x24\x50\x82\x04\x09\x12\xfe\xca\x4d\x47\xa1\xb0\x46\x91\x82\
-\x83\x83\xf9\xe0\x83\x0f\x08\x0f\x0f\x17\xe5\x98\xca\xe5\x72\xae\
-\x5e\xbd\xca\xa1\x43\x87\xac\xce\x4d\x59\x2b\x83\xfe\x07\x05\x1c\
-\xde\x7f\x93\x1e\x53\x17\xd1\x22\x72\x3c\xaf\xfc\xac\xe5\xc4\xe6\
-\x23\x5c\x39\x72\x88\xd3\xb1\x99\x54\xf0\x2d\x1b\x01\x74\x70\x70\
-\xb0\x16\x5e\x10\x04\x01\x6f\x6f\x6f\xa6\x4c\x99\x22\xda\x29\x51\
-\x2a\x95\x7c\xfd\xf5\xd7\x1c\x3e\x7c\xd8\xea\x18\x5a\xf4\xb5\x6c\
-\x41\xca\xd5\x5d\xd4\x1c\xb4\x9a\x56\xca\xf3\x9c\xba\x97\xc6\xe4\
-\x95\x9b\xf1\x88\xdf\xc8\xac\x5f\x14\x38\x97\x91\x24\x79\x79\x79\
-\x59\xc7\x54\x2e\x97\x13\x1e\x1e\xce\x82\x05\x0b\x44\xa7\x5f\x29\
-\x95\x4a\xb2\xb3\xb3\x59\xb6\x6c\x99\x95\x84\x95\xf5\x14\xdf\x1a\
-\x7d\xd0\x3d\xe1\x6e\xb6\x8c\x37\xa6\x7f\x83\x61\xfb\x08\x0e\xe7\
-\x4f\x62\xf3\xaf\xed\xb8\x1e\x1d\xc1\xa5\xdb\x02\x15\xcb\x68\x9b\
-\xa5\x1a\xa9\x25\x65\xae\x57\xaf\x5e\x7c\xf0\xc1\x07\xa2\x53\x8b\
-\x4d\x26\x13\x0a\x85\x82\xcb\x97\x2f\x5b\xdb\xb5\xb9\x90\x8a\x36\
-\x85\x3f\x1e\x3b\xf2\xd5\x9a\xa5\x9c\xd8\xf0\x05\x87\x93\xea\xb3\
-\x63\xef\x5b\x7c\xb7\xe0\x13\xaa\xbd\x1a\x52\xe6\x66\x9c\x9d\x9d\
-\x8b\x90\xd9\x9e\x3d\x7b\xf2\xde\x7b\xef\x89\x4e\x9d\x54\x2a\x95\
-\x45\xee\xbb\x2a\x14\x8a\x32\xaf\x49\xcb\xbc\x65\xc4\xc5\xf0\x38\
-\x5f\xc3\xec\x75\x3f\xb2\x7b\xd9\x22\xba\xcd\xfe\x92\xa1\x2a\x81\
-\x3d\x3f\x7c\x85\xdf\x2b\xe1\x65\xee\x8b\x97\x97\x17\x66\xb3\x19\
-\xa3\xd1\x48\x85\x0a\x15\x78\xf7\xdd\x77\x69\xdb\xb6\xad\xe8\xe7\
-\x2d\x3b\x3b\x9b\x4b\x97\x2e\x59\x35\xf5\x34\x1a\x4d\x99\x2a\x83\
-\x16\xb6\xed\xd4\xfe\x53\x4c\x7d\xef\x53\x8c\x77\xbe\xe4\x87\x03\
-\x31\xcc\x5c\xb8\x95\x6e\x51\x87\x58\xf5\x47\x01\xa1\xed\x3a\x95\
-\xb9\x2f\x2e\x2e\x2e\x45\xb2\x08\x66\xcd\x9a\x65\x57\x75\xd0\xac\
-\xac\x2c\x36\x6e\xdc\x68\xed\x6b\x71\x9a\xa0\xc5\x9f\x6c\x18\x78\
-\x74\x39\x1a\xdd\xa0\x15\x7c\xdb\xf4\x1e\x33\xbe\x7d\xc8\x27\x2b\
-\xde\xa5\x62\xde\x31\x46\xad\xca\xa2\xbf\x0d\x04\xd0\x22\x0d\xa3\
-\xd7\xeb\xa9\x53\xa7\x0e\xd3\xa6\x4d\x23\x30\x30\x50\x94\x6d\x96\
-\xc3\xc4\xed\xdb\xb7\x5b\xa5\x3d\x3c\x3d\x3d\xa5\x7b\x81\x12\x24\
-\x48\x24\x50\x82\x04\x09\xff\x5b\x30\x1a\x8d\xf4\xee\xdd\x9b\x6b\
-\xd7\xae\x15\x71\xa6\x65\x32\x19\x71\x71\x71\x54\xad\x5a\xd5\xea\
-\x90\xc8\xe5\x72\x04\x41\xb0\x2b\x05\xcb\xf2\xd2\x77\x76\x76\x66\
-\xc6\x8c\x19\xac\x58\xb1\xa2\xc4\xff\x9f\x97\x97\xc7\x8d\x1b\x37\
-\x70\x74\x74\xc4\x60\x50\x30\xe0\xa3\xb9\xc8\x84\x4c\x66\xbd\x79\
-\x97\x76\xcb\x82\xa0\x20\x9e\x9b\xd7\xff\xc0\xb1\xfe\x34\x2a\x68\
-\x60\xed\xda\xb5\x7c\xfc\xf1\xc7\x25\xca\x17\x18\x8d\x46\xee\xdf\
-\xbf\xcf\x4b\x2f\xbd\x54\xc4\x49\xb6\x07\x85\x85\xe7\x1d\x1d\x1d\
-\x99\x3d\x7b\x36\x2b\x56\xac\x28\xd6\x61\xd2\x6a\xb5\xd4\xaf\x5f\
-\x9f\x65\xcb\x96\x51\xa5\x52\x45\xb4\x7a\x23\x55\x5e\x9a\xc7\xf8\
-\xfc\x47\xac\x5f\x78\x94\xac\x2a\x43\x08\xd0\x08\x7c\xf7\xe9\x4f\
-\xb4\x5d\xb0\x0f\x99\xd9\xc4\x8f\x1b\x7f\xe2\xdd\x77\xdf\xc5\xc7\
-\xc7\xe7\xb9\x0e\xb4\x25\x4a\x96\x95\x95\xf5\xa7\xcf\xed\xb5\x4f\
-\x10\x04\xab\xac\xc2\xd4\xa9\x53\xf9\xec\xb3\xcf\x8a\xb5\x4d\xa7\
-\xd3\x51\xb5\x6a\x55\x8e\x1c\x39\x82\x51\xaf\xc5\x88\x27\x7d\x07\
-\x0d\x43\xce\x4d\xc6\xee\xca\xe0\xd5\x81\x9e\xa8\xcc\xc9\x3c\xfa\
-\xe3\x00\x95\x5f\x5e\x8a\x0a\x18\x3d\x7a\x74\xa9\x85\xac\x8c\x46\
-\x23\x4e\x4e\x4e\x45\x24\x30\x14\x0a\x85\x5d\x62\xf1\x85\x35\x02\
-\x0d\x06\x03\x0d\x1b\x36\x2c\x91\xe4\xea\x74\x3a\x3a\x75\xea\xc4\
-\xb7\xdf\x7e\x8b\x5e\xa7\x05\x85\x17\x33\xe6\xcc\x22\x27\x39\x86\
-\x93\x47\xaf\x52\x69\xdc\x5c\x8c\x89\x87\x49\x52\x86\x32\xb0\x8a\
-\x1b\xb9\xb9\xb9\x8c\x1d\x3b\x96\xd3\xa7\x4f\x17\xdb\xae\x4c\x26\
-\x23\x35\x35\xf5\xb9\xf7\x12\xcb\xe3\x59\x93\xc9\x64\xdc\xbf\x7f\
-\x9f\x56\xad\x5a\xa1\x56\xab\x8b\x25\x5f\x59\x59\x59\x4c\x9a\x34\
-\x89\x29\xef\x4f\xc6\xa0\xd3\xe1\x58\xb5\x19\xa3\x6b\xb6\x42\x7f\
-\xff\x10\xb7\x12\x0c\x38\x38\xba\x43\xe6\x05\xe2\xf5\x15\x18\x12\
-\xe2\xc4\xf5\x6b\xd7\x98\xf8\xde\x7b\xc4\xc7\xc7\x97\xe8\xcc\xe7\
-\xe4\xe4\xe0\xe1\xe1\xf1\xa7\x79\x13\x8b\xc2\xfb\x94\x45\x2a\x24\
-\x34\x34\xb4\xc4\x03\x25\x41\x10\x18\x30\x60\x00\x73\xe6\xcc\x41\
-\xa7\xd5\xd2\x7c\xf0\xbb\xc8\x64\xb9\x7c\xf9\xfe\x3e\x7c\xdf\x9d\
-\x06\xc8\xf9\xe3\x66\x32\xad\x1a\x36\xa4\x43\x2d\x17\xa2\xa3\xa3\
-\xe9\xd7\xaf\x1f\x46\xa3\xb1\x44\xdb\xee\xdd\xbb\xc7\x6b\xaf\xbd\
-\xf6\xa7\xfe\x89\x3d\x98\x78\xf6\x67\xed\xd8\xb1\x83\x1a\x35\x6a\
-\x94\x48\x6a\xcd\x66\x33\xeb\xd6\xfd\x40\xd3\xc6\x0d\x31\x22\x50\
-\xa7\xfb\x9b\x7c\x2d\x08\xdc\xdc\x7d\x00\xa5\x9b\x1f\x7e\x15\x9d\
-\xf9\x65\xee\x59\x86\x4c\x9f\x83\x1a\xd8\xba\x75\x2b\xb3\x66\xcd\
-\x2a\x35\x45\xf4\xfe\xfd\xfb\x34\x6a\xd4\xe8\x4f\x76\x89\xb5\xad\
-\xf0\xba\x73\x73\x73\x63\xd4\xa8\x51\x4c\x9f\x3e\xfd\x4f\x6b\x65\
-\xf0\xe0\xc1\xcc\x9e\x3d\x5b\xdc\x95\x01\x09\x12\x24\x12\x28\x41\
-\x82\x04\x09\x65\x77\xa8\x76\xee\xdc\xf9\xdc\x7f\xb3\xa4\xc8\x15\
-\xe7\xa0\xd8\x83\xdc\xdc\x5c\xa6\x4d\x9b\xc6\x87\x1f\x7e\x58\x16\
-\xef\x81\x8d\x9b\x77\xb3\xed\x8f\x38\xfe\x35\xf3\x15\xbe\x99\xf3\
-\x29\x8a\x0f\xf6\xf1\x51\x7d\xb8\x1f\x7d\x87\x73\x71\x8e\x8c\x9f\
-\xf8\xb4\xce\xe4\xc8\x91\x23\x19\x39\x72\x64\x89\xcd\x65\x66\x66\
-\xd2\xb1\x63\x47\x6b\x11\x97\xf2\x48\x4b\xb2\x38\xa0\x96\x02\x18\
-\x33\x67\xce\x64\xea\xd4\xa9\x65\xf8\xa6\x9e\x7d\xef\xbd\xcc\xfb\
-\x9b\x2f\xd1\x76\xf1\x09\xda\x3f\xfc\x9a\xeb\x3e\xbd\x99\x3f\xb2\
-\x25\xdc\x5c\xcc\x8f\xe6\x21\x1c\xad\x08\x20\x63\xf0\xe0\xc1\x0c\
-\x1e\x3c\xb8\xc4\xd6\x92\x92\x92\x8a\x14\x95\x10\x04\xc1\xee\xe2\
-\x19\x85\xf5\x0f\x05\x41\x60\xd1\xa2\x45\x0c\x19\x32\xa4\xf4\x03\
-\x86\x9c\x24\xd6\xbd\xd9\x81\x2f\x13\x1b\x33\x7f\xe6\x58\xce\xac\
-\x5b\x45\xa3\x65\x07\x79\xb5\x12\xa4\xde\x3d\xc3\xc1\x0b\xde\xcc\
-\x7f\xf7\xe9\xab\x6d\xcd\x9a\x35\xa5\xb6\x97\x91\x91\x41\x40\x40\
-\x40\x91\xf9\xb2\x67\x4d\x16\x1e\x17\xcb\x21\xc7\xe1\xc3\x87\x09\
-\x2d\x43\xf5\xcb\xa4\xcb\xbb\x18\x3e\xe4\x4d\x5c\xdf\x38\xc8\x37\
-\xed\xee\x33\x63\xee\x7a\x1a\x4f\xfa\x89\xe1\x4d\x64\xfc\xbe\x78\
-\x0f\x3e\x61\xe3\xd0\xc8\xe5\x28\x9c\x9c\xac\x91\x9d\x92\xb0\x69\
-\xd3\x26\xde\x7f\xff\xfd\x72\x7d\xd6\x0a\xcf\x5b\xc5\x8a\x15\xd9\
-\xbf\x7f\xff\x9f\x9e\xe9\xe7\x1b\x77\x82\x59\xbd\x47\x70\xa2\x42\
-\x27\x3e\x7e\xeb\x55\x76\xfe\xb8\x83\x01\xd3\x17\x52\xd1\x4d\xc1\
-\xb9\xad\x5f\xe2\x5c\xfb\x0b\x00\x6a\xbf\xf0\x42\x11\x81\xfb\xe2\
-\x70\xe4\xc8\x11\xc6\x8c\x19\x53\x64\x0d\xd9\xfb\xac\x59\xd6\x80\
-\x56\xab\xa5\x4d\x9b\x36\xec\xd9\xb3\xa7\x4c\x11\xea\xe8\xdd\x5f\
-\x31\x7a\xd2\x17\x0c\x5e\xb2\x99\x94\x1d\x8b\x30\x0e\xdc\xc5\x27\
-\x2f\x3a\x62\xcc\x8e\x23\x29\x33\x9b\x06\x1e\x5e\x00\x84\x85\x85\
-\x11\x13\x13\x53\x6a\x7b\x6f\xbf\xfd\x36\xe9\xe9\xe9\xcf\x5d\x53\
-\xf6\xae\x49\x41\x10\xe8\xd2\xa5\x0b\xfb\xf6\xed\x2b\xd3\x3e\xb2\
-\x7a\x50\x7b\x16\xde\x50\xf3\xdd\x8f\x1b\xe1\xd4\x97\xec\x8a\x73\
-\x61\xca\x7b\x43\x70\x2d\xb8\xc7\x85\x0c\x15\x9f\xfb\x3f\x8d\x2a\
-\xf6\xeb\xd7\x8f\x7e\xfd\xfa\x95\xda\x62\x8f\x1e\x3d\x48\x4a\x4a\
-\x2a\xb7\x79\x2b\x9c\xde\x9a\x9d\x9d\xcd\x17\x5f\x7c\xc1\xf0\xe1\
-\xc3\xa5\x97\xb0\x04\x09\x12\x09\x94\x20\x41\xc2\xdf\x15\x82\x20\
-\xf0\xe4\xc9\x13\x7e\xf9\xe5\x17\xae\x5c\xb9\x22\x2a\x45\x4d\x26\
-\x93\x71\xf3\xe6\xcd\x22\x95\x38\x2d\x4e\x41\xa9\xce\x85\x20\x30\
-\xb0\x7f\x77\x5e\x1f\x98\xcf\xba\x49\xc3\x88\x71\x69\x41\xf7\xcc\
-\x93\x1c\xbb\xf6\x32\xde\x77\xa2\xc8\xa9\xde\x8d\x2a\x36\xf4\xa5\
-\xf0\xdd\x3f\xb3\xd9\x4c\x7a\x7a\x3a\x3f\xff\xfc\xb3\x55\xc8\xd8\
-\x56\xa8\xd5\x6a\x22\x22\x22\x44\x16\x29\x51\xd2\x65\xc9\x01\x3a\
-\x2f\x55\x10\xf3\xe3\x28\x26\x46\xba\x33\x71\x94\x89\x1b\x8f\x93\
-\x89\x5b\xf6\x07\x0d\x46\xaf\xb6\xa9\x2e\x4c\x61\x82\x64\x34\x1a\
-\x89\x8f\x8f\xe7\xbb\xef\xbe\x2b\x31\x02\x54\x52\x5b\xee\xee\xee\
-\x1c\x3f\x7e\xdc\x3a\x2e\x82\x20\x50\x50\x50\x50\xb6\x03\x06\x67\
-\x3f\x46\xae\xbf\xc2\x48\x7d\x02\x5f\xcc\x9d\x87\xf0\x42\x53\xdc\
-\xe3\x0e\x10\x5b\xa5\x27\x05\xdb\x56\x91\xd1\x6a\x23\xb6\x24\xcd\
-\x16\x16\x9a\x56\x28\x14\x9c\x3c\x79\x92\x1f\x7e\xf8\xc1\x2e\x7d\
-\xc7\x88\x88\x08\x5c\x5c\x5c\x6c\x1e\x1b\xbf\xba\xdd\xd8\x73\xe9\
-\x11\x72\x63\x0a\x63\xba\xbd\x81\xff\x6b\x33\x70\x4f\x8a\xe0\xfa\
-\x4d\x25\xbb\x62\x34\xf4\xea\xee\x81\xdc\x86\x6e\x3d\x1b\x05\x3c\
-\x73\xe6\x0c\xbe\xbe\xbe\xa2\xee\xdf\x9a\xcd\x66\x7c\x7c\x7c\x78\
-\xf0\xe0\x01\x4d\x9a\x34\xb1\xda\x56\x66\x1b\xfd\x5a\xf1\xe9\xc9\
-\x5b\x64\xc6\x1c\x65\xde\xc7\x8b\x70\x7f\xb1\x3f\x69\xb1\x57\xd1\
-\xd7\xa8\xc9\xaf\x6b\xe3\xe8\x7e\xc2\xdf\xe6\xfd\xa3\xf0\xe1\xcf\
-\xee\xdd\xbb\x79\xf8\xf0\xa1\xe8\xfd\x48\xa7\xd3\x71\xeb\xd6\x2d\
-\x3a\x75\xea\x64\x33\x61\xae\xd3\xed\x4d\xce\xbe\xfa\x16\xe7\xbe\
-\xff\x80\x83\xe1\x5d\x68\xcc\x59\xa2\x1f\x76\xa4\x52\xca\x35\x72\
-\x73\x0b\x70\xf3\xf6\x17\xbd\x96\x00\x7e\xf8\xe1\x07\x9c\x9c\x9c\
-\x44\xdf\x09\xcc\xce\xce\x2e\x42\x2a\x6d\xd9\x47\xde\xfc\xf1\x38\
-\x63\x8c\x06\xce\x6f\x9a\xc7\x80\x1f\x53\x19\xf1\x5a\x0d\xae\xdd\
-\x4a\xc4\x55\xd8\x84\xd1\xbb\x29\x0e\x22\x39\x9c\x4c\x26\xe3\xd1\
-\xa3\x47\x6c\xd9\xb2\x05\x3f\x3f\x3f\xd1\x77\x02\x2d\x62\xf1\x12\
-\x24\x48\x90\x48\xa0\x04\x09\x12\xfe\x21\xb0\x88\x05\xaf\x5c\xb9\
-\xd2\x2e\x91\x5f\x99\x4c\x46\xe5\xca\x95\x71\x71\x71\xc1\x64\x32\
-\x59\x53\x99\xca\xe2\xc4\x3d\xf5\xf3\xf5\x54\x6e\xfe\x12\x81\x17\
-\xe2\x38\x77\x2e\x9e\x9a\x15\x3b\x12\x16\xda\x94\xfe\x2f\xd4\x12\
-\xed\xb8\xf9\xfa\xfa\xe2\xe9\xe9\xc9\xd8\xb1\x63\xed\x1a\x23\xb9\
-\x5c\x4e\xe5\xca\x95\xad\xe9\x7b\xb6\x38\x81\x82\x4c\x81\x1c\x70\
-\xf5\x09\xa3\x7e\xb5\x04\x4e\xfc\xfe\x07\x0a\xbf\x00\x5c\xdb\x8c\
-\x66\x78\x23\x47\x9b\xfa\x51\x38\xfa\xe3\xe7\xe7\x47\x64\x64\x24\
-\xd3\xa7\x4f\xb7\x2b\xda\xa9\x54\x2a\x09\x0c\x0c\x14\x55\xcc\x41\
-\x90\xc9\x40\xa1\x21\xac\x7e\x3d\x8e\x47\xde\xe5\x5c\xea\x13\xaa\
-\x34\xe9\x8e\x57\xcd\xde\x8c\x6e\xe0\x23\x7a\xac\x2b\x56\xac\xc8\
-\xb1\x63\xc7\x98\x3c\x79\xb2\x5d\xf3\x66\x36\x9b\x19\x3e\x7c\xb8\
-\x35\xc5\xad\xcc\xeb\x5b\x90\x21\x17\x00\xb3\x92\x16\xed\x3b\x70\
-\x33\xee\x24\xa7\x1e\x55\x46\xa3\x0e\xa3\x4d\xbf\x5e\xd4\xf4\xf5\
-\x12\x45\xde\x4d\x26\x13\xae\xae\xae\x1c\x3f\x7e\xdc\x7a\xc7\x54\
-\xac\x5d\x8e\x8e\x8e\x78\x7b\x7b\x3f\xf7\x80\xa0\x14\xe3\x10\x64\
-\x72\x54\xee\x95\x69\xdc\xb8\x31\x97\x13\x6e\x10\x91\x2b\xd0\xb5\
-\x53\x05\x1a\x0e\x9a\x41\x5d\x1b\x33\x54\x2d\xcf\xba\x46\xa3\xc1\
-\xd7\xd7\x97\xf5\xeb\xd7\xb3\x7e\xfd\x7a\xbb\x0e\xa5\xd4\x6a\x35\
-\xbe\xbe\xbe\x56\xbb\xca\x2a\xf1\x21\x08\x4f\x99\xb9\x4f\x9d\x16\
-\x98\x77\x9e\xe6\x74\xb2\x23\x0e\xd5\x5a\x10\xec\x59\x95\x66\x2d\
-\xfc\xf0\x75\xb3\x7d\x9c\x0b\x8b\xc5\xcf\x9c\x39\xd3\x6e\x89\x08\
-\x8b\x7d\x96\xb6\xcb\xfe\xac\xc9\x51\xc8\x04\xdc\xaa\x84\xf1\x7a\
-\xcb\x8b\x14\xdc\xbf\xcc\x1f\x8a\xca\xb4\x6a\xfa\x02\xbd\xba\x37\
-\x15\xdd\x27\x77\x77\x77\x8c\x46\x23\x9f\x7d\xf6\x99\xdd\xb6\x05\
-\x05\x05\xe1\xe8\xe8\x68\xbd\x17\x58\x1e\x11\x46\x09\x12\x24\x12\
-\x28\x41\x82\x04\x09\x7f\x11\xda\xb6\x6d\xcb\xfe\xfd\xfb\xcb\x55\
-\x27\xea\x97\x5f\x7e\x11\xe1\xd8\xba\xd2\xa1\xef\x68\x3a\xf4\x2d\
-\xfc\xa9\x1f\x6d\xf8\x77\x79\x77\x1b\x9d\xb7\x82\x82\x02\xde\x7f\
-\xff\x7d\xc6\x8d\x1b\x57\x6e\x3a\x81\xe2\x25\x14\xcc\x54\xe9\x3c\
-\x91\x45\x9d\x0b\x7d\xd4\xb0\xae\x68\x67\x2b\x3f\x3f\x9f\xb9\x73\
-\xe7\x32\x7e\xfc\xf8\x72\xd1\x52\x53\xa9\x54\x98\x4c\x26\x71\x52\
-\x0a\x72\x2f\x5e\xea\x3b\x8e\x97\x0a\xcf\x5b\xe0\x9b\x84\x8a\x98\
-\x37\xa3\xd1\x88\xbb\xbb\x3b\x0b\x17\x2e\x24\x35\x35\xd5\xee\x35\
-\x69\x36\x9b\xa9\x5c\xb9\x32\x1b\x37\x6e\x14\x37\x6f\x72\x77\x86\
-\x4f\x9b\x57\x2e\xcf\x99\x20\x08\xa4\xa7\xa7\x73\xe8\xd0\xa1\x72\
-\xd1\xd1\xb4\x44\x04\x4f\x9d\x3a\x25\xca\x36\xc7\x80\x9a\x0c\x98\
-\x32\x9f\x01\x85\x3e\x7b\x6d\x42\xa8\x28\x7d\x0f\xa3\xd1\x48\xb5\
-\x6a\xd5\x58\xb7\x6e\x9d\x5d\xd2\x17\x85\xc7\xaa\x76\xed\xda\xec\
-\xdd\xbb\x57\xd4\xf7\x83\x1a\x77\x63\x56\xe3\x6e\x85\x3e\xf1\xa1\
-\x69\x15\x71\x7d\xd1\xeb\xf5\x84\x86\x86\xb2\x7b\xf7\x6e\xbb\x24\
-\x54\x2c\x76\x69\xb5\x5a\x02\x03\x03\x45\xb6\x23\xa3\x56\xdb\xfe\
-\xcc\x6f\xdb\xbf\xc8\xa7\x1d\xed\x58\x43\xf5\xeb\xd7\xe7\xd0\xa1\
-\x43\xe5\xb2\x8f\x28\x14\x0a\x3c\x3c\x3c\x58\xbd\x7a\xb5\xf4\x62\
-\x95\x20\x41\x57\xaa\xb4\x47\x00\x00\x20\x00\x49\x44\x41\x54\x22\
-\x81\x12\x24\x48\xf8\xbb\x43\x26\x93\xd1\xb8\x71\xe3\x72\x6b\x2f\
-\x39\x39\x59\x54\xea\x64\x49\x7e\xa3\x18\x97\xd2\x68\x34\x96\xed\
-\x8e\x94\x0d\xb8\x7b\xf7\xae\x58\xf7\xaf\x5c\xfb\x61\x30\x18\x08\
-\x0a\x0a\x12\x2f\x0f\xf0\x1c\xc4\xc4\xc4\x94\x7b\x59\x77\x5b\xad\
-\xb6\x54\xf4\x0c\x09\x09\x21\x24\x24\xa4\xdc\xfa\x61\x6f\xe1\x9c\
-\xf2\x82\x4e\xa7\xa3\x69\xd3\xa6\xe5\xda\x66\x69\x05\x77\xca\xf5\
-\x41\x2c\x61\xde\x5c\x5c\x5c\x08\x0b\x0b\x2b\xd7\xae\x94\x35\x02\
-\xf8\x57\xc2\x62\x5b\x79\xcf\xdb\xdf\x09\x4d\x9a\x34\x29\xb7\xb6\
-\x72\x72\x72\x4a\x2d\xb8\x23\x41\x82\x04\x89\x04\x4a\x90\x20\xe1\
-\x6f\x80\xe8\xe8\x68\x3e\xf8\xe0\x03\xd1\xfa\x77\x85\xc9\xa4\x5a\
-\xad\xa6\x47\x8f\x1e\xb8\xb8\xb8\x88\x6e\xc7\x6c\x34\x80\x5c\xf1\
-\x94\x40\x98\xc1\x64\xd4\x23\x28\x94\x36\x11\x0a\x41\x10\xd0\x68\
-\x34\x7c\xfa\xe9\xa7\x9c\x3b\x77\x4e\x74\x29\xfe\xc2\xed\x39\x38\
-\x38\x30\x61\xc2\x04\x3b\x47\xdb\x8c\xc1\x28\xa0\x90\x3f\xfd\xb3\
-\x56\x67\x42\xad\xb2\x2d\x2a\x64\x49\x05\xfc\xf4\xd3\x4f\x39\x79\
-\xf2\xa4\xdd\xd1\x09\xb9\x5c\x8e\xa7\xa7\x27\xc3\x86\x0d\xb3\xab\
-\x2d\x83\xde\x88\x42\xf9\x1f\x5b\x8c\x3a\x3d\x72\x95\x6d\xb9\x85\
-\x0a\x85\x82\xac\xac\x2c\x66\xcc\x98\xc1\xa5\x4b\x97\xec\x76\x24\
-\x4d\x26\x13\x5d\xbb\x76\x25\x3b\x3b\xdb\xae\xb6\x4c\x7a\x1d\x28\
-\x55\xc8\x9e\xfe\x05\xb3\x4c\x69\x33\xc1\xb5\xe8\xfb\x75\xe8\xd0\
-\x01\x67\x67\x67\x6b\xba\x9c\xe8\x95\x64\x36\xf3\xf2\xcb\x2f\xe3\
-\xe5\xe5\x65\x97\x6d\x06\x83\x11\x85\xc2\x32\x6f\x46\x8c\x26\xb9\
-\x4d\xf7\x1d\x2d\xf3\x76\xeb\xd6\x2d\x16\x2e\x5c\x48\x52\x52\x92\
-\xdd\xf3\xa6\x54\x2a\x19\x3f\x7e\x3c\x1a\x8d\x86\xcc\xcc\x4c\x71\
-\x73\xa6\xd3\x62\x56\xa9\xb1\x58\x66\x32\xf3\x74\xfe\x04\xdb\xfb\
-\x72\xeb\xd6\x2d\xa6\x4d\x9b\x66\x95\x9e\xb1\x67\x1f\x49\x4f\x4f\
-\x17\x95\x29\xf1\xe7\x9d\xc4\x8c\xf0\x6f\x63\x8c\x06\x23\x72\x85\
-\x5c\x54\x7f\xe2\xe3\xe3\x19\x37\x6e\x5c\xb9\x44\x39\x5d\x5c\x5c\
-\x18\x3d\x7a\xb4\x55\x7e\x42\x82\x04\x09\x65\xf4\x9f\xa4\x21\x90\
-\x20\x41\xc2\x7f\x1b\x66\xb3\x99\xdb\xb7\x6f\xb3\x77\xef\x5e\xee\
-\xdd\xbb\xf7\x6f\xa7\xd0\x60\xf3\x2f\xb3\xd9\xcc\xf5\xeb\xd7\xd9\
-\xb5\x6b\x17\x71\x71\x71\xd6\xbb\x73\xb6\x3a\x83\x59\xd7\x77\x33\
-\x71\x64\x1f\x3a\xf7\xfa\x90\x1b\x3a\x23\xa7\xbe\x9f\x49\xfb\x2e\
-\xfd\xf8\x7a\xdb\x69\xb4\x36\xda\xa6\x50\x28\x38\x73\xe6\x0c\x3b\
-\x76\xec\x40\x10\x04\x51\x76\x59\x6c\x8b\x8d\x8d\xe5\xe7\x9f\x7f\
-\x26\x3b\x3b\x5b\x74\xda\x54\x4e\xf2\x55\xa6\xbe\xfe\x0a\x83\xde\
-\xfc\x90\x33\xf1\x49\x6c\x5a\x38\x8d\x5e\x3d\xbb\xb2\x64\xe7\x75\
-\x9b\x1c\x2d\x8b\x6d\x47\x8f\x1e\xe5\xf0\xe1\xc3\xa4\xa7\xa7\x5b\
-\x53\x39\x6d\xfd\xa5\x54\x2a\x39\x7c\xf8\x30\x3b\x76\xec\x20\x37\
-\x37\x17\x99\x4c\x26\xca\x81\xbf\x7a\x74\x0b\x13\x47\x75\xa7\xcf\
-\x1b\xcb\x49\xd7\x6a\xf9\xe9\xbd\x5e\xb4\x1f\xf4\x36\xdb\x4e\xc5\
-\xda\xec\x48\xe6\xe7\xe7\x73\xe2\xc4\x09\xfe\xf8\xe3\x0f\xf4\x7a\
-\xbd\x28\xbb\x8c\x46\x23\x5a\xad\x96\x93\x27\x4f\x72\xfc\xf8\xf1\
-\x32\x17\xbb\x79\x1e\x22\x37\x7f\x46\xbf\x41\xaf\xf3\xce\xbc\x35\
-\x5c\xb9\x7b\x81\x59\x63\xfb\xd1\x7e\xd0\x74\xee\xa6\xe7\xdb\xdc\
-\x96\x46\xa3\xe1\xe8\xd1\xa3\x5c\xbc\x78\x51\xf4\x9c\x59\xe6\x6d\
-\xff\xfe\xfd\x44\x44\x44\x88\x27\x5c\xa6\x2c\x8e\x6d\x59\xca\xe0\
-\x3e\xdd\x99\xf2\xd5\x11\xb4\x49\xbf\x31\xa0\x4d\x5b\x06\xbc\xbb\
-\x90\xfb\x36\x9e\x99\x58\x64\x30\xf6\xec\xd9\x43\x7c\x7c\xbc\x68\
-\xbb\x0c\x06\x03\x5a\xad\x96\x1d\x3b\x76\x70\xe5\xca\x15\xf1\xb6\
-\xe5\xc5\xf2\xde\xe4\x71\x0c\x1b\xf5\x01\x77\xb5\x70\xff\xcc\xcf\
-\x0c\x6a\xdd\x8c\xc9\x6b\x7e\xe3\x5a\xae\x6d\xe4\x44\x2e\x97\x93\
-\x9c\x9c\xcc\xa1\x43\x87\xc8\xcb\xcb\xc3\x68\x34\x8a\xb2\xcb\x64\
-\x32\x91\x95\x95\xc5\xe9\xd3\xa7\x49\x4b\x4b\x13\xb9\x8f\x98\xc9\
-\x78\x10\xc5\xdc\xa1\x3d\xe9\xf6\x72\x7f\x56\xff\x7e\x9b\x4b\x3f\
-\x4e\xa6\x53\x9b\x8e\xbc\xf3\xc3\x25\x51\x43\x75\xef\xde\x3d\x0e\
-\x1c\x38\x40\x52\x52\x92\xe8\x35\x69\x34\x1a\x49\x4b\x4b\x63\xef\
-\xde\xbd\x3c\x7c\xf8\xf0\x6f\x13\x79\x97\x20\xe1\x9f\x02\xe9\x89\
-\x91\x20\x41\xc2\x5f\x02\xad\x56\xfb\xa7\x53\x59\x8d\x46\x83\xc9\
-\x64\xb2\xde\x4d\x0a\x09\x09\x61\xdb\xb6\x6d\x45\xe4\x07\x6c\xc5\
-\xad\x5b\xb7\x68\xd0\xa0\x81\xb5\x4d\xbd\x5e\x5f\xea\xfd\xa0\x67\
-\x05\x93\x8f\xfd\x72\x82\x8e\xb3\x36\xd0\x67\x59\x13\xde\x5f\x3b\
-\x86\xd6\xf1\x5a\xbe\x5e\x39\x99\x7d\xbf\x1e\x21\xf6\x41\x7d\x6a\
-\x57\x54\xa3\xd5\xe9\x4a\x6c\x53\xa7\xd3\x59\x0b\x80\xc8\xe5\x72\
-\x02\x02\x02\xd8\xbd\x7b\xb7\x5d\x63\xb8\x61\xc3\x06\xc6\x8c\x19\
-\x63\x8d\x96\x5a\xd2\x5d\x8b\x23\x17\x66\xb3\x19\x99\x4c\x86\x4a\
-\xa5\xb2\xf6\x35\x23\x6e\x2f\xfe\x9d\x67\xd2\xc7\xe3\x22\x3b\xa6\
-\x4f\x24\xa6\xe1\x10\x7e\xfe\x71\x38\x6f\x8c\x5f\x49\x66\xb7\xaf\
-\x70\xc1\x58\xa2\x6d\x0a\x85\x82\x82\x82\x02\xeb\x5c\xaa\x54\x2a\
-\xda\xb6\x6d\xcb\x91\x23\x47\xec\xb2\xed\x93\x4f\x3e\x61\xc9\x92\
-\x25\x56\xa7\xb4\xac\xb6\xfd\xa7\x64\x7f\x36\xd7\x1f\xe6\xf1\xc6\
-\x82\x0d\x5c\xfe\xe8\x65\x7e\xfe\x51\xc5\xaa\x87\x9d\xd9\xbe\xa8\
-\x21\xbf\x6c\x3b\x48\x7a\xb3\x50\x9c\xcd\x3a\x8c\xc6\x92\x8b\xb2\
-\x58\xa2\xb5\x96\x7b\x53\x13\x27\x4e\x64\xd6\xac\x59\x76\xd9\x36\
-\x6f\xde\x3c\xce\x9f\x3f\x6f\xb5\x4d\xab\xd5\x16\x59\x1f\xc5\x11\
-\x1a\x95\x4a\xf5\x6f\xa2\x94\xc1\xfe\xcb\x39\x2c\xfd\xf6\x7b\x8e\
-\x7e\x33\x8e\x76\xaf\x5e\x60\xca\xac\xf7\x99\x78\x77\x07\xdf\x5e\
-\x7a\xcc\x67\xed\xaa\x96\xda\x9e\x46\xa3\xf9\x53\x24\x7a\xea\xd4\
-\xa9\x8c\x1f\x3f\xde\x2e\xdb\x6a\xd7\xae\x6d\x7d\xd6\xcc\x66\x33\
-\x5a\xad\xd6\xea\x94\x17\x37\x6f\x96\x7b\xad\x00\xda\x87\x31\xc4\
-\xa6\xe8\xf8\x70\xc5\xd7\xec\xdd\xb2\x89\x15\x7d\xbf\x40\xf9\x61\
-\x1c\x93\x13\x3e\xe6\x8b\x5f\xe3\xf9\x72\x40\xd0\x73\xf7\x8e\x67\
-\xc7\xaa\x70\x85\x53\x2f\x2f\x2f\x56\xaf\x5e\x4d\xeb\xd6\xad\xed\
-\x3a\x98\xea\xda\xb5\xab\x55\xe2\xc5\x64\x32\x51\x50\x50\x50\x2a\
-\x69\x92\xcb\xe5\xd6\xc3\xa7\x4b\x3b\xf7\xf1\xc1\x8c\xcf\x79\xb0\
-\xfd\x6d\xb6\x6c\x8d\xa0\xf2\x83\x23\x74\x78\xf7\x23\xce\x1d\x3c\
-\xc5\x9b\xd9\xc1\x9c\x9c\x14\x52\xea\xc1\x80\x45\x5b\xd2\xf2\x67\
-\x80\x83\x07\x0f\xda\x45\x70\x74\x3a\x1d\x55\xaa\x54\xb1\x3e\xe3\
-\x16\x42\x69\x34\x1a\x4b\x1c\x67\x95\x52\x89\xec\xdf\x73\x9d\x7a\
-\xfd\x1c\x97\x9a\x7d\xca\xc7\xe1\xf7\xd8\x7a\x61\x0d\x3f\x2e\xb9\
-\xcf\x4f\xf1\x1b\x99\x55\x63\x10\x47\x87\x1d\xa7\xbd\xc9\x48\x81\
-\x4e\x5f\xaa\x6d\x96\x54\x5b\x83\xc1\x40\x78\x78\x38\xfb\xf6\xed\
-\x2b\x52\x68\xc8\x56\x24\x25\x25\x51\xb7\x6e\x5d\xab\x6d\xcf\xdb\
-\xff\x2d\x95\x7f\xed\xd1\xc7\x94\x20\x41\x22\x81\x12\x24\x48\x90\
-\x50\x46\x87\xea\xd8\xb1\x63\xa4\xa5\xa5\x15\x79\x19\xbb\xba\xba\
-\x92\x93\x93\x83\x9b\x9b\x9b\xf5\xff\xe5\xe5\xe5\xd9\xf5\xb3\x0a\
-\x3b\x55\x0a\x85\x82\xab\x57\xaf\xb2\x73\xe7\xce\x12\x9d\x1b\x83\
-\xc1\xc0\x80\x01\x03\x48\x4c\x4a\xe5\x61\x5a\x26\x6d\xdf\x99\x4b\
-\x7e\x6a\x14\xb3\xce\xab\xa8\xfd\x52\x3e\xda\x04\x4f\xaa\x56\x0d\
-\xc2\xd1\xc5\x11\x7d\x5e\x36\xb1\x71\x0f\x38\x17\x79\xae\xd8\xc2\
-\x1a\x82\x20\x90\x97\x97\x47\x5a\x5a\x5a\x11\x07\xd9\x5e\xe4\xe7\
-\xe7\x17\xb1\xed\xda\xb5\x6b\xec\xde\xbd\xbb\xd8\x92\xe8\x46\xa3\
-\x11\x6f\x6f\x1f\x5a\xb7\x6a\x4e\xf6\x9d\x2b\x5c\x79\x90\x8e\x6f\
-\xad\xd1\x0c\xf2\xba\xc1\xca\x95\xe7\x78\xa4\xf3\xa0\x59\x03\x2f\
-\x34\xee\x81\x78\x3b\x69\xc9\xcf\x35\x91\xf2\xe4\x0e\x27\x4e\x9e\
-\x42\xa3\xd1\x3c\xb7\x4d\xa5\x52\x49\x4a\x4a\x4a\x11\xa7\xdb\x68\
-\x34\xa2\xd7\xeb\xed\x72\xaa\x0a\x13\x14\x93\xc9\xc4\xd5\xab\x57\
-\xd9\xb1\x63\x47\x11\x9b\x0b\xe3\x69\x85\x4b\x37\x5e\x7d\xb5\x0b\
-\xf1\xe7\x8f\x11\x97\xef\x46\xab\x1e\xfd\xc8\xb8\x7e\x98\x03\xf1\
-\x9e\x34\x0d\x8e\xa5\xfa\x2b\x13\xf1\x17\x52\x90\x29\x05\x52\x74\
-\x66\xae\x9d\x8f\xe0\xc1\xa3\xc7\xa5\x8e\xb1\x42\xa1\x28\xe2\x44\
-\x1a\x8d\x46\xd1\x45\x54\x2c\x0e\x76\x61\xb9\x90\x23\x47\x8e\x70\
-\xe3\xc6\x8d\x62\xef\x9a\x99\x4c\x26\x2a\x57\xa9\x42\xb3\xf0\xea\
-\x9c\x8f\x8c\x42\x19\xf4\x22\x13\x3f\x98\xca\x9d\x63\x9b\x39\x7d\
-\x29\x19\x75\xcd\x17\x08\xf1\x0b\xa4\x9d\xbb\x27\x2b\xcf\x67\x42\
-\x3b\x23\x27\x4f\x9e\x24\x21\x21\xa1\xd8\x7e\x3a\x38\x38\x10\x15\
-\x15\x55\xe4\x67\xda\x9b\x9e\xfc\xec\xba\xce\xce\xce\xe6\xe8\xd1\
-\xa3\xdc\xbe\x7d\xbb\x58\x12\xa8\xd7\xeb\xa9\x5b\x2f\x9c\xf0\x5a\
-\x95\xb8\x16\x71\x8e\x24\x85\x0f\xfd\x87\x8d\xe2\xfa\xd1\x6d\x3c\
-\xc8\xbe\xc7\x9d\x0b\xd5\x99\xdc\xc5\x09\x97\x83\x81\x24\x9e\x8e\
-\xc1\xa0\xf3\xe1\xf0\xe1\x63\x64\x67\x67\x97\x48\x26\x2e\x5f\xbe\
-\x5c\x64\xfd\x59\xc8\x9b\x58\x64\x65\x65\x59\x2b\x67\xca\xe5\x72\
-\x12\x13\x13\xd9\xbd\x7b\xf7\x7f\x88\x79\x31\xcf\x7d\x68\xf5\x50\
-\x6a\x55\xa9\x40\x64\xd4\x35\xfc\x5b\x0d\x21\xff\xf6\x19\x36\x1f\
-\x4d\xa6\xe6\x08\x0d\x29\x51\x79\x54\x9f\xd0\x05\xe3\xaf\x3b\xd9\
-\x7d\xec\x24\xfa\xb7\x7d\xd9\xb1\x63\x4f\xa9\x04\x37\x36\x36\x16\
-\x7f\x7f\xff\x22\x7b\x9c\xb3\xb3\xb3\x5d\xfb\x48\x61\x49\x8f\x47\
-\x8f\x1e\xb1\x6d\xdb\xb6\x12\x53\x83\xcd\x66\x33\x1d\x5f\x7a\x19\
-\xc7\xac\x38\x7e\xbf\x95\x45\xcd\xb0\x3e\xfc\xd8\xce\xc4\xf1\xef\
-\x77\x62\xb8\x71\x9c\x3b\xf5\xc6\x11\x48\x45\x5e\x69\x78\x8f\xe3\
-\x17\xa1\xb6\x57\x3c\xc7\x4e\x47\x96\x38\x56\x00\x8f\x1f\x3f\xb6\
-\xee\x35\x26\x93\xa9\x5c\xf6\x7f\x4b\xdb\x4a\xa5\x92\xf3\xe7\xcf\
-\xe3\xea\xea\xfa\xa7\xfd\xbe\x7a\xf5\xea\x34\x68\xd0\x40\x22\x82\
-\x12\x24\x48\x24\x50\x82\x04\x09\x7f\x35\x02\x02\x02\x70\x77\x77\
-\xff\x13\x09\x2c\xfc\x12\x16\x04\xa1\x44\x27\xab\x2c\x28\xfc\x7d\
-\xb3\xd9\x8c\xa7\xa7\x27\xc1\xc1\xc1\x25\x7e\xc7\x64\x32\x21\x13\
-\x04\xe2\x1f\x24\x70\x3e\x2e\x16\x77\x07\x67\xdc\x15\x5e\xf4\x7e\
-\xb5\x06\xf3\xf7\x46\xd0\x3d\x48\x6d\xbd\xc2\x63\x36\x83\x9b\xbb\
-\x1b\x55\xab\x56\x2d\x31\x2a\x90\x9e\x9e\x5e\x44\x37\xaf\xbc\xaa\
-\xde\x15\xee\xb3\x87\x87\x07\x81\x81\x81\x45\x34\x09\x9f\xb5\xcb\
-\xc5\xc5\x15\xa5\x52\x4e\xe2\xe5\xdf\x39\x14\xf1\x90\x6a\x26\x7f\
-\xba\x37\xac\x42\x58\x68\x08\x77\xaf\x46\x90\x9a\x23\x43\x2e\x13\
-\x9e\xde\xec\x11\x04\xdc\xdc\xdc\x08\x0d\x0d\x2d\xd6\x39\x52\x28\
-\x14\x38\x3a\x3a\x16\x21\x1b\x85\xa3\x1f\x62\xf1\xec\x3a\x70\x77\
-\x77\x27\x28\x28\xa8\x58\x67\xde\x52\x32\x1f\x43\x01\x77\x23\x0f\
-\xb3\x3f\xc5\x0f\x85\x6f\x65\x02\x3d\x83\x69\xff\xa2\x2f\xd1\xd1\
-\x77\x31\x57\x10\x90\xc9\x04\x84\x7f\xdf\x5a\xf2\xf3\xab\x80\x52\
-\xad\x29\xb1\x1f\xa9\xa9\xa9\x45\x9c\x61\xa5\x52\x69\x57\x15\x4d\
-\xb9\x5c\xfe\x27\xd9\x8b\x4a\x95\x2a\x11\x1c\x1c\x5c\x6c\xe4\xce\
-\x64\x32\xe1\xed\xe3\x43\x41\xc6\x63\x4e\x1e\xde\x8b\xba\x55\x35\
-\xbc\x50\xe1\x15\x54\x8d\xa0\x20\x3f\xd2\xb7\x5e\xc3\x28\xc8\x30\
-\x1b\x41\xa1\x92\x01\x32\xfc\xfd\xfd\x71\x74\x74\x2c\x76\x9d\x69\
-\x34\x1a\xbc\xbd\xbd\x8b\xac\x93\xf2\x48\x97\x2b\xfc\xf3\x94\x4a\
-\x25\x95\x2a\x55\x22\x24\x24\xa4\x58\x12\x68\x30\x18\xf0\xf4\xf4\
-\x06\x6d\x32\xd1\xc7\xf6\x71\x51\x08\xc2\xcb\xaf\x0f\x15\xab\xd6\
-\xc2\xf3\x4a\x34\xb1\xf9\xb9\xe8\x00\x05\x26\x90\x29\x51\xa8\x54\
-\x54\xae\x5c\x99\xfc\xfc\xfc\x62\xa3\xd3\x32\x99\xcc\x9a\x46\x58\
-\x9e\xfb\x88\xc5\x36\xcb\xfd\xd7\xa0\xa0\xa0\x62\x0f\x47\x2c\xf0\
-\xf1\xf1\x26\xe3\x51\x2c\xc7\x0f\xed\xa5\x8a\xde\x8d\x97\xab\xf8\
-\x13\xd6\xba\x3e\x0f\x63\xa2\x71\x94\x2b\xc1\x0c\x46\x41\x06\x0a\
-\x35\x82\x20\x27\x38\x38\xb8\x44\x09\x03\x99\x4c\x66\x3d\x24\x7b\
-\xde\x1e\x27\xd6\xb6\xc2\x3f\xcf\xd9\xd9\x99\x90\x90\x90\x62\x0f\
-\x25\x2c\x6b\xd7\xd1\xc5\x85\xec\x4b\x67\xd9\xb5\xef\x11\x05\x4a\
-\x6f\x9c\xbd\xab\x51\x33\xbc\x06\xbf\x9e\x16\x30\x69\x9f\x1e\x0a\
-\x19\xf4\xa0\x50\x81\x8b\x8b\x4b\xa9\x45\x95\x04\x41\xc0\xc9\xc9\
-\xc9\xba\x56\x04\x41\xb0\x7b\x1f\x29\x3c\x6f\x26\x93\x09\x5f\x5f\
-\x5f\x82\x83\x83\x8b\xd8\xfb\xf4\x70\xcc\xbb\x5c\xf6\x64\x09\x12\
-\x24\x12\x28\x41\x82\x04\x09\xa5\xbc\xec\x8b\xab\xd8\x67\x49\xc3\
-\x94\xc9\x64\x64\x65\x65\x71\xe1\xc2\x05\x74\x3a\x9d\xa8\x28\x85\
-\x5c\x2e\xe7\xca\x95\x2b\x98\x4c\x26\x04\x41\xc0\x68\x34\x12\x14\
-\x14\x54\xe6\x8a\x7a\x8d\xc2\x5f\xa0\x51\xd3\x2a\x6c\x9e\x3a\x0b\
-\xf3\xab\xef\x50\xcf\x94\x44\x8e\xaa\x22\xea\xec\xcb\xec\xd9\x7f\
-\x9c\x94\x34\x2d\x0e\x6e\x1e\x54\xf0\x53\x51\xc1\xaf\x42\x89\x6d\
-\x25\x25\x25\x59\xb5\x0a\x2d\xb6\x5d\xbf\x7e\xbd\x58\xc2\x56\x1a\
-\xd4\x6a\xb5\xf5\xbe\xa4\xc5\xc1\x09\x0c\x0c\xa4\x6e\xdd\xb2\x49\
-\x3c\xd4\xec\xfe\x26\xd3\xba\x08\x3c\x3c\xfa\x11\x2b\x7f\xe9\x46\
-\xa7\x0a\xee\x04\xfa\x3b\x10\x79\x2a\x86\x4b\xfe\x0f\x79\x9c\xef\
-\x8e\x93\xb3\x80\xb3\x8b\x2f\x2d\x7d\x7c\x4b\xb5\xad\x30\x81\x48\
-\x49\x49\xe1\xcc\x99\x33\xa2\x0a\x31\x98\xcd\x66\xdc\xdc\xdc\x88\
-\x8e\x8e\xb6\x16\x85\x10\x04\x81\xe0\xe0\x60\xc2\xc3\xc3\xcb\xd0\
-\x80\x89\x66\xaf\x4f\xa5\x6e\x41\x32\xbf\x6c\xd9\x88\xae\xd9\x2b\
-\xb8\xe4\x3d\xc6\xbf\xf1\xcb\x9c\xde\xb2\x9a\xdf\x82\x9b\xa0\xd3\
-\xcb\xf1\xd3\x08\xb8\xd4\xa8\x51\x6a\x73\x09\x09\x09\x56\x32\xa1\
-\x50\x28\xb8\x71\xe3\x06\x91\x91\x91\xa2\x89\xa0\xc9\x64\x22\x2e\
-\x2e\xce\x3a\x5e\x82\x20\x50\xbf\x7e\x7d\x42\x43\x43\x4b\xff\xae\
-\xbe\x80\x31\x53\xe6\xa0\x51\xe8\xf9\x68\xfa\x1c\x06\xbc\x37\x1d\
-\x0f\x17\x25\xde\xf9\x29\x5c\xba\x78\x9c\xc7\x77\xe3\x69\xd3\xdf\
-\x1d\x78\x2a\x65\x50\x1a\xae\x5e\xbd\x5a\xc4\xf1\x8d\x8b\x8b\xe3\
-\xea\xd5\xab\xa2\xa2\x66\x16\xfd\xcb\x94\x94\x14\x2b\xc9\x75\x70\
-\x70\x20\x3c\x3c\x9c\x1a\x65\x18\x67\x4c\x3a\xba\xbd\x33\x93\xc6\
-\xb7\xce\xf2\xeb\xfa\x95\x34\xeb\x33\x18\x43\x81\x0f\xfd\xba\xa5\
-\xb0\xec\xcb\x48\xc6\x14\xdc\xa0\x7a\xe3\xbe\x80\x92\x7a\xf5\xea\
-\x95\xda\x5c\x56\x56\x96\xb5\x1a\x64\x7e\x7e\x3e\x97\x2e\x5d\xb2\
-\x3b\x5a\xf6\xf8\xf1\x63\x94\x4a\xa5\xf5\xc0\xa5\x59\xb3\x66\x85\
-\xd2\x8f\x8b\x87\xc1\xc7\x87\x49\x1f\x35\xe2\x8f\x0d\x5f\x90\xe0\
-\xd7\x8b\x20\x97\x1c\xee\x64\xba\x13\x5a\xd1\x91\xb3\x2b\x97\x12\
-\xe3\x18\x40\xd3\x4e\xad\x50\xa8\x1c\xca\xb4\x37\x05\x04\x04\x14\
-\x11\x77\x8f\x88\x88\xc0\xc5\xc5\x45\xb4\x58\x7c\x66\x66\xa6\x95\
-\x54\x0b\x82\x80\x97\x97\x17\x8d\x1a\x35\x2a\xd3\xf7\x35\xcd\x07\
-\x33\xb7\x4e\x3e\x77\x7e\xfb\x81\x51\xcb\x9a\xf1\x41\x53\xd0\x05\
-\xb6\xa5\xe1\xe9\xcd\x1c\xba\x12\xcc\x96\xeb\xe1\x7c\xfc\x02\x38\
-\xe1\x4b\xd3\xa6\xbe\xa5\xb6\xe7\xe5\xe5\x45\x62\x62\x22\x32\x99\
-\x8c\x8c\x8c\x0c\xce\x9f\x3f\x4f\xa5\x4a\x95\x44\x6b\xc5\x3e\x7c\
-\xf8\xd0\x5a\x80\xc9\x68\x34\x12\x1a\x1a\x4a\xb3\x66\xcd\xa4\x97\
-\xb0\x04\x09\x12\x09\x94\x20\xe1\xff\x1e\x1e\x3c\x78\xc0\x6f\xbf\
-\xfd\x86\x20\x08\x74\xe8\xd0\x81\x4a\x95\x2a\xfd\xe3\xc4\x71\x2d\
-\x7a\x7a\x29\x29\x29\x0c\x1e\x3c\x18\x99\x4c\x26\xca\xc1\x11\x04\
-\xc1\xea\x3c\xe4\xe6\xe6\x5a\xef\xce\x59\x88\x58\x69\x70\x70\x50\
-\x01\x5e\xf4\x7d\xeb\x75\x7e\xd8\xf2\x23\xdb\xe4\x23\xd9\xb9\xa8\
-\x13\x79\x27\x93\x58\xbd\xfb\x1a\x9d\x06\x8d\xa0\xba\x7f\xd9\x4e\
-\xe1\x0b\x47\x25\xd2\xd3\xd3\xc9\xca\xca\x22\x2c\x2c\x4c\x74\x5a\
-\x68\x61\xdb\x2c\xe9\x85\xb6\xb4\xa5\x76\xf5\x44\x0d\x38\x77\x7a\
-\x87\xc0\x55\xdf\xf1\xbb\xbe\x3a\x43\x96\xac\xe3\xd5\x53\x9b\xf9\
-\xfe\xa7\xcb\x0c\x9e\x38\x19\xe7\x32\x2e\x19\x4b\xc4\xc0\x62\xdb\
-\xe5\xcb\x97\x69\xd9\xb2\xa5\x5d\x87\x04\x85\x89\x7b\xe1\xf1\x2b\
-\xfd\xcb\x32\x1c\xdc\xbc\x70\x70\xf3\xe2\xe5\xd6\x09\xfc\xb2\x7b\
-\x3d\x05\xc1\x13\x78\x67\x6c\x17\x9a\x7b\x2e\x60\xcb\xc1\xeb\x0c\
-\x18\x3e\x12\x17\x59\xd9\x6d\xb3\xf4\xc3\x6c\x36\xf3\xd3\x4f\x3f\
-\xb1\x69\xd3\x26\xbb\xd7\x77\x8f\x1e\x3d\x6c\xb6\x4d\xa6\xd4\xe0\
-\xe9\xf5\x34\xf2\x34\xb2\x7f\x3b\x36\xaf\x5f\x8b\xf7\x0b\x03\x38\
-\x75\xa9\x2a\xbf\xaf\x5f\xc3\x25\xdf\xa6\x4c\xaf\x57\xd1\x26\x42\
-\x6a\x21\x02\x00\xcb\x96\x2d\x63\xc5\x8a\x15\xa2\xd7\xa4\xe5\x4e\
-\x57\x46\x46\x46\x91\xfb\x65\x65\xfb\xb2\x0a\x67\x4f\x1f\x9c\x9b\
-\xb4\xa5\x8b\x36\x8f\x6d\x5b\xb7\x10\xd2\xac\x0f\xc3\xa7\xf6\x25\
-\x73\xce\x2a\xae\x04\xb7\xe5\xbd\x2e\xfe\x36\xdb\x66\x30\x18\x48\
-\x4b\x4b\x63\xe2\xc4\x89\xe5\xa2\xef\xd8\xbf\x7f\x7f\xeb\x9f\xcb\
-\x6a\x9b\x42\xe3\x88\xab\x06\x5e\x1a\x31\x8a\x95\xab\xd6\x92\xad\
-\x6a\xcd\x5b\xe3\xba\xa3\xbc\xeb\xc9\xcd\xaf\x36\xd3\xa1\xcf\x18\
-\x5e\x69\x5f\xd1\xa6\x7e\x08\x82\x60\x4d\xc1\x6e\xd7\xae\x5d\xb9\
-\xec\xb9\x96\x08\x9c\x2d\xf3\xaf\x70\x74\xc7\xcf\xd1\x1d\xc7\x97\
-\x7a\x33\xe0\xc7\xcd\xec\x3f\x04\x7d\xfb\x4e\x20\xbc\xd3\x21\x96\
-\xac\xda\x41\xf7\xaf\x96\xd1\xc0\xc6\x7e\x58\x7e\xbf\x77\xef\x1e\
-\xdd\xbb\x77\x17\xbd\xff\x5b\xda\x71\x70\x70\x40\xab\xd5\x5a\xf7\
-\x15\x49\x2c\x5e\x82\x04\x89\x04\x4a\x90\xf0\x7f\x0a\x06\x83\x81\
-\xc5\x8b\x17\xf3\xc1\x07\x1f\x58\x1d\x32\x93\xc9\xc4\x9c\x39\x73\
-\xf8\xe8\xa3\x8f\xfe\x51\xb6\x08\x82\x40\xff\xfe\xfd\xe9\xd1\xa3\
-\x47\xb9\xb5\x97\x9c\x9c\xcc\x6b\xaf\xbd\x26\xea\xfb\x2e\x21\x2d\
-\x18\xff\x41\x8b\xff\x7c\xd0\x71\x38\xcb\x45\x28\x21\x9b\xcd\x66\
-\x72\x72\x72\xd8\xb7\x6f\x5f\xb9\xa4\x1e\x99\xcd\x66\x54\x2a\x15\
-\x77\xef\xde\x15\x7d\x52\xae\x71\xaf\xc6\xd8\x19\x9f\xfd\xe7\x83\
-\x3e\x6f\xd0\xac\x8f\xb8\x31\xce\xce\xce\x26\x22\x22\xa2\xc4\x54\
-\x3d\x5b\xdb\xbc\x75\xeb\x16\x7a\xbd\x5e\x54\x7b\x81\xe1\xed\x98\
-\x1c\xfe\x1f\x07\xb9\xe5\xf0\xd9\x88\xa1\xa6\x7a\xbd\x1e\x3f\x3f\
-\x3f\x4e\x9f\x3e\x6d\x75\x26\xed\x9d\x37\x07\x07\x07\x96\x2f\x5f\
-\x2e\xda\xb9\xad\xd5\x76\x00\x1f\xb7\xfd\xcf\xdf\x87\x4e\x99\xcf\
-\x50\x91\x63\x9c\x98\x98\x28\x3a\x22\x5d\x9c\x6d\x1b\x36\x6c\x10\
-\x67\x9b\xcc\x99\xb0\x36\xfd\x08\x6b\xd3\xcf\xfa\xd1\xfb\x5f\xac\
-\x12\xd5\x17\xbd\x5e\x4f\xb3\x66\xcd\x48\x49\x49\x29\x37\x6d\x3f\
-\x8d\x46\x23\x7a\x1f\xc1\x21\x80\xf1\xef\x17\x2a\x2a\x54\xa3\x25\
-\xb3\x97\x89\x3b\x2c\xc9\xcf\xcf\xa7\x75\xeb\xd6\xe5\x36\x6f\x26\
-\x93\x09\x47\x47\x47\xd1\xfb\x88\x8b\x4f\x75\x06\xbf\x37\xbb\xd0\
-\x27\xc3\x59\xde\x7a\xb8\xe8\x35\xd4\xbe\x7d\xfb\x62\xef\xff\x8a\
-\x59\xe3\x79\x79\x79\x6c\xdc\xb8\x51\x72\x14\x24\x48\x90\x48\xe0\
-\x73\xde\x3b\x85\x2a\x6e\x49\xb0\x8f\x88\x48\x27\x6c\xff\x7d\x3c\
-\x79\xf2\x84\xf9\xf3\xe7\xb3\x7c\xf9\x72\x2a\x55\xaa\x44\x9d\x3a\
-\x75\x10\x04\x81\xc8\xc8\x48\xe6\xcc\x99\xc3\xd1\xa3\x47\xf9\xfd\
-\xf7\xdf\xff\x71\x76\x95\xd7\x5a\xb2\x10\xae\xbf\xd3\xda\xb4\xe7\
-\x74\xbb\xf0\xf8\xfc\x1d\x9f\xb7\xf2\xba\x5b\x23\x56\x1a\xe2\xaf\
-\xb4\xab\x3c\x6c\xb3\xd8\x24\xd6\xe1\x2e\x6f\x58\x2a\xab\x96\xd7\
-\x33\xfb\x77\x7b\x97\xfe\x5d\x9f\x13\x7b\x6d\x32\x1a\x8d\xe5\x26\
-\x7b\x60\xcf\x3d\xd7\x7f\xc2\xfe\x2f\xe9\x03\x4a\x90\x20\x91\xc0\
-\x62\x11\x14\x14\xc4\xb1\x63\xc7\xa4\x19\xb7\x13\x31\x31\x31\x78\
-\x7a\x7a\x4a\x17\xac\xff\x8b\xc8\xcf\xcf\x67\xe2\xc4\x89\x6c\xda\
-\xb4\x89\x56\xad\x5a\xb1\x68\xd1\x22\xeb\xbd\x92\x23\x47\x8e\x30\
-\x74\xe8\x50\xa2\xa3\xa3\xd9\xb2\x65\x8b\x35\x95\xe9\x9f\x80\x47\
-\x8f\x1e\xb1\x72\xe5\x4a\x6b\xfa\xa6\x3d\xce\x8d\x46\xa3\xa1\x71\
-\xe3\xc6\xa5\x16\x71\x28\x0d\x7a\xad\x1e\xa5\xfa\x69\xa1\x02\x83\
-\x4e\x8f\xc2\x46\xd1\x71\x4b\x81\x8a\xed\xdb\xb7\x73\xf3\xe6\x4d\
-\xbb\x74\xe2\x2c\xce\x8d\x93\x93\x13\x9d\x3b\x77\xb6\x7f\xc0\x4d\
-\x06\xf4\x28\x50\xca\xcc\xe4\xe6\x19\x70\x72\xb4\xcd\x36\x4b\x54\
-\x72\xd3\xa6\x4d\x56\x41\x75\x7b\xe6\x4d\xa9\x54\xe2\xe6\xe6\x46\
-\x8b\x16\x2d\xec\x76\xe2\x0a\xcf\x9b\x3e\x5f\x8b\xd2\x41\x6d\xf3\
-\x38\xe7\xe5\xe5\xb1\x76\xed\x5a\x6e\xdd\xba\x65\xad\x12\x69\x8f\
-\x63\xdb\xa6\x4d\x9b\x72\x89\x2a\x9a\xf4\x5a\x04\xa5\x1a\xc1\xa4\
-\xc3\x24\x53\xd9\x2c\xee\x6b\x36\x9b\x71\x72\x72\x62\xe6\xcc\x99\
-\x28\x95\x4a\xbb\x09\x9c\x4c\x26\xe3\xc5\x17\x5f\x2c\x17\x02\x6f\
-\x34\x18\x90\x2b\x14\x80\x0e\xbd\x49\x85\x52\x66\x7b\x5f\x12\x12\
-\x12\xd8\xba\x75\x2b\xc9\xc9\xc9\x76\x13\x12\x95\x4a\x45\xdf\xbe\
-\x7d\xed\x26\x5e\x66\x5d\x01\x26\x95\x06\x39\x60\xc6\x66\x9d\x78\
-\xeb\xbe\x96\x94\x94\xc4\x77\xdf\x7d\x67\xd7\x7a\xb4\x8c\x53\x41\
-\x41\x01\x73\xe7\xce\x2d\x97\x03\x05\xcb\xa1\x82\x5e\xab\x43\xa9\
-\x56\xd9\x6c\xa4\x20\x08\xa4\xa4\xa4\xb0\x78\xf1\x62\xbb\x0f\x4b\
-\x04\x41\xc0\xd5\xd5\x95\x4e\x9d\x3a\x49\x95\x3f\x25\x48\x90\x48\
-\xe0\xf3\xd1\xbb\x77\x6f\xe6\xcc\x99\x43\x4c\x4c\x0c\xb5\x6a\xd5\
-\x92\x66\x5e\x04\x12\x13\x13\x39\x74\xe8\x10\x0b\x17\x2e\x94\x44\
-\x59\xff\x8b\x48\x4d\x4d\xa5\x5d\xbb\x76\x74\xea\xd4\x89\x17\x5f\
-\x7c\x91\x9a\x35\x6b\x5a\xff\xad\x63\xc7\x8e\x7c\xf5\xd5\x57\xf4\
-\xea\xd5\x8b\xd3\xa7\x4f\xff\x23\x48\xa0\xe5\xbe\xc6\xb9\x73\xe7\
-\x58\xb0\x60\x01\xc1\xc1\xc1\xf8\xfa\xfa\x8a\x4a\xe7\x92\xc9\x64\
-\x3c\x78\xf0\x80\x84\x84\x04\x3e\xfe\xf8\x63\x1c\x1c\x1c\xc4\x3b\
-\x4b\xc9\x7f\x30\x71\x45\x3c\x2b\xe7\x0e\xe0\xec\xaf\x2b\x59\x7b\
-\x24\x8e\xf6\x7d\x47\xd0\xab\x43\x5d\x6c\xa1\x14\x4a\xa5\x92\x4d\
-\x9b\x36\xb1\x77\xef\x5e\x5e\x7c\xf1\x45\xd1\x65\xf9\x65\x32\x19\
-\x8f\x1f\x3f\xe6\xe1\xc3\x87\x34\x6c\xd8\xd0\x2e\x87\xbb\x20\xed\
-\x16\x5b\x7f\x3a\x44\xf8\xc0\x37\x78\xbc\x7b\x05\x7b\x2f\xdc\xa1\
-\x71\xcf\x77\x18\xda\xa1\xba\x4d\xed\xa8\xd5\x6a\xbe\xfb\xee\x3b\
-\x7e\xfb\xed\x37\x6a\xd7\xae\x8d\x93\x93\x93\xa8\xf1\x56\xab\xd5\
-\x44\x46\x46\xe2\xec\xec\xcc\x86\x0d\x1b\xec\x8a\x52\x68\xaf\x6e\
-\x66\xfa\x7e\x0f\x96\x4e\x69\xcb\x8e\xcf\x3f\x64\x5f\x8a\x1b\xfd\
-\x07\x0e\xa3\x43\x83\x40\x9b\xc6\x3a\x37\x37\x97\xf5\xeb\xd7\x73\
-\xf5\xea\x55\x6a\xd6\xac\x29\x7a\xbc\x8d\x46\x23\x57\xae\x5c\xe1\
-\xce\x9d\x3b\xd6\x67\x55\xec\x9a\xcc\xbd\xb9\x9b\xaf\xf6\x68\x19\
-\x31\xba\x1e\x5b\x97\xae\xe6\x92\x36\x90\xd9\x1f\xbe\x49\x25\x17\
-\xdb\x48\xae\xb3\xb3\x33\x8b\x17\x2f\xc6\xdb\xdb\x9b\x90\x90\x10\
-\xf1\xa9\xc5\x1a\x0d\xa7\x4e\x9d\x62\xe0\xc0\x81\x74\xeb\xd6\xcd\
-\xae\x7d\xe0\xe1\x99\x9f\xf8\x2d\xbd\x0e\xc3\x9a\x66\x32\x6d\xfa\
-\x06\xcc\xa1\x2f\xf2\xde\xa4\x11\xf8\xdb\xe0\xc7\xcb\xe5\x72\x1e\
-\x3d\x7a\xc4\x27\x9f\x7c\x82\x93\x93\x13\x01\x01\x01\xe2\x09\xa9\
-\xd1\xc8\xc5\x8b\x17\xf1\xf2\xf2\xb2\xef\xfd\x96\x7e\x82\xd9\x73\
-\x2e\x32\x71\xd9\xbb\x68\xaf\x1e\x64\xf9\x17\x1b\xf1\xee\xfa\x36\
-\xdd\xbb\x36\xa5\xba\x0d\x67\x54\x0a\x85\x82\xf8\xf8\x78\x3e\xff\
-\xfc\x73\xc2\xc3\xc3\x51\x2a\x95\xa2\xef\x4d\x17\x14\x14\x10\x1d\
-\x1d\xcd\xd8\xb1\x63\xed\x3e\x70\x39\x79\x60\x17\xea\x6a\x0d\x71\
-\xbf\xb9\x85\x2f\x76\xdc\xa0\x6a\xb7\xc9\x4c\xed\x59\xd3\xe6\x76\
-\xae\x5f\xbf\xce\xe7\x9f\x7f\x4e\x68\x68\x28\x1e\x1e\x1e\xa2\xd7\
-\x64\x6e\x6e\x2e\xb7\x6f\xdf\xa6\x4a\x95\x2a\x76\x57\x51\x95\x20\
-\x41\x22\x81\xff\x47\xe1\xef\xef\xcf\xfc\xf9\xf3\x19\x39\x72\x24\
-\xf3\xe7\xcf\xa7\x7d\xfb\xf6\xd2\xec\xdb\x80\xab\x57\xaf\xf2\xe1\
-\x87\x1f\xd2\xb9\x73\x67\xa9\xf2\xd6\x7f\x89\x24\x25\x26\x26\x5a\
-\xc9\x84\x5a\xad\xa6\x62\xc5\x8a\x04\x05\x05\x15\x21\x81\x00\x1d\
-\x3a\x74\xb0\xbe\x0c\xff\x11\x9b\x8e\x42\x61\x25\x7c\xfe\xfe\xfe\
-\xac\x5c\xb9\x92\x7a\xf5\xea\x89\x8a\x50\xc8\xe5\x72\x2e\x5f\xbe\
-\x4c\xbf\x7e\xfd\xac\x77\x24\x5d\x5d\x5d\x45\x45\xaa\x4f\xef\xfe\
-\x9e\x8d\x3b\xdd\x59\x3c\xab\x03\xbb\x7f\xbb\x48\xdb\xb6\x0d\x88\
-\x8d\x38\xc0\xdd\xda\xd5\xa9\xe9\x5f\xba\xf7\xe6\xec\xec\x8c\x4a\
-\xa5\xb2\xea\x8c\xf9\xf9\xf9\xb1\x75\xeb\x56\xd1\x77\x95\xd4\x6a\
-\x35\xeb\xd6\xad\xe3\xa3\x8f\x3e\xb2\x16\x85\x11\x53\xfd\xd0\x6c\
-\x36\x72\xf9\xc0\x56\x7e\x3e\x7e\x13\x65\xe5\xda\xfc\x7e\x57\x41\
-\xb7\xae\xcd\xd9\xb8\x71\x2d\xbd\xdb\x2d\xc0\xb9\x0c\x43\xe5\xe5\
-\xe5\x65\x75\x1e\x55\x2a\x15\x4d\x9a\x34\x61\xe3\xc6\x8d\xa8\xd5\
-\x6a\x51\xce\x9b\x93\x93\x13\xb3\x67\xcf\x66\xf3\xe6\xcd\x56\xb2\
-\x65\xa9\x1a\x5b\xd6\xe7\xe3\x29\xbb\x7d\xc2\xe6\x9d\xbf\xb0\xe7\
-\x4c\x7b\x16\xf5\xce\x64\xc1\xef\x1a\x26\x0c\x09\x21\xf2\xe4\x11\
-\x1a\xd6\x1b\x85\x7b\x19\xb8\xe5\xb3\x63\x3a\x6a\xd4\x28\xde\x7d\
-\xf7\x5d\xbb\x74\x02\x17\x2f\x5e\x4c\x42\x42\x82\xd5\x09\xf7\xf1\
-\xf1\x11\xd1\xd0\x7d\x16\x2f\xf9\x89\x3b\x86\x10\x76\xef\x4f\xe3\
-\xa1\x22\x98\xaa\xa9\x97\x59\x17\xf5\x98\x99\x6d\x82\xcb\x4c\xfe\
-\x0a\x93\xd9\x37\xdf\x7c\x93\x09\x13\x26\x88\xbe\x8b\xe5\xe9\xe9\
-\x49\xdd\xba\x75\xad\x63\xa3\x50\x28\xfe\x24\x67\x50\x26\xa4\xc4\
-\xb0\x7e\xd3\x46\x12\x6b\xbf\x8b\xc7\xf6\xd9\xdc\xa8\x33\x8b\xbe\
-\x39\x07\xf9\xfa\x40\x47\x3e\x7e\xb5\x72\x99\xfb\x62\x89\x4a\x79\
-\x7b\x7b\x33\x6f\xde\x3c\x5a\xb6\x6c\x29\x9a\xe0\xe4\xe4\xe4\x30\
-\x72\xe4\x48\x74\x3a\x1d\x66\xb3\x19\xb5\x5a\x8d\xa3\xa3\xa3\xcd\
-\x6b\xf2\x9b\x55\x7b\x38\x79\xe2\x01\x63\x19\xc2\xe9\xed\xbf\xa2\
-\x0f\xad\xc7\xf9\xbd\x07\x39\x95\xea\xcd\x8e\xb1\x55\xcb\xfc\x7c\
-\x64\x64\x64\x58\xf7\xb1\xad\x5b\xb7\xa2\xd1\x68\x44\x3d\x6b\x32\
-\x99\x8c\xec\xec\x6c\x5a\xb5\x6a\x65\xdd\x47\xca\xfa\xac\x15\x35\
-\xb2\x00\x62\xb7\xb0\xf9\xc7\xc3\xb4\x19\x9a\xc0\xaf\x9f\x9c\x66\
-\xf0\xcc\x91\xfc\x38\xff\x43\x22\x7a\x6e\xe3\x45\x1b\xf6\x35\x4b\
-\x91\x9a\xaa\x55\xab\xb2\x76\xed\x5a\x82\x82\x82\x44\xed\x93\x96\
-\xf7\x64\xd7\xae\x5d\x81\xa7\x11\xc5\x67\x65\x89\x24\x48\x90\x20\
-\x91\x40\x00\x46\x8c\x18\x81\xb7\xb7\x37\x6f\xbf\xfd\x36\x82\x20\
-\x50\xa3\x46\x0d\x29\x7d\xa0\x0c\x2f\xb7\xf8\xf8\x78\x12\x13\x13\
-\x99\x3c\x79\x32\x63\xc7\x8e\x15\xf7\x02\x91\x60\xd3\x8b\xed\xc1\
-\x83\x07\x8c\x1e\x3d\x9a\x63\xc7\x8e\x15\x89\x24\x6d\xdf\xbe\x9d\
-\x45\x8b\x16\x31\x62\xc4\x08\xeb\x67\x33\x66\xcc\x00\xc0\xcf\xcf\
-\xef\x6f\x63\x83\xc9\x64\x62\xe6\xcc\x99\xc4\xc7\xc7\x17\x11\x4f\
-\x57\xab\xd5\x3c\x78\xf0\x80\x80\x80\x00\xab\xee\x5b\x95\x2a\x55\
-\xec\x3a\xc1\xcf\xcc\xcc\x2c\x42\x24\xbe\xfd\xf6\x5b\x22\x23\x23\
-\x4b\xfc\x4e\x41\x41\x01\xeb\xd7\xaf\xb7\xae\x65\xed\xed\x9d\xdc\
-\x31\x56\xa2\x4e\x45\x15\xf9\x05\x99\x68\x9d\x83\xe9\xdb\xbb\x3b\
-\x6b\xbe\xda\x8c\x21\x2f\x8f\xfd\xfb\x8f\xb1\x6e\xdd\xba\x12\x4f\
-\x9a\x0b\x0a\x0a\x88\x89\x89\xa1\x63\xc7\x8e\x56\x82\x5a\xa9\x52\
-\x25\xbb\xc6\xd1\xcb\xcb\xcb\x6a\x9b\x46\xa3\x61\xed\xda\xb5\x56\
-\x49\x8d\xe7\x39\x3a\x7a\xbd\x9e\xd0\xd0\x6a\x4c\x98\xf0\x0e\xbe\
-\xbe\x4f\xcb\xb5\x0b\xba\x24\x4e\xc7\x64\xd0\xf5\xc5\x60\xee\xdc\
-\x4c\x20\xb4\x49\x3d\xba\x74\x6e\xc0\xa1\x9f\x7f\x23\x27\xc7\xc4\
-\xd9\xc8\xdf\xf8\x72\xd9\x72\xdc\xdd\xdd\x9f\xfb\xfc\xcb\x64\x32\
-\xf2\xf3\xf3\xc9\xca\xca\x2a\xe2\xa4\x86\x84\x84\xd8\x95\x16\xee\
-\xe7\xe7\x67\x75\x9e\xcd\x66\x33\x5f\x7d\xf5\x15\x47\x8e\x1c\x29\
-\xf6\xde\xb1\x5e\xaf\x27\x20\x20\x80\x25\x4b\x96\x58\x3f\x8b\x3a\
-\x7b\x99\xa0\xba\xa1\x54\xbb\xe9\xca\xfd\xe8\x8b\x78\x77\x1b\x45\
-\xef\xe6\xb9\xac\xda\x71\x8a\x54\xbd\x99\xb5\x5f\x2c\x26\xea\xf2\
-\xe5\x12\x9d\xc2\x82\x82\x02\xd4\x6a\xb5\xf5\x10\xc1\xc3\xc3\x83\
-\xa0\xa0\x20\xd1\xb6\x59\xb4\xca\x1e\x3d\x7a\x64\xbd\x3f\x37\x6a\
-\xd4\x28\x5c\x5c\x5c\x8a\xfd\x8e\x5e\xaf\xa7\x51\xa3\x46\xbc\xff\
-\xfe\xfb\xd6\xcf\xce\x6c\xf8\x05\x97\x5e\x83\x68\xbc\x73\x1f\xd1\
-\xa9\x21\x34\x7a\xf1\x55\x5e\x2e\xc8\xe2\xf5\xa8\x0c\x68\xad\xe5\
-\x93\xf9\x8b\x88\x8e\x8e\x7e\xee\x9a\x34\x9b\xcd\x28\x14\x0a\x6e\
-\xdd\xba\x65\xad\x30\x69\x59\x4f\x96\x75\x21\x16\x96\x94\x6b\x4b\
-\x14\x7e\xdc\xb8\x71\xb8\xbb\xbb\x17\x4b\xbe\x72\x73\x73\xe9\xd7\
-\xaf\x1f\x03\x06\x0c\xf8\xf7\x27\x06\xf6\xff\x1e\x8d\x57\xf5\x46\
-\x54\xa8\x9c\xce\xf6\x4f\x54\x8c\x5a\xd3\x95\x1a\x07\xe2\x38\x78\
-\xee\x26\xa9\x4d\xe5\x7c\xb6\xf0\x0b\x12\x13\x13\x4b\x9c\xb7\xc4\
-\xc4\x44\xeb\xf3\xab\x56\xab\xf1\xf3\xf3\xa3\x4a\x95\x2a\xa2\xed\
-\xca\xce\xce\xc6\xcb\xcb\x0b\xa3\xd1\x88\x4a\xa5\x22\x32\x32\x92\
-\x81\x03\x07\x96\x1a\x15\x6c\xdf\xbe\xfd\x7f\xf6\xe3\xbc\xcb\xb8\
-\xf7\xef\x4e\xeb\x13\xab\xc9\xc9\x48\xe7\xd1\x93\x3c\x3a\xcc\x9d\
-\xcc\x9d\x09\x6f\xb1\xf0\xd0\x39\x52\x7b\xa8\x99\xf8\xfe\x87\x98\
-\xcd\xa6\x62\x6d\x13\x04\x81\x13\x27\x4e\xd0\xa2\xc5\x7f\x0a\x55\
-\x05\x04\x04\x94\x99\x90\x16\x67\x5b\x61\x5f\xe7\xc4\x89\x13\x0c\
-\x1b\x36\xac\x58\x52\x69\x21\xd7\xd3\xa7\x4d\x23\xec\xdf\x92\x34\
-\xf9\xa9\xf7\xf8\xf4\xa3\x73\x18\x2a\xbf\x48\x68\xf2\x19\xce\xfb\
-\xbd\xc2\xd6\x6e\xdd\x48\x5f\x3f\x91\xa3\xd7\x41\x9e\x76\x8c\xe5\
-\x5f\x7f\x67\xb5\xa1\x38\xdb\x4e\x9f\x3e\x4d\x50\x50\x90\xf5\x50\
-\x2b\x30\x30\xd0\xae\x7d\x52\x26\x93\x59\xdf\x31\x4e\x4e\x4e\x2c\
-\x58\xb0\x80\x6d\xdb\xb6\x15\xe9\x43\x7e\x7e\x3e\x9d\x3a\x75\x62\
-\xe8\xd0\xa1\x92\xff\x22\x41\xc2\xff\x57\x12\xa8\x54\x2a\xe9\xdd\
-\xbb\x37\x9d\x3b\x77\xe6\xc0\x81\x03\x5c\xbf\x7e\xfd\x6f\x73\x71\
-\xff\xef\x4c\x48\x5e\x7a\xe9\x25\xfa\xf7\xef\x8f\xab\xab\xab\x34\
-\x20\xff\x05\xa4\xa5\xa5\x31\x79\xf2\x64\x0e\x1d\x3a\x44\x40\x40\
-\x00\x43\x86\x0c\xa1\x53\xa7\x4e\x4c\x9e\x3c\x99\x4b\x97\x2e\x31\
-\x7f\xfe\x7c\xea\xd7\xaf\x4f\x78\x78\x38\x87\x0f\x1f\x66\xc5\x8a\
-\x15\x84\x84\x84\xd0\xb7\x6f\xdf\xbf\xd5\xba\x19\x32\x64\x88\x55\
-\xb6\xc1\x02\x77\x77\x77\x7e\xfb\xed\xb7\x3f\x39\xcd\xf6\xa0\xf0\
-\x09\xb2\x5e\xaf\xa7\x65\xcb\x96\x8c\x19\x33\xa6\xc4\x88\x80\xc9\
-\x64\x42\xa5\x52\xf2\xfd\xba\x6d\xec\x8e\x3c\x41\x53\x15\x04\xb7\
-\x09\xc5\x90\x7b\x8b\x98\xbb\xe9\xa8\x14\x32\x4c\x26\x10\x04\xd0\
-\xea\x75\x34\x6c\xd4\xa8\x44\xb1\x61\x4b\xe5\xcc\x6b\xd7\xae\x95\
-\x5b\x95\x42\x8b\x33\x66\x81\xc1\x60\xa0\x45\x8b\x16\x4c\x98\x30\
-\xa1\x08\xf1\x7d\xd6\x2e\x67\x17\x57\x3c\x3d\x9c\xd8\x39\xb6\x11\
-\xe3\x36\x5c\x27\x64\xe0\x00\xba\xd4\x68\x8d\x2c\xfd\x34\x4f\x0a\
-\xbc\xa8\x54\xa7\x0a\x26\xa3\x19\x41\x90\x21\x00\xe1\xe1\xe1\xcc\
-\x98\x31\xa3\xd8\x03\x31\xa5\x52\x49\x62\x62\x22\x7b\xf6\xec\xf9\
-\xd3\xcf\xb2\x87\x04\x3e\x3b\xef\xaf\xbc\xf2\x0a\x7d\xfa\xf4\x21\
-\x2f\x2f\xaf\xd8\xb1\xd0\x68\x34\x98\xf2\x92\xf8\x6a\x60\x23\x3e\
-\x89\x0d\xa0\xfd\xab\x43\x79\xb3\x91\x99\x9c\xac\x87\x3c\x4a\xca\
-\x45\xa5\x54\x60\x32\x1a\x41\x00\x93\xd9\x4c\xcf\x5e\xbd\x68\x53\
-\x4a\xd6\x47\x4e\x4e\x0e\x07\x0f\x1e\x2c\x52\xba\xde\x1e\xdb\x4c\
-\x26\x93\x55\xfe\xc2\xe2\xa4\x0e\x19\x32\x84\xaa\x55\xab\x96\x28\
-\xce\xed\xed\xeb\x43\xe2\xc5\x5f\xe9\xd5\x63\x08\x6e\x23\x36\x53\
-\x2f\xe5\x36\x9d\xfb\x07\xb1\xfb\x71\x32\x09\x3e\xd9\x08\x35\x05\
-\x04\x01\x4c\x66\x40\x50\xd3\xaf\x5f\x3f\x5e\x7e\xf9\xe5\x62\x1d\
-\x6e\x47\x47\x47\x7e\xfd\xf5\x57\x56\xad\x5a\xf5\xdc\xf5\x54\x1e\
-\x6b\xd3\xc3\xc3\x83\xa1\x43\x87\x12\x1a\x1a\x5a\x6c\x24\xdf\x68\
-\x34\x12\x50\x39\x08\x12\x7f\xe3\x9d\x0e\x7d\xf8\x29\xdd\x9d\x1e\
-\x83\xc6\xd2\xa5\xa1\x23\xd7\xef\xdf\x27\xb7\x40\x86\x12\x30\x9a\
-\x65\x98\x0c\x46\xbc\x7c\xfd\x18\x3e\x7c\x78\x89\x5a\x86\x72\xb9\
-\x9c\xd3\xa7\x4f\xb3\x74\xe9\xd2\x22\xa4\xc5\xde\x83\xab\x67\xf5\
-\x46\xc7\x8f\x1f\x5f\xe2\x3d\x63\x41\x10\xa8\x10\xe0\xcb\xe5\xed\
-\xcb\x19\x3c\x7e\x1e\x4e\xa1\x2f\xb1\x6c\xde\x2b\x1c\xca\xcc\x24\
-\x29\x53\xc0\x0c\x20\x80\xdc\x64\xc2\xa4\xd7\xe3\xe5\xe7\xc7\xc4\
-\x89\xef\x96\x4a\x6a\x72\x72\x72\x8a\xd8\x63\xef\x9e\xf2\xec\xf8\
-\x54\xab\x56\x8d\x49\x93\x26\x59\x65\x51\x8a\xfb\x4e\x8d\xba\x75\
-\xb9\xbe\xa4\x2b\x75\x3e\xba\xc4\xa0\x5e\xdd\x10\xda\xf4\xa3\xba\
-\xfe\x36\xb1\xb7\x13\x31\xca\x9e\xba\x8f\x0a\x85\x19\xbd\x1e\xc2\
-\xc2\xc2\x78\xef\xbd\xf7\x4a\xb5\x2d\x3e\x3e\xde\x7a\xb0\x69\xef\
-\x7d\xf0\x67\xc7\x46\xa7\xd3\xd1\xb9\x73\x67\x7a\xf4\xe8\xf1\x27\
-\xb1\x78\x5f\x5f\x5f\x29\x5d\x54\x82\x84\xff\xcf\x24\xd0\x02\x27\
-\x27\x27\xfa\xf4\xe9\x43\x9f\x3e\x7d\xa4\x15\x20\xe1\x6f\x85\x94\
-\x94\x14\x46\x8d\x1a\xc5\xae\x5d\xbb\xe8\xd9\xb3\x27\x6b\xd6\xac\
-\xc1\xdd\xdd\x1d\xb9\x5c\x4e\x54\x54\x14\x93\x27\x4f\x66\xef\xde\
-\xbd\xb8\xba\xba\xb2\x79\xf3\x66\x06\x0e\x1c\x88\xbb\xbb\x3b\xf3\
-\xe6\xcd\xa3\x41\x83\x06\x7f\x1b\x3b\x04\x41\x28\xf6\xee\xad\xe5\
-\x24\xd6\x12\x25\x49\x4b\x4b\x23\x23\x23\x43\x54\x3a\xa8\x45\x94\
-\xdd\xe2\xc8\x58\x9c\xb7\xb2\x8e\xc5\xc0\x81\xdd\x19\xf0\x5a\x0b\
-\xae\x45\x5e\xe0\xce\xad\x53\xa4\x3e\x89\x25\xee\x91\x1e\x07\x53\
-\x26\xb7\xe3\xae\x91\x9f\xa7\x47\xe3\xe8\x82\xaf\x8f\x13\xbe\xa5\
-\xa4\xf4\x15\x16\x8b\x07\xd0\x6a\xb5\xa4\xa4\xa4\x88\x1e\x43\xb5\
-\x5a\x5d\xc4\x19\x34\x18\x0c\x54\xa9\x52\xa5\x4c\xa2\xe3\x00\x5d\
-\xbe\x38\xc2\xf5\x45\x72\x92\xa3\x0f\x72\x38\xf2\x16\x91\x31\x0f\
-\xf1\xaf\x59\x95\xe8\xab\x69\x3c\x6a\x70\x97\x4c\xbd\x03\x6a\x47\
-\x19\xee\xae\x3e\x78\x79\x97\x6c\x9b\xbf\xbf\x7f\x11\x92\xa8\xd7\
-\xeb\x49\x4b\x4b\xb3\x8a\x86\xdb\x0a\x07\x07\x07\x6b\x64\xd1\x12\
-\x0d\xac\x50\xa1\x42\xd9\xee\x6b\x9b\x4d\x8c\xde\x18\xcd\xeb\x05\
-\x39\xc4\x5c\xbe\xcc\xbd\x2b\x51\x24\x3d\x4a\xc6\xc1\xb7\x3a\xf7\
-\xb6\xfc\xc6\xbd\x06\xb5\x11\xcc\x72\xbc\x94\x32\x3c\xab\x55\x2b\
-\xb5\xb9\xc7\x8f\x1f\x5b\x6d\x10\x04\x81\xdc\xdc\x5c\x52\x53\x53\
-\xed\x4a\x07\x2d\x5c\x10\xc8\x22\x16\x1f\x12\x12\x52\x3a\x11\xa9\
-\xe8\xcf\x81\xcb\x8f\x41\xa1\x23\x62\x4f\x32\xd1\xe7\xcf\x13\x97\
-\xab\xc7\x35\xe5\x09\x8f\x1e\x5f\xe7\xc4\xc3\x34\x1a\x37\x7b\x7a\
-\x18\x57\xbd\x7a\xe9\xf7\x39\x9f\x8d\xd6\xe6\xe7\xe7\x93\x97\x97\
-\x57\x2c\xd1\x2e\x0d\x1e\x1e\x1e\xe4\xe4\xe4\x14\x49\x2b\x0c\x0b\
-\x0b\x2b\xa3\x58\x7c\x2b\x3e\x3b\x7d\x87\x69\xa9\x49\x5c\x8b\x8a\
-\xe2\x46\xf4\x41\x2e\x66\x35\xe0\xa5\x06\xf7\xf8\xe5\xf0\x13\xc6\
-\x25\x3c\xa2\x42\xed\x6e\x80\x9c\x3a\x75\xea\x94\xda\x5c\x46\x46\
-\x86\x95\x00\x18\x8d\x46\x72\x72\x72\x48\x4d\x4d\x15\x4d\x06\xb3\
-\xb2\xb2\x8a\x68\xcd\xb9\xbb\xbb\xd3\xa4\x49\x93\x32\x65\x0b\xf9\
-\x76\x1d\xc3\x99\x0e\x43\x79\x72\xf7\x3a\x11\x57\x4e\x73\x3f\x3d\
-\x85\x8c\x6c\x3d\xfe\xbe\xae\xc4\x1e\x3f\xc8\x55\xb7\x00\x42\x1b\
-\xbf\x08\x28\x69\xd8\xb0\x61\xa9\xed\x05\x04\x04\x90\x9a\x9a\x5a\
-\xa4\x6f\x7a\xbd\x5e\x74\x3a\x68\x4e\x4e\x4e\x11\x1d\x53\x6f\x6f\
-\x6f\xea\xd5\xab\x57\xa6\xef\xd7\x78\x6b\x33\x4f\x86\x6b\x79\x12\
-\x77\x99\x4b\xd7\x6e\x72\xee\x42\x14\x51\x2f\x84\x51\xed\xd6\x11\
-\xee\x25\x75\xe6\x58\x4c\x30\x03\xeb\x81\x03\xde\x34\x6c\xe8\x5d\
-\x6a\x7b\x5e\x5e\x5e\x24\x24\x24\x20\x08\x02\x7a\xbd\x9e\xf4\xf4\
-\xf4\x22\xfb\xa6\xad\xc8\xce\xce\xb6\xae\x03\x83\xc1\x40\x68\x68\
-\x28\x8d\x1a\x35\x92\x9c\x09\x09\x12\x24\x12\x28\x41\xc2\x3f\x07\
-\x59\x59\x59\x4c\x9c\x38\x91\x5d\xbb\x76\xd1\xad\x5b\x37\xbe\xff\
-\xfe\x7b\x96\x2c\x59\x42\x6c\x6c\x2c\x3f\xfd\xf4\x13\x32\x99\x8c\
-\xb7\xdf\x7e\x9b\x21\x43\x86\x70\xfb\xf6\x6d\x06\x0e\x1c\x88\xb3\
-\xb3\x33\x33\x67\xce\x64\xd0\xa0\x41\xff\x18\x3b\x2d\x51\x16\xa5\
-\x52\xc9\x83\x07\x0f\xca\x45\x08\xd9\xd5\xd5\xd5\xea\xb4\x1b\x8d\
-\xc6\x32\x47\x72\x34\x6a\x05\xa8\xfd\x68\xd4\xee\x15\x1a\xb5\xab\
-\xc5\xc9\xd8\x33\x0c\xed\xd2\x9c\xfd\x37\x7e\xa4\xf7\x6b\x1f\x33\
-\xfa\xc3\xcf\xa8\x56\xc5\xa9\xcc\x76\x59\x1c\x50\x95\x4a\x45\x56\
-\x56\x96\xb8\xbb\x60\xcf\x39\xb4\xb2\x94\xc0\xb7\x25\x22\xa0\x72\
-\x76\x47\x05\xb8\xb7\xec\x4b\x68\x83\x04\xaa\xfb\xb9\xe3\xda\x65\
-\x2c\x57\x17\x8d\xa1\xf7\x2b\x17\xe8\x3e\x65\x23\xee\x65\x7c\x03\
-\xe8\xf5\x7a\xab\x6d\x72\xb9\x9c\x53\xa7\x4e\xd9\x9d\x7e\x2c\x08\
-\x02\x95\x2a\x55\xb2\x9e\xd8\x97\xd9\x79\x17\x64\x68\x9c\xdd\xd1\
-\x38\xbb\xd3\xbc\x43\x25\x9a\xb7\x73\xe6\x6c\x5a\x36\x8d\x7a\x75\
-\xe5\xcd\x5f\x9b\xd1\xfd\xbd\x00\x3e\x9e\x33\x1f\x4f\x05\x36\xcf\
-\x9b\xab\xab\x2b\x4b\x96\x2c\x29\x92\x72\x2a\x16\xc3\x86\x0d\x2b\
-\x32\x7e\x65\x72\xd8\x15\x2a\xdc\x3c\x9e\x46\x2b\x5e\x1e\x38\x8a\
-\x0e\x39\x77\x71\xd5\x1f\xa1\xfb\x9b\x0d\x99\x37\xe4\x6d\xd6\xe4\
-\xd7\x63\xff\x9b\x65\x17\x1d\xb7\xac\x17\x8b\x7d\x33\x67\xce\xb4\
-\xa6\x8f\xdb\x03\x0b\x31\xb2\x45\x50\x1d\x99\x0a\x27\x77\x4f\x9c\
-\xdc\x3d\x09\xa8\x5a\x8b\x8e\x2d\x7d\xf0\xbe\x10\xc0\xa0\x39\x35\
-\x68\xdb\xa4\x19\x93\x1a\x0f\xe2\xc7\xf5\x41\x65\xee\x83\x65\x4c\
-\x15\x0a\x05\x5a\xad\x96\x5e\xbd\x7a\xd9\xef\x10\x29\x14\x45\xc4\
-\xe2\xf5\x7a\x7d\x99\x48\xa0\x42\xe5\x80\x8b\xca\x01\x97\x7a\xcd\
-\xa9\x5a\x2f\x8c\xec\x33\x19\xbc\x58\xa7\x06\xb9\x99\xcd\x19\xfb\
-\xfa\x18\x02\x27\x7d\xcb\xca\x37\xaa\xd9\x3c\x6f\x82\x20\x20\x93\
-\xc9\xec\x4e\x2b\x2f\x4c\x08\x6d\x8d\xbe\xc9\x1d\x5c\xf0\x76\x70\
-\xc1\xdb\xab\x03\xb5\x9b\x74\xa0\x76\x8d\x63\xc8\xaa\x84\xf3\xba\
-\xd3\x7b\x74\x6e\xd1\x86\x86\x93\xb7\xd2\xc1\xc6\xfd\xdf\x72\x10\
-\x14\x13\x13\x43\xfd\xfa\xf5\xed\xb6\xcb\xd7\xd7\x17\x85\x42\x61\
-\x3d\x58\x94\xc4\xe2\x25\x48\x90\x48\xa0\x04\x09\xff\x28\x2c\x5b\
-\xb6\x8c\x8d\x1b\x37\xf2\xca\x2b\xaf\xb0\x72\xe5\x4a\xdc\xdd\xdd\
-\x39\x78\xf0\x20\xe7\xce\x9d\x23\x38\x38\x98\x4e\x9d\x3a\xe1\xe9\
-\xe9\x49\x44\x44\x04\x93\x26\x4d\xc2\xcd\xcd\x8d\x85\x0b\x17\x14\
-\xd1\x91\x60\x00\x00\x20\x00\x49\x44\x41\x54\x32\x76\xec\xd8\x7f\
-\xd4\x4b\xcf\xd2\xcf\xf0\xf0\x70\xe6\xcd\x9b\x57\x2e\x72\x23\x2a\
-\x95\x8a\xb0\xb0\x30\x0e\x1d\x3a\x24\x9e\x9c\x12\xcc\x8a\xc5\xc1\
-\x60\x86\x2e\xef\x7d\x45\x97\xf7\xc4\xb5\xa3\xd3\xe9\xe8\xd7\xaf\
-\x1f\x0d\x1b\x36\x2c\x97\x74\x73\xb5\x5a\x8d\x97\x97\x97\x7d\xe9\
-\x6e\x8e\xfe\x74\x7c\xfd\x2d\x00\x9a\x7c\xf6\x3d\xc3\xe6\x83\x5c\
-\x66\xfb\xbc\x69\xb5\x5a\x86\x0f\x1f\x4e\x93\x26\x4d\xec\xd6\x1d\
-\x13\x04\x01\x17\x17\x17\xdc\xdd\xdd\xed\x48\x77\x33\x63\x92\xb5\
-\xe1\xcb\x79\x80\x19\xc6\xfc\x78\x96\x31\x66\x13\x08\xb6\x19\x67\
-\x32\x99\x70\x76\x76\x66\xe4\xc8\x91\xb4\x69\xd3\xc6\xee\x35\x69\
-\x32\x99\x68\xdc\xb8\x31\x17\x2f\x5e\xb4\x8f\x6c\x39\x07\x33\x62\
-\xda\x18\x00\xbe\xdc\x15\x21\xba\x9d\x9c\x9c\x1c\x66\xcd\x9a\x65\
-\x5f\xf5\xdc\x42\xb6\xd5\xaf\x5f\x9f\x8c\x8c\x0c\x3b\x5a\x31\x23\
-\xf3\x7f\x89\x41\xdd\x00\x5e\xe0\xf8\xad\x3b\xa2\x5a\x31\x1a\x8d\
-\x54\xac\x58\x91\x29\x53\xa6\x14\x29\xa4\x62\x0f\x49\x6a\xdd\xba\
-\xb5\x5d\x9a\xab\x66\xb3\x0b\xe3\x56\xcf\x07\xb3\x19\x5a\x0c\xe6\
-\x48\xfc\x60\x51\xed\x18\x0c\x06\x2a\x57\xae\xcc\xec\xd9\xb3\xad\
-\x05\xa7\xec\x79\xd6\xb2\xb2\xb2\xa8\x50\xa1\x82\xdd\xf3\x1f\xde\
-\xfc\xdf\x87\x76\x63\xd6\x71\x63\x8c\xc5\xe6\xa7\xa9\xf3\x65\x1f\
-\x23\x33\x35\x6b\xd6\x64\xee\xdc\xb9\xe5\xa2\x5f\xa8\xd1\x68\xa8\
-\x5e\xbd\x7a\x91\xfb\xaf\x12\x24\x48\x90\x48\xa0\x04\x09\xff\x08\
-\xe8\x74\x3a\x56\xac\x58\x81\xb7\xb7\x37\xeb\xd6\xad\xb3\x46\x90\
-\xbe\xf9\xe6\x1b\x5a\xb7\x6e\xcd\x82\x05\x0b\xf8\xfe\xfb\xef\xd1\
-\x68\x34\xdc\xbb\x77\x0f\xb5\x5a\xcd\xda\xb5\x6b\xe9\xdd\xbb\x77\
-\x11\x62\xf5\x4f\x42\x40\x40\x00\x33\x67\xce\x2c\xb7\xf6\xd2\xd2\
-\xd2\x44\x57\x3d\x04\xfe\xa3\xbf\x66\xc7\x50\x9a\xcd\x66\x74\x3a\
-\x1d\xaf\xbd\xf6\x5a\xb9\x8e\x55\x7c\x7c\x7c\xb9\xb6\x27\x17\xe9\
-\x2b\x6b\xb5\xda\x72\x4f\xa5\xbf\x71\xe3\x06\x46\xa3\x51\xe4\x1a\
-\x16\xfe\x3c\x6f\x82\xed\xc6\x19\x8d\x46\x9c\x9c\x9c\xac\xcf\x53\
-\x79\xda\xf6\xbf\x2d\x62\x2d\x08\x02\x39\x39\x39\xe5\xa2\x11\x57\
-\x18\x1b\x36\x6c\xb0\xc3\xb6\xf2\xd9\xaf\x8c\x46\x23\x95\x2a\x55\
-\x62\xfc\xf8\xf1\xe5\x6a\x9b\x58\x59\x97\xa7\xe3\xfd\xec\x1f\xc4\
-\xc1\x42\x02\x3f\xfa\xe8\xa3\xbf\xfd\x5e\x2e\xc6\x54\x0f\x0f\x0f\
-\x66\xcd\x9a\x55\x6e\x7d\xc8\xcb\xcb\x2b\xb6\x60\x96\x04\x09\x12\
-\x24\x12\x28\x41\xc2\xdf\x16\xf9\xf9\xf9\x24\x27\x27\x13\x18\x18\
-\x58\x24\x85\xb0\x7e\xfd\xfa\x44\x46\x46\x32\x7d\xfa\x74\x22\x23\
-\x23\xd1\xe9\x74\x74\xef\xde\x9d\x29\x53\xa6\xd0\xb2\x65\xcb\x7f\
-\xb4\xcd\x29\x29\x29\x6c\xda\xb4\x09\xa0\x48\x21\x0d\x5b\x49\x97\
-\x5c\x2e\x47\xa9\x54\x52\xbd\x7a\x75\x91\x62\xf1\x62\xe5\x9c\x9f\
-\xef\x70\x2b\x95\x4a\xf6\xee\xdd\xcb\xbd\x7b\xf7\xd0\xeb\xf5\x76\
-\x39\x25\x82\x20\xa0\xd1\x68\xca\x74\x8f\xe8\xbf\x01\xb5\x5a\xcd\
-\x81\x03\x07\xb8\x79\xf3\xa6\xb5\x9a\xa6\xd8\x79\x53\x28\x14\x38\
-\x3b\x3b\x53\xa3\x46\x8d\x72\x89\x06\xd8\x45\x8a\xe5\x72\xf2\xf2\
-\xf2\xd8\xb9\x73\x27\xf7\xee\xdd\x2b\x97\x36\x1b\x36\x6c\x58\x62\
-\x71\x93\xff\x16\x2c\x55\x18\x17\x2f\x5e\x2c\x5a\x66\xa0\x70\x5b\
-\x82\x20\x10\x16\x16\x56\x2e\x62\xf1\xe5\x31\x6f\x09\x09\x09\x1c\
-\x3e\x7c\x98\x8c\x8c\x0c\xbb\xfb\xa3\x50\x28\xe8\xdc\xb9\xb3\xe8\
-\xaa\xe1\xe5\xb7\x93\x3c\xed\x4b\x42\x42\x02\xdb\xb7\x6f\xb7\x5b\
-\x97\xd7\x72\xd7\x75\xc2\x84\x09\x7f\xcd\x1a\xb3\xd1\x6e\x4b\x7f\
-\xd6\xac\x59\x53\x2e\x6b\xc8\xd1\xd1\xd1\x7a\x7f\xf3\x7f\xfb\xd0\
-\x45\x82\x04\x89\x04\x4a\x90\x20\xc1\xe6\x17\xbe\x85\x0c\x3d\xeb\
-\x74\xd5\xaa\x55\x8b\xb7\xde\x7a\x8b\x6f\xbf\xfd\x96\xb4\xb4\x34\
-\x42\x42\x42\x50\xab\xd5\xff\x78\x9b\x23\x22\x22\x78\xe7\x9d\x77\
-\x70\x75\x75\x15\x2d\x3a\x2e\x08\x02\x49\x49\x49\xb8\xb9\xb9\x31\
-\x69\xd2\x24\x91\x65\xd4\x05\x8c\x71\x87\x78\x7f\xc1\xf7\xc4\x25\
-\x98\x18\xf9\xf5\x16\xea\x44\x2f\xe7\xbd\x6f\xcf\xf3\xfa\xbb\xd3\
-\xe9\xd7\xb6\x36\xb6\xc4\x96\x2c\x82\xea\x7b\xf6\xec\xc1\xdb\xdb\
-\x5b\x34\x51\x82\xa7\xe5\xf5\x75\x3a\x1d\xdb\xb7\x6f\x17\x9d\xea\
-\x96\x97\xf6\x80\x85\x53\xde\xe0\x52\x7e\x55\xde\x99\x3e\x19\xf9\
-\xc5\xcd\x7c\xb9\xe3\x3c\xaf\x4d\x5f\xc5\xa0\xa6\x65\xbf\xd7\x67\
-\x91\xf8\x58\xbe\x7c\x39\xfb\xf7\xef\xc7\xc9\xc9\x09\x57\x57\x57\
-\x9b\xe7\xcd\x42\xdc\x93\x92\x92\xf0\xf5\xf5\x65\xcd\x9a\x35\xa2\
-\x0b\xcc\xc4\x9d\xd9\xce\xd2\x7f\xfd\x44\x92\xae\x22\x73\xbe\x5f\
-\x46\xe6\xaa\x37\xf9\x24\x4a\xc3\xfb\xd3\x3e\xa4\x7d\x9d\xb2\x4b\
-\x21\x58\xb4\xd4\x36\x6c\xd8\xc0\x91\x23\x47\xf0\xf1\xf1\x11\x3d\
-\x67\x06\x83\x81\x94\x94\x14\x86\x0e\x1d\x4a\x95\x2a\x55\x44\xb7\
-\x73\x79\xcf\x0a\xe6\x7f\x77\x1c\x75\x68\x6b\x86\x0e\xee\x4a\xcc\
-\x86\x4f\x38\xa9\xab\xcb\x37\x9f\x4e\xc0\xd3\xc9\x36\x92\xe2\xec\
-\xec\xcc\x94\x29\x53\x50\x2a\x95\x78\x7a\x7a\xda\x75\xe0\x92\x94\
-\x94\xc4\xe0\xc1\x83\xe9\xdc\xb9\xb3\xd8\x23\x2f\x22\x76\xaf\x67\
-\xc5\xf7\x7b\x50\xd7\xed\xc7\x9a\x69\x4d\xf8\x60\xf0\x04\x52\xea\
-\x0c\x64\xd9\xc7\x23\x70\xb1\x91\x04\xde\xbb\x77\x8f\xd9\xb3\x67\
-\x93\x96\x96\x66\xbd\x3f\x2b\x06\x26\x93\x89\x94\x94\x14\x96\x2d\
-\x5b\x26\x9a\x74\x09\xfa\xfb\x4c\x7e\x77\x0e\x09\x05\x4e\xbc\x3b\
-\x77\x05\x35\x72\x7f\xe7\xc3\xe9\x0b\x09\x19\x36\x8f\x61\x3d\x1b\
-\x60\xcb\x0d\x61\x85\x42\xc1\x9d\x3b\x77\xf8\xe0\x83\x0f\x70\x73\
-\x73\xb3\xeb\xa0\xa4\xa0\xa0\x80\x8c\x8c\x0c\x7a\xf6\xec\x29\x7a\
-\x1f\xc9\x4c\xba\xc6\xb7\xb3\xe7\x73\xe6\x61\x06\x55\x07\x7d\xce\
-\xc4\x4a\x87\x79\xeb\xe3\xa3\xb4\x9c\xfd\x2f\xa6\xb6\xf5\xb7\x7d\
-\x7d\x5f\xbe\xcc\xc4\x89\x13\x71\x77\x77\x17\x79\x78\xf7\x14\x3a\
-\x9d\x0e\x95\x4a\xc5\xa2\x45\x8b\xfe\x4f\xbc\x17\x25\x48\x90\x48\
-\xa0\x04\x09\xff\xcf\xe0\xe0\xe0\x40\x8b\x16\x2d\x88\x8a\x8a\x62\
-\xf3\xe6\xcd\x0c\x18\x30\xc0\x7a\xea\xfe\xc3\x0f\x3f\x30\x7c\xf8\
-\x70\x2a\x56\xac\x68\x15\x8e\xff\x27\xe0\x79\x4e\xbd\xa5\xaa\xa0\
-\xe5\x02\x7f\x60\x60\x20\x3b\x77\xee\xa4\x6e\xdd\xba\xa2\xee\x73\
-\x28\x14\x0a\xa2\xa2\xa2\x68\xdb\xb6\xed\x9f\x7e\x6e\x69\xa4\xa2\
-\xb0\xb3\x78\xf7\xec\x09\xaa\xf7\xfc\x90\x59\xcd\x83\x50\x99\x1e\
-\xf2\xe9\xbe\xdb\x4c\x99\xdc\x97\xc8\xdf\xb7\x73\xab\x66\x28\x35\
-\x2b\x94\x7c\xc2\x6c\xb1\xcb\x02\xa3\xd1\x88\xb7\xb7\x37\x8f\x1f\
-\x3f\xa6\xa0\xa0\x40\x94\x63\xaa\x56\xab\x59\xb3\x66\x0d\x6f\xbf\
-\xfd\xf6\x9f\xec\xb1\xc5\xb6\xdc\x8c\xdb\x38\x87\x0f\x62\xe3\xf8\
-\xc1\x18\x2f\x6e\x63\x64\x4c\x45\x96\x2f\x9a\xc0\xb4\xb9\x0b\xe9\
-\xde\x74\x09\xce\xa5\xb4\xf7\xbc\xbe\xb7\x6a\xd5\x8a\x7d\xfb\xf6\
-\x89\x12\x8b\xb7\x48\x3d\xcc\x98\x31\x83\xaf\xbe\xfa\xaa\x4c\xeb\
-\xe6\xf9\xfd\xd1\x71\xf3\x71\x01\x7d\xdf\x98\x45\x78\x9d\x5a\xb8\
-\xdf\xdb\xc4\x0b\x7b\x2a\xf0\xfd\xd2\x76\x9c\x3c\xbc\x83\xa6\xb5\
-\xc7\xe2\x24\xb3\x4d\x16\x21\x23\x23\x83\x69\xd3\xa6\x31\x6b\xd6\
-\x2c\xd1\xce\xb2\xd9\x6c\x66\xce\x9c\x39\xdc\xb8\x71\xe3\x4f\x45\
-\x6f\x4a\xee\x8b\x50\x28\xad\x4e\xcb\xef\x57\xd2\xf8\x78\xc5\x1a\
-\xaa\x07\x28\x38\xb8\x7c\x19\xc9\xa1\xbd\x69\x7f\xf7\x28\x6b\x6f\
-\x3c\xe6\xfd\x86\x81\x65\x1a\xa7\xc2\x55\x4f\x01\x3e\xf9\xe4\x13\
-\xa6\x4e\x9d\x2a\x2a\x42\x69\x99\xb7\x9a\x35\x6b\x16\x99\xf3\xb2\
-\xd8\x56\x64\x0d\x65\xdc\x23\x36\x15\x86\xce\x5a\xc3\xcb\xf5\xfd\
-\xf8\x7d\x5c\x28\x97\x3b\x1d\x66\x8a\x6e\x19\x8b\xf7\xa7\xf0\x71\
-\x17\x6f\x9b\xd6\xb7\xc9\x64\xc2\xc1\xc1\x81\xcd\x9b\x37\x5b\x35\
-\x3a\xc5\x12\xa5\xde\xbd\x7b\x93\x9b\x9b\x5b\xc4\x36\x5b\xfa\x92\
-\x1e\x79\x8c\x49\x53\x27\xe3\xea\x15\x88\x8b\xf2\x21\x3f\xae\xdf\
-\x4a\x68\xbb\xee\x5c\x38\x72\x84\x33\x39\x81\x6c\x1b\xec\x65\xf3\
-\xb3\xa6\xd3\xe9\xb8\x7e\xfd\x3a\x6e\x6e\x6e\xa2\xa2\xb8\x72\xb9\
-\x9c\xb4\xb4\x34\xea\xd4\xa9\xf3\xdc\xb9\x2a\x5b\x7f\x8c\xa4\xa7\
-\xde\xe6\x10\xaf\x31\x69\xc9\xab\x74\xa9\x19\xc3\xc0\x9a\x87\x99\
-\x71\xfa\x53\x3e\x6b\x31\x81\xcb\x37\x7e\xa1\x9e\x8d\xfb\x48\x41\
-\x41\x01\xb5\x6b\xd7\x66\xd7\xae\x5d\x04\x06\x06\x8a\xbe\x17\x7c\
-\xff\xfe\x7d\x5a\xb6\x6c\x59\xaa\x4d\x52\x9a\xa8\x04\x09\x12\x09\
-\x94\x20\xe1\x6f\x09\x99\x4c\xc6\xac\x59\xb3\xe8\xd5\xab\x17\x23\
-\x46\x8c\x20\x26\x26\x86\x66\xcd\x9a\xb1\x7b\xf7\x6e\x56\xaf\x5e\
-\x4d\x40\x40\x00\x6b\xd7\xae\x25\x3c\x3c\xfc\x1f\x43\x00\x63\x62\
-\x62\xc8\xcd\xcd\x2d\xe2\x4c\xbb\xbb\xbb\xa3\xd5\x6a\xad\x32\x11\
-\x32\x99\xcc\x9a\x56\x26\x96\xdc\x6a\x34\x1a\xeb\x0b\x5e\x2e\x97\
-\xf3\xf0\xe1\xc3\x52\x0b\x72\x18\x8d\xc6\xa7\xe9\x7a\x3a\x3d\x06\
-\xb9\x8a\xc4\x64\x3d\xb1\x37\xb7\xf1\x53\x6a\x33\x3a\xb4\xa8\x88\
-\xd1\xb9\x02\xcd\x9a\x86\x73\xfd\xe2\x2d\x72\x33\xd2\x48\x92\x09\
-\xdc\x2b\x24\x7c\xff\x3c\x07\x23\x2b\x2b\xcb\x5a\x3e\xbf\xb0\xd3\
-\x61\xcf\x29\xf7\xb3\x7a\x73\x8f\x1e\x3d\x22\x36\x36\xb6\x44\x9d\
-\x40\x27\x67\x67\xaa\x55\x0d\xc1\x9c\x9f\x4d\x46\xbe\x89\xf4\x8c\
-\x9b\xc4\x46\xde\xe4\xe7\x9d\xde\xb8\x3f\x49\xa4\x61\xab\x30\xfc\
-\x83\x1b\xe0\xa3\xde\x40\x6e\x36\x68\xb5\xc9\xc4\xde\x8e\x2b\x55\
-\x27\xb0\xb0\x84\x87\x42\xa1\x40\xa3\xd1\xd8\x95\xa6\x66\xf9\xae\
-\x85\xac\x24\x25\x25\x11\x13\x13\x53\xac\x7c\x81\xc9\x64\x42\xa3\
-\xd1\x10\x16\x16\x46\x6e\xfa\x13\x0a\x0c\x26\xf2\xb2\x92\x39\xbb\
-\x67\x0b\x77\x53\xfb\xd0\x20\xe5\x3c\x41\x7d\xc7\x53\xc7\x35\x83\
-\x13\x0a\x03\x09\x05\x66\x64\x8f\xe3\x48\x2b\x25\x4d\x30\x27\x27\
-\xc7\xba\x46\xcd\x66\x33\x4a\xa5\x12\x95\x4a\x65\x97\x44\x44\xe1\
-\xb5\x6c\x36\x9b\xb9\x76\xed\x1a\x05\x05\x05\xc5\x3a\xba\x16\x91\
-\xfa\x90\xa0\xca\xa4\xa5\x65\xa0\x71\xd4\x60\xcc\x49\x64\xef\xe6\
-\x8d\xdc\xaa\x1d\x42\x44\xa6\x23\xe1\x2f\xd4\xe5\xa5\x8a\x57\x19\
-\x72\x2a\x9d\xf7\x1b\x56\xe1\xd6\xad\x5b\x64\x65\x65\x15\x4b\x56\
-\x1d\x1d\x1d\xb9\x7f\xff\x7e\x11\xe2\x60\x99\x63\x7b\x0e\x92\x0a\
-\x93\xcb\x82\x82\x02\x62\x62\x62\x30\x18\x0c\x25\xeb\x04\x06\x04\
-\x10\xe0\xef\x43\x56\x6a\x3a\x39\x29\x4f\x28\x48\xbb\xce\xf1\xfd\
-\x5a\x9c\x9d\x1b\xf2\xc3\xf6\x0a\x8c\x5f\x1d\x44\xe5\x7d\xc1\xdc\
-\x3a\x77\x11\xba\xb4\xe3\xda\xb5\x1b\x25\x12\x55\x99\x4c\x46\x6c\
-\x6c\xac\x75\x8e\x2c\xfb\x87\x3d\x76\x69\xb5\x5a\x54\x2a\x95\xb5\
-\xb2\x70\x66\x66\x26\x97\x2e\x5d\x2a\xf1\xf9\x35\x9b\xcd\xf8\xfa\
-\xfa\x52\xa9\x82\x2f\xe9\x39\x05\x24\x67\x98\x89\x38\xb9\x05\x7d\
-\x70\x6b\x7a\x36\xf1\x25\x29\x29\x8b\x1a\xe3\xde\x40\xf1\xf6\x5b\
-\x7c\xb6\xfd\x30\xa6\x81\x7d\x88\xba\x78\xb9\xc4\xf5\x28\x93\xc9\
-\x48\x4c\x4c\x2c\xf2\x73\x35\x1a\x8d\xe8\x14\xd5\x67\xf7\x48\xb3\
-\xd9\x4c\x46\x46\x06\x97\x2e\x5d\x2a\x52\x19\xf7\x79\xb6\x55\xaf\
-\x51\x13\x47\x41\x47\x72\x76\x01\x39\x09\x4f\x30\x99\x93\x39\x75\
-\xdc\x4c\xd0\xad\x63\x9c\xad\xde\x97\xa6\x5e\xf5\xe9\x1d\x76\x91\
-\x5d\xd7\xa0\x7a\x40\x0a\xd7\xe3\xee\x95\xfa\x9e\xb3\xa4\xed\x5a\
-\x52\xc2\x95\x4a\x25\x0a\x85\x42\xf4\x5e\xa2\x56\xab\x8b\xec\xff\
-\x77\xef\xde\x25\x2a\x2a\xea\xb9\x3a\x81\x95\x2b\x57\xfe\x5f\x4f\
-\x3d\x97\x20\x41\x22\x81\x12\x24\x48\xf8\x13\x3a\x77\xee\xcc\xae\
-\x5d\xbb\x98\x3d\x7b\x36\x8b\x16\x2d\x22\x3f\x3f\x1f\xb5\x5a\x4d\
-\xdb\xb6\x6d\x99\x3b\x77\x2e\xad\x5a\xb5\xfa\xc7\x54\x01\x35\x9b\
-\xcd\x5c\xbf\x7e\x9d\xe4\xe4\xe4\x22\x0e\xb6\x8b\x8b\x0b\x05\x05\
-\x05\x56\x12\x58\x98\x2c\x95\x17\x99\x7e\xf0\xe0\x01\xe7\xcf\x9f\
-\x2f\xf1\xff\xe9\xf5\x7a\xc2\xc3\xeb\x71\xf6\xdc\x15\x22\xe2\x12\
-\xe9\xd5\xac\x03\x9d\x0b\x1c\x78\xb2\x7e\x12\x63\x62\x3f\xa2\xbb\
-\x8b\x12\x84\xa7\x29\x8a\x72\x41\xe0\x49\x52\x12\xe7\xce\x9d\x2b\
-\xd1\x51\xc9\xcd\xcd\x2d\x42\x28\xca\x03\x85\xc7\xc6\x42\x70\x23\
-\x22\x22\xc8\xcb\xcb\x7b\xee\xb8\x19\x8d\x46\xfc\xfc\x2a\x10\x58\
-\xd9\x9f\x9b\xbf\x7c\xc9\xbf\x8e\xdf\xa3\xda\x6b\x23\xe9\xd3\x37\
-\x80\xc7\xb7\x8f\xb3\x7e\xc7\x15\xea\x7c\xd8\x18\x99\x60\x46\x30\
-\x83\xd9\x64\xe2\xc9\x93\x27\x44\x44\x44\x14\x9b\x4a\xab\x50\x28\
-\x48\x4d\x4d\xfd\x93\x93\x6f\xef\xbc\x3d\xfb\xfd\xdb\xb7\x6f\xf3\
-\xc7\x1f\x7f\x14\x1b\x11\x36\x1a\x8d\xb8\xbb\x7b\x10\x56\xbb\x2a\
-\xa7\xbf\xfb\x98\x9d\x69\x41\xb4\x6e\xd9\x9c\x57\xea\x18\x38\xb5\
-\xea\x7d\xbe\x53\x56\xc1\xb5\xb5\xe2\xe9\xdd\x24\xb3\x19\x33\x10\
-\x1b\x1b\xcb\xdd\x7b\xf7\xca\x4c\x02\xcb\xc3\xb6\xe7\x45\xff\xae\
-\x5e\xbd\x5a\xa2\x86\x9d\xd1\x68\xa4\x6a\xb5\x6a\xf8\xaa\x32\x58\
-\xb1\x70\x05\xce\x2f\xcd\xa4\x5d\x9b\xf6\xa4\xaa\xbd\x38\xbf\x6d\
-\x09\x9f\xff\x16\xcc\xc6\xb6\x2a\x14\x06\xd0\xea\x4d\x80\x91\x1b\
-\x37\x6e\xf2\xf0\xe1\x83\x62\xd7\xa4\x5a\xad\x26\x2e\x2e\xae\xc8\
-\xcf\x2c\xef\xbd\xa3\xa0\xa0\x80\xab\x57\xaf\x16\xd1\xec\x7b\x1e\
-\xb9\x6a\xda\xac\x39\x01\xae\x59\x6c\x5f\xb8\x98\x8b\xea\xca\xb4\
-\x6e\xde\x85\x50\x95\x91\x1d\x1b\xd6\x10\xf7\xc4\x84\x06\x30\xcb\
-\xe5\x60\x30\xa2\xcd\xcb\x23\x3a\x3a\xba\xd8\x83\x0e\x8b\x1d\x96\
-\x7b\xa9\x7f\xc5\xb3\x26\x08\x02\x99\x99\x99\x5c\xb8\x70\xa1\x54\
-\x62\x19\x56\x2f\x0c\x45\xea\x6d\xbe\xf8\x76\x0b\x35\x5b\x76\xa5\
-\x46\xbb\x9a\xdc\x3d\xb4\x98\x55\x89\x43\x70\x53\xc8\x50\x2a\x40\
-\x85\x11\x74\x3a\x0a\xf2\x73\x38\x7f\xe1\x02\x94\xb0\x8f\x0b\x82\
-\x40\x42\x42\x02\xc1\xc1\xc1\x7f\xd9\xb3\x96\x96\x96\xc6\xb9\x73\
-\xe7\x8a\x8d\x2c\x5a\x22\xa0\x95\x82\x43\xc9\xfa\xe3\x3b\xa6\xfd\
-\xfa\x80\x9e\x3d\xbb\x31\xac\x73\x15\xbc\x0b\xee\xf1\xf9\xb6\x08\
-\x72\x78\x7a\x4f\x59\xa5\x7a\x2a\x16\x9f\x92\x92\xcc\xf9\xf3\xe7\
-\x4b\x7c\x47\x09\x82\x40\x7a\x7a\x3a\xce\xce\xce\x7f\x89\x6d\x16\
-\x12\x78\xfe\xfc\xf9\x22\x9f\xeb\x74\x3a\xea\xd4\xa9\x43\x40\x40\
-\x80\x44\x02\x25\x48\x90\x48\xa0\x04\x09\x7f\x4f\x74\xec\xd8\x91\
-\x66\xcd\x9a\x71\xf4\xe8\x51\x12\x13\x13\xf1\xf4\xf4\xa4\x7b\xf7\
-\xee\xa8\x54\xaa\xbf\xc4\x89\xfb\xab\x20\x93\xc9\xe8\xdb\xb7\xef\
-\x73\xff\xed\x93\x4f\x3e\xb1\xda\x62\x36\x9b\xd1\x6a\xb5\x18\x0c\
-\x06\x51\x15\xf9\xe4\x72\x79\x11\x61\x6e\xbd\x5e\x4f\x9b\x36\x6d\
-\x78\xe3\x8d\x37\xca\xf4\xfd\x17\x6a\x85\x52\xa9\xaa\x3b\x0f\x23\
-\xae\x12\xd0\xba\x15\xd5\xc3\xdc\xf9\xf2\x81\x0a\x39\x29\x44\x47\
-\x5f\x27\x27\x47\x87\x5c\xe3\x48\x58\x8d\x30\xc2\xc2\xc2\x4a\x6c\
-\x2b\x2d\x2d\x8d\x2d\x5b\xb6\x58\x2b\x5d\x5a\xf4\xb8\xc4\x16\x07\
-\x71\x70\x70\x28\xe2\x58\xeb\xf5\x7a\x9a\x37\x6f\xce\xd0\xa1\x43\
-\xcb\xf4\xfd\xe0\xf6\x03\x18\x53\xb7\x00\x43\xfa\x75\x72\xfc\x3a\
-\x52\x57\x96\xc8\x75\xbf\xab\x5c\xbd\xf2\x98\xc7\xb5\xcc\xa4\x6a\
-\x35\x68\x1c\x65\xd4\xaa\xfd\x02\xb5\x6a\xbf\x50\x62\x5b\x29\x29\
-\x29\x45\xe6\xcd\x60\x30\x90\x97\x97\x67\x8d\x9c\x88\xb1\xcd\x52\
-\x34\xc7\xe2\x34\xb6\x6d\xdb\x96\xe1\xc3\x87\x97\x7e\xc0\x60\xd4\
-\x51\xaf\xfb\x18\x7c\xf2\xb4\xa4\xa4\x15\x10\x10\xda\x88\xf0\x60\
-\x47\xf2\xe5\x81\x9c\xff\xed\x10\x37\xc3\x42\x30\x18\x04\x3c\x54\
-\x02\x9d\xbb\x74\x29\xb5\xbd\xe4\xe4\x64\x6b\x05\x46\x8b\x80\x75\
-\x7e\x7e\xbe\x68\x82\x61\x32\x99\x8a\x54\x29\x94\xc9\x64\x0c\x1e\
-\x3c\x98\xaa\x55\xab\x96\xfa\x5d\x5d\x6e\x1a\xfd\x46\x4f\x40\xe5\
-\xe5\xc2\xb5\xb3\x72\x5a\xbf\xd8\x80\x94\x2b\x55\xf0\xd8\x96\xc2\
-\xfd\xf8\x18\x8e\x3c\x48\x21\xbc\xa1\x0b\xa0\xa0\x47\x8f\xee\xa5\
-\xb6\xa7\xd1\x68\x8a\xc8\xa6\x58\x08\xb6\xd8\x2a\xba\x0e\x0e\x0e\
-\xd6\xe8\xb4\xd9\x6c\xc6\xc3\xc3\x83\xd7\x5f\x7f\x9d\xd0\xd0\xd0\
-\xd2\xbf\xac\xcf\xa4\xed\xd0\x71\x84\x26\xa7\x92\x99\x6b\xe2\x85\
-\x46\x8d\x88\xbc\x74\x89\xf6\x0d\x8e\xf2\xf3\xe1\x87\x0c\x8c\xbf\
-\x87\x6f\xf5\x97\x50\x3b\xba\x32\x70\xe0\xc0\x52\x9b\x3b\x76\xec\
-\x18\xbb\x76\xed\x2a\x42\x48\xed\xa9\x0e\xac\xd5\x6a\x31\x1a\x8d\
-\xc8\x64\x32\x8c\x46\x23\x41\x41\x41\x8c\x1b\x37\xae\x4c\x11\xb8\
-\xdc\xb4\x04\x86\x8f\x7b\x9b\xc4\xbb\x71\xd4\x0c\xae\x89\x4b\x9d\
-\x4a\xdc\x8d\x07\x4f\x4f\x07\x6e\xed\xdf\xcf\x35\xb5\x0f\xc1\x61\
-\x0d\x71\x74\xf6\xe0\xcd\x32\xec\x4d\x57\xae\x5c\x21\x2d\x2d\xcd\
-\xfa\xf7\xbc\xbc\x3c\x14\x0a\x85\xe8\x74\xd0\xbc\xbc\xbc\x22\xa9\
-\xc1\xd5\xaa\x55\x63\xcc\x98\x31\x65\xfa\x7e\x7e\x83\xee\xbc\xe3\
-\x93\x03\x39\x89\xdc\x76\x6b\x4a\x23\x67\x35\xbb\xef\xb4\x20\xe4\
-\xec\x11\x6e\x24\x35\xe7\xe8\x8d\xca\xf4\x7c\x01\x2a\x2b\x6b\xf1\
-\x46\xb5\x5a\xa5\xb6\xb7\x7f\xff\x7e\xab\x58\xbc\xc9\x64\xa2\xa0\
-\xa0\x00\x9d\x4e\x27\x2a\x1d\x54\x10\x84\x22\xb6\x69\xb5\x5a\xba\
-\x77\xef\x5e\x44\xa3\x53\x82\x04\x09\x12\x09\x94\x20\xe1\x1f\x03\
-\x67\x67\x67\xba\x77\xef\xfe\x7f\xd6\xbe\xc2\xa9\x64\xf1\xf1\xf1\
-\x56\xd1\x7b\x31\x0e\x8e\xa5\xfc\x7d\x6e\x6e\xae\x35\xf5\xd4\x16\
-\xb1\x78\x5f\x1f\x0f\x7c\xf1\x40\xab\x39\xc9\xf6\x7f\x2d\x46\x9f\
-\xd7\x89\x6f\xa7\xb6\x26\xe7\xf0\x45\xbe\x5f\x77\x88\xc6\x1d\x5e\
-\x25\xa4\x92\x73\x99\x9d\x48\x0b\xa1\x49\x4f\x4f\x27\x21\x21\x81\
-\xa6\x4d\x9b\x8a\x2e\x37\x2f\x97\xcb\x79\xf4\xe8\x91\x95\x24\x03\
-\x36\x39\x4a\x1e\xc1\x75\xf0\x08\x86\x8c\xeb\x0f\x58\xf8\xdd\x97\
-\xb8\x07\x85\xd2\x77\xce\x62\x6e\x9e\xd8\xcf\xca\xd5\xc7\x69\xd2\
-\x6b\x18\xee\x65\xcc\x30\xb3\x88\xc5\xcb\x64\x32\x52\x52\x52\x88\
-\x8c\x8c\xa4\x65\xcb\x96\x56\xf1\x69\x5b\xa1\x54\x2a\xb9\x7d\xfb\
-\x76\x91\x08\x52\x59\xc7\x49\x90\xab\xf0\xab\x1e\x8e\x1f\x3a\x4e\
-\xef\xfa\x89\x0d\xab\x7f\xc7\xa8\xe9\xc9\xd8\x37\x7a\xe2\xb7\x78\
-\x2e\x6b\x7f\x7d\x42\xc7\xce\xdd\xf1\x2e\xe3\xdb\x4d\xab\xd5\x22\
-\x08\x02\x46\xa3\x11\x83\xc1\xc0\xca\x95\x2b\xd9\xb7\x6f\x9f\x5d\
-\x6b\x3c\x36\x36\x96\x36\x6d\xda\x58\x6d\x2b\x2e\x55\xf2\x59\xa8\
-\x9c\x3c\x79\x21\xdc\x13\xd0\x11\xbd\xf3\x0a\xcb\x56\xc6\xe3\x1b\
-\xd0\x8e\xed\xbf\xf8\x73\xfe\xc0\x6e\x0e\x64\xfa\x30\xb1\x49\xd9\
-\xc5\xe2\x2d\x63\x6a\x79\x16\x16\x2e\x5c\x68\x3d\xa8\x10\x03\xb5\
-\x5a\xcd\xad\x5b\xb7\xa8\x51\xa3\x86\x95\x08\x96\x79\x7d\x2b\xdd\
-\x08\x0c\x6b\x44\x60\xf6\x43\x76\x6f\x5e\xcf\xca\x15\xe7\xf1\xad\
-\xd9\x81\x31\x3f\x54\x65\xc6\xd2\x25\x1c\x0e\x0e\xe6\x8d\x01\xa1\
-\x65\xee\x8b\x65\x4c\x0d\x06\x03\x8f\x1e\x3d\x62\xdc\xb8\x71\x78\
-\x79\x79\x89\x9e\x33\x93\xc9\x44\x74\x74\x34\xad\x5b\xb7\xb6\xfe\
-\xbd\xac\x62\xf1\x4e\x9e\xfe\xd4\xf1\xf4\xa7\x8a\x3a\x8d\xef\x7e\
-\x5c\x8b\x40\x08\x03\x46\xbe\x82\xe2\x9a\x8e\xd5\x6b\x36\xe3\xdb\
-\x66\x18\x0b\x5f\xa9\x65\x53\x5f\x2c\xba\x9c\x00\xed\xdb\xb7\x47\
-\xa1\x50\x88\x2e\x9e\x65\x30\x18\x48\x4e\x4e\xb6\x8e\x99\x2d\xed\
-\x38\xf8\xd7\xa0\xa9\x3f\x3c\xba\x72\x80\x6d\x1b\x96\x72\x4d\xe3\
-\x40\xdb\x57\xdf\x64\xa0\xf7\x46\x56\x2f\x58\x89\xf7\xa8\x79\x74\
-\x51\xda\x36\xce\x96\xbd\xec\xea\xd5\xab\xf4\xe8\xd1\x03\xb5\x5a\
-\x2d\xba\xaa\x67\x41\x41\x01\xe9\xe9\xe9\x68\xb5\x5a\xeb\xfe\xff\
-\xbf\x99\x31\x23\x55\x27\x95\x20\x91\x40\x09\x12\xfe\xe2\x4d\x56\
-\xba\xe4\xfd\xcf\x86\x4c\x26\xa3\x57\xaf\x5e\xfc\xfc\xf3\xcf\xa2\
-\x89\x44\x61\x27\x47\xa5\x52\xe1\xe3\xe3\xc3\x99\x33\x67\x44\xb5\
-\x51\xe7\x95\xc1\x54\x6c\x9a\x09\x6a\x57\x3c\x5d\x35\xe8\xfb\xbc\
-\x45\xcd\x4e\x05\xff\xc3\xde\x7d\x47\x47\x55\xbc\x0d\x1c\xff\xde\
-\xdd\xcd\x6e\x92\x4d\x25\x85\x00\x21\x94\x24\x10\x42\xaf\x02\xa2\
-\x34\x51\xba\x52\x14\x10\x10\x15\x50\x11\x15\x10\x45\xb1\x82\x4a\
-\x53\xf4\x27\x52\x14\x0b\x08\x82\xa2\x34\x11\x05\x15\x04\x44\x50\
-\x3a\xd2\xa5\xf7\x10\x02\x09\xe9\xd9\x6c\xb9\xf7\xfd\x23\xec\x92\
-\x48\x4b\x36\x51\x36\xbe\xcf\xe7\x9c\x9c\x63\x82\xd9\xdc\x29\x77\
-\xee\x3c\x33\x73\x67\xf0\x0f\x2e\x83\x6f\x11\x57\x0f\x59\x2c\x16\
-\xc6\x8f\x1f\xcf\xc5\x8b\x17\x0b\xdd\xf9\xbf\x59\xda\x2a\x56\xac\
-\xe8\x76\x1e\x05\xd6\xe8\xca\x0b\x2f\xdd\x8e\xdd\x60\x26\x38\xd0\
-\x4c\xfd\xaa\xe5\xb8\x98\x6e\x21\x28\x24\xbc\xc8\xf7\x5c\x76\x76\
-\x36\xd3\xa6\x4d\xe3\xd4\xa9\x53\x25\x52\x07\x4c\x26\x13\x61\x61\
-\x61\x6e\x06\x25\x46\x9a\xb6\xef\x45\xf5\xe6\x99\x18\x7c\x02\x09\
-\x32\x1b\x79\x78\xf4\x58\x92\xb3\x1c\x04\x17\x31\x18\xb0\xdb\xed\
-\x04\x07\x07\x33\x6d\xda\x34\x12\x12\x12\x4a\xa4\x8d\xaa\x5d\xbb\
-\x36\xdf\x7f\xff\xbd\x9b\xe5\x66\xa4\xeb\xa0\xe7\x68\x91\x96\x83\
-\x6f\x40\x10\x7e\x3e\x7a\x1a\x54\x8b\xc3\x82\x37\xa1\xc1\xe6\x22\
-\x7f\x5a\x4a\x4a\x0a\x0b\x17\x2e\x44\xaf\xd7\x17\xeb\x88\x08\xa7\
-\x98\x98\x18\xf6\xec\xd9\xe3\xde\x2f\xfb\x57\xa0\x7d\xbf\xa7\xb9\
-\x2d\x23\x37\x2f\x6d\xde\x4d\x99\x34\xa1\x25\xb9\x5e\x01\x84\x05\
-\x52\xe4\x72\x8b\x8f\x8f\x67\xe1\xc2\x85\x64\x66\x66\x96\x48\x9d\
-\x6c\xd6\xac\x19\xc3\x87\x0f\x77\xeb\xf7\x03\xaa\xdf\x49\xff\x90\
-\x5a\x18\x4c\x66\x82\xfc\xbd\xd0\x6e\xeb\xca\xe8\x6a\x2d\x31\xfa\
-\x05\xe3\xe7\x53\xb4\x99\xe5\xdc\xdc\x5c\xea\xd7\xaf\xcf\xe2\xc5\
-\x8b\x8b\x1d\x5c\x28\x8a\x82\xd5\x6a\x25\x3e\x3e\xde\xed\xf2\x2f\
-\x5f\xeb\x2e\x5e\x1d\xdd\x80\x1c\xd5\x40\x40\x50\x30\xc6\xfa\xa3\
-\xa9\x76\x31\x03\xbf\xd0\xb2\x45\x3e\x16\x43\xd3\x34\x5a\xb6\x6c\
-\xc9\x37\xdf\x7c\x53\x22\x4b\x7a\x7d\x7c\x7c\x88\x8e\x8e\xe6\xeb\
-\xaf\xbf\xbe\xe5\xcf\x36\x45\x51\x5c\x5f\xa2\xf8\xf9\x28\x41\xb5\
-\x04\x81\x42\x14\xe0\xed\xed\x4d\x5a\x5a\x9a\x64\x44\x31\x39\x3b\
-\x03\x25\xf9\x5e\x4d\x51\x3a\x01\x26\x93\xe9\xba\x4b\x46\xdd\x91\
-\x90\x90\xe0\xd6\x0e\xa3\x79\x99\x60\xa2\x4c\xd8\x95\xa0\xc8\xcb\
-\xc7\x9f\xb2\x3e\xfe\x6e\xa5\xcb\x6e\xb7\xd3\xb8\x71\x63\xd7\x12\
-\xde\x92\x70\xf4\xe8\xd1\x62\x3c\x4c\xf5\x04\xe6\x0b\xf8\x74\xbe\
-\x81\x94\xf3\x0d\x74\xeb\xb3\x9c\x69\x6b\xdc\xb8\x71\x89\xa5\x6d\
-\xdf\xbe\x7d\x6e\x1f\x16\xaf\x37\xfa\x10\x1a\x7a\xe5\xfd\x52\x2f\
-\xbf\x60\x22\xfc\xdc\xaf\x8f\xcd\x9a\x35\x2b\xd1\x7a\xbe\x72\xe5\
-\x4a\xf7\x1f\xce\xde\x7e\x84\x7b\x5f\x49\x8c\x7f\x99\x30\xfc\xdd\
-\x2a\xff\xbc\x19\xa5\x92\xbc\xd7\x20\x6f\xc9\xa2\x7b\x1d\x34\x05\
-\x2f\x1f\x7f\xc2\xf3\xdd\x5f\x01\x61\xe5\xdc\x6e\xc3\x82\x82\x82\
-\x8a\x71\x5c\xc5\xb5\xb9\x3b\x53\x0a\x3a\x42\x43\x43\xaf\xa4\xd4\
-\x60\x22\x24\x2c\xdc\xed\xb4\xf9\xf9\xf9\xd1\xbd\x7b\x77\xcf\xe8\
-\x94\xeb\x0c\xf8\x95\x09\xe7\x4a\x8d\x34\x13\x51\xce\xec\xf6\xe7\
-\x19\x8d\x46\xee\xbf\xff\xfe\x12\xbb\xbe\x1b\xbd\x97\xfa\x6f\x32\
-\x1a\x8d\xd8\x6c\x36\x8f\xb8\x96\xd2\xcc\x6e\xb7\x63\xb1\x58\x8a\
-\xb5\xb1\x9a\x90\x20\x50\xfc\x07\x75\xef\xde\x9d\x29\x53\xa6\x30\
-\x7c\xf8\x70\x79\xc9\xbb\x18\x01\xe0\x99\x33\x67\x30\x99\x4c\xb7\
-\x24\x08\x74\x76\xf8\xd7\xaf\x5f\x5f\x22\x23\xa6\x7a\xbd\x1e\xb3\
-\xd9\x5c\xbc\x43\x95\x35\x15\x4d\xd1\xb9\x46\xb5\x0b\xbb\xa4\xf4\
-\xaa\x6e\xa0\x4e\xc7\xc1\x83\x07\x49\x4f\x4f\x2f\x91\x59\x17\xa3\
-\xd1\x88\xd9\x6c\x2e\xe6\xa7\x68\xa8\x2a\xe8\x74\x0a\xa0\xe1\x70\
-\x68\xe8\xf5\x3a\xb7\xf2\xf9\xf0\xe1\xc3\x24\x24\x24\x14\xbb\xde\
-\x38\x67\x39\xf5\x7a\x7d\xb1\x66\x83\x55\x55\x45\xd1\xe5\x2b\x37\
-\x87\x8a\xae\x88\x69\x73\xbe\x0b\xb8\x7f\xff\x7e\x2e\x5e\xbc\x58\
-\xec\x3a\xa9\x69\x1a\xb1\xb1\xb1\xc5\x1f\xc5\x56\x1d\xa8\x3a\x7d\
-\xde\x39\x95\x7f\xab\x9f\x45\xad\x43\x6b\xd7\xae\x2d\xf6\xa1\xe3\
-\xce\xfc\x76\x9e\x7f\x58\x9c\x7c\x2a\x78\x7f\xa9\xa8\x9a\x0e\x9d\
-\x52\xf4\x7b\x2d\x33\x33\x93\x23\x47\x8e\x90\x93\x93\x53\x22\x6d\
-\x49\xdd\xba\x75\x8b\x57\xb7\xf3\x97\x19\xee\xaf\x5c\x51\x14\x05\
-\x8b\xc5\xc2\xf6\xed\xdb\x4b\xe4\x39\x97\x9b\x9b\x5b\xac\x23\x34\
-\xb8\x46\x7a\xdc\x6d\x23\x9d\x7e\xfd\xf5\xd7\x12\x79\xfe\x78\x79\
-\x79\x11\x11\x11\x71\x4b\x9e\x65\x7f\xe7\x3c\x36\x27\x21\x21\x81\
-\xf0\xf0\x70\x84\x7b\x12\x12\x12\x38\x7a\xf4\x28\x23\x46\x8c\x90\
-\xcc\x90\x20\x50\x88\x2b\x1e\x7a\xe8\x21\x26\x4d\x9a\xc4\x9c\x39\
-\x73\x78\xf4\xd1\x47\x25\x43\xdc\xb0\x6d\xdb\x36\xbe\xfc\xf2\x4b\
-\xc6\x8d\x1b\x77\x4b\xfe\xbe\xa6\x69\x2c\x5b\xb6\x8c\xfb\xee\xbb\
-\x0f\xa3\xd1\x88\xd1\x68\x74\xfb\x7d\x17\x8b\xc5\x82\xaa\xaa\x8c\
-\x19\x33\x06\x7f\x7f\x7f\xf7\x2e\xc8\x96\xca\xef\xab\x56\x71\x52\
-\x8b\xa4\x6d\xbb\x66\x38\x8e\x6c\x66\xcd\xf6\x13\xd4\xbc\xe3\x2e\
-\xea\x54\x0e\x29\xf4\x61\xf1\x8a\xa2\xe0\xe3\xe3\xc3\xcb\x2f\xbf\
-\xcc\xf2\xe5\xcb\xf1\xf7\xf7\x77\x3b\x10\x54\x14\x85\x9c\x9c\x1c\
-\x54\x55\xe5\x87\x1f\x7e\x70\xff\x10\x6c\x7b\x0e\x7f\x6e\xf8\x99\
-\x43\xc9\x7e\xb4\x6d\xd7\x94\x9c\x53\x5b\x59\xb3\x2d\x91\x46\x6d\
-\xee\xa1\x56\x54\x70\x91\xca\xcc\xc7\xc7\x87\xa1\x43\x87\xb2\x6a\
-\xd5\x2a\x7c\x7c\x7c\xdc\x3e\xe4\xdd\x79\x38\x7b\x48\x48\x08\x73\
-\xe7\xce\x75\x3b\x38\xb1\xa4\x26\xb0\xee\x97\x75\x58\xca\x54\xa3\
-\x5d\xab\x06\x24\x6c\x5a\xc5\x96\x13\xd9\x34\xbb\xab\x1d\x55\xc3\
-\x0a\x3f\x25\xa8\xd7\xeb\x49\x4d\x4d\x65\xe0\xc0\x81\x6c\xda\xb4\
-\xa9\x58\x41\xb7\xa6\x69\x64\x67\x67\xd3\xab\x57\x2f\x62\x63\x63\
-\xdd\x2e\xb7\xac\xf3\x47\x58\xf3\xcb\xef\xa8\x95\x9b\xd2\x2c\x3e\
-\x9c\xe3\x7f\xfc\xc4\x49\xad\x22\x1d\xee\xba\x0d\x7f\xa3\xbe\x48\
-\xd7\x13\x1c\x1c\x4c\x9b\x36\x6d\xd0\xe9\x74\x05\x76\xe6\x75\x67\
-\x10\x20\x3d\x3d\x9d\x7e\xfd\xfa\xd1\xa1\x10\x9b\xee\x5c\x6f\x40\
-\x22\xed\xfc\x21\xd6\xae\xdd\x86\x7f\xb5\xa6\xb4\x8e\xf3\x61\xfd\
-\x8f\xbf\x90\x1c\x58\x93\x8e\x6d\x1a\xe0\x53\x84\xec\x32\x18\x0c\
-\xfc\xf5\xd7\x5f\x74\xe9\xd2\x85\xe4\xe4\xe4\x12\x29\xb7\x29\x53\
-\xa6\x14\x63\x16\xdf\xce\xda\xef\x16\x93\xe4\x5d\x95\x7b\xda\x36\
-\xc6\x94\x71\x94\xd5\xab\xb6\x50\xa6\x66\x0b\x6a\xd6\xa8\x48\x50\
-\x11\x62\x39\x93\xc9\xc4\xae\x5d\xbb\x68\xd7\xae\x1d\xbe\xbe\xbe\
-\x6e\xd7\x23\xe7\xfb\xae\x39\x39\x39\xec\xdb\xb7\xcf\xed\xcf\xb1\
-\x5b\xb3\x38\xb3\x6b\x23\xbb\x4e\xa6\x53\xbe\x61\x2b\x62\x39\xc1\
-\xf7\xbf\xee\xa7\xda\x9d\x5d\x69\x52\x35\xa8\xc8\xd7\xb4\x71\xe3\
-\x46\x5a\xb5\x6a\x55\xac\xf6\x1f\xf2\x66\x8c\x14\x45\xe1\x93\x4f\
-\x3e\x29\x56\xdd\x2e\x49\xfd\xfb\xf7\x67\xe4\xc8\x91\xcc\x9f\x3f\
-\x9f\x88\x88\x08\xe9\x70\x14\xb5\xed\xcb\xca\x62\xf6\xec\xd9\xd4\
-\xad\x5b\x97\x06\x0d\x1a\x48\x86\x48\x10\x28\x44\x41\x0b\x16\x2c\
-\x60\xe8\xd0\xa1\x9c\x3b\x77\x8e\x46\x8d\x1a\x51\xbe\x7c\x79\xc9\
-\x94\x42\x36\xae\x3b\x77\xee\x64\xf1\xe2\xc5\xdc\x7b\xef\xbd\x34\
-\x6d\xda\xf4\x5f\xbf\x86\xfc\x9d\x90\xc0\xc0\x40\x5e\x7c\xf1\x45\
-\xe2\xe2\xe2\xdc\x7a\x7f\x4e\xa7\xd3\x71\xe0\xc0\x01\xde\x7a\xeb\
-\x2d\xd7\xfb\x03\xee\xcc\x6e\x1e\x5a\xfe\x21\x73\xd7\x25\xe2\x95\
-\x98\x48\x46\x78\x65\xd2\x67\x8f\x67\xb7\xd5\x9f\x1d\x87\x13\x78\
-\xe6\xd9\xe1\x54\x0a\xba\x79\xc7\xc9\x64\x32\x15\x38\xb7\x2c\x28\
-\x28\x88\xd9\xb3\x67\xbb\x76\xc1\x2c\x2a\x2f\x2f\x2f\x56\xac\x58\
-\xc1\xe7\x9f\x7f\xee\xea\xa4\xba\xd3\x39\x4d\x3e\xb6\x9a\xa9\x53\
-\xe7\x13\x5a\x23\x1e\x25\xf3\x04\xdf\xfd\xba\x9b\x72\x21\x99\x2c\
-\xf9\xe3\x34\x8b\x66\x3e\x4f\x61\x3e\x31\x7f\x27\x54\xaf\xd7\x13\
-\x1d\x1d\xcd\xeb\xaf\xbf\x8e\xaf\xaf\x6f\x91\x3b\x6f\x9a\xa6\x61\
-\x36\x9b\x99\x3e\x7d\x3a\x9b\x37\x6f\x2e\x90\xde\xa2\x77\xb8\xbf\
-\x66\xfd\xfe\x33\xa4\x9f\xff\x83\xf2\x21\xe9\xbc\x3a\xf4\x6d\xc2\
-\xef\x68\xc0\x91\x0b\x16\x46\x3d\xd3\x87\xc2\x74\x09\x9d\x47\x00\
-\x38\x67\x38\xba\x75\xeb\x46\xef\xde\xbd\xdd\x9e\x55\xb0\xd9\x6c\
-\x7c\xfa\xe9\xa7\xae\xfa\xac\x28\xca\x75\x8f\xdf\xb8\xc1\xa7\xb0\
-\x78\xc6\x24\x7e\xb7\x56\x20\xec\xf0\x09\x7e\x5f\x61\xe2\xf4\xb1\
-\x3d\xa4\x24\xa6\x91\x1e\x31\x93\x41\x0d\x0a\xd7\xde\xfd\xbd\xbe\
-\xf4\xea\xd5\x8b\xde\xbd\x7b\xbb\xb5\x6c\x5a\xd3\x34\x02\x03\x03\
-\xe9\xd7\xaf\x5f\x81\x9d\x4f\x8b\xbc\x5c\x2b\xe3\x38\x4b\xbe\x98\
-\xc9\xe6\x93\x1a\x7e\x89\x7a\x8c\x2b\xe7\xf1\xd8\x6f\x15\x69\x1b\
-\xfe\x13\x17\xfc\xa7\xf1\x44\x93\xc2\x05\x14\x3e\x3e\x3e\xae\xa3\
-\x0c\x7c\x7d\x7d\x79\xfc\xf1\xc7\xa9\x5f\xbf\xbe\xdb\xed\x52\x76\
-\x76\x36\x63\xc7\x8e\x75\x95\x9b\xc1\x60\x28\x74\x50\xe1\xac\x3b\
-\x99\xfb\x7f\x64\xcd\x5f\x87\xd1\x27\xad\xa3\x4c\x64\x14\xb9\x6b\
-\xdf\x65\xda\xd2\x43\x58\xa2\x4e\xd1\xa8\xcf\xa3\xbc\x7b\x4f\x98\
-\x5b\xe5\xf6\xe9\xa7\x9f\xba\x1d\x28\xe9\x74\x3a\xd2\xd3\xd3\x79\
-\xf2\xc9\x27\x5d\xe5\x56\xf4\x41\x17\x95\xc4\xbd\xab\x78\xfa\xe5\
-\xaf\x09\xa9\x10\x42\xac\xea\x60\xfe\xf4\xc9\xe4\xc4\x37\x62\xda\
-\x9c\x1d\x2c\x5e\xfb\x3e\x15\x8a\x10\xb8\x3b\x97\xcd\x07\x05\x05\
-\xf1\xfa\xeb\xaf\x13\x15\x15\xe5\xf6\x60\x59\x72\x72\x32\x2f\xbd\
-\xf4\x92\xab\x1c\xf2\x9f\x89\x78\xab\x0c\x18\x30\x80\xad\x5b\xb7\
-\xf2\xd8\x63\x8f\xd1\xab\x57\x2f\xe2\xe2\xe2\x4a\xf4\xf5\x80\xff\
-\x2a\x55\x55\x39\x72\xe4\x08\x9b\x37\x6f\xe6\xc4\x89\x13\x4c\x9f\
-\x3e\x5d\x32\x45\x82\x40\x21\xae\x56\xbb\x76\x6d\x66\xce\x9c\xc9\
-\x4f\x3f\xfd\xc4\x92\x25\x4b\xc8\xc8\xc8\x90\x4c\x29\xe4\x03\x38\
-\x36\x36\x96\x17\x5e\x78\x81\x76\xed\xda\xfd\x63\x7f\x47\xd3\x34\
-\x7e\xfc\xf1\x47\x52\x52\x52\x0a\x3c\x90\xcd\x66\x33\x69\x69\x69\
-\x04\x06\x06\xa2\xaa\x2a\xa1\xa1\xa1\xf4\xe8\xd1\xa3\x70\x5b\xcc\
-\x5f\xc7\xb1\x63\xc7\x98\x30\x61\x82\x2b\x90\xd8\xb2\x65\x0b\x5f\
-\x7d\xf5\x95\xeb\x3a\xae\x15\x84\xda\xed\x76\xfa\xf4\xe9\xe3\xea\
-\x0c\xfd\xb2\xf2\x4f\x52\x55\x5f\x7c\x7c\x2b\x11\x65\xce\x62\x7d\
-\x60\x23\xe6\x4c\x78\x84\x99\xef\xcf\xe3\xd2\x85\x14\x2c\xe7\xf3\
-\x76\xc4\xbc\xde\x0e\x7d\xce\xc3\xe2\x93\x92\x92\x5c\x81\xa0\x9f\
-\x9f\x1f\xf7\xdd\x77\x5f\xb1\xf2\x31\x25\x25\x85\x39\x73\xe6\xb8\
-\xd2\xb6\x6d\xdb\x36\x96\x2c\x59\x52\xe0\x58\x8c\xbf\x3f\x44\x43\
-\x43\x43\xb9\xfd\xf6\x16\xf8\xfb\xe7\xcd\x84\xe5\xee\xf8\x82\x3d\
-\x17\x8d\xb4\x37\x99\x48\x3c\x75\x81\xe8\x7b\x7b\xf3\xc6\xbd\x0d\
-\x78\xea\x91\x27\xb8\x94\x09\x99\x89\x87\xf9\x75\xfd\x6f\xae\x4e\
-\xf5\xdf\x39\x67\xc9\x9c\x7f\x53\x51\x14\xaa\x56\xad\x4a\xff\xfe\
-\xfd\x8b\x95\xb6\x5d\xbb\x76\xb1\x71\xe3\x46\x57\xf0\xfe\xc7\x1f\
-\x7f\xe0\xe7\xe7\x77\xdd\x00\x45\x55\x55\x02\x02\x02\xf2\xed\x9c\
-\x9b\xcd\xf1\x23\x07\x48\x4a\xb2\x60\x0a\x6d\x44\xee\xae\x5f\x70\
-\x3c\x38\x8d\xcf\xfb\x2a\xbc\xff\xcd\x2a\xce\x5b\x34\x4e\x6f\xfe\
-\x95\x33\x09\xe7\x6e\xd8\x79\x4e\x4b\x4b\xc3\x60\x30\xb8\xea\x45\
-\xa3\x46\x8d\x78\xe0\x81\x07\x8a\x95\xb6\x13\x27\x4e\xb0\x69\xd3\
-\x26\xd7\x36\xf8\x4b\x96\x2c\xa1\x6c\xd9\xb2\xd7\xed\xe8\xaa\xaa\
-\x4a\x64\x64\x24\xad\x5a\xb5\xba\xfc\x93\x4c\x36\x6c\xfa\x13\x7d\
-\xdd\x08\x8c\x06\x3d\x87\x2f\xe9\xe8\x32\x78\x3c\x77\x67\x7c\xc1\
-\xe0\x2d\x17\x18\xd4\xa0\x2c\xab\x57\xaf\x25\x31\x31\xf1\xba\xc1\
-\xaa\xc9\x64\x62\xfd\xfa\xf5\x05\xde\x4d\x6a\xd1\xa2\x45\xb1\x77\
-\x1e\x0e\x0b\x0b\x73\x05\x3d\x69\x69\x69\x2c\x5d\xba\x94\xc8\xc8\
-\xc8\x6b\xbe\x03\xe5\xdc\x90\xa4\x6e\xdd\x3a\xd4\xab\x77\x39\x40\
-\x4b\x4b\xe6\xc8\xb6\xad\x64\x07\xd7\xa5\x46\x45\x3b\x73\x9e\x4e\
-\x60\x6c\xc2\xf7\xdc\xfe\xe3\xff\x18\xbd\x7a\x37\x83\xea\x34\x60\
-\xe5\xaa\xb5\x37\x6c\xd3\x75\x3a\x1d\xfb\xf6\xed\xc3\xcb\xcb\xcb\
-\xf5\xee\x5c\xa7\x4e\x9d\x68\xde\xbc\xb9\xdb\xe9\xca\xcd\xcd\x65\
-\xd1\xa2\x45\xe4\xe6\xe6\xba\xce\xe4\xfc\xe2\x8b\x2f\x6e\x18\x30\
-\x39\x8f\x5b\x70\xbe\x23\x7b\x62\xc7\x2e\x2c\x89\x89\x68\xfa\x10\
-\x42\xbd\xd2\x58\x7f\x34\x93\x67\x16\xfe\xc4\x5f\xcf\x8e\x60\xca\
-\xdc\xdf\x79\xeb\xf6\x56\x7c\xbb\x7c\xc5\x75\xeb\xa3\xa2\x28\xe8\
-\xf5\x7a\x76\xef\xde\x4d\x44\x44\x84\xab\xed\xec\xdd\xbb\x77\xb1\
-\x02\x1b\xbb\xdd\xce\xe8\xd1\xa3\x0b\xd4\xcf\xc5\x8b\x17\x63\xb5\
-\x5a\x6f\x78\x6f\xb4\x6e\xd5\x8a\x72\xe5\xcb\x03\x3a\x52\xf6\x6f\
-\xe6\xb0\xe2\x4d\x80\x7f\x10\xd1\x29\x3f\xf0\x99\xa1\x1f\xc7\x3e\
-\x1c\xc6\x47\x1d\x63\xf9\xea\xf8\xfb\xf4\xd5\x1d\x65\xed\xc6\xcd\
-\x37\x0d\x6e\x4f\x9c\x38\x81\xc9\x64\xc2\x6e\xb7\x53\xb5\x6a\x55\
-\x1e\x7c\xf0\xc1\x62\x2d\x9b\x4c\x4e\x4e\x66\xcc\x98\x31\xa8\xaa\
-\x8a\xd1\x68\x64\xfd\xfa\xf5\xd7\x4c\x7f\xb5\x6a\xd5\x68\xd8\xb0\
-\xa1\x1b\x83\x4d\xee\x0d\x74\x4e\x9f\x3e\x9d\x05\x0b\x16\xb0\x6b\
-\xd7\x2e\x56\xae\x5c\x59\x22\xaf\x06\xfc\xd7\x69\x9a\x46\x78\x78\
-\x38\xb5\x6b\xd7\x66\xc4\x88\x11\x94\x2d\x5b\x56\x32\x45\x82\x40\
-\x21\xae\xad\x46\x8d\x1a\xd4\xa8\x51\x83\xc4\xc4\x44\xd2\xd3\xd3\
-\x25\x43\x0a\xc1\xcb\xcb\x8b\xc8\xc8\xc8\x7f\xe5\x41\x98\x91\x91\
-\xc1\xa5\x4b\x97\x0a\x1c\x16\xff\xf7\x17\xe6\x9d\xcb\x94\x8a\xfb\
-\x77\xf2\x3f\x7c\x33\x33\x33\xb9\x74\xe9\xd2\x4d\x3b\x45\xaa\xc3\
-\xc1\x92\xef\xd6\xb1\xfe\xe0\x7a\x4c\x97\xb2\xa8\xd5\xe3\x41\x5a\
-\x1e\x9e\xca\xf0\x0f\xb7\xd3\xbb\x82\x0f\xb9\x56\x05\x4d\x6f\x00\
-\xcd\x8e\x25\x37\x6f\x1b\xf2\x1b\x75\x08\x73\x72\x72\x0a\x6c\x97\
-\x5f\x12\x0f\xfd\xbf\x6f\xbf\x9f\x95\x95\x45\x7a\x7a\x3a\x59\x59\
-\x59\xd7\x3d\x2c\xde\xe4\xed\x8d\x4e\xb1\xb2\xfa\x95\xee\xbc\xb6\
-\xec\x28\x61\x0d\xca\x53\xbb\xd5\xc3\x34\x2b\x7f\x96\xb9\xb3\x57\
-\x10\xdb\xb0\x0d\x0e\x47\x6e\x5e\x40\xeb\x70\x90\x9b\x9b\x4b\x4a\
-\x4a\xca\x0d\x0f\x8b\x4f\x49\x49\x29\x90\x1e\x9b\xcd\x86\xd5\x6a\
-\x2d\xd6\xe8\xf6\xdf\xdf\xe1\xb2\x5a\xad\xa4\xa5\xa5\x5d\xf7\x5c\
-\x45\xd7\xe6\x31\xb6\x54\xe6\x3d\xdd\x95\x0f\x4f\xfa\x11\x14\x56\
-\x83\x01\xf7\x75\x47\xdd\x32\x9d\x2f\x56\xf8\x11\xd1\x39\x00\x4b\
-\x4e\x22\x9a\xa2\xc3\xa6\x52\xa8\xba\x90\x3f\xb8\x75\x2e\xc1\xb5\
-\xdb\xed\x6e\x2f\x51\x75\x9e\xa1\x98\xff\xd0\xf8\xe4\xe4\x64\xd7\
-\xbb\x42\xd7\x4b\x5b\x68\x78\x18\xc9\x07\x7e\x66\xc8\x13\xcf\x13\
-\xd8\xfd\x1d\xd2\x1c\x3e\x0c\xee\x7d\x2f\xc7\xbf\x7b\x8f\xd7\x7e\
-\x30\xd3\xad\x9b\x01\x6f\x93\x42\x46\x9a\xc3\x55\xef\x53\x52\x52\
-\xae\x7b\x9d\xde\xde\xde\x64\x65\x65\x15\xe8\xe4\x5f\x6f\xf0\xa0\
-\x28\xf2\xa7\xc1\x6e\xb7\x93\x96\x96\x86\x9f\x9f\xdf\x0d\x0f\x8b\
-\xcf\xc9\xb5\x43\xf2\x26\xde\xea\xff\x24\x4b\x13\x6c\x94\xab\xd2\
-\x88\x3e\xf7\x3f\xc4\xb1\xad\xb3\xf8\xeb\x9c\x1f\x0f\x02\x19\x8a\
-\x09\x2d\x27\x13\x87\xaa\x92\x9e\x9e\x4e\x6a\x6a\xea\x75\x03\x1f\
-\x9d\x4e\xe7\x6a\x5b\x9c\x83\x08\xc5\xdd\x1d\xd4\x79\x5e\x9d\xf3\
-\x6f\x3a\xef\x8b\x1b\xd5\x71\x45\x51\xb0\xda\x2d\x1c\x5e\xf3\x25\
-\xcf\x8e\x9d\x46\xa6\xcd\xc4\xf3\x63\xde\xc0\xeb\xd4\x57\x2c\xfa\
-\x76\x0b\xc1\x7a\x1d\x06\xa3\x9e\x00\xab\x05\x7b\xfa\x25\x0c\x7a\
-\xb8\x74\x29\x15\x4d\x53\x6f\x78\xa0\x7a\x76\x76\xf6\x55\x6d\x5c\
-\x40\x40\x80\xdb\x69\xcb\xcc\xcc\x2c\x50\x6e\x16\x8b\x85\x0b\x17\
-\x2e\xdc\xf4\xb0\x78\x9d\x39\x88\x23\xb3\x06\xd3\xe9\xfd\xfd\x34\
-\x8f\x8b\xc0\xbb\x7a\x0f\xee\x6d\xef\xcd\x2f\x4b\x7f\x21\x33\x30\
-\x6f\x10\xb1\x4c\xa8\x83\x33\x29\x60\x0d\xc8\x25\x35\x35\xf5\xa6\
-\x87\xc5\x5b\xad\x56\xd7\xec\xb1\xf3\x4c\xce\xe2\xb6\xff\xce\xbf\
-\xe9\x1c\x98\xb8\x74\xe9\xd2\x55\x6d\x4b\x56\x56\xd6\xbf\xfe\xbc\
-\xed\xdd\xbb\x37\x5d\xba\x74\x21\x31\x31\xd1\xb5\x6c\x55\xdc\x58\
-\x68\x68\x28\x65\xca\x94\x91\x8c\x90\x20\x50\x88\xc2\x89\x88\x88\
-\x90\x75\xf7\x1e\xc6\xb9\xac\xee\xef\xa3\xcc\x46\xa3\xd1\x35\x6b\
-\xe7\xfc\xde\xed\xf7\xf8\x2e\xcb\x3f\x5a\x68\xb3\xd9\x68\xd1\xa2\
-\x05\x83\x06\x0d\x2a\x54\x40\x7c\xc7\x9d\x8d\x68\x72\x67\x1c\x2b\
-\x4f\x8c\x26\xa4\xc5\xed\xdc\x11\x38\x87\xb3\x9f\xd8\xd0\x97\xcb\
-\x45\xb5\x5f\x42\xcd\xc9\x01\xbd\x37\x75\x6a\xd7\xa6\x46\x5c\x8d\
-\x1b\xa6\xf7\xdc\xb9\x73\xae\x33\xd8\x34\x4d\x2b\x91\x4d\x38\x9c\
-\x4b\x15\x9d\x1d\xee\x66\xcd\x9a\xf1\xf0\xc3\x0f\xdf\x70\x39\x9f\
-\xa2\xd3\xe1\x65\xd0\xd1\x68\xe0\x9b\xcc\xe8\xa1\x70\xfe\xc0\x0c\
-\xb6\x3b\x1a\xd1\x38\xd6\x8f\x55\xa6\xf9\xec\x3e\xae\xa1\xd7\x6b\
-\x64\xe4\xa8\x78\xf9\xe8\x89\x8f\x8f\x27\x26\xb6\xda\xf5\x1f\x12\
-\x06\x03\xe7\xce\x9d\x63\xfc\xf8\xf1\x05\x02\x8c\xe2\x2e\x6f\x0a\
-\x08\x08\x70\x75\x42\x15\x45\xe1\xb6\xdb\x6e\x63\xe0\xc0\x81\x37\
-\x4e\x9b\xa2\x80\x5e\xe3\xee\x91\x53\xa9\x95\x99\xc5\xca\x5f\xb6\
-\x51\xbf\xe9\x9d\x78\x27\x7f\xc4\xe6\x94\x40\xfe\xfc\xe3\x00\x4a\
-\x9b\x4a\x28\x76\x07\x01\x06\x85\xbb\xdb\xb7\xc7\xe1\xb8\x71\x30\
-\x9e\x90\x90\xc0\xeb\xaf\xbf\x8e\xa6\x69\xa8\xaa\x4a\x60\x60\x60\
-\xb1\xca\xce\x60\x30\x10\x14\x14\x54\x60\xf7\xdd\xbe\x7d\xfb\x12\
-\x1d\x1d\x7d\xc3\x81\x01\xbd\x5e\x8f\x6a\x49\x67\xcc\x07\xb3\xf1\
-\x09\x0c\x66\xd2\xae\x5a\xdc\xd1\xa0\x11\x86\xfd\x65\xe1\xc8\x1e\
-\x2e\x59\x2e\x71\xe2\x4c\x0e\x71\x35\x7c\x01\x3d\x5d\xba\x74\xb9\
-\xe1\xe7\x39\x37\xdd\x59\xb5\x6a\x55\x81\x3c\x2f\xae\xfc\x33\x8f\
-\xc1\xc1\xc1\x3c\xf0\xc0\x03\xc4\xc7\xc7\xdf\x70\x39\xb7\x5e\x6f\
-\x00\x35\x93\x87\xde\xfe\x84\x56\x87\x36\xf3\xd3\xee\x73\x34\xb8\
-\xb3\x09\x19\xfb\x7f\xa6\x51\xe4\x37\xac\x39\x09\x4f\xe4\x5c\xc4\
-\xa7\x62\x4b\x4c\xbe\x01\x3c\xf0\xc0\x03\x37\x9c\xa1\xd2\xe9\x74\
-\xac\x5b\xb7\x8e\x1f\x7e\xf8\xc1\x15\x00\x84\x85\x85\x15\x2b\x5d\
-\xbe\xbe\xbe\xae\xd9\x70\x87\xc3\x41\xa5\x4a\x95\x18\x34\x68\xd0\
-\x4d\xeb\xb9\xde\xa0\x27\x37\xf5\x22\xef\x7c\x5c\x8f\xcd\xf3\x3e\
-\xa4\x65\x8b\xe6\xa8\x87\x37\xf0\xf3\x37\xd9\x04\x07\x9a\x49\x39\
-\x7e\x8c\xbf\xfc\xc3\x29\x53\xb9\x1e\x5e\x3e\x01\x0c\x1a\x34\xf0\
-\x86\xf5\xdb\x60\x30\xb0\x67\xcf\x1e\x52\x53\x53\x4b\xac\xdc\x82\
-\x82\x82\x0a\xd4\xe9\x98\x98\x18\x9e\x78\xe2\x09\xd7\xf9\x9f\xd7\
-\x6d\x23\x8d\x46\x02\x3a\x3e\xcf\xbc\xda\x19\x90\x52\x80\xaa\x00\
-\x00\x20\x00\x49\x44\x41\x54\x24\x6f\xff\x96\x83\x39\xcd\xb9\xfd\
-\x4e\x95\x35\x1b\x6b\x10\xb2\xe6\x0f\xa0\x3f\xdb\x76\x05\xd1\xb0\
-\x36\x54\x32\xc6\x31\xa8\x52\xcc\x0d\xaf\xc3\x68\x34\xb2\x72\xe5\
-\x4a\x92\x92\x92\x5c\x4b\x37\x8b\xdb\xfe\x3b\x67\x4c\x35\x4d\xc3\
-\x6a\xb5\xd2\xa9\x53\x27\xfa\xf5\xeb\x77\xcd\x3a\x53\x12\x6d\x72\
-\x51\x99\xcd\x66\xa2\xa3\xa3\xa5\x53\x20\x24\x08\x14\x42\xfc\xff\
-\x71\xb3\xd9\x46\x83\xc1\xc0\xa1\x43\x87\x68\xde\xbc\x39\xbe\xbe\
-\xbe\xae\x03\x92\x8b\x2a\x33\x33\xf3\xaa\xd1\x67\x83\xc1\x50\xa8\
-\x77\xba\xc2\x42\x83\x80\x20\xfa\x0c\xbd\x9b\xfb\x3a\xd7\xa6\xf7\
-\xb1\x38\x56\x27\xf6\x25\x61\x4c\x07\xfc\x43\xa7\x31\x74\xec\x14\
-\x06\x44\x07\xa2\xc0\x4d\x3b\x83\xf9\xd3\x6b\x30\x18\x48\x48\x48\
-\x20\x26\x26\xc6\xed\xe3\x0f\x00\xd7\x2c\xd6\xdf\x7f\xbf\x30\x01\
-\x58\x50\x95\x9a\xd4\x03\xb2\xca\x0d\x64\x46\x9b\xfa\x7c\x6c\x6a\
-\xce\xd4\xcf\xe6\x13\xf4\xce\x30\xca\xbe\xb1\x91\xbb\x47\x7e\x47\
-\x88\x11\x40\x77\xd3\xcf\xcb\xff\xf7\x15\x45\x61\xe5\xca\x95\x54\
-\xac\x58\xd1\xad\x19\x65\x67\x80\x7c\xee\xdc\x39\x02\x02\x02\x5c\
-\x9d\x50\xe7\x32\xda\xc2\xa4\x2d\x3c\xb6\x2e\xe1\x80\xf5\xe8\x16\
-\x1e\xeb\x5a\x95\x7d\x19\xed\xf9\xf3\xe0\x7b\xf8\x34\x88\xc0\xef\
-\xf6\x78\xde\x1e\xff\x1e\x65\x8d\x79\x8f\xb8\x9b\x6d\xac\x98\x7f\
-\x89\xaf\xbf\xbf\x3f\x63\xc6\x8c\x61\xfa\xf4\xe9\xee\x6f\xc4\xa3\
-\xaa\x9c\x3e\x7d\x9a\xde\xbd\x7b\x5f\xf5\x77\x6e\x46\x6f\x0e\x26\
-\xbe\x6e\xde\x66\x3d\x7d\xeb\x5a\xa9\x58\xb9\x1a\x71\x0d\x3b\xf3\
-\xfd\xef\x2f\xf2\xd1\x63\xed\x18\x92\x56\x93\xed\x9b\x46\x15\xfa\
-\xf3\xfe\x7e\x0f\x0c\x1f\x3e\xbc\x40\x30\xef\x4e\xb9\x1d\x39\x72\
-\xa4\xc0\x11\x21\x3a\x9d\x0e\x9d\xee\xe6\x75\x08\x7d\x00\x51\xb5\
-\x1a\x12\x55\xab\x1a\x17\x4f\xbe\x4a\x97\xa8\x32\x44\x76\x7f\x97\
-\x1f\x57\xbd\x49\x64\x65\x1d\x73\x9b\xf5\xe1\xbb\x9f\x6b\x16\xaa\
-\xed\x70\x5e\x8f\x33\x1f\xd2\xd3\xd3\x69\xd7\xae\x1d\xfe\xfe\xfe\
-\x6e\x97\x9b\xc3\xe1\x20\x21\x21\x81\xb6\x6d\xdb\x16\x48\x5b\x61\
-\xea\xa3\x6f\x99\xb2\xc4\x95\x29\x4b\xdc\x6b\x43\x68\xd6\xb1\x15\
-\x19\x67\x14\x66\x6d\x5f\x8f\xf7\x9a\x09\x74\xaa\x1b\x4d\xa5\x67\
-\xe7\x30\xe5\xf9\x3a\x80\xe2\xd6\xe0\x49\xe5\xca\x95\xdd\x7a\x47\
-\x55\xd3\x34\xd7\x26\x4c\x17\x2e\x5c\xb8\x6a\x47\xd7\xc2\xe4\xb3\
-\x4f\x44\x35\x1a\x47\x40\x72\xb8\x95\x1a\xf7\xd4\xa3\xe6\x68\x1f\
-\x1e\x9a\xf3\x1d\xef\xda\x9e\xc2\xa4\xf3\x22\x7e\xc4\x32\xde\x2e\
-\x64\x3b\x92\xbf\x2d\xf1\xf1\xf1\x61\xeb\xd6\xad\xd4\xaa\x55\xab\
-\x58\xc7\x00\x58\xad\x56\x6c\x36\x5b\x81\x1d\x54\xbd\xbc\xbc\x64\
-\xd6\x4d\x08\x09\x02\x85\x10\x9e\xc6\x6a\xb5\x62\x30\x18\xf0\xf2\
-\xf2\x22\x3e\x3e\xbe\xd8\x0f\x6b\xb3\xd9\x8c\xc9\x64\xba\xe6\xf2\
-\xb7\x42\x76\x95\xf0\xab\xd3\x9f\xd5\xbb\xf2\xbd\xe3\xf6\xce\x8f\
-\xf4\x1a\x9f\x8b\xe2\x65\x2a\x52\x87\xcb\xe1\x70\x90\x99\x99\x49\
-\x44\x44\x04\x35\x6b\xd6\x2c\xf6\x61\xf1\xce\xd9\x09\x8b\xc5\x82\
-\xc3\xe1\x70\xeb\xec\x29\x73\x44\x7d\x96\xed\x4f\xc7\x7e\xb9\xc1\
-\xef\xf2\xd5\x4f\x8c\xc8\xd0\x08\xf4\x2f\x5a\xbe\x6b\x9a\x46\x5a\
-\x5a\x1a\x15\x2a\x54\x20\x2e\x2e\xae\x58\xa3\xea\x9a\xa6\x51\xb5\
-\x6a\x55\x42\x43\x43\xb1\x58\x2c\x79\xcb\x73\xdd\x58\x3e\xdb\xa4\
-\xe7\x70\x7e\xea\x3c\x1c\xe3\xe5\x3e\xe4\xf8\x1d\xe9\xbc\x95\x95\
-\x85\xae\x88\xbb\x44\x5a\xad\x56\x72\x73\x73\x29\x5f\xbe\x3c\x51\
-\x51\x51\xc5\xde\x6a\xbe\x5a\xb5\x6a\x54\xa8\x50\x01\xab\xd5\x8a\
-\xdd\x6e\x77\x6b\x43\x8f\x3b\x86\x7d\xca\x85\x27\xb2\xc1\x94\xb7\
-\x4c\xb7\xd3\x9e\x63\x40\xd1\x3a\xcb\xaa\xaa\x62\xb7\xdb\x49\x4c\
-\x4c\xa4\x52\xa5\x4a\x04\x06\x06\x16\xeb\xfc\x32\x4d\xd3\x88\x8b\
-\x8b\xa3\x6c\xd9\xb2\xa4\xa7\xa7\xbb\x96\x0d\x16\x8d\x3f\xf7\x8d\
-\x78\x9f\xce\xcf\xbc\x8f\xe1\x72\xbf\xfd\xa2\xf6\x38\x0e\x0c\xe8\
-\x8b\x78\x2d\x56\xab\x15\xab\xd5\x4a\xb5\x6a\xd5\x38\x77\xee\x5c\
-\xb1\x8f\x52\x88\x8f\x8f\xc7\xdf\xdf\xdf\x75\xbf\x15\x7d\xe4\x2b\
-\x9e\x3f\x96\xae\x00\x3f\x7f\x40\x83\xce\xa3\x39\xad\x8d\x76\x2b\
-\x9f\xb3\xb3\xb3\x71\x38\x1c\xc4\xc4\xc4\x14\x58\x11\xe0\x6e\x1b\
-\xa9\xd7\xeb\xc9\xcd\xcd\x75\xed\xa6\x5c\x54\x21\x95\x9a\xf1\xd9\
-\x5f\xa9\x7c\xe6\xfc\x41\xaf\xcd\x64\xbf\x65\x47\x6f\x34\xa0\xa9\
-\xa0\x14\xf2\x96\x71\x38\x1c\xae\xcd\xb2\xaa\x57\xaf\x5e\xec\xd9\
-\x39\x5f\x5f\x5f\xfc\xfc\xfc\xd0\xe9\x74\x57\x2d\xa3\x15\x42\x48\
-\x10\x28\x84\xf0\x20\xad\x5a\xb5\x62\xf6\xec\xd9\x8c\x1b\x37\xae\
-\x44\xd7\xfe\x7f\xf1\xc5\x17\x24\x26\x26\xf2\xc4\x13\x4f\x14\x31\
-\xb0\xbc\xce\xfb\x2b\x5e\x45\xeb\x78\xf9\xf8\xf8\x10\x1b\x1b\xcb\
-\xbc\x79\xf3\xa8\x56\xad\x5a\xb1\x97\x39\xb9\xae\x43\x51\x78\xe5\
-\x95\x57\xd0\xeb\xf5\xc5\xda\x40\x27\x7f\x63\x5f\xd4\x00\xd0\xd7\
-\xd7\x97\x86\x0d\x1b\x32\x6e\xdc\x38\xaa\x56\xad\x5a\x62\xe7\x5f\
-\xd9\x6c\x36\x5e\x7e\xf9\x65\x02\x03\x03\xa9\x5a\xb5\xaa\x5b\x9f\
-\x61\xfc\x5b\x5c\x54\xd4\x00\xd0\xdb\xdb\x9b\xa8\xa8\x28\xde\x79\
-\xe7\x1d\xaa\x56\xad\x4a\x48\x48\x48\x89\xa4\x6d\xf3\xe6\xcd\x1c\
-\x38\x70\x80\xaa\x55\xab\xba\x7f\x74\x81\x29\xff\x7b\x9a\x45\x9f\
-\x2d\x89\x8c\x8c\xc4\x60\x30\xd0\xb1\x63\x47\xa2\xa2\xa2\x8a\x7f\
-\x6e\xe1\x65\x1b\x36\x6c\xe0\xeb\xaf\xbf\x26\x3a\x3a\x9a\xa0\xa0\
-\x20\xf7\xea\xa3\xbe\x60\xed\x2c\x6a\xf8\x16\x1c\x1c\x4c\x76\x76\
-\x36\x23\x46\x8c\xc0\xd7\xd7\xb7\xc0\x21\xed\xc5\xf1\xd9\x67\x9f\
-\xb1\x79\xf3\x66\x1e\x7d\xf4\x51\xf7\x82\x4a\x3f\xff\x1b\xb6\x2b\
-\x85\x11\x13\x13\xc3\xa2\x45\x8b\x38\x73\xe6\x0c\xe5\xca\x95\x2b\
-\x91\x72\x0b\x0a\x0a\x62\xc8\x90\x21\xec\xd9\xb3\x87\xc1\x83\x07\
-\x97\x48\x5e\xe9\x8d\x79\xad\x8a\x52\x84\x31\x93\x1a\x35\x6a\xf0\
-\xc3\x0f\x3f\xf0\xc2\x0b\x2f\x14\x7b\x09\x6f\x7e\x6f\xbf\xfd\x36\
-\xa7\x4f\x9f\x66\xc4\x88\x11\x32\x0b\x28\x44\x61\xfb\x17\x5a\x49\
-\x3d\x15\x84\x10\xe2\x26\x9c\xcb\x36\x5f\x79\xe5\x15\xb7\x0f\x51\
-\xbe\x1e\x87\xc3\x41\xbd\x7a\xf5\xe8\xd6\xad\xdb\x2d\xdb\x8e\x3b\
-\x21\x21\x81\xb9\x73\xe7\x92\x91\x91\x51\xe2\x69\xab\x5b\xb7\xee\
-\x55\x4b\x0c\xff\x4d\xc7\x8f\x1f\x67\xf6\xec\xd9\xc5\x5a\xde\x7a\
-\x2d\xaa\xaa\xd2\xac\x59\x33\xba\x74\xe9\x72\xcb\xd2\xb6\x7f\xff\
-\x7e\x3e\xff\xfc\xf3\x12\xad\x37\xce\x6d\xf0\x07\x0c\x18\x40\x7c\
-\x7c\xfc\x2d\x4b\xdb\xb7\xdf\x7e\xcb\xf6\xed\xdb\x29\xe9\x47\xbd\
-\xd1\x68\xa4\x43\x87\x0e\x05\x96\x86\xfe\x9b\x54\x55\x65\xd1\xa2\
-\x45\x6c\xdf\xbe\xbd\x44\x37\xba\x72\xb6\x4b\x23\x46\x8c\x28\xb1\
-\x01\x81\xa2\x4a\x4f\x4f\x67\xde\xbc\x79\x9c\x3d\x7b\xb6\x44\xef\
-\x35\xe7\x59\x9f\x4f\x3f\xfd\x34\x81\x81\x81\xb7\x24\x6d\x39\x39\
-\x39\x4c\x98\x30\x01\xbb\xdd\x5e\xa2\x87\xbb\x3b\x1c\x0e\xe2\xe2\
-\xe2\xe8\xd9\xb3\x67\xb1\xce\x8b\x14\x42\x82\x40\x21\x84\x10\x42\
-\x08\x21\x84\x10\xff\x49\x3a\xc9\x02\x21\x84\x10\x42\x08\x21\x84\
-\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\x21\
-\x84\x10\x42\x08\x21\x24\x08\x14\x42\x08\x21\x84\x10\x42\x08\x21\
-\x41\xa0\x10\x42\x08\x21\x84\x10\x42\x08\x09\x02\x85\x10\x42\x08\
-\x21\x84\x10\x42\x48\x10\x28\x84\x10\x42\x08\x21\x84\x10\x42\x82\
-\x40\x21\x84\x10\x42\x08\x21\x84\x10\x12\x04\x0a\x21\x84\x10\x42\
-\x08\x21\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\
-\x42\x08\x21\x84\x10\x42\x08\x21\x24\x08\x14\x42\x08\x21\x84\x10\
-\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\x84\
-\x10\x42\x08\x21\x84\x10\x42\x82\x40\x21\x84\x10\x42\x08\x21\x84\
-\x10\x12\x04\x0a\x21\x84\x10\x42\x08\x21\x84\x90\x20\x50\x08\x21\
-\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\x21\x84\x10\x42\x08\x21\
-\x24\x08\x14\x42\x08\x21\x84\x10\x42\x08\x21\x41\xa0\x10\x42\x08\
-\x21\x84\x10\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\
-\x10\x28\x84\x10\x42\x08\x21\x84\x10\x42\x82\x40\x21\x84\x10\x42\
-\x08\x21\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\
-\x42\x08\x21\x84\x10\x42\x08\x21\x24\x08\x14\x42\x08\x21\x84\x10\
-\x42\x08\x21\x41\xa0\x10\x42\x08\x21\x84\x10\x42\x08\x09\x02\x85\
-\x10\x42\x08\x21\x84\x10\x42\x48\x10\x28\x84\x10\x42\x08\x21\x84\
-\x10\x42\x82\x40\x21\x84\x10\x42\x08\x21\x84\x10\x12\x04\x0a\x21\
-\x84\x10\x42\x08\x21\x84\x90\x20\x50\x08\x21\x84\x10\x42\x08\x21\
-\x84\x04\x81\x42\x08\x21\x84\x10\x42\x08\x21\x24\x08\x14\x42\x08\
-\x21\x84\x10\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\x10\x42\x48\
-\x10\x28\x84\x10\x42\x08\x21\x84\x10\x42\x82\x40\x21\x84\x10\x42\
-\x08\x21\x84\x10\x12\x04\x0a\x21\x84\x10\x42\x08\x21\x84\x90\x20\
-\x50\x08\x21\x84\x10\x42\x08\x21\x84\x04\x81\x42\x08\x21\x84\x10\
-\x42\x08\x21\x24\x08\x14\x42\x08\x21\x84\x10\x42\x08\x21\x41\xa0\
-\x10\x42\x08\x21\x84\x10\x42\x08\x09\x02\x85\x10\x42\x08\x21\x84\
-\x10\x42\x48\x10\x58\xea\x69\x9a\x26\x99\x20\x84\x10\x42\x08\xe9\
-\xef\x48\x7f\x49\x88\x12\xa7\x68\x72\xf7\x78\xac\xf7\xdf\x7f\x9f\
-\xf4\xf4\x74\xd7\xf7\x39\x39\x39\xf4\xe9\xd3\x87\x3a\x75\xea\x48\
-\xe6\x78\xb0\xa4\xa4\x24\xde\x7b\xef\x3d\xcc\x66\x33\x9a\xa6\xa1\
-\xaa\x2a\xbe\xbe\xbe\x0c\x1c\x38\x90\x90\x90\x10\xc9\xa0\xeb\xd8\
-\xb6\x6d\x1b\xcb\x96\x2d\xc3\x68\x34\x5e\xf5\x50\x77\x7d\xaf\x28\
-\x28\xf9\x7e\x6e\xb7\xdb\xb9\xed\xb6\xdb\xe8\xd4\xa9\x93\x47\x77\
-\x70\x76\xec\xd8\xc1\xc2\x85\x0b\x5d\x75\xe2\x9a\x9d\x97\xbf\xa5\
-\x4d\xaf\xd7\xd3\xba\x75\x6b\x9a\x37\x6f\xee\xd1\xe5\xb6\x60\xc1\
-\x02\x0e\x1d\x3a\x74\xc3\x8e\x99\xa2\x28\x05\xfe\x2d\x2b\x2b\x8b\
-\x91\x23\x47\x12\x1e\x1e\xee\xb1\xe9\xb2\x5a\xad\x7c\xfd\xf5\xd7\
-\x1c\x3e\x7c\x18\x83\xc1\x70\xad\x82\x45\xbb\x46\xfa\x4c\x26\x13\
-\x7d\xfa\xf4\x21\x2a\x2a\xca\x63\xd3\x76\xfe\xfc\x79\x16\x2d\x5a\
-\x44\x72\x72\x72\xfe\x04\x71\xad\xde\x80\x33\x6d\x0e\x87\x03\xb3\
-\xd9\xcc\xd0\xa1\x43\x31\x9b\xcd\x1e\x9d\xb6\x4f\x3e\xf9\x04\x55\
-\x55\x8b\x54\x27\x8d\x46\x23\x2f\xbe\xf8\xa2\x47\xdf\x6b\xbb\x76\
-\xed\xe2\xbb\xef\xbe\x73\xa5\xe3\xc6\xdd\x37\x05\x45\xc9\xab\xc7\
-\x75\xea\xd4\xa1\x4b\x97\x2e\xf8\xf8\xf8\x78\x6c\xda\xd6\xae\x5d\
-\xcb\xda\xb5\x6b\xaf\xba\xd7\x6e\x54\x66\x9a\xa6\x51\xb9\x72\x65\
-\x06\x0c\x18\x20\x0f\xd0\x42\xc8\xcc\xcc\x64\xc6\x8c\x19\x58\x2c\
-\x96\x02\xcf\x99\xae\x5d\xbb\x52\xbb\x76\x6d\xc9\xa0\xff\xa7\x23\
-\x30\xc2\x43\xb5\x6b\xd7\x4e\x53\x14\x45\xd3\xeb\xf5\x9a\xa2\x28\
-\x9a\xd1\x68\xd4\x56\xac\x58\x21\x19\xe3\xe1\x52\x53\x53\x35\xbd\
-\x5e\xef\xfa\x02\xb4\x3b\xef\xbc\x53\x3b\x77\xee\x9c\x64\xce\x0d\
-\x3c\xfe\xf8\xe3\xae\xfa\x5e\xe0\x4b\xa7\x68\xe8\xf4\x9a\x97\xc1\
-\x70\xd5\xbf\x01\x5a\xa7\x4e\x9d\x3c\x3a\x5d\x16\x8b\x45\x7b\xf1\
-\xc5\x17\x35\x20\x5f\x9a\xd0\x00\x0d\x14\x4d\xa7\xd7\x6b\x3a\x9d\
-\xe2\xfa\x3e\x7f\xda\x46\x8e\x1c\xe9\xf1\xe5\xd6\xa8\x51\x23\x4d\
-\xa7\xd3\xb9\xae\x5b\xe1\x72\xda\x14\x9d\xa6\xd7\xeb\x34\x9d\xe2\
-\x4c\xab\xae\x40\xda\x16\x2f\x5e\xec\xd1\xe9\xba\x70\xe1\x82\x56\
-\xb3\x66\xcd\x82\xe5\x76\xf9\x4b\x77\xb9\xfc\x74\x8a\xa2\x29\xf9\
-\xd2\xae\xd3\xe9\xb4\x80\x80\x00\xed\xb3\xcf\x3e\xf3\xe8\xb4\xad\
-\x5d\xbb\x56\xab\x54\xa9\x52\x81\x72\xd3\x29\x8a\xa6\xfc\xfd\x4b\
-\xa7\x68\x3a\xbd\xce\x95\x36\x40\x3b\x7b\xf6\xac\x47\xa7\x6d\xf9\
-\xf2\xe5\x9a\xa2\x28\x7f\x4b\x5b\xfe\x3a\xa9\xd7\x14\xd7\xf7\x57\
-\xee\xb7\xd0\xd0\x50\xed\xc8\x91\x23\x1e\x9d\xb6\xc9\x93\x27\x17\
-\x48\xdb\x35\xcb\xec\xf2\x97\xf3\xff\x01\xb4\x06\x0d\x1a\x68\x67\
-\xce\x9c\xf1\xe8\xb4\x75\xee\xdc\xb9\xc0\xbd\x76\xa5\x1d\xc9\x4b\
-\x4b\xc1\x76\xe5\xca\xfd\x56\xb3\x66\x4d\x79\x78\x16\x92\xcd\x66\
-\xd3\x6a\xd6\xac\x59\xa0\x6e\x44\x47\x47\x6b\x1b\x36\x6c\x90\xcc\
-\xf9\x7f\x4a\x96\x83\x7a\xb0\x07\x1e\x78\x00\x4d\xd3\x70\x38\x1c\
-\x68\x9a\x46\x54\x54\x14\xe5\xcb\x97\x97\x8c\xf1\x70\xfe\xfe\xfe\
-\xd4\xaf\x5f\x1f\x87\xc3\x81\xc3\xe1\x00\xa0\x4d\x9b\x36\x32\x0b\
-\x78\x13\x19\x19\x19\xae\xfa\x5e\xe0\x4b\xad\xc2\x37\xbb\x4e\x92\
-\x78\xf6\x34\xb3\x9e\xbd\xa7\xc0\xbf\x01\x64\x67\x67\x7b\xf4\x72\
-\x20\x55\x55\xc9\xce\xce\x76\xcd\xa6\xe4\xa5\xa9\x2c\x03\xdf\x9a\
-\xcd\xb6\x03\x47\x39\x77\xe1\x22\x89\xa7\x8f\xb1\xfa\x9b\x19\x74\
-\xa9\x1d\x54\x20\x6d\xb9\xb9\xb9\x9e\x3e\x88\x48\x76\x76\x36\xaa\
-\xaa\xba\xae\x3b\xa0\x5c\x1d\x46\x4f\x5f\xc4\xde\xa3\x67\x38\x9f\
-\x74\x91\x53\x87\x77\x31\xff\xbd\xe7\xa8\x57\x8e\x02\x69\xcb\xcc\
-\xcc\xf4\xe8\xb4\xa9\xaa\x4a\x4e\x4e\x4e\xc1\x72\xbb\xfc\x65\x08\
-\xa8\xcf\x27\xeb\x8f\x91\x78\x21\x99\xbf\x96\xbd\x49\xa5\x50\x13\
-\x0e\x87\xc3\x95\x0f\xce\xf2\xf6\x54\x36\x9b\x0d\x9b\xcd\x76\xa5\
-\xdc\xf0\xa6\xed\x23\x33\x38\x9e\x72\x81\xe3\x47\x8f\x72\xec\xd8\
-\x31\x8e\x1d\x3b\xc6\x91\xfd\xdb\x79\xb6\x7d\x75\x57\xda\x9c\xf9\
-\xe2\xc9\x2c\x16\x8b\x6b\x05\x86\xb3\xbc\x54\xef\x8a\x3c\x35\x71\
-\x2e\xbb\x8f\x25\x70\xf1\x42\x12\x09\x27\x0e\xb0\x78\xda\x28\xaa\
-\x87\x99\xaf\xfc\x3f\xaa\x4a\x56\x56\x96\x47\xa7\xcd\x6a\xb5\xe6\
-\x4b\x5b\x34\xb3\x0f\x5f\x20\xf1\xc4\x51\x8e\x5e\x2e\xaf\xbc\xaf\
-\xa3\x1c\x3b\x79\x86\x9d\xdf\x3e\xe7\xba\xd7\xb2\xb2\xb2\x5c\xff\
-\xed\xa9\x9c\xab\x9e\x9c\xe5\x61\x2e\x5f\x93\xe1\x13\xe7\xb0\xe3\
-\xe0\x09\x92\x92\x92\x38\xb4\x7b\x23\xef\x0c\x7f\x80\x70\x93\x5a\
-\xa0\xcc\xf2\xcf\x6a\x89\x1b\x33\x18\x0c\xd4\xad\x5b\xd7\x95\xcf\
-\x00\x31\x31\x31\xd4\xab\x57\x4f\x32\xe7\xff\x6b\x9d\x90\x2c\xf0\
-\x5c\x7d\xfb\xf6\x65\xf0\xe0\xc1\xae\xef\xab\x56\xad\x4a\x58\x58\
-\x98\x64\x8c\x87\xd3\xe9\x74\x34\x6d\xda\x94\x6d\xdb\xb6\xb9\x7e\
-\x56\xa3\x46\x0d\xbc\xbc\xbc\x24\x73\x8a\x92\x8f\x0a\xa8\xba\x70\
-\x86\xfe\x6f\x1a\x9d\xe3\xca\x63\x22\x07\xbd\x4e\xb9\xea\xff\xfb\
-\xfb\x12\x21\x4f\x54\xf0\x1a\x15\x1e\x9d\xb7\x82\x4f\xfb\x36\x00\
-\x4d\xc5\xee\x50\xd1\x05\x06\xd2\xf6\xfe\x21\xb4\x6c\x59\x87\x56\
-\xf1\x77\xb0\x31\xb9\xf4\xac\xd2\xcf\x9f\x36\x63\x68\x55\x9e\xfb\
-\xec\x7b\x5e\xe9\x50\x11\x4d\x75\xe0\x50\x35\x82\x83\xeb\xf0\xe0\
-\x88\x89\x44\x47\x85\xd1\xa3\xd7\x0b\x9c\x75\x94\xd6\x72\xbb\xfc\
-\x33\x5d\x05\x26\xaf\xfc\x91\x41\x4d\xf3\x96\xb2\x06\x96\x0b\xc2\
-\x68\x50\x4a\x5d\x9d\x2c\x70\xaf\x99\x7c\xa8\xd8\xb4\x2d\x95\x82\
-\x42\xd0\x02\x83\x5d\xcb\x42\xed\xd6\x10\x42\xfd\x4d\xa5\xba\x1d\
-\x51\xa2\x7b\x31\xf2\xad\xb1\x4c\xec\x55\x1d\x3d\x0e\x6c\x56\x3b\
-\x7e\x01\xd5\xe8\x3e\x74\x12\xf5\x83\x6d\x34\x79\x7c\x2a\x17\x33\
-\xed\xa5\x30\x65\x26\x2a\x44\x87\x10\xae\x06\xa3\xe6\x6b\x5b\x74\
-\x97\xdb\xc8\x33\x17\x43\x4b\x6f\xa1\x79\x45\xf2\xf4\x1b\xd3\x79\
-\x63\x60\x4b\x0c\x9a\x03\x9b\x5d\xa3\x4c\x48\x73\x9e\x9b\x54\x0d\
-\x7f\x2f\x3b\x43\xdf\x59\x82\x03\xe1\x8e\x46\x8d\x1a\xb1\x70\xe1\
-\x42\xd7\x60\x4e\x64\x64\xa4\x47\x2f\xef\x16\xff\x70\xdb\x2f\x59\
-\xe0\xb9\x7c\x7c\x7c\xa8\x54\xa9\x52\x81\x40\x22\x38\x38\x58\x32\
-\xa6\x14\xb8\xed\xb6\xdb\x5c\xff\x1d\x1b\x1b\x4b\x4c\x4c\x8c\x64\
-\x4a\x91\x18\xb9\x6b\xf0\xbb\x64\xd9\xcf\x33\xed\xe9\x0e\xf8\x18\
-\x94\xff\x4e\xd2\xca\xb5\x65\xd4\xdd\x71\xa0\xd9\xd9\xff\xc3\xff\
-\x88\x2b\x1f\xc9\xf0\x69\x2b\xc8\xd4\xc0\x10\xde\x8c\x76\x2d\x2b\
-\x97\xda\xc7\x49\x58\x99\xda\xb4\x88\x37\x90\x9a\xb0\x9f\x0f\x86\
-\x75\x25\xac\x7c\x5d\xe6\x6e\x49\x06\xf4\x94\xab\x5c\x8b\xa8\xf2\
-\xa5\xbc\x1c\x95\x40\x06\x4d\xfb\x92\xa7\x9b\x06\x93\x94\x78\xe9\
-\xbf\x73\xb7\x79\x9b\xa8\xdd\x28\x16\xb8\xc0\xb7\x33\xdf\x61\xd4\
-\x73\xcf\x33\xea\xf9\xe7\x78\x76\xf8\x53\x7c\xbd\xf9\x54\x69\x7e\
-\x8a\xf2\xc4\xe8\xc1\xbc\xd0\xbb\x3a\x7a\x05\x76\x7d\xf9\x04\x46\
-\x6f\x5f\xee\xe8\xfd\x2a\x0b\xbf\x5d\xc8\xaf\xa7\x32\xd1\x2b\xa5\
-\x75\x2c\xfc\x0c\xef\x0e\x7a\x9a\xa7\x9e\x1c\xc2\x90\x21\x4f\x30\
-\x78\xd0\x60\x5e\x9e\xb9\x92\xcc\x5c\x07\x0e\x4b\x1a\x9b\xbf\x5e\
-\x51\x6a\x4b\x4d\x5f\x3e\x9a\xb8\xb8\x9a\x18\x80\xe3\xf3\xfb\x61\
-\x34\x96\x63\xe1\x19\x1b\x18\x43\x88\x8b\xaf\x4d\x79\xe9\xb9\xba\
-\xad\x7e\xfd\xfa\x98\x4c\x79\x03\x3b\x81\x81\x81\xb4\x6e\xdd\x5a\
-\x32\xe5\xff\x31\x99\x09\xf4\x70\x8f\x3c\xf2\x08\x63\xc6\x8c\x01\
-\xa0\x5a\xb5\x6a\x1e\xfd\x62\xb7\xb8\xa2\x59\xb3\x66\xe8\xf5\x7a\
-\x1c\x0e\x07\xb5\x6a\xd5\x22\x3a\x3a\x5a\x32\xa5\x88\x32\x2e\x9c\
-\xe4\xa7\x75\xbf\x51\x31\x2c\x8a\xba\x35\xa2\xd0\xff\x47\xd2\x65\
-\xf2\xb5\xb2\x76\xe5\xf7\xec\xf1\xb6\xb2\x62\xc6\x54\x8e\x5e\x48\
-\x26\x2b\x2b\x13\xbb\x03\x30\xe4\x90\x76\xa9\xb4\x2e\x6f\x52\xb9\
-\x70\x66\x3d\x83\xef\x69\x83\x2e\x27\x85\x33\x4a\x05\xba\x74\x6e\
-\x4b\x84\x19\x50\x73\xd8\xbf\x75\x35\xc7\x12\x4b\xf3\x3e\x64\xfe\
-\x74\x7d\x61\x06\xd3\x87\xdc\xc1\x86\xd9\x2f\xf2\xf5\xf1\x16\x4c\
-\x7d\xa3\x0b\x0a\x50\xda\x77\x57\xf3\xf6\x8a\xa2\x61\x3d\x20\x2b\
-\x03\xd5\x1c\x42\x8d\xba\xe5\xd1\xb2\xd3\x38\xb8\xfd\x28\x49\xa9\
-\xd9\xa5\x37\x61\x21\x0d\xb9\x3d\x26\x1a\xe7\x9c\xd8\xf9\xd3\x76\
-\xc6\x4e\x9f\x43\x25\x7d\x12\x1b\x96\x7e\xc1\xb2\x6f\x57\x72\x3e\
-\xc3\x5e\x4a\x13\x77\x89\x95\x9f\x4d\xbb\xf2\x6d\xe8\xed\x7c\xf6\
-\x50\x55\xfc\x4c\x7a\x56\x4c\x7a\x8c\x9e\x93\xd6\x81\xa2\x40\x29\
-\xdc\xfb\xcf\x71\xf1\x24\xbb\x77\x6c\x25\xe7\xf6\x0e\xf8\x54\x69\
-\xc3\xe3\x43\xaa\x52\xc5\x5b\x41\xcb\x38\xc5\xe6\xad\xdb\x48\x52\
-\x11\x6e\x6a\xd0\xa0\x01\x01\x01\x01\x64\x66\x66\x12\x1c\x1c\x4c\
-\xcb\x96\x2d\x25\x53\x24\x08\x14\x9e\xaa\x53\xa7\x4e\x8c\x19\x33\
-\x86\x88\x88\x08\x62\x63\x63\x25\x43\x4a\x89\xe8\xe8\x68\xc2\xc2\
-\xc2\x48\x4c\x4c\x24\x3a\x3a\x9a\xc0\xc0\x40\xc9\x94\x22\xb1\xb2\
-\x69\xd9\x34\xba\x2f\xfd\x80\x06\x7d\xc6\xb3\x6a\xf6\xf3\x04\xfd\
-\x47\xa2\x40\xeb\xb1\xdf\x78\xf2\xe1\xdf\xd0\x34\x0d\xc5\xaf\x3c\
-\x03\xc7\x7d\xc6\xd8\xe1\xbd\x08\x32\xc0\xd6\x79\x63\x59\xb8\xf1\
-\x5c\xe9\x4d\x5b\xf6\x25\x8e\x1c\xcc\x9b\x21\x0b\xef\xf5\x32\x73\
-\x67\x3d\x83\x11\xb0\xe7\xa4\x72\xee\xf8\x01\x52\x6c\xa5\x36\x4c\
-\xa2\xe5\x13\x13\x98\x35\xe1\x41\x8e\xaf\x7e\x9f\x07\x1f\x7f\x9b\
-\xba\x2f\x76\x00\x40\x43\xc5\x96\x63\x2b\xd5\x75\xd2\xbb\x42\x6b\
-\x1a\x2b\x80\xb9\x2a\x77\xb5\xb6\x71\xd6\x16\x44\x7c\x95\xb2\xc0\
-\x60\x5a\xd7\x7e\x9a\xfb\x86\x7f\x42\xa9\x4c\x61\x70\x00\x3e\x7e\
-\x57\x96\xba\xb5\x7b\x61\x36\xb7\xa5\x5e\xc4\x2f\x38\x94\x01\x8f\
-\x3f\xcb\x93\x8b\x5e\xa2\xd5\x23\xef\x92\x98\x69\x2d\xd5\xe5\xe7\
-\x57\xb9\x25\x43\xdf\x9b\xcb\x03\x2d\xa3\x70\x9c\xfa\x96\xe7\x27\
-\x7c\x93\xf7\x0f\xa5\x75\xf3\xf7\xac\xd3\x6c\xdf\xb9\x83\xc4\xd4\
-\xbb\xa8\x72\xfb\x60\x3e\xba\x3d\xef\xc7\xa9\xc7\x93\x38\xf4\xd7\
-\x41\x72\x11\xee\x0a\x08\x08\xa0\x7c\xf9\xf2\x24\x24\x24\x50\xa1\
-\x42\x05\x22\x23\x23\x25\x53\xfe\x1f\x93\x49\x75\x0f\x17\x11\x11\
-\x81\xd1\x68\xa4\x5a\xb5\x6a\xd4\xaf\x5f\x5f\x32\xa4\x14\x69\xd9\
-\xb2\x25\x26\x93\x89\xf8\xf8\x78\xc9\x0c\x37\x68\x97\xdf\x59\xb0\
-\xd9\xec\xff\xad\x74\x69\x1a\x9a\xa6\x51\xa6\x76\x27\x66\x7e\xf3\
-\x03\x33\x5e\x7a\x88\xe0\xe4\x9d\x4c\x1e\xd1\x9b\xde\x43\xde\xe1\
-\x4c\x69\xed\x8f\x2a\x0a\x81\x65\x2b\xd1\xb0\x71\x63\x6a\xc7\x46\
-\x62\xdb\x3a\x9b\x07\xfb\x0d\xe1\xdb\x6d\xe7\x30\xf8\x04\xd1\xf1\
-\x91\x17\xb8\x27\xbe\x94\x2e\x67\x0f\xae\xc6\x90\xfe\xf7\x10\x02\
-\xf8\x96\xbb\x8d\x69\x4b\x7e\xe0\xcd\x01\x79\x47\xf5\x78\xc5\xf5\
-\x60\xf6\x7b\x2f\x52\x3e\xd0\x58\x6a\xeb\x64\xd2\x91\xaf\x68\x7f\
-\x57\x1b\x5a\xb7\x6e\x49\xbb\x4e\x5d\x69\xdf\xba\x2f\xab\x4e\xa4\
-\x00\x26\x1a\xb6\xbb\x97\x7a\xa5\xf5\xb5\xc0\x9c\x5c\x1c\xb9\x57\
-\x6e\xa8\x3d\xf3\x87\x72\x7b\x8b\xce\x3c\x3f\xe9\x3b\x2c\x40\xf5\
-\x9e\x4f\xd3\x39\xb2\x94\x0f\xd0\x19\x02\x69\xfd\xc0\x50\x5e\xeb\
-\x16\x85\x9f\x02\x2b\xde\x7e\x83\xfd\x69\xa5\x3b\x49\x65\xe2\x5b\
-\x31\xf8\xc9\xa1\x54\x09\xf2\xe2\xc8\x77\x63\xe9\xd4\xe9\x7e\x96\
-\x1f\xcd\x25\xa8\x4a\x63\x9e\x7e\x62\x30\xb5\x42\xfe\x43\xaf\x07\
-\xdc\x02\x6d\xda\xb4\x01\xa0\x49\x93\x26\x92\x19\x12\x04\x0a\x4f\
-\xe6\xe7\xe7\x47\x7c\x7c\x3c\x61\x61\x61\x84\x86\x86\x4a\x86\x94\
-\x22\x9d\x3b\x77\xc6\x64\x32\x51\xb9\x72\x65\xc9\x8c\x62\xc5\x16\
-\xff\xbd\x07\x7e\x48\x87\x97\xd9\xf8\xe3\x7c\x06\x77\xa8\xc5\xc9\
-\xf5\xf3\x78\xe6\x99\x17\xf8\x72\xf5\x1e\xbc\x23\xe3\x08\x0d\x28\
-\xa5\xc1\x84\xce\x40\x8d\x8e\x4f\xf0\xc3\x8f\xbf\xb0\x76\xd9\xa7\
-\x34\xd0\x9d\x66\xf1\xfc\x8f\xd8\x78\x3c\x6f\xc7\x45\x93\xaf\x3f\
-\x65\x82\x03\x4a\x67\xda\xbc\xcd\x94\x0d\xcb\x0b\x16\x22\x6b\x36\
-\xa3\x6b\xe7\x8e\xd4\x8b\x2e\x83\xa6\xaa\x28\xe6\x72\xdc\x79\x5f\
-\x5b\x02\x7d\x4a\xeb\x54\xb5\x9e\xe6\x5d\xba\xd1\xa1\x63\x0f\xfa\
-\x76\xa8\x47\xda\xa9\x43\x9c\x3e\x79\x0a\xd4\xbc\x85\xae\xaa\x51\
-\x29\xbd\x4b\x86\xce\x1e\xe1\xe8\x85\x04\xd7\xc6\x29\x59\xe7\x76\
-\xb2\x6f\xff\x66\xb6\xef\x3e\x73\xf9\x4c\xce\x60\xc2\xf5\xa5\x7b\
-\x89\x41\x40\x44\x55\xba\x3f\xd4\x09\x5f\x00\x76\x32\x63\xf9\xf1\
-\x52\xdf\x3e\x46\x54\xae\x44\xcd\xda\x41\x00\x9c\x5e\x3f\x8f\x15\
-\x2b\x16\xb1\xea\x68\xde\xb2\xe4\xea\xd5\x2a\x51\xb1\xac\xb7\x3c\
-\x18\x8b\xe1\xde\x7b\xef\x05\xf2\xf6\x99\x10\xff\xbf\xc9\x72\x50\
-\x0f\x67\x34\x1a\x09\x0d\x0d\xfd\x4f\x76\x84\xff\xeb\xaa\x55\xab\
-\xe6\x2a\x43\x21\x5c\xca\xdc\xce\xf2\x8f\x9f\x27\xae\x7c\x5e\x50\
-\x11\xd3\xa2\x0f\x1f\x35\xef\x85\xa6\x29\x78\x79\x29\xbc\x75\x7f\
-\x0d\x5e\x5d\x74\xb8\xf4\xa5\xcb\xe1\x20\x71\xdf\x21\xb2\x03\xfc\
-\xa9\x52\xe6\x1e\x7e\xde\xbe\x9b\x23\x29\x26\xa2\xa3\xca\x00\x90\
-\x7c\xf6\x38\xfb\x8f\x9e\x2c\x9d\x65\x96\xb4\x8d\x9e\x77\xd6\xc3\
-\x6c\xcc\x7b\x64\x2a\x06\x6f\xba\x3c\x33\x87\xa9\xc3\x9a\x62\xdb\
-\x3b\x97\xb6\x3d\x5f\xe0\xd0\xf9\x9c\x52\x5a\x21\x1d\xa4\x97\xb9\
-\x93\x17\x9e\xbd\x17\x34\x8d\xfe\x8f\xbd\x40\x9a\x16\x48\x68\x90\
-\x19\x34\x07\x89\x5b\x7e\x63\x4b\xa9\x5d\x7f\x77\x92\x0f\xe7\xad\
-\xa5\x72\x7c\x5d\x7a\xc5\x1a\x69\x32\xec\x17\xf6\xb4\xd9\x4d\x48\
-\x8d\x26\x98\x00\x92\x7e\xe4\xfb\x0b\x59\xa5\xb8\x31\xd1\x11\x52\
-\xa1\x3e\xad\x6b\xe4\x85\x80\xfc\xf9\x1b\x7b\x32\x4b\xff\x62\xc9\
-\x33\xa7\xce\x71\xec\xb0\x85\xba\xb5\xbc\x69\x3d\x69\x1b\xdb\x7a\
-\x1d\xa3\x56\xc3\xbc\x55\x04\x87\x8e\x9e\xe6\xe4\x99\x1c\x84\xfb\
-\xe2\xe2\xe2\x00\xf0\xf6\x96\x60\x5a\x82\x40\x51\x80\xd5\x6a\xf5\
-\xa8\x73\x90\xec\x76\x7b\x81\x00\xd0\x93\xce\xc4\xd1\xeb\xf5\x1e\
-\x73\xec\x81\xc3\xe1\xc0\x6e\xb7\x7b\xdc\x79\x71\x06\x83\xc1\x75\
-\x5e\x95\xcd\xe6\x19\x6f\xd5\x28\x8a\x82\xd1\x68\xf4\xb8\x81\x85\
-\xeb\x96\x9d\xa2\x60\x4b\x4f\x27\x4d\xe7\x00\xa5\x08\xbf\xe7\xa1\
-\x69\x8b\xbd\xa3\x25\xd1\xde\x0e\xd2\xd2\xae\x5e\xb3\x65\xf4\x36\
-\xa1\x96\xb2\xd7\x78\xae\xa4\x4d\xe5\xc4\x9f\x8b\x18\xf8\x64\x2d\
-\xa6\xbf\xdc\x8f\x4a\x61\xc1\x54\x0c\x57\xc9\xce\x4c\xe7\xe4\xf6\
-\x1f\x19\xff\xfa\xf3\x6c\x4b\x2c\x5d\xe5\x76\xa5\x81\xb1\x91\x9c\
-\x98\x40\xb2\xab\xa0\x02\x39\x9f\x9c\x77\xce\x61\x6e\x7a\x32\x49\
-\x99\x19\x38\xb4\x52\x9a\x36\x60\xdf\xcc\xbe\xf4\xaf\x30\x9f\x49\
-\x8f\xdd\x45\x90\x77\x30\x7e\xaa\x4a\x56\xe6\x05\x76\xac\xfc\x92\
-\x17\x5f\xf8\x5f\xa9\xde\x8e\xff\xd4\xa2\xd1\x3c\x7d\x68\x13\xfa\
-\x19\x13\x68\x5f\xa7\x3c\x55\xe3\xeb\xa2\x60\xe1\xfc\x91\xbd\x4c\
-\x78\xfa\x55\x0e\x5c\xcc\x28\x35\xf7\xd9\x55\xf5\x4a\xa7\x23\x20\
-\x36\x9a\xb2\xd8\xc8\xb4\xe8\x49\x3d\xb0\x1f\x9b\xad\x74\xbf\xdf\
-\x08\x90\xbe\x77\x15\x13\x5e\x7e\x9e\x80\x09\x2f\xd2\xa8\x62\x10\
-\xf1\xb5\xe2\xb0\xa6\xa7\x70\x64\xdb\x72\x5e\x1a\x3f\x95\xfd\xe9\
-\xa5\xab\x7d\x74\x9e\xef\xe8\x11\xc3\x06\x3a\x1d\x9a\xa6\xa1\xd3\
-\xe9\xd0\xe9\x74\x1e\xd7\xaf\x34\x1a\x8d\xae\xeb\x12\x12\x04\xfe\
-\x6b\x52\x53\x53\xd9\xba\x75\x2b\xbf\xfc\xf2\x0b\x89\x89\x89\x1e\
-\xd3\x41\x76\x38\x1c\x64\x66\x66\x62\xb5\x5a\x79\xec\xb1\xc7\xb0\
-\x5a\xad\xb7\xfc\xda\x9c\x0d\x48\x54\x54\x14\x3d\x7b\xf6\x24\x3a\
-\x3a\xfa\x96\xee\x5a\x7a\xf0\xe0\x41\x7e\xfd\xf5\x57\xb6\x6d\xdb\
-\xe6\x31\x81\x16\xe4\x1d\x7e\x5e\xae\x5c\x39\xa6\x4e\x9d\xca\xec\
-\xd9\xb3\x3d\xe2\x21\xa0\x69\x1a\x3e\x3e\x3e\xb4\x6f\xdf\x9e\x86\
-\x0d\x1b\x7a\xd4\x4b\xe1\x65\xca\x94\xb9\xe6\xcf\xf7\x2e\x7d\x93\
-\x6a\x3f\x4d\x46\xa7\x68\x58\x73\xae\x1e\xb5\x37\x9b\xcd\x1e\x3d\
-\x53\xae\xd3\xe9\xf0\xf7\xf7\x77\x7d\x7f\x6c\xc5\x7b\x54\x8b\xfd\
-\x10\xe5\x1a\x7b\x4a\x2a\x68\x64\x67\x5d\xe9\x94\x3a\xb7\xf2\xf6\
-\x54\x8a\xa2\xe0\xeb\xeb\x7b\xe5\x07\xd6\x0c\xd6\x7e\x32\x92\xda\
-\x5f\x8d\x27\xbe\x56\x6d\x2a\xf8\xda\x38\x72\xe8\x20\x27\xce\x5c\
-\xe4\xef\x6f\x76\x06\x05\x05\x79\x74\xda\xf4\x7a\xfd\xf5\x47\xca\
-\xad\x69\x7c\xfb\x4e\x37\xca\xcc\x30\xa2\x5a\x73\xc8\xc8\xcc\x29\
-\x90\x27\x01\x01\x9e\xbd\xec\xd5\x64\x32\x15\xe8\x68\x39\xac\x59\
-\xcc\x7b\xf1\x3e\x96\xbd\x57\x99\x5a\x35\xab\x61\x76\xa4\x71\xe8\
-\xc0\x01\x4e\x5d\x48\xbf\x66\x7d\xf6\x64\x7e\x7e\x7e\x7f\xfb\x89\
-\xca\xc5\xdd\x4b\x79\xe0\xce\x1f\x28\x13\x5e\x8e\xea\xf1\xd5\xd0\
-\xa5\x9e\x66\xdf\xbe\x83\xa4\xe6\x5e\xb9\x07\x55\x55\xf5\xe8\x3a\
-\xa9\x28\xca\xd5\xed\x81\x6a\x67\xdf\x37\x6f\x11\xf1\xfd\x3b\xe8\
-\x74\x3a\xec\x39\x99\x64\xe4\x5c\x1d\xb2\xfb\xfb\xfb\x63\x30\x78\
-\x76\x77\xaf\xe0\xeb\x2e\x76\xb6\x7e\x37\x8d\xbb\x7e\x98\x45\xe5\
-\x6a\x71\x54\x29\x1b\x40\xc2\xb1\x7d\x1c\x39\x75\xe1\xaa\x01\x09\
-\x4f\x9e\xcd\x3a\x71\xe2\x04\xdb\xb7\x6f\x67\xf5\xea\xd5\xe4\xe4\
-\xe4\x78\xc4\x73\x4a\x51\x14\xac\x56\x2b\xb1\xb1\xb1\x7c\xf3\xcd\
-\x37\xac\x59\xb3\xc6\x23\x26\x3e\x34\x4d\x43\xaf\xd7\xd3\xa6\x4d\
-\x1b\x9a\x34\x69\x42\x4c\x4c\x8c\xac\x80\xfb\x37\xea\x83\xa6\x69\
-\xda\xff\xf7\x4c\x38\x71\xe2\x04\xa3\x46\x8d\x62\xe1\xc2\x85\x1e\
-\xd9\x39\x71\x36\xde\x36\x9b\xcd\xa3\x6e\x8a\xd4\xd4\x54\x00\x5e\
-\x7b\xed\x35\x86\x0d\x1b\x76\xdd\x4e\xfc\x3f\x19\x20\xcf\x9f\x3f\
-\x9f\x51\xa3\x46\x71\xfe\xfc\x79\xfc\xfd\xfd\xd1\x7b\xd0\xfb\x1d\
-\x8a\xa2\xe0\xe5\xe5\x85\xcd\x66\xf3\xa8\x99\x01\xab\xd5\x4a\x76\
-\x76\x36\x0d\x1a\x34\xe0\xdd\x77\xdf\xa5\x55\xab\x56\x1e\x71\x5d\
-\xfb\xf7\xef\xa7\x7b\xf7\xee\x1c\x39\x72\x24\x6f\xe7\xcc\xcb\x75\
-\x5d\xd3\x54\xd4\xcb\xd3\x63\x8a\xa2\x73\x1d\x86\xac\x69\x1a\xa1\
-\xa1\xa1\x4c\x9f\x3e\x9d\x9e\x3d\x7b\x7a\x74\x1b\xf3\xdb\x6f\xbf\
-\xd1\xa7\x4f\x1f\x12\x13\x13\x0b\xa4\xe7\x9a\xf5\x46\xa7\x43\xaf\
-\xd3\x11\x1f\x1f\xcf\xe4\xc9\x93\x69\xd7\xae\x9d\x47\xa7\x6d\xea\
-\xd4\xa9\x8c\x1f\x3f\x9e\xa4\xa4\xa4\xbc\x32\xd3\x34\x54\x55\x2d\
-\x10\xe2\x3a\xcb\xcd\x39\x80\x54\xb3\x66\x4d\x56\xaf\x5e\xed\xd1\
-\xef\x39\xdb\xed\x76\x26\x4f\x9e\xcc\xb8\x71\xe3\xc8\xce\xce\xfe\
-\x5b\xdb\xab\xa1\xa9\xea\xe5\x59\x5b\x05\x9d\x4e\x87\xa2\xe4\xb5\
-\xd5\x6d\xda\xb4\xe1\x8b\x2f\xbe\x20\x24\x24\xc4\x63\xd3\x96\x96\
-\x96\xc6\xb0\x61\xc3\x58\xbc\x78\xb1\x2b\x6d\xda\xe5\x72\xfb\x7b\
-\x5d\xd4\x5d\xfe\x37\xa3\xd1\xc8\xc3\x0f\x3f\xcc\xe4\xc9\x93\x3d\
-\xfa\x70\xe9\xb4\xb4\x34\x7a\xf4\xe8\xc1\x86\x0d\x1b\x0a\x3c\x33\
-\xf3\xca\x4b\xcb\x5f\x29\xd1\x29\x3a\x14\x34\xcc\x7e\x7e\xf4\xe8\
-\xd1\x83\x59\xb3\x66\x79\xf4\xbd\xb6\x63\xc7\x0e\x86\x0e\x1d\xca\
-\x8e\x1d\x3b\x70\x38\x1c\x57\xb5\x8f\x28\x97\xeb\x62\xbe\xdf\x09\
-\x08\x08\x60\xfc\xf8\xf1\x0c\x1c\x38\xd0\x63\x56\xee\x5c\xcb\xd6\
-\xad\x5b\xe9\xd5\xab\x17\xa7\x4f\x9f\x46\x55\x55\x14\x25\x2f\x30\
-\x2f\x58\x64\x57\xda\x7f\x67\xe0\x38\x7e\xfc\x78\x1e\x7d\xf4\x51\
-\x8f\x4b\xcf\xcf\x3f\xff\xcc\xa8\x51\xa3\xd8\xb5\x6b\x17\x66\xb3\
-\xd9\xe3\xf2\xde\x68\x34\x62\xb7\xdb\x3d\x6a\xe5\x9b\xc3\xe1\x20\
-\x23\x23\x83\xf2\xe5\xcb\x33\x71\xe2\x44\xfa\xf7\xef\x2f\x51\x9a\
-\x04\x81\xff\xbc\xa6\x4d\x9b\xb2\x79\xf3\x66\x1e\x7a\xe8\x21\xba\
-\x76\xed\x8a\xbf\xbf\xbf\x8c\x40\x14\x42\x42\x42\x02\xb3\x66\xcd\
-\x62\xfd\xfa\xf5\xbc\xf0\xc2\x0b\xbc\xfa\xea\xab\xff\x6a\xe7\xe0\
-\xab\xaf\xbe\xe2\xa1\x87\x1e\xc2\xcf\xcf\x8f\xd7\x5f\x7f\x9d\xb8\
-\xb8\x38\x8f\x0a\x02\x3d\x95\xc5\x62\x61\xfb\xf6\xed\x4c\x9c\x38\
-\x91\xf0\xf0\x70\x96\x2d\x5b\xe6\x31\x3b\xcf\x6e\xdd\xba\x95\xed\
-\xdb\xb7\xe3\x70\x38\x6e\x78\x0f\x3a\x9b\xad\xb8\xb8\x38\xda\xb4\
-\x69\xe3\xf1\xf7\xab\xd5\x6a\x65\xcb\x96\x2d\xec\xdd\xbb\xf7\xa6\
-\x69\x83\xbc\x59\xa8\x5a\xb5\x6a\xd1\xb4\x69\x53\x8f\xaf\xd3\x16\
-\x8b\x85\xd5\xab\x57\x73\xf2\xe4\xc9\x9b\xa6\xcb\x19\x4c\xb4\x68\
-\xd1\x82\xb8\xb8\x38\x8f\x2f\xb7\x8c\x8c\x0c\x56\xaf\x5e\xcd\xd9\
-\xb3\x67\x51\x14\xe5\xa6\x75\xd2\xc7\xc7\x87\x3b\xee\xb8\xa3\x54\
-\x1c\xe7\x73\xf6\xec\x59\xd6\xad\x5b\x47\x6a\x6a\x6a\xa1\xca\x2d\
-\x38\x38\x98\x7b\xee\xb9\xc7\xa3\x83\x5b\xa7\x93\x27\x4f\xb2\x6e\
-\xdd\x3a\x32\x32\x32\x6e\x3a\x73\xa9\x69\x1a\x61\x61\x61\x74\xea\
-\xd4\xc9\xa3\x83\x5b\xa7\xbd\x7b\xf7\xb2\x69\xd3\x26\xac\x56\xeb\
-\x4d\xd3\xa5\x28\x0a\x95\x2b\x57\xa6\x55\xab\x56\x05\x67\xec\x3d\
-\xd4\x96\x2d\x5b\xd8\xb9\x73\xe7\x55\xaf\xc1\x5c\x2f\x6d\xb1\xb1\
-\xb1\x1e\x39\x48\xb6\x7e\xfd\x7a\x7a\xf5\xea\x45\x62\x62\x22\xaf\
-\xbf\xfe\x3a\x4d\x9a\x34\xf1\xe8\x00\xdc\x53\xd8\xed\x76\x8e\x1e\
-\x3d\xca\x1b\x6f\xbc\x41\x56\x56\x16\x33\x66\xcc\x60\xc0\x80\x01\
-\x92\x31\x12\x04\xfe\x73\xa6\x4d\x9b\xc6\xd3\x4f\x3f\x4d\xaf\x5e\
-\xbd\x98\x3d\x7b\xb6\x1c\xc6\xee\xc6\x03\xa9\x77\xef\xde\xa4\xa6\
-\xa6\xb2\x6c\xd9\x32\x1a\x36\x6c\xf8\xaf\xfc\x5d\x55\x55\xa9\x5f\
-\xbf\x3e\x87\x0e\x1d\x62\xe1\xc2\x85\x74\xee\xdc\x59\x0a\xa3\x08\
-\x1c\x0e\x07\xb3\x67\xcf\x66\xf0\xe0\xc1\x8c\x1c\x39\x92\xb7\xde\
-\x7a\x4b\x5e\x12\x17\x42\x08\x21\x8a\xe9\x81\x07\x1e\x60\xe1\xc2\
-\x85\xcc\x98\x31\x83\x21\x43\x86\x48\x86\x14\xd1\x86\x0d\x1b\x68\
-\xd3\xa6\x0d\xcd\x9a\x35\x63\xc9\x92\x25\xa5\x62\xe0\xa9\xb4\xfa\
-\x7f\xff\xf6\xe5\x8c\x19\x33\xf0\xf1\xf1\xa1\x7f\xff\xfe\x12\x00\
-\xba\xa1\x56\xad\x5a\x0c\x1b\x36\x8c\xb3\x67\xcf\x72\xf8\xf0\xe1\
-\x7f\x6d\xd9\xe3\xb1\x63\xc7\xd8\xbb\x77\x2f\x75\xea\xd4\x91\x00\
-\xd0\x0d\x7a\xbd\x9e\xb6\x6d\xdb\xd2\xa0\x41\x03\xe6\xcf\x9f\xcf\
-\xb9\x73\xe7\x24\x53\x84\x10\x42\x88\x62\xb8\x78\xf1\x22\x3b\x76\
-\xec\x20\x24\x24\x44\x02\x40\x37\x35\x69\xd2\x84\xae\x5d\xbb\xb2\
-\x79\xf3\x66\xd6\xaf\x5f\x2f\x19\xf2\x0f\xfa\x7f\xbf\x31\x8c\xd5\
-\x6a\xc5\xc7\xc7\xc7\xa3\x36\xc8\x28\x6d\x9c\xef\x02\xfe\x9b\x9b\
-\xb2\x9c\x3b\x77\x0e\x55\x55\xa9\x57\xaf\x9e\x14\x80\x9b\x7c\x7d\
-\x7d\x29\x5b\xb6\x2c\xbb\x76\xed\xba\xe9\xd2\xa2\x92\xa6\x69\x1a\
-\x99\x99\x99\xe4\xe4\x94\xfc\x56\xdf\x8a\xa2\x10\x1c\x1c\x7c\xcb\
-\x36\x42\x50\x55\x95\xb4\xb4\xb4\x7f\xe4\x7e\xd0\xe9\x74\x04\x07\
-\x07\xdf\xb2\x25\xa2\x9a\xa6\x71\xf1\xe2\xc5\x7f\x64\xb0\xc7\x68\
-\x34\x12\x10\x10\x70\xcb\x36\x1e\xb1\x5a\xad\xa4\xa7\xa7\xff\x23\
-\xef\xc8\x78\x7b\x7b\xdf\xd2\xcd\x62\x6c\x36\x1b\x29\x29\x29\xff\
-\xc8\xf2\x5b\xb3\xd9\x7c\x4b\x97\x51\x5a\x2c\x16\xd2\xd2\xd2\x4a\
-\x3c\x6d\xaa\xaa\x12\x12\x12\x72\x4b\x97\xf1\x65\x64\x64\x5c\xe3\
-\x7d\xd4\x92\x69\x23\x03\x02\x02\x6e\xd9\xc6\x53\x9a\xa6\x91\x95\
-\x95\x45\x56\x56\xd6\x3f\x52\x27\x43\x42\x42\x6e\x59\x1b\x99\x92\
-\x92\xe2\x7a\xe7\x5e\xb8\x5f\x3f\x2b\x55\xaa\x44\x6e\x6e\xee\x35\
-\x77\xd1\x16\x12\x04\xfe\x23\x95\x4e\x94\x9e\xbc\x73\x76\xd4\x64\
-\x2b\xe1\xe2\x97\xdd\xad\x78\x31\x3c\x39\x39\x99\xbb\xef\xbe\x9b\
-\x9d\x3b\x77\x96\x78\xfd\xd1\x34\x8d\xb9\x73\xe7\xd2\xb7\x6f\xdf\
-\x5b\x52\x3f\x36\x6c\xd8\xe0\x7a\x1f\xa4\x24\xd3\xe6\x0c\xbc\x16\
-\x2d\x5a\x44\x8f\x1e\x3d\x6e\x49\x7d\x59\xb7\x6e\xdd\x3f\xf2\x0e\
-\xa6\xa6\x69\x54\xa9\x52\x85\x25\x4b\x96\xdc\xb2\x81\x9d\xe9\xd3\
-\xa7\xf3\xec\xb3\xcf\x96\x78\x9b\xa6\x69\x1a\xd5\xab\x57\x67\xf5\
-\xea\xd5\xb7\x6c\xb0\xf1\xd5\x57\x5f\x65\xd2\xa4\x49\xff\x48\xb9\
-\x75\xe8\xd0\x81\x39\x73\xe6\x10\x16\x16\x76\x4b\x02\xc0\x17\x5f\
-\x7c\x91\x29\x53\xa6\xfc\x23\x69\x7b\xe9\xa5\x97\x78\xf3\xcd\x37\
-\x6f\x49\x3b\x92\x96\x96\x46\xdb\xb6\x6d\xd9\xbe\x7d\x7b\x89\xd7\
-\x47\xbd\x5e\xcf\xf3\xcf\x3f\xcf\x5b\x6f\xbd\x75\x4b\x82\xa5\x33\
-\x67\xce\xf0\xd0\x43\x0f\xb1\x6e\xdd\xba\x7f\xa4\xdc\x96\x2e\x5d\
-\xca\x7d\xf7\xdd\x77\xcb\x02\x5c\xe9\x53\x96\x5c\xbf\x52\xb6\x2d\
-\x91\x20\x50\x88\x9b\x36\xb8\x25\xf1\x39\x45\x6a\xb4\x35\xae\x79\
-\x66\xdd\xbf\x92\xe6\x5b\xf7\xa7\x4b\xcc\xee\xdd\xbb\xd9\xbb\x77\
-\x2f\x73\xe6\xcc\x41\xa7\xd3\x95\x58\x20\x1a\x18\x18\xc8\xc4\x89\
-\x13\x99\x32\x65\x0a\xdd\xba\x75\xbb\xc6\x76\xf1\xff\xbc\x2f\xbf\
-\xfc\x92\xd0\xd0\x50\x26\x4d\x9a\x54\xf4\x7a\x75\x83\x41\x8f\xa0\
-\xa0\x20\xde\x79\xe7\x1d\x26\x4f\x9e\x7c\xcb\x82\xc0\x71\xe3\xc6\
-\x51\xa1\x42\x05\x66\xce\x9c\x49\x72\x72\x72\x89\x3d\xec\x1d\x0e\
-\x07\xe3\xc6\x8d\x63\xf3\xe6\xcd\xd4\xad\x5b\xf7\x5f\xef\x40\x9d\
-\x3a\x75\x8a\x2f\xbf\xfc\x92\x1e\x3d\x7a\xd0\xad\x5b\x37\xd7\xce\
-\x8b\x25\x91\x36\x45\x51\xe8\xdf\xbf\x3f\xdf\x7c\xf3\x8d\x2b\xc8\
-\xfc\x37\x1d\x3c\x78\x90\x49\x93\x26\xd1\xbb\x77\x6f\x7a\xf5\xea\
-\x55\xa2\xb3\x66\xa7\x4e\x9d\x62\xc2\x84\x09\xac\x59\xb3\x86\x5e\
-\xbd\x7a\xdd\x92\xb4\x4d\x99\x32\x85\xa1\x43\x87\xd2\xb2\x65\xcb\
-\x12\x59\x59\xa0\x69\x1a\xbe\xbe\xbe\x6c\xd8\xb0\x81\xf1\xe3\xc7\
-\x33\x62\xc4\x88\x5b\xb2\x8b\xed\xb4\x69\xd3\xd8\xbe\x7d\x3b\xef\
-\xbe\xfb\x2e\x65\xcb\x96\x2d\xb1\x3a\x09\xf0\xeb\xaf\xbf\x32\x67\
-\xce\x1c\xba\x77\xef\x4e\xe3\xc6\x8d\xff\xf5\xb4\xfd\xf2\xcb\x2f\
-\x6c\xd8\xb0\x81\x77\xde\x79\x87\xf2\xe5\xcb\x63\xb7\xdb\x4b\xe4\
-\x73\xcd\x66\x33\x6f\xbf\xfd\x36\xdd\xba\x75\x93\xe0\x41\x08\x09\
-\x02\x85\xb8\xb6\xdc\x8c\x0b\xfc\xb1\x6e\x2d\x6a\x54\x33\x6e\xaf\
-\x53\x11\x93\xa2\xf0\xfd\xdc\x79\x84\xdf\xde\x9e\x26\xd1\xa1\x24\
-\x1d\xd9\xce\xa6\x33\x06\xda\x35\xaf\x85\x8f\x51\x0f\xa8\x5c\x38\
-\xb9\x87\xb5\xdb\xce\xd2\xac\x65\x6b\x2a\x86\xfa\x90\xb4\xf3\x47\
-\xd6\x9e\xf4\xe2\xee\x2e\x6d\x09\xfe\xdb\x60\xea\x5f\xeb\x17\xb2\
-\xf8\x97\xbd\x84\xd4\xb8\x9d\xfb\xbb\xdf\x4d\x88\x11\x40\x65\xdf\
-\xda\x45\x2c\xfb\x75\x2f\xbe\x95\xea\xd3\xbd\x67\x37\xa2\xfc\xaf\
-\xbe\x36\x5b\x66\x12\x2b\x17\xce\x67\xdb\x69\x07\xad\x7b\xf4\xa5\
-\x75\xcd\x72\xe4\x66\x9e\x67\xed\xaa\x0d\x54\x69\xd9\x9d\xea\x65\
-\xac\xec\xfe\x6d\x0d\x47\xac\x91\x54\xf0\x4d\xe4\xe8\xd1\xf3\xa0\
-\x37\xa0\xa0\x62\x77\x28\xd4\x6d\xd1\x81\xda\x95\x82\xf0\xe4\x81\
-\x48\x2f\x2f\x2f\x22\x22\x22\x68\xd5\xaa\x15\xb3\x66\xcd\xe2\xf4\
-\xe9\xd3\xc5\xfe\x4c\xe7\x16\xf6\xd5\xab\x57\xe7\xd4\xa9\x53\xee\
-\x77\x74\x6d\xa9\x9c\xb9\x08\x91\xe5\x82\xdc\xbe\x8e\xb8\xb8\x38\
-\x5a\xb5\x6a\xc5\xc4\x89\x13\xc9\xcd\xcd\x2d\x76\xda\xec\x76\x3b\
-\x53\xa6\x4c\x61\xd9\xb2\x65\x9c\x3a\x75\xca\xed\xcf\x49\x4b\xb9\
-\x88\xde\x37\x00\x3f\x6f\xa3\x5b\xbf\x1f\x14\x14\x44\x58\x58\x18\
-\xcd\x9a\x35\x63\xd4\xa8\x51\xc5\x1e\x88\x51\x14\x85\x90\x90\x10\
-\x7a\xf6\xec\x49\xed\xda\xb5\x8b\x35\x2b\x91\x7c\xf6\x04\x86\x72\
-\x95\x09\xd4\xb9\x57\x1f\x8d\x46\x23\xcd\x9a\x35\xc3\xc7\xc7\x87\
-\x35\x6b\xd6\x14\x7b\x19\x9e\x5e\xaf\x47\xd3\x34\x3e\xfc\xf0\x43\
-\x9e\x7c\xf2\x49\xb7\x97\x4c\x6a\x0e\x1b\xc9\x29\xe9\x28\x41\x21\
-\x84\x78\xb9\x97\x36\x7f\x7f\x7f\x1a\x34\x68\x80\x8f\x8f\x0f\xdf\
-\x7d\xf7\x5d\xb1\xd2\xa5\x69\x1a\x5e\x5e\x5e\x94\x29\x53\x86\xae\
-\x5d\xbb\x32\x6f\xde\xbc\x62\x2c\x2b\xb4\x72\xf4\x48\x22\xd1\x31\
-\x51\x6e\x0d\x6e\x79\x79\x79\x61\x30\x18\xa8\x5d\xbb\x36\x17\x2f\
-\x5e\xe4\xcf\x3f\xff\x2c\xf6\x51\x4a\x8a\xa2\xd0\xb4\x69\x53\x6e\
-\xbb\xed\x36\x57\x39\xba\xc5\x61\x21\x21\xe1\x12\x65\x22\xcb\xe1\
-\xed\xc6\xe5\x04\x04\x04\x60\x36\x9b\xe9\xd8\xb1\x23\x33\x67\xce\
-\x24\x3b\x3b\xbb\x58\x69\xd3\x34\x0d\x6f\x6f\x6f\xca\x96\x2d\x4b\
-\xc7\x8e\x1d\x59\xbb\x76\x2d\x46\xa3\x7b\xed\x00\x6a\x3a\xc7\x4e\
-\x66\x52\xb9\x4a\x79\xb7\x36\x96\x30\x99\x4c\x44\x46\x46\x52\xbd\
-\x7a\x75\x36\x6f\xde\xcc\xf9\xf3\xe7\x8b\x3d\x10\x68\x30\x18\xe8\
-\xd3\xa7\x0f\x15\x2b\x56\x2c\x91\xe7\x89\x27\x28\xa9\x41\xc4\x7f\
-\xf0\x0a\x29\xfd\x43\xd2\x12\x04\x0a\xf1\xff\x4e\xc2\x5f\x9b\x79\
-\x6d\x48\x2f\x2e\xb4\x9e\xca\xaa\xa9\x43\x89\x0c\x52\x78\x7e\xd0\
-\x60\xca\x3e\x3a\x99\x75\x1f\x0d\xe5\xd0\x9a\xf9\x3c\xb7\xdc\x97\
-\x5f\xeb\xc6\xe5\x05\x81\xf6\x6c\x36\x7f\x37\x9e\x5e\xcf\xec\x64\
-\xea\x8a\x85\x3c\xd5\xa1\x2e\xfb\xbf\x7a\x95\x27\x16\x07\xb0\xee\
-\x9e\xb6\x04\xe7\xdb\x53\x68\xe7\xac\x11\x3c\x38\xfa\x23\x12\xec\
-\x7e\xe8\xd5\x69\xfc\x7e\x60\x32\xef\x8f\x7d\x84\xa4\x3f\xbe\xa7\
-\x77\x9f\x7e\x1c\xb6\x85\xe0\xaf\xe5\xb2\xfc\x8f\xfd\x7c\x38\xe9\
-\x65\xaa\x05\xe7\x8b\x3f\x2c\xc9\xcc\x7c\xa6\x2b\x63\x16\xef\xc1\
-\xee\xb0\xf3\xd1\xe7\x8b\x78\x6f\xe9\x4a\xba\x05\x1d\xe0\xf5\x61\
-\x2f\xd2\x77\xc9\xbd\x54\x2f\x93\xc9\xa2\x0f\x5e\xe3\xb3\xd4\x2e\
-\x74\xab\xb6\x95\xaf\xe6\xae\x47\xd3\xa9\xa8\xe8\xb0\x2b\xde\xbc\
-\xf4\x69\x1d\xe2\xa3\x82\x30\x78\x70\xdb\xec\x5c\x5e\x75\xe2\xc4\
-\x09\x3e\xfa\xe8\x23\x22\x23\x8c\x95\x93\x5b\x00\x00\x20\x00\x49\
-\x44\x41\x54\x23\xa9\x5c\xb9\x72\xb1\x82\xa4\x1f\x7f\xfc\x91\x4a\
-\x95\x2a\x5d\xf5\x37\x8a\xd6\x71\xdb\xc5\xd3\xdd\x5e\x21\xa7\x4a\
-\x1c\xad\x06\xbc\x48\xbf\x46\x45\xdf\x95\xcc\x79\xe6\xda\x89\x13\
-\x27\xf8\xf0\xc3\x0f\xe9\xd2\xa5\x8b\xdb\x9d\x2d\x45\x51\xc8\xcd\
-\xcd\x65\xf9\xf2\xe5\x3c\xf5\xd4\x53\x85\x3a\x5e\xe2\x7a\xce\xfe\
-\xb9\x8a\x99\x53\xdf\x67\xb3\xda\x96\x8f\x3f\x18\x42\x25\x7f\x1f\
-\xb7\xae\x47\x55\x55\xf6\xef\xdf\xcf\x67\x9f\x7d\x46\xeb\xd6\xad\
-\x09\x09\x09\x71\x3b\x10\xcc\xc8\xc8\x60\xde\xbc\x79\x54\xaf\x5e\
-\xdd\x55\x66\xee\xa4\xef\xcc\x8f\x6f\xf2\xf2\x82\x33\xa8\xba\x08\
-\xc6\xce\x1a\x4b\x55\x37\xf3\xda\x6e\xb7\xf3\xd3\x4f\x3f\xf1\xc9\
-\x27\x9f\xd0\xa7\x4f\x1f\x2c\x16\x8b\x5b\xd7\xa3\x28\x0a\xfb\xf6\
-\xed\xe3\xc0\x81\x03\x8c\x1b\x37\xce\xfd\x40\xd9\x61\x61\xc7\x4f\
-\x33\x99\xf6\xe9\x6f\xe4\xe8\x2b\x30\xec\xdd\xd7\x68\x1a\x15\x52\
-\xa4\x6e\x97\xf3\x3e\xb0\x58\x2c\x2c\x5f\xbe\x9c\xf9\xf3\xe7\xd3\
-\xa1\x43\x07\xbc\xbc\xbc\xdc\xba\x2e\xbd\x5e\xcf\xde\xbd\x7b\x39\
-\x7d\xfa\x34\x2d\x5a\xb4\x28\x56\x3b\xf0\xdd\x47\x93\x58\xb7\xf7\
-\x10\x15\xfb\x7f\xcc\x88\xdb\xdc\xab\x8f\x8a\xa2\x90\x9a\x9a\xca\
-\xd2\xa5\x4b\x39\x7e\xfc\x38\xad\x5a\xb5\xba\xe9\x11\x03\xd7\x1d\
-\xff\xb1\xd9\xd8\xb0\x61\x03\x87\x0f\x1f\xa6\x4f\x9f\x3e\xae\xbf\
-\x51\xe4\x18\xc9\x96\xc1\x92\xe9\x6f\xb1\x6c\xf7\x25\x9a\xb4\xea\
-\xc6\x80\x07\x3b\x10\x60\x28\x7a\xda\x20\x6f\x59\xe8\xd4\xa9\x53\
-\x29\x57\xae\x9c\x6b\xb6\xd3\x9d\x6b\x32\x18\x0c\x7c\xf1\xc5\x17\
-\x54\xa8\x50\x81\xf7\xdf\x7f\xdf\xed\xb4\x91\xbe\x89\xf7\x26\x7d\
-\xc3\xa9\xf4\x74\x02\xea\x3c\xc8\x1b\x83\xdb\xb8\x55\x6e\x3a\x9d\
-\x8e\xc3\x87\x0f\xf3\xc1\x07\x1f\x50\xb5\x6a\x55\xa2\xa3\xa3\xdd\
-\x6e\xdb\x72\x73\x73\x59\xb1\x62\x05\x21\x21\x21\xff\xfa\xfb\xed\
-\x25\x2d\x71\xc3\x0c\x46\x7f\x7e\x8c\xde\x2f\x8e\xe7\x9e\x18\x23\
-\x3f\x7f\xfe\x09\xcb\x76\x5d\xe0\xd9\xf1\x2f\x11\xad\xcf\x60\xdd\
-\xd7\x53\x39\x14\xd0\x8e\xc7\xee\x75\xce\xe0\x5e\x60\xc6\xd0\xe7\
-\x38\x16\xdb\x95\x09\xc3\x7b\xa0\xbb\x78\x88\x77\x27\xcf\x20\xe2\
-\xfe\xd7\x79\xa8\x61\x70\xfe\xa7\x24\x07\xd7\x2f\xe2\xed\x29\xf3\
-\x38\x7e\xc9\x46\xd3\x1e\x4f\xf2\xfc\xe3\xf7\x12\x6c\x80\x23\x9b\
-\x56\xf0\xee\xfb\x1f\x72\xe0\x5c\x36\x35\xef\xea\xcb\xab\x2f\x3d\
-\x4a\x84\xfe\xef\xa1\x5e\x32\x8b\xde\x9f\xcc\xa7\x4b\x7f\xc7\x58\
-\x21\x9e\x47\x9f\x19\xc5\x7d\x4d\xab\xb0\xfa\x7f\xc3\x58\x63\xee\
-\xc8\x5b\x8f\xdd\x43\x66\xc2\x3e\x3e\xfb\x7c\x25\xde\xf1\x55\x38\
-\xfd\xcb\x4f\x9c\xc9\x70\xe0\xeb\x6d\xc0\x92\x95\x89\x39\xaa\x21\
-\x8f\x0f\x7b\x96\x3a\xe1\xd2\xff\x94\x20\x50\x88\x5b\xca\xca\x99\
-\xd3\x3b\x38\x74\x16\x92\xd6\xfe\xcc\x89\x4b\x7d\x88\x0c\x0a\x21\
-\xdb\x66\x61\xfb\xcf\x73\xf9\x21\x61\x28\x21\x58\xc9\xca\xd1\xbb\
-\x0e\x17\xb6\x66\xe5\xb0\xe3\xfb\xe5\x40\x0e\x3f\xef\x38\xc6\x43\
-\x1d\xea\xe2\xb0\x66\x93\x96\x65\xa4\xc0\xf8\x65\xea\x6a\x9e\x78\
-\xf5\x23\x02\xda\xbf\xca\xa2\xd7\x1e\xe0\xe0\xf7\x1f\xf2\xe4\xe4\
-\x0f\x58\x77\x6f\x47\x32\x56\x7e\x41\x56\xeb\xf1\xfc\x39\xae\x1b\
-\x49\x5b\xe7\xd2\xad\xf7\x1b\xcc\x68\x72\x3b\x93\x07\xb5\x72\xdd\
-\x88\xa9\x1b\xff\xc7\x2b\x8b\x8e\x33\xf4\xbd\x25\x0c\xbe\xb3\x0c\
-\x6f\xf6\x6f\xcf\x90\x67\x3f\xa3\xc3\x82\xa6\xe4\x66\x66\x61\x53\
-\xf3\x9a\x64\xab\x25\x8b\x4b\xe9\x36\xee\x7a\x7c\x32\xfd\x1e\x38\
-\xcd\xc2\x71\x83\xd8\x1e\xd4\x9b\x37\x9e\xed\x41\xe5\x98\xca\xe8\
-\x3d\xfc\x55\x49\xe7\x66\x0b\xce\x4d\x5c\x5e\x79\xe5\x15\xda\xb4\
-\x69\xe3\xf6\xe7\x65\x64\x64\x30\x70\xe0\x40\xd7\xb2\x22\x45\x51\
-\xdc\x0a\xbc\x92\x3e\x1d\xc9\xa6\x9a\x13\x98\x79\xef\x1e\xa6\x7f\
-\xbe\x8c\xfb\x1b\x3d\x4a\x51\xe7\x38\x9c\x33\x40\xce\xce\xf7\xc7\
-\x1f\x7f\x8c\x9f\x9f\x9f\x5b\x23\xdd\x3a\x9d\x8e\x9c\x9c\x1c\x6a\
-\xd7\xae\xed\xfa\x3c\xb7\x3a\x4a\xea\x45\x36\x6f\x59\x4b\x70\xc3\
-\xe1\xf4\xd8\xf4\x21\x73\xf6\xf6\xe1\xb5\x66\x3e\x6e\x5d\x8f\x33\
-\x10\xac\x51\xa3\x06\xff\xfb\xdf\xff\x88\x8e\x8e\x76\x7b\x14\xff\
-\xdc\xb9\x73\xb4\x6e\xdd\x1a\x9d\x4e\x87\xa6\x69\x6e\x6e\xe6\x63\
-\xe1\xb3\x09\x3f\xd2\x69\xde\x37\x84\x7d\xd0\x87\xf1\x8b\x9e\xe3\
-\xd3\x9e\xfe\x45\xfa\x04\x1f\x1f\x9f\x02\xf9\x1b\x13\x13\xc3\xac\
-\x59\xb3\xdc\x9e\xc5\x35\x1a\x8d\x2c\x58\xb0\x80\xa7\x9e\x7a\xea\
-\xaa\x3a\x5f\xa4\xce\x6d\x46\x2a\x7b\xd6\x6f\xa4\xfd\xf0\x67\x89\
-\xfc\x6d\x34\xeb\x7e\x3f\x46\xc3\x0a\x65\x30\xea\x95\x22\x5d\x4b\
-\xfe\xba\xd9\xaa\x55\x2b\x16\x2c\x58\xe0\x76\x67\xd9\xcb\xcb\x8b\
-\x8f\x3e\xfa\x88\xb1\x63\xc7\xba\x06\x3c\xdc\x9a\xe5\xcc\xfa\x8b\
-\x5f\xff\xca\xe5\xf9\x97\xc7\xd1\xb9\xe7\xfb\x8c\xd8\x38\xda\xad\
-\x7c\xce\x3f\x38\xd1\xaf\x5f\x3f\xc6\x8c\x19\xe3\x76\xd0\x6d\xb5\
-\x5a\x79\xe9\xa5\x97\x38\x7a\xf4\xa8\xeb\x3e\x73\x67\x96\x33\xe7\
-\xd2\x05\xb6\x9c\x70\xf0\xe2\x73\x7d\xf8\xe9\x87\x2d\x9c\x38\xdd\
-\x9c\x3a\x55\x02\xdd\x4e\x9b\x9f\x9f\x1f\xed\xdb\xb7\xe7\xe3\x8f\
-\x3f\x26\x23\x23\xc3\xad\xb4\x05\x04\x04\x50\xad\x5a\x35\x57\xfb\
-\x04\xb8\x51\x6e\x1a\x7b\x3f\xfd\x98\x03\x5e\xf5\x78\xf9\xf9\xd6\
-\xbc\x35\x66\x26\x97\x06\xb4\x21\xb8\x88\x4d\xad\xf3\x3e\xd7\xe9\
-\x74\x98\x4c\x26\xc6\x8c\x19\x43\xeb\xd6\xad\xdd\x0e\x02\xcf\x9f\
-\x3f\xff\x9f\xd9\xe1\xfa\xe7\xa9\x2f\xf0\xf9\x42\x33\xba\xda\x3d\
-\xb9\x67\x58\x53\x76\xfd\xfa\x2b\x1f\x7f\xfe\x2d\x61\x2d\xef\x67\
-\x4c\x87\x32\xec\xff\x75\x09\xbf\x46\x54\x66\xf0\xbd\x8d\xf3\x06\
-\x83\x4e\x2e\xe1\x85\x19\x73\x31\xc7\x27\x73\xff\x90\x1e\x34\xce\
-\x48\x60\xd9\x57\xb3\x88\x6b\xf0\x5c\x81\x20\xf0\xf4\x86\x45\x0c\
-\x19\xf0\x08\x7f\x05\xb5\xa6\x43\xd4\x59\x26\x0c\x7f\x94\x24\xdb\
-\x02\x3e\x1d\xde\x9a\xe9\xb3\x3f\xe2\xeb\xdd\x69\xf4\x6e\x16\xca\
-\xd7\x63\x9f\x64\x6f\x7a\x59\x7e\x7d\xa7\xd3\x95\xa0\x1d\xf8\x7e\
-\xd4\x00\x1e\x9e\xb2\x82\xb8\x96\x3d\xf1\xdb\xbb\x88\x87\x9e\x48\
-\x66\xe3\x2f\x9f\xb3\xe7\x87\xaf\xf8\x32\xb0\x02\x6f\x3e\x76\x0f\
-\x39\x29\x67\xf8\x7e\xf1\x52\x02\x6d\xf7\xc2\xe1\x23\x9c\x39\xb1\
-\x9f\x6d\x87\x2f\x11\x55\x35\x96\x68\x5b\x38\xe9\xb9\x08\x09\x02\
-\x85\xb8\xb5\x34\x4b\x16\x47\x77\x6c\x23\xba\x6e\x43\xc2\x52\x76\
-\xb2\xe5\xf0\x25\x5a\x54\x09\xc1\x00\xf8\x2a\x39\x7c\x3d\x67\x25\
-\x4f\x56\x32\xa3\xd7\x5d\xe9\x48\x64\x65\xef\x66\xdb\x1e\x85\x86\
-\x8d\x6a\xb2\x73\xfd\x66\x2e\x0d\xeb\x86\xa2\xe8\x50\x74\x4a\x81\
-\x07\x64\xd2\xcf\x5f\x72\xe0\x92\x0f\xef\x0d\x1d\x49\xcd\x68\x13\
-\x15\xee\xeb\x49\xb3\xd9\x2b\x59\xbb\x6b\x1b\x96\x3d\x36\xde\x9a\
-\xd0\x97\xb8\xaa\xe5\xa8\x16\xf9\x02\x1b\x36\xb7\xc5\x11\x1e\x97\
-\x6f\x54\xff\x1c\x7f\x2c\xfa\x12\xef\xd8\x56\xf4\xe9\x71\x0f\x95\
-\x83\xe1\xb1\xc7\x1f\xe0\xf3\x81\x5f\xf1\x53\x56\x1b\x7c\x0d\x57\
-\x9a\x64\x45\xd1\x01\x3a\x22\xaa\x54\xa7\x69\x74\x30\xdb\xc3\xfd\
-\x38\x11\x16\xc3\xed\x4d\x1b\xe3\x49\x47\x8b\x0f\x1b\x36\x8c\x0f\
-\x3e\xf8\xe0\xaa\xce\xbd\x33\x88\x70\x76\x04\x7c\x7c\x7c\x8a\xbd\
-\x7b\xa2\x73\x66\xc3\xdb\xdb\x9b\x35\x6b\xd6\x14\xfa\xdc\x43\xbb\
-\xdd\x4e\xdf\xbe\x7d\x99\x39\x7b\x1e\x7b\x36\xed\xa7\x7a\x9f\xc6\
-\x44\x05\xa5\xe0\x9d\xfc\x1b\xd9\xc0\x90\x01\x03\x98\xf7\xd5\x57\
-\x85\xee\x58\xda\xed\x76\xee\xbf\xff\x7e\xd7\xf7\x66\xb3\xb9\x58\
-\xef\x26\x1a\x0c\x86\x02\xb3\x9a\xab\x57\xaf\x2e\x74\x40\xa1\xaa\
-\x2a\x77\xde\xd9\x92\xb5\x6b\x17\x91\x99\x9c\x86\xd6\xe0\x36\x5a\
-\xa5\x4f\xe6\xe5\x83\x0e\x68\x06\xcf\x3c\xf3\x0c\x53\xa7\x4e\x2d\
-\x74\xf0\xe5\x70\x38\x68\xd4\xa8\x91\x2b\x60\xf3\xf7\xf7\x2f\x56\
-\xda\x9c\xef\xa7\x69\x9a\x46\x50\x50\x10\x03\x06\x0c\x60\xe0\xc0\
-\x81\x85\xce\xe7\x71\xe3\x26\xf3\xd2\x4b\xf7\xb0\xef\x4c\x24\xbd\
-\x2a\x56\x20\xa0\x61\x14\xa7\xfe\xfc\x0b\x7a\x36\xa6\x47\x8f\x1e\
-\x2c\x59\xb2\xa4\xd0\x69\xb3\xdb\xed\x74\xef\xde\xdd\x15\x2c\x99\
-\x4c\xa6\x62\xed\x9e\xe8\xed\xed\x5d\x20\x48\x1a\x34\x68\x10\x8f\
-\x3f\xfe\x78\xa1\xaf\x65\xd1\xa2\xc5\x74\x6e\x73\x3b\x49\xe7\x53\
-\x69\xdb\xa4\x2e\xd1\xb9\x35\x58\xb9\xff\x22\x46\xbd\x42\x78\x78\
-\x38\xc9\xc9\xc9\x85\x9e\xed\xce\xff\xce\x95\xc1\x60\xc0\xdb\xdb\
-\xbb\x58\xe7\x82\x1a\x8d\x46\xd7\x06\x23\x00\x77\xdf\x7d\x77\xa1\
-\xf2\x59\xd3\x34\xca\x97\x2f\xcf\xac\xd9\x5f\x70\x57\x13\x15\xcd\
-\x14\x4e\xd9\x72\x51\x44\x1c\xdf\x4a\x22\x90\xf1\xd7\x5f\x3c\xd8\
-\xbf\x3f\xdb\xb6\x6d\x2b\xf4\xe7\x39\x67\x95\x54\x55\xc5\x64\x32\
-\xe1\xef\xef\xef\x76\xba\x72\x73\x73\x0b\x94\xb9\xc9\x64\x2a\x74\
-\xbb\x64\xb7\xdb\x89\x8e\x8e\xe6\x8f\x3f\xfe\xc0\x60\xb1\x61\x37\
-\x05\x12\x13\x13\xcb\x7a\xd3\x36\xac\xb9\x39\xa4\xa6\x41\x58\x11\
-\xde\x2d\x74\x38\x1c\x05\xee\x73\xa3\xd1\xe8\xda\xd5\xd3\x5d\xce\
-\xfa\x62\x30\x18\x38\x7e\xfc\x38\xd5\xab\x57\x2f\x54\xe0\xa5\x69\
-\x1a\xf1\xf1\x35\xd9\xbd\x7b\x1b\xfb\x0e\xe4\x10\xde\x30\x9c\xc8\
-\xc8\x2a\x98\x75\x16\xac\x16\x95\x9f\xd7\xad\xa2\x6b\xd7\x7b\x0b\
-\x3d\x03\xeb\x70\x38\x5c\xbb\x67\x3a\xdf\xc1\x0c\x08\x08\x70\x3b\
-\x08\xcc\xca\xca\x72\xd5\x45\x83\xc1\xc0\xf9\xf3\xe7\xaf\x6a\x23\
-\xed\x76\x3b\x31\x31\x31\x6c\xdc\xb8\x91\xf0\x70\x4f\x9d\x8e\xda\
-\xcd\xbc\xa5\x99\x98\xfc\xfd\x38\xb8\x79\x35\x99\x34\x45\x87\x82\
-\x42\x16\xf3\x3e\x5f\xc0\x8b\x9d\x86\x5d\xce\xb3\x7c\xbf\xf1\xe5\
-\x02\x32\x09\xc2\xcf\x72\x8c\x5f\x7e\xcf\xe1\xb6\x58\x1d\x9a\x4a\
-\xc1\x55\x9a\xf6\x8b\xfc\xb2\x62\x1e\x7f\x38\xda\xb1\x76\xe1\x2c\
-\x6e\x8b\x09\xe5\xfe\x67\x6b\xd2\x7f\xe6\x17\x8c\xea\xea\x47\x46\
-\xb6\x2f\xb3\x3e\x9f\xc2\x7d\x4d\xaa\xd0\xb1\x6a\x77\xfa\xbe\xfb\
-\x36\xbf\xbd\xd3\x89\x3b\x9c\xbf\x7f\x69\x0d\x63\xbf\xf8\x89\x0a\
-\x9d\x3e\x64\xdb\x92\xc7\x49\xdf\xbb\x9c\x5e\xdd\x86\xf2\xe3\xf6\
-\xbd\xa0\xa9\x68\xe4\xcd\x16\x02\xa8\xf6\x2c\x94\x88\xd6\xcc\x5c\
-\x39\x8a\xd0\xdf\x9e\x43\x69\x3d\x9f\x71\x5f\x6f\xa6\x6f\x03\x5f\
-\xe4\x35\x4d\x09\x02\x85\xb8\xe5\x2c\x59\x19\x6c\x5b\xff\x27\x2d\
-\x7b\x0f\xe7\xf8\x77\xd3\xd9\xba\x65\x3f\xdc\x1d\x83\x82\x8e\xfb\
-\x3a\xde\xc9\xae\x95\x9f\xb3\xba\x4d\x24\x26\x83\x01\x14\x1d\x38\
-\x4e\x91\xbe\x75\x1e\x7f\xfa\x35\x60\x78\xf7\xe6\x4c\x9b\xf2\x2b\
-\x47\x52\xb2\xaf\xf1\xce\x5d\x36\x67\x4f\x9f\xc2\x6e\x2c\x4b\xa5\
-\xca\x79\x1d\x09\x1f\xdf\x10\xca\x85\xfb\x90\x70\xf2\x04\x16\xcd\
-\x97\x7a\xfe\xbe\xd8\x32\x2f\xf2\xdd\x82\x2f\x48\xa2\x0c\x75\x9a\
-\x54\xc0\xa1\x85\x93\x37\xb0\x9f\xcc\xc9\x93\x49\x04\x84\x95\x27\
-\xe4\xf2\x00\x5e\x85\xa8\x18\xcc\xca\x12\x8e\x9d\x54\xf1\x2a\x85\
-\x77\x6b\xfb\xf6\xed\xf1\xf2\xf2\x2a\xd0\xe1\xd4\xe9\x74\x9c\x3c\
-\x79\x92\x3f\xfe\xf8\xe3\xca\x48\x63\x31\xdf\x7b\xc8\xbf\x8c\xd0\
-\x6e\xb7\x13\x19\x19\x49\xdf\xbe\x7d\x0b\xd5\x91\xcc\xcd\xcd\xa5\
-\x71\xe3\xc6\x98\xbc\x20\xc0\xcf\x44\x46\x3a\x68\x8a\x1d\xbb\xce\
-\x1b\x05\xb8\xaf\x5b\x37\x2a\x44\x45\x15\x2a\x08\xd4\xe9\x74\x2c\
-\x5b\xb6\xac\xc0\x26\x0e\xc5\xdd\x59\x30\x7f\xde\x68\x9a\x46\xb9\
-\x72\xe5\x18\x3c\x78\x70\xa1\x36\x8a\x50\x55\x95\xb8\xb8\x38\x50\
-\xed\xe8\x0c\x7a\xf4\x56\x0b\x59\x59\x3a\xcc\x7e\x8a\xab\x7c\x0a\
-\x1b\xec\xe8\x74\x3a\xbe\xf9\xe6\x9b\x02\x7f\xb7\x24\xca\x2d\x7f\
-\x39\xb4\x6f\xdf\x9e\x86\x0d\x1b\x16\x6e\x30\x47\xd3\xb8\xe3\x8e\
-\x3b\x00\x33\xbe\x86\x2c\x2c\x80\x5f\x56\x36\x3a\x73\x5e\x10\xd0\
-\xb5\x6b\x57\x62\x63\x63\x6f\x5a\x07\x14\x45\x21\x33\x33\x93\x2f\
-\xbf\xfc\xb2\x44\x37\xdf\x70\xe6\x8d\xa2\x28\x58\xad\x56\xee\xb9\
-\xe7\x1e\x9a\x37\x6f\x5e\xe8\xd9\xc5\xf8\xf8\x78\x34\x4d\xc5\x64\
-\x34\x60\xcb\xb5\xa2\xe6\x64\xa2\x33\x9a\x70\x68\x30\x6a\xd4\x28\
-\x92\x93\x93\x6f\xfa\xbe\x9a\x5e\xaf\x27\x25\x25\x85\xe9\xd3\xa7\
-\x97\x58\x99\xe5\x2f\x37\x4d\xd3\xd0\x34\x8d\xfb\xef\xbf\x9f\x1a\
-\x35\x6a\xdc\x34\xff\x34\x4d\x23\x30\x30\x90\xe8\xe8\x68\x34\xf5\
-\x24\x9a\x66\x43\x07\x64\xeb\xfd\xf0\x06\x4c\x61\x61\x0c\x18\x30\
-\x80\xb6\x6d\xdb\x16\xea\xde\xbd\x70\xe1\x02\xb3\x66\xcd\x2a\xb1\
-\x1d\x19\xff\xbe\x1c\xd9\x6e\xb7\x33\x7c\xf8\x70\xcc\x66\xf3\x4d\
-\xd3\xe6\x70\x38\x88\x88\x88\xc0\x6c\x36\x63\xcb\xbd\x84\xa2\x81\
-\xaa\x5e\x5e\x99\x80\x0e\x1f\x1f\x6f\x86\x0d\x1b\x56\xa8\xe0\xdb\
-\xdb\xdb\x9b\x8d\x1b\x37\xb2\x6e\xdd\xba\x12\x2d\xb7\xfc\xed\x82\
-\x9f\x9f\x1f\x0f\x3e\xf8\x20\x11\x11\x11\x85\xaa\xf7\xe5\xca\x95\
-\x07\x14\xcc\x26\x07\x56\x87\x76\xb9\xf3\xaf\xa0\xe8\x74\xc4\xc6\
-\xc4\x30\x7a\xf4\x68\xac\x56\xeb\x4d\xaf\x53\xaf\xd7\xb3\x7b\xf7\
-\x6e\x0e\x1e\x3c\x78\xdd\x7c\x77\xe7\x5e\x73\xfe\xbe\xaa\xaa\xf8\
-\xfa\xfa\x32\x6a\xd4\xa8\x02\xf7\x5a\xfe\xf2\xf1\x58\x1b\xe6\xb3\
-\xc6\x51\x96\xa1\x7d\xbb\xf2\xdd\xa6\x4d\xfc\x79\x09\x74\xf6\x2c\
-\x82\xee\xe8\x4b\xe0\x8e\x2f\x58\x7a\xf4\x29\xcc\x05\x6e\xf9\x44\
-\xe6\x2f\xdd\x43\xd9\x26\x03\xe8\x1a\xf3\x3b\x9b\x7e\x5c\x0d\xf1\
-\xa1\x57\x2d\x17\x57\x33\x4e\x73\x78\xef\x56\x6a\x76\x7a\x9b\xa8\
-\xf2\x79\xff\x5e\x7f\xf0\x70\x02\x17\xbc\xcf\xb7\x5b\x8f\x11\x1a\
-\x14\x4e\xf5\xca\x15\x71\xe4\x66\xd3\xf6\xb9\xf9\x1c\x7b\x22\x1b\
-\x5f\x07\x38\x47\x94\x33\x0f\xac\xe2\x54\x92\x9d\xbe\xcf\xe4\x0d\
-\x62\x05\xd4\x6a\x44\x83\x86\x95\xd8\x79\xe2\x2c\xb5\x1d\xda\x35\
-\xee\x73\x5d\xde\xeb\x28\x9a\xf3\x7b\xe5\xf2\xe0\xb5\xf4\x3f\x25\
-\x08\x14\xe2\x16\xcb\x4a\x59\xc7\x9a\xed\x0e\x06\x3c\x1b\x4b\x85\
-\xf5\x7e\xfc\xb8\x7d\x0b\x0e\xba\xa2\xa0\xa3\x5a\x9b\xee\x98\x0f\
-\x0c\x63\xe9\xb2\x43\x64\x47\x76\x41\xd1\xe9\xb1\x1e\xd9\xc6\xda\
-\x59\x4b\x71\x84\x75\x24\x36\x3a\x12\x3f\x6d\x2f\x9b\x8f\x26\xd3\
-\xe4\x72\x03\x77\xa5\x5d\xd3\x61\x30\x18\x50\x34\x3b\x97\x9f\xfd\
-\x68\xa8\xd8\x1d\x2a\x06\xbd\x17\x06\xc0\xae\x28\x58\xd2\xcf\xf3\
-\xf1\x9b\x2f\xf1\xf3\x29\x0b\x7d\x5e\x9f\xcd\x87\xb5\xa3\xc9\x5b\
-\x4d\xa3\xc7\xcb\xa0\x47\xb5\x38\x5c\x4b\x4c\xed\x0e\x1b\xaa\x66\
-\xc0\x68\x20\xef\x81\xeb\xfc\x6b\xa5\xa4\x31\xed\xd0\xa1\x03\x1d\
-\x3a\x74\xb8\xea\xe7\x3b\x77\xee\x64\xed\xda\xb5\x68\x9a\x86\xc3\
-\xe1\xe0\xe4\xc9\x93\x6c\xdb\xb6\xcd\xed\x65\x85\xd9\xd9\xd9\xa4\
-\xa7\xa7\xa3\x28\x0a\x36\x9b\x8d\xb8\xb8\x38\x26\x4e\x9c\x58\xe4\
-\xcf\x69\xdc\xaf\x17\x87\x5e\x99\xc0\xaf\x03\x15\xa8\x73\x3b\x41\
-\x40\xd7\xfb\xee\xa3\x6b\x11\xb6\x1b\xb7\x58\x2c\x1c\x3b\x76\xcc\
-\xf5\xfd\xfe\xfd\xfb\x5d\x1d\x60\x77\x3a\x37\x9a\xa6\x61\xb1\x58\
-\x5c\xdf\xd7\xa9\x53\x87\xb1\x63\xc7\x16\xf1\x93\x72\x88\xac\x52\
-\x91\xd3\x9b\x3e\xe2\xfd\x2d\x15\xe8\xf4\x78\x5e\xd0\xd7\xb1\x63\
-\x47\x3a\x76\xec\x58\xe8\x4f\x39\x7c\xf8\x30\xfb\xf7\xef\x47\x51\
-\x14\xb2\xb3\xb3\xd9\xbd\x7b\x37\xc9\xc9\xc9\x6e\x97\x5b\x56\x56\
-\x96\xab\x03\x9a\x93\x93\x43\xff\xfe\xfd\x79\xf0\xc1\x07\x8b\xfc\
-\x39\x1d\x5b\x5e\x60\xf9\x77\xbf\xe1\xb5\xec\x34\xed\x27\xc6\x01\
-\x30\x60\xc0\x80\x42\xff\x7e\x5a\x5a\x1a\x3b\x77\xee\x74\xcd\x98\
-\xe5\xe6\xe6\xf2\xe7\x9f\x7f\xba\xbd\x64\xd2\x68\x34\x72\xfc\xf8\
-\x71\xd7\x59\x91\x36\x9b\x8d\xde\xbd\x7b\x17\xe9\x9a\x00\x1c\x59\
-\xc9\x54\x89\x8b\x62\xdd\xc7\xb3\xd9\xb4\x79\x17\xe5\x9f\xa8\x84\
-\xa6\xc1\x73\xcf\x3d\x57\xe8\xcf\x48\x4a\x4a\x62\xee\xdc\xb9\xae\
-\x3a\x98\x9a\x9a\xca\xbe\x7d\xfb\xc8\xca\xca\x72\x2b\x6d\x5e\x5e\
-\x5e\x24\x24\x24\xb8\x3a\xdc\x7a\xbd\x9e\x47\x1e\x79\xe4\x9a\xf7\
-\xf9\x8d\x13\x67\xc6\x27\xf7\x6b\xfe\xf8\x6d\x35\xe9\x5d\x7a\x13\
-\x04\x10\x12\x52\x60\x09\xed\xcd\x1c\x3f\x7e\x9c\xd9\xb3\x67\xbb\
-\x66\x04\x93\x92\x92\xd8\xba\x75\xab\xdb\xf7\x9a\xdd\x6e\xe7\xc2\
-\x85\x0b\xae\xbc\x72\x38\x1c\x4c\x9c\x38\xb1\xc8\xcb\x94\xad\x36\
-\x5f\xfc\x72\x13\xf8\xee\xfb\x95\xa4\x66\x6a\x04\x86\x04\x63\x32\
-\x7a\x31\x79\xf2\xe4\x42\x7f\xc6\xc7\x1f\x7f\xcc\x86\x0d\x1b\x5c\
-\xf9\x7c\xfe\xfc\xf9\x62\x95\x9b\xd9\x6c\x26\x27\x27\x07\x6f\x6f\
-\x6f\x54\x55\xa5\x6c\xd9\xb2\x8c\x1c\x39\x92\x6a\xd5\xaa\x15\xe9\
-\x73\x5a\x75\x89\xe5\xcb\xef\xfe\x62\xdd\x46\x3d\x29\x4a\x39\xcc\
-\x7e\x10\xee\x17\xcd\xeb\xaf\xbf\x5e\xe8\xcf\x58\xb6\x6c\x19\x23\
-\x46\x8c\x28\x50\x8e\x5b\xb6\x6c\x71\x3b\x00\xbc\x78\xf1\xa2\x2b\
-\x5f\x54\x55\x25\x30\x30\x90\x57\x5f\x7d\xb5\xd4\xf5\x4d\xbe\x9f\
-\xf7\x03\x86\xa8\x46\xdc\x3f\xa0\x33\x2b\x16\x8f\xe4\xe0\x9e\x44\
-\x34\xc5\x8e\x77\x48\x33\x9e\xa8\xfb\x17\xaf\xbf\xf9\x2d\xaf\x45\
-\x9a\x51\x9c\x5d\x80\xc3\x73\xf9\xe1\x60\x32\x8d\xde\x7a\x8c\xce\
-\xc9\xc7\x78\xfe\x8f\x35\xec\xcf\xe9\x8b\xd7\xdf\xc6\x1d\xed\xb9\
-\x39\xa4\xa7\xd9\x08\xad\x67\xc2\xb9\x3a\x5c\x31\x44\x12\x48\x06\
-\x09\x09\x29\xf8\x79\xf9\x12\x18\x6c\x60\xf5\x1b\x9d\x19\xb1\x2c\
-\x89\x90\xf0\x8a\xbc\x34\x6f\x19\x1d\x22\xf2\xfe\xdf\x8c\xe4\x14\
-\x72\x55\x6f\xa2\x5c\x27\xdc\xf8\x11\xe0\xed\x43\x66\x4a\x0e\x8e\
-\x6b\xde\x6a\x05\x7f\x28\xb1\x9f\x04\x81\x42\x78\x8c\xc4\x9f\x16\
-\x70\x20\x3b\x81\x09\x83\x06\xa1\xcb\xbe\xc0\xa5\x88\x4a\xa4\x5c\
-\xee\xc3\xfa\x86\xd4\xe0\xfe\xfb\x9b\x31\xe7\x89\x4f\x48\xf5\xeb\
-\x84\x5e\xaf\x63\xff\xd6\x4d\xcc\xfe\x31\x8d\x04\x65\x25\x83\x9e\
-\xfa\x89\x0b\x17\x32\xd9\xbd\xfd\x00\x75\xaf\xea\xf7\xfa\x10\x5b\
-\xb3\x26\x7a\xeb\x6f\x6c\xdd\x79\x8e\x7b\xca\x97\x23\xf7\xd2\x29\
-\x0e\x9c\xcc\xe6\xce\x98\x58\xb2\x0e\x2c\x63\xd5\x81\x44\x46\xb6\
-\xad\xc9\xec\x15\x4b\x19\xda\xb3\x0f\x0e\x55\x97\xaf\x81\x8c\xa0\
-\x66\xdd\xaa\x24\x7e\x7d\x90\xd3\x89\x50\x21\x02\xf6\xed\xd8\x4a\
-\x96\xa9\x06\xf5\xab\x98\x58\x6a\xcb\x25\x3d\xdd\x72\x39\xd0\xc8\
-\x45\x33\xf9\xe0\x65\x04\xec\xa5\xaf\x0c\x32\x33\x33\x81\xbc\x11\
-\x6f\x3f\x3f\x3f\x46\x8c\x18\x51\xec\xf3\xaa\xf4\x7a\x3d\x0f\x3d\
-\xf4\x10\x47\x8e\x1c\xc1\x6e\xb7\x93\x95\x95\x55\xf4\x51\xdf\xdb\
-\x26\xf2\x56\xfd\xfb\x59\xb8\xb6\x0e\xaf\x4c\x6e\xed\xd6\x75\x58\
-\x2c\x16\x34\x4d\xc3\x68\x34\x12\x1a\x1a\x4a\xdb\xb6\x6d\x8b\x35\
-\xca\xed\x70\x38\x5c\xcb\xd4\x34\x4d\x73\xf3\x10\x7a\x1f\x9a\xdf\
-\xd9\x85\x1d\xbf\xbf\x02\xed\x07\xd0\x35\xb4\x8c\x5b\xd7\xe2\xfc\
-\xdb\x41\x41\x41\x24\x25\x25\xd1\xbf\x7f\xff\x62\xa5\x4d\x55\x55\
-\xca\x95\x2b\xe7\x2a\xa7\xec\xec\x6c\xb7\x76\xc4\x7b\xe0\xad\x77\
-\x18\x3a\x64\x32\x6a\x8b\x49\x7c\x18\xef\x5e\x30\xea\x4c\x5b\x58\
-\x58\x18\xd9\xd9\xd9\xb4\x6c\xd9\xd2\xed\x74\x39\x83\x10\x5f\x5f\
-\xdf\x02\x1b\xb3\x14\xb9\x4e\x9b\x83\xa9\xdd\xa6\x2b\x2b\x27\xce\
-\x25\x3d\x76\x2c\xef\x34\xae\x80\x41\x57\xf4\x7b\xcd\x99\xa7\x61\
-\x61\x61\x6c\xdb\xb6\x8d\xc6\x8d\x1b\xbb\x96\x74\xba\x43\xa7\xd3\
-\x51\xa1\x42\x05\xd7\xfb\x65\x6e\xbd\x3b\xa9\x0f\xe6\xd1\xfb\x9a\
-\xf0\xca\xe4\xf7\x99\xbb\xf4\x7b\xdc\xd9\x69\x30\x27\x27\xc7\xb5\
-\x2c\x35\x3a\x3a\x9a\xaf\xbf\xfe\x9a\x85\x0b\x17\xba\x9d\x2e\x55\
-\x55\xb1\xdb\xed\x74\xeb\xd6\xcd\x55\x6e\xe9\xe9\xe9\x94\x29\x53\
-\xb4\xfb\xc5\x2b\x20\x82\x6e\x6d\xe3\x79\xf3\x8b\xad\xf4\x7a\xea\
-\x39\xaa\x86\xb9\xf1\x3e\x68\x6e\x6e\x81\x72\x5b\xbd\x7a\x35\x3f\
-\xff\xfc\xb3\xdb\x75\xd2\x66\xb3\x61\x36\x9b\xa9\x58\xb1\x22\xaa\
-\xaa\xe2\x70\x38\xdc\x3a\x52\xc3\xef\x9e\x97\x79\xf4\xf4\xbb\x7c\
-\x32\xe3\x5b\xee\x7b\xe6\x3d\xdc\x99\x57\xcb\xce\xce\x06\xf2\x96\
-\xdb\x96\x2f\x5f\x9e\x67\x9e\x79\xc6\xfd\x9d\x4a\xf3\xd5\xc9\xf0\
-\xf0\xf0\x5b\x76\xf6\x6d\xf1\x9d\xe4\xab\x5f\x13\xd0\xdb\xcb\xb1\
-\x76\xe3\x3a\xac\xc9\x09\x1c\x3e\xb6\x1f\x5f\x4d\x8f\x0d\x23\xdd\
-\x1e\x7f\x82\x57\x1b\x8d\x65\x4e\xe7\xca\x54\xac\x93\xd7\x75\xdf\
-\x3a\x6b\x29\x67\xd3\xa1\xdc\xf1\xf5\xac\x3b\x7e\x86\x84\x93\x76\
-\xf6\xed\x4b\x45\xef\xa5\x43\x97\x6f\x63\x00\xa3\xb7\x1f\xfe\x01\
-\x26\x92\x2f\xe6\xe4\x0d\x50\x1b\x40\x67\x3d\x4b\x9a\xe6\x47\xb9\
-\xb0\x00\xd2\x4e\x1e\xc7\x66\x83\x80\x72\x31\x54\x0e\x38\xcb\x9a\
-\xcd\x7f\x70\x3e\x5f\x73\xe5\x1f\x5c\x06\x2f\xbd\x85\xb3\x67\x81\
-\x18\x40\xcb\x26\x33\x27\x1b\xbf\x00\x5f\xf4\x3a\x50\x15\x05\x3d\
-\xa0\x28\x3a\x74\x70\x65\xb0\x5a\x48\x10\x28\x84\x67\x49\x67\xc9\
-\x57\x9b\x89\xa8\xdb\x9d\xb1\xaf\x0d\xc2\x2f\xe1\x07\x86\x8e\x5e\
-\xce\x86\x8b\x36\x0c\xa8\xd8\x75\xde\x34\x68\xd7\x93\xe6\xb1\x9f\
-\xf0\x7d\x8e\x0d\xbd\xc1\xce\x96\x8d\xbf\xf1\xbb\xcd\x97\x9e\x2f\
-\xcd\xe0\xd1\x66\x7a\x7e\x78\xff\x0d\xd6\x6c\xfd\x9d\x94\x00\x07\
-\x6a\xca\x31\xde\x79\xe1\x65\x22\x94\x74\x74\xe5\xea\x31\xea\x91\
-\x87\xe8\x19\x3b\x8d\x29\xa3\x06\xe1\x75\xa8\x0d\x27\x7f\x5b\xc2\
-\x5f\xc6\x28\xde\x6c\xde\x94\xe3\xc7\x2a\xf3\xfc\xc8\x91\xe4\xf4\
-\x6b\x45\xf6\xc9\x0d\xfc\xfc\x57\x16\x0f\x18\x95\x7c\x63\x66\xc1\
-\xd4\xba\x7f\x24\x95\xde\xed\xcf\x4b\x23\x46\x70\x5f\x3d\x6f\x3e\
-\x9b\xbc\x84\x5a\x83\xbe\xe1\xce\xe0\x00\x42\xfd\x33\xf8\x7a\xd2\
-\x48\x42\x36\xf9\xb0\x7c\xc3\x11\xe2\x9f\xbf\x9d\x18\x13\x68\x36\
-\xf2\x5e\x12\x28\x65\xeb\xed\x1d\x0e\x07\x95\x2a\x55\xe2\x7f\xff\
-\xfb\x1f\x19\x19\x19\xc5\x5e\xee\xa4\x28\x0a\x8d\x1a\x35\xe2\x97\
-\x5f\x7e\x71\xbf\xf3\x0e\xf4\x78\x7b\x21\x3d\xf2\x7d\xef\xce\x55\
-\xd9\x6c\x36\xa2\xa2\xa2\x98\x3d\x7b\x76\xb1\x83\x5b\x45\x51\xb0\
-\x58\x2c\xae\x0d\x58\xdc\xcd\x27\x63\x78\x1c\xcf\xbe\xb7\xa8\xd8\
-\xe5\xa6\x69\x1a\xb5\x6a\xd5\x62\xc1\x82\x05\x25\xb2\x44\xcd\x68\
-\x34\x52\xb9\x72\x65\x66\xcf\x9e\xed\xe6\xe7\x69\x10\x7e\x27\xd3\
-\x17\xdf\xe9\xbc\x40\x8a\xba\xee\x28\xff\x52\xe2\xbe\x7d\xfb\xd2\
-\xa2\x45\x8b\x12\xe9\x48\x2a\x8a\x82\x8f\x8f\x4f\x31\x3e\x41\x47\
-\x95\xba\x1d\xf9\xf0\xab\x8e\xc5\xbe\x16\x9d\x4e\x47\xbf\x7e\xfd\
-\x68\xd0\xa0\x41\x81\xcd\x41\xdc\x4d\x97\xc1\x60\xc0\xc7\xc7\xa7\
-\x58\x67\xbc\xc5\xb4\xee\xc7\x82\xd6\xfd\x2e\x97\xa2\x7b\x5d\x47\
-\x55\x55\x31\x9b\xcd\x8c\x1e\x3d\x9a\x87\x1f\x7e\xb8\xd8\xe7\xc3\
-\xa9\xaa\x4a\xa5\x4a\x95\xf8\xf3\xcf\x3f\x0b\xd4\x8d\xa2\xe5\x8f\
-\x81\x7a\x5d\x9f\x66\x71\xd7\xe2\xdf\x6b\xde\xde\xde\x7c\xfa\xe9\
-\xa7\x6e\x0d\x22\x5c\xab\xdc\xcc\x66\x33\x87\x0f\x1f\x76\xff\xa8\
-\x09\x7c\xb9\x6b\xd0\xab\xdc\x35\xa8\x78\xd7\x62\xb5\x5a\xa9\x55\
-\xab\x16\xd3\xa7\x4f\x27\x2b\x2b\xab\xd8\xe5\xa6\x28\x0a\xb5\x6b\
-\xd7\xe6\xb7\xdf\x7e\x2b\x95\x67\x04\xaa\x07\x77\xb0\x39\x31\x83\
-\x80\x72\x99\x2c\xff\x62\x15\x5a\x19\x85\xc3\x87\x8e\x52\x31\xd3\
-\x8e\x66\xb7\x13\x5a\xab\x37\x8f\x35\x7c\x96\x37\x7f\x70\x30\xa4\
-\xa9\x2f\x38\x0e\x33\xeb\xa7\x93\xa4\xfb\x57\x24\x73\xc3\x4c\x56\
-\x65\x67\xa0\x5c\xb0\xb0\x67\xef\x1e\x72\x75\x46\x2c\x19\xa9\xa4\
-\x5f\x32\x62\x55\x75\xf8\xeb\x03\x88\xae\x51\x8f\x69\xdf\x7c\xc3\
-\x9e\x17\x06\xd0\xb6\x92\x9d\xa5\x1f\x4c\x27\x35\xac\xde\xff\xb1\
-\x77\xdd\xf1\x51\x54\xdb\xff\x3b\xb3\xb3\xbd\x24\x21\x8d\x12\x42\
-\x48\x48\x28\xa1\x28\xbd\x23\x35\xf0\xe8\x52\x2c\x20\x45\x3a\x91\
-\x2e\x08\x3e\x44\x04\x41\x04\x04\x54\x9a\x80\x80\x14\x01\x0d\xbd\
-\xf7\x22\x60\x20\xf4\x96\x04\x43\x49\x08\x04\xd2\xb3\x49\xb6\xcf\
-\xcc\xef\x8f\x30\x63\x16\x30\xd9\x9d\xd9\xf7\xc4\xdf\x9b\xef\xe7\
-\xc3\x7b\xec\xca\xde\xb9\xe7\x9e\x7b\xef\x9c\xef\x3d\xe7\x9e\x83\
-\x8e\x0d\x42\xb1\x64\x5f\x0c\x62\xe3\xb3\xf1\xce\xe8\xa5\x18\x98\
-\xdc\x11\x27\x6e\x66\x39\x25\x97\xd3\xd5\x7a\x0b\xc1\xba\xf9\x38\
-\xf8\xc3\x72\xcc\x6d\x35\x1a\x8e\xa4\x73\x38\x7a\x31\x19\x5d\x06\
-\x57\x41\x79\x7f\x39\x32\xef\xdc\x41\x3e\x00\xca\x9e\x85\xd4\x6c\
-\x07\x42\xfc\x35\x12\xb9\x90\x48\xa0\x04\x09\xaf\x21\x9e\xc6\x61\
-\xeb\x75\x23\x1a\x8c\x1f\x8e\xe1\x6f\x47\x01\x74\x38\xb6\x2e\x58\
-\x8e\x9f\x0e\x3c\x82\x02\x45\xa7\xc0\xca\xd0\xa6\x68\xd7\xb6\x39\
-\x0e\x5d\xb2\x80\xb4\x67\xe3\xf4\xe9\x58\x38\x54\x0d\x30\x6c\xfa\
-\x7b\xe8\xa0\x04\xc2\xd3\x4f\x60\xfd\xfc\xcb\xc8\xab\x96\x0f\x58\
-\xd3\xf0\xf3\xf7\x73\x01\x00\xf2\xd0\x36\x88\xea\xde\x1d\x8b\xb6\
-\xfd\x8a\xa7\xdd\xfa\x63\xea\xc4\x03\x50\xfb\x47\xe0\xdf\xdf\xad\
-\x43\xf3\x4a\x6a\xd4\xed\xdb\x07\xab\x96\x77\xc6\x67\x93\xf7\xa1\
-\x6c\xf5\x66\xf8\x60\x74\x37\x90\xf9\x85\x4e\xd9\x45\xbd\x23\xdf\
-\xc6\x92\xc5\x97\x31\x64\xc2\x12\x8c\xdb\x0a\x84\x77\x88\xc6\xaf\
-\x9f\x75\x86\x52\x41\x62\xd2\xb4\x68\xf4\x1c\xbe\x18\x63\x8f\x01\
-\x65\x5b\x7c\x88\x6d\xc3\xea\xc1\x0b\x00\x03\xc0\xc6\xd0\x28\x64\
-\x98\x7f\xd4\xf9\x1b\x17\xb6\x53\x74\xaf\xcb\x73\x10\x63\x94\x12\
-\xa5\x7c\x76\x47\x36\xbd\x5e\x8f\x2e\x5d\xba\x78\x54\xb6\xd7\xc5\
-\xb8\x21\x49\xd2\xad\x30\xd2\xd2\x60\xb1\x58\x44\xdc\xc7\x23\x5e\
-\xb4\x06\x45\xcd\xc9\x6a\xd5\xaa\x15\xdd\xa3\xf4\x10\x3c\x51\x27\
-\xd2\x53\x08\x0e\x0e\x46\x70\x70\xb0\xc7\xda\x8b\x8b\x8b\xf3\x98\
-\xd7\x85\x10\xb1\x26\x64\x32\x19\xea\xd4\xa9\x83\x3a\x75\xea\x78\
-\x4c\xb6\x5b\xb7\x6e\xbd\x1e\x46\x1a\x45\xa1\x75\xeb\xd6\x1e\x6d\
-\x53\x8c\x6c\x9e\x7a\xc7\xd0\x34\x8d\x80\x80\x00\xbe\x3c\x8c\xa7\
-\x40\xfc\x43\x2f\x9e\x5d\xf9\xfd\x18\xee\xe5\x06\x61\xfd\xcd\x5d\
-\xe8\x2c\xcb\xc5\xde\xb5\x9f\x61\xe9\x91\x0b\xb0\x99\xd3\x61\xf1\
-\xb1\x01\xf0\xc1\xe0\xd9\xa3\x30\xbb\xed\x42\x58\x28\x39\x8c\x71\
-\x87\x70\x24\x31\x0d\x15\xdf\xdf\x8a\x5d\xb3\x9a\x21\x37\x35\x01\
-\x9f\x0f\xea\x89\xf3\xe7\x2f\x21\x9f\x91\x63\xe7\x94\xce\x88\x9b\
-\x2b\x87\x83\x91\xa1\x4e\x54\x7f\x7c\xd1\x7f\x30\xaa\x6f\x1c\x80\
-\xf7\xda\xbc\x81\x50\x3f\x06\xb7\xe3\xee\xa2\xc7\xbc\xaf\x50\xa7\
-\x6a\x03\x10\x04\x85\x11\x5d\x1a\x62\x51\x25\x2f\xa4\x3c\xbc\x07\
-\x25\xad\x81\xa3\xf8\xb2\xf6\x8a\xc2\xfc\x91\xcd\xd0\xee\xeb\x71\
-\x78\x23\x69\x23\x1c\x69\x77\x91\x6d\x68\x8c\x56\xd5\xc2\x10\xf6\
-\x41\x2f\xd8\xbb\xad\x42\xa3\x06\x09\x20\xd2\x93\x90\x57\xb6\x0d\
-\x7a\xd7\xab\x0c\x1d\x00\x30\x76\x80\xb1\x80\x96\x32\xc2\x48\x24\
-\x50\x82\x84\xd7\x01\x6c\x40\x0b\x9c\x4b\x7e\x0a\x4a\xf3\x3c\x5d\
-\xb7\x2c\x0c\x3f\x5f\xcf\x00\xad\xf4\x06\xdb\x35\x13\x2a\x83\x0f\
-\x00\x12\x23\xbf\xd9\x8f\x0f\xec\x32\xf8\xe8\xd4\x58\x71\x2e\x03\
-\xdf\xb1\x0a\x78\x3d\xcf\x9d\x11\xfa\xfe\x37\x48\xee\x4e\x43\x4b\
-\xd1\x78\x67\x15\xcd\xbf\x14\x09\x99\x02\x7a\xbd\x0e\x0a\xaa\x2b\
-\x7e\xbd\xf4\x10\x0f\x92\xee\x43\x59\x2e\x02\x21\x81\x7a\x50\x00\
-\x0c\x55\x5a\xe0\xc8\x9d\x54\x3c\x7d\x78\x1f\xca\x8a\xd5\x10\xa8\
-\x01\x1c\x34\x09\x4d\xb1\x77\x16\x21\xd3\xa0\xed\xd0\xaf\x71\xa1\
-\xc3\x68\x3c\x33\x91\x08\xaa\x18\x04\x3f\x43\xd1\x83\x5b\x0e\xfe\
-\x0a\x09\x51\x63\x90\x59\x60\x87\x7f\x85\x60\x04\x78\x15\x25\x18\
-\x20\xb5\xbe\x18\xb9\x2a\x16\x43\x48\x15\xc8\x7f\x90\x2e\x64\x32\
-\x19\x1e\x3f\x7e\x8c\x1d\x3b\x76\x20\x23\x23\x43\x74\x02\x15\x92\
-\x24\xd1\xa7\x4f\x1f\xd1\x61\x45\xfc\x5c\x61\x8a\xfe\x87\x10\x50\
-\x6f\x83\xa2\x28\x3c\x7d\xfa\x14\xcb\x96\x2d\xf3\x48\x7f\x8c\x46\
-\x23\x66\xcd\x9a\x25\x7a\x8c\xfe\x64\x3b\x76\x30\xa4\x5c\xd0\x7c\
-\xe1\xea\xb2\x7d\xf5\xd5\x57\xfc\x9d\x45\x31\x05\xac\x35\x1a\x0d\
-\x3a\x76\xec\x28\x2a\x3c\xf1\x05\xe1\xc0\xb0\x24\x48\x42\xd8\x9c\
-\xdc\xb7\x6f\x1f\x7e\xff\xfd\x77\xc1\xb5\xe6\x5e\xc4\xa7\x9f\x7e\
-\xea\xc1\x43\x00\xe6\x79\x66\x60\x61\x04\xf7\xc4\x89\x13\xd8\xbf\
-\x7f\x3f\x9f\x49\x57\x88\x7c\x5c\xf9\x13\xa5\x52\x89\xd6\xad\x5b\
-\x0b\x2c\xeb\xf1\xca\x86\x41\x83\x80\x8c\x70\x7f\xdd\xdb\xed\x76\
-\x6c\xdc\xb8\x11\xf1\xf1\xf1\xa2\x6a\x69\x72\xe4\xa4\x4e\x9d\x3a\
-\xa2\x0e\x93\x5e\x94\x8b\x15\x41\x4e\xac\x56\x2b\x66\xcd\x9a\x25\
-\x38\x54\xfa\xc5\xb5\x1b\x10\x10\x00\x7f\x7f\x7f\x8f\xc9\xe6\x00\
-\x40\x09\xe8\x93\x5c\x2e\x47\x62\x62\x22\x76\xee\xdc\x89\xdc\xdc\
-\x5c\x8f\x90\xbf\xce\x9d\x3b\x8b\xd6\xff\xdf\x05\xbb\x3c\x10\xbd\
-\xc7\x4e\xc7\x3b\x41\x81\x50\x21\x10\x6d\x3b\x0e\x44\x8a\xfd\x3a\
-\x58\x63\x00\x82\xca\x17\xc5\xb8\x97\xaf\x3f\x01\xdf\x4e\x78\x0a\
-\x55\xf5\x20\x64\x98\x52\xd1\xac\xc3\xbb\x68\x39\xf2\x2d\x04\x96\
-\x0b\x44\xa0\xb7\x1a\x03\xa3\x47\xe3\x64\x8a\x06\xb2\x50\x1f\x3c\
-\x7a\x96\x05\x06\x04\x58\x10\xa8\x12\x1a\x8c\x8a\x8d\xfb\x62\xf3\
-\x16\x07\xbe\x5c\xb8\x0a\xb7\x33\x09\x0c\x5f\xfc\x25\x66\x8c\xe9\
-\x08\x00\x98\x3c\x7a\x00\x48\xf3\xb7\xb8\x9e\xa9\xc5\x17\x6b\x67\
-\x23\xef\xe8\x09\x84\xbc\x10\xe7\xdb\x76\xf6\x7e\xec\x09\x9c\x81\
-\x85\x5b\xce\x40\xd6\xa0\x17\xbe\x9a\x32\x19\x4d\x42\xd4\xa0\x42\
-\xbe\xc1\xb6\x05\x24\x96\x6d\x8f\x05\x53\xa7\x33\x3e\x9b\x38\x19\
-\x51\x21\xcf\x93\x1f\x95\x6b\x88\xde\xfd\x1d\x08\xf3\x95\xa8\x86\
-\x44\x02\x25\x48\x78\x0d\x40\x90\x0a\xf8\xf8\x16\x2f\x00\x4e\x40\
-\xe7\xfd\xfc\xb3\xfa\xcf\xef\x95\x1a\x03\x5f\x1f\xce\xe0\xe3\x9c\
-\xd6\x9b\x54\x68\xe1\xfb\xdc\xae\x57\xfd\x45\x36\x72\xad\x57\x19\
-\xd4\xac\xf7\xc2\x3d\x12\x42\x06\xbd\x97\x0f\xf4\x75\xfe\xcc\x7e\
-\xf8\xaa\x9c\x8c\xa4\x4c\x81\x72\x95\xc3\x51\xee\xc5\xef\x29\x25\
-\x02\x83\x2b\x23\xf0\x25\xa1\x64\x50\xeb\xbd\xa1\xfe\x87\xe9\x42\
-\x26\x93\x21\x2d\x2d\x0d\x4b\x97\x2e\x45\x5a\x5a\x1a\x34\x1a\x8d\
-\x08\x5b\x84\x85\xd1\x68\x84\x9f\x9f\x9f\xe8\xf0\xcb\xa2\x06\xb3\
-\x71\x74\xdf\x36\xa4\x3b\x5a\xa0\xff\xdb\x35\x05\x91\xc0\x27\x4f\
-\x9e\x60\xf1\xe2\xc5\xd0\xeb\xf5\xa2\xc8\x9b\xdd\x6e\x87\xc9\x64\
-\xc2\x90\x21\x43\xf8\x7a\x7a\xe2\x40\x63\xf9\x87\xa3\x50\x77\xf9\
-\x1a\x34\x16\x38\xe4\xf1\xf1\xf1\x98\x3f\x7f\x3e\xb4\x5a\xad\x28\
-\x12\xe0\x70\x38\x20\x97\xcb\x51\xa9\x52\x25\xd1\x64\x99\x05\x60\
-\xcb\x7d\x86\x53\x1b\x17\xc2\xf0\xf6\x02\x34\xa9\x20\x6c\x4e\x1e\
-\x3a\x74\x08\x2b\x56\xac\x80\xc1\x60\x10\x3c\xd6\x2c\xcb\xc2\x64\
-\x32\xc1\xe1\x70\x60\xd2\xa4\x49\x1e\x98\x8f\x00\xe8\x64\x2c\x5d\
-\x71\x1c\xef\x0f\xfd\x00\xbe\x6a\xb9\xa0\x66\xf6\xee\xdd\x8b\x25\
-\x4b\x96\x40\xab\xd5\x0a\x2e\x16\x0f\x14\xdd\xa1\xf4\xf1\xf1\x41\
-\xc3\x86\x0d\x3d\x70\x30\xc1\x82\xb6\x59\x71\x7a\xeb\x8f\xc8\x6b\
-\x36\x18\x3d\xc3\xdc\x9b\x94\x24\x49\xa2\xa0\xa0\x00\xbf\xfc\xf2\
-\x0b\x4e\x9f\x3e\x0d\x1f\x1f\x1f\xc1\xde\x49\xee\x2e\x71\xfb\xf6\
-\xed\xf9\x72\x21\x62\x71\xf1\xc8\x3e\x64\x78\x07\xa3\x7d\x83\x3a\
-\x50\xb8\x39\x54\x5c\x66\xd9\xaf\xbe\xfa\x0a\x36\x9b\x4d\xd4\x9c\
-\xe4\xf6\x91\xb0\xb0\x30\x2c\x5c\xb8\x50\xe4\x3e\x52\x14\x28\x7f\
-\x7d\xd3\x37\x38\x13\xf9\x21\xc6\xd4\x75\xff\x8e\xb1\x5c\x2e\xc7\
-\xbd\x7b\xf7\xb0\x68\xd1\x22\x64\x64\x64\x88\x2a\x11\xc1\x30\x0c\
-\xf2\xf3\xf3\xa1\x54\x2a\x3d\x9a\xe1\xf7\xbf\x89\x26\xfd\x66\xe0\
-\xd7\x7e\x7f\x7e\x0e\xae\xd7\x19\x9f\xd7\xeb\xec\xf4\x6f\x94\x86\
-\xb2\x18\xbb\xe8\xa7\xe7\x9f\x22\xb1\xa1\x4d\xb1\x72\x3a\x6a\x5f\
-\x74\x1a\xfd\x35\x4a\x4a\xcf\xe4\xf5\xd6\xfb\x58\xdf\xa2\x0f\xac\
-\xb4\x0c\xca\x62\x93\xb1\x7a\x8b\x9e\x58\xd3\xb4\x0b\xac\x2c\x05\
-\x25\x45\x00\xaf\x8a\xf2\x90\xeb\xd1\x75\xc2\x62\x74\xfe\xc8\x06\
-\x86\x54\x80\xe2\x5f\xb3\x2a\xf4\xfa\xf8\x7b\xf4\x1c\x67\x05\x4d\
-\x2a\x21\x2f\xfe\xfa\xad\xd6\x0f\xbf\x6e\xec\x27\x19\x9e\x12\x09\
-\x94\x20\x41\xc2\xff\x22\xec\x76\xfb\x4b\x1e\x15\x2e\x83\x27\xf7\
-\xf2\xd6\xeb\xf5\xf8\xf5\xd7\x5f\xd1\xb0\x61\x43\x51\xcf\xea\xd3\
-\xa7\x0f\x9f\x70\x86\x61\x18\x58\xad\x56\x97\x08\x21\x45\x51\xce\
-\x44\x86\xa5\x71\x76\xfd\x7c\x0c\x9a\xb1\x1f\xd3\x96\xb5\x71\x6a\
-\xcf\x95\xf4\xe7\x9c\x11\xc2\xfd\x5b\xa3\xd1\x28\x7a\x1c\x2b\x56\
-\xac\xe8\x64\xf0\x38\x1c\x0e\xd0\x34\x5d\xa2\x21\xc7\xb2\x2c\x94\
-\x4a\xa5\xb3\x91\xce\xa4\xe3\xeb\x8f\xfa\xe3\xab\xbd\x66\x1c\x5e\
-\xf9\x9c\x12\xd2\xb4\x4b\xc9\x66\x28\x8a\xe2\x65\xb3\xd9\x6c\xa8\
-\x5b\xb7\x2e\x8e\x1c\x39\x02\x5f\xa7\x43\x15\xf7\x60\x36\x9b\x11\
-\x1e\x1e\xce\xcb\xe1\x70\x38\x60\xb1\x58\x5c\x32\x06\xe5\x72\xb9\
-\x93\x7e\x09\x3c\xc6\xcc\x3e\x51\xd8\x63\xad\x81\x9f\xfb\xfd\x39\
-\xff\x4a\x33\x0a\x09\x82\x70\x4a\xc2\x61\xb7\xdb\x51\xa3\x46\x0d\
-\xdc\xbc\x79\x53\x94\xce\x0e\x1e\x3c\x88\x77\xdf\x7d\x97\x97\x8d\
-\x1b\xe3\xd2\xee\x76\x71\xf7\xc0\x8a\x8f\x41\xee\xad\x83\x98\x30\
-\x62\x18\x62\x03\x3e\x40\xdf\x21\x84\xcb\xb2\x51\x14\x05\x9b\xcd\
-\xc6\x97\x72\xa0\x69\x1a\xbd\x7a\xf5\x42\x4c\x8c\xb8\xbb\xa1\x1b\
-\x37\x6e\xc4\x47\x1f\x7d\xc4\xf7\x91\x5b\xe7\xae\x78\xcf\x94\x4a\
-\xa5\xb3\x7e\x1d\x71\xb8\xb3\x6e\x05\xde\x9e\x73\x03\x2b\xcf\x8c\
-\xe2\xe7\x57\x69\x44\xee\x45\xbd\xe5\xe7\xe7\x63\xce\x9c\x39\xa2\
-\x3d\xaf\x53\xa7\x4e\x45\x5c\x5c\x1c\xdf\x47\x8b\xc5\xe2\x52\x7f\
-\x48\x92\x84\x5c\x2e\x77\x92\x2d\xed\xf2\x3e\x7c\x3c\x62\x24\xda\
-\xce\xfb\x19\xed\x1b\xc2\xe5\x24\x3a\x2a\x95\xca\x69\x2c\x95\x4a\
-\x25\x46\x8f\x1e\x8d\x6f\xbe\xf9\x46\x94\x6c\x91\x91\x91\x60\x18\
-\x86\x9f\x0f\x36\x9b\xcd\x25\xbd\x11\x04\xf1\x42\x19\x19\x02\x59\
-\x07\xa6\xe1\xad\x11\xab\x30\xfe\xf4\x08\xb7\xf6\x11\x6e\xbe\x70\
-\x65\x1d\x18\x86\xc1\xa5\x4b\x97\x5c\x2e\x0d\xf3\x57\x87\x12\x1d\
-\x3b\x76\xe4\xf7\x68\x4e\xb6\x17\x75\x46\x10\x04\x5f\x6f\xf1\x7f\
-\x16\x32\x39\x94\xb2\xbf\xf8\xde\x95\x43\x17\xb9\xe2\x95\x11\x24\
-\xa4\x5c\xf9\x8f\x8a\x44\x92\x20\x91\x40\x09\x12\x24\xfc\x87\x71\
-\xea\xd4\x29\x9c\x39\x73\xc6\xa9\x36\x16\x41\x10\x78\xf0\xe0\x01\
-\xff\x32\x66\x59\x16\xd9\xd9\xd9\xa2\x9e\x63\x34\x1a\x61\x36\x9b\
-\xf9\x84\x15\x0f\x1f\x3e\xc4\xb7\xdf\x7e\x5b\xaa\x77\x89\x61\x18\
-\x34\x6b\xd6\x0c\x6d\xda\xb4\x01\x93\xff\x0c\xe7\x2e\x5e\x05\x11\
-\xf0\x06\x9a\x0f\x9e\x81\x4d\xea\x32\xb8\x9b\x57\x94\x76\xfc\x71\
-\x6a\x2a\x56\xaf\x59\x53\x6a\x3d\x3d\x82\x20\x10\x1b\x1b\x8b\xca\
-\x95\x2b\x3b\xf5\x4d\x4c\x81\x67\xb3\xd9\xcc\x1b\x69\x2c\xcb\xe2\
-\x8f\x3f\xfe\xc0\xfc\xf9\xf3\x4b\x3d\xc9\xcf\xcf\xcf\xc7\xf0\xe1\
-\xc3\x11\x1a\x1a\x0a\x6b\x61\x36\x6e\x5c\x88\x03\x59\xbe\x36\x3e\
-\x59\x7e\x04\xd4\xe3\xee\xb0\x3c\xe7\x0f\x77\xef\xde\xc5\xb6\x6d\
-\xdb\x8a\xca\x9b\x94\x60\x1c\x11\x04\x81\xbb\x77\xef\xf2\xba\xb4\
-\xd9\x6c\xc8\xcd\xcd\x15\x45\x02\x33\x32\x32\x78\x39\x94\x4a\x25\
-\x0e\x1c\x38\x80\xcc\xcc\xcc\x12\xfb\xc1\x15\xaa\xef\xd2\xa5\x0b\
-\x6a\xd6\xac\x89\xa7\x09\x57\x71\xe3\x51\x36\x22\x1b\xb6\xc1\x57\
-\x07\xe3\xd0\x68\xfe\x47\xc8\x2e\x00\x50\x06\x38\x76\xec\x18\xae\
-\x5c\xb9\x52\xaa\xce\x8c\x46\x23\x1e\x3c\x78\x00\x99\x4c\xc6\x97\
-\x0a\x10\x8b\xbc\xbc\x3c\xde\x08\x95\xcb\xe5\x38\x72\xe4\x08\x2c\
-\x16\x4b\x89\x24\x80\x23\x09\x53\xa6\x4c\x81\x5e\xa7\x43\x7a\xfc\
-\x39\x5c\xcb\x90\xa3\x5e\x83\x4e\x58\x77\xf6\x77\x7c\x35\x6f\x07\
-\x08\xb0\x60\x68\x1a\x07\x0e\x1c\xc0\x95\x2b\x57\x4a\x9c\xe3\x32\
-\x99\x0c\x19\x19\x19\x7c\x16\x48\x82\x20\x04\x65\x84\x7c\xd5\x7a\
-\xe3\xda\x63\x18\x06\x7b\xf7\xee\xc5\xfd\xfb\xf7\x4b\x1d\x37\xb9\
-\x5c\x8e\x51\xa3\x46\x41\xaf\xd7\xe3\xf2\xe5\x2b\x80\x2e\x10\x6f\
-\x44\x34\x44\xad\xe1\x6f\x62\x13\xbd\x10\x46\x9b\x05\x36\x13\x83\
-\x4d\x5b\x7f\xc1\x93\x27\x4f\x4a\x35\xd6\xd3\xd3\xd3\x9d\x48\x58\
-\x7e\x7e\xbe\x28\xb9\xac\x56\x2b\x7f\x90\xc4\x8d\xdf\xf7\xdf\x7f\
-\x0f\xbd\x5e\x5f\x22\x09\xe4\x12\x41\xf5\xed\xdb\x17\x3a\x9d\x0e\
-\x4f\xae\x1c\xc1\x1f\x39\x0a\x04\xd7\x8d\xc2\x82\x65\x8b\xf1\x48\
-\xa7\x01\x58\xc0\x62\xb5\xe0\xbb\xef\xbe\xe3\x49\xd0\x5f\x41\xa3\
-\xd1\xe0\xe4\xc9\x93\x4e\x24\xdf\x13\x89\x61\x1c\x0e\x07\x48\x92\
-\x04\x49\x92\xc8\xce\xce\xc6\xa6\x4d\x9b\x70\xfc\xf8\xf1\x12\x0f\
-\x13\x58\x96\x85\xaf\xaf\x2f\x46\x8d\x1a\x05\xd6\x92\x8b\x5b\x57\
-\x2e\x22\x4d\x16\x8a\x76\xff\xfa\x0a\x87\xbe\x91\xe3\x18\x6d\x05\
-\xa0\x47\x52\x52\x12\xf6\xec\xd9\x53\xea\x61\x19\x49\x92\xb8\x72\
-\xe5\x8a\xd3\x5e\x9a\x99\x99\x29\x2a\xd4\xd5\x68\x34\xf2\x35\x0a\
-\x09\x82\x40\x61\x61\x21\x96\x2e\x5d\x0a\x93\xc9\xc4\xb7\xc9\xdd\
-\x41\x1c\x30\x60\x80\xa8\xa8\x13\x09\x12\x24\x12\xf8\xff\x0c\xdc\
-\xa9\x98\x04\x09\x12\x3c\x0b\x95\x4a\x05\x2f\x2f\x2f\xbe\xbc\x01\
-\x67\x38\xea\xf5\x7a\xa7\xcf\x72\xb9\x5c\xd4\x73\x38\xaf\x10\xb7\
-\x96\x15\x0a\x05\xbc\xbc\xbc\x5c\x0a\x55\xe4\x8c\x11\x26\xfb\x3e\
-\xb6\xfe\xf4\x03\x14\x0d\x3e\x46\xf3\x5a\x35\x61\xb2\x39\xc0\x1d\
-\x6d\xca\x28\x0a\x5e\x5e\x5e\x25\xde\x5b\x23\x08\x02\x24\x49\xbe\
-\x94\x0d\x52\x6c\x98\x63\xf1\x93\x6b\xee\x24\xdb\xc7\xc7\x07\x0e\
-\x87\xa3\xd4\xbe\x70\xf2\x5b\xf3\x9f\x60\xff\xc6\x1f\xa1\x68\x35\
-\x02\x75\xaa\xf9\xc3\x5a\xac\xb8\x93\x5c\x2e\x87\xc1\x60\x28\x75\
-\xac\xe4\x72\xb9\x93\xfc\x9c\xe7\x43\xac\xde\x38\xd9\x58\x96\x85\
-\x4e\xa7\x73\x89\x30\x53\x14\x05\xb9\xbc\x68\x5c\x1f\xc4\x1e\xc1\
-\x9a\xc3\xf1\x18\x15\xda\x0a\x65\xc9\x7c\xd8\x1c\x2c\x7f\x1f\x50\
-\xa5\x52\x41\xaf\xd7\x97\x4a\x02\x19\x86\x71\x0a\x8f\xf4\x84\xa7\
-\xa0\xf8\x78\x72\x77\x1f\x75\x3a\x5d\xa9\xf3\x81\x2f\xb8\x4d\x10\
-\x48\x3e\xfb\x2b\x7e\xbc\x62\x80\x7f\x95\x37\xe1\xeb\x67\x81\x9d\
-\xb3\xd5\x89\x3f\xd7\x56\x49\x7a\x23\x49\x12\x36\x9b\xcd\xc9\x1b\
-\xec\x89\x7b\xa5\xdc\x33\x39\xc3\x5d\x2e\x97\x43\xa7\xd3\x95\xea\
-\x99\x94\xcb\xe5\xfc\xf3\x0f\x1f\x3e\x0a\x26\xa8\x21\x6a\x55\x29\
-\x0f\x30\x0e\xd8\xec\x0e\x14\x15\x94\x2e\xca\x60\x59\xda\x3c\xe0\
-\x8c\xfd\xe2\xf3\x47\xec\xfd\xc4\x17\xbd\xcb\x00\xe0\xe3\xe3\x03\
-\x95\x4a\x55\xa2\x8d\x40\xd3\x34\xb4\x5a\x2d\xdf\x97\x3f\x0e\xad\
-\xc1\x96\x78\xc1\x03\x2d\x4c\x00\x00\x20\x00\x49\x44\x41\x54\x2f\
-\xb4\xf4\xa9\x8d\x2a\xa0\xc1\xbc\xb0\xf7\x95\x46\x96\x95\x4a\xe5\
-\x4b\x1e\x53\x4f\xe8\xad\x78\x1b\x14\x45\x41\xa3\xd1\x40\xaf\xd7\
-\x97\xaa\x37\x9d\x4e\x57\xf4\x17\xd3\x33\x9c\xde\xb9\x16\xbf\xa9\
-\x7a\xa0\x69\xfd\x2a\xb0\xda\x1d\x4e\xed\xe9\xf5\x7a\x97\x0e\xca\
-\x74\x3a\xdd\x4b\xfb\xbf\x98\x35\x47\x51\xd4\x4b\x73\x9c\xdb\xd7\
-\x8a\x1f\xf8\x15\xd7\x91\x04\x09\x12\x24\x12\x58\x64\xe0\xc9\x64\
-\xf0\xf1\xf1\x91\x06\x42\x20\xc4\xa5\x40\xff\xe7\x3e\xfb\x9f\x0e\
-\x57\x5e\xd8\x62\xd1\xa2\x45\x8b\x57\x66\xff\x8c\x8b\x8b\x43\x4c\
-\x4c\x0c\x1f\x7e\x97\x98\x98\x88\xc0\xc0\x40\xc1\xcf\x31\x9b\xcd\
-\xc8\xc8\xc8\x80\x5c\x2e\x87\xc3\xe1\x40\xa5\x4a\x95\x30\x7e\xfc\
-\x78\xb7\x0c\x27\xaa\x42\x5d\xcc\x5a\xf4\x03\x08\xa5\x17\xc0\xe6\
-\xc1\x62\xce\x47\x21\x51\x14\xde\x54\xbe\x7c\x79\x97\xef\x76\xdd\
-\xbf\x7f\x1f\xc9\xc9\xc9\xfc\xe7\x6b\xd7\xae\x39\x91\x5e\x77\x8d\
-\xb6\xc2\xc2\x42\x27\x2f\x40\x78\x78\x38\x46\x8d\x1a\xe5\x56\x3b\
-\x3a\xff\xaa\x18\xbf\x60\x19\x08\x95\x17\x28\xd8\x91\x9f\x95\x0d\
-\xdb\xf3\xee\x54\xa9\x52\x05\x13\x27\x4e\x74\xa9\x9d\xd3\xa7\x4f\
-\x23\x3e\x3e\x1e\x24\x49\xc2\x68\x34\xe2\xe6\xcd\x9b\x28\x28\x28\
-\x10\x7c\x07\x2b\x2d\x2d\x8d\xf7\x1c\x58\xad\x56\xf4\xea\xd5\x0b\
-\xfd\xfb\xf7\x77\xab\x8d\xba\xbd\x47\x62\x59\x67\x3b\xf4\x3e\x32\
-\x38\xf2\x69\x98\x8d\xb9\xb0\x3e\xb7\x4d\x5b\xb7\x6e\xed\x52\x66\
-\xc5\xec\xec\x6c\x1c\x3d\x7a\x14\x34\x4d\xf3\x63\xfe\xe0\xc1\x03\
-\x14\x14\x14\x08\x32\x1a\x29\x8a\x42\x62\x62\x22\x6f\xec\x3b\x1c\
-\x0e\x44\x45\x45\x61\xf0\xe0\xc1\x6e\xb5\x53\xe7\xbd\xcf\xb1\xb4\
-\x17\x09\x6f\x1f\x05\x60\xb6\x21\xbf\xa0\x00\x0c\x58\x90\xa4\x0c\
-\x51\x51\x51\x88\x8a\x8a\x72\x69\x8c\xb9\x30\x42\xae\xb0\xf6\xed\
-\xdb\xb7\x79\xe2\x24\xe4\x50\x22\x25\x25\x85\xbf\x9f\x4a\x10\x04\
-\x7a\xf5\xea\xe5\x76\xb6\xd8\xe8\xe8\x91\x00\xa5\x84\x5c\x46\x80\
-\xa1\x59\x98\x0b\x0a\x60\xb6\xd3\x90\xab\x75\x78\xe7\x9d\x77\x5c\
-\x6a\xe3\xde\xbd\x7b\xfc\xfd\x36\xb9\x5c\x8e\x94\x94\x14\x24\x24\
-\x24\x94\xea\x69\xfb\x2b\x58\xad\x56\x27\x0f\x24\x4d\xd3\x18\x33\
-\x66\x8c\x53\x24\x83\x2b\x68\x14\xbd\x0c\x35\xed\x24\xf4\xbe\xde\
-\x38\x9d\x90\x0f\xb3\xdc\x0e\xf6\xf9\xa1\xc4\xe8\xd1\xa3\x5d\x6e\
-\xe7\xd0\xa1\x43\xfc\xdf\xb3\xb2\xb2\x90\x9a\x9a\x8a\x9c\x9c\x1c\
-\x41\xb2\xe9\xf5\x7a\x98\xcd\x66\x68\x34\x1a\x30\x0c\x03\x1f\x1f\
-\x1f\x0c\x1c\x38\xd0\xad\x4c\xb8\x84\x77\x28\x06\x7e\xfa\x3d\xde\
-\x21\x34\xd0\xc9\x00\x6b\x81\x11\xf9\xb6\xa2\xb5\x1f\x16\x16\x86\
-\xb0\xb0\x30\x97\xda\xd9\xb1\x63\x07\xce\x9c\x39\xc3\xcb\x71\xe7\
-\xce\x1d\xf8\xfb\xfb\x0b\x26\x68\x39\x39\x39\xc8\xcb\xcb\x03\x49\
-\x92\x3c\xd9\x1b\x33\x66\xcc\xdf\xf6\x6e\xe5\x42\xf1\x25\x08\x3f\
-\x8c\x71\xbb\xc6\xaf\x04\x89\x04\x0a\x45\x7e\x7e\x3e\xa6\x4f\x9f\
-\x8e\x80\x80\x80\x7f\xec\xa5\xe2\xbf\x93\x40\x27\x25\x25\xfd\x6d\
-\xcf\x3f\x71\xe2\x04\xa6\x4d\x9b\xe6\x91\x50\x99\xff\x35\x98\xcd\
-\x66\x5c\xbd\x7a\xd5\x33\x89\x54\xdc\x04\x77\xef\xcb\xe1\x70\x20\
-\x2b\x2b\x0b\x63\xc6\x8c\x11\x1d\xa2\x53\x50\x50\x80\x8e\x1d\x3b\
-\x82\x20\x08\xbe\x10\xb2\x5b\x2f\x12\x4a\x09\x5f\xbf\x80\xe7\x6f\
-\x71\x2f\x34\x8d\x1a\x80\x37\x88\xb2\x6e\xf7\x83\xbb\x17\xc3\xfd\
-\x7f\xbb\x76\xed\x04\x27\x74\xe1\xbc\x54\x85\x85\x85\x4e\x84\xc2\
-\x6d\x32\x29\x93\xc3\xdb\x8f\xcb\x08\x48\xe3\x83\xaf\xe7\xc1\x5f\
-\xe5\xfe\x18\x73\xcf\x66\x18\x06\x0f\x1f\x3e\x44\x9f\x3e\x7d\x40\
-\x51\x94\x60\xd9\xb8\xbb\x8d\x9c\xb7\xca\x62\xb1\xb8\x1d\x16\xa6\
-\xd4\x79\xc1\xff\xb9\xa3\x82\xd1\xf9\xa0\xf5\xe0\xa9\x50\x05\xba\
-\x3f\x1f\xb9\xbb\xab\x26\x93\x09\x29\x29\x29\x78\xf3\xcd\x37\x05\
-\xbd\x0f\xb8\xbe\x17\x16\x16\x3a\x91\x63\x9b\xcd\xe6\x3e\xe1\xd2\
-\x97\x01\x9f\xc7\x51\x19\x8c\x41\x03\xfb\xc0\x47\x41\xb9\xbd\xce\
-\x39\xfd\x98\xcd\x66\xc4\xc6\xc6\xa2\x71\xe3\xc6\x7c\x28\xb6\x10\
-\xf9\x0a\x0b\x0b\xa1\x56\xab\xf9\xba\x95\x42\x64\xf3\xf2\xf2\xfa\
-\x73\x7e\x52\x0a\xb4\xea\x33\x10\x74\x39\xf7\x26\x25\x17\x5a\xcb\
-\x30\x0c\x2c\x16\x0b\x36\x6c\xd8\x80\x5d\xbb\x76\x09\x3a\x94\xe0\
-\xc6\xa3\xa0\xa0\x00\x4d\x9a\x34\x71\x1a\x33\x77\x49\xa0\xca\xcb\
-\x1f\xdc\x2f\xea\xb4\x8c\x42\x55\x85\x1e\x72\x37\xf9\x0d\x77\x97\
-\x93\x61\x18\xe4\xe5\xe5\x61\xcb\x96\x2d\x38\x70\xe0\x80\x60\x1b\
-\x85\x3b\xb8\xf1\xf3\xf3\xe3\xc9\x92\xdb\xe5\x4b\x48\x39\xf4\x3e\
-\xfe\xe0\x7c\xeb\x6f\xf4\x1e\x8e\x0a\xbe\x5e\x82\xc8\x36\x77\xf0\
-\x53\x50\x50\x80\xf1\xe3\xc7\x43\xa3\xd1\x88\xde\x23\x39\x79\xfe\
-\xee\xc8\x2e\x8a\xa2\x70\xe3\xc6\x0d\x4c\x99\x32\xc5\xe5\x7b\x92\
-\x12\x9c\x49\xf4\xd9\xb3\x67\xa5\x81\x90\x48\xe0\x7f\x07\x56\xab\
-\x15\x1b\x37\x6e\x94\x06\x42\x24\xfe\x9b\x61\x16\xdc\x26\x7f\xe3\
-\xc6\x0d\xdc\xb8\x71\x43\x1a\x7c\x11\xf8\xbb\x4e\x2c\x1d\x0e\x07\
-\xaa\x57\xaf\x8e\x5d\xbb\x76\x39\x85\x75\x89\x99\x7f\x75\xeb\xd6\
-\xc5\xd8\xb1\x63\x3d\x30\x99\x95\x28\x1f\x52\x0d\x42\xab\x62\xd9\
-\x6c\x36\x44\x46\x46\xe2\xc0\x81\x03\x1e\x2b\x16\x5f\xaf\x5e\x3d\
-\x51\xc5\xe2\x8b\x1d\xdd\xa0\x7a\x8b\x66\x62\xca\xe9\xa1\x55\xab\
-\x56\x38\x78\xf0\xa0\x47\x42\xd4\xb8\xec\xa0\x3b\x77\xee\x14\x2d\
-\x1b\x29\x57\x21\xb8\x46\x03\xb7\xd5\x56\x3c\xc1\xc9\xd4\xa9\x53\
-\xd1\xaf\x5f\x3f\xd1\x86\x24\x47\x66\x3d\x76\xa2\x4d\xe9\x51\xa3\
-\xba\x5e\xb0\xde\x48\x92\xc4\xcc\x99\x33\xd1\xbd\x7b\x77\x8f\x94\
-\x75\xa0\x28\x0a\x2a\x95\xca\x23\x46\x2e\x41\x52\x08\x8a\xa8\x2e\
-\x68\xbd\xd1\x34\x0d\x7f\x7f\x7f\x6c\xde\xbc\x19\xa9\xa9\xa9\xa2\
-\xfb\xc2\x30\x0c\x82\x83\x83\x71\xf9\xf2\x65\x8f\xa8\x2d\x20\xa8\
-\x92\xa8\x39\xa4\xd3\xe9\x70\xf2\xe4\x49\x41\x44\xfb\x55\xd0\x6a\
-\xb5\x48\x4c\x4c\xf4\xc8\xfb\xda\x3f\xa2\x16\xfc\x04\xee\x91\x16\
-\x8b\x05\x4d\x9b\x36\xc5\xd1\xa3\x47\x61\x32\x99\x3c\x22\x5b\xcd\
-\x9a\x35\x31\x66\xcc\x98\xbf\x95\x04\x72\x25\x54\x92\x93\x93\xb1\
-\x60\xc1\x02\xc9\xc0\x10\xb3\x9f\x93\x52\xaa\x19\x89\x04\xfe\x87\
-\x61\xb7\xdb\xd1\xbf\x7f\x7f\x44\x44\x44\x08\x0e\x21\x91\x16\x2a\
-\x89\x3d\x7b\xf6\xfc\x57\x9f\xe9\xe3\xe3\x83\x80\x80\x00\x8c\x1c\
-\x39\x52\x52\x80\x08\xbd\xe5\xe4\xe4\x60\xe7\xce\x9d\x7f\x8b\x07\
-\x9c\xcb\x0c\xda\xbc\x79\x73\x8f\xb6\xeb\x39\x59\xc4\x15\x1d\x57\
-\xab\xd5\xe8\xd4\xa9\x93\xc7\xc7\xec\xef\x3e\xb0\xe1\x0c\xac\x8e\
-\x1d\x3b\x7a\x4c\xae\x82\x82\x02\xcf\xe9\x4d\xa4\x6c\x55\xab\x56\
-\x7d\x6d\x8b\xc5\x8b\x7d\x3d\x95\x2b\x57\x0e\xe5\xca\x95\xf3\x58\
-\x7f\x2e\x5d\xba\xe4\xb1\x39\x29\x74\xbd\x71\xde\xb2\x1a\x35\x6a\
-\xa0\x46\x8d\x1a\x1e\x93\xed\xda\xb5\x6b\xaf\xc5\x3e\x2d\x93\xc9\
-\xf0\xd6\x5b\x6f\x79\x94\xa4\x78\xee\xe0\x94\x10\xbc\x4b\xd2\x34\
-\x0d\x1f\x1f\x1f\x44\x46\x46\x7a\x74\xbc\xfe\x6e\x1b\x4e\xa7\xd3\
-\xc1\xcb\xcb\x0b\x93\x26\x4d\x92\x42\x1a\x45\xda\xe6\x87\x0e\x1d\
-\x92\xa2\xbc\x24\x12\xf8\x9f\x85\xc3\xe1\xc0\xe8\xd1\xa3\xd1\xa4\
-\x49\x13\x69\x36\x88\x80\x4a\xa5\xe2\x93\x7f\xfc\x37\x36\xe1\xc0\
-\xc0\x40\x54\xad\x5a\x15\x5f\x7c\xf1\x85\x34\xf8\x22\x90\x9e\x9e\
-\x8e\xcb\x97\x2f\xff\x2d\x24\x90\x0b\x4f\xba\x70\xe1\x02\xf2\xf2\
-\xf2\x3c\xd2\x9e\x67\xea\x96\x01\xb4\xdd\x02\x2b\x43\x41\xa3\x14\
-\xb6\x45\xca\x64\x32\x98\x4c\x26\x9c\x3c\x79\x52\x74\xe2\x29\x2e\
-\x6c\xb2\x73\xe7\xce\x1e\x91\xcd\x6e\x2a\x84\x8d\xd2\x40\xab\x10\
-\xbe\x4e\x1d\x0e\x07\xf6\xed\xdb\x27\x38\xa4\xb0\xb8\x6c\x2a\x95\
-\x0a\x61\x61\x61\x1e\xf1\x4e\x39\xcc\xf9\xb0\x91\x5a\x68\x94\xa4\
-\xe0\xfe\xdc\xb9\x73\x07\x0f\x1e\x3c\x10\x9d\x21\x94\xdb\x07\xdb\
-\xb5\x6b\xe7\x89\xa3\x0d\x58\xed\x80\x52\x2e\xce\xab\x9c\x92\x92\
-\x82\xcb\x97\x2f\x8b\xf7\xb8\x92\x24\x54\x2a\x15\x34\x1a\x8d\x07\
-\xe6\x24\x0d\xc6\x66\x85\x15\x4a\xa8\x15\x32\x41\xe3\xcc\x30\x0c\
-\x2e\x5f\xbe\x8c\xd4\xd4\x54\x8f\x78\x81\x42\x42\x42\x3c\xb3\x27\
-\x32\x76\x58\x6c\x34\x94\x2a\x95\x60\xb2\xe4\x70\x38\x70\xe8\xd0\
-\x21\xbe\x1c\x86\x58\xbd\xe9\x74\x3a\xb7\xc3\x5b\x5f\x49\x26\xed\
-\x26\x98\x68\x05\xb4\x2a\xe1\x7b\x64\x66\x66\x26\x4e\x9c\x38\x81\
-\xfc\xfc\x7c\x8f\xc8\x56\xa7\x4e\x1d\x0f\x1e\x4a\x08\x83\xb7\xb7\
-\x37\x82\x83\x83\x31\x77\xee\x5c\xd1\x49\xc1\xfe\x97\x41\xd3\x34\
-\xf2\xf2\xf2\x3c\xe6\x01\x97\x20\x91\xc0\xbf\x7c\x81\x14\x4f\x09\
-\x2d\x41\x18\x4c\x26\xd3\x7f\x35\x04\x83\xab\x95\x26\x41\x1c\xb8\
-\xbb\x66\x7f\xc7\xe9\x29\x45\x51\x48\x48\x48\x40\xaf\x5e\xbd\x60\
-\x32\x99\x44\x95\x51\x60\x59\x16\x99\x99\x99\x98\x3d\x7b\xb6\xe8\
-\x17\x6f\x61\xd6\x1d\x6c\xfb\x69\x17\xf2\x34\xc1\x68\xdb\xa9\x0b\
-\x6a\x57\xf2\x76\xbb\x0d\xb9\x5c\x8e\x3b\x77\xee\xa0\x7b\xf7\xee\
-\xf0\xf5\xf5\xe5\x33\x97\x0a\xd9\x9f\x68\x9a\x46\x56\x56\x16\x62\
-\x63\x63\x45\x17\x8b\x4f\x4f\xba\x82\x23\xc7\xcf\xe2\xa9\x59\x89\
-\x4e\xef\x0d\x42\x64\xa0\x52\x50\x9f\xce\x9d\x3b\x87\x9e\x3d\x7b\
-\xbe\x94\xf9\xd5\xdd\x76\x6c\x36\x1b\xf2\xf2\xf2\xf0\xc3\x0f\x3f\
-\x40\xad\x56\x8b\x92\xed\xc9\xf5\xa3\xf8\xf5\xe4\x0d\xa8\x7c\x82\
-\xd1\xa1\x4b\x37\x54\xf6\x55\xba\x35\x7f\x38\xbd\x2d\x5c\xb8\x10\
-\xeb\xd7\xaf\x47\xb9\x72\xe5\x04\xef\x31\x04\x41\x20\x37\x37\x17\
-\x36\x9b\x0d\x4f\x9f\x3e\x15\xc9\x6c\x4d\xb8\x7a\xf6\x18\x8e\x5f\
-\x7a\x88\x26\x5d\xde\x41\x93\xaa\x81\x7c\xf6\x53\x77\xf7\xcc\x2f\
-\xbf\xfc\x12\xab\x57\xaf\xe6\xef\x85\x09\x4d\x56\x94\x9d\x9d\x0d\
-\x92\x24\xb1\x7d\xfb\x76\x91\x19\x62\x73\xb1\x7f\xc3\xaf\x48\xca\
-\x36\x43\xa6\x0d\x40\x54\xdf\xbe\x08\xf7\x72\x8f\x54\xca\x64\x32\
-\xe4\xe4\xe4\x60\xd8\xb0\x61\xb8\x7a\xf5\x2a\x02\x03\x03\x05\xdf\
-\x09\x64\x18\x06\x99\x99\x99\x68\xdc\xb8\x31\x06\x0e\x1c\xe8\x34\
-\x37\xdc\x85\xc5\x98\x86\x63\xdb\x7f\xc1\xb5\x6c\x25\xda\x74\xed\
-\x8a\x46\x11\x15\x20\x13\xd0\xa7\xc2\xc2\x42\x3e\xa2\x40\xe8\x9c\
-\xe4\x4a\x27\x3c\x7b\xf6\x0c\x01\x01\x01\x58\xb5\x6a\x95\xa8\xb5\
-\x66\x4b\x8e\xc5\xda\x7d\x97\x50\x60\x91\xa1\xe5\xfb\x43\xd0\xb0\
-\x9c\xfb\x7b\xae\x4a\xa5\xc2\xc5\x8b\x17\x31\x7d\xfa\x74\x10\x04\
-\x01\x2f\x2f\x2f\xd1\x7b\xe4\xe4\xc9\x93\xff\xb6\xf7\x59\xf1\x75\
-\x46\xd3\x34\x7f\xff\x52\x82\x70\xdb\xc4\x95\xda\xbc\x12\x24\x12\
-\xe8\x11\x22\x28\x41\x82\x84\xff\x1e\xbc\xbd\xbd\xc1\x30\x0c\x64\
-\x32\x19\xfc\xfd\xfd\xf1\xd1\x47\x1f\x39\x25\x63\x70\x17\x66\xb3\
-\x19\x9f\x7e\xfa\x29\x6f\xd8\x2a\x14\x0a\xc1\xa1\x38\x79\x0f\xce\
-\xe2\x31\x5b\x09\xe5\xf3\x12\xb0\x7f\xa7\x06\x11\xe3\xdf\x86\x3b\
-\xe7\xe6\x5c\x82\x1b\xce\x38\xde\xb5\x6b\x17\x9f\x44\x43\x88\xc1\
-\x6d\xb1\x58\xd0\xb5\x6b\x57\xde\x53\x26\xfc\x0e\x27\x8b\xf8\x5b\
-\xf1\x90\x07\xd7\xc2\x1b\xd7\x17\x62\xcd\xde\xa6\x58\x3c\xb4\x96\
-\x5b\x2d\x70\xcf\x26\x49\x12\x95\x2b\x57\xc6\xa2\x45\x8b\x10\x1c\
-\x1c\x2c\x38\x81\x4a\x46\x46\x06\x06\x0d\x1a\x04\xb9\x5c\xce\x87\
-\x07\x0b\xdb\x8f\x59\x5c\x38\x7d\x0e\xba\xea\xed\xe1\x9b\x76\x14\
-\x47\x4f\x85\x60\x78\xaf\x06\x2e\xff\x9a\x2b\xdd\xc0\xb2\x2c\xd4\
-\x6a\x35\x2a\x55\xaa\x84\xbd\x7b\xf7\x0a\x0e\x45\x52\x28\x14\xd8\
-\xbf\x7f\x3f\x66\xcf\x9e\xcd\xcb\x23\x34\xf1\x91\x2d\x37\x03\x37\
-\x53\xf2\xe1\xcf\xdc\xc6\x9e\x43\x17\x51\x3f\xac\x33\x94\x72\xd2\
-\xad\xb5\xc6\x79\xeb\x34\x1a\x0d\x1a\x37\x6e\x8c\x15\x2b\x56\x94\
-\x58\x62\xa4\xb4\x03\x8e\x6d\xdb\xb6\x61\xe5\xca\x95\xbc\x6c\x82\
-\x3d\x4b\x4f\xaf\x61\xf7\x75\x07\xca\xb7\xa8\x8d\x1a\x89\x3b\xb1\
-\xee\xf4\x5b\x98\xdb\xad\xac\xdb\x6b\x8d\x24\x49\x28\x14\x0a\x0c\
-\x1c\x38\x10\x63\xc6\x8c\x11\x4c\x02\xed\x76\x3b\x16\x2d\x5a\xe4\
-\x94\x81\xb3\x4c\x99\x32\x82\xe6\x63\xf6\xb3\xbb\xb8\x7c\x97\x46\
-\x88\xbf\x11\x47\xae\xc7\xa3\x56\x68\x79\xe8\x29\xd7\xe7\x36\x97\
-\xf9\x9a\x24\x49\x78\x79\x79\xa1\x43\x87\x0e\x98\x35\x6b\x96\xe0\
-\x5a\x88\x5a\xad\x16\x9d\x3a\x75\xe2\xb3\x83\x52\x14\xf5\x67\xe9\
-\x07\x17\x0f\x4a\xf8\x6c\x9e\x07\xf6\x23\xd9\xaf\x15\x3a\x3e\xd9\
-\x82\xd9\x3b\xda\x62\x6f\x74\x84\x5b\x7d\xe1\xea\x2e\x2a\x14\x0a\
-\x18\x0c\x06\xcc\x9c\x39\x13\x0d\x1b\x36\x14\x6c\xbf\x65\x65\x65\
-\x61\xe2\xc4\x89\xfc\x01\xe0\xdf\x79\x97\x4c\xb2\x27\x25\x48\x24\
-\x50\x82\x04\x09\x12\x00\x1c\x3c\x78\x10\x27\x4e\x9c\x78\xa9\x58\
-\xfc\xa3\x47\x8f\x78\x23\x87\xa2\x28\xd4\xa8\x51\x03\xf5\xeb\xd7\
-\x17\xfc\x1c\x93\xc9\x04\x5f\x5f\x5f\x38\x1c\x0e\xc8\xe5\x72\xc4\
-\xc7\xc7\x63\xea\xd4\xa9\xa5\x7a\x29\x58\x96\x45\xcb\x96\x2d\xd1\
-\xa1\x43\x07\xfe\xbb\xb2\x91\x3d\xd1\xed\xd9\x6e\x4c\xfc\xe6\x3a\
-\x3e\x98\x31\x1a\x2a\x00\xc9\xc9\xc9\x58\xb6\x6c\x59\xa9\xf5\xc2\
-\x64\x32\x19\x0e\x1f\x3e\x8c\xd0\xd0\x50\xfe\xbb\xfa\xf5\xeb\x8b\
-\x0a\xbf\x72\x38\x1c\xfc\xef\x59\x96\xc5\xf5\xeb\xd7\xf1\xc5\x17\
-\x5f\x94\xe8\x11\xe0\x0a\xa0\x47\x47\x47\x23\x3c\x3c\x9c\xfb\x16\
-\x4d\xba\xbe\x83\xc4\x9d\x8b\x30\x6e\xf3\x33\x8c\xde\x51\xf4\xfd\
-\xed\xdb\xb7\xb1\x71\xe3\xc6\x52\xc7\x4a\x26\x93\xe1\xca\x95\x2b\
-\xbc\x11\xa9\xd7\xeb\xf1\xe6\x9b\x6f\xa2\x52\x25\xe1\x89\x2f\xd2\
-\xd2\xd2\xf8\xfa\x7c\x6a\xb5\x1a\x1b\x36\x6c\xc0\xad\x5b\xb7\x5c\
-\x22\x22\x3d\x7a\xf4\x40\xed\xda\xb5\x79\xd9\xda\xf4\x1f\x87\xd4\
-\xe3\x0b\x30\x71\xfb\x5d\x4c\xf9\x66\x2a\x00\x60\xef\xde\xbd\x88\
-\x8b\x8b\x2b\x51\x67\x5c\x34\x48\x7c\x7c\x3c\xba\x74\xe9\x02\x86\
-\x61\xa0\xd1\x68\x50\xab\x56\x2d\x51\x73\xff\x8f\x3f\xfe\xe0\x89\
-\xbb\x42\xa1\xc0\xd6\xad\x5b\xf1\xf0\xe1\xc3\x12\xc3\x9b\x58\x96\
-\x85\xcd\x66\xc3\xf4\xe9\xd3\x79\xcf\xb8\xc2\x37\x18\x03\xfa\x36\
-\xc1\x84\x91\xbb\x11\xd4\xbb\x12\x28\x8a\x04\x4d\xd3\xd8\xb9\x73\
-\x27\xe2\xe2\xe2\x4a\xf4\x7c\x93\x24\x89\xdc\xdc\x5c\x9e\x38\xb0\
-\x2c\x0b\x3f\x3f\x3f\xbc\xf1\xc6\x1b\xa2\x64\x8b\x8d\x8d\x05\xc3\
-\x30\x7c\x96\xc9\xb5\x6b\xd7\x22\x36\x36\xb6\xd4\xc3\x00\x85\x42\
-\x81\xf1\xe3\xc7\xff\x59\xbb\xd1\xbf\x29\xe6\xce\x0a\x87\xf1\xda\
-\x4e\x0c\xf9\x26\x15\x9f\x7f\x58\x16\xe6\x02\x23\x7e\xda\xf4\x33\
-\x1e\x3f\x7e\x5c\x6a\x3f\x32\x32\x32\x78\x72\xe2\x70\x38\x10\x14\
-\x14\x84\x7a\xf5\xea\x09\x96\x8b\xa6\x69\x94\x2f\x5f\x1e\xd9\xd9\
-\xd9\xfc\x9c\xff\xe4\x93\x4f\x4a\xf5\x76\x3b\x1c\x0e\x84\x84\x84\
-\xe0\xfd\xf7\xdf\x7f\x2e\x1b\x81\x72\x55\x9a\x62\x48\x5f\x06\x73\
-\xe6\x2c\x44\xed\x21\x6d\xa0\xa6\x08\x98\xcd\x66\x2c\x58\xb0\xe0\
-\xcf\x5a\x90\x25\x1c\xb6\x9c\x3f\x7f\xde\x69\x3c\x03\x03\x03\x45\
-\xdf\x55\x2d\x4e\x2c\x9f\x3d\x7b\x86\x05\x0b\x16\xa0\x6c\xd9\xb2\
-\xa5\xea\xcd\xcf\xcf\x0f\xe3\xc6\x8d\xe3\x3f\x47\xbc\xfb\x09\x3e\
-\xc9\xd8\x83\x1e\xb3\xef\x60\xf0\xf6\x8a\x00\x80\xf8\xf8\x78\x6c\
-\xdf\xbe\x9d\xcf\xfc\x5c\xd2\x9c\xbc\x79\xf3\x26\xef\xf9\x67\x59\
-\x16\xd5\xab\x57\x47\x83\x06\x0d\x04\xcb\x95\x91\x91\x01\x83\xc1\
-\xc0\xcf\xc9\xbc\xbc\xbc\x97\xf6\x48\x9a\xa6\x11\x18\x18\x88\xa1\
-\x43\x87\x4a\x77\xf5\x24\x48\xe0\xd6\xa3\x34\x04\x12\x24\x48\xf8\
-\x4f\x81\xa6\x69\xd8\xed\x76\x38\x1c\x0e\xd8\xed\x76\xfe\xef\x2f\
-\x1a\xc2\x62\x33\x0c\x72\xa5\x06\xb8\xb0\x27\x86\x61\xf8\xe7\x95\
-\xf4\xc7\xe1\x70\xf0\x5e\x83\xa3\xcb\x3e\x42\xcd\x6a\x9d\xb0\x2f\
-\x53\x81\xb0\x46\x51\x18\xd0\xbe\x0a\x92\x2f\x1f\x82\xb1\xc8\x7a\
-\x76\x92\xe1\xaf\xda\xb2\xd9\x6c\x2f\xc9\x22\xf6\x4e\x83\xdd\x6e\
-\x77\x32\x40\x69\x9a\x86\xd5\x6a\x2d\xb5\x3f\xdc\xef\x58\xda\x84\
-\x2d\xb3\x3e\x40\xb3\xae\x23\x71\xee\x01\x8d\xf0\xb7\xde\xc3\xe8\
-\xc1\xb5\x71\x2c\xe6\x44\x11\x31\x78\x1e\x5a\xed\x8a\x6c\xc5\x8d\
-\x45\x4f\x84\x64\xbf\x28\x9b\x2b\x3a\xe3\x65\x23\x48\x20\x27\x11\
-\xe3\xfa\xb6\x44\xcb\xc1\x3f\xc0\xa4\x94\x23\xb8\xf1\x7b\xe8\xd2\
-\xb4\x2a\xee\x5c\x3a\xef\x34\xff\x5c\xf9\x53\xdc\x7b\xe4\x89\xd0\
-\xf6\xe2\x63\xc3\x3e\x9f\x3f\xae\xe8\xcc\x6e\xb7\x03\x84\x0c\xc8\
-\x3c\x8f\xee\x4d\xea\xa1\xff\xc7\x3f\x20\x53\x15\x8a\xbe\xdd\xdf\
-\x44\x62\xec\x45\x14\x3e\xaf\x18\x4f\xd3\xb4\xcb\x7a\x2b\x2e\x8f\
-\x27\xee\x4c\x15\x9f\x07\x9c\x21\xef\xb2\x6c\x24\x85\xbc\x3b\x47\
-\xb1\xe2\xdd\xfa\x78\xb3\xc3\x08\x3c\xce\xd3\xa2\x6c\x8d\x8e\x78\
-\xb7\x95\x1f\x7e\x8d\xb9\x04\x85\x5c\xe6\x92\xde\xb8\xf1\x2c\x4e\
-\xe6\xc5\xde\xe3\xe3\xf6\x91\xe2\xb0\x58\x2c\x2e\xf7\x87\x25\x95\
-\x40\xd2\x5a\xd4\x0d\xaf\x81\x77\xa6\xae\x81\xb2\x4a\x63\xbc\xd7\
-\xa1\x2e\xce\xdf\x48\x45\xbe\x99\x01\xcb\xb2\x2e\x8d\x11\xa7\xdb\
-\xe2\xf0\x84\xde\x5e\x9c\x07\xae\xcc\x21\xae\x3f\x00\x10\xb7\x6f\
-\x31\xa2\xfb\xbd\x8d\x1b\x29\x69\x50\x87\x44\xe1\xb3\x21\x35\xb1\
-\x74\xf9\x51\xa7\xfd\xc0\x95\x71\x7a\x71\x8f\x7c\x71\x1f\x10\xa2\
-\xb7\x17\xd7\xef\xab\xc6\x5a\xba\x42\x22\x41\x82\x33\x24\x4f\xa0\
-\x04\x09\x12\xfe\x63\xe8\xd2\xa5\x0b\xba\x74\xe9\xf2\xd2\xf7\xb1\
-\xb1\xb1\xe8\xdb\xb7\x2f\x7f\x8a\xcf\x9d\x0a\x0b\x35\x74\x18\x86\
-\xe1\x4f\xeb\x6d\x36\x1b\xaa\x56\xad\x8a\x79\xf3\xe6\xb9\x75\x5f\
-\xa9\xf5\xb0\x05\x88\x1d\xaa\xc6\x83\x1d\x23\xf0\x83\xf6\x0b\x74\
-\xae\x5d\x1f\x69\xd7\x9f\xc1\x42\x03\x95\x42\x42\xb0\x68\xd1\x22\
-\x97\xda\xb1\x58\x2c\x48\x49\x49\xe1\x3f\x73\xa1\xa0\x42\xef\xbb\
-\x28\x14\x0a\x3e\xbc\x89\x20\x08\xd4\xae\x5d\x1b\x73\xe7\xce\x75\
-\xab\x9d\xde\x9f\xac\x42\x4f\x87\x05\xbf\x6c\xd9\x08\x6d\xb3\x76\
-\xe8\x1a\x55\x03\xfb\x37\x14\x25\xe3\xa9\x59\xab\x16\x16\x2e\x5c\
-\xe8\x52\x3b\xf7\xee\xdd\x43\x42\x42\x42\xd1\xcb\x83\xa2\xf8\xf0\
-\x5b\xa1\x7a\x2b\x9e\x58\xc4\x62\xb1\xa0\x5f\xbf\x7e\xfc\x5d\x2c\
-\xd7\xac\x5a\x1a\xf3\xd6\x1f\x84\x82\x74\xe0\xab\xa9\xff\x46\xaf\
-\xaf\xbf\xc5\x5b\x2d\x13\x71\xfa\x8e\x11\x2c\x80\x1e\x3d\x7a\xa0\
-\x47\x8f\x1e\xa5\x36\xf3\xec\xd9\x33\x5c\xbf\x7e\x9d\x37\x12\xb9\
-\xb2\x1e\x42\x49\x85\x4c\x26\x83\x5c\x2e\xe7\x65\xb3\xdb\xed\xe8\
-\xd3\xa7\x0f\x86\x0e\x1d\xea\x7a\x23\xba\x46\xd8\x72\xec\x34\x72\
-\x92\xef\x60\xcb\xda\x18\xb4\x6b\x52\x15\x5e\x57\x9f\x81\x61\x59\
-\xc8\x64\x14\xde\x79\xe7\x1d\x97\x8a\xaa\x3f\x7a\xf4\x08\x9b\x37\
-\x6f\xe6\x8d\x63\x6e\x4d\x88\x91\x8d\x0b\x0b\xe6\x42\xba\xfb\xf7\
-\xef\x8f\xee\xdd\xbb\xbb\xae\xb6\xaa\xad\x31\x6c\xd3\x45\xf4\x3d\
-\xf9\x2d\x06\xae\xbf\x83\x21\xe3\xea\xa1\x79\xb3\xea\x38\x77\xb5\
-\x00\x32\xa5\x16\xd1\xd1\xd1\x2e\xb5\x93\x90\x90\x80\x0d\x1b\x36\
-\xf0\x73\x50\xa5\x52\x89\x26\x82\xc5\xc3\xad\x69\x9a\xc6\x9c\x39\
-\x73\xdc\x0a\x9b\x44\x68\x7f\x9c\xb9\xdc\x0b\x29\x97\x76\x60\xf6\
-\x82\xe3\x58\xf0\xf6\x9b\xd8\x7c\x4a\x0e\x9a\x61\xa1\xd1\x6a\x30\
-\x7b\xf6\x6c\x97\x9a\x59\xbe\x7c\x39\x7e\xff\xfd\x77\xa7\xbd\x40\
-\xac\xde\xb8\xf9\xc8\x30\x0c\x02\x02\x02\x30\x6e\xdc\x38\xd4\xac\
-\x59\xd3\xe5\x36\xde\x8c\x8a\x46\x83\x2e\xc3\xb0\x66\x60\x34\x6e\
-\x7e\xf9\x0d\x3e\xec\x50\x0f\x85\x5f\x17\x02\x00\x22\x23\x23\x5d\
-\xce\xf4\x19\x13\x13\x83\x4f\x3e\xf9\x84\x97\x4b\xab\xd5\x8a\x22\
-\xb9\x2c\xcb\xf2\xf5\x4a\x19\x86\x81\x97\x97\x17\x66\xce\x9c\x29\
-\xbd\x80\x25\x48\x90\x48\xa0\x04\x09\x12\x5e\x37\x70\x27\xc1\x14\
-\x45\xc1\x62\xb1\xa0\x57\xaf\x5e\xf0\xf1\xf1\x11\xdc\x1e\xc3\x30\
-\xb8\x7f\xff\x3e\x5a\xb7\x6e\x8d\x7b\xf7\xee\x81\x61\x18\xd8\x6c\
-\x36\xb7\x48\x20\xa5\x50\x43\x07\x20\xa4\xcd\x87\x38\xdf\xa1\x2e\
-\x36\x96\x69\x89\xd9\xdf\xae\x41\x80\x9b\xd9\x1c\xb8\xbb\x56\x04\
-\x41\x80\xa2\x28\x54\xab\x56\x4d\x70\x62\x18\x92\x24\x61\xb3\xd9\
-\xf0\xe4\xc9\x13\xde\x80\x13\x62\x04\xca\x95\x6a\xc8\x95\x6a\xb4\
-\xa9\xe9\x83\x71\x13\xdf\xc3\xcd\xfb\x2a\xac\x39\x73\xd2\xed\x76\
-\xb8\x67\x6b\x34\x1a\x5c\xbb\x76\x0d\x4d\x9a\x34\x81\x97\x97\x97\
-\xe0\x3b\x58\x56\xab\x15\x16\x8b\x85\xd7\x13\xe7\x11\x70\xf9\x5e\
-\x0d\x21\x83\x5a\x53\x14\xda\x35\xa8\x4b\x25\xb4\xab\x5d\x0b\x95\
-\x6b\x35\xc0\x17\x4b\xd7\xba\x95\x8d\x91\xa6\x69\x27\xd9\x12\x13\
-\x13\x51\xbd\x7a\x75\xc1\x49\x38\x58\x96\x45\x5a\x5a\x9a\x53\xfd\
-\x4b\xb7\xf5\x46\xc8\xa0\xd1\xea\xa0\xa9\x5e\x1d\xc1\xc7\x63\xd0\
-\xbd\xe3\x51\x4c\xdf\xb2\x07\x06\x37\x8b\xc5\x17\xf7\xba\xa8\xd5\
-\x6a\xec\xde\xbd\x1b\x41\x41\x41\x82\x0d\x6f\x92\x24\x91\x95\x95\
-\x05\x9d\x4e\xc7\xcb\xea\xee\xdc\x26\x64\x14\x28\x00\xbe\xed\x47\
-\xa0\xd5\x9a\x0e\xf8\xa2\x76\x36\x54\xd5\x5b\x60\xe5\x96\xf1\x6e\
-\xaf\x7b\x6e\xbe\x04\x04\x04\x60\xe6\xcc\x99\xd8\xba\x75\xab\x60\
-\xbd\xd9\x6c\x36\xa4\xa4\xa4\xe0\x5f\xff\xfa\x17\xff\xbd\xdb\x9e\
-\x7c\x52\x01\x9d\x41\x81\xb0\x3a\xad\x51\xf6\x87\x5e\x28\xdb\xb7\
-\x0c\x56\xac\x5b\x02\x1f\xad\xcc\xed\xb5\xc6\x8d\xab\x4c\x26\xc3\
-\xc6\x8d\x1b\x71\xfc\xf8\x71\xc1\xb2\xd1\x34\x8d\xc7\x8f\x1f\xf3\
-\xe1\xe1\x2c\xcb\xba\x3d\x27\x29\xb9\x02\x80\x02\x43\xbf\xec\x8a\
-\xb6\x9d\xdf\xc2\x3c\xb6\x3c\x96\x1e\x3e\x2c\x78\xff\xe7\x0e\x14\
-\xda\xb6\x6d\x8b\xe0\xe0\x60\x41\x7b\x3f\x17\x0a\xfc\xe0\xc1\x03\
-\x74\xee\xdc\x59\x74\xc6\x62\x09\x12\x24\x12\x28\x41\x82\x04\x09\
-\xff\x61\x70\xa7\xd1\x43\x86\x0c\xc1\xd3\xa7\x4f\x45\x97\x1a\x50\
-\x2a\x95\x68\xdc\xb8\x31\x2e\x5c\xb8\x20\xaa\x5f\xfa\xc0\x46\xd8\
-\x7e\xfd\xc9\x9f\x5f\xb0\x70\xbb\x84\x19\x77\xff\x64\xd4\xa8\x51\
-\xfc\xbd\x29\xa1\x20\x49\x12\x85\x85\x85\xa8\x50\xa1\x82\xe8\x62\
-\xf1\x41\x8d\x7b\x61\xfb\xc1\x5e\xa2\x75\x57\xb9\x72\x65\x4c\x9c\
-\x38\x91\x0f\x29\x13\xa3\x37\x83\xc1\x80\xf0\xf0\x70\xd1\x21\xc1\
-\x41\xed\x26\x22\x21\x71\xa2\xe0\x7e\x70\x73\xf2\xad\xb7\xde\x82\
-\x5c\x2e\x87\xd9\x6c\x16\x25\x17\x49\x92\x90\xc9\x64\xe2\xd3\xc4\
-\x13\x7a\x74\x1f\x33\x1f\xdd\xc7\x88\x6b\x86\x24\x49\xb4\x6b\xd7\
-\x0e\x66\xb3\x59\xf4\x9c\x94\xcb\xe5\xd0\x68\x34\xd0\x68\x34\xa2\
-\xf4\xcf\xb2\x1a\x4c\xde\x76\x16\x93\x45\xc8\xc5\xb2\x2c\x34\x1a\
-\x0d\xfa\xf6\xed\x8b\x9a\x35\x6b\x8a\xaa\xcb\xc8\xcd\x83\x37\xdf\
-\x7c\xf3\xa5\xef\xdc\x85\xd2\x37\x04\x9f\x6e\xbb\x8c\x4f\x45\xae\
-\x35\x85\x42\x81\xe8\xe8\x68\x14\x14\x14\x88\x0a\x67\x24\x08\x02\
-\x72\xb9\x1c\x81\x81\x81\x4e\x87\x13\x02\x46\x1c\xa8\xd8\x1b\xc7\
-\x6f\xf4\x16\xb3\x45\xc2\xe1\x70\x20\x38\x38\x18\x23\x47\x8e\x44\
-\x76\x76\xb6\x47\x64\x6b\xd6\xac\x19\xe2\xe2\xe2\xa4\x97\xab\x04\
-\x09\x12\x09\x94\x20\x41\xc2\xeb\x0c\x9a\xa6\x11\x14\x14\x84\x69\
-\xd3\xa6\x79\xb4\x5d\xb1\x64\xe2\x65\x0b\xc3\xfd\x9f\x38\x1c\x0e\
-\x94\x2f\x5f\x1e\xdf\x7d\xf7\x9d\x47\xbb\xf2\x3a\x9c\x70\x73\xc9\
-\x45\xbe\xf9\xe6\x1b\x8f\xb5\x69\x36\x9b\x5f\x8b\x74\xe0\x0e\x87\
-\x03\xdd\xba\x75\x43\xb7\x6e\xdd\x3c\xd6\xa6\x27\x8b\xc5\x8b\x9a\
-\xc6\x04\x81\xf6\xed\xdb\xa3\x7d\xfb\xf6\x1e\x6b\x33\x2e\x2e\x4e\
-\xe4\x21\x80\xf8\x3e\x70\xa1\xe0\x83\x07\x0f\xf6\xe8\x78\x6d\xdd\
-\xba\xf5\xb5\x58\x6b\x4a\xa5\x12\xb3\x66\xcd\xf2\x68\xbb\x2b\x56\
-\xac\xf0\xe8\x86\x28\x44\x8d\x36\x9b\x0d\xd5\xaa\x55\x73\x2b\x8c\
-\xd8\x15\x7c\xff\xfd\xf7\x92\x27\x50\x82\x04\x89\x04\xfe\xfd\x9b\
-\xf7\x5f\x19\x34\xee\x16\x54\xf7\x64\x5b\x12\x24\xbc\x2e\xe0\xb2\
-\xb8\xc5\xc5\xc5\xa1\xa0\xa0\x40\xf4\x3c\x26\x08\x02\xf5\xeb\xd7\
-\xe7\xef\x73\xfd\xdd\xb2\xe5\xe7\xe7\xe3\xc4\x89\x13\x7c\xf6\x4b\
-\x31\x72\x99\x4c\x26\xa7\x10\xb5\xbf\x9b\x4c\x00\x45\x99\x5f\x3d\
-\xb1\xf7\x50\x14\x85\xd0\xd0\x50\x8f\x14\x8b\xf7\x84\xde\x12\x12\
-\x12\x90\x9c\x9c\xec\x31\x43\xb2\x45\x8b\x16\xaf\xcd\x3b\x29\x25\
-\x25\x05\x37\x6f\xde\xf4\xc8\x1a\xa1\x28\x4a\x7c\xb1\x78\x96\x15\
-\xcd\x04\xb9\x44\x50\x37\x6f\xde\x74\x29\xa3\xa8\x2b\xa4\x32\x38\
-\x38\xf8\xb5\x49\x22\x42\xd3\x34\x4e\x9e\x3c\xe9\xb1\xc3\x04\x9d\
-\x4e\x27\xa2\xcc\xcc\xab\xd5\x26\xc4\x13\x28\x93\xc9\x90\x9e\x9e\
-\x8e\x67\xcf\x9e\xc1\x64\x32\x79\x44\xb6\xda\xb5\x6b\xff\xed\xc5\
-\xe2\x25\x48\x90\x48\xe0\xff\x23\xe4\xe7\xe7\xe3\xd3\x4f\x3f\xc5\
-\xfd\xfb\xf7\x11\x16\x16\x86\xb1\x63\xc7\xa2\x4a\x95\x2a\x60\x18\
-\x06\x07\x0f\x1e\xc4\x8f\x3f\xfe\x08\x9b\xcd\x06\x93\xc9\x84\x3e\
-\x7d\xfa\x20\x38\x38\x18\x31\x31\x31\x58\xb7\x6e\x1d\x80\xa2\xf4\
-\xeb\xeb\xd6\xad\xc3\xdc\xb9\x73\x31\x67\xce\x1c\xd4\xa9\x53\x07\
-\x6f\xbf\xfd\x36\x80\xa2\x64\x04\xab\x56\xad\xc2\xa3\x47\x8f\x30\
-\x6c\xd8\x30\xd4\xab\x57\x0f\xab\x57\xaf\xc6\xc1\x83\x07\xe1\x70\
-\x38\x60\xb5\x5a\x31\x74\xe8\x50\xa7\xcb\xff\x99\x99\x99\x38\x7d\
-\xfa\x34\x3a\x76\xec\x88\xbd\x7b\xf7\xe2\xdd\x77\xdf\x95\x94\x24\
-\xe1\x1f\x09\x99\x4c\x86\x07\x0f\x1e\x60\xcc\x98\x31\xb8\x7d\xfb\
-\xb6\xa8\x97\x37\x41\x10\xd0\x68\x34\x58\xb0\x60\x81\x68\x32\x41\
-\x9b\x8d\x58\x34\xa1\x37\xf6\xa6\x55\xc6\x17\x0b\xbe\x45\xeb\x08\
-\xf7\xcb\x3b\xc8\xe5\x72\xdc\xbf\x7f\x1f\x03\x07\x0e\x44\x5e\x5e\
-\x9e\x68\x12\xc8\xb2\x2c\xae\x5e\xbd\x2a\xba\x58\x3c\x72\xee\xe0\
-\x93\x4f\x66\xe0\xb7\x04\x0a\xdf\xed\xda\x8a\xfa\x65\x84\x35\x73\
-\xe5\xca\x15\xf4\xec\xd9\x13\x34\x4d\x8b\xd6\x5b\x48\x48\x08\x66\
-\xcf\x9e\x5d\x6a\xf9\x8d\x52\x61\xbc\x8a\xf7\xba\x44\xc3\x16\xd1\
-\x0c\x5f\x7c\xbd\x00\x35\x7d\x85\x11\x9b\x75\xeb\xd6\xe1\xc7\x1f\
-\x7f\x44\x4e\x4e\x8e\xa8\x79\xc4\x25\x86\x29\x9e\x24\x48\x28\xfe\
-\x38\xb5\x01\x9f\xcc\xfc\x19\xef\x2f\x5a\x8f\xb7\xeb\x96\x15\x94\
-\xd6\x9b\x65\x59\xac\x5e\xbd\x1a\xf3\xe6\xcd\x13\x6d\x28\x2b\x95\
-\x4a\x04\x07\x07\x63\xf1\xe2\xc5\xe2\xd6\x1b\x41\xe0\xde\xcf\x13\
-\xb0\x7a\xc3\x39\x9c\xf5\x69\x87\xb5\xeb\xe6\xc2\xdd\xe5\x46\x92\
-\x24\x8c\x46\x23\x66\xcc\x98\x81\xc3\x87\x0f\x8b\x0e\x07\x25\x49\
-\x12\xdd\xbb\x77\x17\xef\x31\xa5\x8d\x38\xb5\x76\x3a\xa2\x57\x3e\
-\xc4\x57\xab\x16\xa1\x4b\xbd\x2a\x6e\xeb\x8d\x20\x8a\xca\x4a\xf4\
-\xef\xdf\x1f\xb9\xb9\xb9\x30\x9b\xcd\x82\x0f\x5e\x58\x96\xe5\x43\
-\xaf\xa7\x4d\x9b\x26\x72\x4f\x2a\xc0\x92\x7e\x9d\xb1\x2a\x25\x08\
-\xab\x77\x6d\x42\x33\x5f\x42\xd0\x1c\xba\x71\xe3\x06\x96\x2e\x5d\
-\x8a\x7b\xf7\xee\x89\xf2\x28\x93\x24\x09\xa5\x52\x89\x19\x33\x66\
-\xf0\x59\xa2\x25\x48\x90\xe0\xc2\xda\x91\x86\xa0\x64\x58\x2c\x16\
-\x9c\x3a\x75\x0a\x0a\x85\x02\x09\x09\x09\x08\x0f\x0f\xc7\xe5\xcb\
-\x97\x79\x82\x77\xe1\xc2\x05\x44\x44\x44\xa0\x7a\xf5\xea\x08\x0c\
-\x0c\x84\x42\xa1\x40\x4c\x4c\x0c\x9e\x3e\x7d\x0a\x00\xd8\xbe\x7d\
-\x3b\x12\x12\x12\x20\x97\xcb\x71\xec\xd8\x31\xbe\x06\x56\x7c\x7c\
-\x3c\xde\x7a\xeb\x2d\xac\x5b\xb7\x0e\xc9\xc9\xc9\x88\x8a\x8a\xc2\
-\xad\x5b\xb7\xf0\xfb\xef\xbf\x23\x3d\x3d\x1d\x11\x11\x11\xa8\x56\
-\xad\xda\x4b\xc9\x32\x2e\x5e\xbc\x88\xf3\xe7\xcf\x23\x29\x29\x09\
-\x67\xce\x9c\x91\x14\x24\xe1\x9f\xb9\xf1\x3c\xf7\x1e\xd8\x6c\x36\
-\xd8\x6c\x36\xec\xdf\xbf\x1f\x66\xb3\x19\x26\x93\x49\xd0\x9f\xa7\
-\x4f\x9f\xa2\x55\xab\x56\x48\x4f\x4f\xe7\xcb\x44\x08\x35\x04\x9e\
-\x3e\xd8\x85\xcc\xc0\x7e\x58\x3e\xa6\x3d\x12\x4f\xed\x28\x2a\x11\
-\xe1\xa6\xe1\xc6\x25\x62\xc8\xce\xce\x46\x76\x76\xb6\x60\xd9\xcc\
-\x66\x33\xf2\xf2\xf2\x10\x10\x10\x00\xbb\xdd\x2e\x4a\x2e\x00\x38\
-\xb0\xfb\x24\x22\xfb\xcf\xc2\xce\x79\x75\xb0\xf3\xe7\xb3\xa2\x0e\
-\xc7\x22\x22\x22\x70\xeb\xd6\x2d\x58\x2c\x16\xc1\x7a\x7b\xf8\xf0\
-\x21\xcc\x66\x33\x5f\x94\x9d\x24\x49\xc1\xf2\xed\x5c\xb4\x02\x35\
-\xbe\xdc\x89\xaf\x87\x37\xc2\xf5\xd3\xee\xef\x8d\xdc\x73\xb9\xf1\
-\x76\x38\x1c\x82\xe5\xa2\x69\x1a\xeb\xd7\xaf\x87\x4c\x26\xe3\x09\
-\x97\x60\xe3\x3d\x33\x09\x3b\x2f\x9b\xd0\x3f\xba\x0b\x1e\x5e\xb8\
-\x08\xab\x9d\x16\xb4\xd6\x58\x96\x45\x5e\x5e\x1e\x3a\x74\xe8\x00\
-\x9a\xa6\x05\xcb\x66\xb7\xdb\xb1\x70\xe1\x42\xa4\xa5\xa5\x89\xf7\
-\x96\x9a\xcf\x60\xe8\x2a\x05\xfe\xe8\xfb\x0b\xb6\x0c\xab\x88\xf5\
-\xbb\xfe\x10\xb4\xd6\x18\x86\xc1\xa3\x47\x8f\x30\x61\xc2\x04\xc1\
-\x72\x99\x4c\x26\xe4\xe6\xe6\x62\xc4\x88\x11\xc8\xc9\xc9\xe1\x65\
-\x13\xa6\x37\x16\x4f\x12\xaf\x60\xdf\x05\x25\x16\x2f\x8a\xc6\xdd\
-\x94\xc7\xc8\xb7\x31\x82\xe6\x23\xcb\xb2\x28\x2c\x2c\xc4\x80\x01\
-\x03\xc0\x30\x8c\x60\xd9\x18\x86\x41\x60\x60\x20\xf2\xf3\xf3\x45\
-\xef\x91\x8f\x57\x0c\xc3\xfe\x7a\xcb\x70\x63\x51\x53\x7c\xfd\xe3\
-\x25\xc1\x6b\xcd\x6e\xb7\x23\x33\x33\x13\xfb\xf6\xed\x43\x61\x61\
-\xa1\x60\xd9\x92\x92\x92\x10\x19\x19\x89\xdc\xdc\x5c\xe9\xe5\x2a\
-\x41\x82\x3b\x07\x9f\xd2\x10\x94\x7e\x7a\xa6\x56\xab\x31\x78\xf0\
-\x60\x74\xeb\xd6\x0d\x13\x26\x4c\x40\xef\xde\xbd\xf1\xe0\xc1\x03\
-\x38\x1c\x0e\xbc\xf1\xc6\x1b\x4e\xa9\xe3\x0b\x0a\x0a\x40\x51\x14\
-\x76\xee\xdc\x89\x51\xa3\x46\x21\x2e\x2e\x0e\x75\xea\xd4\x79\x29\
-\x63\xd5\xf2\xe5\xcb\x51\xb5\x6a\x55\xfc\xfa\xeb\xaf\x90\xcb\xe5\
-\x48\x4f\x4f\x87\x46\xa3\x41\x56\x56\x16\xfa\xf5\xeb\x87\xe8\xe8\
-\xe8\x97\x42\x3d\xd3\xd3\xd3\xb1\x6d\xdb\x36\xe4\xe5\xe5\x61\xd9\
-\xb2\x65\x48\x4b\x4b\xc3\xdd\xbb\x77\x11\x11\x11\x21\x29\x4a\xc2\
-\x6b\x89\x3f\xfe\xf8\x03\xc9\xc9\xc9\x4e\xe1\x67\x24\x49\xe2\xfa\
-\xf5\xeb\xa0\x28\xca\xc9\x88\x13\x93\x40\xc3\x6a\xb5\xf2\xeb\x8b\
-\xcb\x5e\x78\xfa\xf4\x69\x97\x8a\xb4\x07\x07\x07\x23\x2c\x2c\x0c\
-\x76\x8b\x09\x66\x87\x0c\xd9\xbf\xef\xc2\x8d\xf8\x70\x1c\x0e\xac\
-\x85\x2e\xef\xf6\x83\x01\x40\x6e\x6e\x2e\x2e\x5d\xba\xc4\xa7\x21\
-\x2f\xc9\x20\x7d\xf8\xf0\xe1\x4b\xde\x11\x31\xb2\xbd\x58\x93\x2d\
-\x23\x23\x03\x67\xce\x9c\x29\xb1\xec\x04\x97\x79\xb3\x41\x83\x06\
-\x28\x53\xa6\x0c\x6c\xe6\x42\xb0\x8c\x0d\xb9\x26\x23\x12\x76\x7c\
-\x8f\x3b\xfe\x0d\x30\x6e\x72\x53\x7e\x5f\xb9\x79\xf3\x66\x89\x61\
-\x7d\x9c\x6c\xe9\xe9\xe9\x4e\xa4\x82\xa2\x28\xb7\x32\xb0\xbe\x88\
-\xe2\x1e\x29\x8a\xa2\x70\xfb\xf6\x6d\x9c\x38\x71\xa2\x54\xe3\x94\
-\x24\x49\x54\xab\x56\x0d\x81\x81\x01\x30\x15\x14\x40\xa6\x26\x70\
-\xed\x69\x0e\xa8\xdf\x56\x63\x9f\x6f\x38\xde\x1b\xdc\x12\x00\x70\
-\xf7\xee\xdd\x52\x43\x04\x09\x82\x40\x76\x76\x36\xb2\xb2\xb2\x9c\
-\x64\xe3\x92\x0d\x79\x02\x32\x99\x0c\xf1\xf1\xf1\xb8\x70\xe1\x42\
-\xa9\xa1\x6f\x0e\x87\x03\x2d\x5b\xb6\x84\x42\x21\x43\x61\x81\x19\
-\xd9\x4f\xf3\x61\xcf\xbc\x8e\x63\x05\x91\x18\x35\xb4\x05\x54\xf2\
-\xa2\x4c\xb3\xf1\xf1\xf1\x78\xf2\xe4\x49\x89\xa1\x9d\x14\x45\xe1\
-\xd1\xa3\x47\x7c\x86\xcb\xe2\xe3\x2a\x46\xb6\xe2\x04\x89\x65\x59\
-\x24\x24\x24\xe0\xdc\xb9\x73\xa5\x66\xd2\x94\xc9\x64\x68\xdc\xb8\
-\x31\x14\x14\x09\x9b\x9d\x81\x35\xf6\x3a\xe8\x50\x1d\x82\xcc\x3b\
-\x10\x13\x5f\x01\x1f\x8f\x0e\x87\xdd\x6a\xc1\x8d\x5b\xb7\x61\x34\
-\x1a\x4b\xd5\xdb\xc3\x87\x0f\x9d\xe6\x27\x77\x87\x4e\xec\x3b\xbf\
-\xb8\x7c\xa7\x4f\x9f\x86\x8f\x8f\x4f\x89\x9e\x2a\x86\x61\xe0\xed\
-\xed\x8d\x9a\xb5\x6a\x41\x29\x63\x61\xcc\x2f\xc4\x93\x8c\xbb\xb8\
-\xf6\x24\x0f\x65\x6f\x24\xa3\x7d\xb7\x9e\xf0\x52\x90\x70\x38\x1c\
-\x38\x77\xee\x5c\xa9\x9e\x58\x83\xc1\x80\xa4\xa4\x24\xa7\xf5\xcd\
-\xcd\x4d\x31\xf2\x15\x27\x7f\x85\x85\x85\xb8\x72\xe5\x0a\x8c\x46\
-\x63\xa9\xf7\xa8\x35\x1a\x0d\x1a\x35\x6a\x04\x87\xdd\x0a\x99\xdc\
-\x81\xdd\x67\x28\x84\xd5\xdf\x87\x59\x87\x0c\xf8\x7e\x72\x51\x91\
-\xf7\x8c\x8c\x0c\xc4\xc7\xc7\x97\xea\xd1\xa3\x28\x0a\xb7\x6e\xdd\
-\xe2\xf7\x48\x6e\xbc\x95\x4a\xa5\x60\x52\xfa\xe2\xfe\x6a\xb5\x5a\
-\xf9\x6b\x06\xc5\x75\xa4\xd3\xe9\x50\xb7\x6e\x5d\x51\x7b\x96\x04\
-\x09\x12\x09\xfc\x1f\x02\xf7\x62\xe1\x42\x4c\xba\x74\xe9\x82\x25\
-\x4b\x96\xf0\xf5\x96\x2e\x5d\xba\x84\x8f\x3e\xfa\x08\x26\x93\x09\
-\x8b\x16\x2d\x82\xb7\xb7\x37\x9a\x37\x6f\x8e\xe3\xc7\x8f\xa3\x57\
-\xaf\x5e\x48\x4e\x4e\xc6\x47\x1f\x7d\xf4\xd2\x09\xd8\x83\x07\x0f\
-\xd0\xaf\x5f\x3f\x7e\x33\x0a\x08\x08\x40\x6e\x6e\x2e\xb4\x5a\x2d\
-\xd6\xaf\x5f\x8f\x84\x84\x04\xd8\x6c\x36\xfc\xf0\xc3\x0f\xfc\x6f\
-\xf5\x7a\x3d\x52\x53\x53\x11\x15\x15\x85\xab\x57\xaf\xa2\x5e\xbd\
-\x7a\x2e\x19\xb9\x12\x24\xfc\x5d\x38\x76\xec\x18\x36\x6e\xdc\xf8\
-\x52\x9d\xad\xdc\xdc\x5c\x27\x63\x46\xd4\xbd\xa2\xe7\xbf\xe7\xda\
-\xa0\x28\x0a\x0f\x1f\x3e\xc4\xc2\x85\x0b\x4b\x34\x90\x39\xe3\xe3\
-\xdd\x77\xdf\x43\x58\x58\x18\xce\xac\xff\x14\x9f\xac\xc9\x42\xdf\
-\x5e\x34\xfc\x6a\x34\x40\x6d\x7d\x12\xb6\xfd\xb0\x12\xe3\xa7\x8d\
-\xc2\xe3\xd4\x54\xcc\x9c\x39\x13\x1a\x8d\xa6\xd4\xfd\xe2\xfa\xf5\
-\xeb\x4e\xf7\xc0\x3c\x21\x1b\xb7\x6f\x10\x04\x81\xa4\xa4\x24\xcc\
-\x9d\x3b\xb7\x54\x43\x32\x33\x33\x13\xab\x56\xad\x82\x8f\x97\x06\
-\x3b\x97\x8c\xc1\x9a\x4b\x14\xca\xfa\xfb\xa2\x65\xbb\x9e\xa8\xed\
-\xd8\x8b\x4f\xe7\xfa\x63\xdd\xcc\xae\x48\x4c\x4c\xc4\xac\x59\xb3\
-\xa0\x50\x28\x4a\x34\xc2\x48\x92\x44\x7c\x7c\x3c\x2a\x55\xaa\xc4\
-\xf7\xc5\x13\xb2\x15\x27\x25\xfb\xf6\xed\xc3\x8d\x1b\x37\x4a\xec\
-\x07\x67\x30\x4e\xfa\x78\x0a\x02\x55\xf9\x98\x11\x3d\x0a\x89\xba\
-\xee\x08\xc9\xca\x46\x58\xdf\xee\x88\x78\x7a\x0c\xdb\xb6\x1c\xc2\
-\xd8\x41\x1d\x71\xe8\xd0\x41\xec\xdb\xb7\xdf\xa5\x43\x84\x07\x0f\
-\x1e\x78\xf4\x3e\x69\x71\x4f\x8e\x5c\x2e\xc7\xc1\x83\x07\x11\x1f\
-\x1f\x5f\xa2\xde\x18\x86\x81\xd9\x6c\xc6\xee\x3d\xfb\xe0\xc7\x26\
-\x62\x70\x9f\x89\xa0\x03\x6b\xc1\xa7\x72\x08\x5a\x05\x65\x63\xd5\
-\x0f\x3b\x30\x67\xfa\x20\x68\x48\x16\x7b\xf6\xec\xc1\xfe\xfd\xfb\
-\xa1\x56\xab\x4b\xec\x83\xc9\x64\x72\x0a\x91\xf4\x44\xa8\x5c\xf1\
-\xf9\xc8\xb2\x2c\x36\x6f\xde\x8c\x93\x27\x4f\x96\xea\x19\x54\xa9\
-\x54\x58\xbf\x61\x13\xe4\x4f\x2f\x61\xeb\xbc\x39\xf8\xe5\xda\x15\
-\xdc\x0a\x18\x8b\x7a\x5d\x3b\xa0\x66\xfa\x26\x7c\xb2\xb4\x32\xbe\
-\x1b\x1c\x81\x75\xeb\xd6\x21\x31\x31\xb1\xd4\xbe\xe6\xe7\xe7\xf3\
-\x84\xdd\x13\xf7\xe3\x5f\xf4\x44\x53\x14\x85\x25\x4b\x96\x94\x4a\
-\x1a\x6c\x36\x1b\x6a\xd5\xaa\x85\x99\xb3\xbf\x82\x32\x6b\x3b\xa2\
-\xba\x2f\x86\xa2\x82\x01\x8c\x6f\x27\xbc\x59\x81\xc6\xd2\xed\xbf\
-\xe3\xeb\x51\x5d\x40\xd9\x4d\x98\x3f\x7f\x3e\xac\x56\x6b\x89\x6b\
-\x87\x0b\x95\x2f\x4e\xa8\x3c\x19\xe2\x48\x92\x24\xb2\xb3\xb3\xf1\
-\xc3\x0f\x3f\xc0\x60\x30\x94\xa8\x37\x96\x65\x51\xb1\x62\x45\x34\
-\x6a\xd4\x08\xd7\x8e\xae\xc6\x9e\xe3\x67\x60\xbc\x7f\x13\x85\x1d\
-\xc6\xa2\x7f\xf0\x76\x74\x9d\xb8\x0b\x37\x96\xf7\xc0\xdd\xbb\x77\
-\xb1\x68\xd1\x22\x14\x14\x14\x94\x28\x1b\xcb\xb2\x78\xfa\xf4\x29\
-\x3f\x6f\xb9\x7d\x44\x8c\x7c\xc5\xbd\x9a\x24\x49\xc2\x64\x32\xe1\
-\xdf\xff\xfe\xb7\xd3\xbf\xb1\xdb\xed\xa8\x5c\xb9\x32\x16\x2f\x5e\
-\x0c\x2f\x2f\x2f\xe9\xe5\x2c\x41\x82\x44\x02\x05\x0c\xd8\xf3\xd3\
-\xab\xc2\xc2\x42\x7e\xe3\xe2\xc2\x48\xb8\x97\xfb\xc8\x91\x23\x31\
-\x7d\xfa\x74\x1c\x38\x70\x00\x04\x41\xa0\x6a\xd5\xaa\x4e\x6d\x38\
-\x1c\x0e\xd8\xed\xf6\x57\x1a\x1c\xdc\x46\x66\x34\x1a\x5f\x79\xaa\
-\x6a\x32\x99\x10\x11\x11\x81\x3b\x77\xee\xa0\x72\xe5\xca\x28\x5f\
-\xbe\xbc\xa4\x14\x09\xaf\x2d\x46\x8d\x1a\x85\x51\xa3\x46\xbd\xf4\
-\xfd\xcd\x9b\x37\xf9\x44\x27\x34\x4d\xc3\x68\x34\xc2\x68\x34\x0a\
-\x0e\x2f\x2b\x2c\x2c\xe4\xd7\xa4\xd5\x6a\x45\xe3\xc6\x8d\x71\xd8\
-\xcd\xfa\x55\x0d\xde\x1e\x8f\xf5\xad\x64\x70\x3c\x5c\x8d\xac\xeb\
-\x14\xe4\x94\x16\x1a\xad\x1c\x36\x1a\x88\xac\x59\x13\x67\xcf\xba\
-\x16\x3e\x39\x75\xea\x54\x24\x25\x25\x39\x11\x5e\xa1\x05\xd5\x39\
-\x83\xa6\xb8\x31\xd8\xaa\x55\x2b\x1c\x38\x70\xc0\xe5\x36\x58\x96\
-\x41\xbb\x81\x9f\xa1\x6e\x1f\x1a\xb1\x27\x8e\x80\x52\xa9\x20\x23\
-\xfd\x60\xa0\x8a\xfa\xd3\xa2\x45\x0b\x9c\x3e\x7d\xda\xa5\xb6\xfa\
-\xf5\xeb\x87\x5b\xb7\x6e\xf1\xe3\x9c\x93\x93\x03\x7f\x7f\x7f\x41\
-\xf7\x79\x08\x82\x40\x5e\x5e\x1e\x7f\x87\xa7\xa0\xa0\x00\xb3\x67\
-\xcf\x46\xdf\xbe\x7d\x5d\x6f\xc4\x6e\xc2\xd8\x99\xdf\x83\x56\x79\
-\x63\xdf\xb2\xdb\x28\x23\x27\x40\x29\x0c\x50\x12\x04\x58\x00\x63\
-\xc7\x8e\xc3\xd8\xb1\xe3\x4a\x6d\xc6\x64\x32\xa1\x73\xe7\xce\x7c\
-\xc8\xad\xcd\x66\x83\xdd\x6e\x17\x9c\xb0\x42\x2e\x97\xc3\x68\x34\
-\xf2\x25\x3d\xcc\x66\x33\xa6\x4f\x9f\x8e\xfe\xfd\xfb\xbb\xde\x88\
-\xa3\x26\xe6\xae\x58\x03\x6b\x6e\x26\x0e\x5f\xbc\x03\x95\x8f\x1d\
-\xba\xa7\x32\x00\x45\x1e\xd8\xa9\x53\xa7\x62\xea\xd4\xa9\xa5\x36\
-\x93\x93\x93\x83\x90\x90\x10\xfe\xb3\xc5\x62\x41\x61\x61\xa1\x53\
-\x1d\x3a\x77\xa0\x54\x2a\x61\x32\x99\x78\x0f\xbe\x4c\x26\xc3\xa2\
-\x45\x8b\xdc\xba\x43\x47\x2b\xeb\xa1\xc7\xcc\x55\x68\x75\x77\x37\
-\x46\xfd\xa2\x83\xde\x8b\x00\x51\xa0\x87\xc2\x4a\x43\xad\xf3\xc6\
-\xd2\xa5\x4b\x5d\x6a\x27\x35\x35\x15\xa1\xa1\xa1\x60\x18\x86\x4f\
-\x34\x55\x50\x50\x20\x78\x3e\x72\x63\x53\x3c\x5c\xf1\xe4\x49\x37\
-\xeb\x69\xaa\xff\x85\x35\x3f\xbf\x89\x8c\x94\x4b\xd8\x72\x20\x07\
-\x6a\x4a\x5e\x44\x22\x9f\xdf\xc9\xdb\xbf\x7f\xbf\x4b\xcd\xac\x5d\
-\xbb\x16\xe3\xc6\x8d\x73\x22\x9a\x40\x51\xb8\xb2\x10\x78\x79\x79\
-\x81\xa6\x69\x50\x14\x05\x9a\xa6\x11\x12\x12\x82\x9f\x7f\xfe\x19\
-\x95\x2b\x57\x76\xb1\x05\x06\xd5\x9b\xf4\x41\x70\xa3\x6e\x88\x9d\
-\x3d\x0d\x27\x7c\x18\xb0\x4a\x2f\xe8\x9e\xf3\xbd\x66\xcd\x9a\xa1\
-\x59\xb3\x66\x2e\xb5\xb4\x7f\xff\x7e\x8c\x19\x33\x86\x27\xef\x39\
-\x39\x39\x82\xe5\xe2\xf6\x0e\x2e\xbb\x30\x4d\xd3\xf0\xf5\xf5\xc5\
-\x91\x23\x47\xa4\x17\xb0\x04\x09\x12\x09\x14\x0f\x82\x20\xf8\x53\
-\xab\x53\xa7\x4e\xa1\x6c\xd9\xb2\xd0\xe9\x74\xb0\x58\x2c\x68\xda\
-\xb4\x29\xd6\xae\x5d\xeb\x74\xca\xd5\xa0\x41\x03\x38\x1c\x0e\xfc\
-\xf4\xd3\x4f\x68\xd3\xa6\x0d\x02\x03\x03\x9d\xfe\x3b\x45\x51\x6f\
-\x5c\x33\xd5\x00\x00\x20\x00\x49\x44\x41\x54\x28\x5f\xbe\x3c\x4e\
-\x9e\x3c\xc9\x1b\x3c\xcf\x9e\x3d\x83\xc1\x60\x80\xd1\x68\xc4\x98\
-\x31\x63\x30\x60\xc0\x00\xa7\xdf\x70\xa1\x2f\xf9\xf9\xf9\xb8\x77\
-\xef\x1e\x12\x12\x12\x10\x19\x19\x09\xa3\xd1\x88\x32\x65\xca\x48\
-\x4a\x92\xf0\x8f\x42\x6e\x6e\x2e\x5f\xab\x2c\x27\x27\x07\x33\x66\
-\xcc\xc0\xaa\x55\xab\x04\xb7\xc7\x30\x0c\xce\x9c\x39\x83\xd6\xad\
-\x5b\xf3\x46\x7c\x61\x61\x21\xb4\x5a\xad\xcb\x6d\x18\x02\x42\x50\
-\x33\x00\xb0\x96\xed\x87\xb0\x9b\xbf\xe0\x72\x56\x39\x34\x6e\xfb\
-\x2f\xf8\xb9\xe9\x1c\xe2\x88\x03\x97\x5d\xb0\x7f\xff\xfe\x50\x2a\
-\x95\x82\x0c\x6e\x4e\x96\xf4\xf4\x74\xde\xb0\x75\x37\xf1\x05\x41\
-\x90\xf0\x2d\x5f\x19\xbe\x00\xbc\xd9\x1c\xec\x3b\x19\x87\xb3\xf9\
-\x6a\xf4\x79\xaf\xb5\xdb\xfd\xe1\x9e\xcd\xb2\x2c\xee\xde\xbd\x8b\
-\xe8\xe8\xe8\x52\x3d\x09\x25\xa1\xa0\xa0\x00\xb9\xb9\xb9\xb0\xdb\
-\xed\x7c\x82\x0f\xb7\x3c\x3a\x72\x0d\x82\xab\x54\x03\x00\xf4\xed\
-\xdb\x1d\xeb\x4f\x1c\x45\x41\x19\x7f\x34\x6d\xd7\xc4\xad\x6c\x85\
-\xb9\xb9\xb9\xb0\xd9\x6c\xfc\x78\xdf\xbf\x7f\x1f\x3d\x7b\xf6\x74\
-\xbf\x50\x78\x31\xbd\xdd\xbf\x7f\x9f\x9f\x0b\x5c\xf8\x9d\x7b\x6f\
-\x67\x1d\xc2\xab\xd5\x00\x60\x86\xc5\x94\x85\x53\x17\xe2\xd1\xaa\
-\x63\x17\x68\xe5\xee\xbd\xb6\x8b\xdf\x6f\xb3\xd9\x6c\x38\x75\xea\
-\x14\x7a\xf4\xe8\x21\xd8\xf3\x22\x93\xc9\x90\x98\x98\x08\x87\xc3\
-\xc1\x7b\xd3\xdd\x95\x4d\xa6\xf6\x82\x7f\x88\x17\xfc\x43\x46\xe1\
-\xa3\x87\xab\x90\x78\xf1\x18\x12\x0c\xe5\x30\xb8\x4f\x3d\xb7\xda\
-\xe1\x42\x46\x19\x86\x81\xc3\xe1\xc0\x96\x2d\x5b\x70\xff\xfe\x7d\
-\xc1\x99\x3d\x1d\x0e\x07\x2e\x5d\xba\x84\xda\xb5\x6b\xf3\x63\x96\
-\x9d\x9d\xed\xde\x3b\x56\xe9\x8f\xc8\xda\xfe\x70\x84\x96\x45\xfe\
-\x93\x0d\x38\x7c\xdb\x84\x1e\xff\xaa\x0a\x83\xda\xbd\x8d\xa4\xb0\
-\xb0\x90\x1f\xdf\xbc\xbc\x3c\xec\xde\xbd\x1b\x69\x69\x69\x82\x13\
-\xdf\x50\x14\x85\x7b\xf7\xee\xa1\x5c\xb9\x72\x20\xc9\xa2\xd0\xd4\
-\xd2\x42\x6e\x5f\x38\x92\x82\xd6\x27\x10\x5a\x00\x5d\x3f\x1e\x89\
-\x7b\xdb\x2e\xe2\x10\xad\xc0\xf4\xb1\x6d\xdd\xee\x8b\xd1\x68\x04\
-\x49\x92\xb0\xdb\xed\x30\x9b\xcd\xf8\xec\xb3\xcf\xb0\x66\xcd\x1a\
-\xc1\xfb\xbf\xcd\x66\xc3\xb5\x6b\xd7\xd0\xa1\x43\x07\x7e\x3e\x48\
-\x90\x20\x41\x22\x81\xa2\xc1\xb2\x2c\x8c\x46\x23\x76\xec\xd8\x81\
-\x83\x07\x0f\x62\xe5\xca\x95\xd8\xbe\x7d\x3b\xff\x82\xb8\x74\xe9\
-\x12\x16\x2f\x5e\x0c\xbb\xdd\x8e\x90\x90\x10\xf4\xed\xdb\x17\x5a\
-\xad\x16\x0d\x1a\x34\xc0\xba\x75\xeb\x30\x6c\xd8\x30\x9e\x40\xda\
-\x6c\x36\xfe\xe5\xd4\xaf\x5f\x3f\x0c\x19\x32\x04\x9d\x3a\x75\x42\
-\x48\x48\x08\x4e\x9d\x3a\x85\x6f\xbf\xfd\x16\xde\xde\xde\xd8\xbc\
-\x79\x33\x32\x33\x33\x41\xd3\x34\x6a\xd6\xac\x89\x4e\x9d\x3a\x01\
-\x28\x0a\x19\x8d\x88\x88\xc0\xfb\xef\xbf\x8f\x0b\x17\x2e\xa0\x7f\
-\xff\xfe\x2f\x25\x8e\x91\x20\xe1\x9f\x02\x9a\xa6\x51\xae\x5c\x39\
-\x8c\x1a\x35\x0a\x4f\x9f\x3e\x15\x1d\x5a\x58\xbd\x7a\x75\xb4\x6d\
-\xdb\x16\x89\x89\x89\xa2\xda\x51\xfa\x54\xc5\x07\xa3\x3e\x82\x89\
-\x51\xc0\xc7\x4b\x2b\xa8\x0d\x87\xc3\x81\x0a\x15\x2a\xbc\xd2\x0b\
-\x2a\x04\x21\x21\x21\xa8\x54\xa9\x92\xe8\x62\xf1\xfe\xe1\xf5\xd1\
-\xc7\x2f\x14\x16\x52\x0d\x3f\x2f\x8d\xe0\x76\xaa\x55\xab\x86\x11\
-\x23\x46\x88\xd6\x19\x50\xe4\x89\xac\x51\xa3\x06\xf6\xec\xd9\x23\
-\xaa\x9d\xc0\x37\xa3\x30\xba\x52\x5d\xd8\x29\x3d\xca\x18\xd4\x6e\
-\x93\x36\x6e\x4e\x76\xea\xd4\x09\x3a\x9d\x8e\x27\x85\x42\xdf\x1b\
-\x61\x61\x61\x68\xdf\xbe\xbd\x07\xee\x15\xaa\x51\xaf\x65\x27\x54\
-\xa9\xd7\x0e\x3a\x83\x1e\x32\x81\xea\x27\x49\x12\xdd\xba\x75\x03\
-\x4d\xd3\x90\xc9\x64\xa2\xe6\x51\x68\x68\x28\x0c\x06\x03\x34\x1a\
-\x8d\x48\x83\x5b\x8d\x9e\x1f\x0e\x83\xa9\xd0\x04\x0b\xa1\x45\x19\
-\x83\xfb\x77\x67\x19\x86\x81\x5e\xaf\xc7\x88\x11\x23\x70\xe3\xc6\
-\x0d\xd1\xc9\x6a\xc2\xc3\xc3\x51\xbf\x7e\x7d\x3e\xea\x47\xe8\x38\
-\x51\xba\x00\x74\x1a\x30\x12\x4d\x4d\x0e\x78\x79\x7b\x81\x22\x84\
-\xcd\x23\x85\x42\x81\x8f\x3f\xfe\x98\x4f\xee\x22\x66\x4e\x46\x47\
-\x47\x23\x20\x20\x40\x74\x49\x1e\x22\xa8\x05\x46\x0f\xaf\x01\xa3\
-\x5d\x09\xff\x32\x3a\x41\x6d\xd8\xed\x76\x84\x86\x86\x62\xd2\xa4\
-\x49\xc8\xcc\xcc\x14\xbd\x8f\x44\x46\x46\xa2\x7d\xfb\xf6\xb8\x7b\
-\xf7\xae\xf4\x72\x95\x20\x41\x22\x81\x9e\x81\x4a\xa5\x42\x8b\x16\
-\x2d\xf0\xe4\xc9\x13\x54\xa8\x50\x01\x47\x8e\x1c\x41\xab\x56\xad\
-\xc0\xb2\x2c\x22\x23\x23\x51\xab\x56\x2d\x9c\x3a\x75\x0a\x36\x9b\
-\x0d\xf5\xeb\xd7\x47\xdf\xbe\x7d\xa1\xd1\x68\xf0\xce\x3b\xef\xa0\
-\xb0\xb0\x10\x0d\x1b\x36\xe4\xdb\x6a\xd3\xa6\x0d\x6a\xd4\xa8\x01\
-\x00\x68\xd7\xae\x1d\xb6\x6d\xdb\x86\xad\x5b\xb7\x22\x27\x27\x07\
-\x73\xe7\xce\x45\xd3\xa6\x4d\x91\x90\x90\x80\x23\x47\x8e\xe0\xf4\
-\xe9\xd3\x70\x38\x1c\x50\x28\x14\x3c\x09\x64\x18\x06\x9d\x3a\x75\
-\x82\xc1\x60\x40\xd3\xa6\x4d\xe1\xe7\xe7\x27\xa5\x42\x96\xf0\x8f\
-\x05\xc3\x30\xa8\x50\xa1\x02\xfe\xfd\xef\x7f\x8b\x4a\x0f\xfe\xe2\
-\x7a\xfd\xf6\xdb\x6f\x45\xb7\xa3\xd6\xfb\x40\x2d\xe2\xf7\x34\x4d\
-\x23\x20\x20\xc0\x29\x69\x94\xd8\xc3\x28\xb5\x5a\xed\x81\x13\x6e\
-\x02\x3a\x1f\x5f\xe8\x44\xf6\x25\x20\x20\x00\x4b\x96\x2c\xf1\x88\
-\x6c\x24\x49\xc2\x6c\x36\x8b\x22\x5d\x9c\x6c\xfa\x32\x01\xa2\x0f\
-\x26\xba\x75\xeb\x86\x2e\x5d\xba\x78\x4c\x36\x4f\x78\x25\x08\x4a\
-\x05\x6f\x2f\xf1\xf7\xbf\x3b\x75\xea\x84\xd6\xad\x5b\x7b\x4c\xb6\
-\xeb\xd7\xaf\x8b\xaf\xa7\x47\x69\xa0\xf1\xd2\x40\x23\x62\x1f\x51\
-\x28\x14\x18\x36\x6c\x18\x9f\x65\xd6\x13\xfb\xc8\xcf\x3f\xff\x2c\
-\xde\xc0\x52\xe9\xe0\xab\x12\xdf\x97\xb9\x73\xe7\x7a\x6c\x8f\x64\
-\x59\x16\x3f\xfd\xf4\x93\xe8\x76\x94\x7a\x5f\xf8\x8b\xf8\xbd\xdd\
-\x6e\x47\x95\x2a\x55\xd0\xbd\x7b\xf7\x52\x13\xd3\xb8\x7a\x90\xa3\
-\x54\x2a\xb1\x72\xe5\x4a\xa9\x58\xbc\x04\x09\x12\x09\xf4\x0c\x0c\
-\x06\x03\x56\xaf\x5e\xfd\xca\xff\xd6\xa3\x47\x0f\xf4\xe8\xd1\xe3\
-\x95\x9b\x51\x54\x54\x14\xa2\xa2\xa2\x9c\xbe\x9f\x3f\x7f\xbe\xd3\
-\xe7\xc6\x8d\x1b\xa3\x71\xe3\xc6\x4e\xdf\x8d\x1d\x3b\x16\x63\xc7\
-\x8e\x7d\xe5\xf3\xfc\xfd\xfd\x31\x6c\xd8\x30\x00\xc0\xf8\xf1\xe3\
-\x25\xe5\x48\xf8\xff\xb1\x09\x3d\xcf\x12\xfa\x5a\x81\x65\xc1\x82\
-\x10\x55\xc7\x9a\x20\x88\xd7\xa2\x00\xfa\xab\x8c\x40\x10\x04\x08\
-\x0f\xe8\xcd\x53\x64\xe2\xc5\xec\xc9\xa2\xf4\x26\x52\x36\x92\x24\
-\x21\x93\xc9\x3c\xd2\x1f\x92\x24\x05\x87\x94\xbe\x24\x1a\x00\xc2\
-\x43\xeb\xcd\x53\x7a\x7b\x5d\xd6\x1b\xa7\x2b\x4f\xae\x37\x4f\xed\
-\x49\x9e\x48\x58\xe3\xc9\x3d\xd2\x73\xa1\x92\x2c\x58\x56\x9c\xce\
-\x08\x82\xf0\xd8\x5a\x93\x0e\xc4\x25\x48\x10\xb0\x8f\x4b\x43\x20\
-\x41\x82\x84\xbf\x03\x5c\x76\x5d\x3f\x3f\x3f\xc8\xe5\x72\x8f\xfc\
-\x99\x33\x67\x8e\xe8\x8c\xb9\x0e\x6b\x1e\xe2\x4e\xec\xc3\xfe\xdf\
-\xae\xc1\x68\x15\x66\x30\x29\x95\x4a\x5c\xb9\x72\xc5\x63\x72\xc9\
-\xe5\x72\x5c\xb8\x70\xa1\xc4\x12\x15\x2e\xc9\x56\x98\x85\xf3\x87\
-\x76\x62\xff\x99\x5b\x28\xb0\x09\x6b\x87\x20\x08\xfc\xf6\xdb\x6f\
-\x1e\x93\x4b\xa1\x50\x60\xdb\xb6\x6d\xd0\xeb\xf5\xa2\x64\xb3\x18\
-\x9f\xe0\xcc\xde\x5f\x71\x38\x36\x01\x56\x81\x4e\x13\x85\x42\x81\
-\xe1\xc3\x87\xf3\xa5\x2f\xc4\xfe\x91\xc9\x64\x6e\xde\xbb\x7a\xa5\
-\xd9\x8e\xec\x94\x9b\x38\x7e\xfa\x02\xd2\xf2\x84\x13\x4a\x96\x65\
-\x31\x72\xe4\x48\x8f\xe9\x4d\xab\xd5\xe2\xd9\xb3\x67\x22\xc3\x5d\
-\x69\xa4\x25\xc4\xe1\xf7\xe3\xbb\x71\xf8\xdc\x2d\x98\x04\xa8\x9f\
-\xa2\x28\x64\x67\x67\xa3\x5e\xbd\x7a\x1e\x93\xad\x69\xd3\xa6\x82\
-\x13\x95\xf0\xe3\x4d\x5b\x70\xff\xea\x69\xec\x3b\x78\x0a\x4f\x72\
-\xcd\x82\xd7\x5a\x5e\x5e\x1e\x48\x92\xf4\x98\x6c\x15\x2b\x56\x44\
-\xb9\x72\xe5\xc4\x11\x2f\x9b\x11\x57\xcf\xec\xc5\xae\x23\x17\x90\
-\x2b\xd0\x11\xac\xd5\x6a\x71\xe8\xd0\x21\xa8\xd5\x6a\x8f\xc8\x45\
-\x51\x14\xa6\x4c\x99\xe2\x81\x88\x02\x89\x8c\xbe\x2e\xf0\xc4\x01\
-\x8a\x84\x52\xf6\x4f\x69\x08\x24\x48\x90\xf0\x5f\xdf\x78\x9e\x93\
-\x19\x99\x4c\x06\x1f\x1f\x1f\xf4\xea\xd5\x0b\x91\x91\x91\x82\xdb\
-\xb3\x5a\xad\x58\xbf\x7e\x3d\xe4\x72\x39\x58\x96\x05\x49\x92\x82\
-\xbd\x02\xa9\xe7\x97\xe3\xab\xef\xef\xa2\x62\x00\x89\xa4\x94\xc1\
-\x18\xd3\xbf\x39\xdc\x49\xe9\xc0\x65\xfd\xe5\x9e\x3f\x6f\xde\x3c\
-\xa8\xd5\x6a\x51\x89\x61\x3e\xfb\xec\x33\xbe\x3d\xe1\x1e\x18\x16\
-\xc7\x7e\xfd\x09\x27\x1f\x1a\x41\xc7\x2f\xc2\x1d\xe3\xcf\x98\xd2\
-\x25\xd8\xad\x16\xb8\x67\x93\x24\x89\x80\x80\x00\x8c\x18\x31\x02\
-\xfe\xfe\xfe\x82\xbd\x0b\xb9\xb9\xb9\xf8\xee\xbb\xef\xa0\x50\x28\
-\xf8\xa4\x59\x42\x8b\x73\xef\x58\xf8\x29\x8e\xda\xaa\x21\x98\x39\
-\x81\x1c\xcb\xc7\x78\xef\xad\x2a\x6e\xc9\x45\x92\x24\x1f\x76\xeb\
-\xe7\xe7\x87\xd9\xb3\x67\x8b\x4a\xc2\x71\xf1\xe2\x45\xa7\x90\x42\
-\xa1\x7a\xb3\xa5\xdf\xc7\xda\xf5\x3f\xe3\xda\xf5\x2b\xa8\xd2\x79\
-\x1a\xa6\x0d\x6c\x05\xa5\x1b\x17\x03\x8b\xd7\x63\x53\xab\xd5\x88\
-\x88\x88\xc0\xd8\xb1\x63\x05\x87\x71\x52\x14\x85\x13\x27\x4e\xe0\
-\xd4\xa9\x53\xfc\x98\x09\x9e\x93\x4f\x4f\xe0\xc3\x71\x5b\x80\xea\
-\xa1\xa8\x65\xde\x8d\x3f\xc8\x6f\x30\xa6\x69\x19\xb7\xd7\x1a\x49\
-\x92\x50\xab\xd5\x68\xd3\xa6\x0d\x7a\xf4\xe8\x21\x78\x3e\x3a\x1c\
-\x0e\xc4\xc4\xc4\x40\xab\xd5\xf2\xf3\x50\xd8\x3e\xc2\xe2\xf1\x9d\
-\x13\x98\x39\x7d\x2d\xa8\x00\x7f\xdc\x28\x24\x31\xe1\xed\x96\xd0\
-\xb8\xa1\xb7\xe2\x6b\xcd\x60\x30\xa0\x46\x8d\x1a\x18\x32\x64\x88\
-\xfb\x09\x86\x9e\x43\xa3\xd1\x60\xfa\xf4\xe9\x28\x53\xa6\x0c\x7f\
-\xb7\x50\x68\x49\x94\xab\x4b\xa7\x60\xda\x83\x00\xd4\xcf\xbb\x8a\
-\x63\xf9\xdf\x63\x59\xef\x10\xb7\x7e\xcf\x79\xff\x14\x0a\x05\xf4\
-\x7a\x3d\x06\x0d\x1a\x84\x6a\xd5\xaa\x09\xde\xff\x0b\x0a\x0a\xb0\
-\x62\xc5\x8a\xd7\xa2\x64\x96\x5a\xad\x86\xc9\x64\xf2\x48\x88\xeb\
-\xff\x32\x4c\x26\x13\xd2\xd3\xd3\x51\xb6\x6c\x59\x69\x30\x24\x12\
-\x28\x41\x82\x84\x7f\x22\xb2\xb2\xb2\x90\x9d\x9d\xed\x64\x24\x92\
-\x24\x89\xd4\xd4\x54\xde\x80\x54\x2a\x95\xe8\xdf\xbf\x3f\x5a\xb6\
-\x6c\x29\xf8\x39\x0e\x87\x03\xe7\xcf\x9f\x87\xc5\x62\xe1\xcb\xb6\
-\xdc\xbb\x77\xcf\x25\x2f\x85\xb7\xb7\x37\x7c\x7d\x7d\xf9\xcf\xe6\
-\xc7\xb7\xd0\x60\xc0\x7c\xf4\xd6\xc4\x60\xcd\xe9\xdf\x91\x83\xe6\
-\xd0\x5b\x2c\x48\x79\xf4\xa8\x54\x63\x97\xf3\x4a\x14\xc7\xe4\xc9\
-\x93\x45\x87\xce\x15\xbf\x7f\x57\x58\x58\x88\x47\x8f\x1e\xc1\x6e\
-\xb7\x97\x48\x2c\x69\x9a\x46\x50\x50\x50\xb1\xda\x86\x2c\xd2\x0a\
-\x65\xe8\xf9\xc1\x04\xd4\x7c\x98\x83\x0f\xf6\xc7\x02\x5d\x82\x51\
-\x58\x58\x88\xb4\xb4\xb4\x52\xc9\x97\x5c\x2e\x47\x7e\x7e\x3e\x08\
-\x82\x80\xc3\xe1\xe0\x93\xfa\x94\x2b\x57\x4e\xb0\x5c\xd9\xd9\xd9\
-\x58\xb5\x6a\x15\x9f\xe2\xff\xd9\xb3\x67\x48\x4a\x4a\x2a\xb5\x2f\
-\x04\x41\x20\xc0\xdf\x1f\x3a\xbd\xfe\xf9\x37\x76\x5c\x7f\x44\x62\
-\xda\xea\xa9\x30\x9d\xf8\x1e\x07\x6f\xdc\x00\xde\xaa\x82\xcc\xcc\
-\xcc\x52\x4b\x8f\x10\x04\x81\xf4\xf4\x74\xbe\xec\x81\xc3\xe1\x80\
-\xbf\xbf\x3f\x46\x8e\x1c\x29\x4a\x67\x15\x2a\x54\xc0\xce\x9d\x3b\
-\xf9\x39\x9f\x9e\x9e\x8e\xb4\xb4\xb4\x52\xcb\x4e\xb0\x2c\x8b\x90\
-\x90\x10\x9e\x7c\x58\x0b\x0b\xc0\x06\xd4\xc2\xc7\x13\x2b\x61\xd9\
-\xce\x9b\x30\x3b\x9a\x43\x41\xca\x90\x91\x91\x01\xa3\xd1\x58\xe2\
-\x58\x51\x14\x85\x94\x94\x14\xfe\x3e\x19\x4d\xd3\xa8\x56\xad\x1a\
-\xa2\xa3\xa3\x45\xc9\xa6\x54\x2a\x71\xec\xd8\x31\xfe\xd9\x4f\x9f\
-\x3e\x45\x4a\x4a\x4a\xa9\x86\x2f\x49\x92\xa8\x58\xb1\xe2\x9f\xc4\
-\xea\xc1\x6d\x18\xeb\x0f\xc3\xd8\x99\x4d\xf0\xc6\xaf\x9f\xe1\xd3\
-\x13\x37\x30\xa6\xe9\x5b\x48\x4d\x4d\x2d\x95\x80\xbf\x58\x2c\xde\
-\x62\xb1\xa0\x6d\xdb\xb6\x18\x33\x66\x8c\x28\xd9\x1e\x3f\x7e\x8c\
-\xeb\xd7\xaf\xf3\x9f\xef\xdd\xbb\x07\x2f\x2f\xaf\x12\x89\x25\x47\
-\xb0\xcb\x06\x06\x42\x46\x51\x00\x08\x58\xf3\x9f\x41\x56\x7b\x10\
-\xbe\x7d\xcf\x84\xd1\x07\x32\x50\x68\x61\xa0\x52\x17\xf5\xb9\xb4\
-\x03\x21\x9d\x4e\xe7\x94\x2c\x85\x20\x08\x34\x6c\xd8\x10\x43\x87\
-\x0e\x15\x25\xdb\xe2\xc5\x8b\x79\xef\x8a\xdd\x6e\xc7\xa3\x47\x8f\
-\x60\x30\x18\x4a\xd5\x9b\x42\xa1\x40\xc5\x8a\x15\xf9\xcf\xb1\x27\
-\x9f\xa0\xd3\xaa\x95\x18\x97\xf4\x25\x2a\x2c\x3f\x8f\x65\xbd\x43\
-\x50\x58\x58\x88\xf4\xf4\xf4\x52\x09\x38\x49\x92\x7c\x22\x30\x2e\
-\xfb\xe9\xfb\xef\xbf\xef\x54\x5b\x55\xc8\x61\xd2\xfe\xfd\xfb\xe1\
-\x70\x38\xf8\x32\x11\x8f\x1e\x3d\x72\x0a\xc5\xe6\xde\x35\xe5\xcb\
-\x97\xf7\x68\x3d\xd0\x57\x11\xdc\xd0\xd0\x50\xc4\xc4\xc4\x88\x9e\
-\x8b\xff\xcb\xb8\x74\xe9\x12\x72\x73\x73\xd1\xb1\x63\x47\x69\x30\
-\x24\x12\x28\x41\x82\x84\x7f\x22\xae\x5e\xbd\x8a\x33\x67\xce\x38\
-\x9d\xd0\x72\xe9\xf3\x8b\x17\x60\x16\x5a\x8f\xad\xf8\xef\x39\x03\
-\x80\xa2\x28\xa4\xa5\xa5\x61\xdb\xb6\x6d\xa5\x92\x40\x96\x65\xd1\
-\xa4\x69\x53\xb4\x69\xdd\x1a\x17\x7e\x9d\x8f\x6f\xb6\x3e\xc1\xe0\
-\xb9\x13\x61\x59\xfc\x6f\xcc\x4e\xcf\x42\x40\x83\x2e\xa0\x00\x64\
-\x64\x64\x60\xd3\xa6\x4d\xa5\xb6\x47\x10\x04\x6e\xdd\xba\xe5\x54\
-\x97\xad\xa0\xa0\x00\x06\x83\x41\xb0\x6c\x66\xb3\x99\x37\xe2\x59\
-\x96\x45\x4a\x4a\x0a\x36\x6f\xde\x5c\xaa\xb1\x55\x50\x50\x80\xa1\
-\x43\x87\xa2\x72\x48\x79\x1c\x59\x3b\x07\x31\x09\x5a\x74\x6f\x5d\
-\x07\xc7\xd6\x7f\x8d\xf5\xf7\x6f\x40\x1b\xda\x0a\x00\xf0\xe8\xd1\
-\x23\x6c\xdb\xb6\xad\x54\x2f\x1c\x41\x10\x48\x4e\x4e\xe6\x75\x49\
-\xd3\xb4\x68\xbd\xe5\xe7\xe7\x3b\x91\xcc\x73\xe7\xce\xf1\x7a\x2c\
-\x8d\x6c\x77\xee\xda\x0d\x91\x41\x6a\x2c\x9c\x33\x1b\x7f\x18\xba\
-\x61\xec\xa0\x16\x98\x37\x3a\x1a\xb4\xb5\x00\x91\x6d\xaa\xf1\x86\
-\xc4\x95\x2b\x57\x4a\xd5\x59\x7e\x7e\x3e\x9e\x3c\x79\xc2\x67\xcd\
-\xf4\xc4\x1d\x25\x8b\xc5\xc2\xb7\x23\x93\xc9\x70\xf1\xe2\x45\xa8\
-\x54\xaa\x12\xc9\x0d\xcb\xb2\xb0\xd9\x6c\xf8\x78\xf2\x27\xd0\xdb\
-\xef\x60\xd2\xc4\x05\xf0\xaa\xd5\x01\x35\x2b\x32\x58\xb1\x74\x27\
-\xb2\xfd\xbb\x82\x20\x8a\xee\x75\xfd\xfe\xfb\xef\xb8\x7a\xf5\x2a\
-\x14\x0a\x45\x89\x06\x77\x66\x66\x26\x9f\x30\x85\x23\xb9\x9e\x90\
-\x8d\x6b\x8f\x61\x18\x9c\x3d\x7b\x16\xb9\xb9\xb9\xa5\xb6\x2d\x97\
-\xcb\x31\x3a\x7a\x0c\xac\x8f\x2e\xe3\xc0\xaa\x65\x38\xe1\x28\x8f\
-\xb7\xf2\xd7\xe3\xf0\x88\x9f\xb1\x3f\xff\x0f\x68\x1b\x75\x01\x1c\
-\x66\x1c\x3d\x7a\x14\x69\x69\x69\xa5\xf6\x23\x3d\x3d\x9d\x1f\x63\
-\xce\x6b\x2e\x06\x56\xab\xd5\xa9\x0d\x99\x4c\x86\x98\x98\x18\xe8\
-\x74\xba\x12\xd7\x9b\xc3\xe1\x40\x70\x70\x30\x7a\xf7\x7d\x1f\xba\
-\xb4\x3d\xe8\x3f\x6e\x13\xca\x35\x68\x81\xba\xd4\x35\x8c\x98\x76\
-\x13\xcf\xea\x0c\x03\x49\x12\xb0\x5a\xad\x88\x89\x89\xe1\xeb\x51\
-\xfe\x15\x34\x1a\x0d\x2e\x5f\xbe\xec\xf4\x4c\x4f\xe8\x8d\xa6\x69\
-\xfe\x0e\x6e\x5e\x5e\x1e\x0e\x1f\x3e\x8c\x9b\x37\x6f\x96\xd8\x36\
-\xcb\xb2\xf0\xf5\xf5\xc3\xc8\x91\x23\x70\xe7\xb7\xcd\xd8\x7b\xfc\
-\x3e\xde\x9e\xd4\x0d\x8b\xbf\xf8\x18\x93\x0b\x62\xa1\x90\x4f\x00\
-\x50\x54\xb3\x71\xef\xde\xbd\x7c\xbd\xbe\x92\x48\xd2\xa5\x4b\x97\
-\xf8\xfd\x9f\x65\x59\x98\x4c\x26\x51\xa1\x7f\xc5\xf7\x48\xae\x2e\
-\x67\x4c\x4c\x0c\x7f\xb0\xc3\xc9\x1e\x10\x10\x80\x0f\x3e\xf8\xa0\
-\xd8\xc1\xd8\x7f\x06\xd3\xa6\x4d\x43\xef\xde\xbd\xc1\x30\x8c\x53\
-\xad\x47\x09\xae\xe1\xfc\xf9\xf3\x98\x37\x6f\x1e\xc6\x8d\x1b\x07\
-\x3d\x7f\xd0\x27\x41\x22\x81\x12\x24\x48\xf8\x47\xa1\x49\x93\x26\
-\xa8\x5d\xbb\xb6\x93\x27\x8c\x20\x08\xc4\xc5\xc5\xe1\xc8\x91\x23\
-\x7c\x28\x99\xd8\x5a\x97\x3a\x9d\x0e\x7a\xbd\x9e\xaf\x17\x56\xb1\
-\x62\x45\x0c\x1f\x3e\xdc\x25\x12\xc8\x19\x04\xe1\x4d\xba\x63\x52\
-\x08\x0b\x4d\xde\x05\xd4\xea\x39\x1e\x6f\xa4\xed\x45\x42\x4e\x51\
-\x5d\x2c\x5d\xd9\xb2\x88\x8e\x8e\x76\xc9\x13\xf8\xf0\xe1\x43\x64\
-\x65\x65\xf1\xdf\x89\x21\x80\x40\x51\x78\x51\xf1\x74\xf5\x61\x61\
-\x61\x18\x3d\x7a\x74\xa9\x06\x2f\x4d\xd3\xf0\xf1\xf1\x01\x41\x50\
-\x78\xa3\xdd\x7b\x08\x6c\xc8\xe2\xc9\xe3\x54\x74\x1f\x3c\x1a\x96\
-\x03\xd7\xb0\x55\x5b\x14\x7e\x5b\xb9\x72\x65\x8c\x1e\x3d\x9a\x6f\
-\xff\xaf\xa0\x50\x28\x10\x1b\x1b\x8b\xe4\xe4\x64\xb0\x2c\x0b\x95\
-\x4a\x05\x2f\x2f\x2f\x51\xb2\xf9\xfb\xfb\xf3\xa7\xf2\x36\x9b\x0d\
-\xed\xdb\xb7\xc7\xbb\xef\xbe\xeb\x92\x31\xa8\xd7\x1b\x00\xd2\x8e\
-\x6e\xfd\x47\xc3\xaa\xf0\x45\xfc\xf9\xa3\x98\x30\xf3\x33\xa4\x9d\
-\x5a\x83\x64\x65\x51\xe9\x9c\xe6\xcd\x9b\xa3\x7e\xfd\xfa\xa5\x92\
-\xc0\xa7\x4f\x9f\xe2\xf8\xf1\xe3\x7c\x01\xf5\x92\x88\x95\xab\x30\
-\x18\x0c\xbc\x6c\x0e\x87\x03\xad\x5a\xb5\xc2\xf0\xe1\xc3\x4b\xcc\
-\x60\xc9\x79\x46\xb4\x1a\x35\xe0\xa8\x84\x81\x1f\x8d\x85\xcd\x46\
-\x23\xcd\x42\xe0\x9d\xce\xb5\x71\x2c\x27\x0c\x4a\x42\x06\x99\x8c\
-\x40\x9b\x36\x6d\xd0\xb4\x69\xd3\x52\x0d\xee\xe4\xe4\x64\xac\x5c\
-\xb9\x92\x6f\x9f\x2b\x59\x24\x06\x9c\xde\xb9\xf5\xdb\xae\x5d\x3b\
-\x74\xeb\xd6\xcd\x25\xa2\xa2\x56\x2b\xc1\x04\x84\xa3\xd9\xc0\x49\
-\xa8\x92\x70\x0e\x9b\x33\x7b\xa0\x4f\xa7\xca\x60\xb7\xcc\xc7\x85\
-\x5a\x21\x00\xa5\x46\xcf\x9e\x3d\x4b\x25\x4a\x00\x90\x98\x98\x88\
-\xe5\xcb\x97\x3b\xcd\x77\x31\x50\x2a\x95\x4e\x46\x27\x4d\xd3\x18\
-\x32\x64\x48\xa9\xb5\x30\x59\x96\x85\x5c\x2e\x87\x46\xad\x00\xfc\
-\x1a\x60\xdc\x64\x7f\x98\x0a\x1f\x23\xf1\x61\x2d\x8c\xac\x5e\x0b\
-\xe7\x94\x01\x50\xca\x09\xa8\x64\x2a\x7c\xf8\xe1\x87\xa5\x12\x1e\
-\x8d\x46\x03\xab\xd5\x8a\x13\x27\x4e\x38\xf5\x4d\xb4\xc1\xf7\xbc\
-\x50\x3c\xcb\xb2\xf0\xf1\xf1\xc1\xdb\x6f\xbf\x8d\x5a\xb5\x6a\x95\
-\x98\x79\x94\x0b\xd3\x06\x80\xa0\xea\x2d\xf1\x6e\x48\x7d\x24\x6d\
-\xdf\x89\xb6\xd3\x26\xa2\xca\xbe\x39\xb8\xaf\xaa\xcd\xef\x23\x83\
-\x07\x0f\x76\xa9\x8c\x85\x9f\x9f\x1f\xae\x5e\xbd\xca\xaf\x3f\x7f\
-\x7f\x7f\x51\x77\xbf\xb4\x5a\x2d\x54\x2a\xd5\x9f\xeb\x47\xab\xc5\
-\x80\x01\x03\x9c\x74\xc6\xc9\xf1\xdf\x08\x19\x8d\x88\x88\xc0\x2f\
-\xbf\xfc\x82\xc9\x93\x27\x63\xcd\x9a\x35\x68\xd6\xac\x19\x7c\x7d\
-\x7d\xf9\xfe\x49\x78\xf5\x3e\x6c\xb1\x58\x70\xee\xdc\x39\xb0\x2c\
-\x8b\x69\xd3\xa6\xa1\x67\xcf\x9e\xd2\xc0\x48\x24\x50\x82\x04\x09\
-\xff\x54\x68\xb5\xda\x57\x16\x6c\xd7\x6a\xb5\xfc\x9d\xc0\xdc\xdc\
-\x5c\x4c\x98\x30\x01\xe1\xe1\xe1\x82\x9f\x63\xb7\xdb\xb1\x75\xeb\
-\x56\x3e\xdc\x49\x2e\x97\xc3\xdb\xdb\xdb\xad\x62\xf1\x65\x82\xaa\
-\xa2\x51\x10\x90\xfd\x20\x05\x43\xbb\x36\x82\xbd\xce\x00\x7c\xb7\
-\xf9\x33\xc8\x01\x40\x2e\x47\x40\x80\x6b\xe5\x07\x5e\x34\xd6\xfa\
-\xf5\xeb\xc7\xdf\x79\x73\x17\x24\x49\xc2\x62\xb1\x20\x35\x35\x95\
-\xff\x4e\x2e\x97\xbb\x4d\x2c\x03\x43\x6a\x20\x10\x80\xfa\xe9\xef\
-\x88\xee\x37\x0c\xb7\xf3\xda\xe2\xec\xcd\x08\xbe\xbf\xfe\xfe\xae\
-\x25\x7b\xe7\xee\x5c\xaa\x54\x2a\x5c\xba\x74\x09\xef\xbc\xf3\x0e\
-\x42\x42\x42\x04\xa5\xaf\x27\x08\x02\x39\x39\x39\xc8\xcd\xcd\xe5\
-\xef\x08\x69\x34\x1a\x37\x4b\xdf\x28\x10\x51\xb3\x6e\x51\xdf\xae\
-\x24\xa1\x49\x83\x16\x68\xde\xb4\x23\x96\x6c\xaa\xcf\x1f\x0e\xe8\
-\x74\xa5\x17\xc4\xb0\xd9\x6c\xfc\x3d\x55\xa5\x52\x89\x1b\x37\x6e\
-\x60\xe4\xc8\x91\x82\x4b\x0e\x10\x04\x81\xcb\x97\x2f\x23\x2f\x2f\
-\x8f\xf7\x2c\x6a\xb5\x5a\x97\xfb\x53\x24\x9a\x17\x6a\xd7\x6b\x00\
-\xd8\xb3\xb0\xee\xcb\x49\x18\xf8\x43\x2a\xb6\x9c\x99\x08\xa5\x9c\
-\x78\x4e\x82\xf5\x2e\x9d\x92\xe7\xe6\xe6\xf2\x87\x17\x14\x45\xe1\
-\xc8\x91\x23\x78\xff\xfd\xf7\xa1\x52\xa9\x04\xdd\x9d\xa3\x28\x8a\
-\xf7\xe4\x70\x73\xda\x60\x30\xc0\xdb\xdb\xdb\xf5\x79\xad\x2d\x83\
-\xf2\xd5\xca\xa0\x7c\xb5\x0a\xf8\xa9\x69\x63\x0c\x98\x68\x47\xd5\
-\xae\xef\x63\xe7\xa4\x40\x00\x70\xb9\xad\xf4\xf4\x74\xde\xc0\xf7\
-\xf1\xf1\xc1\xf4\xe9\xd3\x91\x94\x94\x24\xc8\x23\x48\x10\x04\x0a\
-\x0b\x0b\x71\xf4\xe8\x51\x34\x68\xd0\x80\xff\xde\xdb\xdb\xdb\x3d\
-\x72\xa9\x2e\x87\x06\x4d\xca\xa1\xf0\xf1\x6d\xc4\x7c\xd1\x1e\x13\
-\x72\x1b\x61\xd7\x4f\x8b\xa1\xa5\x8a\xb2\xd6\xfa\xf9\xf9\xb9\xd4\
-\x4c\x71\x6f\x15\x4d\xd3\xd8\xbd\x7b\x37\x2c\x16\x8b\x20\xef\x3b\
-\x41\x10\x20\x49\x12\xc9\xc9\xc9\x08\x0a\x0a\xe2\xc9\xbb\x97\x97\
-\x97\x5b\xb2\x19\xfc\x2a\xc2\x00\xa0\x52\x3b\x3d\x22\xea\x37\x84\
-\x39\xac\x39\x4e\x9c\x0c\xe7\x0f\x89\x8a\x87\xd5\x97\x26\x1b\x47\
-\x84\x59\x96\xc5\x80\x01\x03\x4a\x3d\xac\x29\x4d\x6f\x67\xce\x9c\
-\x41\x9b\x36\x6d\xf8\x76\x5d\xed\xcb\x7f\x0a\xd5\xaa\x55\xc3\xf6\
-\xed\xdb\x11\x1f\x1f\x8f\x0d\x1b\x36\xf0\x73\x55\x42\xc9\x87\x0d\
-\x9f\x7f\xfe\x39\x3a\x74\xe8\xf0\x1f\x0d\xd9\x95\x20\x91\x40\x09\
-\x12\x24\xbc\x06\x9b\xbe\x56\xab\x45\xbd\x7a\xf5\x90\x94\x94\x84\
-\x4b\x97\x2e\x09\x6e\x8b\x20\x08\x34\x6a\xd4\x08\x41\x41\x41\xb8\
-\x7a\xf5\xaa\xa8\xd3\xd6\x32\x95\x3b\xe0\xc2\x33\x2b\x68\x00\x42\
-\x5f\x43\x5c\x01\xeb\xc8\xc8\x48\xdc\xbc\x79\x53\x54\x5a\x76\x92\
-\x24\x11\x1c\x1c\x0c\x83\xc1\x20\x3a\xbd\x7b\xd5\x0e\x43\x71\xa4\
-\xe5\x20\x90\x2a\x0a\x45\x45\x07\x04\x8e\x51\x99\x32\x78\xf3\xcd\
-\x37\x91\x99\x99\x89\x67\xcf\x9e\x89\x92\xad\x5e\xbd\x7a\x28\x53\
-\xa6\x0c\xef\xa1\x10\x6c\x74\xbd\x3b\x0f\x39\x7d\x3f\x87\x83\x54\
-\x83\x12\x58\x50\x81\xbb\x8f\xd7\xb8\x71\x63\x9c\x3d\x7b\x56\xd4\
-\x7c\x94\xc9\x64\xa8\x5b\xb7\xae\x78\x63\x46\xee\x8b\xc1\x5f\xac\
-\xc7\xe0\x2f\x84\xaf\x33\xae\x4f\x61\x61\x61\xa8\x58\xb1\x22\x6e\
-\xde\xbc\x29\x6a\xac\x15\x0a\x05\x6a\xd5\xaa\x25\xf8\x70\x83\xef\
-\x1b\xfc\xb0\xe4\x7c\x12\x96\xc0\x21\xd8\x1c\xe1\x0e\x7d\x6a\xd6\
-\xac\x89\xfc\xfc\x7c\x9c\x3f\x7f\x5e\xd4\x7c\x0c\x0a\x0a\x42\x64\
-\x64\xa4\xe8\x72\x13\xda\x0a\x91\xf8\xfe\xb7\x27\xf8\x5e\xd4\x4e\
-\x52\xe4\xcd\xad\x5f\xbf\x3e\x72\x73\x73\x71\xe6\xcc\x19\xd1\xc4\
-\x24\x34\x34\xd4\xa5\x90\xeb\x92\xb4\x86\x9a\xd1\xb8\x9b\x31\x42\
-\x94\x09\xc9\x30\x0c\xbc\xbc\xbc\xd0\xb0\x61\x43\xa4\xa5\xa5\xe1\
-\xf2\xe5\xcb\x82\xe7\x12\x49\x92\xa8\x5f\xbf\x3e\x2a\x55\xaa\xc4\
-\x7b\x18\x5f\x07\x28\x14\x0a\xd4\xa9\x53\x07\xdf\x7c\xf3\x8d\xf4\
-\xc2\x97\x20\x91\x40\x09\x12\x24\x48\xe0\x40\xd3\x34\xc2\xc3\xc3\
-\xb1\x63\xc7\x0e\x91\x46\xc9\x9f\xc6\xa0\x42\xa1\x40\x4c\x4c\x8c\
-\x47\xfa\x27\xc6\x74\xb7\xdb\xed\x08\x0f\x0f\xc7\x95\x2b\x57\x3c\
-\x92\xe2\x9a\x93\xcd\x23\xb5\xeb\x54\xdc\xb6\x4f\x08\xee\x4b\x44\
-\x44\x04\x62\x63\x63\x79\x72\x21\x06\xdc\x1d\x9e\xef\xbe\xfb\x4e\
-\xfc\x58\x91\xea\xe7\x2f\x35\x42\xb0\xde\x26\x4f\x9e\xec\x91\x84\
-\x0e\x9c\xb7\xc5\x53\x45\xbe\x45\xeb\x9d\x24\x11\x1d\x1d\x8d\x61\
-\xc3\x86\x79\x64\xad\x11\x04\x81\xab\x57\xaf\x8a\xca\x82\x48\x78\
-\xc0\x14\xa1\x69\x1a\x06\x83\x01\xdf\x7e\xfb\xad\x47\xca\x03\x70\
-\x6b\x6d\xcb\x96\x2d\x1e\x1a\x79\x99\xa8\xbe\xa8\xd5\x6a\x1c\x3f\
-\x7e\xdc\x63\x7b\x24\x00\xac\x5d\xbb\x56\xcc\x8a\xf5\x88\xf9\x68\
-\xb5\x5a\x51\xbf\x7e\x7d\x0c\x1a\x34\xc8\x63\x65\x1d\xe4\x72\x39\
-\xf6\xed\xdb\x27\x85\x5c\x4a\x90\x20\x91\x40\x09\x12\x24\xbc\xee\
-\x70\x38\x1c\xc8\xce\xce\xf6\x58\x3a\xed\x72\xe5\xca\xbd\x36\x75\
-\x85\xac\x56\x2b\x72\x73\x73\x3d\xd2\x1f\x2e\xd3\xe7\xeb\x84\xe2\
-\xf7\x1e\xc5\x92\x13\x2e\x21\xcb\xdf\x0d\x82\x20\x50\x50\x50\x00\
-\xb3\xd9\xec\xb1\x62\xf1\x62\xef\x84\x7a\xfa\xe0\x25\x33\x33\xd3\
-\x23\x63\xcd\x65\x77\x7c\x1d\xf4\xc6\x30\x0c\x4c\x26\x93\xe8\xda\
-\x7e\x1c\x51\xf2\xf6\xf6\x7e\xad\x88\x44\x56\x56\x96\x47\x12\xc3\
-\x00\x45\x9e\x45\xb1\xd9\x8a\x3d\x05\xbb\xdd\x8e\xec\xec\x6c\xc1\
-\xa5\x58\x5e\x44\x60\x60\xa0\x44\x00\x25\x48\x90\x48\xa0\x04\x09\
-\x12\x5e\x77\xc8\x64\x32\x3c\x7c\xf8\x10\x5f\x7f\xfd\x35\xee\xde\
-\xbd\x2b\x3a\xd4\x51\xab\xd5\x62\xd2\xa4\x49\x4e\x59\x47\x05\x9a\
-\x26\xa0\x59\x39\x64\x22\x6c\x5b\xb9\x5c\x8e\x94\x94\x14\x8c\x1b\
-\x37\x0e\xf9\xf9\xf9\xa2\x0c\x13\xee\xde\x4c\x4c\x4c\x0c\x6f\x78\
-\x8b\x33\x72\x19\x10\x04\x09\xf0\x61\x6a\xee\x85\x4e\x12\x04\x81\
-\xa4\xa4\x24\xf4\xef\xdf\x1f\x0e\x87\x43\x74\xa8\x6b\x85\x0a\x15\
-\x30\x62\xc4\x08\xc1\xb5\x14\xff\x14\x8c\x06\x4b\xc8\x20\x86\x92\
-\x50\x14\x85\x9f\x7e\xfa\x09\xbb\x77\xef\x46\x76\x76\xb6\x28\x82\
-\xc3\x15\x8b\xdf\xb7\x6f\x9f\xf8\xc5\xc2\xb2\x60\x89\xa2\x3b\x65\
-\x66\x1a\x50\xcb\x00\x96\x05\xdc\xe9\x1e\xc3\x30\x58\xbb\x76\x2d\
-\x56\xad\x5a\x25\xca\x3b\xc9\x79\xa7\x02\x03\x03\x11\x1d\x1d\x2d\
-\x3a\x6c\x92\x66\x59\xc8\x38\x41\x58\x06\x20\x48\xb7\xf7\x11\x93\
-\xc9\x84\xcf\x3f\xff\x1c\xe7\xce\x9d\x83\xd9\x6c\x16\xa5\x37\x8a\
-\xa2\xd0\xa6\x4d\x1b\x51\x77\x94\x9f\x0b\xf3\x5c\x47\x04\x60\xb7\
-\x83\x95\xcb\xdd\x9e\x9b\x9c\x97\xfc\x83\x0f\x3e\x80\xd1\x68\x84\
-\xc9\x64\x12\x4c\xe0\x58\x96\x85\xc1\x60\x40\x50\x50\x10\xba\x77\
-\xef\x2e\xf6\x38\x01\x34\x43\x42\x46\x12\x00\x6c\xb0\x43\x01\x77\
-\x77\x5d\xee\xee\xed\x9c\x39\x73\x90\x9c\x9c\x2c\x6a\x4e\x12\x04\
-\x01\xb5\x5a\x8d\x11\x23\x46\x80\xa6\x69\xa9\xc0\xb8\x04\x09\x12\
-\x09\x94\x20\x41\xc2\xeb\x0a\x2e\x4d\xb9\xd1\x68\xc4\xd9\xb3\x67\
-\xd1\xa7\x4f\x1f\xa7\x64\x0c\x6e\xd3\x36\xbb\x1d\xb3\x67\xcf\xc6\
-\xed\xdb\xb7\xf9\xb6\xdd\x35\x04\x8a\xa8\x50\x1e\x96\x0e\x9f\x8e\
-\x4e\xab\xbe\x07\x7b\x76\x3d\x3e\x99\xb0\x04\xea\x77\xbe\xc4\xca\
-\x8f\xfe\x05\x9d\xca\x35\xe3\x8b\x4b\xc2\x60\x34\x1a\x71\xfa\xf4\
-\x69\xfc\xf8\xe3\x8f\x7c\x22\x1c\x21\xe3\x64\xb1\x58\x30\x7c\xf8\
-\x70\x9e\x94\x08\x36\x70\x0a\x1f\x60\xef\x91\x8b\xa8\xd5\xa2\x2f\
-\xbc\xef\x2d\xc3\x07\x53\x7f\x81\x3d\xa8\x33\x36\x6c\x9c\x82\x00\
-\x37\x9b\x7a\xf2\xe4\x09\xee\xde\xbd\x8b\x19\x33\x66\xa0\x42\x85\
-\x0a\x82\x0d\xb8\x67\xcf\x9e\xe1\xd3\x4f\x3f\x45\x8f\x1e\x3d\x04\
-\xeb\xad\x48\xb6\x3b\x58\xf4\xe3\x35\x8c\x19\xfb\x1e\x6e\x1f\x5d\
-\x8e\xa9\x53\xd6\xa2\xda\xf0\xf9\xf8\x7c\x68\x5b\xf8\xb8\x68\x9d\
-\x72\xcf\x8e\x8f\x8f\xc7\x6f\xbf\xfd\x86\xdd\xbb\x77\x0b\xf6\xe4\
-\xca\x64\x32\x9c\x3c\x79\x12\x2b\x56\xac\xe0\x3d\x38\x42\xf5\x96\
-\x72\xf7\x1a\xae\xfd\x91\x8d\x6e\x9d\x5b\x61\xdd\xec\x8f\xb0\xeb\
-\x78\x1c\x2a\x0e\xfa\x19\x4b\x07\x45\xb8\x2c\x17\x47\x02\x6e\xdc\
-\xb8\x81\x82\x82\x02\xcc\x9e\x3d\x5b\xf0\x1d\x4c\xa5\x52\x89\xcd\
-\x9b\x37\xe3\xe8\xd1\xa3\xa2\x43\x4b\x1f\x1e\xda\x80\x3d\x5e\x6d\
-\x30\xb6\xb1\x2f\xf6\x7e\xff\x6f\x2c\xd8\x95\x88\xae\x03\x27\x60\
-\xf4\x80\x76\xd0\x12\xae\xeb\xcc\x6a\xb5\xe2\xf4\xe9\xd3\xd0\x68\
-\x34\x98\x3c\x79\x32\x5f\x2f\xd4\x5d\xd8\x6c\x36\xac\x5e\xbd\x1a\
-\xb1\xb1\xb1\x7c\x99\x17\x21\xed\x58\xf3\xd2\xb1\x61\xdb\x7e\x0c\
-\x1c\x3e\x18\x05\xf1\x27\xf0\xc5\xa2\x1f\x10\xff\x90\xc0\xc0\x1f\
-\xb7\xe2\xfd\x60\xf7\x82\x95\x69\x9a\xc6\xa9\x53\xa7\x50\xbf\x7e\
-\x7d\xcc\x9f\x3f\x1f\x59\x59\x59\x82\xfa\x64\x30\x18\x30\x68\xd0\
-\x20\xa4\xa6\xa6\xa2\x4f\x9f\x3e\xa2\xe6\xe4\xd9\x6f\x66\xe3\x7e\
-\xf7\x49\xe8\x5d\xb0\x1f\xbd\xa6\x6c\x40\xd9\x2a\x35\x31\xfe\xf3\
-\x79\xa8\x13\xe8\xde\x1e\x99\x9d\x9d\x8d\x63\xc7\x8e\x61\xe8\xd0\
-\xa1\xa2\x12\xc3\xe4\xe7\xe7\x63\xca\x94\x29\x48\x48\x48\x10\x7d\
-\x98\x28\x41\x82\x44\x02\x25\x48\x90\x20\xc1\x03\x60\x18\xe6\xa5\
-\x97\xb2\x4c\x26\x73\xba\xdf\xa2\xd7\xeb\x11\x15\x15\x85\x0e\x1d\
-\x3a\x08\xf6\x04\xe5\xe7\xe7\xe3\x97\x5f\x7e\xe1\x9f\xc5\x95\x8a\
-\x28\x2d\x84\x8a\x24\x49\xfe\x64\x9d\x30\x3f\xc0\x67\xe3\x46\x61\
-\xe7\xef\x7a\x74\xb2\x3d\xc3\xa5\x33\xb7\xf1\xf6\x0f\xbf\xe2\xdc\
-\xb7\x1b\x11\x9f\xd7\x1c\x0d\x54\xde\x70\xd0\x74\x91\x0b\xa6\x04\
-\xc3\x86\x33\xae\x39\xf9\xfa\xf6\xed\x0b\x9d\x4e\x27\x48\x36\x2e\
-\x6d\xf6\xd4\xa9\x53\xf9\xf6\x38\x19\x4b\x33\xe2\x8b\x87\x58\xda\
-\xf3\x9e\x62\xcd\xf4\x91\xd8\x9e\x53\x0f\xeb\x3b\xb4\xc7\xca\x79\
-\xc7\x30\xe9\x97\xed\xf0\x5e\x3b\x10\x33\x63\x46\x63\x79\x6f\x5d\
-\x89\xed\x71\x89\x4e\x8a\x67\xf4\x0b\x0a\x0a\x42\xb7\x6e\xdd\x10\
-\x1a\x1a\x2a\x58\xb6\xd4\xd4\x54\xcc\x9f\x3f\xdf\xc9\xe0\x2d\xad\
-\x34\x00\xd7\x97\x3f\x99\xe4\x19\x0c\x1e\x34\x19\xa9\x55\x06\x23\
-\xda\x9a\x87\xbb\xb1\xd7\xf1\xc9\xaf\xab\xb0\xef\xfb\x7d\xb8\xff\
-\xa0\x36\xea\x86\xfb\x81\x66\x98\xbf\xd4\x1b\xe7\x5d\xe5\xc6\x95\
-\x65\x59\x84\x85\x85\xa1\x53\xa7\x4e\x82\xe7\x23\x57\x3f\x6f\xe3\
-\xc6\x8d\xfc\x67\x8e\x28\x97\x34\x27\x5f\x94\x2d\x3f\xeb\x04\x3e\
-\x1e\xf0\x6f\x84\x0c\xfc\x02\x6d\xef\xed\x42\xaa\xb6\x3d\xd6\xec\
-\x98\x8e\x05\x3d\x07\xe3\xda\xa0\x23\x78\x03\x2c\x1c\x8e\xbf\x26\
-\xe0\xc5\x4b\x02\x70\xb2\x86\x85\x85\xa1\x77\xef\xde\xbc\xac\x42\
-\x64\x4b\x4b\x4b\xc3\xd1\xa3\x47\x79\x3d\x71\xde\xf7\x92\x64\x2b\
-\xbe\xd6\x00\xc0\x9e\xb8\x07\x1f\x4d\x98\x8d\xf2\xf3\x9a\x82\xc9\
-\x4d\xc3\xf5\x5c\x7f\xfc\xba\xa9\x2f\xf6\xed\x8e\xc3\xc3\xe4\x06\
-\xa8\x1e\xac\x2f\xd1\xa0\x27\x49\xd2\xe9\x79\x0c\xc3\xa0\x59\xb3\
-\x66\xe8\xd9\xb3\xa7\x60\xb9\xac\x56\x2b\xe2\xe2\xe2\x70\xe7\xce\
-\x9d\x3f\xd7\xce\xf3\x50\x75\x77\x64\xfb\x63\xcf\x5c\xac\x3a\xe9\
-\x8b\x61\xc3\x81\xdf\x2e\x27\xa3\xdb\x88\xe9\xf8\x9c\xde\x89\xda\
-\xc3\x36\xa3\xe7\xfe\x7e\xd0\xc8\x18\x38\x68\xa6\x44\xbd\x15\x5f\
-\x03\x2a\x95\x0a\x75\xea\xd4\x11\xb5\x47\x12\x04\x81\x32\x65\xca\
-\xf0\xeb\xb7\x78\x29\x87\xbf\x92\x8d\xdb\xd3\xf8\xbe\x38\xd2\xb1\
-\xfb\x87\x2f\x31\x6d\x7a\x0c\x06\xb7\x1b\x8d\x2d\xdb\xe3\x30\x65\
-\xcd\x66\x18\xee\x1f\xc2\xd5\xd3\xa7\x50\xa7\x6f\x1b\x30\x0c\x0d\
-\x86\x61\x4b\x94\xad\xf8\xc1\x88\x5c\x2e\x47\x54\x54\x14\xda\xb5\
-\x6b\x27\x58\xae\xb4\xb4\x34\xac\x5e\xbd\xda\x69\x7f\x7a\x95\x5c\
-\xa2\x0e\x9a\x24\x48\x90\x48\xa0\x04\x09\x12\x24\xb8\x8e\xb5\x6b\
-\xd7\x62\xd3\xa6\x4d\x4e\x24\x88\x20\x08\x64\x66\x66\x3a\xd5\x2b\
-\xe3\x8c\x3d\x4f\xbc\x9c\x15\x0a\x05\xae\x5d\xbb\x86\x3e\x7d\xfa\
-\x94\x18\xaa\x46\x10\x04\xda\xb7\x6f\x8f\x71\xe3\xc6\x81\xa6\x19\
-\x90\xaa\xca\x98\xbd\xea\x27\xd0\x6d\x87\xa0\x40\x11\x88\xee\xd1\
-\x53\x21\x37\xdf\x41\x0c\x23\x87\x1f\xa5\xc0\xc3\xfb\xf7\x31\x76\
-\xfc\xf8\xbf\xf4\x7a\x71\x7d\x8f\x8b\x8b\x43\xf3\xe6\xcd\xf9\xef\
-\x8b\xcb\x2d\x04\x2f\x1a\x7d\xb1\xb1\xb1\xe8\xda\xb5\x6b\x89\x35\
-\xa7\x18\x86\xc1\xac\x59\xb3\x50\xaf\x5e\x5d\x80\x05\x64\x86\xb2\
-\x18\x32\x63\x1e\x14\x3b\x7f\x47\x61\x36\x8b\x0f\xbf\x5f\x0d\x7f\
-\x5f\x25\xe6\x9d\xcd\x40\x95\xae\x3a\xfc\x76\xe2\x30\xe6\x7d\xf3\
-\x5d\x89\x63\xc5\xc9\x56\xb1\x62\x45\x8f\xc9\x56\xdc\xc8\xd7\x6a\
-\xb5\x58\xb2\x64\x09\x76\xef\xde\x5d\xe2\x6f\xd4\x6a\x35\x66\xcc\
-\x98\x81\xda\xb5\x6b\x83\xa6\x69\xc8\x02\x5b\x62\xf9\x4f\x4b\xf0\
-\xd9\xe2\x8b\x80\xd2\x1b\x9d\xc7\xcc\x05\x1e\x1d\xc7\xda\x42\x02\
-\x3e\x5e\xde\xd8\xb4\x69\x13\x36\x6c\xd8\x00\xa5\x52\xf9\xca\xf1\
-\xe2\x88\xf6\xb5\x6b\xd7\x78\x72\xf4\xa2\xdc\x62\xf5\xa6\x50\x28\
-\xb0\x74\xe9\x52\x1c\x3a\x74\xe8\x2f\x0d\x6e\x87\xc3\x81\x88\x88\
-\x70\x4c\x9d\xfa\x29\xca\x97\x2b\x0b\x86\x05\xf4\x65\x5a\x61\xc6\
-\x92\xb9\xb8\x98\x94\x07\x59\xf9\x28\x8c\x1b\xab\x83\x21\x65\x35\
-\x62\x2d\xa1\x98\x04\x60\xcb\xc6\x4d\x58\xb9\x66\x0d\xf4\x7a\xfd\
-\x2b\x65\x23\x49\x12\x05\x05\x05\x28\x28\x28\x78\x65\xbf\xc4\xce\
-\x49\x8e\xec\x7e\xf6\xd9\x67\x58\xb9\x72\xe5\x5f\x92\x36\x86\x61\
-\x10\x1e\x1e\x8e\x25\x4b\x16\x83\x24\x08\xd0\x0c\x20\xaf\xda\x0d\
-\x5f\x4e\xbd\x83\xff\x63\xef\xbc\xe3\xa3\xaa\xb6\xb7\xff\x3d\x67\
-\x7a\x7a\x4f\x08\x25\x09\x84\xde\x42\x15\xa4\x57\xe9\x5d\x10\x2e\
-\x45\x9a\x4a\xb5\x20\xa8\xa0\xe8\x55\x3a\x22\xa8\x34\x41\x40\xaa\
-\x22\x2a\x55\x8a\x52\xa4\x0b\xd2\x8b\x12\x5a\x08\x21\x40\x7a\x2f\
-\x53\xcf\xfb\x47\x98\x31\x51\x93\x4c\x66\xe6\x77\xf5\xbd\xf7\x3c\
-\x7f\xdc\xcb\xc4\xcf\xec\x39\x6b\xb7\xb3\x9e\xbd\xd6\x5e\xcf\x56\
-\xad\x80\xe8\x5b\x91\x09\x2f\xbf\x4c\x4e\xf4\x41\xe2\x1f\x67\xe0\
-\x17\xe4\xcd\xa4\x89\xe3\xb9\x1b\x13\x63\x3b\x7c\xf8\xab\x71\xb3\
-\xa6\x5a\x5b\x09\x98\xb3\xf3\xf1\x8f\xfd\xa3\x52\xa9\x4a\x95\xd3\
-\x30\x18\x0c\x74\xef\xde\x8d\x57\x5e\x79\x05\x8b\xd9\x82\x24\x28\
-\x88\xe8\x34\x89\x9e\x31\xdf\x90\x2b\x41\x87\x3e\xcf\xe2\xee\xe1\
-\xc1\xe1\x7f\xbf\x81\xae\x56\x17\xcc\x66\x3d\x6f\xbf\xfb\x3e\xa7\
-\x7f\xfe\xb9\xd8\x14\x68\x95\x4a\xc5\xad\x5b\xb7\xfe\x72\xaf\x71\
-\xc5\x1e\xa9\x50\x28\x78\xf8\xf0\x21\x13\x26\x4c\xc0\xdb\xdb\xfb\
-\x2f\x6d\xb3\x0a\xca\x4f\x9e\x3c\x99\x67\x9f\x7d\xb6\x20\xcd\x52\
-\x0c\xa4\xf7\x84\x4f\xb0\x44\x67\x71\x5b\x12\x18\xf8\xea\x74\xdc\
-\x75\xb0\x7b\xe7\x59\xcc\x95\x47\x91\x67\xc8\x67\xcc\xc8\xd1\xa4\
-\xa5\xa5\x15\xfb\x9c\xd6\xc3\x1f\xab\x7c\x4f\xe1\x7d\xcc\x55\x77\
-\x55\xd3\xd2\xd2\xe8\xdd\xbb\x77\x91\xb5\x66\x32\x99\x08\x0f\x0f\
-\x67\xc1\x82\x05\x4e\xeb\x9b\xca\x90\x21\x93\x40\x19\x32\x64\xc8\
-\x28\x05\x63\xc6\x8c\x61\xcc\x98\x31\x7f\xfa\xfb\xc5\x8b\x17\x6d\
-\xf7\x52\x24\x49\xc2\x6c\x36\x3b\x75\x27\xc4\x1a\xf9\x83\x82\x82\
-\x2c\x4d\x9a\x34\xe1\xc0\x81\x03\x76\x7d\x77\xdd\x67\x9f\xf2\xea\
-\x8a\x8b\x1c\xdb\xf5\x31\xf5\x2a\x15\x44\x85\x44\x40\x95\x17\xc7\
-\xcc\x0f\x36\x31\xf0\x85\x97\x09\xf3\x77\x43\xf4\xaf\xcc\xae\x5d\
-\xbb\x4a\x6d\x6f\xea\xd4\xa9\xc4\xc4\xc4\xd8\x3e\x5b\x23\x31\x8e\
-\xa4\x29\x15\x8e\x2c\x5a\xd1\xaa\x55\x2b\x76\xef\xde\x6d\xd7\xf7\
-\xcf\x2f\xe8\xc6\x9c\x25\x27\xb8\xdf\x63\x1e\xa7\x16\xb6\x43\x21\
-\x80\x05\x1d\x01\xde\x89\xbc\x37\xec\x5f\xe4\x8d\xde\xc6\x82\x5a\
-\x40\xad\x67\x68\xd5\xfe\x99\x52\xdb\x1b\x3c\x78\xb0\x2d\x4a\x62\
-\xb1\x58\x9c\xb2\xad\x70\xdf\x58\x0b\xb2\xbc\xfd\xf6\xdb\x0c\x19\
-\x32\xc4\xae\xef\x9e\xda\xba\x89\xfe\xe3\xe7\xb1\x74\xcf\x5e\x7a\
-\x56\x13\x6d\x37\x1b\x73\x1f\x5e\xe1\x9d\xc5\xc7\xe8\x37\x79\x3a\
-\x95\x83\x55\x54\x1e\x36\x8c\x61\xc3\x86\x95\xd8\x56\x46\x46\x06\
-\xbd\x7b\xf7\xb6\x45\x7d\x0a\x47\x5b\x1d\x75\xb2\x0b\x8f\x9b\x5e\
-\xaf\x67\xda\xb4\x69\x8c\x18\x31\xc2\x8e\x6f\x27\x32\xa9\x76\x05\
-\x36\x07\x3d\xc7\xc3\x43\x1f\xa1\x54\x88\x08\x92\x05\x95\xce\x83\
-\x84\x9f\x96\xf3\xcc\xdb\xbf\xb0\xe2\xd4\x3a\x82\x91\x18\x3c\x6c\
-\x18\x83\x4b\xb1\x2d\x31\x31\xb1\xc8\xfd\x36\xeb\x33\x39\x63\x9b\
-\x35\x8a\x64\xb1\x58\x10\x45\x91\xd9\xb3\x67\xd3\xb5\x6b\xd7\xd2\
-\xbf\x9c\x9f\xc6\xde\xb7\xda\x33\x62\x7f\x15\x36\xed\xda\x42\x45\
-\xdb\x21\x8d\x82\xf4\x1b\x3b\x79\x77\xe1\x4e\xfa\xbd\xb3\x94\x72\
-\x6e\xb0\xec\x89\x08\x7c\x49\x88\x89\x89\xa1\x7a\xf5\xea\xb6\xe7\
-\xb1\xde\x51\x75\x34\x5a\x66\x36\x9b\x8b\xcc\x65\xa3\xd1\xc8\xbe\
-\x7d\xfb\xec\xbb\xf7\x68\xbc\x40\xff\xfa\xdd\xb8\xd6\x76\x0d\xb7\
-\x3e\x8c\x42\x78\x32\x21\x3d\xdc\x0c\xac\x7f\xbd\x1f\x5f\xab\xc6\
-\x73\x6b\x71\x53\x00\x66\xcd\x9e\x5d\x6a\x73\xab\x57\xaf\xe6\xb5\
-\xd7\x5e\x73\xe9\xb8\x59\xd7\x9a\xd9\x6c\xa6\x52\xa5\x4a\xac\x59\
-\xb3\xc6\xae\xbb\x8f\x99\xf1\xd7\xe8\xfd\x54\x73\xfc\x87\xae\xe7\
-\x9b\x79\xfd\x0a\x6c\x03\xb4\x1a\x23\x6b\xa6\x8f\xe5\xa4\xc7\x48\
-\xd6\x4d\xaa\x8b\x00\x6c\xde\xbc\xb9\xd4\xf6\x76\xee\xdc\xc9\xab\
-\xaf\xbe\x6a\x23\x7e\xd6\xfd\xdf\x99\xc3\xa4\xc2\x6b\x36\x20\x20\
-\xa0\xd4\xc3\x24\x19\x32\x64\xc8\x24\x50\x86\x0c\x19\x7f\x03\xb2\
-\xb3\xb3\x6d\x2f\xfc\xac\xac\x2c\xbe\xfb\xee\xbb\x22\xc4\xa9\xac\
-\x30\x1a\x8d\x5c\xba\x74\x89\xd6\xad\x5b\xdb\x9c\xc1\x9c\x9c\x1c\
-\xbb\xc4\xe2\x07\x8f\x18\x43\xcf\x81\x26\x7c\xbc\x3d\x81\x5c\xf2\
-\x73\x72\xb0\x98\xd2\x59\x37\xfb\x4d\xe2\x3d\xba\xd1\x16\x03\x69\
-\x7a\x23\xfe\x1a\xfb\x2e\x97\x59\x2b\xdd\x59\x9d\x92\xd5\xab\x57\
-\xdb\xc4\x91\xcb\x0a\x6b\x94\x2a\x39\x39\xb9\xd8\x14\xa7\x92\x50\
-\x7f\xe2\x97\xac\x1b\x6d\xc0\xa2\xf5\x86\xdc\xcb\xe4\xeb\xcd\xe8\
-\xdc\xf2\xf8\x78\x78\x4f\x7e\x6d\x34\x93\xe9\xe5\x1e\x70\x33\xb1\
-\x1c\xd5\x82\xd4\x76\xf7\xb3\xf5\xb9\x62\x62\x62\xd8\xb0\x61\x03\
-\xa1\xa1\xa1\x0e\x93\xc0\xe4\xe4\x64\x32\x33\x33\x6d\xce\x69\x6e\
-\x6e\xae\xdd\x15\x27\x9b\xf4\xe9\xcf\xb5\x0e\x5d\xf1\xf4\xf3\x47\
-\x4a\x89\x23\x3f\xdf\x80\xd1\x90\xc1\xc6\xc5\x1f\xe0\x56\x75\x14\
-\xe5\x4d\xe9\xa4\xe7\x06\xe2\xe3\x56\xba\x6d\x39\x39\x39\x45\x2a\
-\xd4\xc6\xc7\xc7\xf3\xc5\x17\x5f\x90\x95\x95\xe5\x90\x63\x2a\x8a\
-\x22\x27\x4e\x9c\x20\x27\x27\xe7\x77\xfe\x63\xb7\xf0\x7c\x20\x73\
-\x8f\x5f\xe1\x5d\x51\x8b\x56\x94\x30\x99\x8c\x18\x25\x25\xf9\x77\
-\xbf\xe7\xa5\x59\x07\x99\x3a\xff\x55\x72\xcf\x5c\x20\xbb\x79\x43\
-\x3c\x04\xfb\xd6\x9a\x75\xee\x58\x2c\x16\x6e\xdc\xb8\xc1\xb2\x65\
-\xcb\x8a\x10\x8b\xb2\x40\xad\x56\x73\xe8\xd0\xa1\x22\xdf\xb5\xbb\
-\xba\xa3\xc6\x87\x8e\x1f\x1c\xe6\xc6\x3b\x02\x7e\x7e\x6a\x2e\x1d\
-\xcb\x23\xdf\x2c\x61\xce\xb8\xc3\x07\xef\x7d\x4c\xf5\x61\xb3\xa9\
-\xa2\x4e\x24\x4b\xef\x81\xa7\xa6\x74\x69\x85\xbc\xbc\xbc\x22\x7d\
-\x7e\xf0\xe0\x41\xd6\xac\x59\xe3\xf0\x9d\x40\xbd\x5e\xcf\xc9\x93\
-\x27\xf1\xf5\xf5\xb5\xd9\x97\x95\x95\x65\x9f\xa0\xba\xaa\x1e\xeb\
-\x8f\x5f\xc1\xa4\xf5\x21\x2f\xfb\x01\xf9\x7a\x3d\x4a\x60\xf7\xd2\
-\x05\x1c\xb0\x34\x67\x6a\x17\x2f\x0e\x9f\x7b\x40\x9b\x86\x15\x50\
-\xd8\x71\x75\x2e\x3f\x3f\xdf\x16\x25\xcb\xcf\xcf\xe7\xca\x95\x2b\
-\x6c\xdc\xb8\xd1\xe1\x7b\xaa\x1e\x1e\x1e\x24\x27\x27\xe3\xe3\xe3\
-\x63\x23\x5e\xf6\x0a\xcf\x7b\x96\xab\xc9\xf6\xcb\x77\x11\xb4\x05\
-\x11\x34\x43\x5e\x1e\x92\xa0\xe0\xbb\x99\x23\xf8\xda\xd8\x93\x25\
-\x03\xab\x10\xfb\x38\x83\xf0\x10\xfb\x22\x6c\xbd\x87\xb3\x6c\x00\
-\x00\x20\x00\x49\x44\x41\x54\xb9\xb9\xb9\xb6\xb4\x4d\x93\xc9\xc4\
-\xd6\xad\x5b\xb9\x73\xe7\x8e\xc3\xfb\x7f\x6e\x6e\x2e\xb7\x6f\xdf\
-\xa6\x73\xe7\xce\x45\xf6\x5e\x19\x32\x64\xc8\x24\x50\x86\x0c\x19\
-\xff\x40\x48\x92\x84\x9b\x9b\x1b\x75\xea\xd4\xe1\xd4\xa9\x53\x9c\
-\x39\x73\xc6\xe1\xb6\x04\x41\xc0\xdf\xdf\x9f\xf0\xf0\x70\x6e\xdc\
-\xb8\x51\xa6\xef\x6a\xb5\x3a\xb4\x5a\xeb\x27\x77\x3a\x8e\xf8\x17\
-\x7e\x26\x89\xe0\xaa\x8d\x09\xcf\xca\xe5\xe4\xb1\x0b\x54\x69\x50\
-\xc3\x6e\x12\x68\x75\x42\x3c\x3c\x3c\xa8\x53\xa7\x0e\xeb\xd7\xaf\
-\x77\xba\xaf\xca\x97\x2f\x6f\x4b\xf9\x2b\x8b\x03\xa8\x74\xf3\xc6\
-\xcb\xad\xe0\xdf\x66\x29\x84\x06\x8d\x9a\xe2\xe7\x91\x8d\x67\xc3\
-\xfe\x34\x74\x8b\xe3\xc7\x63\x71\x34\xf1\x6d\x48\xb5\x32\x56\x86\
-\x09\x0c\x0c\x24\x34\x34\x94\xed\xdb\xb7\x3b\x9d\x7a\xd7\xa0\x41\
-\x03\x7c\x7d\x7d\xcb\xec\xb8\xa9\x34\x3a\xfc\x35\x05\x29\xc5\x26\
-\xb7\x0a\x74\xee\xf0\x14\x0a\x8b\x82\x90\xb0\x28\xd2\x2d\xf1\x1c\
-\x39\xad\xa1\x5c\x64\x65\x7c\xdc\xec\x9b\x3f\xd6\xe7\x09\x0f\x0f\
-\xa7\x6a\xd5\xaa\x2c\x5a\xb4\xc8\x39\x21\x74\x49\xa2\x7a\xf5\xea\
-\x0e\x54\xcf\x14\xf0\xf0\x0b\xc0\xa3\xa0\x15\x02\xcb\x87\xd3\xc0\
-\xcd\x8c\x64\xba\x4f\xbb\x0e\x8d\xb9\x75\xfc\x38\x71\x3e\x55\xa8\
-\xd6\xcc\x3e\x12\x58\xd8\xc6\x2a\x55\xaa\xa0\x50\x28\x58\xbe\x7c\
-\xb9\x4b\xc6\x4d\xa9\x54\x96\xad\x8f\x04\x01\xb5\x87\x2f\xfe\x4f\
-\x3e\x06\xd7\x7b\x9a\x8e\x5e\x7e\x40\x26\xf5\x9b\x36\x25\xef\xfe\
-\x69\x4e\x29\xea\x13\x5c\x31\xcc\x2e\x12\x68\x7d\x16\x95\x4a\x45\
-\x54\x54\x14\xc7\x8e\x1d\xe3\x93\x4f\x3e\x71\x78\xdc\x24\x49\xc2\
-\x60\x30\xd0\xb2\x65\x4b\x07\xc6\x4d\x89\x97\x7f\xc1\x42\x32\x48\
-\x3e\xb4\x69\xd3\x12\x11\x08\xa8\x5a\x9f\xc6\x39\xb7\xf8\xf9\xf4\
-\xcf\x08\x15\x3d\x68\xd5\xa0\x3c\x65\xa9\x61\xab\x50\x28\xa8\x5f\
-\xbf\x3e\xe9\xe9\xe9\xcc\x9f\x3f\xdf\xa9\x31\x2b\x5f\xbe\x3c\xe1\
-\xe1\xe1\xa5\xde\xbb\xfd\xd3\xb0\x89\x0a\x7c\xfc\x03\x6d\x9f\x6b\
-\x76\xeb\x4d\xb9\x00\x15\x59\x35\x5a\xd2\x3e\x3d\x87\xef\x0f\x9d\
-\xa6\xd5\x33\x41\x76\x93\x40\xeb\x1e\xe9\xe5\xe5\x45\xc3\x86\x0d\
-\x39\x73\xe6\x0c\xe7\xce\x9d\x73\x6a\x8f\x2c\x57\xae\x1c\x61\x61\
-\x61\x5c\xbb\x76\x4d\x7e\xb9\xca\x90\x21\x93\x40\x19\x32\x64\xfc\
-\x93\x61\x32\x99\x88\x88\x88\x60\xd9\xb2\x65\x65\x88\x92\x94\xec\
-\xe4\x46\x46\x46\xda\x9d\x2a\xf9\xd7\xf0\xa0\xfb\xf8\xb1\x00\x54\
-\x9c\x3c\x8b\x5e\x4e\xd8\x56\xa9\x52\x25\xbe\xfa\xea\x2b\xa7\x65\
-\x1d\x04\x41\xb0\x89\xcf\x3b\x73\xc2\xad\xf0\xa8\xc8\x53\xcd\x0b\
-\xee\xf3\x8d\x79\xe7\x3d\xa7\x9c\xc9\x1a\x35\x6a\xb0\x73\xe7\xce\
-\x22\x45\x18\x1c\x7e\x09\x29\x95\x78\x7a\x7a\xb2\x72\xe5\x4a\x87\
-\x89\x89\xd2\x3d\x8c\xde\x3d\xc2\x00\x18\xf2\xf6\x62\x87\x9f\xc5\
-\x6c\x36\x33\x7a\xf4\x68\x7a\xf7\xee\xed\x32\x9d\x40\xed\xef\x27\
-\x0c\x8e\x8c\x3e\xc1\x95\x22\x09\xae\x04\x50\x9d\x69\x6f\x75\x72\
-\x6a\x1e\x8d\x1e\x3d\x9a\x4e\x9d\x3a\xb9\x64\x4e\x5a\xef\x5e\x39\
-\xa3\x5f\x17\xda\xa4\x03\xa1\x00\xf8\xf1\xf2\xbf\x17\x39\xd4\x86\
-\xc5\x62\xc1\xcd\xcd\x8d\xf7\xdf\x7f\x9f\xd4\xd4\x54\xa7\xed\xb2\
-\x58\x2c\x04\x06\x06\xf2\xc3\x0f\x3f\x38\xdc\x8e\xda\xc3\x8f\xce\
-\xcf\xb4\x07\xa0\x79\xd7\xc1\x34\xef\xea\xf8\x5a\xd3\xe9\x74\x6c\
-\xda\xb4\x09\x93\xc9\xe4\xf4\x9c\xb4\x16\x62\x39\x72\xe4\x88\xe3\
-\x8d\x48\x50\xb7\xdf\xe0\x82\x7f\x8f\x9d\x4e\x37\x07\x9b\x31\x18\
-\x0c\xd4\xad\x5b\x97\xd5\xab\x57\xbb\x6c\xff\x0f\x0b\x0b\xe3\xc0\
-\x81\x03\xb2\x56\xa0\x0c\x19\x32\x09\x94\x21\x43\xc6\x3f\x19\x92\
-\x24\xe1\xee\xee\x8e\x9f\x9f\x9f\x4b\xdb\x75\xe6\x6e\xa1\xab\x60\
-\xb1\x58\xd0\xe9\x74\xd4\xae\x5d\xdb\xe5\x7d\xf6\x4f\x41\xad\x5a\
-\xb5\x5c\xd6\x96\x5e\xaf\xff\x47\x8c\x9b\x24\x49\x84\x84\x84\x10\
-\x12\x12\xe2\x52\xdb\xfe\x29\xf0\xf4\xf4\x74\xe9\x9c\xbc\x70\xe1\
-\xc2\xdf\x3e\x27\xad\x85\x61\x82\x83\x83\x09\x0e\x0e\x76\x59\xbb\
-\x45\x2a\xd0\xfe\x8d\xb6\x29\x14\x0a\x17\x68\x16\x16\x85\xbd\xf7\
-\xa5\x8b\x39\x97\x70\xd9\x1e\xe9\xed\xed\x4d\xe5\xca\x95\x5d\x6a\
-\x9b\xa3\x3a\x8a\x32\x64\xc8\x24\x50\x86\x0c\x19\x32\xfe\x43\x50\
-\xa9\x54\x5c\xb9\x72\x85\x97\x5e\x7a\x89\x98\x98\x18\xa7\x45\xa7\
-\x05\x41\x60\xce\x9c\x39\x4e\x46\x5e\x5c\x03\x8d\x46\xc3\xf5\xeb\
-\xd7\x69\xd7\xae\x9d\xc3\xf2\x10\x85\xed\x4a\x4c\x4c\xe4\xca\x95\
-\x2b\xc5\x56\x4a\xfc\x4f\x42\x10\x04\x2e\x5f\xbe\x4c\xbb\x76\xed\
-\x8a\xc8\x50\x38\x0a\x0f\x0f\x0f\xe6\xcf\x9f\xef\x74\x3f\xb9\x6a\
-\x4e\xbe\xfd\xf6\xdb\xac\x59\xb3\xc6\x69\x52\x6a\x2d\x98\x13\x1d\
-\x1d\xfd\x8f\x58\x6f\xd6\x8a\xb1\x0b\x17\x2e\x2c\x52\x99\xd7\xd1\
-\x39\xe0\xe1\xe1\xc1\x8a\x15\x2b\x50\xab\xd5\x7f\xab\x5d\x0a\x85\
-\x82\xcc\xcc\x4c\x06\x0e\x1c\xc8\xd1\xa3\x47\x9d\x9e\x43\x7a\xbd\
-\x9e\x6e\xdd\xba\xd1\xbe\x7d\xfb\xbf\x7d\xcc\x44\x51\x24\x2b\x2b\
-\x8b\xc8\xc8\x48\x32\x33\x33\x5d\xb2\x76\xab\x56\xad\x6a\x2b\xca\
-\xf2\x77\x42\xa7\xd3\x71\xe4\xc8\x11\xfa\xf7\xef\x4f\x42\x42\x82\
-\xd3\xfb\x88\x24\x49\x4c\x9f\x3e\x1d\x83\xc1\x20\x4b\x40\xc8\x90\
-\x21\x93\x40\x19\x32\x64\xfc\xd3\x61\x30\x18\x48\x4a\x4a\xa2\x72\
-\xe5\xca\x54\xa8\x50\xc1\xe1\x76\xcc\x66\x33\x27\x4e\x9c\xb0\x95\
-\x26\x77\xc8\x09\x90\x2c\xe8\xf5\xb9\x1c\x5a\xb3\x91\xfa\x13\xc6\
-\x61\xbe\xfa\x23\xdb\xb6\x1e\x21\xaf\x72\x3b\x5e\x19\xd2\x0e\x0f\
-\xad\xfd\xdb\xa5\x20\x08\x18\x0c\x06\x72\x73\x73\x69\xdb\xb6\xad\
-\x4d\x47\xcd\x51\xdb\xf6\xec\xd9\x63\x73\x6e\x1c\xb3\x0d\xf4\xe9\
-\x77\xb8\xf0\xdb\x23\x2a\xd7\x79\x1a\x8f\xd8\x1d\x7c\xb4\x33\x1a\
-\x37\xcf\x40\xba\x8f\x1d\x43\x0d\xb7\xb2\x35\x97\x93\x93\x43\x56\
-\x56\x16\xad\x5b\xb7\xc6\xcb\xcb\xcb\x61\xc7\x3b\x27\x27\x87\xb3\
-\x67\xcf\xda\x0a\x45\x38\x66\x9b\x19\x7d\x66\x1c\xfb\x8e\xdd\xa3\
-\x47\xcf\xd6\xc4\x5e\xdc\xc3\xd7\xdb\xce\xe0\x5e\xbf\x2b\xc3\x7b\
-\x3e\x8d\x8f\x9b\xfd\x02\xd6\x50\x50\x29\x34\x31\x31\x91\x01\x03\
-\x06\x38\x5c\x60\xc4\x5a\x38\xe7\xf2\xe5\xcb\xce\x91\x12\xc9\xc8\
-\xfd\x98\xbb\x3c\x4c\xd5\xd3\xac\x71\x1d\x0e\x7e\xb5\x92\x0b\xf7\
-\x52\xf1\x0e\xef\xc8\x98\xe7\x9a\xa1\x28\x83\x5d\x82\x20\x90\x9a\
-\x9a\x8a\x28\x8a\xb4\x68\xd1\xc2\xe1\xe7\x52\x28\x14\x5c\xbf\x7e\
-\x9d\x94\x94\x14\xa7\x52\x41\x41\xe2\xe1\xcf\x3f\x72\xd6\xbb\x21\
-\x7d\x22\xd5\xec\xde\xf4\x19\x97\x1e\x89\x34\xe9\xd0\x9d\xf6\x4f\
-\xd5\x40\x5d\x86\xbe\x36\x9b\xcd\x24\x24\x24\xa0\x52\xa9\x78\xea\
-\xa9\xa7\x1c\x26\xf0\x66\xb3\x99\x73\xe7\xce\x91\x9c\x9c\xec\xd4\
-\x21\x80\x21\x2b\x99\xc3\x27\x2f\xd1\xb1\x4b\x47\xb2\xef\x5f\x66\
-\xc7\xee\x43\x24\xe4\x40\x68\xfb\x17\x18\xd2\xd8\x83\xb2\xc4\x18\
-\x25\x49\xe2\xf1\xe3\xc7\xf8\xf8\xf8\xd0\xb2\x65\x4b\x87\x53\x27\
-\xd5\x6a\x35\xdf\x7f\xff\x3d\xc9\xc9\xc9\x4e\xa4\x03\x5b\x30\x5b\
-\x2c\x5c\xdb\xb6\x85\xa4\xd6\x03\x68\x96\x79\x8e\x65\xdb\x8f\xa3\
-\xf5\xad\x44\xe7\x5e\x7d\xa8\x59\xce\xb3\x4c\x6b\x44\xaf\xd7\xf3\
-\xf8\xf1\x63\x22\x22\x22\x28\x5f\xbe\xbc\x53\xc4\xfd\xd0\xa1\x43\
-\x64\x64\x64\xc8\xa9\xa0\x25\x20\x2d\x2d\x8d\xa8\xa8\x28\xee\xdf\
-\xbf\x6f\xfb\x9b\x56\xab\x65\xcb\x96\x2d\xf4\xed\xdb\x57\xee\x20\
-\x99\x04\xca\x90\x21\x43\x86\xeb\xf0\x57\xa5\xbf\xad\xf7\xc8\xac\
-\xf7\x6f\xdc\xdd\xdd\x99\x37\x6f\x9e\xc3\x62\xc1\x50\x10\xe5\xe8\
-\xd9\xb3\x27\x79\x79\x79\xb6\x08\x8c\x55\x78\xbc\x24\x88\xa2\xf8\
-\x7b\xda\x97\xfe\x01\x1f\x4e\x1b\xcf\xfa\xef\xe1\xc0\x84\x91\xdc\
-\xb8\x74\x82\x14\x75\x5d\x06\xb4\xac\x81\x46\x29\xda\x2a\xd9\x95\
-\xe6\x20\xff\xf1\xde\xde\xf6\xed\xdb\x9d\x8a\x96\x58\x85\xd9\x0b\
-\xdb\x0a\x94\x6a\x9b\x42\xa1\xb0\xa5\x46\x99\xb3\x93\xd8\xf0\xc1\
-\x64\xbe\x7c\x54\x9d\x55\x2b\x5a\x12\xb7\xfd\x33\x32\x2a\xbe\x4b\
-\xf7\x86\xde\x84\xa8\x0b\x08\xb0\xd1\x54\xb2\xd3\xab\x52\xa9\x6c\
-\x0e\x96\xd1\x68\xa4\x46\x8d\x1a\x6c\xdc\xb8\x91\xd0\xd0\x50\x87\
-\x6d\x7b\xfc\xf8\x31\x51\x51\x51\x45\xaa\x57\xda\x53\xb4\xa2\x88\
-\x98\x76\xca\x59\x26\x8f\x7a\x95\xe8\x90\x7f\xd1\xbd\x67\x53\xee\
-\x5f\x3f\x86\x18\xd2\x9a\xb6\x8d\xab\xe0\xa6\x2e\xbd\xfc\xbc\xb5\
-\x9a\x6c\xe1\xea\xab\x61\x61\x61\x6c\xdd\xba\xd5\xa9\xb9\xff\xcd\
-\x37\xdf\x30\x72\xe4\xc8\x3f\x95\xf6\x2f\x69\xdc\xac\x62\xf1\xb6\
-\xca\xb9\xa9\xa7\x79\x63\xf8\x9b\x84\x0c\x78\x93\xa6\x75\x7d\xf9\
-\xf9\xea\x03\xea\xb5\x7b\x86\xca\xe1\x11\x88\x80\xc5\x6c\xc6\x54\
-\x82\x6d\x85\x85\xb9\xad\xeb\xa2\x75\xeb\xd6\x6c\xdf\xbe\xdd\x29\
-\xdb\x96\x2f\x5f\xce\x5b\x6f\xbd\x65\xfb\x5d\xab\x2c\x43\x49\xeb\
-\x43\x10\x84\x22\xd1\x7e\xf3\xed\xfd\xbc\x34\x72\x02\x7e\xb3\xf7\
-\xd3\x3b\x58\xc1\xd9\x5f\x1f\xd1\xaa\xd7\x30\xaa\x47\x84\xa0\x7c\
-\x32\x0e\xa5\x39\xf4\x85\x45\xc7\x73\x72\x72\x18\x3a\x74\x28\xf3\
-\xe6\xcd\x73\xca\xb6\xc9\x93\x27\x73\xfd\xfa\xf5\x22\x42\xea\x7f\
-\x94\x8e\xf8\xe3\xfa\x54\x28\x14\x45\xd2\x47\x6f\xed\x9a\xc7\x5b\
-\xdf\xe9\xe8\xd2\xa5\x23\x57\xaf\x5e\xc3\xa4\xf6\xa1\x59\x83\xfa\
-\x94\x0b\xd3\x20\x3c\x69\xb3\xb0\x58\xfb\x5f\xad\xb5\xc2\xbf\xa7\
-\x54\x2a\xe9\xdb\xb7\x2f\x9f\x7e\xfa\xa9\x53\xb6\xd5\xaa\x55\xab\
-\x48\x9f\x5a\x65\x4c\x8a\x1b\x37\x49\x92\x50\x2a\x95\xbf\xa7\x58\
-\x5a\x52\xf9\x61\xed\x3c\x5e\x1f\xb7\x9e\xe7\xce\xf7\xc0\xed\xe8\
-\x21\xb2\x23\x1b\xf3\x4c\x95\x48\x42\x7c\xb4\x76\xed\x4b\xd6\x7d\
-\xdf\xda\x3e\xc0\xfc\xf9\xf3\x9d\x8a\xbc\x66\x64\x64\xd0\xa1\x43\
-\x87\x22\x51\xc0\xe2\xd6\xbd\x33\x07\x72\xff\xbf\xc3\xd7\xd7\x97\
-\x86\x0d\x1b\x12\x17\x17\x67\xeb\xfb\x66\xcd\x9a\xd1\xba\x75\x6b\
-\xd9\x59\x91\x49\xa0\x0c\x19\x32\x64\xb8\x16\xe7\xcf\x9f\xe7\xe2\
-\xc5\x8b\x45\x48\x90\x28\x8a\xfc\xf6\xdb\x6f\xb6\x97\xb1\x28\x8a\
-\x4e\x46\x14\x0a\xca\xe0\x5b\x1d\x15\xa5\x52\xc9\xc3\x87\x0f\xd9\
-\xb2\x65\x0b\x1a\x8d\xa6\xc4\xef\x55\xaf\x5e\x9d\x46\x0d\x1b\xf0\
-\x28\x25\x9b\xd0\xc0\xf2\xbc\xf1\xf1\x72\x32\xaf\x8f\x27\xdf\xa2\
-\x47\x4a\x4e\x26\x2e\xe9\x3e\xd7\x6e\x3d\xa2\x76\x44\x79\xd2\xd3\
-\xd2\xd8\xb9\x6b\x57\x89\xce\x9b\x20\x08\x5c\xbd\x7a\x95\x80\x80\
-\x00\xdb\xdf\xf4\x7a\xbd\x53\x24\x50\xaf\xd7\xdb\x5e\xd8\x92\x24\
-\x11\x17\x17\xc7\xfa\xf5\xeb\x4b\x74\x4a\x01\x3a\x77\xe9\x42\xa0\
-\x9b\x48\x7a\x66\x3e\x26\x37\x7f\x06\xbf\xf6\x36\x96\x3d\x17\x50\
-\x5a\xe0\x6e\xbc\x89\x7c\xb7\x2b\x9c\xbd\x58\x81\x8a\xf5\x6b\x73\
-\xe7\xd6\x6d\x8e\x9d\x38\x59\x62\xf5\x51\x41\x10\xb8\x77\xef\x9e\
-\xcd\xd9\xb5\xca\x57\x38\x03\x83\xc1\x60\xab\x30\xa9\x56\xab\x39\
-\x7e\xfc\x78\xa9\x29\xa6\x2a\x95\x8a\x8e\x1d\xda\xe3\xef\xa1\xe2\
-\x51\x9a\x81\xc0\xc0\x46\xcc\x5d\xba\x80\xd9\x2b\x2e\x16\x94\xbd\
-\xbf\xff\x80\x3b\xa9\x77\xb8\x71\x2f\x8c\x1a\x11\xe5\xb8\x7c\xe9\
-\x32\xe7\xcf\x9f\x2f\x36\xdd\xd8\x2a\x8a\x1d\x1f\x1f\x6f\x4b\xb7\
-\x75\x45\x4a\x71\xe1\x39\xad\x54\x2a\xf9\xf9\xe7\x9f\xf1\xf3\xf3\
-\xb3\x45\x3d\xff\xea\x20\x23\x20\x20\x90\x0e\x1d\x5b\xa1\x4f\xcf\
-\x24\x5b\xf4\xa0\x62\xf0\x53\xbc\x3e\x6b\x26\x97\x1f\x9a\x31\x18\
-\x1e\x92\x9b\x91\x47\xf4\xc5\x33\xe4\xab\x2b\x50\x27\x32\x98\x4b\
-\x57\xae\x70\xe6\xcc\x99\x62\xe7\xb9\x52\xa9\xe4\xd1\xa3\x47\x45\
-\xc6\xc9\x15\xe5\xf3\x0b\x8b\x7b\x4b\x92\x64\x93\xc3\x28\x89\x4c\
-\x04\x04\x04\xd0\xb3\x67\x0f\xf2\x52\x1f\x92\x94\xa7\xa2\x5c\xe5\
-\x2e\xbc\x3d\x65\x14\xdb\x3d\x54\x98\x8d\xb9\x64\xa6\x3c\xe2\xca\
-\xd5\x2b\xb8\xf9\x05\x11\x16\xe4\xc3\xae\xdd\xbb\x49\x2d\x45\x74\
-\x3c\x3e\x3e\xbe\x08\xa9\x71\xf6\x3e\x58\xe1\xb5\x66\x6d\xef\xab\
-\xaf\xbe\xc2\xdb\xdb\x1b\x93\xc9\xf4\x97\xcf\x62\x32\x99\xa8\x59\
-\xb3\x16\x2d\x5b\x36\x21\x21\x2e\x1e\x83\x5b\x08\x11\xed\x47\xd3\
-\xeb\xf6\x1e\x8c\x80\x64\xc8\x27\xf1\xc1\x3d\x32\xf3\xa0\x61\xb9\
-\xda\x44\xf8\xc2\xe1\x43\x87\x89\x8d\x8d\xfd\x4b\x42\x22\x49\x12\
-\x9e\x9e\x9e\x9c\x3b\x77\xae\x48\x34\xd2\x15\xe3\x66\x36\x9b\x11\
-\x45\x11\x51\x14\xc9\xc8\xc8\x60\xdf\xbe\x7d\x5c\xbf\x7e\xbd\xd8\
-\x71\xd3\xeb\xf5\xb4\x68\xd1\x82\xba\x75\x6a\xf1\x30\xee\x3e\xa2\
-\x47\x20\x5d\xc7\xcc\x23\xf3\x7c\x22\x8f\x55\x0a\x52\x8c\x79\x98\
-\xef\xde\xe0\x42\x9e\x11\xbf\x88\x48\x3c\x55\x46\xbe\xfd\xf6\xdb\
-\x62\xe7\xb8\xb5\x92\xeb\xf1\xe3\xc7\x8b\xec\x89\xce\xee\xff\xb9\
-\xb9\xb9\xb6\xf5\x6d\x95\x9a\xf9\xf6\xdb\x6f\x8b\x48\x11\x59\x2c\
-\x16\x7c\x7d\x7d\xe9\xd6\xad\xdb\x3f\xe2\xca\xc0\xdf\x85\x26\x4d\
-\x9a\xb0\x67\xcf\x1e\x5b\x9f\x57\xae\x5c\x19\x7f\x7f\x7f\xd9\x59\
-\x91\x49\xa0\x0c\x19\x32\x64\xb8\x16\x1e\x1e\x1e\x84\x84\x84\x14\
-\x71\xc0\x45\x51\x24\x25\x25\xc5\x16\x3d\x10\x45\x11\x4f\x4f\x4f\
-\xa7\x7e\x47\xa7\xd3\xa1\xd3\xe9\x6c\xba\x5a\x3a\x9d\x8e\x90\x90\
-\x90\x12\x4f\x7d\x05\x41\xc0\xc7\xc7\x87\x6b\x97\x2f\xf2\xd5\x91\
-\x18\x5e\x79\xf1\x59\xca\xfb\x7a\xa0\x90\x24\xcc\xa2\x37\x0d\x3b\
-\x0c\x42\x51\xeb\x3e\xab\x3e\xda\x44\x44\xe3\xea\x44\xe9\x94\x04\
-\x05\x05\x95\x18\x9d\xb0\x56\xba\x2c\x0c\x67\x6d\xd3\x6a\xb5\x45\
-\x9c\x5b\x9d\x4e\x47\x68\x68\x28\x46\xa3\xb1\xd8\x67\x91\x24\x09\
-\x9d\xbb\x27\x89\xbf\x6c\xe2\xc0\x91\xdb\xa4\xd7\xed\xcb\xab\xdd\
-\x7c\xd0\x2a\x05\x0c\xf9\x06\x9a\x3c\xff\x1a\xde\xb9\x5a\xe2\xbf\
-\x9d\xc7\x1c\xdf\x16\xcc\x6c\xee\x41\x50\x50\xc9\x3a\x11\x1a\x8d\
-\x06\x37\x37\x37\xb2\xb3\xb3\x6d\x64\xcc\xcd\xcd\xcd\x29\xdb\xbc\
-\xbc\xbc\x6c\xb6\x59\x2c\x16\xfc\xfd\xfd\x4b\x2d\xee\xa1\x54\x2a\
-\xd1\x28\xcc\x3c\x3c\xb3\x8b\x55\x87\xd3\x19\xf8\xc2\x78\xea\x78\
-\xeb\x10\x00\x41\xe1\x41\xdd\x2e\x63\x50\x26\xdc\x64\xd3\x9a\xcd\
-\x84\x47\x54\xc2\xfb\xc9\x1c\x2c\x8e\x20\x58\x23\x54\x5a\xad\xd6\
-\x36\x7f\x9c\xbd\x9f\x0a\xe0\xe6\xe6\x66\xfb\x4d\x49\x92\xf0\xf1\
-\xf1\x21\x20\x20\xa0\xd8\x42\x31\x92\x24\xe1\xed\xed\x87\xce\x5d\
-\xcf\xbe\x25\xcb\x38\xe7\xd9\x8c\xd9\x93\xfa\xe1\xe9\xe5\x8e\xf0\
-\x20\x05\x85\xae\x2a\xdd\xfb\xf5\x42\x90\x32\x58\xf9\xee\x44\x6a\
-\xec\xdf\x87\x8f\x87\x7b\x89\xf3\xdc\x1a\x99\x2e\xfc\x1c\xae\xb8\
-\xc3\x67\x1d\x77\xeb\xa1\x81\xbb\xbb\x3b\x41\x41\x41\x25\x92\x40\
-\x1f\x1f\x1f\x30\xe9\x89\xf9\x69\x03\x1b\xaf\xfb\x32\x72\xd2\x38\
-\x3c\xdd\x74\x80\x84\xd2\xb7\x3c\xfd\x06\x0d\x26\xed\xfe\x35\x8e\
-\xed\xd9\x4e\x64\xe5\x89\xf8\xfb\xfb\xa3\x2a\xe1\x59\xad\x87\x10\
-\x85\x9d\x7c\x2f\x2f\x2f\xa7\xec\xd2\x68\x34\x45\xee\x4b\x4a\x92\
-\x44\x68\x68\xa8\x6d\x6f\x29\x8e\x58\x79\x79\xfb\x80\x39\x89\x5d\
-\x6b\x3e\xe6\x61\xad\x31\xbc\xd3\xc5\x17\x95\x60\xc1\x04\xd4\x8c\
-\x6a\x06\x41\x35\xc9\xba\xbe\x8e\x61\x2f\x09\xfc\xba\x7b\x18\x7e\
-\xbe\xbe\xe8\xf5\xfa\x62\x8b\xcf\xe8\x74\x3a\x3c\x3d\x3d\x8b\xcc\
-\x59\x57\x44\xb0\xac\x87\x1c\x56\x32\xe6\xeb\xeb\x4b\x60\x60\x60\
-\xb1\xa9\xaf\x46\xa3\x11\x37\x37\x37\x0c\xd9\xc9\x6c\x5b\xb5\x04\
-\x4d\x93\xd1\xbc\xd4\xbb\x1e\x3a\x95\x12\x93\xd1\x44\xb3\xae\xbd\
-\x50\xdc\xd7\x93\x70\xfb\x17\x0e\x1c\xfc\x99\x91\x03\x5a\x95\x38\
-\xc7\xad\xe3\xe6\xef\xef\x6f\x23\xb5\x82\x20\xb8\x64\xff\x57\xab\
-\xd5\x45\xd6\xaf\xa7\xa7\x67\x11\x9d\x58\x2b\xb9\xfe\x5f\x2f\x1c\
-\xd3\xa0\x41\x03\x34\x1a\x0d\x26\x93\x09\x77\x77\x77\x1a\x37\x6e\
-\x2c\x3b\x2a\x32\x09\x94\x21\x43\x86\x0c\xd7\xa3\x56\xad\x5a\x7f\
-\x59\x45\xd2\xd7\xd7\x97\x25\x4b\x96\x20\x8a\x22\xe9\xe9\xe9\x6c\
-\xdb\xb6\x8d\xb8\xb8\x38\x87\x7f\x27\x3f\x3f\x9f\x83\x07\x0f\xd2\
-\xa4\x49\x13\xcc\x66\x33\x01\x01\x01\x74\xeb\xd6\xcd\x2e\x87\x37\
-\x23\x3d\x8d\xb1\x41\x11\x04\x78\xa8\x01\x13\x26\x93\x09\x7d\x56\
-\x22\xc7\x7f\x3a\x4d\xdd\x51\x2f\xe2\xff\xf9\x25\x54\x16\x0b\x9e\
-\x5e\x05\xa7\xc8\xa5\x61\xff\xfe\xfd\x45\x6c\x59\xbf\x7e\xbd\x8d\
-\x60\x94\x15\xa2\x28\x92\x9f\x9f\x4f\x5a\x5a\x9a\xcd\x61\x0a\x09\
-\x09\xa1\x53\x27\xfb\xa4\x02\xdc\x1b\xf6\xa0\x6b\x78\x1e\x26\xcf\
-\x10\xcc\xfa\x5b\x18\x4d\x22\x1a\xcd\x2d\xd6\x2f\x3b\xcd\x4b\x9b\
-\x66\xe1\x77\x64\x06\x3f\xe5\xaa\xf1\x0d\xf2\xa5\x7b\xf7\xd2\xd3\
-\x3a\x57\xad\x5a\x45\x74\x74\x34\x4a\xa5\x92\x1b\x37\x6e\xb0\x6e\
-\xdd\x3a\x22\x23\x23\x1d\xbe\x3f\x95\x98\x98\x48\x7a\x7a\xba\x2d\
-\x1a\x1c\x15\x15\x45\xf7\xee\xdd\xed\xf8\xa6\x05\x6d\x83\xee\x8c\
-\x0c\x37\x11\x52\xce\x0b\x53\xa6\x11\x93\xd9\x8c\x31\x2f\x93\x33\
-\x47\x8e\xd2\x61\xfc\x28\xf6\x7e\xb3\x12\x8b\xde\x48\xf5\x9a\xd5\
-\xa8\x5e\xad\x5a\x89\xad\x25\x25\x25\xf1\xd9\x67\x9f\x61\xb1\x58\
-\x50\xa9\x54\xdc\xba\x75\x8b\x3d\x7b\xf6\xd8\x08\x6f\x99\x5f\xac\
-\x4a\x25\xfb\xf7\xef\xb7\x15\xf3\x30\x9b\xcd\xd4\xaf\x5f\xdf\xce\
-\x94\x67\x33\xad\x07\x8f\x21\x4a\xe9\x83\x12\x09\xa3\xd1\x84\xa4\
-\x50\x92\x75\x65\x3f\xd7\x32\xeb\xf2\x62\x9f\x1a\xac\x9b\x34\x0f\
-\x93\x06\x22\xaa\x56\x23\xa2\x6a\xc9\xb6\x3d\x78\xf0\xc0\xb6\x0e\
-\x04\x41\xe0\xc6\x8d\x1b\x7c\xf5\xd5\x57\x0e\xcb\x7b\xa8\xd5\x6a\
-\x7e\xfc\xf1\xc7\x22\x45\x8a\x9a\x36\x6d\xca\x33\xcf\x3c\x53\xfa\
-\x97\x25\x33\x61\xad\x06\x33\xba\x81\x8a\x4a\xbe\x70\xc3\x60\xc0\
-\x2c\xa9\xc8\x7e\x7c\x84\x9b\x69\x61\x0c\x69\xad\x21\xe6\xbb\x4b\
-\xe4\xea\xa1\x95\x1d\x29\x6a\x37\x6f\xde\xb4\x39\xf8\x1e\x1e\x1e\
-\xac\x5e\xbd\x9a\x1a\x35\x6a\x38\x14\xa1\xb6\xa6\x94\x1e\x3a\x74\
-\xc8\x26\x0e\x2f\x49\x12\x5d\xba\x74\x29\x42\x26\x8a\xb7\x2d\x9f\
-\x6e\xc3\xc6\xa1\xf7\xa8\x80\x41\x9f\x84\xc9\x64\x46\xb0\xc0\xd9\
-\x4b\x37\xa8\xfa\x74\x0f\x1a\x0b\xbb\x48\x5c\x27\x20\x8a\x4a\x9a\
-\x34\x6d\x5a\x6a\x73\x37\x6e\xdc\x28\x92\xda\x78\xf9\xf2\x65\xf6\
-\xee\xdd\xeb\x50\x81\x18\x41\x10\xd0\xe9\x74\xa4\xa6\xa6\xe2\xe3\
-\xe3\x63\xeb\xaf\x36\x6d\xda\xd8\x55\x2d\xd6\x62\xd2\xd3\xf7\xf9\
-\x71\x88\xde\x05\x69\xe9\x46\x93\x09\xd1\xa4\x67\xf7\xfe\x93\x74\
-\x9b\xf6\x06\x09\xca\x7b\x9c\x8c\xcf\x45\x09\x76\xcd\xf1\x9c\x9c\
-\x1c\xbe\xfe\xfa\x6b\x9b\x6d\x9b\x36\x6d\x22\x36\x36\xd6\xa1\xb5\
-\x26\x08\x02\x69\x69\x69\x5c\xb8\x70\x81\x76\xed\xda\x21\x49\x12\
-\x1a\x8d\x86\xae\x5d\xbb\x22\xe3\xaf\x49\xa0\x97\x97\x17\x39\x39\
-\x39\xf8\xfb\xfb\xdb\xfd\x2e\x91\x21\x93\x40\x19\x32\x64\xc8\x70\
-\x09\xac\xf7\x46\xac\x27\xb6\x9f\x7d\xf6\x19\x6b\xd7\xae\x75\xb8\
-\x3d\xeb\x09\xb0\x87\x87\x87\xed\xce\x89\xd1\x68\xb4\x8b\x04\x7a\
-\xfb\xf8\xe2\xed\x63\x73\x71\xa9\xfe\x54\x63\xfc\x3d\x03\x30\x95\
-\xb7\xf0\x4a\xe7\xbe\xd4\x1c\x39\x83\xda\xfe\xf6\x8b\x20\x5b\xef\
-\xd9\x58\xef\xad\x4d\x9e\x3c\xd9\xe9\xea\xa0\xb9\xb9\xb9\xb6\xa8\
-\x41\x59\x08\x97\xd6\xaf\x22\xe5\x9f\x28\x70\x98\xd2\x3d\xa9\x50\
-\x31\x14\x95\xb2\x06\xfd\xbb\x19\x78\xbe\x6b\x37\x02\x6a\x8d\xe1\
-\x93\xc1\xee\x76\xb7\x67\x3d\xbd\xd7\x6a\xb5\x18\x8d\x46\x66\xcf\
-\x9e\xed\xd4\xc9\xba\x55\x26\xc4\x1a\xe5\xb0\x46\x37\x4b\x2f\xc6\
-\x22\xa2\xf3\xaf\x48\xe4\x93\x2c\x26\xa3\xc6\x97\x1a\xd5\xc3\xd1\
-\xe8\x74\x04\x06\x1a\x19\xd8\xf1\x45\xda\x4e\x7c\x9b\x5a\x55\x83\
-\xec\x7a\x0e\xeb\x1d\x2d\x28\x88\x72\xa9\x54\x2a\x86\x0c\x19\xe2\
-\xd4\x1c\x37\x9b\xcd\xa8\xd5\x6a\x5b\xff\xd8\x9f\xf2\xa6\x20\xb8\
-\x72\x35\x82\x9f\x90\x5d\x0f\x6f\x3f\xca\x07\x69\xf1\xab\xd7\x84\
-\x8c\x8d\xd3\x18\xb8\x26\x91\x3a\xf3\xbe\xa6\xa1\x9d\xad\x19\x0c\
-\x06\xdb\xbf\x3d\x3c\x3c\x88\x8e\x8e\x66\xec\xd8\xb1\x0e\x57\x50\
-\xb4\xae\xaf\xc2\x51\x15\xbb\xe7\xa4\xa0\xc0\x23\x28\x02\xeb\xb0\
-\x78\x96\xaf\x4c\x75\x3f\x15\x3a\xdf\x46\xc4\x1d\x78\x91\x7f\xed\
-\xa9\xc2\x88\x17\xa7\x50\xd9\x07\xbb\xc7\xcd\x9a\x4d\xe0\xe3\xe3\
-\xc3\xf9\xf3\xe7\x19\x3e\x7c\xb8\x53\xe3\x96\x9b\x9b\x4b\xcf\x9e\
-\x3d\x6d\xfd\x63\x30\x18\xec\x23\x81\x82\x96\xf2\x55\xaa\x03\xa0\
-\x4f\xcf\x26\xb2\x6a\x15\x14\x22\xd4\x0e\x86\xb9\x6f\x0e\x23\x4d\
-\x1f\xca\x77\xdf\x0d\xc1\x4d\x69\xff\xfc\x29\x3c\x6e\x67\xcf\x9e\
-\xe5\xb9\xe7\x9e\x73\xca\x36\x8b\xc5\x42\xf9\xf2\xe5\x6d\xf7\x43\
-\xed\x9d\x93\xa2\x52\x43\xa5\xc8\x1a\xb6\xcf\x21\xb5\xea\x82\xbf\
-\x17\x0d\xeb\x6b\x79\xbe\x6b\x3f\x6a\x36\x7a\x8a\x17\x5f\x1b\x6d\
-\xf7\x73\x58\x7f\x57\xa9\x54\xe2\xe3\xe3\xc3\x17\x5f\x7c\xc1\xc6\
-\x8d\x1b\x9d\xda\x47\xac\x7a\x91\xae\xd0\x2e\xfd\x6f\x46\x48\x48\
-\x08\x7e\x7e\x7e\x3c\x7a\xf4\x88\xa0\xa0\x20\x22\x23\x23\xe5\x4e\
-\x91\x49\xa0\x0c\x19\x32\x64\xfc\x67\x61\x32\x99\xa8\x5e\xbd\x3a\
-\x7b\xf7\xee\x45\xaf\xd7\xbb\xa4\xac\x77\xe5\xca\x95\x39\x76\xec\
-\x98\x13\x2d\xf8\x30\x7a\xe1\x6c\x40\x22\xbc\xff\x5b\xec\xeb\xff\
-\x96\x43\xb2\x58\x46\xa3\x91\x9a\x35\x6b\xf2\xeb\xaf\xbf\xba\x24\
-\xfd\xc8\x68\x34\x52\xbb\x76\xed\x12\x0b\x9c\x94\xba\xd9\xfb\x54\
-\xa3\x4b\xf7\x82\xa8\x51\xe8\x90\x05\xec\x19\x64\x41\x54\x94\xfd\
-\xd9\x24\x49\xa2\x51\xa3\x46\x5c\xbd\x7a\xd5\x46\x0a\x9c\x81\x42\
-\xa1\xc0\xdd\xdd\x9d\x0d\x1b\x36\x38\xdc\x96\xca\xab\x26\x2f\x8d\
-\xae\x09\x40\xdb\xe1\xf3\x68\x3b\x5c\xc2\x11\x41\x33\xa3\xd1\xc8\
-\xd4\xa9\x53\x19\x33\x66\x8c\xd3\x63\x66\x25\xb3\xce\xa5\xcc\x8a\
-\x84\xd5\xa8\x4f\xd8\x13\xff\x7b\xda\xe2\x75\x98\x10\x1d\x7a\x71\
-\x2b\x14\x0a\xde\x7d\xf7\x5d\x86\x0e\x1d\xea\x12\x0d\x3c\x85\x42\
-\x41\x52\x52\x52\xa9\x85\x40\x4a\x5c\xaf\x9d\x06\x61\x55\x89\x7b\
-\x7f\xdd\x3e\x4c\x66\x50\x96\xf1\xd1\x2c\x16\x0b\x7e\x7e\x7e\xac\
-\x5b\xb7\x8e\xe4\xe4\x64\xa7\xe7\xa3\xc5\x62\x21\x28\x28\x88\x7d\
-\xfb\xf6\x39\xdc\x86\xc6\x27\x98\xa1\xc3\x06\x01\x10\xfe\x74\x7f\
-\x96\x37\xe9\x83\x42\xa5\x70\x68\x0e\xb9\xbb\xbb\x73\xf2\xe4\x49\
-\xbb\x0a\x26\xd9\xd3\x9e\x46\xa3\xe1\xc7\x1f\x7f\x74\xaa\xad\x16\
-\x13\xa7\x16\xfc\x23\xec\x65\xf6\x77\x18\x87\x45\xa9\xa6\xac\x3b\
-\x49\x7e\x7e\x3e\xcd\x9a\x35\xe3\xa7\x9f\x7e\x22\x2f\x2f\xcf\x25\
-\xfb\x7f\xc5\x8a\x15\x39\x7b\xf6\xac\x4c\x02\x4b\x41\x9b\x36\x6d\
-\xb8\x7e\xfd\x3a\x8d\x1a\x35\x92\x3b\x43\x26\x81\x32\x64\xc8\x90\
-\xf1\xf7\x40\xad\x56\x13\x16\x16\xe6\x32\xa1\x70\x6b\x91\x11\xe7\
-\x21\x14\xfa\x5f\xc7\x09\x80\xab\x4e\x59\x0b\x17\x86\x71\x15\x1c\
-\x21\x80\x85\x51\xa5\x4a\x15\x97\x3c\x87\x35\x0d\xcf\x15\x85\x2f\
-\xfe\x38\x7e\x8e\xf4\xb3\x8f\x8f\x8f\x2d\x1d\xd0\x15\xb6\x39\x43\
-\x92\xfe\x8a\x14\x2a\x9d\x5c\x6f\xae\x12\x1e\x17\x04\x81\x94\x94\
-\x14\x97\xce\x49\xa5\xc2\xb1\x31\x33\x9b\xcd\xf8\xfb\xfb\xe3\xed\
-\xed\xed\xb2\x7d\xc4\x95\x77\xc7\x1c\x21\x80\xb6\x11\x17\x45\xc2\
-\xc3\xc3\x5d\xb6\x3e\xac\x95\x93\x5d\x37\x68\x65\x27\x80\xd6\x71\
-\xd3\x6a\xb5\x54\xaa\x54\xc9\xe9\xc2\x30\x85\xc7\x4d\xd6\x08\x2c\
-\x1d\xdd\xba\x75\x63\xf9\xf2\xe5\xd4\xaf\x5f\x5f\xee\x0c\x99\x04\
-\xca\x90\x21\x43\xc6\x7f\x1e\xa2\x28\x92\x90\x90\xc0\x9e\x3d\x7b\
-\x78\xf4\xe8\x91\x4b\x08\x65\xbf\x7e\xfd\x5c\x50\xd4\xc3\x82\x84\
-\x88\x33\xae\x84\x42\xa1\x20\x25\x25\x85\x85\x0b\x17\xba\xc4\xc1\
-\x31\x1a\x8d\x4c\x9f\x3e\xdd\x35\x8e\xa9\x24\x41\x11\x47\xa9\x6c\
-\x51\x33\xeb\x1d\x9c\x45\x8b\x16\x39\xed\x4c\x0a\x82\x80\xb7\xb7\
-\x37\x1d\x3a\x74\xb0\x15\x76\x70\xc2\x30\x27\x68\xfb\xef\x4e\xe4\
-\xe1\xc3\x87\x39\x73\xe6\x4c\xb1\x15\x0e\xcb\x32\xbf\x95\x4a\x25\
-\x53\xa6\x4c\x71\xe9\xba\x31\x43\x81\xce\x5c\x19\xcd\xb5\x58\x2c\
-\x9c\x38\x71\x82\x3d\x7b\xf6\x38\x65\x57\xe1\xc2\x1b\xcd\x9a\x35\
-\x73\x3a\xaa\xe8\xec\xa8\x89\xa2\x88\xd9\x6c\x66\xeb\xd6\xad\x5c\
-\xbb\x76\xcd\x25\x11\xb3\xa8\xa8\xa8\x22\x69\xb4\xae\x5f\x73\xf6\
-\x43\xaf\xd7\xb3\x70\xe1\x42\xb2\xb2\xb2\x8a\xad\x50\x6a\xef\xb8\
-\xa9\xd5\x6a\x82\x83\x83\x9d\x2e\xa0\x03\x12\x92\x24\x3c\x31\x49\
-\x42\x42\x28\xf3\x18\x2a\x95\x4a\xee\xdd\xbb\xc7\x0f\x3f\xfc\x40\
-\x72\x72\xb2\xd3\x87\x09\x6a\xb5\x9a\x2e\x5d\xba\x38\x95\x2d\xf1\
-\xbf\x82\x26\x4d\x9a\x00\xce\x17\x2d\x93\x21\x93\x40\x19\x32\x64\
-\xc8\x70\x98\x28\xc5\xc7\xc7\xf3\xfe\xfb\xef\x13\x1c\x1c\x4c\x44\
-\x44\x84\xc3\x6d\x99\x4c\x26\x0e\x1e\x3c\x88\x9b\x9b\x9b\xc3\x24\
-\xb0\xc0\x19\x35\xf1\xc3\xca\xb5\xd4\x79\xe9\x05\x94\xb7\x8e\xb1\
-\x6e\xf5\x2e\x7c\xda\x0f\x63\x78\xc7\x7a\xe8\x94\xf6\x3b\x16\x4a\
-\xa5\x92\xb8\xb8\x38\x66\xcd\x9a\x45\xe7\xce\x9d\x1d\x26\x38\xd6\
-\x48\xd2\x81\x03\x07\x18\x34\x68\x90\x13\x22\xcf\x80\x29\x85\x0b\
-\x17\xa3\xa9\x50\xed\x29\xbc\xd2\x8e\xf2\xd1\xaa\xfd\x88\x95\x3b\
-\xf3\xca\x98\x8e\x94\xb5\x60\xfa\xf5\xeb\xd7\x99\x3d\x7b\x36\x2d\
-\x5b\xb6\xc4\xd7\xd7\xd7\xe1\x28\x45\x66\x66\x26\x27\x4e\x9c\x60\
-\xcd\x9a\x35\xce\x55\xad\x34\x27\xb0\x67\x7f\x34\x5d\xba\xb7\xe6\
-\xe1\xd5\x1f\x58\xb7\xe1\x20\x55\x7a\x8c\xa6\x5f\xab\xea\xd8\xa3\
-\x15\x6f\xed\x53\x85\x42\xc1\x8e\x1d\x3b\x58\xb9\x72\x25\xfd\xfb\
-\xf7\x77\x58\x02\x43\x10\x04\x6e\xdf\xbe\xcd\x8d\x1b\x37\x98\x30\
-\x61\x82\x53\xeb\x24\x2d\x31\x8e\x3b\x71\xe9\x34\x6e\x54\x97\x13\
-\x3b\x56\xf1\xe3\xe9\x7b\x54\x1f\xf0\x3a\x43\x9a\xf8\x95\x99\x04\
-\x7c\xf5\xd5\x57\x7c\xf6\xd9\x67\x3c\xf3\xcc\x33\x0e\xdf\x9d\x52\
-\x2a\x95\x5c\xbc\x78\x91\xe4\xe4\x64\xb6\x6d\xdb\xe6\x14\x09\x4c\
-\xbb\x72\x9c\x93\x9a\x5a\xf4\xa8\xa2\x63\xff\x96\x95\x9c\xb8\x07\
-\xdd\x07\x0e\xa5\x79\x8d\x20\xbb\xdb\xb0\xca\x1d\x6c\xd8\xb0\x81\
-\xab\x57\xaf\xd2\xa1\x43\x07\x87\x0f\x5e\x8c\x46\x23\xa7\x4e\x9d\
-\xa2\x41\x83\x06\x4e\xdd\x09\x35\xe5\x67\x73\xec\xc4\x59\x5a\x75\
-\x6c\x8f\xf1\xd1\x0d\xbe\xdc\xb6\x9d\xfb\x39\xde\xf4\x99\x38\x9e\
-\x28\x4f\xfb\x49\xaf\x55\x50\x7d\xc6\x8c\x19\xf8\xf8\xf8\xd0\xae\
-\x5d\x3b\xf2\xf2\xf2\x1c\x26\x49\x3b\x76\xec\xa0\x52\xa5\x4a\x2c\
-\x59\xb2\xc4\x29\xd2\x75\x7b\xcf\x36\xe2\x1a\xf5\xa4\xa5\xe9\x0a\
-\x8b\x3e\xff\x1e\x6d\x85\xba\x0c\x1c\xf2\x2c\xa1\xee\x65\x7b\x9e\
-\x9b\x37\x6f\x32\x73\xe6\x4c\x22\x22\x22\xa8\x54\xa9\x92\x43\xe4\
-\xcd\x7a\x67\xfa\xf0\xe1\xc3\x36\x6d\x40\x19\x25\xc3\x7a\x08\xf0\
-\xbf\x2c\x95\x21\x43\x26\x81\x32\x64\xc8\xf8\x9b\xe0\xe9\xe9\x69\
-\x73\x42\xfc\xfc\xfc\xf8\xe0\x83\x0f\xe8\xd4\xa9\x93\xc3\x8e\x89\
-\x55\x28\xda\x5a\x58\x44\xa5\x52\xd9\x57\xcc\x81\xdf\x53\x37\x05\
-\xfd\x23\x56\x2e\x7a\x97\x35\x1b\x1f\xb1\xf5\xa5\x41\x5c\xdb\xb3\
-\x83\xf4\x90\x08\x0e\xef\x38\x44\xaf\xc6\x91\xe8\x02\xec\x6b\xcf\
-\xfa\x62\xb5\x46\xed\xd6\xaf\x5f\x8f\x87\x87\x87\x43\x44\xc9\x5a\
-\x1d\xb4\x4e\x9d\x3a\xb6\xf6\x1c\x29\x15\x6f\xca\x4e\xe1\xbb\x8f\
-\x5f\xe3\xab\x98\x50\x16\x7d\xf4\x34\x47\x66\xbf\x8b\x76\xd0\x4c\
-\x14\x6b\xde\x65\x65\xf3\x8e\xbc\x52\xdb\xbe\x76\xac\x44\xcd\x62\
-\xb1\x50\xbd\x7a\x75\x96\x2e\x5d\xea\x70\x75\x50\xab\xce\x5b\xab\
-\x56\xad\x6c\x84\xc4\xdd\xdd\xbd\xec\x8e\x60\xea\x25\xde\x9d\xf1\
-\x1e\x67\x85\x0e\x74\xee\xd2\x80\xab\x87\xb6\xe3\x59\xa9\x2a\x7b\
-\x77\xec\xa1\x51\x95\x0a\xd4\xac\x50\xfa\xb8\x79\x79\x79\xa1\x52\
-\xa9\x6c\x73\xa1\x62\xc5\x8a\x6c\xdd\xba\x95\x9c\x9c\x1c\x87\xe6\
-\xa3\x46\xa3\x61\xcb\x96\x2d\x4c\x9a\x34\xc9\x36\xc7\x0a\x4b\x0f\
-\xd8\x8b\xdc\xf4\x5f\x78\x77\xdc\x1c\xdc\xdb\x8d\xa6\x7e\x64\x36\
-\xbb\x4f\x67\xd3\xad\x53\x25\x16\x4d\x9e\x45\xe7\xd3\x1f\x11\x60\
-\xa7\xc3\x67\xed\x53\x85\x42\x41\xfb\xf6\xed\xf9\xf6\xdb\x6f\x31\
-\x18\x0c\x0e\xad\x37\x8d\x46\xc3\xc7\x1f\x7f\xcc\x9c\x39\x73\x6c\
-\x7f\x73\xe4\xde\xa3\x39\xee\x38\x53\x27\xbc\x8a\x30\xe5\x2b\x3a\
-\xfb\xc4\x73\xe8\x5c\x3c\xcd\x6b\x05\x72\xf2\xc0\x2e\xaa\x54\x1e\
-\x43\x90\x1d\x67\x02\x1e\x1e\x1e\xb6\xb9\x64\x32\x99\x18\x3e\x7c\
-\x38\x0b\x16\x2c\x70\x78\x3e\xe6\xe7\xe7\xf3\xd6\x5b\x6f\x11\x13\
-\x13\x63\xeb\x33\x47\x52\x4c\xef\x1e\xf8\x84\x7f\x7f\x6d\xe0\x68\
-\xc7\xf6\x1c\xfe\xe9\x18\x8a\xf2\xd5\x78\x2a\x7a\x13\xc3\xe6\xb5\
-\xe1\xc2\xac\xda\xa8\xed\x98\xe2\x3a\x9d\xae\x60\x5f\x7a\x22\xc1\
-\xd1\xbb\x77\x6f\xd6\xac\x59\xe3\x50\x75\x50\xeb\x3c\xa8\x56\xad\
-\x9a\xad\xaa\xab\x42\xa1\xb0\xf5\x9f\xfd\x83\x96\xca\xf1\x9d\x6b\
-\x98\x39\x6e\x05\x9d\x0f\x76\x24\x67\xd7\x66\x4c\x8d\xfa\x51\x21\
-\xe9\x28\x87\x8f\x5f\x63\x68\x97\x3a\x76\x35\xe3\xee\xee\x6e\x93\
-\x2e\xd1\x6a\xb5\x7c\xf0\xc1\x07\x0e\x8b\xc5\x0b\x82\x40\x42\x42\
-\x02\xbd\x7b\xf7\x2e\xa2\x5f\xf9\x4f\x40\x76\x76\x36\xa7\x4e\x9d\
-\xe2\xfc\xf9\xf3\xae\x8d\x2c\x3b\x01\xeb\x3b\x25\x2c\x2c\x8c\xbd\
-\x7b\xf7\x72\xf3\xe6\x4d\x17\xa7\xac\x3b\x0e\x85\x42\x41\x9d\x3a\
-\x75\x68\xd3\xa6\x0d\xbe\xbe\xbe\x76\x16\x09\x93\x21\x93\x40\x19\
-\x32\x64\xfc\x23\xb1\x76\xed\x5a\xbe\xfc\xf2\xcb\x3f\x11\xb2\xe4\
-\xe4\x64\x9b\xe3\xa8\x56\xab\xf1\xf0\xf0\x70\x2a\x35\xc5\xea\x28\
-\x59\x53\x9e\x7e\xf9\xe5\x17\x7a\xf6\xec\x59\x62\x94\x42\x10\x04\
-\x3a\x74\xe8\xc0\xc4\x89\x13\x9f\x30\x9c\x20\xfa\x8d\x1c\xcd\xd5\
-\xfd\xb3\x31\xe0\x4d\x70\xc5\x20\x2e\x2f\xfc\x02\x63\x9b\x97\xd1\
-\xb9\x69\x89\x89\x89\x61\xca\x94\x29\x25\xa6\x1b\x09\x82\xc0\x99\
-\x33\x67\x78\xfa\xe9\xa7\x8b\x38\xaa\x65\x76\xb6\x0a\x41\xa5\x52\
-\x15\x49\x03\x3d\x71\xe2\x04\x7d\xfb\xf6\x2d\x51\x23\x50\x92\x24\
-\x66\xbe\xf3\x0e\x8d\x9f\xa4\xfd\x28\x3d\xfc\x69\xd9\x63\x00\xb1\
-\x87\xee\x60\xce\x87\xfa\xed\xeb\xb3\xe9\xd3\xa5\xe8\xf3\x6b\xb0\
-\xa4\x36\xfc\x74\xf0\x07\x96\x2c\x5d\x5e\xaa\x58\xfc\xe9\xd3\xa7\
-\xa9\x50\xa1\x82\xad\x9f\xbd\xbc\xbc\xec\x26\xdb\xc5\x39\xf1\x1a\
-\x8d\xc6\x46\x00\xe7\xcc\x99\x63\x93\x2f\x28\x89\x64\xcf\x98\xf1\
-\x36\x75\xeb\x3e\x71\x38\xfd\x6a\x31\xf8\xf9\x21\x24\x7f\xf7\x18\
-\x49\xa1\xc5\x33\x30\x80\x03\x4b\xb6\xe0\xd7\x73\x2a\x41\xc1\xee\
-\x6c\xde\xbc\x99\xcd\x9b\x37\x97\x18\x69\xd4\xeb\xf5\xfc\xf2\xcb\
-\x2f\xf4\xea\xd5\xcb\x56\xf9\x52\xa1\x50\x38\x95\x36\x67\x25\xb4\
-\xd6\xbb\x4f\x1f\x7e\xf8\x21\x3b\x77\xee\x2c\x96\xa0\x98\x4c\x26\
-\x22\x23\x23\x99\xfa\xfa\x5b\x94\xaf\x50\x50\x1b\x54\xeb\x11\x49\
-\xf7\xe7\xfa\x73\x27\xd7\x82\xca\xb3\x2a\x3e\xf9\x6b\x58\xb3\xf4\
-\x2a\xca\x56\xb3\x09\x00\xbe\xdc\xb2\x85\x35\x6b\xd7\x16\x3b\xbf\
-\x04\x41\x20\x3b\x3b\xbb\x08\x71\x50\xa9\x54\x68\x34\x9a\x62\x05\
-\xe6\xcb\x72\x88\x23\x8a\x22\x16\x8b\x85\x19\x33\x66\xb0\x72\xe5\
-\xca\x62\x0f\x3a\xcc\x66\x33\x55\xab\x56\xe5\xc3\x0f\x17\x21\x8a\
-\x4f\x08\x69\xc5\x86\xf4\xed\xd1\x96\x9f\xb4\x22\x2a\x77\x3f\xb4\
-\x99\xd7\x59\xfb\xbd\x27\x9d\x86\x4e\x20\x48\x0d\x93\x27\x4d\xe2\
-\x5e\x6c\x6c\x89\x29\xd0\x99\x99\x99\x45\x9e\xc3\xd7\xd7\xd7\xa9\
-\xf9\x68\xd5\xc2\x2c\xdc\x57\x3d\x7a\xf4\xb0\xcd\xd1\xe2\xe6\x4e\
-\xd7\xae\x5d\x99\x3c\x79\xb2\xed\x6f\xfe\x35\xda\xd1\x38\xec\x28\
-\x06\xa0\x4a\x05\x3f\x76\x7f\xb9\x93\x47\xbf\x66\xd0\x63\x4e\x24\
-\x92\x3e\x97\x77\xe7\xcc\xe3\xe7\x33\x67\x8a\x3d\x18\x50\xa9\x54\
-\x44\x47\x47\xdb\x22\x9a\x56\x89\x07\x2b\x99\x73\x86\x00\x58\x9d\
-\xed\xb8\xb8\x38\xc6\x8e\x1d\x8b\xb7\xb7\x77\xb1\xb6\x65\x66\x66\
-\x32\x61\xc2\x04\xfa\xf7\xef\xff\xc4\x4b\xf7\xa3\x71\xe7\xc1\x0c\
-\xe8\xf0\x33\x79\xa2\x40\xfd\x7a\x61\x2c\x5e\xfb\x19\x71\x21\xde\
-\xfc\xab\x55\x65\xf4\xf9\xb9\xbc\xf8\xd2\x78\xd2\xd2\xd2\x4a\xdc\
-\x47\xee\xdf\xbf\x5f\x64\xce\xba\xbb\xbb\x3b\x65\x57\x4e\x4e\x0e\
-\x5e\x5e\x5e\x36\x72\x9b\x9a\x9a\x4a\xff\xfe\xfd\x8b\xac\x35\x93\
-\xc9\x44\x58\x58\x18\x73\xe7\xce\x75\x41\x3a\x6c\xe9\x38\x73\xe6\
-\x0c\x13\x27\x4e\xe4\xd6\xad\x5b\x64\x64\x64\xfc\x23\xdf\xcf\xeb\
-\xd6\xad\xfb\x47\x1e\x10\x57\xad\x5a\x95\x99\x33\x67\xd2\xbb\x77\
-\x6f\xd9\x89\x92\x49\xa0\x0c\x19\x32\xfe\x7f\xc5\xf0\xe1\xc3\xf9\
-\xd7\xbf\xfe\xf5\x27\x47\xe4\xe4\xc9\x93\x8c\x18\x31\xa2\x08\x69\
-\x71\x16\xd6\x36\x8c\x46\x23\xf5\xeb\xd7\x67\xd3\xa6\x4d\xa5\xa6\
-\xbb\x68\x34\x1a\xd6\xae\xfc\x98\x09\x9f\x9c\xe3\xe7\x7d\xcb\xa9\
-\x1f\x56\x19\x2f\x95\x19\xb3\x29\x8d\xbb\xd7\xa2\xa9\xde\xa6\x33\
-\xe7\x6e\x5c\xe3\x51\x76\x2e\x35\xc2\xc3\xf9\xf2\xcb\x2f\x4b\x24\
-\x95\x0a\x85\x82\x97\x5f\x7e\x99\xc7\x8f\x1f\xff\xe9\xb9\x9c\xb5\
-\xcb\x8a\xa6\x4d\x9b\xf2\xdd\x77\xdf\x95\x28\x16\x6f\xb5\xed\x97\
-\xb9\x9d\xf8\xe0\xc3\x63\xdc\xef\xfd\x21\xe7\x16\x77\x22\xd0\xf3\
-\x01\x2a\x65\x1e\x47\x76\x9d\xa5\x4e\xdf\x77\x30\x6e\x7e\x87\xed\
-\x3f\xc3\x8c\x8e\x1d\x69\xde\xaa\x4d\x89\xb6\x29\x95\x4a\x9e\x7d\
-\xf6\x59\x6e\xdf\xbe\xfd\x7f\x62\x5b\x6e\x6e\x2e\x93\x26\x4d\xb2\
-\xcd\x8b\x92\x9e\x45\x6d\x49\xe3\xe4\xfb\x9d\xe8\xb5\xe4\x31\x2b\
-\x77\xef\xa1\x57\x8d\x30\xb4\xe2\x23\xcc\xc6\x5c\xe2\xa2\xa3\x69\
-\xd2\xb1\x2d\x97\x7f\xbb\xc8\xc3\x87\x5d\x79\xee\xb9\xe7\x18\x30\
-\x60\x40\x89\xed\x3d\x7a\xf4\x88\xc1\x83\x07\xdb\x9c\x6e\x57\x14\
-\xe1\x28\x1c\x95\xd0\xeb\xf5\xbc\xf4\xd2\x4b\x8c\x1f\x3f\xbe\x44\
-\x21\x6d\x51\x54\xa1\x52\x25\xf0\x52\xd5\x00\x36\x85\x0c\x21\xf9\
-\xe8\x27\x84\x85\x57\xe0\xd1\xed\x5c\xf2\x1e\x5f\x26\x26\x3f\x88\
-\xc1\xcf\xb5\x67\xd6\x82\xcd\x3c\xa0\x23\x83\x07\x0d\xa2\x9f\xd5\
-\x41\xff\xab\x17\xbc\x52\xc9\x9d\x3b\x77\x8a\x08\x42\xbb\x62\xad\
-\x59\xfb\xc7\x4a\xc0\xa6\x4d\x9b\x46\xff\xfe\xfd\x4b\x8c\x28\x88\
-\xa2\x88\xa0\x4f\x63\xcf\xb4\x56\x0c\xf9\x3e\x92\xad\xfb\xb7\x11\
-\x51\x21\x84\x13\x0a\x11\x43\xc6\x5d\x1e\x9a\x42\xe9\xde\x3a\x88\
-\xd8\x1b\xbf\x91\xa0\x6f\xcb\xa2\x8f\x3e\x2a\x71\x1c\x04\x41\xe0\
-\xb7\xdf\x7e\xa3\x49\x93\x26\x36\x9b\x5c\x39\x6e\xd6\xbd\xe4\x8b\
-\x2f\xbe\x28\x35\xe5\x59\xa9\xd2\x80\xe1\x1c\x3d\x6a\x75\xe6\x4a\
-\xfb\x2f\xb8\xbf\xa4\x11\x3e\x9a\x82\x7b\x72\xd1\xd1\xf7\xa9\xd8\
-\xa0\x03\x35\x58\xc7\x82\x2f\x4e\xf1\xee\x53\xed\x98\x39\xf3\x1d\
-\x4c\x66\x4b\x89\x6b\x77\xc9\x92\x25\xbc\xfd\xf6\xdb\x2e\x1d\xb7\
-\xc2\xa4\x3c\x34\x34\x94\x05\x0b\x16\xd0\xa0\x41\x83\x12\xd3\x67\
-\x95\x4a\x15\x99\x0f\xae\xd2\xb5\x41\x23\x02\x46\x6c\x61\xe7\x87\
-\x03\x28\xef\xef\x45\xac\x20\x72\xe6\xe7\x4b\xd4\xe8\xd8\x9f\x5a\
-\x89\x3f\xf2\xeb\x6f\xd1\xb4\xae\xd6\x80\x55\xab\x56\x95\xfa\xac\
-\xdb\xb6\x6d\xe3\xbd\xf7\xde\x73\xe9\xbb\xa6\xf0\x1c\xf0\xf1\xf1\
-\xe1\xcb\x2f\xbf\xfc\xd3\x73\x08\x82\xe0\x50\x26\x45\x59\x71\xed\
-\xda\x35\x7a\xf7\xee\x4d\x42\x42\x02\x51\x51\x51\xbc\xf3\xce\x3b\
-\x04\x06\x06\xba\xb8\xf8\xd5\x7f\x17\x44\x51\x24\x27\x27\x87\x39\
-\x73\xe6\x70\xfc\xf8\x71\xc6\x8f\x1f\x8f\xa7\xa7\xa7\xc3\x11\x62\
-\x19\x32\x09\x94\x21\x43\xc6\xdf\xbd\xc1\x28\x95\x7f\x79\x47\xcf\
-\x9a\x92\x24\x08\x02\x79\x79\x79\xdc\xbe\x7d\x9b\xb0\xb0\x30\x87\
-\x7f\x47\xaf\xd7\xf3\xf0\xe1\x43\x5b\xe4\xcf\x4a\x5a\xec\x89\x76\
-\xf4\x1d\x38\x94\xe6\x9d\x06\x10\x11\xea\x09\xe4\x21\x59\x24\xf2\
-\xb3\x32\x49\xce\x16\xe9\x30\xf5\x03\xfc\x5f\x7a\x8d\x1b\x26\x3d\
-\x35\x05\x4f\xbb\xda\xfb\x63\xe4\x22\x3a\x3a\xba\x48\xfa\x6b\x59\
-\x60\xbd\xef\x52\x98\x38\x58\x53\xc4\xec\xb9\x43\x57\x77\xec\xe7\
-\x2c\xed\x9b\x8b\xc9\xa7\x1c\x16\xd3\x5d\x2c\x92\x0a\xa5\xe2\x3a\
-\x3f\xdf\xac\xc6\xeb\xeb\x3a\xe2\xa6\xfd\x86\x57\x4f\xfc\x06\xcd\
-\x6a\xda\x65\x9b\xf5\x74\xdf\x7a\x0f\xeb\xd6\xad\x5b\x4e\xdd\xc3\
-\x79\xf0\xe0\x01\xd9\xd9\xd9\x45\xda\x55\xab\xd5\xa5\xa7\x00\x49\
-\x01\x34\x18\xf7\x39\xa7\x06\x1a\x09\x8d\xa8\x04\x59\x0f\x91\x24\
-\x30\xeb\x8d\xa4\xa6\xe8\x79\x76\xc9\x9b\x68\xc6\x2d\x24\x29\x2b\
-\x03\x51\xe1\x85\xa6\x94\x7b\x6b\xd6\xdf\xb4\x46\x12\x52\x52\x52\
-\x78\xfc\xf8\x71\x89\x11\x8d\xd2\xe6\xfd\xbd\x7b\xf7\x8a\x90\x22\
-\xeb\xdc\x2c\xbd\x9f\x83\x78\x6f\xdf\x71\x5e\x51\xfa\xa2\x11\x24\
-\x2c\x12\xa0\x10\xc9\xba\x7d\x95\x72\x51\x6d\x69\xdd\xb7\x23\x83\
-\x36\xd7\xe5\xd7\x54\xa8\xe0\xa7\x28\xd5\xb6\x3f\xae\xbf\xf4\xf4\
-\x74\x6e\xdd\xba\x85\xc5\x62\x29\xf3\x9c\xb4\x46\x35\x1f\x3c\x78\
-\x50\xe4\x7e\xaa\x35\x5a\x5d\xaa\x6d\x4a\x6f\xda\xcc\xd8\xc9\x2f\
-\x93\x55\x84\x55\x55\x73\xf3\x67\x33\x12\x4a\xf2\xb2\x7f\xa3\x5c\
-\x9d\xbe\x8c\xe9\xa7\x61\xc3\xbe\x5f\xc9\x4c\x37\x11\x1c\x5c\xba\
-\xb3\x6e\x75\xe8\xad\x29\xe0\x37\x6f\xde\xe4\xde\xbd\x7b\x0e\x4b\
-\x0e\xe4\xe5\xe5\x11\x1f\x1f\xff\xa7\xdf\xb0\x8b\x38\xa8\xea\xb0\
-\x62\xef\x71\xf4\x5e\x95\xd0\xe7\xa4\x16\x54\x2d\xb5\x48\xa4\x4a\
-\x6e\xb4\x6c\xd2\x8c\x66\xbd\x44\x66\x37\x3f\x88\xd1\xdc\x16\x9d\
-\x5a\x85\xa2\x14\xef\xab\x70\x16\x83\xc5\x62\x21\x2d\x2d\x8d\xa4\
-\xa4\x24\x87\x64\x30\x24\x49\xc2\xd7\xd7\x17\xbd\x5e\x5f\x64\x8c\
-\x54\x2a\x15\x0a\x85\xa2\xd4\x7b\x9d\x1e\xc1\x55\xd9\x74\xf2\x22\
-\x0a\xef\xb0\x27\xed\x81\xa8\xcf\xe6\xd7\x2c\x2f\x5e\x7b\xbe\x2f\
-\x39\x57\x3d\xf8\xe5\xe6\x7d\x2c\x34\xb0\x6b\x5f\xb2\xee\xff\x56\
-\xdc\xba\x75\x8b\x8a\x15\x2b\x3a\xbc\xff\x67\x64\x64\x90\x90\x90\
-\x60\x9b\x93\xf6\xee\x8f\xff\x57\xf8\xf8\xe3\x8f\x49\x48\x48\x60\
-\xd8\xb0\x61\x6c\xd8\xb0\x41\x76\x04\xca\x80\x2e\x5d\xba\xb0\x7c\
-\xf9\x72\x26\x4c\x98\xc0\x47\x1f\x7d\x24\x93\x40\x99\x04\xca\x90\
-\x21\xe3\xbf\x15\x56\xc7\x71\xc6\x8c\x19\xcc\x9a\x35\xcb\xe1\x76\
-\x24\x49\x22\x25\x25\x85\x51\xa3\x46\x95\xf9\xbb\xbe\x7e\xfe\xf8\
-\xfa\xfd\xbe\x25\x06\x54\x28\x8f\xb7\x6f\x05\x9e\x6a\x14\xce\x82\
-\x61\x5d\x90\x1a\x0d\x65\x42\x19\xd3\x87\xac\x11\x12\x9d\x4e\x47\
-\x8f\x1e\x3d\x9c\xae\xc6\x98\x9a\x9a\xfa\x27\xc7\xc9\x1e\x68\x03\
-\xc2\xa8\xf4\xe4\xe2\x98\x31\x55\x8d\x97\xb7\x0e\x8b\xb9\x31\xe3\
-\xc7\x07\xf2\xce\xc8\x17\x50\x12\xc8\x5b\x9f\xd7\x2c\xf3\x33\xe9\
-\x74\x3a\xee\xdf\xbf\xcf\x90\x67\x0f\xe3\x49\x00\x00\x20\x00\x49\
-\x44\x41\x54\x21\x43\x4a\x4c\x95\x2b\x0d\x26\x93\xa9\x88\x58\xbc\
-\xfd\xec\x58\x81\x5b\x60\x18\xd5\x03\x9f\xd8\x96\xab\x23\x30\xc0\
-\x07\xb5\x87\x27\xb5\x1a\xd5\x60\x66\xb7\x21\x04\xb7\x1b\x4d\x9d\
-\xb0\xf2\x65\xae\x5a\xa8\xd5\x6a\xc9\xcb\xcb\xa3\x51\xa3\x46\x4e\
-\x9d\xdc\xe7\xe4\xe4\x38\x58\xa9\x52\x41\x48\x64\x4d\x42\x0a\xdc\
-\x7f\xd4\x5a\x1d\x9e\x5a\x0b\xfe\x4d\xfb\xa3\xdd\xf1\x01\xaf\x8c\
-\xfa\x18\xa9\xc9\x42\x26\xf9\x95\xb1\xcb\x9e\xa4\x14\x9e\x3d\x7b\
-\x96\x96\x2d\x5b\x3a\x55\x69\x36\x37\x37\x17\x5f\x5f\xdf\xb2\xdb\
-\x26\x28\xf0\x0c\x89\xa4\x7a\xc8\x13\xf2\xed\xe5\x4b\x80\x4e\xc2\
-\xbb\x5c\x27\xb8\xf5\x2a\x43\xdf\xf1\xa3\xed\x80\x17\xa8\x18\xac\
-\x2c\xd3\xfa\x10\x04\x01\x5f\x5f\x5f\xb6\x6f\xdf\xce\xa9\x53\xa7\
-\x1c\x9e\x8f\x66\xb3\x99\xf4\xf4\x74\xba\x76\xed\xea\x80\x6d\x5a\
-\x2a\x56\x2b\xb8\x5c\x9b\x97\x92\x81\x9f\xbf\x1f\x0a\x51\xe0\xa9\
-\x6a\x7e\x2c\xfb\x7c\x01\xcb\x1e\x65\x31\x76\xd5\x4a\xdc\x55\x65\
-\xdf\x0b\xd4\x6a\x35\xbb\x76\xed\xe2\xe8\xd1\xa3\x0e\xcf\x49\x41\
-\x10\xc8\xc8\xc8\x20\x32\x32\xb2\xcc\xfd\x23\xaa\xb4\x44\x54\xfb\
-\xfd\xe2\xb0\x47\x50\x30\xee\x1e\xde\x74\x6e\x1f\xce\x6b\x23\x47\
-\x51\x21\x34\x98\x41\xe3\xa7\x97\x59\x2a\x42\xa1\x50\xe0\xe9\xe9\
-\xc9\x5b\x6f\xbd\xe5\x94\x9e\xa6\xd9\x6c\x26\x25\x25\xc5\x26\x16\
-\xff\x77\x22\x2b\x2b\x8b\x83\x07\x0f\xa2\x54\x2a\x65\x02\xe8\x20\
-\x5e\x7a\xe9\x25\xb6\x6f\xdf\xce\xf1\xe3\xc7\xd9\xb7\x6f\x1f\x5d\
-\xbb\x76\x95\x3b\x45\x26\x81\x32\x64\xc8\xf8\x6f\x82\xc5\x62\xa1\
-\x62\xc5\x8a\xbc\xfd\xf6\xdb\x0e\x47\x5c\xfe\x48\x28\x3b\x77\xee\
-\xcc\xe9\xd3\xa7\x9d\x68\xc5\x8f\xd7\x37\xae\x2e\xf8\xe7\xe0\x77\
-\xf8\x6a\xc0\x1b\x28\x55\x65\x3f\x51\x36\x99\x4c\x94\x2f\x5f\x9e\
-\xb9\x73\xe7\xda\x0a\x8e\x38\x0a\xab\x8e\x9e\x55\x2b\xcc\x61\x41\
-\x75\xbf\x3a\x0c\x18\x54\x70\x8f\xae\xe2\xe8\xc5\x6c\x7e\x36\x1d\
-\x8d\x97\x0f\x8e\x94\x78\xaf\x55\xab\x16\x4b\x97\x2e\x75\xc9\x3c\
-\xd0\x6a\xb5\xd4\xab\x57\x8f\x2d\x5b\xb6\x38\x6e\x9b\x6f\x14\x6f\
-\xbd\x1e\x05\x40\x87\x51\xf3\x69\x35\xd4\x88\x5a\x5d\xf6\xb4\x2f\
-\xb3\xd9\x4c\xdf\xbe\x7d\xa9\x5a\xb5\xaa\x4b\xaa\x0c\x5a\x0b\x5f\
-\x38\xd1\x02\x91\xf5\x9e\x22\xb2\x5e\xc1\xa7\xb7\x3e\x5a\x46\x62\
-\x96\x82\x20\x4f\xb1\xcc\xb2\x03\x82\x20\x30\x70\xe0\x40\x42\x43\
-\x43\x9d\x96\x75\x10\x45\x11\x95\x4a\x85\xa7\xa7\xa7\xe3\xfd\x24\
-\x49\xd4\xe8\xf3\x02\x35\x9e\x7c\x9c\xb5\x66\x3b\x99\x39\x16\xbc\
-\xdc\x95\x65\x6c\xa6\xe0\x3e\xe9\xcb\x2f\xbf\x4c\xcf\x9e\x3d\x9d\
-\x22\xee\x82\x20\x60\x36\x9b\xa9\x5e\xbd\xba\x53\xb2\x35\x3a\xff\
-\x0a\x4c\x9c\xf4\x02\x00\xd5\xda\x0c\xe4\xc3\x06\x9d\x31\x79\xf9\
-\xa0\x2b\x73\x17\x15\x44\x5e\x17\x2e\x5c\x48\x5e\x5e\x9e\xd3\x29\
-\xa1\xa2\x28\xe2\xe3\xe3\x43\x56\x56\x96\x13\x52\x13\xd0\x69\xe6\
-\xbc\x82\x0f\x55\xa7\xb2\xb3\x53\x0a\x59\x5a\x7f\x3c\xcb\x38\xa5\
-\x0c\x06\x03\xd5\xab\x57\xe7\x83\x0f\x3e\x70\xc9\x9d\x39\x51\x14\
-\x69\xd5\xaa\x15\xe7\xce\x9d\xfb\x5b\xdf\x6b\x8f\x1f\x3f\xc6\x60\
-\x30\xd0\xa6\x4d\x1b\xf9\x25\xef\x84\x6f\x50\xbf\x7e\x7d\x0e\x1e\
-\x3c\x48\x42\x42\x82\xdc\x21\x32\x09\x94\x21\x43\xc6\x7f\x1b\xcc\
-\x66\x33\xc1\xc1\xc1\x7f\xba\x33\xe8\x2c\x5c\x59\xe9\xcc\x11\x02\
-\x68\xb5\x2d\x30\x30\x90\x97\x5f\x7e\xd9\xa5\xb6\xb9\xf2\x5e\x50\
-\x01\x01\x04\xca\x48\x00\x25\x49\xc2\xcd\xcd\xcd\x69\xe9\x83\x3f\
-\x3a\x84\xae\xac\x9e\xe7\x08\x01\xb4\x8e\x5b\xcb\x96\x2d\x69\xd9\
-\xb2\xa5\x4b\x6d\x73\x1d\x54\x04\x79\xda\x18\x4b\x99\xbf\xdd\xb0\
-\x61\x43\x1a\x36\x6c\xe8\xb2\xa7\xb9\x70\xe1\x82\xe3\x24\xf0\x4f\
-\xcf\x2f\xe2\xe5\x5e\xf6\xe8\xa4\xc5\x62\x41\xad\x56\xf3\xcc\x33\
-\xcf\xb8\x74\xad\x95\x74\xff\xb7\xcc\xa3\xe6\xe5\x83\xca\xc1\xf5\
-\xae\x56\xab\x19\x39\x72\xa4\x4b\x6d\x5b\xb6\x6c\x99\x13\x44\xf9\
-\x0f\x7f\x70\xf7\xc7\x91\x92\x5e\x46\xa3\x91\xf0\xf0\x70\x3a\x77\
-\xee\xec\x52\xdb\x1c\xc9\x98\x70\xf5\x7b\xcd\xaa\xa5\x29\xe3\x9f\
-\xf5\xce\x93\x21\x93\x40\x19\x32\x64\xfc\x43\xa0\x50\x28\xb8\x77\
-\xef\x1e\x1b\x37\x6e\xb4\xdd\xe7\x70\xb6\xbd\xa1\x43\x87\xba\xf4\
-\x2e\x88\xa3\x42\xd6\x4a\xa5\x92\x07\x0f\x1e\x30\x6f\xde\x3c\xa7\
-\xd2\x25\x0b\x9c\x2e\x81\xf4\xf4\x74\x16\x2d\x5a\xe4\x1a\xb1\x78\
-\x27\x8d\xb4\x96\x64\x9f\x39\x73\xa6\x4b\x52\xaf\xdc\xdc\xdc\xe8\
-\xdf\xbf\x3f\x5a\xad\xd6\x45\x05\x82\x1c\xd6\xe5\x46\xa9\x54\xb2\
-\x6d\xdb\x36\x8e\x1e\x3d\xea\xb0\xd6\xdc\x1f\xfb\x6a\xde\xbc\x79\
-\x7f\xdf\x60\xfd\xc1\x99\xda\xb3\x67\x0f\xdb\xb7\x6f\x77\xba\x38\
-\x86\x35\xc2\xd9\xab\x57\xaf\xbf\xdd\xd9\x15\x45\x91\xbc\xbc\x3c\
-\x96\x2f\x5f\xce\xb5\x6b\xd7\x9c\x2e\xbe\x61\x32\x99\x68\xd2\xa4\
-\xc9\xdf\x7a\xa7\xac\xb0\x6d\xf9\xf9\xf9\xbc\xfe\xfa\xeb\xe4\xe4\
-\xe4\x38\x95\x09\x60\x6d\x2f\x24\x24\x84\x2a\x55\xaa\xfc\xed\xb6\
-\x69\x34\x1a\xae\x5d\xbb\xc6\x17\x5f\x7c\x41\x6a\x6a\xaa\x4b\xfa\
-\xaa\x7f\xff\xfe\x98\x4c\xa6\xbf\x35\x25\xd4\xfa\xdb\x65\xd9\xcb\
-\x1c\x5f\xd5\x7f\xdd\x5a\x59\x33\x3b\x4a\xdb\x50\x25\x04\xfe\x93\
-\x5d\x2a\x13\x3f\x99\x04\xca\x90\x21\xe3\xbf\x1c\xa2\x28\x92\x94\
-\x94\xc4\xa6\x4d\x9b\xc8\xce\xce\x2e\xa2\x67\x56\x56\x98\xcd\x66\
-\x62\x63\x63\xa9\x5a\xb5\xaa\x93\xa9\x6e\x69\xec\xfd\x62\x33\x49\
-\x7e\x0d\x19\xd8\xeb\x69\x74\xa4\x71\xec\x62\x3a\x8d\x6b\x55\xc2\
-\x4d\x63\x7f\xbb\x4a\xa5\x92\xc4\xc4\x44\xd6\xaf\x5f\x4f\xa5\x4a\
-\x95\x9c\x7a\x26\x8b\xc5\x42\x4c\x4c\x0c\xd3\xa6\x4d\x73\x4a\x2c\
-\x3e\x27\xf9\x36\xdf\xef\x38\x88\x6f\xe3\xae\xb4\xab\x17\x86\x52\
-\xcc\xe7\xe0\x9e\x2b\xb4\xe9\xd1\xb4\xcc\x51\x8a\x7b\xf7\xee\xb1\
-\x6a\xd5\x2a\x42\x43\x43\x1d\xd2\xbf\xb3\x42\xaf\xd7\x93\x9b\x9b\
-\x4b\xfd\xfa\xf5\x9d\x22\x26\x39\xf7\x4e\xb2\x71\xc7\x25\xaa\x75\
-\xff\x17\xed\xab\xfa\x90\x1b\x7b\x9b\x9b\x7a\x05\xd5\xaa\x46\xe0\
-\x26\x94\x6d\x4e\x9e\x38\x71\x82\xcf\x3e\xfb\x8c\xca\x95\x2b\x3b\
-\xe5\x50\xa6\xa6\xa6\x92\x96\x96\xc6\xfb\xef\xbf\xef\x84\x37\x64\
-\x26\xfe\xd7\xe3\xec\x3a\xf9\x88\xce\x3d\xba\x53\x25\xd4\x0b\xe2\
-\x0f\xb2\x23\xb1\x39\x7d\x1a\x94\x5d\x0a\xe1\xc8\x91\x23\x7c\xf1\
-\xc5\x17\x84\x85\x85\x39\x75\xa0\x90\x92\x92\x82\x56\xab\xa5\x53\
-\xa7\x4e\x4e\xb5\x13\x73\x6e\x1f\xfb\x7e\x7e\x44\x58\xb3\xee\x74\
-\x6f\x1c\x4c\xce\xa3\x78\xe2\x52\x33\x88\xa8\x5d\x0b\x4d\x19\xc6\
-\x2c\x2f\x2f\x8f\x03\x07\x0e\x70\xf4\xe8\x51\x22\x22\x22\x1c\x26\
-\x4b\x26\x93\x89\x87\x0f\x1f\x12\x1f\x1f\x4f\x9f\x3e\x7d\x1c\xb6\
-\xcb\x90\x93\xc9\xf7\x5b\xd7\x63\x0e\x6b\x4b\xcf\x0e\x75\xd1\x00\
-\xfa\xe8\x03\xfc\xe6\xd6\x8e\xa8\x8a\x65\x23\x97\x06\x83\x81\x55\
-\xab\x56\x61\x36\x9b\xa9\x50\xa1\x82\xc3\x73\x52\x14\x45\x62\x62\
-\x62\x88\x8c\x8c\x64\xce\x9c\x39\x0e\xef\x23\x89\xf7\x6f\xb0\xe3\
-\xd0\x55\xda\xf5\xee\x43\x55\xbf\x82\x35\x9b\xf5\xf8\x1a\x89\x86\
-\x8a\x54\xa9\xe4\x5d\xa6\x3d\x32\x2e\x2e\x8e\xb5\x6b\xd7\x62\x32\
-\x99\xf0\xf6\xf6\x76\x78\xad\x19\x8d\x46\xee\xdf\xbf\x4f\x48\x48\
-\xc8\x3f\x56\x2c\xde\x94\xfe\x90\x0d\xb3\x27\xb2\xfc\x58\x02\x1a\
-\x85\x19\x41\xe3\xc7\x53\xdd\x86\x33\xfd\xf5\xe7\xf0\xd7\xdf\x66\
-\xcf\x8a\xf7\x58\x7a\xb9\x16\xab\x16\xbc\x42\xa5\x20\x1d\xc7\x3e\
-\x7f\x8b\xc9\xff\x5e\x41\x8c\xde\x9b\x96\x7d\xc7\xb3\x68\xd6\x2b\
-\xd4\x08\x4c\x67\xc5\xcb\x63\xd8\x69\xea\xc3\xb4\xc0\x1d\x4c\xdf\
-\x95\x8c\xca\x53\x8b\x52\x90\x30\x1a\x8d\x78\x84\xd4\x66\xf1\xc6\
-\xd5\xd4\x74\x83\x93\xdb\x96\xf0\xc1\x87\xeb\x69\x3d\xe7\x47\xa6\
-\x77\x08\xc0\x90\x95\xcc\xf2\x09\x7d\xf8\x35\x72\x2c\xb3\xde\x1e\
-\x41\xd0\x9f\x96\x6d\x3e\xbb\x97\xcd\x60\xd6\x3e\x89\x1f\xb6\xbc\
-\xc9\xfc\xd1\xdd\xb8\xe4\x37\x9a\x6f\x3f\x1b\x87\x8e\x7c\xb6\xcf\
-\x79\x9d\x9d\x99\x75\x58\xfc\xef\xb1\xf8\x16\x7a\x17\x1a\x8d\x46\
-\x3e\xfe\xf8\x63\x4e\x9e\x3c\x49\xb5\x6a\xd5\x98\x3f\x7f\xfe\x9f\
-\x6c\x8f\x8e\x8e\xe6\x9b\x6f\xbe\x41\xaf\xd7\xd3\xb3\x67\x4f\x9a\
-\x3c\x91\x2e\x92\x21\x93\x40\x19\x32\x64\xfc\x0f\xc2\xfa\xb2\xb7\
-\x58\x2c\x28\x95\x4a\x3e\xfd\xf4\x53\xba\x74\xe9\xe2\x70\x7b\x79\
-\x79\x79\x3c\xf7\xdc\x73\x0e\x8b\x7b\x5b\xf1\xe3\xab\xcf\xb1\xa5\
-\xca\x34\x3a\x25\xec\xe4\x33\xad\x37\x11\xa7\x67\x30\xfe\x74\x43\
-\xce\x7d\xf5\x66\x99\x48\x60\x61\x02\x77\xf4\xe8\x51\x7c\x7c\x7c\
-\x1c\x16\x8b\xcf\xc9\xc9\x21\x2a\x2a\xca\xb9\x08\x47\xf6\x03\xbe\
-\x5f\xf7\x29\x37\x89\xe0\xf2\xa7\x5f\x51\xf9\xa3\x91\x6c\x1b\xd7\
-\x96\x0f\xef\x0c\x20\xb1\x47\x53\x87\xc8\x5b\xd5\xaa\x55\xf9\xfa\
-\xeb\xaf\xa9\x52\xa5\x8a\xc3\xe2\xdc\xf7\xee\xdd\xa3\x6d\xdb\xb6\
-\x4e\x8a\x3c\x5f\x64\xf2\xd8\x55\xf4\x78\xb7\x2f\x1b\xc7\xbf\x06\
-\x6b\xdf\x66\xeb\xa0\x9e\x64\x3e\x3b\x9b\xe5\x53\x22\x28\x6b\xb9\
-\x09\xa3\xd1\x48\x40\x40\x00\xd1\xd1\xd1\x0e\xdf\x55\x55\xa9\x54\
-\x6c\xd9\xb2\x85\x57\x5e\x79\xc5\xa9\x53\xed\xec\xd4\x58\x36\x2d\
-\x5e\x86\x31\xbc\x2e\x19\xf7\xce\x10\x1b\x9f\xc6\xa8\x3e\x83\xf0\
-\xfc\x20\xb5\xcc\x24\x50\x92\x24\x4c\x26\x13\xed\xda\xb5\x63\xe7\
-\xce\x9d\x98\x4c\x26\x87\x9e\x4d\xab\xd5\xb2\x78\xf1\x62\xe6\xcf\
-\x9f\xef\x94\x6d\xa6\xc7\x3f\xb2\xfc\xab\x4b\x74\x79\xc6\x8f\x63\
-\x0b\x9f\x27\x6b\xc4\xab\x6c\x9c\xf9\x3a\xd5\x86\xbe\xcb\xec\xda\
-\xb5\xca\xde\x57\xd9\xd9\x8c\x1c\x39\x92\x4f\x3f\xfd\x94\xfc\xfc\
-\x7c\x87\xe6\x63\x5e\x5e\x1e\x6f\xbe\xf9\x26\x71\x71\x71\x4e\xed\
-\x23\xf1\x29\x0f\x38\x16\x0b\x15\x63\xd7\xb1\x43\xf5\x0a\x11\xf7\
-\xbf\xe4\x85\xb7\x16\xf1\xe2\xd6\x58\xa2\x2a\x3a\xb6\x5f\x0e\x19\
-\x32\x84\xd5\xab\x57\x3b\x3c\x27\x7d\x7c\x7c\xa8\x5a\xb5\xaa\x93\
-\x4c\x26\x93\x3b\x17\x4f\x51\x25\xeb\x10\xe3\xde\xd0\x73\x70\xf5\
-\x50\x8e\x2c\x1e\xc9\xd4\x6f\xee\x33\xe3\x93\xaf\xa8\x52\x09\x87\
-\xe6\xe4\xb2\x65\xcb\x1c\x4e\xe7\x15\x04\x81\xd4\xd4\x54\xba\x74\
-\xe9\x82\xc1\x60\xf8\xc7\x8a\x8b\x5b\x8c\xb9\xc4\x5c\xfa\x89\x0b\
-\x77\x7c\x78\xba\x61\x4d\xa4\x84\x4b\x7c\x34\x6d\x30\xc7\xee\x8a\
-\xfc\xb2\xa2\x01\x8f\x7e\x3d\xcd\xe1\x53\xa0\x47\xc3\xaf\xcb\xff\
-\x45\x9b\x09\x5f\x12\xde\xac\x17\x2f\x36\xf5\xe6\x9b\x35\x6f\x31\
-\x58\x11\xc8\xc9\x25\x6d\xb8\x79\xfe\x30\xe7\x8c\x51\x68\xfa\xaa\
-\x50\xa9\xcd\xdc\xff\xf5\x02\x8f\x0c\xee\x44\xd5\x8a\x28\x14\x4e\
-\x7c\xc0\xd1\xfd\x7b\xf9\xf1\xec\x25\x2e\x2d\xdb\xce\xf4\x0e\x63\
-\x31\x1b\xf4\x44\xff\x7c\x92\x0b\x96\x0e\xe4\xfd\xe5\xb2\x35\x11\
-\x77\xe3\x16\x67\x0f\xe6\x63\x36\xe6\x71\xe9\xd4\x79\x0e\x64\xc5\
-\xb1\x70\xe0\x08\x66\x76\x10\xb9\x7f\xfd\x12\xa7\x92\x35\xe8\xcd\
-\x52\x91\x43\xa5\x09\x13\x26\xf0\xdb\x6f\xbf\x01\xd0\xac\x59\xb3\
-\x3f\xb5\xba\x64\xc9\x12\xa6\x4c\x99\x62\x7b\x7f\xcd\x9a\x35\x8b\
-\x6d\xdb\xb6\xfd\xae\x3d\x29\x43\x26\x81\x32\x64\xc8\xf8\xef\x44\
-\x7a\x7a\x3a\xe9\xe9\xe9\x45\xa2\x05\xa2\x28\xf2\xf8\xf1\x63\xdb\
-\xdf\x34\x1a\x0d\xbe\xbe\xbe\xf8\xf8\xf8\x38\xfc\x3b\x56\x61\x6f\
-\x6b\x04\x20\x3f\x3f\x9f\xb8\xb8\xb8\x52\x2b\xce\x79\x7a\x7a\xe2\
-\xeb\xeb\x8b\x21\x5f\x8f\x42\xab\x27\x3d\x60\x20\x1f\x4c\x6c\x43\
-\xc6\xd6\xcb\x7c\x99\x2c\xf0\xca\xb0\xb1\x7c\xa9\x4f\x47\x14\x0a\
-\xc8\xc1\xe3\xc7\x8f\x4b\x74\x7c\x45\x51\x2c\x22\xcc\x0d\xe0\xe7\
-\xe7\xe7\x94\x58\xbc\x5a\xad\x2e\x12\x49\xb4\x96\xb1\x2f\xad\xc4\
-\x7f\x50\x50\x10\x5a\xad\x16\x93\x3e\x8f\x9c\x2c\x33\x21\x35\x5b\
-\xd3\xa0\x63\x2b\x32\xc7\x7d\x4a\xa2\xc1\x83\x97\x67\xbd\xcf\x4f\
-\x13\xa2\x31\x02\xe6\xec\x6c\x92\x4b\x49\xc9\x12\x45\x91\xdc\xdc\
-\xdc\x22\x02\xe8\x5e\x5e\x5e\x78\x7a\x7a\x3a\x6c\x9b\x9f\x9f\x1f\
-\xee\xee\xee\xb6\x6a\xaa\x29\x29\x29\xdc\xbf\x7f\xbf\x44\x47\x4e\
-\x10\x04\x82\x82\x82\xd0\xa8\x95\xe4\x1b\x24\xb4\xa9\xc9\xd4\x18\
-\x35\x95\x3e\x4d\xc2\xb9\xeb\xfb\x19\x19\x5e\x95\x79\x69\xec\x08\
-\x76\x2a\x54\x58\x24\xc8\xc8\xcc\x20\x3d\x3d\xbd\x44\xf1\xea\xa4\
-\xa4\x24\xf2\xf3\xf3\x11\x04\xc1\x26\x3a\x0e\xd8\xfe\xdf\x11\x78\
-\x79\x79\xd9\xe6\xb8\x28\x8a\xa4\xa6\xa6\x92\x9c\x9c\x4c\x6e\x6e\
-\x6e\xb1\x0e\xb1\x46\xa3\x21\x20\x20\x00\x85\x60\x21\x4f\x6f\xc6\
-\x24\xe6\x52\xad\xe5\x38\x5a\xd4\x4d\xe0\x91\xca\x42\x60\xbd\x81\
-\x7c\xf2\xf2\x2a\xde\x30\x14\xa4\xaa\x66\x64\x64\x90\x96\x96\x56\
-\x6c\x34\x4e\xa5\x52\xf1\xe8\xd1\xa3\x22\x07\x08\x5a\xad\xd6\x29\
-\x41\x75\xc0\x26\x30\x6e\x9d\x0b\x29\x29\x29\x3c\x7a\xf4\xa8\xd8\
-\xfb\xb8\x56\xdb\x42\x42\x42\x90\x2c\x66\x8c\x26\x0b\xd9\x69\x16\
-\x3a\x3f\xfb\x1c\x2d\xea\x6a\x30\x1e\xfb\x9e\xa4\xa0\x26\xcc\x78\
-\xe3\x45\xce\x27\xe7\x63\xe1\xf7\x02\x1b\x25\xcd\x03\x6b\xf1\x16\
-\x6b\x41\x17\xeb\x9c\x77\xb4\x18\x8f\x4e\xa7\xfb\xd3\x7c\x8e\x8b\
-\x8b\x23\x2f\x2f\xaf\xd8\xf4\x60\x49\x92\xf0\xf4\xf4\xc4\xcf\xcf\
-\x0f\xb3\x51\x8f\xc1\x08\x5e\xfe\x0a\x46\x8d\x1f\x4a\xcc\xfe\xe5\
-\x24\xdc\x4f\x26\x6a\xe8\x1b\xcc\xf9\xed\x30\x77\xcd\x16\x40\x22\
-\x31\x31\x89\xdc\xdc\xdc\x62\xc7\xcd\xdd\xdd\x9d\xf4\xf4\xf4\x22\
-\xb6\x5a\xd3\x53\x9d\x99\x93\x85\x25\x74\x4c\x26\x13\x09\x09\x09\
-\x3c\x7c\xf8\xb0\x58\xdb\x2c\x16\x0b\x7e\x7e\x7e\x78\x79\x79\x61\
-\x32\x1a\xc8\xcf\xcf\xc6\xb7\x5c\x14\xf5\xa2\x34\xf8\xfc\x70\x9f\
-\x54\xa0\xc9\xe0\xb7\x79\xcb\xeb\x0b\xc8\x29\x90\xb1\x89\x8f\x8f\
-\x2f\xf1\x50\x48\xa1\x50\x90\x94\x94\x54\xc4\x76\x3f\x3f\x3f\xa7\
-\xf6\xff\xbc\xbc\xbc\x22\x5a\x8e\x26\x93\xe9\x4f\xcf\x61\xbd\x5f\
-\x19\x1c\x1c\xfc\x7f\x93\x56\x6f\x07\xcc\x26\x91\xea\x3d\x27\xb1\
-\x79\xcd\xab\x84\x89\xb0\x74\x54\x3d\x5e\xdd\x3c\x93\xef\xdf\x3c\
-\x8c\x4e\x2b\xa2\x50\x28\x70\x33\x7f\xc7\xa8\x79\xbb\xf0\xad\xd9\
-\x8f\xc3\xa7\xbf\x25\x02\xe8\x5e\x2f\x98\x61\xf3\xf6\x92\xaf\x6f\
-\x8e\x28\x2a\x50\x68\xbd\x68\xf1\xe6\x76\x8e\xbf\x99\xcb\x82\xc1\
-\xed\x59\x9e\xf8\x34\x07\x0f\x7d\x44\x41\x0d\xeb\x2c\xf2\x2e\x6f\
-\xe0\x72\x4c\x3c\x95\x7d\x34\xdc\x3f\xb4\x91\x33\xf9\x63\x69\x20\
-\x80\x20\x82\x20\x88\xc5\xa6\x76\x8a\xa2\x00\x4a\x11\x10\x10\x45\
-\xc0\xa4\xe7\x87\xa5\x73\x78\xad\xc3\x2c\x94\x0a\x01\x85\x42\x2c\
-\x52\x01\x76\xc3\x86\x0d\xdc\xbc\x79\x93\x76\xed\xda\x71\xe4\xc8\
-\x91\xbf\x6c\x33\x20\x20\x80\x71\xe3\xc6\x31\x73\xe6\x4c\xa6\x4e\
-\x9d\xca\x86\x0d\x1b\xf8\xfc\xf3\xcf\x65\x12\x28\x93\x40\x19\x32\
-\x64\xfc\xb7\xe3\xc7\x1f\x7f\x64\xd7\xae\x5d\xb8\xb9\xb9\x15\x89\
-\xf6\x24\x24\x24\x14\xd1\xab\x72\xf6\x5e\x91\x55\xeb\xca\xaa\xf3\
-\x16\x13\x13\xc3\xc2\x85\x0b\x4b\x4c\xc3\x14\x45\x91\xa7\x9f\x6e\
-\xc9\xf0\xe1\x3d\x39\xf8\xcd\x16\xe2\xb4\x0d\x78\x71\xc6\x40\x8e\
-\x6f\xf9\x9c\x03\xd1\x26\x06\xbf\x52\x0b\xf4\xa9\xb8\xeb\x72\x11\
-\x05\x81\xc7\x8f\x1f\x33\x7b\xf6\xec\x62\x23\x72\x82\x20\x20\x8a\
-\x22\xa7\x4f\x9f\xa6\x6e\xdd\xba\x7f\x72\xbc\x1c\xde\xa4\xff\xd0\
-\x37\x37\x6f\xde\x64\xf6\xec\xd9\xb6\x02\x04\xc5\x39\xa6\x93\x27\
-\x4f\xa6\x6e\xdd\xba\x5c\xd9\xb5\x9c\x63\xfa\x7a\x8c\x19\xdc\x96\
-\xa3\x9f\x7d\x8a\xd4\xb4\x39\xf5\x3c\xdd\xd0\x79\x85\xa2\x11\xa3\
-\x11\x81\x73\x17\x2f\xb2\x7e\xe3\xc6\x52\xfb\xf8\xb7\xdf\x7e\xc3\
-\xcf\xcf\xcf\x66\xaf\xb3\xb6\xa9\x54\x2a\x1b\x39\xd3\x68\x34\xec\
-\xde\xbd\xbb\x88\x18\xfd\x5f\x41\xab\xd5\x32\x71\xd2\x24\x2a\x79\
-\xc1\x96\xad\xbb\xa9\xd6\xfb\x05\xa6\x74\xbe\xcf\xba\x4f\x66\xf3\
-\xb0\xe9\xab\x4c\xf1\x86\xcb\x5a\x3f\xd4\x66\x50\x09\x70\xf8\xc8\
-\x11\x76\xee\xdc\x89\x5a\xad\xfe\xcb\xfe\xb2\x6a\x31\xc6\xc4\xc4\
-\xd8\xe6\x90\x2b\x9c\xc4\xc2\x7d\xa3\x54\x2a\xd9\xbb\x77\x2f\x71\
-\x71\x71\xc5\x3a\xdc\x66\xb3\x99\xf0\xf0\x70\x5e\x9a\x30\x09\xaf\
-\xf4\x5f\xf8\x78\xd3\x35\xda\x8f\x7b\x95\xae\x9d\xcf\xb1\x70\xf1\
-\x0f\x74\xec\x3b\x18\x37\x20\xd4\x47\x8b\xc5\x2c\x01\x12\x3f\xfd\
-\xf4\x13\xdb\xb6\x6d\xb3\x11\xe9\xbf\x9a\xe3\xd9\xd9\xd9\xe4\xe5\
-\xe5\x15\xb1\xd7\x55\xb6\x59\xdb\xda\xba\x75\x2b\xe7\xce\x9d\x2b\
-\xd6\xf9\xb7\x58\x2c\x84\x87\x87\x33\x7d\xfa\x74\xb2\xe3\x6f\xf1\
-\xc3\xb6\x4d\xe4\xd4\x1f\x46\xdb\x4a\x29\x7c\xf1\xe1\x7a\x6e\x09\
-\x7d\x78\xaf\xb1\x2f\x77\x13\x7c\x50\x60\x41\x0b\x2c\x5a\xb9\x92\
-\x07\xf1\xf1\xc5\xa6\x40\x5b\x23\x40\x85\xff\x9b\xab\xf6\x91\xc2\
-\xed\x2d\x5e\xbc\xb8\xd8\xb9\x03\x05\x87\x43\x6d\xdb\xb6\x65\xc4\
-\x88\x11\xdc\x3e\xbb\x87\x1d\x47\x93\xe8\x31\xf1\x45\xd2\x7f\xfc\
-\x90\x33\xb1\xde\x3c\x37\xbe\x21\x6a\x20\xc8\x43\xc9\x1d\x0b\x98\
-\x8d\x7a\x36\x6f\xde\xcc\xa5\x4b\x97\x8a\xbd\x07\xab\x56\xab\xb9\
-\x74\xe9\x52\x91\xfe\x74\x25\x71\xb1\x1e\x4a\xac\x5e\xbd\x1a\x7f\
-\x7f\xff\xbf\xdc\xd3\x04\x41\x20\x3b\x3b\x9b\x61\xc3\x86\xd1\xa5\
-\x4b\x27\xae\x1c\xfe\x9a\x53\x0f\x3d\xe9\xf8\x4c\x73\x36\xae\xda\
-\x4c\xf3\xc9\x93\xf0\x03\x24\xff\x20\x82\x7d\x54\x24\x01\x46\x43\
-\x3e\x4b\x16\x2f\x26\xe3\x0f\x07\x61\x7f\x6c\xf7\xce\x9d\x3b\x45\
-\x88\xba\x2b\xaa\xd5\x16\x9e\x93\xb9\xb9\xb9\xcc\x9a\x35\xab\x48\
-\xff\x99\xcd\x66\xca\x97\x2f\xcf\xb4\x69\xd3\x9c\x3a\x94\x73\x0a\
-\x02\x58\x8c\x7a\x72\x73\x00\x4f\x68\xdb\xf1\x19\x14\x9b\x3f\xe7\
-\xc2\xd9\x38\x22\xb5\x2a\x10\x24\x0c\xbb\xbf\xe2\xb7\xe4\x1c\xaa\
-\x0f\x9e\x42\x04\x90\x91\x70\x9f\xd0\x56\xa3\xd9\xdd\x58\x85\x9f\
-\x9b\x64\xdb\xdf\x0b\x90\x8d\xc1\x64\x46\xb2\x18\xc9\xc9\x36\xe2\
-\xe5\xa1\xc2\x94\x96\xce\xd1\x15\x6b\xb9\x91\x57\x93\x69\x2f\xd4\
-\xe6\xd5\x4f\xf6\x72\xf4\x58\x12\x4d\x9a\x95\xa9\xfc\x17\x46\x3d\
-\xb4\x18\x31\x11\xf5\x4f\xdf\xb1\xfb\xda\x58\x14\xea\x3f\xaf\xad\
-\x05\x0b\x16\x30\x6e\xdc\x38\x92\x92\x92\x8a\x25\x81\x43\x87\x0e\
-\x65\xe8\xd0\xa1\x00\xb6\xbb\xa8\x7f\x5b\xff\xcb\x90\x49\xa0\x0c\
-\x19\x32\xfe\x73\x78\xf6\xd9\x67\x79\xf6\xd9\x67\xff\xf4\xf7\x2b\
-\x57\xae\xd0\xbd\x7b\x77\xdb\x0b\x3b\x36\x36\x96\xd8\xd8\x58\xc7\
-\xef\xbb\xe5\xe4\xf0\xf0\xe1\x43\x9a\x36\x6d\x8a\xd1\x68\xa4\x5e\
-\xbd\x7a\xac\x59\xb3\xc6\xbe\x2f\x1b\x53\xf1\x0f\x2e\x8f\xe8\xe3\
-\xc7\xcf\x9f\xcc\xe4\x2b\xa9\x0d\xef\xbd\xf3\x12\x81\x4a\x20\xd6\
-\x88\xc9\x64\xb6\xc9\x59\xac\x5c\xb9\xb2\xd4\xe6\xde\x78\xe3\x0d\
-\xee\xdc\xb9\x63\xfb\x7c\xef\xde\x3d\xdc\xdd\xdd\x1d\x4e\x07\xcd\
-\xcf\xcf\x2f\x12\x61\x69\xd2\xa4\x09\xcb\x97\x2f\xb7\xbb\x0d\xcf\
-\xc0\x0a\x94\x4f\x37\x72\x68\xfd\x0a\x7e\xd3\xb6\x63\xfe\xa8\x36\
-\x05\xa7\xb9\x39\x06\x8c\x66\x33\x26\xa0\x45\xab\x56\xb4\x68\xd5\
-\xaa\xd4\xb6\x86\x0c\x19\xc2\xf5\xeb\xd7\x6d\x11\xcf\xbb\x77\xef\
-\x22\x8a\xa2\xc3\xe9\xa0\xf1\xf1\xf1\xb6\xe8\x62\x6e\x6e\x2e\x13\
-\x27\x4e\x64\xd0\xa0\x41\x76\x7d\x3f\x2f\x29\x96\x72\x15\x2a\x53\
-\x4e\xf9\x2b\x73\xdf\xde\x48\xe5\x41\x13\x59\xd4\xb6\x3a\x00\x26\
-\xb3\x09\xb3\x45\x42\x6f\x81\x3e\x7d\xfa\x94\x7a\xbf\x2b\x2b\x2b\
-\x8b\x5e\xbd\x7a\x61\x32\x99\x6c\x91\x8a\xa4\xa4\x24\x87\xd3\x8b\
-\xd5\x6a\x35\x0f\x1e\x3c\xb0\x11\x3e\xbd\x5e\xcf\x0b\x2f\xbc\xc0\
-\xb0\x61\xc3\xec\xfa\xbe\x21\xdf\x87\x4a\xe1\x15\x50\xe5\xdd\x63\
-\xcb\x67\xeb\xa8\x3f\xe2\x3d\x9a\xd7\x09\xb4\x91\x0e\xf3\x13\x8f\
-\xb2\x77\xef\xde\xf4\xee\xdd\xbb\xc4\xb6\x52\x53\x53\xd9\xb3\x67\
-\x4f\x11\x5b\xe3\xe3\xe3\x1d\x4e\x07\xd5\x68\x34\xc4\x3f\x21\x67\
-\x16\x8b\x05\x51\x14\x99\x32\x65\x8a\xdd\xe9\x7c\x0a\x8d\x8e\xa0\
-\xb0\x6a\x64\xe4\x5d\x60\xdd\x17\x77\x68\x3d\x78\x26\x2f\xd5\x09\
-\x04\x2c\x18\x4c\x46\xcc\x92\x48\x36\xf0\xee\x7b\xef\x95\xda\x56\
-\x6c\x6c\x2c\x3b\x77\xee\xb4\x55\x63\x8c\x8e\x8e\x2e\xd2\xef\x65\
-\x9d\x8f\x79\x79\x79\x45\xa4\x21\x4c\x26\x13\x6b\xd7\xae\xb5\x9b\
-\x38\xbb\x79\x05\x52\x29\x4c\x4d\x66\x6a\x0c\x87\x92\x2a\xf3\xf6\
-\xcc\xfe\x36\x59\x08\x83\xd1\x8c\x45\x02\x85\x4a\xcb\xab\xaf\xbe\
-\x5a\x6a\x5b\x9f\x7f\xfe\x39\x97\x2f\x5f\xb6\x39\xfd\xa9\xa9\xa9\
-\xb6\xcc\x0a\x47\xe0\xe5\xe5\x85\xd1\x68\x44\xa5\x52\x61\x36\x9b\
-\x09\x0d\x0d\x65\xde\xbc\x79\x76\x15\x89\x91\x2c\x46\x3c\xfc\x42\
-\x08\x35\xe8\xb9\x71\xe2\x47\xa2\xfa\x4f\xa2\x59\xdd\xf0\x27\xff\
-\xcd\x8c\xd1\x68\xc6\x6c\xb6\xa0\x52\x6b\x59\xf8\xe1\x87\xa5\xb6\
-\xb7\x7b\xf7\xee\x22\x95\x93\xef\xdd\xbb\xc7\xbd\x7b\xf7\x1c\xe3\
-\x55\x4f\x0e\x15\x1f\x3c\x78\x80\x42\xa1\xc0\x62\xb1\xe0\xe3\xe3\
-\xc3\x8a\x15\x2b\xfe\xf1\xef\x47\xad\x46\x87\x20\x49\xe8\xf3\x73\
-\x10\x84\x82\x28\x5b\x7a\x42\x0a\x66\x03\xf8\x55\xaa\x00\x96\x64\
-\x0e\x2d\x9d\xc4\xb8\x2f\x2e\xa1\x56\x36\xe4\xda\x95\xd2\xb5\x74\
-\xd3\xd2\x62\x58\xb6\xed\x0e\x3c\x3d\x88\x81\x53\x3b\xb0\x6e\xcd\
-\xf7\x1c\xfc\xe9\x27\x5e\x6f\xd9\xe6\x49\xb6\xa8\x54\x50\x89\xa6\
-\x34\x58\xc0\xab\xde\x50\x06\xab\x8e\xb0\x7a\xdd\xb7\x34\xcb\x11\
-\x50\xfc\x61\x19\x04\x06\x06\x12\x18\x18\xc8\xf7\xdf\x7f\x5f\x6a\
-\x73\x09\x09\x09\x2c\x5d\xba\x14\x41\x10\x78\xf1\xc5\x17\x65\xe7\
-\x48\x26\x81\x32\x64\xc8\xf8\x5f\x45\x46\x46\x86\xed\x64\x3b\x2b\
-\x2b\x8b\x29\x53\xa6\x10\x18\x18\xe8\x70\x7b\x16\x8b\x85\x3b\x77\
-\xee\x30\x70\xe0\x40\x04\x41\xc0\x68\x34\x92\x93\x93\x63\x5f\xda\
-\x9b\xca\x8f\xa7\x3a\xf5\x02\xf2\x99\xf7\xfe\x55\x1e\x55\xd6\x30\
-\x6f\xfa\x2f\x34\xed\xf7\x32\x83\x22\x3d\x09\x0d\xcc\x43\xa9\xb0\
-\xff\x14\xd5\x1a\x75\xb1\x3a\xd8\x3d\x7a\xf4\x40\xa9\x54\x3a\xe4\
-\x70\x5b\xd3\xdc\x92\x93\x93\x6d\xdf\x2f\xab\xe4\x40\xd5\xb6\x83\
-\x88\x4c\x8b\x65\xd1\xb4\x25\xfc\x6c\x4a\x64\xdc\xa5\xb3\xbc\x3c\
-\x6b\x32\xb5\x94\x6e\x54\xaa\x18\x58\xa6\x2a\x72\xd6\xdf\xb6\x56\
-\x76\x1d\x3e\x7c\xb8\xc3\x04\xd7\x4a\xfc\xac\x1a\x61\x82\x20\x90\
-\x95\x95\x65\x4b\x33\x2c\x0d\xba\xc0\x30\xba\xf6\x0b\x83\xb8\x2f\
-\xf9\xf1\xb7\x47\x34\xfa\x7e\x15\x17\xf6\x07\xf2\xfc\xfb\x6f\xe2\
-\xe9\xeb\x4b\x80\xc9\xc3\xee\x17\x5c\x56\x56\x96\xed\x3e\x91\x20\
-\x08\x24\x26\x26\xd2\xb6\x6d\x5b\x87\xe4\x46\xac\xcf\x9e\x98\x98\
-\x68\x4b\x31\xb5\xda\x6a\x37\x89\x0c\x6d\xc2\xbf\x86\x37\x21\xf3\
-\xf1\x6e\xe6\xec\xbd\x84\x7b\xfa\x7b\xa8\x47\x8c\xe0\x99\xa6\x4d\
-\x51\xf8\x55\xa2\x12\xf6\x47\x4e\xd2\xd3\xd3\x6d\xe3\x23\x49\x12\
-\x47\x8f\x1e\xa5\x5d\xbb\x76\xb6\x54\xce\xb2\x42\xa1\x50\xd8\x88\
-\x96\xb5\x8d\xc2\x91\xc6\xd2\xe0\x1e\x14\x46\xeb\xfe\xc3\x31\x5c\
-\xf8\x9c\x2d\x77\x6e\x90\xb1\x76\x0e\xfb\x75\x7e\x8c\x78\x65\x06\
-\x5e\x3e\x3e\xf8\xe5\x0a\x76\x8f\x9b\x95\xa4\x5b\x53\xfd\xb6\x6e\
-\xdd\xca\xe5\xcb\x97\x1d\x3e\x94\x30\x99\x4c\xdc\xbd\x7b\xb7\x88\
-\xc6\x5b\x5a\x5a\x9a\x2d\xfa\x5d\x1a\x2a\xd6\x6d\xcd\xe0\xba\x70\
-\xef\xc6\x46\x4e\x9c\x38\x46\x4e\x62\x34\x5d\x07\x0d\xa7\x7d\x54\
-\x05\xdc\x02\x2b\xe2\xe7\x56\xb6\x7d\x44\x92\x24\x24\x49\x22\x3f\
-\x3f\x9f\x6f\xbf\xfd\x96\xcb\x97\x2f\x3b\x2c\x39\xa2\x54\x2a\xb9\
-\x7b\xf7\x2e\x95\x2b\x57\xb6\xd9\x9a\x9d\x9d\x6d\x5f\xdf\x88\x2a\
-\xaa\x35\xe9\x48\x35\x1e\xb1\x79\xee\x2c\x36\x7e\xbf\x8f\xef\x6a\
-\xf6\xe5\x9d\x37\xfb\xe3\x21\x28\x70\xf7\x0a\xc4\xe0\x66\x7f\x61\
-\xa7\xec\xec\x6c\xdb\xdc\x31\x1a\x8d\xbc\xfe\xfa\xeb\x04\x04\x04\
-\x38\x4c\x02\xad\x85\x61\x0a\xdf\x35\xff\x47\x42\x02\x41\x14\x6d\
-\x64\xea\xf1\xa3\xfb\x98\x94\x50\x2e\x2c\x14\xcb\x45\x13\x16\xc0\
-\x2f\x2c\x14\xb5\x16\x12\x6f\xdf\x06\xb1\x25\xd5\x5b\xf7\xa3\x7f\
-\x4c\x1e\x2b\x36\xff\x8a\xc1\x58\xca\xbc\x96\xcc\x24\xff\x7a\x92\
-\x43\xa9\xa0\xbe\xb4\x8b\xd1\xaf\x5e\xe5\x41\x7a\x2e\xa9\x87\x7f\
-\x22\x7d\x46\x07\x04\x40\x10\x95\xd8\x1b\x78\x15\x15\xee\xb4\x79\
-\x6e\x24\xb3\x47\x7d\xc4\xee\xdc\x0c\x68\xe0\x58\x41\x97\xcc\xcc\
-\x4c\xba\x76\xed\x4a\x52\x52\x12\x1f\x7e\xf8\x21\x1d\x3b\x76\x94\
-\x9d\x20\x99\x04\xca\x90\x21\xe3\x7f\x19\x26\x93\x89\x88\x88\x08\
-\x3e\xff\xfc\x73\xd2\xd2\xd2\x9c\xdf\xcc\x94\x4a\xda\xb4\x69\xc3\
-\xc5\x8b\x17\x1d\x6c\x41\xc5\x8b\xab\x37\x30\x28\x27\x17\x33\x0a\
-\xbc\x03\x7d\xc0\xc3\x87\x69\xc3\xcd\x78\xbb\x97\xad\x72\xa5\xd1\
-\x68\x24\x32\x32\x92\x75\xeb\xd6\xb9\xa4\xaf\x0c\x06\x03\xb5\x6a\
-\xd5\x72\xbc\x44\xbc\x57\x79\x46\xbd\xff\x39\x7d\x73\xf5\x98\x24\
-\x2d\x15\xdd\x54\x48\x8a\xfa\xcc\x9a\x5b\xd3\xee\x2a\x8c\x85\xd1\
-\xa8\x51\x23\xd6\xaf\x5f\xef\x12\x67\xcb\xcd\xcd\x8d\x7a\xf5\xea\
-\xb1\x6d\xdb\x36\xc7\x6c\x0b\xee\xc1\xe6\x8d\x4f\x93\x6f\x30\x22\
-\x88\x1a\x82\x95\xa0\xee\xd0\x8b\xa1\x28\xb0\x57\x76\xce\xfa\xbb\
-\x46\xa3\x91\x51\xa3\x46\xd1\xa2\x45\x0b\xa7\xf5\xfd\xac\xe9\xb2\
-\xce\x54\x4f\x75\x0f\x68\xcb\xe2\x6f\x6b\x93\x67\x32\x12\x50\xae\
-\x1c\x02\xe0\xdb\x6b\x2e\x73\x29\xfb\xbd\x30\x51\x14\x99\x38\x71\
-\x22\x0d\x1a\x34\x70\x3a\x25\xd4\x2a\x11\xe1\xe9\xe9\xe9\xb0\x94\
-\x86\xb2\xd6\xb3\x2c\x5c\xd0\x01\xbd\xd1\x82\x20\x2a\x09\xf6\x16\
-\xd1\x3c\xd5\x99\xf2\x66\xca\x54\xcc\xc7\x6c\x36\xe3\xef\xef\xcf\
-\xdc\xb9\x73\xb9\x7b\xf7\xae\xd3\xd5\x21\x25\x49\xa2\x7a\xf5\xea\
-\xb6\x68\xbe\x23\x7d\x55\x3e\xbc\x07\x2b\xe6\x3e\x85\xa0\xd4\x12\
-\x10\x54\x70\xb8\x55\x6b\xe8\x5c\x22\xd5\xba\x32\x3f\x8b\x4e\xa7\
-\x63\xf3\xe6\xcd\xe4\xe6\xe6\x3a\xbd\xde\x14\x0a\x05\xde\xde\xde\
-\xa4\xa6\xa6\x3a\x36\x07\xa4\x00\xba\x8d\x99\x41\xb3\xf4\x6c\x04\
-\x8d\x1f\x6e\x80\xa0\x72\xa7\x7e\xbb\xe1\x58\x44\xf7\x32\xef\x69\
-\xf5\xeb\xd7\x67\xc3\x86\x0d\xa4\xa7\xa7\x3b\x2d\x0b\xa0\x54\x2a\
-\x69\xda\xb4\x29\xd7\xae\x5d\xfb\xe7\x4a\x0c\x08\x02\x92\xd9\x8c\
-\x19\x48\xbb\x73\x82\x4f\x56\x7f\x83\xca\xb7\x0b\xbd\x5b\x78\x72\
-\xf0\x4b\x13\x48\x02\xca\x67\x46\x12\x15\xb8\x93\xfd\x3b\xe6\x70\
-\x64\xea\x41\xda\x75\x1a\x48\x93\x43\xdb\x58\x81\xb1\x54\x1d\x09\
-\x8b\x39\x9f\xf3\x27\x4e\x91\x87\x48\xa8\x8f\x8e\xf4\x24\x33\x91\
-\x51\x15\x38\x72\xe1\x20\x3f\x25\xbf\x83\x4e\x01\x86\x9c\x0c\x92\
-\xe2\x13\x51\x29\xcc\x18\xcd\x0a\xfc\x43\x83\xd0\x16\xdb\xae\x82\
-\x0a\xb5\x5b\xf3\x4c\xc4\xc7\x2c\xd9\xff\x90\x2a\x0d\xec\x3f\x7c\
-\xd2\xeb\xf5\x68\x34\x1a\xf4\x7a\x3d\x7d\xfa\xf4\xe1\xe2\xc5\x8b\
-\x4c\x9d\x3a\x95\x29\x53\xa6\xc8\xce\x8f\x4c\x02\x65\xc8\x90\xf1\
-\xbf\x0e\x6b\x01\x8e\xd2\xd2\xd9\xca\x0a\xc7\x9d\x40\x05\xbe\x21\
-\xa1\x7f\x72\xaf\x7d\xbd\x1c\xb3\xcd\xdd\xdd\x9d\xe7\x9f\x7f\xde\
-\xe5\x7d\xe6\x90\xef\xa1\x50\xe2\x57\xae\x12\x45\xe3\x19\x1a\x02\
-\x02\xca\x4e\x01\xad\x45\x3e\x86\x0f\x1f\xee\x32\xbb\xb2\xb2\xb2\
-\x1c\x8a\xba\x01\xa0\xf6\xa4\x7c\xc5\x3f\x14\xa7\x71\x73\x77\x48\
-\x9c\xdb\x62\xb1\x10\x15\x15\x45\xa3\x46\x8d\x5c\x66\x9b\x5e\xaf\
-\x77\xdc\x69\x57\x7a\x52\xb1\x72\x51\xdb\x44\xf7\x00\x1c\x89\x99\
-\x08\x82\x40\xb5\x6a\xd5\xa8\x56\xad\x9a\xcb\x6c\x3b\x7b\xf6\xac\
-\xc3\x73\x52\xd4\x7a\x53\xe1\x4f\x92\x02\x6e\x78\x38\x30\x1f\x25\
-\x49\xa2\x45\x8b\x16\xb4\x68\xd1\xc2\x65\xb6\xc5\xc6\xc6\x3a\xfc\
-\x5d\x95\xd6\x97\xaa\xd5\x7c\xff\x30\x4d\x03\x70\x44\x79\x50\xa5\
-\x52\x31\x60\xc0\x00\x97\xee\x8f\xab\x57\xaf\x76\x90\xc4\xa8\xf0\
-\x0d\x0c\xc5\xb7\x70\xd2\x86\x20\xa2\xd1\x79\x39\xf4\x1c\xc1\xc1\
-\xc1\xb4\x6f\xdf\xde\xa5\x7b\xe4\xdf\x55\xf4\xc5\x3e\xa2\x2a\x71\
-\x73\xcb\x74\xea\x7f\xf3\x1e\x58\xcc\x18\x4d\x0a\x5e\xd9\xf3\x09\
-\x15\xa4\x14\x0c\x66\x09\x8b\xc5\x4c\xb6\xd4\x96\x2f\x3e\x7d\x1e\
-\x9f\x9e\xcb\xe9\x5c\xc5\x1d\x9d\x46\x85\xd2\x92\x07\x54\x46\x00\
-\x24\xc9\x82\x54\x28\x9f\x53\x92\x2c\x58\x2c\x05\x4a\x83\xe6\xdc\
-\x34\x8e\x1f\xff\x05\xca\x8f\x64\xfa\x92\xe9\x8c\xea\x50\x99\xdc\
-\xf8\xaf\xa8\x55\x61\x30\xab\xbf\x8b\xa5\xb5\x37\x5c\xfe\x76\x11\
-\x4d\x76\x7d\x8c\x80\x19\xa3\xb1\x0a\xdf\xe4\xdd\xa4\xbf\xf6\xf7\
-\xb5\x84\xe5\xc9\xbd\x43\x0b\x05\xed\x7a\x87\x33\x6e\x74\x17\x0e\
-\x1e\xbf\x46\xa6\xd9\x3e\x72\xbd\x60\xc1\x02\xde\x79\xe7\x1d\x36\
-\x6d\xda\xc4\x4f\x3f\xfd\xc4\x91\x23\x47\xd0\xe9\x74\xa4\xa4\xa4\
-\x30\x76\xec\x58\xdc\xdd\xdd\x59\xb2\x64\x89\xec\x04\xc9\x24\x50\
-\x86\x0c\x19\xff\xab\xb0\x16\xad\xb8\x7a\xf5\xaa\x2d\x3d\xc8\xd9\
-\xf6\xa2\xa2\xa2\x9c\x76\x02\x9c\x11\x1b\x2f\xec\x70\xeb\xf5\x7a\
-\x0e\x1e\x3c\xe8\xf4\xf3\x58\xdb\xea\xdc\xb9\xb3\xeb\x1d\x1c\x27\
-\x8c\x3d\x74\xe8\x90\x4b\x8a\x8c\xa8\x54\x2a\x2a\x56\xac\xe8\x74\
-\x71\x08\x57\x08\x2e\x5b\xb5\xd4\x4a\xab\x70\x58\x96\xf6\x9a\x36\
-\x6d\xea\xf2\xb5\xe3\xc8\xb0\x49\x92\x44\x62\x62\x22\x57\xae\x5c\
-\x71\xc9\x9c\x54\xa9\x54\x88\xa2\xe8\x64\x5b\x7f\x31\x6a\x65\x1c\
-\x48\x6b\x41\xa6\xe8\xe8\x68\x1e\x3e\x7c\xe8\x74\x14\x48\x92\x24\
-\x2a\x54\xa8\xf0\x7f\xa0\x37\xe7\xd8\x0c\x35\x99\x4c\x9c\x3c\x79\
-\xd2\xa9\xc3\x84\xc2\x7d\xe5\xee\xee\x6e\xab\x34\xea\x4c\x1f\xb9\
-\x62\xbf\x4e\x4f\x4f\xe7\xcc\x99\x33\x4e\x4b\xfb\x58\x6d\xab\x55\
-\xab\xd6\x3f\x36\x0a\xa8\xd0\x78\x52\xa7\x6d\x7f\x7a\x79\xa6\xe3\
-\xa6\x12\x10\xd5\xde\xb4\x7c\x6e\x32\xe3\xba\x85\x42\x9e\x81\x2a\
-\x4f\xf5\x62\x90\x67\x55\x3c\x95\x26\xbc\x7b\x2c\xe3\xc6\xf6\xf2\
-\x4c\x5b\x7a\x80\x74\x55\x28\xa3\x47\x0e\xe0\xb7\xb3\xf7\xd1\xa8\
-\x7d\x68\xd8\x69\x20\xa9\x92\x55\x42\x45\x4b\x9d\xe6\x9d\xe8\x93\
-\x53\x1d\x9d\x4a\xc4\x98\x6d\x22\xb8\x4e\x1b\xc6\x8f\x7c\x99\xe6\
-\x51\x95\x0b\x8e\x55\x42\x7a\x30\x79\x42\x4f\xae\xe4\x3c\x24\xaa\
-\xc7\x10\xfa\x85\x9a\x51\xab\x45\x04\xc9\x48\x5e\x6e\x28\x15\x6d\
-\xdb\xae\x8a\xaa\x8d\x9a\xd2\x2b\x0b\x54\x1a\x0f\xda\x0d\xe8\x8a\
-\x32\xd2\x0d\x50\x53\xad\xf7\x44\x26\x4e\xc9\xe5\x9a\xae\x2e\x5a\
-\x65\xe9\xe3\x1e\x1f\x1f\x8f\xc1\x60\x20\x36\x36\x96\xfb\xf7\xef\
-\x03\x05\xe9\xcd\x6b\xd7\xae\x05\xa0\x41\x83\x06\xb2\x03\x24\x93\
-\x40\x19\x32\x64\xfc\x4f\x6f\x3e\x4a\x25\xb7\x6f\xdf\x66\xe0\xc0\
-\x81\x24\x26\x26\x3a\x55\x31\x4c\x92\x24\xd2\xd3\xd3\x6d\x95\xfc\
-\x1c\x83\x9e\xdb\xd7\xcf\x73\xf3\x81\x91\xa8\xa6\x4f\x11\xea\xab\
-\x25\xfb\x71\x1c\x0f\x2c\x5a\xaa\x84\x04\xa0\x12\xed\x77\x7a\xd4\
-\x6a\x35\xd1\xd1\xd1\x74\xea\xd4\x09\x1f\x1f\x1f\xa7\x1c\x26\xab\
-\x6d\xe7\xcf\x9f\x77\x5c\x2c\xde\x64\xe4\xe1\xcd\xf3\xdc\x48\x92\
-\xa8\xdd\x20\x8a\x60\x2f\x1d\xe4\x3e\xe2\xe8\xa5\x6c\xda\x3c\x5d\
-\x36\xed\x30\x41\x10\xf8\xf9\xe7\x9f\xe9\xd8\xb1\x23\x1e\x1e\x1e\
-\x4e\x89\xbc\x9b\x4c\x26\xcc\x66\x33\x2b\x56\xac\x40\xa7\xd3\x39\
-\x66\x9b\x25\x93\x1b\xe7\xcf\x11\x9b\xef\x4f\xb3\xe6\xf5\xf1\x56\
-\x4a\x24\xdf\xbd\x45\xb2\xda\x8b\x2a\x15\x42\xec\x8a\x08\x5a\x7f\
-\x57\xa9\x54\xf2\xc9\x27\x9f\xf0\xe9\xa7\x9f\x16\x5b\x35\xd1\x5e\
-\xe4\xe6\xe6\xa2\xd7\xeb\x49\x4c\x4c\x74\xb8\x0d\x8b\x39\x93\xab\
-\x67\xce\x93\xa5\x2d\x4f\xcd\x3a\xd5\xf0\x53\x43\xda\xf5\x23\xdc\
-\xf4\x6a\x47\xb3\x32\xea\xcd\x59\x2c\x16\xe6\xcd\x9b\xc7\xe2\xc5\
-\x8b\x9d\x9a\x93\x82\x20\x90\x93\x93\x83\x5a\xad\xe6\xeb\xaf\xbf\
-\x76\xbc\x22\xa7\x3e\x8d\x8b\x67\xcf\x91\xe1\x16\x46\xb3\x46\xd5\
-\xd0\x5a\xf4\xc4\xdd\xb9\x89\x51\x17\x4e\xe5\x0a\xf6\xcb\x8e\x28\
-\x14\x0a\x52\x52\x52\x18\x3f\x7e\x3c\x87\x0f\x1f\x76\x6a\xdc\xac\
-\x6b\xad\x53\xa7\x4e\x4e\x95\xb0\xcf\x49\xbe\xcb\xf1\xcb\x89\x34\
-\x7e\xfa\x29\x02\x74\x02\x90\xcd\xe5\x9f\xae\x12\xda\xb6\x39\x81\
-\x65\xec\xeb\xbc\xbc\x3c\xba\x74\xe9\x42\x5e\x5e\x9e\xc3\x7a\xa3\
-\xd6\xb6\xd2\xd2\xd2\xa8\x56\xad\x1a\x73\xe7\xce\x75\x90\x2c\x99\
-\x48\x8e\xbb\xc9\xb5\xeb\xf7\xd0\x95\xab\x49\xc3\xfa\xe1\x28\xcc\
-\xb9\xc4\x5e\xbb\x8e\x57\x8d\xa6\xf8\x97\x21\xb1\x40\xa3\xd1\x70\
-\xee\xdc\x39\x66\xcd\x9a\x45\x56\x56\x56\xa9\x72\x3e\xa5\xcd\xed\
-\x8c\x8c\x0c\xfe\xfd\xef\x7f\x63\x34\x1a\xff\x91\x5a\x81\x0a\xaf\
-\x60\x06\x4e\xff\x8c\x81\x7f\xf5\x1f\x75\xe1\x74\x18\xbd\x98\x0e\
-\x85\xfe\x54\xbd\xcf\x74\x76\xf6\x99\xfe\xfb\x1f\x9e\x7c\x71\xe8\
-\xcc\x75\x0c\x05\x2c\x92\x84\x88\x17\x7d\xa7\xcc\xa3\xaf\xad\x53\
-\xc3\x79\xff\xb3\xad\x7f\xf8\x61\x0f\x5e\x5b\xba\xeb\xc9\x87\xbe\
-\x74\x2d\x7e\x44\xe8\x38\xe2\x6d\x3a\x8e\x28\xf8\xf4\xd6\xaa\xbd\
-\xb6\x03\x27\x54\x61\xbc\xf8\xef\x65\xc5\x7e\xb3\x7b\xf7\xee\x45\
-\xe6\x53\x8b\x16\x2d\x58\xba\x74\x29\xfd\xfb\xf7\xe7\xf5\xd7\x5f\
-\x97\x9d\x1d\x99\x04\xca\x90\x21\x43\xc6\xef\xb0\x4a\x46\x58\x2c\
-\x16\x14\x0a\x05\xb3\x67\xcf\xa6\x6d\xdb\xb6\x4e\x39\xdc\x2f\xbe\
-\xf8\x22\xf9\xf9\xf9\xb6\x4a\x81\xf6\x3a\x15\xd6\x53\xed\x9c\xab\
-\x7b\x99\x3a\xfb\x47\xaa\x84\x2b\x38\x74\x25\x91\x45\x53\x9f\xe5\
-\xc0\xea\x0f\xd9\x1f\xd0\x96\x0f\xc7\xf4\xc1\xdb\xce\x80\xc7\x1f\
-\x49\xe8\xce\x9d\x3b\x8b\x48\x64\x94\x05\xa2\x28\x92\x97\x97\x47\
-\xcf\x9e\x3d\x8b\x10\x95\x32\xba\xb6\x24\xc7\xfe\xc2\xa2\xf7\xe6\
-\x73\xd7\xec\x4d\xf3\x7f\xbd\xc0\x2b\xfd\x5a\x12\xfd\xed\x07\x3c\
-\xfb\x79\x45\x12\x8f\xbe\x55\x26\xe2\x6e\x25\x6f\xc1\xc1\xc1\x7c\
-\xf2\xc9\x27\x44\x46\x46\x3a\x1c\x35\x79\xf8\xf0\x21\xcf\x3f\xff\
-\xbc\x2d\xa5\x4f\xa7\xd3\x95\xd9\x81\x7b\xb8\x7b\x29\xaf\x7f\x73\
-\x8f\x0a\xa6\x24\x8e\x64\x7c\xc2\xbc\x1e\x1e\xac\x9f\xf7\x3e\x77\
-\x1a\x0c\x60\xee\xb8\x3e\x78\xdb\xd1\x86\x4e\xa7\xb3\xd9\x66\x36\
-\x9b\xf1\xf2\xf2\xe2\xf8\xf1\xe3\x64\x65\x65\x39\x2c\x16\xbf\x63\
-\xc7\x0e\xe6\xcc\x99\x63\x1b\xb7\xc2\x92\x28\xf6\xe2\xfe\xe1\x25\
-\xbc\x36\xeb\x12\xfe\x35\xaa\xe1\xd3\x72\x2c\x1f\xf5\xf5\x60\xde\
-\xf3\xdd\xb8\x3b\x35\x97\x6f\x2a\xda\xf7\x5c\xee\xee\xee\x36\x1b\
-\xcc\x66\x33\x4d\x9b\x36\x65\xc5\x8a\x15\xa5\xea\x4c\x96\x34\xbf\
-\xd7\xad\x5b\x57\xe4\x4e\x68\xd9\x0f\x5e\x32\xb8\xb4\x65\x16\x2b\
-\xce\xa6\x92\x75\xf5\x26\xe7\x97\x1d\xe1\xb5\xa0\x73\xfc\x7b\xea\
-\xfb\xd4\x1a\xb6\x8c\xd7\xec\x24\x81\x85\x65\x06\xf2\xf3\xf3\x69\
-\xd7\xae\x1d\x8b\x17\x2f\x46\xaf\xd7\x97\x79\xdc\xac\xc5\x7b\xe6\
-\xce\x9d\x5b\xe4\x3e\x68\xd9\x35\x15\x0d\xec\x9d\xf5\x02\x5f\xa6\
-\x55\xe1\x44\xac\x92\x59\xa3\x1a\x93\x7c\x7e\x3d\x23\x06\xef\x60\
-\xc9\xa3\x1f\xb1\x77\x97\xd3\x68\x34\x36\x1b\x04\x41\xa0\x67\xcf\
-\x9e\xcc\x9f\x3f\xdf\x56\x48\xa9\xac\xf0\xf0\xf0\x28\x52\xc1\xd5\
-\x7a\xaf\xb3\x4c\xbc\xfd\xd1\x65\x3e\x9a\xb5\x84\x04\x3c\xc8\xbc\
-\xb3\x92\x71\x5b\x76\x50\xf9\xea\x5a\x5e\x9b\xbb\x8f\x19\xdb\xf6\
-\xda\x4d\x02\xad\xbf\x6b\x7d\x07\x7c\xf0\xc1\x07\xb4\x69\xd3\xc6\
-\xa1\xb5\x66\xd5\xf9\x1c\x3e\x7c\xb8\xed\x7e\xea\x3f\x55\x30\xde\
-\x95\x10\xff\x43\x36\x3a\xf2\x33\xc7\x8f\x1f\xa7\x7b\xf7\xee\x44\
-\x44\x44\xc8\xce\x8e\x4c\x02\x65\xc8\x90\xf1\xbf\x8a\x23\x47\x8e\
-\x70\xea\xd4\xa9\x22\x0e\xb0\x20\x08\xc4\xc6\xc6\xa2\xd1\x68\x90\
-\x24\x09\x2f\x2f\x2f\x9a\x36\x6d\x4a\x93\x26\x4d\x1c\xfe\x9d\xfc\
-\xfc\x7c\x6a\xd7\xae\x8d\xc1\x60\xb0\x55\xc1\x9b\x3f\x7f\x7e\xa9\
-\x84\xa9\x4e\x9d\x3a\x74\xe9\xd2\x05\x80\x94\x4c\x77\x5e\x5e\xb9\
-\x9c\xb6\x9e\x37\x98\xfc\xda\x16\x1e\xc7\x55\xe7\xca\xf5\xfb\xb8\
-\xf7\xf6\x45\x21\x16\x54\x8c\xdc\xb4\x69\x53\x89\x27\xf1\x0a\x85\
-\x82\x93\x27\x4f\x12\x1a\x1a\x6a\xfb\x5b\xf3\xe6\xcd\x9d\x8a\x96\
-\x49\x92\x54\x84\xd0\x46\x47\x47\xf3\xf1\xc7\x1f\x97\x78\x87\x4e\
-\x92\x24\xfa\xf5\xeb\x4b\x95\x2a\x91\x80\x80\xbb\x7f\x20\x1d\x27\
-\xad\xa4\x89\xf2\x34\x8b\xee\x80\xe1\xf1\x71\xf6\x5c\xcb\xa2\x66\
-\x50\x01\x45\xba\x7a\xe5\x0a\x07\x7e\xf8\xa1\x54\x62\xf3\xeb\xaf\
-\xbf\xa2\x54\x2a\x31\x9b\xcd\x94\x2b\x57\x8e\xa7\x9f\x7e\x9a\x0a\
-\x15\x2a\x38\x6c\x5b\x72\x72\x32\x1e\x1e\x1e\x58\x2c\x16\xb4\x5a\
-\x2d\x3b\x77\xee\x2c\x52\xa2\xbf\x38\x12\xd2\xa7\x4f\x5f\x2a\x55\
-\x2a\x08\x85\x25\xe4\x55\x61\xee\xc6\xe9\xd4\x38\xf8\x2e\xed\x8e\
-\xc7\xa1\x7f\x4a\x43\xdc\xc3\x0c\x82\x3b\xb8\xa1\x04\x4e\x9c\x38\
-\xc1\x89\x13\x27\x8a\x9d\x0b\x82\x20\xd8\xe4\x2e\x14\x0a\x05\x26\
-\x93\x89\x4a\x95\x2a\x51\xb3\x66\x4d\xa7\xe6\x7e\x4c\x4c\x8c\xcd\
-\xd9\x55\xa9\x54\xec\xd9\xb3\x87\x8c\x8c\x8c\x62\xc7\xcd\x6c\x36\
-\x13\x12\x12\x42\xcf\x1e\x7d\xf0\xf3\x2f\x18\x17\xc1\x14\xc0\xbb\
-\xdf\x7c\x47\xf6\xee\x25\xbc\x71\xea\x36\xfb\xa4\x47\x04\xd5\xa8\
-\xc2\x63\xc1\x0c\x28\x38\x79\xf2\x14\x47\x8e\x1c\x29\xd6\x99\x17\
-\x45\x91\xb4\xb4\x34\x5b\x65\x52\x49\x92\x08\x09\x09\xa1\x61\xc3\
-\x86\x4e\xd9\x56\xa7\x4e\x1d\x9b\x3c\x84\x24\x49\x6c\xdd\xba\x95\
-\xff\xc7\xde\x79\x87\x47\x55\x6d\x7f\xff\x73\xa6\x25\x99\x4c\x3a\
-\x49\x48\x20\x04\x12\x20\xf4\x80\xf4\x5e\xa5\x29\x55\x40\x3a\x48\
-\x47\x10\x11\x04\x04\x45\x44\x50\x04\x41\x01\x11\x04\x41\xe1\x52\
-\x55\x8a\x48\x6f\x82\x54\xe9\xbd\x86\x92\x84\x90\x46\x42\x7a\xa6\
-\xcf\xbc\x7f\x70\x67\x6e\xa2\xa6\xcc\x99\xdc\x57\xfc\xdd\xf3\x7d\
-\x1e\x9e\x07\x46\xcf\x3e\x7b\xed\xb5\xf7\x3e\xeb\xbb\xd7\xda\x6b\
-\xdd\xbd\x7b\xb7\xd0\x3a\x81\x41\x41\x41\x0c\x1c\x38\xf0\xdf\x06\
-\xba\x05\xbd\x47\x6d\xe6\xaf\x18\x44\xf2\xf4\x48\xc6\x9c\x4a\xe7\
-\xe5\xb2\xc7\x31\x95\x89\x20\x40\xf1\x9c\x98\x7e\xff\xfd\xf7\xa4\
-\xa4\xa4\x14\x6a\xd0\x27\x25\x25\xd9\x75\xa8\xd3\xe9\xe8\xd8\xb1\
-\x23\x91\x91\x91\x4e\xc9\xb6\x73\xe7\x4e\xae\x5c\xb9\x62\x5f\xcf\
-\x0b\x17\x2e\xb4\xef\x55\x7f\x05\x93\xc9\x44\xed\xda\x91\x74\xec\
-\x68\xf3\xb1\x98\xf0\xac\x3c\x98\x6f\xdb\xf9\xf2\xce\x57\x77\x30\
-\xe5\xf8\xb1\xf5\xaa\x85\xda\xe1\x9e\x60\x01\x93\x51\xcf\x8e\x5f\
-\x7e\x21\x2a\x2a\xaa\x40\xf2\xac\x52\xa9\x38\x76\xec\x98\x7d\x3c\
-\x65\x32\x19\xe5\xca\x95\x73\xfa\x3e\xa7\x8d\xd0\xe6\xad\x13\x18\
-\x1c\x1c\x5c\xcf\x5e\x35\xb1\x00\x00\x20\x00\x49\x44\x41\x54\xe0\
-\x9e\xa6\xd5\x6a\xe9\xd0\xa1\x3d\x0d\x1a\x34\x7c\x6e\x30\x5a\x5c\
-\x68\x30\xf8\x5d\xba\x37\x8d\x64\xe7\xe8\xfa\x5c\x3d\x79\x86\x63\
-\xa7\x92\xa8\xdb\x28\x1c\xc1\x02\x66\x83\x8e\x95\xab\xbf\x2b\x32\
-\x13\xee\xd5\xab\x57\xed\xdf\x04\x41\x10\x68\xd8\xb0\xa1\x53\x61\
-\xd3\xa9\xa9\xa9\x44\x44\x44\x60\x34\x1a\xed\xd7\x0c\xbe\xf8\xe2\
-\x8b\x7c\x72\x59\x2c\x16\x4a\x95\x2a\x45\xdf\xbe\x7d\x9d\xf2\x3a\
-\x4a\x28\x1a\xef\xbe\xfb\xae\x54\x0b\x50\x22\x81\x12\x24\x48\xf8\
-\x5f\x47\x48\x48\x08\x0d\x1a\x34\x40\xa9\x54\xda\x8d\x28\x99\x4c\
-\x66\x27\x12\x36\xc3\x54\xa7\xd3\x39\xf5\x1e\xa3\xd1\x68\x4f\xf1\
-\x6f\xb5\x5a\xd1\x68\x34\x44\x46\x46\x16\x1a\x62\x28\x08\x02\xa1\
-\xa1\xa1\xec\xda\xbe\x85\x39\xeb\xaf\xb3\xe1\x9b\xd9\xb4\xca\xde\
-\x49\xdf\xd7\x56\xd1\xe5\xc3\x4f\xb9\x72\xf4\x30\x81\x4d\x5e\xa7\
-\x4c\x79\x5f\x14\xc2\x73\xef\xe5\x4b\x2f\xbd\x54\x68\x7b\x82\x20\
-\x70\xec\xd8\xb1\x3f\x11\x54\x67\x48\xa0\x5e\xaf\xcf\xf7\x4e\x2f\
-\x2f\x2f\xea\xd4\xa9\x53\xa8\x27\xc7\x6a\xb5\xe2\x1f\x54\x8e\x9b\
-\x6b\x46\xb3\x72\xdd\x45\x92\xda\x4d\x65\xe5\x90\x50\xe6\xcc\x3d\
-\x4c\xe7\x77\xc7\xf3\xc3\xfc\x6f\xe9\x34\x71\x14\x17\x67\xde\x05\
-\xc0\xaf\x54\xa9\x42\x93\xa1\xd8\x64\xf3\xf6\xf6\xb6\xa7\x95\x37\
-\x9b\xcd\x4e\x67\xd0\xb4\xa5\xc1\xb7\xb5\x17\x12\x12\x52\x64\x52\
-\x16\xb9\x42\x81\x8f\x3b\x5c\x5d\x35\x86\xb7\xd6\x3f\x65\xe6\xb7\
-\x6b\xa9\x7b\x7a\x05\xaf\x2d\x4f\x62\xfe\x97\x95\x39\x7b\x70\x39\
-\xd5\x5a\xf6\x40\xe6\xfd\xdc\xc8\x2c\x53\xa6\x0c\xf5\xeb\xd7\xb7\
-\x17\x82\xff\x2b\xd9\x9e\x3d\x7b\x86\x46\xa3\xb1\x7b\x85\x4b\xe2\
-\x3e\x98\xc1\x60\xb0\xbf\xcf\x62\xb1\x50\xae\x5c\x39\x1a\x37\x6e\
-\x5c\xe0\xfd\x27\xab\xd5\x8a\x87\xa7\x1f\xbe\x7e\x59\xcc\xed\xd2\
-\x85\xdd\x7e\x9d\x39\xb6\xe6\x3d\xd2\x0e\x2c\xe5\x87\xbb\x02\xf3\
-\xfa\xe4\x72\x3f\xb9\x06\xfd\x1b\x97\xe5\x8a\x42\x01\x58\x09\x0e\
-\x0e\xa6\x61\xc3\x86\xf9\xd6\x57\xbe\x0f\xbc\x42\x41\x5c\x5c\x9c\
-\x9d\x00\xdb\x4a\x03\x94\x84\x6c\xb6\x3e\x03\x54\xab\x56\x8d\x06\
-\x0d\x1a\x14\x38\x1f\xac\x56\x2b\x5e\x5e\x5e\x60\xc8\xe4\xf8\x97\
-\x6f\xf0\xde\xf1\x10\x16\xae\x59\xc4\xad\x6f\x67\xf0\x79\xe6\x50\
-\x16\xb6\x7b\xc8\x85\xa3\xa5\xe9\xdf\xc1\x87\x64\xf3\x73\xd2\x57\
-\xbd\x7a\xf5\x42\xef\x8a\x09\x82\x40\x74\x74\xb4\xbd\x0f\x36\x22\
-\xe8\xac\x5c\x79\x65\xb0\x58\x2c\x54\xaf\x5e\x1d\x5f\x5f\xdf\x02\
-\xc7\xcd\x62\xb1\x50\xa6\x6c\x79\x30\xde\xe2\xad\x1e\xa3\xb9\xd7\
-\x60\x0e\xbb\xdf\xee\xc0\xb0\xe1\x93\x19\x3e\xef\x2b\xce\x1c\xfd\
-\x8d\x86\x9d\x5a\x93\xf5\xf3\x05\xdc\x64\xcf\x75\x52\xb9\x72\x65\
-\x7c\x7c\x7c\x0a\x2c\x1d\xe3\xe9\xe9\xc9\xc3\x87\x0f\xf3\x11\xe0\
-\x92\xd0\x9b\x6d\x7e\xdb\x4a\x6a\xd4\xac\x59\x93\x8a\x15\x2b\xfe\
-\xa5\xde\x04\x41\xc0\x60\x30\x50\x3a\x28\x94\xa7\x0f\xb6\xd0\xbb\
-\xcf\x6a\x5e\x9d\xbf\x99\x77\xdb\x65\xb3\x7a\x4a\x5f\xce\x04\x8f\
-\xa1\xee\xc3\x13\x34\x1f\x33\x09\xe5\xde\x99\x98\x85\xe7\x6b\x33\
-\x32\x32\xb2\xd0\x7d\x41\xa9\x54\x92\x9e\x9e\xce\xb9\x73\xe7\xf2\
-\xed\x91\xce\xea\x2d\x6f\xc9\x12\x85\x42\x41\x8b\x16\x2d\xc8\xca\
-\xca\xca\x27\xbb\xbb\xbb\xbb\xf8\xf0\x65\x09\xc5\x46\x68\x68\xa8\
-\x34\x08\x12\x09\x94\x20\x41\xc2\xff\x3a\x2a\x56\xac\x48\xc5\x8a\
-\x15\xff\x6c\xc8\xff\xdb\xe3\x92\x97\xc0\x39\x63\x78\xcb\x64\x32\
-\x7b\x08\x98\xc5\x62\xc1\xd7\xd7\x97\x96\x2d\x5b\x16\xeb\xc4\x57\
-\x86\x85\x0f\x4b\xd5\xa0\x74\xc6\x61\xfa\xce\x3d\xcb\x8c\xdd\x3b\
-\xa9\xaa\x7b\xca\xe7\x6b\xf7\xb3\xf3\xc6\x53\xe2\xbf\x0e\xa4\xf4\
-\xd1\x2d\x74\x0d\xf6\x2e\x56\xc8\xea\xf6\xed\xdb\x79\xf2\xe4\x49\
-\x3e\xe3\xcd\x16\xf6\xe4\x28\xe4\x72\x39\x66\xb3\x39\x9f\xa1\xe8\
-\xef\xef\x4f\x8b\x16\x2d\x8a\xf5\x7c\xd9\xe6\x83\x19\x10\xd4\x99\
-\x54\x99\x95\xe5\x8b\x7f\xa4\xcd\x84\xcf\x69\x1b\x11\xcd\x5b\xf7\
-\xa3\xd8\xf5\xe6\x34\x4e\x5f\x33\xf0\xf5\x81\x0e\x8c\xeb\x10\x92\
-\xcf\x7b\x59\x10\x02\x03\x03\xc9\xc8\xc8\xb0\x93\x09\x9b\x4c\x62\
-\xeb\xb2\x19\x8d\x46\x7b\x2d\x3d\x93\xc9\x44\xb5\x6a\xd5\x68\xd5\
-\xaa\x55\xd1\xe1\x5c\x56\x03\x21\x2d\x07\xf1\x41\x25\x25\xe5\xef\
-\x2f\x67\xf4\x1e\x15\xab\x37\x2f\xa7\x94\xe9\x31\xef\x6d\xfe\x99\
-\x5f\x63\x0d\xe4\xa8\x6b\x11\x51\xa3\x26\xcd\x2a\x54\x28\x32\x2c\
-\x29\x21\x21\xc1\x7e\x97\x4c\x10\x04\x7b\xc8\x9d\xcd\xb0\x14\xa3\
-\x37\xa3\xd1\x98\x8f\xe0\x46\x44\x44\x14\xd3\xdb\xa1\xa7\xcb\x84\
-\x29\xd4\xd6\x54\x26\xeb\xea\x1a\x56\xed\x35\xf0\xf1\xb2\x77\xf1\
-\x38\xf7\x2d\x1b\xb7\x6e\x60\xcf\xad\x73\x3c\x08\x7e\x8b\xa8\x97\
-\xbf\xa2\x52\x31\x64\x7b\xf4\xe8\x51\xbe\x43\x08\x9b\xce\xc4\x86\
-\x83\xca\xe5\xf2\x7c\x07\x2e\x82\x20\x10\x11\x11\x51\xbc\xcc\x9c\
-\x66\x03\x95\x5f\x19\xcf\xac\x46\x0a\x64\x47\xe7\xf0\x4b\xce\x4b\
-\xfc\x6b\x49\x2f\xb8\xfe\x25\xef\xad\xd9\xca\x33\x7d\x2a\x55\xda\
-\x5a\xe9\xdc\x21\xac\x58\x63\x75\xeb\xd6\x2d\x7b\x3f\x64\x32\x99\
-\xdd\xe8\x17\xa3\x37\xdb\x1c\xcc\x4b\x60\xac\x56\x2b\x2d\x5a\xb4\
-\xc0\xc7\xa7\x18\x25\x39\xac\x19\xf4\x7f\x6b\x0a\xda\x0a\x35\xb9\
-\xb2\x65\x26\x13\xd6\x6c\xa0\xbe\x97\x9e\xed\x07\xce\xb3\x74\xf5\
-\x12\xae\x9f\xbe\xcb\xa6\xa1\xdf\x72\x7a\xd5\xb0\x62\x79\x2b\xcf\
-\x9c\x39\x63\x97\xc1\x16\x2e\xed\xec\x9c\xcc\x2b\x97\x5a\xad\xa6\
-\x76\xed\xda\xc5\xea\x8b\x36\xb3\x01\xd3\x66\x79\x13\x12\x92\xc8\
-\x82\x49\x2b\xd0\xbd\x34\x89\x15\x03\x1b\xf0\xdd\x3b\xdd\x59\xf0\
-\xd6\x6f\x3c\x4b\x88\x67\x40\xf9\x5b\x34\xe8\x56\xad\x58\xf3\x20\
-\x2e\x2e\x8e\xcd\x9b\x37\xe7\x23\x71\x62\xf7\x7f\x5b\x92\xa2\x9c\
-\x9c\x1c\xfb\xb8\xb8\xb8\xb8\x50\xaf\x5e\x3d\xe9\x03\x2c\x41\x82\
-\x44\x02\x25\x48\x90\xf0\xa2\xe1\x8f\xa7\xf7\xe3\xc6\x8d\x13\x5d\
-\x2c\xd8\x66\xd0\xde\xba\x75\xcb\x1e\xda\x99\xf7\x1d\x45\x21\xb4\
-\x42\x38\xa1\x15\xe0\xd8\xd2\xaf\xb9\x78\xf3\x3a\x53\xba\xb4\x27\
-\xb8\xc9\x10\xbe\xff\xfe\x20\x83\x8e\xfc\xcc\x0f\xe6\xd2\xb4\x0e\
-\xf0\x72\x58\x36\x1b\x5a\xb5\x6a\xe5\x74\xb1\xf8\xc4\xc4\xc4\x7c\
-\x06\x61\x71\xe1\x55\xb9\x29\x0d\x2b\x99\xb9\xb9\x77\x21\x43\x37\
-\xee\xa4\xf2\xd9\x33\xec\xe8\xfb\x31\x8b\x77\xec\x46\xc3\x71\xda\
-\xf5\xbc\xc2\xb8\x0e\x21\x0e\xcb\xa6\x54\x2a\xb9\x7d\xfb\x36\x5d\
-\xba\x74\x11\x7d\xdf\x11\x9e\x7b\x00\xf2\x1a\xb5\xc5\x6e\x47\x50\
-\xe1\x1b\xd1\x94\xf6\x11\x26\x16\xf7\x9a\xc6\x95\x27\x02\xfd\xda\
-\xfd\x40\xd9\x5e\x4b\x59\xb7\xfb\x12\xe7\x57\xaf\xe1\x84\x6f\x69\
-\x6a\x96\xf1\x2d\x76\x3e\xc6\xbc\x77\x2e\x13\x12\x12\x68\xd4\xa8\
-\x91\x68\x4f\xa7\x20\x08\x24\x25\x25\xe5\x33\x4c\x8b\x0f\x17\x22\
-\x5f\xee\x42\x24\xb0\xb6\x47\x23\xbe\xbb\x59\x8b\xfb\x1d\xce\xe3\
-\xd9\x74\x2c\xcb\x37\x8d\x44\xb1\xbc\x19\x6f\x04\x7e\x45\x25\x8d\
-\xe3\x6b\x4d\x26\x93\x71\xe4\xc8\x11\xbb\xb7\x55\x2c\x09\x8c\x8d\
-\x8d\x15\x75\xc7\x11\xb9\x8a\xd2\x35\xdb\x50\xfa\xe9\xaf\xcc\xfe\
-\x60\x35\xbb\x74\xe5\x39\xf9\xc3\x67\x34\x99\xbc\x87\x43\xe7\x86\
-\xb0\x63\xd3\x4a\x92\x69\x85\xaf\xda\xf1\x8c\xa3\x6a\xb5\x9a\xd5\
-\xab\x57\x73\xe6\xcc\x19\xd1\x84\xc2\x62\xb1\x10\x15\x15\x45\xd3\
-\xa6\x4d\x1d\x1f\x1b\xc1\x8b\xc6\x1d\xba\x02\xc7\x69\x18\xb1\x02\
-\xd7\xed\x8f\x79\xa9\xfd\x48\xe6\x4f\xfe\x84\x9e\xe3\x0d\x7c\xd4\
-\xaa\x1f\x6d\xd6\x8e\xc4\x4d\xc4\x3e\x62\x32\x99\xd8\xb4\x69\x13\
-\x97\x2e\x5d\x72\xaa\x58\xfc\x83\x07\x0f\x08\x0b\x0b\x73\xf8\x59\
-\x37\xcf\x30\x3a\x75\x0d\xe3\xfe\x81\x7f\xf1\xd3\xce\xed\x68\xcf\
-\xde\xe5\xc0\x1a\x25\xd3\x97\xfd\xc2\xc1\xd0\x74\x76\x2c\x9a\x4c\
-\x40\xe3\x6a\xa2\xf6\x48\x41\x10\xec\xfb\xbf\xd8\x3d\xd2\x60\x30\
-\x70\xe3\xc6\x8d\x12\x2d\xa5\x21\xe1\xef\xc3\xff\xc2\x9d\x4e\x89\
-\x04\x4a\x90\x20\xe1\x7f\x9e\x08\x7a\x79\x79\xd1\xac\x59\x33\x1e\
-\x3f\x7e\xec\x74\x89\x80\x96\x2d\x5b\x52\xa9\x52\x25\xfb\x7d\x1e\
-\xc7\x3a\x03\xad\x26\xac\x20\x6a\x42\xbe\x0e\x12\xd2\xb6\x3b\x62\
-\x72\x9b\xd9\x92\x8b\x34\x6e\xdc\x18\x57\x57\x57\xa7\xd2\x96\x0b\
-\x82\x40\xad\x5a\xb5\xec\x99\x01\x1d\xfe\x40\x0a\x72\xaa\xbf\x32\
-\x8d\xe4\xe4\x69\x7f\xf8\x0f\x2d\x38\xfc\x4b\x0b\x51\xe5\x06\x02\
-\x03\x03\x45\x27\x72\xc8\x47\x52\xbd\xbc\x08\x0f\x0f\xa7\x74\xe9\
-\xd2\xa2\x0c\x77\xab\x55\xc1\xc4\xad\x47\x99\x98\x5f\x6d\xd4\x1f\
-\x31\x9c\xfa\x22\xe7\x64\xd5\xaa\x55\x69\xd7\xae\x1d\x46\xa3\xd1\
-\xa9\x42\xef\x9e\x9e\x9e\x54\xae\x5c\xd9\xa9\xf0\xb3\xa1\x3b\xd2\
-\x18\xfa\xc7\x1f\xdf\x3e\xc9\x4e\xc4\x15\x1c\xa8\x51\xa3\x06\xf5\
-\xea\xd5\x13\x47\xe0\xfe\xd0\x8e\x5a\xad\x2e\xf4\xae\x5c\xa1\xe3\
-\xec\xdf\x86\x59\x27\x9f\x30\x2b\xff\x12\xa4\x47\xff\xe9\xa2\x74\
-\xa6\x52\xa9\x68\xd2\xa4\x09\x72\xb9\xdc\xa9\x8c\xae\x82\x20\x50\
-\xa7\x4e\x1d\xea\xd7\xaf\xef\x44\x08\x77\x0b\xce\xe6\x1d\x13\x2b\
-\x58\x51\xf1\xd1\xb1\x6d\xa2\x5a\x93\xcb\xe5\xb4\x6b\xd7\x8e\xac\
-\xac\x2c\x7b\xf2\x24\xb1\x68\xd1\xa2\x05\xa1\xa1\xa1\xa2\x12\xe7\
-\x00\x54\xec\x30\x98\xf3\x0f\xfe\x58\x1f\x34\x80\x9e\xb3\xd6\x3b\
-\x3c\x23\x6d\x77\xf4\x5a\xb7\x6e\xcd\xd3\xa7\x4f\x9d\xfe\x9e\xb4\
-\x69\xd3\x86\xca\x95\x2b\x73\xf9\xf2\xe5\x17\xe2\xfb\xa6\xd5\x6a\
-\x89\x8f\x8f\x17\x5f\xff\xf4\x7f\x18\x26\x93\x29\x5f\x28\xaf\x04\
-\x89\x04\x4a\x90\x20\xe1\xff\xe0\x46\x1f\x11\x11\xc1\xc6\x8d\x1b\
-\x4b\xb4\xdd\x0d\x1b\x36\x88\xb0\xfe\xfe\xd2\x22\x14\xdd\x07\xa3\
-\xd1\x48\xc5\x8a\x15\x39\x7d\xfa\x74\x89\xca\xe6\x8c\x81\x5b\xb0\
-\xe1\xeb\xb8\xd1\x1d\x16\x16\xf6\xa7\xbb\x8f\xce\xc0\x60\x30\xb0\
-\x70\xe1\x42\x11\x21\x7c\x25\xaa\x36\x8c\x46\x23\x6f\xbe\xf9\x26\
-\x6f\xbe\xf9\x66\x89\xc9\x56\x12\xf5\xdd\x8a\x3b\x65\x8b\x22\x38\
-\xc3\x87\x0f\x67\xf8\xf0\xe1\x25\xd6\x87\xcb\x97\x2f\x8b\x32\x72\
-\x85\x12\x90\x27\xef\x81\x8b\x46\xa3\x61\xe2\xc4\x89\x25\x3a\xbe\
-\x79\xc3\x15\x9d\x55\x94\xe0\xc4\x7a\x77\x77\x77\x67\xe7\xce\x9d\
-\x25\x2a\xdb\xd7\x5f\x7f\xfd\xb7\xcf\x48\xad\x56\x4b\x83\x06\x0d\
-\x18\x38\x70\x60\x89\xf6\x62\xfb\xf6\xed\x7f\x6b\xad\x40\x8b\xc5\
-\x82\x42\xa1\xe0\xc4\x89\x13\x94\x29\x53\x46\xfa\xd0\x4b\x90\x48\
-\xa0\x04\x09\x12\x24\xfc\x11\xb6\xcc\x85\x77\xef\xde\x15\x9d\x8a\
-\xff\x8f\xed\xd5\xab\x57\xef\x85\xb8\xf8\x2f\x93\xc9\xc8\xc8\xc8\
-\xe0\xc8\x91\x23\xa2\x43\x41\xf3\x1a\xef\xb6\xcc\x87\x2f\x4a\x98\
-\x8c\xd5\x6a\x65\xdf\xbe\x7d\x25\xd2\x96\x4a\xa5\xa2\x42\x85\x0a\
-\x4e\x25\xcf\x29\x49\xbd\xdd\xba\x75\x8b\xd8\xd8\xd8\x12\x21\xdc\
-\x32\x99\x8c\xe6\xcd\x9b\xbf\x30\x3a\x8b\x89\x89\xe1\xfa\xf5\xeb\
-\x25\x52\x2c\x5e\xa1\x50\xe0\xee\xee\xee\x74\x5b\xce\x1f\x62\x3c\
-\xbf\xcb\x77\xed\xda\x35\xe2\xe3\xe3\x9d\xd6\x9b\xd5\x6a\xa5\x5c\
-\xb9\x72\x25\x92\x88\xa5\x24\x64\x33\x1a\x8d\xfc\xfa\xeb\xaf\x7f\
-\x4a\x10\x25\xb6\x3d\x77\x77\x77\xa7\xbc\x89\x25\x66\x7c\x2a\x14\
-\x24\x26\x26\x92\x98\x98\x68\x4f\x36\xe5\xec\x5a\xab\x55\xab\xd6\
-\x7f\xe5\xa0\xcc\x11\x68\x34\x1a\x4a\x95\x2a\x45\x8f\x1e\x3d\x5e\
-\x88\x71\xfe\xa7\xc2\x68\x34\x72\xe4\xc8\x91\xff\xda\x21\x9a\x04\
-\x89\x04\x4a\x90\x20\xe1\x6f\x84\x5c\x2e\x27\x3a\x3a\x9a\x49\x93\
-\x26\x11\x1b\x1b\xeb\x44\x91\xf7\xe7\x86\x9b\x56\xab\x65\xfe\xfc\
-\xf9\x4e\x91\x89\x84\xeb\x27\x39\x1f\x67\xa2\x61\xb3\xa6\x64\xdf\
-\x3b\x45\xd4\x33\x0b\x6e\x0a\x35\x95\x1a\xd7\x25\xd8\xb5\xf8\xed\
-\x2a\x95\x4a\x62\x63\x63\x19\x3e\x7c\xb8\x53\x72\xd9\x64\x7b\xf6\
-\xec\x19\xe7\xce\x9d\x13\x5f\x2c\x1e\x0b\x29\x8f\xae\x70\xf1\x91\
-\x91\xa6\x2d\xaa\x10\x7d\xf6\x32\x09\x5a\x13\x2e\x1a\x2f\xca\x84\
-\x54\x21\xbc\x4c\xf1\x8b\x73\x0b\x82\xc0\x95\x2b\x57\xe8\xd3\xa7\
-\x0f\xee\xee\xee\x4e\x8d\xb7\x2d\x6c\x76\xf6\xec\xd9\xa2\x43\x0b\
-\xc1\xca\x83\xb3\x87\xb9\xa3\x0b\xa4\x5d\xcb\x1a\x3c\x38\x79\x80\
-\x58\x9d\x2b\x1e\x6a\x6f\xaa\xd4\xa9\x86\x9f\x5b\xf1\x43\x1f\x15\
-\x0a\x05\x1b\x36\x6c\xe0\xfb\xef\xbf\x77\x9a\xbc\xeb\xf5\x7a\x0c\
-\x06\x03\x0f\x1e\x3c\x10\xaf\x7b\x4c\xdc\xfd\xfd\x28\xa9\xea\xca\
-\xd4\x0d\x53\x72\xe9\xd2\x6d\x72\x0c\x72\xbc\x4b\xf9\x50\xa9\x6a\
-\x24\xde\x0e\x46\x75\xae\x5d\xbb\x96\x2f\xbe\xf8\xc2\x69\xf2\x66\
-\x30\x18\xf0\xf7\xf7\x67\xd1\xa2\x45\x4e\x1c\xba\xe8\xb9\x72\xfc\
-\x57\x52\x34\x91\xb4\xac\x69\xe6\xd4\xa1\x9b\x98\xdc\xdc\x28\x5d\
-\x26\x8c\xca\x15\xca\xa0\x52\x16\xaf\x7f\x32\x99\x8c\x9c\x9c\x1c\
-\x3e\xfe\xf8\x63\x0e\x1f\x3e\x8c\x87\x87\x87\x68\xbd\x59\x2c\x16\
-\x72\x72\x72\xe8\xdc\xb9\x33\xad\x5b\xb7\x16\xaf\xfb\xac\x04\x0e\
-\xfd\x1e\x4d\xdb\x97\x1b\x93\xf5\xf0\x16\xb7\x1e\x3e\xc6\xa2\xf2\
-\xc4\xd5\xcd\x9f\x86\x75\xc3\x91\xcb\x84\x62\xaf\x35\xad\x56\xcb\
-\xb0\x61\xc3\xc8\xcd\xcd\x75\x62\x8d\xfc\x47\x6f\xe1\xe1\xe1\x4c\
-\x99\x32\x45\x74\x3b\xda\xa4\xbb\x9c\xbf\x78\x0b\x97\xb0\xe6\x04\
-\x59\xef\x73\x27\x2e\x1b\x95\xda\x93\x0a\x95\x22\x08\x75\xe0\xee\
-\xb4\x4a\xa5\xe2\xc6\x8d\x1b\x2c\x5f\xbe\x9c\xa4\xa4\x24\xa7\x42\
-\x94\xad\x56\x2b\x39\x39\x39\xcc\x9c\x39\x53\x74\xe2\x9c\x92\x82\
-\x8f\x8f\x0f\x41\x41\x41\xcc\x9b\x37\x4f\x2a\x45\xe1\x04\xcc\x66\
-\x33\xe3\xc6\x8d\x93\x48\xa0\x44\x02\x25\x48\x90\xf0\x7f\x11\xb6\
-\x0b\xfd\x4f\x9f\x3e\xe5\xcd\x37\xdf\x2c\x5e\x76\xc1\x42\x8c\x9b\
-\xc9\x93\x27\x93\x92\x92\x22\xba\x8d\xf4\xf3\x3f\x30\x63\xc7\x53\
-\x5e\xa9\x26\x63\xe5\xaa\x47\xb4\xaf\xe9\x45\xc6\x93\x28\xe6\xaf\
-\x7b\xc8\xc7\x3f\x54\x25\xd8\xd5\xcb\x21\xd9\x8c\x46\x23\x4f\x9f\
-\x3e\xe5\xe7\x9f\x7f\xb6\xd7\xc2\x13\x43\x94\xb5\x5a\x2d\x7d\xfb\
-\xf6\xb5\x67\x64\x14\x43\x25\x92\xa3\x7f\xe7\xab\x45\x5b\x91\x07\
-\x95\xe6\x89\x2c\x9b\xd0\x84\x78\xe2\x65\x2e\xc4\x7c\xf3\x3e\xd9\
-\xc3\x0e\xb2\xc0\xc1\xa8\xa5\xec\xec\x6c\xd4\x6a\x35\xf3\xe7\xcf\
-\x27\x34\x34\x54\x94\xd7\x44\x10\x04\x12\x12\x12\x18\x3f\x7e\xbc\
-\x3d\x43\xa8\x18\x3c\xd8\x3c\x9b\x79\x0f\x2a\xd0\xd8\xbc\x8b\x8f\
-\x9f\x8d\xa7\x9f\x5b\x32\xcf\x62\x1f\xf2\xcd\x81\x4c\xa6\x2f\x98\
-\x89\x5f\x78\xd1\xc6\x65\x5e\x83\x38\x3d\x3d\x1d\xbd\x5e\xcf\xce\
-\x9d\x3b\x45\x17\xe6\x56\x28\x14\xec\xdd\xbb\xf7\x4f\xb5\xca\x1c\
-\x45\xfc\xbe\x39\xcc\xfd\x59\x4e\xad\xca\x77\x59\x6f\x0d\xa6\xa1\
-\xbf\x16\x4f\xcf\xa7\x2c\x9d\x71\x94\x05\x67\x77\xe2\x2d\xe2\x30\
-\x21\x2c\x2c\x8c\x45\x8b\x16\x89\xce\x58\xeb\xe2\xe2\xc2\xa6\x4d\
-\x9b\xd8\xb2\x65\x8b\x13\xb2\xa5\x72\x6e\xf5\x5c\x0e\xea\x23\x91\
-\x9f\x1f\xc7\xe9\x7e\xb3\xa8\xff\x2c\x91\xbb\x8f\xee\x70\x42\x08\
-\x62\xd4\xc4\xb7\x29\xa3\x2c\xfe\x3c\x32\x9b\xcd\x3c\x79\xf2\x84\
-\xba\x75\xeb\x32\x7b\xf6\x6c\xb4\x5a\xad\xa8\xf9\xa8\xd3\xe9\x58\
-\xbc\x78\x31\xc9\xc9\xc9\x4e\x90\x2d\x2b\x7b\x3f\x1a\xc9\xe3\xf2\
-\xad\xb9\x96\x28\x67\x50\x23\x2b\x09\x49\x99\xe4\x46\x7d\xc3\xcc\
-\xcb\xbd\x88\xda\x16\x8e\xbb\x83\xfc\x3b\x25\x25\x85\x36\x6d\xda\
-\x30\x6b\xd6\x2c\x9e\x3d\x7b\x26\xaa\x57\x5e\x5e\x5e\xf4\xe8\xd1\
-\x83\xd4\xd4\x54\xd1\x07\x00\xfa\xb8\xf3\x7c\xfa\xd5\x56\x34\x95\
-\xeb\xa0\xdd\xfe\x16\x1e\xcd\x7b\xe1\x6f\x49\x27\x36\x2e\x8a\xbb\
-\x4f\xba\x30\xba\x4f\x53\x87\xf7\xff\x84\x84\x04\xde\x7a\xeb\x2d\
-\xd1\xfb\xbf\x20\x08\x64\x65\x65\x31\x7e\xfc\x78\xd2\xd2\xd2\xfe\
-\xd6\x50\x50\xdb\x3a\xb3\x58\x2c\xe4\xe6\xe6\x4a\x24\xd0\x09\xe4\
-\xe4\xe4\xfc\xed\x84\x5e\x22\x81\x12\x24\x48\x90\xf0\x5f\x80\x4a\
-\xa5\xb2\x7f\xac\x35\x1a\x0d\x8d\x1a\x35\xa2\x5d\xbb\x76\xa2\xdb\
-\xcb\xca\xca\xa2\x62\xc5\x8a\xf6\x72\x0c\x32\x99\xcc\xe1\x93\xe5\
-\xd8\x04\x0b\x5d\x86\xf5\xa6\xab\x9f\x8e\x5b\x8b\x37\x12\xd9\xfe\
-\x0d\x4a\x1d\xf9\x89\x0e\xe3\x1a\x50\xcb\xa7\xf8\x9e\xb2\x3f\x7a\
-\x46\x5a\xb7\x6e\x8d\xa7\xa7\xa7\xe8\xcc\x77\x5a\xad\x36\x5f\xe1\
-\x5d\x31\x06\x9c\x3e\x37\x97\xa0\xe6\x43\xe8\x1f\x1e\xcb\x82\x5b\
-\x56\xba\xf5\x1a\x40\x9b\xac\x83\xbc\xba\xbd\x1f\x3b\x3a\x17\x9f\
-\xdc\xda\x92\xf7\x58\x2c\x16\x02\x03\x03\x69\xde\xbc\x39\xe1\xe1\
-\xe1\xa2\x65\x8b\x8d\x8d\xb5\xd7\xe7\x83\xe7\x1e\x54\xc7\x3e\xfa\
-\x56\x6e\xc5\xf8\xd1\xf7\xcd\x5e\xb4\xbb\xaf\xa5\xd5\xf6\x18\x3e\
-\xf9\x6c\x08\x19\xeb\x56\xd0\xa4\x7b\x43\x2a\x85\xf9\x16\xab\x15\
-\xa5\x52\x69\x1f\x57\x8b\xc5\x42\x40\x40\x00\x0d\x1a\x34\x10\x6d\
-\x50\x0a\x82\x40\x62\x62\x62\x3e\x23\x50\x8c\xc7\x2c\x29\x36\x9b\
-\x57\xde\x5b\x40\xe0\xd9\xd5\x6c\xdd\xa5\x67\xea\xf2\x01\x98\x57\
-\x76\x40\xf3\xf6\x66\xaa\x0a\xc5\x5f\x6b\x79\x11\x1c\x1c\x4c\x9b\
-\x36\x6d\xfe\x44\x7e\x1d\x91\xed\xda\xb5\x6b\xf9\x9e\x75\x38\xa9\
-\x93\x2e\x89\x84\x14\x7f\x5e\x19\xda\x87\xaa\xde\xbb\x79\xf9\xb2\
-\x3b\x1f\xbe\xd7\x19\xd3\xea\x58\x9e\x78\xbe\x4c\x19\x8d\xe3\x6b\
-\xcd\x64\x32\xd1\xa0\x41\x03\xa7\xc8\x84\x4e\xa7\x63\xff\xfe\xfd\
-\xdc\xbe\x7d\x3b\xdf\xdc\x70\x0c\xd1\x24\x19\x5a\xd2\xb3\x6b\x7d\
-\x16\x7d\x71\x05\xef\x41\xa3\xe8\x57\xa9\x3c\x1f\x74\xda\xce\xb7\
-\x3f\xf6\xc5\x5d\x21\x38\x2c\x9b\x42\xa1\xb0\xd7\xd0\x74\x66\x4e\
-\x6a\x34\x1a\x7b\x34\x81\x4c\x26\x73\x58\xb6\xec\x74\x3d\xe5\x1b\
-\x36\xa1\x6d\xcf\x6e\x64\x65\xfe\xc0\x5e\xff\xe6\xf4\x6f\x06\x9b\
-\xe6\x4f\x23\xbc\x45\xf1\xc7\x3d\xef\x7b\x05\x41\xa0\x49\x93\x26\
-\xb4\x6d\xdb\x56\x94\xc1\x6f\x3b\x4c\x2a\x5b\xb6\xec\xdf\x1e\x0a\
-\x2a\x41\x82\x44\x02\x25\x48\x90\x20\xe1\xdf\x58\xb9\x72\x25\x1b\
-\x36\x6c\xc0\xdd\xdd\x3d\xdf\xef\xa9\xa9\xa9\xf9\x7e\xb3\x15\x23\
-\x17\x8b\xbc\xcf\xbb\xb8\xb8\x70\xe1\xc2\x05\x3a\x76\xec\x58\xa4\
-\xe1\xdd\xa9\x73\x67\xfa\xf5\xe9\xc5\xc9\xab\x71\x74\xe8\xd8\x97\
-\xea\xfa\xc7\x6c\xfe\x7a\x01\xe6\xb2\xbd\x70\xc3\xc4\xc5\xb8\x4c\
-\x5a\xd6\xaa\x85\x97\x4a\xc6\xc3\x87\x0f\x19\x3f\x7e\x3c\x66\xb3\
-\xb9\xd0\xbe\x5e\xba\x74\x29\xdf\x3d\x30\xdb\xff\x2b\x56\xbe\x3f\
-\x8e\xcd\xc9\x93\x27\xe9\xd4\xa9\x53\xa1\x85\xe2\x2d\x16\x0b\xf3\
-\x16\x2c\x24\xcc\x2d\x83\xdb\xf7\x52\xd0\x85\xd4\xe7\xcd\xce\xb0\
-\x78\xfe\x16\x2a\xb7\xee\x8d\x8f\x5a\xc6\x81\x65\x87\xe9\xf0\xfe\
-\x6c\x54\xc0\xbe\x7d\xfb\x58\xb2\x64\x89\xbd\xee\x5b\x41\xb8\x78\
-\xf1\xa2\xbd\x10\x70\xde\x7e\x39\x23\x9b\x0d\xee\xee\xee\x7c\xfa\
-\xe9\xa7\x6c\xda\xb4\xa9\xd0\xf6\x5c\x5d\x5d\x99\xf3\xd1\x4c\xca\
-\x69\x0c\x1c\xbd\x91\x4d\xf3\xb7\x46\xe1\x95\x71\x9b\x0f\x57\x1e\
-\xa7\xff\xf8\x81\x90\x15\xcd\x95\x1c\x05\x91\xcd\x1b\xe3\x2b\xc0\
-\xba\x75\xeb\x58\xbb\x76\x6d\xa1\x87\x02\x7a\xbd\x9e\xf3\xe7\xcf\
-\xd3\xa3\x47\x8f\x12\xd1\x59\xde\x67\xad\x56\x2b\xae\xae\xae\x2c\
-\x5a\xb4\x88\xed\xdb\xb7\x17\x98\x05\xd5\x68\x34\x52\x39\xa2\x2a\
-\xb3\x3f\x9e\xc4\x93\x0b\xd7\x88\x76\x09\xa5\xc7\xe8\x45\x04\x5d\
-\xdb\xc3\x92\xab\x49\x74\x1f\xdd\x9f\x50\x97\xb3\xbc\x72\xac\x05\
-\x5b\xf7\xfa\x62\x31\x9b\xd9\xb0\x71\x23\x2b\x57\xae\xc4\xc3\xc3\
-\xa3\xc0\x3e\xe4\xe4\xe4\x14\x98\x69\xcf\x59\xbd\xc9\x64\x32\x2c\
-\x16\x0b\x33\x67\xce\x64\xc5\x8a\x15\x05\x1a\xe1\xb6\x3a\x89\x4b\
-\x17\x7f\x41\xd2\xf5\x5f\xf9\x3d\xc9\x9b\x66\x13\x67\xa0\x8a\x3e\
-\xc0\xc8\x7f\x59\x99\xba\xa1\x12\xcf\xee\xfd\xce\xc5\xdb\x66\xfa\
-\x2e\x7a\x5e\x6a\x60\xd4\xa8\x51\x44\x47\x47\x17\x7a\xe8\x61\xcb\
-\x98\x69\x23\x36\x25\xb9\x8f\xd8\xc8\x4a\xd7\xae\x5d\x0b\x0d\xe9\
-\xd6\xe9\x74\x74\xed\xda\x9d\x49\xef\x0c\xe5\xd4\xde\x43\xa4\x97\
-\x6e\xc5\x98\x25\xe3\x59\x30\x75\x22\x65\x3b\xbe\x87\x07\x90\xf4\
-\xaf\x8f\x88\xea\xf6\x11\x73\x3d\xe4\xe4\xe4\xe4\x30\x67\xce\x1c\
-\x4e\x9f\x3e\x5d\xa0\xa7\x48\xa9\x54\x72\xff\xfe\xfd\xbf\xf4\xb0\
-\x97\xc4\x9c\x94\xcb\xe5\x3c\x7e\xfc\x98\x91\x23\x47\x16\x7a\x40\
-\x95\x99\x99\xc1\xc4\x89\x93\x79\xad\x4b\x03\xf6\xec\x3a\x4f\xf9\
-\x66\xaf\x32\xbc\xa7\x99\x87\x27\x57\xf3\xc9\xf1\x00\xde\x1f\x1b\
-\x40\xca\xb9\x0f\x39\x61\x19\xc4\xe0\xd2\x90\x9d\x95\xcd\x88\x91\
-\x23\x48\x4b\x4b\x2b\xb0\x9f\x82\x20\x10\x17\x17\xf7\xa7\x6f\x42\
-\x49\xe8\xce\x26\xdb\xb3\x67\xcf\x78\xf5\xd5\x57\x31\x1a\x8d\xf6\
-\xdf\x8d\x46\x23\x15\x2a\x54\x60\xd1\xa2\x45\x78\x79\x79\x21\x41\
-\x82\x04\x89\x04\x4a\x90\x20\xe1\xbf\x88\xd1\xa3\x47\x33\x7a\xf4\
-\xe8\x3f\xfd\x7e\xe1\xc2\x05\x7a\xf6\xec\x09\x3c\xf7\xbc\x98\xcd\
-\x66\xa7\x52\x69\x1b\x8d\x46\xbb\x71\x6d\x30\x18\xa8\x5f\xbf\x3e\
-\x87\x0e\x1d\x2a\x96\x51\x71\xf6\xf4\x09\x2e\xdc\x4c\xa6\x69\x15\
-\x0b\xef\x7d\xf4\x1d\xd5\xfa\xbe\xc3\xec\x0e\x55\x31\x26\x5f\x22\
-\x23\x27\x17\x8d\x4f\x20\x00\x61\x61\x61\xec\xdd\xbb\xb7\xc8\xf6\
-\x26\x4f\x9e\x4c\x4c\x4c\x4c\x3e\x03\xd8\x6c\x36\x8b\x3a\xa5\x96\
-\xc9\x64\x76\xef\xa6\x0d\xcd\x9b\x37\x2f\x76\x52\x96\x27\x47\x57\
-\x11\x75\xf1\x21\x09\xf1\x19\x5c\xdf\x74\x01\x45\xf3\x11\x0c\x6e\
-\x5b\x07\x99\xe9\x29\x87\xe3\x60\x4a\xd5\xe7\x86\x58\xa7\x4e\x9d\
-\xe8\xd4\xa9\x53\x91\xed\xf5\xed\xdb\xd7\xee\x25\xb1\x58\x2c\xf6\
-\x71\x17\x7b\x02\x6f\x1b\x1b\x41\x10\xc8\xce\xce\xe6\x83\x0f\x3e\
-\x60\xd0\xa0\x41\xc5\x78\x52\x47\xf4\xa1\xb5\x5c\xbd\x69\xa1\xac\
-\xf2\x21\xcb\x7e\xbc\x4e\x8f\xc9\x4b\xe9\x56\x4b\x43\xf4\x8d\x9b\
-\xa0\x50\x52\xb3\xf2\xf3\x02\xdf\x43\x86\x0c\x61\xc8\x90\x21\x85\
-\xb6\x96\x91\x91\x41\x97\x2e\x5d\xec\x46\xa3\xad\x16\x9b\xd8\x39\
-\xa9\x54\x2a\xed\x63\x62\xf3\x30\x4d\x99\x32\x85\x37\xde\x78\xa3\
-\x18\x4f\xe7\x72\xf2\xca\x6a\x2e\x7a\xca\x69\x5e\x3a\x86\x39\x5f\
-\x1e\xa7\xff\xac\xd9\x34\x2b\xef\xc1\xdd\xf5\x47\x08\x1f\xd9\x0b\
-\xcd\x73\x6b\x97\xc1\x83\x07\x33\x78\xf0\xe0\x42\x5b\x4b\x4c\x4c\
-\x24\x22\x22\x22\xdf\x21\x81\xb3\xb2\xd9\x74\x66\xb1\x58\x90\xc9\
-\x64\xcc\x9f\x3f\x9f\x0e\x1d\x3a\x14\xfd\xb0\x29\x97\xb4\xe8\x6b\
-\x5c\x8d\xd2\xe0\x97\x73\x96\x6d\xa7\xd3\x78\x7b\xfd\x4f\xd4\xf3\
-\x37\x72\xf1\xf8\x69\x72\xaa\xbc\x46\x95\x7f\xf7\x71\xd5\xaa\x55\
-\x45\x36\xf7\xe8\xd1\x23\x22\x22\x22\xec\xa5\x53\x8c\x46\xe3\x9f\
-\xd6\x8b\x98\x7d\x24\x2f\x71\xd8\xbb\x77\x2f\xae\xae\xae\x45\x3f\
-\x6c\x79\xc2\xdd\x4b\x67\x49\xaa\x5d\x8b\x90\xbb\x8b\xf0\xe9\xf4\
-\x1e\x23\xdb\x56\x00\xe2\xf9\xf4\xa0\x27\x13\x96\x94\xb6\x1f\x76\
-\x7c\xf6\xd9\x67\x45\x36\xb7\x6a\xd5\x2a\x26\x4d\x9a\x94\x6f\xad\
-\x38\xab\x37\x1b\x51\x36\x9b\xcd\x84\x84\x84\xb0\x76\xed\x5a\x2a\
-\x55\xaa\x54\xe4\xb3\x19\x09\x27\xb9\x7c\xee\x12\xf2\x72\x11\x5c\
-\xff\x6e\x15\xbf\x65\x86\x33\x6f\xd3\x4a\x2a\xb8\xe6\xf2\xe5\xc2\
-\x33\xb4\xf8\xfe\x63\x00\x34\x1e\x1a\xb6\x6c\xd9\x52\x64\x7b\xdb\
-\xb6\x6d\x63\xea\xd4\xa9\xf6\xf5\x61\xdb\x4b\xc4\x92\xc0\xbc\xdf\
-\x0f\xb3\xd9\x8c\xaf\xaf\x2f\xbb\x77\xef\x96\x3e\xc0\x12\x24\x48\
-\x24\x50\x82\x04\x09\x2f\x1a\xf2\xde\x01\x7b\xf6\xec\x19\xcb\x96\
-\x2d\xe3\xd7\x5f\x7f\x15\xdd\x9e\xc9\x64\xe2\xcc\x99\x33\x76\x0f\
-\x9c\xed\x4e\xc6\x1f\x4f\x9b\xff\x0a\x0d\x9b\x34\xa7\x61\x13\xb8\
-\xb8\x76\x36\x59\x11\x8d\x09\xd5\xdf\xe5\xd0\x59\x81\x48\x55\x12\
-\x32\x99\x12\x6f\x3f\x6f\x87\xfa\x62\x33\x46\x6c\x24\x60\xe6\xcc\
-\x99\xb8\xb9\xb9\x89\x26\x81\x7a\xbd\x9e\xc4\xc4\x44\xfb\xf3\xc5\
-\x6f\xc7\x4a\x99\xd6\xa3\x18\xda\x1a\xe2\xce\x6d\x64\xc2\x6f\x1a\
-\x06\x08\xd1\x1c\xbd\x1a\x48\xe3\xa0\x47\xc8\x3c\xc3\xf0\x55\x3a\
-\x3e\xce\xb6\x7e\xdd\xb9\x73\x87\xcf\x3e\xfb\x0c\x7f\x7f\x7f\x51\
-\xb2\x09\x82\x40\x6a\x6a\x2a\x4f\x9f\x3e\xb5\x1b\xa7\x06\x83\xa1\
-\x48\x6f\xe4\x73\xb8\x52\xfe\xe5\x31\xcc\x7a\x19\x36\x8f\x1b\x82\
-\x7b\xa3\x8e\x10\x75\x84\x03\xa6\x66\x54\x92\x1b\xd1\xb8\x7b\x11\
-\xe0\x40\x34\x70\x6e\x6e\xae\xdd\xc8\x16\x04\x81\x87\x0f\x1f\xf2\
-\xd1\x47\x1f\x89\xce\x5a\x28\x97\xcb\xb9\x74\xe9\x52\xbe\xe7\x8b\
-\x5b\xe4\xdb\x6a\x55\xd3\xf3\xbd\x4f\xe9\x09\x1c\x9c\xd2\x8c\xb8\
-\x90\x77\xc8\xba\x71\x8a\x83\xa9\x55\x88\x8e\x35\xd1\x6b\x50\x29\
-\x87\xfa\xa2\xd5\x6a\xed\xa4\xc8\x64\x32\x71\xfe\xfc\x79\xa6\x4e\
-\x9d\x8a\xd5\x6a\x15\x45\x96\x94\x4a\x25\x87\x0f\x1f\xce\xe7\xa5\
-\x2a\xf6\x1d\x3c\x85\x9a\x6a\x3d\xa6\xf2\x91\xf9\x06\xab\x86\x4e\
-\xc6\xbb\x61\x1f\xa2\x8f\xfd\x40\x76\xb5\x36\xe4\x24\xe9\xa8\xd7\
-\xbe\xb2\x5d\x07\xc5\x95\xcd\x46\x6c\xe5\x72\x39\x5b\xb7\x6e\x45\
-\xa9\x54\x8a\x2a\xa8\x6e\x9b\x7f\xfb\xf6\xed\xa3\x5c\xb9\x72\xf6\
-\xb1\xd1\x6a\xb5\xc5\x23\x81\xb2\x32\x0c\x9b\xb9\x10\xb8\xcb\x9b\
-\xb5\x8e\xd1\x79\x41\x6b\x7e\xbb\x2c\xa7\x65\x60\x0c\xb9\xd5\x1a\
-\x52\x55\xe9\x58\xa6\xc8\xbc\x09\x31\x72\x72\x72\x38\x72\xe4\x08\
-\xb3\x67\xcf\x16\x5d\x3f\x4d\xad\x56\xf3\xf8\xf1\x63\x02\x03\x03\
-\xed\xc4\x2b\x37\x37\xb7\x58\xcf\x7a\x05\x35\x63\xd6\xc2\x66\xa4\
-\x9c\xdb\xce\xbb\xd1\x7a\xaa\xb7\xae\xc8\xc5\x7d\xbf\x60\x8d\x54\
-\x71\x5c\xde\x81\x1f\xfd\x1c\xeb\x8b\xed\x7e\xb3\xc5\x62\x41\xa7\
-\xd3\xf1\xd5\x57\x5f\x71\xf8\xf0\x61\x51\x72\xd9\xbc\xdd\x97\x2e\
-\x5d\x2a\xd6\x41\x96\x04\x09\x12\x24\x12\x28\x41\x82\x84\xbf\x11\
-\x56\xab\x15\xb3\xd9\x8c\xbf\xbf\x3f\x43\x87\x0e\x25\x26\x26\x86\
-\xc7\x8f\x1f\x3b\xd5\x66\xb7\x6e\xdd\x68\xda\xb4\x29\xb7\x6e\xdd\
-\x12\x65\xdc\x86\xb6\xea\x4e\xd7\x53\x57\x48\x78\xfa\x0c\x5f\x0f\
-\x1d\xee\x95\x5f\xa2\x9d\x57\x04\x01\x1a\xc7\xfb\x62\x36\x9b\x09\
-\x0c\x0c\x64\xc8\x90\x21\x76\x92\xe3\x0c\x7a\xf5\xea\x45\x99\x32\
-\x65\x1c\x6c\x47\xb0\x93\x41\xef\xb2\x2f\xd1\xbf\xab\x99\x94\xd8\
-\x44\xe4\xfe\x7a\xe4\xee\x21\x0c\x1e\x50\x1e\xb1\x79\x3d\xc3\xc3\
-\xc3\xe9\xdb\xb7\x2f\x5a\xad\x36\x9f\xd7\x53\x8c\x01\x37\x6e\xdc\
-\x38\xc2\xc3\xc3\x31\x1a\x8d\x22\xc6\xc9\x44\x83\xe1\xa3\x90\xdf\
-\xbc\x47\xca\x33\x03\x3e\xc1\x16\xca\xd6\xaa\x46\x6b\x3f\x83\xa8\
-\x8f\x9b\xc5\x62\xa1\x59\xb3\x66\x18\x8d\x46\x6e\xdd\xba\xe5\x54\
-\x78\x9a\xbf\xbf\x3f\x83\x06\x0d\x72\x38\x3b\x6c\xde\x57\x86\x75\
-\x9f\x46\xaf\xa8\x24\xe2\x92\x4d\x78\xa9\x0d\x34\xee\xd6\x8b\xb0\
-\x00\x4f\x87\xd7\x9a\x6d\xac\x5f\x7e\xf9\x65\x52\x53\x53\x9d\xd2\
-\x99\xd5\x6a\x25\x22\x22\x82\x26\x4d\x9a\xe0\xea\xea\x2a\xce\x0b\
-\x6c\x08\xa0\xd9\xb0\x09\x5c\x8e\x49\x26\x3d\x3d\x03\x0f\x8b\x9c\
-\x06\x9d\x7a\x23\x84\xb8\x88\xd2\x99\x46\xa3\xa1\x5f\xbf\x7e\x5c\
-\xbc\x78\x91\xfb\xf7\xef\x3b\xa5\xb7\x46\x8d\x1a\xd1\xa4\x49\x13\
-\x27\xb2\xfa\x7a\xd2\xf5\xbd\x09\x44\x3f\x8e\xa7\xbc\x67\x05\xf4\
-\xde\x55\x78\xbb\x5f\x15\x34\xee\x4a\x51\x63\xad\x54\x2a\x19\x35\
-\x6a\x14\x99\x99\x99\xdc\xbc\x79\x53\xb4\x6c\x56\xab\x95\x3e\x7d\
-\xfa\x10\x1c\x1c\x8c\x56\xab\x15\xd5\x8e\x4b\x68\x5d\x06\x74\xc8\
-\xe0\x49\x56\x22\x69\x06\x17\x8c\xa6\x86\x4c\xfa\xb8\x96\xa8\x7d\
-\xc4\x64\x32\x51\xae\x5c\x39\x46\x8d\x1a\x45\x7c\x7c\xbc\x53\xfb\
-\xbf\x20\x08\x0c\x1e\x3c\x98\xa6\x4d\x9b\x72\xe3\xc6\x0d\xe9\x03\
-\x2b\x41\x82\x44\x02\x25\x48\x90\xf0\x22\xc3\x62\xb1\x50\xb6\x6c\
-\x59\x3e\xfe\xf8\xe3\x12\xab\xc9\xe5\xee\xee\xce\xf2\xe5\xcb\x45\
-\x3d\x5b\xaa\x7c\x24\x3d\xcb\x47\xe6\x6f\xcf\x47\x5c\x3f\x4c\x26\
-\x13\xa5\x4b\x97\x66\xd9\xb2\x65\x25\x92\xdd\xcc\x6a\xb5\xa2\xd1\
-\x68\x0a\xbc\x4f\x56\x14\x19\xd4\x04\x57\xa5\x57\xbf\xaa\xf9\x7e\
-\xad\x51\x55\x7c\x5f\x82\x83\x83\x59\xb9\x72\x65\x89\xe8\xcc\xe6\
-\xed\x14\x97\xfd\x54\x41\xf8\x4b\x4d\x09\x7f\x29\x7f\x52\x8a\x72\
-\xee\xe2\xf5\xd6\xb3\x67\x4f\xba\x77\xef\x5e\x22\x59\x06\x65\x32\
-\x99\x53\xfa\xaf\xd8\xb4\x0b\x15\x9b\x52\x62\xe3\xdc\xbd\x7b\x77\
-\x5e\x7e\xf9\xe5\x12\x69\x4f\x10\x04\xae\x5f\xbf\x2e\x6e\x4e\xba\
-\x05\x50\xad\xf5\x2b\x54\xcb\xbf\x02\x45\xef\x23\x2a\x95\x8a\x71\
-\xe3\xc6\x91\x93\x93\x53\x62\xfb\x88\xf8\x62\xf1\x41\x74\xec\xdf\
-\x3f\xff\x5a\xab\x20\xbe\x2f\x2e\x2e\x2e\x2c\x5a\xb4\x48\xe4\xda\
-\xff\x6b\x6c\xd8\xb0\x41\xd4\x73\x1e\x81\xa1\xbc\xdc\x3b\x7f\x48\
-\x73\x84\xc8\x3e\x18\x0c\x06\x2a\x57\xae\x4c\xb7\x6e\xdd\x44\x79\
-\x6e\xff\x6a\x3e\xaa\xd5\x6a\xd6\xac\x59\xf3\xb7\x67\x08\x95\x20\
-\x41\x22\x81\x12\x24\x48\x90\x50\x0c\x03\x2e\x37\x37\xb7\x44\x49\
-\xe0\x8b\x92\x52\x5a\x2e\x7f\x9e\x04\xa2\x24\x8a\x69\x9b\xcd\x66\
-\x34\x1a\xcd\x0b\x95\x2e\x3b\x27\x27\xa7\x44\xfa\xf3\x77\x17\x1b\
-\xff\xa3\x21\x69\x32\x99\x44\x95\x18\xf8\x2b\xb2\x2c\x08\x42\x81\
-\x49\x5b\xfe\x2e\x64\x67\x67\x97\xc8\x98\xbf\x48\x73\x51\x2e\x97\
-\xa3\xd7\xeb\x8b\x1d\xde\x58\x94\xde\x6c\xf7\xe7\x5e\x14\xe4\x0d\
-\x57\xfe\xbb\x0f\x26\xfe\x1b\xfb\x7f\x49\x90\x40\x00\x37\x37\x37\
-\x89\x00\x4a\x90\x20\x91\x40\x09\x12\x24\xbc\xf0\x9b\x8f\x42\xc1\
-\xdd\xbb\x77\x79\xeb\xad\xb7\x9c\x0e\xe1\x12\x04\x01\x17\x17\x17\
-\xe6\xcc\x99\xe3\x64\xd1\xf9\x2c\x62\x1f\x1b\x08\x2d\xe7\x07\x58\
-\x48\xcf\xc8\xc1\xd5\xd5\x0d\x17\x17\x05\x8e\xf4\x4e\xa9\x54\x72\
-\xfb\xf6\x6d\xda\xb7\x6f\xef\xb4\x41\x29\x93\xc9\x48\x4d\x4d\xe5\
-\xea\xd5\xab\xc8\xe5\x72\x71\x6d\x59\xc1\xac\xcb\x24\xd7\x60\xc6\
-\xd5\xd3\x07\xa5\x00\x99\x4f\x13\x50\x95\x0a\xc2\x55\xb0\x82\x03\
-\xd2\xd9\x4a\x04\xd8\x3c\x4a\xce\xa4\x65\x17\x04\x01\x5f\x5f\x5f\
-\xe6\xce\x9d\x8b\x5a\xad\x16\x21\xdb\xf3\xbe\x5b\x0d\x29\x24\x6b\
-\x3d\x08\xf4\x72\xc1\x6a\xd2\x93\xa9\xd5\xa3\x54\x7b\xe2\x26\xc7\
-\x61\xbd\x7d\xfe\xf9\xe7\xac\x5d\xbb\xd6\x69\x42\x61\x33\xb6\x6f\
-\xde\xbc\x29\x7e\x3e\x62\x45\xa7\xd3\xa2\x37\x08\x78\x7b\xba\x81\
-\x25\x9b\x47\xc9\x32\x2a\x94\x56\xdb\x44\x77\xc8\xe0\xfe\xe4\x93\
-\x4f\x58\xb8\x70\xa1\xd3\x73\x52\xa1\x50\xe0\xe5\xe5\xc5\xd2\xa5\
-\x4b\x45\x94\x50\xc8\x43\x48\x53\x93\xc1\xdb\x0f\x8d\x5c\x8e\x5e\
-\xa7\x25\x3d\x4d\x47\x60\x90\x63\xee\x77\xb9\x5c\x4e\x5a\x5a\x1a\
-\x6f\xbc\xf1\x06\xc7\x8f\x1f\x77\xaa\xe6\xa4\x2d\x69\x4a\xe7\xce\
-\x9d\x69\xd1\xa2\x85\x68\xad\x59\x2c\x56\x52\x52\xb3\x09\xf0\x7f\
-\x1e\xba\x9b\x9d\x10\x87\xae\x54\x00\x7e\x4a\x95\x43\xf3\xd1\x76\
-\xdf\xad\x69\xd3\xa6\xa4\xa7\xa7\x3b\x95\x3c\x05\x9e\x97\x0b\xa9\
-\x5c\xb9\x32\xe3\xc7\x8f\x77\x42\xff\x46\x92\xe2\x53\xf1\xf6\x2f\
-\x85\x8b\x52\x8e\x21\x2d\x8e\x14\x79\x08\xc1\x8e\x45\x29\xe3\xea\
-\xea\xca\xd9\xb3\x67\x79\xe3\x8d\x37\x88\x8f\x8f\x77\xba\xbc\x83\
-\x4a\xa5\x62\xda\xb4\x69\x52\x6d\x39\x09\x12\x24\x12\x28\x41\x82\
-\x84\x17\x19\x36\x4f\x84\xc1\x60\x20\x2e\x2e\x8e\x76\xed\xda\x51\
-\xa7\x4e\x1d\xd1\xed\xe9\x74\x3a\x66\xcf\x9e\x6d\x2f\xa4\x2c\x08\
-\x82\xe3\xde\x8e\xa4\xa3\x34\x6b\xf3\x2e\x26\x5f\x68\xd2\xf7\x33\
-\x86\x04\x5d\xa0\xd7\x6b\x33\xf0\x78\xf3\x5b\x0e\x7f\x3e\x14\x3f\
-\xb5\xa2\xd8\xb2\xd9\x42\x1c\xd3\xd3\xd3\x99\x3d\x7b\x36\xae\xae\
-\xae\xa2\x6b\xb2\xe9\x74\x3a\xe6\xce\x9d\x8b\x4e\xa7\xb3\xff\xe6\
-\xb0\xb1\xfd\xe4\x06\x33\x87\x74\x67\xc5\x6d\x3f\xbe\xd8\xf0\x2f\
-\x3a\x65\x7c\x4d\xf3\x11\x1b\x11\x82\x5e\xe3\xc4\x8d\x55\x94\x77\
-\xa0\x3f\xf0\xdc\x9b\x94\x9c\x9c\xcc\x98\x31\x63\x08\x0f\x0f\x17\
-\xed\xa5\x78\xfa\xf4\x29\x2b\x57\xae\xb4\x7b\x15\x1d\xf7\x52\x08\
-\x70\xf9\x2b\x6a\xf6\x5e\x81\xce\xac\xe4\xed\xed\x47\x69\x78\x7b\
-\x2e\x9d\x06\x7c\x49\x83\xf7\xff\xc5\xda\x0f\x06\x11\xe8\x5a\x3c\
-\xb9\x6c\xef\x4d\x4d\x4d\xe5\xc9\x93\x27\x2c\x5e\xbc\x98\xec\xec\
-\x6c\x51\xe3\x2d\x93\xc9\xf8\xed\xb7\xdf\xd8\xb3\x67\x4f\xbe\x2c\
-\xa1\x8e\x22\xf9\xda\x2a\x5a\xd7\x9f\x80\xa5\xdd\x70\x06\x4e\x9f\
-\x46\xea\xb2\xc1\xec\x3f\x70\x9a\x80\x77\x4e\xf3\xdb\x87\xf5\x8b\
-\x4d\x92\x9e\x1f\x70\x58\x49\x49\x49\x41\xa3\xd1\x30\x76\xec\x58\
-\x14\x0a\x85\xa8\x39\xa9\x50\x28\x38\x78\xf0\x20\x17\x2e\x5c\xb0\
-\x7b\xf0\x1d\x97\xcd\x4a\xdc\xde\x8f\x18\xf4\xe1\x06\x2e\xde\xf2\
-\x66\xed\xbd\x23\x9c\x1f\x51\x9b\xd5\xb7\x3d\x99\xf8\xf1\xb7\xcc\
-\x18\xd2\xb0\x58\x64\xc9\x36\x5f\xcc\x66\x33\xf1\xf1\xf1\x68\xb5\
-\x5a\x3e\xf8\xe0\x03\xf4\x7a\xbd\xc3\x7d\x12\x04\x81\xcc\xcc\x4c\
-\x36\x6c\xd8\x40\x42\x42\x82\x5d\x6f\x8e\x7b\x4d\x05\x0e\xcf\x69\
-\x46\x9f\x7f\x99\x98\xba\x62\x27\x63\xbc\x8f\xf1\xfa\xd4\x4f\xb9\
-\x79\xd5\xc0\x84\x93\x57\x98\x56\xdd\xb5\x58\xb2\xe5\x2d\x31\x12\
-\x17\x17\x47\xe5\xca\x95\x19\x36\x6c\x98\xe8\x64\x45\x2e\x2e\x2e\
-\x7c\xfc\xf1\xc7\x24\x24\x24\xd8\xc7\xcd\x51\xd9\xac\x99\x77\x99\
-\x39\x72\x2c\x7b\xaf\xdc\x25\x59\x68\xc6\xea\xcf\x1b\x31\x68\xd8\
-\x57\x54\xaf\x53\x83\x59\xab\x76\xd0\xba\xbc\xbc\xd8\xeb\xc3\xb6\
-\xb7\xc5\xc4\xc4\xd0\xac\x59\x33\x9a\x34\x69\x22\x9a\xbc\x65\x64\
-\x64\xb0\x60\xc1\x02\x9e\x3d\x7b\x26\x79\x02\x25\x48\x90\x48\xa0\
-\x04\x09\x12\x5e\x04\x24\x24\x24\x90\x94\x94\x94\xaf\x98\xb4\x20\
-\x08\xc4\xc4\xc4\x20\x97\xcb\x31\x9b\xcd\xf8\xf8\xf8\x30\x71\xe2\
-\x44\x1a\x35\x6a\x24\xfa\x3d\x66\xb3\x99\x3b\x77\xee\x90\x95\x95\
-\x85\x4c\x26\x23\x3b\x3b\x9b\x5b\xb7\x6e\x15\xe9\x15\xf4\xf1\xf1\
-\xa1\x6c\xd9\xb2\x00\x3c\xba\x9c\xcc\x9b\xdb\x0e\xd1\x42\xb8\xcb\
-\x37\x2b\x36\x71\x34\xc6\xcc\x82\x7b\xf1\xec\x99\xb1\x90\xfb\xe9\
-\x99\x68\x64\x6a\xee\xdd\xbf\x0f\x85\x18\x19\x0a\x85\x82\xa7\x4f\
-\x9f\xe6\xfb\xed\xc3\x0f\x3f\x74\x7a\x1c\xbf\xfd\xf6\x5b\xbb\x41\
-\x98\x95\x95\xc5\xbd\x7b\xf7\xf2\x65\x0f\xfc\x2b\x84\x86\x86\xe2\
-\xe9\xf9\xfc\x78\x5e\x8b\x96\x1a\x7d\x57\x71\x2e\x20\x8e\xb3\xee\
-\x71\x2c\x9e\x78\x94\x1f\x52\x53\xf1\xf9\xa0\x0e\x53\x37\x68\xd9\
-\xfc\x9a\x9e\x5b\xf7\x1f\x17\x69\x44\x66\x66\x66\xda\xb3\x28\xd6\
-\xad\x5b\x97\xd9\xb3\x67\x13\x10\x10\x20\x5a\xae\xec\xec\x6c\x7e\
-\xfc\xf1\x47\x7b\xa9\x81\xf8\xf8\x78\xae\x5f\xbf\x5e\xa4\x01\x59\
-\xbe\x7c\x79\x7b\xe6\xd7\xd3\x27\xf4\xcc\x3b\x7b\x82\x6a\xfb\x3e\
-\x63\xda\xf1\x07\x84\x65\x24\x70\x28\x3e\x8a\xef\x67\xac\x20\xe6\
-\x51\x07\xf0\xb5\x92\x98\x98\x58\xa0\xc1\x2b\x08\x02\x4f\x9f\x3e\
-\xb5\x13\x51\xa3\xd1\x48\xf5\xea\xd5\x19\x3f\x7e\xbc\x53\x3a\xab\
-\x56\xad\x1a\x27\x4e\x9c\xb0\xd7\xb1\x8b\x8f\x8f\x27\x2a\x2a\xca\
-\x4e\xe6\xff\x64\x60\x5b\xad\xa8\xdd\xdc\x08\x09\x09\xc5\xc5\xf5\
-\xf9\xbc\xd5\xde\x89\x65\xcc\xd1\x27\x78\xdd\xfb\x99\x65\xab\xbe\
-\x24\xa2\xe2\x3b\xdc\xde\xf2\x33\x6f\x54\x68\xc1\xf9\x0f\xaf\x53\
-\x31\x39\x89\x98\xf8\x84\x02\x8b\xb5\xcb\xe5\x72\x9e\x3c\x79\x62\
-\x27\x6b\x16\x8b\x85\x06\x0d\x1a\x30\x63\xc6\x0c\xa7\x64\x2b\x55\
-\xaa\x14\xbf\xff\xfe\xbb\xdd\x68\x8f\x8e\x8e\xe6\xf6\xed\xdb\x05\
-\x86\x75\x5b\xad\x56\xd4\x6a\x35\xe1\x15\x2b\xfe\x9b\x00\x25\x12\
-\x15\xad\xe0\x8b\x5f\x8e\x92\x36\xbf\x27\x0b\xb7\x9c\xa6\x79\xeb\
-\xd9\x24\x2c\x2b\xc3\x92\xcd\x87\x88\xce\x6a\x88\x39\x31\x0a\x6d\
-\x01\x63\x65\xc3\xc3\x87\x0f\xf3\x11\xb8\x69\xd3\xa6\xf1\xce\x3b\
-\xef\x38\x25\x9b\x2d\x83\xaa\xad\xdd\x3b\x77\xee\xa0\xd1\x68\x0a\
-\xf4\x54\x59\x2c\x16\xfc\xfc\xfc\xec\xfb\x08\xe8\x48\xcb\x6c\xcc\
-\x81\x0d\xf5\xd9\xf4\xdb\x59\x0e\x07\xa5\x31\x73\xf5\x11\x5a\x64\
-\x2c\x40\xe8\xb7\x81\x71\x17\x86\xf3\x2c\x3e\x9a\xf4\x8c\xcc\x02\
-\xe7\xa4\x9b\x9b\x1b\x09\x09\x09\x76\x42\x23\x97\xcb\x69\xd9\xb2\
-\x25\xe3\xc6\x8d\x73\x7a\x1f\xb1\x95\xd3\x30\x18\x0c\x44\x45\x45\
-\xd9\xf7\xe1\x82\xf6\xd5\x32\x65\xca\xe0\xef\xef\x0f\x80\xf1\x59\
-\x3a\xa1\x7d\xdf\x63\xfd\xf2\xb6\xdc\xfc\xa0\x2e\xe3\x3e\x73\xe7\
-\x97\xc7\x0f\x29\x7d\xf1\x7b\x7e\xf9\xf5\x00\x2d\x86\x75\x26\xea\
-\xf6\x6d\x8c\x85\x84\xf7\xdb\xea\x04\xda\x6a\x3b\xca\xe5\x72\x66\
-\xce\x9c\x49\xfd\xfa\xf5\x45\xcb\x95\x99\x99\xc9\xa9\x53\xa7\xec\
-\xe4\xdf\x64\x32\x71\xf3\xe6\xcd\x7c\x3a\xb3\xd5\xeb\x0c\x0b\x0b\
-\x2b\xb2\x7e\xac\x04\x09\x12\x09\x94\x20\x41\x82\x04\x27\x71\xe7\
-\xce\x1d\x4e\x9d\x3a\x95\xaf\x50\xb7\x4c\x26\xe3\xfe\xfd\xfb\x28\
-\x14\x0a\x7b\x9a\xf0\xf4\xf4\x74\xa7\xde\x63\x2b\x88\x2d\x93\xc9\
-\x90\xcb\xe5\x3c\x7d\xfa\x94\xfd\xfb\xf7\x17\x4a\x02\x05\x41\xa0\
-\x4e\x9d\x3a\xa4\xa5\x26\xb1\xed\xd8\x43\xc6\x0e\x7f\x9d\x01\xca\
-\x9b\x7c\x38\x66\x01\xd1\xee\xb5\xd0\xf0\x18\x8f\xe0\x20\x22\xd2\
-\x12\xb9\x65\x35\x53\x25\x2b\x8b\x03\x07\x0e\x60\x29\xa4\x58\xbc\
-\x20\x08\xdc\xbb\x77\x8f\x72\xe5\xca\xe5\x33\x50\x6c\x64\x4c\x0c\
-\xb4\x5a\x6d\x3e\xe3\x3a\x31\x31\x91\x5d\xbb\x76\x15\x68\x94\xda\
-\x0c\xc7\xbe\x03\x06\x93\x79\x79\x1b\xc7\x4e\x45\x93\x51\xb3\x27\
-\xe3\xfa\x57\xe4\x83\x71\xab\x09\xec\xd7\x80\xe8\x8c\xea\x94\x02\
-\x7c\x6b\xd7\x24\xed\xf2\x0d\x9e\x24\x78\xb0\x7f\xff\xfe\x42\xfb\
-\x21\x08\x02\xf1\xf1\xf1\xa8\x54\x2a\x04\x41\x40\xaf\xd7\x93\x95\
-\x95\xe5\x14\x09\x7c\xf6\xec\x99\xdd\x00\x55\x2a\x95\x5c\xba\x74\
-\xc9\xde\x7e\x41\x50\xa9\x54\xbc\xd6\xfd\x15\xd2\x2e\x9e\x62\xed\
-\xf1\x4c\x5e\x1b\xf1\x36\x4d\x4c\x67\x19\xbc\xea\x04\xc1\xe3\xfa\
-\x10\x7f\x3b\x8d\xf2\x41\x65\x09\xd6\x67\x93\x69\xd6\x71\x2f\x2a\
-\x96\x93\x27\x4e\x14\x68\xf8\xd9\x08\x44\x72\x72\xb2\xdd\x43\x51\
-\x12\x77\x94\xb2\xb2\xb2\xec\x3a\x92\xcb\xe5\x5c\xbb\x76\x8d\x52\
-\xa5\x4a\x15\x78\xdf\xd0\x6c\x36\x13\x14\x54\x96\x5e\xaf\xbb\x72\
-\xe0\xcb\x7f\x71\xd9\x3d\x92\x99\xa3\x3e\xa1\xd7\xa5\x9f\x78\xef\
-\xc0\x55\x4a\xfb\xe9\xf1\x09\x50\x63\xc6\x87\x7a\x35\x92\x88\x89\
-\x03\x59\x5c\x14\x7b\x0f\x1d\x2d\xb0\x84\x81\x6d\x2d\xd8\x0e\x0c\
-\x6c\xde\x17\x67\x61\xf3\x46\xd9\xd6\xef\xb5\x6b\xd7\xb0\x58\x2c\
-\x85\x92\xc0\xd2\xa5\x4b\x13\x56\xbe\x0c\xf7\xf6\xaf\xe2\xc7\x7b\
-\xfe\xf4\x1f\x3e\x13\xf7\x07\x5b\x99\x76\x00\xaa\x7f\xf8\x08\x1c\
-\x8a\x90\x6b\x00\x00\x20\x00\x49\x44\x41\x54\x21\xa1\x02\x16\x37\
-\x25\x6a\x37\x25\x18\xe0\xe4\xa9\x93\x24\x27\x3f\x2d\x74\x2e\x24\
-\x25\x25\xe5\x23\x4a\x69\x69\x69\x4e\xc9\xa5\xd7\xeb\xf3\x79\xda\
-\x64\x32\x19\xfb\xf7\xef\xc7\xc3\xc3\xa3\x40\xa2\x64\x32\x99\xa8\
-\xf3\x52\x3d\xca\x06\xcb\x58\xff\xe5\x1a\x12\xc3\xfb\xf2\xce\x9c\
-\x0f\x78\x6f\x60\x0f\x14\x9d\xe7\x60\x92\x25\x62\xcd\xc8\x42\x5f\
-\xbe\x1e\x9e\x77\xf7\x63\x30\x0e\xe1\xfc\x85\x0b\xdc\xbd\x7b\xaf\
-\xc0\xfd\x49\xad\x56\xff\x29\xcb\x71\x51\x87\x3e\xc5\x25\xb8\xb6\
-\x39\x9e\x95\x95\xc5\x99\x33\x67\x88\x89\x89\x29\x50\x6f\x5a\xad\
-\x96\x8e\x1d\x3b\xe2\xed\x06\xdf\x7f\xb5\x14\x75\x9d\xfe\x8c\xec\
-\x51\x8b\xf3\x3b\x97\xb0\xe6\x9c\x0a\x75\x65\x4f\xc2\x8d\x46\x1e\
-\x9b\x03\x51\x92\x85\xde\x68\xe5\xd7\xa3\x47\x0b\xf5\xa0\x2b\x14\
-\x0a\x2e\x5c\xb8\x60\x0f\x23\xb6\x5a\xad\x76\x0f\x9e\x58\x4f\x60\
-\x4e\x4e\x8e\x9d\x00\xda\xe6\xf8\xb1\x63\xc7\xf2\xdd\x5b\xb6\x65\
-\xa3\x2e\x5b\xb6\xac\x44\x02\x25\x48\x90\x48\xa0\x04\x09\x12\xfe\
-\xdb\x68\xdc\xb8\x31\x75\xea\xd4\xc9\xf7\x71\x97\xc9\x64\x9c\x39\
-\x73\xc6\x5e\x78\xdd\x76\x42\xeb\x0c\x3c\x3c\x3c\xec\xa7\xea\x26\
-\x93\x89\x90\x90\x10\x46\x8c\x18\x51\x64\xbb\x6a\xb5\x9a\xcb\x17\
-\x7e\xc7\x68\x31\x73\xe7\xd4\x41\x52\x9b\xb5\xe5\x9d\x39\x73\xf9\
-\x70\xea\xfb\x18\xbd\x7d\x31\xe9\x4d\xa4\xa8\x3d\xa8\x81\x80\xa7\
-\xaf\x0f\x23\x47\x8c\x28\xb4\x3d\xb9\x5c\xce\xfd\xfb\xf7\x49\x49\
-\x49\xb1\xff\xa6\xd1\x68\x9c\x92\xcd\xcd\xcd\xcd\x2e\x9b\x20\x08\
-\x94\x2f\x5f\x9e\xb1\x63\xc7\x16\x59\x14\xdb\xd3\xcb\x8b\xb8\x3b\
-\x06\x0c\xda\x1c\x12\x6e\x1f\xe7\x48\xc8\x00\xde\x1b\xf5\x0a\xef\
-\xdf\xc9\xc1\x5d\x16\x8f\x16\x30\x25\x26\xa0\xf0\x0d\xa4\x5c\x58\
-\x59\x46\x8d\x1a\x55\x68\x3f\x54\x2a\x15\x27\x4f\x9e\x24\x3a\x3a\
-\xda\xae\xc7\xe2\xd4\x61\x2c\x0c\xee\xee\xee\x76\x19\x0c\x06\x03\
-\x6d\xdb\xb6\x65\xc0\x80\x01\x85\x1a\x83\x82\x20\xa0\x71\x95\x11\
-\x7b\x57\x87\x20\xcb\xe4\xe8\xc6\x9f\x70\x7f\xe7\x75\x16\x2d\xe8\
-\x4b\xc3\x4f\x8e\xd3\xae\xae\x1f\x56\x83\x8e\x2c\x85\x0a\x85\x45\
-\x46\xfd\xfa\xf5\xa9\x59\xa3\x46\xa1\xc4\x3d\x31\x31\x91\x83\x07\
-\x0f\x8a\xa8\xc5\x58\x30\x5c\x5c\x5c\xec\xef\x34\x99\x4c\xb4\x6c\
-\xd9\x92\xd1\xa3\x47\x17\x7a\xd7\x50\x2e\x57\xe1\xee\xfa\x5c\x67\
-\x06\x77\xb8\xbe\x7b\x3d\x96\xd6\x83\xe8\xdb\x30\x9e\x41\x5f\x6c\
-\xc6\x63\x58\x37\xe4\x40\x7c\x82\x2b\x95\xfd\xe0\xa5\x80\x7a\x84\
-\x57\xa9\x51\xa8\xc1\xfd\xe8\xd1\x23\x96\x2d\x5b\x66\x5f\x6b\x25\
-\x61\x00\xdb\xda\xb0\x79\x39\xdb\xb5\x6b\x47\xb7\x6e\xdd\x0a\x2d\
-\x64\x2e\x97\xcb\x91\x01\x66\x93\x09\xf3\xb3\x3b\x1c\xdd\xb0\x95\
-\xee\x43\xbb\xb2\x61\xd6\x16\xca\x7d\xfd\x88\x05\x83\xca\xa1\xb4\
-\x80\xc9\x64\xc6\x68\x81\xde\xbd\x7b\x63\x32\x99\x0b\x9d\x07\x77\
-\xee\xdc\x61\xc9\x92\x25\xf6\xbe\x14\xe4\x11\x75\x44\x67\x79\xc7\
-\xc7\x6c\x36\x33\x6c\xd8\x30\xbc\xbd\xbd\x0b\x3d\x74\x71\x71\x75\
-\x07\x92\xd1\x6b\x0d\x20\xbb\xc7\xaf\x5b\x63\x18\xf3\xee\x64\x16\
-\xac\xd8\x4f\x74\x87\x8a\x84\xa9\xd5\xb8\x64\x27\x90\xe9\x5b\x1e\
-\x85\x52\xc9\x2b\xaf\xbc\x42\xbb\x76\x2f\x17\xa8\x37\x8d\x46\x83\
-\x56\xab\xe5\xd0\xa1\x43\xf9\xc6\xcf\x59\xd8\xee\x14\x5b\x2c\x16\
-\xbc\xbd\xbd\xe9\xd9\xb3\x27\xb5\x6a\xd5\x2a\x94\xbc\xbb\xb9\xa9\
-\xb1\xe8\x9f\x61\x30\xe8\xc9\x7a\x78\x93\x93\x77\x21\xb2\xdb\x24\
-\x16\x3d\xda\x4d\xcd\x85\x89\xe4\xba\x2b\x71\x97\xeb\x30\x5b\x15\
-\xb8\x2a\x05\x06\x0d\x1a\x88\xc5\x62\x2d\x54\x6f\xde\xde\xde\x76\
-\x6f\xab\x6d\x8f\x73\xe6\x1e\x5f\xde\x7d\xc4\x6a\xb5\xe2\xee\xee\
-\xce\xd0\xa1\x43\xff\x24\x97\x4c\x26\xc3\xcd\xcd\x0d\x09\x12\x24\
-\x48\x24\x50\x82\x04\x09\xff\x65\xb8\xba\xba\xfe\x25\x11\xb3\x7d\
-\xb4\x05\x41\x20\x37\x37\x97\x05\x0b\x16\xb0\x6d\xdb\x36\xd1\xef\
-\x31\x1a\x8d\x5c\xba\x74\x89\xe6\xcd\x9b\xdb\x0d\x5d\x4f\x4f\xcf\
-\x62\x7d\xf0\xeb\x36\x68\x42\xdd\xc6\x72\x9e\x1e\x5d\x49\x9f\x01\
-\xa3\x69\x54\x51\x40\x17\xd2\x82\xfa\x15\x9e\xf0\x69\xf3\x48\x9e\
-\xd5\x1e\xca\x04\x77\x0d\x82\x5c\x8e\x97\x97\x57\xb1\x0c\xc9\xbc\
-\x18\x3b\x76\x2c\x2e\x2e\x2e\xa2\xef\x04\x1a\x8d\x46\x12\x13\x13\
-\xed\xbf\x29\x95\x4a\xd4\x6a\x75\xb1\x9e\x2f\xdb\x6a\x18\x83\x5b\
-\x58\x78\x72\xf7\x30\xd3\xde\xee\xcb\x57\x9e\x9e\x44\xf4\x9f\xc6\
-\xb0\xa1\xdb\x78\xab\xcb\x6b\x58\xa3\x2d\xbc\x7f\xf2\xb9\xd7\xb2\
-\x38\xb2\xd9\x12\x8a\x28\x95\x4a\x1e\x3e\x7c\xc8\x94\x29\x53\xf0\
-\xf5\xf5\x15\x4d\x9a\x32\x33\x33\xc9\xcd\xcd\xb5\x87\x86\xb9\xb9\
-\xb9\xe1\xed\xed\x5d\xac\x67\xcb\xb5\x1d\xce\xfb\xed\x15\x5c\x5e\
-\x3a\x8e\x81\x7d\x4f\x50\xd5\x12\x45\xa3\xf6\x73\xf1\x77\xbb\xc3\
-\xe8\x3a\x4d\x70\x6d\x3e\x8a\xe1\x65\x83\x70\x75\x91\xe3\xea\x52\
-\x78\xfd\xb9\xdc\xdc\x5c\xfb\x1d\x39\xa5\x52\x49\x6c\x6c\x2c\xef\
-\xbe\xfb\xae\x68\xef\x8b\x4c\x26\xe3\xd6\xad\x5b\x76\x8f\x88\x4d\
-\x36\xa5\x52\x59\x8c\x71\x76\xa3\xfb\xbb\x1f\xd1\x4d\xae\xe0\xfe\
-\xfa\x37\xe8\xdb\x6e\x07\x55\xc2\x82\x68\x34\xe4\x2d\x2c\x57\xd6\
-\x30\xf6\xb5\x0f\x38\x5b\x7e\x26\x73\xdd\x40\xc0\x15\x6f\x55\xe1\
-\x07\x1d\x79\xb3\xca\x2a\x14\x0a\xce\x9f\x3f\xcf\xdb\x6f\xbf\x2d\
-\xba\x58\xbc\x42\xa1\xe0\xf7\xdf\x7f\x47\xa5\x52\xd9\x9f\x77\x73\
-\x73\x2b\xf6\x9c\xac\xd2\x65\x22\x1f\x75\x89\xe3\xc0\xa7\x93\x79\
-\xeb\xad\x03\x98\x6e\xdc\x66\xe0\x98\x29\xc4\xed\x7d\x9b\x57\x77\
-\xfa\x51\xa7\xe3\x30\xca\xf8\x83\x3b\x45\x1f\x9e\x78\x78\x78\xd8\
-\xc7\x57\xad\x56\xb3\x73\xe7\x4e\xb2\xb3\xb3\x45\xdf\x51\x35\x9b\
-\xcd\x1c\x39\x72\x84\xd0\xd0\xd0\x7c\xef\x28\x5e\x86\xd7\x60\x86\
-\x4c\xfd\x10\x85\xca\xc0\x92\x57\xeb\xb2\xda\xbb\x11\xc1\x75\x06\
-\xd0\xd1\x3f\x8e\x25\x8b\xa6\x31\xef\xca\x59\xba\x7f\xfe\x1b\xee\
-\x4a\x50\xa8\xd4\xb8\xb9\xa9\x8b\xdc\x3b\x6d\xb0\x58\x2c\x1c\x3a\
-\x74\x88\xa9\x53\xa7\x8a\xce\x5c\xeb\xea\xea\x4a\x42\x42\x02\x81\
-\x81\x81\x76\x42\xe8\xee\xee\x5e\xbc\x83\x1c\x55\x20\x63\x3e\x98\
-\x47\x76\xd4\x31\x26\xcf\x98\x8c\x36\x20\x0c\xfd\x1d\x2b\x13\x7b\
-\xfa\xd3\xa7\xeb\x40\x22\x7d\x0d\xb4\x1f\xf7\x15\x32\xc0\xc3\xa3\
-\xe8\xa8\x07\x5b\x16\x4f\x9b\xe7\x6e\xc1\x82\x05\xfc\xf4\xd3\x4f\
-\xa2\xf7\x7f\xad\x56\xcb\xdd\xbb\x77\xe9\xd8\xb1\xa3\xbd\x5d\x67\
-\x0f\xa8\x24\x48\x90\x48\xa0\x04\x09\x12\x5e\x48\x5c\xbe\x7c\x99\
-\x25\x4b\x96\x90\x94\x94\x44\xa3\x46\x8d\x98\x35\x6b\xd6\x3f\xaa\
-\xff\xb6\x7b\x29\xf0\xdc\x4b\xb2\x6f\xdf\xbe\x12\x69\xd7\x16\xea\
-\x64\x3b\xed\x2e\x0e\x6c\x27\xec\xa5\x5b\x8d\x62\x7f\xad\xd6\x5c\
-\xbb\x6f\xa1\x66\xbd\x2a\xb8\x99\x32\x08\x6d\x32\x08\x8f\xc0\x0a\
-\x94\xf1\x2e\xbe\xa7\xf2\x8f\x86\xf5\xaa\x55\xab\x4a\x74\xec\x1c\
-\x31\xdc\x05\xb9\x12\x85\x1c\x42\xab\x77\x62\xe5\xa6\x9a\x24\x3c\
-\xd3\x11\x54\xa1\x22\x5e\x3d\xb6\x53\xfa\xd2\x55\x5c\xc2\x22\xa9\
-\xe4\xe5\xf8\xbb\x05\x41\x20\x3b\x3b\x5b\x74\xbd\xb1\x3f\x92\x14\
-\x5b\xbb\x16\x8b\xa5\xd8\x61\x61\x32\xf9\xf3\xcf\x57\x9d\xf1\x4b\
-\xf9\xb9\xe7\x1d\x1e\x67\x79\x52\x35\x22\x04\x6b\x4e\x38\xcb\xeb\
-\x25\x12\x10\x5a\x89\x20\x1f\x79\xb1\xe5\xb2\xf5\xc1\x6c\x36\xa3\
-\xd3\xe9\x58\xb4\x68\xd1\xdf\xa6\x37\xc5\xbf\xc3\x04\x23\x06\x7e\
-\xc3\xde\xd6\x71\x68\xad\x1a\x42\xca\x05\x61\x4e\x6e\xc0\xef\x8f\
-\x0c\x2c\xaa\x5f\xad\xd8\x59\x26\xf3\xae\x03\xb3\xd9\x4c\x42\x42\
-\x02\x4b\x97\x2e\x75\x5a\x1e\x6f\x6f\x6f\x71\x49\x73\xe4\x72\x20\
-\x94\xf6\xd3\xd7\x53\x39\xea\x3e\x66\xef\xf9\x54\x08\xf4\x26\xab\
-\xc3\x3a\x6e\x27\x5a\xa9\x59\xbb\x0a\xee\x22\xc7\xf4\xc6\x8d\x1b\
-\x25\x52\x2c\x3c\x24\x24\x44\x84\xde\x04\x94\x2a\x25\xa0\x64\xe4\
-\xfa\x13\xb4\x8d\x4f\xa7\x52\x95\x4a\xb8\xca\x8d\x7c\xe8\x5f\x85\
-\x74\xaf\x45\xd4\xaa\x50\x0a\x85\xe0\xb8\x6c\x7a\xbd\x9e\x3b\x77\
-\xee\x70\xe7\xce\x1d\xa7\x65\xf3\xf5\xf5\xb5\xef\x91\xc5\x96\x4d\
-\x10\x50\xc8\xe5\x78\x47\xb4\x66\xe5\xfa\xea\xdc\xbe\x9d\x88\x57\
-\x85\x8a\x04\x7b\xba\xf0\xf8\xda\x69\x9e\x79\xd6\xa0\x6e\x45\x3f\
-\x87\xd7\x82\x6d\x9f\xde\xb3\x67\x4f\x89\xad\x33\x29\x33\xa8\x04\
-\x09\x12\x09\x94\x20\xe1\xff\x24\x72\x72\x72\xf8\xe4\x93\x4f\x98\
-\x37\x6f\x1e\x32\x99\x0c\x85\x42\xc1\xfe\xfd\xfb\x59\xbe\x7c\x39\
-\x9b\x37\x6f\xa6\x4d\x9b\x36\xff\x18\x59\x6c\xc9\x45\xe2\xe2\xe2\
-\x4a\xb4\xdd\xbe\x7d\xfb\x8a\xb5\x1e\x50\xfb\x55\xa6\x91\xcd\x96\
-\x91\x7b\x51\xad\x56\x6d\x51\x4d\xe9\x74\x3a\x6a\xd7\xae\x5d\xe2\
-\x99\xea\x44\xa7\x3f\x17\x64\x78\x05\x96\xc3\x2b\xd0\xf6\x83\x3b\
-\x35\x1a\x34\x11\x4d\x66\x1a\x37\x6e\x5c\xa2\xb2\xe5\xe6\xe6\xb2\
-\x69\xd3\x26\x71\xb2\xc9\xe4\xf8\x96\xad\x8e\xaf\xed\xdf\x1e\xfe\
-\x44\xd6\xf6\x17\xd5\x0f\xa3\xd1\xc8\xf2\xe5\xcb\x59\xbe\x7c\x79\
-\x89\xc9\xe6\xcc\x1d\x3c\x99\xc2\x8d\x32\xa1\x95\xfe\xf3\x43\xe9\
-\x4a\xb4\x29\x2d\xfe\x80\x64\xc9\x92\x25\xf6\xf0\xc9\x92\xc0\xa5\
-\x4b\x97\x44\xdf\x9f\x14\x14\x6e\x54\xa8\x5a\xf3\x3f\xa4\xb2\x4c\
-\x04\x8d\xcb\x88\x5b\x13\x3e\x3e\x3e\x1c\x3f\x7e\xbc\x44\xd7\x9a\
-\xf8\x62\xf1\xe0\xee\xe3\x4f\x4d\x1f\xdb\x1c\x54\x12\xfe\x52\x63\
-\xd1\x6b\xcd\xd3\xd3\xb3\x44\xee\x03\xe6\xc5\xf2\xe5\xcb\x45\xef\
-\x23\x0a\x75\x69\x6a\xd6\xfd\xcf\x24\xac\xf0\x52\x4b\x2a\x88\x5c\
-\xf3\x1d\x3a\x74\x60\xe2\xc4\x89\x25\x2a\x5b\xef\xde\xbd\xa5\x0c\
-\xa1\x12\x24\x48\x24\x50\x82\x84\xff\x5b\x88\x8e\x8e\x66\xca\x94\
-\x29\x6c\xdd\xba\x95\xe0\xe0\x60\x3e\xfc\xf0\x43\xca\x97\x2f\xcf\
-\xe2\xc5\x8b\x39\x76\xec\x18\x43\x86\x0c\x61\xdb\xb6\x6d\x34\x68\
-\xd0\xe0\x1f\x21\x8f\x2d\xd4\x51\xa7\xd3\x15\x7a\x97\xc8\x11\x04\
-\x04\x04\xbc\x10\x27\xc1\x36\xd9\x92\x92\x92\x4a\xa4\x3f\xcf\x93\
-\x86\x04\xbd\x50\xa7\xdc\xc9\xc9\xc9\x25\xd2\x8e\xcd\x7b\xfb\xa2\
-\xc8\x96\x99\x99\x89\x5e\xaf\x2f\x11\x43\xb2\x24\xee\x4d\x96\x24\
-\xcc\x66\x33\x29\x29\x29\x25\x32\xd6\x32\x99\xec\x85\xa9\xc9\x66\
-\xb5\x5a\xd1\xe9\x74\x64\x66\x66\x96\x48\x5b\x85\xdd\x01\xfc\xff\
-\x0d\x8b\xc5\xc2\xb3\x67\xcf\x0a\xbc\xb7\x27\x46\x6f\x25\x71\xbf\
-\xb0\x24\xf6\x48\x9d\x4e\x47\x7a\x7a\x7a\x89\x15\x8b\x0f\x08\x08\
-\x90\x08\xa0\x04\x09\x12\x09\x94\x20\xe1\xff\x1e\x7e\xf9\xe5\x17\
-\xce\x9c\x39\x43\xdb\xb6\x6d\x59\xb3\x66\x8d\xfd\xde\x4a\x87\x0e\
-\x1d\x58\xbc\x78\x31\xef\xbc\xf3\x0e\x2b\x56\xac\xa0\x6a\xd5\xaa\
-\xc5\xbc\xc3\xf2\xf7\x42\x2e\x97\x13\x13\x13\xc3\xa2\x45\x8b\x88\
-\x8d\x8d\x15\x51\x8f\xeb\xcf\xc6\xcd\x84\x09\x13\x9c\x2a\x5e\x0d\
-\x60\xc9\x4d\x22\xdd\xec\x87\xaf\xda\x44\xcc\xa3\xc7\xb8\x07\x84\
-\x50\xca\xd3\xb1\xc4\x35\x0a\x85\x82\xb8\xb8\x38\x26\x4d\x9a\x54\
-\x22\x46\x49\x4e\x4e\x0e\x9b\x37\x6f\x76\x7a\x8c\x72\xb2\xb2\x90\
-\x29\x5d\x70\x73\x95\x11\x7d\xfb\x36\xb2\xd2\x55\x28\xe7\xe3\xd8\
-\x78\x09\x82\x40\x74\x74\x34\x6f\xbc\xf1\x46\x89\x18\x93\xde\xde\
-\xde\x8c\x1c\x39\x52\x74\x2d\x45\x1b\xd2\x53\x93\x51\xfb\xf8\x23\
-\x33\xe6\x10\x1d\x93\x88\x5f\xd9\x50\x7c\xd4\x4a\x87\xf5\xb6\x71\
-\xe3\x46\x76\xed\xda\x55\x22\x86\xa9\xd5\x6a\x65\xeb\xd6\xad\xce\
-\xcd\x47\x93\x91\xac\x5c\x2d\xae\x9e\x9e\x90\x1e\xcf\xbd\xb8\x5c\
-\xc2\x6b\x54\x44\x2d\xa2\x2f\xeb\xd7\xaf\xe7\xfb\xef\xbf\xb7\x67\
-\xe6\x75\x06\x7e\x7e\x7e\x8c\x1c\x39\xd2\xc9\x39\x60\x20\x36\x2e\
-\x8b\x72\x65\xfd\xc8\x49\x89\x23\x36\xcd\x42\xf9\xb0\x72\xb8\xc9\
-\x1d\x5b\xf7\x3a\x9d\x8e\x39\x73\xe6\x70\xf6\xec\x59\xa7\xf5\x65\
-\x36\x9b\x69\xd9\xb2\x65\xbe\x0c\xbf\x22\xb4\x46\x76\x7a\x3a\x56\
-\x8d\x2f\x1e\x0a\x13\xf1\x0f\xef\x93\xa5\x0c\x24\x22\xc4\xc7\xe1\
-\x96\x74\x3a\x1d\xc3\x86\x0d\x23\x27\x27\xc7\xa9\xf5\x61\xbb\x2b\
-\x5d\xb6\x6c\x59\xda\xb7\x6f\xef\xe4\xc4\xce\xe4\x71\x82\x85\x90\
-\x60\x0f\xe2\xee\xdd\x46\xef\x5e\x96\xf0\x32\xde\x0e\x35\xa1\x52\
-\xa9\xb8\x79\xf3\x26\x0b\x17\x2e\x24\x3e\x3e\xbe\x44\xf6\x92\x11\
-\x23\x46\xfc\xed\x07\x13\x12\x09\x2d\xd9\x83\x02\x69\x3c\x25\x12\
-\x28\x41\xc2\xff\x3c\x4e\x9f\x3e\x4d\x76\x76\x36\x53\xa6\x4c\xa1\
-\x5b\xb7\x6e\xf9\x12\x17\x00\x74\xed\xda\x95\xef\xbe\xfb\x8e\x2d\
-\x5b\xb6\x30\x7d\xfa\xf4\x7f\x04\x09\x94\xc9\x64\xa4\xa5\xa5\x71\
-\xf0\xe0\x41\x22\x23\x23\x89\x88\x88\x10\xdd\x96\xd1\x68\x64\xe3\
-\xc6\x8d\x5c\xbb\x76\x4d\x3c\x51\xb2\x02\x42\x36\x2b\xa7\x8c\xc5\
-\xa3\xff\x57\xd4\x35\x1c\xe2\xbb\x7f\xfd\x46\x76\x9d\x5e\x2c\x18\
-\xd1\x01\x0f\x75\xf1\xb7\x4b\x5b\xba\xfa\xc3\x87\x0f\x33\x7a\xf4\
-\x68\x7b\x22\x04\x31\x1f\x41\x9d\x4e\xc7\x37\xdf\x7c\xc3\xd3\xa7\
-\x4f\x9d\xfb\x28\x66\x47\xb3\x6e\xd5\x46\x6a\xbe\x32\x96\x32\xf7\
-\x97\xb1\xf4\x94\x80\x90\x65\x60\xe4\xe2\x39\x54\x73\xf0\x4b\x10\
-\x1b\x1b\xcb\xb1\x63\xc7\x18\x30\x60\x00\x01\x01\x01\xa2\xbd\x26\
-\x69\x69\x69\xfc\xf4\xd3\x4f\x74\xea\xd4\xc9\xb9\xac\x95\xe6\x7b\
-\x4c\x7b\x7b\x29\xd3\xbf\xf9\x82\xcc\x93\xeb\x58\xfb\xc3\x05\xd4\
-\x4d\xfa\xf0\xf6\x80\x8e\xf8\xab\x8b\x36\x08\x6d\x63\x2a\x93\xc9\
-\xb8\x7c\xf9\x32\x47\x8e\x1c\x61\xd2\xa4\x49\xe4\xe6\xe6\x8a\x2e\
-\x16\x7f\xf9\xf2\x65\x8e\x1d\x3b\xe6\xb4\x97\xfb\xc9\xed\x73\x6c\
-\x3c\x78\x85\x2e\x63\xfa\x70\x66\xd5\x6a\xd2\x75\x71\xc4\xef\x1b\
-\xcc\x17\x53\x9a\x39\x6c\x9c\x9e\x3f\x7f\x9e\x1b\x37\x6e\x30\x70\
-\xe0\x40\x7b\x32\x1e\x87\x8d\x06\x85\x82\x53\xa7\x4e\x71\xee\xdc\
-\x39\x06\x0f\x1e\xec\xd4\xc1\x44\xd6\xf5\x6d\x0c\xfd\xec\x29\xfb\
-\xd7\xbf\xc1\xba\x65\xf3\x89\x35\xf8\x12\xd9\xec\x15\x5e\xeb\xdc\
-\x00\x95\x03\x63\xad\xd5\x6a\x39\x78\xf0\x20\x69\x69\x69\xf4\xe8\
-\xd1\x03\x83\xc1\x20\x4a\x6f\x06\x83\x81\x3d\x7b\xf6\x60\xb1\x58\
-\xe8\xdf\xbf\xbf\x68\xb9\xf4\xe9\x29\x2c\xff\xe8\x63\xea\x7f\xb4\
-\x8c\x88\x87\x47\xd9\x74\xf4\x12\x99\x8f\x1e\xe1\x35\x74\x09\xef\
-\xd4\x73\x41\xe6\xc0\xfa\x37\x1a\x8d\xec\xde\xbd\x9b\xca\x95\x2b\
-\xd3\xa3\x47\x8f\x42\xcb\x2f\x14\x06\x57\x57\x57\x96\x2e\x5d\x8a\
-\xbf\xbf\x3f\x5d\xba\x74\x71\xca\xb8\x8e\xfa\xf9\x0b\xa6\x9e\xaa\
-\xc6\xe2\x9e\x06\x3e\xdb\xf5\x88\x4a\x7e\x4a\x9a\xf5\x1c\x4f\x83\
-\x30\x8d\x43\xf3\x28\x29\x29\x89\x5d\xbb\x76\xd1\xa0\x41\x03\xaa\
-\x57\xaf\x2e\x9a\xbc\xe9\x74\x3a\xd6\xad\x5b\x47\xfd\xfa\xf5\xff\
-\x76\x0f\xee\x8b\x16\xd9\xf0\x4f\x26\x80\xd2\x38\x4a\x24\x50\x82\
-\x84\xff\x69\xa4\xa7\xa7\x33\x66\xcc\x18\xce\x9d\x3b\x47\x76\x76\
-\x36\xee\xee\xee\x9c\x39\x73\x86\x85\x0b\x17\xe6\x29\x4e\xfc\x3c\
-\x23\xa5\x87\x87\x07\x0a\x85\xc2\x69\x6f\xd1\xff\x0f\x78\x78\x78\
-\xd8\x13\x80\x78\x79\x79\x31\x76\xec\x58\x7b\x66\x37\x51\xfc\x26\
-\x3b\x9b\xa8\xa8\x28\x7b\x62\x11\x85\x42\xe1\x78\x18\x9e\x00\xf7\
-\x56\xce\x64\xbf\xcc\x9b\x57\x1f\xdd\xe7\xec\x83\x53\x84\xf5\x1b\
-\xc1\xef\xcb\xb7\x73\xb5\x77\x13\x9a\xa9\x8b\x77\x8a\x6f\xcb\xea\
-\x67\xd3\xc3\xdc\xb9\x73\xf1\xf2\xf2\x12\x65\x9c\xc8\xe5\x72\x72\
-\x72\x72\xd8\xb1\x63\x87\xbd\x3d\x71\x9e\x4e\x33\xb7\x2e\x1e\xe5\
-\xc0\x91\x7b\xd4\xef\x97\xc0\xba\x05\x87\x68\xbc\xee\x07\x02\x96\
-\xf7\x65\xd1\xf6\x74\xd6\xf4\x29\xde\x29\x7e\xde\x77\x57\xad\x5a\
-\x95\x19\x33\x66\x50\xb9\x72\x65\x51\xd9\x18\x05\x41\x20\x36\x36\
-\x96\x83\x07\x0f\x22\x97\xcb\xb1\x58\x2c\xb8\xbb\xbb\x8b\xfa\xe8\
-\x9f\xfb\x62\x0e\x67\x33\xbd\xd1\xe6\x64\x70\xed\xe8\x51\x9a\x8f\
-\x1c\xc3\xc1\x6f\x0f\x71\xaf\x79\x5d\xfc\xab\x14\x5d\xc7\x50\xa3\
-\xd1\xd8\x33\x9f\xca\xe5\x72\xca\x95\x2b\xc7\xbc\x79\xf3\x44\xdf\
-\xc5\x52\xa9\x54\xac\x5f\xbf\xde\x9e\x06\xdf\x96\x1d\xd4\xe1\x73\
-\x09\x93\x8e\x5b\xfb\x57\x72\x21\xbe\x19\x8d\xee\xec\xe3\x46\x66\
-\x69\xde\x7b\xb3\x3b\x1f\x74\x1b\xc7\xe5\x49\x27\xa8\x53\x0c\xe7\
-\x89\xa7\xa7\x67\xbe\xec\xa0\xf5\xeb\xd7\x67\xf1\xe2\xc5\x18\x8d\
-\x46\x51\xeb\xcd\xc5\xc5\x85\x25\x4b\x96\x30\x6b\xd6\x2c\x7b\xbb\
-\xe2\xd2\xee\x9b\x39\x72\xf4\x00\x0f\x1e\x56\x20\x25\xf9\x1c\x51\
-\x39\xe5\x18\xfe\x4a\x30\xfb\xcf\x9e\xe0\x49\x93\x06\x54\x28\xc6\
-\x94\xb4\xad\x71\x9b\xb1\xd8\xb5\x6b\x57\xe6\xcd\x9b\x27\x7a\x3e\
-\xea\x74\x3a\xcc\x66\x33\xf7\xef\xdf\xb7\xcb\x26\xa6\xc6\x67\xaa\
-\x41\xcf\xc1\xf3\xa9\xd4\x31\xe7\x70\xfe\xf2\x2d\xca\xd5\x6a\x43\
-\xad\xaa\x9b\x68\xf8\xce\x26\xc6\x1c\x7d\x03\xf7\x62\x58\x5e\xb6\
-\xb2\x09\x82\x20\xa0\xd1\x68\x68\xd1\xa2\x05\x9f\x7c\xf2\x89\xe8\
-\x39\xe9\xe2\xe2\xc2\xf6\xed\xdb\xed\x65\x22\x6c\xd9\x41\x1d\x26\
-\xb8\x17\x37\xb3\xff\xe6\x45\x92\x1f\x79\xf2\xe3\xae\x7b\xb4\xee\
-\x35\x15\xbf\xe8\x03\x5c\xfa\xfd\x77\x1a\x84\xb5\x2b\x56\x1b\xee\
-\xee\xee\x58\x2c\x16\xe4\x72\x39\x2e\x2e\x2e\xbc\xfd\xf6\xdb\xa2\
-\xbd\x93\x82\x20\x90\x94\x94\xc4\x85\x0b\x17\xec\x7b\xe4\xdf\xf9\
-\x0d\x54\xa9\x54\x4e\x65\xa8\x95\xf0\x1f\x62\x9f\x92\x92\xf2\x8f\
-\x38\xd0\x96\x48\xa0\x04\x09\x12\xfe\x2b\x9b\x60\xff\xfe\xfd\xed\
-\x99\x33\x4b\x95\x2a\x45\x74\x74\x34\xd1\xd1\xd1\x64\x65\x65\xb1\
-\x6d\xdb\x36\x3b\xe1\x38\x71\xe2\x04\xa7\x4f\x9f\xa6\x7f\xff\xfe\
-\xf8\xfb\xfb\xbf\x30\x32\x6c\xd8\xb0\x81\x6d\xdb\xb6\xfd\x29\x7d\
-\x7c\x72\x72\xb2\xfd\x37\x99\x4c\x86\x8b\x8b\x4b\xa1\x85\xdd\x8b\
-\x82\xc1\x60\xb0\x97\x61\x50\xa9\x54\x5c\xbe\x7c\x99\xbe\x7d\xfb\
-\x16\x1a\x62\x24\x08\x02\xad\x5a\xb5\xa2\xef\xeb\xbd\xb9\xfd\x38\
-\x93\x48\xf5\x1d\x16\x24\x77\xe3\x9b\xe1\xbf\xb3\xed\x9c\x81\xec\
-\x4c\x3d\xd5\x1a\x37\x25\x73\xe1\x37\x3c\xb4\x9a\x09\x8f\x8d\x65\
-\xea\xfb\xef\x63\x2e\xa2\x58\xfc\x89\x13\x27\xa8\x57\xaf\x5e\x3e\
-\xe3\xcb\x99\x10\x55\x17\x17\x97\x7c\x46\xcd\x99\x33\x67\x18\x38\
-\x70\x60\x81\x06\xbc\x2d\xeb\xdf\xf4\xf7\x3f\x20\xcc\x47\x46\x7c\
-\x62\x16\x19\x16\x03\xb7\x2f\xa5\x52\xbf\xcf\x60\x2a\xb8\xdd\xe7\
-\xd6\x93\x32\xf4\xaf\x10\x8c\x67\xdd\x50\xe2\x6f\x3e\xe2\xf2\xf9\
-\x1c\x16\x2e\x5e\x51\x68\x66\x4e\x9b\x6c\xa5\x4b\x97\xb6\x13\x6d\
-\x57\x57\x57\x14\x0a\x85\x68\x2f\x9e\x4d\x36\x5b\x6d\xaf\x45\x8b\
-\x16\xb1\x6b\xd7\xae\x42\x89\xa0\xab\xab\x1b\xef\x4e\x9e\x48\xf9\
-\x52\x2e\xdc\x79\xaa\x20\x38\x65\x37\x3f\xa8\xde\x60\x54\xab\x73\
-\xa8\x14\x56\x92\x92\x33\xe8\xd4\xa4\x09\xb7\xbf\xde\x8a\xd1\x6a\
-\xe4\xc7\x9f\x7e\x62\xeb\x4f\x3f\x15\xaa\x03\x9d\x4e\xc7\xa5\x4b\
-\x97\xe8\xda\xb5\x6b\xbe\x5a\x7a\x2e\x45\x94\x96\x28\xca\x18\xb4\
-\xc9\x61\xf3\xc2\x1c\x39\x72\xa4\xc0\xbb\x5d\x26\x93\x89\xb0\xb0\
-\x8a\x4c\x7e\x77\x0c\xd9\x71\x89\x3c\x55\x95\x25\x42\x79\x86\x5f\
-\x1f\x54\xa5\xcb\xeb\xb5\x91\x25\x1e\xc2\xad\x74\x5d\xfc\x83\x6b\
-\x51\x2b\xe0\x3e\x8f\x12\xe1\xc9\xf9\xad\xac\x5e\xbb\xa1\x40\x63\
-\xde\x56\x14\x3c\xef\x5d\x39\xb9\x5c\x8e\x20\x08\x4e\xad\x37\x5b\
-\x39\x0d\x99\x4c\x86\xc5\x62\x61\xee\xdc\xb9\x6c\xd8\xb0\xa1\xc0\
-\x83\x0e\xb3\xd9\x4c\x78\x78\x38\x73\x3e\x9e\x4d\xe6\xe3\x5b\x3c\
-\xd2\xaa\x50\xc6\x1e\x43\x1d\xd1\x8a\x88\x60\x03\x0a\xeb\x23\x5c\
-\x3d\xab\x10\x51\xc9\x93\xe3\xe7\x1f\xa3\x10\xe0\xbd\xf7\xa6\x11\
-\x1b\xfb\xb8\xd0\xb9\x90\x91\x91\x91\xaf\x1f\xce\xce\x47\xdb\xfe\
-\x91\x57\xce\xd7\x5f\x7f\xbd\xd0\x50\x65\x83\xc1\xc0\xcb\x2f\xb7\
-\x67\xd4\xc8\x01\xdc\xbd\x7c\x1d\x7d\x50\x24\xee\xbf\x2f\xe6\xf5\
-\x37\x3a\xa3\xc2\xc2\x33\xa3\x40\xa0\x9f\x1f\x15\xca\xd4\x87\x8b\
-\xbf\x92\xab\xeb\xcf\x57\xcb\xbe\xe0\xfc\xf9\x0b\x05\xd6\x31\x55\
-\x2a\x95\xdc\xbc\x79\x33\xdf\x5c\xb1\xed\x65\xce\xcc\x49\xdb\x3e\
-\x22\x97\xcb\x89\x8b\x8b\xe3\xed\xb7\xdf\x2e\xb4\xc4\x4b\x56\x56\
-\x16\x23\x47\x8e\xa4\x4b\x97\x8e\xdc\xbc\x74\x05\x99\x9b\x92\xbd\
-\xbf\x1a\x69\xd5\xa2\x23\x27\xef\x41\xb2\x5e\x49\x9f\x8a\xa1\xa4\
-\xe6\x84\x60\xbd\x9f\x46\x96\xce\xc4\xb4\x49\x13\x48\x4f\x4f\x2f\
-\x74\x1f\x79\xf8\xf0\xa1\x7d\xce\x5a\xad\x56\x5c\x5c\x5c\x9c\x92\
-\xcb\xa6\x73\xdb\x5c\x78\xf6\xec\x19\x43\x86\x0c\xc9\x37\x7e\xb6\
-\xfa\xb1\xb3\x66\xcd\xfa\xaf\x12\x0b\x95\x4a\x85\x8f\x8f\x0f\x17\
-\x2f\x5e\xa4\x53\xa7\x4e\x92\x21\x23\x12\x31\x31\x31\xc4\xc5\xc5\
-\x49\x63\x28\x91\x40\x09\x12\xfe\x37\x37\xc0\xb1\x63\xc7\xb2\x6f\
-\xdf\x3e\x7a\xf6\xec\xc9\xd8\xb1\x63\xa9\x52\xa5\x0a\x37\x6e\xdc\
-\x60\xfe\xfc\xf9\xec\xdd\xbb\x97\xe9\xd3\xa7\xf3\xe5\x97\x5f\xb2\
-\x6d\xdb\x36\x46\x8e\x1c\x49\x60\x60\x20\x6f\xbe\xf9\x66\xb1\xea\
-\xbd\xfd\xff\x42\xcf\x9e\x3d\xe9\xd4\xa9\x53\x3e\x83\x40\x2e\x97\
-\x73\xea\xd4\x29\xc6\x8e\x1d\x5b\x62\xef\xc9\x6b\xa0\x19\x8d\x46\
-\xaa\x56\xad\xca\xc2\x85\x0b\x8b\xac\x5d\xa6\xd1\x68\x38\x79\xec\
-\x08\x1b\x8f\xc5\x50\x5f\x7e\x96\x1b\x17\x32\x19\x7d\xe4\x36\x99\
-\x9e\x8f\xe9\x52\x51\x89\x41\x67\x26\x4b\xee\x42\x25\x2b\x04\x95\
-\x29\x53\x68\x66\x45\xdb\xa9\xfd\x94\x29\x53\x48\x4b\x4b\xfb\xaf\
-\x8d\x69\x64\x64\x24\xcb\x97\x2f\xc7\x6c\x36\x17\xea\xc9\xf1\xf5\
-\xf5\xe5\xc1\xcf\x73\xf8\x79\xe7\x0d\x4e\x3c\x4b\xe2\xf6\x03\x0b\
-\x81\xea\xcd\x3c\xca\xe8\x83\x9c\x6c\x72\x01\xcf\xdc\x6c\xac\xae\
-\xee\xd4\xa9\x5f\x8b\xaf\xbe\xaa\x56\xa8\x6c\x32\x99\x8c\x41\x83\
-\x06\x11\x1b\x1b\x5b\x62\xb2\xe4\x0d\xf7\xd1\x6a\xb5\x0c\x1e\x3c\
-\xb8\x58\xc5\xe2\xbd\xdc\x95\xdc\xfb\x65\x31\x1b\x4e\xc5\x11\x75\
-\xf8\x77\x9e\x85\x57\xe4\xd7\xdb\x97\x39\x94\x5c\x86\x3e\xfe\x9e\
-\xe8\x0d\x5a\x74\x72\x25\x66\xa3\x99\x57\xbb\xbc\x4a\xbb\xb6\x6d\
-\x0b\x6d\x2f\x29\x29\x89\xc7\x8f\x1f\xdb\x8d\xc6\x92\x08\x41\xca\
-\xdb\x86\xc1\x60\x60\xc0\x80\x01\x8c\x1f\x3f\x9e\xac\xac\xac\x42\
-\x8c\x59\x57\x3c\x3d\xf5\x6c\x9f\xb5\x98\xb3\x65\xdb\x52\xed\xe8\
-\x07\xac\x4b\xab\x43\xa5\x1b\xa7\x30\x79\xca\xa8\xd5\xac\x26\x02\
-\x90\xa3\x55\xe2\xa6\x86\x8e\x9d\x5f\xa1\x71\xf3\xd6\x05\xf6\x57\
-\xa9\x54\x72\xff\xfe\x7d\x8e\x1c\x39\xf2\x97\xfd\x72\x96\x4c\xd8\
-\x8c\xee\x09\x13\x26\xd0\xb9\x73\xe7\x42\xbd\x54\x0a\x85\x02\xc1\
-\xa2\xe7\xc1\xb1\x0d\xac\x3c\x78\x8d\xc7\xe7\xee\x20\x54\x0a\xe5\
-\xf2\xc5\x14\x26\x7e\xd9\x83\xda\x65\x03\x30\x19\x8c\x20\xc8\xd0\
-\xea\xcd\xcc\x98\x31\xa3\x58\xc5\xe2\x0f\x1c\x38\x90\xaf\x74\x49\
-\x49\xc2\x64\x32\x31\x7f\xfe\x7c\xfc\xfd\xfd\x0b\x4d\xcc\xe2\xea\
-\xa6\x01\xcb\x13\xb6\x7f\xbb\x9c\xcc\xc8\x4a\x9c\x9c\xb0\x1a\x4b\
-\xed\x2a\x54\x4e\xb4\xf0\x52\x59\x77\x82\xad\x60\x31\xe5\x60\x74\
-\xf7\x43\xa9\x54\xf1\xd6\xf8\xf1\xe8\xf4\x05\x87\xac\xfa\xf8\xf8\
-\xb0\x68\xd1\x22\x6e\xdf\xbe\x5d\xa2\x7a\xb3\xb5\x61\x36\x9b\x09\
-\x08\x08\xe0\x83\x0f\x3e\xa0\x66\xcd\x9a\x05\xde\x7f\xb5\x1d\xce\
-\x68\xd3\x12\xf8\xf1\xdb\x45\xc4\xea\x3c\x88\xb9\x77\x91\xc3\x27\
-\x34\x5c\xbb\x9a\x81\x5b\x68\x5d\xc6\xc9\xcc\x60\xb1\x60\x15\x04\
-\xd4\xae\x0a\x3e\xfd\xf4\xd3\x42\xa3\x1e\x94\x4a\x25\x9b\x37\x6f\
-\x66\xc1\x82\x05\xf9\xf6\x80\xe2\x96\x86\x29\xce\xb7\xc0\xc3\xc3\
-\x83\x35\x6b\xd6\x90\x91\x91\xf1\xa7\x6f\xcf\xff\x8f\x44\x4d\xd3\
-\xa6\x4d\xa3\x7b\xf7\xee\x1c\x3c\x78\x90\xda\xb5\x6b\x23\xc1\x31\
-\x68\xb5\x5a\xa6\x4d\x9b\x46\xef\xde\xbd\x29\x5d\xba\xb4\x34\x20\
-\x12\x09\x94\x20\xe1\x7f\x07\x49\x49\x49\x4c\x9c\x38\x91\x7d\xfb\
-\xf6\xd1\xbe\x7d\x7b\xd6\xaf\x5f\x4f\x42\x42\x02\x65\xca\x94\xa1\
-\x6c\xd9\xb2\x78\x7a\x7a\x32\x75\xea\x54\x66\xcf\x9e\xcd\xee\xdd\
-\xbb\xe9\xd5\xab\x17\x3e\x3e\x3e\x7c\xf9\xe5\x97\x34\x6d\xda\xf4\
-\x85\x92\x45\xad\x56\xff\x25\x11\xf3\xf2\xf2\xb2\x1b\x6e\x7a\xbd\
-\x9e\xfb\xf7\xef\xe7\x0b\x6f\x75\x14\x7a\xbd\x3e\x5f\xd6\x43\xa5\
-\x52\x89\xaf\xaf\x6f\xb1\x0a\x58\xb7\x69\xdf\x89\x36\xed\x01\xc6\
-\x30\x06\x88\x3e\x32\x93\x43\x29\x5d\x09\x4e\xf9\x91\x5b\xdf\x7f\
-\xc5\xe5\xf2\x35\x18\xef\xe2\x06\x72\x39\xbe\xbe\xbe\xc5\x92\x39\
-\x2d\x2d\xcd\x2e\xdf\xcd\x9b\x37\x45\x87\x83\xca\x64\x32\x72\x73\
-\x73\xf3\x15\x88\x56\xa9\x54\xc5\x0e\x51\x0b\xef\x3e\x93\xa9\xdd\
-\x61\xea\x73\xf3\x88\x5d\x3f\x6e\x21\xb4\x69\x67\xee\xde\xfa\x91\
-\x23\xc7\x62\x90\xef\x7c\x44\xfb\xf9\x95\xed\xa4\xb1\x28\xd8\x0a\
-\x84\x0b\x82\x40\x66\x66\x26\x51\x51\x51\x18\x0c\x06\xd1\xe1\x77\
-\x71\x71\x71\x76\xd9\xac\x56\x2b\x1a\x8d\x06\x3f\xbf\xe2\xd5\x1b\
-\xab\xd2\xeb\x03\x16\xf5\xb2\x9b\xeb\x2c\x99\x33\x87\x8e\x63\xba\
-\x11\xfd\xe3\x39\xce\xaf\xf8\x8e\x68\x9f\x10\xfa\xf9\x96\x42\xed\
-\xea\x86\xda\xb5\xf0\x70\x45\x9d\x4e\x97\x4f\xb6\x94\x94\x14\x9e\
-\x3c\x79\x42\x5a\x5a\x9a\x28\xc3\x54\xa1\x50\x10\x1d\x1d\x6d\x37\
-\xae\x6d\xc6\xb4\x6d\x5e\x16\x31\x83\x18\xb5\x6c\x23\xa3\x00\xde\
-\x1b\xc6\x9b\x4f\xee\xf1\xe3\x6f\x37\xa9\xda\xd2\x8f\x8d\x5f\x9c\
-\x27\xee\xce\x72\x0e\xa4\xf4\x60\xb4\x0f\x08\xb8\xe1\xe7\x57\xb8\
-\x6c\xde\xde\xde\xf9\x48\x5b\x5a\x5a\x1a\xf7\xee\xdd\xc3\x64\x32\
-\x89\x0e\x07\x7d\xf0\xe0\x41\xbe\xfb\xa9\x4a\xa5\xb2\xd8\x85\xc7\
-\xeb\x0e\x5d\xc0\xaa\xa1\xb6\x7f\x5d\xe3\x95\xd7\x0e\xf1\xf5\xac\
-\x9e\x7c\xf2\xfe\x72\x4e\x5c\xa8\x48\xa6\x59\x83\xb7\xaf\x1c\x4f\
-\x45\xd1\x87\x59\xb6\x5a\x85\x36\xbd\xc5\xc4\xc4\xf0\xe0\xc1\x03\
-\x51\x65\x39\x04\x41\x40\xaf\xd7\x93\x90\x90\x90\x6f\x5c\xfc\xfc\
-\xfc\x8a\xb9\xde\x2a\x30\x7d\xc5\xba\xe7\x7f\x1d\x33\x9d\x9d\xcb\
-\xbe\xc4\xad\xef\xeb\x28\xf6\x7f\xcf\xfd\xd4\x64\x8c\x7b\xb7\x13\
-\x3c\xfa\x0b\xd4\x2a\x01\x95\x8b\x07\xee\x9a\xa2\xc7\x39\x2f\x19\
-\x8d\x8b\x8b\x23\x31\x31\x91\xd4\xd4\x54\x51\x7b\xa4\x8f\x8f\x0f\
-\x5a\xad\xd6\xee\xe9\xb4\x85\xcc\x6b\x34\xc5\xb8\xc7\xe7\x5a\x8e\
-\xd9\x2b\xb6\xe4\x59\x30\x3f\xd3\x7b\x42\x1a\xfd\x2b\x5e\x62\xf5\
-\x6f\xb7\x69\x99\x7a\x16\x57\xff\x7e\xc8\xff\xad\x93\xa2\xe0\xe9\
-\xe9\x99\xaf\x36\xe8\x83\x07\x0f\x08\x0e\x0e\x16\x4d\x6c\x33\x32\
-\x32\xec\xfb\xbf\x2d\xd4\x55\xa1\x50\x14\x7b\x2f\x29\x69\x34\x69\
-\xd2\x84\xd5\xab\x57\xd3\xb4\x69\x53\xe6\xce\x9d\x4b\xff\xfe\xfd\
-\x4b\x2c\xbb\xeb\xff\x65\xc8\x64\x32\x2e\x5e\xbc\xc8\x8c\x19\x33\
-\x68\xd3\xa6\x0d\x53\xa6\x4c\x91\x06\x45\x22\x81\x12\x24\xfc\xef\
-\xc0\x60\x30\x30\x77\xee\x5c\x7e\xfe\xf9\x67\x5a\xb7\x6e\xcd\x96\
-\x2d\x5b\xd8\xb1\x63\x07\x03\x07\x0e\x64\xe3\xc6\x8d\xbc\xfe\xfa\
-\xeb\x44\x46\x46\xb2\x7f\xff\x7e\x4e\x9c\x38\xc1\xe0\xc1\x83\xf1\
-\xf3\xf3\x63\xd2\xa4\x49\xf4\xeb\xd7\xef\x1f\x23\xa7\x8d\x10\xb9\
-\xb9\xb9\x11\x1a\x1a\xca\x27\x9f\x7c\xc2\xc7\x1f\x7f\x2c\xba\x3d\
-\x41\x10\x70\x77\x77\x27\x34\x34\x94\xa8\xa8\x28\xc7\x0a\x21\xff\
-\x01\x1e\xe5\x9a\x52\x23\xa8\x12\xd5\x5d\x7a\x70\x60\xda\x7c\xda\
-\x0d\x9b\x83\x8f\x6f\xf1\x4f\x8f\x6d\x05\x90\x5d\x5d\x5d\x89\x88\
-\x88\xa0\x7b\xf7\xee\x4e\x25\x61\x10\x04\x01\x57\x57\x57\xd4\x6a\
-\xb5\x53\x72\x81\x85\xf0\x88\x2a\xb8\x2b\xa0\xf7\x67\x2b\x18\x37\
-\x6c\x38\x96\x96\x5f\xb3\xa2\x8a\xe3\x2d\xd9\x42\xc8\x86\x0e\x1d\
-\xea\x54\x22\x06\x99\x4c\x46\xa5\x4a\x95\xec\x87\x02\x8e\x14\x8b\
-\xff\x13\xb9\x68\xd4\x14\x5f\x8d\x3b\xee\xad\x5e\x65\xd3\x8c\x55\
-\xb4\x9a\x34\x97\x8a\x65\xd5\x0e\xe9\xcd\x6a\xb5\x12\x1c\x1c\x4c\
-\xa9\x52\xa5\xa8\x53\xa7\x8e\x53\x9e\x09\x95\x4a\x45\x50\x50\x90\
-\x3d\x8c\x4f\xac\xde\x04\xb5\x0f\xd5\xab\x94\x27\x24\xa8\x0e\xbd\
-\xea\x9d\x64\xd2\x3b\xa7\x19\xbe\x7d\x1b\xbe\x0e\xc8\x65\x9b\x47\
-\x21\x21\x21\x6c\xdb\xb6\x8d\xe6\xcd\x9b\x3b\xb5\x7e\x5d\x5d\x5d\
-\xa9\x51\xa3\x86\xfd\x7e\x99\x78\x94\xe2\xb5\x6e\xf5\xf0\x76\x2f\
-\x47\xdb\x4a\x02\x2b\xf7\xde\xe7\x9d\xf7\x3e\x22\x40\xe1\x98\xce\
-\x14\x0a\x05\xd5\xab\x57\xe7\xd8\xb1\x63\x34\x69\xd2\xc4\xa9\xb5\
-\xa6\x50\x28\xe8\xd4\xa9\x53\x3e\xe2\xec\x28\xac\x66\x0b\x15\x5f\
-\xaa\x8f\xcc\xcd\x85\xaa\xaf\xb4\xe1\xd3\x4f\xe6\x73\x20\xbb\x1d\
-\xc7\xbe\xa9\x8a\x4a\x44\x9f\x2a\x56\xac\xc8\xd5\xab\x57\xa9\x55\
-\xab\x96\xe8\x39\x69\x2b\x7d\x51\xa1\x42\x05\xfb\xa1\x8d\x68\xdd\
-\xc9\xc2\xe9\xdc\xd6\x44\x8f\x57\xea\x71\x78\xc4\x47\x1c\xa8\xd9\
-\x89\x69\x83\x6b\x38\xbc\xd6\xd4\x6a\x35\xd5\xaa\x55\x63\xce\x9c\
-\x39\x4e\x91\x24\x41\x10\x50\xab\xd5\x94\x29\x53\x86\x1b\x37\x6e\
-\xfc\xed\xdf\x37\xab\xd5\x4a\xd7\xae\x5d\x39\x73\xe6\x0c\xf3\xe7\
-\xcf\x67\xfb\xf6\xed\x2f\x54\xa9\x98\x17\x15\x7a\xbd\x1e\x17\x17\
-\x17\xa6\x4f\x9f\xfe\x8f\xb2\x67\x24\x12\x28\x41\x82\x84\x12\xc1\
-\x2f\xbf\xfc\xc2\xb2\x65\xcb\xe8\xdd\xbb\x37\x8b\x17\x2f\xc6\xc7\
-\xc7\x87\xf4\xf4\x74\x00\x26\x4c\x98\xc0\xc9\x93\x27\xa9\x55\xab\
-\x16\x27\x4e\x9c\x60\xc7\x8e\x1d\xc8\xe5\x72\xbe\xfb\xee\x3b\x7a\
-\xf7\xee\xfd\x8f\x93\xf5\xf9\x1d\xa8\x30\x56\xad\x5a\x85\x4e\xa7\
-\x2b\x91\x50\xa0\x4a\x95\x2a\xd9\xef\x50\x8a\x85\x5f\xa5\x8e\x3c\
-\x2f\xed\xdc\x84\xa5\x5b\x77\x8a\x6a\xc3\x68\x34\x12\x16\x16\xc6\
-\x4f\x3f\xfd\x64\xbf\xab\xe2\x8c\x81\x63\x30\x18\xa8\x52\xa5\x0a\
-\x16\x8b\xc5\x89\x71\x92\x53\x2d\xb2\xce\xbf\xff\xde\x80\xaf\x77\
-\x1c\xb6\x59\x2c\xe0\x40\x9b\x56\xab\x95\x1a\x35\x6a\xb0\x7f\xff\
-\xfe\x12\x99\x07\x72\xb9\x1c\x4f\x4f\x4f\x56\xad\x5a\xe5\x84\x6c\
-\x0a\x9a\xbd\xfc\xef\xc4\x12\xd5\x3b\xb0\x6e\x67\x07\xd1\x73\x72\
-\xc4\x88\x11\xbc\xf6\xda\x6b\x25\x22\x9b\x20\x08\x22\x93\xa6\xe4\
-\x21\x5c\x3e\xfe\xd4\xfb\x77\xe1\xf1\xc0\x7e\x33\x68\xfe\x6f\xdb\
-\xc8\x0a\x38\x32\x5a\x32\x99\x8c\xb1\x63\xc7\xe6\x23\x38\xce\xc0\
-\x96\xdd\xd7\x19\xe3\xdd\x4a\x30\xc3\x06\x3f\xf7\x00\x75\x1a\xb7\
-\x00\x31\xb7\x7f\x2c\x16\x0b\x1e\x1e\x1e\xcc\x9f\x3f\x5f\xb4\x97\
-\xec\x8f\xf3\xdb\xdf\xdf\x9f\x43\x87\x0e\x89\xd7\xbb\x5c\x49\xf5\
-\x26\x2d\x9f\xff\xc3\x3d\x82\x19\x0b\xbf\x13\xdd\x17\xb5\x5a\xcd\
-\x4f\x3f\xfd\x54\x62\xb5\x54\x55\x2a\x15\xc7\x8e\x1d\x73\x6e\x8c\
-\x54\x35\x79\xe3\xf5\xe7\x7f\xff\x7a\xcb\x36\xc4\xcc\x48\xbd\x5e\
-\x4f\x9d\x3a\x75\x68\xd7\xae\x9d\x28\xcf\xed\x5f\xad\xb5\x72\xe5\
-\xca\x71\xe4\xc8\x91\xbf\xbd\xac\x80\x6d\x1f\xab\x55\xab\x16\x1b\
-\x37\x6e\x24\x33\x33\x13\xa3\xd1\x28\x65\xba\x2c\x62\xae\xcb\x64\
-\x32\x7c\x7c\x7c\xa4\xc1\x90\x48\xa0\x04\x09\xff\x9b\xf8\xec\xb3\
-\xcf\xf0\xf7\xf7\x67\xec\xd8\xb1\xf6\xf0\x98\x71\xe3\xc6\xa1\xd5\
-\x6a\x99\x32\x65\x0a\x2b\x56\xac\xb0\xff\xbf\xfe\xfe\xfe\x7c\xfe\
-\xf9\xe7\xff\x48\x02\x68\xdb\xf4\xdd\xdc\xdc\x8a\x15\x86\xe8\xa8\
-\x51\xf8\x22\xc0\xcd\xcd\x8d\x9a\x35\x6b\xbe\xf8\x8a\x10\x69\x98\
-\x54\xab\x56\xad\xc4\xba\x90\x93\x93\xf3\x42\xe8\xcd\x6a\xb5\x12\
-\x14\x14\x44\x50\x50\x50\x89\xb5\x29\x36\x9b\x63\x91\x6a\x13\xf1\
-\x8c\x46\xa3\xa1\x46\x8d\x1a\x25\xd6\x87\x73\xe7\xce\x39\x77\xc0\
-\x51\x82\xc6\x63\x60\x60\x20\x81\x81\x81\x25\x26\xdb\x8b\x50\x50\
-\xdd\x46\xb6\x2b\x55\xaa\x54\xa2\x6d\x3a\x43\x70\x0b\xd6\x9b\x63\
-\xda\xb4\x58\x2c\x68\x34\x1a\xc2\xc2\xc2\xfe\x2b\x04\xec\x45\x82\
-\x98\x0c\xb3\x12\x24\x48\x24\x50\x82\x84\xff\x31\xdc\xb9\x73\x07\
-\x7f\x7f\xff\x3f\xdd\xd3\x98\x34\x69\x12\x4d\x9b\x36\xe5\xf4\xe9\
-\xd3\x18\x0c\x06\xf4\x7a\x3d\xaf\xbf\xfe\x3a\x95\x2b\x57\xfe\xe7\
-\x6e\x3e\x0a\x05\x0f\x1f\x3e\x64\xe9\xd2\xa5\x44\x47\x47\x3b\xfd\
-\xe1\x57\xab\xd5\x8c\x19\x33\x46\x74\xd6\x43\x47\x3d\x2b\x45\xc9\
-\xf6\xe8\xd1\x23\x26\x4f\x9e\x6c\x37\x54\x9d\x31\x02\xb3\xb3\xb3\
-\xd9\xb0\x61\x43\x09\x1b\x38\x16\x40\xe6\xb0\x27\xd0\x56\xda\x61\
-\xfc\xf8\xf1\x98\x4c\x26\xa7\x52\xa1\x0b\x82\x80\xaf\xaf\x2f\xc3\
-\x86\x0d\x13\x59\x2c\xde\x8a\x15\xa1\x44\xf5\xf6\xdd\x77\xdf\xb1\
-\x67\xcf\x1e\xb2\xb2\xb2\x9c\x1a\x6f\x5b\xc6\xc2\x75\xeb\xd6\x95\
-\xe8\xba\xc9\xb1\x80\xbb\xe3\x6a\xc3\x62\xb1\xb0\x69\xd3\x26\xd6\
-\xae\x5d\x2b\xba\x46\xa0\x6d\x2e\xdb\xee\xa5\x8e\x18\x31\x42\x64\
-\xe6\xdb\xbf\x5e\x6d\x56\x13\x08\x0a\xc7\x56\xa3\xad\x8c\xca\x9c\
-\x39\x73\xb8\x74\xe9\x12\xb9\xb9\xb9\x4e\x13\x88\xe6\xcd\x9b\x97\
-\x6c\x42\x0a\x83\x1e\x54\x2e\xa2\xfa\xa3\xd5\x6a\x19\x30\x60\x00\
-\x99\x99\x99\xe8\xf5\x7a\xa7\xe6\xa4\x9b\x9b\x1b\x21\x21\x21\x4e\
-\x85\xcc\xfe\xc5\x31\x07\x7a\x5c\x70\x54\x3a\x17\x17\x17\xae\x5c\
-\xb9\xc2\xc2\x85\x0b\x49\x4a\x4a\x72\xca\xd3\x69\x0b\x99\x1f\x3c\
-\x78\xf0\xdf\x5e\x2c\x5e\x82\x84\x7f\x12\x64\xd2\x10\x48\x90\xf0\
-\xe2\xa0\x76\xed\xda\x18\x0c\x86\x3f\x85\x58\x09\x82\x40\x72\x72\
-\x32\xe1\xe1\xe1\xb4\x6d\xdb\x96\x89\x13\x27\x52\xb5\x6a\xd5\x17\
-\xe6\xb4\x5a\xec\x87\x3b\x23\x23\x83\xfd\xfb\xf7\x13\x13\x13\x83\
-\xc5\x62\x11\xfd\x47\xaf\xd7\xb3\x63\xc7\x0e\xee\xdc\xb9\x23\xda\
-\x00\x10\x32\xcf\xd2\xb8\x62\x69\x5c\xd5\xde\xf4\x9f\xb7\x83\xa8\
-\xe3\xab\x88\x10\x04\xda\xcc\xfc\x89\x0c\xbd\x63\x06\xb3\xad\x58\
-\xfc\xc1\x83\x07\xd1\xeb\xf5\xf6\xfb\x6e\x8e\xfe\xb1\x5a\xad\xe4\
-\xe6\xe6\x72\xf2\xe4\x49\x52\x53\x53\x45\x1b\xef\xda\xc4\x28\xa6\
-\xb6\xf0\x42\x10\xbc\x78\xe7\xa7\x0b\xa4\x9d\x5d\x40\x88\x52\x49\
-\x99\x66\x73\xd0\x89\x18\xaf\xc4\xc4\x44\x76\xed\xda\x45\x5c\x5c\
-\x1c\x82\x20\x88\x96\x2d\x3d\x3d\x9d\xbd\x7b\xf7\x92\x90\x90\x20\
-\x32\xad\xbf\x80\x70\x7f\x0d\xe1\xa5\xbd\x90\xcb\x5d\x99\xb0\x3b\
-\x85\xbb\x07\x3e\xc1\x47\x10\xe8\xb7\x68\x37\xe9\xc5\x74\x2e\xe6\
-\x2d\x16\x7f\xf5\xea\x55\x76\xec\xd8\x81\x52\xa9\x14\x3d\x1f\xad\
-\x56\x2b\x57\xae\x5c\xe1\x97\x5f\x7e\x71\xca\xb8\x4d\x89\xdf\x40\
-\xb8\x20\xa0\xac\xd8\x81\x81\x1b\x63\xf8\x70\x78\x3b\x2a\x29\x04\
-\x5e\xfb\x57\x82\xc3\x0e\x5c\xab\xd5\xca\xa5\x4b\x97\x38\x7a\xf4\
-\x28\x39\x39\x39\x76\x62\xe8\xe8\x1f\x99\x4c\xc6\xed\xdb\xb7\x39\
-\x72\xe4\x88\x13\xa4\x44\x40\x7b\xfc\x73\x6a\x94\x55\x23\x08\xee\
-\xcc\xbf\x60\x60\x51\xdf\x2a\xb8\x97\xab\xcd\x57\x3b\xef\x39\x74\
-\x1c\x63\xab\xef\x77\xe2\xc4\x09\x7e\xfe\xf9\x67\x7b\xcd\x49\x31\
-\x3a\xcb\xc9\xc9\xe1\xb7\xdf\x7e\xe3\xc4\x89\x13\x4e\x85\xb9\x5e\
-\xfc\xa4\x31\x82\x32\x98\x71\x6b\x6e\x62\x89\x3a\x48\xfb\xd6\x35\
-\xf0\xf2\x6d\xc4\xd6\x74\xc7\xdb\x32\x99\x4c\xec\xde\xbd\x9b\x0b\
-\x17\x2e\xa0\x52\xa9\x44\xcb\x66\xb1\x58\x38\x78\xf0\x20\x47\x8e\
-\x1c\x11\x79\xe0\x02\x98\x1e\x32\x67\x44\x73\xdc\x05\x01\xb7\x80\
-\x7a\xec\xdc\xbb\x91\x60\xcf\x32\xb4\x6a\xff\x3a\x97\x9e\xe1\xf0\
-\x1e\xf9\xf4\xe9\x53\x76\xef\xde\xcd\xb9\x73\xe7\x9c\x5a\x6b\xb9\
-\xb9\xb9\xec\xdc\xb9\x93\x9b\x37\x6f\xbe\x30\x91\x20\x12\x24\xfc\
-\x13\x20\x79\x02\x25\x48\x78\x81\x30\x79\xf2\x64\x7a\xf6\xec\xc9\
-\xa2\x45\x8b\x58\xb2\x64\x09\xa5\x4a\x95\x02\x9e\xdf\x15\x1c\x38\
-\x70\x20\x4a\xa5\x92\x95\x2b\x57\xd2\xa0\x41\x83\x7f\x84\x3c\x36\
-\x4f\x51\x5e\x43\x31\x6f\x36\x3f\x93\xc9\x84\x87\x87\x07\xab\x57\
-\xaf\xa6\x51\xa3\x46\xa2\xdf\x63\x30\x18\x18\x34\x68\x90\xfd\xfe\
-\xa4\xcd\xc0\x2d\x28\xf5\xb9\xfd\x14\x4c\x26\xb3\x93\x0f\xfd\xf5\
-\x9b\xd4\x9c\x73\x86\x33\xfd\x2a\x40\xc6\x7d\xd6\xcc\xff\x8c\xf7\
-\x4f\x5d\x66\xf7\xd7\xdb\x88\x7b\xf6\x32\x9e\xa5\xbd\x8a\x34\xe8\
-\xff\x48\x64\xac\x56\x2b\x47\x8f\x1e\x75\x7a\x1c\x43\x42\x42\xfe\
-\x64\xb4\x15\x25\x9b\x42\xa1\xb0\xdf\xfd\xca\xc8\xca\xa1\x74\x8b\
-\x39\x24\x1c\x9f\x40\x69\xe0\x93\xe6\x03\x58\x99\x63\xc6\x73\x62\
-\x55\xc6\xed\x9e\xc9\x9a\x57\xad\x18\x0c\x85\xcb\x96\xd7\xc3\x9a\
-\x9b\x9b\x4b\xbd\x7a\xf5\xd8\xb5\x6b\x97\x53\x1e\x93\xec\xec\x6c\
-\xaa\x55\xab\x96\xcf\xe0\x36\x18\x0c\x45\x12\x8b\xbc\xb2\x25\x9f\
-\xbc\x4c\xd7\xb5\x51\x7c\xd1\x21\x00\x4b\x4e\x12\x3f\x2e\xb8\xcd\
-\x2f\x57\x4e\xb1\xee\xab\x5d\x3c\x8c\x6a\x4c\x64\x45\xef\x42\xbd\
-\x03\xb6\x79\x68\x83\x4e\xa7\xa3\x46\x8d\x1a\xec\xd9\xb3\xc7\x29\
-\x9d\xed\xda\xb5\x2b\x5f\x3d\x47\x9b\x71\x5a\x58\x3a\x7e\xdb\x7c\
-\xb4\xf5\xd5\x12\xfb\x90\x8e\x0b\x6f\xf3\xf5\xe4\x2a\x10\xbf\x99\
-\xb7\x6e\x0f\x23\xde\xf2\x35\x3d\xca\xf4\xe1\xd6\xe0\x13\x54\x33\
-\x9b\xd1\x17\x22\x9b\x8d\x10\xe5\x1d\xdb\xae\x5d\xbb\xb2\x6d\xdb\
-\x36\xa7\x64\x5b\xb7\x6e\x1d\x13\x26\x4c\xc8\xb7\x8e\x2d\x16\x4b\
-\x81\xc4\xc9\x26\xdb\x7f\xbc\x86\x5a\x1e\x3c\x78\xc2\x8c\x9f\xae\
-\xd2\xab\x51\x25\xac\x8f\x8f\x32\xa5\xfc\x9b\xc4\x4f\xab\xc0\xaa\
-\x5d\xdb\x88\x6e\x3b\x9d\xb2\x2e\x46\x2c\x45\x10\x15\xdb\x7a\xb4\
-\x65\x74\xfd\xf4\xd3\x4f\x99\x3e\x7d\xba\x53\xb2\x4d\x9b\x36\x8d\
-\x0b\x17\x2e\xe4\xdb\x47\x8c\x46\x63\xa1\x75\x39\x6d\xd9\x28\xed\
-\xfb\x8a\xd1\x0f\xab\xf1\x0c\x60\x66\xfd\xd2\x03\xbc\xbb\xe6\x18\
-\x4d\x62\x66\xe2\xd1\x6b\x27\xd9\x07\xba\xe1\x6a\x35\x61\x2a\xa4\
-\xde\xa8\x8d\xec\xe5\x9d\xa3\xaf\xbf\xfe\x3a\x8b\x17\x2f\x76\x4a\
-\xb6\xea\xd5\xab\xe7\x6b\xd7\xb6\x3f\x17\xe4\xcd\xb7\x25\xdd\xb1\
-\x1d\x36\x5a\x9e\xa5\x90\x53\x7d\x34\xdb\x6e\x1d\xa6\x63\x55\x17\
-\x96\x8f\xeb\xcb\x92\x7b\x29\x44\xde\x5c\xc6\xfe\x5d\x47\x78\x69\
-\x48\x5b\x8c\x06\x03\x45\xd1\xcb\xbc\x6b\xc2\x62\xb1\xb0\x6f\xdf\
-\xbe\x7c\xb5\x55\x1d\x45\x5a\x5a\x1a\xdd\xba\x75\x23\x37\x37\xd7\
-\x3e\xa6\x7f\x5c\x67\x7f\xb5\xbe\x24\x48\x90\x48\xa0\x04\x09\x12\
-\x5e\x18\x74\xe9\xd2\x85\xe9\xd3\xa7\x33\x6f\xde\x3c\xce\x9e\x3d\
-\x4b\x95\x2a\x55\xd0\xe9\x74\x9c\x3c\x79\x92\xf0\xf0\x70\xbe\xfb\
-\xee\x3b\x5a\xb4\x68\xf1\x8f\x91\xe7\xf8\xf1\xe3\x9c\x3c\x79\x32\
-\x5f\xba\x73\x99\x4c\xc6\x83\x07\x0f\xec\xc5\xb4\x6d\x1e\x21\x67\
-\xa0\xd3\xe9\xc8\xc9\xc9\x41\x10\x04\x94\x4a\x25\xd1\xd1\xd1\x2c\
-\x5e\xbc\xb8\xd0\xd0\x50\x41\x10\x88\x8c\x8c\xa4\x71\xa3\x06\x3c\
-\x48\xd4\xe2\xa7\x85\xe8\x9d\x73\x78\xfb\xa4\x50\x97\x80\x1e\x00\
-\x00\x20\x00\x49\x44\x41\x54\x40\x70\xf5\xb6\x08\xb9\x26\x22\x6b\
-\xd6\xe6\xa5\xe4\x45\x5c\xb0\x18\x29\xf3\xf4\x29\xab\xd6\xad\xc3\
-\x5a\xc8\x49\xb3\x4c\x26\xe3\xcc\x99\x33\x94\x2b\x57\xce\xfe\x5b\
-\x66\x66\xa6\x53\x77\x42\xb4\x5a\xad\xdd\xb8\xb6\x5a\xad\xdc\xbb\
-\x77\x8f\xcf\x3f\xff\xbc\xd0\x4c\xa1\x56\xab\x95\xd7\xfb\xf6\x23\
-\x40\xa5\x25\x3e\x29\x8b\x47\x4f\x63\xb8\x7c\x72\x37\x27\xde\x78\
-\xcc\x5b\xef\xbd\xc4\xe5\x27\x91\xf4\x54\x81\x5f\xcb\xba\x3c\x3e\
-\x77\x99\x98\xaa\xae\x6c\xd9\xfa\x4b\xa1\x63\x05\xcf\xc3\x95\x6d\
-\x7a\xb3\x8d\xb9\x33\x48\x4d\x4d\xb5\x1b\xa0\x2e\x2e\x2e\xec\xd9\
-\xb3\xa7\xc8\xe4\x1e\x2a\x95\x8a\x5e\x3d\xbb\x51\xca\xd5\xcc\xfd\
-\x34\x25\x19\x49\x3a\xae\x1d\xfe\x80\xa1\xeb\x4c\xb4\x9d\x34\x83\
-\xec\x84\xa7\xd4\x8c\xac\x4d\x05\xed\x7a\xd2\x8c\xb9\x9c\x3a\x7d\
-\x8b\x13\xc7\x8f\x17\xe8\x69\xb4\x15\x54\x7f\xf4\xe8\x91\xbd\x90\
-\x7a\x49\x24\xe1\xc8\x7b\xcf\x51\xa9\x54\x72\xe0\xc0\x01\x0c\x06\
-\x43\x81\x49\x30\xcc\x66\x33\x41\x41\xc1\xf4\x78\xad\x33\xe9\xd1\
-\x71\xa4\x2a\x4b\x11\xf8\x30\x86\x83\x3f\xce\x64\x42\x76\x3b\x82\
-\x3c\x1e\xa2\x08\x68\x85\x99\x08\x5a\x47\x46\x71\x27\x1e\x72\x63\
-\x4e\xb3\xe7\xe0\xaf\x05\x16\x1d\xb7\x79\x5b\x6c\x7a\xb2\xe9\xcd\
-\x59\xd8\x6a\x1d\xda\x8a\xb4\xef\xd9\xb3\x87\x98\x98\x98\x02\x49\
-\xa0\xc5\x62\x21\x28\x28\x88\xc1\x83\x06\x92\x19\x77\x97\xc7\x86\
-\x74\x1e\xc6\x3d\xe6\x97\x5f\x3f\x60\xcb\xbc\xd2\xbc\x36\xb1\x2a\
-\x7e\x3e\x61\xa8\xfd\x35\x78\xa8\x65\x58\x0d\xf0\xaf\x1f\xff\x45\
-\x72\xf2\xd3\x42\xc9\x7b\x62\x62\xa2\x7d\x0d\xc8\xe5\x72\x32\x33\
-\x33\x9d\x92\x4b\xaf\xd7\xe7\x9b\xd3\x72\xb9\x9c\xa5\x4b\x97\xe2\
-\xe1\xe1\x51\x20\x51\x32\x99\x4c\xd4\xa9\x53\x97\xce\x9d\x5a\x70\
-\xef\xda\x6d\x0c\xfe\x55\xf9\xfd\xd2\x75\x3e\x1f\x3d\x85\x57\x07\
-\x8c\x46\xae\x71\xc5\x25\x47\x8f\xf2\xa5\x76\x68\x4e\xed\x46\xa7\
-\xeb\xcc\xde\x3d\xdb\xb9\x73\xf7\x5e\x81\xfb\x93\x5a\xad\xe6\xe8\
-\xd1\xa3\xf9\x08\x5b\x49\xcc\x49\x93\xc9\x84\x4c\x26\xb3\x17\x54\
-\xdf\xb4\x69\x13\xc7\x8e\x1d\xfb\x4b\xbd\x09\x82\x40\x6e\x6e\x2e\
-\x1d\x3b\x75\xa2\x61\xdd\xda\xdc\xb9\x79\x13\x4b\xfa\x13\x72\xaf\
-\x6e\xe7\x9b\x4b\x87\xd8\x22\x78\x93\xac\xf0\xe7\x5b\x77\x23\x89\
-\xca\x30\x94\xe6\x54\x72\x8d\x56\xbe\x5f\xb5\x8a\xec\x42\xf6\x05\
-\xb9\x5c\xce\x85\x0b\x17\xec\xdf\x04\xab\xd5\x4a\x4a\x4a\x8a\x53\
-\x75\x02\x75\x3a\x9d\xdd\x2b\x2d\x08\x02\xd9\xd9\xd9\xac\x5c\xb9\
-\x32\x5f\x68\xb0\xd9\x6c\xc6\xdf\xdf\x9f\x81\x03\x07\x3a\x9d\xac\
-\x49\x82\x04\x89\x04\x4a\x90\x20\xa1\xe4\x17\xa4\x42\xc1\xec\xd9\
-\xb3\x09\x08\x08\x60\xfd\xfa\xf5\xdc\xba\x75\x0b\xa5\x52\x49\xe7\
-\xce\x9d\x99\x38\x71\xe2\x3f\x8a\x00\x02\x84\x87\x87\xa3\x52\xa9\
-\xf2\x19\xe0\x82\x20\xe0\xe5\xe5\xc5\x81\x03\x07\xec\xff\x76\x3a\
-\x83\xa2\xab\xab\x3d\x0b\xa7\xd9\x6c\xc6\xc7\xc7\x87\xe6\xcd\x9b\
-\x17\x68\x1c\xdb\x50\xa6\x6c\x59\x8e\x1f\x3d\xc4\xfc\x2d\xb7\x58\
-\x38\xad\x27\xdf\x7c\x3f\x8c\x30\x59\x02\x6f\x0d\x19\x85\x8f\x6f\
-\x00\x82\x15\xb4\x4a\x25\xee\x80\x9b\x46\x43\x8b\x22\x52\xeb\xcb\
-\xe5\x72\xce\x9e\x3d\x9b\x8f\x9c\x15\xa7\x56\x61\x61\x70\x73\x73\
-\xcb\x97\xcd\x31\x20\x20\x80\xd6\xad\x5b\x17\x1a\xae\x66\xb5\x58\
-\x08\x0c\x09\x25\x66\xfd\x38\x56\xaf\xbf\xc4\xc3\xda\xbd\x98\xbf\
-\x79\x1f\xa5\xe3\xf7\xb1\xf0\xda\x23\xac\xe6\x2c\x2c\x80\x25\x27\
-\x1b\xc1\x45\x4d\xe9\x40\x7f\x5a\xb6\x6c\x59\xe4\xdc\xdc\xbf\x7f\
-\x3f\x69\x69\x69\x76\x59\x8b\x1a\xdf\xa2\xe0\xee\xee\x6e\x37\xfc\
-\x4c\x26\x13\xd5\xaa\x55\xa3\x45\x8b\x16\x85\x1a\x83\x72\xb9\x1c\
-\x5f\x2f\x37\xa2\xb6\xcd\x65\xea\xd6\x14\xfa\xf4\x19\xc0\x86\x0d\
-\x5d\x09\x3a\xbf\x98\x8a\x4b\x8e\xf2\x59\x59\x0f\x04\xab\x05\xa3\
-\x20\x43\xb0\x42\x85\x0a\x15\x50\xc8\xe5\x05\x66\xc4\xb4\x79\x91\
-\x7e\xfe\xf9\x67\x3b\xb1\x2e\x89\xec\x99\x2e\x2e\x2e\xf9\x8a\x73\
-\x57\xa9\x52\x85\x96\x2d\x5b\x16\x48\xc2\x9e\x27\xca\xf0\xc1\xdb\
-\xd3\xc4\x37\xb3\xde\x61\x5f\x60\x4f\x7e\x78\x7b\x0c\xc7\x4e\xd4\
-\xe3\xee\xa6\xd5\xf4\x98\x77\x96\xae\x43\x5b\x23\x07\xb2\x73\xe4\
-\xb8\xb8\x42\x68\x68\x05\xda\xb6\x6d\x5b\x20\xc1\x95\xcb\xe5\xc4\
-\xc5\xc5\xd9\xc9\x86\xcd\xb3\x53\x12\xb2\xd9\xda\x83\xe7\x49\x82\
-\x5a\xb6\x6c\x59\xa8\x27\x50\xa3\xd1\x20\x58\xf4\x5c\xff\x61\x36\
-\x1f\x9d\xd0\x30\x7a\xd8\xdb\xac\x9f\xd9\x02\xeb\xea\x97\xff\x5f\
-\x7b\x77\x1e\x1f\x45\x95\xe0\x01\xfc\x57\xd5\x5d\x7d\xe6\xbe\x08\
-\x39\x38\x42\x0e\x48\x20\x09\x49\x80\x04\x42\xb8\x91\x73\xb9\x67\
-\x14\x11\x19\x46\x46\x01\x71\xd5\x91\xf1\xfa\x88\x88\xba\xeb\x38\
-\x23\x20\x30\x1c\xd9\x51\x51\x07\x05\x1c\x58\xb9\x23\x60\x1c\xe4\
-\x1e\x0f\x4e\x01\x41\x12\xc9\x01\x86\x04\x42\xc8\xd1\x49\xa7\xab\
-\x7a\xff\xc0\xea\x49\x64\x92\xf4\xb5\xb0\xce\xfe\xbe\xff\x68\x02\
-\xdd\xf4\xab\xf7\xaa\xfa\xfd\xaa\xde\x81\xc0\x25\xfe\x78\x6d\x54\
-\x34\x34\x10\x20\xcb\x76\xc8\x0a\x90\x91\x91\x81\xda\xda\xba\x56\
-\xdb\x42\x41\x41\x81\xe3\xcf\xd5\xb9\x8a\x9e\x96\xab\xe9\x1c\x47\
-\x45\x51\xd0\xbf\x7f\x7f\xf8\xf9\xf9\xb5\x38\xcc\xf0\x56\x78\xef\
-\x00\xc8\xc5\x58\xf5\xfc\x13\xf8\x7e\xc0\x73\x58\xb3\x68\x2b\x7e\
-\x61\xba\x8c\xdf\xbe\xfa\x11\x52\xef\x09\x47\x27\x9d\x0e\x52\x63\
-\x2d\xac\x46\x3f\x88\xa2\x88\xe4\xe4\x64\x44\x44\x46\xb5\x38\x9c\
-\xdf\x6c\x36\xa3\xa8\xa8\xa8\xd9\x02\x2e\xde\xa8\xb7\xa6\xdb\x5e\
-\x98\x4c\x26\xa4\xa7\xa7\x23\x3e\x3e\xbe\xc5\x7a\x6b\x6c\x6c\x44\
-\x87\xe8\x0e\xa8\xaf\x2a\xc5\x1f\x7f\x37\x1b\xba\xfe\x4f\xe2\x89\
-\xc5\x6f\x21\x3e\x28\x10\xe7\xfe\x23\x0d\xdd\x3e\xe8\x09\xc1\x20\
-\x41\x2f\x36\x42\xb1\x8b\x90\x24\x01\x99\x59\x99\xb0\x5a\x5b\x5e\
-\x09\x53\x14\x45\x58\x2c\x16\x7c\xfd\xf5\xd7\xcd\xae\x91\x9e\x3c\
-\x9d\xd3\xeb\xf5\xcd\xb6\x62\xd1\xe9\x74\xe8\xdb\xb7\x6f\xb3\x51\
-\x05\x8a\xa2\xc0\x64\x32\xb9\x39\x87\x95\x88\x21\x90\x88\xee\x00\
-\x49\x92\xf0\xf8\xe3\x8f\x63\xf2\xe4\xc9\xb8\x74\xe9\x12\x74\x3a\
-\x1d\x12\x12\x12\x7e\x96\x2b\x8c\x75\xec\xd8\x11\x1d\x3b\x76\xfc\
-\xa7\x1d\x6f\x75\x98\x68\x63\x63\x23\xf6\xee\xdd\xeb\xb8\x1b\xec\
-\x8e\xfa\xfa\x7a\x94\x96\x96\xa2\x4f\x9f\x3e\x50\x14\x05\x41\x41\
-\x41\xc8\xce\xce\x76\xaa\xe3\x14\x16\x3a\x0e\x03\x46\x4c\x40\xd5\
-\xf1\x6d\x58\xbd\xea\x0b\x24\x06\xdd\x84\xa1\x4b\x5f\x74\xf3\x2f\
-\xc5\xfb\xff\xfe\x10\x2e\x9a\x3b\xe1\x7e\xbd\x09\x7a\x93\xc9\xa9\
-\x21\xab\x1d\x3b\x76\xc4\xa5\x4b\x97\x1c\x3f\x6f\xdc\xb8\x11\x06\
-\x83\xc1\xed\xcd\xe2\xad\x56\xab\xe3\x09\x87\x20\x08\x08\x0e\x0e\
-\x76\x7a\xe8\x54\xfc\xbd\xaf\x61\xd1\x04\x1b\x7e\x28\x3e\x86\x0f\
-\x57\xbe\x0e\xad\xfd\x26\x0c\x59\xe3\x30\x6e\xd8\x7a\x2c\xf9\xcf\
-\x37\x60\xfc\xb4\x1c\x63\x97\x27\x40\xef\x03\xa7\xca\x16\x1a\x1a\
-\x8a\x6b\xd7\xae\x41\xa3\xd1\xe0\xda\xb5\x6b\xd8\xb2\x65\x0b\xc2\
-\xc3\xc3\xdd\x2a\x9b\x20\x08\xa8\xac\xac\x74\x74\xd4\x6c\x36\x1b\
-\x12\x12\x12\x90\x95\x95\xe5\xd4\xeb\x13\xef\xff\x3d\x36\x4f\x13\
-\x71\x66\x43\x2e\x56\xaf\x58\x8b\x88\xb2\x53\xe8\x93\x31\x03\xc1\
-\xe2\x41\x2c\x9b\xf5\x28\xae\xe8\xe3\x30\x25\x28\x18\xd1\x91\x26\
-\x44\x47\x45\xb5\xfa\x5e\x15\x15\x15\x08\x0c\x0c\x84\xa2\x28\x8e\
-\x27\x4a\xdb\xb6\x6d\x73\x7b\x65\x4f\x49\x92\xb0\x7f\xff\x7e\xc7\
-\xeb\x15\x45\x41\x7c\x7c\x3c\x52\x53\x53\x9d\x7a\xfd\x63\x6b\xb7\
-\x60\xb6\x56\x8f\x1f\x3e\xf9\x03\xd6\x6c\x3c\x00\x53\x7d\x0d\xb2\
-\xc7\x4e\x80\xf5\xf4\x0e\xfc\x79\xf1\x0e\x7c\xa2\xb9\x0f\x8f\x04\
-\x01\x41\x88\x42\x68\x44\xeb\x65\x8b\x88\x88\x70\x84\x23\x51\x14\
-\x51\x54\x54\xe4\x98\xab\xe8\xce\xf9\x26\x49\x12\xbe\xf8\xe2\x0b\
-\xc7\x1e\x81\x82\x20\xa0\x6b\xd7\xae\xce\xb5\x49\xbb\x1d\x99\x8f\
-\xbd\x83\x6d\x0f\x95\xe0\xe8\x86\x0f\xb1\x3a\xf7\x02\xac\xfb\x65\
-\x8c\x1f\x36\x00\x97\xbf\x5c\x83\x97\xbf\x0f\x03\x42\xd2\x11\xe0\
-\x0f\xc4\x86\xa4\xb4\xf9\x76\xea\x66\xe0\x76\xbb\x1d\x92\x24\xe1\
-\xf4\xe9\xd3\xd8\xbc\x79\xb3\xdb\xed\xb1\xb1\xb1\x11\x67\xcf\x9e\
-\x6d\x16\x96\xfa\xf6\xed\xeb\xe4\x8d\x1c\x19\x2f\xaf\xdb\x06\xd1\
-\x5c\x8f\xff\x7e\xf6\x45\x14\x87\xb4\x47\x78\x72\x06\x92\x4c\x97\
-\xb1\x73\xfb\x07\xc8\xff\x6e\x3b\x92\xe6\x2c\x83\x49\xaf\x41\x42\
-\xd7\x6e\x48\x68\xe3\xdd\x62\x62\x62\x9a\xdd\x8c\x38\x7f\xfe\x3c\
-\xf2\xf2\xf2\x50\x53\x53\xe3\x56\x9b\xf4\xf1\xf1\x71\x8c\x4a\x50\
-\x43\x60\x6a\x6a\xaa\x53\xab\xfc\xda\x15\x19\x6f\xfe\x75\x0f\xaa\
-\x4b\xbf\xc1\x07\xb9\xcb\x60\x8c\xec\x82\xf2\x0b\x91\x98\x92\xaa\
-\xc1\x0b\xaf\xbe\x89\x38\xdb\x79\x44\xe4\x3c\x0a\x09\x40\x7a\x7a\
-\xdb\xed\xa0\xb8\xb8\xd8\x71\xfd\x17\x04\x01\x9f\x7e\xfa\x29\xae\
-\x5e\xbd\xea\x56\xb9\xd4\xb9\xe5\xe5\xe5\xe5\x8e\x36\xa9\xd7\xeb\
-\x91\x9e\x9e\xce\xce\x04\x11\x43\x20\xd1\xcf\x53\x54\x54\x14\xa2\
-\xda\xe8\xbc\xfe\x5c\xa9\x43\x77\x6c\x36\x1b\xae\x5e\xbd\x8a\x57\
-\x5e\x79\xc5\xa3\x3b\xc1\x6a\x67\x76\xdc\xb8\x71\x8e\x80\xd9\xd0\
-\xd0\xe0\x54\x08\xd4\xeb\x6f\xad\x6c\x67\xe8\xda\x07\x39\x65\xfb\
-\x51\xa9\xe9\x8c\x47\xee\xe9\x89\x50\x5c\x81\x26\xef\x30\xcc\x49\
-\x03\xd1\x39\xd0\xf9\xa7\x79\xea\xb0\x2d\xf5\xee\xfa\xfd\xf7\xdf\
-\xef\x95\xb2\xa9\xef\xe7\xca\x6a\x9c\x1a\x83\x2f\xcc\x06\x20\x5a\
-\xea\x8e\xfe\x99\xd7\x50\xd6\xe8\x8f\xde\x7d\x7b\x22\x3c\x6d\x25\
-\xa4\x5d\x5f\x42\x7a\x7a\x39\xc6\x74\x73\xfe\xb3\xa8\xff\xb6\xa2\
-\x28\x28\x29\x29\xc1\xdc\xb9\x73\xbd\x52\x36\xab\xd5\xea\x08\xbc\
-\xce\x0e\x0b\xd3\x1a\x7c\xa0\x05\xd0\x6d\xf0\x08\x5c\x3e\x7a\x0c\
-\x72\xcc\x83\x78\xbd\x7f\x16\x0c\xd7\x8c\x28\x31\x9d\x44\x64\xef\
-\x61\x88\x6b\xef\x5c\xbd\x59\xad\x56\x47\xa7\xd4\x62\xb1\xa0\xa4\
-\xa4\x04\x13\x26\x4c\xf0\x68\x91\x09\xb5\x6c\xea\x7f\x5d\x19\xce\
-\x67\xf2\x0f\xb8\x15\xda\x32\x46\x23\xbb\xe1\x02\x4c\xd1\xdd\xf0\
-\x50\x72\x57\xd4\x9c\xdc\x8b\xa3\xe7\xaf\xe1\xb5\xd5\xe3\x9c\xde\
-\x2c\x5e\x5d\x98\x08\xb8\x35\x97\xf3\xf8\xf1\xe3\x18\x3f\x7e\xbc\
-\xdb\xe5\x52\x17\x02\x52\x17\xce\x51\xcf\x37\x27\x5f\x0c\xc9\x60\
-\x86\x64\xe8\x8c\xe4\xa1\x23\x51\x79\xa2\x08\xfa\xe9\xaf\x60\x7a\
-\x76\x6f\x5c\x3e\x5c\x89\x2f\x2f\x6b\xd0\x6f\xf0\x60\x84\x48\xae\
-\x9d\x6b\x76\xbb\x1d\xf5\xf5\xf5\xd8\xbc\x79\xb3\xe3\x89\xae\x27\
-\x75\xd6\xa7\x4f\x1f\xc7\xff\x37\x34\x34\x38\x19\x02\x35\xf0\xf1\
-\xf7\x07\xe0\x8b\x9e\x63\xc6\x42\x57\x6d\x42\xef\xec\x6c\x44\x69\
-\xae\x42\xb6\x7d\x86\xf2\xd8\x17\xb0\x71\x44\x2a\xf4\x4e\x3e\x64\
-\xb6\xd9\x6c\x8e\x05\x5d\xd4\x05\xb4\xf6\xec\xd9\xe3\x76\x9b\x14\
-\x45\x11\xb2\x2c\x3b\xce\x35\x75\xae\xa3\x53\xd5\x26\x6a\xe0\xe3\
-\xeb\x07\x53\x87\x78\x0c\xea\xfd\x03\xce\x95\x2b\xe8\x3a\xeb\x55\
-\xcc\x8d\xf1\xc5\xbe\x3d\x9f\xc2\x1e\x3a\x15\x43\x07\x38\x7f\x21\
-\x51\x6f\xfc\x58\xad\x56\x54\x55\x55\x61\xd1\xa2\x45\x5e\xb9\x8e\
-\xa8\x4f\xd9\xef\xf6\x3e\x81\x44\x0c\x81\x3f\x13\x9e\x8c\x43\xa7\
-\xe6\x1d\x83\x3b\x79\x1c\x59\x67\x3f\xcf\x7a\xfb\x69\x07\x2e\x35\
-\x35\x15\x67\xce\x9c\xf1\xda\x66\xc1\x1d\x3b\x76\xc4\xd4\xa9\x53\
-\xdd\x7a\xbd\x14\x10\x89\xe1\x63\x27\xa3\xd1\xae\x81\xa4\x11\x00\
-\x04\x62\xf2\x83\x09\x10\x04\x8d\xcb\x2b\x31\x36\x34\x34\x20\x39\
-\x39\x19\x05\x05\x05\x5e\x39\x56\x8a\xa2\x20\x26\x26\x06\xcb\x96\
-\x2d\x73\xab\xbe\x74\xa6\x30\x0c\x18\x35\x09\xb2\x02\x68\x34\x22\
-\x80\x14\xfc\x62\x7a\x12\x04\xad\xd6\xe5\x25\xa2\xed\x76\x3b\x72\
-\x72\x72\xbc\x56\x36\x49\x92\xa0\xd3\xe9\xb0\x79\xf3\x66\xb7\xca\
-\x66\x8e\xea\x8a\xb1\xed\x63\xa1\x08\x5a\x68\x44\x00\xbe\xe9\x98\
-\xfa\xab\x9e\x10\x35\x1a\xa7\xd7\x98\x6c\xba\x98\xc4\xe2\xc5\x8b\
-\xb1\x70\xe1\x42\x8f\x57\x19\x54\xdf\xd3\x93\x27\xf8\xbe\x1d\xd2\
-\x31\x21\x2a\x15\x76\x41\x03\x51\x00\xd0\x6f\x24\x12\x32\x01\x49\
-\xeb\xfa\x70\x55\x8d\x46\x83\xe5\xcb\x97\xe3\x99\x67\x9e\xf1\xf8\
-\x9c\x17\x04\x01\x1a\x8d\x06\xa5\xa5\xa5\x6d\x2e\x50\xd4\x42\x8b\
-\x44\x70\x5c\x1f\x8c\x8b\xc9\x70\xd4\x53\xe8\xa0\x89\x48\x92\x01\
-\xad\x8b\x65\x93\x65\x19\x01\x01\x01\xc8\xcf\xcf\x47\x55\x55\x95\
-\x57\x02\x40\x48\x48\x08\xb6\x6d\xdb\xe6\xe6\xab\x45\x24\x0e\x18\
-\x8d\x04\xd9\x0e\x8d\x46\x00\x10\x89\xe1\xe3\xef\x85\x5d\xa3\x85\
-\xc6\x8d\x15\x5d\xfd\xfc\xfc\x50\x5c\x5c\xec\x08\x85\x9e\xd6\x9b\
-\x56\xab\xc5\xae\x5d\xbb\xdc\x6a\x03\xa2\x29\x18\x69\x83\xc6\x21\
-\x59\xb6\x43\xab\xbd\x35\xfc\x72\xe2\xd4\x07\x21\x0b\x12\x5c\x6d\
-\x92\x16\x8b\x05\x83\x07\x0f\x46\x51\x51\x11\x2c\x16\x8b\x57\xae\
-\xff\x11\x11\x11\xb8\xef\xbe\xfb\x18\x02\x89\x18\x02\x9d\xbf\xd8\
-\x9f\x3f\x7f\x1e\x43\x86\x0c\x61\x6b\xf0\x80\xda\x89\xbf\x53\x81\
-\xc2\x60\x30\xa0\xba\xba\xda\xb1\x64\x39\xb9\xe7\xea\xd5\xab\x3f\
-\x59\xb5\xef\xce\xde\x80\xd1\xe9\x74\x08\x08\x08\xf0\xfa\xfb\xba\
-\x4d\xd4\xa2\xe9\x91\x10\x45\xf7\xb7\xe0\xd0\x6a\xb5\xe8\xdc\xb9\
-\xb3\xd7\xca\xa4\x2e\xa2\xe3\x7e\x2f\x49\x44\xd3\x29\x48\x1a\x0f\
-\xe7\x18\x79\xab\x6c\x00\x1c\xe7\xb2\xdb\x45\xd3\x68\xf1\x8f\xa2\
-\x09\x1e\x6d\x9d\xe2\xe7\xe7\x87\xc0\xc0\x40\xaf\x95\xcd\xd3\xcd\
-\xe2\x05\xb1\x49\x98\x15\x44\x48\x5a\xf7\xdb\x90\x5e\xaf\xf7\xea\
-\xe6\xdc\x65\x65\x65\x1e\xb5\xc9\x66\xf5\x24\x88\x70\xa7\x49\xaa\
-\xe7\x46\x60\x60\xa0\x57\xeb\xcd\x53\x9a\x26\x89\x4f\xf4\xe0\x5c\
-\x13\x04\xc1\xab\x23\x42\x64\x59\xf6\x68\xfb\x8b\x9f\xd6\x93\xa0\
-\x91\xdc\xea\x48\x2a\x8a\x02\xbd\x5e\xef\xdd\xfd\x18\xc1\x1b\xc4\
-\x44\x0c\x81\x2e\x58\xb8\x70\x21\x1e\x7b\xec\x31\xcc\x9e\x3d\x9b\
-\xad\xc1\x4d\xe5\xe5\xe5\x28\x2f\x2f\x47\x68\x68\xe8\x1d\xbb\x00\
-\x07\x06\x06\xc2\x6c\x36\xe3\xf8\xf1\xe3\x48\x4b\x4b\x63\x25\xb8\
-\x69\xf7\xee\xdd\xe8\xd1\xa3\xc7\x5d\x19\x76\xaa\xae\x5c\x98\x9f\
-\x9f\x8f\xeb\xd7\xaf\x7b\x1c\xe6\x05\x41\xc0\x88\x11\x23\x3c\x5a\
-\x40\xc1\xde\x58\x8f\x9a\x7a\x1b\x8c\x3e\x3e\xd0\x42\x86\xa5\xae\
-\x1e\x1a\xbd\x01\x3a\xad\x6b\xa1\x42\x14\x45\xdc\xb8\x71\x03\xb9\
-\xb9\xb9\x5e\xd9\xcb\xd1\x62\xb1\x60\xee\xdc\xb9\x1e\x1d\x23\xc5\
-\x66\x85\xa5\xc1\x06\x83\xd1\x08\x8d\x08\xd4\xd5\xd4\x40\xd0\x9b\
-\x61\x94\x44\x97\x8f\x73\x4d\x4d\x0d\x56\xaf\x5e\xed\x95\xb2\x19\
-\x0c\x06\x64\x65\x65\x41\xa7\xd3\xb9\x1d\x28\xe4\x86\x3a\xd4\xd9\
-\x44\xf8\x98\x0d\x80\x62\x43\x9d\xa5\x01\x3a\x83\x11\x92\x46\x74\
-\xb9\xde\xf6\xef\xdf\x8f\x13\x27\x4e\x78\x65\xbf\x31\xbb\xdd\x8e\
-\x59\xb3\x66\x79\xf4\x1e\x8d\x0d\x75\x68\x54\x34\x30\x1a\xf5\xb0\
-\x37\xd6\xa3\xb6\x5e\x86\xc9\xd7\x0c\x77\x8e\xfc\x57\x5f\x7d\x85\
-\xfc\xfc\x7c\x8f\x17\x19\x51\x37\xe7\x4e\x4c\x4c\xf4\xa8\x0d\x58\
-\x2d\x35\xb0\x42\x0f\x1f\xa3\x04\x9b\xb5\x1e\xf5\x8d\x76\x18\x4d\
-\x46\x97\x9e\x98\xa9\x37\x47\xb6\x6f\xdf\x8e\x0b\x17\x2e\x78\x25\
-\x24\x75\xeb\xd6\xcd\xa3\xd5\x38\xed\x8a\x8c\xda\xba\x06\x98\x7c\
-\x4c\x10\x61\x47\x7d\x5d\x2d\x6c\xc2\xad\x72\xba\x5c\xff\x8d\x8d\
-\x58\xb5\x6a\x95\xd7\x46\x4b\x04\x04\x04\xc0\x6c\x36\xbb\xff\x26\
-\x4a\x23\x2c\x75\xf5\xb0\x4b\x26\x98\xf4\x22\xea\x6b\x6b\xa0\x68\
-\x0c\x30\x19\x5c\x2b\x9b\x24\x49\x28\x29\x29\xc1\xdf\xff\xfe\x77\
-\x54\x55\x55\x79\xe5\x3b\x65\xe0\xc0\x81\xb7\x6d\x49\x44\x44\x0c\
-\x81\x2d\x7e\x41\x4f\x98\x30\x01\x6f\xbe\xf9\x26\x5e\x7a\xe9\x25\
-\x3c\xf9\xe4\x93\xf0\xf5\xf5\x65\xab\x70\xc1\x95\x2b\x57\xb0\x6c\
-\xd9\x32\x18\x0c\x06\xf4\xec\xd9\xf3\x8e\xfe\xdb\xf3\xe7\xcf\xc7\
-\xdc\xb9\x73\xb1\x7a\xf5\x6a\xa4\xa4\xa4\xb0\x32\x5c\xf9\x1e\x57\
-\x14\xec\xdd\xbb\x17\xfb\xf7\xef\xc7\x0b\x2f\xbc\xe0\x59\xa7\xc0\
-\x83\x10\x58\x58\x58\x88\xf9\xf3\xe7\x3b\xee\xe4\x7b\x72\x2e\x7f\
-\xf7\xdd\x77\xa8\xae\xae\x76\xbf\x83\x2b\x5f\xc7\xd6\xf7\xd6\xe3\
-\xfc\x0d\x2b\x12\x32\x87\xa3\x57\x40\x39\xd6\x7d\xf8\x09\xf4\xbd\
-\x26\x60\xd6\xa8\x74\x18\x5c\x08\x4b\x92\x24\xe1\xe2\xc5\x8b\x98\
-\x3f\x7f\x3e\x62\x62\x62\x1c\x2b\x97\xba\xd3\x69\x93\x65\x19\x17\
-\x2f\x5e\xc4\x90\x21\x43\xdc\xde\x2c\x5e\xa9\xaf\xc2\xd1\x9d\xeb\
-\xb1\xeb\x74\x0d\x72\x7e\xf1\x00\xd2\xe4\xa3\x58\xb3\xe9\x38\xb4\
-\xa1\x3d\xf0\xeb\xd9\xe3\x9d\x9e\x5f\xd6\x34\x4c\xcc\x9f\x3f\x1f\
-\xd1\xd1\xd1\x30\x1a\x8d\x6e\x87\x37\xab\xd5\x8a\xcb\x97\x2f\x63\
-\xc5\x8a\x15\xcd\xb6\x11\x71\x2d\x21\x5f\xc4\xfa\xb7\xb7\xa2\xb8\
-\xda\x8e\x9e\x13\x7f\x8d\xe4\xfa\x03\x78\xfb\xc3\x43\x88\x1a\x34\
-\x05\x93\x07\xa7\xc2\xac\x75\xae\xfd\x00\xb7\x9e\xde\xbe\xfb\xee\
-\xbb\x58\xbb\x76\x2d\xba\x75\xeb\xe6\xf6\x13\x13\x41\x10\x50\x5e\
-\x5e\x8e\xca\xca\x4a\x4c\x9b\x36\xcd\xed\x76\xdd\x70\xb3\x10\x1b\
-\x73\xdf\xc5\x15\x73\x57\x74\xcd\x1e\x08\xdd\x37\x5b\x71\xfc\xbb\
-\x52\x44\xf5\x7b\x08\xd3\x06\x45\xbb\x7c\xce\xe7\xe6\xe6\x22\x37\
-\x37\x17\x71\x71\x71\x6e\x3f\x59\x16\x45\x11\x65\x65\x65\xb0\x5a\
-\xad\xd8\xb0\x61\x83\xdb\xe7\x9b\xad\xfc\x04\xd6\x7f\x94\x8f\xd2\
-\x4a\x20\x67\xfa\x2c\xd4\xef\x5b\x8d\x83\x25\x7a\x0c\x1a\x3d\x01\
-\xd9\x3d\xa2\x9c\x1e\xca\xab\xd1\x68\x50\x59\x59\x89\x55\xab\x56\
-\xe1\xec\xd9\xb3\xe8\xdc\xb9\xb3\xdb\x01\x5e\x51\x14\x14\x14\x14\
-\x20\x33\x33\x13\xd3\xa7\x4f\x77\xbb\xde\x7e\x38\xb9\x15\xab\x76\
-\x14\xa2\xff\x98\x07\xd0\xaf\x5d\x05\x36\x6e\xde\x89\x1f\xaa\x8d\
-\xc8\x9a\xfe\x30\x72\xda\xbb\x36\x4c\xd9\x62\xb1\x60\xce\x9c\x39\
-\x30\x18\x0c\x88\x89\x89\x71\x3b\x9c\x6a\xb5\x5a\x9c\x3d\x7b\x16\
-\x61\x61\x61\xc8\xcd\xcd\x75\xef\x9c\x55\x6a\x70\xe2\xd3\x1d\xd8\
-\x7f\xac\x00\xf5\xc6\x08\x0c\xcd\x8e\xc7\xde\xbc\x7c\x18\xc3\xbb\
-\x60\xec\x84\x29\xe8\x10\xe0\xfc\x0d\x01\x9d\x4e\x87\x53\xa7\x4e\
-\x61\xc1\x82\x05\x30\x9b\xcd\x08\x0a\x0a\x72\xfb\x78\xcb\xb2\x8c\
-\x82\x82\x02\x3c\xf5\xd4\x53\x2e\xcd\x99\x26\x62\x08\xfc\x7f\x4c\
-\xbd\x5b\xb4\x6e\xdd\x3a\x3c\xf5\xd4\x53\x98\x31\x63\x06\x7a\xf5\
-\xea\x85\x76\xed\xda\xf1\x4e\x52\x1b\xc7\x4d\x51\x14\x94\x95\x95\
-\xe1\xe0\xc1\x83\x08\x0b\x0b\xc3\xc2\x85\x0b\xe1\xef\xef\x7f\x47\
-\x3f\xc7\xa4\x49\x93\x50\x5e\x5e\x8e\x79\xf3\xe6\x21\x2d\x2d\x0d\
-\x89\x89\x89\xd0\xeb\xf5\x9c\x0f\xd0\x46\xdd\xd5\xd5\xd5\xe1\xc4\
-\x89\x13\x28\x2e\x2e\xc6\xcc\x99\x33\x91\x9d\x9d\x7d\xc7\x3f\x87\
-\x1a\x1c\xb4\x5a\x2d\x82\x83\x83\xb1\x60\xc1\x02\x0c\x19\x32\xc4\
-\xed\xba\xab\xab\xab\xc3\xcc\x99\x33\x1d\xab\xc3\x69\xb5\x5a\x97\
-\x83\xed\xf5\x7d\x9b\xf0\x7e\x89\x09\xbf\xcb\xe9\x82\x92\xb2\x53\
-\xf8\x64\x6f\x3e\xaa\x02\xba\xe3\xcb\xf7\x3f\x46\x4e\x56\x02\x52\
-\xc2\x9c\x9b\xdb\xa5\xae\xc4\xa8\x0e\xb1\xcd\xcb\xcb\x6b\x75\x89\
-\xf9\xb6\x3a\xdc\x75\x75\x75\xe8\xdd\xbb\xb7\xa3\xb3\xed\x4e\xa7\
-\xbb\xec\xfb\x63\xd8\xb8\xe3\x3c\xd2\x46\x0f\x82\x56\x57\x8b\xf7\
-\x9f\x5c\x04\xfb\x6f\x96\xc0\xb8\xf6\x09\xbc\xd1\x7d\x2c\x5e\xed\
-\xef\x5c\xe7\x4d\xfd\xb7\x45\x51\x44\x97\x2e\x5d\xf0\xde\x7b\xef\
-\x21\x36\x36\xd6\xad\x8e\x97\x20\x08\x28\x29\x29\xc1\xe8\xd1\xa3\
-\x1d\x9b\x63\x1b\x0c\x06\x97\xaf\xbd\x67\xff\xbc\x18\x3b\x1b\x87\
-\xe1\x91\xb8\xeb\x38\x5f\x7c\x05\x0d\x47\xfe\x02\x63\x64\x06\xf2\
-\x3e\xdc\x84\xa4\xd8\xce\xc8\x88\xf1\x77\xaa\x3d\xaa\x41\xdd\x68\
-\x34\xa2\x53\xa7\x4e\x38\x72\xe4\x88\xdb\xfb\x20\x4a\x92\x84\x0f\
-\x3e\xf8\x00\xcf\x3c\xf3\xcc\x6d\xed\xc2\x15\xc5\x7b\xfe\x80\x8f\
-\x2f\x65\x60\xe6\xe8\x10\x7c\x7b\xf4\x63\x1c\xff\xa2\x1c\x8f\xde\
-\xdf\x11\x2f\x3e\x31\x1f\xfd\xbf\x5a\x8f\x8e\x4e\xbc\x47\xd3\xe5\
-\xf7\x8d\x46\x23\x06\x0c\x18\x80\x8d\x1b\x37\x42\x51\x14\xb7\xce\
-\x37\xbd\x5e\x8f\xd5\xab\x57\xe3\xf5\xd7\x5f\x77\xdc\x94\x70\xbd\
-\x6c\x15\x38\xb4\xf6\x0d\x5c\x0a\x18\x87\x9e\x61\x85\x38\x71\xec\
-\x28\x0a\x0e\x17\x23\x2b\x3d\x0a\xfb\xb6\x6f\x46\x4c\xec\x63\x88\
-\x74\x62\xd7\x18\x75\x8b\x12\x51\x14\xa1\xd7\xeb\x31\x63\xc6\x0c\
-\xbc\xfa\xea\xab\x6e\x05\x25\x75\x0f\xc5\x17\x5e\x78\x01\x57\xae\
-\x5c\x71\x1c\x33\xd7\xb7\x78\xb1\xe2\x6f\x4b\xff\x80\x5e\xd3\x5f\
-\x82\xa5\xe2\x2a\xf2\x4f\x7e\x86\x1a\xff\x58\x24\xd6\xac\xc5\x7d\
-\x4f\xc7\xe3\xe2\xda\xa1\x30\x8a\xce\x5d\x47\xd4\x39\xdb\xfe\xfe\
-\xfe\x98\x38\x71\x22\x56\xae\x5c\xe9\xd8\xa2\xc5\x55\xfe\xfe\xfe\
-\x48\x4e\x4e\x76\x2c\xe8\x23\x8a\xa2\xcb\x5b\xbc\x58\x8b\xbe\xc6\
-\x5b\xbb\xbe\x42\xa7\x8c\x51\xe8\xda\x78\x0c\x6b\x16\xaf\x46\xe4\
-\xd8\x07\x11\x55\xf1\x37\xe4\xe5\x7f\x85\xdf\x4c\xec\xed\x74\x1b\
-\x52\xdb\x8d\xd9\x6c\xc6\xe2\xc5\x8b\x31\x6c\xd8\x30\xb7\xbf\xd3\
-\x2a\x2a\x2a\x30\x75\xea\x54\xc7\x8d\x24\xf6\xdf\x88\x18\x02\x9d\
-\x16\x19\x19\x89\xe5\xcb\x97\x63\xfb\xf6\xed\x38\x7a\xf4\x28\x4e\
-\x9f\x3e\xcd\x83\xd2\xc6\x45\x57\x10\x04\x98\x4c\x26\xcc\x9a\x35\
-\x0b\x03\x06\x0c\xb8\xe3\x01\x50\xf5\xc8\x23\x8f\x20\x2d\x2d\x0d\
-\x79\x79\x79\xd8\xbf\x7f\x3f\x00\xae\x0c\xe6\x4c\xfd\x75\xef\xde\
-\x1d\x0f\x3f\xfc\xf0\xff\xfa\xd3\xdb\xcf\x3f\xff\x1c\x47\x8f\x1e\
-\x6d\xf6\x94\x47\x10\x04\xc7\x66\xf1\xea\xd2\xee\x61\x61\x61\x1e\
-\xcd\x0d\xa9\xad\xad\x85\xbf\xbf\x3f\x6c\x36\x1b\xb4\x5a\x2d\x0a\
-\x0b\x0b\xf1\xc6\x1b\x6f\xb4\x3a\xd7\x51\x10\x84\x5b\xfb\xd2\xf5\
-\xcf\x46\xa5\xc5\x8a\x6f\xce\x15\xe0\xe6\x85\x72\x7c\x54\xa9\x47\
-\x64\x52\x3f\x34\xde\x68\x40\xf6\x6f\xe7\xc1\xb0\xe7\x41\x9c\x6e\
-\x6c\x40\x87\x8a\x72\xfc\xe5\xc3\x0d\x50\x14\xb9\xd5\x3d\xb0\x0e\
-\x1d\x3a\x84\xf6\xed\xdb\x3b\x7e\x17\x11\x11\xe1\xd1\x93\x56\xab\
-\xd5\xea\x28\x87\xba\x59\xfc\x9f\xfe\xf4\xa7\x16\x83\x97\xba\xd7\
-\xdd\xf8\x89\x93\x10\xe1\xaf\x43\x55\xb5\x05\x17\xcf\x1c\xc1\xbe\
-\x33\xe7\x71\x53\x6f\xc4\x03\x3d\xac\x38\x74\x2a\x1a\x0b\x47\x65\
-\x23\xb8\xb2\x0b\x1e\xc8\xff\x06\x25\xd1\x7a\x6c\xde\xfa\x49\xab\
-\x9f\x43\xa3\xd1\xe0\xdc\xb9\x73\xd0\x68\x34\x50\x14\x05\x66\xb3\
-\x19\x11\x11\x11\x08\x0b\x0b\x73\xbb\x6c\xb2\x2c\x43\x92\x24\xc7\
-\x7c\xb5\xed\xdb\xb7\xe3\xda\xb5\x6b\xad\x76\xe2\x24\x49\xc2\xbf\
-\x8d\x1d\x83\xb0\x00\x33\x2c\x62\x1d\x3e\xd9\x7f\x19\x37\x02\xf6\
-\xe0\xfd\x93\x0a\x06\xcf\x1b\x80\xd2\xa2\x1b\x18\xb1\x66\x0e\xea\
-\xa6\x3d\x89\xea\xba\x9b\x38\x7c\xe4\x0c\x0e\x1f\x3a\xdc\x6a\x78\
-\xbe\x79\xf3\x26\x0a\x0a\x0a\x1c\x65\x33\x1a\x8d\xf0\xf3\xf3\xf3\
-\x68\x51\x97\xf0\xf0\x70\xc7\x50\x49\x49\x92\x90\x97\x97\x87\x86\
-\x86\x86\x16\x17\x52\x91\x65\x19\xed\xda\x85\x63\xcc\xd8\xe1\xb0\
-\x55\xd7\xa1\xde\x14\x84\x53\x3b\x76\xe3\x4c\xb9\x06\xfb\x8f\x29\
-\x08\xf3\x2d\x42\x70\x62\x0e\x7a\xe7\x8c\xc0\xb0\xe0\xe7\x71\xbc\
-\x0c\xa8\x2c\x3a\x82\xdd\x9f\x7d\xde\x62\x67\x5e\x14\x45\x54\x54\
-\x54\x38\xc2\xac\xba\x5f\x9f\x27\x75\x06\xdc\x1a\x8e\xdf\x74\x9e\
-\xea\xe6\xcd\x9b\x51\x58\x58\xd8\x62\x9b\x54\x14\x05\xed\xda\xb5\
-\xc3\xbd\xbf\xfc\x25\xea\xab\x2b\x61\x29\x3b\x8c\xcf\x77\x7f\x83\
-\x53\x91\x1a\x7c\x53\x1f\x8a\x71\xb3\xbf\x87\x4f\xf4\x50\x8c\xbf\
-\xc7\x1f\x65\x1f\x1c\x82\xd5\x02\xac\xdb\xfc\x17\x54\x54\xb4\xde\
-\x16\xd4\xcd\xe2\xd5\x27\xe6\xa1\xa1\xa1\x08\x09\x09\x71\xbb\x5c\
-\x36\x9b\x0d\x81\x81\x81\xb8\x7c\xf9\xb2\xa3\xcd\x2f\x5d\xba\x14\
-\x26\x93\xa9\xc5\xef\x15\x9b\xcd\x86\xe4\xe4\x14\x0c\x1d\xda\x1f\
-\xe5\xa5\x95\xd0\x85\x5c\xc4\x86\x4d\xc5\x88\x0a\xff\x1c\x03\xc6\
-\xfd\x0a\x8d\x8d\x02\x92\xd3\x52\xd1\x77\xd8\x04\x54\xc5\x6c\x42\
-\xdd\xea\x01\xd8\xbd\x7b\x07\x2e\x7c\xf7\x5d\x8b\xe1\x59\xaf\xd7\
-\x63\xcf\x9e\x3d\xcd\x8e\xa7\xc9\x64\x82\xc1\x60\x68\x76\x6d\x71\
-\xb9\xc3\xd7\xe4\x26\xce\xf5\xeb\xd7\xf1\xce\x3b\xef\x20\x2a\x2a\
-\xaa\xc5\x1b\x54\x16\x8b\x05\x43\x86\x0c\x41\x46\x46\x1a\xca\xcb\
-\xca\x50\x72\xfa\x3b\x94\x7c\x73\x00\x57\x1b\x6a\x71\xc1\xe6\x83\
-\x12\xc9\x17\xcf\x8d\x1a\x84\xeb\xc7\xeb\x70\xf0\xdb\x4b\xb0\xd8\
-\x7a\x61\xdd\xda\xb7\x50\x5b\x5b\xdb\x62\xbd\x09\x82\x80\x2f\xbf\
-\xfc\xd2\x71\xfd\x17\x04\x01\x91\x91\x91\x1e\x95\x4b\x14\x45\x98\
-\x4c\x26\x47\xb8\xad\xa9\xa9\xb9\xed\x1a\x29\xcb\x32\x82\x83\x83\
-\x31\x65\xca\x14\x6e\x16\x4f\xc4\x10\xd8\x5c\x48\x48\x08\x66\xcc\
-\x98\x81\x29\x53\xa6\x78\x65\xec\xfd\xff\x07\x7a\xbd\x1e\x3e\x3e\
-\x3e\x77\xfd\x73\xf4\xee\xdd\x1b\xe9\xe9\xe9\xb8\x79\xf3\xa6\x57\
-\xe6\xf1\xfc\xab\x13\x45\x11\x01\x01\x01\x77\xe4\x6e\x69\x64\x64\
-\x24\xd2\xd2\xd2\x9a\x0d\x87\x54\xe7\xb5\xa9\x75\xa5\x6e\xf0\xee\
-\x09\x59\x96\x1d\xcb\xd5\xab\x1d\xdd\xa4\xa4\xa4\x56\x87\x2a\x0a\
-\x82\x80\xe8\xe8\x68\x1c\x3a\xb0\x0f\xef\xe5\x17\x22\xcb\x7e\x0d\
-\x51\x43\xa7\xe3\xe1\x7e\x66\x2c\x5b\xf4\x7b\x04\x98\xcd\xb0\xdb\
-\x01\xc5\x0e\x88\x00\xcc\x46\x23\x52\x52\x92\x5b\x6c\x63\xea\xcd\
-\x91\xbd\x7b\xf7\xde\xf6\xd9\x3c\x2d\x5b\xd3\x32\xf8\xfb\xfb\x23\
-\x25\x25\xe5\xb6\xdf\xff\x24\x09\x22\x38\x2c\x1c\x25\x79\xaf\x61\
-\xd3\xd6\x6f\x70\xb8\xbe\x1e\xe1\x49\x23\xf1\xbb\xf1\xbe\x58\x7b\
-\xb4\x10\xf5\x56\x05\x0a\x00\x51\x00\x64\xbb\x80\xe0\xa0\x60\xa4\
-\xa4\xa4\xb4\x7a\xac\x44\x51\x84\x9f\x9f\x9f\x63\x9f\x32\x45\x51\
-\xbc\x5a\x36\x45\x51\xd0\xa1\x43\x87\x36\x87\x76\x6b\xb5\x5a\xf8\
-\x99\x25\x14\x7e\xb2\x1a\xb9\x5f\xfc\x80\xa2\xaf\x8b\x91\xb4\xf2\
-\x79\x3c\xa4\xdb\x87\x09\x7f\xd8\x81\x17\xa2\x0d\x90\xa1\x40\x81\
-\x00\x59\xb1\x23\x3c\xbc\x3d\x7a\xf6\xec\xd9\x6a\x70\xbf\x7e\xfd\
-\x3a\x7c\x7d\x7d\x6f\xdb\xd6\xc1\x13\x4d\xdb\x89\xa2\x28\x88\x8a\
-\x8a\x42\x7a\x7a\x7a\x8b\x4f\x17\xed\x76\x3b\x7c\x7d\x83\xe0\xe7\
-\xdb\x88\xff\x7a\xfe\x59\x1c\x89\x1c\x87\x81\x8d\x76\xa4\x4d\xfa\
-\x77\x64\xde\xdc\x8d\x79\xcb\xfe\x86\xc1\x33\xfb\xff\x58\x6f\x76\
-\x40\x00\xda\x87\x87\x3b\xce\xaf\x96\x02\x73\x71\x71\x71\xb3\x3f\
-\xf7\x76\xd9\x00\x20\x3e\x3e\x1e\x3d\x7b\xf6\x6c\x75\xa5\x50\x5f\
-\x5f\x5f\x40\xb1\xe0\xcc\x7f\xff\x1e\x6f\x1f\x3c\x8f\x8a\xcb\xc0\
-\xd0\x67\x1e\xc6\xd0\x92\xa5\xe8\xf5\x8a\x15\x0b\x27\xdd\x03\x59\
-\xb1\x41\x10\x44\xc8\xb2\x1d\x5d\x13\xba\xa2\x3a\xb2\xa6\xd5\xeb\
-\x58\x61\x61\x61\xb3\x36\xea\xad\xeb\x48\xd3\x72\x26\x26\x26\x22\
-\x30\x30\xb0\xc5\xa1\xc1\x8a\xa2\x20\x32\xaa\x13\x20\x5f\xc6\x5b\
-\x8b\x16\xa0\x6a\x48\x16\x42\x03\xa2\x31\x6d\x54\x0e\xd6\xbd\xf5\
-\x01\xa2\x06\x45\xa3\xa3\x2c\x43\x11\x45\x00\xe2\x8f\x4f\xd1\x63\
-\xe0\xe3\xeb\xdb\xe2\x7c\x4a\x3f\x3f\x3f\x9c\x3b\x77\xee\xb6\xf6\
-\xe1\xa9\xa6\xc1\x5d\xaf\xd7\x23\x31\x31\x11\xb1\xb1\xb1\xff\xb4\
-\xde\xd4\x7d\x13\xc3\xda\xb5\x43\xfd\x8d\xcb\x58\xf1\xd2\xd3\xb8\
-\xaa\x84\x41\xd7\x2d\x07\xf7\xfd\xe6\x69\x84\xef\x9c\x82\xec\x77\
-\x3a\x40\xaf\x91\x21\x2b\x22\x04\xc1\x0e\x51\x23\x20\x29\x31\x11\
-\x0d\xad\xb4\x03\x49\x92\x50\x56\x56\x86\x23\x47\x8e\x38\x3e\x93\
-\xba\xf2\xa9\xbb\xdf\x49\x4d\xaf\x23\xea\x48\x90\xcc\xcc\x4c\x54\
-\x57\x57\x37\x2b\xbb\x8f\x8f\x8f\xc7\xf3\x61\x89\x18\x02\xff\x85\
-\x99\xcd\xe6\xbb\x32\x3f\x8a\x3c\xa3\xd1\x68\xfe\x4f\xad\x0c\x47\
-\xb7\xc4\xc4\xc4\xdc\xb6\x1a\xa1\x1a\x96\x9a\x2e\x79\xee\xe9\xcd\
-\x04\x83\xc1\xe0\xb8\xb3\xac\x28\x0a\x02\x03\x03\x91\x9d\x9d\xdd\
-\xe6\xb9\x2c\x08\x02\x3a\x74\x88\x46\xd6\xe0\xe1\x28\x59\xbf\x10\
-\x1f\x5f\x0b\x40\x6c\x4c\x10\xcc\x66\x13\xda\xb7\xf3\xc7\x95\x4f\
-\x76\xe0\xcb\xf6\x71\x98\xa6\xd5\x43\x67\xf6\x41\xff\xfe\xfd\xdb\
-\x7c\xbf\xbf\xfe\xf5\xaf\x8e\x27\x09\x6a\x87\xce\x13\x46\xa3\xd1\
-\xd1\x59\x54\x37\x8b\x57\x87\xf0\xb6\xd6\x31\x14\x04\x01\xe6\xd1\
-\xf3\xf1\xd8\x3d\x36\x8c\x39\xb3\x0b\x6f\xe6\x16\xa1\x31\xa4\x03\
-\xf4\x96\x38\xe4\x24\xad\xc0\xb1\x52\x40\xbf\xf5\x0b\xa4\x3e\xd6\
-\x03\x46\x3f\x20\x27\x27\xa7\xcd\xb2\x85\x85\x85\x39\x16\x71\xd0\
-\x6a\xb5\x1e\xdf\x51\xf7\xf3\xf3\x73\x74\xfc\x6c\x36\x1b\xba\x76\
-\xed\x8a\x9c\x9c\x9c\x36\x3b\x83\x82\x00\x98\xc6\x3e\x89\xd7\x27\
-\x19\xf0\x79\xc3\x48\xbc\xdb\x10\x8f\xf8\xc0\xbf\x41\x1b\x10\x89\
-\x4e\x71\x11\x28\xda\xbe\x13\x17\x4d\xa1\x18\x6b\x0e\x40\xe7\x4e\
-\x7e\xe8\xd4\xb1\x63\xab\xe5\x2a\x2d\x2d\x75\x6c\x16\x6f\xb7\xdb\
-\xbd\xb2\xe0\x8d\xd1\x68\x74\x94\x43\x96\x65\xc4\xc5\xc5\xa1\x57\
-\xaf\x5e\x4e\x75\xe6\xa7\xbf\xb6\x06\xd3\x24\x3d\x2e\xff\xf9\x7d\
-\x6c\xab\xaa\x85\x7f\x94\x11\x68\xdf\x03\x37\xbf\x2f\x85\x88\xdd\
-\xd8\x72\x32\x13\xef\x85\x01\xed\xec\x1d\x11\x16\xd5\x7a\xd9\x0a\
-\x0a\x0a\x1c\x4f\x9c\xd4\x27\xef\xde\x28\x5b\xd3\x50\x11\x17\x17\
-\x87\xbe\x7d\xfb\xb6\x59\x36\x41\x00\x52\xef\x7f\x05\x2b\x1e\xb8\
-\x84\x4d\xbf\x9d\x85\xea\x90\xce\x08\x3c\x5b\x0a\x9f\x0e\x53\x60\
-\xa9\x3c\x8d\xa2\xa2\x4e\xb8\x5e\xab\xc0\xe0\x2b\x20\x36\x3d\x1d\
-\x6d\x1d\xa9\xe0\xe0\x60\xc7\x31\x56\x9f\xe0\x7a\x7a\x63\xb3\xe9\
-\x53\x55\xbb\xdd\x8e\x7e\xfd\xfa\x21\x28\x28\xa8\xed\x7a\x13\xec\
-\x78\x7c\xc9\x1a\x48\x26\x2d\xd6\xbe\xbf\x14\xd1\xb1\x7e\x68\xd0\
-\x07\x20\x42\xb0\xe2\x9a\x46\x8b\xd2\xad\x9b\x60\x1b\xff\x14\x8c\
-\x3a\x0d\xba\xf7\xe8\x81\x24\x7b\xeb\xe7\xda\x81\x03\x07\x9a\x2d\
-\x04\xe5\x8d\xf0\xa2\x0e\x97\x57\x87\x3d\x27\x27\x27\x23\x35\x35\
-\xb5\xed\x7a\x03\xf0\xec\x92\xb7\x61\x39\x97\x87\xd9\xff\x75\x0a\
-\xe6\x90\x40\xe8\xad\x75\x88\xb0\x55\x61\x7b\x49\x03\x32\x2a\xbf\
-\x86\x6c\x1c\x0c\xbd\x00\x64\x66\x65\xb5\xf9\x39\x2e\x5d\xba\xe4\
-\x08\xd5\x82\x20\xc0\xc7\xc7\xc7\xa3\x9b\x92\x7a\xbd\xbe\xd9\x8d\
-\x46\xbd\x5e\xdf\xe2\x82\x71\x1c\x2a\x4a\xc4\x10\x48\x44\x77\x40\
-\x6b\x5f\xb8\x82\x20\x40\x92\x24\xd8\x6c\xb6\x36\xc3\x95\x53\x17\
-\x33\xad\x16\x83\x06\x0d\xba\x2d\x6c\xb6\xfd\xba\x5b\x9d\xe2\x98\
-\x7b\x9f\x44\xdf\x7b\x27\x20\x6d\x83\x80\x79\xaf\xbc\x8f\xb1\x3e\
-\x87\x31\x65\xe2\x43\x88\x7b\x76\x1d\xda\x05\xfb\xb9\xdc\x81\x50\
-\xe7\x29\x79\xab\xd3\xf1\xcf\x3a\x81\x6d\xbd\xb7\x28\x19\xa0\x97\
-\x80\x6e\x49\x03\x31\x2c\x72\x0e\x46\xff\xea\x73\xe4\xae\xcb\xc5\
-\x90\x55\x7f\xc4\xa0\xec\x60\xc8\x43\x56\xe0\x50\x5f\xd7\x3a\x47\
-\xea\x50\xf0\xe3\xc7\x8f\x23\x32\x32\xd2\xe3\x72\xb5\x6f\xdf\x1e\
-\x92\x24\x39\xfe\x7d\x67\xeb\x4d\xa3\xbb\xd5\x59\x1f\xb8\xe4\x4f\
-\xd8\x3c\x6c\x20\x12\xea\xba\x61\x7d\xde\x6f\x61\x3e\x7e\x03\x8f\
-\xfc\xf2\x29\x8c\xfa\xe3\x3a\x74\xed\xe2\x5c\xbd\xa9\x9d\x6d\x41\
-\x10\x60\x36\x9b\x51\x50\x50\xe0\xb5\x7a\xd3\x68\x34\xcd\xca\xe4\
-\xcc\xfb\xea\x4d\xb7\x6e\x5e\xb4\x9f\xba\x14\x11\x23\x07\x61\x51\
-\xd2\x6c\x6c\xd8\xb1\x06\xdf\xbf\x39\x03\x89\xed\x3f\xc3\xa4\x8f\
-\xce\x23\xfa\xc7\x54\xe5\xca\x22\x23\x46\xa3\x11\x5b\xb6\x6c\xf1\
-\xb8\x6c\xa2\x28\x22\x32\x32\x12\xa2\x28\xba\x5c\x36\x8d\xa4\x03\
-\x10\x87\xc9\x0b\x5e\xc7\x6f\xa6\x8d\xc0\xab\x55\xc3\xf1\xc5\xc1\
-\x49\xd8\xfe\xf8\x48\x8c\x78\x42\x83\xff\x5c\xfa\x36\xa2\x0c\xb7\
-\xa2\x87\xe0\x44\x99\xd4\x8e\x7f\x68\x68\x28\x5e\x7a\xe9\x25\xbc\
-\xf8\xe2\x8b\x1e\xd7\xd9\x98\x31\x63\x6e\x2b\x53\xdb\x65\x13\x60\
-\x30\xdd\x0a\xa1\x03\x9f\x9d\x87\xbe\x23\x5f\xc6\xea\x9d\xdb\x31\
-\x12\x47\xf0\xab\xd9\xf7\xe2\xe9\xf2\x6e\x38\x74\xb0\x1f\x0c\xe2\
-\x8f\x65\x13\x9c\xbb\x76\xaa\xc7\x77\xc5\x8a\x15\x58\xb6\x6c\x99\
-\x47\xe5\x92\x24\x09\xf1\xf1\xf1\x6e\x94\x0d\x30\xe8\xf5\x30\xa4\
-\x0c\xc7\xec\xae\xfb\xf0\xfa\xc8\x68\x54\x26\x3c\x8f\xd3\xfb\x12\
-\x30\x62\x60\x1a\x3e\xce\x9c\x80\xa5\x6b\xfa\x3a\xfd\x5e\xea\xdf\
-\x51\x87\x71\x7a\x63\x5e\xba\x20\x08\x18\x35\x6a\x14\xc3\x1e\x11\
-\x43\x20\x11\xfd\x5f\x66\xb7\xdb\x51\x5d\x5d\x8d\xea\xea\x6a\xdc\
-\x7b\xef\xbd\xa8\xaa\xaa\xf2\xca\x16\x11\xd1\xd1\xd1\xd8\xb9\x73\
-\xa7\x5b\xc3\xc2\xec\x76\x3f\x3c\xb7\xfe\x53\x3c\xe7\xf8\xcd\x44\
-\x7c\xf6\xfd\x44\xb7\x3e\x8b\x3a\x0f\x6b\xd6\xac\x59\x1e\x3f\x79\
-\x51\xb7\x64\xa8\xab\xab\xc3\xb5\x6b\xd7\xdc\x1b\x16\x66\x08\xc5\
-\xa4\x05\x1f\x61\xd2\x02\xf5\x17\x93\xb0\xbf\x70\x92\x5a\x70\xc0\
-\xc9\x0e\x93\xcd\x66\x43\x4d\x4d\x0d\x64\x59\xc6\x13\x4f\x3c\xe1\
-\x95\x3d\x3a\x75\x3a\x1d\x8c\x46\x23\xae\x5c\xb9\xe2\x5e\x5b\x42\
-\x0c\x96\xed\xf9\xfa\x1f\xbf\xe8\xff\x6b\x1c\xbf\xfc\x6b\x97\xdb\
-\xa3\xdd\x6e\x47\x49\x49\x09\x52\x52\x52\x30\x67\xce\x1c\xaf\x0d\
-\x2d\xbf\x78\xf1\x22\x1a\x1b\x1b\xdd\x6a\x93\x26\xff\x18\x2c\x3d\
-\x74\xc9\xf1\x73\xdf\xe7\xd7\x62\xea\xf3\x6a\xb9\xe1\x74\x00\x94\
-\x65\x19\x57\xaf\x5e\x45\x56\x56\x16\xe6\xcd\x9b\xe7\x98\x87\xe9\
-\x49\x9b\xd4\x6a\xb5\x28\x2b\x2b\x73\x7f\x18\x7e\x50\x6f\xe4\xee\
-\x3c\xe6\xf8\x71\xe6\xd2\x5d\x98\xe9\xc6\x75\xc4\x66\xb3\xa1\xba\
-\xba\x1a\xa3\x47\x8f\x46\x52\x52\x92\xc7\xc3\x26\x65\x59\x46\x6c\
-\x6c\x2c\x2a\x2a\x2a\x00\xc0\xad\xb2\x75\xe9\xfb\x28\x2e\x9d\x78\
-\xf4\xc7\x9f\x32\xf1\xce\xd6\x43\x6e\x7d\x0e\x59\x96\x51\x54\x54\
-\x84\xd9\xb3\x67\x7b\x3c\x4d\x45\x0d\x45\x01\x01\x01\x38\x73\xe6\
-\x8c\xa3\xcd\xbb\xc6\x88\x01\x8f\x2e\xc6\x80\x47\x17\x3b\x7e\x73\
-\xf0\xdc\xb7\x70\xb5\x45\x2a\x8a\x82\x1b\x37\x6e\x40\xa7\xd3\xe1\
-\xc1\x07\x1f\x74\x0c\x31\xf7\xb4\x7c\x71\x71\x71\xc8\xcf\xcf\x6f\
-\x75\x58\x32\x11\x31\x04\x12\xd1\x5d\x14\x16\x16\x86\x80\x80\x00\
-\xdc\x73\xcf\x3d\x90\x24\xc9\x2b\x61\xc2\x6e\xb7\x63\xc9\x92\x25\
-\x00\x80\xe7\x9e\x7b\xce\xe5\xe1\x53\xde\xba\x71\xdc\xa7\x4f\x1f\
-\x7c\xf4\xd1\x47\x18\x3e\x7c\xb8\xfb\xdb\x1e\xfc\xa4\x5c\xa2\x28\
-\x22\x37\x37\x17\xbe\xbe\xbe\x78\xf6\xd9\x67\xbd\x5b\x19\x2e\x14\
-\x7c\xf0\xe0\xc1\xc8\xcb\xcb\x43\x56\x56\x96\x57\x57\xe2\xb5\x5a\
-\xad\x08\x0d\x0d\x45\x4c\x4c\x8c\xcb\x77\xf0\xbd\x51\x6d\x3e\x3e\
-\x3e\xc8\xcc\xcc\xc4\x8a\x15\x2b\x20\xcb\x32\xb4\x5a\xad\xd7\x9e\
-\x24\x2c\x59\xb2\x04\xf1\xf1\xf1\xe8\xde\xbd\xbb\x77\xab\xcd\xc9\
-\xbf\xe7\xe7\xe7\x87\x51\xa3\x46\x61\xf9\xf2\xe5\x58\xb9\x72\xa5\
-\xd7\xe6\x44\xd9\xed\x76\x58\xad\x56\xa4\xa7\xa7\x23\x36\x36\xf6\
-\xae\x5c\x47\x82\x82\x82\x90\x9d\x9d\x8d\x97\x5f\x7e\x19\x5a\xad\
-\xd6\x2b\xc3\x78\xd5\x90\xd2\xd8\xd8\x88\x11\x23\x46\xb8\xbc\x82\
-\xa6\xb7\xa4\xa4\xa4\x20\x21\x21\x01\x93\x27\x4f\x76\xac\x14\xea\
-\xad\xb2\xd9\xed\x76\xdc\x77\xdf\x7d\x1e\x2d\xa2\xe3\xc9\x99\xd8\
-\xb9\x73\x67\x84\x84\x84\x60\xf6\xec\xd9\x5e\x2d\xdb\xd2\xa5\x4b\
-\xa1\x28\x0a\x66\xce\x9c\x09\x22\x72\xe2\xac\xb5\x73\x29\x45\x22\
-\xba\x0b\x4e\x9e\x3c\x89\x13\x27\x4e\x78\x65\x8e\x52\xd3\x8e\xa9\
-\x46\xa3\xc1\xf8\xf1\xe3\xdd\x5a\x92\xdf\x5b\x9f\x61\xdf\xbe\x7d\
-\xf8\xe1\x87\x1f\xbc\xfe\xde\x26\x93\x09\x63\xc7\x8e\xbd\xab\x43\
-\x9d\x36\x6d\xda\x04\xab\xd5\xea\xd5\xcf\x20\xcb\x32\x62\x62\x62\
-\xd0\xab\x57\xaf\xbb\xb6\x70\x43\x45\x45\x05\x0e\x1c\x38\x00\x8b\
-\xc5\xe2\xd5\xb2\x29\x8a\x82\xf8\xf8\x78\x64\x64\x64\x78\xb4\xf8\
-\x85\x27\x6e\xde\xbc\x89\x2d\x5b\xb6\x78\xf5\x5c\x53\x65\x64\x64\
-\xdc\xb5\x10\x08\xdc\x5a\x21\x74\xd7\xae\x5d\x5e\x5f\xf1\xb1\xb6\
-\xb6\x16\x0f\x3c\xf0\xc0\x5d\xb9\x8e\xa8\xed\xe4\xd8\xb1\x63\x38\
-\x7b\xf6\xac\x57\x6e\x92\x35\x25\x49\x12\x72\x72\x72\x10\x1a\x1a\
-\x7a\xd7\xea\xed\xdb\x6f\xbf\xc5\xe1\xc3\x87\xbd\x1a\xb2\xd5\x45\
-\xc6\x3c\xd9\x9b\x93\x88\x21\x90\x88\x88\x88\x88\x88\x88\xfe\x25\
-\x89\x3c\x04\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\
-\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\
-\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\
-\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\
-\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\
-\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\
-\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\
-\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\
-\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\
-\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\
-\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\
-\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\
-\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\
-\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\
-\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\
-\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\
-\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\
-\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\
-\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\
-\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\
-\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\
-\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\
-\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\
-\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\x0c\x81\x44\
-\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\x81\
-\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\x0c\
-\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\x44\
-\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\
-\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\
-\x44\x44\x0c\x81\x44\x44\x44\xb9\xe9\xcc\xdc\x00\x00\x00\x2d\x49\
-\x44\x41\x54\x44\x44\x44\xc4\x10\x48\x44\x44\x44\x44\x44\xc4\x10\
-\x48\x44\x44\x44\x44\x44\x44\x0c\x81\x44\x44\x44\x44\x44\x44\xc4\
-\x10\x48\x44\x44\x44\x44\x44\x44\x3f\x13\xff\x03\xc9\x64\x1c\x8f\
-\x33\x46\x23\xbb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-"
+RCCFILE = 'Glucid8824.rcc'
 
-qt_resource_name = b"\
-\x00\x09\
-\x0c\x78\x54\x88\
-\x00\x6e\
-\x00\x65\x00\x77\x00\x50\x00\x72\x00\x65\x00\x66\x00\x69\x00\x78\
-\x00\x12\
-\x05\xe4\xff\x60\
-\x00\x6c\
-\x00\x75\x00\x63\x00\x69\x00\x64\x00\x38\x00\x38\x00\x32\x00\x34\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x62\x00\x6d\
-\x00\x70\
-\x00\x10\
-\x0b\x73\x97\xe7\
-\x00\x67\
-\x00\x6c\x00\x75\x00\x63\x00\x69\x00\x64\x00\x53\x00\x70\x00\x6c\x00\x61\x00\x73\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x0c\x31\xb0\xc7\
-\x00\x67\
-\x00\x6c\x00\x75\x00\x63\x00\x69\x00\x64\x00\x4c\x00\x61\x00\x79\x00\x6f\x00\x75\x00\x74\x00\x33\x00\x2d\x00\x6e\x00\x6f\x00\x73\
-\x00\x69\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
+registered = False
 
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
-\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x42\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x7e\
-\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x01\x1a\xa3\
-"
 
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x62\xea\xd6\x1c\x89\
-\x00\x00\x00\x42\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x7e\
-\x00\x00\x01\x67\x1d\x92\x1d\x49\
-\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x01\x1a\xa3\
-\x00\x00\x01\x64\xeb\x84\xaf\x7c\
-"
+def rcc_path():
+    """Glucid8824.rcc, next to this module or in the bundle of a
+    pyinstaller binary
+    """
+    return os.path.join(getattr(sys, '_MEIPASS',
+                                os.path.dirname(os.path.abspath(__file__))),
+                        RCCFILE)
 
-qt_version = QtCore.qVersion().split('.')
-if qt_version < ['5', '8', '0']:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
 
 def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    """Register the resources, once; returns True if they are"""
+    global registered
+    if not registered:
+        registered = QtCore.QResource.registerResource(rcc_path())
+        if not registered:
+            logging.error("xglucid: could not load resources from %s",
+                          rcc_path())
+    return registered
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-qInitResources()
+def qCleanupResources():
+    global registered
+    if registered:
+        QtCore.QResource.unregisterResource(rcc_path())
+        registered = False
@@ -33,10 +33,251 @@ import configparser
 import getopt
 import sys
 import os
+import time
+import bisect
+import contextlib
+import collections
 import serial
-from distutils.util import strtobool
+import glucidcapture
 from _ast import Or
 
+
+class CommandStats:
+    """Counters and a latency histogram for one command key,
+    kept by `Glucid8824` for every command it sends
+    """
+    # upper bounds of the latency histogram buckets, in seconds;
+    # a last bucket holds everything slower
+    BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+    def __init__(self):
+        self.sent = 0
+        self.written = 0
+        self.read = 0
+        self.timeouts = 0
+        self.bad_frames = 0
+        self.mismatches = 0
+        self.retries = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.histogram = [0] * (len(self.BUCKETS) + 1)
+
+    def record_latency(self, seconds):
+        """Add one successful round trip of `seconds`"""
+        self.latency_total += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        self.histogram[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+
+    def as_dict(self):
+        """Return the counters as a plain dictionary"""
+        replies = sum(self.histogram)
+        return {
+            'sent': self.sent,
+            'bytes_written': self.written,
+            'bytes_read': self.read,
+            'timeouts': self.timeouts,
+            'bad_frames': self.bad_frames,
+            'mismatches': self.mismatches,
+            'retries': self.retries,
+            'latency_mean': self.latency_total / replies if replies else 0.0,
+            'latency_max': self.latency_max,
+            'histogram': dict(zip(
+                [str(b) for b in self.BUCKETS] + ['inf'], self.histogram)),
+        }
+
+class DeviceState:
+    """The last known state of a Lucid 8824: the mode register
+    (meter and dig1 bits), sync, the three output sources and the
+    gains, kept by `Glucid8824` from the responses to Get commands
+    and written through on every successful Set command.
+
+    Values older than `max_age` seconds are stale and are read
+    from the unit again.  A `max_age` of 0 disables the cache.
+    """
+    # Get command key -> attribute holding its decoded value
+    FIELDS = {
+        'GetMode': 'mode',
+        'GetSync': 'sync',
+        'GetOptSrc': 'opt_src',
+        'GetAnalogSrc': 'analog_src',
+        'GetAesSrc': 'aes_src',
+        'GetAnalogGain': 'gain',
+    }
+
+    def __init__(self, max_age=2.0):
+        self.max_age = max_age
+        # Get command key -> (time.monotonic(), payload bytes)
+        self.values = {}
+
+    def get(self, cmdkey):
+        """Return the payload of the Get command `cmdkey` if it is
+        known and fresh, otherwise None
+        """
+        hit = self.values.get(cmdkey)
+        if hit is None or time.monotonic() - hit[0] >= self.max_age:
+            return None
+        return hit[1]
+
+    def record(self, cmdkey, frame, retval):
+        """Update the state from the command `cmdkey` that was sent
+        as `frame` and answered with `retval`
+        """
+        if cmdkey.startswith('Set'):
+            getkey = 'Get' + cmdkey[3:]
+            if getkey not in self.FIELDS:
+                return
+            if retval is False:
+                # the unit may or may not have taken the value
+                self.values.pop(getkey, None)
+            else:
+                # the arguments sent are the unit's new value
+                self.values[getkey] = (time.monotonic(),
+                                       bytes(frame[7:-1]))
+        elif cmdkey in self.FIELDS and retval is not False \
+                and retval is not True:
+            self.values[cmdkey] = (time.monotonic(), bytes(retval))
+
+    def invalidate(self, cmdkey=None):
+        """Forget the value of the Get command `cmdkey`, or of
+        every command
+        """
+        if cmdkey is None:
+            self.values = {}
+        else:
+            self.values.pop(cmdkey, None)
+
+    def _value(self, cmdkey):
+        payload = self.get(cmdkey)
+        return payload[0] if payload else None
+
+    @property
+    def mode(self):
+        """The raw mode register, or None if unknown"""
+        return self._value('GetMode')
+
+    @property
+    def meter(self):
+        """Meter source, bits 0-1 of the mode register"""
+        mode = self.mode
+        return None if mode is None else mode & 3
+
+    @property
+    def dig1(self):
+        """Digital 1,2 input, bit 2 of the mode register"""
+        mode = self.mode
+        return None if mode is None else (mode >> 2) & 1
+
+    @property
+    def sync(self):
+        return self._value('GetSync')
+
+    @property
+    def opt_src(self):
+        return self._value('GetOptSrc')
+
+    @property
+    def analog_src(self):
+        return self._value('GetAnalogSrc')
+
+    @property
+    def aes_src(self):
+        return self._value('GetAesSrc')
+
+    @property
+    def gain(self):
+        """Gains in channel order, IN 1-8 then OUT 1-8, as the
+        integers the 8824 uses, or None if unknown
+        """
+        payload = self.get('GetAnalogGain')
+        if payload is None or len(payload) != 16:
+            return None
+        # the lucid reverses this 8..1 8..1
+        return list(payload[7::-1] + payload[15:7:-1])
+
+
+class DeviceSnapshot:
+    """An immutable copy of every readable parameter of a Lucid
+    8824, as returned by `Glucid8824.read_all`.
+
+    The raw values are the integers the 8824 uses; the `*_name`
+    properties and `gain_db` render them the way the cli and
+    xglucid show them.
+    """
+    __slots__ = ('siface', 'instanceid', 'sync', 'mode', 'opt_src',
+                 'analog_src', 'aes_src', 'gain')
+
+    def __init__(self, siface, instanceid, sync, mode, opt_src,
+                 analog_src, aes_src, gain):
+        """gain - the 16 gains in channel order, IN 1-8 then OUT 1-8"""
+        for name, value in (('siface', siface),
+                            ('instanceid', instanceid),
+                            ('sync', sync),
+                            ('mode', mode),
+                            ('opt_src', opt_src),
+                            ('analog_src', analog_src),
+                            ('aes_src', aes_src),
+                            ('gain', tuple(gain))):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DeviceSnapshot is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("DeviceSnapshot is read-only")
+
+    def __eq__(self, other):
+        if not isinstance(other, DeviceSnapshot):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        return 'DeviceSnapshot(%s)' % ', '.join(
+            '%s=%r' % (name, getattr(self, name)) for name in self.__slots__)
+
+    @property
+    def meter(self):
+        """Meter source, bits 0-1 of the mode register"""
+        return self.mode & 3
+
+    @property
+    def dig1(self):
+        """Digital 1,2 input, bit 2 of the mode register"""
+        return (self.mode >> 2) & 1
+
+    @property
+    def sync_name(self):
+        return Glucid8824.SYNC[self.sync]
+
+    @property
+    def meter_name(self):
+        return Glucid8824.METER[self.meter]
+
+    @property
+    def dig1_name(self):
+        return Glucid8824.DIG1[self.dig1]
+
+    @property
+    def opt_src_name(self):
+        return Glucid8824.OPTICAL_SRC[self.opt_src]
+
+    @property
+    def analog_src_name(self):
+        return Glucid8824.ANALOG_SRC[self.analog_src]
+
+    @property
+    def aes_src_name(self):
+        return Glucid8824.AES_SRC[self.aes_src]
+
+    @property
+    def gain_db(self):
+        """Gains in channel order as strings representing dB"""
+        return tuple(Glucid8824.gain_int_to_db_string(g) for g in self.gain)
+
+
 class Glucid8824:
     """The glucid8824 class represents a single Lucid
     ADA8824 unit and provides methods to communicate with
@@ -71,6 +312,14 @@ class Glucid8824:
             'SetAnalogGain': '30',
     }
 
+    # the same constants as integers, so frames can be
+    # encoded and checked without parsing hex strings
+    STARTBYTE_INT = int(STARTBYTE, 16)
+    ENDBYTE_INT = int(ENDBYTE, 16)
+    FRAMEHEADER = bytes([int(i, 16) for i in LUCIDINCID + [MODELID]])
+    RESPONSEBYTE = 0x05
+    COMMANDSET_INT = {k: int(v, 16) for k, v in COMMANDSET.items()}
+
     # OPTIONS FOR FRONT METER
     METER = ('Analog In', 'Digital In', 'Analog Out', 'Digital Out')
 
@@ -148,13 +397,14 @@ class Glucid8824:
     DEVICES = {
         'rs232' : [
             '/dev/ttyUSB0',
-            '/dev/tty.usbserial',
-            'COM1',
             '/dev/ttyUSB1',
             '/dev/ttyUSB2',
             '/dev/ttyUSB3',
             '/dev/ttyUSB4',
             '/dev/ttyUSB5',
+            '/dev/tty.usbserial',
+            '/dev/tty.usbserial-A50285BI',  # FTDI based dongle
+            '/dev/tty-usbserial-1430',  # Prolific based dongle
             '/dev/ttyS0',
             '/dev/ttyS1',
             '/dev/ttyS2',
@@ -177,37 +427,64 @@ class Glucid8824:
             'COM1',
             'COM2',
             'COM3',
-            'COM4',
-            '/dev/tty.usbserial-A50285BI',  # FTDI based dongle
-            '/dev/tty-usbserial-1430',  # Prolific based dongle
-            '/dev/ttyUSB0',
-            '/dev/ttyUSB1',
-            '/dev/ttyUSB2',
-            '/dev/ttyUSB3',
-            '/dev/ttyUSB4',
-            '/dev/ttyUSB4',
-            '/dev/ttyUSB5',
-            '/dev/ttyS0',
-            '/dev/ttyS1',
-            '/dev/ttyS2',
-            '/dev/ttyS3',
-            '/dev/ttyS4',
-            '/dev/ttyS5',
-            '/dev/ttyAMA0',
-            '/dev/ttyAMA1',
-            '/dev/ttyACM0',
-            '/dev/ttyACM1',
-            '/dev/rfcomm0',
-            '/dev/ircomm0',
-            '/dev/cuau0'
+            'COM4'
         ],
         'midi': [
             '/dev/midi1',
             '/dev/snd/midiC1D0'
         ]
+    }
 
-
-
+    # Known devices keyed by path: the transport ('rs232', 'midi'
+    # or 'network'), whether the 8824 answers commands sent over
+    # it, and the last instance id that answered on it.
+    # See register_device.
+    REGISTRY = {device: {'transport': transport,
+                         'replies': transport == 'rs232',
+                         'instanceid': None}
+                for transport, devices in DEVICES.items()
+                for device in devices}
+
+    # (device, instance id) found by autodetect
+    AUTODETECTED = None
+
+    # Response timeouts are learned per serial device from
+    # the last LATENCY_SAMPLES round trips: the LATENCY_PERCENTILE
+    # response time times LATENCY_FACTOR plus LATENCY_MARGIN seconds,
+    # never less than MIN_TIMEOUT nor more than `tout`.  The learned
+    # timeout is stored in the config file under 'Latency <device>'.
+    LATENCY_SAMPLES = 64
+    LATENCY_UPDATE = 16
+    LATENCY_PERCENTILE = 99
+    LATENCY_FACTOR = 1.5
+    LATENCY_MARGIN = 0.05
+    MIN_TIMEOUT = 0.05
+
+    # seconds a value read from or written to the unit is
+    # trusted before it is read again, see DeviceState
+    STATE_MAX_AGE = 2.0
+
+    # a gain ramp sends at most RAMP_WINDOW SetAnalogGain frames
+    # ahead of the unit's replies, and looks for replies and the
+    # next step every RAMP_POLL seconds
+    RAMP_WINDOW = 2
+    RAMP_POLL = 0.001
+
+    # the Get commands read by read_all
+    READ_ALL = ('GetSync', 'GetMode', 'GetOptSrc', 'GetAnalogSrc',
+                'GetAesSrc', 'GetAnalogGain')
+
+    # fields of a state given to apply_state -> (Get command
+    # holding it, highest value, config file key)
+    STATE_FIELDS = {
+        'sync': ('GetSync', 7, 'SYNC'),
+        'mode': ('GetMode', 7, None),
+        'meter': ('GetMode', 3, 'METER'),
+        'dig1': ('GetMode', 1, 'DIG1'),
+        'opt_src': ('GetOptSrc', 1, 'OPTICAL_SRC'),
+        'analog_src': ('GetAnalogSrc', 1, 'ANALOG_SRC'),
+        'aes_src': ('GetAesSrc', 1, 'AES_SRC'),
+        'gain': ('GetAnalogGain', None, None),
     }
 
     def __init__(self,
@@ -216,7 +493,8 @@ class Glucid8824:
 
            siface  - serial interface, defaults to /dev/ttyUSB0
            LucidID - The ID target of the Unit, defaults to 00
-           tout    - serial timeout, in seconds, defaults to 1
+           tout    - longest time to wait for a response, in seconds,
+                     defaults to 1
         """
         self.ANALOG_GAIN = []
 
@@ -228,6 +506,19 @@ class Glucid8824:
         self.conn = False
         self.tout = tout
 
+        # the response timeout in use, learned from recent
+        # response times, see load_latency_profile
+        self.read_timeout = tout
+        self.latencies = collections.deque(maxlen=self.LATENCY_SAMPLES)
+        self.latency_updates = 0
+        self.latency_dirty = False
+        # a response may still arrive after a timeout
+        self.stale_input = False
+
+        # how many sessions hold the connection open, see
+        # begin_session
+        self.sessions = 0
+
         # our serial interface
         self.siface = siface
 
@@ -246,6 +537,29 @@ class Glucid8824:
         # we had a device mismatch
         self.device_mismatch = False
 
+        # bytes read from the serial port past the end of
+        # the last frame, kept for the next call to
+        # getLinefromSerial
+        self.rxbuf = bytearray()
+
+        # fixed frame headers (STARTBYTE through the command byte)
+        # keyed by (instance id, command key), see encodeCommand
+        self.framecache = {}
+
+        # CommandStats keyed by command key, see stats()
+        self.metrics = {}
+
+        # what we last read from or wrote to the unit
+        self.state = DeviceState(self.STATE_MAX_AGE)
+
+        # if set to a list, every round trip is appended to
+        # it as (command key, seconds, succeeded)
+        self.trace = None
+
+        # a glucidcapture.CaptureWriter recording every frame
+        # written and read, see start_capture
+        self.capture = None
+
         # our local representation of analog channel gain
         # 16 ... 8 ins then 8 outs
         # we store these values internally as integers in the
@@ -254,6 +568,43 @@ class Glucid8824:
         # we convert to hex when writing to Lucid
         self.gainlist = []
 
+    @classmethod
+    def register_device(cls, path, transport='rs232', replies=None,
+                        instanceid=None):
+        """Add `path` to the device REGISTRY, or update its entry
+
+           transport  - 'rs232', 'midi' or 'network'
+           replies    - whether the 8824 answers on it, by default
+                        only over rs232
+           instanceid - the last instance id that answered on it
+        """
+        if replies is None:
+            replies = transport == 'rs232'
+        info = cls.REGISTRY.setdefault(path, {'instanceid': None})
+        info['transport'] = transport
+        info['replies'] = replies
+        if instanceid is not None:
+            info['instanceid'] = instanceid
+        return info
+
+    @classmethod
+    def unregister_device(cls, path):
+        """Remove `path` from the device REGISTRY"""
+        cls.REGISTRY.pop(path, None)
+
+    def expects_reply(self):
+        """Return True if the 8824 answers commands on our device"""
+        info = self.REGISTRY.get(self.siface)
+        return info is not None and info['replies']
+
+    def remember_instanceid(self):
+        """Record INSTANCEID as the last instance id to answer on
+        our device
+        """
+        info = self.REGISTRY.get(self.siface)
+        if info is not None and info['instanceid'] != self.INSTANCEID:
+            info['instanceid'] = self.INSTANCEID
+
     def write_configfile(self):
         """Write the glucidconf to config file"""
         newconfig = open(os.path.join(os.path.expanduser('~'), CONFIGFILE), 'w')
@@ -392,11 +743,9 @@ class Glucid8824:
         DEFAULT_SYNC = 1 # Wordclock
         
         retval = self.sendCommand('GetSync')
-        if isinstance(retval, list):
-            retval = retval[0]
-        else:
+        if not retval:
             raise ValueError("Bad Data Recieved")
-        retval = 0
+        retval = retval[0]
 
             
         if RETSTRING:
@@ -574,8 +923,7 @@ class Glucid8824:
         retlist = []
         self.gainlist = []
         
-        lgainlist = self.sendCommand('GetAnalogGain')
-        self.gainlist = []
+        lgainlist = list(self.sendCommand('GetAnalogGain') or [])
         self.log_gain_list(lgainlist)
 
         # the lucid reverses this 8..1 8..1
@@ -591,6 +939,330 @@ class Glucid8824:
         logging.info(retlist)
         return retlist
 
+    def read_all(self):
+        """Read every readable parameter of the 8824 and return a
+        `DeviceSnapshot`, or False on failure.
+
+        Values fresh in `state` are not read again; the rest are
+        read with one pipelined write, so the meter and dig1 share
+        a single GetMode.  Also updates `gainlist`.
+        """
+        return self.make_snapshot(self.read_values(self.READ_ALL))
+
+    def read_values(self, cmdkeys, received=None):
+        """Return a dictionary of the payloads of the Get commands
+        `cmdkeys`, taken from `state` when fresh and otherwise read
+        with one pipelined write.  A payload is False if it could
+        not be read.
+
+        received - if given, called with the command key and payload
+                   of each value as soon as it is known
+        """
+        payloads = {cmdkey: self.state.get(cmdkey) for cmdkey in cmdkeys}
+        missing = [cmdkey for cmdkey in cmdkeys if payloads[cmdkey] is None]
+        if received:
+            for cmdkey in cmdkeys:
+                if payloads[cmdkey] is not None:
+                    received(cmdkey, payloads[cmdkey])
+        if missing:
+            results = self.pipeline(missing, received) or \
+                [False] * len(missing)
+            for cmdkey, retval in zip(missing, results):
+                if retval is False or retval is True:
+                    # one more try on its own
+                    retval = self.sendCommand(cmdkey)
+                    if received and retval is not False:
+                        received(cmdkey, retval)
+                payloads[cmdkey] = retval
+        return payloads
+
+    def apply_state(self, desired):
+        """Bring the 8824 to the state `desired`, sending only the
+        commands that change something.
+
+        desired - a `DeviceSnapshot`, or a dictionary with any of
+                  the keys in STATE_FIELDS: 'sync', 'mode' or its
+                  halves 'meter' and 'dig1', 'opt_src', 'analog_src',
+                  'aes_src' and 'gain'.  'gain' is a list of 16
+                  gains in channel order (None leaves a channel
+                  alone) or a dictionary of channel: gain, as the
+                  integers the 8824 uses (dB + 96).
+
+        The current values are taken from `state` when fresh and
+        otherwise read first, unless `desired` gives them in full.
+        Returns the list of (command key,
+        arguments) sent, which is empty if nothing changed, or
+        False on failure.
+        """
+        desired = self.desired_state(desired)
+        if desired is False:
+            return False
+        payloads = self.read_values(self.state_reads(desired))
+        plan = self.plan_state(desired, payloads)
+        if plan is False:
+            return False
+        if plan:
+            results = self.pipeline(plan)
+            if not results or False in results:
+                logging.error("apply_state: failed sending %s", plan)
+                return False
+        self.remember_state(desired)
+        return plan
+
+    def desired_state(self, desired):
+        """Return `desired` as a validated dictionary, or False"""
+        if isinstance(desired, DeviceSnapshot):
+            desired = {name: getattr(desired, name)
+                       for name in ('sync', 'mode', 'opt_src',
+                                    'analog_src', 'aes_src', 'gain')}
+        desired = dict(desired)
+        for name, value in desired.items():
+            if name not in self.STATE_FIELDS:
+                logging.error("apply_state: unknown field %s", name)
+                return False
+            highest = self.STATE_FIELDS[name][1]
+            if name == 'gain':
+                if isinstance(value, dict):
+                    gains = value
+                elif len(value) == 16:
+                    gains = {ch: g for ch, g in enumerate(value)
+                             if g is not None}
+                else:
+                    logging.error("apply_state: need 16 gains, got %s",
+                                  len(value))
+                    return False
+                for ch, g in gains.items():
+                    if int(ch) < 0 or int(ch) > 15 or \
+                            int(g) < 1 or int(g) > 128:
+                        logging.error("apply_state: bad gain %s for "
+                                      "channel %s", g, ch)
+                        return False
+                desired['gain'] = {int(ch): int(g)
+                                   for ch, g in gains.items()}
+            elif int(value) < 0 or int(value) > highest:
+                logging.error("apply_state: %s value %s invalid!",
+                              name, value)
+                return False
+            else:
+                desired[name] = int(value)
+        return desired
+
+    def state_commands(self, desired):
+        """Return the Get commands holding the fields of the
+        validated state `desired`
+        """
+        cmdkeys = []
+        for name in desired:
+            cmdkey = self.STATE_FIELDS[name][0]
+            if cmdkey not in cmdkeys:
+                cmdkeys.append(cmdkey)
+        return cmdkeys
+
+    def state_reads(self, desired):
+        """Return the Get commands whose current values are needed
+        to compare with the validated state `desired`.
+
+        A value that `desired` gives in full and that is not in
+        `state` is not read: writing it costs a round trip, just
+        like reading it would.
+        """
+        return [cmdkey for cmdkey in self.state_commands(desired)
+                if not self.state_given(desired, cmdkey) or
+                self.state.get(cmdkey) is not None]
+
+    @staticmethod
+    def state_given(desired, cmdkey):
+        """Return True if the validated state `desired` gives the
+        whole value of the Get command `cmdkey`
+        """
+        if cmdkey == 'GetMode':
+            return 'mode' in desired or ('meter' in desired and
+                                         'dig1' in desired)
+        if cmdkey == 'GetAnalogGain':
+            return len(desired['gain']) == 16
+        return True
+
+    def plan_state(self, desired, payloads):
+        """Return the (command key, arguments) needed to go from the
+        current `payloads` (see read_values) to the validated state
+        `desired`, or False if a current value is missing.  Values
+        absent from `payloads` are written without comparing.
+        """
+        plan = []
+        for cmdkey in self.state_commands(desired):
+            current = payloads.get(cmdkey)
+            if current is None and self.state_given(desired, cmdkey):
+                current = ()
+            elif current is False or current is True or not current:
+                logging.error("apply_state: could not read %s", cmdkey)
+                return False
+            setkey = 'Set' + cmdkey[3:]
+            if cmdkey == 'GetAnalogGain':
+                if current and len(current) != 16:
+                    logging.error("apply_state: bad gain list %s",
+                                  list(current))
+                    return False
+                if current:
+                    gains = list(current[7::-1]) + list(current[15:7:-1])
+                else:
+                    gains = [0] * 16
+                for ch, g in desired['gain'].items():
+                    gains[ch] = g
+                # back to the lucid's reversed 8..1 8..1 order
+                wire = gains[7::-1] + gains[15:7:-1]
+                if wire != list(current):
+                    plan.append((setkey, wire))
+            elif cmdkey == 'GetMode':
+                mode = desired.get('mode', current[0] if current else 0)
+                if 'meter' in desired:
+                    mode = (mode & ~3) | desired['meter']
+                if 'dig1' in desired:
+                    mode = (mode & ~4) | (desired['dig1'] << 2)
+                if not current or mode != current[0]:
+                    plan.append((setkey, [mode]))
+            else:
+                for name, value in desired.items():
+                    if (self.STATE_FIELDS[name][0] == cmdkey and
+                            (not current or value != current[0])):
+                        plan.append((setkey, [value]))
+        return plan
+
+    def remember_state(self, desired):
+        """Record the validated state `desired` in the config the
+        way the set_* methods do, and in `gainlist`
+        """
+        conf = self.glucidconf['DEFAULT']
+        mode = desired.get('mode')
+        if mode is not None:
+            conf['METER'] = str(mode & 3)
+            conf['DIG1'] = str((mode >> 2) & 1)
+        for name, value in desired.items():
+            confkey = self.STATE_FIELDS[name][2]
+            if confkey == 'SYNC':
+                conf[confkey] = '{:02}'.format(value)
+            elif confkey:
+                conf[confkey] = str(value)
+        gains = self.state.gain
+        if gains is not None:
+            self.gainlist = gains
+
+    def make_snapshot(self, payloads):
+        """Build a `DeviceSnapshot` from the `READ_ALL` response
+        payloads in `payloads`, or return False if any is missing
+        """
+        for cmdkey in self.READ_ALL:
+            retval = payloads.get(cmdkey)
+            if retval is False or retval is True or not retval:
+                logging.error("read_all: no data for %s", cmdkey)
+                return False
+        lgainlist = list(payloads['GetAnalogGain'])
+        if len(lgainlist) != 16:
+            logging.error("read_all: bad gain list %s", lgainlist)
+            return False
+        # the lucid reverses this 8..1 8..1
+        self.gainlist = lgainlist[7::-1] + lgainlist[15:7:-1]
+        return DeviceSnapshot(self.siface, self.INSTANCEID,
+                              payloads['GetSync'][0],
+                              payloads['GetMode'][0],
+                              payloads['GetOptSrc'][0],
+                              payloads['GetAnalogSrc'][0],
+                              payloads['GetAesSrc'][0],
+                              self.gainlist)
+
+    def ramp(self, channels, target_db, duration, window=None):
+        """Move the gains of `channels` (0-7 IN 1-8, 8-15 OUT 1-8)
+        smoothly from their current values to `target_db` (-95 to
+        +32) over `duration` seconds.
+
+        Intermediate SetAnalogGain frames are streamed as fast as
+        the 9600 baud link and the unit take them: a frame is only
+        written once the link is free and fewer than `window`
+        (default RAMP_WINDOW) frames await a reply.  Steps that come
+        due meanwhile are dropped rather than queued, and the final
+        gains are always sent.  Returns the number of frames sent,
+        or False on failure.
+        """
+        window = window or self.RAMP_WINDOW
+        if int(target_db) < -95 or int(target_db) > 32:
+            logging.error("ramp: target %s out of range", target_db)
+            return False
+        channels = [int(ch) for ch in channels]
+        if not channels or min(channels) < 0 or max(channels) > 15:
+            logging.error("ramp: bad channels %s", channels)
+            return False
+
+        current = self.read_values(['GetAnalogGain'])['GetAnalogGain']
+        if current is False or current is True or len(current) != 16:
+            logging.error("ramp: could not read the gains")
+            return False
+        # the lucid reverses this 8..1 8..1
+        first = list(current[7::-1]) + list(current[15:7:-1])
+        target = int(target_db) + 96
+
+        if self.stale_input:
+            self.discard_input()
+        replies = self.expects_reply()
+        # (frame, time.perf_counter() when written) awaiting a reply
+        outstanding = []
+        sent = 0
+        failed = False
+        last = first
+        begin = time.monotonic()
+        # when the link has finished carrying the last frame
+        link_free = begin
+        while True:
+            now = time.monotonic()
+            if duration > 0:
+                fraction = min(1.0, (now - begin) / duration)
+            else:
+                fraction = 1.0
+            gains = list(first)
+            for ch in channels:
+                gains[ch] = int(round(first[ch] +
+                                      (target - first[ch]) * fraction))
+
+            if (gains != last and now >= link_free and
+                    len(outstanding) < window):
+                frame = self.encodeCommand('SetAnalogGain',
+                                           gains[7::-1] + gains[15:7:-1])
+                if not self.writeFrame(frame):
+                    return False
+                self.record_sent('SetAnalogGain', frame)
+                sent += 1
+                last = gains
+                link_free = now + len(frame) * 10.0 / self.baud
+                if replies:
+                    outstanding.append((frame, time.perf_counter()))
+                else:
+                    self.state.record('SetAnalogGain', frame, True)
+                continue
+            if gains == last and fraction >= 1.0 and not outstanding:
+                break
+
+            for hexdata in self.pollFrames():
+                if not outstanding:
+                    break
+                frame, written = outstanding.pop(0)
+                retval = self.getResponse('SetAnalogGain', hexdata)
+                self.record_reply('SetAnalogGain', written, hexdata, retval)
+                self.state.record('SetAnalogGain', frame, retval)
+                if retval is False:
+                    failed = True
+            if (outstanding and time.perf_counter() - outstanding[0][1] >
+                    self.read_timeout):
+                frame, written = outstanding.pop(0)
+                logging.error("ramp: no reply to SetAnalogGain")
+                self.record_reply('SetAnalogGain', written, b'', False)
+                self.state.record('SetAnalogGain', frame, False)
+                self.missed_response()
+                failed = True
+            time.sleep(self.RAMP_POLL)
+
+        self.gainlist = last
+        if failed:
+            return False
+        return sent
+
     def log_gain_list(self, gainlist=False):
         """Log the current gainlist, for testing purposes
         """
@@ -675,161 +1347,633 @@ class Glucid8824:
             logging.info("%s" % Glucid8824.gain_int_to_db_string(g))
 
     def write_gainlist_to_lucid(self):
-        """Convert `gainlist` to hex and call `SetAnalogGain`
-        to write the values to the 8824
+        """Put `gainlist` in the 8824's channel order and call
+        `SetAnalogGain` to write the values to the 8824
         """
-        # we have to convert our local gainlist to hex
-        # and use sendCommand to write it.
         # first we need to put the channels
         # in the ordering the lucid likes:
         # 8..1 8..1
-        lucidgainlist = [];
         lucidgainlist = self.gainlist[7::-1] + self.gainlist[15:7:-1]
-
-        cmdArg = []
-        for chgain in lucidgainlist:
-            chgain = hex(int(chgain))[2:]
-            cmdArg.append(chgain)
-            logging.info("write_gainlist_to_lucid: add %s to cmdArg" %
-                         (chgain))
-
         logging.info("write_gainlist_to_lucid: calling sendCommand")
-        
-        self.sendCommand('SetAnalogGain', cmdArg)
+
+        self.sendCommand('SetAnalogGain', lucidgainlist)
 
     ###########################
     # Begin lower-level methods
     ###########################
 
-    def sendCommand(self, cmdkey, cmdArg=['00'], checkcommand=True):
+    def encodeCommand(self, cmdkey, cmdArg=(0,), instanceid=None):
+        """Return the binary SysEx frame for `cmdkey` and `cmdArg`,
+        addressed to `instanceid` or by default to INSTANCEID
+
+        The fixed part of the frame (STARTBYTE through the command
+        byte) is built once per (instance id, command) and cached in
+        `framecache`.  `cmdArg` is a sequence of integers, or of hex
+        strings as accepted by earlier versions of sendCommand.
+        """
+        if instanceid is None:
+            instanceid = int(self.INSTANCEID)
+        header = self.framecache.get((instanceid, cmdkey))
+        if header is None:
+            if cmdkey in self.COMMANDSET_INT:
+                cmdbyte = self.COMMANDSET_INT[cmdkey]
+            else:
+                cmdbyte = int(cmdkey, 16)
+            header = (bytes([self.STARTBYTE_INT]) + self.FRAMEHEADER +
+                      bytes([instanceid, cmdbyte]))
+            self.framecache[(instanceid, cmdkey)] = header
+
+        hlen = len(header)
+        frame = bytearray(hlen + len(cmdArg) + 1)
+        frame[:hlen] = header
+        for i, arg in enumerate(cmdArg, hlen):
+            frame[i] = arg if isinstance(arg, int) else int(arg, 16)
+        frame[-1] = self.ENDBYTE_INT
+        return frame
+
+    def sendCommand(self, cmdkey, cmdArg=(0,), checkcommand=True):
         # if checkcommand is False we can use values outside
-        # of our command dictionary.  Good for looking for undocumented
-        # commands
+        # of our command dictionary, given as a hex string.
+        # Good for looking for undocumented commands
         if checkcommand and cmdkey not in self.COMMANDSET:
             logging.error("SendCommand: Invalid Command Key: %s", cmdkey)
             return False
 
+        payload = self.state.get(cmdkey)
+        if payload is not None:
+            logging.info('sendCommand: %s answered from state', cmdkey)
+            return payload
+
         logging.info('sendCommand sending %s:%s',
                      cmdkey,
-                     self.COMMANDSET[cmdkey])
+                     self.COMMANDSET.get(cmdkey, cmdkey))
+        if self.error_flag and self.sessions:
+            self.command_stats(cmdkey).retries += 1
+            self.reopen()
         if self.error_flag:
             logging.error("SendCommand: Error Flag - aborting command")
             return False
 
-        cmd = ""
-        cmd += self.STARTBYTE+' '
-        for hexcode in self.LUCIDINCID:
-            cmd += hexcode+' '
-        cmd += self.MODELID+' '
-        cmd += '{:02}'.format(int(self.INSTANCEID))+' '
-        cmd += self.COMMANDSET[cmdkey]+' '
-        for cmdargs in cmdArg:
-            cmd += cmdargs+' '
-        cmd += self.ENDBYTE
-        logging.info('sendCommand: Sending \"%s\"', cmd)
+        frame = self.encodeCommand(cmdkey, cmdArg)
+        logging.info('sendCommand: Sending %s', frame)
 
-        self.conn.write(bytes.fromhex(cmd))
+        if self.stale_input:
+            self.discard_input()
+        start = time.perf_counter()
+        if not self.writeFrame(frame):
+            # within a session, reopen the port and try once more
+            if not (self.sessions and self.reopen() and
+                    self.writeFrame(frame)):
+                return False
+            self.command_stats(cmdkey).retries += 1
+        self.record_sent(cmdkey, frame)
 
-        if self.siface in self.DEVICES['rs232'] :
-            logging.info("siface is %s"%self.siface)
+        if self.expects_reply():
             hexdata = self.getLinefromSerial()
             if not hexdata:
                 logging.error("Did NOT receive data response.")
+                self.record_reply(cmdkey, start, hexdata, False)
+                self.state.record(cmdkey, frame, False)
                 return False
-            return self.getResponse(cmdkey, hexdata)
+            retval = self.getResponse(cmdkey, hexdata)
+            self.record_reply(cmdkey, start, hexdata, retval)
+            self.state.record(cmdkey, frame, retval)
+            if retval is not False:
+                self.learn_latency(time.perf_counter() - start)
+                self.remember_instanceid()
+            return retval
+        self.record_reply(cmdkey, start, b'', True)
+        self.state.record(cmdkey, frame, True)
         return True
+
+    def writeFrame(self, frame):
+        """Write `frame` to the serial connection.  On a transport
+        error the error flag is set and False returned
+        """
+        try:
+            self.conn.write(frame)
+        except (serial.SerialException, OSError) as se:
+            logging.error("Write to %s failed: %s", self.siface, se)
+            self.set_errorflag()
+            return False
+        if self.capture:
+            self.capture.record(glucidcapture.WRITTEN, frame)
+        return True
+
+    def command_stats(self, cmdkey):
+        """Return the CommandStats for `cmdkey`, creating it"""
+        stats = self.metrics.get(cmdkey)
+        if stats is None:
+            stats = self.metrics[cmdkey] = CommandStats()
+        return stats
+
+    def record_sent(self, cmdkey, frame):
+        """Count a frame written for `cmdkey`"""
+        stats = self.command_stats(cmdkey)
+        stats.sent += 1
+        stats.written += len(frame)
+
+    def record_reply(self, cmdkey, start, hexdata, retval):
+        """Count the outcome of a round trip for `cmdkey` started
+        at `start` (a time.perf_counter value)
+        """
+        elapsed = time.perf_counter() - start
+        stats = self.command_stats(cmdkey)
+        if not hexdata and retval is False:
+            stats.timeouts += 1
+        else:
+            stats.read += len(hexdata)
+            if retval is False:
+                if self.device_mismatch:
+                    stats.mismatches += 1
+                else:
+                    stats.bad_frames += 1
+            else:
+                stats.record_latency(elapsed)
+        if self.trace is not None:
+            self.trace.append((cmdkey, elapsed, retval is not False))
+
+    def load_latency_profile(self):
+        """Start from the response timeout learned for `siface` in an
+        earlier session, or from `tout` if there is none
+        """
+        self.latencies.clear()
+        self.latency_updates = 0
+        self.latency_dirty = False
+        self.read_timeout = self.tout
+        section = 'Latency ' + self.siface
+        if self.glucidconf.has_section(section):
+            try:
+                self.read_timeout = min(
+                    self.tout,
+                    max(self.MIN_TIMEOUT,
+                        float(self.glucidconf[section]['Timeout'])))
+            except (KeyError, ValueError):
+                logging.warning("Ignoring bad latency profile for %s",
+                                self.siface)
+        logging.info("Using response timeout %.3fs for %s",
+                     self.read_timeout, self.siface)
+        self.set_port_timeout()
+
+    def save_latency_profile(self):
+        """Store the learned response timeout for `siface` in the
+        config file, if it changed.  The file is read again and only
+        our Latency section replaced, so whatever another process
+        wrote to it since we read it is kept
+        """
+        if not self.latency_dirty:
+            return
+        section = 'Latency ' + self.siface
+        profile = {
+            'Timeout': '%.4f' % self.read_timeout,
+            'Samples': str(len(self.latencies)),
+        }
+        self.glucidconf[section] = profile
+        self.latency_dirty = False
+
+        configpath = os.path.join(os.path.expanduser('~'), CONFIGFILE)
+        stored = configparser.ConfigParser()
+        try:
+            stored.read(configpath)
+        except configparser.Error as ce:
+            logging.warning("Replacing unreadable %s: %s", configpath, ce)
+            stored = configparser.ConfigParser()
+            stored.read_dict(self.glucidconf)
+        stored[section] = profile
+        logging.info("Writing latency profile to %s", configpath)
+        with open(configpath, 'w') as newconfig:
+            stored.write(newconfig)
+
+    def learn_latency(self, seconds):
+        """Add the response time of a round trip and periodically
+        derive a new response timeout from the recent ones
+        """
+        self.latencies.append(seconds)
+        self.latency_updates += 1
+        if self.latency_updates < self.LATENCY_UPDATE:
+            return
+        self.latency_updates = 0
+
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1,
+                    len(ordered) * self.LATENCY_PERCENTILE // 100)
+        timeout = ordered[index] * self.LATENCY_FACTOR + self.LATENCY_MARGIN
+        timeout = min(self.tout, max(self.MIN_TIMEOUT, timeout))
+        if abs(timeout - self.read_timeout) > 0.1 * self.read_timeout:
+            logging.info("Response timeout for %s now %.3fs",
+                         self.siface, timeout)
+            self.read_timeout = timeout
+            self.latency_dirty = True
+            self.set_port_timeout()
+
+    def missed_response(self):
+        """A response did not arrive in time: back the timeout off
+        towards `tout`, and drop any late response before the next
+        command
+        """
+        self.stale_input = True
+        if self.read_timeout < self.tout:
+            self.read_timeout = min(self.tout, self.read_timeout * 2)
+            self.latency_updates = 0
+            self.latency_dirty = True
+            self.set_port_timeout()
+
+    def set_port_timeout(self):
+        """Make the serial port's read timeout match read_timeout"""
+        if self.conn and self.conn.timeout != self.read_timeout:
+            self.conn.timeout = self.read_timeout
+
+    def discard_input(self):
+        """Drop anything received but not yet read"""
+        self.rxbuf = bytearray()
+        self.conn.reset_input_buffer()
+        self.stale_input = False
+
+    def stats(self):
+        """Return the counters and latency histogram of every
+        command sent so far, keyed by command key
+        """
+        return {k: v.as_dict() for k, v in self.metrics.items()}
+
+    def reset_stats(self):
+        """Forget all counters"""
+        self.metrics = {}
     
-    def getResponse(self, cmdkey, hexdata):
-        """Parse the hex data received, set error flags
-        if the repsponse is poorly formed
+    def decodeFrame(self, hexdata):
+        """Check for a well formed response frame from any instance
+        id in a single pass
+
+        Returns a tuple of the instance id, the echoed command byte
+        and a memoryview of the payload (no copy is made), or False
+        if the frame is malformed.
+        """
+        start = hexdata.find(self.STARTBYTE_INT)
+        if start < 0:
+            logging.error("decodeFrame failed to find STARTBYTE")
+            return False
+
+        # getLinefromSerial hands us frames ending in ENDBYTE
+        end = len(hexdata) - 1
+        if hexdata[end] != self.ENDBYTE_INT:
+            logging.error("decodeFrame failed at finding ENDBYTE")
+            return False
+        # header, instance id, 0x05 and the echoed command byte
+        if end < start + 8:
+            logging.error("decodeFrame frame too short: %s", hexdata.hex())
+            return False
+
+        frame = memoryview(hexdata)[start:end]
+        # Have a Valid Manufacturer Id and ModelId?
+        if frame[1:5] != self.FRAMEHEADER:
+            logging.error("decodeFrame failed manufacturer or model id")
+            return False
+
+        # we are getting a response
+        if frame[6] != self.RESPONSEBYTE:
+            logging.error("decodeFrame looking for 0x05:%s", frame[6])
+            return False
+
+        return frame[5], frame[7], frame[8:]
+
+    def parseFrame(self, hexdata):
+        """Check for a well formed response frame from our instance
+        id in a single pass
+
+        Returns a tuple of the echoed command byte and a memoryview
+        of the payload (no copy is made), or False if the frame is
+        malformed or came from another instance id.
         """
+        response = self.decodeFrame(hexdata)
+        if not response:
+            return False
+        instanceid, cmdbyte, payload = response
 
-        logging.info("getResponse: Length of hexdata is %s", len(hexdata))
-        # if logging print out our response
-        for i in range(0, len(hexdata)):
-            logging.info("hexdata[%s]:%s", i, format(hexdata[i], '#04x'))
+        # If we are receiving the wrong InstanceID
+        # update it and set the device_mismatch flag
+        if instanceid != int(self.INSTANCEID):
+            logging.warning("parseFrame: unexpected InstanceId - %s",
+                            instanceid)
+            logging.warning("parseFrame Updating from %s to %s",
+                            self.INSTANCEID, instanceid)
+            self.INSTANCEID = '{:02}'.format(instanceid)
+            self.device_mismatch = True
+            self.state.invalidate()
+            return False
+        # clear device mismatch flag if set
+        self.device_mismatch = False
+        return cmdbyte, payload
 
-        retdata = []
+    def pipeline(self, commands, received=None):
+        """Send several commands back-to-back and collect their responses
+
+        commands - a list of command keys, or of (command key, cmdArg)
+                   tuples, e.g. ['GetSync', 'GetMode', 'GetAnalogGain']
+        received - if given, called with the command key and payload
+                   of each response as soon as it is parsed
+
+        All frames are written in a single write so the 8824 can work
+        on one command while the next is still on the wire.  Responses
+        are matched to commands by their echoed command byte.  Returns
+        a list holding the payload (or False) for each command, in the
+        order given, or False if no command could be sent.
+        """
+        if self.error_flag and self.sessions:
+            self.reopen()
         if self.error_flag:
-            print("Error Flag is set, not attempting response")
+            logging.error("pipeline: Error Flag - aborting commands")
             return False
 
-        if not self.isValidHexData(hexdata):
-            logging.error("getReponse received Error from isValidHexData")
+        requests = []
+        for command in commands:
+            if isinstance(command, str):
+                cmdkey, cmdArg = command, (0,)
+            else:
+                cmdkey, cmdArg = command
+            if cmdkey not in self.COMMANDSET:
+                logging.error("pipeline: Invalid Command Key: %s", cmdkey)
+                return False
+            requests.append((cmdkey, cmdArg))
+
+        frames = bytearray()
+        sent = []
+        for cmdkey, cmdArg in requests:
+            frame = self.encodeCommand(cmdkey, cmdArg)
+            self.record_sent(cmdkey, frame)
+            sent.append(frame)
+            frames += frame
+        logging.info('pipeline: Sending %s commands', len(requests))
+        if self.stale_input:
+            self.discard_input()
+        start = time.perf_counter()
+        if not self.writeFrame(frames):
             return False
 
-        # get the beginning of the command
-        StartIndex = hexdata.index(int(self.STARTBYTE, 16))
+        if not self.expects_reply():
+            for (cmdkey, cmdArg), frame in zip(requests, sent):
+                self.state.record(cmdkey, frame, True)
+            return [True] * len(requests)
+
+        # command byte -> indexes of the requests still
+        # waiting on a response with that byte
+        pending = {}
+        for i, (cmdkey, cmdArg) in enumerate(requests):
+            pending.setdefault(self.COMMANDSET_INT[cmdkey], []).append(i)
+
+        results = [False] * len(requests)
+        unanswered = len(requests)
+        # a bad or unexpected frame does not use up a reply: read
+        # until each request is answered or the replies are overdue
+        deadline = time.monotonic() + len(frames) * 10.0 / self.baud + \
+            len(requests) * self.read_timeout
+        while unanswered and time.monotonic() < deadline:
+            hexdata = self.getLinefromSerial()
+            if not hexdata:
+                logging.error("pipeline: Did NOT receive data response.")
+                break
+            response = self.parseFrame(hexdata)
+            if not response:
+                # we cannot tell which command this answered
+                self.record_reply('pipeline', start, hexdata, False)
+                continue
+            cmdbyte, retdata = response
+            if not pending.get(cmdbyte):
+                logging.error("pipeline: unexpected response to %s", cmdbyte)
+                self.record_reply('pipeline', start, hexdata, False)
+                continue
+            i = pending[cmdbyte].pop(0)
+            results[i] = retdata
+            unanswered -= 1
+            self.record_reply(requests[i][0], start, hexdata, retdata)
+            if received:
+                received(requests[i][0], retdata)
+
+        # anything still pending timed out; its reply must not be
+        # taken for the next command's
+        if unanswered:
+            self.stale_input = True
+        for indexes in pending.values():
+            for i in indexes:
+                self.record_reply(requests[i][0], start, b'', False)
+        for (cmdkey, cmdArg), frame, retval in zip(requests, sent, results):
+            self.state.record(cmdkey, frame, retval)
+        return results
+
+    def probe(self, instanceids=range(8)):
+        """Send GetMode to each of `instanceids` back-to-back and
+        return a dictionary of the instance ids that answered and
+        their response latency in seconds
+        """
+        if self.error_flag:
+            logging.error("probe: Error Flag - not probing")
+            return {}
+        frames = bytearray()
+        for instanceid in instanceids:
+            frames += self.encodeCommand('GetMode', instanceid=instanceid)
+        self.discard_input()
+        start = time.perf_counter()
+        if not self.writeFrame(frames):
+            return {}
+
+        found = {}
+        getmode = self.COMMANDSET_INT['GetMode']
+        # the learned read_timeout is for one command; a unit at a
+        # high id answers only after every probe has crossed the wire
+        deadline = time.monotonic() + len(frames) * 10.0 / self.baud + \
+            self.tout
+        saved = (self.read_timeout, self.latency_updates,
+                 self.latency_dirty)
+        try:
+            for _ in instanceids:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.read_timeout = remaining
+                self.set_port_timeout()
+                # absent units simply never answer
+                hexdata = self.getLinefromSerial()
+                if not hexdata:
+                    break
+                response = self.decodeFrame(hexdata)
+                if (response and response[1] == getmode and
+                        response[0] in instanceids):
+                    found[response[0]] = time.perf_counter() - start
+        finally:
+            (self.read_timeout, self.latency_updates,
+             self.latency_dirty) = saved
+            self.set_port_timeout()
+        return found
+
+    @staticmethod
+    def candidate_ports():
+        """Return the serial ports that exist on this computer"""
+        import serial.tools.list_ports
+        ports = [p.device for p in serial.tools.list_ports.comports()]
+        known = set(ports)
+        for device, info in Glucid8824.REGISTRY.items():
+            if (info['transport'] == 'rs232' and device not in known and
+                    os.path.exists(device)):
+                ports.append(device)
+        return ports
 
-        # we are getting a response
-        if hexdata[StartIndex+6] != int('0x05', 16):
-            logging.error("getLucidResponse looking for OxO5:%s",
-                          hexdata[StartIndex+6])
+    @staticmethod
+    def scan(ports=None, instanceids=range(8), tout=0.5):
+        """Look for Lucid 8824 units on each of `ports` (by default
+        every candidate port) with instance ids `instanceids`.  Ports
+        are probed in parallel.
+
+        Returns a list of dictionaries with the 'siface',
+        'instanceid' and 'latency' (seconds) of each unit found.
+        """
+        import concurrent.futures
+
+        def scan_port(siface):
+            lucid = Glucid8824(siface=siface, tout=tout)
+            if not lucid.connect():
+                return []
+            try:
+                found = lucid.probe(instanceids)
+            finally:
+                # timeouts from absent units say nothing
+                # about this port's latency
+                lucid.latency_dirty = False
+                lucid.disconnect()
+            return [{'siface': siface,
+                     'instanceid': '{:02}'.format(instanceid),
+                     'latency': latency}
+                    for instanceid, latency in sorted(found.items())]
+
+        if ports is None:
+            ports = Glucid8824.candidate_ports()
+        units = []
+        if not ports:
+            return units
+        with concurrent.futures.ThreadPoolExecutor(len(ports)) as pool:
+            for found in pool.map(scan_port, ports):
+                units.extend(found)
+        for unit in units:
+            Glucid8824.register_device(unit['siface'], 'rs232', True,
+                                       unit['instanceid'])
+        return units
+
+    @staticmethod
+    def autodetect(ports=None, tout=0.5):
+        """Return the (device, instance id) of a Lucid 8824, probing
+        `ports` (by default every candidate port) in parallel, or
+        None if none answers.
+
+        A unit on the device and instance id that last answered is
+        preferred.  The result is cached in AUTODETECTED and later
+        calls return it without probing.
+        """
+        if Glucid8824.AUTODETECTED is not None:
+            return Glucid8824.AUTODETECTED
+        # scan registers every unit it finds, so note
+        # which instance ids answered before
+        previous = {device: info['instanceid']
+                    for device, info in Glucid8824.REGISTRY.items()
+                    if info['instanceid'] is not None}
+        units = Glucid8824.scan(ports, tout=tout)
+        if not units:
+            logging.error("autodetect: no Lucid 8824 found")
+            return None
+        unit = units[0]
+        for candidate in units:
+            if previous.get(candidate['siface']) == candidate['instanceid']:
+                unit = candidate
+                break
+        Glucid8824.AUTODETECTED = (unit['siface'], unit['instanceid'])
+        logging.info("autodetect: found Lucid ID %s on %s",
+                     unit['instanceid'], unit['siface'])
+        return Glucid8824.AUTODETECTED
+
+    def getResponse(self, cmdkey, hexdata):
+        """Parse the hex data received, set error flags
+        if the repsponse is poorly formed.  Returns the payload
+        as a memoryview, or False
+        """
+        logging.info("getResponse: received %s", hexdata)
+
+        if self.error_flag:
+            print("Error Flag is set, not attempting response")
+            return False
+
+        response = self.parseFrame(hexdata)
+        if not response:
+            logging.error("getReponse received Error from parseFrame")
             return False
 
         # expect response to be same as command issued
-        # clean this up?  all cases been checked?
+        cmdbyte, retdata = response
+        if cmdbyte != self.COMMANDSET_INT.get(cmdkey, cmdbyte):
             logging.error("failed at verifying commandkey %s:%s ",
-                          self.COMMANDSET[cmdkey], hexdata[StartIndex+7])
+                          self.COMMANDSET[cmdkey], cmdbyte)
             return False
-
-        retindex = StartIndex + 8
-        while ((retindex < len(hexdata))
-                and (hexdata[retindex] != int(self.ENDBYTE, 16))):
-            logging.info("appending %s to response string",
-                         hexdata[retindex])
-            retdata.append(hexdata[retindex])
-            retindex += 1
         return retdata
 
     def isValidHexData(self, hexdata):
         """Check for a well formed instruction"""
-        # Have a Valid Start Byte?
-        try:
-            StartIndex = hexdata.index(int(self.STARTBYTE, 16))
-        except ValueError:
-            logging.error("isValidHexData failed to find StartIndex")
-            return False
-        # Have a Valid End Byte?
+        return self.parseFrame(hexdata) is not False
+
+    def is_connected(self):
+        """True if the serial connection is open and usable"""
+        return (bool(self.conn) and self.conn.is_open and
+                not self.error_flag)
+
+    def begin_session(self):
+        """Hold the serial connection open until the matching
+        `end_session`.  Within a session `connect` reuses the open
+        port, `disconnect` leaves it open, and commands reopen it
+        after a transport error.  Sessions may be nested.
+        """
+        self.sessions += 1
+        return self.connect()
+
+    def end_session(self):
+        """Leave a session, closing the port when the outermost
+        session ends
+        """
+        if self.sessions:
+            self.sessions -= 1
+            if not self.sessions:
+                self.disconnect()
+
+    @contextlib.contextmanager
+    def session(self):
+        """A context manager holding one serial connection open
+        for every command sent within it
+        """
+        self.begin_session()
         try:
-            hexdata.index(int(self.ENDBYTE, 16))
-        except ValueError:
-            logging.error("isValidHexData failed at finding ENDBYTE")
-            return False
+            yield self
+        finally:
+            self.end_session()
 
-        # Have a Valid Manufacturer Id?
-        for i in range(3):
-            if hexdata[StartIndex+1+i] != int(self.LUCIDINCID[i], 16):
-                logging.error("isValidHexData:%s failed manufacturer id",
-                              StartIndex+1+i)
-                return False
+    def __enter__(self):
+        self.begin_session()
+        return self
 
-        # Have a Valid ModelId?
-        if hexdata[StartIndex+4] != int(self.MODELID, 16):
-            logging.error("isValidHexData:%s failed at modelId",
-                          StartIndex+1+i)
-            return False
+    def __exit__(self, *exc):
+        self.end_session()
 
-        # Read and Update InstanceID should be last.
-        # If we are receiving the wrong InstanceID
-        # set the INSTANCEIDDIRTY flag
-        if hexdata[StartIndex+5] != int(self.INSTANCEID, 16):
-            logging.warning("isValidHexData: unexpected InstanceId - %s",
-                            hexdata[StartIndex+5])
-            logging.warning("isValidHexData Updating from %s to %s",
-                            self.InstanceId, hexdata[StartIndex+5])
-            self.INSTANCEID = hexdata[StartIndex+5]
-            self.device_mismatch = True
-            return False
-        else:
-            # clear device mismatch flag if set
-            self.device_mismatch = False
-        return True
+    def reopen(self):
+        """Close the serial connection and open it again"""
+        logging.warning("Reopening %s", self.siface)
+        try:
+            if self.conn:
+                self.conn.close()
+        except (serial.SerialException, OSError):
+            pass
+        self.error_flag = True
+        return self.connect()
 
     def connect(self):
         """Attempt to open a serial connection to self.siface
         """
         logging.info("LucidConnection running connect")
+        if self.sessions and self.is_connected():
+            logging.info("LucidConnection reusing session on %s",
+                         self.siface)
+            return True
 
         try:
             logging.info("LucidConnection opening rs232 device %s"%self.siface)
@@ -844,18 +1988,41 @@ class Glucid8824:
             return False
         else:
             self.error_flag = False
-
+            self.rxbuf = bytearray()
+            self.stale_input = False
+            # the unit may have changed while the port was closed
+            self.state.invalidate()
+            self.load_latency_profile()
             return True
         
 
     def disconnect(self):
-        """Close serial connection"""
+        """Close serial connection, saving the learned
+        response timeout.  Within a session the connection is
+        left open
+        """
+        if self.sessions or not self.conn:
+            return
+        self.save_latency_profile()
         try:
             self.conn.close()
         except serial.SerialException as se:
             self.error_flag = True
             logging.error("Could not close serial connection %s", self.siface)
 
+    def start_capture(self, path):
+        """Append every frame written and read to the capture
+        file `path`, see glucidcapture.py
+        """
+        self.stop_capture()
+        self.capture = glucidcapture.CaptureWriter(path)
+
+    def stop_capture(self):
+        """Stop recording frames and close the capture file"""
+        if self.capture:
+            self.capture.close()
+            self.capture = None
+
     def get_iface(self):
         """Return the currently set serial interface"""
         return self.siface
@@ -869,18 +2036,72 @@ class Glucid8824:
         self.error_flag = True
 
     def getLinefromSerial(self):
-        """Returns a line of data from the serial connection"""
+        """Returns one SysEx frame (through ENDBYTE) from the serial
+        connection.
+
+        The 8824 terminates its responses with ENDBYTE rather than a
+        newline, so we return as soon as ENDBYTE arrives instead of
+        waiting for `readline` to time out.  Any bytes received after
+        ENDBYTE are kept in `rxbuf` for the next frame.  Returns False
+        if no complete frame arrives within `tout` seconds.
+        """
         if self.error_flag:
             logging.warning("getLinefromSerial not connected")
             self.set_errorflag()
             return False
 
-        # we try 10 times
-        for i in range(0, 3):
-            myline = self.conn.readline()
-            logging.info("Received %s bytes", len(myline))
-            if len(myline) > 0:
-                break
-            if i == 9:
+        endbyte = int(self.ENDBYTE, 16)
+        deadline = time.monotonic() + self.read_timeout
+        while True:
+            end = self.rxbuf.find(endbyte)
+            if end >= 0:
+                myline = bytes(self.rxbuf[:end + 1])
+                del self.rxbuf[:end + 1]
+                logging.info("Received %s bytes", len(myline))
+                if self.capture:
+                    self.capture.record(glucidcapture.READ, myline)
+                return myline
+
+            # block for the first byte, then take whatever has
+            # already arrived in a single read
+            try:
+                chunk = self.conn.read(self.conn.in_waiting or 1)
+            except (serial.SerialException, OSError) as se:
+                logging.error("Read from %s failed: %s", self.siface, se)
+                self.set_errorflag()
                 return False
-        return myline
+            if not chunk or time.monotonic() > deadline:
+                if chunk:
+                    self.rxbuf += chunk
+                logging.info("getLinefromSerial: timed out with %s bytes",
+                             len(self.rxbuf))
+                self.missed_response()
+                return False
+            self.rxbuf += chunk
+
+    def pollFrames(self):
+        """Return a list of the complete SysEx frames that have
+        already arrived, without waiting for more.  Partial frames
+        are kept in `rxbuf`.
+        """
+        if self.error_flag:
+            return []
+        try:
+            waiting = self.conn.in_waiting
+            if waiting:
+                self.rxbuf += self.conn.read(waiting)
+        except (serial.SerialException, OSError) as se:
+            logging.error("Read from %s failed: %s", self.siface, se)
+            self.set_errorflag()
+            return []
+
+        frames = []
+        end = self.rxbuf.find(self.ENDBYTE_INT)
+        while end >= 0:
+            frame = bytes(self.rxbuf[:end + 1])
+            del self.rxbuf[:end + 1]
+            if self.capture:
+                self.capture.record(glucidcapture.READ, frame)
+            frames.append(frame)
+            end = self.rxbuf.find(self.ENDBYTE_INT)
+        return frames
@@ -0,0 +1,697 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucid8824_async.py defines a class `AsyncGlucid8824` which
+implements the `Glucid8824` api as asyncio coroutines, so a
+single event loop can drive one or many Lucid 8824 units without
+blocking on serial round trips or pushing calls into threads.
+
+The serial port is opened non-blocking and read through the event
+loop's reader callbacks, which requires a selector based event loop
+(the default on Linux, BSD and OSX).
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+import serial
+import glucidcapture
+from glucid8824 import Glucid8824
+
+
+class AsyncGlucid8824(Glucid8824):
+    """AsyncGlucid8824 represents a single Lucid ADA8824 unit
+    like `Glucid8824`, but every method that talks to the unit
+    is a coroutine.  Commands to one unit are serialized with
+    a lock; separate instances run concurrently.
+    """
+
+    def __init__(self,
+                 LucidID='00', siface="/dev/ttyUSB0", tout=1):
+        """Define required data structures and serial interface
+
+           siface  - serial interface, defaults to /dev/ttyUSB0
+           LucidID - The ID target of the Unit, defaults to 00
+           tout    - response timeout, in seconds, defaults to 1
+        """
+        super().__init__(LucidID=LucidID, siface=siface, tout=tout)
+        self.fd = None
+        self.loop = None
+        self.lock = asyncio.Lock()
+        self.rxevent = asyncio.Event()
+
+    def get_aes_source(self, RETSTRING=True):
+        return self._get_source('GetAesSrc', self.AES_SRC, RETSTRING)
+
+    def get_opt_source(self, RETSTRING=True):
+        return self._get_source('GetOptSrc', self.OPTICAL_SRC, RETSTRING)
+
+    def get_analog_source(self, RETSTRING=True):
+        return self._get_source('GetAnalogSrc', self.ANALOG_SRC, RETSTRING)
+
+    def get_sync_source(self, RETSTRING=True):
+        return self._get_source('GetSync', self.SYNC, RETSTRING)
+
+    async def _get_source(self, cmdkey, names, RETSTRING):
+        """Send the Get command `cmdkey` and return the first byte
+        of the response, or its name from `names` if RETSTRING
+        """
+        retval = await self.sendCommand(cmdkey)
+        if not retval:
+            raise ValueError("Bad Data Received")
+        retval = retval[0]
+
+        if RETSTRING:
+            return names[retval]
+        else:
+            return retval
+
+    async def _set_source(self, cmdkey, names, srcval, confkey):
+        """Validate `srcval` against `names`, record it in the
+        config under `confkey` and send the Set command `cmdkey`
+        """
+        if int(srcval) < 0 or int(srcval) >= len(names):
+            logging.error("%s value %s invalid!" % (cmdkey, srcval))
+            return False
+        logging.info("%s: setting to %s" % (cmdkey, names[srcval]))
+        self.glucidconf['DEFAULT'][confkey] = str(srcval)
+        return await self.sendCommand(cmdkey, [int(srcval)])
+
+    def set_aes_src(self, srcval=False):
+        return self._set_source('SetAesSrc', self.AES_SRC, srcval,
+                                'AES_SRC')
+
+    def set_opt_src(self, srcval=False):
+        return self._set_source('SetOptSrc', self.OPTICAL_SRC, srcval,
+                                'OPTICAL_SRC')
+
+    def set_analog_src(self, srcval=False):
+        return self._set_source('SetAnalogSrc', self.ANALOG_SRC, srcval,
+                                'ANALOG_SRC')
+
+    def set_sync_source(self, syncsrc=False, RETSTRING=True):
+        return self._set_source('SetSync', self.SYNC, syncsrc, 'SYNC')
+
+    async def get_meter(self, RETSTRING=True):
+        """Get the source for the front meters of the 8824
+        """
+        retval = await self.sendCommand('GetMode')
+        if not retval:
+            raise ValueError("Bad Data Received")
+        retval = retval[0] & 3
+
+        if RETSTRING:
+            return self.METER[retval]
+        else:
+            return retval
+
+    async def get_dig1(self, RETSTRING=True):
+        """Get the source of Digital Channels 1,2
+        Input (AES of SPDIF) by sending the GetMode command
+        """
+        retval = await self.sendCommand('GetMode')
+        if not retval:
+            raise ValueError("Bad Data Received")
+        retval = (retval[0] >> 2) & 1
+
+        if RETSTRING:
+            return self.DIG1[retval]
+        else:
+            return retval
+
+    async def set_meter_and_dig1(self, metersrc=False):
+        """Set the front meters and digital 1,2 source in a
+        single SetMode, see `Glucid8824.set_meter_and_dig1`
+        """
+        if int(metersrc) < 0 or int(metersrc) > 7:
+            logging.error("set_meter_source val %s invalid!" % metersrc)
+            return False
+
+        modeval = int(metersrc)
+        logging.info("set_meter_and_dig1: setting MODE to %s" % modeval)
+        self.glucidconf['DEFAULT']['DIG1'] = str(modeval // 4)
+        self.glucidconf['DEFAULT']['METER'] = str(modeval % 4)
+        return await self.sendCommand('SetMode', [modeval])
+
+    async def set_meter(self, metersrc=False):
+        """Set the source for front meters of the 8824
+
+        metersrc - 0 : Analog IN
+                   1 : Digital IN
+                   2 : Analog OUT
+                   3 : Digital OUT
+        """
+        if int(metersrc) < 0 or int(metersrc) > 3:
+            logging.error("set_meter_source val %s invalid!" % metersrc)
+            return False
+        curr_dig1 = await self.get_dig1(False)
+        return await self.set_meter_and_dig1(
+            (int(curr_dig1)*4)+int(metersrc))
+
+    async def set_dig1(self, srcval=False):
+        """Set the source for Digital Channels 1,2:
+
+        srcval - 0 : AES
+                 1 : S/PDIF
+        """
+        if int(srcval) < 0 or int(srcval) > 1:
+            logging.error("set_dig1 value %s invalid!" % srcval)
+            return False
+        curr_meter = await self.get_meter(False)
+        return await self.set_meter_and_dig1(
+            (int(srcval)*4)+int(curr_meter))
+
+    async def get_gain(self):
+        """Populates the internal datastructure `gainlist` by
+        sending the `GetAnalogGain` command to the 8824, and
+        returns a list of strings representing dB
+        """
+        lgainlist = list(await self.sendCommand('GetAnalogGain') or [])
+        # the lucid reverses this 8..1 8..1
+        self.gainlist = lgainlist[7::-1] + lgainlist[15:7:-1]
+        return [Glucid8824.gain_int_to_db_string(g) for g in self.gainlist]
+
+    async def read_all(self):
+        """Read every readable parameter of the 8824 and return a
+        `DeviceSnapshot`, see `Glucid8824.read_all`
+        """
+        return self.make_snapshot(await self.read_values(self.READ_ALL))
+
+    async def read_values(self, cmdkeys, received=None):
+        """Return the payloads of the Get commands `cmdkeys`, see
+        `Glucid8824.read_values`
+        """
+        payloads = {cmdkey: self.state.get(cmdkey) for cmdkey in cmdkeys}
+        missing = [cmdkey for cmdkey in cmdkeys if payloads[cmdkey] is None]
+        if received:
+            for cmdkey in cmdkeys:
+                if payloads[cmdkey] is not None:
+                    received(cmdkey, payloads[cmdkey])
+        if missing:
+            results = await self.pipeline(missing, received) or \
+                [False] * len(missing)
+            for cmdkey, retval in zip(missing, results):
+                if retval is False or retval is True:
+                    retval = await self.sendCommand(cmdkey)
+                    if received and retval is not False:
+                        received(cmdkey, retval)
+                payloads[cmdkey] = retval
+        return payloads
+
+    async def apply_state(self, desired):
+        """Bring the 8824 to the state `desired`, sending only the
+        commands that change something, see `Glucid8824.apply_state`
+        """
+        desired = self.desired_state(desired)
+        if desired is False:
+            return False
+        payloads = await self.read_values(self.state_reads(desired))
+        plan = self.plan_state(desired, payloads)
+        if plan is False:
+            return False
+        if plan:
+            results = await self.pipeline(plan)
+            if not results or False in results:
+                logging.error("apply_state: failed sending %s", plan)
+                return False
+        self.remember_state(desired)
+        return plan
+
+    async def write_gainlist_to_lucid(self):
+        """Put `gainlist` in the 8824's channel order and call
+        `SetAnalogGain` to write the values to the 8824
+        """
+        lucidgainlist = self.gainlist[7::-1] + self.gainlist[15:7:-1]
+        return await self.sendCommand('SetAnalogGain', lucidgainlist)
+
+    async def ramp(self, channels, target_db, duration, window=None):
+        """Move the gains of `channels` smoothly to `target_db` over
+        `duration` seconds, see `Glucid8824.ramp`.  The unit is held
+        for the whole ramp; other commands to it wait.
+        """
+        window = window or self.RAMP_WINDOW
+        if int(target_db) < -95 or int(target_db) > 32:
+            logging.error("ramp: target %s out of range", target_db)
+            return False
+        channels = [int(ch) for ch in channels]
+        if not channels or min(channels) < 0 or max(channels) > 15:
+            logging.error("ramp: bad channels %s", channels)
+            return False
+
+        current = (await self.read_values(['GetAnalogGain']))['GetAnalogGain']
+        if current is False or current is True or len(current) != 16:
+            logging.error("ramp: could not read the gains")
+            return False
+        # the lucid reverses this 8..1 8..1
+        first = list(current[7::-1]) + list(current[15:7:-1])
+        target = int(target_db) + 96
+
+        async with self.lock:
+            if self.stale_input:
+                self.discard_input()
+            replies = self.expects_reply()
+            # (frame, time.perf_counter() when written) awaiting a reply
+            outstanding = []
+            sent = 0
+            failed = False
+            last = first
+            begin = time.monotonic()
+            # when the link has finished carrying the last frame
+            link_free = begin
+            while True:
+                now = time.monotonic()
+                if duration > 0:
+                    fraction = min(1.0, (now - begin) / duration)
+                else:
+                    fraction = 1.0
+                gains = list(first)
+                for ch in channels:
+                    gains[ch] = int(round(first[ch] +
+                                          (target - first[ch]) * fraction))
+
+                if (gains != last and now >= link_free and
+                        len(outstanding) < window):
+                    frame = self.encodeCommand('SetAnalogGain',
+                                               gains[7::-1] + gains[15:7:-1])
+                    if not await self.writeFrame(frame):
+                        return False
+                    self.record_sent('SetAnalogGain', frame)
+                    sent += 1
+                    last = gains
+                    link_free = now + len(frame) * 10.0 / self.baud
+                    if replies:
+                        outstanding.append((frame, time.perf_counter()))
+                    else:
+                        self.state.record('SetAnalogGain', frame, True)
+                    continue
+                if gains == last and fraction >= 1.0 and not outstanding:
+                    break
+
+                for hexdata in self.pollFrames():
+                    if not outstanding:
+                        break
+                    frame, written = outstanding.pop(0)
+                    retval = self.getResponse('SetAnalogGain', hexdata)
+                    self.record_reply('SetAnalogGain', written, hexdata,
+                                      retval)
+                    self.state.record('SetAnalogGain', frame, retval)
+                    if retval is False:
+                        failed = True
+                if (outstanding and time.perf_counter() - outstanding[0][1] >
+                        self.read_timeout):
+                    frame, written = outstanding.pop(0)
+                    logging.error("ramp: no reply to SetAnalogGain")
+                    self.record_reply('SetAnalogGain', written, b'', False)
+                    self.state.record('SetAnalogGain', frame, False)
+                    self.missed_response()
+                    failed = True
+                await asyncio.sleep(self.RAMP_POLL)
+
+        self.gainlist = last
+        if failed:
+            return False
+        return sent
+
+    async def probe(self, instanceids=range(8)):
+        """Send GetMode to each of `instanceids` back-to-back and
+        return a dictionary of the instance ids that answered and
+        their response latency in seconds, see `Glucid8824.probe`
+        """
+        if self.error_flag:
+            logging.error("probe: Error Flag - not probing")
+            return {}
+        frames = bytearray()
+        for instanceid in instanceids:
+            frames += self.encodeCommand('GetMode', instanceid=instanceid)
+
+        found = {}
+        getmode = self.COMMANDSET_INT['GetMode']
+        async with self.lock:
+            self.discard_input()
+            start = time.perf_counter()
+            if not await self.writeFrame(frames):
+                return {}
+            # the learned read_timeout is for one command; a unit at a
+            # high id answers only after every probe has crossed the wire
+            deadline = time.monotonic() + len(frames) * 10.0 / self.baud + \
+                self.tout
+            saved = (self.read_timeout, self.latency_updates,
+                     self.latency_dirty)
+            try:
+                for _ in instanceids:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.read_timeout = remaining
+                    # absent units simply never answer
+                    hexdata = await self.getLinefromSerial()
+                    if not hexdata:
+                        break
+                    response = self.decodeFrame(hexdata)
+                    if (response and response[1] == getmode and
+                            response[0] in instanceids):
+                        found[response[0]] = time.perf_counter() - start
+            finally:
+                (self.read_timeout, self.latency_updates,
+                 self.latency_dirty) = saved
+        return found
+
+    ###########################
+    # Begin lower-level methods
+    ###########################
+
+    async def sendCommand(self, cmdkey, cmdArg=(0,), checkcommand=True):
+        """Send `cmdkey` with `cmdArg` and return the response
+        payload, see `Glucid8824.sendCommand`
+        """
+        if checkcommand and cmdkey not in self.COMMANDSET:
+            logging.error("SendCommand: Invalid Command Key: %s", cmdkey)
+            return False
+        payload = self.state.get(cmdkey)
+        if payload is not None:
+            return payload
+        if self.error_flag and self.sessions:
+            self.command_stats(cmdkey).retries += 1
+            await self.reopen()
+        if self.error_flag:
+            logging.error("SendCommand: Error Flag - aborting command")
+            return False
+
+        frame = self.encodeCommand(cmdkey, cmdArg)
+        logging.info('sendCommand: Sending %s', frame)
+
+        async with self.lock:
+            if self.stale_input:
+                self.discard_input()
+            start = time.perf_counter()
+            if not await self.writeFrame(frame):
+                # within a session, reopen the port and try once more
+                if not (self.sessions and await self.reopen() and
+                        await self.writeFrame(frame)):
+                    return False
+                self.command_stats(cmdkey).retries += 1
+            self.record_sent(cmdkey, frame)
+            if not self.expects_reply():
+                self.record_reply(cmdkey, start, b'', True)
+                self.state.record(cmdkey, frame, True)
+                return True
+            hexdata = await self.getLinefromSerial()
+        if not hexdata:
+            logging.error("Did NOT receive data response.")
+            self.record_reply(cmdkey, start, hexdata, False)
+            self.state.record(cmdkey, frame, False)
+            return False
+        retval = self.getResponse(cmdkey, hexdata)
+        self.record_reply(cmdkey, start, hexdata, retval)
+        self.state.record(cmdkey, frame, retval)
+        if retval is not False:
+            self.learn_latency(time.perf_counter() - start)
+            self.remember_instanceid()
+        return retval
+
+    async def pipeline(self, commands, received=None):
+        """Send several commands back-to-back and collect their
+        responses, see `Glucid8824.pipeline`
+        """
+        if self.error_flag and self.sessions:
+            await self.reopen()
+        if self.error_flag:
+            logging.error("pipeline: Error Flag - aborting commands")
+            return False
+
+        requests = []
+        sent = []
+        frames = bytearray()
+        for command in commands:
+            if isinstance(command, str):
+                cmdkey, cmdArg = command, (0,)
+            else:
+                cmdkey, cmdArg = command
+            if cmdkey not in self.COMMANDSET:
+                logging.error("pipeline: Invalid Command Key: %s", cmdkey)
+                return False
+            frame = self.encodeCommand(cmdkey, cmdArg)
+            self.record_sent(cmdkey, frame)
+            requests.append(cmdkey)
+            sent.append(frame)
+            frames += frame
+
+        async with self.lock:
+            if self.stale_input:
+                self.discard_input()
+            start = time.perf_counter()
+            if not await self.writeFrame(frames):
+                return False
+            if not self.expects_reply():
+                for cmdkey, frame in zip(requests, sent):
+                    self.state.record(cmdkey, frame, True)
+                return [True] * len(requests)
+
+            pending = {}
+            for i, cmdkey in enumerate(requests):
+                pending.setdefault(self.COMMANDSET_INT[cmdkey], []).append(i)
+
+            results = [False] * len(requests)
+            unanswered = len(requests)
+            deadline = time.monotonic() + len(frames) * 10.0 / self.baud + \
+                len(requests) * self.read_timeout
+            while unanswered and time.monotonic() < deadline:
+                hexdata = await self.getLinefromSerial()
+                if not hexdata:
+                    logging.error("pipeline: Did NOT receive data response.")
+                    break
+                response = self.parseFrame(hexdata)
+                if not response:
+                    self.record_reply('pipeline', start, hexdata, False)
+                    continue
+                cmdbyte, retdata = response
+                if not pending.get(cmdbyte):
+                    logging.error("pipeline: unexpected response to %s",
+                                  cmdbyte)
+                    self.record_reply('pipeline', start, hexdata, False)
+                    continue
+                i = pending[cmdbyte].pop(0)
+                results[i] = retdata
+                unanswered -= 1
+                self.record_reply(requests[i], start, hexdata, retdata)
+                if received:
+                    received(requests[i], retdata)
+
+            if unanswered:
+                self.stale_input = True
+        for indexes in pending.values():
+            for i in indexes:
+                self.record_reply(requests[i], start, b'', False)
+        for cmdkey, frame, retval in zip(requests, sent, results):
+            self.state.record(cmdkey, frame, retval)
+        return results
+
+    async def begin_session(self):
+        """Hold the serial connection open until the matching
+        `end_session`, see `Glucid8824.begin_session`
+        """
+        self.sessions += 1
+        return await self.connect()
+
+    async def end_session(self):
+        """Leave a session, closing the port when the outermost
+        session ends
+        """
+        if self.sessions:
+            self.sessions -= 1
+            if not self.sessions:
+                await self.disconnect()
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        """An async context manager holding one serial connection
+        open for every command sent within it
+        """
+        await self.begin_session()
+        try:
+            yield self
+        finally:
+            await self.end_session()
+
+    async def __aenter__(self):
+        await self.begin_session()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.end_session()
+
+    def __enter__(self):
+        raise TypeError("use 'async with' with AsyncGlucid8824")
+
+    async def reopen(self):
+        """Close the serial connection and open it again"""
+        logging.warning("Reopening %s", self.siface)
+        self._close_port()
+        self.error_flag = True
+        return await self.connect()
+
+    async def connect(self):
+        """Open a non-blocking serial connection to self.siface and
+        register it with the running event loop
+        """
+        if self.sessions and self.is_connected():
+            return True
+        logging.info("LucidConnection opening rs232 device %s" % self.siface)
+        try:
+            self.conn = serial.Serial(self.siface, baudrate=self.baud,
+                                      timeout=0)
+        except (serial.SerialException, OSError):
+            logging.error("Could not open connection %s", self.siface)
+            self.error_flag = True
+            return False
+
+        self.loop = asyncio.get_running_loop()
+        self.fd = self.conn.fileno()
+        os.set_blocking(self.fd, False)
+        self.rxbuf = bytearray()
+        self.loop.add_reader(self.fd, self._on_readable)
+        self.error_flag = False
+        self.state.invalidate()
+        self.load_latency_profile()
+        return True
+
+    async def disconnect(self):
+        """Unregister and close the serial connection, saving
+        the learned response timeout.  Within a session the
+        connection is left open
+        """
+        if self.sessions:
+            return
+        self.save_latency_profile()
+        if not self._close_port():
+            self.error_flag = True
+            logging.error("Could not close serial connection %s", self.siface)
+
+    def _close_port(self):
+        """Unregister and close the port, returning False if
+        closing failed
+        """
+        if self.fd is not None:
+            self.loop.remove_reader(self.fd)
+            self.fd = None
+        try:
+            if self.conn:
+                self.conn.close()
+        except (serial.SerialException, OSError):
+            return False
+        return True
+
+    def set_port_timeout(self):
+        """The port stays non-blocking; read_timeout is applied
+        in getLinefromSerial
+        """
+
+    def discard_input(self):
+        """Drop anything received but not yet read"""
+        self.rxbuf = bytearray()
+        self.stale_input = False
+
+    def _on_readable(self):
+        """Event loop callback: move waiting bytes into `rxbuf`"""
+        try:
+            data = os.read(self.fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            logging.error("Read failed on %s", self.siface)
+            self.loop.remove_reader(self.fd)
+            self.fd = None
+            self.set_errorflag()
+            data = b''
+        self.rxbuf += data
+        self.rxevent.set()
+
+    def pollFrames(self):
+        """Return a list of the complete SysEx frames already moved
+        into `rxbuf` by the event loop, without waiting for more
+        """
+        if self.error_flag:
+            return []
+        frames = []
+        end = self.rxbuf.find(self.ENDBYTE_INT)
+        while end >= 0:
+            frame = bytes(self.rxbuf[:end + 1])
+            del self.rxbuf[:end + 1]
+            if self.capture:
+                self.capture.record(glucidcapture.READ, frame)
+            frames.append(frame)
+            end = self.rxbuf.find(self.ENDBYTE_INT)
+        return frames
+
+    async def writeFrame(self, frame):
+        """Write `frame` to the port, waiting for the port to
+        become writable rather than blocking the event loop
+        """
+        view = memoryview(frame)
+        while view:
+            try:
+                view = view[os.write(self.conn.fileno(), view):]
+            except BlockingIOError:
+                pass
+            except OSError as oe:
+                logging.error("Write to %s failed: %s", self.siface, oe)
+                self.set_errorflag()
+                return False
+            if view:
+                writable = self.loop.create_future()
+                self.loop.add_writer(
+                    self.conn.fileno(),
+                    lambda: writable.done() or writable.set_result(None))
+                try:
+                    await writable
+                finally:
+                    self.loop.remove_writer(self.conn.fileno())
+        if self.capture:
+            self.capture.record(glucidcapture.WRITTEN, frame)
+        return True
+
+    async def getLinefromSerial(self):
+        """Returns one SysEx frame (through ENDBYTE) received from
+        the unit, or False after `tout` seconds without one
+        """
+        if self.error_flag:
+            logging.warning("getLinefromSerial not connected")
+            return False
+
+        deadline = self.loop.time() + self.read_timeout
+        while True:
+            end = self.rxbuf.find(self.ENDBYTE_INT)
+            if end >= 0:
+                myline = bytes(self.rxbuf[:end + 1])
+                del self.rxbuf[:end + 1]
+                if self.capture:
+                    self.capture.record(glucidcapture.READ, myline)
+                return myline
+
+            remaining = deadline - self.loop.time()
+            if remaining <= 0 or self.error_flag:
+                logging.info("getLinefromSerial: timed out with %s bytes",
+                             len(self.rxbuf))
+                self.missed_response()
+                return False
+            self.rxevent.clear()
+            try:
+                await asyncio.wait_for(self.rxevent.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
@@ -32,8 +32,54 @@ import getopt
 import logging
 import os
 import sys
+import time
+import glucidclient
+import glucidscenes
 from glucid8824 import Glucid8824
 
+# command line options, shared with glucidd which runs
+# them on behalf of the cli
+SHORTOPTS = "hvmgd:D:i:"
+LONGOPTS = [
+    "help",
+    "verbose",
+    "timings",
+    "capture=",
+    "no_daemon",
+    "scan",
+    "autodetect",
+    "get_all",
+    "get_aes",
+    "set_aes=",
+    "get_analog",
+    "set_analog=",
+    "get_opt",
+    "set_opt=",
+    "get_sync",
+    "set_sync=",
+    "get_meter",
+    "set_meter=",
+    "get_gain",
+    "set_gain=",
+    "set_channel_input_gain=",
+    "sci=",
+    "set_channel_output_gain=",
+    "sco=",
+    "get_dig1",
+    "set_dig1=",
+    "set_meter_and_dig1=",
+    "device_id=",
+    "recall=",
+    "store=",
+    "tags=",
+    "scenes"
+]
+
+# options that are handled here rather than by a running glucidd
+LOCALOPTS = ("-h", "--help", "-d", "-D", "-i", "--device_id",
+             "--capture", "--timings", "--no_daemon", "--scan",
+             "--autodetect", "--scenes")
+
 # BEGIN FUNCTIONS FOR COMMAND LINE INTERFACE
 
 def banner():
@@ -69,6 +115,14 @@ def usage():
     print("OPTIONS:")
     print("  -h,--help\tthis help")
     print("  -v,--verbose\tverbose output")
+    print("  --timings\tprint time spent on config, port open and")
+    print("         \teach round trip to the 8824")
+    print("  --capture=FILE\tappend every frame sent and received to FILE")
+    print("  --no_daemon\tdo not forward options to a running glucidd")
+    print("  --scan\tlook for Lucid 8824 units on every serial port")
+    print("         \tand print their device and ID")
+    print("  --autodetect\tuse the first Lucid 8824 found on any serial")
+    print("         \tport AND Set it as new default")
     print("  -d DEVICE\tUse DEVICE instead of /dev/ttyUSB0")
     print("  -D DEVICE\tUse DEVICE instead of /dev/ttyUSB0")
     print("         \tAND Set DEVICE as new default")
@@ -140,6 +194,11 @@ def usage():
     print("        \tPRESET is an integer value +4 or -10:")
     print("         \t'+4' -Sets all INPUTS to -8dB and all OUTPUTS to +1dB")
     print("         \t'-10' -Sets all INPUTS to +4dB and all OUTPUTS to -11dB")
+    print("\nSCENE OPTIONS:")
+    print("  --recall=NAME\trecall scene NAME, sending only what changes")
+    print("  --store=NAME\tstore current routing and gains as scene NAME")
+    print("  --tags=TAGS\tcomma separated tags for --store")
+    print("  --scenes\tlist the presets and stored scenes")
     print("\nGET OPTIONS:")
     print("**GET OPTIONS ARE FOR RS232 MODEL UNITS ONLY**")
     print("  -g,--get_all\tget all values from lucid")
@@ -159,6 +218,32 @@ def error_exit(errormsg="Fatal Error"):
     print("--help will provide usage options")
     sys.exit(1)
 
+def print_timings(lucid, config_time, open_time):
+    """Print the time spent on config file I/O, opening the port
+    and each round trip to the 8824
+    """
+    print("\nTimings:")
+    print("  config I/O\t%8.2f ms" % (config_time * 1000))
+    print("  port open\t%8.2f ms" % (open_time * 1000))
+    total = 0.0
+    for cmdkey, seconds, succeeded in lucid.trace or []:
+        total += seconds
+        print("  %-14s%8.2f ms%s" %
+              (cmdkey, seconds * 1000, '' if succeeded else '  FAILED'))
+    print("  round trips\t%8.2f ms" % (total * 1000))
+
+
+def scan():
+    """Call Glucid8824.scan and print each unit found"""
+    units = Glucid8824.scan()
+    for unit in units:
+        print("Found Lucid ID %s on %s (%.1f ms)" %
+              (unit['instanceid'], unit['siface'], unit['latency'] * 1000))
+    if not units:
+        print("No Lucid 8824 found")
+    return units
+
+
 def get_aes_src(lucid):
     """Call lucid8824.get_aes_source, exit on failure"""
     print("AES Source:\t%s" % (lucid.get_aes_source() or
@@ -195,7 +280,11 @@ def get_dig1(lucid):
 
 def get_gain(lucid):
     """Call lucid8824.get_get, exit on failure"""
-    gainlist = lucid.get_gain() or sys.exit("failed talking to Lucid")
+    print_gain(lucid.get_gain() or sys.exit("failed talking to Lucid"))
+
+
+def print_gain(gainlist):
+    """Print the gains in `gainlist`, strings representing dB"""
     print("Analog Gain:")
     print(' '*40)
     print('***************************************')
@@ -241,35 +330,65 @@ def set_gain_channels(lucid, gain=-99, channel_list=[]):
     lucid.write_gainlist_to_lucid()
 
 
+def recall(lucid, name):
+    """Recall the scene `name` with glucidscenes.recall, exit on
+    failure
+    """
+    scene = glucidscenes.SceneLibrary().get(name)
+    if scene is None:
+        sys.exit("No scene named %s" % name)
+    plan = glucidscenes.recall(lucid, scene)
+    if plan is False:
+        sys.exit("failed talking to 8824")
+    print("Recalled %s:\t%d command(s) sent" % (name, len(plan)))
+
+
+def store(lucid, name, tags):
+    """Store the unit's current routing and gains as scene `name`"""
+    snapshot = lucid.read_all() or sys.exit("failed talking to 8824")
+    glucidscenes.SceneLibrary().store(
+        glucidscenes.Scene.from_state(name, snapshot, tags))
+    print("Stored %s" % name)
+
+
+def list_scenes():
+    """Print the presets and the scenes in the library"""
+    library = glucidscenes.SceneLibrary()
+    for name in library.available():
+        scene = library.get(name)
+        print("%-24s %s" % (name, ','.join(scene.tags)))
+
+
 def get_all(lucid):
-    """Get all possible values from the 8824 by calling each
-    function sequentially
+    """Get all possible values from the 8824 with
+    lucid8824.read_all, exit on failure
     """
-    get_sync(lucid)
-    get_meter(lucid)
-    get_analog_src(lucid)
-    get_aes_src(lucid)
-    get_opt_src(lucid)
-    get_dig1(lucid)
-    get_gain(lucid)
+    snapshot = lucid.read_all() or sys.exit("failed talking to 8824")
+    print("Sync:\t\t%s" % snapshot.sync_name)
+    print("Meter:\t\t%s" % snapshot.meter_name)
+    print("Analog Source:\t%s" % snapshot.analog_src_name)
+    print("AES Source:\t%s" % snapshot.aes_src_name)
+    print("Optical Source:\t%s" % snapshot.opt_src_name)
+    print("Dig Input 1,2:\t%s" % snapshot.dig1_name)
+    print_gain(snapshot.gain_db)
 
 
 def set_sync(lucid, syncval):
     """Call lucid8824.set_sync_source"""
     lucid.set_sync_source(syncval)
-    if lucid.siface in lucid.DEVICES['rs232']:
+    if lucid.expects_reply():
         get_sync(lucid)
 
 def set_meter_and_dig1(lucid, meterval):
     """Call lucid8824.set_meter"""
     lucid.set_meter_and_dig1(meterval)
-    if lucid.siface in lucid.DEVICES['rs232']:
+    if lucid.expects_reply():
         get_meter(lucid)
         get_dig1(lucid)
 
 def set_meter(lucid, meterval):
     """Call lucid8824.set_meter"""
-    if lucid.siface in lucid.DEVICES['rs232']:
+    if lucid.expects_reply():
         lucid.set_meter(meterval)
         get_meter(lucid)
 
@@ -277,7 +396,7 @@ def set_meter(lucid, meterval):
 def set_dig1(lucid, srcval):
     """Call lucid8824.set_dig1"""
     lucid.set_dig1(srcval)
-    if lucid.siface in lucid.DEVICES['rs232']:
+    if lucid.expects_reply():
         get_dig1(lucid)
 
 
@@ -289,7 +408,7 @@ def set_analog_src(lucid, srcval):
 def set_opt_src(lucid, srcval):
     """Call lucid8824.set_opt_src"""
     lucid.set_opt_src(srcval)
-    if lucid.siface in lucid.DEVICES['rs232']:
+    if lucid.expects_reply():
         get_opt_src(lucid)
                 
 def set_aes_src(lucid, srcval):
@@ -307,52 +426,46 @@ def main():
     banner()
 
     try:
-        opts, args = getopt.getopt(sys.argv[1:],
-                                   "hvmgd:D:i:",
-                                   [
-                                       "help",
-                                       "verbose",
-                                       "get_all",
-                                       "get_aes",
-                                       "set_aes=",
-                                       "get_analog",
-                                       "set_analog=",
-                                       "get_opt",
-                                       "set_opt=",
-                                       "get_sync",
-                                       "set_sync=",
-                                       "get_meter",
-                                       "set_meter=",
-                                       "get_gain",
-                                       "set_gain=",
-                                       "set_channel_input_gain=",
-                                       "sci=",
-                                       "set_channel_output_gain=",
-                                       "sco=",
-                                       "get_dig1",
-                                       "set_dig1=",
-                                       "set_meter_and_dig1=",
-                                       "device_id="
-                                ]
-        )
+        opts, args = getopt.getopt(sys.argv[1:], SHORTOPTS, LONGOPTS)
     except getopt.GetoptError as err:
         print(err)
         usage()
         sys.exit(2)
 
     verbose = False
+    timings = False
     # if not default serial interface
     serialif = '/dev/ttyUSB0'
-    # first parse for verbose option
+    # first parse for verbose and timings options
     for o, a in opts:
         if o in ("-v", "--verbose"):
             verbose = True
             logging.basicConfig(level=logging.INFO)
+        elif o == "--timings":
+            timings = True
 
     if verbose:
         logging.basicConfig(level=logging.INFO)
 
+    if any(o == "--scan" for o, a in opts):
+        sys.exit(0 if scan() else 1)
+
+    # the scene library is local; no unit needs to be attached
+    if any(o == "--scenes" for o, a in opts):
+        list_scenes()
+        sys.exit(0)
+
+    # let a running glucidd, which already has the port open
+    # and recent values cached, answer for us
+    if opts and not any(o in LOCALOPTS for o, a in opts):
+        reply = glucidclient.forward(sys.argv[1:])
+        if reply is not None:
+            output, status = reply
+            sys.stdout.write(output)
+            sys.exit(status)
+
     # read interface from configfile
+    config_start = time.perf_counter()
     glucidconf = configparser.ConfigParser()
     #glucidconf.read(CONFIGFILE)
     glucidconf.read(os.path.join(os.path.expanduser('~'), CONFIGFILE))
@@ -364,8 +477,6 @@ def main():
         device_id = glucidconf['DEFAULT']['DEVICE_ID']
         logging.info("Read device_id %s from configfile" % device_id)
 
-    newconfig = open(os.path.join(os.path.expanduser('~'), CONFIGFILE), 'w')
-            
     for o, a in opts:
         if o in ("-h", "--help"):
             usage()
@@ -380,7 +491,15 @@ def main():
             serialif = a
             logging.info("new default device %s" % serialif)
             glucidconf.set('DEFAULT','Device',serialif)
-            newconfig.close()
+        elif o == "--autodetect":
+            # find a unit AND write it to config file
+            found = Glucid8824.autodetect()
+            if found is None:
+                sys.exit("No Lucid 8824 found")
+            serialif, device_id = found
+            logging.info("autodetected %s ID %s" % found)
+            glucidconf.set('DEFAULT', 'Device', serialif)
+            glucidconf.set('DEFAULT', 'DEVICE_ID', device_id)
         elif o in ("-i"):
             device_id = '{:02}'.format(int(a))
             logging.info("new default device_id %s" % device_id)
@@ -389,20 +508,45 @@ def main():
             logging.info("new default device_id %s" % device_id)
             glucidconf.set('DEFAULT','DEVICE_ID',device_id)
 
-    glucidconf.write(newconfig)
+    # written out before Glucid8824 reads it, with the learned
+    # response timeouts
+    with open(os.path.join(os.path.expanduser('~'), CONFIGFILE),
+              'w') as newconfig:
+        glucidconf.write(newconfig)
     logging.info("Wrote config to  %s" % os.path.join(os.path.expanduser('~'), CONFIGFILE))
 
     lucid = Glucid8824(siface=serialif,LucidID=device_id)
+    config_time = time.perf_counter() - config_start
 
+    open_start = time.perf_counter()
     if not lucid.connect():
         sys.exit("Failed to open connection using %s \n" %
                  lucid.get_iface())
+    open_time = time.perf_counter() - open_start
 
     print("Using %s to connect to lucid ID %s\n" %
           (lucid.get_iface(), lucid.get_instanceid()))
 
+    if timings:
+        lucid.trace = []
     for o, a in opts:
-        if o in ("-h", "--help", "-v", "--verbose", "-d"):
+        if o == "--capture":
+            lucid.start_capture(a)
+    try:
+        with lucid.session():
+            run_options(lucid, opts, args)
+    finally:
+        lucid.stop_capture()
+        if timings:
+            print_timings(lucid, config_time, open_time)
+
+
+def run_options(lucid, opts, args):
+    """Run each get and set option in `opts` against `lucid`"""
+    for o, a in opts:
+        if o in ("-h", "--help", "-v", "--verbose", "-d", "--timings",
+                 "--capture", "--no_daemon", "--scan",
+                 "--autodetect"):
             continue
         elif o in ("-g", "--get_all"):
             logging.info("get all")
@@ -493,12 +637,17 @@ def main():
                 logging.critical("bad argument to set_gain")
                 sys.exit(1)
             if int(a) == 4:
-                set_gain_channels(lucid, -8, [0, 1, 2, 3, 4, 5, 6, 7])
-                set_gain_channels(lucid, 1, [8, 9, 10, 11, 12, 13, 14, 15])
+                recall(lucid, '+4dBu')
             elif int(a) == -10:
-                set_gain_channels(lucid, 4, [0, 1, 2, 3, 4, 5, 6, 7])
-                set_gain_channels(lucid, -11, [8, 9, 10, 11, 12, 13, 14, 15])
+                recall(lucid, '-10dBV')
                 get_gain(lucid)
+        elif o == '--recall':
+            recall(lucid, a)
+        elif o == '--store':
+            tags = [v for k, v in opts if k == '--tags']
+            store(lucid, a, ','.join(tags).split(',') if tags else [])
+        elif o == '--tags':
+            continue
         elif o in ('--sci', '--set_channel_input_gain',
                    '--sco', '--set_channel_output_gain'):
             # make sure gain value is valid
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidbench.py runs the `Glucid8824` api against a simulated
+Lucid 8824 (see glucidsim.py) and reports round trip latency and
+throughput, so transport and parser changes can be measured.
+
+It reports p50/p95/p99 latency for every entry in
+`Glucid8824.COMMANDSET`, the wall time of the command line
+`get_all`, the cost of the gain write path (get_gain,
+update_channel_in_gainlist, write_gainlist_to_lucid) and the
+number of commands per second a tight loop sustains.
+
+    python3 glucidbench.py [-n COUNT] [--fast] [-o FILE] [-b BASELINE]
+
+Results are written as JSON with -o.  With -b they are compared to
+BASELINE (which is written first if it does not exist) and the
+exit status is 1 if any figure regressed by more than --tolerance
+percent.
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import contextlib
+import getopt
+import io
+import json
+import logging
+import os
+import sys
+import time
+import glucid_cli
+from glucid8824 import Glucid8824
+from glucidsim import Glucid8824Sim
+
+# arguments sent with each Set command while benchmarking;
+# they match the simulator's power-on state
+SET_ARGS = {
+    'SetMode': [2],
+    'SetSync': [1],
+    'SetOptSrc': [0],
+    'SetAnalogSrc': [0],
+    'SetAesSrc': [1],
+    'SetAnalogGain': Glucid8824Sim.DEFAULT_GAIN,
+}
+
+
+def percentiles(samples):
+    """Return the p50, p95 and p99 of `samples`, in milliseconds"""
+    ordered = sorted(samples)
+    result = {}
+    for p in (50, 95, 99):
+        index = min(len(ordered) - 1, int(round(p / 100.0 * len(ordered))))
+        result['p%d' % p] = ordered[index] * 1000.0
+    return result
+
+
+def timed(func, count):
+    """Call `func` `count` times and return the percentiles of
+    the wall time of each call
+    """
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        if func() is False:
+            raise RuntimeError("benchmarked call failed")
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def bench_commands(lucid, count):
+    """Latency of each command in COMMANDSET"""
+    results = {}
+    for cmdkey in sorted(lucid.COMMANDSET):
+        args = SET_ARGS.get(cmdkey, (0,))
+        results[cmdkey] = timed(
+            lambda: lucid.sendCommand(cmdkey, args), count)
+    return results
+
+
+def bench_get_all(lucid, count):
+    """Wall time of glucid_cli.get_all"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return timed(lambda: glucid_cli.get_all(lucid), count)
+
+
+def bench_gain_write(lucid, count):
+    """Cost of reading the gains, changing one channel and writing
+    them back
+    """
+    def gain_write():
+        lucid.get_gain()
+        lucid.update_channel_in_gainlist(-8, 0)
+        return lucid.write_gainlist_to_lucid()
+    return timed(gain_write, count)
+
+
+def bench_throughput(lucid, seconds):
+    """Commands per second sent in a loop of GetMode commands"""
+    sent = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        lucid.sendCommand('GetMode')
+        sent += 1
+    return sent / (time.perf_counter() - start)
+
+
+def run(count=50, realtime=True):
+    """Run every benchmark against a fresh simulator and return
+    the results as a dictionary
+    """
+    with Glucid8824Sim(realtime=realtime) as sim:
+        lucid = Glucid8824(siface=sim.path)
+        # measure round trips, not the state cache
+        lucid.state.max_age = 0
+        if not lucid.connect():
+            raise RuntimeError("could not open %s" % sim.path)
+        try:
+            results = {
+                'realtime': realtime,
+                'count': count,
+                'commands': bench_commands(lucid, count),
+                'get_all': bench_get_all(lucid, max(1, count // 10)),
+                'gain_write': bench_gain_write(lucid, count),
+                'commands_per_second': bench_throughput(lucid, 2.0),
+            }
+        finally:
+            lucid.disconnect()
+    return results
+
+
+def flatten(results, prefix=''):
+    """Flatten nested results to {'commands.GetMode.p50': value}"""
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix + key + '.'))
+        elif isinstance(value, float):
+            flat[prefix + key] = value
+    return flat
+
+
+def compare(results, baseline, tolerance=20.0):
+    """Print each figure next to its baseline and return a list
+    of the figures that regressed by more than `tolerance` percent
+    """
+    current = flatten(results)
+    previous = flatten(baseline)
+    regressions = []
+    for key in sorted(current):
+        if key not in previous or not previous[key]:
+            continue
+        change = (current[key] - previous[key]) / previous[key] * 100.0
+        # throughput regresses when it falls, latency when it rises
+        if key == 'commands_per_second':
+            change = -change
+        flag = ''
+        if change > tolerance:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print("%-32s %10.3f %10.3f %+7.1f%%%s" %
+              (key, previous[key], current[key], change, flag))
+    return regressions
+
+
+def main():
+    """Run the benchmarks from the command line"""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "hvn:o:b:t:",
+                                   ["help", "verbose", "fast",
+                                    "tolerance="])
+    except getopt.GetoptError as err:
+        print(err)
+        sys.exit(2)
+
+    count = 50
+    realtime = True
+    outfile = None
+    baselinefile = None
+    tolerance = 20.0
+    for o, a in opts:
+        if o in ("-h", "--help"):
+            print("Usage: glucidbench.py [-n COUNT] [--fast] [-o FILE] "
+                  "[-b BASELINE] [-t,--tolerance PERCENT]")
+            sys.exit(0)
+        elif o in ("-v", "--verbose"):
+            logging.basicConfig(level=logging.INFO)
+        elif o == "-n":
+            count = int(a)
+        elif o == "--fast":
+            realtime = False
+        elif o == "-o":
+            outfile = a
+        elif o == "-b":
+            baselinefile = a
+        elif o in ("-t", "--tolerance"):
+            tolerance = float(a)
+
+    results = run(count, realtime)
+
+    if outfile:
+        with open(outfile, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+    if baselinefile:
+        if not os.path.exists(baselinefile):
+            with open(baselinefile, 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            print("Wrote new baseline %s" % baselinefile)
+            return
+        with open(baselinefile) as f:
+            baseline = json.load(f)
+        if baseline.get('realtime') != realtime:
+            sys.exit("baseline %s was not run with the same timing" %
+                     baselinefile)
+        print("%-32s %10s %10s %8s" % ('', 'baseline', 'current', 'change'))
+        if compare(results, baseline, tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
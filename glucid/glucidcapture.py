@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidcapture.py records the frames `Glucid8824` writes to and
+reads from a Lucid 8824 in a compact, append-only capture file,
+and replays a capture back to `Glucid8824` in place of a serial
+port, at its original timing or as fast as possible.
+
+A capture file starts with MAGIC, followed by one record per
+frame: a RECORD header (direction, monotonic timestamp in
+nanoseconds, length) and the frame bytes.
+
+    python3 glucidcapture.py CAPTUREFILE
+
+prints a capture.
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import struct
+import sys
+import time
+
+MAGIC = b'GLUCIDCAP1\n'
+
+# direction, monotonic nanoseconds, length
+RECORD = struct.Struct('<BQH')
+
+WRITTEN = 0
+READ = 1
+
+
+class CaptureWriter:
+    """Appends frames to a capture file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.capfile = open(path, 'ab')
+        if self.capfile.tell() == 0:
+            self.capfile.write(MAGIC)
+            self.capfile.flush()
+
+    def record(self, direction, frame):
+        """Append `frame` as WRITTEN or READ, stamped now.  Each
+        record is flushed so a capture survives the program dying
+        in the middle of the exchange it is meant to show.
+        """
+        self.capfile.write(RECORD.pack(direction, time.monotonic_ns(),
+                                       len(frame)) + bytes(frame))
+        self.capfile.flush()
+
+    def close(self):
+        self.capfile.close()
+
+
+def read_capture(path):
+    """Yield (direction, nanoseconds, frame) for each record in the
+    capture file `path`
+    """
+    with open(path, 'rb') as capfile:
+        if capfile.read(len(MAGIC)) != MAGIC:
+            raise ValueError("%s is not a glucid capture file" % path)
+        while True:
+            header = capfile.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            direction, stamp, length = RECORD.unpack(header)
+            frame = capfile.read(length)
+            if len(frame) < length:
+                logging.warning("read_capture: %s is truncated", path)
+                return
+            yield direction, stamp, frame
+
+
+class ReplaySerial:
+    """Stands in for a serial.Serial connection and answers each
+    write with the frames that followed it in a capture
+
+    With realtime, each reply becomes readable after the same delay
+    that followed the write when it was captured; otherwise replies
+    are readable immediately.
+    """
+
+    def __init__(self, path, realtime=True, timeout=1):
+        self.records = list(read_capture(path))
+        self.realtime = realtime
+        self.timeout = timeout
+        self.index = 0
+        self.rxbuf = bytearray()
+        # (wall clock time due, frame) of replies not yet readable
+        self.pending = []
+        self.mismatches = 0
+        self.is_open = True
+
+    def write(self, data):
+        """Match `data` to the next WRITTEN record and queue the
+        READ records that followed it
+        """
+        # replies the client never read are dropped, as they
+        # would have been by the serial port going quiet
+        self.pending = []
+        while (self.index < len(self.records) and
+               self.records[self.index][0] != WRITTEN):
+            self.index += 1
+        if self.index == len(self.records):
+            logging.warning("ReplaySerial: capture exhausted")
+            return len(data)
+
+        direction, written_at, frame = self.records[self.index]
+        if bytes(data) != frame:
+            self.mismatches += 1
+            logging.warning("ReplaySerial: wrote %s, capture has %s",
+                            bytes(data), frame)
+        self.index += 1
+
+        now = time.monotonic()
+        while (self.index < len(self.records) and
+               self.records[self.index][0] == READ):
+            direction, read_at, frame = self.records[self.index]
+            due = now + (read_at - written_at) / 1e9 if self.realtime else 0
+            self.pending.append((due, frame))
+            self.index += 1
+        return len(data)
+
+    def _collect(self):
+        """Move replies that are due into rxbuf"""
+        now = time.monotonic()
+        while self.pending and self.pending[0][0] <= now:
+            self.rxbuf += self.pending.pop(0)[1]
+
+    @property
+    def in_waiting(self):
+        self._collect()
+        return len(self.rxbuf)
+
+    def read(self, size=1):
+        """Return up to `size` bytes, waiting up to `timeout` for
+        the next reply like a serial port would
+        """
+        self._collect()
+        if not self.rxbuf:
+            if self.pending:
+                wait = self.pending[0][0] - time.monotonic()
+            else:
+                wait = self.timeout if self.realtime else 0
+            if wait > self.timeout:
+                wait = self.timeout
+            if wait > 0:
+                time.sleep(wait)
+            self._collect()
+        data = bytes(self.rxbuf[:size])
+        del self.rxbuf[:size]
+        return data
+
+    def reset_input_buffer(self):
+        self.rxbuf = bytearray()
+        self.pending = []
+
+    def close(self):
+        self.is_open = False
+
+
+def replay(lucid, path, realtime=True):
+    """Connect the Glucid8824 `lucid` to a replay of the capture
+    at `path` instead of a serial port
+    """
+    lucid.conn = ReplaySerial(path, realtime, lucid.tout)
+    lucid.rxbuf = bytearray()
+    lucid.clear_errorflag()
+    return lucid.conn
+
+
+def main():
+    """Print the capture file named on the command line"""
+    if len(sys.argv) != 2:
+        print("Usage: glucidcapture.py CAPTUREFILE")
+        sys.exit(2)
+    start = None
+    for direction, stamp, frame in read_capture(sys.argv[1]):
+        if start is None:
+            start = stamp
+        print("%12.3f ms %s %s" % ((stamp - start) / 1e6,
+                                   '>' if direction == WRITTEN else '<',
+                                   frame.hex()))
+
+
+if __name__ == "__main__":
+    main()
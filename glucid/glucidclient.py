@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidclient.py forwards `glucid` command line options to a running
+`glucidd` over its Unix domain socket.  It is kept apart from
+glucidd.py so that a plain `glucid` call loads only what it needs
+to talk to the daemon.
+
+Requests and replies are single lines of JSON:
+
+    {"argv": ["--get_sync"]}
+    {"output": "Sync:\\t\\tWordClock\\n", "status": 0}
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import logging
+import os
+import socket
+
+SOCKETFILE = '.glucidd.sock'
+
+
+def socket_path():
+    """The default socket, in the user's home like the config file"""
+    return os.path.join(os.path.expanduser('~'), SOCKETFILE)
+
+
+def forward(argv, path=None, timeout=30):
+    """Send the command line options `argv` to a running glucidd.
+
+    Returns a tuple of the output and exit status, or None if no
+    daemon is listening on `path`.
+    """
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        sock.sendall(json.dumps({'argv': list(argv)}).encode() + b'\n')
+        reply = sock.makefile('rb').readline()
+    except OSError as oe:
+        logging.info("glucidd not available on %s: %s", path, oe)
+        return None
+    finally:
+        sock.close()
+    if not reply:
+        return None
+    reply = json.loads(reply.decode())
+    return reply['output'], reply['status']
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidcues.py runs a timeline of scene changes and gain moves
+against one or more Lucid 8824 units, landing each cue at a precise
+monotonic time and reporting how far each one drifted.
+
+Every cue is planned and encoded before the show starts: the state
+each unit will be in is followed through the timeline, so each cue
+is only the frames that change something (see
+`Glucid8824.plan_state`) and sending it is a single write.  The
+units' replies are collected between cues without blocking.
+
+    python3 glucidcues.py [-v] [-d DEVICE] [-i ID] CUEFILE
+
+runs a cue file, one cue per line:
+
+    # seconds  action
+    0          recall +4dBu
+    12.5       recall verse
+    30         gain in1,in2 -6
+    31.25      gain out1-out8 +1
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import configparser
+import getopt
+import logging
+import os
+import sys
+import time
+import glucidscenes
+from glucid8824 import Glucid8824, CONFIGFILE
+
+
+def gain_move(channels, gain_db):
+    """Return the state setting `channels` (0-7 IN 1-8, 8-15
+    OUT 1-8) to `gain_db`, for a cue
+    """
+    return {'gain': {int(ch): int(gain_db) + 96 for ch in channels}}
+
+
+def parse_channels(text):
+    """Parse 'in1,in2' or 'out1-out8' into channel numbers 0-15"""
+    channels = []
+    for part in text.lower().split(','):
+        first, _, last = part.partition('-')
+        last = last or first
+        if first[:-1] != last[:-1] or first.rstrip('0123456789') not in \
+                ('in', 'out'):
+            raise ValueError("bad channel %s" % part)
+        offset = 0 if first.startswith('in') else 8
+        low = int(first.lstrip('inout'))
+        high = int(last.lstrip('inout'))
+        if low < 1 or high > 8 or low > high:
+            raise ValueError("bad channel %s" % part)
+        channels.extend(range(offset + low - 1, offset + high))
+    return channels
+
+
+class Cue:
+    """One change of state for one unit at `at` seconds into
+    the show
+    """
+    __slots__ = ('at', 'lucid', 'state', 'plan', 'commands', 'frames',
+                 'sent_at', 'drift', 'confirmed', 'failed')
+
+    def __init__(self, at, lucid, state):
+        """at    - seconds from the start of the show
+           lucid - the Glucid8824 to change
+           state - a state for `Glucid8824.apply_state`, a
+                   glucidscenes.Scene or the name of a scene
+        """
+        self.at = float(at)
+        self.lucid = lucid
+        self.state = state
+        self.plan = []
+        # (command key, encoded frame) of each command in plan
+        self.commands = []
+        self.frames = b''
+        self.sent_at = None
+        self.drift = None
+        self.confirmed = 0
+        self.failed = 0
+
+
+class CueList:
+    """A timeline of cues, run with `prepare` then `run`"""
+    # wake this long before a cue and spin for the rest
+    SPIN = 0.002
+    # longest sleep between looks at the units' replies
+    POLL = 0.005
+
+    def __init__(self, cues=(), library=None):
+        self.cues = sorted(cues, key=lambda cue: cue.at)
+        self.library = library
+        self.prepared = False
+
+    def add(self, at, lucid, state):
+        """Add a cue, returning it"""
+        cue = Cue(at, lucid, state)
+        self.cues.append(cue)
+        self.cues.sort(key=lambda c: c.at)
+        self.prepared = False
+        return cue
+
+    def desired(self, cue):
+        """Return the validated state of `cue`, or False"""
+        state = cue.state
+        if isinstance(state, str):
+            if self.library is None:
+                self.library = glucidscenes.SceneLibrary()
+            scene = self.library.get(state)
+            if scene is None:
+                logging.error("CueList: no scene named %s", state)
+                return False
+            state = scene
+        if isinstance(state, glucidscenes.Scene):
+            state = state.state
+        return cue.lucid.desired_state(state)
+
+    def prepare(self):
+        """Read each unit's state and plan and encode every cue.
+        Returns False if a cue is invalid or a unit cannot be read.
+        """
+        # each unit's Get payloads as they will be after each cue
+        payloads = {}
+        for cue in self.cues:
+            lucid = cue.lucid
+            if lucid not in payloads:
+                payloads[lucid] = lucid.read_values(lucid.READ_ALL)
+            desired = self.desired(cue)
+            if desired is False:
+                return False
+            plan = lucid.plan_state(desired, payloads[lucid])
+            if plan is False:
+                return False
+            cue.plan = plan
+            cue.commands = [(cmdkey, bytes(lucid.encodeCommand(cmdkey, args)))
+                            for cmdkey, args in plan]
+            cue.frames = b''.join(frame for cmdkey, frame in cue.commands)
+            for cmdkey, args in plan:
+                payloads[lucid]['Get' + cmdkey[3:]] = bytes(args)
+        self.prepared = True
+        return True
+
+    def run(self, start=None):
+        """Send each cue at `start` (a time.monotonic value, by
+        default now) plus its time, and return the cues with their
+        `drift` (seconds late when written) and replies filled in.
+        Returns False if the cues could not be prepared.
+        """
+        if not self.prepared and not self.prepare():
+            return False
+        # (cue, command key, frame, time.perf_counter() when written)
+        # sent to each unit and not yet answered, oldest first
+        outstanding = {}
+        for cue in self.cues:
+            outstanding.setdefault(cue.lucid, [])
+            if cue.lucid.stale_input:
+                cue.lucid.discard_input()
+        if start is None:
+            start = time.monotonic()
+
+        for cue in self.cues:
+            target = start + cue.at
+            while True:
+                remaining = target - time.monotonic()
+                if remaining <= self.SPIN:
+                    break
+                self.collect(outstanding)
+                time.sleep(min(self.POLL, remaining - self.SPIN))
+            while time.monotonic() < target:
+                pass
+
+            cue.sent_at = time.monotonic()
+            cue.drift = cue.sent_at - target
+            if not cue.frames:
+                continue
+            written = time.perf_counter()
+            if not cue.lucid.writeFrame(cue.frames):
+                cue.failed = len(cue.plan)
+                continue
+            for cmdkey, frame in cue.commands:
+                cue.lucid.record_sent(cmdkey, frame)
+                if cue.lucid.expects_reply():
+                    outstanding[cue.lucid].append((cue, cmdkey, frame,
+                                                   written))
+                else:
+                    cue.lucid.state.record(cmdkey, frame, True)
+
+        # wait out the replies to the last cues
+        deadline = time.monotonic() + max(
+            [lucid.read_timeout for lucid in outstanding] or [0])
+        while any(outstanding.values()) and time.monotonic() < deadline:
+            self.collect(outstanding)
+            time.sleep(self.POLL)
+        for lucid, sent in outstanding.items():
+            for cue, cmdkey, frame, written in sent:
+                logging.error("CueList: no reply to %s at %.3fs",
+                              cmdkey, cue.at)
+                cue.failed += 1
+                lucid.state.record(cmdkey, frame, False)
+                lucid.record_reply(cmdkey, written, b'', False)
+            if sent:
+                lucid.stale_input = True
+        return self.cues
+
+    def collect(self, outstanding):
+        """Match the replies that have arrived to the frames sent"""
+        for lucid, sent in outstanding.items():
+            if not sent:
+                continue
+            for hexdata in lucid.pollFrames():
+                if not sent:
+                    break
+                cue, cmdkey, frame, written = sent.pop(0)
+                retval = lucid.getResponse(cmdkey, hexdata)
+                lucid.record_reply(cmdkey, written, hexdata, retval)
+                lucid.state.record(cmdkey, frame, retval)
+                if retval is False:
+                    cue.failed += 1
+                else:
+                    cue.confirmed += 1
+
+
+def read_cuefile(path, lucid):
+    """Return a CueList of the cues in the cue file `path` for
+    `lucid`
+    """
+    cues = CueList()
+    with open(path) as cuefile:
+        for lineno, line in enumerate(cuefile, 1):
+            words = line.split('#')[0].split()
+            if not words:
+                continue
+            try:
+                if len(words) == 3 and words[1] == 'recall':
+                    cues.add(words[0], lucid, words[2])
+                elif len(words) == 4 and words[1] == 'gain':
+                    cues.add(words[0], lucid,
+                             gain_move(parse_channels(words[2]), words[3]))
+                else:
+                    raise ValueError("unknown cue")
+            except ValueError as ve:
+                raise ValueError("%s:%d: %s" % (path, lineno, ve))
+    return cues
+
+
+def main():
+    """Run a cue file from the command line"""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "hvd:i:", ["help",
+                                                            "verbose"])
+    except getopt.GetoptError as err:
+        print(err)
+        sys.exit(2)
+
+    glucidconf = configparser.ConfigParser()
+    glucidconf.read(os.path.join(os.path.expanduser('~'), CONFIGFILE))
+    serialif = glucidconf['DEFAULT'].get('Device', '/dev/ttyUSB0')
+    device_id = glucidconf['DEFAULT'].get('DEVICE_ID', '00')
+    for o, a in opts:
+        if o in ("-h", "--help"):
+            print("Usage: glucidcues.py [-v] [-d DEVICE] [-i ID] CUEFILE")
+            sys.exit(0)
+        elif o in ("-v", "--verbose"):
+            logging.basicConfig(level=logging.INFO)
+        elif o == "-d":
+            serialif = a
+        elif o == "-i":
+            device_id = '{:02}'.format(int(a))
+    if len(args) != 1:
+        print("Usage: glucidcues.py [-v] [-d DEVICE] [-i ID] CUEFILE")
+        sys.exit(2)
+
+    lucid = Glucid8824(siface=serialif, LucidID=device_id)
+    try:
+        cues = read_cuefile(args[0], lucid)
+    except ValueError as ve:
+        sys.exit(str(ve))
+    with lucid.session():
+        if not lucid.is_connected():
+            sys.exit("Failed to open connection using %s" % serialif)
+        if not cues.prepare():
+            sys.exit("failed preparing cues")
+        print("Running %d cues" % len(cues.cues))
+        cues.run()
+
+    worst = 0.0
+    for cue in cues.cues:
+        worst = max(worst, abs(cue.drift))
+        print("%10.3f s  %+8.3f ms  %d sent  %d confirmed%s" %
+              (cue.at, cue.drift * 1000, len(cue.plan), cue.confirmed,
+               '  %d FAILED' % cue.failed if cue.failed else ''))
+    print("worst drift %.3f ms" % (worst * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidd.py provides `glucidd`, a resident daemon which opens a
+Lucid 8824 once, keeps the values it has recently read in memory,
+and runs `glucid` command line options sent to it over a Unix
+domain socket.
+
+When glucidd is running, `glucid` forwards its options to it
+instead of reading the config file, opening the serial port and
+doing fresh round trips, so frequent polling costs neither a port
+open nor a serial timeout.
+
+Values are trusted for `--max_age` seconds (the MAX_AGE key of the
+config file), by default POLL_INTERVAL, so scripts polling that
+often are answered from memory.  The protocol and the client side
+are in glucidclient.py.
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+__version__ = '0.5.1'
+__author__ = 'Daniel R Mechanic (dan.mechanic@gmail.com)'
+
+# how often, in seconds, monitoring scripts are expected to poll
+POLL_INTERVAL = 5.0
+
+import configparser
+import contextlib
+import getopt
+import io
+import json
+import logging
+import os
+import signal
+import socketserver
+import sys
+import glucid_cli
+from glucid8824 import Glucid8824, CONFIGFILE
+from glucidclient import forward, socket_path
+
+
+class CachingGlucid8824(Glucid8824):
+    """A Glucid8824 that trusts values read from or written to
+    the unit for `max_age` seconds, see `DeviceState`
+    """
+
+    def __init__(self, max_age=POLL_INTERVAL, **kwargs):
+        super().__init__(**kwargs)
+        self.state.max_age = max_age
+
+
+class GlucidRequestHandler(socketserver.StreamRequestHandler):
+    """Runs the cli options of one request against the server's
+    Glucid8824 and writes back what the cli would have printed
+    """
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            argv = json.loads(line.decode())['argv']
+        except (ValueError, KeyError, TypeError):
+            logging.error("glucidd: bad request %s", line)
+            return
+        output, status = self.server.run(argv)
+        self.wfile.write(json.dumps({'output': output,
+                                     'status': status}).encode() + b'\n')
+
+
+class GlucidServer(socketserver.UnixStreamServer):
+    """Serves requests one at a time, so the single serial
+    connection is never shared
+    """
+
+    def __init__(self, path, lucid):
+        self.lucid = lucid
+        super().__init__(path, GlucidRequestHandler)
+
+    def server_bind(self):
+        """Bind the socket with no permissions for anyone else, so
+        there is no moment it could be connected to by other users
+        """
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def run(self, argv):
+        """Run cli options `argv`, returning (output, status)"""
+        logging.info("glucidd: running %s", argv)
+        output = io.StringIO()
+        status = 0
+        try:
+            opts, args = getopt.getopt(argv, glucid_cli.SHORTOPTS,
+                                       glucid_cli.LONGOPTS)
+        except getopt.GetoptError as err:
+            return "%s\n" % err, 2
+        with contextlib.redirect_stdout(output):
+            try:
+                glucid_cli.run_options(self.lucid, opts, args)
+            except SystemExit as se:
+                if isinstance(se.code, str):
+                    print(se.code)
+                    status = 1
+                else:
+                    status = se.code or 0
+            except Exception as e:
+                logging.exception("glucidd: request failed")
+                print("glucidd: %s" % e)
+                status = 1
+        return output.getvalue(), status
+
+
+def usage():
+    print("Usage: glucidd [-v] [-d DEVICE] [-i ID] [-s SOCKET] "
+          "[--max_age=SECONDS]")
+    print("Keep a Lucid 8824 open and answer glucid requests for it")
+
+
+def main():
+    """Run the glucid daemon until interrupted"""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "hvd:i:s:",
+                                   ["help", "verbose", "socket=",
+                                    "max_age="])
+    except getopt.GetoptError as err:
+        print(err)
+        usage()
+        sys.exit(2)
+
+    glucidconf = configparser.ConfigParser()
+    glucidconf.read(os.path.join(os.path.expanduser('~'), CONFIGFILE))
+    serialif = glucidconf['DEFAULT'].get('Device', '/dev/ttyUSB0')
+    device_id = glucidconf['DEFAULT'].get('DEVICE_ID', '00')
+    path = socket_path()
+    max_age = float(glucidconf['DEFAULT'].get('MAX_AGE', POLL_INTERVAL))
+
+    for o, a in opts:
+        if o in ("-h", "--help"):
+            usage()
+            sys.exit(0)
+        elif o in ("-v", "--verbose"):
+            logging.basicConfig(level=logging.INFO)
+        elif o == "-d":
+            serialif = a
+        elif o == "-i":
+            device_id = '{:02}'.format(int(a))
+        elif o in ("-s", "--socket"):
+            path = a
+        elif o == "--max_age":
+            max_age = float(a)
+
+    if forward([], path) is not None:
+        sys.exit("glucidd is already running on %s" % path)
+    if os.path.exists(path):
+        # left behind by a daemon that did not exit cleanly
+        os.unlink(path)
+
+    lucid = CachingGlucid8824(max_age=max_age, siface=serialif,
+                              LucidID=device_id)
+    if not lucid.begin_session():
+        sys.exit("Failed to open connection using %s" % serialif)
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    server = GlucidServer(path, lucid)
+    print("glucidd: serving %s id %s on %s" % (serialif, device_id, path))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(path)
+        lucid.end_session()
+
+
+if __name__ == "__main__":
+    main()
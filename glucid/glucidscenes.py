@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidscenes.py keeps a library of named scenes for the Lucid 8824:
+the routing (sync, mode, optical and analog output sources) and the
+16 gains, any of which may be left out.  A scene that gives whole
+values is recalled by sending its precompiled body, leaving out
+what the unit's cached state already holds; one that sets only some
+gains or half of the mode register goes through
+`Glucid8824.apply_state`, which merges it with the unit's values.
+
+The library lives in one compact, append-only file in the user's
+home.  It starts with MAGIC, followed by one record per stored or
+deleted scene: a HEADER (flags, name length, tags length), the
+name and comma separated tags in UTF-8, and a BODY holding the
+scene as the bytes sent to the 8824, gains already in its reversed
+8..1 8..1 order.  A later record for a name replaces an earlier
+one; `SceneLibrary.compact` drops the replaced records.
+
+Scenes are indexed by name and by tag when the library is loaded.
+The +4dBu and -10dBV presets are always available.
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import os
+import struct
+from glucid8824 import Glucid8824, DeviceSnapshot
+
+SCENEFILE = '.glucid.scenes'
+
+MAGIC = b'GLUCIDSCN1\n'
+
+# flags, name length, tags length
+HEADER = struct.Struct('<BBH')
+
+# sync, mode, optical source, analog source, 16 gains in
+# the 8824's order
+BODY = struct.Struct('<4B16B')
+
+DELETED = 1
+
+# a routing byte that is not part of the scene; a gain of 0
+# leaves that channel alone
+UNSET = 0xff
+
+# the mode byte of a scene keeps which halves it sets
+MODE_METER = 0x10
+MODE_DIG1 = 0x20
+
+ROUTING = ('sync', 'mode', 'opt_src', 'analog_src')
+# the Set commands of the routing bytes
+SETS = ('SetSync', 'SetMode', 'SetOptSrc', 'SetAnalogSrc')
+
+
+class Scene:
+    """A named, tagged scene held as its precompiled BODY"""
+    __slots__ = ('name', 'tags', 'body')
+
+    def __init__(self, name, tags=(), body=None):
+        self.name = name
+        self.tags = tuple(tags)
+        self.body = body or BODY.pack(*([UNSET] * 4 + [0] * 16))
+
+    @classmethod
+    def from_state(cls, name, state, tags=()):
+        """Make a scene from a state as accepted by
+        `Glucid8824.apply_state`; the AES source, which the 8824
+        does not let us set, is left out
+        """
+        if isinstance(state, DeviceSnapshot):
+            state = {field: getattr(state, field)
+                     for field in ROUTING + ('gain',)}
+        routing = [UNSET] * 4
+        for i, field in enumerate(ROUTING):
+            if field != 'mode' and state.get(field) is not None:
+                routing[i] = int(state[field])
+        mode = 0
+        if state.get('mode') is not None:
+            mode = int(state['mode']) | MODE_METER | MODE_DIG1
+        if state.get('meter') is not None:
+            mode = (mode & ~3) | int(state['meter']) | MODE_METER
+        if state.get('dig1') is not None:
+            mode = (mode & ~4) | (int(state['dig1']) << 2) | MODE_DIG1
+        if mode:
+            routing[1] = mode
+
+        gains = [0] * 16
+        given = state.get('gain') or ()
+        if isinstance(given, dict):
+            given = given.items()
+        else:
+            given = enumerate(given)
+        for channel, gain in given:
+            if gain is not None:
+                gains[int(channel)] = int(gain)
+        # the lucid reverses this 8..1 8..1
+        return cls(name, tags,
+                   BODY.pack(*(routing + gains[7::-1] + gains[15:7:-1])))
+
+    @property
+    def state(self):
+        """The scene as a state for `Glucid8824.apply_state`"""
+        values = BODY.unpack(self.body)
+        state = {}
+        for field, value in zip(ROUTING, values[:4]):
+            if value == UNSET:
+                continue
+            if field == 'mode':
+                if value & MODE_METER and value & MODE_DIG1:
+                    state['mode'] = value & 7
+                elif value & MODE_METER:
+                    state['meter'] = value & 3
+                elif value & MODE_DIG1:
+                    state['dig1'] = (value >> 2) & 1
+            else:
+                state[field] = value
+        wire = values[4:]
+        gains = list(wire[7::-1] + wire[15:7:-1])
+        if all(gains):
+            state['gain'] = gains
+        elif any(gains):
+            state['gain'] = {channel: gain for channel, gain
+                             in enumerate(gains) if gain}
+        return state
+
+    def __repr__(self):
+        return 'Scene(%r, %r, %r)' % (self.name, self.tags, self.state)
+
+
+# the presets every library has
+PRESETS = {
+    '+4dBu': Scene.from_state('+4dBu', {
+        'gain': [int(Glucid8824.PLUS4IN, 16)] * 8 +
+                [int(Glucid8824.PLUS4OUT, 16)] * 8}, ('preset',)),
+    '-10dBV': Scene.from_state('-10dBV', {
+        'gain': [int(Glucid8824.MINUS10IN, 16)] * 8 +
+                [int(Glucid8824.MINUS10OUT, 16)] * 8}, ('preset',)),
+}
+
+
+def scene_path():
+    """The default library, in the user's home like the config file"""
+    return os.path.join(os.path.expanduser('~'), SCENEFILE)
+
+
+class SceneLibrary:
+    """The scenes stored in the library file `path`, indexed by
+    name and by tag
+    """
+
+    def __init__(self, path=None):
+        self.path = path or scene_path()
+        # name -> Scene
+        self.scenes = {}
+        # tag -> set of names
+        self.tags = {}
+        # records in the file that a later record replaced
+        self.replaced = 0
+        self.load()
+
+    def load(self):
+        """Read the library file and build the indexes"""
+        self.scenes = {}
+        self.tags = {}
+        self.replaced = 0
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as scenefile:
+            data = scenefile.read()
+        if not data.startswith(MAGIC):
+            raise ValueError("%s is not a glucid scene library" % self.path)
+        offset = len(MAGIC)
+        while offset + HEADER.size <= len(data):
+            flags, namelen, tagslen = HEADER.unpack_from(data, offset)
+            offset += HEADER.size
+            end = offset + namelen + tagslen + BODY.size
+            if end > len(data):
+                logging.warning("SceneLibrary: %s is truncated", self.path)
+                break
+            name = data[offset:offset + namelen].decode()
+            offset += namelen
+            tags = data[offset:offset + tagslen].decode()
+            offset += tagslen
+            body = data[offset:end]
+            offset = end
+            if name in self.scenes:
+                self.replaced += 1
+                self._unindex(name)
+            if flags & DELETED:
+                self.replaced += 1
+            else:
+                self._index(Scene(name, tags.split(',') if tags else (),
+                                  body))
+
+    def _index(self, scene):
+        self.scenes[scene.name] = scene
+        for tag in scene.tags:
+            self.tags.setdefault(tag, set()).add(scene.name)
+
+    def _unindex(self, name):
+        scene = self.scenes.pop(name)
+        for tag in scene.tags:
+            self.tags[tag].discard(name)
+            if not self.tags[tag]:
+                del self.tags[tag]
+
+    def _append(self, records):
+        """Append encoded records to the library file"""
+        with open(self.path, 'ab') as scenefile:
+            if scenefile.tell() == 0:
+                scenefile.write(MAGIC)
+            scenefile.write(records)
+
+    @staticmethod
+    def _record(scene, flags=0):
+        name = scene.name.encode()
+        tags = ','.join(scene.tags).encode()
+        if not name or len(name) > 255:
+            raise ValueError("scene name must be 1-255 bytes: %r" %
+                             scene.name)
+        return HEADER.pack(flags, len(name), len(tags)) + name + tags + \
+            scene.body
+
+    def get(self, name):
+        """Return the scene `name`, a preset, or None"""
+        return self.scenes.get(name) or PRESETS.get(name)
+
+    def __contains__(self, name):
+        return name in self.scenes or name in PRESETS
+
+    def __len__(self):
+        return len(self.scenes)
+
+    def names(self):
+        """Return the names of the stored scenes, sorted"""
+        return sorted(self.scenes)
+
+    def available(self):
+        """Return the names of the stored scenes and the presets,
+        sorted; a stored scene hides the preset of the same name
+        """
+        return sorted(set(self.scenes).union(PRESETS))
+
+    def tagged(self, tag):
+        """Return the names of the scenes tagged `tag`, sorted"""
+        return sorted(self.tags.get(tag, ()))
+
+    def store(self, scene):
+        """Add `scene`, replacing a scene of the same name"""
+        record = self._record(scene)
+        self._append(record)
+        if scene.name in self.scenes:
+            self.replaced += 1
+            self._unindex(scene.name)
+        self._index(scene)
+
+    def delete(self, name):
+        """Remove the scene `name`; returns False if there is none"""
+        if name not in self.scenes:
+            return False
+        self._append(self._record(Scene(name), DELETED))
+        self._unindex(name)
+        self.replaced += 2
+        return True
+
+    def compact(self):
+        """Rewrite the library file without replaced records"""
+        tmppath = self.path + '.tmp'
+        with open(tmppath, 'wb') as scenefile:
+            scenefile.write(MAGIC)
+            for name in self.names():
+                scenefile.write(self._record(self.scenes[name]))
+        os.replace(tmppath, self.path)
+        self.replaced = 0
+
+
+def recall(lucid, scene):
+    """Bring `lucid` to `scene`, returning the commands sent or
+    False, like `Glucid8824.apply_state`
+    """
+    logging.info("recall: %s", scene.name)
+    desired = lucid.desired_state(scene.state)
+    if desired is False:
+        return False
+    values = BODY.unpack(scene.body)
+    mode, wire = values[1], scene.body[4:]
+    whole_mode = MODE_METER | MODE_DIG1
+    if ((mode != UNSET and (mode & whole_mode) != whole_mode) or
+            (any(wire) and not all(wire))):
+        # part of a value: merge it with what the unit has
+        return lucid.apply_state(desired)
+
+    plan = []
+    for setkey, value in zip(SETS, values[:4]):
+        if value == UNSET:
+            continue
+        if setkey == 'SetMode':
+            # without the flags saying which halves the scene sets
+            value &= 7
+        if lucid.state.get('Get' + setkey[3:]) != bytes([value]):
+            plan.append((setkey, [value]))
+    # already in the 8824's order
+    if all(wire) and lucid.state.get('GetAnalogGain') != wire:
+        plan.append(('SetAnalogGain', list(wire)))
+    if plan:
+        results = lucid.pipeline(plan)
+        if not results or False in results:
+            logging.error("recall: failed sending %s", plan)
+            return False
+    lucid.remember_state(desired)
+    return plan
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+glucidsim.py defines a class `Glucid8824Sim` which simulates one
+or more Lucid 8824 units (instance ids 00-07) on a pseudo-terminal,
+so `Glucid8824` can be tested and benchmarked without hardware.
+
+The simulator answers the SysEx frames sent by
+`Glucid8824.sendCommand` with properly framed 0x05 responses, keeps
+the sync, mode, source and gain state of each unit (gains travel in
+the unit's reversed 8..1 8..1 order), and by default paces its
+replies like a 9600 baud link.  Pseudo-terminals are only available
+on POSIX systems.
+
+Run directly, it prints the pty path and serves until interrupted:
+
+    python3 glucidsim.py [-i ID]... [--fast]
+
+(a client in another process must register that path with
+`Glucid8824.register_device` to wait for the replies)
+
+Copyright (C) 2017,2018  Daniel R Mechanic (dan.mechanic@gmail.com)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3 of the License ONLY.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import getopt
+import logging
+import os
+import pty
+import select
+import sys
+import threading
+import time
+import tty
+from glucid8824 import Glucid8824
+
+
+class Glucid8824Sim:
+    """Glucid8824Sim owns a pseudo-terminal and answers on it as
+    a chain of Lucid 8824 units would
+    """
+    # seconds to send one byte at 9600 baud, 8N1
+    BYTETIME = 10 / 9600.0
+
+    # power-on state of a simulated unit
+    DEFAULT_STATE = {
+        'GetSync': 1,           # WordClock
+        'GetMode': 2,           # Analog Out, AES dig 1,2
+        'GetOptSrc': 0,         # Analog In
+        'GetAnalogSrc': 0,      # ADAT In
+        'GetAesSrc': 1,         # Analog In
+    }
+
+    # gains in channel order, IN 1-8 then OUT 1-8 (+4dBu preset)
+    DEFAULT_GAIN = [int(Glucid8824.PLUS4IN, 16)] * 8 + \
+                   [int(Glucid8824.PLUS4OUT, 16)] * 8
+
+    def __init__(self, instanceids=(0,), realtime=True, latency=0.0):
+        """Define the simulated units
+
+           instanceids - instance ids (0-7) of the units to simulate
+           realtime    - pace traffic like a 9600 baud link
+           latency     - extra processing time per command, in seconds
+        """
+        self.realtime = realtime
+        self.latency = latency
+        self.units = {}
+        for instanceid in instanceids:
+            if int(instanceid) < 0 or int(instanceid) > 7:
+                raise ValueError("instance id %s out of range" % instanceid)
+            self.units[int(instanceid)] = {
+                'state': dict(self.DEFAULT_STATE),
+                'gain': list(self.DEFAULT_GAIN),
+            }
+
+        # Get and Set command bytes mapped to the state they touch
+        self.commands = {}
+        for cmdkey, cmdbyte in Glucid8824.COMMANDSET_INT.items():
+            self.commands[cmdbyte] = 'Get' + cmdkey[3:]
+
+        self.master = None
+        self.slave = None
+        self.path = None
+        self.thread = None
+        self.running = False
+        self.frames = 0
+
+    def start(self):
+        """Open the pty, start answering on it and return its path.
+
+        The path is added to `Glucid8824.REGISTRY` so that
+        `Glucid8824(siface=path)` in this process expects replies.
+        """
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)
+        self.path = os.ttyname(self.slave)
+        Glucid8824.register_device(self.path, 'rs232')
+
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+        logging.info("Glucid8824Sim serving on %s", self.path)
+        return self.path
+
+    def stop(self):
+        """Stop answering and close the pty"""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        for fd in (self.master, self.slave):
+            if fd is not None:
+                os.close(fd)
+        self.master = self.slave = None
+        Glucid8824.unregister_device(self.path)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def gain_to_wire(self, gain):
+        """Reorder a channel ordered gain list the way the 8824 does"""
+        return gain[7::-1] + gain[15:7:-1]
+
+    def handle_frame(self, frame):
+        """Return the response to one request frame, or None if no
+        simulated unit would answer it
+        """
+        if (len(frame) < 8 or frame[0] != Glucid8824.STARTBYTE_INT or
+                frame[1:5] != Glucid8824.FRAMEHEADER):
+            logging.warning("Glucid8824Sim: ignoring bad frame %s", frame)
+            return None
+        unit = self.units.get(frame[5])
+        cmdbyte = frame[6]
+        key = self.commands.get(cmdbyte)
+        if unit is None or key is None:
+            return None
+        args = list(frame[7:-1])
+
+        if cmdbyte >= 0x60:
+            # a Get command
+            if key == 'GetAnalogGain':
+                payload = self.gain_to_wire(unit['gain'])
+            else:
+                payload = [unit['state'][key]]
+        else:
+            # a Set command; the unit echoes what it was sent
+            if key == 'GetAnalogGain':
+                if len(args) != 16:
+                    return None
+                unit['gain'] = self.gain_to_wire(args)
+            elif args:
+                unit['state'][key] = args[0]
+            payload = args
+
+        return (bytes([Glucid8824.STARTBYTE_INT]) + Glucid8824.FRAMEHEADER +
+                bytes([frame[5], Glucid8824.RESPONSEBYTE, cmdbyte]) +
+                bytes(payload) + bytes([Glucid8824.ENDBYTE_INT]))
+
+    def serve(self):
+        """Read request frames from the pty and answer them until
+        `stop` is called
+        """
+        rxbuf = bytearray()
+        # when the last received byte and the last sent byte
+        # would have finished crossing a 9600 baud link
+        rx_done = tx_done = time.monotonic()
+        while self.running:
+            ready, _, _ = select.select([self.master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                data = os.read(self.master, 4096)
+            except OSError:
+                break
+            now = time.monotonic()
+            rxbuf += data
+
+            while True:
+                end = rxbuf.find(Glucid8824.ENDBYTE_INT)
+                if end < 0:
+                    break
+                frame = bytes(rxbuf[:end + 1])
+                del rxbuf[:end + 1]
+                self.frames += 1
+                response = self.handle_frame(frame)
+
+                rx_done = max(rx_done, now) + len(frame) * self.BYTETIME
+                if response is None:
+                    continue
+                if self.realtime:
+                    start = max(rx_done + self.latency, tx_done)
+                    tx_done = start + len(response) * self.BYTETIME
+                    delay = tx_done - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                elif self.latency:
+                    time.sleep(self.latency)
+                os.write(self.master, response)
+
+
+def main():
+    """Run a simulator until interrupted"""
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "hvi:",
+                                   ["help", "verbose", "fast"])
+    except getopt.GetoptError as err:
+        print(err)
+        sys.exit(2)
+
+    instanceids = []
+    realtime = True
+    for o, a in opts:
+        if o in ("-h", "--help"):
+            print("Usage: glucidsim.py [-v] [-i ID]... [--fast]")
+            sys.exit(0)
+        elif o in ("-v", "--verbose"):
+            logging.basicConfig(level=logging.INFO)
+        elif o == "-i":
+            instanceids.append(int(a))
+        elif o == "--fast":
+            realtime = False
+
+    sim = Glucid8824Sim(instanceids or [0], realtime=realtime)
+    print("Simulating Lucid 8824 id(s) %s on %s" %
+          (', '.join('{:02}'.format(i) for i in sorted(sim.units)),
+           sim.start()))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        sim.stop()
+
+
+if __name__ == "__main__":
+    main()
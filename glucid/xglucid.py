@@ -19,6 +19,13 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import time
+# when we started, for the time to interactive reported by main
+STARTED = time.monotonic()
+
+import concurrent.futures
+import getopt
+import logging
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QPushButton,
                              QToolTip, QMessageBox, QGridLayout, QVBoxLayout,
@@ -28,7 +35,7 @@ from PyQt5.QtCore import QCoreApplication, Qt
 from PyQt5.QtGui import QIcon, QPixmap
 import sys
 import os
-from time import sleep
+import Glucid8824_rc
 import Glucid8824_UI
 from glucid8824 import Glucid8824
 import configparser
@@ -36,34 +43,51 @@ import serial.tools.list_ports as lsports
 
 CLEAN_NONEX_DEVICES=True
 
+DIP_ADVICE = "Recommended: ALL DIP switches down and Power Cycle your Lucid!"
+
+
+def available_ports():
+    """Return the serial ports on this system; slow on some
+    systems, so main runs it while the window is built
+    """
+    portlist = []
+    for i in lsports.comports():
+        portlist.append(i.device)
+
+    # pyserial doesn't recognize these
+    # and we need them...
+    portlist.append("/dev/tty.usbserial")
+    return portlist
+
+
 class xglucid(QtWidgets.QMainWindow, Glucid8824_UI.Ui_MainWindow):
     """xglucid is just a class to call the Qt MainWindow"""
-    def __init__(self):
+    def __init__(self, prune=True):
+        """prune - remove the serial ports not on this system
+                   now; main does it once available_ports() has
+                   run on another thread
+        """
         super(self.__class__, self).__init__()
+        Glucid8824_rc.qInitResources()
         self.setupUi(self)
+        self.centralwidget.bind_model()
         # load the default device from conf file
         currentdevice = Glucid8824.get_device_from_cfg()
         self.SerialPortCombo.setCurrentText(currentdevice)
         self.connection_label.setText("rs232")
+        if prune:
+            self.prune_ports(available_ports())
 
-
+    def prune_ports(self, portlist):
+        """Remove the SerialPortCombo items not in `portlist`"""
         # cleanup non-valid serial ports
         # from interface...
-        # first build a list of the ports
-        portlist = []
         allports = []
 
         #print("BEFORE: all devices:")
         for i in range(self.SerialPortCombo.count()):
             allports.append(self.SerialPortCombo.itemText(i))
         #print(allports)
-                
-        for i in lsports.comports():
-            portlist.append(i.device)
-
-        # pyserial doesn't recognize these
-        # and we need them...
-        portlist.append("/dev/tty.usbserial")
 
         # then remove the SerialPortCombo items that aren't there
         #print("On this system:")
@@ -78,25 +102,63 @@ class xglucid(QtWidgets.QMainWindow, Glucid8824_UI.Ui_MainWindow):
 
                 
         
+def usage():
+    print("Usage: xglucid [-v] [-r]")
+    print("  -r, --read     read the unit while starting")
+    print("  -v, --verbose  log what is sent, and the startup time")
+
+
 def main():
-    """call QApplication"""
+    """call QApplication
+
+    The splash is up only while the window is built and the serial
+    ports are listed (on another thread); with --read the unit is
+    also read in the background, the widgets filling in as its
+    values arrive.  The time from start to the first event handled
+    by the window is shown in the status bar.
+    """
     app = QApplication(sys.argv)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "hvr",
+                                   ["help", "verbose", "read"])
+    except getopt.GetoptError as err:
+        print(err)
+        usage()
+        sys.exit(2)
+    prefetch = False
+    for o, a in opts:
+        if o in ("-h", "--help"):
+            usage()
+            sys.exit(0)
+        elif o in ("-v", "--verbose"):
+            logging.basicConfig(level=logging.INFO)
+        elif o in ("-r", "--read"):
+            prefetch = True
+
+    Glucid8824_rc.qInitResources()
     splashmap = QPixmap(":/newPrefix/glucidSplash.png")
     splash = QSplashScreen(splashmap, QtCore.Qt.WindowStaysOnTopHint)
     splash.show()
-    splash.showMessage("<center><h1>Recommended: ALL DIP switches down and Power Cycle your Lucid!</h1></center>")
+    splash.showMessage("<center><h1>%s</h1></center>" % DIP_ADVICE)
     app.processEvents()
-    timer = QtCore.QElapsedTimer()
-    timer.start()
 
-    while timer.elapsed() < 4000 :
-        app.processEvents()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        ports = pool.submit(available_ports)
+        form = xglucid(prune=False)
+        form.prune_ports(ports.result())
+    if prefetch:
+        form.centralwidget.set_ui_from_lucid()
 
-
-    form = xglucid()
     form.show()
-
     splash.finish(form)
+
+    def interactive():
+        elapsed = time.monotonic() - STARTED
+        logging.info("xglucid: interactive after %.3f s", elapsed)
+        if not prefetch:
+            form.statusBar().showMessage("Ready in %.2f s.  %s" %
+                                         (elapsed, DIP_ADVICE))
+    QtCore.QTimer.singleShot(0, interactive)
     app.exec_()
 
 # if we wish to run from CLI without package
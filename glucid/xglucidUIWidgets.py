@@ -21,27 +21,336 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """
+import logging
+import threading
+import time
 import xglucidUIWidgets
-from glucid8824 import Glucid8824
-from PyQt5.QtCore import QCoreApplication
+import glucidcues
+from glucid8824 import Glucid8824, DeviceState
+from PyQt5.QtCore import (QCoreApplication, QObject, QThread, pyqtSignal,
+                          pyqtSlot)
 from PyQt5.QtGui import QPainter, QColor, QFont
-from PyQt5.QtWidgets import (QWidget, QLabel, QSlider, QComboBox,
-                             QCheckBox, QPushButton)
+from PyQt5.QtWidgets import QWidget, QLabel, QSlider
+
+# channels 0-7 are IN 1-8 and 8-15 OUT 1-8
+LINK_STEREO = tuple((ch, ch + 1) for ch in range(0, 16, 2))
+
+
+def parse_link_groups(text):
+    """Parse slider link groups as kept in the config: 'stereo',
+    or lists of channels separated by ';' such as
+    'in1,in2;out1-out8'.  Raises ValueError.
+    """
+    if text.strip().lower() == 'stereo':
+        return [list(group) for group in LINK_STEREO]
+    return [glucidcues.parse_channels(group.strip())
+            for group in text.split(';') if group.strip()]
+
+
+class xglucidWorker(QObject):
+    """xglucidWorker owns the Glucid8824 of an xglucidWidget and
+    does all of its serial I/O on a QThread of its own, so a slow
+    or missing unit never blocks repainting or input.  Requests
+    arrive as queued signals and results go back as signals.
+    """
+    # a message for the status bar
+    progress = pyqtSignal(str)
+    # the name of a DeviceSnapshot field and its value, as soon as
+    # the unit has answered for it
+    field_read = pyqtSignal(str, object)
+    # the DeviceSnapshot read, or None on failure
+    read_done = pyqtSignal(object)
+    # True if the write succeeded
+    write_done = pyqtSignal(bool)
+
+    def __init__(self, lucid):
+        super().__init__()
+        self.lucid = lucid
+        # state changed live and not yet written, see queue_live
+        self.live_lock = threading.Lock()
+        self.live_pending = {}
+        # when the link has finished carrying the last live write
+        self.link_free = 0.0
+
+    def open_session(self):
+        """Hold the serial port open across reads and writes, so
+        only the first one pays for opening it
+        """
+        if self.lucid.sessions:
+            return self.lucid.connect()
+        return self.lucid.begin_session()
+
+    @pyqtSlot(object)
+    def set_lucid(self, lucid):
+        """Close the current unit and use `lucid` from now on"""
+        self.lucid.end_session()
+        self.lucid = lucid
+
+    @pyqtSlot(bool)
+    def read(self, fresh):
+        """Read every field of the unit with one pipelined write,
+        sending each field back as soon as its response is parsed.
+        With `fresh` nothing is taken from the state cache.
+        """
+        lucid = self.lucid
+        try:
+            if not self.open_session():
+                self.progress.emit("FAILED to connect using %s" %
+                                   lucid.get_iface())
+                self.read_done.emit(None)
+                return
+            if fresh:
+                lucid.state.invalidate()
+            self.progress.emit("Connected using %s and reading DATA..." %
+                               lucid.get_iface())
+            payloads = lucid.read_values(lucid.READ_ALL, self.received)
+            snapshot = lucid.make_snapshot(payloads)
+        except Exception:
+            logging.exception("xglucid: read failed")
+            snapshot = False
+        if not snapshot:
+            self.progress.emit("FAILED reading DATA using %s" %
+                               lucid.get_iface())
+            self.read_done.emit(None)
+            return
+        self.read_done.emit(snapshot)
+
+    def received(self, cmdkey, payload):
+        """Emit field_read for each field in the response `payload`
+        to the Get command `cmdkey`
+        """
+        if payload is True or not payload:
+            return
+        for name, value in self.decode(cmdkey, payload):
+            self.field_read.emit(name, value)
+
+    @staticmethod
+    def decode(cmdkey, payload):
+        """Return the (field name, value) pairs in the response
+        `payload` to the Get command `cmdkey`
+        """
+        if cmdkey == 'GetMode':
+            return [('meter', payload[0] & 3),
+                    ('dig1', (payload[0] >> 2) & 1)]
+        if cmdkey == 'GetAnalogGain':
+            if len(payload) != 16:
+                return []
+            gains = list(payload)
+            # the lucid reverses this 8..1 8..1
+            return [('gain', gains[7::-1] + gains[15:7:-1])]
+        return [(DeviceState.FIELDS[cmdkey], payload[0])]
+
+    @pyqtSlot(object, object)
+    def write(self, desired, conf):
+        """Bring the unit to the state `desired` with apply_state
+        and, if that works, save the config entries in `conf`
+        """
+        lucid = self.lucid
+        try:
+            if not self.open_session():
+                self.progress.emit(
+                    "ERROR: Unable to connect to %s id %s to write DATA" %
+                    (lucid.get_iface(), lucid.get_instanceid()))
+                self.write_done.emit(False)
+                return
+            self.progress.emit("Connected using %s id: %s and writing "
+                               "DATA..." % (lucid.get_iface(),
+                                            lucid.get_instanceid()))
+            if lucid.apply_state(desired) is False:
+                self.progress.emit("FAILED writing DATA using %s" %
+                                   lucid.get_iface())
+                self.write_done.emit(False)
+                return
+            for key, value in conf.items():
+                lucid.glucidconf['DEFAULT'][key] = value
+            lucid.save_latency_profile()
+            lucid.write_configfile()
+        except Exception:
+            logging.exception("xglucid: write failed")
+            self.progress.emit("FAILED writing DATA using %s" %
+                               lucid.get_iface())
+            self.write_done.emit(False)
+            return
+        self.progress.emit("Finished Writing DATA")
+        self.write_done.emit(True)
+
+    def queue_live(self, desired):
+        """Merge the state `desired` into the live changes waiting
+        to be written; called from the main thread.  Returns True
+        if none were waiting, so write_live must be requested.
+        """
+        with self.live_lock:
+            idle = not self.live_pending
+            self.live_pending.update(desired)
+        return idle
+
+    @pyqtSlot()
+    def write_live(self):
+        """Write the live changes until none are waiting.
+
+        Changes made while a write is on the wire replace the
+        waiting values rather than queue behind them, so a slider
+        drag becomes one SetAnalogGain per round trip with the
+        latest gains, and the unit never falls behind the controls.
+        Writes are also spaced by the time the 9600 baud link needs
+        to carry them, for units that do not reply.
+        """
+        lucid = self.lucid
+        while True:
+            with self.live_lock:
+                desired, self.live_pending = self.live_pending, {}
+            if not desired:
+                return
+            delay = self.link_free - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                if not self.open_session():
+                    self.progress.emit("FAILED to connect using %s" %
+                                       lucid.get_iface())
+                    continue
+                plan = lucid.apply_state(desired)
+            except Exception:
+                logging.exception("xglucid: live write failed")
+                plan = False
+            if plan is False:
+                self.progress.emit("FAILED writing DATA using %s" %
+                                   lucid.get_iface())
+                continue
+            # each frame is its arguments plus 8 bytes of framing
+            wire = sum(len(args) + 8 for cmdkey, args in plan)
+            self.link_free = time.monotonic() + wire * 10.0 / lucid.baud
+
+    @pyqtSlot()
+    def close(self):
+        """Close the unit and stop the worker's thread"""
+        try:
+            self.lucid.end_session()
+        finally:
+            QThread.currentThread().quit()
+
+
+class DeviceModel(QObject):
+    """The state of a Lucid 8824 as xglucid shows it: the fields
+    of a DeviceSnapshot, set from the unit or by the user.  A
+    change signal is sent only for values that actually change,
+    so the widgets bound to the model are only touched then.
+    """
+    FIELDS = ('sync', 'meter', 'dig1', 'opt_src', 'analog_src', 'aes_src')
+
+    # the name of a field in FIELDS and its new value
+    field_changed = pyqtSignal(str, object)
+    # channel: gain of the gains that changed, as the integers the
+    # 8824 uses (dB + 96)
+    gains_changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = dict.fromkeys(self.FIELDS)
+        # in channel order, IN 1-8 then OUT 1-8
+        self.gains = [None] * 16
+
+    def set_field(self, name, value):
+        """Set the field `name` to `value`"""
+        if self.values[name] != value:
+            self.values[name] = value
+            self.field_changed.emit(name, value)
+
+    def set_gains(self, gains):
+        """Set the gains from a list of 16 in channel order or a
+        dictionary of channel: gain
+        """
+        if not isinstance(gains, dict):
+            gains = dict(enumerate(gains))
+        changed = {}
+        for ch, gain in gains.items():
+            if self.gains[ch] != gain:
+                self.gains[ch] = gain
+                changed[ch] = gain
+        if changed:
+            self.gains_changed.emit(changed)
+
+    def state(self):
+        """The known values as a state for apply_state"""
+        # NOTE: SETTING AES DOES NOT APPEAR TO WORK
+        # so the AES source is left alone
+        state = {name: value for name, value in self.values.items()
+                 if value is not None and name != 'aes_src'}
+        if None not in self.gains:
+            state['gain'] = list(self.gains)
+        return state
+
 
 class xglucidWidget(QWidget):
     """xglucidWidget extends QWidget to provide custom signals
     and slots fo the glucid interface
     """
+    # queued to the xglucidWorker on its thread
+    read_requested = pyqtSignal(bool)
+    write_requested = pyqtSignal(object, object)
+    live_requested = pyqtSignal()
+    lucid_changed = pyqtSignal(object)
+    close_requested = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         QWidget.__init__(self, parent)
 
         self.InputSliders = []
         self.OutputSliders = []
-
+        # all 16 sliders and their labels, in channel order
+        self.sliders = []
+        self.labels = []
+        # field name -> combo showing it, and back
+        self.combos = {}
+        self.comboFields = {}
+        # not our child: disable_all_except_comm walks our children
+        self.model = DeviceModel()
+
+        # the worker owns myLucid; the main thread only asks it
+        # for its interface and id
         self.myLucid = Glucid8824()
         self.myLucid.set_device_from_configfile()
+        # groups of channels whose sliders move together, besides
+        # the IN and OUT groups of LinkInCh and LinkOutCh
+        self.linkGroups = []
+        try:
+            self.set_link_groups(parse_link_groups(
+                self.myLucid.glucidconf['DEFAULT'].get('LINKGROUPS', '')))
+        except ValueError as ve:
+            logging.error("xglucid: bad LINKGROUPS: %s", ve)
+        self.start_worker()
         self.initUI()
+
+    def start_worker(self):
+        """Start the xglucidWorker doing our serial I/O on its
+        own thread
+        """
+        # not our child: disable_all_except_comm walks our children
+        self.ioThread = QThread()
+        self.worker = xglucidWorker(self.myLucid)
+        self.worker.moveToThread(self.ioThread)
+        self.read_requested.connect(self.worker.read)
+        self.write_requested.connect(self.worker.write)
+        self.live_requested.connect(self.worker.write_live)
+        self.lucid_changed.connect(self.worker.set_lucid)
+        self.close_requested.connect(self.worker.close)
+        self.worker.progress.connect(self.show_status)
+        self.worker.field_read.connect(self.on_field_read)
+        self.worker.read_done.connect(self.on_read_done)
+        self.worker.write_done.connect(self.on_write_done)
+        self.ioThread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.stop_worker)
+
+    def stop_worker(self):
+        """Close the unit and wait for the worker's thread"""
+        if self.ioThread.isRunning():
+            self.close_requested.emit()
+            self.ioThread.wait()
+
+    def show_status(self, message):
+        """Show `message` in the status bar"""
+        self.parent().statusBar().showMessage(message)
         
     def initUI(self):
         """set geometry and title, call show()"""
@@ -56,10 +365,49 @@ class xglucidWidget(QWidget):
         """Deprecated: `Needs write` written to status bar"""
         self.parent().statusBar().showMessage('Need to Write to the Device')
 
+    def bind_model(self):
+        """Bind `model` to the widgets, once the main window has
+        built them: each change of the model sets the one widget
+        showing it
+        """
+        if self.combos:
+            return
+        self.make_sliders()
+        self.combos = {
+            'sync': self.parent().LucidSyncCombo,
+            'meter': self.parent().LucidMeterCombo,
+            'dig1': self.parent().LucidSpdifCombo,
+            'opt_src': self.parent().LucidOpticalCombo,
+            'analog_src': self.parent().LucidAnalogSrcCombo,
+            'aes_src': self.parent().LucidAesCombo,
+        }
+        self.comboFields = {combo: name
+                            for name, combo in self.combos.items()}
+        self.model.field_changed.connect(self.show_field)
+        self.model.gains_changed.connect(self.show_gains)
+
+    def show_field(self, name, value):
+        """Show the field `name` of the model in its combo, without
+        signalling a change by the user
+        """
+        combo = self.combos[name]
+        combo.blockSignals(True)
+        combo.setCurrentIndex(value)
+        combo.blockSignals(False)
+
+    def show_gains(self, gains):
+        """Show the channel: gain of the model in `gains` on the
+        sliders
+        """
+        self.set_sliders({ch: gain - 96 for ch, gain in gains.items()})
+
     def make_sliders(self):
-        """Build lists `InputSliders` and `OutputSliders`.  This is
+        """Build lists `InputSliders` and `OutputSliders`, and
+        `sliders` and `labels` of all 16 channels, once.  This is
         a convenience function so these sliders can be linked together
         """
+        if self.sliders:
+            return
         self.InputSliders = [
             self.parent().SliderIN_1,
             self.parent().SliderIN_2,
@@ -80,29 +428,115 @@ class xglucidWidget(QWidget):
             self.parent().SliderOUT_7,
             self.parent().SliderOUT_8,
         ]
+        self.sliders = self.InputSliders + self.OutputSliders
+        self.labels = [
+            self.parent().labelIN_1,
+            self.parent().labelIN_2,
+            self.parent().labelIN_3,
+            self.parent().labelIN_4,
+            self.parent().labelIN_5,
+            self.parent().labelIN_6,
+            self.parent().labelIN_7,
+            self.parent().labelIN_8,
+            self.parent().labelOUT_1,
+            self.parent().labelOUT_2,
+            self.parent().labelOUT_3,
+            self.parent().labelOUT_4,
+            self.parent().labelOUT_5,
+            self.parent().labelOUT_6,
+            self.parent().labelOUT_7,
+            self.parent().labelOUT_8,
+        ]
+
+    def set_link_groups(self, groups):
+        """Link the sliders of each group of channels (0-7 IN 1-8,
+        8-15 OUT 1-8) in `groups`, such as LINK_STEREO
+        """
+        for group in groups:
+            for ch in group:
+                if int(ch) < 0 or int(ch) > 15:
+                    raise ValueError("bad channel %s" % ch)
+        self.linkGroups = [[int(ch) for ch in group] for group in groups]
+
+    def linked_channels(self, channel):
+        """Return the other channels whose sliders move with the
+        slider of `channel`
+        """
+        linked = set()
+        if channel < 8 and self.parent().LinkInCh.isChecked():
+            linked.update(range(0, 8))
+        elif channel >= 8 and self.parent().LinkOutCh.isChecked():
+            linked.update(range(8, 16))
+        for group in self.linkGroups:
+            if channel in group:
+                linked.update(group)
+        linked.discard(channel)
+        return sorted(linked)
+
+    def set_sliders(self, values):
+        """Set the sliders of the channels in the dictionary
+        `values` in one batch: their signals are blocked, so nothing
+        cascades, and each label is updated once
+        """
+        self.make_sliders()
+        for ch, value in values.items():
+            slider = self.sliders[ch]
+            slider.blockSignals(True)
+            slider.setValue(value)
+            slider.blockSignals(False)
+            self.labels[ch].set_value(slider.value())
 
     def on_glucid_slider_changed(self, value):
-        """when a slider is changed, we check
-        if the linked box is checked, and if so
-        we set the values of other sliders...
+        """when a slider is changed by the user, we
+        set its gain and those of the sliders linked
+        to it in the model, which moves the linked
+        sliders without signalling again, and in live
+        mode write the gains once for the whole group
+        """
+        channel = self.sliders.index(self.sender())
+        channels = [channel] + self.linked_channels(channel)
+        self.model.set_gains({ch: value + 96 for ch in channels})
+        if self.is_live():
+            self.send_live({'gain': list(self.model.gains)})
+
+    def is_live(self):
+        """True if changes go to the unit as they are made"""
+        return self.parent().LiveCheck.isChecked()
+
+    def send_live(self, desired):
+        """Have the worker write the state `desired` now, merged
+        with any live changes still waiting
+        """
+        if self.worker.queue_live(desired):
+            self.live_requested.emit()
 
-        this may be better in a slider class
-        as a slot routine...
+    def on_live_toggled(self, checked):
+        """Live mode was switched on or off; switching it on brings
+        the unit to what the widgets show
         """
-        
-        changed_slider = self.sender()
-        self.make_sliders()
+        if checked:
+            self.parent().statusBar().showMessage(
+                "LIVE: changes are written as they are made")
+            self.send_live(self.model.state())
+        else:
+            self.parent().statusBar().showMessage(
+                "Changes are written with WRITE")
 
-        if (changed_slider in self.InputSliders and
-            self.parent().LinkInCh.isChecked()):
-            for sl in self.InputSliders:
-                if sl is not changed_slider:
-                    sl.setValue(value)
-        if (changed_slider in self.OutputSliders and
-        self.parent().LinkOutCh.isChecked()):
-            for sl in self.OutputSliders:
-                if sl is not changed_slider:
-                    sl.setValue(value)
+    def on_combo_changed(self, index):
+        """The user changed a combo: set its field in the model
+        and, in live mode, write it
+        """
+        name = self.comboFields[self.sender()]
+        self.model.set_field(name, index)
+        if not self.is_live():
+            return
+        if name in ('meter', 'dig1'):
+            # both halves of the mode register, so no GetMode is
+            # needed to change one of them
+            self.send_live({'meter': self.model.values['meter'],
+                            'dig1': self.model.values['dig1']})
+        else:
+            self.send_live({name: index})
 
     def on_serial_port_changed(self, value):
         """Declare a new Glucid8824 object with the 
@@ -110,6 +544,7 @@ class xglucidWidget(QWidget):
         """
         # TODO: implement set_iface in glucid?
         self.myLucid = Glucid8824(siface=value)
+        self.lucid_changed.emit(self.myLucid)
         self.disable_all_except_comm()
 
     def on_device_id_changed(self, value):
@@ -149,381 +584,127 @@ class xglucidWidget(QWidget):
             i.setEnabled(True)
 
     def read_button_clicked(self):
-        """The read button was clicked, if successful set all
-        widgets to proper values, otherwise reflect the failure
-        in the status bar
-        """
-        try:
-            # we only connect to check connectivity, then close
-            if self.myLucid.connect():
-                self.parent().statusBar().showMessage("Connected using %s" %
-                                                      self.myLucid.get_iface())
-                self.myLucid.disconnect()
-                self.set_ui_from_lucid()
-            else:
-                self.parent().statusBar().showMessage(
-                    "FAILED to connect using %s" %
-                    self.myLucid.get_iface())
-        except:
-            self.parent().statusBar().showMessage("Connection FAILED: %s" %
-                                                      self.myLucid.get_iface())
-            self.disable_all_except_comm()
- 
-            
-    def set_ui_from_lucid(self):
-        """Given we are connected to a lucid, set all UI values 
-        by reading each individually from the lucid, setting the
-        widget value, and enabling the widget
+        """The read button was clicked: read what the unit has now,
+        setting each widget as its value arrives, or reflect the
+        failure in the status bar
         """
+        self.set_ui_from_lucid(fresh=True)
 
+    def set_ui_from_lucid(self, fresh=False):
+        """Ask the worker to read all values from the lucid; each
+        widget is set and enabled by on_field_read as its value
+        arrives, and the rest by on_read_done
+        """
         self.disable_all_except_comm()
-        # make sure disconnecting first
-        self.myLucid.disconnect()
-        if self.myLucid.connect():
-            self.parent().statusBar().showMessage(
-                "Connected using %s and reading DATA..." %
-                self.myLucid.get_iface())
-        else:
-            return -1
-
-        QCoreApplication.processEvents()
-        # Set Clock Sync
-        self.parent().statusBar().showMessage(
-            "Connected using %s and reading Clock Sync..." %
-            self.myLucid.get_iface())
-
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidSyncCombo"
-        ).setCurrentIndex(self.myLucid.get_sync_source(False))
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidSyncCombo"
-        ).setEnabled(True)
-
-        # set device_id
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidIdCombo"
-        ).setCurrentIndex(int(self.myLucid.get_instanceid()))
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidIdCombo"
-        ).setEnabled(True)
-
-        # set Metering
-        self.parent().statusBar().showMessage(
-            "Connected using %s and reading Front Meter..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidMeterCombo"
-        ).setCurrentIndex(self.myLucid.get_meter(False))
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidMeterCombo"
-        ).setEnabled(True)
-        QCoreApplication.processEvents()
-        # set optical out
-        self.parent().statusBar().showMessage(
-            "Connected using %s and reading ADAT OUT source..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidOpticalCombo"
-        ).setCurrentIndex(self.myLucid.get_opt_source(False))
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidOpticalCombo"
-        ).setEnabled(True)
-
-        # set AES out
-        # NOTE: SETTING AES DOES NOT APPEAR TO WORK
-        self.parent().statusBar().showMessage(
-            "%s : reading AES OUT source... WARNING: READ-ONLY Value" %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidOpticalCombo"
-        ).setCurrentIndex(self.myLucid.get_opt_source(False))
-        # Leave disabled because you cannot set this BUG
-        # self.parent().centralwidget.findChild(QComboBox,
-        #                            "LucidOpticalCombo").setEnabled(True)
-
-        # set anlog out src
-        self.parent().statusBar().showMessage(
-            "Connected using %s and reading Analog OUT source..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidAnalogSrcCombo"
-        ).setCurrentIndex(self.myLucid.get_analog_source(False))
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidAnalogSrcCombo"
-        ).setEnabled(True)
-
-        # set digital in 1,2
+        self.parent().LucidReadButton.setEnabled(False)
         self.parent().statusBar().showMessage(
-            "Connected using %s and reading Digital Ch 1,2 source..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidSpdifCombo"
-        ).setCurrentIndex(self.myLucid.get_dig1(False))
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidSpdifCombo"
-        ).setEnabled(True)
+            "Connecting using %s..." % self.myLucid.get_iface())
+        self.read_requested.emit(fresh)
 
-        # set deviceId
-        self.parent().statusBar().showMessage(
-            "Connected using %s and reading DEVICE ID..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidIdCombo"
-        ).setCurrentIndex(int(self.myLucid.get_instanceid()))
+    def on_field_read(self, name, value):
+        """Set the field `name` read from the unit in the model,
+        and enable the widgets showing it
+        """
+        if name == 'gain':
+            self.model.set_gains(value)
+            for slider in self.sliders:
+                slider.setEnabled(True)
+        else:
+            self.model.set_field(name, value)
+            # Leave the AES source disabled because you cannot set
+            # this BUG
+            if name != 'aes_src':
+                self.combos[name].setEnabled(True)
+
+    def on_read_done(self, snapshot):
+        """The worker has read the unit into `snapshot`, or None if
+        it failed; enable the rest of the widgets
+        """
+        self.parent().LucidReadButton.setEnabled(True)
+        if snapshot is None:
+            self.disable_all_except_comm()
+            return
 
-        self.parent().centralwidget.findChild(
-            QComboBox, "LucidIdCombo").setEnabled(True)
+        # set deviceId
+        self.parent().LucidIdCombo.setCurrentIndex(int(snapshot.instanceid))
+        self.parent().LucidIdCombo.setEnabled(True)
 
-        # set input and output sliders
-        self.parent().statusBar().showMessage(
-            "Connected using %s and reading Channel Levels..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        
         # turn on other buttons...
-        self.parent().centralwidget.findChild(
-            QCheckBox, "LinkInCh").setEnabled(True)
-        self.parent().centralwidget.findChild(
-            QCheckBox, "LinkOutCh").setEnabled(True)
-        self.parent().centralwidget.findChild(
-            QCheckBox, "LinkInCh").setCheckState(False)
-            #QCheckBox, "LinkInCh").setCheckState(self.myLucid.is_in_linked())
-        self.parent().centralwidget.findChild(
-            QCheckBox, "LinkOutCh").setCheckState(False)
-            #QCheckBox, "LinkOutCh").setCheckState(self.myLucid.is_out_linked())
-
-        self.myLucid.get_gain()
-
-        # we can disconnect here:
-        self.myLucid.disconnect()
-        
-        self.make_sliders()
-        
-        for i in range(0, 8):
-            instr = "SliderIN_"+str(i+1)
-            outstr = "SliderOUT_"+str(i+1)
-
-            self.parent().centralwidget.findChild(
-                QSlider, instr).setEnabled(True)
-            self.parent().centralwidget.findChild(
-                QSlider, outstr).setEnabled(True)
-
-            # hack to get all labels to redraw no matter previous val
-            # wont work if previous value was -95... ok... that's silent
-            self.parent().centralwidget.findChild(QSlider, instr).setValue(
-                -95)
-            self.parent().centralwidget.findChild(QSlider, outstr).setValue(
-                -95)
-            # set to gainlist values
-            self.parent().centralwidget.findChild(QSlider, instr).setValue(
-                int(self.myLucid.gainlist[i]-96))
-            self.parent().centralwidget.findChild(QSlider, outstr).setValue(
-                int(self.myLucid.gainlist[i+8]-96))
-
-
-
-        self.parent().centralwidget.findChild(
-            QPushButton, "ProINButton").setEnabled(True)
-        self.parent().centralwidget.findChild(
-            QPushButton, "ProOUTButton").setEnabled(True)
-        self.parent().centralwidget.findChild(
-            QPushButton, "ConINButton").setEnabled(True)
-        self.parent().centralwidget.findChild(
-            QPushButton, "ConOUTButton").setEnabled(True)
-        self.parent().centralwidget.findChild(
-            QPushButton, "LucidWriteButton").setEnabled(True)
+        self.parent().LinkInCh.setEnabled(True)
+        self.parent().LinkOutCh.setEnabled(True)
+        self.parent().LinkInCh.setCheckState(False)
+        #self.parent().LinkInCh.setCheckState(self.myLucid.is_in_linked())
+        self.parent().LinkOutCh.setCheckState(False)
+        #self.parent().LinkOutCh.setCheckState(self.myLucid.is_out_linked())
+
+        self.parent().ProINButton.setEnabled(True)
+        self.parent().ProOUTButton.setEnabled(True)
+        self.parent().ConINButton.setEnabled(True)
+        self.parent().ConOUTButton.setEnabled(True)
+        self.parent().LucidWriteButton.setEnabled(True)
+        self.parent().LiveCheck.setEnabled(True)
         self.parent().statusBar().showMessage("Finished Reading DATA")
-        QCoreApplication.processEvents()
-        # make sure to disconnect
-
 
-        
     def pro_or_consumer_clicked(self):
         """a slot to handle when a user clicks the +4 or -10 buttons"""
-        # There's a bug here
-        # if the first Slider is already the correct
-        # value, no update is triggered.
-        # This should be reimplemented in the slider class
-        # so that sliders themselves have a slot that listens
-        # to the buttons signal.
-        if self.sender().objectName() == "ProOUTButton":
-            self.parent().centralwidget.findChild(
-                QCheckBox, "LinkOutCh").setCheckState(True)
-            self.parent().centralwidget.findChild(
-                QSlider, "SliderOUT_1").setValue(1)
-        elif self.sender().objectName() == "ConOUTButton":
-            self.parent().centralwidget.findChild(
-                QCheckBox, "LinkOutCh").setCheckState(True)
-            self.parent().centralwidget.findChild(
-                QSlider, "SliderOUT_1").setValue(-11)
-        elif self.sender().objectName() == "ProINButton":
-            self.parent().centralwidget.findChild(
-                QCheckBox, "LinkInCh").setCheckState(True)
-            self.parent().centralwidget.findChild(
-                QSlider, "SliderIN_1").setValue(-8)
-        elif self.sender().objectName() == "ConINButton":
-            self.parent().centralwidget.findChild(
-                QCheckBox, "LinkInCh").setCheckState(True)
-            self.parent().centralwidget.findChild(
-                QSlider, "SliderIN_1").setValue(4)
+        # button -> link box, channels, gain in dB
+        presets = {
+            "ProOUTButton": ("LinkOutCh", range(8, 16), 1),
+            "ConOUTButton": ("LinkOutCh", range(8, 16), -11),
+            "ProINButton": ("LinkInCh", range(0, 8), -8),
+            "ConINButton": ("LinkInCh", range(0, 8), 4),
+        }
+        link, channels, value = presets[self.sender().objectName()]
+        getattr(self.parent(), link).setCheckState(True)
+        self.model.set_gains({ch: value + 96 for ch in channels})
+        if self.is_live():
+            self.send_live({'gain': list(self.model.gains)})
 
     def write_ui_to_lucid(self):
-        """Given we are connected to a lucid, write all UI values to it
-        
-        We write all values, and not just updated ones because
-        something may have changed on the unit since we last read them
-        and writing what the user sees would be the most predictable 
-        behavoir
-
-        however, it's slow.
+        """Ask the worker to write the UI values to the lucid
+
+        apply_state compares what the user sees with the values
+        cached in the lucid's state and only sends the commands
+        that change something.  Values the UI gives in full are not
+        read again when they are not cached: they are written
+        outright, which costs the same round trip.  on_write_done
+        reports the result.
         """
         self.disable_all_except_comm()
-        # make sure diconnected first...
-        self.myLucid.disconnect()
-
-        if self.myLucid.connect():
-            self.parent().statusBar().showMessage(
-                "Connected using %s id: %s and writing DATA..." %
-                (self.myLucid.get_iface(),
-                 self.myLucid.get_instanceid()) )
-            QCoreApplication.processEvents()
-            self.myLucid.glucidconf['DEFAULT']['Device']=self.myLucid.get_iface()
-            self.myLucid.glucidconf['DEFAULT']['DEVICE_ID']=self.myLucid.get_instanceid()
-        else:
-            self.parent().statusBar().showMessage(
-                "ERROR: Unable to connect to %s id %s to write DATA" %
-                (self.myLucid.get_iface(),
-                 self.myLucid.get_instancid()))            
-            return -1
-        
-        
-        # Set Clock Sync
-        self.parent().statusBar().showMessage(
-            "Connected using %s and writing Clock Sync..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.myLucid.set_sync_source(
-            self.parent().centralwidget.findChild(
-                QComboBox, "LucidSyncCombo").currentIndex())
-
-
-
-        # # set Metering
-        # self.parent().statusBar().showMessage(
-        #     "Connected using %s and writing Front Meter..." %
-        #     self.myLucid.get_iface())
-        # self.myLucid.set_meter(
-        #     self.parent().centralwidget.findChild(
-        #         QComboBox, "LucidMeterCombo").currentIndex())
-
-        # # set digital in 1,2
-        # self.parent().statusBar().showMessage(
-        #     "Connected using %s and writing Digital Ch 1,2 source..." %
-        #     self.myLucid.get_iface())
-
-        # self.myLucid.set_dig1(
-        #     self.parent().centralwidget.findChild(
-        #         QComboBox, "LucidSpdifCombo").currentIndex())
-
-        ### Updated to use set_meter_and_dig1
-        self.parent().statusBar().showMessage(
-            "Connected using %s and writing mode..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.myLucid.set_meter_and_dig1(
-            (4 * self.parent().centralwidget.findChild(
-                QComboBox, "LucidSpdifCombo").currentIndex()) +
-            self.parent().centralwidget.findChild(
-                QComboBox, "LucidMeterCombo").currentIndex())
-        
-        # set optical out
-        self.parent().statusBar().showMessage(
-            "Connected using %s and writing ADAT OUT source..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.myLucid.set_opt_src(
-            self.parent().centralwidget.findChild(
-                QComboBox, "LucidOpticalCombo").currentIndex())
-
-        # set AES out
-        # NOTE: SETTING AES DOES NOT APPEAR TO WORK
-        #
-
-        # set anlog out src
-        self.parent().statusBar().showMessage(
-            "Connected using %s and writing Analog OUT source..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        self.myLucid.set_analog_src(
-            self.parent().centralwidget.findChild(
-                QComboBox, "LucidAnalogSrcCombo").currentIndex())
-
+        self.parent().LucidReadButton.setEnabled(False)
 
+        conf = {
+            'Device': self.myLucid.get_iface(),
+            'DEVICE_ID': self.myLucid.get_instanceid(),
+        }
         # save state of sliders, if they are linked
-        if self.parent().centralwidget.findChild(QCheckBox, "LinkInCh").isChecked():
-            self.myLucid.glucidconf['DEFAULT']['LINKINCH']='1'
+        if self.parent().LinkInCh.isChecked():
+            conf['LINKINCH'] = '1'
         else:
-            self.myLucid.glucidconf['DEFAULT']['LINKINCH']='0'
+            conf['LINKINCH'] = '0'
 
-        if self.parent().centralwidget.findChild(QCheckBox, "LinkOutCh").isChecked():
-            self.myLucid.glucidconf['DEFAULT']['LINKOUTCH']='1'
+        if self.parent().LinkOutCh.isChecked():
+            conf['LINKOUTCH'] = '1'
         else:
-            self.myLucid.glucidconf['DEFAULT']['LINKOUTCH']='0'
-            
-            
-        # set input and output sliders
-        self.parent().statusBar().showMessage(
-            "Connected using %s and writing Channel Levels..." %
-            self.myLucid.get_iface())
-        QCoreApplication.processEvents()
-        for i in range(1, 9):
-            self.myLucid.update_channel_in_gainlist(
-                self.parent().centralwidget.findChild(
-                    QSlider, "SliderIN_"+str(i)).value(), i-1
-            )
-            self.myLucid.update_channel_in_gainlist(
-                self.parent().centralwidget.findChild(
-                    QSlider, "SliderOUT_"+str(i)).value(), i+7
-            )
-
-        self.myLucid.write_gainlist_to_lucid()
-        
-        self.parent().statusBar().showMessage("Finished Writing DATA")
-        QCoreApplication.processEvents()
-        # windows fails without disconnecting first
-        self.myLucid.disconnect()
-        self.myLucid.write_configfile()
+            conf['LINKOUTCH'] = '0'
+
+        self.write_requested.emit(self.model.state(), conf)
 
+    def on_write_done(self, ok):
+        """The worker has finished writing to the unit"""
         # instead of setting the ui from the lucid,
         # which takes awhile...  let's leave the UI
         # alone but disabled, causing the user to click
         # 'read' again.
-        self.disable_all_except_comm()
-        #self.set_ui_from_lucid()
-        return 1
+        self.parent().LucidReadButton.setEnabled(True)
+        if not ok:
+            self.parent().statusBar().showMessage("ERROR: Failed to write")
 
     def write_button_clicked(self):
-        """The write button was clicked, if successful set all
-        widgets to proper values, otherwise reflect the failure
-        in the status bar
+        """The write button was clicked: write the widget values to
+        the unit, reflecting a failure in the status bar
         """
-        self.disable_all_except_comm()
-
-        if self.myLucid.connect():
-            self.parent().statusBar().showMessage("Connected using %s" %
-                                                  self.myLucid.get_iface())
-            if self.write_ui_to_lucid() < 0:
-                self.parent().statusBar().showMessage("ERROR: Failed to write")
-        else:
-            self.parent().statusBar().showMessage("FAILED to connect using %s" %
-                                                  self.myLucid.get_iface())
+        self.write_ui_to_lucid()
 
 
 class xglucidLabel(QLabel):
@@ -533,17 +714,18 @@ class xglucidLabel(QLabel):
         super().__init__(parent)
 
     def on_slider_value_changed(self, value):
+        """show the value of the slider changed"""
+        self.set_value(value)
+
+    def set_value(self, value):
         """setText with the value of `value` with
         positive values preceded with a `+` and
         ended with `dB`
         """
-
-        if self.sender().value() > 0:
-            retstring = str('+'+str(self.sender().value())+"dB")
-            self.setText(retstring)
+        if value > 0:
+            self.setText('+'+str(value)+"dB")
         else:
-            self.setText(str(self.sender().value())+"dB")
-        QCoreApplication.processEvents()
+            self.setText(str(value)+"dB")
 
 
 class xglucidInputSlider(QSlider):
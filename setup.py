@@ -19,12 +19,14 @@ setup(name='glucid',
       entry_points={  # Optional
           'console_scripts': [
               'glucid=glucid.glucid_cli:main',
-              'xglucid=glucid.xglucid:main'
+              'xglucid=glucid.xglucid:main',
+              'glucidd=glucid.glucidd:main'
           ],
       },
       long_description=long_desc,
       keywords='lucid 8824 audio converter',
       packages=['glucid'],
+      package_data={'glucid': ['Glucid8824.rcc']},
 #      py_modules=['glucid.glucid'],
       python_requires=">=3",
       package_dir={ 'glucid8824' : 'glucid',
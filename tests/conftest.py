@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the glucid tests.  The modules in glucid/ import
+each other by their flat names, so that directory goes on sys.path.
+The tests talk to Glucid8824Sim on a pseudo-terminal, so they need a
+POSIX system.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'glucid'))
+
+from glucid8824 import Glucid8824  # noqa: E402
+from glucidsim import Glucid8824Sim  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    """Keep ~/.glucid.cfg and ~/.glucid.scenes out of the real home"""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def sim():
+    """A simulated unit with instance id 00, answering at full speed"""
+    with Glucid8824Sim([0], realtime=False) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def lucid(sim):
+    """A Glucid8824 connected to `sim`"""
+    unit = Glucid8824(siface=sim.path)
+    assert unit.connect()
+    yield unit
+    unit.disconnect()
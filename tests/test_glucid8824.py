@@ -0,0 +1,178 @@
+from glucid8824 import Glucid8824, DeviceSnapshot
+
+
+def response(cmdkey, payload, instanceid=0):
+    return (bytes([Glucid8824.STARTBYTE_INT]) + Glucid8824.FRAMEHEADER +
+            bytes([instanceid, Glucid8824.RESPONSEBYTE,
+                   Glucid8824.COMMANDSET_INT[cmdkey]]) +
+            bytes(payload) + bytes([Glucid8824.ENDBYTE_INT]))
+
+
+def test_encode_command():
+    lucid = Glucid8824(LucidID='03')
+    frame = lucid.encodeCommand('SetSync', [2])
+    assert bytes(frame) == (b'\xf0\x00\x00\x5e\x58\x03' +
+                            bytes([Glucid8824.COMMANDSET_INT['SetSync']]) +
+                            b'\x02\xf7')
+    # hex strings, as earlier versions of sendCommand took
+    assert lucid.encodeCommand('SetSync', ['0a'])[-2] == 10
+    assert lucid.encodeCommand('GetMode', instanceid=7)[5] == 7
+
+
+def test_decode_frame():
+    lucid = Glucid8824()
+    instanceid, cmdbyte, payload = lucid.decodeFrame(
+        response('GetAnalogGain', range(1, 17), instanceid=5))
+    assert instanceid == 5
+    assert cmdbyte == Glucid8824.COMMANDSET_INT['GetAnalogGain']
+    assert list(payload) == list(range(1, 17))
+    # an empty payload is still a frame
+    assert list(lucid.decodeFrame(response('GetSync', b''))[2]) == []
+
+
+def test_decode_frame_rejects_malformed():
+    lucid = Glucid8824()
+    frame = response('GetSync', [1])
+    assert lucid.decodeFrame(frame[:-1]) is False
+    assert lucid.decodeFrame(b'\x00' + frame[1:]) is False
+    assert lucid.decodeFrame(frame[:2] + b'\x01' + frame[3:]) is False
+    # too short to hold the echoed command byte
+    assert lucid.decodeFrame(b'\xf0\x00\x00\x5e\x58\x00\x05\xf7') is False
+    assert lucid.decodeFrame(b'\xf0\xf7') is False
+
+
+def test_parse_frame():
+    lucid = Glucid8824()
+    cmdbyte, payload = lucid.parseFrame(response('GetSync', [1]))
+    assert cmdbyte == Glucid8824.COMMANDSET_INT['GetSync']
+    assert bytes(payload) == b'\x01'
+
+
+def test_parse_frame_follows_another_instance_id():
+    lucid = Glucid8824()
+    assert lucid.parseFrame(response('GetSync', [1], 2)) is False
+    assert lucid.INSTANCEID == '02'
+    assert lucid.device_mismatch
+
+
+def test_pipeline(sim, lucid):
+    results = lucid.pipeline(['GetSync', 'GetMode', 'GetAnalogGain'])
+    assert bytes(results[0]) == bytes([sim.units[0]['state']['GetSync']])
+    assert bytes(results[1]) == bytes([sim.units[0]['state']['GetMode']])
+    assert list(results[2]) == sim.gain_to_wire(sim.units[0]['gain'])
+    assert sim.frames == 3
+
+
+def test_pipeline_reports_each_response(lucid):
+    received = []
+    lucid.pipeline(['GetSync', 'GetOptSrc'],
+                   lambda cmdkey, payload: received.append(cmdkey))
+    assert received == ['GetSync', 'GetOptSrc']
+
+
+def test_read_all(sim, lucid):
+    sim.units[0]['gain'][9] = 70
+    snapshot = lucid.read_all()
+    assert isinstance(snapshot, DeviceSnapshot)
+    assert snapshot.sync == sim.DEFAULT_STATE['GetSync']
+    assert snapshot.mode == sim.DEFAULT_STATE['GetMode']
+    assert snapshot.opt_src == sim.DEFAULT_STATE['GetOptSrc']
+    assert list(snapshot.gain) == sim.units[0]['gain']
+    assert snapshot.gain[9] == 70
+
+
+def test_state_cache(sim, lucid):
+    assert lucid.read_all()
+    frames = sim.frames
+    sim.units[0]['state']['GetSync'] = 3
+    # answered from the cache
+    assert lucid.get_sync_source(False) == sim.DEFAULT_STATE['GetSync']
+    assert sim.frames == frames
+    lucid.state.invalidate('GetSync')
+    assert lucid.get_sync_source(False) == 3
+    assert sim.frames == frames + 1
+
+
+def test_state_cache_expires(sim, lucid):
+    lucid.state.max_age = 0
+    assert lucid.read_all()
+    frames = sim.frames
+    lucid.get_sync_source()
+    assert sim.frames == frames + 1
+
+
+def test_failed_set_invalidates(lucid):
+    assert lucid.read_all()
+    assert lucid.state.sync is not None
+    frame = lucid.encodeCommand('SetSync', [2])
+    lucid.state.record('SetSync', frame, False)
+    assert lucid.state.sync is None
+
+
+def test_set_writes_through(sim, lucid):
+    assert lucid.read_all()
+    lucid.set_sync_source(2)
+    assert sim.units[0]['state']['GetSync'] == 2
+    frames = sim.frames
+    assert lucid.state.sync == 2
+    assert lucid.get_sync_source(False) == 2
+    assert sim.frames == frames
+
+
+def test_apply_state_sends_only_changes(sim, lucid):
+    assert lucid.read_all()
+    frames = sim.frames
+    gains = list(sim.units[0]['gain'])
+    gains[3] = 40
+    plan = lucid.apply_state({'sync': sim.DEFAULT_STATE['GetSync'],
+                              'gain': {3: 40}})
+    assert plan == [('SetAnalogGain', gains[7::-1] + gains[15:7:-1])]
+    assert sim.frames == frames + 1
+    assert sim.units[0]['gain'] == gains
+
+    assert lucid.apply_state({'gain': {3: 40}}) == []
+    assert sim.frames == frames + 1
+
+
+def test_apply_state_writes_given_values_without_reading(sim, lucid):
+    plan = lucid.apply_state({'opt_src': 1, 'meter': 3, 'dig1': 1})
+    assert sorted(plan) == [('SetMode', [7]), ('SetOptSrc', [1])]
+    assert sim.frames == 2
+    assert sim.units[0]['state']['GetMode'] == 7
+
+
+def test_apply_state_merges_half_of_the_mode(sim, lucid):
+    plan = lucid.apply_state({'dig1': 1})
+    mode = sim.DEFAULT_STATE['GetMode'] | 4
+    assert plan == [('SetMode', [mode])]
+    assert sim.units[0]['state']['GetMode'] == mode
+
+
+def test_apply_state_rejects_bad_values(sim, lucid):
+    assert lucid.apply_state({'sync': 9}) is False
+    assert lucid.apply_state({'foo': 1}) is False
+    assert lucid.apply_state({'gain': [1]}) is False
+    assert sim.frames == 0
+
+
+def test_pipeline_reads_past_a_bad_frame(sim, lucid):
+    # a malformed frame waiting ahead of the replies
+    lucid.rxbuf += b'\xf0\x00\xf7'
+    results = lucid.pipeline(['GetSync', 'GetMode'])
+    assert [bytes(r) for r in results] == [
+        bytes([sim.DEFAULT_STATE['GetSync']]),
+        bytes([sim.DEFAULT_STATE['GetMode']])]
+    assert not lucid.stale_input
+    lucid.state.invalidate()
+    assert lucid.get_opt_source(False) == sim.DEFAULT_STATE['GetOptSrc']
+
+
+def test_pipeline_marks_input_stale_when_unanswered(sim):
+    # no unit answers on instance id 01
+    lucid = Glucid8824(siface=sim.path, LucidID='01', tout=0.1)
+    assert lucid.connect()
+    try:
+        assert lucid.pipeline(['GetSync']) == [False]
+        assert lucid.stale_input
+    finally:
+        lucid.disconnect()
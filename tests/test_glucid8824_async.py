@@ -0,0 +1,33 @@
+import asyncio
+
+import glucidcapture
+from glucid8824_async import AsyncGlucid8824
+
+
+def test_read_all(sim):
+    async def read():
+        lucid = AsyncGlucid8824(siface=sim.path)
+        async with lucid.session():
+            return await lucid.read_all()
+
+    snapshot = asyncio.run(read())
+    assert list(snapshot.gain) == sim.units[0]['gain']
+
+
+def test_failed_write_is_not_captured(tmp_path, sim):
+    path = str(tmp_path / 'capture')
+
+    async def write():
+        lucid = AsyncGlucid8824(siface=sim.path)
+        async with lucid.session():
+            lucid.start_capture(path)
+            assert await lucid.writeFrame(lucid.encodeCommand('GetSync'))
+            lucid.conn.close()
+            assert not await lucid.writeFrame(lucid.encodeCommand('GetMode'))
+            lucid.stop_capture()
+
+    asyncio.run(write())
+    written = [frame for direction, stamp, frame
+               in glucidcapture.read_capture(path)
+               if direction == glucidcapture.WRITTEN]
+    assert len(written) == 1
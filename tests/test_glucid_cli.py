@@ -0,0 +1,36 @@
+import configparser
+import os
+
+import glucid_cli
+from glucid8824 import Glucid8824, CONFIGFILE
+
+
+def run_cli(monkeypatch, *argv):
+    monkeypatch.setattr('sys.argv', ['glucid'] + list(argv))
+    glucid_cli.main()
+
+
+def test_second_run_starts_from_stored_timeout(monkeypatch, sim, home):
+    # learn from every round trip rather than every 16th
+    monkeypatch.setattr(Glucid8824, 'LATENCY_UPDATE', 1)
+    run_cli(monkeypatch, '-d', sim.path, '--no_daemon', '--get_sync')
+
+    stored = configparser.ConfigParser()
+    stored.read(os.path.join(str(home), CONFIGFILE))
+    timeout = float(stored['Latency ' + sim.path]['Timeout'])
+    assert timeout < 1
+
+    started = []
+    load_latency_profile = Glucid8824.load_latency_profile
+
+    def spy(lucid):
+        load_latency_profile(lucid)
+        started.append(lucid.read_timeout)
+
+    monkeypatch.setattr(Glucid8824, 'load_latency_profile', spy)
+    run_cli(monkeypatch, '-d', sim.path, '--no_daemon', '--get_sync')
+    assert started == [timeout]
+
+    stored = configparser.ConfigParser()
+    stored.read(os.path.join(str(home), CONFIGFILE))
+    assert stored.has_section('Latency ' + sim.path)
@@ -0,0 +1,34 @@
+import glucidcapture
+from glucid8824 import Glucid8824
+
+
+def test_capture_replay_round_trip(tmp_path, sim, lucid):
+    path = str(tmp_path / 'capture')
+    lucid.start_capture(path)
+    snapshot = lucid.read_all()
+    lucid.stop_capture()
+
+    records = list(glucidcapture.read_capture(path))
+    written = [frame for direction, stamp, frame in records
+               if direction == glucidcapture.WRITTEN]
+    read = [frame for direction, stamp, frame in records
+            if direction == glucidcapture.READ]
+    assert len(written) == 1
+    assert len(read) == len(Glucid8824.READ_ALL)
+
+    replayed = Glucid8824(siface=sim.path)
+    conn = glucidcapture.replay(replayed, path, realtime=False)
+    replayed_snapshot = replayed.read_all()
+    for field in ('sync', 'mode', 'opt_src', 'analog_src', 'aes_src',
+                  'gain'):
+        assert getattr(replayed_snapshot, field) == getattr(snapshot, field)
+    assert conn.mismatches == 0
+
+
+def test_record_is_readable_before_close(tmp_path):
+    path = str(tmp_path / 'capture')
+    writer = glucidcapture.CaptureWriter(path)
+    writer.record(glucidcapture.WRITTEN, bytearray(b'\xf0\xf7'))
+    assert [frame for direction, stamp, frame in
+            glucidcapture.read_capture(path)] == [b'\xf0\xf7']
+    writer.close()
@@ -0,0 +1,18 @@
+from glucidcues import CueList
+
+
+def test_cues_run_on_time(sim, lucid):
+    cues = CueList()
+    cues.add(0.1, lucid, {'gain': {0: 50}})
+    cues.add(0.05, lucid, {'gain': {0: 60, 1: 61}})
+    cues.add(0.15, lucid, {'gain': {0: 50}})
+    assert cues.prepare()
+    # planned against the state after the earlier cues
+    assert [len(cue.plan) for cue in cues.cues] == [1, 1, 0]
+
+    ran = cues.run()
+    for cue in ran:
+        assert 0 <= cue.drift < 0.05
+        assert cue.failed == 0
+        assert cue.confirmed == len(cue.plan)
+    assert sim.units[0]['gain'][:2] == [50, 61]
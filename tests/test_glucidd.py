@@ -0,0 +1,51 @@
+import os
+import stat
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import glucidclient
+import glucidd
+
+
+@pytest.fixture
+def daemon(sim, home):
+    lucid = glucidd.CachingGlucid8824(siface=sim.path)
+    assert lucid.begin_session()
+    server = glucidd.GlucidServer(glucidclient.socket_path(), lucid)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+    lucid.end_session()
+
+
+def test_forward_without_daemon():
+    assert glucidclient.forward(['--get_sync']) is None
+
+
+def test_repeat_polls_are_answered_from_memory(sim, daemon):
+    output, status = glucidclient.forward(['--get_sync'])
+    assert status == 0
+    assert 'WordClock' in output
+    frames = sim.frames
+    assert glucidclient.forward(['--get_sync']) == (output, status)
+    assert sim.frames == frames
+    assert daemon.lucid.state.max_age == glucidd.POLL_INTERVAL
+
+
+def test_socket_is_private(daemon):
+    mode = os.stat(glucidclient.socket_path()).st_mode
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_cli_does_not_load_the_daemon():
+    code = ("import sys, glucid_cli; "
+            "sys.exit('glucidd' in sys.modules or "
+            "'socketserver' in sys.modules)")
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   cwd=os.path.dirname(glucidclient.__file__))